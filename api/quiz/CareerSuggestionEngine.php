@@ -12,9 +12,29 @@ class CareerSuggestionEngine {
     private $db;
     private $cacheEnabled = true;
     private $maxJobsPerStar = [5 => 5, 4 => 15, 3 => 20, 2 => 10]; // Limit jobs per star level
+    private $jobsIndex = null; // holland_code => jobs (file sinh bởi tools/migrate_jobs_to_sql.py)
+    private $inactiveJobIds = null; // id => true, nghề bị ẩn trong database (lọc khỏi jobs index)
     
-    public function __construct($database) {
+    /**
+     * Khi có jobs index, nội dung và danh sách nghề lấy từ file (không đọc bảng jobs
+     * hay job_suggestion_cache): sửa hoặc thêm nghề trực tiếp trong database thì phải
+     * chạy lại tools/migrate_jobs_to_sql.py. Riêng jobs.is_active vẫn được đọc từ
+     * database (một truy vấn) để nghề bị ẩn không được gợi ý.
+     * 
+     * @param mixed $database Database adapter (fetchAll/fetch/execute)
+     * @param string|false|null $jobsIndexFile File PHP jobs theo Holland Code;
+     *        null = file mặc định nếu có, false = luôn truy vấn database
+     */
+    public function __construct($database, $jobsIndexFile = null) {
         $this->db = $database;
+        
+        if ($jobsIndexFile === null) {
+            $jobsIndexFile = __DIR__ . '/generated/jobs-by-code.php';
+        }
+        if ($jobsIndexFile !== false && is_file($jobsIndexFile)) {
+            // opcache giữ mảng hằng này trong shared memory, không tốn truy vấn nào
+            $this->jobsIndex = require $jobsIndexFile;
+        }
     }
     
     /**
@@ -108,6 +128,15 @@ class CareerSuggestionEngine {
      * Thuật toán 4 tầng tìm nghề theo Holland Code
      */
     private function findJobsByHollandCode($hollandCode) {
+        // Bảng job_suggestion_cache được tính sẵn khi migrate jobs (tools/migrate_jobs_to_sql.py)
+        // Không cần khi đã có file jobs index: các tầng bên dưới không truy vấn database
+        if ($this->cacheEnabled && $this->jobsIndex === null) {
+            $cachedJobs = $this->findCachedSuggestions($hollandCode);
+            if ($cachedJobs !== null) {
+                return $cachedJobs;
+            }
+        }
+        
         $allSuggestedJobs = [];
         $codeArray = str_split($hollandCode); // ['A', 'E', 'I']
         
@@ -138,16 +167,85 @@ class CareerSuggestionEngine {
         return $allSuggestedJobs;
     }
     
+    /**
+     * Đọc kết quả 4 tầng đã tính sẵn: một truy vấn theo khóa chính thay vì ~15 truy vấn
+     * Trả về null để chạy lại thuật toán khi chưa có cache hoặc cache đã cũ
+     */
+    private function findCachedSuggestions($hollandCode) {
+        try {
+            $sql = "SELECT c.star_rating, c.match_type, c.match_score, j.*
+                    FROM job_suggestion_cache c
+                    JOIN jobs j ON j.id = c.job_id
+                    WHERE c.holland_code = ?
+                    ORDER BY c.sort_order";
+            
+            $rows = $this->db->fetchAll($sql, [$hollandCode]);
+        } catch (Exception $e) {
+            // Bảng cache chưa được tạo
+            return null;
+        }
+        
+        if (empty($rows)) {
+            return null;
+        }
+        
+        $suggestedJobs = [];
+        foreach ($rows as $row) {
+            // Nghề đã bị ẩn sau khi tính cache => kết quả không còn đúng
+            if (!$row['is_active']) {
+                return null;
+            }
+            $suggestedJobs[] = $this->buildJobSuggestion(
+                $row, (int) $row['star_rating'], $row['match_type'], (float) $row['match_score'], $hollandCode
+            );
+        }
+        
+        return $suggestedJobs;
+    }
+    
+    /**
+     * Nghề đang hoạt động của một Holland Code theo thứ tự id
+     * Dùng file jobs index nếu có, nếu không thì truy vấn database
+     */
+    private function findActiveJobs($hollandCode, $limit) {
+        if ($this->jobsIndex !== null) {
+            $inactive = $this->getInactiveJobIds();
+            $jobs = array_filter($this->jobsIndex[$hollandCode] ?? [], function($job) use ($inactive) {
+                return !isset($inactive[$job['id']]);
+            });
+            return array_slice($jobs, 0, $limit);
+        }
+        
+        $sql = "SELECT * FROM jobs 
+                WHERE holland_code = ? AND is_active = TRUE 
+                LIMIT ?";
+        
+        return $this->db->fetchAll($sql, [$hollandCode, $limit]);
+    }
+    
+    /**
+     * Id các nghề bị ẩn (is_active = FALSE), đọc một lần cho mỗi engine
+     */
+    private function getInactiveJobIds() {
+        if ($this->inactiveJobIds === null) {
+            try {
+                $rows = $this->db->fetchAll("SELECT id FROM jobs WHERE is_active = FALSE");
+            } catch (Exception $e) {
+                // Chưa có bảng jobs: jobs index là nguồn duy nhất
+                $rows = [];
+            }
+            $this->inactiveJobIds = array_fill_keys(array_column($rows, 'id'), true);
+        }
+        
+        return $this->inactiveJobIds;
+    }
+    
     /**
      * TẦNG 1: Tìm nghề 5 sao - Exact match
      */
     private function findExactMatches($hollandCode) {
         try {
-            $sql = "SELECT * FROM jobs 
-                    WHERE holland_code = ? AND is_active = TRUE 
-                    LIMIT ?";
-            
-            $jobs = $this->db->fetchAll($sql, [$hollandCode, $this->maxJobsPerStar[5]]);
+            $jobs = $this->findActiveJobs($hollandCode, $this->maxJobsPerStar[5]);
             
             return array_map(function($job) use ($hollandCode) {
                 return $this->buildJobSuggestion($job, 5, 'exact', 100.0, $hollandCode);
@@ -172,11 +270,7 @@ class CareerSuggestionEngine {
             if ($permCode === $originalCode) continue;
             
             try {
-                $sql = "SELECT * FROM jobs 
-                        WHERE holland_code = ? AND is_active = TRUE
-                        LIMIT ?";
-                
-                $permJobs = $this->db->fetchAll($sql, [$permCode, 5]);
+                $permJobs = $this->findActiveJobs($permCode, 5);
             } catch (Exception $e) {
                 // Fallback
                 $permJobs = $this->getFallbackJobs($permCode, 4, 'permutation');
@@ -213,11 +307,7 @@ class CareerSuggestionEngine {
         
         foreach ($twoCharCodes as $index => $code) {
             try {
-                $sql = "SELECT * FROM jobs 
-                        WHERE holland_code = ? AND is_active = TRUE
-                        LIMIT ?";
-                
-                $twoCharJobs = $this->db->fetchAll($sql, [$code, 5]);
+                $twoCharJobs = $this->findActiveJobs($code, 5);
             } catch (Exception $e) {
                 // Fallback
                 $twoCharJobs = $this->getFallbackJobs($code, 3, 'two_char');
@@ -243,11 +333,7 @@ class CareerSuggestionEngine {
         
         foreach ($codeArray as $index => $char) {
             try {
-                $sql = "SELECT * FROM jobs 
-                        WHERE holland_code = ? AND is_active = TRUE
-                        LIMIT ?";
-                
-                $singleJobs = $this->db->fetchAll($sql, [$char, 4]);
+                $singleJobs = $this->findActiveJobs($char, 4);
             } catch (Exception $e) {
                 // Fallback
                 $singleJobs = $this->getFallbackJobs($char, 2, 'single_char');
@@ -384,7 +470,7 @@ class CareerSuggestionEngine {
     /**
      * Get suggested jobs for API response
      */
-    public function getSuggestedJobs($resultId, $starFilter = null, $limit = 50) {
+    public function getSuggestedJobs($resultId, $starFilter = null, $limit = 50, $workArea = null) {
         $sql = "SELECT 
                     qsj.*,
                     j.job_name,
@@ -414,6 +500,12 @@ class CareerSuggestionEngine {
             $params[] = $starFilter;
         }
         
+        // Lọc nơi làm việc qua index của job_work_areas, không parse JSON jobs.work_areas
+        if ($workArea) {
+            $sql .= " AND qsj.job_id IN (SELECT jwa.job_id FROM job_work_areas jwa WHERE jwa.work_area = ?)";
+            $params[] = $workArea;
+        }
+        
         $sql .= " ORDER BY qsj.star_rating DESC, qsj.match_score DESC, qsj.sort_order ASC";
         
         if ($limit) {
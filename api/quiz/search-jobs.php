@@ -0,0 +1,147 @@
+<?php
+/**
+ * API Tìm kiếm nghề nghiệp (không phân biệt dấu)
+ * GET /api/quiz/search-jobs.php?q={keyword}
+ *
+ * Parameters:
+ * - q (required): Từ khóa tìm kiếm, có dấu hoặc không dấu ("ky su", "kỹ sư")
+ * - holland_code: Lọc theo Holland Code (optional)
+ * - limit: int (default: 20, max: 100)
+ *
+ * Dùng bảng job_search_tokens (inverted index sinh bởi tools/migrate_jobs_to_sql.py):
+ * mỗi token của từ khóa là một lần tra khóa chính, không LIKE trên toàn bộ mô tả.
+ * Từ khóa được chuẩn hóa giống tools/vietnamese_text.py (NFD, bỏ dấu, đ->d, chữ thường).
+ */
+
+header('Content-Type: application/json; charset=utf-8');
+header('Access-Control-Allow-Origin: *');
+header('Access-Control-Allow-Methods: GET');
+header('Access-Control-Allow-Headers: Content-Type');
+
+if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
+    http_response_code(405);
+    echo json_encode(['error' => 'Method not allowed']);
+    exit;
+}
+
+require_once '../../config/db-pdo.php';
+
+// Chữ cái có dấu (chữ thường) => chữ không dấu, dùng khi không có extension intl
+const VIETNAMESE_FOLDS = [
+    'a' => 'àáâãăạảấầẩẫậắằẳẵặ',
+    'e' => 'èéêẹẻẽếềểễệ',
+    'i' => 'ìíĩỉị',
+    'o' => 'òóôõơọỏốồổỗộớờởỡợ',
+    'u' => 'ùúũưụủứừửữự',
+    'y' => 'ýỳỵỷỹ',
+    'd' => 'đ',
+];
+
+// Số token tối đa của một từ khóa
+const MAX_QUERY_TOKENS = 8;
+
+/**
+ * Chuẩn hóa từ khóa thành các token không dấu
+ */
+function tokenizeVietnamese($text) {
+    $text = mb_strtolower($text, 'UTF-8');
+
+    if (class_exists('Normalizer')) {
+        $text = str_replace('đ', 'd', $text);
+        $text = preg_replace('/\p{Mn}+/u', '', Normalizer::normalize($text, Normalizer::FORM_D));
+    } else {
+        $folds = [];
+        foreach (VIETNAMESE_FOLDS as $plain => $letters) {
+            foreach (mb_str_split($letters) as $letter) {
+                $folds[$letter] = $plain;
+            }
+        }
+        $text = strtr($text, $folds);
+    }
+
+    preg_match_all('/[a-z0-9]+/', $text, $matches);
+    return array_values(array_unique($matches[0]));
+}
+
+try {
+    // Lấy parameters
+    $query = isset($_GET['q']) ? trim($_GET['q']) : null;
+    $hollandCode = isset($_GET['holland_code']) ? strtoupper(trim($_GET['holland_code'])) : null;
+    $limit = isset($_GET['limit']) ? (int)$_GET['limit'] : 20;
+    $limit = max(1, min($limit, 100));
+
+    $tokens = $query ? array_slice(tokenizeVietnamese($query), 0, MAX_QUERY_TOKENS) : [];
+
+    if (!$tokens) {
+        http_response_code(400);
+        echo json_encode([
+            'success' => false,
+            'error' => 'Vui lòng cung cấp từ khóa tìm kiếm (q)'
+        ], JSON_UNESCAPED_UNICODE);
+        exit;
+    }
+
+    // Nghề phải chứa tất cả token; điểm = tổng trọng số các token
+    $placeholders = implode(', ', array_fill(0, count($tokens), '?'));
+    $sql = "SELECT
+                j.id, j.job_name, j.holland_code, j.job_group, j.education_level,
+                j.job_description,
+                SUM(t.weight) as relevance_score
+            FROM job_search_tokens t
+            JOIN jobs j ON j.id = t.job_id
+            WHERE t.token IN ($placeholders)
+            AND j.is_active = TRUE";
+    $params = $tokens;
+
+    if ($hollandCode) {
+        $sql .= " AND j.holland_code = ?";
+        $params[] = $hollandCode;
+    }
+
+    $sql .= " GROUP BY t.job_id
+              HAVING COUNT(*) = ?
+              ORDER BY relevance_score DESC, j.id ASC
+              LIMIT ?";
+    $params[] = count($tokens);
+    $params[] = $limit;
+
+    $stmt = $conn->prepare($sql);
+    foreach ($params as $index => $value) {
+        $stmt->bindValue($index + 1, $value, is_int($value) ? PDO::PARAM_INT : PDO::PARAM_STR);
+    }
+    $stmt->execute();
+    $jobs = $stmt->fetchAll(PDO::FETCH_ASSOC);
+
+    foreach ($jobs as &$job) {
+        $job['id'] = (int)$job['id'];
+        $job['education_level'] = $job['education_level'] !== null ? (int)$job['education_level'] : null;
+        $job['relevance_score'] = (int)$job['relevance_score'];
+    }
+    unset($job);
+
+    echo json_encode([
+        'success' => true,
+        'data' => $jobs,
+        'total' => count($jobs),
+        'query' => $query,
+        'tokens' => $tokens,
+        'filters' => [
+            'holland_code' => $hollandCode,
+            'limit' => $limit
+        ]
+    ], JSON_UNESCAPED_UNICODE | JSON_PRETTY_PRINT);
+
+} catch (PDOException $e) {
+    http_response_code(500);
+    echo json_encode([
+        'success' => false,
+        'error' => 'Database error: ' . $e->getMessage()
+    ], JSON_UNESCAPED_UNICODE);
+} catch (Exception $e) {
+    http_response_code(500);
+    echo json_encode([
+        'success' => false,
+        'error' => 'Server error: ' . $e->getMessage()
+    ], JSON_UNESCAPED_UNICODE);
+}
+?>
@@ -7,6 +7,8 @@ require_once __DIR__ . '/CareerSuggestionEngine.php';
  * API: Get Suggested Jobs
  * 
  * GET /api/quiz/suggested-jobs.php?result_id=123&star=5&limit=20
+ * GET /api/quiz/suggested-jobs.php?result_id=123&work_area=Bệnh viện
+ *     (work_area: lọc theo bảng job_work_areas - sql/jobs_normalized_data.sql)
  */
 
 header('Content-Type: application/json');
@@ -32,6 +34,7 @@ try {
     $starFilter = isset($_GET['star']) ? (int)$_GET['star'] : null;
     $limit = isset($_GET['limit']) ? (int)$_GET['limit'] : 50;
     $offset = isset($_GET['offset']) ? (int)$_GET['offset'] : 0;
+    $workArea = isset($_GET['work_area']) ? trim($_GET['work_area']) : null;
     
     if ($resultId <= 0) {
         http_response_code(400);
@@ -53,7 +56,7 @@ try {
     $engine = new CareerSuggestionEngine($pdo);
     
     // Get suggested jobs
-    $jobs = $engine->getSuggestedJobs($resultId, $starFilter, $limit + 1); // +1 để check có more data không
+    $jobs = $engine->getSuggestedJobs($resultId, $starFilter, $limit + 1, $workArea ?: null); // +1 để check có more data không
     
     $hasMore = count($jobs) > $limit;
     if ($hasMore) {
@@ -99,6 +102,7 @@ try {
             }, $summary),
             'filters' => [
                 'star_filter' => $starFilter,
+                'work_area' => $workArea ?: null,
                 'applied' => $starFilter ? "Jobs with {$starFilter} stars" : 'All jobs'
             ]
         ]
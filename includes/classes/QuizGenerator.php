@@ -83,6 +83,12 @@ class QuizGenerator {
      */
     private function generateQuestionSet($examType) {
         $questionsPerGroup = ($examType === 'FREE') ? QUESTIONS_PER_GROUP_FREE : QUESTIONS_PER_GROUP_PAID;
+        
+        $pooledQuestions = $this->getPooledQuestionSet($questionsPerGroup);
+        if ($pooledQuestions !== null) {
+            return $pooledQuestions;
+        }
+        
         $selectedQuestions = [];
         
         foreach ($this->hollandGroups as $code) {
@@ -101,6 +107,67 @@ class QuizGenerator {
         return $selectedQuestions;
     }
     
+    /**
+     * Lấy một bộ câu hỏi dựng sẵn (bảng question_pools)
+     * Bộ câu hỏi sinh bởi tools/create_sql_migrate_questions.py: đủ $questionsPerGroup câu
+     * cho mỗi nhóm và đã xáo trộn, nên không cần ORDER BY RAND() cho từng nhóm
+     * 
+     * @param int $questionsPerGroup
+     * @return array|null null nếu chưa có bộ phù hợp (dùng cách chọn ngẫu nhiên theo nhóm)
+     */
+    private function getPooledQuestionSet($questionsPerGroup) {
+        try {
+            $stmt = $this->pdo->prepare("SELECT COUNT(*) FROM question_pools WHERE questions_per_group = ?");
+            $stmt->execute([$questionsPerGroup]);
+            $poolCount = (int)$stmt->fetchColumn();
+            
+            if ($poolCount === 0) {
+                return null;
+            }
+            
+            // pool_number liên tục từ 0
+            $stmt = $this->pdo->prepare("
+                SELECT question_ids FROM question_pools
+                WHERE questions_per_group = ? AND pool_number = ?
+            ");
+            $stmt->execute([$questionsPerGroup, random_int(0, $poolCount - 1)]);
+            $questionIds = json_decode((string)$stmt->fetchColumn(), true);
+            
+            if (!is_array($questionIds) || count($questionIds) !== $questionsPerGroup * count($this->hollandGroups)) {
+                return null;
+            }
+            
+            $placeholders = implode(',', array_fill(0, count($questionIds), '?'));
+            $stmt = $this->pdo->prepare("
+                SELECT question_id, question_text, holland_code, category
+                FROM questions
+                WHERE question_id IN ($placeholders) AND is_active = 1
+            ");
+            $stmt->execute($questionIds);
+            
+            $questionsById = [];
+            foreach ($stmt->fetchAll(PDO::FETCH_ASSOC) as $question) {
+                $questionsById[$question['question_id']] = $question;
+            }
+            
+            // Có câu hỏi đã bị tắt sau khi sinh bộ câu hỏi: chọn ngẫu nhiên theo nhóm
+            if (count($questionsById) !== count($questionIds)) {
+                return null;
+            }
+            
+            $questions = [];
+            foreach ($questionIds as $questionId) {
+                $questions[] = $questionsById[$questionId];
+            }
+            return $questions;
+            
+        } catch (PDOException $e) {
+            // Database chưa có bảng question_pools
+            error_log("Database error in getPooledQuestionSet: " . $e->getMessage());
+            return null;
+        }
+    }
+    
     /**
      * Random select questions from specific Holland group
      * 
@@ -572,6 +639,11 @@ class QuizGenerator {
             error_log("Warning: Question count mismatch. Expected: $expectedTotal, Requested: $totalQuestions");
         }
         
+        $pooledQuestions = $this->getPooledQuestionSet($questionsPerGroup);
+        if ($pooledQuestions !== null) {
+            return $pooledQuestions;
+        }
+        
         foreach ($this->hollandGroups as $code) {
             $groupQuestions = $this->getRandomQuestionsByHollandCode($code, $questionsPerGroup);
             
@@ -54,11 +54,17 @@ DROP TABLE IF EXISTS quiz_answers;
 DROP TABLE IF EXISTS quiz_exams;
 
 -- Jobs master data table
+DROP TABLE IF EXISTS job_search_tokens;
+DROP TABLE IF EXISTS job_work_areas;
+DROP TABLE IF EXISTS job_tasks;
+DROP TABLE IF EXISTS job_specializations;
+DROP TABLE IF EXISTS job_suggestion_cache;
 DROP TABLE IF EXISTS jobs;
 
 -- Legacy Holland Code tables
 DROP TABLE IF EXISTS test_answers;
 DROP TABLE IF EXISTS test_results;
+DROP TABLE IF EXISTS question_pools;
 DROP TABLE IF EXISTS questions;
 
 -- E-commerce tables
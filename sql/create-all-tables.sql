@@ -25,6 +25,11 @@ DROP TABLE IF EXISTS quiz_answers;
 DROP TABLE IF EXISTS quiz_exams;
 
 -- Drop jobs master data table
+DROP TABLE IF EXISTS job_search_tokens;
+DROP TABLE IF EXISTS job_work_areas;
+DROP TABLE IF EXISTS job_tasks;
+DROP TABLE IF EXISTS job_specializations;
+DROP TABLE IF EXISTS job_suggestion_cache;
 DROP TABLE IF EXISTS jobs;
 
 -- Drop legacy tables
@@ -37,6 +42,7 @@ DROP TABLE IF EXISTS product_packages;
 DROP TABLE IF EXISTS products;
 DROP TABLE IF EXISTS test_answers;
 DROP TABLE IF EXISTS test_results;
+DROP TABLE IF EXISTS question_pools;
 DROP TABLE IF EXISTS questions;
 DROP TABLE IF EXISTS sessions;
 DROP TABLE IF EXISTS users;
@@ -126,6 +132,19 @@ CREATE TABLE questions (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci 
 COMMENT='Bảng câu hỏi trắc nghiệm Holland Code để đánh giá hướng nghiệp';
 
+-- Bảng question_pools: Bộ câu hỏi dựng sẵn cho từng cấu hình quiz_package_configs
+-- Sinh bởi tools/create_sql_migrate_questions.py: mỗi bộ có questions_per_group câu cho mỗi nhóm
+-- R/I/A/S/E/C và đã xáo trộn; tạo bài thi chỉ cần chọn ngẫu nhiên một pool_number
+CREATE TABLE question_pools (
+    questions_per_group INT NOT NULL COMMENT 'quiz_package_configs.questions_per_group',
+    pool_number SMALLINT NOT NULL COMMENT 'Số thứ tự bộ câu hỏi (0, 1, 2...)',
+    question_ids JSON NOT NULL COMMENT 'Mảng questions.question_id theo thứ tự hiển thị',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (questions_per_group, pool_number)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Bộ câu hỏi cân bằng theo nhóm Holland, xáo trộn sẵn';
+
 -- Bảng nghề nghiệp (jobs) - Master data từ old project
 CREATE TABLE jobs (
     id INT PRIMARY KEY AUTO_INCREMENT,
@@ -172,6 +191,73 @@ CREATE TABLE jobs (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
 COMMENT='Bảng master data nghề nghiệp từ old project (200 jobs)';
 
+-- Bảng job_suggestion_cache: Kết quả thuật toán 4 tầng tính sẵn cho 120 Holland Code
+-- Được tạo lại cùng dữ liệu jobs (tools/migrate_jobs_to_sql.py)
+CREATE TABLE job_suggestion_cache (
+    holland_code CHAR(3) NOT NULL COMMENT 'Holland Code của người dùng (VD: AEI)',
+    sort_order SMALLINT NOT NULL COMMENT 'Thứ tự sau khi sắp xếp theo sao và điểm',
+    job_id INT NOT NULL,
+    
+    -- Matching details
+    star_rating TINYINT NOT NULL COMMENT '2-5 sao',
+    match_type ENUM('exact','permutation','two_char','single_char') NOT NULL,
+    match_score DECIMAL(5,2) NOT NULL COMMENT 'Điểm khớp %',
+    
+    PRIMARY KEY (holland_code, sort_order),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    INDEX idx_cache_job (job_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Cache gợi ý nghề nghiệp theo Holland Code (tính sẵn)';
+
+-- Các bảng con chuẩn hóa từ cột JSON của jobs (specializations, main_tasks, work_areas)
+-- Để lọc/tìm bằng index thay vì parse JSON trên từng dòng
+-- Dữ liệu: sql/jobs_normalized_data.sql (tools/migrate_jobs_to_sql.py --normalized)
+CREATE TABLE job_specializations (
+    job_id INT NOT NULL,
+    sort_order SMALLINT NOT NULL COMMENT 'Vị trí trong mảng JSON',
+    specialization VARCHAR(500) NOT NULL COMMENT 'Chuyên môn con (expertise)',
+    
+    PRIMARY KEY (job_id, sort_order),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    INDEX idx_job_specialization (specialization)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Chuyên môn con của nghề nghiệp (1 dòng / chuyên môn)';
+
+CREATE TABLE job_tasks (
+    job_id INT NOT NULL,
+    sort_order SMALLINT NOT NULL COMMENT 'Vị trí trong mảng JSON',
+    task TEXT NOT NULL COMMENT 'Nhiệm vụ chính (mission)',
+    
+    PRIMARY KEY (job_id, sort_order),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    FULLTEXT INDEX idx_job_task_search (task)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Nhiệm vụ chính của nghề nghiệp (1 dòng / nhiệm vụ)';
+
+CREATE TABLE job_work_areas (
+    job_id INT NOT NULL,
+    sort_order SMALLINT NOT NULL COMMENT 'Vị trí trong mảng JSON',
+    work_area VARCHAR(500) NOT NULL COMMENT 'Nơi làm việc (workArea)',
+    
+    PRIMARY KEY (job_id, sort_order),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    INDEX idx_job_work_area (work_area, job_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Nơi làm việc của nghề nghiệp (1 dòng / nơi làm việc)';
+
+-- Bảng job_search_tokens: Inverted index tìm kiếm nghề nghiệp (tiếng Việt không dấu)
+-- Token = NFD, bỏ dấu, đ->d, chữ thường (tools/vietnamese_text.py); sinh cùng jobs_data_insertion.sql
+CREATE TABLE job_search_tokens (
+    token VARCHAR(64) CHARACTER SET ascii COLLATE ascii_bin NOT NULL COMMENT 'Token đã bỏ dấu',
+    job_id INT NOT NULL,
+    weight SMALLINT UNSIGNED NOT NULL COMMENT 'Tên x8, nhóm x4, chuyên môn x2, mô tả x1',
+    
+    PRIMARY KEY (token, job_id),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    INDEX idx_search_job (job_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Inverted index tìm kiếm nghề nghiệp';
+
 -- =====================================================
 -- PHẦN 2A: QUIZ SYSTEM TABLES - PACKAGE INTEGRATION
 -- =====================================================
@@ -311,7 +397,8 @@ CREATE TABLE quiz_suggested_jobs (
     result_id INT NOT NULL,
     
     -- Job information
-    job_code VARCHAR(20) NOT NULL COMMENT 'Mã nghề nghiệp',
+    job_id INT NULL COMMENT 'jobs.id (CareerSuggestionEngine::saveSuggestedJobs)',
+    job_code VARCHAR(20) NULL COMMENT 'Mã nghề nghiệp (cũ, engine không ghi)',
     job_name VARCHAR(255) NOT NULL,
     job_name_en VARCHAR(255) NULL,
     holland_code VARCHAR(3) NOT NULL,
@@ -332,6 +419,7 @@ CREATE TABLE quiz_suggested_jobs (
     job_description TEXT NULL,
     work_areas JSON NULL COMMENT 'Nơi làm việc',
     main_tasks JSON NULL COMMENT 'Nhiệm vụ chính',
+    specializations JSON NULL COMMENT 'Chuyên ngành',
     
     -- Display control
     sort_order INT DEFAULT 0,
@@ -342,6 +430,7 @@ CREATE TABLE quiz_suggested_jobs (
     FOREIGN KEY (result_id) REFERENCES quiz_results(id) ON DELETE CASCADE,
     INDEX idx_result_star (result_id, star_rating DESC, sort_order),
     INDEX idx_job_code (job_code),
+    INDEX idx_job_id (job_id),
     FULLTEXT INDEX idx_job_search (job_name, job_description)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
 COMMENT='Bảng nghề nghiệp gợi ý với hệ thống sao từ 2-5';
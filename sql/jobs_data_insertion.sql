@@ -1,255 +1,14355 @@
 -- =====================================================
 -- JOBS DATA INSERTION 
--- Insert 200 job records from old project
+-- Insert the job records from old project (count at the end)
 -- =====================================================
 
 -- Disable foreign key checks and autocommit for better performance
 SET FOREIGN_KEY_CHECKS = 0;
 SET AUTOCOMMIT = 0;
 
--- Clear existing jobs data (if any)
+-- Clear existing jobs data (if any); FOREIGN_KEY_CHECKS = 0 skips the
+-- cascade, so the child tables are cleared explicitly
 DELETE FROM jobs;
+DELETE FROM job_search_tokens;
+DELETE FROM job_specializations;
+DELETE FROM job_tasks;
+DELETE FROM job_work_areas;
 
--- Reset auto increment
+-- Reset auto increment (rows carry explicit ids, MySQL moves it past the highest)
 ALTER TABLE jobs AUTO_INCREMENT = 1;
 
 -- Insert job data
 
 -- Batch 1: Jobs 1 to 50
 INSERT INTO jobs (
-    job_name, holland_code, job_group, activities_code,
+    id, job_name, holland_code, job_group, activities_code,
     capacity, essential_ability, education_level, work_environment,
     work_style, work_value, job_description, specializations,
     main_tasks, work_areas, is_active
 ) VALUES
-    ('Phát thanh viên, biên tập viên truyền thông', 'AEI', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Thành tựu', 'Phát thanh viên trên đài phát thanh, truyền hình và các phương tiện truyền thông khác là người đọc bản tin, phỏng vấn, hướng dẫn và thực hiện các thông báo khác hoặc thực hiện các chỉ dẫn trên đài phát thanh, truyền hình, trong rạp chiếu phim và các cơ sở khác. Họ được ví như là “nhân vật đinh” của chương trình.', '["Phát thanh viên thời sự", "Phát thanh viên thể thao", "Phát thanh viên thời tiết"]', '["Đọc bản tin và các thông báo khác trên đài phát thanh, đài truyền hình", "Giới thiệu diễn viên, nghệ sĩ biểu diễn, người được phỏng vấn và thực hiện các thông báo liên quan trên đài phát thanh, truyền hình hoặc trong nhà hát và các cơ sở khác", "Phỏng vấn người ở những nơi công cộng cho các chương trình trên đài phát thanh và truyền hình"]', '["Đài phát thanh và truyền hình", "Doanh nghiệp Tổ chức Sự kiện", "Công ty truyền thông và quảng cáo"]', TRUE),
-    ('Nhà nhân chủng học', 'IAR', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Nhân chủng học là một ngành khoa học xã hội. Nhà nhân chủng học nghiên cứu quá trình tiến hóa của con người, phong tục truyền thống qua các thời đại cũng như các nền văn hóa còn tồn tại đến ngày nay. Họ quan tâm đến các khía cạnh của đời sống xã hội như tôn giáo, gia đình, các mối quan hệ, ngôn ngữ, nghệ thuật, nghề thủ công, âm nhạc, các biểu tượng, thần thoại và các hoạt động dân gian. Nhà nhân chủng học cũng quan tâm đến các hoạt động kinh tế và chính trị hiện đại.', '["Nhân chủng học ứng dụng", "Nhân chủng học trong lĩnh vực sinh học/vật lí", "Nhân chủng học ngôn ngữ", "Nhân chủng học xã hội/văn hóa"]', '["Hiểu biết và áp dụng các lí thuyết về nhân chủng học để hiểu hành vi con người", "Giảng dạy lí thuyết nhân chủng học cho học sinh, sinh viên", "Áp dụng các phương pháp nhân chủng học đặc biệt như quan sát người tham dự để tiến hành quan sát cộng đồng, thu thập và phân tích thông tin về hành vi xã hội, văn hóa của con người", "Phát hiện, thu thập và nghiên cứu các hiện vật, phương tiện truyền thông, thậm chí nghiên cứu cả đặc tính sinh học hoặc từng nhóm người cụ thể", "Sử dụng dữ liệu thu thập thông qua quan sát để xác nhận hoặc phản biện các lí thuyết, nhận định và chính sách hiện có", "Phát triển các lí thuyết mới để giải thích hành vi của con người"]', '["Giảng dạy tại các trường ĐH", "Các tổ chức tình nguyện", "Các tổ chức chính phủ", "Các tổ chức nghiên cứu quốc tế"]', TRUE),
-    ('Nhà khảo cổ học', 'IAR', 'Ngôn ngữ', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Các nhà khảo cổ nghiên cứu quá khứ để hiểu con người đã sống như thế nào. Họ theo dõi sự phát triển của nhân loại bằng cách nghiên cứu các di vật từ quá khứ, như cung điện, đền đài, nhà cửa, công cụ, đồ gốm, tiền xu, vũ khí, hay các tác phẩm điêu khắc.', '["Khảo cổ học ứng dụng", "Khảo cổ sinh học", "Số hóa khảo cổ học", "Khảo cổ dân tộc học", "Khảo cổ học thực nghiệm", "Khảo cổ học địa chất", "Khảo cổ học lịch sử"]', '["Thăm những di tích cổ, tiếp xúc với các tài liệu hiện vật đã được con người sử dụng từ rất lâu", "Tiến hành thăm dò, khảo sát và khai quật có hệ thống các vùng đất xa xưa để khám phá thành phố, công trình cổ và các cổ vật khác", "Nghiên cứu các di tích hiện vật phát hiện được và công bố báo cáo về tầm quan trọng lịch sử", "Chuẩn bị ca-ta-lô về những cổ vật đã thu thập để triển lãm trong bảo tàng", "Giảng bài cho học sinh, sinh viên và những người khác quan tâm đến khảo cổ học"]', '["Các phòng ban và viện bảo tàng khảo cổ", "Các tổ chức phi chính phủ tham gia vào việc bảo tồn di sản"]', TRUE),
-    ('Chuyên viên lưu trữ văn thư và quản lí bảo tàng', 'CSR', 'Ngôn ngữ', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Một hệ thống lưu trữ bảo tàng là tập hợp các ghi chép theo lịch sử, bao gồm chữ cái, giấy tờ, hình ảnh, nhật kí hay bất kì loại hiện vật nào khác. Hệ thống này cũng đánh dấu vị trí lưu trữ những hồ sơ đó. Chuyên viên lưu trữ văn thư và quản lí bảo tàng tiến hành nghiên cứu, thu thập, đánh giá và bảo vệ, bảo tồn các nội dung tài liệu, hiện vật có lợi ích lịch sử, văn hóa và nghệ thuật, đồng thời tổ chức trưng bày tại bảo tàng và triển lãm nghệ thuật.', '["Cổ vật và chữ viết cổ", "Công nghệ thông tin lưu trữ", "Quản lí thông tin", "Quản lí hồ sơ", "An toàn và bảo mật thông tin"]', '["Nghiên cứu, đánh giá, phát triển, tổ chức và bảo tồn các tài liệu có ý nghĩa lịch sử và có giá trị như văn bản chính phủ, các giấy tờ cá nhân, tranh ảnh, ghi âm và phim tư liệu", "Thực hiện việc chuẩn bị các danh mục và thư mục ấn phẩm, các bản vi phim và các tài liệu tham khảo khác của các tài liệu thu thập được và đem đến cho người sử dụng", "Nghiên cứu bản gốc, phân phối và sử dụng các vật liệu và đồ dùng có lợi ích văn hóa và lịch sử", "Tổ chức, phát triển và duy trì bộ sưu tập các đồ dùng mang tính nghệ thuật, văn hóa, khoa học và có ý nghĩa lịch sử tại bảo tàng và triển lãm nghệ thuật", "Thực hiện phân loại và ghi mục lục các bộ sưu tập bảo tàng và triển lãm nghệ thuật và tổ chức trưng bày", "Chuẩn bị các tài liệu và báo cáo học thuật"]', '["Bảo tàng, phòng trưng bày triển lãm", "Cục, chi cục văn thư lưu trữ Nhà nước"]', TRUE),
-    ('Thư kí điều hành', 'CE', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Thư kí điều hành là người hỗ trợ quản trị hành chính cho lãnh đạo cấp cao. Họ tiến hành nghiên cứu, viết báo cáo thống kê, xử lí yêu cầu thông tin và thực hiện cả những nhiệm vụ của của thư kí hành chính như soạn thảo thư từ, tiếp khách, đặt lịch họp và sắp xếp hội đàm điện tử điện thoại. Họ cũng có thể có nhiệm vụ đào tạo và giám sát thư kí ở cấp thấp hơn. Trong doanh nghiệp thư kí điều hành là người trợ lí cho chủ tịch và giám đốc, kết nối giữa hội đồng quản trị, cổ đông, các cơ quan pháp luật và cơ quan quản lí, đảm bảo các thủ tục được tuân thủ và đánh giá thường xuyên.', '["Chuyên sâu theo loại tổ chức (ví dụ: tổ chức từ thiện, tổ chức kinh doanh, tổ chức giáo dục...)", "Chuyên sâu theo lĩnh vực luật liên quan đến doanh nghiệp (ví dụ: thuế, cổ phần hóa, mua bán sáp nhập...)"]', '["Tiến hành nghiên cứu, tập hợp số liệu, văn bản pháp lí và văn bản chuyên môn liên quan đến công việc của tổ chức", "Làm dự thảo các báo cáo, văn bản theo yêu cầu của lãnh đạo", "Tiếp nhận và xử lí yêu cầu của khách lạ cần gặp người phù hợp trong tổ chức", "Hỗ trợ lập kế hoạch và chuẩn bị họp, hội nghị, hội đàm trực tiếp hoặc điện tử điện thoại", "Chuẩn bị các cuộc họp của các lãnh đạo và ủy ban cấp cao", "Trả lời các câu hỏi của công chúng", "Đánh các văn bản tài liệu mật trên hệ thống soạn thảo văn bản", "Hỗ trợ hành chính văn phòng cho lãnh đạo cấp cao như soạn thảo thư từ, văn bản, xử lí thư từ, điện thoại, fax đến và đi, tiếp khách, đặt lịch họp, lưu tài liệu, chuẩn bị văn phòng phẩm...", "Hướng dẫn, đào tạo và/ giám sát thư kí cấp thấp hơn nếu được giao"]', '["Các doanh nghiệp Nhà nước, tư nhân, có vốn đầu tư nước ngoài", "Các cơ quan Nhà nước, đoàn thể xã hội, tổ chức phi chính phủ"]', TRUE),
-    ('Giảng viên đại học, sau đại học', 'SI', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Mối quan hệ', 'Giảng viên đại học, cao học là người có kiến thức chuyên sâu về một chuyên ngành cụ thể và dạy các lý thuyết và thực hành về một hay nhiều môn học ở ở bậc đại học, hoặc tương đương; thực hiện nghiên cứu và cải tiến, phát triển khái niệm, lý thuyết, phương pháp hoạt động, biên soạn sách và và giảng dạy', '["Dạy học: lĩnh vực chuyên sâu chủ yếu là liên quan đến các ngành, nghề đào tạo chuyên môn sâu như Kinh tế, tài chính, ngôn ngữ, các lĩnh vực khoa học tự nhiên, khoa học xã hội, công nghệ, dược, các môn cơ sở ngành", "Quản lí: Giảng viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học nghiên cứu theo yêu cầu", "Giảng dạy và tổ chức hướng dẫn, thảo luận, và thí nghiệm", "Khuyến khích sinh viên thảo luận và tư duy độc lập", "Giám sát, nếu cần, các công tác thí nghiệm và thực hành của sinh viên", "Quản lí, đánh giá và chấm điểm các bài kiểm tra", "Chỉ dẫn sinh viên và các thành viên trong khoa nghiên cứu", "Nghiên cứu và phát triển các khái niệm, lí thuyết và các biện pháp hoạt động để ứng dụng trong lĩnh vực chuyên môn và các lĩnh vực khác", "Chuẩn bị tài liệu, sách báo, sách giảng dạy", "Tham gia các cuộc hội thảo và thảo luận", "Tham gia quá trình quyết định liên quan đến các vấn đề về khoa, ngân sách, và các chính sách khác", "Trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề", "Thực hiện các công việc liên quan khác", "Giám sát các giáo viên khác"]', '["Giảng dạy trong các trường đại học", "Nghiên cứu tại các viện nghiên cứu về giáo dục và các khoa học có liên quan", "Vị trí quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng)"]', TRUE),
-    ('Giảng viên cao đẳng', 'SI', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Mối quan hệ', 'Giảng viên cao đẳng là người có kiến thức chuyên sâu về một chuyên ngành cụ thể và dạy các lý thuyết và thực hành về một hay nhiều môn học ở bậc cao đẳng hoặc các tương đương; thực hiện nghiên cứu và cải tiến, phát triển khái niệm, lý thuyết, phương pháp hoạt động, biên soạn sách và và giảng dạy.', '["Dạy học: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: Cao đẳng Giao thông vận tải, giảng dạy các học phần: Cơ lí thuyết, Hình họa – vẽ kĩ thuật, …", "Quản lí: Giảng viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học nghiên cứu theo yêu cầu", "Giảng dạy và tổ chức hướng dẫn, thảo luận, và thí nghiệm", "Khuyến khích sinh viên thảo luận và tư duy độc lập", "Giám sát, nếu cần, các công tác thí nghiệm và thực hành của sinh viên", "Quản lí, đánh giá và chấm điểm các bài kiểm tra", "Chỉ dẫn sinh viên và các thành viên trong khoa nghiên cứu", "Nghiên cứu và phát triển các khái niệm, lí thuyết và các biện pháp hoạt động để ứng dụng trong lĩnh vực chuyên môn và các lĩnh vực khác", "Chuẩn bị tài liệu, sách báo, sách giảng dạy", "Tham gia các cuộc hội thảo và thảo luận", "Tham gia quá trình quyết định liên quan đến các vấn đề về khoa, ngân sách, và các chính sách khác", "Trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề", "Thực hiện các công việc liên quan khác", "Giám sát các giáo viên khác"]', '["Giảng dạy tại các trường Cao đẳng", "Vị trí quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng khoa)"]', TRUE),
-    ('Giáo viên trung cấp', 'SR', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên trung cấp là người có kiến thức chuyên sâu về một lĩnh vực cụ thể và dạy các lý thuyết và thực hành về một hay nhiều môn học ở cấp giáo dục trung cấp, sau khi kết thúc giáo dục trung học cơ sở hoặc trung học phổ thông, với mục đích giáo dục, hướng nghiệp, hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến học phần giảng dạy. Ví dụ: Thực hành lái xe nâng, thực hành gấp khăn, …", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa đào tạo, hướng nghiệp và nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề hoặc câu lạc bộ", "Giảng dạy cá nhân nếu cần", "Thực hiện các công việc liên quan khác", "Giám sát các giáo viên khác"]', '["Giảng dạy trong các trường trung cấp", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)"]', TRUE),
-    ('Giáo viên trung học phổ thông', 'SI', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên trung học phổ thông dạy học sinh ở các trường trung học phổ thông hoặc tương đương, ví dụ như trung tâm giáo dục thường xuyên. Họ dạy một hoặc nhiều môn học với mục đích giáo dục, hướng nghiệp, hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, vật lí, toán...", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường (ví dụ: hiệu phó, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp và nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Dạy đọc, viết và các môn cơ bản khác cho người lớn", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...", "Giảng dạy cá nhân nếu cần", "Hướng dẫn các hoạt động ngoại khóa"]', '["Dạy học tại các trường trung học phổ thông", "các trung tâm giáo dục thường xuyên", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)", "Làm việc chuyên môn trong các cơ quan quản lý giáo dục", "Dạy học tại các trung tâm bồi dưỡng văn hóa"]', TRUE),
-    ('Giáo viên trung học cơ sở', 'SI', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên trung học cơ sở dạy học sinh ở các trường trung học cơ sở hoặc tương đương, ví dụ như trường trẻ em khuyết tật bậc trung học cơ sở. Họ dạy một hoặc nhiều môn học với mục đích giáo dục, hướng nghiệp, hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, vật lí, toán...", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường (ví dụ: hiệu phó, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp, nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Dạy đọc, viết và các môn cơ bản khác cho người lớn", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...", "Giảng dạy cá nhân nếu cần"]', '["Dạy học tại các trường trung học cơ sở", "các trung tâm giáo dục thường xuyên", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)", "Làm việc chuyên môn trong các cơ quan quản lý giáo dục", "Dạy học tại các trung tâm bồi dưỡng văn hóa"]', TRUE),
-    ('Giáo viên ngoại ngữ', 'SAI', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Sự độc lập', 'Giáo viên Ngoại ngữ dạy học sinh ở các trường trung học phổ thông, trung cấp, cao đẳng và các bậc học khác. Họ dạy một hoặc nhiều ngoại ngữ khác nhau nhằm mục đích giáo dục, hướng nghiệp hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, tiếng Pháp, tiếng Tây ban Nha, ...", "Quản lí: Giáo viên Ngôn ngữ cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường... (ví dụ: tổ trưởng chuyên môn, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp, nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Dạy đọc, viết và nói", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...", "Giảng dạy cá nhân nếu cần"]', '["Dạy học tại các cơ sở giáo dục", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)", "Làm việc chuyên môn trong các cơ quan quản lý giáo dục", "Dạy học tại các trung tâm ngoại ngữ"]', TRUE),
-    ('Chuyên viên quan hệ công chúng', 'EAS', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Chuyên viên quan hệ công chúng, còn được gọi là cán bộ truyền thông, là người giữ nhiệm vụ kết nối giữa tổ chức, doanh nghiệp với thế giới bên ngoài. Họ đảm bảo rằng các thông tin chính xác về tổ chức, doanh nghiệp, khách hàng, sản phẩm hoặc người sử dụng lao động được các đối tượng công chúng biết đến.', '["Quản trị khủng hoảng", "Quan hệ Chính phủ (vận động hành lang)", "Chủ đầu tư và các mối quan hệ tài chính", "Truyền thông tiếp thị", "Quan hệ với giới truyền thông", "Chuẩn bị các ấn phẩm", "Các chiến dịch quảng bá", "Sự kiện xúc tiến đặc biệt"]', '["Duy trì thông tin liên lạc giữa tổ chức và khách hàng của họ để tăng cường hiểu biết và uy tín", "Xây dựng, biên tập và phân phối bản thông tin định kì để công bố các hoạt động, phát hành thông cáo báo chí để giới thiệu các hoạt động của tổ chức", "Theo dõi sát tin tức, báo chí và các phương tiện truyền thông khác, lưu ý xu hướng của dư luận", "Giúp người sử dụng lao động hiểu ý kiến dư luận và phản biện chính sách", "Gặp gỡ báo chí và đại diện công chúng để giới thiệu các đặc điểm của tổ chức", "Tham gia vào các sự kiện để quảng bá cho tổ chức, doanh nghiệp", "Biên soạn các bài giới thiệu đặc biệt, báo cáo hoặc tờ rơi thông tin", "Duy trì trung tâm thông tin và tổ chức các hoạt động quan hệ cộng đồng"]', '["Bộ phận truyền thông của doanh nghiệp và các tổ chức chính phủ. Ví dụ như hầu hết các doanh nghiệp lớn hiện nay đều có bộ phận quan hệ cộng đồng doanh nghiệp", "Các doanh nghiệp dịch vụ quan hệ công chúng. Các doanh nghiệp này được các tổ chức thuê triển khai thực hiện các sự kiện đặc biệt như ra mắt sản phẩm, hội nghị..."]', TRUE),
-    ('Luật sư', 'EIA', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự công nhận', 'Luật sư là người bào chữa hoặc người bảo vệ quyền lợi cho thân chủ tại tòa án, trong các vụ án, các vụ việc và yêu cầu khác theo qui định của pháp luật. Các vụ án, vụ việc và yêu cầu có thể liên quan đến những lĩnh vực khác nhau như hình sự, dân sự, hành chính, hôn nhân và gia đình, kinh doanh, thương mại, lao động, sở hữu trí tuệ...', '["Hiến pháp", "Luật hành chính", "Luật doanh nghiệp", "Luật dân sự", "Luật thương mại", "Luật hình sự", "Luật môi trường", "Luật y tế", "Luật sở hữu trí tuệ"]', '["Tiến hành nghiên cứu trên các lí thuyết pháp lí và mối quan hệ của chúng với các điều luật hoặc dự luật cụ thể", "Soạn thảo luật và các qui định của Chính phủ dựa trên pháp luật hiện hành", "Đưa ra lời khuyên pháp lí cho khách hàng, bao gồm cả Chính phủ trên nhiều loại vấn đề khác nhau và thay mặt cho khách hàng thực hiện các công việc pháp lí", "Hỗ trợ khách hàng để đàm phán, dàn xếp trong những vấn đề liên quan đến tranh chấp pháp lí", "Kiểm tra các trường hợp tranh chấp hoặc báo cáo tội phạm để xác định sự kiện và ý nghĩa pháp lí của họ", "Chuẩn bị lời biện hộ hoặc các tình huống cho nguyên đơn hoặc bị đơn và trình bày tại tòa án", "Đóng vai trò là công tố viên đại diện cho Chính phủ trong các vụ án hình sự"]', '["Các công ty luật, văn phòng luật sư", "Các cơ quan Nhà nước", "Các doanh nghiệp lớn", "Các tổ chức tình nguyện"]', TRUE),
-    ('Thủ thư và nhân viên thư viện', 'CSE', 'Ngôn ngữ', 'Tương tác với người khác', 'Phân tích - logic', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Thủ thư và nhân viên thư viện là những người thu thập và lưu trữ các tài liệu; ghi lại hoặc cho mượn và thu lại sách báo, tài liệu; lấy và cung cấp thông tin theo yêu cầu. Họ còn được gọi bằng một thuật ngữ khác rộng hơn là người quản lí tài liệu.', '["Tự động hóa thư viện và xây dựng mạng lưới", "Thư viện kĩ thuật số", "Mục lục và tóm tắt", "Quản lí nội dung", "Các công cụ công nghệ thông tin"]', '["Tổ chức, phát triển và bảo tồn bộ sưu tập có hệ thống các sách, ấn phẩm định kì, và các tài liệu giấy, âm thanh và hình ảnh", "Lựa chọn và đề xuất mua lại các sách và các tài liệu in ấn, âm thanh-hình ảnh khác", "Tổ chức, phân loại và quản lí hệ thống tài liệu thư viện", "Tổ chức và quản lí hệ thống đồ vật mượn và mạng lưới thông tin", "Thu hồi tài liệu và cung cấp thông tin cho doanh nghiệp và người sử dụng khác dựa trên các bộ sưu tập trong thư viện và các hệ thống mạng lưới thông tin", "Thực hiện nghiên cứu và phân tích, thay đổi các dịch vụ thư viện và thông tin theo những yêu cầu của người sử dụng", "Chuẩn bị tài liệu và báo cáo học thuật"]', '["Thư viện các trường ĐH, CĐ", "Thư viện công cộng hoặc tư nhân", "Các cơ quan nghiên cứu và phát triển", "Các doanh nghiệp", "Thư viện số (sử dụng mạng Internet)"]', TRUE),
-    ('Biên tập viên nhà xuất bản', 'CA', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Biên tập viên làm việc với các tác giả, giúp họ trình bày tác phẩm của họ một cách lôi cuốn, chỉnh sửa và hoàn thiện bản thảo. Ngày nay, với sự phát triển của internet, ngành xuất bản cũng được mở rộng. Các biên tập viên cũng tham gia xây dựng nội dung trên mạng và kiểm tra xem các nội dung này có sử dụng ngôn ngữ chính xác và trình bày một cách hấp dẫn hay không.', '["Biên tập sách", "Biên tập tạp chí", "Biên tập báo", "Biên tập trên internet"]', '["Quyết định về vấn đề xuất bản sản phẩm phù hợp với các chính sách và hướng dẫn của nhà xuất bản", "Đọc bản thảo để đảm bảo văn phong và ngôn ngữ được sử dụng một cách chính xác", "Quản lí công việc hàng ngày của báo chí", "tạp chí, các tài liệu cần xuất bản", "Xác định các chủ đề, sự kiện và câu chuyện có liên quan, phân công công việc cho biên tập viên cấp dưới, các phóng viên và nhiếp ảnh gia để đảm bảo tiến độ theo kế hoạch của nhóm", "Viết các bài báo và bài xã luận về các chủ đề cụ thể"]', '["Các nhà xuất bản", "Các phòng ban phụ trách công việc xuất bản của các trường ĐH", "Báo", "Tạp chí", "Các doanh nghiệp kinh doanh mạng thông tin internet"]', TRUE),
-    ('Nhà nghiên cứu khoa học xã hội', 'IAS', 'Ngôn ngữ', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Khoa học xã hội quan tâm tới hành vi, bản chất và cuộc sống của con người như một chủ thể xã hội. Các nhà nghiên cứu khoa học xã hội nghiên cứu xã hội loài người và những mối quan hệ giữa người và người trong xã hội. Có nhiều ngành khoa học xã hội như nhân chủng học, kinh tế học, lịch sử, khoa học chính trị, xã hội học, tâm lí học, tội phạm học, luật học, nghệ thuật học và các khoa học tương tự. Nói rộng ra, những bộ môn liên quan đến nhân học và nghệ thuật đều là các môn khoa học xã hội.', '["Nhân chủng học", "Kinh tế học", "Lịch sử", "Triết học", "Khoa học chính trị", "Tâm lí học", "Xã hội học"]', '["Tìm hiểu các lí thuyết giải thích về hành vi của con người và xã hội", "Giảng dạy những lí thuyết này cho sinh viên", "Tiến hành nghiên cứu để giải thích, xác nhận hoặc phê bình các lí thuyết hiện hành", "Tiến hành nghiên cứu để phát triển các lí thuyết mới giải thích cho hành vi con người", "Sử dụng dữ liệu nghiên cứu và các nguyên tắc lí thuyết để khuyến khích cổ vũ sự phát triển hài hòa về xã hội, tâm lí, tình cảm của cả cá nhân và nhóm người"]', '["Giáo viên tại các trường ĐH, CĐ, TC", "Các tổ chức chính phủ", "Các tổ chức tình nguyện", "Các tổ chức phi chính phủ", "Các tổ chức quốc tế", "Các tập đoàn kinh tế"]', TRUE),
-    ('Nhà sử học', 'I', 'Ngôn ngữ', 'Thu thập thông tin', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Nhà sử học cho chúng ta biết về quá khứ nhờ tiến hành nghiên cứu và mô tả hoạt động của con người trong quá khứ, như lịch sử của cộng đồng, quốc gia, doanh nghiệp, các thời kì và sự kiện cụ thể, các cá nhân và ý tưởng... Nhờ có các tư liệu lịch sử mà chúng ta có thể hiểu hiện tại và hoạch định tương lai.', '["Các thời kì, triều đại trong lịch sử Việt Nam (ví dụ: triều Trần, triều Lê, triều Nguyễn)", "Các nhân vật lịch sử cụ thể VN và TG (ví dụ: Trần Hưng Đạo, Hồ Chí Minh, Võ Nguyên Giáp, Lê Nin...)", "Các sự kiện lịch sử VN và TG (ví dụ: các cuộc cách mạng, chiến tranh, hiệp ước hòa bình, dịch bệnh lớn trong lịch sử)", "Liên kết với các môn khoa học khác như kinh tế học, nhân chủng học hay xã hội học", "Lịch sử các quốc gia, khu vực địa lí, theo thời gian (ví dụ: lịch sử Việt Nam, lịch sử châu Âu...) – Lịch sử VN, Lịch sử thế giới (cận đại, trung đại...)"]', '["Kiểm tra thông tin về những gì xảy ra trong quá khứ bằng cách nghiên cứu các tác phẩm của nhà sử học đi trước", "Truyền đạt thông tin về lịch sử cho học sinh, sinh viên", "Kiểm tra bản gốc của các nhật kí, bản thảo, lưu trữ, báo cáo, thống kê, hiện vật, thư từ, báo, tạp chí và các tập san để tạo ra một bức tranh về một thời kì cụ thể", "Liên kết thông tin từ các giai đoạn khác nhau để phát triển một ý tưởng hoàn chỉnh hơn về các sự kiện, đời sống con người", "Ghi lại các kết quả và phát hiện dưới hình thức báo cáo, sách, bài báo và phổ biến qua các cuộc triển lãm, bảo tàng", "Sử dụng dữ liệu nghiên cứu và các nguyên tắc lí thuyết để khuyến khích cổ vũ sự phát triển hài hòa về xã hội, tâm lí, tình cảm của cả cá nhân và nhóm người"]', '["Dạy học trong các cơ sở giáo dục", "Các tổ chức tình nguyện", "Các cơ quan chính phủ", "Các tổ chức quốc tế", "Các nhóm nghiên cứu hành vi của con người", "Các viện bảo tàng", "Cơ quan lưu trữ"]', TRUE),
-    ('Nhà biên kịch, nhà văn và các nghề có liên quan', 'AIS', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà biên kịch, nhà văn và các nghề có liên quan làm công việc sáng tác và viết kịch bản phim, kịch, tác phẩm phát thanh và truyền hình, truyện đọc, tiểu thuyết... Các tác phẩm văn học. Nhà Văn có thể sáng tác những tác phẩm văn học và viết kịch bản. Nhà biên kịch có thể khai thác một ý tưởng, cốt truyện gốc hoặc chuyển thể các tác phẩm văn học đã được xuất bản sang một dạng kịch bản phù hợp với hình thức sản xuất.', '["Viết truyện ngắn, tiểu thuyết", "Viết kịch bản phim tài liệu", "Viết kịch bản kịch", "Viết kịch bản phim", "Chỉnh sửa kịch bản"]', '["Sáng tác các tác phẩm văn học theo các thể loại khác nhau", "Nghiên cứu một tác phẩm văn học, tìm hiểu toàn bộ cốt truyện", "Nghiên cứu nguồn gốc và bối cảnh câu chuyện", "Phát triển phong cách của kịch bản dựa trên thảo luận với đạo diễn và những người khác trong nhóm", "Chuyển thể câu chuyện sang dạng kịch bản: viết các cảnh, viết lời thoại cho các nhân vật khác nhau", "Kiểm tra kịch bản", "Hoàn thiện kịch bản cuối cùng để đưa vào sản xuất. Hoàn thiện tác phẩm văn học của mình và chuyển cho nhà biên tập"]', '["Các xưởng sản xuất phim", "Các đoàn kịch, đoàn nghệ thuật", "Các doanh nghiệp sản xuất chương trình phát thanh, truyền hình", "Các doanh nghiệp quảng cáo", "Hội Văn học Việt nam"]', TRUE),
-    ('Nhà báo', 'AEI', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Thành tựu', 'Nhà báo là những người viết, biên tập, sản xuất các ấn phẩm báo chí (truyền hình, phát thanh, báo viết, báo mạng).', '["Báo điện tử", "Báo thời trang", "Báo ảnh", "Báo in", "Báo thể thao", "Tranh biếm họa hoặc minh họa cho báo chí"]', '["Tìm hiểu, thu thập và trình bày một cách khách quan những thông tin quan trọng bằng từ ngữ, hình ảnh, âm thanh theo cách công chúng dễ đọc, dễ hiểu", "Một số nhà báo có thể biên tập thông tin, viết bình luận, phân tích chuyên sâu về một vấn đề công chúng quan tâm", "Vấn đề thời sự nóng", "Trong một số trường hợp, nhà báo có thể điều tra tường tận (như thám tử) về một vấn đề được quan tâm, thông thường liên quan đến hành vi phạm tội, gian lận và tham nhũng"]', '["Tòa soạn các loại Báo viết", "Các loại Tạp chí", "Văn phòng thông tin báo chí", "Báo mạng, các đài truyền hình và đài phát thanh"]', TRUE),
-    ('Nhà ngôn ngữ học', 'AIC', 'Ngôn ngữ', NULL, 'Làm việc với con người', 'Ngôn ngữ', 5, NULL, NULL, NULL, 'Nhà ngôn ngữ học nghiên cứu các thành phần cơ bản của một ngôn ngữ nào đó, chẳng hạn như ngữ âm, ngữ nghĩa và chữ viết. Ở góc độ khác, nghề này liên quan tới việc học và sử dụng thành thạo một ngôn ngữ cụ thể. Để trở thành một nhà ngôn ngữ học cần phải tìm hiểu về các thành phần cơ bản của ngôn ngữ. Ngoài ra, học một ngôn ngữ cụ thể thì bạn có thể trở thành một người biên dịch, phiên dịch hoặc giáo viên ngôn ngữ.', '["Ngôn ngữ học", "Ngôn ngữ học xã hội", "Ngôn ngữ học tâm lí", "Giảng dạy ngôn ngữ", "Biên dịch và phiên dịch", "Các rối loạn về khả năng học ngôn ngữ"]', '["Nghiên cứu để hiểu nguồn gốc lịch sử của ngôn ngữ", "Tìm hiểu và trình bày bằng văn bản những hiểu biết về các khía cạnh ngữ âm (nói) và chữ viết của một ngôn ngữ", "Tìm hiểu cá tác phẩm văn học viết bằng một ngôn ngữ nào đó", "Phát triển phương pháp dạy một ngôn ngữ", "Theo dõi và tìm hiểu quá trình phát triển của ngôn ngữ và mối liên hệ của nó với đời sống đương đại"]', '["Phòng ban, khoa, bộ môn của trường ĐH", "Giáo viên ngoại ngữ", "Các tổ chức cần người biên dịch, phiên dịch", "Trung tâm điều trị trẻ em bị rối loạn khả năng học ngôn ngữ", "Nhà xuất bản"]', TRUE),
-    ('Biên dịch và phiên dịch', 'AS', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Biên dịch và phiên dịch nghiên cứu nguồn gốc, sự phát triển và cấu trúc của các ngôn ngữ, dịch viết và dịch nói từ ngôn ngữ này sang ngôn ngữ khác.', '["Chuyên về một ngôn ngữ cụ thể (ví dụ: ngôn ngữ cổ, tiếng Anh, tiếng Nhật...)", "Chuyên về một lĩnh vực cụ thể (ví dụ: dịch về pháp luật, y tế, khoa học, công nghệ, văn học, thương mại, du lịch, hàng không...)"]', '["Nghiên cứu mối quan hệ giữa các ngôn ngữ gốc cổ đại và các nhóm ngôn ngữ hiện đại, tìm hiểu nguồn gốc và sự tiến hóa của từ, ngữ pháp và hình thái ngôn ngữ", "Tư vấn hoặc biên soạn các hệ thống phân loại ngôn ngữ, ngữ pháp, từ điển và các tài liệu tương tự", "Dịch viết từ ngôn ngữ này sang ngôn ngữ khác, đảm bảo diễn đạt chính xác ý nghĩa của bản gốc hay của các tài liệu pháp lí, kĩ thuật và khoa học", "Diễn đạt hoặc chuyển tải một cách chính xác hết mức có thể từ ngữ, cú pháp, tinh thần và văn phong của bản gốc", "Dịch nói từ ngôn ngữ này sang ngôn ngữ khác tại các hội nghị, cuộc họp và các hoạt động tương tự, đảm bảo diễn đạt ý nghĩa chính xác và truyền tải được hết mức có thể tinh thần của lời nói gốc"]', '["Các doanh nghiệp có bộ phận dịch thuật", "Các công ty tổ chức sự kiện", "Các doanh nghiệp có vốn đầu tư nước ngoài", "Các doanh nghiệp thường xuyên giao dịch với khách hàng nước ngoài", "Vụ, phòng, bộ phận quan hệ quốc tế của các cơ quan Nhà nước", "Các tổ chức quốc tế như các cơ quan Liên Hợp Quốc, tổ chức phi chính phủ, tổ chức tài trợ..."]', TRUE),
-    ('Đạo diễn phim, sân khấu', 'EAS', 'Ngôn ngữ', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Đạo diễn phim, sân khấu, còn gọi là đạo diễn và nhà sản xuất điện ảnh, sân khấu, là người chỉ đạo và sản xuất phim, các tác phẩm truyền hình, phát thanh và chương trình biểu diễn trên sân khấu.', '["Phim ngắn dùng cho mục đích quảng cáo", "Phim tài liệu", "Phim truyện", "Kịch", "Ca nhạc"]', '["Nghiên cứu kịch bản, lựa chọn diễn viên, hướng dẫn diễn viên về diễn xuất, và chỉ đạo các mặt của sáng tác kịch diễn trên sân khấu, truyền hình, phát thanh hoặc phim nhựa", "Đưa ra quyết định cuối cùng về trang phục, thiết kế, âm thanh và hiệu ứng ánh sáng", "Phối hợp chặt chẽ với nhà quay phim, giám đốc âm nhạc và kĩ thuật viên âm thanh nhằm đảm bảo cho công việc sản xuất của bộ phim", "Duy trì quan hệ với các nhà phân phối phim để bộ phim được trình chiếu ở nhiều nơi khác nhau"]', '["Các doanh nghiệp quảng cáo", "Bộ phận truyền thông trong các cơ quan Nhà nước", "Các xưởng sản xuất phim", "Các đoàn kịch, đoàn nghệ thuật"]', TRUE),
-    ('Kĩ thuật viên ghi chép sổ sách y tế và thông tin về sức khỏe', 'CS', 'Ngôn ngữ', NULL, 'Phân tích - logic', 'Ngôn ngữ', 4, NULL, NULL, NULL, 'Kĩ thuật viên ghi chép sổ sách y tế và thông tin về sức khỏe là chuyên gia trong việc lưu trữ cập nhật hồ sơ tại các bệnh viện, phòng khám và các cơ sở chăm sóc sức khỏe. Hồ sơ của mỗi bệnh nhân phải được lưu trữ cẩn thận và có thể truy cập một cách dễ dàng. Kĩ thuật viên sử dụng dữ liệu về hồ sơ y tế và hệ thống phân loại để lập và duy trì bộ phận quản lí hồ sơ y tế của một bệnh viện.', '["Các bộ phận cụ thể của hệ thống phân loại (ví dụ: hồ sơ khoa khám bệnh, khoa tim mạch...)", "Các hệ thống công nghệ lưu trữ và truy cập (ví dụ: hệ thống hồ sơ giấy, hệ thống hồ sơ điện tử...)", "Các đối tượng lập hồ sơ cụ thể (ví dụ: hồ sơ bệnh nhân, hồ sơ bệnh học...)"]', '["Sử dụng các phương pháp phân loại để duy trì một hệ thống phân loại hồ sơ y tế của bệnh nhân", "Sử dụng các phương pháp phân loại để duy trì hệ thống thông tin y tế", "Chuyên nghiệp hóa bằng các phương pháp quản lí thông tin y tế bao gồm cả các hệ thống trên máy vi tính để xác định hồ sơ bệnh nhân, mã hóa các bệnh", "Thiết kế các biểu mẫu khác nhau cho các loại bệnh nhân khác nhau", "Phát triển các phương pháp mới để quản lí thông tin y tế", "Thiết kế hệ thống lưu trữ hồ sơ và thông tin", "Dạy và đào tạo các nhân viên khác"]', '["Các bệnh viện, phòng khám", "Các phòng xét nghiệm y tế", "Các bệnh viện của trường y", "Các trung tâm nghiên cứu"]', TRUE),
-    ('Kĩ thuật viên bảo tàng', 'ICR', 'Ngôn ngữ', 'Thu thập thông tin', 'Phân tích - logic', 'Ngôn ngữ', 4, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Kĩ thuật viên bảo tàng là người làm công việc đánh số hạng mục, phân loại và bảo quản hiện vật trong toàn bộ hoặc một bộ phận của bảo tàng. Trong khi đó, người quản lí bảo tàng là người chịu trách nhiệm bảo quản tổng thể bảo tàng. Trong bảo tàng, có ba vị trí cùng làm việc với các nhà sử học và khảo cổ học là kĩ thuật viên, người quản lí và chuyên viên lưu trữ văn thư.', '["Kĩ thuật viện bảo tàng thường được đào tạo cơ bản trong một ngành cụ thể (ví dụ: nhân chủng học, nghệ thuật, nghệ thuật trang trí, lịch sử tự nhiên, lịch sử xã hội, khoa học hoặc công nghệ). Sau đó, họ được chuyên môn hóa trong việc bảo quản và trưng bày các hiện vật thuộc về ngành đó. Một kĩ thuật viên viện bảo tàng học được đào tạo cơ bản về động vật học có thể chuyên về động vật thời tiền sử, hoặc một nhà nhân loại học có thể chuyên về các loại vũ khí của một nền văn hóa nhất định..."]', '["Mua các hiện vật cho bảo tàng", "Kiểm tra các hiện vật để xác định tình trạng và tính xác thực của nó", "Phân loại hiện vật", "Tổ chức bảo tồn và phục hồi hiện vật", "Lưu và cập nhật hồ sơ của tất cả các hiện vật trong các bộ sưu tập", "Tổ chức triển lãm, trưng bày trong bảo tàng và hợp tác với các bảo tàng khác trên thế giới", "Sắp xếp việc cho mượn hiện vật với các bảo tàng khác", "Thực hiện chương trình giảng dạy và giải đáp thắc mắc", "Hỗ trợ các nhà nghiên cứu"]', '["Các khoa của các trường ĐH", "Các viện bảo tàng", "Các nhóm nghiên cứu"]', TRUE),
-    ('Thư kí hành chính', 'CER', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', NULL, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thư kí là người hỗ trợ công việc hành chính cho những người khác trong một tổ chức. Họ đóng vai trò quan trọng vì hoạt động của toàn bộ tổ chức phụ thuộc vào hiệu quả làm việc của họ. Ví dụ, thư kí điều hành là một chuyên gia cấp cao trong một tổ chức và hỗ trợ người đứng đầu tổ chức điều hành công ty', '["Trợ lí hành chính", "Quản trị viên văn phòng", "Nhân viên lễ tân", "Thư kí trong một loại hình doanh nghiệp cụ thể (ví dụ thư kí luật, thư kí y tế)", "Tốc kí", "Quản lí hành chính lưu trữ", "Thư kí chuyên ngành máy tính"]', '["Kiểm tra, định dạng và soạn thư từ, biên bản và báo cáo từ lời đọc, tài liệu điện tử hoặc dự thảo văn bản cho phù hợp với tiêu chuẩn soạn thảo văn bản", "Sử dụng các ứng dụng phần mềm máy tính khác nhau bao gồm cả bảng tính để phục vụ cho việc hỗ trợ hành chính", "Xử lí thư, văn bản đến hoặc đi", "rà soát, ghi chép và phân phối các email, thư từ, tài liệu", "Sắp xếp các yêu cầu họp và hẹn gặp và hỗ trợ tổ chức họp", "Tổ chức và giám sát hệ thống tài liệu", "Chủ động giải quyết các thư từ thường xuyên"]', '["Tất cả các tổ chức đều cần một thư kí tốt"]', TRUE),
-    ('Kĩ thuật viên phát thanh, truyền hình và nghe - nhìn', 'RCI', 'Ngôn ngữ', 'Thu thập thông tin', 'Phân tích - logic', 'Ngôn ngữ', NULL, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên phát thanh, truyền hình và nghe - nhìn quản lí các chức năng kĩ thuật của thiết bị để ghi lại và biên tập các hình ảnh và âm thanh và để truyền thanh, truyền hình các hình ảnh và âm thanh cũng như các dạng tín hiệu viễn thông khác trên đất liền, trên biển và trên không.', '["Biên tập âm thanh", "Biên tập các tài liệu nghe nhìn", "Biên tập phim", "Sản xuất phim", "Trợ lí sản xuất", "Nhà điều hành đài phát thanh", "Nhà điều hành truyền hình", "Kĩ thuật sản xuất chương trình truyền hình"]', '["Quản lí thiết bị để ghi âm thanh", "Quản lí các thiết bị để biên tập và trộn hình ảnh và âm thanh đã được ghi lại để đảm bảo chất lượng như ý muốn và để tạo ra các hiệu ứng hình ảnh và âm thanh đặc biệt", "Ứng dụng kiến thức trên nguyên lí và thực tế của việc ghi lại và biên tập âm thanh, hình ảnh để xác định và giải quyết các vấn đề", "Kiểm soát việc truyền phát tín hiệu và các hệ thống phát thanh truyền hình và các hệ thống vệ tinh của các chương trình phát thanh, truyền hình", "Quản lí các chương trình truyền thông, các dịch vụ vệ tinh, và các hệ thống đa thành phần trên đất liền, trên biển và trên không", "Ứng dụng kiến thức trên nguyên lí và thực tế của việc phát thanh truyền hình, của các thiết bị đầu cuối viễn thông và các hệ thống truyền tin để xác định và giải quyết các vấn đề", "Thực hiện những công việc sửa chữa các thiết bị khẩn cấp"]', '["Các công ty phát thanh", "Các công ty truyền hình", "Các công ty điện ảnh", "Dịch vụ phát thanh truyền hình công cộng"]', TRUE),
-    ('Nhân viên tổng đài dịch vụ khách hàng', 'EC', 'Ngôn ngữ', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Các doanh nghiệp thường có một tổng đài dịch vụ để giải đáp và hỗ trợ khách hàng được gọi là tổng đài dịch vụ khách hàng. Các nhân viên tổng đài dịch vụ khách hàng được đào tạo sử dụng điện thoại để giải đáp cho khách hàng về sản phẩm, dịch vụ cũng như thúc đẩy hỗ trợ việc bán sản phẩm; tạo dựng hình ảnh, thương hiệu… rất cần thiết với mỗi doanh nghiệp', '["Dịch vụ khách hàng", "Phụ trách các loại sản phẩm cụ thể", "Bán hàng và tiếp thị"]', '["Phát triển ngôn ngữ và kĩ năng giao tiếp theo yêu cầu của doanh nghiệp, bao gồm cả giọng nói, ngữ điệu, hiểu biết về văn hóa doanh nghiệp", "Học về hàng hóa, dịch vụ hay chính sách, các giao dịch tài chính của tổ chức và trả lời các câu hỏi của khách hàng", "Sử dụng điện thoại đáp ứng các yêu cầu cụ thể của khách hàng", "Liên lạc với các khách hàng tiềm năng và thu hút sự quan tâm của họ tới một sản phẩm cụ thể bằng cách mô tả cho họ qua điện thoại", "Theo dõi cuộc trò chuyện qua điện thoại để viết báo cáo, giao nhận thêm thông tin cho khách hàng nếu cần thiết"]', '["Các trung tâm hỗ trợ khách hàng của các công ty như Điện lực, bưu chính viễn thông, v.v...", "Dịch vụ chăm sóc khách hàng", "Nhân viên Bán hàng online"]', TRUE),
-    ('Hướng dẫn viên du lịch', 'SE', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Mối quan hệ', 'Hướng dẫn viên du lịch được đào tạo để đi cùng với khách du lịch trong phạm vi một quốc gia, thành phố hoặc khu vực nào đó. Họ giới thiệu với khách du lịch về ý nghĩa lịch sử, khảo cổ của những nơi họ đến hoặc các di tích, công trình nghệ thuật mà họ xem. Họ cũng giúp khách du lịch làm quen với văn hóa, môi trường, vẻ đẹp tự nhiên và những điều thú vị khác nhằm thu hút sự quan tâm của khách.', '["Các loại hình cụ thể của các tour du lịch (ví dụ: tour du lịch lịch sử, mạo hiểm, du lịch tham quan…)", "Các khu vực, địa điểm cụ thể (ví dụ: một thành phố", "một khu vực có thiên nhiên, địa hình đẹp, lạ", "một di tích lịch sử, văn hóa, tự nhiên)"]', '["Lập kế hoạch và tổ chức các tour du lịch", "Gặp các nhóm khách du lịch và sắp xếp trước kế hoạch ăn nghỉ, phương tiện đi lại và tất cả những gì cần thiết để đảm bảo khách cảm thấy hài lòng", "Dẫn tour du lịch đi xung quanh một khu vực để thăm các địa điểm hoặc di tích thú vị", "Tham gia giải quyết các vấn đề liên quan đến tổ chức chuyến đi trong suốt hành trình", "Sắp xếp các dịch vụ khác cho các thành viên của đoàn trong trường hợp cần thiết (VD: tìm bác sĩ trong trường hợp ốm đau)", "Phối hợp với tất cả các bộ phận hỗ trợ khác để chuyến đi thành công (VD: các doanh nghiệp vận tải, khách sạn)", "Nộp báo cáo cho doanh nghiệp du lịch và giải quyết công việc hành chính"]', '["Các doanh nghiệp du lịch lữ hành", "Cơ quan quản lí du lịch của Nhà nước", "Tự thành lập cơ sở kinh doanh du lịch", "Dẫn tour du lịch vào thời gian rảnh"]', TRUE),
-    ('Nhân viên marketing và bán hàng', 'ESC', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Nhân viên marketing và bán hàng trong cửa hàng và tại các cơ sở bán lẻ trực tiếp bán nhiều loại hàng hóa và dịch vụ cho khách hàng, giới thiệu chức năng và chất lượng hàng hóa và dịch vụ cho khách hiểu.', '["Trợ giúp bán hàng", "Phụ trách một quầy, mặt hàng hoặc nhóm mặt hàng cụ thể (ví dụ: hóa mĩ phẩm, thực phẩm đông lạnh, sữa...)", "Giới thiệu sản phẩm"]', '["Tìm hiểu sản phẩm, giá cả, phương thức giao hàng, bảo hành, cách sử dụng và bảo quản sản phẩm. Tìm hiểu nhu cầu và tư vấn cho khách hàng một cách phù hợp", "Chứng minh cho khách hàng thấy chất lượng sản phẩm", "Bán hàng, nhận thanh toán bằng nhiều phương thức (tiền mặt, thẻ, séc...)", "Lập hóa đơn", "Ghi sổ bán hàng", "Hỗ trợ quản lí hàng trong kho", "Sắp xếp và trưng bày hàng hóa", "Đóng gói hàng bán", "Ghi lại thông tin khách hàng"]', '["Tất cả các cửa hàng", "Trung tâm thương mại", "Điểm bán hàng", "Các siêu thị", "Bán hàng trên mạng"]', TRUE),
-    ('Chuyên gia công nghệ polyme', 'IRC', 'Phân tích - Logic', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Chuyên gia công nghệ polyme chuyên về sản xuất chất dẻo tổng hợp và các chất liên quan. Polyme là các loại vật liệu tự nhiên và tổng hợp với nhiều tính chất và mục đích sử dụng khác nhau. Các loại polyme có nhiều trong tự nhiên bao gồm tinh bột, xen-lu-lô và cao su đều mang đầy đủ các tính chất của polyme. Bên cạnh đó cũng có nhiều loại polyme nhân tạo, hay còn được gọi là nhựa. Polyme có nhiều ứng dụng ưu việt hơn nhiều so với các dạng vật liệu khác được con người khai thác và sử dụng. Các ứng dụng đó bao gồm từ việc tạo ra chất dính, nhuộm vải, nấu sợi bằng xà phòng cho tới các ứng dụng trong ngành dệt, công nghiệp sợi, các thiết bị điện tử, thiết bị y sinh và thiết bị quang học.', '["Công nghệ sản xuất chất dẻo từ Polyme", "Các hoá chất đặc biệt", "Y sinh học", "Các thiết bị y khoa", "Ống tuỳ chỉnh", "Kĩ thuật sản xuất nhựa từ chất dẻo polyme"]', '["Tiến hành nghiên cứu và tư vấn sản xuất sản phẩm từ polyme", "Phát triển các qui trình hoá học qui mô lớn để lọc và sản xuất các chất và sản phẩm từ polyme", "Nghiên cứu tiền khả thi và khả thi về việc xây dựng các nhà máy sản xuất hóa chất", " Xác định phương pháp sản xuất vật liệu và các tiêu chuẩn chất lượng để đảm bảo rằng chúng phù hợp với các thông số kĩ thuật", "Đề ra các tiêu chuẩn kiểm soát và các qui trình thủ tục đảm bảo sự an toàn và tính hiệu quả của các hoạt động sản xuất", "Tìm ra và khắc phục sai sót và trục trặc", "Tổ chức và hướng dẫn việc bảo trì, sửa chữa các thiết bị hiện đang hoạt động", "Nghiên cứu và tư vấn về mặt kĩ thuật về các vật liệu, sản phẩm hoặc một quá trình nhất định"]', '["Ngành công nghiệp hoá chất", "Ngành công nghiệp sản xuất các vật dụng từ polyme"]', TRUE),
-    ('Kĩ sư công nghệ thực phẩm', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Kĩ sư công nghệ thực phẩm và đồ uống cải tiến các kĩ thuật chế biến, bảo quản, sử dụng và đánh giá thành phần thực phẩm và đồ uống từ động thực vật hoặc nguyên liệu nhân tạo.', '["Công nghệ thực phẩm", "Công nghệ sau thu hoạch", "Công nghệ chế biến thủy sản", "Quản lí chất lượng lương thực, thực phẩm", "Kiểm nghiệm chất lượng lương thực, thực phẩm", "Kiểm tra chất lượng thực phẩm", "Chế biến dầu thực vật", "Bảo quản và chế biến các sản phẩm thuỷ sản", "Chế biến sữa", "Sản xuất bánh kẹo"]', '["Tiến hành nghiên cứu cách thức chế biến các loại thực phẩm đồ uống mới", "Cải tiến các kĩ thuật hiện có để đảm bảo giữ được chất lượng, hương vị thực phẩm đồ uống như bảo quản lạnh những đồ dễ hư hỏng, thịt, cá, đồ hộp, giữ nước của trái cây và rau", "Phát triển các biện pháp như kiểm soát lây nhiễm, trị nấm và côn trùng, lưu trữ để bảo vệ các loại thực phẩm không bị hư hỏng và thiệt hại", "Kiểm tra các thực phẩm nhiễm độc, làm giả, giá trị dinh dưỡng v;v", "bằng cách xét nghiệm sinh hóa, dinh dưỡng và các biện pháp kiểm soát chất lượng", "Phát triển phương pháp và qui trình mới thông qua nghiên cứu để phục hồi các sản phẩm hữu ích từ chất thải công nghiệp và thực phẩm trong nước", "Kiểm soát và hướng dẫn quá trình pha chế, chống ô xi hoá, kiểm nghiệm vệ sinh an toàn thực phẩm và kiểm nghiệm vi sinh"]', '["Các công ti chế biến thực phẩm đồ uống", "Bệnh viện", "Cơ sở dịch vụ ăn uống", "Cơ quan kiểm tra chất lượng", "Phòng thí nghiệm công nghệ thực phẩm"]', TRUE),
-    ('Kĩ sư phát triển phần mềm', 'IC', 'Phân tích - Logic', 'Phân tích và xử lý', NULL, 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Kĩ sư, chuyên gia phát triển phần mềm nghiên cứu, phân tích và đánh giá các yêu cầu đối với các phần mềm ứng dụng sẵn có hoặc phần mềm và hệ điều hành mới. Họ thiết kế, phát triển, thử nghiệm và duy trì các giải pháp phần mềm nhằm đáp ứng tất cả các yêu cầu.', '["Kĩ thuật  phần mềm"]', '["Nghiên cứu, phân tích và đánh giá các yêu cầu đối với các phần mềm ứng dụng và hệ điều hành của máy tính", "Nghiên cứu, thiết kế và phát triển hệ thống phần mềm", " Cố vấn cho các cán bộ kĩ thuật trong việc đánh giá sự khác biệt giữa phần cứng và phần mềm máy tính", "Phát triển và hướng dẫn thử nghiệm phần mềm và các thủ tục pháp lí", "Khắc phục lỗi của các mô hình hiện tại và áp dụng kiến thức đó vào phát triển các phần mềm mới hoặc nâng cấp các chức năng cũ và cải tiến hiệu suất hoạt động trên máy", "Hướng dẫn lên chương trình phần mềm và phát triển các tài liệu phần mềm", "Tiếp cận, phát triển, nâng cấp và ghi chép lại các qui trình thủ tục duy trì phần mềm", "Tư vấn cho khách hàng các vấn đề liên quan tới việc duy trì hệ thống phần mềm"]', '["Lập trình viên cho các công ti phần mềm", "Tư vấn phát triển phần mềm chuyên dụng cho các ngành nghề, công ty", "Kiểm tra, bảo trì, quản trị hệ thống phần mềm cho các tổ chức, công ty", "Làm việc trong các tổ chức giáo dục giảng dạy và nghiên cứu các vấn đề liên quan đến lĩnh vực này", "Chuyên gia phát triển phần mềm độc lập"]', TRUE),
-    ('Chuyên gia phân tích tài chính', 'IC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 5, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Chuyên gia phân tích tài chính điều tra, nghiên cứu các quá trình tác động tới các hoạt động tài chính của khu vực công hoặc các tổ chức tư nhân. Các hoạt động này bao gồm các chương trình nghiên cứu hay các kế hoạch ngân sách và tài chính.', '["Tài chính - ngân hàng", "Đầu tư ngân hàng", "Mua bán và sáp nhập", "Quản lí danh mục đầu tư", "Chuyên gia phân tích, đánh giá", "Chứng khoán và trái phiếu", "Tài chính doanh nghiệp", "Tín dụng tài chính."]', '["Phân tích thông tin tài chính để dự đoán các điều kiện kinh doanh, công nghiệp và kinh tế nhằm đưa ra các quyết định đầu tư", "Cập nhật kiến thức trong các lĩnh vực kĩ thuật công nghiệp, kinh doanh, tài chính và học thuyết kinh tế", "Nắm bắt được các nhân tố ảnh hưởng tới đầu tư như giá cả, sản lượng, tính ổn định, xu hướng tương lai trong quản lí rủi ro và các tác động kinh tế", "Giám sát các hoạt động kinh tế, công nghiệp và hợp tác thông qua phân tích thông tin thu thập được từ các báo cáo tài chính và dịch vụ của các hãng đầu tư vào lĩnh vực ngân hàng, các tổ chức chính phủ, các ấn phẩm thương mại, nguồn lực của công ti,và từ phỏng vấn cá nhân", "Đề xuất đầu tư và thời điểm đầu tư với các công ti, cán bộ phụ trách đầu tư của công ti hoặc đầu tư công", "Xác định mức giá an toàn để có thể cung ứng các dịch vụ tư vấn chứng khoán công", "Chuẩn bị kế hoạch hành động cho hoạt động đầu tư dựa trên các phân tích tài chính"]', '["Ngân hàng", "Các công ti bảo hiểm", "Các quĩ chung", "Các công ti chứng khoán", "Người môi giới chứng khoán", "Tư vấn tài chính", "Quản lí tài chính"]', TRUE),
-    ('Nhà thiên văn học', 'IAR', 'Phân tích - Logic', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Thiên văn học là việc nghiên cứu khoa học các thiên thể (như các ngôi sao, hành tinh, sao chổi, tinh vân, quần tinh, thiên hà) và các hiện tượng có nguồn gốc bên ngoài vũ trụ (như bức xạ nền vũ trụ). Nó nghiên cứu sự phát triển, tính chất vật lý, hoá học, khí tượng học, và chuyển động của các vật thể vũ trụ, cũng như sự hình thành và phát triển của vũ trụ. Nhà thiên văn học tiến hành nghiên cứu, phát triển các lí thuyết và phương pháp vận hành, hoặc áp dụng kiến thức khoa học liên quan tới thiên văn học vào các lĩnh vực khác. Thiên văn học và vật lí học có mối quan hệ rất gần gũi. Nền tảng toán học vững chắc cũng hết sức quan trọng. Nhà thiên văn học hiện đại không còn dành nhiều thời gian quan sát qua kính viễn vọng. Ngày nay, kính thiên văn và máy ảnh kỹ thuật số thường được kiểm soát và quản lí bởi hệ thống máy tính. Họ tập trung phân tích số liệu trên máy tính. Họ cũng thường tham gia giảng dạy ở các trường. Cần phân biệt rõ thiên văn học không phải là chiêm tinh học, mặc dù thời cổ đại hai lĩnh vực này gắn chặt với nhau.', '["Thiên văn học", "Khoa học vũ trụ và ứng dụng"]', '["Tiến hành nghiên cứu, cải tiến, phát triển khung lí thuyết, các học thuyết và các phương pháp vận hành liên quan tới thiên văn học", "Tiến hành các thực nghiệm, thí nghiệm và phân tích cấu trúc, tính chất của vấn đề ở trạng thái rắn và biểu hiện biến chuyển của vật chất đó dưới tác động của nhiệt độ, áp suất, áp lực và các điều kiện khác", "đánh giá kết quả điều tra và thực nghiệm nhằm đưa ra kết luận chủ yếu bằng việc sử dụng các kĩ thuật và các mô hình toán học", "Phát triển hoặc cải tiến ứng dụng trong các lĩnh vực công nghiệp, y học, quân đội và các ứng dụng thực nghiệm khác của các nguyên lí và kĩ thuật thiên văn học", "Quan sát, phân tích và nhận thức được các hiện tượng thiên văn học cũng như phát triển các phương pháp và kĩ thuật được sử dụng trong các lĩnh vực như hàng hải hay khám phá vũ trụ", "Chuẩn bị các nghiên cứu và báo cáo khoa học", "Giám sát và chỉ đạo những người cùng làm việc"]', '["Làm cho các cơ quan công lập và các tổ chức nghiên cứu vũ trụ", "Làm cho các tổ chức phi chính phủ bao gồm chế tạo các kính viễn vọng, tổ chức các buổi phổ biến thực hành quan sát thiên văn học trong cộng đồng", "Ví dụ về các lĩnh vực khác bao gồm các đài thiên văn, cung thiên văn, công viên khoa học và các trường ĐH"]', TRUE),
-    ('Nhà khí tượng học', 'IR', 'Phân tích - Logic', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Nhà khí tượng học tiến hành nghiên cứu, cải tiến hoặc phát triển các khái niệm, lí thuyết và phương pháp hoạt động liên quan đến các thành phần, cấu trúc và những biến đổi của bầu khí quyển. Họ dự báo thời tiết một cách chi tiết hoặc dài hạn để sử dụng trong ngành hàng không, vận tải biển, nông nghiệp và thông tin đại chúng.', '["Khí tượng học"]', '["Nghiên cứu, cải tiến và phát triển các khái niệm, học thuyết và phương pháp hoạt động liên quan tới thành phần cấu tạo, cấu trúc và các động lực học của khí quyển", "Thu thập dữ liệu về hướng và tốc độ chuyển động của không khí, áp suất, nhiệt độ, độ ẩm và các hiện tượng khác như sự hình thành mây và mưa, nhiễu điện từ hoặc bức xạ năng lượng mặt trời", "Nghiên cứu dữ liệu này để chuẩn bị các bản đồ và dự báo thời tiết", "Tiến hành thí nghiệm về phát tán sương, tạo mưa và các dạng kiểm soát thời tiết khác", "Chuẩn bị các tài liệu và báo cáo khoa học", "Giám sát và chỉ đạo những người cùng làm việc"]', '["Các Đài, Trạm, Trung tâm dự báo khí tượng thủy văn", "Các công ty thủy điện, thủy lợi", "Các viện nghiên cứu, Trung tâm Môi trường", "Các cơ quan thuộc Bộ TN&amp;amp;MT (gồm các đơn vị thuộc Trung tâm khí tượng thủy văn quốc gia, Viện khoa học KTTV và Môi trường), Bộ NN&amp;amp;PTNT, Viện Khoa học và Công nghệ Quốc gia, Bộ Công nghiệp, Viện nghiên cứu kĩ thuật Bảo hộ Lao động,… và cả các cơ sở hoạt động trong lĩnh vực tin học, tính toán liên quan tới KTTV"]', TRUE),
-    ('Nhà hoá học', 'IRC', 'Phân tích - Logic', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà hóa học thực hiện các nghiên cứu, cải tiến hoặc phát triển các khái niệm, học thuyết và các phương pháp hoạt động, hoặc ứng dụng các kiến thức khoa học liên quan vào hóa học, chủ yếu để kiểm nghiệm, phát triển và cải tiến các nguyên liệu, các sản phẩm và qui trình công nghiệp.', '["Phân tích hoá học", "Hoá học ăn mòn", "Hoá học môi trường", "Hoá học pháp lí", "Hoá học công nghiệp", "Hoá học vô cơ", "Hoá học hữu cơ", "Hoá dược phẩm", "Hoá học vật lí", "Hoá học polymer", "Hoá học đất đai"]', '["Thực hiện các nghiên cứu và cải tiến hoặc phát triển các khái niệm, học thuyết và các phương pháp hoạt động liên quan tới hóa học", "Thực hiện các thí nghiệm, kiểm nghiệm và phân tích để tìm ra các thành phần hóa học và năng lượng và các thay đổi hóa học trong các điều kiện tự nhiên, nhân tạo khác nhau hoặc tổng hợp các chất, các nguyên liệu và sản phẩm khác, đánh giá kết quả và đưa ra kết luận", "Phát triển hoặc cải tiến các dược phẩm và các nguyên liệu, sản phẩm và phương pháp công nghiệp khác", "Phát triển các qui trình quản lí chất lượng cho nhà sản xuất và người sử dụng", "Chuẩn bị các tài liệu và báo cáo khoa học."]', '["Làm việc trong các ngành công nghiệp hoá chất, ví dụ như nước hoa, sơn, màu vẽ và dược phẩm", "Làm việc trong các cơ quan môi trường để giảm ô nhiễm, đồng thời quản lí và tái chế chất thải", "Làm việc trong ngành công nghiệp đóng gói thực phẩm, nước uống đóng chai và các loại kẹo đóng gói"]', TRUE),
-    ('Nhà địa chất', 'IR', 'Phân tích - Logic', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Các nhà địa chất nghiên cứu cấu trúc vật lí của lớp vỏ trái đất, quá trình hình thành đá và hóa thạch để xác định từng bước thay đổi và lịch sử phát triển của trái đất, xác định vị trí khoáng sản và nhiên liệu.', '["Địa chất học", "Khoa học trái đất"]', '["Sử dụng dụng cụ và kĩ thuật để tiến hành khảo sát địa chất, lập bản đồ khảo sát không khí và ảnh hàng không, thăm dò địa chất và địa vật lí để xác định vị trí mỏ khoáng sản, mỏ dầu khí đặc biệt", "Thu thập các mẫu khoáng sản hoặc đá ở các độ sâu khác nhau phục vụ cho các nghiên cứu chi tiết để xác thành phần, chất lượng và số lượng của các mỏ khoáng sản", "Giám sát hoạt động khoan trong các khu vực có các mỏ khoáng sản kinh tế", "Chuẩn bị các báo cáo, bản đồ và biểu đồ cho thấy các hồ chứa nước ngầm, lớp đá, thân quặng lộ thiên và cấu trúc địa chất khác nhau của chúng", "Tư vấn về tính phù hợp của đất và đá để xây dựng các đập nước, đường hầm, đường giao thông, các tòa nhà trên nền móng vững chắc", "Nghiên cứu các hiện tượng tự nhiên như động đất, núi lửa, sông băng và lở núi"]', '["Làm công tác quản lí ở các cơ quan quản lí Nhà nước của nhiều Bộ, ngành khác nhau", "Các viện nghiên cứu", "Giảng dạy tại các trường ĐH, CĐ", "Các công ty khai thác dầu khí, khoáng sản..."]', TRUE),
-    ('Nhà địa lí', 'IRA', 'Phân tích - Logic', 'Thu thập thông tin; Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Nhà địa lí nghiên cứu các đặc điểm và tác dụng của bề mặt trái đất trong mối tương quan với các hiện tượng vật lí và văn hoá xã hội.', '["Địa lí học", "Bản đồ học", "Địa lí tự nhiên", "Khí tượng học", "Thủy văn"]', '["Nghiên cứu bản chất của môi trường vật chất và khí hậu ở những khu vực cụ thể bằng cách thu thập số liệu về những ứng dụng trong nhiều ngành khoa học như vật lí, địa lí, hải dương học, vũ trụ học và sinh học", "Phân tích hoạt động của con người trong các lĩnh vực khác nhau của xã hội như chính trị, kinh tế, sự di cư và tăng trưởng dân số", "và chỉ ra mối quan hệ giữa những hoạt động đó với môi trường địa lí", "Tiến hành các nghiên cứu bản đồ và vẽ bản đồ theo kích thước qui định", "Tư vấn cho Chính phủ và các tổ chức khác về các khu vực địa lí có khả năng khai thác về mặt kinh tế, xác định ranh giới về mặt chính trị và những vấn đề liên quan"]', '["Làm việc trong các cơ quan Nhà nước có nhiệm vụ qui hoạch đô thị và vùng, điều tra việc sử dụng đất, khí tượng và thị hiếu", "Làm việc trong các tổ chức tham gia vào hệ thống thông tin địa lí và dự đoán dựa trên các phần mềm ứng dụng", "Giảng dạy và nghiên cứu trong các tổ chức giáo dục đại học bao gồm các hoạt động", "Làm việc trong các cơ quan tham gia hoạch định chính sách và qui hoạch xã hội, kinh tế và môi trường"]', TRUE),
-    ('Nhà toán học', 'ICA', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Toán học là nền tảng cho tất cả các ngành khoa học. Toán học có thể nặng về lí thuyết hoặc thiên về ứng dụng. Ví dụ như trong một thùng hình vuông có thể chứa bao nhiêu quả táo hình tròn? Bài toán ứng dụng này có ý nghĩa rất lớn đối với những người hàng ngày phải đóng gói và chuyển đi hàng triệu quả táo. Đó là vấn đề mà một nhà toán học cần giải quyết. Các nhà toán học và các nhà nghiên cứu liên quan tới toán học tiến hành nghiên cứu và phát triển các khái niệm toán học và tính toán rủi ro (xem thêm nghề Thống kế bảo hiểm), các lí thuyết, các phương pháp và kĩ thuật vận hành. Họ tư vấn cho các chuyên gia hoạt động trong nhiều lĩnh vực như kĩ thuật, kinh doanh, y tế, khoa học, đời sống tự nhiên và xã hội. Nhiệm vụ cụ thể của một nhà toán học phụ thuộc vào lĩnh vực', '["Toán học", "Toán cơ", "Toán ứng dụng"]', '["Nghiên cứu, cải tiến, phát triển các lí thuyết và thuật toán", "Nghiên cứu, cải tiến, phát triển các lí thuyết và kĩ thuật tính toán rủi ro", "Tư vấn và áp dụng các nguyên tắc, mô hình và thuật toán vào nhiều lĩnh vực như kĩ thuật, kinh doanh, y khoa, các lĩnh vực khác trong các ngành khoa học, đời sống tự nhiên và xã hội", "Tiến hành phân tích logic về các vấn đề quản lí, đặc biệt là tính hiệu quả đầu vào-đầu ra và xây dựng các mô hình toán cho các vấn đề liên quan tới lập trình các chương trình và giải pháp xử lí bằng máy tính", "Thiết kế và đưa vào vận hành lộ trình lương hưu và hệ thống bảo hiểm nhân thọ, y tế, an sinh xã hội và các hình thức bảo hiểm khác", "Chuẩn bị báo cáo và nghiên cứu khoa học"]', '["Các viện hàn lâm", "Các tổ chức nghiên cứu", "Nghiên cứu và phát triển công nghiệp", "Các công ty bảo hiểm", "Giảng dạy nghiên cứu tại các trường ĐH"]', TRUE),
-    ('Nhà thống kê', 'CI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Ngôn ngữ', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Nhà thống kê ứng dụng toán học vào phân tích số liệu, ví dụ như quyết định lựa chọn việc làm chịu ảnh hưởng lớn từ các yếu tố nào: mức lương hay thời hạn hợp đồng? Một nhãn hiệu trà mới có thể bán chạy ở khu vực thành thị hay nông thôn? Đây là những ví dụ thống kê đơn giản. Hầu hết các nhà nghiên cứu, hoạch định và quản lí phụ thuộc rất nhiều vào các nhà phân tích thống kê.', '["Thống kê kinh tế, xã hội", "Thống kê kinh doanh"]', '["Nghiên cứu, cải tiến và phát triển các lí thuyết và phương pháp thống kê", "Thiết kế bảng hỏi nghiên cứu", "Lên kế hoạch và tổ chức các cuộc điều tra lấy số liệu", "Đánh giá, xử lí, phân tích và diễn giải số liệu thống và chuẩn bị phát hành", "Tư vấn hoặc áp dụng các phương pháp thu thập dữ liệu khác nhau cũng như các phương pháp và kĩ thuật thống kê", "Chuẩn bị bài báo khoa học và các báo cáo."]', '["Các cơ quan Nhà nước, chẳng hạn như Cục thống kê, bộ phận thống kê của các cơ quan chính quyền", "Các tổ chức kinh doanh dự đoán nhu cầu về các sản phẩm và phân tích rủi ro, lợi nhuận khi đầu tư", "Hỗ trợ các nhà nghiên cứu cả trong khoa học tự nhiên và xã hội", "Các tổ chức nghiên cứu và giáo dục", "Tạp chí và báo phân tích thị trường tài chính", "Kênh thể thao và các hiệp hội cung cấp bình luận đi kèm với điểm phân tích, và các thông tin khác có liên quan"]', TRUE),
-    ('Thống kê bảo hiểm', 'CEI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Nhà thống kê bảo hiểm đảm nhiệm việc tính toán các rủi ro. Họ là những chuyên gia trong việc tính phí bảo hiểm đối với những dạng rủi ro khác nhau dựa trên các tính toán tài chính, toán học và thống kê.', '["Toán ứng dụng (toán tài chính, toán kinh tế)", "Bảo hiểm"]', '["Nghiên cứu, cải tiến, phát triển các lí thuyết và kĩ thuật định phí bảo hiểm", "Thu thập và phân tích số liệu từ các nguồn khác nhau liên quan tới các khoản phí chi cho người bị thương, đau ốm, khuyết tật hoặc tử vong", "Thu thập và phân tích số liệu từ các nguồn khác nhau liên quan tới mất mát tài sản do hoả hoạn, trộm cướp, cháy nổ và các mối nguy hại", "Tính toán tần suất có thể có của các rủi ro đó", "Cố định tỉ lệ tăng thêm của các loại hình rủi ro khác nhau có tính đến thị trường tiền tệ, các điều kiện kinh tế và các xu hướng thị hiếu tương lai", "Tiếp tục nghiên cứu các hướng phát triển và kinh doanh mới, các yếu tố pháp luật, xã hội cũng như các yếu tố khác ảnh hưởng tới việc kinh doanh bảo hiểm", "Khuyến nghị các biện pháp quản trị phù hợp với chính sách tương lai và các khoá đào tạo nhằm nâng cao doanh thu"]', '["Các công ty bảo hiểm", "Các công ty tài chính", "Các công ty tư vấn", "Các phòng ban bảo hiểm của Nhà nước", "Các trường ĐH và CĐ", "Các hãng đầu tư và ngân hàng", "Các đơn vị kế toán công và liên doanh lớn"]', TRUE),
-    ('Nhà sinh vật học', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà sinh vật học nghiên cứu về sự sống và các hệ sinh vật. Họ tiến hành nghiên cứu, cải tiến hoặc phát triển các lí thuyết và phương pháp vận hành cũng như áp dụng kiến thức khoa học liên quan tới sinh vật học, vi sinh vật học, vi khuẩn học, tế bào học, nghiên cứu gen, động vật học, thực vật học và sinh thái học, đặc biệt trong các lĩnh vực dược và nông nghiệp.', '["Sinh vật học", "Động vật học", "Thực vật học", "Vi sinh", "Sinh học ứng dụng (công nghệ sinh học)"]', '["Tiến hành thử nghiệm trong thực tế, trong phòng thí nghiệm những vấn đề liên quan tới tất cả các dạng của sự sống bằng cách xác định và phân loại các nhóm người, động vật, bò sát hoặc các loài cây", "nghiên cứu tìm hiểu về nguồn gốc, sự phát triển, tính chất vật lí, hoá học, cấu trúc, thành phần và sự tái tạo của chúng", "Nghiên cứu và tiến hành các thực nghiệm liên quan tới cấu trúc, sự phát triển và tính chất của các hệ vi sinh vật như vi khuẩn, virus", "Nghiên cứu và tiến hành các thực nghiệm liên quan tới các yếu tố hình thành nên nguồn gốc, sự phát triển và quá trình chuyển đổi các tính chất di truyền học ở tất cả các dạng của sự sống", "Nghiên cứu sự sống của tất cả các cây cỏ và động vật để phát triển các ứng dụng thực tế trong các lĩnh vực như nông nghiệp, dược dựa trên những kiến thức này", "Nghiên cứu và tiến hành thực nghiệm liên quan tới chức năng của các tế bào sống cũng như các ảnh hưởng của các nhân tố vật lí, hoá học đối với các tế bào bình thường và bất thường", "Nghiên cứu mối liên kết giữa động, thực vật với các yếu tố môi trường liên quan", "Phát triển các ứng dụng trong lĩnh vực công nghiệp và y học. 8. Chuẩn bị nghiên cứu khoa học và các báo cáo"]', '["Đây là chuyên ngành chính làm nền tảng cho các ngành nghề liên quan tới khoa học về sự sống. Nơi làm việc cụ thể của nhà sinh vật học phụ thuộc vào lĩnh vực chuyên sâu mà người đó chọn, ví dụ như phòng thí nghiệm sinh học, công ty dược phẩm, nhà máy thực phẩm, nhà máy bia… Bạn cũng có thể giảng dạy môn sinh học tại các trường ĐH, CĐ, TC, THPT, THCS"]', TRUE),
-    ('Nhà khoa học biển', 'IR', 'Phân tích - Logic', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà khoa học biển chủ yếu làm việc ở đại dương. Tùy thuộc vào chuyên môn mà họ nghiên cứu những vật thể không có sự sống (ví dụ như đất, đá ở đáy biển, nước, cát…) hoặc vật thể sống trong đại dương (ví dụ như động vật biển, sinh vật biển…). Các nhà khoa học biển sử dụng máy móc thiết bị chuyên dụng, hình ảnh vệ tinh và lặn dưới nước để thu thập dữ liệu về các đại dương. Họ góp phần bảo vệ môi trường bằng cách phát minh ra phương pháp bảo vệ các vùng nước và bờ biển khỏi ô nhiễm và thiệt hại. Họ ứng dụng kết quả nghiên cứu để phát triển các phương pháp dự báo, đánh giá điều kiện môi trường đại dương, xác định khu vực khai thác, đánh bắt thuỷ sản, cải thiện an ninh vùng biển của một quốc gia.', '["Hải dương học - hóa học", "Hải dương học - địa chất", "Hải dương học - địa vật lí", "Hải dương học - vật lí"]', '["Nghiên cứu tế bào, mô và đời sống của sinh vật trong đại dương", "Đánh giá tác động của môi trường bên trong và bên ngoài đối với các sinh vật trong đại dương", "Tiến hành thăm dò đại dương để thu thập dữ liệu về hình dạng, tính chất của đáy đại dương và các hiện tượng như thủy triều, dòng chảy, núi băng trôi", "Tiến hành phân tích hóa học đáy đại dương và nước biển ở các độ sâu khác nhau", "Lập bản đồ và biểu đồ tích tụ cát trên bãi biển", "Xây dựng một bức tranh toàn diện và thống nhất về các vận động diễn biến của đại dương", "Đánh giá tác động của môi trường bên trong và bên ngoài đối với cấu tạo vật lí của đại dương (ví dụ như đáy đại dương, bờ biển)", "Viết báo cáo dựa trên kết quả nghiên cứu để cung cấp thông tin cho công chúng, chính phủ, các tổ chức môi trường, tổ chức khai thác tài nguyên thiên nhiên và đánh bắt thuỷ sản"]', '["Các viện nghiên cứu của Trung tâm Khoa học tự nhiên và công nghệ quốc gia", "Các viện, trung tâm nghiên cứu và các đài, trạm của Tổng cục Khí tượng thủy văn", "Tập đoàn Dầu khí", "Các đơn vị chuyên môn của quân đội, các cơ quan, doanh nghiệp trong các ngành kinh tế, kĩ thuật liên quan tới khí hậu, tài nguyên, nước và biển…", "Các trường đại học"]', TRUE),
-    ('Kĩ sư và kĩ thuật viên công nghệ sinh học', 'RIC', 'Phân tích - Logic', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ sư công nghệ sinh học áp dụng các nguyên tắc sinh học ở cấp độ “công nghiệp” để kiểm soát, cải tiến và quản lí các quá trình biến đổi về mặt sinh học tồn tại trong tự nhiên như sự lên men, quá trình sản xuất chất xúc tác enzyme nhằm nâng cao lợi ích cho con người bằng nhiều cách khác nhau. Công nghệ sinh học có nhiều ứng dụng trong các lĩnh vực chăm sóc sức khoẻ, nông nghiệp, quản lí môi trường và bào chế thuốc.', '["Công nghệ sinh học"]', '["Tham gia nghiên cứu hệ vi sinh vật như vi khuẩn, nấm, men và enzyme", "Tiến hành nghiên cứu trong các lĩnh vực biến đổi gien và sinh học phân tử, bao gồm việc nhân bản cây cối, động vật và con người từ gien", "Sử dụng vi khuẩn, chất xúc tác và các sinh vật khác cho các mục đích khác nhau trong công nghiệp, sản xuất nông nghiệp, sản xuất thực phẩm và loại bỏ chất thải", "Phát triển và thử nghiệm các phương pháp sản xuất mới", "Điều chỉnh gen của các cơ quan để tạo ra sản phẩm mới", "Tương tác với khách hàng để đưa ra các giải pháp dựa trên kĩ thuật sinh học", "Tính toán ngân sách và chi phí sản xuất cũng như chuẩn bị mua lại hoặc tự phát triển các ứng dụng", "Tư vấn cho Chính phủ, các tổ chức hoặc các doanh nghiệp trong lĩnh vực kĩ sinh học"]', '["Làm việc trong các phòng nghiên cứu thí nghiệm của Nhà nước và tư nhân", "Làm việc trong các doanh nghiệp bào chế thuốc và dược phẩm, sản xuất chất hoá học, nông nghiệp và các ngành liên quan", "Làm việc trong các tổ chức giáo dục liên quan tới giảng dạy và nghiên cứu"]', TRUE),
-    ('Kĩ thuật y sinh', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ thuật y sinh tiến hành nghiên cứu các khía cạnh khác nhau của con người hay các loài động vật nhằm kiểm tra, chứng minh hoặc điều chỉnh hệ thống lí thuyết về sự sống đã biết. Những thông tin này được sử dụng để thiết kế bộ máy hỗ trợ cho sự sống, tối đa hoá lợi ích của các nguyên tắc trong khoa học kĩ thuật và hành vi của sinh vật.', '["Kĩ thuật y sinh", "Kĩ thuật hình ảnh y học", "Thiết bị sinh học", "Vật liệu sinh học và cơ chế sinh học kĩ thuật", "Tế bào, mô và kĩ thuật di truyền", "Kĩ thuật lâm sàng", "Hình ảnh y tế", "Phẫu thuật chỉnh hình", "Kĩ thuật phục hồi chức năng", "Kĩ thuật điện tử y tế", "Kĩ thuật thiết bị điện tử y tế"]', '["Nghiên cứu liên kết giữa số liệu về sinh học và hành vi dựa trên các nguyên tắc về điện tích, cơ chế, hoá học và các nguyên tắc kĩ thuật khác", "Sử dụng thông tin này nhằm thiết kế và phát triển các công cụ và thiết bị như các bộ phận nhân tạo, thiết bị tạo nhịp tim, các thiết bị hình ảnh (ví dụ như máy chụp tia X-quang, máy chụp cắt lớp CT)", "Giới thiệu các thiết bị và công cụ chăm sóc sức khoẻ cá nhân", "Định hướng và đào tạo nhân lực sử dụng máy móc để quan sát, sửa chữa hoặc điều trị những tổn thương về vật chất hoặc biến dạng"]', '["Bệnh viện", "Ngành công nghiệp hoá chất", "Các tổ chức nghiên cứu", "Các cơ sở giáo dục", "Các công ty dược phẩm", "Các cơ quan chỉnh hình, phục hồi chức năng", "Chuyên gia tư vấn độc lập"]', TRUE),
-    ('Nhà nông học', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Nông nghiệp là khoa học và cũng là nghệ thuật về nuôi trồng cây cối, vật nuôi trong các nông trại. Nghề làm vườn cũng là một nhánh thuộc ngành nông nghiệp, liên quan tới các loại cây ăn quả, các loại hạt, rau, hoa và cây cảnh trong vườn hoặc vườn cây ăn quả. Dựa vào nguyên tắc hóa sinh, vi sinh học, di truyền học và các khoa học khác, nhà nông học tham gia nghiên cứu và phát triển các ứng dụng về các lĩnh vực nông nghiệp khác nhau.', '["Nông nghiệp", "Khuyến nông", "Chăn nuôi", "Nông học", "Khoa học cây trồng", "Bảo vệ thực vật", "Công nghệ rau hoa quả và cảnh quan", "Kinh doanh nông nghiệp", "Kinh tế nông nghiệp", "Phát triển nông thôn"]', '["Phát triển kĩ thuật sản xuất (ví dụ như quản lí thủy lợi)", "Nâng cao năng suất nông nghiệp về số lượng và chất lượng (ví dụ như lựa chọn các giống cây trồng có khả năng chống chịu hạn hán, phát triển các loại thuốc trừ sâu mới, công nghệ cảm ứng, các mô hình mô phỏng sự phát triển cây trồng, kĩ thuật nuôi cấy tế bào trong ống nghiệm)", "Biến đổi các sản phẩm chủ yếu thành sản phẩm đầu ra (ví dụ như sản xuất, bảo quản và đóng gói các sản phẩm sữa)", "Khắc phục các tác động bất lợi của môi trường (ví dụ như sâu bệnh, suy thoái đất, xử lí sinh học)"]', '["Làm việc với các tổ chức, doanh nghiệp phát triển máy móc thiết bị nông nghiệp, phương pháp chế biến thực phẩm, phân bón, thuốc trừ sâu, nâng cao số lượng và chất lượng cây trồng và vật nuôi", "Chuyên gia về trang trại như vườn cây ăn quả, cà phê, trang trại gia cầm ...", "Làm việc với các cơ quan Nhà nước trong lĩnh vực quản lí nông nghiệp", "Làm công tác nghiên cứu giảng dạy trong các trường ĐH, CĐ, TC"]', TRUE),
-    ('Kĩ sư thủy sản', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư thủy sản chuyên về nuôi trồng, đánh bắt các loài cá và thủy sản khác. Họ có thể làm việc về thủy sản nước ngọt, nước lợ và nước mặn.', '["Kĩ thuật khai thác thủy sản", "Nuôi trồng thủy sản", "Bệnh học thủy sản", "Quản lí nguồn lợi thủy sản"]', '["Tìm hiểu về quá trình sinh sản và đời sống của các sinh vật sống dưới nước (ví dụ nuôi cá, sò, trai ngọc)", "Tìm hiểu các bệnh có ảnh hưởng đến sự sống của các sinh vật dưới nước", "Nuôi trồng các thuỷ sinh vật phục vụ cho tiêu dùng của con người", "Sử dụng các công cụ đặc biệt để đo oxy, hàm lượng muối, độ pH và các đặc điểm khác của nước để hiểu làm thế nào những điều này ảnh hưởng đến các thuỷ sinh vật", "Duy trì các nhóm sinh vật (ví dụ như tảo) là thức ăn cho các sinh vật biển", "Duy trì hồ sơ chi tiết về nuôi hải sản và môi trường sống cũng như vòng đời của các sinh vật được nuôi", "Phát triển phương pháp đánh bắt mà không làm suy thoái môi trường", "Chế biến thuỷ sản sau thu hoạch", "Giảng dạy, tập huấn về nuôi trồng thuỷ, hải sản", "Tiến hành nghiên cứu và công bố kết quả nghiên cứu"]', '["Các công ty đánh bắt thuỷ sản", "Các tổ chức nghiên cứu và phát triển", "Các tổ chức BVMT"]', TRUE),
-    ('Kĩ sư và kĩ thuật viên lâm nghiệp', 'RIE', 'Phân tích - Logic', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ sư và kĩ thuật viên lâm nghiệp cung cấp hỗ trợ kĩ thuật, tư vấn về các vấn đề và các phương thức lâm nghiệp.', '["Lâm nghiệp", "Lâm nghiệp và đô thị", "Lâm sinh", "Quản lí tài nguyên rừng", "Kinh tế tài nguyên thiên nhiên", "Công nghệ chế biến lâm sản", "Thương mại lâm nghiệp", "Kinh tế học lâm nghiệp", "Quản lí rừng", "Lâm nghiệp xã hội", "Khoa học bảo tồn thiên nhiên hoang dã", "Khoa học và kĩ thuật gỗ"]', '["Cập nhật các phương thức và kĩ thuật lâm nghiệp", "Tư vấn các phương pháp nâng cao chất lượng đầu ra, sản lượng thu hoạch, hiệu quả vận hành hệ thống sản xuất lâm nghiệp, các biện pháp bảo tồn tài nguyên thiên nhiên và môi trường", "Đề xuất các phương pháp giải quyết các vấn đề như tình trạng xói mòn đất hay sâu bệnh phá hoại, ...", "Thu thập số liệu và ước tính số lượng, chi phí nguyên vật liệu, lao động cần thiết trong các dự án", "Tổ chức các buổi nói chuyện, thực hành mẫu, và phổ biến tài liệu nhằm nâng cao nhận thức và chuyển giao kĩ thuật", "Áp dụng kiến thức khoa học và thực tiễn để phát hiện và giải quyết các vấn đề phát sinh trong quá trình làm việc"]', '["Làm việc cho cơ quan kiểm lâm và bảo tồn rừng", "Làm việc cho các dự án về môi trường của các tổ chức phi lợi nhuận (ví dụ: Tổ chức Hoà bình xanh)", "Làm việc cho các cơ quan quốc tế về phát triển, môi trường"]', TRUE),
-    ('Chuyên gia bảo vệ môi trường', 'IRC', 'Phân tích - Logic', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Chuyên gia bảo vệ môi trường nghiên cứu, đánh giá và quản lí tác động của các hoạt động của con người đối với môi trường tự nhiên và nhân tạo. Họ áp dụng chuyên môn vào quản lí ô nhiễm, quản lí chất thải, ứng phó với biến đổi khí hậu và sự cạn kiệt, thoái hóa các nguồn lực tự nhiên. Họ xây dựng các kế hoạch, giải pháp để bảo vệ, bảo tồn, phục hồi, giảm thiểu tác hại tới môi trường', '["Khoa học môi trường", "Khoa học đất", "Công nghệ kĩ thuật môi trường", "Kĩ thuật môi trường", "Kiểm soát và BVMT", "Kinh tế tài nguyên và môi trường", "Kinh tế tài nguyên thiên nhiên", "Quản lí đất đai", "Quản lí tài nguyên và môi trường", "Quản lí chất thải", "BVMT đô thị", "BVMT công nghiệp", "BVMT biển", "Xử lí sự cố tràn dầu", "Xử lí chất thải"]', '["Nghiên cứu, thử nghiệm, thu thập mẫu, đi thực tế và phân tích các xét nghiệm để xác định nguồn gốc của các vấn đề về môi trường và khuyến nghị các giải pháp bảo vệ, kiểm soát và phục hồi", "Kiểm tra và đánh giá tác động môi trường của các hoạt động, qui trình hiện tại", "đánh giá tác động môi trường của các hoạt động, đề xuất, dự án và hướng phát triển tương lai", "Phát triển và điều phối việc thực hiện những hệ thống quản lí môi trường để giúp các tổ chức kiểm soát tác động môi trường do các hoạt động của họ", "Tư vấn và hỗ trợ kĩ thuật cho các tổ chức để giải quyết hài hòa vấn đề môi trường và tổn thất tài chính", "Đánh giá mức độ chấp nhận của xã hội đối với các quyết định và hướng dẫn về môi trường của Nhà nước, xác định vi phạm và mức độ cam kết giải quyết vi phạm", "Phát triển các kế hoạch bảo tồn thiên nhiên", "Chuẩn bị báo cáo và tài liệu nghiên cứu"]', '["Các trung tâm, viện nghiên cứu", "Các tổ chức hàn lâm, trường ĐH, CĐ", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật tư nhân", "Các nhà máy và xí nghiệp có hệ thống kiểm soát ô nhiễm và quản lí chất thải", "Các tổ chức BVMT"]', TRUE),
-    ('Kĩ sư công nghiệp', 'ICR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư quản lí sự vận hành của toàn bộ nhà máy, đảm bảo rằng các qui trình hoạt động hiệu quả, an toàn và có tính kinh tế.', '["Quản lí công nghiệp", "Kĩ thuật hệ thống công nghiệp", "Kĩ thuật công nghiệp"]', '["Tính toán và bố trí các loại thiết bị máy móc khác nhau trong nhà máy sao cho hợp lí và hiệu quả", "Quản lí hệ thống theo cách vừa an toàn vừa năng suất nhất có thể", "Điều chỉnh lại máy móc, thiết bị để nâng cao năng suất", "Đặt ra tiêu chuẩn hoạt động cho công nhân và máy móc", "Phát triển các hệ thống có thể tối ưu hoá tiện nghi ở nơi làm việc thông qua việc quản lí hệ thống ánh sáng, băng ghế, chiều cao máy và mức độ ô nhiễm của máy"]', '["Bất cứ ngành công nghiệp nào", "Các trung tâm nghiên cứu", "Các Viện hàn lâm", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật tư nhân"]', TRUE);
+    (1, 'Phát thanh viên, biên tập viên truyền thông', 'AEI', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Thành tựu', 'Phát thanh viên trên đài phát thanh, truyền hình và các phương tiện truyền thông khác là người đọc bản tin, phỏng vấn, hướng dẫn và thực hiện các thông báo khác hoặc thực hiện các chỉ dẫn trên đài phát thanh, truyền hình, trong rạp chiếu phim và các cơ sở khác. Họ được ví như là “nhân vật đinh” của chương trình.', '["Phát thanh viên thời sự", "Phát thanh viên thể thao", "Phát thanh viên thời tiết"]', '["Đọc bản tin và các thông báo khác trên đài phát thanh, đài truyền hình", "Giới thiệu diễn viên, nghệ sĩ biểu diễn, người được phỏng vấn và thực hiện các thông báo liên quan trên đài phát thanh, truyền hình hoặc trong nhà hát và các cơ sở khác", "Phỏng vấn người ở những nơi công cộng cho các chương trình trên đài phát thanh và truyền hình"]', '["Đài phát thanh và truyền hình", "Doanh nghiệp Tổ chức Sự kiện", "Công ty truyền thông và quảng cáo"]', TRUE),
+    (2, 'Nhà nhân chủng học', 'IAR', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Nhân chủng học là một ngành khoa học xã hội. Nhà nhân chủng học nghiên cứu quá trình tiến hóa của con người, phong tục truyền thống qua các thời đại cũng như các nền văn hóa còn tồn tại đến ngày nay. Họ quan tâm đến các khía cạnh của đời sống xã hội như tôn giáo, gia đình, các mối quan hệ, ngôn ngữ, nghệ thuật, nghề thủ công, âm nhạc, các biểu tượng, thần thoại và các hoạt động dân gian. Nhà nhân chủng học cũng quan tâm đến các hoạt động kinh tế và chính trị hiện đại.', '["Nhân chủng học ứng dụng", "Nhân chủng học trong lĩnh vực sinh học/vật lí", "Nhân chủng học ngôn ngữ", "Nhân chủng học xã hội/văn hóa"]', '["Hiểu biết và áp dụng các lí thuyết về nhân chủng học để hiểu hành vi con người", "Giảng dạy lí thuyết nhân chủng học cho học sinh, sinh viên", "Áp dụng các phương pháp nhân chủng học đặc biệt như quan sát người tham dự để tiến hành quan sát cộng đồng, thu thập và phân tích thông tin về hành vi xã hội, văn hóa của con người", "Phát hiện, thu thập và nghiên cứu các hiện vật, phương tiện truyền thông, thậm chí nghiên cứu cả đặc tính sinh học hoặc từng nhóm người cụ thể", "Sử dụng dữ liệu thu thập thông qua quan sát để xác nhận hoặc phản biện các lí thuyết, nhận định và chính sách hiện có", "Phát triển các lí thuyết mới để giải thích hành vi của con người"]', '["Giảng dạy tại các trường ĐH", "Các tổ chức tình nguyện", "Các tổ chức chính phủ", "Các tổ chức nghiên cứu quốc tế"]', TRUE),
+    (3, 'Nhà khảo cổ học', 'IAR', 'Ngôn ngữ', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Các nhà khảo cổ nghiên cứu quá khứ để hiểu con người đã sống như thế nào. Họ theo dõi sự phát triển của nhân loại bằng cách nghiên cứu các di vật từ quá khứ, như cung điện, đền đài, nhà cửa, công cụ, đồ gốm, tiền xu, vũ khí, hay các tác phẩm điêu khắc.', '["Khảo cổ học ứng dụng", "Khảo cổ sinh học", "Số hóa khảo cổ học", "Khảo cổ dân tộc học", "Khảo cổ học thực nghiệm", "Khảo cổ học địa chất", "Khảo cổ học lịch sử"]', '["Thăm những di tích cổ, tiếp xúc với các tài liệu hiện vật đã được con người sử dụng từ rất lâu", "Tiến hành thăm dò, khảo sát và khai quật có hệ thống các vùng đất xa xưa để khám phá thành phố, công trình cổ và các cổ vật khác", "Nghiên cứu các di tích hiện vật phát hiện được và công bố báo cáo về tầm quan trọng lịch sử", "Chuẩn bị ca-ta-lô về những cổ vật đã thu thập để triển lãm trong bảo tàng", "Giảng bài cho học sinh, sinh viên và những người khác quan tâm đến khảo cổ học"]', '["Các phòng ban và viện bảo tàng khảo cổ", "Các tổ chức phi chính phủ tham gia vào việc bảo tồn di sản"]', TRUE),
+    (4, 'Chuyên viên lưu trữ văn thư và quản lí bảo tàng', 'CSR', 'Ngôn ngữ', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Một hệ thống lưu trữ bảo tàng là tập hợp các ghi chép theo lịch sử, bao gồm chữ cái, giấy tờ, hình ảnh, nhật kí hay bất kì loại hiện vật nào khác. Hệ thống này cũng đánh dấu vị trí lưu trữ những hồ sơ đó. Chuyên viên lưu trữ văn thư và quản lí bảo tàng tiến hành nghiên cứu, thu thập, đánh giá và bảo vệ, bảo tồn các nội dung tài liệu, hiện vật có lợi ích lịch sử, văn hóa và nghệ thuật, đồng thời tổ chức trưng bày tại bảo tàng và triển lãm nghệ thuật.', '["Cổ vật và chữ viết cổ", "Công nghệ thông tin lưu trữ", "Quản lí thông tin", "Quản lí hồ sơ", "An toàn và bảo mật thông tin"]', '["Nghiên cứu, đánh giá, phát triển, tổ chức và bảo tồn các tài liệu có ý nghĩa lịch sử và có giá trị như văn bản chính phủ, các giấy tờ cá nhân, tranh ảnh, ghi âm và phim tư liệu", "Thực hiện việc chuẩn bị các danh mục và thư mục ấn phẩm, các bản vi phim và các tài liệu tham khảo khác của các tài liệu thu thập được và đem đến cho người sử dụng", "Nghiên cứu bản gốc, phân phối và sử dụng các vật liệu và đồ dùng có lợi ích văn hóa và lịch sử", "Tổ chức, phát triển và duy trì bộ sưu tập các đồ dùng mang tính nghệ thuật, văn hóa, khoa học và có ý nghĩa lịch sử tại bảo tàng và triển lãm nghệ thuật", "Thực hiện phân loại và ghi mục lục các bộ sưu tập bảo tàng và triển lãm nghệ thuật và tổ chức trưng bày", "Chuẩn bị các tài liệu và báo cáo học thuật"]', '["Bảo tàng, phòng trưng bày triển lãm", "Cục, chi cục văn thư lưu trữ Nhà nước"]', TRUE),
+    (5, 'Thư kí điều hành', 'CE', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Thư kí điều hành là người hỗ trợ quản trị hành chính cho lãnh đạo cấp cao. Họ tiến hành nghiên cứu, viết báo cáo thống kê, xử lí yêu cầu thông tin và thực hiện cả những nhiệm vụ của của thư kí hành chính như soạn thảo thư từ, tiếp khách, đặt lịch họp và sắp xếp hội đàm điện tử điện thoại. Họ cũng có thể có nhiệm vụ đào tạo và giám sát thư kí ở cấp thấp hơn. Trong doanh nghiệp thư kí điều hành là người trợ lí cho chủ tịch và giám đốc, kết nối giữa hội đồng quản trị, cổ đông, các cơ quan pháp luật và cơ quan quản lí, đảm bảo các thủ tục được tuân thủ và đánh giá thường xuyên.', '["Chuyên sâu theo loại tổ chức (ví dụ: tổ chức từ thiện, tổ chức kinh doanh, tổ chức giáo dục...)", "Chuyên sâu theo lĩnh vực luật liên quan đến doanh nghiệp (ví dụ: thuế, cổ phần hóa, mua bán sáp nhập...)"]', '["Tiến hành nghiên cứu, tập hợp số liệu, văn bản pháp lí và văn bản chuyên môn liên quan đến công việc của tổ chức", "Làm dự thảo các báo cáo, văn bản theo yêu cầu của lãnh đạo", "Tiếp nhận và xử lí yêu cầu của khách lạ cần gặp người phù hợp trong tổ chức", "Hỗ trợ lập kế hoạch và chuẩn bị họp, hội nghị, hội đàm trực tiếp hoặc điện tử điện thoại", "Chuẩn bị các cuộc họp của các lãnh đạo và ủy ban cấp cao", "Trả lời các câu hỏi của công chúng", "Đánh các văn bản tài liệu mật trên hệ thống soạn thảo văn bản", "Hỗ trợ hành chính văn phòng cho lãnh đạo cấp cao như soạn thảo thư từ, văn bản, xử lí thư từ, điện thoại, fax đến và đi, tiếp khách, đặt lịch họp, lưu tài liệu, chuẩn bị văn phòng phẩm...", "Hướng dẫn, đào tạo và/ giám sát thư kí cấp thấp hơn nếu được giao"]', '["Các doanh nghiệp Nhà nước, tư nhân, có vốn đầu tư nước ngoài", "Các cơ quan Nhà nước, đoàn thể xã hội, tổ chức phi chính phủ"]', TRUE),
+    (6, 'Giảng viên đại học, sau đại học', 'SI', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Mối quan hệ', 'Giảng viên đại học, cao học là người có kiến thức chuyên sâu về một chuyên ngành cụ thể và dạy các lý thuyết và thực hành về một hay nhiều môn học ở ở bậc đại học, hoặc tương đương; thực hiện nghiên cứu và cải tiến, phát triển khái niệm, lý thuyết, phương pháp hoạt động, biên soạn sách và và giảng dạy', '["Dạy học: lĩnh vực chuyên sâu chủ yếu là liên quan đến các ngành, nghề đào tạo chuyên môn sâu như Kinh tế, tài chính, ngôn ngữ, các lĩnh vực khoa học tự nhiên, khoa học xã hội, công nghệ, dược, các môn cơ sở ngành", "Quản lí: Giảng viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học nghiên cứu theo yêu cầu", "Giảng dạy và tổ chức hướng dẫn, thảo luận, và thí nghiệm", "Khuyến khích sinh viên thảo luận và tư duy độc lập", "Giám sát, nếu cần, các công tác thí nghiệm và thực hành của sinh viên", "Quản lí, đánh giá và chấm điểm các bài kiểm tra", "Chỉ dẫn sinh viên và các thành viên trong khoa nghiên cứu", "Nghiên cứu và phát triển các khái niệm, lí thuyết và các biện pháp hoạt động để ứng dụng trong lĩnh vực chuyên môn và các lĩnh vực khác", "Chuẩn bị tài liệu, sách báo, sách giảng dạy", "Tham gia các cuộc hội thảo và thảo luận", "Tham gia quá trình quyết định liên quan đến các vấn đề về khoa, ngân sách, và các chính sách khác", "Trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề", "Thực hiện các công việc liên quan khác", "Giám sát các giáo viên khác"]', '["Giảng dạy trong các trường đại học", "Nghiên cứu tại các viện nghiên cứu về giáo dục và các khoa học có liên quan", "Vị trí quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng)"]', TRUE),
+    (7, 'Giảng viên cao đẳng', 'SI', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Mối quan hệ', 'Giảng viên cao đẳng là người có kiến thức chuyên sâu về một chuyên ngành cụ thể và dạy các lý thuyết và thực hành về một hay nhiều môn học ở bậc cao đẳng hoặc các tương đương; thực hiện nghiên cứu và cải tiến, phát triển khái niệm, lý thuyết, phương pháp hoạt động, biên soạn sách và và giảng dạy.', '["Dạy học: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: Cao đẳng Giao thông vận tải, giảng dạy các học phần: Cơ lí thuyết, Hình họa – vẽ kĩ thuật, …", "Quản lí: Giảng viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học nghiên cứu theo yêu cầu", "Giảng dạy và tổ chức hướng dẫn, thảo luận, và thí nghiệm", "Khuyến khích sinh viên thảo luận và tư duy độc lập", "Giám sát, nếu cần, các công tác thí nghiệm và thực hành của sinh viên", "Quản lí, đánh giá và chấm điểm các bài kiểm tra", "Chỉ dẫn sinh viên và các thành viên trong khoa nghiên cứu", "Nghiên cứu và phát triển các khái niệm, lí thuyết và các biện pháp hoạt động để ứng dụng trong lĩnh vực chuyên môn và các lĩnh vực khác", "Chuẩn bị tài liệu, sách báo, sách giảng dạy", "Tham gia các cuộc hội thảo và thảo luận", "Tham gia quá trình quyết định liên quan đến các vấn đề về khoa, ngân sách, và các chính sách khác", "Trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề", "Thực hiện các công việc liên quan khác", "Giám sát các giáo viên khác"]', '["Giảng dạy tại các trường Cao đẳng", "Vị trí quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng khoa)"]', TRUE),
+    (8, 'Giáo viên trung cấp', 'SR', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên trung cấp là người có kiến thức chuyên sâu về một lĩnh vực cụ thể và dạy các lý thuyết và thực hành về một hay nhiều môn học ở cấp giáo dục trung cấp, sau khi kết thúc giáo dục trung học cơ sở hoặc trung học phổ thông, với mục đích giáo dục, hướng nghiệp, hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến học phần giảng dạy. Ví dụ: Thực hành lái xe nâng, thực hành gấp khăn, …", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa đào tạo, hướng nghiệp và nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề hoặc câu lạc bộ", "Giảng dạy cá nhân nếu cần", "Thực hiện các công việc liên quan khác", "Giám sát các giáo viên khác"]', '["Giảng dạy trong các trường trung cấp", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)"]', TRUE),
+    (9, 'Giáo viên trung học phổ thông', 'SI', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên trung học phổ thông dạy học sinh ở các trường trung học phổ thông hoặc tương đương, ví dụ như trung tâm giáo dục thường xuyên. Họ dạy một hoặc nhiều môn học với mục đích giáo dục, hướng nghiệp, hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, vật lí, toán...", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường (ví dụ: hiệu phó, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp và nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Dạy đọc, viết và các môn cơ bản khác cho người lớn", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...", "Giảng dạy cá nhân nếu cần", "Hướng dẫn các hoạt động ngoại khóa"]', '["Dạy học tại các trường trung học phổ thông", "các trung tâm giáo dục thường xuyên", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)", "Làm việc chuyên môn trong các cơ quan quản lý giáo dục", "Dạy học tại các trung tâm bồi dưỡng văn hóa"]', TRUE),
+    (10, 'Giáo viên trung học cơ sở', 'SI', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên trung học cơ sở dạy học sinh ở các trường trung học cơ sở hoặc tương đương, ví dụ như trường trẻ em khuyết tật bậc trung học cơ sở. Họ dạy một hoặc nhiều môn học với mục đích giáo dục, hướng nghiệp, hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, vật lí, toán...", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường (ví dụ: hiệu phó, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp, nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Dạy đọc, viết và các môn cơ bản khác cho người lớn", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...", "Giảng dạy cá nhân nếu cần"]', '["Dạy học tại các trường trung học cơ sở", "các trung tâm giáo dục thường xuyên", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)", "Làm việc chuyên môn trong các cơ quan quản lý giáo dục", "Dạy học tại các trung tâm bồi dưỡng văn hóa"]', TRUE),
+    (11, 'Giáo viên ngoại ngữ', 'SAI', 'Ngôn ngữ', 'Phân tích và xử lý', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Sự độc lập', 'Giáo viên Ngoại ngữ dạy học sinh ở các trường trung học phổ thông, trung cấp, cao đẳng và các bậc học khác. Họ dạy một hoặc nhiều ngoại ngữ khác nhau nhằm mục đích giáo dục, hướng nghiệp hoặc dạy nghề.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, tiếng Pháp, tiếng Tây ban Nha, ...", "Quản lí: Giáo viên Ngôn ngữ cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường... (ví dụ: tổ trưởng chuyên môn, hiệu trưởng)"]', '["Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học", "Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp, nghiên cứu theo yêu cầu", "Chuẩn bị, phân công và chữa bài tập", "Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh", "Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh", "Dạy đọc, viết và nói", "Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức", "Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...", "Giảng dạy cá nhân nếu cần"]', '["Dạy học tại các cơ sở giáo dục", "Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)", "Làm việc chuyên môn trong các cơ quan quản lý giáo dục", "Dạy học tại các trung tâm ngoại ngữ"]', TRUE),
+    (12, 'Chuyên viên quan hệ công chúng', 'EAS', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Chuyên viên quan hệ công chúng, còn được gọi là cán bộ truyền thông, là người giữ nhiệm vụ kết nối giữa tổ chức, doanh nghiệp với thế giới bên ngoài. Họ đảm bảo rằng các thông tin chính xác về tổ chức, doanh nghiệp, khách hàng, sản phẩm hoặc người sử dụng lao động được các đối tượng công chúng biết đến.', '["Quản trị khủng hoảng", "Quan hệ Chính phủ (vận động hành lang)", "Chủ đầu tư và các mối quan hệ tài chính", "Truyền thông tiếp thị", "Quan hệ với giới truyền thông", "Chuẩn bị các ấn phẩm", "Các chiến dịch quảng bá", "Sự kiện xúc tiến đặc biệt"]', '["Duy trì thông tin liên lạc giữa tổ chức và khách hàng của họ để tăng cường hiểu biết và uy tín", "Xây dựng, biên tập và phân phối bản thông tin định kì để công bố các hoạt động, phát hành thông cáo báo chí để giới thiệu các hoạt động của tổ chức", "Theo dõi sát tin tức, báo chí và các phương tiện truyền thông khác, lưu ý xu hướng của dư luận", "Giúp người sử dụng lao động hiểu ý kiến dư luận và phản biện chính sách", "Gặp gỡ báo chí và đại diện công chúng để giới thiệu các đặc điểm của tổ chức", "Tham gia vào các sự kiện để quảng bá cho tổ chức, doanh nghiệp", "Biên soạn các bài giới thiệu đặc biệt, báo cáo hoặc tờ rơi thông tin", "Duy trì trung tâm thông tin và tổ chức các hoạt động quan hệ cộng đồng"]', '["Bộ phận truyền thông của doanh nghiệp và các tổ chức chính phủ. Ví dụ như hầu hết các doanh nghiệp lớn hiện nay đều có bộ phận quan hệ cộng đồng doanh nghiệp", "Các doanh nghiệp dịch vụ quan hệ công chúng. Các doanh nghiệp này được các tổ chức thuê triển khai thực hiện các sự kiện đặc biệt như ra mắt sản phẩm, hội nghị..."]', TRUE),
+    (13, 'Luật sư', 'EIA', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự công nhận', 'Luật sư là người bào chữa hoặc người bảo vệ quyền lợi cho thân chủ tại tòa án, trong các vụ án, các vụ việc và yêu cầu khác theo qui định của pháp luật. Các vụ án, vụ việc và yêu cầu có thể liên quan đến những lĩnh vực khác nhau như hình sự, dân sự, hành chính, hôn nhân và gia đình, kinh doanh, thương mại, lao động, sở hữu trí tuệ...', '["Hiến pháp", "Luật hành chính", "Luật doanh nghiệp", "Luật dân sự", "Luật thương mại", "Luật hình sự", "Luật môi trường", "Luật y tế", "Luật sở hữu trí tuệ"]', '["Tiến hành nghiên cứu trên các lí thuyết pháp lí và mối quan hệ của chúng với các điều luật hoặc dự luật cụ thể", "Soạn thảo luật và các qui định của Chính phủ dựa trên pháp luật hiện hành", "Đưa ra lời khuyên pháp lí cho khách hàng, bao gồm cả Chính phủ trên nhiều loại vấn đề khác nhau và thay mặt cho khách hàng thực hiện các công việc pháp lí", "Hỗ trợ khách hàng để đàm phán, dàn xếp trong những vấn đề liên quan đến tranh chấp pháp lí", "Kiểm tra các trường hợp tranh chấp hoặc báo cáo tội phạm để xác định sự kiện và ý nghĩa pháp lí của họ", "Chuẩn bị lời biện hộ hoặc các tình huống cho nguyên đơn hoặc bị đơn và trình bày tại tòa án", "Đóng vai trò là công tố viên đại diện cho Chính phủ trong các vụ án hình sự"]', '["Các công ty luật, văn phòng luật sư", "Các cơ quan Nhà nước", "Các doanh nghiệp lớn", "Các tổ chức tình nguyện"]', TRUE),
+    (14, 'Thủ thư và nhân viên thư viện', 'CSE', 'Ngôn ngữ', 'Tương tác với người khác', 'Phân tích - logic', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Thủ thư và nhân viên thư viện là những người thu thập và lưu trữ các tài liệu; ghi lại hoặc cho mượn và thu lại sách báo, tài liệu; lấy và cung cấp thông tin theo yêu cầu. Họ còn được gọi bằng một thuật ngữ khác rộng hơn là người quản lí tài liệu.', '["Tự động hóa thư viện và xây dựng mạng lưới", "Thư viện kĩ thuật số", "Mục lục và tóm tắt", "Quản lí nội dung", "Các công cụ công nghệ thông tin"]', '["Tổ chức, phát triển và bảo tồn bộ sưu tập có hệ thống các sách, ấn phẩm định kì, và các tài liệu giấy, âm thanh và hình ảnh", "Lựa chọn và đề xuất mua lại các sách và các tài liệu in ấn, âm thanh-hình ảnh khác", "Tổ chức, phân loại và quản lí hệ thống tài liệu thư viện", "Tổ chức và quản lí hệ thống đồ vật mượn và mạng lưới thông tin", "Thu hồi tài liệu và cung cấp thông tin cho doanh nghiệp và người sử dụng khác dựa trên các bộ sưu tập trong thư viện và các hệ thống mạng lưới thông tin", "Thực hiện nghiên cứu và phân tích, thay đổi các dịch vụ thư viện và thông tin theo những yêu cầu của người sử dụng", "Chuẩn bị tài liệu và báo cáo học thuật"]', '["Thư viện các trường ĐH, CĐ", "Thư viện công cộng hoặc tư nhân", "Các cơ quan nghiên cứu và phát triển", "Các doanh nghiệp", "Thư viện số (sử dụng mạng Internet)"]', TRUE),
+    (15, 'Biên tập viên nhà xuất bản', 'CA', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Biên tập viên làm việc với các tác giả, giúp họ trình bày tác phẩm của họ một cách lôi cuốn, chỉnh sửa và hoàn thiện bản thảo. Ngày nay, với sự phát triển của internet, ngành xuất bản cũng được mở rộng. Các biên tập viên cũng tham gia xây dựng nội dung trên mạng và kiểm tra xem các nội dung này có sử dụng ngôn ngữ chính xác và trình bày một cách hấp dẫn hay không.', '["Biên tập sách", "Biên tập tạp chí", "Biên tập báo", "Biên tập trên internet"]', '["Quyết định về vấn đề xuất bản sản phẩm phù hợp với các chính sách và hướng dẫn của nhà xuất bản", "Đọc bản thảo để đảm bảo văn phong và ngôn ngữ được sử dụng một cách chính xác", "Quản lí công việc hàng ngày của báo chí", "tạp chí, các tài liệu cần xuất bản", "Xác định các chủ đề, sự kiện và câu chuyện có liên quan, phân công công việc cho biên tập viên cấp dưới, các phóng viên và nhiếp ảnh gia để đảm bảo tiến độ theo kế hoạch của nhóm", "Viết các bài báo và bài xã luận về các chủ đề cụ thể"]', '["Các nhà xuất bản", "Các phòng ban phụ trách công việc xuất bản của các trường ĐH", "Báo", "Tạp chí", "Các doanh nghiệp kinh doanh mạng thông tin internet"]', TRUE),
+    (16, 'Nhà nghiên cứu khoa học xã hội', 'IAS', 'Ngôn ngữ', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Khoa học xã hội quan tâm tới hành vi, bản chất và cuộc sống của con người như một chủ thể xã hội. Các nhà nghiên cứu khoa học xã hội nghiên cứu xã hội loài người và những mối quan hệ giữa người và người trong xã hội. Có nhiều ngành khoa học xã hội như nhân chủng học, kinh tế học, lịch sử, khoa học chính trị, xã hội học, tâm lí học, tội phạm học, luật học, nghệ thuật học và các khoa học tương tự. Nói rộng ra, những bộ môn liên quan đến nhân học và nghệ thuật đều là các môn khoa học xã hội.', '["Nhân chủng học", "Kinh tế học", "Lịch sử", "Triết học", "Khoa học chính trị", "Tâm lí học", "Xã hội học"]', '["Tìm hiểu các lí thuyết giải thích về hành vi của con người và xã hội", "Giảng dạy những lí thuyết này cho sinh viên", "Tiến hành nghiên cứu để giải thích, xác nhận hoặc phê bình các lí thuyết hiện hành", "Tiến hành nghiên cứu để phát triển các lí thuyết mới giải thích cho hành vi con người", "Sử dụng dữ liệu nghiên cứu và các nguyên tắc lí thuyết để khuyến khích cổ vũ sự phát triển hài hòa về xã hội, tâm lí, tình cảm của cả cá nhân và nhóm người"]', '["Giáo viên tại các trường ĐH, CĐ, TC", "Các tổ chức chính phủ", "Các tổ chức tình nguyện", "Các tổ chức phi chính phủ", "Các tổ chức quốc tế", "Các tập đoàn kinh tế"]', TRUE),
+    (17, 'Nhà sử học', 'I', 'Ngôn ngữ', 'Thu thập thông tin', 'Làm việc với con người', 'Ngôn ngữ', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Nhà sử học cho chúng ta biết về quá khứ nhờ tiến hành nghiên cứu và mô tả hoạt động của con người trong quá khứ, như lịch sử của cộng đồng, quốc gia, doanh nghiệp, các thời kì và sự kiện cụ thể, các cá nhân và ý tưởng... Nhờ có các tư liệu lịch sử mà chúng ta có thể hiểu hiện tại và hoạch định tương lai.', '["Các thời kì, triều đại trong lịch sử Việt Nam (ví dụ: triều Trần, triều Lê, triều Nguyễn)", "Các nhân vật lịch sử cụ thể VN và TG (ví dụ: Trần Hưng Đạo, Hồ Chí Minh, Võ Nguyên Giáp, Lê Nin...)", "Các sự kiện lịch sử VN và TG (ví dụ: các cuộc cách mạng, chiến tranh, hiệp ước hòa bình, dịch bệnh lớn trong lịch sử)", "Liên kết với các môn khoa học khác như kinh tế học, nhân chủng học hay xã hội học", "Lịch sử các quốc gia, khu vực địa lí, theo thời gian (ví dụ: lịch sử Việt Nam, lịch sử châu Âu...) – Lịch sử VN, Lịch sử thế giới (cận đại, trung đại...)"]', '["Kiểm tra thông tin về những gì xảy ra trong quá khứ bằng cách nghiên cứu các tác phẩm của nhà sử học đi trước", "Truyền đạt thông tin về lịch sử cho học sinh, sinh viên", "Kiểm tra bản gốc của các nhật kí, bản thảo, lưu trữ, báo cáo, thống kê, hiện vật, thư từ, báo, tạp chí và các tập san để tạo ra một bức tranh về một thời kì cụ thể", "Liên kết thông tin từ các giai đoạn khác nhau để phát triển một ý tưởng hoàn chỉnh hơn về các sự kiện, đời sống con người", "Ghi lại các kết quả và phát hiện dưới hình thức báo cáo, sách, bài báo và phổ biến qua các cuộc triển lãm, bảo tàng", "Sử dụng dữ liệu nghiên cứu và các nguyên tắc lí thuyết để khuyến khích cổ vũ sự phát triển hài hòa về xã hội, tâm lí, tình cảm của cả cá nhân và nhóm người"]', '["Dạy học trong các cơ sở giáo dục", "Các tổ chức tình nguyện", "Các cơ quan chính phủ", "Các tổ chức quốc tế", "Các nhóm nghiên cứu hành vi của con người", "Các viện bảo tàng", "Cơ quan lưu trữ"]', TRUE),
+    (18, 'Nhà biên kịch, nhà văn và các nghề có liên quan', 'AIS', 'Ngôn ngữ', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà biên kịch, nhà văn và các nghề có liên quan làm công việc sáng tác và viết kịch bản phim, kịch, tác phẩm phát thanh và truyền hình, truyện đọc, tiểu thuyết... Các tác phẩm văn học. Nhà Văn có thể sáng tác những tác phẩm văn học và viết kịch bản. Nhà biên kịch có thể khai thác một ý tưởng, cốt truyện gốc hoặc chuyển thể các tác phẩm văn học đã được xuất bản sang một dạng kịch bản phù hợp với hình thức sản xuất.', '["Viết truyện ngắn, tiểu thuyết", "Viết kịch bản phim tài liệu", "Viết kịch bản kịch", "Viết kịch bản phim", "Chỉnh sửa kịch bản"]', '["Sáng tác các tác phẩm văn học theo các thể loại khác nhau", "Nghiên cứu một tác phẩm văn học, tìm hiểu toàn bộ cốt truyện", "Nghiên cứu nguồn gốc và bối cảnh câu chuyện", "Phát triển phong cách của kịch bản dựa trên thảo luận với đạo diễn và những người khác trong nhóm", "Chuyển thể câu chuyện sang dạng kịch bản: viết các cảnh, viết lời thoại cho các nhân vật khác nhau", "Kiểm tra kịch bản", "Hoàn thiện kịch bản cuối cùng để đưa vào sản xuất. Hoàn thiện tác phẩm văn học của mình và chuyển cho nhà biên tập"]', '["Các xưởng sản xuất phim", "Các đoàn kịch, đoàn nghệ thuật", "Các doanh nghiệp sản xuất chương trình phát thanh, truyền hình", "Các doanh nghiệp quảng cáo", "Hội Văn học Việt nam"]', TRUE),
+    (19, 'Nhà báo', 'AEI', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Thành tựu', 'Nhà báo là những người viết, biên tập, sản xuất các ấn phẩm báo chí (truyền hình, phát thanh, báo viết, báo mạng).', '["Báo điện tử", "Báo thời trang", "Báo ảnh", "Báo in", "Báo thể thao", "Tranh biếm họa hoặc minh họa cho báo chí"]', '["Tìm hiểu, thu thập và trình bày một cách khách quan những thông tin quan trọng bằng từ ngữ, hình ảnh, âm thanh theo cách công chúng dễ đọc, dễ hiểu", "Một số nhà báo có thể biên tập thông tin, viết bình luận, phân tích chuyên sâu về một vấn đề công chúng quan tâm", "Vấn đề thời sự nóng", "Trong một số trường hợp, nhà báo có thể điều tra tường tận (như thám tử) về một vấn đề được quan tâm, thông thường liên quan đến hành vi phạm tội, gian lận và tham nhũng"]', '["Tòa soạn các loại Báo viết", "Các loại Tạp chí", "Văn phòng thông tin báo chí", "Báo mạng, các đài truyền hình và đài phát thanh"]', TRUE),
+    (20, 'Nhà ngôn ngữ học', 'AIC', 'Ngôn ngữ', NULL, 'Làm việc với con người', 'Ngôn ngữ', 5, NULL, NULL, NULL, 'Nhà ngôn ngữ học nghiên cứu các thành phần cơ bản của một ngôn ngữ nào đó, chẳng hạn như ngữ âm, ngữ nghĩa và chữ viết. Ở góc độ khác, nghề này liên quan tới việc học và sử dụng thành thạo một ngôn ngữ cụ thể. Để trở thành một nhà ngôn ngữ học cần phải tìm hiểu về các thành phần cơ bản của ngôn ngữ. Ngoài ra, học một ngôn ngữ cụ thể thì bạn có thể trở thành một người biên dịch, phiên dịch hoặc giáo viên ngôn ngữ.', '["Ngôn ngữ học", "Ngôn ngữ học xã hội", "Ngôn ngữ học tâm lí", "Giảng dạy ngôn ngữ", "Biên dịch và phiên dịch", "Các rối loạn về khả năng học ngôn ngữ"]', '["Nghiên cứu để hiểu nguồn gốc lịch sử của ngôn ngữ", "Tìm hiểu và trình bày bằng văn bản những hiểu biết về các khía cạnh ngữ âm (nói) và chữ viết của một ngôn ngữ", "Tìm hiểu cá tác phẩm văn học viết bằng một ngôn ngữ nào đó", "Phát triển phương pháp dạy một ngôn ngữ", "Theo dõi và tìm hiểu quá trình phát triển của ngôn ngữ và mối liên hệ của nó với đời sống đương đại"]', '["Phòng ban, khoa, bộ môn của trường ĐH", "Giáo viên ngoại ngữ", "Các tổ chức cần người biên dịch, phiên dịch", "Trung tâm điều trị trẻ em bị rối loạn khả năng học ngôn ngữ", "Nhà xuất bản"]', TRUE),
+    (21, 'Biên dịch và phiên dịch', 'AS', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Biên dịch và phiên dịch nghiên cứu nguồn gốc, sự phát triển và cấu trúc của các ngôn ngữ, dịch viết và dịch nói từ ngôn ngữ này sang ngôn ngữ khác.', '["Chuyên về một ngôn ngữ cụ thể (ví dụ: ngôn ngữ cổ, tiếng Anh, tiếng Nhật...)", "Chuyên về một lĩnh vực cụ thể (ví dụ: dịch về pháp luật, y tế, khoa học, công nghệ, văn học, thương mại, du lịch, hàng không...)"]', '["Nghiên cứu mối quan hệ giữa các ngôn ngữ gốc cổ đại và các nhóm ngôn ngữ hiện đại, tìm hiểu nguồn gốc và sự tiến hóa của từ, ngữ pháp và hình thái ngôn ngữ", "Tư vấn hoặc biên soạn các hệ thống phân loại ngôn ngữ, ngữ pháp, từ điển và các tài liệu tương tự", "Dịch viết từ ngôn ngữ này sang ngôn ngữ khác, đảm bảo diễn đạt chính xác ý nghĩa của bản gốc hay của các tài liệu pháp lí, kĩ thuật và khoa học", "Diễn đạt hoặc chuyển tải một cách chính xác hết mức có thể từ ngữ, cú pháp, tinh thần và văn phong của bản gốc", "Dịch nói từ ngôn ngữ này sang ngôn ngữ khác tại các hội nghị, cuộc họp và các hoạt động tương tự, đảm bảo diễn đạt ý nghĩa chính xác và truyền tải được hết mức có thể tinh thần của lời nói gốc"]', '["Các doanh nghiệp có bộ phận dịch thuật", "Các công ty tổ chức sự kiện", "Các doanh nghiệp có vốn đầu tư nước ngoài", "Các doanh nghiệp thường xuyên giao dịch với khách hàng nước ngoài", "Vụ, phòng, bộ phận quan hệ quốc tế của các cơ quan Nhà nước", "Các tổ chức quốc tế như các cơ quan Liên Hợp Quốc, tổ chức phi chính phủ, tổ chức tài trợ..."]', TRUE),
+    (22, 'Đạo diễn phim, sân khấu', 'EAS', 'Ngôn ngữ', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Ngôn ngữ', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Đạo diễn phim, sân khấu, còn gọi là đạo diễn và nhà sản xuất điện ảnh, sân khấu, là người chỉ đạo và sản xuất phim, các tác phẩm truyền hình, phát thanh và chương trình biểu diễn trên sân khấu.', '["Phim ngắn dùng cho mục đích quảng cáo", "Phim tài liệu", "Phim truyện", "Kịch", "Ca nhạc"]', '["Nghiên cứu kịch bản, lựa chọn diễn viên, hướng dẫn diễn viên về diễn xuất, và chỉ đạo các mặt của sáng tác kịch diễn trên sân khấu, truyền hình, phát thanh hoặc phim nhựa", "Đưa ra quyết định cuối cùng về trang phục, thiết kế, âm thanh và hiệu ứng ánh sáng", "Phối hợp chặt chẽ với nhà quay phim, giám đốc âm nhạc và kĩ thuật viên âm thanh nhằm đảm bảo cho công việc sản xuất của bộ phim", "Duy trì quan hệ với các nhà phân phối phim để bộ phim được trình chiếu ở nhiều nơi khác nhau"]', '["Các doanh nghiệp quảng cáo", "Bộ phận truyền thông trong các cơ quan Nhà nước", "Các xưởng sản xuất phim", "Các đoàn kịch, đoàn nghệ thuật"]', TRUE),
+    (23, 'Kĩ thuật viên ghi chép sổ sách y tế và thông tin về sức khỏe', 'CS', 'Ngôn ngữ', NULL, 'Phân tích - logic', 'Ngôn ngữ', 4, NULL, NULL, NULL, 'Kĩ thuật viên ghi chép sổ sách y tế và thông tin về sức khỏe là chuyên gia trong việc lưu trữ cập nhật hồ sơ tại các bệnh viện, phòng khám và các cơ sở chăm sóc sức khỏe. Hồ sơ của mỗi bệnh nhân phải được lưu trữ cẩn thận và có thể truy cập một cách dễ dàng. Kĩ thuật viên sử dụng dữ liệu về hồ sơ y tế và hệ thống phân loại để lập và duy trì bộ phận quản lí hồ sơ y tế của một bệnh viện.', '["Các bộ phận cụ thể của hệ thống phân loại (ví dụ: hồ sơ khoa khám bệnh, khoa tim mạch...)", "Các hệ thống công nghệ lưu trữ và truy cập (ví dụ: hệ thống hồ sơ giấy, hệ thống hồ sơ điện tử...)", "Các đối tượng lập hồ sơ cụ thể (ví dụ: hồ sơ bệnh nhân, hồ sơ bệnh học...)"]', '["Sử dụng các phương pháp phân loại để duy trì một hệ thống phân loại hồ sơ y tế của bệnh nhân", "Sử dụng các phương pháp phân loại để duy trì hệ thống thông tin y tế", "Chuyên nghiệp hóa bằng các phương pháp quản lí thông tin y tế bao gồm cả các hệ thống trên máy vi tính để xác định hồ sơ bệnh nhân, mã hóa các bệnh", "Thiết kế các biểu mẫu khác nhau cho các loại bệnh nhân khác nhau", "Phát triển các phương pháp mới để quản lí thông tin y tế", "Thiết kế hệ thống lưu trữ hồ sơ và thông tin", "Dạy và đào tạo các nhân viên khác"]', '["Các bệnh viện, phòng khám", "Các phòng xét nghiệm y tế", "Các bệnh viện của trường y", "Các trung tâm nghiên cứu"]', TRUE),
+    (24, 'Kĩ thuật viên bảo tàng', 'ICR', 'Ngôn ngữ', 'Thu thập thông tin', 'Phân tích - logic', 'Ngôn ngữ', 4, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Kĩ thuật viên bảo tàng là người làm công việc đánh số hạng mục, phân loại và bảo quản hiện vật trong toàn bộ hoặc một bộ phận của bảo tàng. Trong khi đó, người quản lí bảo tàng là người chịu trách nhiệm bảo quản tổng thể bảo tàng. Trong bảo tàng, có ba vị trí cùng làm việc với các nhà sử học và khảo cổ học là kĩ thuật viên, người quản lí và chuyên viên lưu trữ văn thư.', '["Kĩ thuật viện bảo tàng thường được đào tạo cơ bản trong một ngành cụ thể (ví dụ: nhân chủng học, nghệ thuật, nghệ thuật trang trí, lịch sử tự nhiên, lịch sử xã hội, khoa học hoặc công nghệ). Sau đó, họ được chuyên môn hóa trong việc bảo quản và trưng bày các hiện vật thuộc về ngành đó. Một kĩ thuật viên viện bảo tàng học được đào tạo cơ bản về động vật học có thể chuyên về động vật thời tiền sử, hoặc một nhà nhân loại học có thể chuyên về các loại vũ khí của một nền văn hóa nhất định..."]', '["Mua các hiện vật cho bảo tàng", "Kiểm tra các hiện vật để xác định tình trạng và tính xác thực của nó", "Phân loại hiện vật", "Tổ chức bảo tồn và phục hồi hiện vật", "Lưu và cập nhật hồ sơ của tất cả các hiện vật trong các bộ sưu tập", "Tổ chức triển lãm, trưng bày trong bảo tàng và hợp tác với các bảo tàng khác trên thế giới", "Sắp xếp việc cho mượn hiện vật với các bảo tàng khác", "Thực hiện chương trình giảng dạy và giải đáp thắc mắc", "Hỗ trợ các nhà nghiên cứu"]', '["Các khoa của các trường ĐH", "Các viện bảo tàng", "Các nhóm nghiên cứu"]', TRUE),
+    (25, 'Thư kí hành chính', 'CER', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', NULL, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thư kí là người hỗ trợ công việc hành chính cho những người khác trong một tổ chức. Họ đóng vai trò quan trọng vì hoạt động của toàn bộ tổ chức phụ thuộc vào hiệu quả làm việc của họ. Ví dụ, thư kí điều hành là một chuyên gia cấp cao trong một tổ chức và hỗ trợ người đứng đầu tổ chức điều hành công ty', '["Trợ lí hành chính", "Quản trị viên văn phòng", "Nhân viên lễ tân", "Thư kí trong một loại hình doanh nghiệp cụ thể (ví dụ thư kí luật, thư kí y tế)", "Tốc kí", "Quản lí hành chính lưu trữ", "Thư kí chuyên ngành máy tính"]', '["Kiểm tra, định dạng và soạn thư từ, biên bản và báo cáo từ lời đọc, tài liệu điện tử hoặc dự thảo văn bản cho phù hợp với tiêu chuẩn soạn thảo văn bản", "Sử dụng các ứng dụng phần mềm máy tính khác nhau bao gồm cả bảng tính để phục vụ cho việc hỗ trợ hành chính", "Xử lí thư, văn bản đến hoặc đi", "rà soát, ghi chép và phân phối các email, thư từ, tài liệu", "Sắp xếp các yêu cầu họp và hẹn gặp và hỗ trợ tổ chức họp", "Tổ chức và giám sát hệ thống tài liệu", "Chủ động giải quyết các thư từ thường xuyên"]', '["Tất cả các tổ chức đều cần một thư kí tốt"]', TRUE),
+    (26, 'Kĩ thuật viên phát thanh, truyền hình và nghe - nhìn', 'RCI', 'Ngôn ngữ', 'Thu thập thông tin', 'Phân tích - logic', 'Ngôn ngữ', NULL, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên phát thanh, truyền hình và nghe - nhìn quản lí các chức năng kĩ thuật của thiết bị để ghi lại và biên tập các hình ảnh và âm thanh và để truyền thanh, truyền hình các hình ảnh và âm thanh cũng như các dạng tín hiệu viễn thông khác trên đất liền, trên biển và trên không.', '["Biên tập âm thanh", "Biên tập các tài liệu nghe nhìn", "Biên tập phim", "Sản xuất phim", "Trợ lí sản xuất", "Nhà điều hành đài phát thanh", "Nhà điều hành truyền hình", "Kĩ thuật sản xuất chương trình truyền hình"]', '["Quản lí thiết bị để ghi âm thanh", "Quản lí các thiết bị để biên tập và trộn hình ảnh và âm thanh đã được ghi lại để đảm bảo chất lượng như ý muốn và để tạo ra các hiệu ứng hình ảnh và âm thanh đặc biệt", "Ứng dụng kiến thức trên nguyên lí và thực tế của việc ghi lại và biên tập âm thanh, hình ảnh để xác định và giải quyết các vấn đề", "Kiểm soát việc truyền phát tín hiệu và các hệ thống phát thanh truyền hình và các hệ thống vệ tinh của các chương trình phát thanh, truyền hình", "Quản lí các chương trình truyền thông, các dịch vụ vệ tinh, và các hệ thống đa thành phần trên đất liền, trên biển và trên không", "Ứng dụng kiến thức trên nguyên lí và thực tế của việc phát thanh truyền hình, của các thiết bị đầu cuối viễn thông và các hệ thống truyền tin để xác định và giải quyết các vấn đề", "Thực hiện những công việc sửa chữa các thiết bị khẩn cấp"]', '["Các công ty phát thanh", "Các công ty truyền hình", "Các công ty điện ảnh", "Dịch vụ phát thanh truyền hình công cộng"]', TRUE),
+    (27, 'Nhân viên tổng đài dịch vụ khách hàng', 'EC', 'Ngôn ngữ', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Các doanh nghiệp thường có một tổng đài dịch vụ để giải đáp và hỗ trợ khách hàng được gọi là tổng đài dịch vụ khách hàng. Các nhân viên tổng đài dịch vụ khách hàng được đào tạo sử dụng điện thoại để giải đáp cho khách hàng về sản phẩm, dịch vụ cũng như thúc đẩy hỗ trợ việc bán sản phẩm; tạo dựng hình ảnh, thương hiệu… rất cần thiết với mỗi doanh nghiệp', '["Dịch vụ khách hàng", "Phụ trách các loại sản phẩm cụ thể", "Bán hàng và tiếp thị"]', '["Phát triển ngôn ngữ và kĩ năng giao tiếp theo yêu cầu của doanh nghiệp, bao gồm cả giọng nói, ngữ điệu, hiểu biết về văn hóa doanh nghiệp", "Học về hàng hóa, dịch vụ hay chính sách, các giao dịch tài chính của tổ chức và trả lời các câu hỏi của khách hàng", "Sử dụng điện thoại đáp ứng các yêu cầu cụ thể của khách hàng", "Liên lạc với các khách hàng tiềm năng và thu hút sự quan tâm của họ tới một sản phẩm cụ thể bằng cách mô tả cho họ qua điện thoại", "Theo dõi cuộc trò chuyện qua điện thoại để viết báo cáo, giao nhận thêm thông tin cho khách hàng nếu cần thiết"]', '["Các trung tâm hỗ trợ khách hàng của các công ty như Điện lực, bưu chính viễn thông, v.v...", "Dịch vụ chăm sóc khách hàng", "Nhân viên Bán hàng online"]', TRUE),
+    (28, 'Hướng dẫn viên du lịch', 'SE', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Mối quan hệ', 'Hướng dẫn viên du lịch được đào tạo để đi cùng với khách du lịch trong phạm vi một quốc gia, thành phố hoặc khu vực nào đó. Họ giới thiệu với khách du lịch về ý nghĩa lịch sử, khảo cổ của những nơi họ đến hoặc các di tích, công trình nghệ thuật mà họ xem. Họ cũng giúp khách du lịch làm quen với văn hóa, môi trường, vẻ đẹp tự nhiên và những điều thú vị khác nhằm thu hút sự quan tâm của khách.', '["Các loại hình cụ thể của các tour du lịch (ví dụ: tour du lịch lịch sử, mạo hiểm, du lịch tham quan…)", "Các khu vực, địa điểm cụ thể (ví dụ: một thành phố", "một khu vực có thiên nhiên, địa hình đẹp, lạ", "một di tích lịch sử, văn hóa, tự nhiên)"]', '["Lập kế hoạch và tổ chức các tour du lịch", "Gặp các nhóm khách du lịch và sắp xếp trước kế hoạch ăn nghỉ, phương tiện đi lại và tất cả những gì cần thiết để đảm bảo khách cảm thấy hài lòng", "Dẫn tour du lịch đi xung quanh một khu vực để thăm các địa điểm hoặc di tích thú vị", "Tham gia giải quyết các vấn đề liên quan đến tổ chức chuyến đi trong suốt hành trình", "Sắp xếp các dịch vụ khác cho các thành viên của đoàn trong trường hợp cần thiết (VD: tìm bác sĩ trong trường hợp ốm đau)", "Phối hợp với tất cả các bộ phận hỗ trợ khác để chuyến đi thành công (VD: các doanh nghiệp vận tải, khách sạn)", "Nộp báo cáo cho doanh nghiệp du lịch và giải quyết công việc hành chính"]', '["Các doanh nghiệp du lịch lữ hành", "Cơ quan quản lí du lịch của Nhà nước", "Tự thành lập cơ sở kinh doanh du lịch", "Dẫn tour du lịch vào thời gian rảnh"]', TRUE),
+    (29, 'Nhân viên marketing và bán hàng', 'ESC', 'Ngôn ngữ', 'Tương tác với người khác', 'Làm việc với con người', 'Ngôn ngữ', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Nhân viên marketing và bán hàng trong cửa hàng và tại các cơ sở bán lẻ trực tiếp bán nhiều loại hàng hóa và dịch vụ cho khách hàng, giới thiệu chức năng và chất lượng hàng hóa và dịch vụ cho khách hiểu.', '["Trợ giúp bán hàng", "Phụ trách một quầy, mặt hàng hoặc nhóm mặt hàng cụ thể (ví dụ: hóa mĩ phẩm, thực phẩm đông lạnh, sữa...)", "Giới thiệu sản phẩm"]', '["Tìm hiểu sản phẩm, giá cả, phương thức giao hàng, bảo hành, cách sử dụng và bảo quản sản phẩm. Tìm hiểu nhu cầu và tư vấn cho khách hàng một cách phù hợp", "Chứng minh cho khách hàng thấy chất lượng sản phẩm", "Bán hàng, nhận thanh toán bằng nhiều phương thức (tiền mặt, thẻ, séc...)", "Lập hóa đơn", "Ghi sổ bán hàng", "Hỗ trợ quản lí hàng trong kho", "Sắp xếp và trưng bày hàng hóa", "Đóng gói hàng bán", "Ghi lại thông tin khách hàng"]', '["Tất cả các cửa hàng", "Trung tâm thương mại", "Điểm bán hàng", "Các siêu thị", "Bán hàng trên mạng"]', TRUE),
+    (30, 'Chuyên gia công nghệ polyme', 'IRC', 'Phân tích - Logic', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Chuyên gia công nghệ polyme chuyên về sản xuất chất dẻo tổng hợp và các chất liên quan. Polyme là các loại vật liệu tự nhiên và tổng hợp với nhiều tính chất và mục đích sử dụng khác nhau. Các loại polyme có nhiều trong tự nhiên bao gồm tinh bột, xen-lu-lô và cao su đều mang đầy đủ các tính chất của polyme. Bên cạnh đó cũng có nhiều loại polyme nhân tạo, hay còn được gọi là nhựa. Polyme có nhiều ứng dụng ưu việt hơn nhiều so với các dạng vật liệu khác được con người khai thác và sử dụng. Các ứng dụng đó bao gồm từ việc tạo ra chất dính, nhuộm vải, nấu sợi bằng xà phòng cho tới các ứng dụng trong ngành dệt, công nghiệp sợi, các thiết bị điện tử, thiết bị y sinh và thiết bị quang học.', '["Công nghệ sản xuất chất dẻo từ Polyme", "Các hoá chất đặc biệt", "Y sinh học", "Các thiết bị y khoa", "Ống tuỳ chỉnh", "Kĩ thuật sản xuất nhựa từ chất dẻo polyme"]', '["Tiến hành nghiên cứu và tư vấn sản xuất sản phẩm từ polyme", "Phát triển các qui trình hoá học qui mô lớn để lọc và sản xuất các chất và sản phẩm từ polyme", "Nghiên cứu tiền khả thi và khả thi về việc xây dựng các nhà máy sản xuất hóa chất", " Xác định phương pháp sản xuất vật liệu và các tiêu chuẩn chất lượng để đảm bảo rằng chúng phù hợp với các thông số kĩ thuật", "Đề ra các tiêu chuẩn kiểm soát và các qui trình thủ tục đảm bảo sự an toàn và tính hiệu quả của các hoạt động sản xuất", "Tìm ra và khắc phục sai sót và trục trặc", "Tổ chức và hướng dẫn việc bảo trì, sửa chữa các thiết bị hiện đang hoạt động", "Nghiên cứu và tư vấn về mặt kĩ thuật về các vật liệu, sản phẩm hoặc một quá trình nhất định"]', '["Ngành công nghiệp hoá chất", "Ngành công nghiệp sản xuất các vật dụng từ polyme"]', TRUE),
+    (31, 'Kĩ sư công nghệ thực phẩm', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Kĩ sư công nghệ thực phẩm và đồ uống cải tiến các kĩ thuật chế biến, bảo quản, sử dụng và đánh giá thành phần thực phẩm và đồ uống từ động thực vật hoặc nguyên liệu nhân tạo.', '["Công nghệ thực phẩm", "Công nghệ sau thu hoạch", "Công nghệ chế biến thủy sản", "Quản lí chất lượng lương thực, thực phẩm", "Kiểm nghiệm chất lượng lương thực, thực phẩm", "Kiểm tra chất lượng thực phẩm", "Chế biến dầu thực vật", "Bảo quản và chế biến các sản phẩm thuỷ sản", "Chế biến sữa", "Sản xuất bánh kẹo"]', '["Tiến hành nghiên cứu cách thức chế biến các loại thực phẩm đồ uống mới", "Cải tiến các kĩ thuật hiện có để đảm bảo giữ được chất lượng, hương vị thực phẩm đồ uống như bảo quản lạnh những đồ dễ hư hỏng, thịt, cá, đồ hộp, giữ nước của trái cây và rau", "Phát triển các biện pháp như kiểm soát lây nhiễm, trị nấm và côn trùng, lưu trữ để bảo vệ các loại thực phẩm không bị hư hỏng và thiệt hại", "Kiểm tra các thực phẩm nhiễm độc, làm giả, giá trị dinh dưỡng v;v", "bằng cách xét nghiệm sinh hóa, dinh dưỡng và các biện pháp kiểm soát chất lượng", "Phát triển phương pháp và qui trình mới thông qua nghiên cứu để phục hồi các sản phẩm hữu ích từ chất thải công nghiệp và thực phẩm trong nước", "Kiểm soát và hướng dẫn quá trình pha chế, chống ô xi hoá, kiểm nghiệm vệ sinh an toàn thực phẩm và kiểm nghiệm vi sinh"]', '["Các công ti chế biến thực phẩm đồ uống", "Bệnh viện", "Cơ sở dịch vụ ăn uống", "Cơ quan kiểm tra chất lượng", "Phòng thí nghiệm công nghệ thực phẩm"]', TRUE),
+    (32, 'Kĩ sư phát triển phần mềm', 'IC', 'Phân tích - Logic', 'Phân tích và xử lý', NULL, 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Kĩ sư, chuyên gia phát triển phần mềm nghiên cứu, phân tích và đánh giá các yêu cầu đối với các phần mềm ứng dụng sẵn có hoặc phần mềm và hệ điều hành mới. Họ thiết kế, phát triển, thử nghiệm và duy trì các giải pháp phần mềm nhằm đáp ứng tất cả các yêu cầu.', '["Kĩ thuật  phần mềm"]', '["Nghiên cứu, phân tích và đánh giá các yêu cầu đối với các phần mềm ứng dụng và hệ điều hành của máy tính", "Nghiên cứu, thiết kế và phát triển hệ thống phần mềm", " Cố vấn cho các cán bộ kĩ thuật trong việc đánh giá sự khác biệt giữa phần cứng và phần mềm máy tính", "Phát triển và hướng dẫn thử nghiệm phần mềm và các thủ tục pháp lí", "Khắc phục lỗi của các mô hình hiện tại và áp dụng kiến thức đó vào phát triển các phần mềm mới hoặc nâng cấp các chức năng cũ và cải tiến hiệu suất hoạt động trên máy", "Hướng dẫn lên chương trình phần mềm và phát triển các tài liệu phần mềm", "Tiếp cận, phát triển, nâng cấp và ghi chép lại các qui trình thủ tục duy trì phần mềm", "Tư vấn cho khách hàng các vấn đề liên quan tới việc duy trì hệ thống phần mềm"]', '["Lập trình viên cho các công ti phần mềm", "Tư vấn phát triển phần mềm chuyên dụng cho các ngành nghề, công ty", "Kiểm tra, bảo trì, quản trị hệ thống phần mềm cho các tổ chức, công ty", "Làm việc trong các tổ chức giáo dục giảng dạy và nghiên cứu các vấn đề liên quan đến lĩnh vực này", "Chuyên gia phát triển phần mềm độc lập"]', TRUE),
+    (33, 'Chuyên gia phân tích tài chính', 'IC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 5, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Chuyên gia phân tích tài chính điều tra, nghiên cứu các quá trình tác động tới các hoạt động tài chính của khu vực công hoặc các tổ chức tư nhân. Các hoạt động này bao gồm các chương trình nghiên cứu hay các kế hoạch ngân sách và tài chính.', '["Tài chính - ngân hàng", "Đầu tư ngân hàng", "Mua bán và sáp nhập", "Quản lí danh mục đầu tư", "Chuyên gia phân tích, đánh giá", "Chứng khoán và trái phiếu", "Tài chính doanh nghiệp", "Tín dụng tài chính."]', '["Phân tích thông tin tài chính để dự đoán các điều kiện kinh doanh, công nghiệp và kinh tế nhằm đưa ra các quyết định đầu tư", "Cập nhật kiến thức trong các lĩnh vực kĩ thuật công nghiệp, kinh doanh, tài chính và học thuyết kinh tế", "Nắm bắt được các nhân tố ảnh hưởng tới đầu tư như giá cả, sản lượng, tính ổn định, xu hướng tương lai trong quản lí rủi ro và các tác động kinh tế", "Giám sát các hoạt động kinh tế, công nghiệp và hợp tác thông qua phân tích thông tin thu thập được từ các báo cáo tài chính và dịch vụ của các hãng đầu tư vào lĩnh vực ngân hàng, các tổ chức chính phủ, các ấn phẩm thương mại, nguồn lực của công ti,và từ phỏng vấn cá nhân", "Đề xuất đầu tư và thời điểm đầu tư với các công ti, cán bộ phụ trách đầu tư của công ti hoặc đầu tư công", "Xác định mức giá an toàn để có thể cung ứng các dịch vụ tư vấn chứng khoán công", "Chuẩn bị kế hoạch hành động cho hoạt động đầu tư dựa trên các phân tích tài chính"]', '["Ngân hàng", "Các công ti bảo hiểm", "Các quĩ chung", "Các công ti chứng khoán", "Người môi giới chứng khoán", "Tư vấn tài chính", "Quản lí tài chính"]', TRUE),
+    (34, 'Nhà thiên văn học', 'IAR', 'Phân tích - Logic', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Thiên văn học là việc nghiên cứu khoa học các thiên thể (như các ngôi sao, hành tinh, sao chổi, tinh vân, quần tinh, thiên hà) và các hiện tượng có nguồn gốc bên ngoài vũ trụ (như bức xạ nền vũ trụ). Nó nghiên cứu sự phát triển, tính chất vật lý, hoá học, khí tượng học, và chuyển động của các vật thể vũ trụ, cũng như sự hình thành và phát triển của vũ trụ. Nhà thiên văn học tiến hành nghiên cứu, phát triển các lí thuyết và phương pháp vận hành, hoặc áp dụng kiến thức khoa học liên quan tới thiên văn học vào các lĩnh vực khác. Thiên văn học và vật lí học có mối quan hệ rất gần gũi. Nền tảng toán học vững chắc cũng hết sức quan trọng. Nhà thiên văn học hiện đại không còn dành nhiều thời gian quan sát qua kính viễn vọng. Ngày nay, kính thiên văn và máy ảnh kỹ thuật số thường được kiểm soát và quản lí bởi hệ thống máy tính. Họ tập trung phân tích số liệu trên máy tính. Họ cũng thường tham gia giảng dạy ở các trường. Cần phân biệt rõ thiên văn học không phải là chiêm tinh học, mặc dù thời cổ đại hai lĩnh vực này gắn chặt với nhau.', '["Thiên văn học", "Khoa học vũ trụ và ứng dụng"]', '["Tiến hành nghiên cứu, cải tiến, phát triển khung lí thuyết, các học thuyết và các phương pháp vận hành liên quan tới thiên văn học", "Tiến hành các thực nghiệm, thí nghiệm và phân tích cấu trúc, tính chất của vấn đề ở trạng thái rắn và biểu hiện biến chuyển của vật chất đó dưới tác động của nhiệt độ, áp suất, áp lực và các điều kiện khác", "đánh giá kết quả điều tra và thực nghiệm nhằm đưa ra kết luận chủ yếu bằng việc sử dụng các kĩ thuật và các mô hình toán học", "Phát triển hoặc cải tiến ứng dụng trong các lĩnh vực công nghiệp, y học, quân đội và các ứng dụng thực nghiệm khác của các nguyên lí và kĩ thuật thiên văn học", "Quan sát, phân tích và nhận thức được các hiện tượng thiên văn học cũng như phát triển các phương pháp và kĩ thuật được sử dụng trong các lĩnh vực như hàng hải hay khám phá vũ trụ", "Chuẩn bị các nghiên cứu và báo cáo khoa học", "Giám sát và chỉ đạo những người cùng làm việc"]', '["Làm cho các cơ quan công lập và các tổ chức nghiên cứu vũ trụ", "Làm cho các tổ chức phi chính phủ bao gồm chế tạo các kính viễn vọng, tổ chức các buổi phổ biến thực hành quan sát thiên văn học trong cộng đồng", "Ví dụ về các lĩnh vực khác bao gồm các đài thiên văn, cung thiên văn, công viên khoa học và các trường ĐH"]', TRUE),
+    (35, 'Nhà khí tượng học', 'IR', 'Phân tích - Logic', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Nhà khí tượng học tiến hành nghiên cứu, cải tiến hoặc phát triển các khái niệm, lí thuyết và phương pháp hoạt động liên quan đến các thành phần, cấu trúc và những biến đổi của bầu khí quyển. Họ dự báo thời tiết một cách chi tiết hoặc dài hạn để sử dụng trong ngành hàng không, vận tải biển, nông nghiệp và thông tin đại chúng.', '["Khí tượng học"]', '["Nghiên cứu, cải tiến và phát triển các khái niệm, học thuyết và phương pháp hoạt động liên quan tới thành phần cấu tạo, cấu trúc và các động lực học của khí quyển", "Thu thập dữ liệu về hướng và tốc độ chuyển động của không khí, áp suất, nhiệt độ, độ ẩm và các hiện tượng khác như sự hình thành mây và mưa, nhiễu điện từ hoặc bức xạ năng lượng mặt trời", "Nghiên cứu dữ liệu này để chuẩn bị các bản đồ và dự báo thời tiết", "Tiến hành thí nghiệm về phát tán sương, tạo mưa và các dạng kiểm soát thời tiết khác", "Chuẩn bị các tài liệu và báo cáo khoa học", "Giám sát và chỉ đạo những người cùng làm việc"]', '["Các Đài, Trạm, Trung tâm dự báo khí tượng thủy văn", "Các công ty thủy điện, thủy lợi", "Các viện nghiên cứu, Trung tâm Môi trường", "Các cơ quan thuộc Bộ TN&amp;amp;MT (gồm các đơn vị thuộc Trung tâm khí tượng thủy văn quốc gia, Viện khoa học KTTV và Môi trường), Bộ NN&amp;amp;PTNT, Viện Khoa học và Công nghệ Quốc gia, Bộ Công nghiệp, Viện nghiên cứu kĩ thuật Bảo hộ Lao động,… và cả các cơ sở hoạt động trong lĩnh vực tin học, tính toán liên quan tới KTTV"]', TRUE),
+    (36, 'Nhà hoá học', 'IRC', 'Phân tích - Logic', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà hóa học thực hiện các nghiên cứu, cải tiến hoặc phát triển các khái niệm, học thuyết và các phương pháp hoạt động, hoặc ứng dụng các kiến thức khoa học liên quan vào hóa học, chủ yếu để kiểm nghiệm, phát triển và cải tiến các nguyên liệu, các sản phẩm và qui trình công nghiệp.', '["Phân tích hoá học", "Hoá học ăn mòn", "Hoá học môi trường", "Hoá học pháp lí", "Hoá học công nghiệp", "Hoá học vô cơ", "Hoá học hữu cơ", "Hoá dược phẩm", "Hoá học vật lí", "Hoá học polymer", "Hoá học đất đai"]', '["Thực hiện các nghiên cứu và cải tiến hoặc phát triển các khái niệm, học thuyết và các phương pháp hoạt động liên quan tới hóa học", "Thực hiện các thí nghiệm, kiểm nghiệm và phân tích để tìm ra các thành phần hóa học và năng lượng và các thay đổi hóa học trong các điều kiện tự nhiên, nhân tạo khác nhau hoặc tổng hợp các chất, các nguyên liệu và sản phẩm khác, đánh giá kết quả và đưa ra kết luận", "Phát triển hoặc cải tiến các dược phẩm và các nguyên liệu, sản phẩm và phương pháp công nghiệp khác", "Phát triển các qui trình quản lí chất lượng cho nhà sản xuất và người sử dụng", "Chuẩn bị các tài liệu và báo cáo khoa học."]', '["Làm việc trong các ngành công nghiệp hoá chất, ví dụ như nước hoa, sơn, màu vẽ và dược phẩm", "Làm việc trong các cơ quan môi trường để giảm ô nhiễm, đồng thời quản lí và tái chế chất thải", "Làm việc trong ngành công nghiệp đóng gói thực phẩm, nước uống đóng chai và các loại kẹo đóng gói"]', TRUE),
+    (37, 'Nhà địa chất', 'IR', 'Phân tích - Logic', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Các nhà địa chất nghiên cứu cấu trúc vật lí của lớp vỏ trái đất, quá trình hình thành đá và hóa thạch để xác định từng bước thay đổi và lịch sử phát triển của trái đất, xác định vị trí khoáng sản và nhiên liệu.', '["Địa chất học", "Khoa học trái đất"]', '["Sử dụng dụng cụ và kĩ thuật để tiến hành khảo sát địa chất, lập bản đồ khảo sát không khí và ảnh hàng không, thăm dò địa chất và địa vật lí để xác định vị trí mỏ khoáng sản, mỏ dầu khí đặc biệt", "Thu thập các mẫu khoáng sản hoặc đá ở các độ sâu khác nhau phục vụ cho các nghiên cứu chi tiết để xác thành phần, chất lượng và số lượng của các mỏ khoáng sản", "Giám sát hoạt động khoan trong các khu vực có các mỏ khoáng sản kinh tế", "Chuẩn bị các báo cáo, bản đồ và biểu đồ cho thấy các hồ chứa nước ngầm, lớp đá, thân quặng lộ thiên và cấu trúc địa chất khác nhau của chúng", "Tư vấn về tính phù hợp của đất và đá để xây dựng các đập nước, đường hầm, đường giao thông, các tòa nhà trên nền móng vững chắc", "Nghiên cứu các hiện tượng tự nhiên như động đất, núi lửa, sông băng và lở núi"]', '["Làm công tác quản lí ở các cơ quan quản lí Nhà nước của nhiều Bộ, ngành khác nhau", "Các viện nghiên cứu", "Giảng dạy tại các trường ĐH, CĐ", "Các công ty khai thác dầu khí, khoáng sản..."]', TRUE),
+    (38, 'Nhà địa lí', 'IRA', 'Phân tích - Logic', 'Thu thập thông tin; Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Nhà địa lí nghiên cứu các đặc điểm và tác dụng của bề mặt trái đất trong mối tương quan với các hiện tượng vật lí và văn hoá xã hội.', '["Địa lí học", "Bản đồ học", "Địa lí tự nhiên", "Khí tượng học", "Thủy văn"]', '["Nghiên cứu bản chất của môi trường vật chất và khí hậu ở những khu vực cụ thể bằng cách thu thập số liệu về những ứng dụng trong nhiều ngành khoa học như vật lí, địa lí, hải dương học, vũ trụ học và sinh học", "Phân tích hoạt động của con người trong các lĩnh vực khác nhau của xã hội như chính trị, kinh tế, sự di cư và tăng trưởng dân số", "và chỉ ra mối quan hệ giữa những hoạt động đó với môi trường địa lí", "Tiến hành các nghiên cứu bản đồ và vẽ bản đồ theo kích thước qui định", "Tư vấn cho Chính phủ và các tổ chức khác về các khu vực địa lí có khả năng khai thác về mặt kinh tế, xác định ranh giới về mặt chính trị và những vấn đề liên quan"]', '["Làm việc trong các cơ quan Nhà nước có nhiệm vụ qui hoạch đô thị và vùng, điều tra việc sử dụng đất, khí tượng và thị hiếu", "Làm việc trong các tổ chức tham gia vào hệ thống thông tin địa lí và dự đoán dựa trên các phần mềm ứng dụng", "Giảng dạy và nghiên cứu trong các tổ chức giáo dục đại học bao gồm các hoạt động", "Làm việc trong các cơ quan tham gia hoạch định chính sách và qui hoạch xã hội, kinh tế và môi trường"]', TRUE),
+    (39, 'Nhà toán học', 'ICA', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 5, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Toán học là nền tảng cho tất cả các ngành khoa học. Toán học có thể nặng về lí thuyết hoặc thiên về ứng dụng. Ví dụ như trong một thùng hình vuông có thể chứa bao nhiêu quả táo hình tròn? Bài toán ứng dụng này có ý nghĩa rất lớn đối với những người hàng ngày phải đóng gói và chuyển đi hàng triệu quả táo. Đó là vấn đề mà một nhà toán học cần giải quyết. Các nhà toán học và các nhà nghiên cứu liên quan tới toán học tiến hành nghiên cứu và phát triển các khái niệm toán học và tính toán rủi ro (xem thêm nghề Thống kế bảo hiểm), các lí thuyết, các phương pháp và kĩ thuật vận hành. Họ tư vấn cho các chuyên gia hoạt động trong nhiều lĩnh vực như kĩ thuật, kinh doanh, y tế, khoa học, đời sống tự nhiên và xã hội. Nhiệm vụ cụ thể của một nhà toán học phụ thuộc vào lĩnh vực', '["Toán học", "Toán cơ", "Toán ứng dụng"]', '["Nghiên cứu, cải tiến, phát triển các lí thuyết và thuật toán", "Nghiên cứu, cải tiến, phát triển các lí thuyết và kĩ thuật tính toán rủi ro", "Tư vấn và áp dụng các nguyên tắc, mô hình và thuật toán vào nhiều lĩnh vực như kĩ thuật, kinh doanh, y khoa, các lĩnh vực khác trong các ngành khoa học, đời sống tự nhiên và xã hội", "Tiến hành phân tích logic về các vấn đề quản lí, đặc biệt là tính hiệu quả đầu vào-đầu ra và xây dựng các mô hình toán cho các vấn đề liên quan tới lập trình các chương trình và giải pháp xử lí bằng máy tính", "Thiết kế và đưa vào vận hành lộ trình lương hưu và hệ thống bảo hiểm nhân thọ, y tế, an sinh xã hội và các hình thức bảo hiểm khác", "Chuẩn bị báo cáo và nghiên cứu khoa học"]', '["Các viện hàn lâm", "Các tổ chức nghiên cứu", "Nghiên cứu và phát triển công nghiệp", "Các công ty bảo hiểm", "Giảng dạy nghiên cứu tại các trường ĐH"]', TRUE),
+    (40, 'Nhà thống kê', 'CI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Ngôn ngữ', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Nhà thống kê ứng dụng toán học vào phân tích số liệu, ví dụ như quyết định lựa chọn việc làm chịu ảnh hưởng lớn từ các yếu tố nào: mức lương hay thời hạn hợp đồng? Một nhãn hiệu trà mới có thể bán chạy ở khu vực thành thị hay nông thôn? Đây là những ví dụ thống kê đơn giản. Hầu hết các nhà nghiên cứu, hoạch định và quản lí phụ thuộc rất nhiều vào các nhà phân tích thống kê.', '["Thống kê kinh tế, xã hội", "Thống kê kinh doanh"]', '["Nghiên cứu, cải tiến và phát triển các lí thuyết và phương pháp thống kê", "Thiết kế bảng hỏi nghiên cứu", "Lên kế hoạch và tổ chức các cuộc điều tra lấy số liệu", "Đánh giá, xử lí, phân tích và diễn giải số liệu thống và chuẩn bị phát hành", "Tư vấn hoặc áp dụng các phương pháp thu thập dữ liệu khác nhau cũng như các phương pháp và kĩ thuật thống kê", "Chuẩn bị bài báo khoa học và các báo cáo."]', '["Các cơ quan Nhà nước, chẳng hạn như Cục thống kê, bộ phận thống kê của các cơ quan chính quyền", "Các tổ chức kinh doanh dự đoán nhu cầu về các sản phẩm và phân tích rủi ro, lợi nhuận khi đầu tư", "Hỗ trợ các nhà nghiên cứu cả trong khoa học tự nhiên và xã hội", "Các tổ chức nghiên cứu và giáo dục", "Tạp chí và báo phân tích thị trường tài chính", "Kênh thể thao và các hiệp hội cung cấp bình luận đi kèm với điểm phân tích, và các thông tin khác có liên quan"]', TRUE),
+    (41, 'Thống kê bảo hiểm', 'CEI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Nhà thống kê bảo hiểm đảm nhiệm việc tính toán các rủi ro. Họ là những chuyên gia trong việc tính phí bảo hiểm đối với những dạng rủi ro khác nhau dựa trên các tính toán tài chính, toán học và thống kê.', '["Toán ứng dụng (toán tài chính, toán kinh tế)", "Bảo hiểm"]', '["Nghiên cứu, cải tiến, phát triển các lí thuyết và kĩ thuật định phí bảo hiểm", "Thu thập và phân tích số liệu từ các nguồn khác nhau liên quan tới các khoản phí chi cho người bị thương, đau ốm, khuyết tật hoặc tử vong", "Thu thập và phân tích số liệu từ các nguồn khác nhau liên quan tới mất mát tài sản do hoả hoạn, trộm cướp, cháy nổ và các mối nguy hại", "Tính toán tần suất có thể có của các rủi ro đó", "Cố định tỉ lệ tăng thêm của các loại hình rủi ro khác nhau có tính đến thị trường tiền tệ, các điều kiện kinh tế và các xu hướng thị hiếu tương lai", "Tiếp tục nghiên cứu các hướng phát triển và kinh doanh mới, các yếu tố pháp luật, xã hội cũng như các yếu tố khác ảnh hưởng tới việc kinh doanh bảo hiểm", "Khuyến nghị các biện pháp quản trị phù hợp với chính sách tương lai và các khoá đào tạo nhằm nâng cao doanh thu"]', '["Các công ty bảo hiểm", "Các công ty tài chính", "Các công ty tư vấn", "Các phòng ban bảo hiểm của Nhà nước", "Các trường ĐH và CĐ", "Các hãng đầu tư và ngân hàng", "Các đơn vị kế toán công và liên doanh lớn"]', TRUE),
+    (42, 'Nhà sinh vật học', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà sinh vật học nghiên cứu về sự sống và các hệ sinh vật. Họ tiến hành nghiên cứu, cải tiến hoặc phát triển các lí thuyết và phương pháp vận hành cũng như áp dụng kiến thức khoa học liên quan tới sinh vật học, vi sinh vật học, vi khuẩn học, tế bào học, nghiên cứu gen, động vật học, thực vật học và sinh thái học, đặc biệt trong các lĩnh vực dược và nông nghiệp.', '["Sinh vật học", "Động vật học", "Thực vật học", "Vi sinh", "Sinh học ứng dụng (công nghệ sinh học)"]', '["Tiến hành thử nghiệm trong thực tế, trong phòng thí nghiệm những vấn đề liên quan tới tất cả các dạng của sự sống bằng cách xác định và phân loại các nhóm người, động vật, bò sát hoặc các loài cây", "nghiên cứu tìm hiểu về nguồn gốc, sự phát triển, tính chất vật lí, hoá học, cấu trúc, thành phần và sự tái tạo của chúng", "Nghiên cứu và tiến hành các thực nghiệm liên quan tới cấu trúc, sự phát triển và tính chất của các hệ vi sinh vật như vi khuẩn, virus", "Nghiên cứu và tiến hành các thực nghiệm liên quan tới các yếu tố hình thành nên nguồn gốc, sự phát triển và quá trình chuyển đổi các tính chất di truyền học ở tất cả các dạng của sự sống", "Nghiên cứu sự sống của tất cả các cây cỏ và động vật để phát triển các ứng dụng thực tế trong các lĩnh vực như nông nghiệp, dược dựa trên những kiến thức này", "Nghiên cứu và tiến hành thực nghiệm liên quan tới chức năng của các tế bào sống cũng như các ảnh hưởng của các nhân tố vật lí, hoá học đối với các tế bào bình thường và bất thường", "Nghiên cứu mối liên kết giữa động, thực vật với các yếu tố môi trường liên quan", "Phát triển các ứng dụng trong lĩnh vực công nghiệp và y học. 8. Chuẩn bị nghiên cứu khoa học và các báo cáo"]', '["Đây là chuyên ngành chính làm nền tảng cho các ngành nghề liên quan tới khoa học về sự sống. Nơi làm việc cụ thể của nhà sinh vật học phụ thuộc vào lĩnh vực chuyên sâu mà người đó chọn, ví dụ như phòng thí nghiệm sinh học, công ty dược phẩm, nhà máy thực phẩm, nhà máy bia… Bạn cũng có thể giảng dạy môn sinh học tại các trường ĐH, CĐ, TC, THPT, THCS"]', TRUE),
+    (43, 'Nhà khoa học biển', 'IR', 'Phân tích - Logic', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà khoa học biển chủ yếu làm việc ở đại dương. Tùy thuộc vào chuyên môn mà họ nghiên cứu những vật thể không có sự sống (ví dụ như đất, đá ở đáy biển, nước, cát…) hoặc vật thể sống trong đại dương (ví dụ như động vật biển, sinh vật biển…). Các nhà khoa học biển sử dụng máy móc thiết bị chuyên dụng, hình ảnh vệ tinh và lặn dưới nước để thu thập dữ liệu về các đại dương. Họ góp phần bảo vệ môi trường bằng cách phát minh ra phương pháp bảo vệ các vùng nước và bờ biển khỏi ô nhiễm và thiệt hại. Họ ứng dụng kết quả nghiên cứu để phát triển các phương pháp dự báo, đánh giá điều kiện môi trường đại dương, xác định khu vực khai thác, đánh bắt thuỷ sản, cải thiện an ninh vùng biển của một quốc gia.', '["Hải dương học - hóa học", "Hải dương học - địa chất", "Hải dương học - địa vật lí", "Hải dương học - vật lí"]', '["Nghiên cứu tế bào, mô và đời sống của sinh vật trong đại dương", "Đánh giá tác động của môi trường bên trong và bên ngoài đối với các sinh vật trong đại dương", "Tiến hành thăm dò đại dương để thu thập dữ liệu về hình dạng, tính chất của đáy đại dương và các hiện tượng như thủy triều, dòng chảy, núi băng trôi", "Tiến hành phân tích hóa học đáy đại dương và nước biển ở các độ sâu khác nhau", "Lập bản đồ và biểu đồ tích tụ cát trên bãi biển", "Xây dựng một bức tranh toàn diện và thống nhất về các vận động diễn biến của đại dương", "Đánh giá tác động của môi trường bên trong và bên ngoài đối với cấu tạo vật lí của đại dương (ví dụ như đáy đại dương, bờ biển)", "Viết báo cáo dựa trên kết quả nghiên cứu để cung cấp thông tin cho công chúng, chính phủ, các tổ chức môi trường, tổ chức khai thác tài nguyên thiên nhiên và đánh bắt thuỷ sản"]', '["Các viện nghiên cứu của Trung tâm Khoa học tự nhiên và công nghệ quốc gia", "Các viện, trung tâm nghiên cứu và các đài, trạm của Tổng cục Khí tượng thủy văn", "Tập đoàn Dầu khí", "Các đơn vị chuyên môn của quân đội, các cơ quan, doanh nghiệp trong các ngành kinh tế, kĩ thuật liên quan tới khí hậu, tài nguyên, nước và biển…", "Các trường đại học"]', TRUE),
+    (44, 'Kĩ sư và kĩ thuật viên công nghệ sinh học', 'RIC', 'Phân tích - Logic', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ sư công nghệ sinh học áp dụng các nguyên tắc sinh học ở cấp độ “công nghiệp” để kiểm soát, cải tiến và quản lí các quá trình biến đổi về mặt sinh học tồn tại trong tự nhiên như sự lên men, quá trình sản xuất chất xúc tác enzyme nhằm nâng cao lợi ích cho con người bằng nhiều cách khác nhau. Công nghệ sinh học có nhiều ứng dụng trong các lĩnh vực chăm sóc sức khoẻ, nông nghiệp, quản lí môi trường và bào chế thuốc.', '["Công nghệ sinh học"]', '["Tham gia nghiên cứu hệ vi sinh vật như vi khuẩn, nấm, men và enzyme", "Tiến hành nghiên cứu trong các lĩnh vực biến đổi gien và sinh học phân tử, bao gồm việc nhân bản cây cối, động vật và con người từ gien", "Sử dụng vi khuẩn, chất xúc tác và các sinh vật khác cho các mục đích khác nhau trong công nghiệp, sản xuất nông nghiệp, sản xuất thực phẩm và loại bỏ chất thải", "Phát triển và thử nghiệm các phương pháp sản xuất mới", "Điều chỉnh gen của các cơ quan để tạo ra sản phẩm mới", "Tương tác với khách hàng để đưa ra các giải pháp dựa trên kĩ thuật sinh học", "Tính toán ngân sách và chi phí sản xuất cũng như chuẩn bị mua lại hoặc tự phát triển các ứng dụng", "Tư vấn cho Chính phủ, các tổ chức hoặc các doanh nghiệp trong lĩnh vực kĩ sinh học"]', '["Làm việc trong các phòng nghiên cứu thí nghiệm của Nhà nước và tư nhân", "Làm việc trong các doanh nghiệp bào chế thuốc và dược phẩm, sản xuất chất hoá học, nông nghiệp và các ngành liên quan", "Làm việc trong các tổ chức giáo dục liên quan tới giảng dạy và nghiên cứu"]', TRUE),
+    (45, 'Kĩ thuật y sinh', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ thuật y sinh tiến hành nghiên cứu các khía cạnh khác nhau của con người hay các loài động vật nhằm kiểm tra, chứng minh hoặc điều chỉnh hệ thống lí thuyết về sự sống đã biết. Những thông tin này được sử dụng để thiết kế bộ máy hỗ trợ cho sự sống, tối đa hoá lợi ích của các nguyên tắc trong khoa học kĩ thuật và hành vi của sinh vật.', '["Kĩ thuật y sinh", "Kĩ thuật hình ảnh y học", "Thiết bị sinh học", "Vật liệu sinh học và cơ chế sinh học kĩ thuật", "Tế bào, mô và kĩ thuật di truyền", "Kĩ thuật lâm sàng", "Hình ảnh y tế", "Phẫu thuật chỉnh hình", "Kĩ thuật phục hồi chức năng", "Kĩ thuật điện tử y tế", "Kĩ thuật thiết bị điện tử y tế"]', '["Nghiên cứu liên kết giữa số liệu về sinh học và hành vi dựa trên các nguyên tắc về điện tích, cơ chế, hoá học và các nguyên tắc kĩ thuật khác", "Sử dụng thông tin này nhằm thiết kế và phát triển các công cụ và thiết bị như các bộ phận nhân tạo, thiết bị tạo nhịp tim, các thiết bị hình ảnh (ví dụ như máy chụp tia X-quang, máy chụp cắt lớp CT)", "Giới thiệu các thiết bị và công cụ chăm sóc sức khoẻ cá nhân", "Định hướng và đào tạo nhân lực sử dụng máy móc để quan sát, sửa chữa hoặc điều trị những tổn thương về vật chất hoặc biến dạng"]', '["Bệnh viện", "Ngành công nghiệp hoá chất", "Các tổ chức nghiên cứu", "Các cơ sở giáo dục", "Các công ty dược phẩm", "Các cơ quan chỉnh hình, phục hồi chức năng", "Chuyên gia tư vấn độc lập"]', TRUE),
+    (46, 'Nhà nông học', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Nông nghiệp là khoa học và cũng là nghệ thuật về nuôi trồng cây cối, vật nuôi trong các nông trại. Nghề làm vườn cũng là một nhánh thuộc ngành nông nghiệp, liên quan tới các loại cây ăn quả, các loại hạt, rau, hoa và cây cảnh trong vườn hoặc vườn cây ăn quả. Dựa vào nguyên tắc hóa sinh, vi sinh học, di truyền học và các khoa học khác, nhà nông học tham gia nghiên cứu và phát triển các ứng dụng về các lĩnh vực nông nghiệp khác nhau.', '["Nông nghiệp", "Khuyến nông", "Chăn nuôi", "Nông học", "Khoa học cây trồng", "Bảo vệ thực vật", "Công nghệ rau hoa quả và cảnh quan", "Kinh doanh nông nghiệp", "Kinh tế nông nghiệp", "Phát triển nông thôn"]', '["Phát triển kĩ thuật sản xuất (ví dụ như quản lí thủy lợi)", "Nâng cao năng suất nông nghiệp về số lượng và chất lượng (ví dụ như lựa chọn các giống cây trồng có khả năng chống chịu hạn hán, phát triển các loại thuốc trừ sâu mới, công nghệ cảm ứng, các mô hình mô phỏng sự phát triển cây trồng, kĩ thuật nuôi cấy tế bào trong ống nghiệm)", "Biến đổi các sản phẩm chủ yếu thành sản phẩm đầu ra (ví dụ như sản xuất, bảo quản và đóng gói các sản phẩm sữa)", "Khắc phục các tác động bất lợi của môi trường (ví dụ như sâu bệnh, suy thoái đất, xử lí sinh học)"]', '["Làm việc với các tổ chức, doanh nghiệp phát triển máy móc thiết bị nông nghiệp, phương pháp chế biến thực phẩm, phân bón, thuốc trừ sâu, nâng cao số lượng và chất lượng cây trồng và vật nuôi", "Chuyên gia về trang trại như vườn cây ăn quả, cà phê, trang trại gia cầm ...", "Làm việc với các cơ quan Nhà nước trong lĩnh vực quản lí nông nghiệp", "Làm công tác nghiên cứu giảng dạy trong các trường ĐH, CĐ, TC"]', TRUE),
+    (47, 'Kĩ sư thủy sản', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư thủy sản chuyên về nuôi trồng, đánh bắt các loài cá và thủy sản khác. Họ có thể làm việc về thủy sản nước ngọt, nước lợ và nước mặn.', '["Kĩ thuật khai thác thủy sản", "Nuôi trồng thủy sản", "Bệnh học thủy sản", "Quản lí nguồn lợi thủy sản"]', '["Tìm hiểu về quá trình sinh sản và đời sống của các sinh vật sống dưới nước (ví dụ nuôi cá, sò, trai ngọc)", "Tìm hiểu các bệnh có ảnh hưởng đến sự sống của các sinh vật dưới nước", "Nuôi trồng các thuỷ sinh vật phục vụ cho tiêu dùng của con người", "Sử dụng các công cụ đặc biệt để đo oxy, hàm lượng muối, độ pH và các đặc điểm khác của nước để hiểu làm thế nào những điều này ảnh hưởng đến các thuỷ sinh vật", "Duy trì các nhóm sinh vật (ví dụ như tảo) là thức ăn cho các sinh vật biển", "Duy trì hồ sơ chi tiết về nuôi hải sản và môi trường sống cũng như vòng đời của các sinh vật được nuôi", "Phát triển phương pháp đánh bắt mà không làm suy thoái môi trường", "Chế biến thuỷ sản sau thu hoạch", "Giảng dạy, tập huấn về nuôi trồng thuỷ, hải sản", "Tiến hành nghiên cứu và công bố kết quả nghiên cứu"]', '["Các công ty đánh bắt thuỷ sản", "Các tổ chức nghiên cứu và phát triển", "Các tổ chức BVMT"]', TRUE),
+    (48, 'Kĩ sư và kĩ thuật viên lâm nghiệp', 'RIE', 'Phân tích - Logic', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ sư và kĩ thuật viên lâm nghiệp cung cấp hỗ trợ kĩ thuật, tư vấn về các vấn đề và các phương thức lâm nghiệp.', '["Lâm nghiệp", "Lâm nghiệp và đô thị", "Lâm sinh", "Quản lí tài nguyên rừng", "Kinh tế tài nguyên thiên nhiên", "Công nghệ chế biến lâm sản", "Thương mại lâm nghiệp", "Kinh tế học lâm nghiệp", "Quản lí rừng", "Lâm nghiệp xã hội", "Khoa học bảo tồn thiên nhiên hoang dã", "Khoa học và kĩ thuật gỗ"]', '["Cập nhật các phương thức và kĩ thuật lâm nghiệp", "Tư vấn các phương pháp nâng cao chất lượng đầu ra, sản lượng thu hoạch, hiệu quả vận hành hệ thống sản xuất lâm nghiệp, các biện pháp bảo tồn tài nguyên thiên nhiên và môi trường", "Đề xuất các phương pháp giải quyết các vấn đề như tình trạng xói mòn đất hay sâu bệnh phá hoại, ...", "Thu thập số liệu và ước tính số lượng, chi phí nguyên vật liệu, lao động cần thiết trong các dự án", "Tổ chức các buổi nói chuyện, thực hành mẫu, và phổ biến tài liệu nhằm nâng cao nhận thức và chuyển giao kĩ thuật", "Áp dụng kiến thức khoa học và thực tiễn để phát hiện và giải quyết các vấn đề phát sinh trong quá trình làm việc"]', '["Làm việc cho cơ quan kiểm lâm và bảo tồn rừng", "Làm việc cho các dự án về môi trường của các tổ chức phi lợi nhuận (ví dụ: Tổ chức Hoà bình xanh)", "Làm việc cho các cơ quan quốc tế về phát triển, môi trường"]', TRUE),
+    (49, 'Chuyên gia bảo vệ môi trường', 'IRC', 'Phân tích - Logic', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Chuyên gia bảo vệ môi trường nghiên cứu, đánh giá và quản lí tác động của các hoạt động của con người đối với môi trường tự nhiên và nhân tạo. Họ áp dụng chuyên môn vào quản lí ô nhiễm, quản lí chất thải, ứng phó với biến đổi khí hậu và sự cạn kiệt, thoái hóa các nguồn lực tự nhiên. Họ xây dựng các kế hoạch, giải pháp để bảo vệ, bảo tồn, phục hồi, giảm thiểu tác hại tới môi trường', '["Khoa học môi trường", "Khoa học đất", "Công nghệ kĩ thuật môi trường", "Kĩ thuật môi trường", "Kiểm soát và BVMT", "Kinh tế tài nguyên và môi trường", "Kinh tế tài nguyên thiên nhiên", "Quản lí đất đai", "Quản lí tài nguyên và môi trường", "Quản lí chất thải", "BVMT đô thị", "BVMT công nghiệp", "BVMT biển", "Xử lí sự cố tràn dầu", "Xử lí chất thải"]', '["Nghiên cứu, thử nghiệm, thu thập mẫu, đi thực tế và phân tích các xét nghiệm để xác định nguồn gốc của các vấn đề về môi trường và khuyến nghị các giải pháp bảo vệ, kiểm soát và phục hồi", "Kiểm tra và đánh giá tác động môi trường của các hoạt động, qui trình hiện tại", "đánh giá tác động môi trường của các hoạt động, đề xuất, dự án và hướng phát triển tương lai", "Phát triển và điều phối việc thực hiện những hệ thống quản lí môi trường để giúp các tổ chức kiểm soát tác động môi trường do các hoạt động của họ", "Tư vấn và hỗ trợ kĩ thuật cho các tổ chức để giải quyết hài hòa vấn đề môi trường và tổn thất tài chính", "Đánh giá mức độ chấp nhận của xã hội đối với các quyết định và hướng dẫn về môi trường của Nhà nước, xác định vi phạm và mức độ cam kết giải quyết vi phạm", "Phát triển các kế hoạch bảo tồn thiên nhiên", "Chuẩn bị báo cáo và tài liệu nghiên cứu"]', '["Các trung tâm, viện nghiên cứu", "Các tổ chức hàn lâm, trường ĐH, CĐ", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật tư nhân", "Các nhà máy và xí nghiệp có hệ thống kiểm soát ô nhiễm và quản lí chất thải", "Các tổ chức BVMT"]', TRUE),
+    (50, 'Kĩ sư công nghiệp', 'ICR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư quản lí sự vận hành của toàn bộ nhà máy, đảm bảo rằng các qui trình hoạt động hiệu quả, an toàn và có tính kinh tế.', '["Quản lí công nghiệp", "Kĩ thuật hệ thống công nghiệp", "Kĩ thuật công nghiệp"]', '["Tính toán và bố trí các loại thiết bị máy móc khác nhau trong nhà máy sao cho hợp lí và hiệu quả", "Quản lí hệ thống theo cách vừa an toàn vừa năng suất nhất có thể", "Điều chỉnh lại máy móc, thiết bị để nâng cao năng suất", "Đặt ra tiêu chuẩn hoạt động cho công nhân và máy móc", "Phát triển các hệ thống có thể tối ưu hoá tiện nghi ở nơi làm việc thông qua việc quản lí hệ thống ánh sáng, băng ghế, chiều cao máy và mức độ ô nhiễm của máy"]', '["Bất cứ ngành công nghiệp nào", "Các trung tâm nghiên cứu", "Các Viện hàn lâm", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật tư nhân"]', TRUE);
+
+INSERT INTO job_search_tokens (token, job_id, weight) VALUES
+    ('phat', 1, 17),
+    ('thanh', 1, 17),
+    ('vien', 1, 23),
+    ('bien', 1, 8),
+    ('tap', 1, 8),
+    ('truyen', 1, 11),
+    ('thong', 1, 10),
+    ('ngon', 1, 4),
+    ('ngu', 1, 4),
+    ('thoi', 1, 4),
+    ('su', 1, 2),
+    ('the', 1, 2),
+    ('thao', 1, 2),
+    ('tiet', 1, 2),
+    ('tren', 1, 2),
+    ('dai', 1, 2),
+    ('hinh', 1, 2),
+    ('va', 1, 3),
+    ('cac', 1, 4),
+    ('phuong', 1, 1),
+    ('tien', 1, 1),
+    ('khac', 1, 3),
+    ('la', 1, 2),
+    ('nguoi', 1, 1),
+    ('doc', 1, 1),
+    ('ban', 1, 1),
+    ('tin', 1, 1),
+    ('phong', 1, 1),
+    ('van', 1, 1),
+    ('huong', 1, 1),
+    ('dan', 1, 2),
+    ('thuc', 1, 2),
+    ('hien', 1, 2),
+    ('bao', 1, 1),
+    ('hoac', 1, 1),
+    ('chi', 1, 1),
+    ('trong', 1, 1),
+    ('rap', 1, 1),
+    ('chieu', 1, 1),
+    ('phim', 1, 1),
+    ('co', 1, 1),
+    ('so', 1, 1),
+    ('ho', 1, 1),
+    ('duoc', 1, 1),
+    ('vi', 1, 1),
+    ('nhu', 1, 1),
+    ('nhan', 1, 1),
+    ('vat', 1, 1),
+    ('dinh', 1, 1),
+    ('cua', 1, 1),
+    ('chuong', 1, 1),
+    ('trinh', 1, 1),
+    ('nha', 2, 10),
+    ('nhan', 2, 19),
+    ('chung', 2, 19),
+    ('hoc', 2, 22),
+    ('ngon', 2, 7),
+    ('ngu', 2, 7),
+    ('ung', 2, 2),
+    ('dung', 2, 2),
+    ('trong', 2, 2),
+    ('linh', 2, 2),
+    ('vuc', 2, 2),
+    ('sinh', 2, 2),
+    ('vat', 2, 2),
+    ('li', 2, 2),
+    ('xa', 2, 4),
+    ('hoi', 2, 4),
+    ('van', 2, 3),
+    ('hoa', 2, 4),
+    ('la', 2, 1),
+    ('mot', 2, 1),
+    ('nganh', 2, 1),
+    ('khoa', 2, 1),
+    ('nghien', 2, 1),
+    ('cuu', 2, 1),
+    ('qua', 2, 2),
+    ('trinh', 2, 1),
+    ('tien', 2, 1),
+    ('cua', 2, 2),
+    ('con', 2, 2),
+    ('nguoi', 2, 1),
+    ('phong', 2, 1),
+    ('tuc', 2, 1),
+    ('truyen', 2, 1),
+    ('thong', 2, 1),
+    ('cac', 2, 7),
+    ('thoi', 2, 1),
+    ('dai', 2, 2),
+    ('cung', 2, 2),
+    ('nhu', 2, 2),
+    ('nen', 2, 1),
+    ('ton', 2, 2),
+    ('tai', 2, 1),
+    ('den', 2, 3),
+    ('ngay', 2, 1),
+    ('nay', 2, 1),
+    ('ho', 2, 1),
+    ('quan', 2, 3),
+    ('tam', 2, 2),
+    ('khia', 2, 1),
+    ('canh', 2, 1),
+    ('doi', 2, 1),
+    ('song', 2, 1),
+    ('giao', 2, 1),
+    ('gia', 2, 1),
+    ('dinh', 2, 1),
+    ('moi', 2, 1),
+    ('he', 2, 1),
+    ('nghe', 2, 2),
+    ('thuat', 2, 1),
+    ('thu', 2, 1),
+    ('cong', 2, 1),
+    ('am', 2, 1),
+    ('nhac', 2, 1),
+    ('bieu', 2, 1),
+    ('tuong', 2, 1),
+    ('than', 2, 1),
+    ('thoai', 2, 1),
+    ('va', 2, 2),
+    ('hoat', 2, 2),
+    ('dong', 2, 2),
+    ('dan', 2, 1),
+    ('gian', 2, 1),
+    ('kinh', 2, 1),
+    ('te', 2, 1),
+    ('chinh', 2, 1),
+    ('tri', 2, 1),
+    ('hien', 2, 1),
+    ('nha', 3, 10),
+    ('khao', 3, 23),
+    ('co', 3, 23),
+    ('hoc', 3, 22),
+    ('ngon', 3, 4),
+    ('ngu', 3, 4),
+    ('ung', 3, 2),
+    ('dung', 3, 2),
+    ('sinh', 3, 2),
+    ('so', 3, 2),
+    ('hoa', 3, 2),
+    ('dan', 3, 2),
+    ('toc', 3, 2),
+    ('thuc', 3, 2),
+    ('nghiem', 3, 2),
+    ('dia', 3, 2),
+    ('chat', 3, 2),
+    ('lich', 3, 2),
+    ('su', 3, 3),
+    ('cac', 3, 3),
+    ('nghien', 3, 2),
+    ('cuu', 3, 2),
+    ('qua', 3, 2),
+    ('khu', 3, 2),
+    ('de', 3, 1),
+    ('hieu', 3, 1),
+    ('con', 3, 1),
+    ('nguoi', 3, 1),
+    ('da', 3, 1),
+    ('song', 3, 1),
+    ('nhu', 3, 2),
+    ('the', 3, 1),
+    ('nao', 3, 1),
+    ('ho', 3, 1),
+    ('theo', 3, 1),
+    ('doi', 3, 1),
+    ('phat', 3, 1),
+    ('trien', 3, 1),
+    ('cua', 3, 2),
+    ('nhan', 3, 1),
+    ('loai', 3, 1),
+    ('bang', 3, 1),
+    ('cach', 3, 1),
+    ('di', 3, 1),
+    ('vat', 3, 1),
+    ('tu', 3, 1),
+    ('cung', 3, 1),
+    ('dien', 3, 1),
+    ('den', 3, 1),
+    ('dai', 3, 1),
+    ('cong', 3, 1),
+    ('cu', 3, 1),
+    ('do', 3, 1),
+    ('gom', 3, 1),
+    ('tien', 3, 1),
+    ('xu', 3, 1),
+    ('vu', 3, 1),
+    ('khi', 3, 1),
+    ('hay', 3, 1),
+    ('tac', 3, 1),
+    ('pham', 3, 1),
+    ('dieu', 3, 1),
+    ('khac', 3, 1),
+    ('chuyen', 4, 9),
+    ('vien', 4, 9),
+    ('luu', 4, 13),
+    ('tru', 4, 13),
+    ('van', 4, 10),
+    ('thu', 4, 10),
+    ('va', 4, 16),
+    ('quan', 4, 13),
+    ('li', 4, 13),
+    ('bao', 4, 16),
+    ('tang', 4, 11),
+    ('ngon', 4, 4),
+    ('ngu', 4, 4),
+    ('co', 4, 5),
+    ('vat', 4, 4),
+    ('chu', 4, 3),
+    ('viet', 4, 2),
+    ('cong', 4, 2),
+    ('nghe', 4, 4),
+    ('thong', 4, 8),
+    ('tin', 4, 6),
+    ('ho', 4, 3),
+    ('so', 4, 3),
+    ('an', 4, 2),
+    ('toan', 4, 2),
+    ('mat', 4, 2),
+    ('mot', 4, 1),
+    ('he', 4, 2),
+    ('la', 4, 1),
+    ('tap', 4, 1),
+    ('hop', 4, 1),
+    ('cac', 4, 2),
+    ('ghi', 4, 1),
+    ('chep', 4, 1),
+    ('theo', 4, 1),
+    ('lich', 4, 2),
+    ('su', 4, 2),
+    ('gom', 4, 1),
+    ('cai', 4, 1),
+    ('giay', 4, 1),
+    ('to', 4, 2),
+    ('hinh', 4, 1),
+    ('anh', 4, 1),
+    ('nhat', 4, 1),
+    ('ki', 4, 2),
+    ('hay', 4, 1),
+    ('bat', 4, 1),
+    ('loai', 4, 1),
+    ('hien', 4, 2),
+    ('nao', 4, 1),
+    ('khac', 4, 1),
+    ('nay', 4, 1),
+    ('cung', 4, 1),
+    ('danh', 4, 2),
+    ('dau', 4, 1),
+    ('vi', 4, 1),
+    ('tri', 4, 1),
+    ('nhung', 4, 1),
+    ('do', 4, 1),
+    ('tien', 4, 1),
+    ('hanh', 4, 1),
+    ('nghien', 4, 1),
+    ('cuu', 4, 1),
+    ('thap', 4, 1),
+    ('gia', 4, 1),
+    ('ve', 4, 1),
+    ('ton', 4, 1),
+    ('noi', 4, 1),
+    ('dung', 4, 1),
+    ('tai', 4, 2),
+    ('lieu', 4, 1),
+    ('loi', 4, 1),
+    ('ich', 4, 1),
+    ('hoa', 4, 1),
+    ('thuat', 4, 2),
+    ('dong', 4, 1),
+    ('thoi', 4, 1),
+    ('chuc', 4, 1),
+    ('trung', 4, 1),
+    ('bay', 4, 1),
+    ('trien', 4, 1),
+    ('lam', 4, 1),
+    ('thu', 5, 15),
+    ('ki', 5, 12),
+    ('dieu', 5, 10),
+    ('hanh', 5, 13),
+    ('ngon', 5, 4),
+    ('ngu', 5, 4),
+    ('chuyen', 5, 4),
+    ('sau', 5, 4),
+    ('theo', 5, 4),
+    ('loai', 5, 2),
+    ('to', 5, 8),
+    ('chuc', 5, 8),
+    ('vi', 5, 4),
+    ('du', 5, 4),
+    ('tu', 5, 4),
+    ('thien', 5, 2),
+    ('kinh', 5, 2),
+    ('doanh', 5, 5),
+    ('giao', 5, 2),
+    ('duc', 5, 2),
+    ('linh', 5, 2),
+    ('vuc', 5, 2),
+    ('luat', 5, 3),
+    ('lien', 5, 2),
+    ('quan', 5, 7),
+    ('den', 5, 2),
+    ('nghiep', 5, 3),
+    ('thue', 5, 2),
+    ('co', 5, 7),
+    ('phan', 5, 2),
+    ('hoa', 5, 2),
+    ('mua', 5, 2),
+    ('ban', 5, 2),
+    ('sap', 5, 3),
+    ('nhap', 5, 2),
+    ('la', 5, 2),
+    ('nguoi', 5, 2),
+    ('ho', 5, 3),
+    ('tro', 5, 2),
+    ('tri', 5, 2),
+    ('chinh', 5, 2),
+    ('cho', 5, 2),
+    ('lanh', 5, 1),
+    ('dao', 5, 2),
+    ('cap', 5, 2),
+    ('cao', 5, 2),
+    ('tien', 5, 1),
+    ('nghien', 5, 1),
+    ('cuu', 5, 1),
+    ('viet', 5, 1),
+    ('bao', 5, 2),
+    ('thong', 5, 2),
+    ('ke', 5, 1),
+    ('xu', 5, 1),
+    ('li', 5, 3),
+    ('yeu', 5, 1),
+    ('cau', 5, 1),
+    ('tin', 5, 1),
+    ('va', 5, 6),
+    ('thuc', 5, 1),
+    ('hien', 5, 1),
+    ('ca', 5, 1),
+    ('nhung', 5, 1),
+    ('nhiem', 5, 2),
+    ('vu', 5, 2),
+    ('cua', 5, 2),
+    ('nhu', 5, 1),
+    ('soan', 5, 1),
+    ('thao', 5, 1),
+    ('tiep', 5, 1),
+    ('khach', 5, 1),
+    ('dat', 5, 1),
+    ('lich', 5, 1),
+    ('hop', 5, 1),
+    ('xep', 5, 1),
+    ('hoi', 5, 2),
+    ('dam', 5, 2),
+    ('dien', 5, 2),
+    ('thoai', 5, 1),
+    ('cung', 5, 1),
+    ('the', 5, 1),
+    ('tao', 5, 1),
+    ('giam', 5, 2),
+    ('sat', 5, 1),
+    ('o', 5, 1),
+    ('thap', 5, 1),
+    ('hon', 5, 1),
+    ('trong', 5, 1),
+    ('chu', 5, 1),
+    ('tich', 5, 1),
+    ('doc', 5, 1),
+    ('ket', 5, 1),
+    ('noi', 5, 1),
+    ('giua', 5, 1),
+    ('dong', 5, 2),
+    ('cac', 5, 2),
+    ('phap', 5, 1),
+    ('tuc', 5, 1),
+    ('duoc', 5, 1),
+    ('tuan', 5, 1),
+    ('danh', 5, 1),
+    ('gia', 5, 1),
+    ('thuong', 5, 1),
+    ('xuyen', 5, 1),
+    ('giang', 6, 12),
+    ('vien', 6, 11),
+    ('dai', 6, 18),
+    ('hoc', 6, 26),
+    ('sau', 6, 13),
+    ('ngon', 6, 6),
+    ('ngu', 6, 6),
+    ('day', 6, 4),
+    ('linh', 6, 4),
+    ('vuc', 6, 4),
+    ('chuyen', 6, 8),
+    ('chu', 6, 2),
+    ('yeu', 6, 2),
+    ('la', 6, 3),
+    ('lien', 6, 2),
+    ('quan', 6, 6),
+    ('den', 6, 2),
+    ('cac', 6, 7),
+    ('nganh', 6, 5),
+    ('nghe', 6, 4),
+    ('dao', 6, 2),
+    ('tao', 6, 2),
+    ('mon', 6, 7),
+    ('nhu', 6, 2),
+    ('kinh', 6, 2),
+    ('te', 6, 2),
+    ('tai', 6, 2),
+    ('chinh', 6, 2),
+    ('khoa', 6, 8),
+    ('tu', 6, 2),
+    ('nhien', 6, 2),
+    ('xa', 6, 2),
+    ('hoi', 6, 2),
+    ('cong', 6, 4),
+    ('duoc', 6, 2),
+    ('co', 6, 5),
+    ('so', 6, 2),
+    ('li', 6, 4),
+    ('cung', 6, 2),
+    ('the', 6, 3),
+    ('sang', 6, 2),
+    ('viec', 6, 2),
+    ('va', 6, 7),
+    ('tro', 6, 2),
+    ('thanh', 6, 2),
+    ('nguoi', 6, 3),
+    ('dung', 6, 2),
+    ('dau', 6, 2),
+    ('bo', 6, 2),
+    ('truong', 6, 6),
+    ('vi', 6, 2),
+    ('du', 6, 2),
+    ('hieu', 6, 2),
+    ('cao', 6, 1),
+    ('kien', 6, 1),
+    ('thuc', 6, 3),
+    ('ve', 6, 2),
+    ('mot', 6, 2),
+    ('cu', 6, 1),
+    ('ly', 6, 2),
+    ('thuyet', 6, 2),
+    ('hanh', 6, 1),
+    ('hay', 6, 1),
+    ('nhieu', 6, 1),
+    ('o', 6, 2),
+    ('bac', 6, 1),
+    ('hoac', 6, 1),
+    ('tuong', 6, 1),
+    ('duong', 6, 1),
+    ('hien', 6, 1),
+    ('nghien', 6, 1),
+    ('cuu', 6, 1),
+    ('cai', 6, 1),
+    ('tien', 6, 1),
+    ('phat', 6, 1),
+    ('trien', 6, 1),
+    ('khai', 6, 1),
+    ('niem', 6, 1),
+    ('phuong', 6, 1),
+    ('phap', 6, 1),
+    ('hoat', 6, 1),
+    ('dong', 6, 1),
+    ('bien', 6, 1),
+    ('soan', 6, 1),
+    ('sach', 6, 1),
+    ('giang', 7, 14),
+    ('vien', 7, 11),
+    ('cao', 7, 12),
+    ('dang', 7, 12),
+    ('ngon', 7, 4),
+    ('ngu', 7, 4),
+    ('day', 7, 6),
+    ('hoc', 7, 7),
+    ('linh', 7, 2),
+    ('vuc', 7, 2),
+    ('chuyen', 7, 6),
+    ('sau', 7, 3),
+    ('chu', 7, 2),
+    ('yeu', 7, 2),
+    ('la', 7, 3),
+    ('lien', 7, 2),
+    ('quan', 7, 6),
+    ('den', 7, 2),
+    ('mon', 7, 5),
+    ('vi', 7, 4),
+    ('du', 7, 4),
+    ('giao', 7, 2),
+    ('thong', 7, 2),
+    ('van', 7, 2),
+    ('tai', 7, 2),
+    ('cac', 7, 4),
+    ('phan', 7, 2),
+    ('co', 7, 5),
+    ('li', 7, 6),
+    ('thuyet', 7, 4),
+    ('hinh', 7, 2),
+    ('hoa', 7, 2),
+    ('ve', 7, 4),
+    ('ki', 7, 2),
+    ('thuat', 7, 2),
+    ('cung', 7, 2),
+    ('the', 7, 3),
+    ('sang', 7, 2),
+    ('cong', 7, 2),
+    ('viec', 7, 2),
+    ('va', 7, 7),
+    ('tro', 7, 2),
+    ('thanh', 7, 2),
+    ('nguoi', 7, 3),
+    ('dung', 7, 2),
+    ('dau', 7, 2),
+    ('bo', 7, 2),
+    ('khoa', 7, 4),
+    ('truong', 7, 6),
+    ('hieu', 7, 2),
+    ('kien', 7, 1),
+    ('thuc', 7, 3),
+    ('mot', 7, 2),
+    ('nganh', 7, 1),
+    ('cu', 7, 1),
+    ('ly', 7, 2),
+    ('hanh', 7, 1),
+    ('hay', 7, 1),
+    ('nhieu', 7, 1),
+    ('o', 7, 1),
+    ('bac', 7, 1),
+    ('hoac', 7, 1),
+    ('tuong', 7, 1),
+    ('duong', 7, 1),
+    ('hien', 7, 1),
+    ('nghien', 7, 1),
+    ('cuu', 7, 1),
+    ('cai', 7, 1),
+    ('tien', 7, 1),
+    ('phat', 7, 1),
+    ('trien', 7, 1),
+    ('khai', 7, 1),
+    ('niem', 7, 1),
+    ('phuong', 7, 1),
+    ('phap', 7, 1),
+    ('hoat', 7, 1),
+    ('dong', 7, 1),
+    ('bien', 7, 1),
+    ('soan', 7, 1),
+    ('sach', 7, 1),
+    ('giao', 8, 14),
+    ('vien', 8, 11),
+    ('trung', 8, 12),
+    ('cap', 8, 11),
+    ('ngon', 8, 4),
+    ('ngu', 8, 4),
+    ('mon', 8, 5),
+    ('lien', 8, 4),
+    ('quan', 8, 8),
+    ('linh', 8, 3),
+    ('vuc', 8, 3),
+    ('chuyen', 8, 5),
+    ('sau', 8, 4),
+    ('chu', 8, 2),
+    ('yeu', 8, 2),
+    ('la', 8, 3),
+    ('den', 8, 2),
+    ('hoc', 8, 5),
+    ('phan', 8, 2),
+    ('giang', 8, 2),
+    ('day', 8, 4),
+    ('vi', 8, 4),
+    ('du', 8, 4),
+    ('thuc', 8, 7),
+    ('hanh', 8, 5),
+    ('lai', 8, 2),
+    ('xe', 8, 2),
+    ('nang', 8, 2),
+    ('gap', 8, 2),
+    ('khan', 8, 2),
+    ('li', 8, 4),
+    ('cung', 8, 2),
+    ('co', 8, 4),
+    ('the', 8, 3),
+    ('sang', 8, 2),
+    ('cong', 8, 2),
+    ('viec', 8, 2),
+    ('va', 8, 4),
+    ('tro', 8, 2),
+    ('thanh', 8, 2),
+    ('nguoi', 8, 3),
+    ('dung', 8, 2),
+    ('dau', 8, 2),
+    ('bo', 8, 2),
+    ('khoa', 8, 4),
+    ('truong', 8, 6),
+    ('hieu', 8, 2),
+    ('kien', 8, 1),
+    ('ve', 8, 2),
+    ('mot', 8, 2),
+    ('cu', 8, 1),
+    ('cac', 8, 1),
+    ('ly', 8, 1),
+    ('thuyet', 8, 1),
+    ('hay', 8, 1),
+    ('nhieu', 8, 1),
+    ('o', 8, 1),
+    ('duc', 8, 3),
+    ('khi', 8, 1),
+    ('ket', 8, 1),
+    ('so', 8, 1),
+    ('hoac', 8, 2),
+    ('pho', 8, 1),
+    ('thong', 8, 1),
+    ('voi', 8, 1),
+    ('muc', 8, 1),
+    ('dich', 8, 1),
+    ('huong', 8, 1),
+    ('nghiep', 8, 1),
+    ('nghe', 8, 1),
+    ('giao', 9, 13),
+    ('vien', 9, 11),
+    ('trung', 9, 11),
+    ('hoc', 9, 14),
+    ('pho', 9, 12),
+    ('thong', 9, 10),
+    ('ngon', 9, 4),
+    ('ngu', 9, 4),
+    ('mon', 9, 7),
+    ('lien', 9, 4),
+    ('quan', 9, 8),
+    ('linh', 9, 2),
+    ('vuc', 9, 2),
+    ('chuyen', 9, 4),
+    ('sau', 9, 2),
+    ('chu', 9, 2),
+    ('yeu', 9, 2),
+    ('la', 9, 2),
+    ('den', 9, 2),
+    ('vi', 9, 5),
+    ('du', 9, 5),
+    ('tieng', 9, 2),
+    ('anh', 9, 2),
+    ('vat', 9, 2),
+    ('li', 9, 6),
+    ('toan', 9, 2),
+    ('cung', 9, 2),
+    ('co', 9, 2),
+    ('the', 9, 2),
+    ('sang', 9, 2),
+    ('cong', 9, 2),
+    ('viec', 9, 2),
+    ('va', 9, 2),
+    ('tro', 9, 2),
+    ('thanh', 9, 2),
+    ('nguoi', 9, 2),
+    ('dung', 9, 2),
+    ('dau', 9, 2),
+    ('bo', 9, 2),
+    ('to', 9, 2),
+    ('truong', 9, 5),
+    ('hieu', 9, 4),
+    ('day', 9, 3),
+    ('sinh', 9, 1),
+    ('o', 9, 1),
+    ('cac', 9, 1),
+    ('hoac', 9, 3),
+    ('tuong', 9, 1),
+    ('duong', 9, 1),
+    ('nhu', 9, 1),
+    ('tam', 9, 1),
+    ('duc', 9, 2),
+    ('thuong', 9, 1),
+    ('xuyen', 9, 1),
+    ('ho', 9, 1),
+    ('mot', 9, 1),
+    ('nhieu', 9, 1),
+    ('voi', 9, 1),
+    ('muc', 9, 1),
+    ('dich', 9, 1),
+    ('huong', 9, 1),
+    ('nghiep', 9, 1),
+    ('nghe', 9, 1),
+    ('giao', 10, 12),
+    ('vien', 10, 11),
+    ('trung', 10, 11),
+    ('hoc', 10, 15),
+    ('co', 10, 13),
+    ('so', 10, 11),
+    ('ngon', 10, 4),
+    ('ngu', 10, 4),
+    ('mon', 10, 7),
+    ('lien', 10, 4),
+    ('quan', 10, 8),
+    ('linh', 10, 2),
+    ('vuc', 10, 2),
+    ('chuyen', 10, 4),
+    ('sau', 10, 2),
+    ('chu', 10, 2),
+    ('yeu', 10, 2),
+    ('la', 10, 2),
+    ('den', 10, 2),
+    ('vi', 10, 5),
+    ('du', 10, 5),
+    ('tieng', 10, 2),
+    ('anh', 10, 2),
+    ('vat', 10, 2),
+    ('li', 10, 6),
+    ('toan', 10, 2),
+    ('cung', 10, 2),
+    ('the', 10, 2),
+    ('sang', 10, 2),
+    ('cong', 10, 2),
+    ('viec', 10, 2),
+    ('va', 10, 2),
+    ('tro', 10, 2),
+    ('thanh', 10, 2),
+    ('nguoi', 10, 2),
+    ('dung', 10, 2),
+    ('dau', 10, 2),
+    ('bo', 10, 2),
+    ('to', 10, 2),
+    ('truong', 10, 6),
+    ('hieu', 10, 4),
+    ('pho', 10, 2),
+    ('day', 10, 3),
+    ('sinh', 10, 1),
+    ('o', 10, 1),
+    ('cac', 10, 1),
+    ('hoac', 10, 3),
+    ('tuong', 10, 1),
+    ('duong', 10, 1),
+    ('nhu', 10, 1),
+    ('tre', 10, 1),
+    ('em', 10, 1),
+    ('khuyet', 10, 1),
+    ('tat', 10, 1),
+    ('bac', 10, 1),
+    ('ho', 10, 1),
+    ('mot', 10, 1),
+    ('nhieu', 10, 1),
+    ('voi', 10, 1),
+    ('muc', 10, 1),
+    ('dich', 10, 1),
+    ('duc', 10, 1),
+    ('huong', 10, 1),
+    ('nghiep', 10, 1),
+    ('nghe', 10, 1),
+    ('giao', 11, 12),
+    ('vien', 11, 11),
+    ('ngoai', 11, 10),
+    ('ngu', 11, 16),
+    ('ngon', 11, 6),
+    ('mon', 11, 8),
+    ('lien', 11, 4),
+    ('quan', 11, 8),
+    ('linh', 11, 2),
+    ('vuc', 11, 2),
+    ('chuyen', 11, 6),
+    ('sau', 11, 2),
+    ('chu', 11, 2),
+    ('yeu', 11, 2),
+    ('la', 11, 2),
+    ('den', 11, 2),
+    ('hoc', 11, 5),
+    ('vi', 11, 4),
+    ('du', 11, 4),
+    ('tieng', 11, 6),
+    ('anh', 11, 2),
+    ('phap', 11, 2),
+    ('tay', 11, 2),
+    ('ban', 11, 2),
+    ('nha', 11, 2),
+    ('li', 11, 4),
+    ('cung', 11, 2),
+    ('co', 11, 2),
+    ('the', 11, 2),
+    ('sang', 11, 2),
+    ('cong', 11, 2),
+    ('viec', 11, 2),
+    ('va', 11, 3),
+    ('tro', 11, 2),
+    ('thanh', 11, 2),
+    ('nguoi', 11, 2),
+    ('dung', 11, 2),
+    ('dau', 11, 2),
+    ('bo', 11, 2),
+    ('to', 11, 4),
+    ('truong', 11, 7),
+    ('hieu', 11, 2),
+    ('day', 11, 3),
+    ('sinh', 11, 1),
+    ('o', 11, 1),
+    ('cac', 11, 2),
+    ('trung', 11, 2),
+    ('pho', 11, 1),
+    ('thong', 11, 1),
+    ('cap', 11, 1),
+    ('cao', 11, 1),
+    ('dang', 11, 1),
+    ('bac', 11, 1),
+    ('khac', 11, 2),
+    ('ho', 11, 1),
+    ('mot', 11, 1),
+    ('hoac', 11, 2),
+    ('nhieu', 11, 1),
+    ('nhau', 11, 1),
+    ('nham', 11, 1),
+    ('muc', 11, 1),
+    ('dich', 11, 1),
+    ('duc', 11, 1),
+    ('huong', 11, 1),
+    ('nghiep', 11, 1),
+    ('nghe', 11, 1),
+    ('chuyen', 12, 9),
+    ('vien', 12, 9),
+    ('quan', 12, 17),
+    ('he', 12, 15),
+    ('cong', 12, 10),
+    ('chung', 12, 10),
+    ('ngon', 12, 4),
+    ('ngu', 12, 4),
+    ('tri', 12, 2),
+    ('khung', 12, 2),
+    ('hoang', 12, 2),
+    ('chinh', 12, 5),
+    ('phu', 12, 2),
+    ('van', 12, 2),
+    ('dong', 12, 3),
+    ('hanh', 12, 2),
+    ('lang', 12, 2),
+    ('chu', 12, 2),
+    ('dau', 12, 2),
+    ('tu', 12, 2),
+    ('va', 12, 2),
+    ('cac', 12, 8),
+    ('moi', 12, 2),
+    ('tai', 12, 2),
+    ('truyen', 12, 5),
+    ('thong', 12, 6),
+    ('tiep', 12, 2),
+    ('thi', 12, 2),
+    ('voi', 12, 3),
+    ('gioi', 12, 3),
+    ('chuan', 12, 2),
+    ('bi', 12, 2),
+    ('an', 12, 2),
+    ('pham', 12, 3),
+    ('chien', 12, 2),
+    ('dich', 12, 2),
+    ('quang', 12, 2),
+    ('ba', 12, 2),
+    ('su', 12, 3),
+    ('kien', 12, 2),
+    ('xuc', 12, 2),
+    ('tien', 12, 2),
+    ('dac', 12, 2),
+    ('biet', 12, 3),
+    ('con', 12, 1),
+    ('duoc', 12, 2),
+    ('goi', 12, 1),
+    ('la', 12, 2),
+    ('can', 12, 1),
+    ('bo', 12, 1),
+    ('nguoi', 12, 2),
+    ('giu', 12, 1),
+    ('nhiem', 12, 1),
+    ('vu', 12, 1),
+    ('ket', 12, 1),
+    ('noi', 12, 1),
+    ('giua', 12, 1),
+    ('to', 12, 2),
+    ('chuc', 12, 2),
+    ('doanh', 12, 2),
+    ('nghiep', 12, 2),
+    ('the', 12, 1),
+    ('ben', 12, 1),
+    ('ngoai', 12, 1),
+    ('ho', 12, 1),
+    ('dam', 12, 1),
+    ('bao', 12, 1),
+    ('rang', 12, 1),
+    ('tin', 12, 1),
+    ('xac', 12, 1),
+    ('ve', 12, 1),
+    ('khach', 12, 1),
+    ('hang', 12, 1),
+    ('san', 12, 1),
+    ('hoac', 12, 1),
+    ('dung', 12, 1),
+    ('lao', 12, 1),
+    ('doi', 12, 1),
+    ('tuong', 12, 1),
+    ('den', 12, 1),
+    ('luat', 13, 26),
+    ('su', 13, 15),
+    ('ngon', 13, 4),
+    ('ngu', 13, 4),
+    ('hien', 13, 2),
+    ('phap', 13, 3),
+    ('hanh', 13, 3),
+    ('chinh', 13, 3),
+    ('doanh', 13, 3),
+    ('nghiep', 13, 2),
+    ('dan', 13, 3),
+    ('thuong', 13, 3),
+    ('mai', 13, 3),
+    ('hinh', 13, 3),
+    ('moi', 13, 2),
+    ('truong', 13, 2),
+    ('y', 13, 2),
+    ('te', 13, 2),
+    ('so', 13, 3),
+    ('huu', 13, 3),
+    ('tri', 13, 3),
+    ('tue', 13, 3),
+    ('la', 13, 1),
+    ('nguoi', 13, 2),
+    ('bao', 13, 2),
+    ('chua', 13, 1),
+    ('hoac', 13, 1),
+    ('ve', 13, 1),
+    ('quyen', 13, 1),
+    ('loi', 13, 1),
+    ('cho', 13, 1),
+    ('than', 13, 1),
+    ('chu', 13, 1),
+    ('tai', 13, 1),
+    ('toa', 13, 1),
+    ('an', 13, 3),
+    ('trong', 13, 1),
+    ('cac', 13, 3),
+    ('vu', 13, 4),
+    ('viec', 13, 2),
+    ('va', 13, 3),
+    ('yeu', 13, 2),
+    ('cau', 13, 2),
+    ('khac', 13, 2),
+    ('theo', 13, 1),
+    ('qui', 13, 1),
+    ('dinh', 13, 2),
+    ('cua', 13, 1),
+    ('co', 13, 1),
+    ('the', 13, 1),
+    ('lien', 13, 1),
+    ('quan', 13, 1),
+    ('den', 13, 1),
+    ('nhung', 13, 1),
+    ('linh', 13, 1),
+    ('vuc', 13, 1),
+    ('nhau', 13, 1),
+    ('nhu', 13, 1),
+    ('hon', 13, 1),
+    ('nhan', 13, 1),
+    ('gia', 13, 1),
+    ('kinh', 13, 1),
+    ('lao', 13, 1),
+    ('dong', 13, 1),
+    ('thu', 14, 33),
+    ('va', 14, 16),
+    ('nhan', 14, 9),
+    ('vien', 14, 22),
+    ('ngon', 14, 4),
+    ('ngu', 14, 5),
+    ('tu', 14, 2),
+    ('dong', 14, 2),
+    ('hoa', 14, 2),
+    ('xay', 14, 2),
+    ('dung', 14, 4),
+    ('mang', 14, 2),
+    ('luoi', 14, 2),
+    ('ki', 14, 2),
+    ('thuat', 14, 3),
+    ('so', 14, 2),
+    ('muc', 14, 2),
+    ('luc', 14, 2),
+    ('tom', 14, 2),
+    ('tat', 14, 2),
+    ('quan', 14, 3),
+    ('li', 14, 3),
+    ('noi', 14, 2),
+    ('cac', 14, 3),
+    ('cong', 14, 4),
+    ('cu', 14, 2),
+    ('nghe', 14, 2),
+    ('thong', 14, 3),
+    ('tin', 14, 3),
+    ('la', 14, 2),
+    ('nhung', 14, 1),
+    ('nguoi', 14, 2),
+    ('thap', 14, 1),
+    ('luu', 14, 1),
+    ('tru', 14, 1),
+    ('tai', 14, 3),
+    ('lieu', 14, 3),
+    ('ghi', 14, 1),
+    ('lai', 14, 2),
+    ('hoac', 14, 1),
+    ('cho', 14, 1),
+    ('muon', 14, 1),
+    ('sach', 14, 1),
+    ('bao', 14, 1),
+    ('lay', 14, 1),
+    ('cung', 14, 1),
+    ('cap', 14, 1),
+    ('theo', 14, 1),
+    ('yeu', 14, 1),
+    ('cau', 14, 1),
+    ('ho', 14, 1),
+    ('con', 14, 1),
+    ('duoc', 14, 1),
+    ('goi', 14, 1),
+    ('bang', 14, 1),
+    ('mot', 14, 1),
+    ('khac', 14, 1),
+    ('rong', 14, 1),
+    ('hon', 14, 1),
+    ('bien', 15, 18),
+    ('tap', 15, 20),
+    ('vien', 15, 10),
+    ('nha', 15, 8),
+    ('xuat', 15, 9),
+    ('ban', 15, 10),
+    ('ngon', 15, 5),
+    ('ngu', 15, 5),
+    ('sach', 15, 2),
+    ('chi', 15, 2),
+    ('bao', 15, 2),
+    ('tren', 15, 3),
+    ('internet', 15, 3),
+    ('lam', 15, 1),
+    ('viec', 15, 1),
+    ('voi', 15, 2),
+    ('cac', 15, 3),
+    ('tac', 15, 2),
+    ('gia', 15, 2),
+    ('giup', 15, 1),
+    ('ho', 15, 2),
+    ('trinh', 15, 2),
+    ('bay', 15, 2),
+    ('pham', 15, 1),
+    ('cua', 15, 2),
+    ('mot', 15, 2),
+    ('cach', 15, 2),
+    ('loi', 15, 1),
+    ('cuon', 15, 1),
+    ('chinh', 15, 2),
+    ('sua', 15, 1),
+    ('va', 15, 3),
+    ('hoan', 15, 1),
+    ('thien', 15, 1),
+    ('thao', 15, 1),
+    ('ngay', 15, 1),
+    ('nay', 15, 2),
+    ('su', 15, 2),
+    ('phat', 15, 1),
+    ('trien', 15, 1),
+    ('nganh', 15, 1),
+    ('cung', 15, 2),
+    ('duoc', 15, 1),
+    ('mo', 15, 1),
+    ('rong', 15, 1),
+    ('tham', 15, 1),
+    ('xay', 15, 1),
+    ('dung', 15, 4),
+    ('noi', 15, 2),
+    ('mang', 15, 1),
+    ('kiem', 15, 1),
+    ('tra', 15, 1),
+    ('xem', 15, 1),
+    ('co', 15, 1),
+    ('xac', 15, 1),
+    ('hap', 15, 1),
+    ('dan', 15, 1),
+    ('hay', 15, 1),
+    ('khong', 15, 1),
+    ('nha', 16, 9),
+    ('nghien', 16, 10),
+    ('cuu', 16, 10),
+    ('khoa', 16, 16),
+    ('hoc', 16, 34),
+    ('xa', 16, 18),
+    ('hoi', 16, 18),
+    ('ngon', 16, 4),
+    ('ngu', 16, 4),
+    ('nhan', 16, 4),
+    ('chung', 16, 3),
+    ('kinh', 16, 3),
+    ('te', 16, 3),
+    ('lich', 16, 3),
+    ('su', 16, 3),
+    ('triet', 16, 2),
+    ('chinh', 16, 3),
+    ('tri', 16, 3),
+    ('tam', 16, 4),
+    ('li', 16, 3),
+    ('quan', 16, 3),
+    ('toi', 16, 2),
+    ('hanh', 16, 1),
+    ('vi', 16, 1),
+    ('ban', 16, 1),
+    ('chat', 16, 1),
+    ('va', 16, 5),
+    ('cuoc', 16, 1),
+    ('song', 16, 1),
+    ('cua', 16, 1),
+    ('con', 16, 1),
+    ('nguoi', 16, 4),
+    ('nhu', 16, 2),
+    ('mot', 16, 1),
+    ('chu', 16, 1),
+    ('the', 16, 1),
+    ('cac', 16, 3),
+    ('loai', 16, 1),
+    ('nhung', 16, 2),
+    ('moi', 16, 1),
+    ('he', 16, 1),
+    ('giua', 16, 1),
+    ('trong', 16, 1),
+    ('co', 16, 1),
+    ('nhieu', 16, 1),
+    ('nganh', 16, 1),
+    ('pham', 16, 1),
+    ('luat', 16, 1),
+    ('nghe', 16, 2),
+    ('thuat', 16, 2),
+    ('tuong', 16, 1),
+    ('tu', 16, 1),
+    ('noi', 16, 1),
+    ('rong', 16, 1),
+    ('ra', 16, 1),
+    ('bo', 16, 1),
+    ('mon', 16, 2),
+    ('lien', 16, 1),
+    ('den', 16, 1),
+    ('deu', 16, 1),
+    ('la', 16, 1),
+    ('nha', 17, 9),
+    ('su', 17, 32),
+    ('hoc', 17, 17),
+    ('ngon', 17, 4),
+    ('ngu', 17, 4),
+    ('cac', 17, 15),
+    ('thoi', 17, 5),
+    ('ki', 17, 3),
+    ('trieu', 17, 8),
+    ('dai', 17, 6),
+    ('trong', 17, 5),
+    ('lich', 17, 20),
+    ('viet', 17, 4),
+    ('nam', 17, 4),
+    ('vi', 17, 8),
+    ('du', 17, 8),
+    ('tran', 17, 4),
+    ('le', 17, 4),
+    ('nguyen', 17, 4),
+    ('nhan', 17, 5),
+    ('vat', 17, 2),
+    ('cu', 17, 3),
+    ('the', 17, 6),
+    ('vn', 17, 6),
+    ('va', 17, 8),
+    ('tg', 17, 4),
+    ('hung', 17, 2),
+    ('dao', 17, 2),
+    ('ho', 17, 2),
+    ('chi', 17, 2),
+    ('minh', 17, 2),
+    ('vo', 17, 2),
+    ('giap', 17, 2),
+    ('nin', 17, 2),
+    ('kien', 17, 3),
+    ('cuoc', 17, 2),
+    ('cach', 17, 2),
+    ('mang', 17, 2),
+    ('chien', 17, 2),
+    ('tranh', 17, 2),
+    ('hiep', 17, 2),
+    ('uoc', 17, 2),
+    ('hoa', 17, 2),
+    ('binh', 17, 2),
+    ('dich', 17, 2),
+    ('benh', 17, 2),
+    ('lon', 17, 2),
+    ('lien', 17, 2),
+    ('ket', 17, 2),
+    ('voi', 17, 2),
+    ('mon', 17, 2),
+    ('khoa', 17, 2),
+    ('khac', 17, 2),
+    ('nhu', 17, 3),
+    ('kinh', 17, 2),
+    ('te', 17, 2),
+    ('chung', 17, 4),
+    ('hay', 17, 2),
+    ('xa', 17, 2),
+    ('hoi', 17, 2),
+    ('quoc', 17, 3),
+    ('gia', 17, 3),
+    ('khu', 17, 4),
+    ('vuc', 17, 2),
+    ('dia', 17, 2),
+    ('li', 17, 2),
+    ('theo', 17, 2),
+    ('gian', 17, 2),
+    ('chau', 17, 2),
+    ('au', 17, 2),
+    ('gioi', 17, 2),
+    ('can', 17, 2),
+    ('trung', 17, 2),
+    ('cho', 17, 1),
+    ('ta', 17, 3),
+    ('biet', 17, 1),
+    ('ve', 17, 1),
+    ('qua', 17, 2),
+    ('nho', 17, 2),
+    ('tien', 17, 1),
+    ('hanh', 17, 1),
+    ('nghien', 17, 1),
+    ('cuu', 17, 1),
+    ('mo', 17, 1),
+    ('hoat', 17, 1),
+    ('dong', 17, 2),
+    ('cua', 17, 2),
+    ('con', 17, 1),
+    ('nguoi', 17, 1),
+    ('cong', 17, 1),
+    ('doanh', 17, 1),
+    ('nghiep', 17, 1),
+    ('ca', 17, 1),
+    ('y', 17, 1),
+    ('tuong', 17, 2),
+    ('co', 17, 2),
+    ('tu', 17, 1),
+    ('lieu', 17, 1),
+    ('ma', 17, 1),
+    ('hieu', 17, 1),
+    ('hien', 17, 1),
+    ('tai', 17, 1),
+    ('hoach', 17, 1),
+    ('dinh', 17, 1),
+    ('lai', 17, 1),
+    ('nha', 18, 20),
+    ('bien', 18, 10),
+    ('kich', 18, 24),
+    ('van', 18, 13),
+    ('va', 18, 12),
+    ('cac', 18, 11),
+    ('nghe', 18, 9),
+    ('co', 18, 11),
+    ('lien', 18, 9),
+    ('quan', 18, 9),
+    ('ngon', 18, 4),
+    ('ngu', 18, 4),
+    ('viet', 18, 10),
+    ('truyen', 18, 5),
+    ('ngan', 18, 2),
+    ('tieu', 18, 3),
+    ('thuyet', 18, 3),
+    ('ban', 18, 12),
+    ('phim', 18, 5),
+    ('tai', 18, 2),
+    ('lieu', 18, 2),
+    ('chinh', 18, 2),
+    ('sua', 18, 2),
+    ('lam', 18, 1),
+    ('cong', 18, 1),
+    ('viec', 18, 1),
+    ('sang', 18, 3),
+    ('tac', 18, 6),
+    ('pham', 18, 4),
+    ('phat', 18, 1),
+    ('thanh', 18, 1),
+    ('hinh', 18, 2),
+    ('doc', 18, 1),
+    ('hoc', 18, 3),
+    ('the', 18, 3),
+    ('nhung', 18, 1),
+    ('khai', 18, 1),
+    ('thac', 18, 1),
+    ('mot', 18, 2),
+    ('y', 18, 1),
+    ('tuong', 18, 1),
+    ('cot', 18, 1),
+    ('goc', 18, 1),
+    ('hoac', 18, 1),
+    ('chuyen', 18, 1),
+    ('da', 18, 1),
+    ('duoc', 18, 1),
+    ('xuat', 18, 2),
+    ('dang', 18, 1),
+    ('phu', 18, 1),
+    ('hop', 18, 1),
+    ('voi', 18, 1),
+    ('thuc', 18, 1),
+    ('san', 18, 1),
+    ('nha', 19, 9),
+    ('bao', 19, 24),
+    ('ngon', 19, 4),
+    ('ngu', 19, 4),
+    ('dien', 19, 2),
+    ('tu', 19, 2),
+    ('thoi', 19, 2),
+    ('trang', 19, 2),
+    ('anh', 19, 2),
+    ('in', 19, 2),
+    ('the', 19, 2),
+    ('thao', 19, 2),
+    ('tranh', 19, 2),
+    ('biem', 19, 2),
+    ('hoa', 19, 4),
+    ('hoac', 19, 2),
+    ('minh', 19, 2),
+    ('cho', 19, 2),
+    ('chi', 19, 3),
+    ('la', 19, 1),
+    ('nhung', 19, 1),
+    ('nguoi', 19, 1),
+    ('viet', 19, 2),
+    ('bien', 19, 1),
+    ('tap', 19, 1),
+    ('san', 19, 1),
+    ('xuat', 19, 1),
+    ('cac', 19, 1),
+    ('an', 19, 1),
+    ('pham', 19, 1),
+    ('truyen', 19, 1),
+    ('hinh', 19, 1),
+    ('phat', 19, 1),
+    ('thanh', 19, 1),
+    ('mang', 19, 1),
+    ('nha', 20, 10),
+    ('ngon', 20, 29),
+    ('ngu', 20, 31),
+    ('hoc', 20, 20),
+    ('xa', 20, 2),
+    ('hoi', 20, 2),
+    ('tam', 20, 2),
+    ('li', 20, 2),
+    ('giang', 20, 2),
+    ('day', 20, 2),
+    ('bien', 20, 3),
+    ('dich', 20, 6),
+    ('va', 20, 4),
+    ('phien', 20, 3),
+    ('cac', 20, 4),
+    ('roi', 20, 2),
+    ('loan', 20, 2),
+    ('ve', 20, 3),
+    ('kha', 20, 2),
+    ('nang', 20, 2),
+    ('nghien', 20, 1),
+    ('cuu', 20, 1),
+    ('thanh', 20, 5),
+    ('phan', 20, 2),
+    ('co', 20, 3),
+    ('ban', 20, 3),
+    ('cua', 20, 2),
+    ('mot', 20, 5),
+    ('nao', 20, 1),
+    ('do', 20, 2),
+    ('chang', 20, 1),
+    ('han', 20, 1),
+    ('nhu', 20, 1),
+    ('am', 20, 1),
+    ('nghia', 20, 1),
+    ('chu', 20, 1),
+    ('viet', 20, 1),
+    ('o', 20, 1),
+    ('goc', 20, 1),
+    ('khac', 20, 1),
+    ('nghe', 20, 1),
+    ('nay', 20, 1),
+    ('lien', 20, 1),
+    ('quan', 20, 1),
+    ('toi', 20, 1),
+    ('viec', 20, 1),
+    ('su', 20, 1),
+    ('dung', 20, 1),
+    ('thao', 20, 1),
+    ('cu', 20, 2),
+    ('the', 20, 3),
+    ('de', 20, 1),
+    ('tro', 20, 2),
+    ('can', 20, 1),
+    ('phai', 20, 1),
+    ('tim', 20, 1),
+    ('hieu', 20, 1),
+    ('ngoai', 20, 1),
+    ('ra', 20, 1),
+    ('thi', 20, 1),
+    ('nguoi', 20, 1),
+    ('hoac', 20, 1),
+    ('giao', 20, 1),
+    ('vien', 20, 1),
+    ('bien', 21, 9),
+    ('dich', 21, 22),
+    ('va', 21, 11),
+    ('phien', 21, 9),
+    ('ngon', 21, 11),
+    ('ngu', 21, 11),
+    ('chuyen', 21, 4),
+    ('ve', 21, 6),
+    ('mot', 21, 4),
+    ('cu', 21, 4),
+    ('the', 21, 4),
+    ('vi', 21, 4),
+    ('du', 21, 6),
+    ('co', 21, 2),
+    ('tieng', 21, 4),
+    ('anh', 21, 2),
+    ('nhat', 21, 2),
+    ('linh', 21, 2),
+    ('vuc', 21, 2),
+    ('phap', 21, 2),
+    ('luat', 21, 2),
+    ('y', 21, 2),
+    ('te', 21, 2),
+    ('khoa', 21, 2),
+    ('hoc', 21, 4),
+    ('cong', 21, 2),
+    ('nghe', 21, 2),
+    ('van', 21, 2),
+    ('thuong', 21, 2),
+    ('mai', 21, 2),
+    ('lich', 21, 2),
+    ('hang', 21, 2),
+    ('khong', 21, 2),
+    ('nghien', 21, 1),
+    ('cuu', 21, 1),
+    ('nguon', 21, 1),
+    ('goc', 21, 1),
+    ('su', 21, 1),
+    ('phat', 21, 1),
+    ('trien', 21, 1),
+    ('cau', 21, 1),
+    ('truc', 21, 1),
+    ('cua', 21, 1),
+    ('cac', 21, 1),
+    ('viet', 21, 1),
+    ('noi', 21, 1),
+    ('tu', 21, 1),
+    ('nay', 21, 1),
+    ('sang', 21, 1),
+    ('khac', 21, 1),
+    ('dao', 22, 11),
+    ('dien', 22, 12),
+    ('phim', 22, 16),
+    ('san', 22, 13),
+    ('khau', 22, 11),
+    ('ngon', 22, 4),
+    ('ngu', 22, 4),
+    ('ngan', 22, 2),
+    ('dung', 22, 2),
+    ('cho', 22, 2),
+    ('muc', 22, 2),
+    ('dich', 22, 2),
+    ('quang', 22, 2),
+    ('cao', 22, 2),
+    ('tai', 22, 2),
+    ('lieu', 22, 2),
+    ('truyen', 22, 3),
+    ('kich', 22, 2),
+    ('ca', 22, 2),
+    ('nhac', 22, 2),
+    ('con', 22, 1),
+    ('goi', 22, 1),
+    ('la', 22, 2),
+    ('va', 22, 3),
+    ('nha', 22, 1),
+    ('xuat', 22, 2),
+    ('anh', 22, 1),
+    ('nguoi', 22, 1),
+    ('chi', 22, 1),
+    ('cac', 22, 1),
+    ('tac', 22, 1),
+    ('pham', 22, 1),
+    ('hinh', 22, 1),
+    ('phat', 22, 1),
+    ('thanh', 22, 1),
+    ('chuong', 22, 1),
+    ('trinh', 22, 1),
+    ('bieu', 22, 1),
+    ('tren', 22, 1),
+    ('ki', 23, 10),
+    ('thuat', 23, 10),
+    ('vien', 23, 12),
+    ('ghi', 23, 9),
+    ('chep', 23, 9),
+    ('so', 23, 26),
+    ('sach', 23, 9),
+    ('y', 23, 11),
+    ('te', 23, 11),
+    ('va', 23, 15),
+    ('thong', 23, 18),
+    ('tin', 23, 9),
+    ('ve', 23, 10),
+    ('suc', 23, 10),
+    ('khoe', 23, 10),
+    ('ngon', 23, 4),
+    ('ngu', 23, 4),
+    ('cac', 23, 8),
+    ('bo', 23, 3),
+    ('phan', 23, 6),
+    ('cu', 23, 4),
+    ('the', 23, 5),
+    ('cua', 23, 4),
+    ('he', 23, 9),
+    ('loai', 23, 3),
+    ('vi', 23, 6),
+    ('du', 23, 7),
+    ('ho', 23, 16),
+    ('khoa', 23, 4),
+    ('kham', 23, 3),
+    ('benh', 23, 9),
+    ('tim', 23, 2),
+    ('mach', 23, 2),
+    ('cong', 23, 2),
+    ('nghe', 23, 2),
+    ('luu', 23, 4),
+    ('tru', 23, 4),
+    ('truy', 23, 3),
+    ('cap', 23, 4),
+    ('giay', 23, 2),
+    ('dien', 23, 2),
+    ('tu', 23, 2),
+    ('doi', 23, 2),
+    ('tuong', 23, 2),
+    ('lap', 23, 3),
+    ('nhan', 23, 3),
+    ('hoc', 23, 2),
+    ('la', 23, 1),
+    ('chuyen', 23, 1),
+    ('gia', 23, 1),
+    ('trong', 23, 1),
+    ('viec', 23, 1),
+    ('nhat', 23, 1),
+    ('tai', 23, 1),
+    ('phong', 23, 1),
+    ('co', 23, 2),
+    ('cham', 23, 1),
+    ('soc', 23, 1),
+    ('moi', 23, 1),
+    ('phai', 23, 1),
+    ('duoc', 23, 1),
+    ('can', 23, 1),
+    ('than', 23, 1),
+    ('mot', 23, 2),
+    ('cach', 23, 1),
+    ('de', 23, 2),
+    ('dang', 23, 1),
+    ('su', 23, 1),
+    ('dung', 23, 1),
+    ('lieu', 23, 1),
+    ('duy', 23, 1),
+    ('tri', 23, 1),
+    ('quan', 23, 1),
+    ('li', 23, 1),
+    ('ki', 24, 14),
+    ('thuat', 24, 18),
+    ('vien', 24, 17),
+    ('bao', 24, 21),
+    ('tang', 24, 17),
+    ('ngon', 24, 4),
+    ('ngu', 24, 4),
+    ('thuong', 24, 2),
+    ('duoc', 24, 6),
+    ('dao', 24, 4),
+    ('tao', 24, 4),
+    ('co', 24, 10),
+    ('ban', 24, 4),
+    ('trong', 24, 7),
+    ('mot', 24, 9),
+    ('nganh', 24, 4),
+    ('cu', 24, 2),
+    ('the', 24, 7),
+    ('vi', 24, 3),
+    ('du', 24, 2),
+    ('nhan', 24, 4),
+    ('chung', 24, 2),
+    ('hoc', 24, 12),
+    ('nghe', 24, 6),
+    ('trang', 24, 2),
+    ('tri', 24, 3),
+    ('lich', 24, 4),
+    ('su', 24, 7),
+    ('tu', 24, 2),
+    ('nhien', 24, 2),
+    ('xa', 24, 2),
+    ('hoi', 24, 2),
+    ('khoa', 24, 2),
+    ('hoac', 24, 5),
+    ('cong', 24, 3),
+    ('sau', 24, 2),
+    ('do', 24, 5),
+    ('ho', 24, 2),
+    ('chuyen', 24, 7),
+    ('mon', 24, 2),
+    ('hoa', 24, 4),
+    ('viec', 24, 4),
+    ('quan', 24, 6),
+    ('va', 24, 5),
+    ('trung', 24, 2),
+    ('bay', 24, 2),
+    ('cac', 24, 5),
+    ('hien', 24, 3),
+    ('vat', 24, 7),
+    ('thuoc', 24, 2),
+    ('ve', 24, 8),
+    ('dong', 24, 4),
+    ('thoi', 24, 2),
+    ('tien', 24, 2),
+    ('nha', 24, 3),
+    ('loai', 24, 5),
+    ('vu', 24, 2),
+    ('khi', 24, 3),
+    ('cua', 24, 3),
+    ('nen', 24, 2),
+    ('van', 24, 3),
+    ('nhat', 24, 2),
+    ('dinh', 24, 2),
+    ('la', 24, 3),
+    ('nguoi', 24, 4),
+    ('lam', 24, 2),
+    ('danh', 24, 1),
+    ('so', 24, 1),
+    ('hang', 24, 1),
+    ('muc', 24, 1),
+    ('phan', 24, 2),
+    ('toan', 24, 1),
+    ('bo', 24, 2),
+    ('li', 24, 2),
+    ('chiu', 24, 1),
+    ('trach', 24, 1),
+    ('nhiem', 24, 1),
+    ('tong', 24, 1),
+    ('ba', 24, 1),
+    ('cung', 24, 1),
+    ('voi', 24, 1),
+    ('khao', 24, 1),
+    ('luu', 24, 1),
+    ('tru', 24, 1),
+    ('thu', 24, 1),
+    ('thu', 25, 18),
+    ('ki', 25, 20),
+    ('hanh', 25, 15),
+    ('chinh', 25, 13),
+    ('ngon', 25, 4),
+    ('ngu', 25, 4),
+    ('tro', 25, 5),
+    ('li', 25, 4),
+    ('quan', 25, 5),
+    ('tri', 25, 2),
+    ('vien', 25, 4),
+    ('van', 25, 2),
+    ('phong', 25, 2),
+    ('nhan', 25, 2),
+    ('le', 25, 2),
+    ('tan', 25, 2),
+    ('trong', 25, 5),
+    ('mot', 25, 5),
+    ('loai', 25, 2),
+    ('hinh', 25, 2),
+    ('doanh', 25, 2),
+    ('nghiep', 25, 2),
+    ('cu', 25, 2),
+    ('the', 25, 2),
+    ('vi', 25, 4),
+    ('du', 25, 3),
+    ('luat', 25, 2),
+    ('y', 25, 2),
+    ('te', 25, 2),
+    ('toc', 25, 2),
+    ('luu', 25, 2),
+    ('tru', 25, 2),
+    ('chuyen', 25, 3),
+    ('nganh', 25, 2),
+    ('may', 25, 2),
+    ('tinh', 25, 2),
+    ('la', 25, 2),
+    ('nguoi', 25, 3),
+    ('ho', 25, 4),
+    ('cong', 25, 2),
+    ('viec', 25, 2),
+    ('cho', 25, 1),
+    ('nhung', 25, 1),
+    ('khac', 25, 1),
+    ('to', 25, 4),
+    ('chuc', 25, 4),
+    ('dong', 25, 2),
+    ('vai', 25, 1),
+    ('hoat', 25, 1),
+    ('cua', 25, 2),
+    ('toan', 25, 1),
+    ('bo', 25, 1),
+    ('phu', 25, 1),
+    ('thuoc', 25, 1),
+    ('vao', 25, 1),
+    ('hieu', 25, 1),
+    ('qua', 25, 1),
+    ('lam', 25, 1),
+    ('dieu', 25, 2),
+    ('gia', 25, 1),
+    ('cap', 25, 1),
+    ('cao', 25, 1),
+    ('va', 25, 1),
+    ('dung', 25, 1),
+    ('dau', 25, 1),
+    ('ty', 25, 1),
+    ('ki', 26, 12),
+    ('thuat', 26, 12),
+    ('vien', 26, 10),
+    ('phat', 26, 11),
+    ('thanh', 26, 16),
+    ('truyen', 26, 15),
+    ('hinh', 26, 16),
+    ('va', 26, 14),
+    ('nghe', 26, 11),
+    ('nhin', 26, 11),
+    ('ngon', 26, 4),
+    ('ngu', 26, 4),
+    ('bien', 26, 8),
+    ('tap', 26, 7),
+    ('am', 26, 4),
+    ('cac', 26, 6),
+    ('tai', 26, 2),
+    ('lieu', 26, 2),
+    ('phim', 26, 4),
+    ('san', 26, 6),
+    ('xuat', 26, 6),
+    ('tro', 26, 2),
+    ('li', 26, 3),
+    ('nha', 26, 4),
+    ('dieu', 26, 4),
+    ('hanh', 26, 4),
+    ('dai', 26, 2),
+    ('chuong', 26, 2),
+    ('trinh', 26, 2),
+    ('quan', 26, 1),
+    ('chuc', 26, 1),
+    ('nang', 26, 1),
+    ('cua', 26, 1),
+    ('thiet', 26, 1),
+    ('bi', 26, 1),
+    ('de', 26, 2),
+    ('ghi', 26, 1),
+    ('lai', 26, 1),
+    ('anh', 26, 2),
+    ('cung', 26, 1),
+    ('nhu', 26, 1),
+    ('dang', 26, 1),
+    ('tin', 26, 1),
+    ('hieu', 26, 1),
+    ('thong', 26, 1),
+    ('khac', 26, 1),
+    ('tren', 26, 3),
+    ('dat', 26, 1),
+    ('lien', 26, 1),
+    ('khong', 26, 1),
+    ('nhan', 27, 9),
+    ('vien', 27, 9),
+    ('tong', 27, 11),
+    ('dai', 27, 11),
+    ('dich', 27, 14),
+    ('vu', 27, 14),
+    ('khach', 27, 14),
+    ('hang', 27, 16),
+    ('ngon', 27, 4),
+    ('ngu', 27, 4),
+    ('phu', 27, 2),
+    ('trach', 27, 2),
+    ('cac', 27, 4),
+    ('loai', 27, 2),
+    ('san', 27, 4),
+    ('pham', 27, 4),
+    ('cu', 27, 2),
+    ('the', 27, 2),
+    ('ban', 27, 3),
+    ('va', 27, 3),
+    ('tiep', 27, 2),
+    ('thi', 27, 2),
+    ('doanh', 27, 2),
+    ('nghiep', 27, 2),
+    ('thuong', 27, 2),
+    ('co', 27, 1),
+    ('mot', 27, 1),
+    ('de', 27, 2),
+    ('giai', 27, 2),
+    ('dap', 27, 2),
+    ('ho', 27, 2),
+    ('tro', 27, 2),
+    ('duoc', 27, 2),
+    ('goi', 27, 1),
+    ('la', 27, 1),
+    ('dao', 27, 1),
+    ('tao', 27, 2),
+    ('su', 27, 1),
+    ('dung', 27, 2),
+    ('dien', 27, 1),
+    ('thoai', 27, 1),
+    ('cho', 27, 1),
+    ('ve', 27, 1),
+    ('cung', 27, 1),
+    ('nhu', 27, 1),
+    ('thuc', 27, 1),
+    ('day', 27, 1),
+    ('viec', 27, 1),
+    ('hinh', 27, 1),
+    ('anh', 27, 1),
+    ('hieu', 27, 1),
+    ('rat', 27, 1),
+    ('can', 27, 1),
+    ('thiet', 27, 1),
+    ('voi', 27, 1),
+    ('moi', 27, 1),
+    ('huong', 28, 9),
+    ('dan', 28, 9),
+    ('vien', 28, 9),
+    ('du', 28, 22),
+    ('lich', 28, 23),
+    ('ngon', 28, 4),
+    ('ngu', 28, 4),
+    ('cac', 28, 7),
+    ('loai', 28, 2),
+    ('hinh', 28, 4),
+    ('cu', 28, 4),
+    ('the', 28, 4),
+    ('cua', 28, 4),
+    ('tour', 28, 4),
+    ('vi', 28, 6),
+    ('su', 28, 6),
+    ('mao', 28, 2),
+    ('hiem', 28, 2),
+    ('tham', 28, 2),
+    ('quan', 28, 3),
+    ('khu', 28, 5),
+    ('vuc', 28, 5),
+    ('dia', 28, 4),
+    ('diem', 28, 2),
+    ('mot', 28, 7),
+    ('thanh', 28, 3),
+    ('pho', 28, 3),
+    ('co', 28, 3),
+    ('thien', 28, 2),
+    ('nhien', 28, 5),
+    ('dep', 28, 3),
+    ('la', 28, 2),
+    ('di', 28, 4),
+    ('tich', 28, 3),
+    ('van', 28, 3),
+    ('hoa', 28, 3),
+    ('tu', 28, 3),
+    ('duoc', 28, 1),
+    ('dao', 28, 1),
+    ('tao', 28, 1),
+    ('de', 28, 1),
+    ('cung', 28, 2),
+    ('voi', 28, 3),
+    ('khach', 28, 4),
+    ('trong', 28, 1),
+    ('pham', 28, 1),
+    ('quoc', 28, 1),
+    ('gia', 28, 1),
+    ('hoac', 28, 2),
+    ('nao', 28, 1),
+    ('do', 28, 1),
+    ('ho', 28, 4),
+    ('gioi', 28, 1),
+    ('thieu', 28, 1),
+    ('ve', 28, 2),
+    ('y', 28, 1),
+    ('nghia', 28, 1),
+    ('khao', 28, 1),
+    ('nhung', 28, 2),
+    ('noi', 28, 1),
+    ('den', 28, 1),
+    ('cong', 28, 1),
+    ('trinh', 28, 1),
+    ('nghe', 28, 1),
+    ('thuat', 28, 1),
+    ('ma', 28, 1),
+    ('xem', 28, 1),
+    ('giup', 28, 1),
+    ('lam', 28, 1),
+    ('quen', 28, 1),
+    ('moi', 28, 1),
+    ('truong', 28, 1),
+    ('va', 28, 1),
+    ('dieu', 28, 1),
+    ('thu', 28, 2),
+    ('khac', 28, 1),
+    ('nham', 28, 1),
+    ('hut', 28, 1),
+    ('tam', 28, 1),
+    ('nhan', 29, 9),
+    ('vien', 29, 9),
+    ('marketing', 29, 9),
+    ('va', 29, 13),
+    ('ban', 29, 13),
+    ('hang', 29, 19),
+    ('ngon', 29, 4),
+    ('ngu', 29, 4),
+    ('tro', 29, 2),
+    ('giup', 29, 2),
+    ('phu', 29, 2),
+    ('trach', 29, 2),
+    ('mot', 29, 2),
+    ('quay', 29, 2),
+    ('mat', 29, 4),
+    ('hoac', 29, 2),
+    ('nhom', 29, 2),
+    ('cu', 29, 2),
+    ('the', 29, 2),
+    ('vi', 29, 2),
+    ('du', 29, 2),
+    ('hoa', 29, 4),
+    ('mi', 29, 2),
+    ('pham', 29, 6),
+    ('thuc', 29, 2),
+    ('dong', 29, 2),
+    ('lanh', 29, 2),
+    ('sua', 29, 2),
+    ('gioi', 29, 3),
+    ('thieu', 29, 3),
+    ('san', 29, 2),
+    ('trong', 29, 1),
+    ('cua', 29, 1),
+    ('tai', 29, 1),
+    ('cac', 29, 1),
+    ('co', 29, 1),
+    ('so', 29, 1),
+    ('le', 29, 1),
+    ('truc', 29, 1),
+    ('tiep', 29, 1),
+    ('nhieu', 29, 1),
+    ('loai', 29, 1),
+    ('dich', 29, 2),
+    ('vu', 29, 2),
+    ('cho', 29, 2),
+    ('khach', 29, 2),
+    ('chuc', 29, 1),
+    ('nang', 29, 1),
+    ('chat', 29, 1),
+    ('luong', 29, 1),
+    ('hieu', 29, 1),
+    ('chuyen', 30, 10),
+    ('gia', 30, 9),
+    ('cong', 30, 12),
+    ('nghe', 30, 11),
+    ('polyme', 30, 18),
+    ('phan', 30, 4),
+    ('tich', 30, 4),
+    ('logic', 30, 4),
+    ('san', 30, 5),
+    ('xuat', 30, 5),
+    ('chat', 30, 11),
+    ('deo', 30, 5),
+    ('tu', 30, 8),
+    ('cac', 30, 12),
+    ('hoa', 30, 2),
+    ('dac', 30, 2),
+    ('biet', 30, 2),
+    ('y', 30, 5),
+    ('sinh', 30, 3),
+    ('hoc', 30, 3),
+    ('thiet', 30, 5),
+    ('bi', 30, 5),
+    ('khoa', 30, 2),
+    ('ong', 30, 2),
+    ('tuy', 30, 2),
+    ('chinh', 30, 2),
+    ('ki', 30, 2),
+    ('thuat', 30, 2),
+    ('nhua', 30, 3),
+    ('ve', 30, 1),
+    ('tong', 30, 2),
+    ('hop', 30, 2),
+    ('va', 30, 6),
+    ('lien', 30, 1),
+    ('quan', 30, 1),
+    ('la', 30, 2),
+    ('loai', 30, 3),
+    ('vat', 30, 2),
+    ('lieu', 30, 2),
+    ('nhien', 30, 2),
+    ('voi', 30, 2),
+    ('nhieu', 30, 5),
+    ('tinh', 30, 3),
+    ('muc', 30, 1),
+    ('dich', 30, 1),
+    ('su', 30, 3),
+    ('dung', 30, 5),
+    ('khac', 30, 2),
+    ('nhau', 30, 1),
+    ('co', 30, 3),
+    ('trong', 30, 2),
+    ('bao', 30, 2),
+    ('gom', 30, 2),
+    ('bot', 30, 1),
+    ('xen', 30, 1),
+    ('lu', 30, 1),
+    ('lo', 30, 1),
+    ('cao', 30, 1),
+    ('deu', 30, 1),
+    ('mang', 30, 1),
+    ('day', 30, 1),
+    ('du', 30, 1),
+    ('cua', 30, 1),
+    ('ben', 30, 1),
+    ('canh', 30, 1),
+    ('do', 30, 2),
+    ('cung', 30, 1),
+    ('nhan', 30, 1),
+    ('tao', 30, 2),
+    ('hay', 30, 1),
+    ('con', 30, 2),
+    ('duoc', 30, 2),
+    ('goi', 30, 1),
+    ('ung', 30, 3),
+    ('uu', 30, 1),
+    ('viet', 30, 1),
+    ('hon', 30, 1),
+    ('so', 30, 1),
+    ('dang', 30, 1),
+    ('nguoi', 30, 1),
+    ('khai', 30, 1),
+    ('thac', 30, 1),
+    ('viec', 30, 1),
+    ('ra', 30, 1),
+    ('dinh', 30, 1),
+    ('nhuom', 30, 1),
+    ('vai', 30, 1),
+    ('nau', 30, 1),
+    ('soi', 30, 2),
+    ('bang', 30, 1),
+    ('xa', 30, 1),
+    ('phong', 30, 1),
+    ('cho', 30, 1),
+    ('toi', 30, 1),
+    ('nganh', 30, 1),
+    ('det', 30, 1),
+    ('nghiep', 30, 1),
+    ('dien', 30, 1),
+    ('quang', 30, 1),
+    ('ki', 31, 10),
+    ('su', 31, 10),
+    ('cong', 31, 15),
+    ('nghe', 31, 15),
+    ('thuc', 31, 25),
+    ('pham', 31, 20),
+    ('phan', 31, 5),
+    ('tich', 31, 4),
+    ('logic', 31, 4),
+    ('sau', 31, 2),
+    ('thu', 31, 2),
+    ('hoach', 31, 2),
+    ('che', 31, 9),
+    ('bien', 31, 9),
+    ('thuy', 31, 4),
+    ('san', 31, 8),
+    ('quan', 31, 5),
+    ('li', 31, 2),
+    ('chat', 31, 6),
+    ('luong', 31, 10),
+    ('kiem', 31, 4),
+    ('nghiem', 31, 2),
+    ('tra', 31, 2),
+    ('dau', 31, 2),
+    ('vat', 31, 3),
+    ('bao', 31, 3),
+    ('va', 31, 5),
+    ('cac', 31, 3),
+    ('sua', 31, 2),
+    ('xuat', 31, 2),
+    ('banh', 31, 2),
+    ('keo', 31, 2),
+    ('do', 31, 2),
+    ('uong', 31, 2),
+    ('cai', 31, 1),
+    ('tien', 31, 1),
+    ('thuat', 31, 1),
+    ('dung', 31, 1),
+    ('danh', 31, 1),
+    ('gia', 31, 1),
+    ('thanh', 31, 1),
+    ('tu', 31, 1),
+    ('dong', 31, 1),
+    ('hoac', 31, 1),
+    ('nguyen', 31, 1),
+    ('lieu', 31, 1),
+    ('nhan', 31, 1),
+    ('tao', 31, 1),
+    ('ki', 32, 11),
+    ('su', 32, 9),
+    ('phat', 32, 10),
+    ('trien', 32, 10),
+    ('phan', 32, 19),
+    ('mem', 32, 14),
+    ('tich', 32, 5),
+    ('logic', 32, 4),
+    ('thuat', 32, 2),
+    ('chuyen', 32, 1),
+    ('gia', 32, 2),
+    ('nghien', 32, 1),
+    ('cuu', 32, 1),
+    ('va', 32, 3),
+    ('danh', 32, 1),
+    ('cac', 32, 4),
+    ('yeu', 32, 2),
+    ('cau', 32, 2),
+    ('doi', 32, 1),
+    ('voi', 32, 1),
+    ('ung', 32, 2),
+    ('dung', 32, 1),
+    ('san', 32, 1),
+    ('co', 32, 1),
+    ('hoac', 32, 1),
+    ('he', 32, 1),
+    ('dieu', 32, 1),
+    ('hanh', 32, 1),
+    ('moi', 32, 1),
+    ('ho', 32, 1),
+    ('thiet', 32, 1),
+    ('ke', 32, 1),
+    ('thu', 32, 1),
+    ('nghiem', 32, 1),
+    ('duy', 32, 1),
+    ('tri', 32, 1),
+    ('giai', 32, 1),
+    ('phap', 32, 1),
+    ('nham', 32, 1),
+    ('dap', 32, 1),
+    ('tat', 32, 1),
+    ('ca', 32, 1),
+    ('chuyen', 33, 11),
+    ('gia', 33, 13),
+    ('phan', 33, 15),
+    ('tich', 33, 15),
+    ('tai', 33, 17),
+    ('chinh', 33, 17),
+    ('logic', 33, 4),
+    ('ngan', 33, 5),
+    ('hang', 33, 4),
+    ('dau', 33, 4),
+    ('tu', 33, 5),
+    ('mua', 33, 2),
+    ('ban', 33, 2),
+    ('va', 33, 5),
+    ('sap', 33, 2),
+    ('nhap', 33, 2),
+    ('quan', 33, 2),
+    ('li', 33, 2),
+    ('danh', 33, 4),
+    ('muc', 33, 2),
+    ('chung', 33, 2),
+    ('khoan', 33, 2),
+    ('trai', 33, 2),
+    ('phieu', 33, 2),
+    ('doanh', 33, 2),
+    ('nghiep', 33, 2),
+    ('tin', 33, 2),
+    ('dung', 33, 2),
+    ('dieu', 33, 1),
+    ('tra', 33, 1),
+    ('nghien', 33, 2),
+    ('cuu', 33, 2),
+    ('cac', 33, 6),
+    ('qua', 33, 1),
+    ('trinh', 33, 2),
+    ('tac', 33, 1),
+    ('dong', 33, 3),
+    ('toi', 33, 1),
+    ('hoat', 33, 2),
+    ('cua', 33, 1),
+    ('khu', 33, 1),
+    ('vuc', 33, 1),
+    ('cong', 33, 1),
+    ('hoac', 33, 1),
+    ('to', 33, 1),
+    ('chuc', 33, 1),
+    ('nhan', 33, 1),
+    ('nay', 33, 1),
+    ('bao', 33, 1),
+    ('gom', 33, 1),
+    ('chuong', 33, 1),
+    ('hay', 33, 1),
+    ('ke', 33, 1),
+    ('hoach', 33, 1),
+    ('sach', 33, 1),
+    ('nha', 34, 10),
+    ('thien', 34, 19),
+    ('van', 34, 19),
+    ('hoc', 34, 25),
+    ('phan', 34, 6),
+    ('tich', 34, 5),
+    ('logic', 34, 4),
+    ('khoa', 34, 4),
+    ('vu', 34, 6),
+    ('tru', 34, 6),
+    ('va', 34, 9),
+    ('ung', 34, 2),
+    ('dung', 34, 3),
+    ('la', 34, 2),
+    ('viec', 34, 1),
+    ('nghien', 34, 3),
+    ('cuu', 34, 3),
+    ('cac', 34, 7),
+    ('the', 34, 2),
+    ('nhu', 34, 3),
+    ('ngoi', 34, 1),
+    ('sao', 34, 2),
+    ('hanh', 34, 3),
+    ('tinh', 34, 7),
+    ('choi', 34, 1),
+    ('quan', 34, 6),
+    ('ha', 34, 1),
+    ('hien', 34, 2),
+    ('tuong', 34, 2),
+    ('co', 34, 3),
+    ('nguon', 34, 1),
+    ('goc', 34, 1),
+    ('ben', 34, 1),
+    ('ngoai', 34, 1),
+    ('buc', 34, 1),
+    ('xa', 34, 1),
+    ('nen', 34, 2),
+    ('no', 34, 1),
+    ('su', 34, 2),
+    ('phat', 34, 3),
+    ('trien', 34, 3),
+    ('chat', 34, 2),
+    ('vat', 34, 3),
+    ('ly', 34, 1),
+    ('hoa', 34, 1),
+    ('khi', 34, 1),
+    ('chuyen', 34, 1),
+    ('dong', 34, 1),
+    ('cua', 34, 2),
+    ('cung', 34, 3),
+    ('hinh', 34, 1),
+    ('thanh', 34, 1),
+    ('tien', 34, 1),
+    ('li', 34, 3),
+    ('thuyet', 34, 1),
+    ('phuong', 34, 1),
+    ('phap', 34, 1),
+    ('hoac', 34, 1),
+    ('ap', 34, 1),
+    ('kien', 34, 1),
+    ('thuc', 34, 1),
+    ('lien', 34, 1),
+    ('toi', 34, 1),
+    ('vao', 34, 1),
+    ('linh', 34, 2),
+    ('vuc', 34, 2),
+    ('khac', 34, 1),
+    ('moi', 34, 1),
+    ('he', 34, 2),
+    ('rat', 34, 1),
+    ('gan', 34, 2),
+    ('gui', 34, 1),
+    ('tang', 34, 1),
+    ('toan', 34, 1),
+    ('vung', 34, 1),
+    ('chac', 34, 1),
+    ('het', 34, 1),
+    ('suc', 34, 1),
+    ('trong', 34, 1),
+    ('dai', 34, 2),
+    ('khong', 34, 2),
+    ('con', 34, 1),
+    ('danh', 34, 1),
+    ('nhieu', 34, 1),
+    ('thoi', 34, 2),
+    ('gian', 34, 1),
+    ('sat', 34, 1),
+    ('qua', 34, 1),
+    ('kinh', 34, 2),
+    ('vien', 34, 1),
+    ('vong', 34, 1),
+    ('ngay', 34, 1),
+    ('nay', 34, 2),
+    ('may', 34, 3),
+    ('anh', 34, 1),
+    ('ky', 34, 1),
+    ('thuat', 34, 1),
+    ('so', 34, 2),
+    ('thuong', 34, 2),
+    ('duoc', 34, 1),
+    ('kiem', 34, 1),
+    ('soat', 34, 1),
+    ('boi', 34, 1),
+    ('thong', 34, 1),
+    ('ho', 34, 2),
+    ('tap', 34, 1),
+    ('trung', 34, 1),
+    ('lieu', 34, 1),
+    ('tren', 34, 1),
+    ('tham', 34, 1),
+    ('gia', 34, 1),
+    ('giang', 34, 1),
+    ('day', 34, 1),
+    ('o', 34, 1),
+    ('truong', 34, 1),
+    ('can', 34, 1),
+    ('biet', 34, 1),
+    ('ro', 34, 1),
+    ('phai', 34, 1),
+    ('chiem', 34, 1),
+    ('mac', 34, 1),
+    ('du', 34, 1),
+    ('hai', 34, 1),
+    ('voi', 34, 1),
+    ('nhau', 34, 1),
+    ('nha', 35, 9),
+    ('khi', 35, 12),
+    ('tuong', 35, 11),
+    ('hoc', 35, 11),
+    ('phan', 35, 5),
+    ('tich', 35, 4),
+    ('logic', 35, 4),
+    ('tien', 35, 2),
+    ('hanh', 35, 1),
+    ('nghien', 35, 1),
+    ('cuu', 35, 1),
+    ('cai', 35, 1),
+    ('hoac', 35, 2),
+    ('phat', 35, 1),
+    ('trien', 35, 1),
+    ('cac', 35, 2),
+    ('khai', 35, 1),
+    ('niem', 35, 1),
+    ('li', 35, 1),
+    ('thuyet', 35, 1),
+    ('va', 35, 3),
+    ('phuong', 35, 1),
+    ('phap', 35, 1),
+    ('hoat', 35, 1),
+    ('dong', 35, 1),
+    ('lien', 35, 1),
+    ('quan', 35, 1),
+    ('den', 35, 1),
+    ('thanh', 35, 1),
+    ('cau', 35, 1),
+    ('truc', 35, 1),
+    ('nhung', 35, 1),
+    ('bien', 35, 2),
+    ('doi', 35, 1),
+    ('cua', 35, 1),
+    ('bau', 35, 1),
+    ('quyen', 35, 1),
+    ('ho', 35, 1),
+    ('du', 35, 1),
+    ('bao', 35, 1),
+    ('thoi', 35, 1),
+    ('tiet', 35, 2),
+    ('mot', 35, 1),
+    ('cach', 35, 1),
+    ('chi', 35, 1),
+    ('dai', 35, 2),
+    ('han', 35, 1),
+    ('de', 35, 1),
+    ('su', 35, 1),
+    ('dung', 35, 1),
+    ('trong', 35, 1),
+    ('nganh', 35, 1),
+    ('hang', 35, 1),
+    ('khong', 35, 1),
+    ('van', 35, 1),
+    ('tai', 35, 1),
+    ('nong', 35, 1),
+    ('nghiep', 35, 1),
+    ('thong', 35, 1),
+    ('tin', 35, 1),
+    ('chung', 35, 1),
+    ('nha', 36, 9),
+    ('hoa', 36, 32),
+    ('hoc', 36, 32),
+    ('phan', 36, 6),
+    ('tich', 36, 6),
+    ('logic', 36, 4),
+    ('an', 36, 2),
+    ('mon', 36, 2),
+    ('moi', 36, 2),
+    ('truong', 36, 2),
+    ('phap', 36, 3),
+    ('li', 36, 4),
+    ('cong', 36, 3),
+    ('nghiep', 36, 3),
+    ('vo', 36, 2),
+    ('co', 36, 4),
+    ('huu', 36, 2),
+    ('duoc', 36, 2),
+    ('pham', 36, 3),
+    ('vat', 36, 2),
+    ('polymer', 36, 2),
+    ('dat', 36, 2),
+    ('dai', 36, 2),
+    ('thuc', 36, 2),
+    ('hien', 36, 1),
+    ('cac', 36, 6),
+    ('nghien', 36, 1),
+    ('cuu', 36, 1),
+    ('cai', 36, 2),
+    ('tien', 36, 2),
+    ('hoac', 36, 2),
+    ('phat', 36, 2),
+    ('trien', 36, 2),
+    ('khai', 36, 1),
+    ('niem', 36, 1),
+    ('thuyet', 36, 1),
+    ('va', 36, 3),
+    ('phuong', 36, 1),
+    ('hoat', 36, 1),
+    ('dong', 36, 1),
+    ('ung', 36, 1),
+    ('dung', 36, 1),
+    ('kien', 36, 1),
+    ('khoa', 36, 1),
+    ('lien', 36, 1),
+    ('quan', 36, 1),
+    ('vao', 36, 1),
+    ('chu', 36, 1),
+    ('yeu', 36, 1),
+    ('de', 36, 1),
+    ('kiem', 36, 1),
+    ('nghiem', 36, 1),
+    ('nguyen', 36, 1),
+    ('lieu', 36, 1),
+    ('san', 36, 1),
+    ('qui', 36, 1),
+    ('trinh', 36, 1),
+    ('nha', 37, 9),
+    ('dia', 37, 11),
+    ('chat', 37, 11),
+    ('phan', 37, 4),
+    ('tich', 37, 4),
+    ('logic', 37, 4),
+    ('hoc', 37, 4),
+    ('khoa', 37, 2),
+    ('trai', 37, 4),
+    ('dat', 37, 4),
+    ('cac', 37, 1),
+    ('nghien', 37, 1),
+    ('cuu', 37, 1),
+    ('cau', 37, 1),
+    ('truc', 37, 1),
+    ('vat', 37, 1),
+    ('li', 37, 1),
+    ('cua', 37, 2),
+    ('lop', 37, 1),
+    ('vo', 37, 1),
+    ('qua', 37, 1),
+    ('trinh', 37, 1),
+    ('hinh', 37, 1),
+    ('thanh', 37, 1),
+    ('da', 37, 1),
+    ('va', 37, 3),
+    ('hoa', 37, 1),
+    ('thach', 37, 1),
+    ('de', 37, 1),
+    ('xac', 37, 2),
+    ('dinh', 37, 2),
+    ('tung', 37, 1),
+    ('buoc', 37, 1),
+    ('thay', 37, 1),
+    ('doi', 37, 1),
+    ('lich', 37, 1),
+    ('su', 37, 1),
+    ('phat', 37, 1),
+    ('trien', 37, 1),
+    ('vi', 37, 1),
+    ('tri', 37, 1),
+    ('khoang', 37, 1),
+    ('san', 37, 1),
+    ('nhien', 37, 1),
+    ('lieu', 37, 1),
+    ('nha', 38, 9),
+    ('dia', 38, 13),
+    ('li', 38, 14),
+    ('phan', 38, 4),
+    ('tich', 38, 4),
+    ('logic', 38, 4),
+    ('hoc', 38, 6),
+    ('ban', 38, 2),
+    ('do', 38, 2),
+    ('tu', 38, 2),
+    ('nhien', 38, 2),
+    ('khi', 38, 2),
+    ('tuong', 38, 4),
+    ('thuy', 38, 2),
+    ('van', 38, 3),
+    ('nghien', 38, 1),
+    ('cuu', 38, 1),
+    ('cac', 38, 2),
+    ('dac', 38, 1),
+    ('diem', 38, 1),
+    ('va', 38, 2),
+    ('tac', 38, 1),
+    ('dung', 38, 1),
+    ('cua', 38, 1),
+    ('be', 38, 1),
+    ('mat', 38, 1),
+    ('trai', 38, 1),
+    ('dat', 38, 1),
+    ('trong', 38, 1),
+    ('moi', 38, 1),
+    ('quan', 38, 1),
+    ('voi', 38, 1),
+    ('hien', 38, 1),
+    ('vat', 38, 1),
+    ('hoa', 38, 1),
+    ('xa', 38, 1),
+    ('hoi', 38, 1),
+    ('nha', 39, 12),
+    ('toan', 39, 23),
+    ('hoc', 39, 19),
+    ('phan', 39, 4),
+    ('tich', 39, 4),
+    ('logic', 39, 4),
+    ('co', 39, 5),
+    ('ung', 39, 4),
+    ('dung', 39, 4),
+    ('la', 39, 2),
+    ('nen', 39, 1),
+    ('tang', 39, 1),
+    ('cho', 39, 2),
+    ('tat', 39, 1),
+    ('ca', 39, 1),
+    ('cac', 39, 7),
+    ('nganh', 39, 1),
+    ('khoa', 39, 2),
+    ('the', 39, 3),
+    ('nang', 39, 1),
+    ('ve', 39, 2),
+    ('li', 39, 2),
+    ('thuyet', 39, 2),
+    ('hoac', 39, 1),
+    ('thien', 39, 1),
+    ('vi', 39, 1),
+    ('du', 39, 1),
+    ('nhu', 39, 2),
+    ('trong', 39, 2),
+    ('mot', 39, 3),
+    ('thung', 39, 1),
+    ('hinh', 39, 2),
+    ('vuong', 39, 1),
+    ('chua', 39, 1),
+    ('bao', 39, 2),
+    ('nhieu', 39, 2),
+    ('qua', 39, 2),
+    ('tao', 39, 2),
+    ('tron', 39, 1),
+    ('bai', 39, 1),
+    ('nay', 39, 1),
+    ('y', 39, 2),
+    ('nghia', 39, 1),
+    ('rat', 39, 1),
+    ('lon', 39, 1),
+    ('doi', 39, 2),
+    ('voi', 39, 1),
+    ('nhung', 39, 1),
+    ('nguoi', 39, 1),
+    ('hang', 39, 2),
+    ('ngay', 39, 1),
+    ('phai', 39, 1),
+    ('dong', 39, 2),
+    ('goi', 39, 1),
+    ('va', 39, 6),
+    ('chuyen', 39, 2),
+    ('di', 39, 1),
+    ('trieu', 39, 1),
+    ('do', 39, 1),
+    ('van', 39, 3),
+    ('de', 39, 1),
+    ('ma', 39, 1),
+    ('can', 39, 1),
+    ('giai', 39, 1),
+    ('quyet', 39, 1),
+    ('nghien', 39, 2),
+    ('cuu', 39, 2),
+    ('lien', 39, 1),
+    ('quan', 39, 1),
+    ('toi', 39, 1),
+    ('tien', 39, 1),
+    ('hanh', 39, 2),
+    ('phat', 39, 1),
+    ('trien', 39, 1),
+    ('khai', 39, 1),
+    ('niem', 39, 1),
+    ('tinh', 39, 1),
+    ('rui', 39, 1),
+    ('ro', 39, 1),
+    ('xem', 39, 1),
+    ('them', 39, 1),
+    ('nghe', 39, 1),
+    ('thong', 39, 1),
+    ('ke', 39, 1),
+    ('hiem', 39, 1),
+    ('phuong', 39, 1),
+    ('phap', 39, 1),
+    ('ki', 39, 2),
+    ('thuat', 39, 2),
+    ('ho', 39, 1),
+    ('tu', 39, 2),
+    ('gia', 39, 1),
+    ('hoat', 39, 1),
+    ('linh', 39, 2),
+    ('vuc', 39, 2),
+    ('kinh', 39, 1),
+    ('doanh', 39, 1),
+    ('te', 39, 1),
+    ('song', 39, 1),
+    ('nhien', 39, 1),
+    ('xa', 39, 1),
+    ('hoi', 39, 1),
+    ('nhiem', 39, 1),
+    ('vu', 39, 1),
+    ('cu', 39, 1),
+    ('cua', 39, 1),
+    ('phu', 39, 1),
+    ('thuoc', 39, 1),
+    ('vao', 39, 1),
+    ('nha', 40, 11),
+    ('thong', 40, 15),
+    ('ke', 40, 15),
+    ('phan', 40, 6),
+    ('tich', 40, 6),
+    ('logic', 40, 4),
+    ('kinh', 40, 4),
+    ('te', 40, 2),
+    ('xa', 40, 2),
+    ('hoi', 40, 2),
+    ('doanh', 40, 2),
+    ('ung', 40, 1),
+    ('dung', 40, 1),
+    ('toan', 40, 1),
+    ('hoc', 40, 1),
+    ('vao', 40, 2),
+    ('so', 40, 1),
+    ('lieu', 40, 1),
+    ('vi', 40, 2),
+    ('du', 40, 2),
+    ('nhu', 40, 1),
+    ('quyet', 40, 1),
+    ('dinh', 40, 2),
+    ('lua', 40, 1),
+    ('chon', 40, 1),
+    ('viec', 40, 1),
+    ('lam', 40, 1),
+    ('chiu', 40, 1),
+    ('anh', 40, 1),
+    ('huong', 40, 1),
+    ('lon', 40, 1),
+    ('tu', 40, 1),
+    ('cac', 40, 3),
+    ('yeu', 40, 1),
+    ('to', 40, 1),
+    ('nao', 40, 1),
+    ('muc', 40, 1),
+    ('luong', 40, 1),
+    ('hay', 40, 2),
+    ('thoi', 40, 1),
+    ('han', 40, 1),
+    ('hop', 40, 1),
+    ('dong', 40, 1),
+    ('mot', 40, 1),
+    ('nhan', 40, 1),
+    ('hieu', 40, 1),
+    ('tra', 40, 1),
+    ('moi', 40, 1),
+    ('co', 40, 1),
+    ('the', 40, 1),
+    ('ban', 40, 1),
+    ('chay', 40, 1),
+    ('o', 40, 1),
+    ('khu', 40, 1),
+    ('vuc', 40, 1),
+    ('thanh', 40, 1),
+    ('thi', 40, 1),
+    ('nong', 40, 1),
+    ('thon', 40, 1),
+    ('day', 40, 1),
+    ('la', 40, 1),
+    ('nhung', 40, 1),
+    ('don', 40, 1),
+    ('gian', 40, 1),
+    ('hau', 40, 1),
+    ('het', 40, 1),
+    ('nghien', 40, 1),
+    ('cuu', 40, 1),
+    ('hoach', 40, 1),
+    ('va', 40, 1),
+    ('quan', 40, 1),
+    ('li', 40, 1),
+    ('phu', 40, 1),
+    ('thuoc', 40, 1),
+    ('rat', 40, 1),
+    ('nhieu', 40, 1),
+    ('thong', 41, 10),
+    ('ke', 41, 10),
+    ('bao', 41, 12),
+    ('hiem', 41, 12),
+    ('phan', 41, 4),
+    ('tich', 41, 4),
+    ('logic', 41, 4),
+    ('toan', 41, 9),
+    ('ung', 41, 2),
+    ('dung', 41, 2),
+    ('tai', 41, 3),
+    ('chinh', 41, 3),
+    ('kinh', 41, 2),
+    ('te', 41, 2),
+    ('nha', 41, 1),
+    ('dam', 41, 1),
+    ('nhiem', 41, 1),
+    ('viec', 41, 2),
+    ('tinh', 41, 3),
+    ('cac', 41, 2),
+    ('rui', 41, 2),
+    ('ro', 41, 2),
+    ('ho', 41, 1),
+    ('la', 41, 1),
+    ('nhung', 41, 2),
+    ('chuyen', 41, 1),
+    ('gia', 41, 1),
+    ('trong', 41, 1),
+    ('phi', 41, 1),
+    ('doi', 41, 1),
+    ('voi', 41, 1),
+    ('dang', 41, 1),
+    ('khac', 41, 1),
+    ('nhau', 41, 1),
+    ('dua', 41, 1),
+    ('tren', 41, 1),
+    ('hoc', 41, 1),
+    ('va', 41, 1),
+    ('nha', 42, 9),
+    ('sinh', 42, 21),
+    ('vat', 42, 20),
+    ('hoc', 42, 27),
+    ('phan', 42, 4),
+    ('tich', 42, 4),
+    ('logic', 42, 4),
+    ('dong', 42, 3),
+    ('thuc', 42, 4),
+    ('vi', 42, 4),
+    ('ung', 42, 2),
+    ('dung', 42, 3),
+    ('cong', 42, 2),
+    ('nghe', 42, 2),
+    ('nghien', 42, 3),
+    ('cuu', 42, 3),
+    ('ve', 42, 1),
+    ('su', 42, 1),
+    ('song', 42, 1),
+    ('va', 42, 4),
+    ('cac', 42, 3),
+    ('he', 42, 1),
+    ('ho', 42, 1),
+    ('tien', 42, 2),
+    ('hanh', 42, 2),
+    ('cai', 42, 1),
+    ('hoac', 42, 1),
+    ('phat', 42, 1),
+    ('trien', 42, 1),
+    ('li', 42, 1),
+    ('thuyet', 42, 1),
+    ('phuong', 42, 1),
+    ('phap', 42, 1),
+    ('van', 42, 1),
+    ('cung', 42, 1),
+    ('nhu', 42, 1),
+    ('ap', 42, 1),
+    ('kien', 42, 1),
+    ('khoa', 42, 1),
+    ('lien', 42, 1),
+    ('quan', 42, 1),
+    ('toi', 42, 1),
+    ('khuan', 42, 1),
+    ('te', 42, 1),
+    ('bao', 42, 1),
+    ('gen', 42, 1),
+    ('thai', 42, 1),
+    ('dac', 42, 1),
+    ('biet', 42, 1),
+    ('trong', 42, 1),
+    ('linh', 42, 1),
+    ('vuc', 42, 1),
+    ('duoc', 42, 1),
+    ('nong', 42, 1),
+    ('nghiep', 42, 1),
+    ('nha', 43, 10),
+    ('khoa', 43, 10),
+    ('hoc', 43, 20),
+    ('bien', 43, 15),
+    ('phan', 43, 5),
+    ('tich', 43, 4),
+    ('logic', 43, 4),
+    ('hai', 43, 9),
+    ('duong', 43, 12),
+    ('hoa', 43, 2),
+    ('dia', 43, 4),
+    ('chat', 43, 2),
+    ('vat', 43, 8),
+    ('li', 43, 4),
+    ('chu', 43, 1),
+    ('yeu', 43, 1),
+    ('lam', 43, 1),
+    ('viec', 43, 1),
+    ('o', 43, 3),
+    ('dai', 43, 4),
+    ('tuy', 43, 1),
+    ('thuoc', 43, 1),
+    ('vao', 43, 1),
+    ('chuyen', 43, 2),
+    ('mon', 43, 1),
+    ('ma', 43, 1),
+    ('ho', 43, 3),
+    ('nghien', 43, 2),
+    ('cuu', 43, 2),
+    ('nhung', 43, 1),
+    ('the', 43, 2),
+    ('khong', 43, 1),
+    ('co', 43, 1),
+    ('su', 43, 2),
+    ('song', 43, 2),
+    ('vi', 43, 2),
+    ('du', 43, 4),
+    ('nhu', 43, 2),
+    ('dat', 43, 1),
+    ('da', 43, 1),
+    ('day', 43, 1),
+    ('nuoc', 43, 3),
+    ('cat', 43, 1),
+    ('hoac', 43, 1),
+    ('trong', 43, 1),
+    ('dong', 43, 1),
+    ('sinh', 43, 1),
+    ('cac', 43, 4),
+    ('dung', 43, 3),
+    ('may', 43, 1),
+    ('moc', 43, 1),
+    ('thiet', 43, 2),
+    ('bi', 43, 1),
+    ('hinh', 43, 1),
+    ('anh', 43, 1),
+    ('ve', 43, 4),
+    ('tinh', 43, 1),
+    ('va', 43, 3),
+    ('lan', 43, 1),
+    ('duoi', 43, 1),
+    ('de', 43, 2),
+    ('thu', 43, 1),
+    ('thap', 43, 1),
+    ('lieu', 43, 1),
+    ('gop', 43, 1),
+    ('bao', 43, 3),
+    ('moi', 43, 2),
+    ('truong', 43, 2),
+    ('bang', 43, 1),
+    ('cach', 43, 1),
+    ('phat', 43, 2),
+    ('minh', 43, 1),
+    ('ra', 43, 1),
+    ('phuong', 43, 2),
+    ('phap', 43, 2),
+    ('vung', 43, 2),
+    ('bo', 43, 1),
+    ('khoi', 43, 1),
+    ('nhiem', 43, 1),
+    ('ung', 43, 1),
+    ('ket', 43, 1),
+    ('qua', 43, 1),
+    ('trien', 43, 1),
+    ('danh', 43, 2),
+    ('gia', 43, 2),
+    ('dieu', 43, 1),
+    ('kien', 43, 1),
+    ('xac', 43, 1),
+    ('dinh', 43, 1),
+    ('khu', 43, 1),
+    ('vuc', 43, 1),
+    ('khai', 43, 1),
+    ('thac', 43, 1),
+    ('bat', 43, 1),
+    ('thuy', 43, 1),
+    ('san', 43, 1),
+    ('cai', 43, 1),
+    ('thien', 43, 1),
+    ('an', 43, 1),
+    ('ninh', 43, 1),
+    ('cua', 43, 1),
+    ('mot', 43, 1),
+    ('quoc', 43, 1),
+    ('ki', 44, 17),
+    ('su', 44, 10),
+    ('va', 44, 10),
+    ('thuat', 44, 8),
+    ('vien', 44, 8),
+    ('cong', 44, 13),
+    ('nghe', 44, 12),
+    ('sinh', 44, 14),
+    ('hoc', 44, 14),
+    ('phan', 44, 4),
+    ('tich', 44, 4),
+    ('logic', 44, 4),
+    ('ap', 44, 1),
+    ('dung', 44, 2),
+    ('cac', 44, 3),
+    ('nguyen', 44, 1),
+    ('tac', 44, 2),
+    ('o', 44, 1),
+    ('cap', 44, 1),
+    ('do', 44, 1),
+    ('nghiep', 44, 2),
+    ('de', 44, 1),
+    ('kiem', 44, 1),
+    ('soat', 44, 1),
+    ('cai', 44, 1),
+    ('tien', 44, 1),
+    ('quan', 44, 2),
+    ('li', 44, 2),
+    ('qua', 44, 2),
+    ('trinh', 44, 2),
+    ('bien', 44, 1),
+    ('doi', 44, 1),
+    ('ve', 44, 1),
+    ('mat', 44, 1),
+    ('ton', 44, 1),
+    ('tai', 44, 1),
+    ('trong', 44, 2),
+    ('tu', 44, 1),
+    ('nhien', 44, 1),
+    ('nhu', 44, 1),
+    ('len', 44, 1),
+    ('men', 44, 1),
+    ('san', 44, 1),
+    ('xuat', 44, 1),
+    ('chat', 44, 1),
+    ('xuc', 44, 1),
+    ('enzyme', 44, 1),
+    ('nham', 44, 1),
+    ('nang', 44, 1),
+    ('cao', 44, 1),
+    ('loi', 44, 1),
+    ('ich', 44, 1),
+    ('cho', 44, 1),
+    ('con', 44, 1),
+    ('nguoi', 44, 1),
+    ('bang', 44, 1),
+    ('nhieu', 44, 2),
+    ('cach', 44, 1),
+    ('khac', 44, 1),
+    ('nhau', 44, 1),
+    ('co', 44, 1),
+    ('ung', 44, 1),
+    ('linh', 44, 1),
+    ('vuc', 44, 1),
+    ('cham', 44, 1),
+    ('soc', 44, 1),
+    ('suc', 44, 1),
+    ('khoe', 44, 1),
+    ('nong', 44, 1),
+    ('moi', 44, 1),
+    ('truong', 44, 1),
+    ('bao', 44, 1),
+    ('che', 44, 1),
+    ('thuoc', 44, 1),
+    ('ki', 45, 26),
+    ('thuat', 45, 28),
+    ('y', 45, 19),
+    ('sinh', 45, 18),
+    ('phan', 45, 4),
+    ('tich', 45, 4),
+    ('logic', 45, 4),
+    ('hinh', 45, 6),
+    ('anh', 45, 4),
+    ('hoc', 45, 9),
+    ('thiet', 45, 5),
+    ('bi', 45, 4),
+    ('vat', 45, 4),
+    ('lieu', 45, 2),
+    ('va', 45, 5),
+    ('co', 45, 2),
+    ('che', 45, 2),
+    ('te', 45, 8),
+    ('bao', 45, 2),
+    ('mo', 45, 2),
+    ('di', 45, 2),
+    ('truyen', 45, 2),
+    ('lam', 45, 2),
+    ('sang', 45, 2),
+    ('phau', 45, 2),
+    ('chinh', 45, 3),
+    ('phuc', 45, 2),
+    ('hoi', 45, 2),
+    ('chuc', 45, 2),
+    ('nang', 45, 2),
+    ('dien', 45, 4),
+    ('tu', 45, 4),
+    ('tien', 45, 1),
+    ('hanh', 45, 2),
+    ('nghien', 45, 1),
+    ('cuu', 45, 1),
+    ('cac', 45, 3),
+    ('khia', 45, 1),
+    ('canh', 45, 1),
+    ('khac', 45, 1),
+    ('nhau', 45, 1),
+    ('cua', 45, 3),
+    ('con', 45, 1),
+    ('nguoi', 45, 1),
+    ('hay', 45, 1),
+    ('loai', 45, 1),
+    ('dong', 45, 1),
+    ('nham', 45, 1),
+    ('kiem', 45, 1),
+    ('tra', 45, 1),
+    ('chung', 45, 1),
+    ('minh', 45, 1),
+    ('hoac', 45, 1),
+    ('dieu', 45, 1),
+    ('he', 45, 1),
+    ('thong', 45, 2),
+    ('li', 45, 1),
+    ('thuyet', 45, 1),
+    ('ve', 45, 1),
+    ('su', 45, 3),
+    ('song', 45, 2),
+    ('da', 45, 2),
+    ('biet', 45, 1),
+    ('nhung', 45, 1),
+    ('tin', 45, 1),
+    ('nay', 45, 1),
+    ('duoc', 45, 1),
+    ('dung', 45, 1),
+    ('de', 45, 1),
+    ('ke', 45, 1),
+    ('bo', 45, 1),
+    ('may', 45, 1),
+    ('ho', 45, 1),
+    ('tro', 45, 1),
+    ('cho', 45, 1),
+    ('toi', 45, 1),
+    ('hoa', 45, 1),
+    ('loi', 45, 1),
+    ('ich', 45, 1),
+    ('nguyen', 45, 1),
+    ('tac', 45, 1),
+    ('trong', 45, 1),
+    ('khoa', 45, 1),
+    ('vi', 45, 1),
+    ('nha', 46, 9),
+    ('nong', 46, 25),
+    ('hoc', 46, 17),
+    ('phan', 46, 4),
+    ('tich', 46, 4),
+    ('logic', 46, 4),
+    ('nghiep', 46, 9),
+    ('khuyen', 46, 2),
+    ('chan', 46, 2),
+    ('nuoi', 46, 4),
+    ('khoa', 46, 4),
+    ('cay', 46, 6),
+    ('trong', 46, 5),
+    ('bao', 46, 2),
+    ('ve', 46, 4),
+    ('thuc', 46, 2),
+    ('vat', 46, 3),
+    ('cong', 46, 2),
+    ('nghe', 46, 4),
+    ('rau', 46, 3),
+    ('hoa', 46, 4),
+    ('qua', 46, 4),
+    ('va', 46, 6),
+    ('canh', 46, 3),
+    ('quan', 46, 3),
+    ('kinh', 46, 4),
+    ('doanh', 46, 2),
+    ('te', 46, 2),
+    ('phat', 46, 3),
+    ('trien', 46, 3),
+    ('thon', 46, 2),
+    ('la', 46, 3),
+    ('cung', 46, 2),
+    ('thuat', 46, 1),
+    ('coi', 46, 1),
+    ('cac', 46, 6),
+    ('trai', 46, 1),
+    ('lam', 46, 1),
+    ('vuon', 46, 3),
+    ('mot', 46, 1),
+    ('nhanh', 46, 1),
+    ('thuoc', 46, 1),
+    ('nganh', 46, 1),
+    ('lien', 46, 1),
+    ('toi', 46, 1),
+    ('loai', 46, 2),
+    ('an', 46, 2),
+    ('hat', 46, 1),
+    ('hoac', 46, 1),
+    ('dua', 46, 1),
+    ('vao', 46, 1),
+    ('nguyen', 46, 1),
+    ('tac', 46, 1),
+    ('sinh', 46, 2),
+    ('vi', 46, 1),
+    ('di', 46, 1),
+    ('truyen', 46, 1),
+    ('khac', 46, 2),
+    ('tham', 46, 1),
+    ('gia', 46, 1),
+    ('nghien', 46, 1),
+    ('cuu', 46, 1),
+    ('ung', 46, 1),
+    ('dung', 46, 1),
+    ('linh', 46, 1),
+    ('vuc', 46, 1),
+    ('nhau', 46, 1),
+    ('ki', 47, 11),
+    ('su', 47, 9),
+    ('thuy', 47, 19),
+    ('san', 47, 19),
+    ('phan', 47, 4),
+    ('tich', 47, 4),
+    ('logic', 47, 4),
+    ('thuat', 47, 2),
+    ('khai', 47, 2),
+    ('thac', 47, 2),
+    ('nuoi', 47, 3),
+    ('trong', 47, 3),
+    ('benh', 47, 2),
+    ('hoc', 47, 2),
+    ('quan', 47, 2),
+    ('li', 47, 2),
+    ('nguon', 47, 2),
+    ('loi', 47, 2),
+    ('chuyen', 47, 1),
+    ('ve', 47, 2),
+    ('danh', 47, 1),
+    ('bat', 47, 1),
+    ('cac', 47, 1),
+    ('loai', 47, 1),
+    ('ca', 47, 1),
+    ('va', 47, 2),
+    ('khac', 47, 1),
+    ('ho', 47, 1),
+    ('co', 47, 1),
+    ('the', 47, 1),
+    ('lam', 47, 1),
+    ('viec', 47, 1),
+    ('nuoc', 47, 3),
+    ('ngot', 47, 1),
+    ('lo', 47, 1),
+    ('man', 47, 1),
+    ('ki', 48, 21),
+    ('su', 48, 9),
+    ('va', 48, 14),
+    ('thuat', 48, 12),
+    ('vien', 48, 9),
+    ('lam', 48, 24),
+    ('nghiep', 48, 20),
+    ('phan', 48, 4),
+    ('tich', 48, 4),
+    ('logic', 48, 4),
+    ('do', 48, 2),
+    ('thi', 48, 2),
+    ('sinh', 48, 2),
+    ('quan', 48, 4),
+    ('li', 48, 4),
+    ('tai', 48, 4),
+    ('nguyen', 48, 4),
+    ('rung', 48, 4),
+    ('kinh', 48, 4),
+    ('te', 48, 4),
+    ('thien', 48, 4),
+    ('nhien', 48, 4),
+    ('cong', 48, 2),
+    ('nghe', 48, 2),
+    ('che', 48, 2),
+    ('bien', 48, 2),
+    ('san', 48, 2),
+    ('thuong', 48, 2),
+    ('mai', 48, 2),
+    ('hoc', 48, 6),
+    ('xa', 48, 2),
+    ('hoi', 48, 2),
+    ('khoa', 48, 4),
+    ('bao', 48, 2),
+    ('ton', 48, 2),
+    ('hoang', 48, 2),
+    ('da', 48, 2),
+    ('go', 48, 2),
+    ('cung', 48, 1),
+    ('cap', 48, 1),
+    ('ho', 48, 1),
+    ('tro', 48, 1),
+    ('tu', 48, 1),
+    ('van', 48, 2),
+    ('ve', 48, 1),
+    ('cac', 48, 2),
+    ('de', 48, 1),
+    ('phuong', 48, 1),
+    ('thuc', 48, 1),
+    ('chuyen', 49, 10),
+    ('gia', 49, 10),
+    ('bao', 49, 11),
+    ('ve', 49, 10),
+    ('moi', 49, 21),
+    ('truong', 49, 21),
+    ('phan', 49, 4),
+    ('tich', 49, 4),
+    ('logic', 49, 4),
+    ('khoa', 49, 4),
+    ('hoc', 49, 4),
+    ('dat', 49, 4),
+    ('cong', 49, 4),
+    ('nghe', 49, 2),
+    ('ki', 49, 4),
+    ('thuat', 49, 4),
+    ('kiem', 49, 2),
+    ('soat', 49, 2),
+    ('va', 49, 9),
+    ('bvmt', 49, 8),
+    ('kinh', 49, 4),
+    ('te', 49, 4),
+    ('tai', 49, 6),
+    ('nguyen', 49, 6),
+    ('thien', 49, 2),
+    ('nhien', 49, 4),
+    ('quan', 49, 9),
+    ('li', 49, 13),
+    ('dai', 49, 2),
+    ('chat', 49, 5),
+    ('thai', 49, 5),
+    ('do', 49, 2),
+    ('thi', 49, 2),
+    ('nghiep', 49, 2),
+    ('bien', 49, 3),
+    ('xu', 49, 4),
+    ('su', 49, 3),
+    ('co', 49, 2),
+    ('tran', 49, 2),
+    ('dau', 49, 2),
+    ('nghien', 49, 1),
+    ('cuu', 49, 1),
+    ('danh', 49, 1),
+    ('tac', 49, 2),
+    ('dong', 49, 2),
+    ('cua', 49, 2),
+    ('cac', 49, 3),
+    ('hoat', 49, 1),
+    ('con', 49, 1),
+    ('nguoi', 49, 1),
+    ('doi', 49, 2),
+    ('voi', 49, 2),
+    ('tu', 49, 2),
+    ('nhan', 49, 1),
+    ('tao', 49, 1),
+    ('ho', 49, 2),
+    ('ap', 49, 1),
+    ('dung', 49, 2),
+    ('mon', 49, 1),
+    ('vao', 49, 1),
+    ('o', 49, 1),
+    ('nhiem', 49, 1),
+    ('ung', 49, 1),
+    ('pho', 49, 1),
+    ('khi', 49, 1),
+    ('hau', 49, 1),
+    ('can', 49, 1),
+    ('kiet', 49, 1),
+    ('thoai', 49, 1),
+    ('hoa', 49, 1),
+    ('nguon', 49, 1),
+    ('luc', 49, 1),
+    ('xay', 49, 1),
+    ('ke', 49, 1),
+    ('hoach', 49, 1),
+    ('giai', 49, 1),
+    ('phap', 49, 1),
+    ('de', 49, 1),
+    ('ton', 49, 1),
+    ('phuc', 49, 1),
+    ('hoi', 49, 1),
+    ('giam', 49, 1),
+    ('thieu', 49, 1),
+    ('hai', 49, 1),
+    ('toi', 49, 1),
+    ('ki', 50, 13),
+    ('su', 50, 10),
+    ('cong', 50, 14),
+    ('nghiep', 50, 14),
+    ('phan', 50, 4),
+    ('tich', 50, 4),
+    ('logic', 50, 4),
+    ('quan', 50, 3),
+    ('li', 50, 3),
+    ('thuat', 50, 4),
+    ('he', 50, 2),
+    ('thong', 50, 2),
+    ('van', 50, 1),
+    ('hanh', 50, 1),
+    ('cua', 50, 1),
+    ('toan', 50, 2),
+    ('bo', 50, 1),
+    ('nha', 50, 1),
+    ('may', 50, 1),
+    ('dam', 50, 1),
+    ('bao', 50, 1),
+    ('rang', 50, 1),
+    ('cac', 50, 1),
+    ('qui', 50, 1),
+    ('trinh', 50, 1),
+    ('hoat', 50, 1),
+    ('dong', 50, 1),
+    ('hieu', 50, 1),
+    ('qua', 50, 1),
+    ('an', 50, 1),
+    ('va', 50, 1),
+    ('co', 50, 1),
+    ('tinh', 50, 1),
+    ('kinh', 50, 1),
+    ('te', 50, 1);
 
 
 -- Batch 2: Jobs 51 to 100
 INSERT INTO jobs (
-    job_name, holland_code, job_group, activities_code,
+    id, job_name, holland_code, job_group, activities_code,
     capacity, essential_ability, education_level, work_environment,
     work_style, work_value, job_description, specializations,
     main_tasks, work_areas, is_active
 ) VALUES
-    ('Kĩ sư xây dựng', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Các kĩ sư xây dựng áp dụng toán học, vật lí và hóa học để xây dựng các công trình nhà ở, nhà thương mại, đường giao thông, cầu, đập nước, mạng lưới cấp nước, mạng lưới thoát nước, bến cảng, kênh rạch, bến, sân bay, hệ thống đường sắt.', '["Công nghệ kĩ thuật vật liệu xây dựng", "Công nghệ kĩ thuật xây dựng", "Công nghệ kĩ thuật công trình xây dựng", "Xây dựng dân dụng và công nghiệp"]', '["Thực hiện nghiên cứu và phát triển các lí thuyết và phương pháp mới và được cải tiến liên quan đến kĩ thuật xây dựng", "Tư vấn và thiết kế các kết cấu như cầu, đập, bến tầu, đường bộ, sân bay, đường sắt, kênh đào, đường ống, hệ thống thải nước, kiểm soát lũ lụt và các công trình công nghiệp và lớn khác", "Quyết định và chỉ rõ các phương pháp xây dựng, vật liệu và tiêu chuẩn chất lượng, và chỉ đạo công tác xây dựng", "Thiết lập các hệ thống kiểm soát và đảm bảo hoạt động chức năng hiệu quả của các cấu trúc cũng như độ an toàn và BVMT", "Xác định vị trí và chỉnh sửa các sự cố", "Tổ chức và chỉ đạo bảo dưỡng sửa chữa các cấu trúc hiện có", "Nghiên cứu và tư vấn về các vấn đề của vật liệu đặc biệt", "Duy trì đội ngũ kĩ thuật và tư vấn viên với các chuyên gia liên quan khác", "Chuẩn bị tài liệu và báo cáo khoa học", "Giám sát công nhân"]', '["Các công ty xây dựng", "Các công ty cầu đường", "Các công ty kiến trúc", "Tư vấn độc lập"]', TRUE),
-    ('Kĩ sư ô tô', 'RI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Kĩ sư ô tô thiết kế, thử nghiệm, phát triển và chỉ đạo sản xuất các loại ô tô như xe hơi, xe tải, xe buýt, xe bồn, xe đua… Họ giúp ngành công nghiệp ô tô đáp ứng những yêu cầu mới như tăng độ an toàn, tiết kiệm nhiên liệu và tiêu chuẩn môi trường.', '["Công nghệ ô tô", "Công nghệ kĩ thuật ô tô"]', '["Thiết kế động cơ và các bộ phận khác của xe ô tô, việc này cần áp dụng các công thức toán học và vật lí", "Thiết kế các hệ thống cụ thể trong ô tô như hệ thống phun nhiên liệu, điều hòa, phanh...", "Thử nghiệm và tiến hành thí nghiệm nguyên mẫu", "Giám sát việc lắp ráp và sản xuất ô tô/ phụ tùng ô tô", "Xây dựng và giám sát quy trình bảo dưỡng ô tô", "Đo lường các chỉ số kỹ thuật của xe ô tô"]', '["Các công ty sản xuất, lắp ráp, bảo dưỡng ô tô", "Các đơn vị nghiên cứu và phát triển về ô tô"]', TRUE),
-    ('Kĩ sư cơ khí', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự công nhận', 'Kĩ sư cơ khí làm công việc có liên quan tới quá trình lắp đặt, vận hành và bảo trì máy móc trong các ngành công nghiệp. Họ giải quyết các vấn đề kĩ thuật hàng ngày để nâng cao hiệu quả và năng suất.', '["Công nghệ kĩ thuật cơ khí", "Công nghệ chế tạo máy", "Công nghệ kĩ thuật cơ điện tử", "Công nghệ kĩ thuật ô tô", "Công nghệ kĩ thuật nhiệt"]', '["Tư vấn và thiết kế máy móc thiết bị, dụng cụ, bộ phận phi điện – điện tử để đạt được mục tiêu sản xuất và chế biến nhất định trong các ngành công nghiệp và nông nghiệp", "Xác định và kiểm tra các phương pháp sản xuất, lắp đặt và hoạt động của máy móc thiết bị và dụng cụ", "Cộng tác với kĩ sư công nghiệp để có kế hoạch bố trí máy móc thiết bị", "Thiết lập tiêu chuẩn và qui trình kiểm soát để đảm bảo hoạt động hiệu quả và an toàn của máy móc thiết bị, dụng cụ", "Tổ chức và chỉ đạo việc bảo dưỡng và sửa chữa máy móc thiết bị, dụng cụ", "Nghiên cứu và tư vấn về nhiên liệu và chức năng của máy móc, về công nghệ của các vật liệu, sản phẩm và qui trình sản xuất cụ thể trên máy móc đó", "Quản lí các tác động của việc vận hành máy móc đối với người sử dụng và môi trường", "Giám sát thợ cơ khí và công nhân có liên quan"]', '["Trung tâm nghiên cứu", "Các trường ĐH", "Các cơ quan Nhà nước", "Các doanh nghiệp chế tạo và sửa chữa máy móc thiết bị dụng cụ", "Các doanh nghiệp tư vấn chế tạo cơ khí", "Các doanh nghiệp có lắp đặt vận hành máy móc thiết bị"]', TRUE),
-    ('Kĩ sư hoá học', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự công nhận', 'Kĩ sư hóa học áp dụng các kiến thức hóa học, vật lí và toán học để biến đổi các hóa chất trong nguyên liệu, hóa chất tổng hợp thành các dạng hữu ích hơn hoặc có giá trị hơn (ví dụ như xăng dầu, cao su…). Kĩ sư hóa học cũng tạo ra các loại vật liệu và các kĩ thuật mới được sử dụng trong các ngành công nghiệp khác', '["Công nghệ kĩ thuật hóa học", "Kĩ thuật hóa học", "Hóa học"]', '["Thực hiện nghiên cứu và tư vấn, phát triển các qui trình hóa chất thương mại để lọc dầu và các chất lỏng khác hoặc khí và sản xuất các chất và hàng hóa như dẫn xuất dầu, chất nổ, lương thực và đồ uống, dược phẩm, hoặc các vật liệu tổng hợp khác", "Nghiên cứu tiền khả thi và khả thi về xây dựng các máy móc sản xuất hóa chất", "Xác định các phương pháp sản xuất, vật liệu và tiêu chuẩn chất lượng và đảm bảo chúng đồng bộ với các chi tiết kĩ thuật", "Lập các tiêu chuẩn và qui trình kiểm soát để đảm bảo độ an toàn và hiệu quả của hoạt động sản xuất", "Xác định và chỉnh sửa các sự cố", "Tổ chức và chỉ đạo bảo dưỡng, sửa chữa các thiết bị hiện có", "Nghiên cứu và tư vấn về các vấn đề về công nghệ liên quan đến các vật liệu, sản phẩm và các quá trình cụ thể", "Duy trì đội ngũ kĩ thuật và tư vấn viên với các chuyên gia liên quan khác", "Chuẩn bị tài liệu và báo cáo khoa học"]', '["Các công ty dược phẩm, thực phẩm và đồ uống, hóa chất, lọc hóa dầu, phân bón", "Tất cả các ngành công nghiệp sử dụng nguyên liệu thô để tạo ra sản phẩm (ví dụ như giấy, cao su)", "Các đơn vị nghiên cứu và phát triển"]', TRUE),
-    ('Kĩ sư luyện kim', 'RCI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Kĩ sư luyện kim là chuyên gia về công nghệ chế tạo kim loại và vận dụng các nguyên tắc vật lí để xử lí kim loại tuỳ theo mục đích ứng dụng. Họ nghiên cứu tính chất vật lí và hóa học của các kim loại và hợp kim.', '["Luyện gang", "Luyện thép", "Luyện kim màu", "Luyện kim đen", "Luyện Ferro hợp kim", "Công nghệ sản xuất alumin", "Công nghệ nhiệt luyện", "Công nghệ đúc kim loại", "Công nghệ cán, kéo kim loại", "Công nghệ kĩ thuật vật liệu", "Kĩ thuật vật liệu kim loại"]', '["Nghiên cứu các tính chất của kim loại, hợp kim và các loại vật liệu khác cũng như mối quan hệ của chúng với kim loại và hợp kim", "Nghiên cứu, tư vấn và giám sát công nghệ sản xuất kim loại và hợp kim trong các xưởng đúc, cán, luyện kim và chế tạo", "Cộng tác với kĩ sư vật liệu để tìm ra các phương pháp xử lí kim loại", "Quản lí các tác động của quá trình luyện kim đối với người sử dụng và môi trường", "Giám sát thợ luyện kim và công nhân có liên quan"]', '["Ngành công nghiệp luyện kim (ví dụ như các xưởng đúc, máy cán, chế tạo)", "Trung tâm nghiên cứu", "Các trường ĐH", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật cá nhân"]', TRUE),
-    ('Kĩ sư vật liệu', 'IRE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Kĩ sư vật liệu nghiên cứu các tính chất của những loại vật liệu tự nhiên và tổng hợp như kim loại, gốm, sứ, polymer, gỗ và các nguồn tài nguyên khác nhằm nâng cao chất lượng cho các ứng dụng công nghiệp và thương mại.', '["Công nghệ vật liệu", "Kĩ thuật vật liệu", "Kĩ thuật vật liệu kim loại"]', '["Nghiên cứu của các nguồn tài nguyên có giá trị công nghiệp và thương mại", "Phát triển các phương pháp chế tạo vật liệu thành những sản phẩm sử dụng được", "Phát triển các phương pháp kết hợp hai loại vật liệu khác nhau bằng cách ghép nối, nung chảy, chế tạo hợp kim, nhằm tạo ra các vật liệu hoặc sản phẩm mới", "Thiết kế sản phẩm mới", "Xác định được nguyên nhân vật liệu bị hỏng và cách nâng cao độ bền của vật liệu", "Phát triển các biện pháp kéo dài tuổi thọ của vật liệu"]', '["Bất cứ ngành công nghiệp nào", "Các trung tâm nghiên cứu", "Các viện hàn lâm", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật tư nhân"]', TRUE),
-    ('Kĩ sư điện', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Kĩ sư điện làm công việc có liên quan tới việc phát và truyền tải điện. Họ lắp đặt, vận hành và duy trì mạng lưới điện. Kĩ sư điện cũng là những chuyên gia về các mạch điện trong các sản phẩm như máy tính và các thiết bị gia dụng.', '["Điện công nghiệp và dân dụng", "Hệ thống điện", "Nhiệt điện", "Thủy điện", "Công nghệ kĩ thuật điện, điện tử"]', '["Lập kế hoạch và thiết kế các trạm phát điện", "Bố trí các loại thiết bị phát điện", "Sửa chữa bảo dưỡng các trạm phát điện", "Thiết kế các mạch điện trong một sản phẩm", "Thiết kế các mạch điện trong một tòa nhà", "Thiết kế các mạch điện trong một chiếc xe", "Sửa chữa bảo dưỡng thiết bị điện", "Thiết kế và duy trì động cơ điện", "Lắp đặt thiết bị chuyển mạch, cáp và phụ kiện", "Lắp đặt thiết bị phát tín hiệu để quản lí giao thông đường bộ, hàng không, đường sắt", "Thiết kế và duy trì cấu tạo điện của mạng viễn thông", "Tính toán về mặt kĩ thuật và phát triển các dự toán chi phí"]', '["Điện công nghiệp và dân dụng", "Hệ thống điện", "Nhiệt điện", "Thủy điện", "Công nghệ kĩ thuật điện, điện tử"]', TRUE),
-    ('Kĩ sư điện tử', 'IR', 'Phân tích - Logic', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự công nhận', 'Các kĩ sư điện tử nghiên cứu, thiết kế và chỉ đạo xây dựng, bảo dưỡng và sửa chữa các hệ thống điện tử; tìm hiểu và tư vấn về các vấn đề kỹ thuật của vật liệu, sản phẩm hay quá trình chế tạo điện tử.', '["Kĩ thuật điện, điện tử", "Kĩ thuật cơ điện tử", "Công nghệ kĩ thuật cơ điện tử", "Công nghệ kĩ thuật điện, điện tử", "Công nghệ kĩ thuật điện tử, truyền thông"]', '["Thiết kế mạch điện tử cho các thiết bị điện tử", "Chuẩn bị thiết kế các chi tiết", "Phát triển các thiết bị thử nghiệm", "Kiểm tra việc cài đặt vì mục tiêu an toàn và chất lượng", "Tiến hành nghiên cứu cải tiến thiết kế của thiết bị điện tử cụ thể"]', '["Các cơ quan truyền thông, kĩ thuật vũ trụ và giao thông của Nhà nước", "Các ngành công nghiệp sản xuất các dụng cụ điện tử", "Các ngành công nghiệp liên quan tới truyền thông", "Công nghiệp sản xuất máy tính", "Các đơn vị nghiên cứu"]', TRUE),
-    ('Kĩ sư viễn thông', 'REC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Các kĩ sư viễn thông tiến hành nghiên cứu, tư vấn, thiết kế, chỉ đạo việc xây dựng, vận hành, bảo dưỡng và sửa chữa các hệ thống và thiết bị viễn thông. Họ nghiên cứu và tư vấn về các vấn đề kĩ thuật của vật liệu, sản phẩm hay quá trình kĩ thuật viễn thông.', '["Công nghệ điện tử - viễn thông", "Công nghệ phát sóng", "Kĩ thuật điện tử truyền thông"]', '["Tư vấn và thiết kế phần điện tử của các máy móc thiết bị, bộ phận, hệ thống và các tổ hợp viễn thông", "Xác định các phương pháp sản xuất và lắp đặt, tiêu chuẩn vật liệu, chất lượng và an toàn, chỉ đạo và giám sát việc sản xuất, lắp đặt các máy móc thiết bị và hệ thống viễn thông", "Tổ chức và chỉ đạo việc bảo dưỡng và sửa chữa các thiết bị, hệ thống viễn thông", "Nghiên cứu và tư vấn về các trang bị viễn thông", "Thiết kế, qui hoạch các mạng lưới viễn thông ứng dụng công nghệ vô tuyến, hữu tuyến hay cáp quang", "Thiết kế các mạng phân phối truyền thanh và truyền hình không dây và có dây", "Giám sát thợ kĩ thuật và công nhân có liên quan"]', '["Các công ty viễn thông", "Các viện thiết kế", "Các cơ quan quản lý viễn thông của nhà nước"]', TRUE),
-    ('Kĩ sư vũ trụ, hàng không', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Điều kiện làm việc', 'Kĩ sư vũ trụ, hàng không là chuyên gia trong việc thiết kế và sản xuất các loại thiết bị bay. Họ cũng thực hiện các công việc duy tu, bảo dưỡng máy bay. Kĩ thuật hàng không vũ trụ cũng có thể mở rộng đến tàu vũ trụ, vệ tinh cũng như các hệ thống kiểm soát và hướng dẫn các máy bay từ xa', '["Kĩ thuật hàng không", "Kĩ sư vũ trụ"]', '["Thiết kế các loại máy bay, bao gồm cả thiết kế tổng thể và thiết kế chi tiết", "Điều này đòi hỏi phải áp dụng các công thức toán học và vật lí", "Thiết kế hệ thống chi tiết trong máy bay như hệ thống phun nhiên liệu, điều hòa, thiết bị hạ cánh… Thử nghiệm và tiến hành thí nghiệm nguyên mẫu", "Giám sát việc lắp ráp và sản xuất máy bay / chi tiết máy bay", "Sửa chữa máy bay hiện có để thêm các bộ phận mới (ví dụ như thùng nhiên liệu phụ)", "Chuẩn bị các chuyến bay", "Tiến hành sửa chữa và bảo trì thường xuyên"]', '["Các nhà máy tham gia sản xuất máy bay", "Các sân bay", "Công ty hàng không", "Không quân", "Các đơn vị nghiên cứu và phát triển"]', TRUE),
-    ('Bác sĩ Thú y', 'RIC', 'Phân tích - Logic', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Chuyên gia thú y áp dụng các nguyên tắc y học để điều trị và kiểm soát dịch bệnh trong gia súc gia cầm và vật nuôi. Họ tiến hành nghiên cứu, cải tiến, phát triển các khái niệm, học thuyết và phương pháp hoạt động, và áp dụng các kiến thức y khoa vào lĩnh vực thú y', '["Thú y", "Dược thú y", "Sản xuất thuốc thú y", "Dịch vụ thú y"]', '["Nghiên cứu, cải tiến và phát triển các khái niệm, học thuyết và phương pháp hoạt động thú y", "Tiến hành kiểm tra và chẩn đoán bệnh và tổn thương trên động vật", "Quản lí và thực hiện việc điều trị thú y bằng phẫu thuật hoặc dùng thuốc", "Thử nghiệm trên bò sữa và đàn vật nuôi khác, tiêm chủng phòng bệnh trên động vật", "Tư vấn về chăm sóc và chăn nuôi gia súc", "Kiểm tra chất lượng, độ tinh khiết và an toàn thực phẩm được làm toàn bộ hoặc một phần từ nguyên liệu có nguồn gốc động vật dùng cho người", "Hỗ trợ về dịch tễ học, X-quang và giám sát khác về thú y", "Chuẩn bị tài liệu và báo cáo khoa học"]', '["Làm việc trong bệnh viện thú y", "Làm việc trong các viện nghiên cứu chuyên ngành khác nhau của khoa học thú y", "Làm việc trong nhà máy sữa, các công ty dược phẩm, trang trại gia cầm và trang trại nuôi heo", "Làm việc trong phòng khám thú y tư nhân"]', TRUE),
-    ('Kỹ thuật viên Thú y', 'RI', 'Phân tích - Logic', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Kỹ thuật viên thú y thực hiện nhiệm vụ tư vấn, chẩn đoán, phòng ngừa và chữa bệnh thú y theo chỉ dẫn của bác sĩ thú y. Họ chăm sóc động vật được điều trị, thực hiện các thủ tục thường quy và hỗ trợ bác sĩ thú y trong các hoạt động', '["Thú y", "Dược thú y", "Sản xuất thuốc thú y", "Sản xuất thuốc thú y", "Dịch vụ thú y"]', '["Tư vấn cho cộng đồng và cá nhân về việc bệnh và điều trị vật nuôi", "Khám bệnh vật nuôi để chẩn đoán bệnh vật nuôi", "điều trị vật nuôi bị bệnh hoặc bị thương, đặc biệt là các bệnh thông thường", "Làm sạch và khử trùng dụng cụ và chuẩn bị vật liệu được sử dụng trong việc khám và điều trị động vật", "Thực hiện các nhiệm vụ kỹ thuật liên cần thiết cho việc thụ tinh nhân tạo của vật nuôi", "Hỗ trợ bác sĩ thú y trong quá trình điều trị", "Tiến hành chụp x quang, lấy mẫu, và tiến hành các xét nghiệm trong phòng thí nghiệm để hỗ trợ chẩn đoán sức khỏe vật nuôi"]', '["Làm việc tại các nông trường, trang trại lớn Làm việc trong các cơ quan quản lý thú y các cấp", "Làm việc trong phòng khám thú y tư nhân, bệnh viện dành cho vật nuôi/thú cưng", "Làm việc trong các viện nghiên cứu, các phòng thí nghiệm thú y"]', TRUE),
-    ('Dược sĩ', 'ICS', 'Phân tích - Logic', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự công nhận', 'Dược sĩ nghiên cứu, cải tiến, phát triển các khái niệm, học thuyết và phương pháp hoạt động dược phẩm bằng cách chuẩn bị, phân phối và bán dược phẩm và thuốc.', '["Dược sĩ", "Kĩ thuật dược", "Kĩ thuật kiểm nghiệm thuốc", "Dược học", "Hóa dược"]', '["Chuẩn bị và chỉ đạo chuẩn bị dược phẩm theo đơn đã kê của bác sĩ y khoa, nha khoa, bác sĩ thú y và theo liều lượng cho trước", "Kiểm tra đơn để bảo đảm rằng lượng thuốc kê không vượt quá mức cho phép và hướng dẫn sử dụng cho bệnh nhân hoặc những người mua thuốc và tư vấn về các loại thuốc tương khắc nhau", "Phân phối thuốc và dược phẩm tại bệnh viện và bán thuốc trong các nhà thuốc", "Giữ các hóa đơn, đặc biệt đối với các chất gây mê, chất độc và các thuốc gây nghiện", "Thử nghiệm thuốc để xác định tính chất, độ tinh chất và tác dụng", "Tham gia phát triển các biện pháp kiểm soát và qui định", "Chuẩn bị tài liệu và báo cáo khoa học"]', '["Tự mở hiệu thuốc", "Bộ phận dược phẩm trong một tổ chức chăm sóc sức khoẻ (ví dụ: bệnh viện)", "Công ty dược phẩm sản xuất thuốc"]', TRUE),
-    ('Kế toán', 'CEI', 'Phân tích - Logic', 'Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Kế toán theo dõi các hoạt động tài chính của một tổ chức. Họ lập kế hoạch, tổ chức, điều hành và thực hiện hệ thống kế toán cho tổ chức. Việc cấp chứng nhận cho kế toán và thực hành nghiệp vụ chuyên môn của họ được giám sát chặt chẽ. Có nhiều phần hành kế toán khác nhau và có nhiều vị trí trong hệ thống kế toán của một tổ chức. Nhiệm vụ cụ thể của một kế toán phụ thuộc vào công việc cụ thể mà người đó đảm nhận.', '["Kế toán doanh nghiệp", "Kế toán hành chính – sự nghiệp", "Kế toán lao động, tiền lương và bảo hiểm xã hội", "Kế toán ngân hàng", "Kế toán xây dựng"]', '["Tư vấn, lập kế hoạch và thiết lập ngân sách, kiểm soát tài khoản và các chính sách và hệ thống kiểm soát khác", "Chuẩn bị và xác thực báo cáo tài chính để trình bầy, để phục vụ quản lí, cổ đông và các cơ quan theo luật định và các cơ quan khác", "Chuẩn bị kế hoạch kinh phí, báo cáo thực hiện thực tế", "Chuẩn bị hoàn thuế, tư vấn và nêu ý kiến về các vấn đề thuế trước cơ quản quản lí thuế", "Lập kế hoạch lợi nhuận và ngân sách, làm báo cáo kết quả thực hiện thực tế", "Thực hiện điều tra tài chính trong những vấn đề như nghi ngờ gian lận, tình trạng không trả được nợ và phá sản", "Kiểm tra các tài khoản và sổ sách lưu giữ", "Thực hiện điều tra và tư vấn về quản lí các vấn đề quản lí như hiệu quả, cổ phiếu, doanh thu, sản phẩm mới, v.v.", "Thiết lập và kiểm soát hệ thống xác định chi phí đơn vị của các sản phẩm và dịch vụ"]', '["Các doanh nghiệp trong nước, có vốn đầu tư nước ngoài", "Các cơ quan Nhà nước", "Hành nghề độc lập"]', TRUE),
-    ('Chuyên gia quản trị dầu khí', 'ECR', 'Phân tích - Logic', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Chuyên gia quản trị dầu khí là chuyên gia lập kế hoạch và quản lí hoạt động khai thác dầu và khí đốt.', '["Quản trị kinh doanh xăng dầu và khí đốt"]', '["Xác định hạn ngạch sản xuất", "Lập kế hoạch các vị trí khai thác", "Lập kế hoạch vận chuyển nguyên liệu thô", "Xác định tính phù hợp của nhân viên, thiết bị và công nghệ", "Lập kế hoạch và quản lí lịch làm việc và trang thiết bị", "Giám sát hoạt động của nhà máy", "Giám sát việc mua sắm, lắp đặt và bảo trì thiết bị", "Điều phối và triển khai các chính sách về y tế và an toàn lao động", "Thực hiện các qui định và luật liên quan đến hoạt động khai thác khoáng sản và môi trường", "Lựa chọn, đào tạo và giám sát nhân viên"]', '["Các công ty thăm dò khai thác dầu khí", "Các doanh nghiệp, đơn vị thuộc ngành dầu khí", "Các vụ, phòng phụ trách lĩnh vực dầu khí thuộc cơ quan quản lí Nhà nước Bộ Công thương, Văn phòng Chính phủ…"]', TRUE),
-    ('Chuyên gia quản trị giao thông (quản lí và điều hành giao thông vận tải)', 'CER', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Chuyên gia quản trị giao thông lưu giữ hồ sơ và quản lí vận hành các dịch vụ vận tải hành khách và hàng hóa trong các hệ thống giao thông đường bộ, đường không, đường sắt, đường thủy…', '["Vận tải đường sắt", "Vận tải đường bộ và thành phố", "Vận tải đa phương thức", "Vận tải &amp;amp; Kinh tế đường sắt", "Vận tải - Kinh tế đường bộ và thành phố", "Qui hoạch &amp;amp; Quản lí giao thông vận tải đô thị", "Điều khiển các quá trình vận tải", "Khai thác vận tải", "Kinh tế vận tải"]', '["Lưu giữ hồ sơ vận hành và điều phối thời gian vận tải hành khách và hàng hóa", "Chỉ đạo tuyến đường xe lửa, xe buýt, máy bay và tàu thủy", "Tạo ra và duy trì hệ thống vận chuyển hành khách, hàng hóa", "Chỉ đạo và giám sát các hoạt động như phân công phương tiện, lái xe, cung ứng nhiên liệu và các yêu cầu khác", "Giám sát sự di chuyển của phương tiện qua các tuyến đường qui định", "Quản lí sự cố phương tiện và điều xe thay thế"]', '["Có thể làm tại các bộ phận nghiệp vụ và quản lí trong cơ quan quản lí Nhà nước về giao thông vận tải nói chung, đặc biệt là giao thông vận tải đô thị, quản lí sử dụng đất và môi trường đô thị", "Các Viện, trường đào tạo về giao thông vận tải, qui hoạch giao thông vận tải đô thị", "Các ban quản lí dự án về xây dựng giao thông vận tải đô thị", "Các doanh nghiệp kinh doanh vận tải đô thị, doanh nghiệp quản lí và khai thác cơ sở hạng tầng giao thông đô thị"]', TRUE),
-    ('Chuyên gia quản trị năng lượng', 'IRE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Chuyên gia quản trị năng lượng là những chuyên gia trong việc mua bán, trao đổi, phân phối và sử dụng năng lượng để đáp ứng các yêu cầu cụ thể, có tính đến các mục tiêu môi trường và kinh tế.', '["Quản trị và kinh doanh điện", "Quản trị và kinh doanh xăng dầu và khí đốt", "Quản trị kinh doanh năng lượng"]', '["Tìm hiểu về các loại năng lượng cần thiết khác nhau", "Tính toán lượng năng lượng cần thiết", "Phát triển mô hình tiêu thụ năng lượng và tạo ra các hệ thống cung cấp năng lượng dựa trên các mô hình đó", "Xác định các nguồn cung cấp năng lượng, đàm phán hợp đồng với các nhà cung cấp và tiến hành mua năng lượng", "Xác định các phương tiện truyền tải năng lượng đến nơi cần thiết", "Quản lí việc phân phối năng lượng", "Tính toán chi phí mua, truyền tải và phân phối năng lượng", "Phát triển và triển khai kế hoạch cắt giảm hoặc tối ưu hoá việc tiêu thụ năng lượng"]', '["Các doanh nghiệp, tổ chức sản xuất năng lượng", "Các doanh nghiệp tiêu thụ nhiều điện và năng lượng các dạng khác"]', TRUE),
-    ('Nhà kinh tế học', 'ICE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Nhà kinh tế học hiểu cách làm cho một quốc gia trở nên thịnh vượng bằng cách sử dụng nguồn lực của quốc gia đó một cách năng suất và hiệu quả. Họ tiến hành nghiên cứu, theo dõi và phân tích thông tin số liệu, làm các báo cáo và kế hoạch để giải quyết các vấn đề về kinh tế và kinh doanh, phát triển các mô hình phân tích, lí giải và dự báo hành vi và xu hướng kinh tế. Họ tư vấn cho doanh nghiệp, các nhóm lợi ích và chính phủ để xây dựng các giải pháp cho các vấn đề kinh tế và kinh doanh hiện tại và tương lai.', '["Kinh tế học", "Kinh tế quốc tế", "Kinh tế dân số và lao động", "Kinh tế tổ chức công nghiệp", "Kinh tế hoạch định", "Kinh tế tài chính công", "Hệ thống thông tin kinh tế"]', '["Theo dõi, thu thập, phân tích và lí giải các số liệu kinh tế bằng cách sử dụng các học thuyết kinh tế, kĩ thuật thống kê và kĩ thuật khác", "Áp dụng các công thức toán học và kĩ thuật thống kê để kiểm định các học thuyết kinh tế và đề ra giải pháp cho các vấn đề kinh tế", "Dự báo những thay đổi trong môi trường kinh tế và các chỉ số chính của nền kinh tế như thu nhập và chi tiêu, lãi suất và tỉ giá, việc làm và thất nghiệp, để xây dựng ngân sách ngắn hạn, lập kế hoạch dài hạn và đánh giá đầu tư", "Đánh giá tính phù hợp, kết quả và hiệu quả của các chính sách kinh tế - xã hội, các quyết định chính trị đối với nền kinh tế, tài chính và xã hội", "Tư vấn, khuyến nghị về chính sách và kế hoạch cho nền kinh tế, chiến lược và đầu tư cho công ti, tiến hành nghiên cứu khả thi cho dự án, dựa trên những nhân tố và xu hướng quá khứ, hiện tại và dự báo tương lai", "Tư vấn ứng dụng các kết quả nghiên cứu vào xây dựng chính sách kinh tế - xã hội cho các bộ phận trong dân số, các vùng và cho phát triển các thị trường", "Chuẩn bị các nghiên cứu và báo cáo khoa học"]', '["Các cơ quan Nhà nước", "Làm cho các ngân hàng lớn", "Các tổ chức phát triển và đa quốc gia như Ngân hàng Thế giới, Tổ chức Lao động quốc tế", "Các doanh nghiệp và công ty lớn"]', TRUE),
-    ('Chuyên viên thương mại quốc tế', 'EC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Đây là lĩnh vực liên quan tới nhiều khía cạnh của thương mại. Các hoạt động bao gồm: đàm phán hợp đồng thương mại, tạo điều kiện cho việc vận chuyển hàng hoá, phân phối sản phẩm và dịch vụ, các hiệp định thương mại, lưu kho hàng hoá... Phạm vi công việc của họ bao gồm từ việc thiết lập các thoả thuận giữa nhà sản xuất và đại lí bán lẻ trong một quốc gia cho tới các hoạt động kinh doanh quốc tế.', '["Kinh tế quốc tế", "Kinh doanh quốc tế"]', '["Thông thạo luật và tập quán thương mại quốc tế", "Phát triển lĩnh vực chuyên môn để được cấp chứng nhận cần thiết cho việc trao đổi buôn bán các mặt hàng khác nhau", "Phát triển danh bạ doanh nghiệp", "Xác định sản phẩm thương mại", "Hiểu rõ các phương thức vận tải và quản lí hàng hóa (ví dụ như một số sản phẩm có thể dễ bị hư hỏng và cần được chuyển tới người mua trong một vài giờ)", "Hiểu rõ cách thức lưu trữ ở kho của sản phẩm", "Thông thạo về tiền tệ quốc tế"]', '["Công ty đa quốc gia xuất khẩu và nhập khẩu hàng hoá và dịch vụ", "Dịch vụ tư vấn xuất nhập khẩu cá nhân"]', TRUE),
-    ('Chuyên viên ngân hàng, quỹ đầu tư', 'ECS', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Chuyên viên ngân hàng, quỹ đầu tư là các chuyên gia tạo ra các sản phẩm và dịch vụ tài chính (chẳng hạn như đề án quỹ tương hỗ). Họ xử lí lượng lớn các giao dịch và chuyên về các quỹ đầu tư và cho vay liên kết với mục tiêu làm thế nào để có lợi nhất cho những người sở hữu quỹ.', '["Tài chính ngân hàng"]', '["Nghiên cứu thị trường và xác định các hoạt động đầu tư tiềm năng", "Tạo ra các sản phẩm tài chính", "Tương tác với khách hàng để nắm bắt được kế hoạch đầu tư của họ, đặc biệt chú ý tới việc hiểu rõ được các mức độ rủi ro mà khách hàng sẵn sàng chấp nhận", "Tìm hiểu tình hình tài chính của khách hàng", "Phát triển kế hoạch đầu tư cho khách hàng và thực hiện đúng kế hoạch đó", "Thông báo cho khách hàng về tình trạng các khoản đầu tư", "Điều hành kinh tế và tư vấn khách hàng", "Tư vấn cho các ngân hàng và các cơ quan khác về qui trình đầu tư"]', '["Ngân hàng", "Các công ty chuyên về đầu tư", "Các hãng môi giới chứng khoám", "Các công ty đa quốc gia"]', TRUE),
-    ('Kĩ sư và kĩ thuật viên âm thanh', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý; Tương tác với người khác', 'Năng lực hình học – thiết kế', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Kĩ sư và kĩ thuật viên kĩ thuật âm thanh vận hành máy móc, thiết bị để ghi lại, đồng bộ hoá, phối âm hoặc sao chép các hiệu ứng về âm thanh, giọng nói và âm nhạc trong các phòng thu, đấu trường thể thao, nhà hát, rạp chiếu phim, trường quay phim truyện và video.', '["Thiết kế âm thanh, ánh sáng", "Công nghệ điện ảnh, truyền hình"]', '["Làm việc với các loại phương tiện truyền thông ghi âm khác nhau", "Thiết kế, cài đặt và vận hành các thiết bị và công cụ ghi âm", "Ghi âm, biên tập và phối âm bằng các phương tiện kĩ thuật khác nhau để cho ra sản phẩm hoàn chỉnh"]', '["Phòng thu thanh", "Công nghiệp làm phim", "Hãng phim lồng tiếng", "Buổi hoà nhạc trực tiếp", "Đài phát thanh"]', TRUE),
-    ('Nhân viên giao dịch ngân hàng', 'CE', 'Phân tích - Logic', 'Tương tác với người khác', 'Làm việc với con người', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Nhân viên giao dịch ngân hàng và các nghề liên quan làm việc trực tiếp với khách hàng đến ngân hàng hoặc các bưu điện giao dịch, thực hiện các giao dịch liên quan tới nhận, gửi, chuyển, qui đổi và rút tiền.', '["Tài chính – ngân hàng", "Tài chính tín dụng"]', '["Xử lí tiền gửi và tiền rút séc, chuyển khoản, hối phiếu, thẻ tín dụng, thư chuyển tiền, chi phiếu ngân hàng của khách hàng và những giao dịch ngân hàng có liên quan khác", "Ghi nợ vào tài khoản khách hàng", "Trả hối phiếu và chuyển nhượng tiền thay mặt khách hàng", "Nhận thư, bán tem thư và thực hiện các công việc tại quầy bưu điện như trả hối phiếu, chuyển tiền và các công việc liên quan", "Đổi tiền từ ngoại tệ này sang ngoại tệ khác, theo yêu cầu của khách hàng", "Ghi lại các giao dịch và giải quyết bằng quyết toán tiền mặt"]', '["Xử lí giao dịch trong các ngân hàng quốc doanh, cổ phần, nước ngoài…", "Công việc liên quan tới chuyển hàng và chuyển tiền trong bưu điện"]', TRUE),
-    ('Giáo viên công nghệ thông tin', 'SIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên CNTT xây dựng chương trình, bố trí lịch học và thực hiện đào tạo về máy tính và CNTT cho người dùng không chuyên.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến CNTT. Ví dụ: lập trình, phần cứng...", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Xác định nhu cầu đào tạo về CNTT và yêu cầu cụ thể của các cá nhân và tổ chức", "Chuẩn bị và phát triển tài liệu học tập và các tài liệu phụ trợ như sổ tay, phương tiện nghe nhìn, mô hình và các tư liệu tham khảo khác", "Thiết kế, điều phối. xếp lịch và thực hiện đào tạo các chương trình cho cá nhân và nhóm, hỗ trợ các hội thảo, trình diễn và hội nghị", "Thực hiện đánh gia thường xuyên và tổng kết chất lượng và hiệu quả đào tạo, điều chỉnh chương trình đào tạo", "Tìm hiểu, nghiên cứu và đánh giá các tư liệu bổ sung để có được hiểu biết rộng hơn về nội dung chuyên môn", "Cập nhật các phiên bản phần mềm mới, các tiến bộ về CNTT, biên soạn tài liệu hướng dẫn người dùng và các hướng dẫn khác"]', '["Các trường trung cấp", "Các trường trung học", "Các trung tâm đào tạo tin học", "Các bộ phận đào tạo của doanh nghiệp"]', TRUE),
-    ('Nhà thiết kế đồ họa và truyền thông đa phương tiện', 'ARE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà Thiết kế đồ họa và truyền thông đa phương tiện kết hợp thiết kế và những kiến thức kỹ thuật để nghiên cứu, phân tích, đánh giá, thiết kế, lập trình và sửa đổi các trang web và các ứng dụng cùng sử dụng các ký tự văn bản, đồ hoạ, sự chuyển động, hình ảnh, âm thanh và hiển thị hình ảnh và các phương tiện truyền thông tương tác khác.', '["Truyền thông kĩ thuật số", "Thiết kế", "Hiệu ứng hình ảnh", "Đồ họa chuyển động", "Hoạt họa", "Phát triển sản xuất", "Hỗ trợ thiết kế bằng vi tính", "Thiết kế đồ họa", "Thiết kế trang web", "Công nghệ xuất bản điện tử (sách, báo, video, nhạc)"]', '["Phân tích, thiết kế và phát triển các trang internet có áp dụng một hỗn hợp của nghệ thuật và sáng tạo với việc lập trình phần mềm và các ngôn ngữ chữ viết và giao diện với môi trường hoạt động", "Thiết kế và phát triển chuyển động, các hình ảnh, sự trình diễn, trò chơi, âm thanh và đoạn phim video kỹ thuật số và các ứng dụng Internet sử dụng phần mềm đa phương tiện, các công cụ và tiện ích, đồ họa có tính tương tác và ngôn ngữ lập trình", "Cùng với các nhà chuyên gia về mạng thực hiện các vấn đề liên quan tới trang web, như là an ninh và việc kết nối tới máy chủ của các trang web, để kiểm soát được an ninh mạng internet và các máy chủ, phân bổ không gian, quyền truy cập của người sử dụng, tính liên tục, sao lưu trang web và lập kế hoạch khôi phục sự cố", "Thiết kế, phát triển và kết hợp mã máy tính với các dữ liệu đầu vào chuyên dụng, như các file hình ảnh, âm thanh và ngôn ngữ lập trình, để sản xuất, duy tu và hỗ trợ các trang web", "Hỗ trợ trong việc phân tích, xác định và phát triển các chiến lược internet, các phương pháp sử dụng web và các kế hoạch phát triển"]', '["Các hãng phim", "Các đài truyền hình", "Các cơ quan quảng cáo", "Nhà sản xuất video", "Nhà hát và các buổi hòa nhạc trực tiếp", "Các công ty tổ chức sự kiện"]', TRUE),
-    ('Nhà quản trị cơ sở dữ liệu và mạng máy tính', 'ECI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Điều kiện làm việc', 'Quản trị cơ sở dữ liệu và mạng máy tính thiết kế, xây dựng, kiểm soát, hỗ trợ các hệ thống công nghệ thông tin để đảm bảo vận hành và an toàn, bao gồm cả dữ liệu, phần cứng, phần mềm, mạng và hệ điều hành', '["Mạng máy tính", "An ninh mạng", "CSDL", "Quản trị dữ liệu"]', '["Thiết kế và phát triển kiến trúc CSDL, cấu trúc dữ liệu, từ điển và quy ước về dữ liệu cho các dự án hệ thống thông tin", "Thiết kê, xây dựng, điều chỉnh, tích hợp và thử nghiệm các hệ CSDL", "Xây dựng và triển khai chính sách quản lý, tài liệu, chuẩn và mô hình về dữ liệu", "Duy trì và quản lý mạng máy tính và các môi trường máy tính khác", "Phân tích phát triển, diễn giải và đánh giá kiến trúc, mô hình dữ liệu và sơ đồ của các hệ phức tạp trong thiết kế, triển khai, cấu hình và tích hợp các hệ thống máy tính"]', '["Các công ty dữ liệu", "Các bộ phận quản trị mạng và dữ liệu của các công ty", "Các ngân hàng", "Các công ty viễn thông lớn"]', TRUE),
-    ('Kỹ thuật viên công nghệ thông tin', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Kỹ thuật viên vận hành công nghệ thông tin (CNTT) và truyền thông hỗ trợ việc xử lý, vận hành và quản lý thông tin và hệ thống kỹ thuật truyền thông hàng ngày, bao gồm các mạng LAN và WAN, và các phần cứng, phần mềm và các thiết bị máy tính liên quan nhằm đảm bảo việc vận hành tốt nhất và xác định các vấn đề phát sinh.', '["Sử dụng phàn mềm", "Lắp đặt và sửa chữa phần cứng", "Kỹ thuật lập trình"]', '["Vận hành và giám sát các thiết bị ngoại vi và các thiết bị máy tính liên quan", "Nhập lệnh, sử dụng thiết bị đầu cuối máy tính, và kích hoạt bảng điều khiển máy tính và các thiết bị ngoại vi để tích hợp và vận hành thiết bị", "Giám sát hệ thống tìm lỗi của thiết bị hoặc lỗi vận hành", "Thông báo cho giám sát viên hoặc kỹ thuật viên bảo dưỡng các trục trặc của thiết bị", "Giải quyết các thông báo lỗi chương trình bằng cách tìm và sửa các vấn đề, thông báo lỗi cho các kỹ thuật viên khác hoặc kết thúc chương trình", "Đọc các hướng dẫn thiết lập để xác định những thiết bị được sử dụng, yêu cầu sử dụng, các tài liệu như các đĩa và sách hướng dẫn và thiết lập các quản lý", "Sửa chữa, khôi phục, tách biệt và sắp xếp các chương trình đầu ra theo yêu cầu, và gửi dữ liệu đến những người sử dụng cụ thể", "Cài đặt các thiết bị ngoại vi, như máy in, với các vật liệu được chọn để chạy vận hành, hoặc giám sát việc cài đặt các thiết bị ngoại vi do người vận hành thiết bị ngoại vi thực hiện"]', '["Các doanh nghiệp", "Các nhà trường", "Các cơ quan nhà nước"]', TRUE),
-    ('Thủ quỹ', 'CE', 'Phân tích - Logic', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Điều kiện làm việc', 'Thủ quỹ là người kiểm soát toàn bộ hoạt động thu chi phát sinh trong doanh nghiệp như kiểm tra phiếu Thu, phiếu Chi, ký xác nhận, giao các liên, tạm ứng, … Thủ quỹ quản lý, lưu trữ toàn bộ giấy tờ liên quan khác trong quá trình này', '["Thủ quỹ tiền mặt"]', '["Thực hiện việc kiểm tra lần cuối về tính hợp pháp và hợp lý của chứng từ trước khi xuất, nhập tiền khỏi quỹ", "Kiểm tra, phân loại, sắp xếp tiền mặt để nhận biết, xuất nhập tiền dễ dàng", "Thực hiện việc thanh toán tiền mặt hàng ngày theo quy trình thanh toán của đơn vị", "Thực hiện kiểm kê đối chiếu quỹ thường kỳ với kế toán tổng hợp", "Quản lý toàn bộ tiền mặt trong két sắt", "Lưu trữ chứng từ thu chi tiền", "Thực hiện các công việc khác được phân công"]', '["Các doanh nghiệp trong nước, có vốn đầu tư nước ngoài", "Các cơ quan Nhà nước", "Hành nghề độc lập"]', TRUE),
-    ('Họa sĩ truyện tranh, biếm hoạ', 'ASR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Năng lực làm việc với con người', 'Hình học - màu sắc - thiết kế', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Họa sĩ biếm họa, truyện tranh là người nghệ sĩ sử dụng khả năng của mình để vẽ, cụ thể hóa, sử dụng màu sắc và thiết kế để lột tả hành vi con người, sự kiện hay một vấn đề và trình bày một cách hài hước hoặc gợi mở suy nghĩ.', '["Biếm họa tâm lí", "Biếm họa chính trị", "Biếm họa về bản tính con người", "Tranh châm biếm", "Đồ họa hoạt hình"]', '["Thu thập thông tin về các sự kiện trong lịch sử hoặc trong hiện tại, các vấn đề đang gây tranh cãi, các vấn đề chính trị và triết học", "Biến quan sát thành tranh vẽ hài hước, châm biếm hoặc gợi mở suy nghĩ", "Tranh có thể có hoặc không có chú thích", "Tạo ra một phong cách hoặc một tập hợp các nhân vật", "Sử dụng thành thạo công cụ đa phương tiện (ví dụ: bản vẽ bao gồm các đường thẳng và cong riêng biệt đặt trên nền)", "Làm việc với các nhà khoa học xã hội, lịch sử, nghệ thuật, nhà in, biên tập viên tạp chí… để tạo ra và sản xuất tranh biếm họa, truyện tranh"]', '["Tạp chí", "Các tờ báo", "Cơ quan quảng cáo", "Làm họa sĩ minh họa hoặc họa sĩ truyện tranh cho các nhà xuất bản", "Xưởng hoạt hình trong ngành sản xuất phim"]', TRUE),
-    ('Kĩ thuật viên in ấn', 'RC', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên in ấn tiến hành nghiên cứu, phát triển, thực hiện và giám sát qui trình in ấn tốt hơn, kinh tế hơn để sử dụng trong ngành công nghiệp in ấn.', '["Công nghệ vật liệu in", "Công nghệ bao bì đóng gói: các kĩ thuật in bao bì đóng gói", "Kĩ thuật sau in", "Kĩ thuật trước in"]', '["Thực hiện các qui trình in ấn khác nhau như in ốp-xét, in cán, in lưới…", "Nghiên cứu sử dụng các thiết bị điện tử và từ tính trong quí trình in ấn, ví dụ như in từ tính, in bằng âm thanh nổi, bố cục ảnh, khắc laze, in dầu, in 3D…", "Phát triển qui trình in chính xác, nhanh chóng và tiết kiệm để phục vụ mục đích in ấn khác nhau", "Thử nghiệm các loại mực giấy và máy móc khác nhau để cải thiện các ấn phẩm cuối cùng", "Giám sát qui trình in ấn"]', '["Các xưởng in", "Tòa soạn báo và tạp chí", "Nhà xuất bản"]', TRUE),
-    ('Kĩ thuật viên thuộc da, chuyên gia vật liệu da', 'RCA', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên thuộc da sử dụng các qui trình khác nhau để sản xuất da thuộc phù hợp với tiêu chuẩn đã được qui định. Kĩ thuật viên thuộc da là chuyên gia trong bảo quản và sấy khô để làm da thuộc tốt hơn. Các hóa chất như muối, thuốc nhuộm, dầu và các hợp chất crom khác được sử dụng trong ngành công nghiệp thuộc da được phân tích để xác định đặc tính của da. Kĩ thuật viên thuộc da còn là chuyên gia trong việc lập kế hoạch, thiết kế, lắp đặt thiết bị, máy móc mới và có chuyên môn để nghiên cứu dầu, thuốc nhuộm, mạ crom, thuộc da và sản phẩm được sử dụng trong công nghiệp sản xuất da, hàng hoá thể thao, da may mặc và các loại hình tương tự như vậy.', '["Thiết kế và sản xuất giày dép da", "Thiết kế và sản xuất đồ vật bằng da", "Thiết kế và sản xuất đồ may mặc bằng da"]', '["Chế biến các loại da thành phẩm", "Kiểm tra da và những khiếm khuyết trong cấu trúc da", "Tổ chức, quản lí sản xuất da và các nghiên cứu về máy móc sử dụng trong sản xuất da", "Kiểm soát chất lượng, tiếp thị và bán sản phẩm da", "Áp dụng các qui trình khoa học và kĩ thuật để chế biến da và thuộc da", "Giám sát việc sử dụng các hóa chất khác nhau trong chế biến da"]', '["Các công ti sản xuất giày dép, may mặc và phụ kiện", "Nhà máy thuộc da và các công ti hóa da, hóa chất"]', TRUE),
-    ('Kĩ thuật viên vẽ kĩ thuật', 'RCA', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên vẽ kĩ thuật chuẩn bị các bản vẽ kĩ thuật, bản đồ và các bản minh họa từ các bản phác thảo, các số đo và các số liệu khác và các bản thảo và bản vẽ trên các bản in. Họ cũng sao chép hoặc phóng to bản vẽ để chuẩn bị cho việc in ấn.', '["Nhà phác thảo kĩ thuật/ dân sự", "Nhà phác thảo kiến trúc", "Nhà phác thảo bản đồ", "Nhà thiết kế và phác thảo kĩ thuật số"]', '["Chuẩn bị và sửa lại các bản vẽ từ các bản phác thảo và các chi tiết kĩ thuật được chuẩn bị bởi kĩ sư, nhà thiết kế để sản xuất, lắp đặt và lắp ráp máy móc, thiết bị hoặc để xây dựng, sửa đổi, bảo dưỡng và sửa chữa các công trình xây dựng và các dự án kĩ thuật kiến trúc và kĩ thuật dân dụng khác", "Vẽ trên máy tính để tạo, thay đổi và in ra các bản cứng và biểu diễn bằng số liệu các bản phác thảo", "Vận hành thiết bị bảng biểu số hóa và các thiết bị khác để chuyển bản cứng thành hình thức số hóa", "Sử dụng các dụng cụ đo ba chiều để lấy số liệu đo vẽ địa hình bằng phương pháp tương tự hoặc phương pháp số hóa và sử dụng những số liệu đó để chuẩn bị và xem xét lại phép đo vẽ địa hình, thủy văn học, thực tiễn và các bản đồ khác", "Chuẩn bị và xem xét lại các tranh minh họa cho các công việc liên quan, sách tham khảo và sách kĩ thuật liên quan tới lắp đặt, vận hành, bảo dưỡng và sửa chữa máy móc và thiết bị hàng hóa khác"]', '["Trong các ngành công nghiệp liên quan đến xây dựng, bản đồ học, kĩ thuật, kiến trúc và khảo sát"]', TRUE),
-    ('Kĩ thuật viên bao bì', 'RC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên bao bì lập kế hoạch, triển khai và hướng dẫn kĩ thuật trong các hoạt động liên quan đến việc thiết kế, phát triển và sản xuất các loại bao bì bảo vệ, bảo quản, vận chuyển, trang trí và công nghệ đóng gói. Sản phẩm cần được bao gói, đóng hộp, đóng chai, đóng thùng, dán nhãn trước khi đưa ra thị trường tiêu thụ. Ngành bao bì sử dụng giấy, bìa, thủy tinh, nhựa, nhôm và nhiều vật liệu khác để sản xuất hộp, gói, túi, bình, ống, thùng… làm bao bì nhãn mác cho sản phẩm hàng hóa khác.', '["Thiết kế bao bì sản phẩm", "Thiết kế đồ họa bao bì", "Kĩ thuật sản xuất bao bì", "Vật liệu bao bì", "Kĩ thuật in", "Đóng gói và ổn định sản phẩm", "Quản lí chất lượng sản phẩm bao bì", "Bao bì đóng gói trong các ngành đặc thù (như hàng tiêu dùng, hàng xa xỉ, thực phẩm, mĩ phẩm và chăm sóc sức khỏe, quà tặng)"]', '["Phân tích các bản vẽ và thông số kĩ thuật của sản phẩm để xác định các đặc tính vật lí và hóa học, các yêu cầu đặc thù về vận chuyển, bảo quản, thẩm mĩ, an toàn, dán nhãn và loại vật liệu cần thiết cho việc đóng gói", "Thiết kế bao bì và qui trình đóng gói phù hợp", "Lập kế hoạch, triển khai và giám sát hoạt động sản xuất bao bì, kiểm soát chất lượng sản phẩm bao bì", "Giám sát việc xử lí phụ phẩm và rác thải", "Tư vấn cho doanh nghiệp và khách hàng về qui trình, vật liệu và thiết bị bao gói, dán nhãn, niêm phong và chằng buộc"]', '["Doanh nghiệp trong các ngành đòi hỏi sản phẩm phải có bao bì như dược phẩm, thực phẩm, mĩ phẩm, hóa chất vệ sinh, công nghiệp chế tạo…", "Các cơ sở, doanh nghiệp sản xuất bao bì", "Các cơ sở, doanh nghiệp phân phối, bán lẻ", "Các phòng thí nghiệm kiểm định chất lượng bao bì"]', TRUE),
-    ('Kĩ thuật viên ngành giấy', 'RC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên giấy phụ trách công nghệ kĩ thuật trong quá trình sản xuất giấy và sản phẩm từ giấy. Quá trình này bao gồm các công việc tập kết nguyên liệu, làm bột giấy, nghiền, xeo, ép, sấy, cán và cuộn để cuối cùng ra sản phẩm giấy, cũng như tái chế giấy và sản phẩm từ giấy.', '["Các công đoạn sản xuất giấy và bìa", "Nghiên cứu và phát triển giấy từ nguyên liệu mới, sản phẩm mới từ giấy", "Tái chế giấy"]', '["Xác định và kiểm tra nguyên liệu sản xuất giấy (như bã mía, tre, nứa, bạch đàn, keo, giấy bìa cũ…)", "Tham gia lắp đặt dây chuyển máy móc thiết bị sản xuất giấy hoặc sản phẩm từ giấy", "Kiểm tra mẫu để đảm bảo định lượng chính xác của sản phẩm giấy", "Giám sát và điều chỉnh quá trình sản xuất nếu cần", "Kiểm soát chất lượng sản phẩm", "Giám sát việc xử lí phụ phẩm và rác thải", "Nghiên cứu cải tiến công nghệ sản xuất giấy không ảnh hưởng tới môi trường", "Đưa nguyên liệu vào dây chuyền sản xuất bột giấy, giấy hoặc sản phẩm từ giấy đúng chủng loại và định lượng", "Vận hành máy móc thiết bị sản xuất bột giấy, giấy hoặc sản phẩm từ giấy theo qui trình đã đề ra"]', '["Các cơ sở, doanh nghiệp sản xuất giấy", "Các cơ sở, doanh nghiệp tái chế giấy", "Các cơ sở sản xuất giấy thủ công", "Các cơ sở, doanh nghiệp sản xuất bao bì", "Các doanh nghiệp in"]', TRUE),
-    ('Kĩ thuật viên may mặc và công nghệ có liên quan', 'RC', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Kĩ thuật viên may mặc và công nghệ có liên quan (sợi, dệt, nhuộm…) phụ trách công nghệ kĩ thuật trong quá trình sản xuất hàng vải sợi, dệt và may mặc đại trà. Họ cũng có thể chuyên về hóa chất (thuốc nhuộm, chất tẩy, phụ gia…) hay máy móc thiết bị sản xuất hàng dệt may.', '["Công nghệ sợi", "Công nghệ dệt thoi", "Công nghệ dệt kim", "Công nghệ may", "Công nghệ sản xuất tất và hàng dệt kim", "Công nghệ giặt là", "Máy móc thiết bị dệt may"]', '["Làm rập, sơ đồ theo tài liệu kĩ thuật từ khách hàng", "Viết qui trình công đoạn sản xuất sản phẩm", "Làm tài liệu kĩ thuật, thiết kế và cân bằng chuyền", "Lập kế hoạch sản uất và theo dõi tiến độ", "Đề xuất và kiểm tra định mức nguyên phụ liệu, định mức công đoạn", "Kiểm soát chất lượng sản phẩm", "Giám sát việc xử lí phụ phẩm và rác thải", "Cải tiến thao tác, qui trình, máy móc thiết bị sản xuất", "Xây dựng, ban hành qui trình, tài liệu tiêu chuẩn cho các bộ phận sợi, dệt - nhuộm, phụ liệu và sản phẩm dệt - nhuộm", "Kiểm tra, đánh giá chất lượng các dòng nguyên phụ liệu mới", "Kiểm tra, so mẫu sợi, vải dệt - nhuộm", "Khắc phục lỗi, cho ra thành phẩm đúng với mẫu gốc", "Kiểm soát chất lượng và an toàn sản phẩm từ khâu thiết kế đến khi sản phẩm lên kệ"]', '["Các doanh nghiệp sản xuất sợi, sản phẩm dệt và may mặc", "Các doanh nghiệp cung cấp nguyên phụ liệu, hóa chất và máy móc thiết bị cho ngành dệt may", "Các phòng thí nghiệm, đơn vị chứng nhận sản phẩm dệt may"]', TRUE),
-    ('Kĩ thuật viên da giày', 'RC', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên da giày phụ trách công nghệ kĩ thuật trong quá trình sản xuất các sản phẩm da giày, từ thuộc da và da lông thú, đến sản xuất thành phẩm cuối cùng như giày da, giày thể thao, túi xách và phụ kiện bằng nguyên liệu da thật và giả da. Họ cũng có thể chuyên về hóa chất (dầu, thuốc nhuộm, phụ gia…) hay máy móc thiết bị sản xuất nguyên liệu và thành phẩm da giày', '["Thiết kế và sản xuất giày dép da", "Thiết kế và sản xuất đồ vật bằng da", "Thiết kế và sản xuất đồ may mặc và phụ kiện bằng da", "Thiết kế và sản xuất va li, túi xách bằng da"]', '["Kiểm tra và phân loại nguyên liệu da theo chủng loại, màu sắc, kết cấu, kích thước, mức độ khiếm khuyết trước khi đưa vào thuộc", "Triển khai thuộc và chế biến da bằng cách hồi ẩm, làm sạch, làm mềm, tẩy lông, thuộc và xử lí với muối, hóa chất và các chiết xuất từ thiên nhiên", "Nhuộm, làm khô và hoàn thiện bề mặt để che khuyết điểm và phủ chống ẩm", "Kiểm soát chất lượng sản phẩm", "Giám sát việc xử lí phụ phẩm và rác thải", "Nghiên cứu, thử nghiệm, cải tiến, áp dụng các hóa chất, máy móc và qui trình công nghệ trong sản xuất da", "Đọc, hiểu kĩ tài liệu kĩ thuật, nghiên cứu mẫu giày, túi xách, phụ kiện và yêu cầu của khách hàng", "Tham gia thiết kế và sản xuất mẫu sản phẩm", "So sánh thông số, qui cách giữa tài liệu kĩ thuật và mẫu để thiết kế ra một bộ rập chính xác ngay từ đầu", "Kiểm tra, thiết kế rập và nhảy size theo đúng yêu cầu", "Phụ trách kĩ thuật tại xưởng", "Điều hành sản xuất, đảm bảo tiến độ và kĩ thuật", "Đánh giá kĩ năng công đoạn", "Giám sát sản xuất để đề ra các giải pháp nhằm giải quyết những vấn đề chất lượng và hiệu quả sản xuất trên chuyền", "Kiểm soát chất lượng sản phẩm từ khâu cắt đến khâu hoàn thiện sản phẩm"]', '["Các cơ sở, doanh nghiệp chế biến và thuộc da", "Các cơ sở, doanh nghiệp sản xuất giày dép và sản phẩm da", "Các doanh nghiệp cung cấp nguyên phụ liệu, hóa chất và máy móc thiết bị cho ngành da giày", "Các phòng thí nghiệm, đơn vị chứng nhận sản phẩm da giày"]', TRUE),
-    ('Thợ thẩm mĩ (Làm đẹp)', 'AES', 'Hình học - màu sắc - thiết kế', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Thợ thẩm mĩ, còn gọi là thợ làm đẹp, cắt và tạo dáng tóc, râu, chăm sóc sắc đẹp, sử dụng mĩ phẩm và trang điểm, và thực hiện các dịch vụ và liệu pháp chăm sóc khác cho khách hàng để cải thiện ngoại hình của họ.', '["Chăm sóc da", "Massage mặt và toàn thân", "Chăm sóc và trang điểm tóc", "Làm móng", "Các liệu pháp đặc biệt trong chăm sóc sắc đẹp (vật lí trị liệu, cổ truyền, Nhật Bản, Hàn Quốc, Trung Quốc…)", "Trang điểm", "Trang điểm và hóa trang cho các đối tượng/ dịp đặc thù (đám cưới, chụp ảnh, đám tiệc, điện ảnh, sân khấu, truyền hình…)"]', '["Cắt, gội, nhuộm, uốn, duỗi và tạo kiểu tóc", "Chăm sóc và điều trị tóc và da đầu", "Làm tóc giả theo yêu cầu của khách hàng", "Làm sạch và chăm sóc da bằng cách sử dụng các loại kem, sữa và các sản phẩm liên quan đến khuôn mặt và các bộ phận của cơ thể", "Massage mặt và cơ thể", "Hỗ trợ bác sĩ để làm sạch, chuẩn bị, làm dịu da và cơ thể trong các trị liệu thẩm mĩ chuyên sâu như laser, lăn kim, trị liệu ánh sáng…", "Trang điểm cho các khách hàng", "Trang điểm và hóa trang cho các diễn viên, nghệ sĩ biểu diễn, người tham gia chương trình truyền hình", "Làm sạch, định hình, chăm sóc, đánh bóng và trang điểm móng tay, móng chân", "điều trị các bệnh đơn giản của bàn chân con người như nứt nẻ, bị chai hay biến dạng ngón chân, móng tay", "Theo dõi sức khỏe và hỗ trợ khách hàng tắm hơi, jacuzzi", "Tấy lông cho khách hàng bằng sáp, đường và các kĩ thuật tẩy lông phù hợp", "Tư vấn khách hàng về chế độ chăm sóc, dinh dưỡng và thể dục để hỗ trợ giảm và giữ cân"]', '["Hành nghề tự do hoặc tự mở cơ sở làm đẹp da, tóc, móng, trang điểm", "Mở kênh dạy chăm sóc sắc đẹp và trang điểm riêng trên mạng", "Các thẩm mĩ viện, bộ phận thẩm mĩ trong khách sạn và khu nghỉ dưỡng", "Các hãng mĩ phẩm", "Ngành công nghiệp giải trí (truyền hình, phim, sân khấu)", "Các trung tâm chăm sóc sức khỏe và vật lí trị liệu"]', TRUE),
-    ('Kiến trúc sư xây dựng', 'AIR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kiến trúc sư xây dựng thiết kế nhà ở, nhà thương mại, các công trình xây dựng dân dụng và công nghiệp; lập kế hoạch và giám sát thi công, bảo trì, mở rộng và cải tạo về mặt thẩm mĩ và công năng của các công trình đó. Họ cũng có thể tham gia qui hoạch đô thị, cảnh quan và các hệ thống giao thông.', '["Thiết kế kiến trúc", "Thiết kế nội ngoại thất công trình xây dựng", "Thiết kế qui hoạch đô thị", "Thiết kế cảnh quan"]', '["Khảo sát mặt bằng, thảo luận với khách hàng, lãnh đạo và những người liên quan để xác định loại công trình, phong cách, kích thước, nhu cầu sử dụng và các khía cạnh của công trình hiện tại hoặc tương lai", "Chuẩn bị và trình bày các phương án đề xuất thiết kế, vật liệu và thời gian thi công", "thảo luận và tư vấn khách hàng chọn phương án", "Thiết kế công trình, chuẩn bị bản phác thảo, bản vẽ chi tiết, sơ đồ mặt bằng, cân nhắc các yếu tố kết cấu, công năng, thẩm mĩ, nội ngoại thất và trang thiết bị để hoàn thiện thiết kế cuối cùng", "Chuẩn bị các thông số, kế hoạch xây dựng và văn bản hợp đồng để huy động thợ hoặc mời thầu giúp khách hàng", "Xử lí các giấy tờ thủ tục cần thiết để đảm bảo dự án khả thi về mặt phong cách, cấu trúc, chi phí, thời gian, pháp lí", "Giám sát thi công phù hợp với bản vẽ, thông số kĩ thuật và chất lượng, các tiêu chuẩn, hướng dẫn và qui định", "Phối hợp với kĩ sư xây dựng, nhà thầu, đội trưởng, thợ chính và thợ phụ để phát hiện và giải quyết các vấn đề phát sinh", "Điều phối công việc giữa nhiều nhà thầu khác nhau", "Qui hoạch phát triển các khu đô thị như bố trí mặt bằng, đường giao thông, công viên và các tiện ích chung", "Cải tiến và phát triển các phương pháp thiết kế kiến trúc"]', '["Hành nghề tự do hoặc tự mở studio, công ty riêng", "Các doanh nghiệp thiết kế kiến trúc, thiết kế nội thất", "Các doanh nghiệp tư vấn thiết kế, giám sát, thi công xây dựng", "Cơ quan nhà nước về quản lí đô thị, qui hoạch đô thị", "Các viện nghiên cứu kiến trúc, thiết kế, qui hoạch kiến trúc và qui hoạch đô thị", "Các trường dạy về thiết kế kiến trúc xây dựng, qui hoạch đô thị"]', TRUE),
-    ('Kiến trúc sư cảnh quan/ nhà thiết kế cảnh quan', 'AIR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kiến trúc sư cảnh quan, còn gọi là nhà thiết kế cảnh quan, qui hoạch, thiết kế, tổ chức thi công, quản lí, bảo dưỡng và phục hồi cảnh quan, đường nội bộ và không gian ngoài trời của các công trình nhà ở, văn phòng, nhà thương mại và công nghiệp, vườn hoa, công viên, khu du lịch, nghỉ dưỡng và giải trí. Họ đảm bảo rằng khu đất có công trình trông đẹp mắt và thân thiện với môi trường.', '["Thiết kế cảnh quan, vườn hoa, công viên", "Kiến trúc cảnh quan", "Thiết kế khu du lịch, nghỉ dưỡng, khu vực nghỉ ngơi giải trí"]', '["Khảo sát tổng thể, tìm hiểu nhu cầu của khách hàng và đưa ra đề xuất về phong cách và các khía cạnh khác của thiết kế tổng quan", "Làm việc với các kiến trúc sư, kĩ sư xây dựng, người làm vườn, chuyên gia quản lí nước và môi trường để thu thập thông tin về công trình, môi trường, đất, nước, đường di chuyển của mặt trời và bóng râm", "Quyết định cần trồng hoặc giữ loại thực vật nào", "Chuẩn bị bản vẽ tổng quan và chi tiết để bố trí địa điểm xây dựng, vườn hoa, mặt nước, đường đi bộ và chạy xe", "Chuẩn bị thông số kĩ thuật, dự toán và danh sách các tài liệu yêu cầu", "Giám sát thi công cảnh quan", "Quản lí thường xuyên cảnh quan khu vực"]', '["Hành nghề tự do hoặc tự mở studio, công ty riêng", "Các doanh nghiệp thiết kế kiến trúc, tư vấn thiết kế, giám sát, thi công xây dựng", "Các doanh nghiệp thiết kế cảnh quan", "Các công ty công viên cây xanh, các khu danh thắng, di tích, khu du lịch, khu đô thị", "Các doanh nghiệp, đơn vị tư vấn qui hoạch, thiết kế, thi công xây dựng và phát triển đô thị, thi công xây dựng cảnh quan", "Các cơ quan quản lí nhà nước về qui hoạch, xây dựng và quản lí đô thị, về cảnh quan và môi trường", "Các cơ quan nghiên cứu, đào tạo và chuyển giao công nghệ về kiến trúc cảnh quan trong và ngoài nước"]', TRUE),
-    ('Nhà thiết kế sản phẩm/ Mỹ thuật công nghiệp', 'AER', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế sản phẩm, còn gọi là nhà thiết kế Mỹ thuật công nghiệp, thiết kế hình thức của các sản phẩm, chuẩn bị bản vẽ và các thông số của sản phẩm để đưa vào sản xuất. Trong khi các kĩ sư công nghiệp thiết kế kết cấu, chức năng hoạt động của máy móc, sản phẩm thì nhà thiết kế Mỹ thuật công nghiệp thiết kế kiểu dáng hình thức của máy móc, sản phẩm sao cho không chỉ đẹp mà còn hiệu quả và kinh tế.', '["Thiết kế trên máy tính", "Thiết kế máy móc thiết bị công nghiệp", "Thiết kế chuyên ngành cụ thể (như ô tô, nội thất, sản phẩm dệt may, thiết bị gia dụng)", "Thiết kế bao bì"]', '["Thảo luận với khách hàng và những người liên quan để xác định yêu cầu và mục đích của sản phẩm", "Hình thành ý tưởng thiết kế sản phẩm", "Cân đối yếu tố thẩm mĩ với các yêu cầu kĩ thuật, tính năng, sinh thái và sản xuất", "Chuẩn bị bản phác thảo, sơ đồ, minh họa, kế hoạch, mẫu và mô hình để thể hiện ý tưởng thiết kế", "Thảo luận và thống nhất phương án thiết kế với khách hàng, lãnh đạo, nhân viên bán hàng và nhân viên sản xuất", "Xác định, lựa chọn và đề xuất chất liệu đảm bảo tính năng và thẩm mĩ, phương pháp sản xuất và hoàn thiện để đưa sản phẩm vào sản xuất", "Thiết kế chi tiết và viết hướng dẫn cho thiết kế được chọn để sản xuất", "Làm mô hình và sản phẩm mẫu", "Giám sát quá trình chuẩn bị vật liệu công cụ và sản xuất sản phẩm"]', '["Hầu như tất cả các doanh nghiệp sản xuất, chế tạo máy móc, sản phẩm đều cần nhà thiết kế Mỹ thuật công nghiệp", "Các công ty thời trang", "Các doanh nghiệp sản xuất hàng tiêu dùng", "Các đơn vị tổ chức trình diễn thời trang, sản phẩm"]', TRUE),
-    ('Nhà thiết kế thời trang', 'AER', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế thời trang thiết kế áo quần, giày dép, phụ kiện và tạo ra những bộ sưu tập và dòng sản phẩm thời trang. Họ vẽ phác thảo, lựa chọn chất liệu, hoa văn, và chỉ dẫn cách sản xuất sản phẩm vừa thiết kế.', '["Thiết kế chuyên sâu theo nhóm sản phẩm cụ thể (như thời trang nữ/ nam/ trẻ em, đồ công sở, dạ hội, áo dài/ trang phục truyền thống, đồ thể thao, phụ kiện…)", "Thiết kế giày dép", "Thiết kế trang sức và kim hoàn", "Thiết kế trang phục da và đồ da", "Tiếp thị và bán hàng thời trang", "Truyền thông về thời trang"]', '["Thiết kế hàng may mặc theo xu hướng thời trang", "Phát triển dòng sản phẩm thời trang với màu sắc và chất liệu đặc trưng", "Dự các buổi trình diễn thời trang và xem đánh giá của các tạp chí nhằm thu thập thông tin về các xu hướng thời trang và sở thích của người tiêu dùng", "Thiết kế trang phục và phụ kiện cho các cá nhân, các nhà bán lẻ hoặc sân khấu, truyền hình, nhà sản xuất phim", "Vẽ mẫu cho các thiết kế và cắt theo mẫu", "Thử sản phẩm trên người mẫu và ma-nơ-canh, sau đó chỉnh sửa thiết kế để đạt được hiệu quả mong muốn", "Điều chỉnh ý tưởng thiết kế cho phù hợp với thị trường đại chúng", "Thảo luận ý tưởng thiết kế với nhân viên và người quản trị bán hàng hoặc khách hàng", "Định giá sản phẩm thiết kế"]', '["Hành nghề tự do hoặc mở studio, cửa hàng riêng", "Các doanh nghiệp thiết kế, sản xuất hàng dệt may, thời trang", "Các doanh nghiệp xuất nhập khẩu, phân phối hàng dệt may, thời trang", "Các đơn vị tổ chức trình diễn thời trang và xuất bản tạp chí thời trang", "Các nhà sản xuất phim và chương trình truyền hình", "Các nhà hát, đoàn nghệ thuật biểu diễn", "Các cơ quan quản lí nhà nước ngành dệt may", "Các viện, trung tâm nghiên cứu phát triển dệt may"]', TRUE),
-    ('Nhà trắc địa bản đồ', 'IRC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà trắc địa bản đồ sử dụng các phương pháp và kĩ thuật khảo sát để xác định vị trí chính xác của các phân vùng tự nhiên, phân vùng xây dựng, ranh giới đất, nước, trong lòng đất, xây dựng và chỉnh sửa bản đồ kĩ thuật số, đồ họa và ảnh.', '["Trắc địa bản đồ", "Trắc địa công trình", "Trắc địa mỏ", "Trắc địa biển", "Viễn thám", "Trắc địa ảnh", "Hệ thống thông tin địa lí", "Khảo sát và vẽ bản đồ", "Kĩ thuật công nghệ trắc địa"]', '["Khảo sát, đo đạc và mô tả bề mặt đất cho các mục đích khác nhau, như vẽ bản đồ và xác định ranh giới các khu đất", "Khảo sát thăm dò mỏ, phân tách các tầng trong lòng đất, đánh dấu vị trí chính xác của các phân tầng khác nhau và thiết lập biểu đồ, bản đồ để kiểm soát hướng và qui mô mỏ", "Khảo sát đáy biển, đáy sông hồ, phân tách các tầng dưới nước, đánh dấu vị trí chính xác của các phân tầng khác nhau và thiết lập biểu đồ, bản đồ để xác định các luồng lạch và luồng thông thuyền", "Tiến hành chụp ảnh trên không, viễn thám và khảo sát dữ liệu để xây dựng và sửa đổi bản đồ địa hình, các biểu đồ, bản đồ tiện ích và bản đồ chuyên biệt khác", "Nghiên cứu và tư vấn về kĩ thuật, thẩm mĩ và kinh tế trong việc sản xuất bản đồ"]', '["Cơ quan khí tượng thủy văn", "Cơ quan trắc địa, bản đồ", "Các doanh nghiệp, đơn vị thăm dò khảo sát dầu khí, khảo sát biển và công trình biển"]', TRUE),
-    ('Nhà thiết kế đồ họa và truyền thông đa phương tiện', 'ARE', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế đồ họa và truyền thông đa phương tiện thiết kế nội dung hình ảnh và âm thanh để truyền thông dưới dạng in ấn, phim, điện tử, kĩ thuật số và các phương tiện nghe nhìn khác. Họ tạo ra đồ họa, hiệu ứng đặc biệt, hình ảnh động và các hình ảnh khác để sử dụng trong trò chơi điện tử, phim ảnh, video, bản in và quảng cáo.', '["Thiết kế in ấn", "Thiết kế trang web", "Thiết kế quảng cáo", "Đồ họa video", "Hoạt họa", "Hiệu ứng đặc biệt", "Truyền thông kĩ thuật số", "Xuất bản điện tử (sách, báo, video, nhạc)"]', '["Thảo luận với khách hàng và những người liên quan để xác định và phân tích yêu cầu và mục tiêu truyền thông", "Hình thành ý tưởng thiết kế cho đối tượng cần truyền thông", "Chuẩn bị bản phác thảo, sơ đồ, minh họa và bản trình bày ý tưởng", "Thảo luận và thống nhất phương án thiết kế với khách hàng, lãnh đạo, nhân viên bán hàng và nhân viên sản xuất", "Thiết kế các đồ họa tĩnh và động để đáp ứng các yêu cầu về chức năng, thẩm mĩ và sáng tạo của khách hàng", "Tạo ra hình ảnh 2D và 3D để minh hoạt vật thể chuyển động hoặc quá trình diễn ra bằng các phần mềm máy tính", "Xác định, lựa chọn và đề xuất chất liệu đảm bảo tính năng và thẩm mĩ, phương tiện phát hành, chuyển giao và trình diễn", "Thiết kế chi tiết và viết hướng dẫn cho sản xuất", "Triển khai sản xuất hoặc giám sát sản xuất"]', '["Hành nghề tự do hoặc tự mở studio, công ti", "Các doanh nghiệp xuất bản, in, thiết kế ấn phẩm, quảng cáo", "Các doanh nghiệp truyền thông, tổ chức sự kiện", "Các doanh nghiệp sản xuất video, phim", "Các đài truyền hình", "Nhà hát và các buổi hòa nhạc trực tiếp"]', TRUE),
-    ('Nhà nhiếp ảnh', 'AR', 'Hình học - màu sắc - thiết kế', 'Tương tác với người khác', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Nhà nhiếp ảnh sử dụng khả năng tư duy, sáng tạo của bản thân và các kĩ thuật của máy ảnh để chụp ảnh. Họ có thể chụp hình ảnh tĩnh và động, sử dụng máy ảnh, máy quay video và các thiết bị khác để ghi lại và chỉnh sửa cả hình ảnh và âm thanh.', '["Nhiếp ảnh thời trang", "Nhiếp ảnh công nghiệp", "Nhiếp ảnh y tế", "Nhiếp ảnh báo chí", "Nhiếp ảnh sản phẩm", "Nhiếp ảnh du lịch, thiên nhiên hoang dã"]', '["Chụp ảnh phục vụ mục đích quảng cáo, nghệ thuật, thương mại, công nghiệp, khoa học", "Chụp ảnh minh họa cho tin tức và bài viết trên báo, tạp chí và các ấn phẩm khác", "Chụp ảnh một hay một nhóm người", "Bố trí và thực hiện ảnh động, video, chụp ảnh qua kính hiển vi và thiết bị chuyên dụng, kể cả chụp ảnh trên không"]', '["Hành nghề tự do hoặc mở studio, cửa hàng riêng", "Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện", "Báo và tạp chí", "Xưởng phim điện ảnh và truyền hình", "Các doanh nghiệp in ấn, xuất bản", "Các trung tâm nghiên cứu"]', TRUE),
-    ('Nhà thiết kế và trang trí nội thất', 'AE', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế và trang trí nội thất khảo sát mặt bằng, thiết kế nội thất và ngoại thất, đồ dùng và đồ trang trí nhà ở, nhà thương mại, công trình công cộng và công nghiệp để làm cho công trình đẹp, tiện nghi và thoải mái cho cuộc sống và công việc. Họ cũng phối hợp và tham gia xây dựng và hoàn thiện công trình. Họ cũng có thể thiết kế các sản phẩm đồ gỗ nội thất, đồ gia dụng và trang trí để sản xuất phục vụ tiêu dùng nội địa và xuất khẩu.', '["Thiết kế sản phẩm đồ gỗ nội thất, đồ gia dụng và phụ kiện", "Thiết kế nội ngoại thất gia dụng, văn phòng, tòa nhà thương mại, công trình công nghiệp", "Thiết kế sân khấu, điện ảnh"]', '["Khảo sát mặt bằng và tìm hiểu yêu cầu và sở thích của khách hàng", "Làm bản vẽ trang trí nội thất và ngoại thất cho nhà ở, công trình xây dựng, xe hơi, máy bay, tàu và những công trình khác", "Thiết kế và vẽ cảnh trang trí sân khấu, điện ảnh, truyền hình", "Phối hợp với nhà thầu để triển khai thi công và hoàn thiện phù hợp với bản vẽ, thông số kĩ thuật và chất lượng", "Sáng tạo và thực hiện các"]', '["Hành nghề tự do hoặc tự mở công ti", "Các doanh nghiệp, cơ sở sản xuất đồ gỗ, đồ gia dụng và trang trí nội ngoại thất", "Các doanh nghiệp thiết kế kiến trúc, tư vấn thiết kế, giám sát, xây dựng", "Khách sạn, khu nghỉ dưỡng, nhà khách", "Các doanh nghiệp sản xuất phim, chương trình truyền hình", "Nhà hát, đoàn kịch", "Đài truyền hình"]', TRUE),
-    ('Nhà thiết kế thủ công mĩ nghệ', 'ARE', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế thủ công mĩ nghệ thiết kế các sản phẩm thủ công mĩ nghệ để đảm bảo hài hòa các giá trị thẩm mĩ, văn hóa, công năng và phù hợp với các đối tượng khách hàng. Thủ công mĩ nghệ là một nét văn hóa. Mỗi nhóm dân tộc, mỗi địa phương đều có các nghề thủ công của mình. Sản phẩm thủ công mĩ nghệ đã xuất hiện từ lâu đời để phục vụ các mục đích truyền thống. Ngày nay, các doanh nghiệp và nhà nước mong muốn phát triển các sản phẩm thủ công mĩ nghệ vừa có nét truyền thống vừa phù hợp với đối tượng và nhu cầu sử dụng rộng rãi hơn.', '["Thiết kế chuyên sâu theo loại sản phẩm (như đồ dệt may, đồ gỗ, sơn mài, khảm trai, đồ đá, gốm sứ, thủy tinh)", "Kinh doanh tiếp thị sản phẩm thủ công mĩ nghệ"]', '["Xác định các sản phẩm tiêu dùng có thể thiết kế và sản xuất theo phương pháp thủ công mĩ nghệ", "Thiết kế sản phẩm thủ công mĩ nghệ có các tính năng mà nhiều đối tượng khách hàng có thể sử dụng", "Thiết kế lại hàng thủ công mĩ nghệ truyền thống để phù hợp hơn với các thị trường và khách hàng đa dạng hơn", "Giới thiệu các giá trị truyền thống và tính năng hiện đại để quảng bá mở rộng thị trường cho các mặt hàng thủ công mĩ nghệ", "Tổ chức các nghệ nhân thủ công mĩ nghệ thành các nhóm sản xuất hoặc hợp tác xã, hướng dẫn họ qui trình sản xuất các sản phẩm mẫu mới"]', '["Hành nghề tự do hoặc tự mở xưởng, cửa hàng, công ti", "Các cơ sở, doanh nghiệp sản xuất và mua bán hàng thủ công mĩ nghệ", "Các tổ chức trong nước và quốc tế về bảo tồn, phát triển nghề truyền thống", "Các cửa hàng bán sản phẩm thủ công mĩ nghệ, đồ lưu niệm"]', TRUE),
-    ('Nghệ sĩ Mỹ thuật', 'AR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Nghệ sĩ Mỹ thuật là người tạo ra các tác phẩm nghệ thuật thông qua các phương tiện khác nhau như màu vẽ, điêu khắc, nhiếp ảnh, sắp đặt vật thể… Nghệ sĩ Mỹ thuật có khả năng biến ý tưởng, suy nghĩ, thông điệp thành hình dạng cụ thể cho người khác thưởng thức.', '["Chuyên sâu theo loại hình Mỹ thuật (như hội họa, điêu khắc, nhiếp ảnh) hoặc kĩ thuật (như bột màu, màu nước, sơn dầu)"]', '["Sáng tác tác phẩm theo một loại hình Mỹ thuật cụ thể (như điêu khắc, hội họa, nhiếp ảnh), bằng các công cụ, vật liệu và phương tiện của loại hình Mỹ thuật đó", "Quan hệ với các đại lí và nhà kinh doanh tác phẩm nghệ thuật", "Tổ chức triển lãm tác phẩm"]', '["Hành nghề tự do", "Mở studio riêng", "Giảng dạy tại các trường Mỹ thuật, trung tâm văn hóa nghệ thuật", "Giảng dạy môn Mỹ thuật tại các trường phổ thông", "Dạy và hỗ trợ trẻ có nhu cầu đặc biệt tại trường khuyết tật"]', TRUE),
-    ('Nhà thiết kế quảng cáo', 'ARE', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Ngôn ngữ', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế quảng cáo đưa ra ý tưởng, vẽ và thiết kế nên các hình ảnh mang tính biểu tượng để truyền tải thông điệp trong quảng cáo truyền thông. Mục tiêu là quảng bá sản phẩm, dịch vụ và ý tưởng đến cho người xem. Các hình ảnh và cách trình bày trong các quảng cáo, các lô-gô, biểu tượng của doanh nghiệp và tổ chức là sản phẩm trí tuệ của nhà thiết kế quảng cáo.', '["Quảng cáo và minh hoạ", "Thiết kế thương hiệu", "Thiết kế đồ họa", "Thiết kế đồ họa hoạt hình", "Thiết kế sách và tạp chí", "Biếm họa", "Thiết lập và thiết kế triển lãm"]', '["Thảo luận với khách hàng để xác định và phân tích mục tiêu, yêu cầu, sản phẩm và ý tưởng quảng cáo", "Hình thành ý tưởng thiết kế", "Chuẩn bị các bản phác thảo, minh họa để thể hiện ý tưởng bằng cách vẽ tay hoặc sử dụng phần mềm trên máy tính", "Trình bày và thống nhất mẫu phác thảo với khách hàng", "Thiết kế chi tiết, chỉnh sửa và hoàn thiện theo yêu cầu của khách hàng", "Triển khai sản xuất hoặc giám sát sản xuất sản phẩm quảng cáo nếu cần"]', '["Hành nghề tự do hoặc tự mở cơ sở, studio", "Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện", "Các doanh nghiệp thiết kế đồ họa", "Các doanh nghiệp sản xuất video, phim", "Các nhà xuất bản, tờ báo, tạp chí, đài truyền hình", "Các nhà sản xuất và tập đoàn lớn"]', TRUE),
-    ('Nhà quay phim', 'EAS', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin; Tương tác với người khác', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Nhà quay phim là người ghi hình bộ phim, video, tác phẩm sân khấu, chương trình truyền hình và các sự kiện xã hội hay gia đình. Họ cũng cần đảm bảo rằng có sự phối hợp giữa các diễn viên và đội ngũ ghi hình. Các nhà quay phim là đạo diễn hình ảnh và đảm bảo rằng hành động được ghi lại chính xác.', '["Quay phim trên không", "Quay phim dưới nước", "Quay phim kĩ thuật số", "Quay phim tài liệu, điện ảnh, tác phẩm sân khấu, ca nhạc", "Quay phim báo chí truyền hình", "Quay phim sự kiện xã hội, gia đình"]', '["Bố trí, vận hành và giám sát hoạt động của máy quay, máy ảnh, phụ kiện và ánh sáng để ghi hình", "Chuẩn bị tình huống bấm máy để bắt đầu ghi hình", "Lựa chọn phim tư liệu (từ các phim dự trữ có sẵn với khả năng thay đổi độ sáng và màu sắc), và kiểm soát việc lựa chọn ống kính với độ dài tiêu cự, khẩu độ tiếp xúc và lấy nét cho phù hợp", "Tính toán các chủng loại, số lượng các thiết bị chiếu sáng và phụ kiện một cách cụ thể", "Chiếu sáng vị trí quay phim hoặc thiết lập vị trí quay phim với ánh sáng có sẵn, hoặc ánh sáng ban ngày", "Xây dựng kế hoạch sử dụng ánh sáng, gel, bộ lọc, tiếp xúc, độ dài tiêu cự, lấy nét, tỉ lệ khung hình...", "Đặt máy quay ở vị trí thích hợp liên quan đến các diễn viên/ đối tượng ghi hình, hành động và địa điểm", "Làm việc, trao đổi cụ thể với giám đốc sản xuất để đảm bảo đạt được các yếu tố về nghệ thuật", "Hướng dẫn cụ thể quá trình xử lí, in bộ phim và chuyển sang video (nếu cần)"]', '["Hành nghề tự do hoặc tự mở cơ sở, studio", "Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện, tổ chức biểu diễn", "Các doanh nghiệp sản xuất video, phim", "Các đài truyền hình", "Bộ phận truyền thông của cơ quan, tổ chức, doanh nghiệp lớn"]', TRUE),
-    ('Người làm vườn, vườn ươm và trồng hoa, cây cảnh', 'RC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Người làm vườn, vườn ươm và trồng hoa, cây cảnh lập kế hoạch và thực hiện các hoạt động cần thiết để trồng và chăm sóc hoa và cây trồng tạo cảnh quan. Họ cũng có thể sản xuất cây, củ và hạt giống để cung cấp cho thương lái, doanh nghiệp bán buôn, bán lẻ hoặc trực tiếp bán ra thị trường.', '["Sản xuất giống", "Trồng hoa", "Trồng cây cảnh", "Chăm sóc vườn hoa cây cảnh ", "Quản lí cây xanh đô thị"]', '["Xác định chủng loại, số lượng cây giống và các sản phẩm để ươm, trồng", "Mua hạt, củ, phân bón, vật tư khác", "Đầu tư cải tạo đất đai, nhà vườn, kho xưởng, máy móc thiết bị, nuôi động vật để phục vụ trồng trọt", "Thực hiện các hoạt động nông nghiệp như làm đất, gieo hạt, trồng, làm cỏ, bón phân, cắt tỉa cho hoa và các cây trồng khác", "Sản xuất cây giống, củ và hạt", "Trồng hoa, cây, cây bụi và cây trồng khác trong công viên, vườn công cộng hoặc tư nhân", "Trồng cây cho triển lãm hoặc cho mục đích y tế", "Cung cấp và tiếp thị sản phẩm cây, hoa và giống cây, hoa", "Thu hoạch, lưu trữ và xử lí cơ bản sản phẩm nếu cần", "Chăm sóc động vật phục vụ trồng trọt và bảo trì nhà vườn, kho xưởng và máy móc thiết bị"]', '["Vườn bách thảo và công viên", "Các khu đô thị", "Các vườn ươm, cơ sở, doanh nghiệp sản xuất giống, hoa và cây cảnh", "Doanh nghiệp công viên cây xanh", "Viện nghiên cứu về cây trồng", "Nhận chăm sóc vườn tại hộ gia đình, tổ chức", "Tự làm vườn hoa, cây cảnh, sản xuất giống"]', TRUE),
-    ('Nhà thiết kế trang sức', 'RAC', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Điều kiện làm việc', 'Nhà thiết kế trang sức áp dụng các nguyên tắc nghệ thuật và khoa học để thiết kế các sản phẩm kim hoàn, đồ trang sức phục vụ cho trang điểm, nghi lễ, tôn giáo hoặc công nghiệp.', '["Định hình đá quý", "Mạ điện", "Khắc và tráng men", "Đánh bóng và hoàn thiện", "Phân loại đá quý", "Thiết kế trang sức", "Tiếp thị và trưng bày đồ trang sức", "Gia công đá quý"]', '["Thiết kế các sản phẩm trang sức hoàn chỉnh như nhẫn, dây chuyền, vòng đeo tay, trâm cài đầu từ các vật liệu như vàng, bạc, bạch kim, đá quý, đá nhân tạo", "Đúc, đánh đồ trang sức và các sản phẩm kim loại màu khác bằng kĩ thuật thủ công", "Thiết kế đồ trang sức mới và sửa đổi thiết kế hiện tại, có thể sử dụng máy tính khi cần thiết", "Thiết kế khuôn đúc để sử dụng trong chế tác đồ trang sức", "Tái chế, điều chỉnh, sửa chữa đồ trang sức cũ hoặc đồ kim hoàn theo thiết kế hoặc hướng dẫn", "Kiểm tra bề mặt đá quý và kết cấu bên trong bằng các phương pháp như đo khúc xạ, soi kính hiển vi và các công cụ khác để phân biệt các loại đá, xác định các mẫu đá quý hiếm và phát hiện vết ảnh hưởng tới giá trị đá quý", "Mài, khoan và hoàn thiện đá để sử dụng trong các thiết bị đo như la bàn và máy đo thời gian"]', '["Các xưởng, công ty sản xuất, chế tác kim hoàn, đồ trang sức", "Các doanh nghiệp vàng bạc, đá quý", "Các doanh nghiệp thiết kế thời trang", "Hành nghề tự do hoặc mở studio, cửa hàng riêng"]', TRUE);
+    (51, 'Kĩ sư xây dựng', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Các kĩ sư xây dựng áp dụng toán học, vật lí và hóa học để xây dựng các công trình nhà ở, nhà thương mại, đường giao thông, cầu, đập nước, mạng lưới cấp nước, mạng lưới thoát nước, bến cảng, kênh rạch, bến, sân bay, hệ thống đường sắt.', '["Công nghệ kĩ thuật vật liệu xây dựng", "Công nghệ kĩ thuật xây dựng", "Công nghệ kĩ thuật công trình xây dựng", "Xây dựng dân dụng và công nghiệp"]', '["Thực hiện nghiên cứu và phát triển các lí thuyết và phương pháp mới và được cải tiến liên quan đến kĩ thuật xây dựng", "Tư vấn và thiết kế các kết cấu như cầu, đập, bến tầu, đường bộ, sân bay, đường sắt, kênh đào, đường ống, hệ thống thải nước, kiểm soát lũ lụt và các công trình công nghiệp và lớn khác", "Quyết định và chỉ rõ các phương pháp xây dựng, vật liệu và tiêu chuẩn chất lượng, và chỉ đạo công tác xây dựng", "Thiết lập các hệ thống kiểm soát và đảm bảo hoạt động chức năng hiệu quả của các cấu trúc cũng như độ an toàn và BVMT", "Xác định vị trí và chỉnh sửa các sự cố", "Tổ chức và chỉ đạo bảo dưỡng sửa chữa các cấu trúc hiện có", "Nghiên cứu và tư vấn về các vấn đề của vật liệu đặc biệt", "Duy trì đội ngũ kĩ thuật và tư vấn viên với các chuyên gia liên quan khác", "Chuẩn bị tài liệu và báo cáo khoa học", "Giám sát công nhân"]', '["Các công ty xây dựng", "Các công ty cầu đường", "Các công ty kiến trúc", "Tư vấn độc lập"]', TRUE),
+    (52, 'Kĩ sư ô tô', 'RI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Kĩ sư ô tô thiết kế, thử nghiệm, phát triển và chỉ đạo sản xuất các loại ô tô như xe hơi, xe tải, xe buýt, xe bồn, xe đua… Họ giúp ngành công nghiệp ô tô đáp ứng những yêu cầu mới như tăng độ an toàn, tiết kiệm nhiên liệu và tiêu chuẩn môi trường.', '["Công nghệ ô tô", "Công nghệ kĩ thuật ô tô"]', '["Thiết kế động cơ và các bộ phận khác của xe ô tô, việc này cần áp dụng các công thức toán học và vật lí", "Thiết kế các hệ thống cụ thể trong ô tô như hệ thống phun nhiên liệu, điều hòa, phanh...", "Thử nghiệm và tiến hành thí nghiệm nguyên mẫu", "Giám sát việc lắp ráp và sản xuất ô tô/ phụ tùng ô tô", "Xây dựng và giám sát quy trình bảo dưỡng ô tô", "Đo lường các chỉ số kỹ thuật của xe ô tô"]', '["Các công ty sản xuất, lắp ráp, bảo dưỡng ô tô", "Các đơn vị nghiên cứu và phát triển về ô tô"]', TRUE),
+    (53, 'Kĩ sư cơ khí', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự công nhận', 'Kĩ sư cơ khí làm công việc có liên quan tới quá trình lắp đặt, vận hành và bảo trì máy móc trong các ngành công nghiệp. Họ giải quyết các vấn đề kĩ thuật hàng ngày để nâng cao hiệu quả và năng suất.', '["Công nghệ kĩ thuật cơ khí", "Công nghệ chế tạo máy", "Công nghệ kĩ thuật cơ điện tử", "Công nghệ kĩ thuật ô tô", "Công nghệ kĩ thuật nhiệt"]', '["Tư vấn và thiết kế máy móc thiết bị, dụng cụ, bộ phận phi điện – điện tử để đạt được mục tiêu sản xuất và chế biến nhất định trong các ngành công nghiệp và nông nghiệp", "Xác định và kiểm tra các phương pháp sản xuất, lắp đặt và hoạt động của máy móc thiết bị và dụng cụ", "Cộng tác với kĩ sư công nghiệp để có kế hoạch bố trí máy móc thiết bị", "Thiết lập tiêu chuẩn và qui trình kiểm soát để đảm bảo hoạt động hiệu quả và an toàn của máy móc thiết bị, dụng cụ", "Tổ chức và chỉ đạo việc bảo dưỡng và sửa chữa máy móc thiết bị, dụng cụ", "Nghiên cứu và tư vấn về nhiên liệu và chức năng của máy móc, về công nghệ của các vật liệu, sản phẩm và qui trình sản xuất cụ thể trên máy móc đó", "Quản lí các tác động của việc vận hành máy móc đối với người sử dụng và môi trường", "Giám sát thợ cơ khí và công nhân có liên quan"]', '["Trung tâm nghiên cứu", "Các trường ĐH", "Các cơ quan Nhà nước", "Các doanh nghiệp chế tạo và sửa chữa máy móc thiết bị dụng cụ", "Các doanh nghiệp tư vấn chế tạo cơ khí", "Các doanh nghiệp có lắp đặt vận hành máy móc thiết bị"]', TRUE),
+    (54, 'Kĩ sư hoá học', 'IRC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự công nhận', 'Kĩ sư hóa học áp dụng các kiến thức hóa học, vật lí và toán học để biến đổi các hóa chất trong nguyên liệu, hóa chất tổng hợp thành các dạng hữu ích hơn hoặc có giá trị hơn (ví dụ như xăng dầu, cao su…). Kĩ sư hóa học cũng tạo ra các loại vật liệu và các kĩ thuật mới được sử dụng trong các ngành công nghiệp khác', '["Công nghệ kĩ thuật hóa học", "Kĩ thuật hóa học", "Hóa học"]', '["Thực hiện nghiên cứu và tư vấn, phát triển các qui trình hóa chất thương mại để lọc dầu và các chất lỏng khác hoặc khí và sản xuất các chất và hàng hóa như dẫn xuất dầu, chất nổ, lương thực và đồ uống, dược phẩm, hoặc các vật liệu tổng hợp khác", "Nghiên cứu tiền khả thi và khả thi về xây dựng các máy móc sản xuất hóa chất", "Xác định các phương pháp sản xuất, vật liệu và tiêu chuẩn chất lượng và đảm bảo chúng đồng bộ với các chi tiết kĩ thuật", "Lập các tiêu chuẩn và qui trình kiểm soát để đảm bảo độ an toàn và hiệu quả của hoạt động sản xuất", "Xác định và chỉnh sửa các sự cố", "Tổ chức và chỉ đạo bảo dưỡng, sửa chữa các thiết bị hiện có", "Nghiên cứu và tư vấn về các vấn đề về công nghệ liên quan đến các vật liệu, sản phẩm và các quá trình cụ thể", "Duy trì đội ngũ kĩ thuật và tư vấn viên với các chuyên gia liên quan khác", "Chuẩn bị tài liệu và báo cáo khoa học"]', '["Các công ty dược phẩm, thực phẩm và đồ uống, hóa chất, lọc hóa dầu, phân bón", "Tất cả các ngành công nghiệp sử dụng nguyên liệu thô để tạo ra sản phẩm (ví dụ như giấy, cao su)", "Các đơn vị nghiên cứu và phát triển"]', TRUE),
+    (55, 'Kĩ sư luyện kim', 'RCI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Kĩ sư luyện kim là chuyên gia về công nghệ chế tạo kim loại và vận dụng các nguyên tắc vật lí để xử lí kim loại tuỳ theo mục đích ứng dụng. Họ nghiên cứu tính chất vật lí và hóa học của các kim loại và hợp kim.', '["Luyện gang", "Luyện thép", "Luyện kim màu", "Luyện kim đen", "Luyện Ferro hợp kim", "Công nghệ sản xuất alumin", "Công nghệ nhiệt luyện", "Công nghệ đúc kim loại", "Công nghệ cán, kéo kim loại", "Công nghệ kĩ thuật vật liệu", "Kĩ thuật vật liệu kim loại"]', '["Nghiên cứu các tính chất của kim loại, hợp kim và các loại vật liệu khác cũng như mối quan hệ của chúng với kim loại và hợp kim", "Nghiên cứu, tư vấn và giám sát công nghệ sản xuất kim loại và hợp kim trong các xưởng đúc, cán, luyện kim và chế tạo", "Cộng tác với kĩ sư vật liệu để tìm ra các phương pháp xử lí kim loại", "Quản lí các tác động của quá trình luyện kim đối với người sử dụng và môi trường", "Giám sát thợ luyện kim và công nhân có liên quan"]', '["Ngành công nghiệp luyện kim (ví dụ như các xưởng đúc, máy cán, chế tạo)", "Trung tâm nghiên cứu", "Các trường ĐH", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật cá nhân"]', TRUE),
+    (56, 'Kĩ sư vật liệu', 'IRE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Kĩ sư vật liệu nghiên cứu các tính chất của những loại vật liệu tự nhiên và tổng hợp như kim loại, gốm, sứ, polymer, gỗ và các nguồn tài nguyên khác nhằm nâng cao chất lượng cho các ứng dụng công nghiệp và thương mại.', '["Công nghệ vật liệu", "Kĩ thuật vật liệu", "Kĩ thuật vật liệu kim loại"]', '["Nghiên cứu của các nguồn tài nguyên có giá trị công nghiệp và thương mại", "Phát triển các phương pháp chế tạo vật liệu thành những sản phẩm sử dụng được", "Phát triển các phương pháp kết hợp hai loại vật liệu khác nhau bằng cách ghép nối, nung chảy, chế tạo hợp kim, nhằm tạo ra các vật liệu hoặc sản phẩm mới", "Thiết kế sản phẩm mới", "Xác định được nguyên nhân vật liệu bị hỏng và cách nâng cao độ bền của vật liệu", "Phát triển các biện pháp kéo dài tuổi thọ của vật liệu"]', '["Bất cứ ngành công nghiệp nào", "Các trung tâm nghiên cứu", "Các viện hàn lâm", "Các cơ quan Nhà nước", "Các công ty tư vấn kĩ thuật tư nhân"]', TRUE),
+    (57, 'Kĩ sư điện', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Kĩ sư điện làm công việc có liên quan tới việc phát và truyền tải điện. Họ lắp đặt, vận hành và duy trì mạng lưới điện. Kĩ sư điện cũng là những chuyên gia về các mạch điện trong các sản phẩm như máy tính và các thiết bị gia dụng.', '["Điện công nghiệp và dân dụng", "Hệ thống điện", "Nhiệt điện", "Thủy điện", "Công nghệ kĩ thuật điện, điện tử"]', '["Lập kế hoạch và thiết kế các trạm phát điện", "Bố trí các loại thiết bị phát điện", "Sửa chữa bảo dưỡng các trạm phát điện", "Thiết kế các mạch điện trong một sản phẩm", "Thiết kế các mạch điện trong một tòa nhà", "Thiết kế các mạch điện trong một chiếc xe", "Sửa chữa bảo dưỡng thiết bị điện", "Thiết kế và duy trì động cơ điện", "Lắp đặt thiết bị chuyển mạch, cáp và phụ kiện", "Lắp đặt thiết bị phát tín hiệu để quản lí giao thông đường bộ, hàng không, đường sắt", "Thiết kế và duy trì cấu tạo điện của mạng viễn thông", "Tính toán về mặt kĩ thuật và phát triển các dự toán chi phí"]', '["Điện công nghiệp và dân dụng", "Hệ thống điện", "Nhiệt điện", "Thủy điện", "Công nghệ kĩ thuật điện, điện tử"]', TRUE),
+    (58, 'Kĩ sư điện tử', 'IR', 'Phân tích - Logic', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự công nhận', 'Các kĩ sư điện tử nghiên cứu, thiết kế và chỉ đạo xây dựng, bảo dưỡng và sửa chữa các hệ thống điện tử; tìm hiểu và tư vấn về các vấn đề kỹ thuật của vật liệu, sản phẩm hay quá trình chế tạo điện tử.', '["Kĩ thuật điện, điện tử", "Kĩ thuật cơ điện tử", "Công nghệ kĩ thuật cơ điện tử", "Công nghệ kĩ thuật điện, điện tử", "Công nghệ kĩ thuật điện tử, truyền thông"]', '["Thiết kế mạch điện tử cho các thiết bị điện tử", "Chuẩn bị thiết kế các chi tiết", "Phát triển các thiết bị thử nghiệm", "Kiểm tra việc cài đặt vì mục tiêu an toàn và chất lượng", "Tiến hành nghiên cứu cải tiến thiết kế của thiết bị điện tử cụ thể"]', '["Các cơ quan truyền thông, kĩ thuật vũ trụ và giao thông của Nhà nước", "Các ngành công nghiệp sản xuất các dụng cụ điện tử", "Các ngành công nghiệp liên quan tới truyền thông", "Công nghiệp sản xuất máy tính", "Các đơn vị nghiên cứu"]', TRUE),
+    (59, 'Kĩ sư viễn thông', 'REC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Các kĩ sư viễn thông tiến hành nghiên cứu, tư vấn, thiết kế, chỉ đạo việc xây dựng, vận hành, bảo dưỡng và sửa chữa các hệ thống và thiết bị viễn thông. Họ nghiên cứu và tư vấn về các vấn đề kĩ thuật của vật liệu, sản phẩm hay quá trình kĩ thuật viễn thông.', '["Công nghệ điện tử - viễn thông", "Công nghệ phát sóng", "Kĩ thuật điện tử truyền thông"]', '["Tư vấn và thiết kế phần điện tử của các máy móc thiết bị, bộ phận, hệ thống và các tổ hợp viễn thông", "Xác định các phương pháp sản xuất và lắp đặt, tiêu chuẩn vật liệu, chất lượng và an toàn, chỉ đạo và giám sát việc sản xuất, lắp đặt các máy móc thiết bị và hệ thống viễn thông", "Tổ chức và chỉ đạo việc bảo dưỡng và sửa chữa các thiết bị, hệ thống viễn thông", "Nghiên cứu và tư vấn về các trang bị viễn thông", "Thiết kế, qui hoạch các mạng lưới viễn thông ứng dụng công nghệ vô tuyến, hữu tuyến hay cáp quang", "Thiết kế các mạng phân phối truyền thanh và truyền hình không dây và có dây", "Giám sát thợ kĩ thuật và công nhân có liên quan"]', '["Các công ty viễn thông", "Các viện thiết kế", "Các cơ quan quản lý viễn thông của nhà nước"]', TRUE),
+    (60, 'Kĩ sư vũ trụ, hàng không', 'IR', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Điều kiện làm việc', 'Kĩ sư vũ trụ, hàng không là chuyên gia trong việc thiết kế và sản xuất các loại thiết bị bay. Họ cũng thực hiện các công việc duy tu, bảo dưỡng máy bay. Kĩ thuật hàng không vũ trụ cũng có thể mở rộng đến tàu vũ trụ, vệ tinh cũng như các hệ thống kiểm soát và hướng dẫn các máy bay từ xa', '["Kĩ thuật hàng không", "Kĩ sư vũ trụ"]', '["Thiết kế các loại máy bay, bao gồm cả thiết kế tổng thể và thiết kế chi tiết", "Điều này đòi hỏi phải áp dụng các công thức toán học và vật lí", "Thiết kế hệ thống chi tiết trong máy bay như hệ thống phun nhiên liệu, điều hòa, thiết bị hạ cánh… Thử nghiệm và tiến hành thí nghiệm nguyên mẫu", "Giám sát việc lắp ráp và sản xuất máy bay / chi tiết máy bay", "Sửa chữa máy bay hiện có để thêm các bộ phận mới (ví dụ như thùng nhiên liệu phụ)", "Chuẩn bị các chuyến bay", "Tiến hành sửa chữa và bảo trì thường xuyên"]', '["Các nhà máy tham gia sản xuất máy bay", "Các sân bay", "Công ty hàng không", "Không quân", "Các đơn vị nghiên cứu và phát triển"]', TRUE),
+    (61, 'Bác sĩ Thú y', 'RIC', 'Phân tích - Logic', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Chuyên gia thú y áp dụng các nguyên tắc y học để điều trị và kiểm soát dịch bệnh trong gia súc gia cầm và vật nuôi. Họ tiến hành nghiên cứu, cải tiến, phát triển các khái niệm, học thuyết và phương pháp hoạt động, và áp dụng các kiến thức y khoa vào lĩnh vực thú y', '["Thú y", "Dược thú y", "Sản xuất thuốc thú y", "Dịch vụ thú y"]', '["Nghiên cứu, cải tiến và phát triển các khái niệm, học thuyết và phương pháp hoạt động thú y", "Tiến hành kiểm tra và chẩn đoán bệnh và tổn thương trên động vật", "Quản lí và thực hiện việc điều trị thú y bằng phẫu thuật hoặc dùng thuốc", "Thử nghiệm trên bò sữa và đàn vật nuôi khác, tiêm chủng phòng bệnh trên động vật", "Tư vấn về chăm sóc và chăn nuôi gia súc", "Kiểm tra chất lượng, độ tinh khiết và an toàn thực phẩm được làm toàn bộ hoặc một phần từ nguyên liệu có nguồn gốc động vật dùng cho người", "Hỗ trợ về dịch tễ học, X-quang và giám sát khác về thú y", "Chuẩn bị tài liệu và báo cáo khoa học"]', '["Làm việc trong bệnh viện thú y", "Làm việc trong các viện nghiên cứu chuyên ngành khác nhau của khoa học thú y", "Làm việc trong nhà máy sữa, các công ty dược phẩm, trang trại gia cầm và trang trại nuôi heo", "Làm việc trong phòng khám thú y tư nhân"]', TRUE),
+    (62, 'Kỹ thuật viên Thú y', 'RI', 'Phân tích - Logic', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Kỹ thuật viên thú y thực hiện nhiệm vụ tư vấn, chẩn đoán, phòng ngừa và chữa bệnh thú y theo chỉ dẫn của bác sĩ thú y. Họ chăm sóc động vật được điều trị, thực hiện các thủ tục thường quy và hỗ trợ bác sĩ thú y trong các hoạt động', '["Thú y", "Dược thú y", "Sản xuất thuốc thú y", "Sản xuất thuốc thú y", "Dịch vụ thú y"]', '["Tư vấn cho cộng đồng và cá nhân về việc bệnh và điều trị vật nuôi", "Khám bệnh vật nuôi để chẩn đoán bệnh vật nuôi", "điều trị vật nuôi bị bệnh hoặc bị thương, đặc biệt là các bệnh thông thường", "Làm sạch và khử trùng dụng cụ và chuẩn bị vật liệu được sử dụng trong việc khám và điều trị động vật", "Thực hiện các nhiệm vụ kỹ thuật liên cần thiết cho việc thụ tinh nhân tạo của vật nuôi", "Hỗ trợ bác sĩ thú y trong quá trình điều trị", "Tiến hành chụp x quang, lấy mẫu, và tiến hành các xét nghiệm trong phòng thí nghiệm để hỗ trợ chẩn đoán sức khỏe vật nuôi"]', '["Làm việc tại các nông trường, trang trại lớn Làm việc trong các cơ quan quản lý thú y các cấp", "Làm việc trong phòng khám thú y tư nhân, bệnh viện dành cho vật nuôi/thú cưng", "Làm việc trong các viện nghiên cứu, các phòng thí nghiệm thú y"]', TRUE),
+    (63, 'Dược sĩ', 'ICS', 'Phân tích - Logic', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự công nhận', 'Dược sĩ nghiên cứu, cải tiến, phát triển các khái niệm, học thuyết và phương pháp hoạt động dược phẩm bằng cách chuẩn bị, phân phối và bán dược phẩm và thuốc.', '["Dược sĩ", "Kĩ thuật dược", "Kĩ thuật kiểm nghiệm thuốc", "Dược học", "Hóa dược"]', '["Chuẩn bị và chỉ đạo chuẩn bị dược phẩm theo đơn đã kê của bác sĩ y khoa, nha khoa, bác sĩ thú y và theo liều lượng cho trước", "Kiểm tra đơn để bảo đảm rằng lượng thuốc kê không vượt quá mức cho phép và hướng dẫn sử dụng cho bệnh nhân hoặc những người mua thuốc và tư vấn về các loại thuốc tương khắc nhau", "Phân phối thuốc và dược phẩm tại bệnh viện và bán thuốc trong các nhà thuốc", "Giữ các hóa đơn, đặc biệt đối với các chất gây mê, chất độc và các thuốc gây nghiện", "Thử nghiệm thuốc để xác định tính chất, độ tinh chất và tác dụng", "Tham gia phát triển các biện pháp kiểm soát và qui định", "Chuẩn bị tài liệu và báo cáo khoa học"]', '["Tự mở hiệu thuốc", "Bộ phận dược phẩm trong một tổ chức chăm sóc sức khoẻ (ví dụ: bệnh viện)", "Công ty dược phẩm sản xuất thuốc"]', TRUE),
+    (64, 'Kế toán', 'CEI', 'Phân tích - Logic', 'Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Kế toán theo dõi các hoạt động tài chính của một tổ chức. Họ lập kế hoạch, tổ chức, điều hành và thực hiện hệ thống kế toán cho tổ chức. Việc cấp chứng nhận cho kế toán và thực hành nghiệp vụ chuyên môn của họ được giám sát chặt chẽ. Có nhiều phần hành kế toán khác nhau và có nhiều vị trí trong hệ thống kế toán của một tổ chức. Nhiệm vụ cụ thể của một kế toán phụ thuộc vào công việc cụ thể mà người đó đảm nhận.', '["Kế toán doanh nghiệp", "Kế toán hành chính – sự nghiệp", "Kế toán lao động, tiền lương và bảo hiểm xã hội", "Kế toán ngân hàng", "Kế toán xây dựng"]', '["Tư vấn, lập kế hoạch và thiết lập ngân sách, kiểm soát tài khoản và các chính sách và hệ thống kiểm soát khác", "Chuẩn bị và xác thực báo cáo tài chính để trình bầy, để phục vụ quản lí, cổ đông và các cơ quan theo luật định và các cơ quan khác", "Chuẩn bị kế hoạch kinh phí, báo cáo thực hiện thực tế", "Chuẩn bị hoàn thuế, tư vấn và nêu ý kiến về các vấn đề thuế trước cơ quản quản lí thuế", "Lập kế hoạch lợi nhuận và ngân sách, làm báo cáo kết quả thực hiện thực tế", "Thực hiện điều tra tài chính trong những vấn đề như nghi ngờ gian lận, tình trạng không trả được nợ và phá sản", "Kiểm tra các tài khoản và sổ sách lưu giữ", "Thực hiện điều tra và tư vấn về quản lí các vấn đề quản lí như hiệu quả, cổ phiếu, doanh thu, sản phẩm mới, v.v.", "Thiết lập và kiểm soát hệ thống xác định chi phí đơn vị của các sản phẩm và dịch vụ"]', '["Các doanh nghiệp trong nước, có vốn đầu tư nước ngoài", "Các cơ quan Nhà nước", "Hành nghề độc lập"]', TRUE),
+    (65, 'Chuyên gia quản trị dầu khí', 'ECR', 'Phân tích - Logic', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Chuyên gia quản trị dầu khí là chuyên gia lập kế hoạch và quản lí hoạt động khai thác dầu và khí đốt.', '["Quản trị kinh doanh xăng dầu và khí đốt"]', '["Xác định hạn ngạch sản xuất", "Lập kế hoạch các vị trí khai thác", "Lập kế hoạch vận chuyển nguyên liệu thô", "Xác định tính phù hợp của nhân viên, thiết bị và công nghệ", "Lập kế hoạch và quản lí lịch làm việc và trang thiết bị", "Giám sát hoạt động của nhà máy", "Giám sát việc mua sắm, lắp đặt và bảo trì thiết bị", "Điều phối và triển khai các chính sách về y tế và an toàn lao động", "Thực hiện các qui định và luật liên quan đến hoạt động khai thác khoáng sản và môi trường", "Lựa chọn, đào tạo và giám sát nhân viên"]', '["Các công ty thăm dò khai thác dầu khí", "Các doanh nghiệp, đơn vị thuộc ngành dầu khí", "Các vụ, phòng phụ trách lĩnh vực dầu khí thuộc cơ quan quản lí Nhà nước Bộ Công thương, Văn phòng Chính phủ…"]', TRUE),
+    (66, 'Chuyên gia quản trị giao thông (quản lí và điều hành giao thông vận tải)', 'CER', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Chuyên gia quản trị giao thông lưu giữ hồ sơ và quản lí vận hành các dịch vụ vận tải hành khách và hàng hóa trong các hệ thống giao thông đường bộ, đường không, đường sắt, đường thủy…', '["Vận tải đường sắt", "Vận tải đường bộ và thành phố", "Vận tải đa phương thức", "Vận tải &amp;amp; Kinh tế đường sắt", "Vận tải - Kinh tế đường bộ và thành phố", "Qui hoạch &amp;amp; Quản lí giao thông vận tải đô thị", "Điều khiển các quá trình vận tải", "Khai thác vận tải", "Kinh tế vận tải"]', '["Lưu giữ hồ sơ vận hành và điều phối thời gian vận tải hành khách và hàng hóa", "Chỉ đạo tuyến đường xe lửa, xe buýt, máy bay và tàu thủy", "Tạo ra và duy trì hệ thống vận chuyển hành khách, hàng hóa", "Chỉ đạo và giám sát các hoạt động như phân công phương tiện, lái xe, cung ứng nhiên liệu và các yêu cầu khác", "Giám sát sự di chuyển của phương tiện qua các tuyến đường qui định", "Quản lí sự cố phương tiện và điều xe thay thế"]', '["Có thể làm tại các bộ phận nghiệp vụ và quản lí trong cơ quan quản lí Nhà nước về giao thông vận tải nói chung, đặc biệt là giao thông vận tải đô thị, quản lí sử dụng đất và môi trường đô thị", "Các Viện, trường đào tạo về giao thông vận tải, qui hoạch giao thông vận tải đô thị", "Các ban quản lí dự án về xây dựng giao thông vận tải đô thị", "Các doanh nghiệp kinh doanh vận tải đô thị, doanh nghiệp quản lí và khai thác cơ sở hạng tầng giao thông đô thị"]', TRUE),
+    (67, 'Chuyên gia quản trị năng lượng', 'IRE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Chuyên gia quản trị năng lượng là những chuyên gia trong việc mua bán, trao đổi, phân phối và sử dụng năng lượng để đáp ứng các yêu cầu cụ thể, có tính đến các mục tiêu môi trường và kinh tế.', '["Quản trị và kinh doanh điện", "Quản trị và kinh doanh xăng dầu và khí đốt", "Quản trị kinh doanh năng lượng"]', '["Tìm hiểu về các loại năng lượng cần thiết khác nhau", "Tính toán lượng năng lượng cần thiết", "Phát triển mô hình tiêu thụ năng lượng và tạo ra các hệ thống cung cấp năng lượng dựa trên các mô hình đó", "Xác định các nguồn cung cấp năng lượng, đàm phán hợp đồng với các nhà cung cấp và tiến hành mua năng lượng", "Xác định các phương tiện truyền tải năng lượng đến nơi cần thiết", "Quản lí việc phân phối năng lượng", "Tính toán chi phí mua, truyền tải và phân phối năng lượng", "Phát triển và triển khai kế hoạch cắt giảm hoặc tối ưu hoá việc tiêu thụ năng lượng"]', '["Các doanh nghiệp, tổ chức sản xuất năng lượng", "Các doanh nghiệp tiêu thụ nhiều điện và năng lượng các dạng khác"]', TRUE),
+    (68, 'Nhà kinh tế học', 'ICE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Nhà kinh tế học hiểu cách làm cho một quốc gia trở nên thịnh vượng bằng cách sử dụng nguồn lực của quốc gia đó một cách năng suất và hiệu quả. Họ tiến hành nghiên cứu, theo dõi và phân tích thông tin số liệu, làm các báo cáo và kế hoạch để giải quyết các vấn đề về kinh tế và kinh doanh, phát triển các mô hình phân tích, lí giải và dự báo hành vi và xu hướng kinh tế. Họ tư vấn cho doanh nghiệp, các nhóm lợi ích và chính phủ để xây dựng các giải pháp cho các vấn đề kinh tế và kinh doanh hiện tại và tương lai.', '["Kinh tế học", "Kinh tế quốc tế", "Kinh tế dân số và lao động", "Kinh tế tổ chức công nghiệp", "Kinh tế hoạch định", "Kinh tế tài chính công", "Hệ thống thông tin kinh tế"]', '["Theo dõi, thu thập, phân tích và lí giải các số liệu kinh tế bằng cách sử dụng các học thuyết kinh tế, kĩ thuật thống kê và kĩ thuật khác", "Áp dụng các công thức toán học và kĩ thuật thống kê để kiểm định các học thuyết kinh tế và đề ra giải pháp cho các vấn đề kinh tế", "Dự báo những thay đổi trong môi trường kinh tế và các chỉ số chính của nền kinh tế như thu nhập và chi tiêu, lãi suất và tỉ giá, việc làm và thất nghiệp, để xây dựng ngân sách ngắn hạn, lập kế hoạch dài hạn và đánh giá đầu tư", "Đánh giá tính phù hợp, kết quả và hiệu quả của các chính sách kinh tế - xã hội, các quyết định chính trị đối với nền kinh tế, tài chính và xã hội", "Tư vấn, khuyến nghị về chính sách và kế hoạch cho nền kinh tế, chiến lược và đầu tư cho công ti, tiến hành nghiên cứu khả thi cho dự án, dựa trên những nhân tố và xu hướng quá khứ, hiện tại và dự báo tương lai", "Tư vấn ứng dụng các kết quả nghiên cứu vào xây dựng chính sách kinh tế - xã hội cho các bộ phận trong dân số, các vùng và cho phát triển các thị trường", "Chuẩn bị các nghiên cứu và báo cáo khoa học"]', '["Các cơ quan Nhà nước", "Làm cho các ngân hàng lớn", "Các tổ chức phát triển và đa quốc gia như Ngân hàng Thế giới, Tổ chức Lao động quốc tế", "Các doanh nghiệp và công ty lớn"]', TRUE),
+    (69, 'Chuyên viên thương mại quốc tế', 'EC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Đây là lĩnh vực liên quan tới nhiều khía cạnh của thương mại. Các hoạt động bao gồm: đàm phán hợp đồng thương mại, tạo điều kiện cho việc vận chuyển hàng hoá, phân phối sản phẩm và dịch vụ, các hiệp định thương mại, lưu kho hàng hoá... Phạm vi công việc của họ bao gồm từ việc thiết lập các thoả thuận giữa nhà sản xuất và đại lí bán lẻ trong một quốc gia cho tới các hoạt động kinh doanh quốc tế.', '["Kinh tế quốc tế", "Kinh doanh quốc tế"]', '["Thông thạo luật và tập quán thương mại quốc tế", "Phát triển lĩnh vực chuyên môn để được cấp chứng nhận cần thiết cho việc trao đổi buôn bán các mặt hàng khác nhau", "Phát triển danh bạ doanh nghiệp", "Xác định sản phẩm thương mại", "Hiểu rõ các phương thức vận tải và quản lí hàng hóa (ví dụ như một số sản phẩm có thể dễ bị hư hỏng và cần được chuyển tới người mua trong một vài giờ)", "Hiểu rõ cách thức lưu trữ ở kho của sản phẩm", "Thông thạo về tiền tệ quốc tế"]', '["Công ty đa quốc gia xuất khẩu và nhập khẩu hàng hoá và dịch vụ", "Dịch vụ tư vấn xuất nhập khẩu cá nhân"]', TRUE),
+    (70, 'Chuyên viên ngân hàng, quỹ đầu tư', 'ECS', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Sự độc lập', 'Chuyên viên ngân hàng, quỹ đầu tư là các chuyên gia tạo ra các sản phẩm và dịch vụ tài chính (chẳng hạn như đề án quỹ tương hỗ). Họ xử lí lượng lớn các giao dịch và chuyên về các quỹ đầu tư và cho vay liên kết với mục tiêu làm thế nào để có lợi nhất cho những người sở hữu quỹ.', '["Tài chính ngân hàng"]', '["Nghiên cứu thị trường và xác định các hoạt động đầu tư tiềm năng", "Tạo ra các sản phẩm tài chính", "Tương tác với khách hàng để nắm bắt được kế hoạch đầu tư của họ, đặc biệt chú ý tới việc hiểu rõ được các mức độ rủi ro mà khách hàng sẵn sàng chấp nhận", "Tìm hiểu tình hình tài chính của khách hàng", "Phát triển kế hoạch đầu tư cho khách hàng và thực hiện đúng kế hoạch đó", "Thông báo cho khách hàng về tình trạng các khoản đầu tư", "Điều hành kinh tế và tư vấn khách hàng", "Tư vấn cho các ngân hàng và các cơ quan khác về qui trình đầu tư"]', '["Ngân hàng", "Các công ty chuyên về đầu tư", "Các hãng môi giới chứng khoám", "Các công ty đa quốc gia"]', TRUE),
+    (71, 'Kĩ sư và kĩ thuật viên âm thanh', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý; Tương tác với người khác', 'Năng lực hình học – thiết kế', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Kĩ sư và kĩ thuật viên kĩ thuật âm thanh vận hành máy móc, thiết bị để ghi lại, đồng bộ hoá, phối âm hoặc sao chép các hiệu ứng về âm thanh, giọng nói và âm nhạc trong các phòng thu, đấu trường thể thao, nhà hát, rạp chiếu phim, trường quay phim truyện và video.', '["Thiết kế âm thanh, ánh sáng", "Công nghệ điện ảnh, truyền hình"]', '["Làm việc với các loại phương tiện truyền thông ghi âm khác nhau", "Thiết kế, cài đặt và vận hành các thiết bị và công cụ ghi âm", "Ghi âm, biên tập và phối âm bằng các phương tiện kĩ thuật khác nhau để cho ra sản phẩm hoàn chỉnh"]', '["Phòng thu thanh", "Công nghiệp làm phim", "Hãng phim lồng tiếng", "Buổi hoà nhạc trực tiếp", "Đài phát thanh"]', TRUE),
+    (72, 'Nhân viên giao dịch ngân hàng', 'CE', 'Phân tích - Logic', 'Tương tác với người khác', 'Làm việc với con người', 'Phân tích - logic', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Nhân viên giao dịch ngân hàng và các nghề liên quan làm việc trực tiếp với khách hàng đến ngân hàng hoặc các bưu điện giao dịch, thực hiện các giao dịch liên quan tới nhận, gửi, chuyển, qui đổi và rút tiền.', '["Tài chính – ngân hàng", "Tài chính tín dụng"]', '["Xử lí tiền gửi và tiền rút séc, chuyển khoản, hối phiếu, thẻ tín dụng, thư chuyển tiền, chi phiếu ngân hàng của khách hàng và những giao dịch ngân hàng có liên quan khác", "Ghi nợ vào tài khoản khách hàng", "Trả hối phiếu và chuyển nhượng tiền thay mặt khách hàng", "Nhận thư, bán tem thư và thực hiện các công việc tại quầy bưu điện như trả hối phiếu, chuyển tiền và các công việc liên quan", "Đổi tiền từ ngoại tệ này sang ngoại tệ khác, theo yêu cầu của khách hàng", "Ghi lại các giao dịch và giải quyết bằng quyết toán tiền mặt"]', '["Xử lí giao dịch trong các ngân hàng quốc doanh, cổ phần, nước ngoài…", "Công việc liên quan tới chuyển hàng và chuyển tiền trong bưu điện"]', TRUE),
+    (73, 'Giáo viên công nghệ thông tin', 'SIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên CNTT xây dựng chương trình, bố trí lịch học và thực hiện đào tạo về máy tính và CNTT cho người dùng không chuyên.', '["Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến CNTT. Ví dụ: lập trình, phần cứng...", "Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)"]', '["Xác định nhu cầu đào tạo về CNTT và yêu cầu cụ thể của các cá nhân và tổ chức", "Chuẩn bị và phát triển tài liệu học tập và các tài liệu phụ trợ như sổ tay, phương tiện nghe nhìn, mô hình và các tư liệu tham khảo khác", "Thiết kế, điều phối. xếp lịch và thực hiện đào tạo các chương trình cho cá nhân và nhóm, hỗ trợ các hội thảo, trình diễn và hội nghị", "Thực hiện đánh gia thường xuyên và tổng kết chất lượng và hiệu quả đào tạo, điều chỉnh chương trình đào tạo", "Tìm hiểu, nghiên cứu và đánh giá các tư liệu bổ sung để có được hiểu biết rộng hơn về nội dung chuyên môn", "Cập nhật các phiên bản phần mềm mới, các tiến bộ về CNTT, biên soạn tài liệu hướng dẫn người dùng và các hướng dẫn khác"]', '["Các trường trung cấp", "Các trường trung học", "Các trung tâm đào tạo tin học", "Các bộ phận đào tạo của doanh nghiệp"]', TRUE),
+    (74, 'Nhà thiết kế đồ họa và truyền thông đa phương tiện', 'ARE', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà Thiết kế đồ họa và truyền thông đa phương tiện kết hợp thiết kế và những kiến thức kỹ thuật để nghiên cứu, phân tích, đánh giá, thiết kế, lập trình và sửa đổi các trang web và các ứng dụng cùng sử dụng các ký tự văn bản, đồ hoạ, sự chuyển động, hình ảnh, âm thanh và hiển thị hình ảnh và các phương tiện truyền thông tương tác khác.', '["Truyền thông kĩ thuật số", "Thiết kế", "Hiệu ứng hình ảnh", "Đồ họa chuyển động", "Hoạt họa", "Phát triển sản xuất", "Hỗ trợ thiết kế bằng vi tính", "Thiết kế đồ họa", "Thiết kế trang web", "Công nghệ xuất bản điện tử (sách, báo, video, nhạc)"]', '["Phân tích, thiết kế và phát triển các trang internet có áp dụng một hỗn hợp của nghệ thuật và sáng tạo với việc lập trình phần mềm và các ngôn ngữ chữ viết và giao diện với môi trường hoạt động", "Thiết kế và phát triển chuyển động, các hình ảnh, sự trình diễn, trò chơi, âm thanh và đoạn phim video kỹ thuật số và các ứng dụng Internet sử dụng phần mềm đa phương tiện, các công cụ và tiện ích, đồ họa có tính tương tác và ngôn ngữ lập trình", "Cùng với các nhà chuyên gia về mạng thực hiện các vấn đề liên quan tới trang web, như là an ninh và việc kết nối tới máy chủ của các trang web, để kiểm soát được an ninh mạng internet và các máy chủ, phân bổ không gian, quyền truy cập của người sử dụng, tính liên tục, sao lưu trang web và lập kế hoạch khôi phục sự cố", "Thiết kế, phát triển và kết hợp mã máy tính với các dữ liệu đầu vào chuyên dụng, như các file hình ảnh, âm thanh và ngôn ngữ lập trình, để sản xuất, duy tu và hỗ trợ các trang web", "Hỗ trợ trong việc phân tích, xác định và phát triển các chiến lược internet, các phương pháp sử dụng web và các kế hoạch phát triển"]', '["Các hãng phim", "Các đài truyền hình", "Các cơ quan quảng cáo", "Nhà sản xuất video", "Nhà hát và các buổi hòa nhạc trực tiếp", "Các công ty tổ chức sự kiện"]', TRUE),
+    (75, 'Nhà quản trị cơ sở dữ liệu và mạng máy tính', 'ECI', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Điều kiện làm việc', 'Quản trị cơ sở dữ liệu và mạng máy tính thiết kế, xây dựng, kiểm soát, hỗ trợ các hệ thống công nghệ thông tin để đảm bảo vận hành và an toàn, bao gồm cả dữ liệu, phần cứng, phần mềm, mạng và hệ điều hành', '["Mạng máy tính", "An ninh mạng", "CSDL", "Quản trị dữ liệu"]', '["Thiết kế và phát triển kiến trúc CSDL, cấu trúc dữ liệu, từ điển và quy ước về dữ liệu cho các dự án hệ thống thông tin", "Thiết kê, xây dựng, điều chỉnh, tích hợp và thử nghiệm các hệ CSDL", "Xây dựng và triển khai chính sách quản lý, tài liệu, chuẩn và mô hình về dữ liệu", "Duy trì và quản lý mạng máy tính và các môi trường máy tính khác", "Phân tích phát triển, diễn giải và đánh giá kiến trúc, mô hình dữ liệu và sơ đồ của các hệ phức tạp trong thiết kế, triển khai, cấu hình và tích hợp các hệ thống máy tính"]', '["Các công ty dữ liệu", "Các bộ phận quản trị mạng và dữ liệu của các công ty", "Các ngân hàng", "Các công ty viễn thông lớn"]', TRUE),
+    (76, 'Kỹ thuật viên công nghệ thông tin', 'RIC', 'Phân tích - Logic', 'Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Kỹ thuật viên vận hành công nghệ thông tin (CNTT) và truyền thông hỗ trợ việc xử lý, vận hành và quản lý thông tin và hệ thống kỹ thuật truyền thông hàng ngày, bao gồm các mạng LAN và WAN, và các phần cứng, phần mềm và các thiết bị máy tính liên quan nhằm đảm bảo việc vận hành tốt nhất và xác định các vấn đề phát sinh.', '["Sử dụng phàn mềm", "Lắp đặt và sửa chữa phần cứng", "Kỹ thuật lập trình"]', '["Vận hành và giám sát các thiết bị ngoại vi và các thiết bị máy tính liên quan", "Nhập lệnh, sử dụng thiết bị đầu cuối máy tính, và kích hoạt bảng điều khiển máy tính và các thiết bị ngoại vi để tích hợp và vận hành thiết bị", "Giám sát hệ thống tìm lỗi của thiết bị hoặc lỗi vận hành", "Thông báo cho giám sát viên hoặc kỹ thuật viên bảo dưỡng các trục trặc của thiết bị", "Giải quyết các thông báo lỗi chương trình bằng cách tìm và sửa các vấn đề, thông báo lỗi cho các kỹ thuật viên khác hoặc kết thúc chương trình", "Đọc các hướng dẫn thiết lập để xác định những thiết bị được sử dụng, yêu cầu sử dụng, các tài liệu như các đĩa và sách hướng dẫn và thiết lập các quản lý", "Sửa chữa, khôi phục, tách biệt và sắp xếp các chương trình đầu ra theo yêu cầu, và gửi dữ liệu đến những người sử dụng cụ thể", "Cài đặt các thiết bị ngoại vi, như máy in, với các vật liệu được chọn để chạy vận hành, hoặc giám sát việc cài đặt các thiết bị ngoại vi do người vận hành thiết bị ngoại vi thực hiện"]', '["Các doanh nghiệp", "Các nhà trường", "Các cơ quan nhà nước"]', TRUE),
+    (77, 'Thủ quỹ', 'CE', 'Phân tích - Logic', 'Phân tích và xử lý; Tương tác với người khác', 'Làm việc với con người', 'Phân tích - logic', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Điều kiện làm việc', 'Thủ quỹ là người kiểm soát toàn bộ hoạt động thu chi phát sinh trong doanh nghiệp như kiểm tra phiếu Thu, phiếu Chi, ký xác nhận, giao các liên, tạm ứng, … Thủ quỹ quản lý, lưu trữ toàn bộ giấy tờ liên quan khác trong quá trình này', '["Thủ quỹ tiền mặt"]', '["Thực hiện việc kiểm tra lần cuối về tính hợp pháp và hợp lý của chứng từ trước khi xuất, nhập tiền khỏi quỹ", "Kiểm tra, phân loại, sắp xếp tiền mặt để nhận biết, xuất nhập tiền dễ dàng", "Thực hiện việc thanh toán tiền mặt hàng ngày theo quy trình thanh toán của đơn vị", "Thực hiện kiểm kê đối chiếu quỹ thường kỳ với kế toán tổng hợp", "Quản lý toàn bộ tiền mặt trong két sắt", "Lưu trữ chứng từ thu chi tiền", "Thực hiện các công việc khác được phân công"]', '["Các doanh nghiệp trong nước, có vốn đầu tư nước ngoài", "Các cơ quan Nhà nước", "Hành nghề độc lập"]', TRUE),
+    (78, 'Họa sĩ truyện tranh, biếm hoạ', 'ASR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Năng lực làm việc với con người', 'Hình học - màu sắc - thiết kế', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Họa sĩ biếm họa, truyện tranh là người nghệ sĩ sử dụng khả năng của mình để vẽ, cụ thể hóa, sử dụng màu sắc và thiết kế để lột tả hành vi con người, sự kiện hay một vấn đề và trình bày một cách hài hước hoặc gợi mở suy nghĩ.', '["Biếm họa tâm lí", "Biếm họa chính trị", "Biếm họa về bản tính con người", "Tranh châm biếm", "Đồ họa hoạt hình"]', '["Thu thập thông tin về các sự kiện trong lịch sử hoặc trong hiện tại, các vấn đề đang gây tranh cãi, các vấn đề chính trị và triết học", "Biến quan sát thành tranh vẽ hài hước, châm biếm hoặc gợi mở suy nghĩ", "Tranh có thể có hoặc không có chú thích", "Tạo ra một phong cách hoặc một tập hợp các nhân vật", "Sử dụng thành thạo công cụ đa phương tiện (ví dụ: bản vẽ bao gồm các đường thẳng và cong riêng biệt đặt trên nền)", "Làm việc với các nhà khoa học xã hội, lịch sử, nghệ thuật, nhà in, biên tập viên tạp chí… để tạo ra và sản xuất tranh biếm họa, truyện tranh"]', '["Tạp chí", "Các tờ báo", "Cơ quan quảng cáo", "Làm họa sĩ minh họa hoặc họa sĩ truyện tranh cho các nhà xuất bản", "Xưởng hoạt hình trong ngành sản xuất phim"]', TRUE),
+    (79, 'Kĩ thuật viên in ấn', 'RC', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên in ấn tiến hành nghiên cứu, phát triển, thực hiện và giám sát qui trình in ấn tốt hơn, kinh tế hơn để sử dụng trong ngành công nghiệp in ấn.', '["Công nghệ vật liệu in", "Công nghệ bao bì đóng gói: các kĩ thuật in bao bì đóng gói", "Kĩ thuật sau in", "Kĩ thuật trước in"]', '["Thực hiện các qui trình in ấn khác nhau như in ốp-xét, in cán, in lưới…", "Nghiên cứu sử dụng các thiết bị điện tử và từ tính trong quí trình in ấn, ví dụ như in từ tính, in bằng âm thanh nổi, bố cục ảnh, khắc laze, in dầu, in 3D…", "Phát triển qui trình in chính xác, nhanh chóng và tiết kiệm để phục vụ mục đích in ấn khác nhau", "Thử nghiệm các loại mực giấy và máy móc khác nhau để cải thiện các ấn phẩm cuối cùng", "Giám sát qui trình in ấn"]', '["Các xưởng in", "Tòa soạn báo và tạp chí", "Nhà xuất bản"]', TRUE),
+    (80, 'Kĩ thuật viên thuộc da, chuyên gia vật liệu da', 'RCA', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên thuộc da sử dụng các qui trình khác nhau để sản xuất da thuộc phù hợp với tiêu chuẩn đã được qui định. Kĩ thuật viên thuộc da là chuyên gia trong bảo quản và sấy khô để làm da thuộc tốt hơn. Các hóa chất như muối, thuốc nhuộm, dầu và các hợp chất crom khác được sử dụng trong ngành công nghiệp thuộc da được phân tích để xác định đặc tính của da. Kĩ thuật viên thuộc da còn là chuyên gia trong việc lập kế hoạch, thiết kế, lắp đặt thiết bị, máy móc mới và có chuyên môn để nghiên cứu dầu, thuốc nhuộm, mạ crom, thuộc da và sản phẩm được sử dụng trong công nghiệp sản xuất da, hàng hoá thể thao, da may mặc và các loại hình tương tự như vậy.', '["Thiết kế và sản xuất giày dép da", "Thiết kế và sản xuất đồ vật bằng da", "Thiết kế và sản xuất đồ may mặc bằng da"]', '["Chế biến các loại da thành phẩm", "Kiểm tra da và những khiếm khuyết trong cấu trúc da", "Tổ chức, quản lí sản xuất da và các nghiên cứu về máy móc sử dụng trong sản xuất da", "Kiểm soát chất lượng, tiếp thị và bán sản phẩm da", "Áp dụng các qui trình khoa học và kĩ thuật để chế biến da và thuộc da", "Giám sát việc sử dụng các hóa chất khác nhau trong chế biến da"]', '["Các công ti sản xuất giày dép, may mặc và phụ kiện", "Nhà máy thuộc da và các công ti hóa da, hóa chất"]', TRUE),
+    (81, 'Kĩ thuật viên vẽ kĩ thuật', 'RCA', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên vẽ kĩ thuật chuẩn bị các bản vẽ kĩ thuật, bản đồ và các bản minh họa từ các bản phác thảo, các số đo và các số liệu khác và các bản thảo và bản vẽ trên các bản in. Họ cũng sao chép hoặc phóng to bản vẽ để chuẩn bị cho việc in ấn.', '["Nhà phác thảo kĩ thuật/ dân sự", "Nhà phác thảo kiến trúc", "Nhà phác thảo bản đồ", "Nhà thiết kế và phác thảo kĩ thuật số"]', '["Chuẩn bị và sửa lại các bản vẽ từ các bản phác thảo và các chi tiết kĩ thuật được chuẩn bị bởi kĩ sư, nhà thiết kế để sản xuất, lắp đặt và lắp ráp máy móc, thiết bị hoặc để xây dựng, sửa đổi, bảo dưỡng và sửa chữa các công trình xây dựng và các dự án kĩ thuật kiến trúc và kĩ thuật dân dụng khác", "Vẽ trên máy tính để tạo, thay đổi và in ra các bản cứng và biểu diễn bằng số liệu các bản phác thảo", "Vận hành thiết bị bảng biểu số hóa và các thiết bị khác để chuyển bản cứng thành hình thức số hóa", "Sử dụng các dụng cụ đo ba chiều để lấy số liệu đo vẽ địa hình bằng phương pháp tương tự hoặc phương pháp số hóa và sử dụng những số liệu đó để chuẩn bị và xem xét lại phép đo vẽ địa hình, thủy văn học, thực tiễn và các bản đồ khác", "Chuẩn bị và xem xét lại các tranh minh họa cho các công việc liên quan, sách tham khảo và sách kĩ thuật liên quan tới lắp đặt, vận hành, bảo dưỡng và sửa chữa máy móc và thiết bị hàng hóa khác"]', '["Trong các ngành công nghiệp liên quan đến xây dựng, bản đồ học, kĩ thuật, kiến trúc và khảo sát"]', TRUE),
+    (82, 'Kĩ thuật viên bao bì', 'RC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên bao bì lập kế hoạch, triển khai và hướng dẫn kĩ thuật trong các hoạt động liên quan đến việc thiết kế, phát triển và sản xuất các loại bao bì bảo vệ, bảo quản, vận chuyển, trang trí và công nghệ đóng gói. Sản phẩm cần được bao gói, đóng hộp, đóng chai, đóng thùng, dán nhãn trước khi đưa ra thị trường tiêu thụ. Ngành bao bì sử dụng giấy, bìa, thủy tinh, nhựa, nhôm và nhiều vật liệu khác để sản xuất hộp, gói, túi, bình, ống, thùng… làm bao bì nhãn mác cho sản phẩm hàng hóa khác.', '["Thiết kế bao bì sản phẩm", "Thiết kế đồ họa bao bì", "Kĩ thuật sản xuất bao bì", "Vật liệu bao bì", "Kĩ thuật in", "Đóng gói và ổn định sản phẩm", "Quản lí chất lượng sản phẩm bao bì", "Bao bì đóng gói trong các ngành đặc thù (như hàng tiêu dùng, hàng xa xỉ, thực phẩm, mĩ phẩm và chăm sóc sức khỏe, quà tặng)"]', '["Phân tích các bản vẽ và thông số kĩ thuật của sản phẩm để xác định các đặc tính vật lí và hóa học, các yêu cầu đặc thù về vận chuyển, bảo quản, thẩm mĩ, an toàn, dán nhãn và loại vật liệu cần thiết cho việc đóng gói", "Thiết kế bao bì và qui trình đóng gói phù hợp", "Lập kế hoạch, triển khai và giám sát hoạt động sản xuất bao bì, kiểm soát chất lượng sản phẩm bao bì", "Giám sát việc xử lí phụ phẩm và rác thải", "Tư vấn cho doanh nghiệp và khách hàng về qui trình, vật liệu và thiết bị bao gói, dán nhãn, niêm phong và chằng buộc"]', '["Doanh nghiệp trong các ngành đòi hỏi sản phẩm phải có bao bì như dược phẩm, thực phẩm, mĩ phẩm, hóa chất vệ sinh, công nghiệp chế tạo…", "Các cơ sở, doanh nghiệp sản xuất bao bì", "Các cơ sở, doanh nghiệp phân phối, bán lẻ", "Các phòng thí nghiệm kiểm định chất lượng bao bì"]', TRUE),
+    (83, 'Kĩ thuật viên ngành giấy', 'RC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên giấy phụ trách công nghệ kĩ thuật trong quá trình sản xuất giấy và sản phẩm từ giấy. Quá trình này bao gồm các công việc tập kết nguyên liệu, làm bột giấy, nghiền, xeo, ép, sấy, cán và cuộn để cuối cùng ra sản phẩm giấy, cũng như tái chế giấy và sản phẩm từ giấy.', '["Các công đoạn sản xuất giấy và bìa", "Nghiên cứu và phát triển giấy từ nguyên liệu mới, sản phẩm mới từ giấy", "Tái chế giấy"]', '["Xác định và kiểm tra nguyên liệu sản xuất giấy (như bã mía, tre, nứa, bạch đàn, keo, giấy bìa cũ…)", "Tham gia lắp đặt dây chuyển máy móc thiết bị sản xuất giấy hoặc sản phẩm từ giấy", "Kiểm tra mẫu để đảm bảo định lượng chính xác của sản phẩm giấy", "Giám sát và điều chỉnh quá trình sản xuất nếu cần", "Kiểm soát chất lượng sản phẩm", "Giám sát việc xử lí phụ phẩm và rác thải", "Nghiên cứu cải tiến công nghệ sản xuất giấy không ảnh hưởng tới môi trường", "Đưa nguyên liệu vào dây chuyền sản xuất bột giấy, giấy hoặc sản phẩm từ giấy đúng chủng loại và định lượng", "Vận hành máy móc thiết bị sản xuất bột giấy, giấy hoặc sản phẩm từ giấy theo qui trình đã đề ra"]', '["Các cơ sở, doanh nghiệp sản xuất giấy", "Các cơ sở, doanh nghiệp tái chế giấy", "Các cơ sở sản xuất giấy thủ công", "Các cơ sở, doanh nghiệp sản xuất bao bì", "Các doanh nghiệp in"]', TRUE),
+    (84, 'Kĩ thuật viên may mặc và công nghệ có liên quan', 'RC', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Kĩ thuật viên may mặc và công nghệ có liên quan (sợi, dệt, nhuộm…) phụ trách công nghệ kĩ thuật trong quá trình sản xuất hàng vải sợi, dệt và may mặc đại trà. Họ cũng có thể chuyên về hóa chất (thuốc nhuộm, chất tẩy, phụ gia…) hay máy móc thiết bị sản xuất hàng dệt may.', '["Công nghệ sợi", "Công nghệ dệt thoi", "Công nghệ dệt kim", "Công nghệ may", "Công nghệ sản xuất tất và hàng dệt kim", "Công nghệ giặt là", "Máy móc thiết bị dệt may"]', '["Làm rập, sơ đồ theo tài liệu kĩ thuật từ khách hàng", "Viết qui trình công đoạn sản xuất sản phẩm", "Làm tài liệu kĩ thuật, thiết kế và cân bằng chuyền", "Lập kế hoạch sản uất và theo dõi tiến độ", "Đề xuất và kiểm tra định mức nguyên phụ liệu, định mức công đoạn", "Kiểm soát chất lượng sản phẩm", "Giám sát việc xử lí phụ phẩm và rác thải", "Cải tiến thao tác, qui trình, máy móc thiết bị sản xuất", "Xây dựng, ban hành qui trình, tài liệu tiêu chuẩn cho các bộ phận sợi, dệt - nhuộm, phụ liệu và sản phẩm dệt - nhuộm", "Kiểm tra, đánh giá chất lượng các dòng nguyên phụ liệu mới", "Kiểm tra, so mẫu sợi, vải dệt - nhuộm", "Khắc phục lỗi, cho ra thành phẩm đúng với mẫu gốc", "Kiểm soát chất lượng và an toàn sản phẩm từ khâu thiết kế đến khi sản phẩm lên kệ"]', '["Các doanh nghiệp sản xuất sợi, sản phẩm dệt và may mặc", "Các doanh nghiệp cung cấp nguyên phụ liệu, hóa chất và máy móc thiết bị cho ngành dệt may", "Các phòng thí nghiệm, đơn vị chứng nhận sản phẩm dệt may"]', TRUE),
+    (85, 'Kĩ thuật viên da giày', 'RC', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên da giày phụ trách công nghệ kĩ thuật trong quá trình sản xuất các sản phẩm da giày, từ thuộc da và da lông thú, đến sản xuất thành phẩm cuối cùng như giày da, giày thể thao, túi xách và phụ kiện bằng nguyên liệu da thật và giả da. Họ cũng có thể chuyên về hóa chất (dầu, thuốc nhuộm, phụ gia…) hay máy móc thiết bị sản xuất nguyên liệu và thành phẩm da giày', '["Thiết kế và sản xuất giày dép da", "Thiết kế và sản xuất đồ vật bằng da", "Thiết kế và sản xuất đồ may mặc và phụ kiện bằng da", "Thiết kế và sản xuất va li, túi xách bằng da"]', '["Kiểm tra và phân loại nguyên liệu da theo chủng loại, màu sắc, kết cấu, kích thước, mức độ khiếm khuyết trước khi đưa vào thuộc", "Triển khai thuộc và chế biến da bằng cách hồi ẩm, làm sạch, làm mềm, tẩy lông, thuộc và xử lí với muối, hóa chất và các chiết xuất từ thiên nhiên", "Nhuộm, làm khô và hoàn thiện bề mặt để che khuyết điểm và phủ chống ẩm", "Kiểm soát chất lượng sản phẩm", "Giám sát việc xử lí phụ phẩm và rác thải", "Nghiên cứu, thử nghiệm, cải tiến, áp dụng các hóa chất, máy móc và qui trình công nghệ trong sản xuất da", "Đọc, hiểu kĩ tài liệu kĩ thuật, nghiên cứu mẫu giày, túi xách, phụ kiện và yêu cầu của khách hàng", "Tham gia thiết kế và sản xuất mẫu sản phẩm", "So sánh thông số, qui cách giữa tài liệu kĩ thuật và mẫu để thiết kế ra một bộ rập chính xác ngay từ đầu", "Kiểm tra, thiết kế rập và nhảy size theo đúng yêu cầu", "Phụ trách kĩ thuật tại xưởng", "Điều hành sản xuất, đảm bảo tiến độ và kĩ thuật", "Đánh giá kĩ năng công đoạn", "Giám sát sản xuất để đề ra các giải pháp nhằm giải quyết những vấn đề chất lượng và hiệu quả sản xuất trên chuyền", "Kiểm soát chất lượng sản phẩm từ khâu cắt đến khâu hoàn thiện sản phẩm"]', '["Các cơ sở, doanh nghiệp chế biến và thuộc da", "Các cơ sở, doanh nghiệp sản xuất giày dép và sản phẩm da", "Các doanh nghiệp cung cấp nguyên phụ liệu, hóa chất và máy móc thiết bị cho ngành da giày", "Các phòng thí nghiệm, đơn vị chứng nhận sản phẩm da giày"]', TRUE),
+    (86, 'Thợ thẩm mĩ (Làm đẹp)', 'AES', 'Hình học - màu sắc - thiết kế', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Thợ thẩm mĩ, còn gọi là thợ làm đẹp, cắt và tạo dáng tóc, râu, chăm sóc sắc đẹp, sử dụng mĩ phẩm và trang điểm, và thực hiện các dịch vụ và liệu pháp chăm sóc khác cho khách hàng để cải thiện ngoại hình của họ.', '["Chăm sóc da", "Massage mặt và toàn thân", "Chăm sóc và trang điểm tóc", "Làm móng", "Các liệu pháp đặc biệt trong chăm sóc sắc đẹp (vật lí trị liệu, cổ truyền, Nhật Bản, Hàn Quốc, Trung Quốc…)", "Trang điểm", "Trang điểm và hóa trang cho các đối tượng/ dịp đặc thù (đám cưới, chụp ảnh, đám tiệc, điện ảnh, sân khấu, truyền hình…)"]', '["Cắt, gội, nhuộm, uốn, duỗi và tạo kiểu tóc", "Chăm sóc và điều trị tóc và da đầu", "Làm tóc giả theo yêu cầu của khách hàng", "Làm sạch và chăm sóc da bằng cách sử dụng các loại kem, sữa và các sản phẩm liên quan đến khuôn mặt và các bộ phận của cơ thể", "Massage mặt và cơ thể", "Hỗ trợ bác sĩ để làm sạch, chuẩn bị, làm dịu da và cơ thể trong các trị liệu thẩm mĩ chuyên sâu như laser, lăn kim, trị liệu ánh sáng…", "Trang điểm cho các khách hàng", "Trang điểm và hóa trang cho các diễn viên, nghệ sĩ biểu diễn, người tham gia chương trình truyền hình", "Làm sạch, định hình, chăm sóc, đánh bóng và trang điểm móng tay, móng chân", "điều trị các bệnh đơn giản của bàn chân con người như nứt nẻ, bị chai hay biến dạng ngón chân, móng tay", "Theo dõi sức khỏe và hỗ trợ khách hàng tắm hơi, jacuzzi", "Tấy lông cho khách hàng bằng sáp, đường và các kĩ thuật tẩy lông phù hợp", "Tư vấn khách hàng về chế độ chăm sóc, dinh dưỡng và thể dục để hỗ trợ giảm và giữ cân"]', '["Hành nghề tự do hoặc tự mở cơ sở làm đẹp da, tóc, móng, trang điểm", "Mở kênh dạy chăm sóc sắc đẹp và trang điểm riêng trên mạng", "Các thẩm mĩ viện, bộ phận thẩm mĩ trong khách sạn và khu nghỉ dưỡng", "Các hãng mĩ phẩm", "Ngành công nghiệp giải trí (truyền hình, phim, sân khấu)", "Các trung tâm chăm sóc sức khỏe và vật lí trị liệu"]', TRUE),
+    (87, 'Kiến trúc sư xây dựng', 'AIR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kiến trúc sư xây dựng thiết kế nhà ở, nhà thương mại, các công trình xây dựng dân dụng và công nghiệp; lập kế hoạch và giám sát thi công, bảo trì, mở rộng và cải tạo về mặt thẩm mĩ và công năng của các công trình đó. Họ cũng có thể tham gia qui hoạch đô thị, cảnh quan và các hệ thống giao thông.', '["Thiết kế kiến trúc", "Thiết kế nội ngoại thất công trình xây dựng", "Thiết kế qui hoạch đô thị", "Thiết kế cảnh quan"]', '["Khảo sát mặt bằng, thảo luận với khách hàng, lãnh đạo và những người liên quan để xác định loại công trình, phong cách, kích thước, nhu cầu sử dụng và các khía cạnh của công trình hiện tại hoặc tương lai", "Chuẩn bị và trình bày các phương án đề xuất thiết kế, vật liệu và thời gian thi công", "thảo luận và tư vấn khách hàng chọn phương án", "Thiết kế công trình, chuẩn bị bản phác thảo, bản vẽ chi tiết, sơ đồ mặt bằng, cân nhắc các yếu tố kết cấu, công năng, thẩm mĩ, nội ngoại thất và trang thiết bị để hoàn thiện thiết kế cuối cùng", "Chuẩn bị các thông số, kế hoạch xây dựng và văn bản hợp đồng để huy động thợ hoặc mời thầu giúp khách hàng", "Xử lí các giấy tờ thủ tục cần thiết để đảm bảo dự án khả thi về mặt phong cách, cấu trúc, chi phí, thời gian, pháp lí", "Giám sát thi công phù hợp với bản vẽ, thông số kĩ thuật và chất lượng, các tiêu chuẩn, hướng dẫn và qui định", "Phối hợp với kĩ sư xây dựng, nhà thầu, đội trưởng, thợ chính và thợ phụ để phát hiện và giải quyết các vấn đề phát sinh", "Điều phối công việc giữa nhiều nhà thầu khác nhau", "Qui hoạch phát triển các khu đô thị như bố trí mặt bằng, đường giao thông, công viên và các tiện ích chung", "Cải tiến và phát triển các phương pháp thiết kế kiến trúc"]', '["Hành nghề tự do hoặc tự mở studio, công ty riêng", "Các doanh nghiệp thiết kế kiến trúc, thiết kế nội thất", "Các doanh nghiệp tư vấn thiết kế, giám sát, thi công xây dựng", "Cơ quan nhà nước về quản lí đô thị, qui hoạch đô thị", "Các viện nghiên cứu kiến trúc, thiết kế, qui hoạch kiến trúc và qui hoạch đô thị", "Các trường dạy về thiết kế kiến trúc xây dựng, qui hoạch đô thị"]', TRUE),
+    (88, 'Kiến trúc sư cảnh quan/ nhà thiết kế cảnh quan', 'AIR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kiến trúc sư cảnh quan, còn gọi là nhà thiết kế cảnh quan, qui hoạch, thiết kế, tổ chức thi công, quản lí, bảo dưỡng và phục hồi cảnh quan, đường nội bộ và không gian ngoài trời của các công trình nhà ở, văn phòng, nhà thương mại và công nghiệp, vườn hoa, công viên, khu du lịch, nghỉ dưỡng và giải trí. Họ đảm bảo rằng khu đất có công trình trông đẹp mắt và thân thiện với môi trường.', '["Thiết kế cảnh quan, vườn hoa, công viên", "Kiến trúc cảnh quan", "Thiết kế khu du lịch, nghỉ dưỡng, khu vực nghỉ ngơi giải trí"]', '["Khảo sát tổng thể, tìm hiểu nhu cầu của khách hàng và đưa ra đề xuất về phong cách và các khía cạnh khác của thiết kế tổng quan", "Làm việc với các kiến trúc sư, kĩ sư xây dựng, người làm vườn, chuyên gia quản lí nước và môi trường để thu thập thông tin về công trình, môi trường, đất, nước, đường di chuyển của mặt trời và bóng râm", "Quyết định cần trồng hoặc giữ loại thực vật nào", "Chuẩn bị bản vẽ tổng quan và chi tiết để bố trí địa điểm xây dựng, vườn hoa, mặt nước, đường đi bộ và chạy xe", "Chuẩn bị thông số kĩ thuật, dự toán và danh sách các tài liệu yêu cầu", "Giám sát thi công cảnh quan", "Quản lí thường xuyên cảnh quan khu vực"]', '["Hành nghề tự do hoặc tự mở studio, công ty riêng", "Các doanh nghiệp thiết kế kiến trúc, tư vấn thiết kế, giám sát, thi công xây dựng", "Các doanh nghiệp thiết kế cảnh quan", "Các công ty công viên cây xanh, các khu danh thắng, di tích, khu du lịch, khu đô thị", "Các doanh nghiệp, đơn vị tư vấn qui hoạch, thiết kế, thi công xây dựng và phát triển đô thị, thi công xây dựng cảnh quan", "Các cơ quan quản lí nhà nước về qui hoạch, xây dựng và quản lí đô thị, về cảnh quan và môi trường", "Các cơ quan nghiên cứu, đào tạo và chuyển giao công nghệ về kiến trúc cảnh quan trong và ngoài nước"]', TRUE),
+    (89, 'Nhà thiết kế sản phẩm/ Mỹ thuật công nghiệp', 'AER', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế sản phẩm, còn gọi là nhà thiết kế Mỹ thuật công nghiệp, thiết kế hình thức của các sản phẩm, chuẩn bị bản vẽ và các thông số của sản phẩm để đưa vào sản xuất. Trong khi các kĩ sư công nghiệp thiết kế kết cấu, chức năng hoạt động của máy móc, sản phẩm thì nhà thiết kế Mỹ thuật công nghiệp thiết kế kiểu dáng hình thức của máy móc, sản phẩm sao cho không chỉ đẹp mà còn hiệu quả và kinh tế.', '["Thiết kế trên máy tính", "Thiết kế máy móc thiết bị công nghiệp", "Thiết kế chuyên ngành cụ thể (như ô tô, nội thất, sản phẩm dệt may, thiết bị gia dụng)", "Thiết kế bao bì"]', '["Thảo luận với khách hàng và những người liên quan để xác định yêu cầu và mục đích của sản phẩm", "Hình thành ý tưởng thiết kế sản phẩm", "Cân đối yếu tố thẩm mĩ với các yêu cầu kĩ thuật, tính năng, sinh thái và sản xuất", "Chuẩn bị bản phác thảo, sơ đồ, minh họa, kế hoạch, mẫu và mô hình để thể hiện ý tưởng thiết kế", "Thảo luận và thống nhất phương án thiết kế với khách hàng, lãnh đạo, nhân viên bán hàng và nhân viên sản xuất", "Xác định, lựa chọn và đề xuất chất liệu đảm bảo tính năng và thẩm mĩ, phương pháp sản xuất và hoàn thiện để đưa sản phẩm vào sản xuất", "Thiết kế chi tiết và viết hướng dẫn cho thiết kế được chọn để sản xuất", "Làm mô hình và sản phẩm mẫu", "Giám sát quá trình chuẩn bị vật liệu công cụ và sản xuất sản phẩm"]', '["Hầu như tất cả các doanh nghiệp sản xuất, chế tạo máy móc, sản phẩm đều cần nhà thiết kế Mỹ thuật công nghiệp", "Các công ty thời trang", "Các doanh nghiệp sản xuất hàng tiêu dùng", "Các đơn vị tổ chức trình diễn thời trang, sản phẩm"]', TRUE),
+    (90, 'Nhà thiết kế thời trang', 'AER', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế thời trang thiết kế áo quần, giày dép, phụ kiện và tạo ra những bộ sưu tập và dòng sản phẩm thời trang. Họ vẽ phác thảo, lựa chọn chất liệu, hoa văn, và chỉ dẫn cách sản xuất sản phẩm vừa thiết kế.', '["Thiết kế chuyên sâu theo nhóm sản phẩm cụ thể (như thời trang nữ/ nam/ trẻ em, đồ công sở, dạ hội, áo dài/ trang phục truyền thống, đồ thể thao, phụ kiện…)", "Thiết kế giày dép", "Thiết kế trang sức và kim hoàn", "Thiết kế trang phục da và đồ da", "Tiếp thị và bán hàng thời trang", "Truyền thông về thời trang"]', '["Thiết kế hàng may mặc theo xu hướng thời trang", "Phát triển dòng sản phẩm thời trang với màu sắc và chất liệu đặc trưng", "Dự các buổi trình diễn thời trang và xem đánh giá của các tạp chí nhằm thu thập thông tin về các xu hướng thời trang và sở thích của người tiêu dùng", "Thiết kế trang phục và phụ kiện cho các cá nhân, các nhà bán lẻ hoặc sân khấu, truyền hình, nhà sản xuất phim", "Vẽ mẫu cho các thiết kế và cắt theo mẫu", "Thử sản phẩm trên người mẫu và ma-nơ-canh, sau đó chỉnh sửa thiết kế để đạt được hiệu quả mong muốn", "Điều chỉnh ý tưởng thiết kế cho phù hợp với thị trường đại chúng", "Thảo luận ý tưởng thiết kế với nhân viên và người quản trị bán hàng hoặc khách hàng", "Định giá sản phẩm thiết kế"]', '["Hành nghề tự do hoặc mở studio, cửa hàng riêng", "Các doanh nghiệp thiết kế, sản xuất hàng dệt may, thời trang", "Các doanh nghiệp xuất nhập khẩu, phân phối hàng dệt may, thời trang", "Các đơn vị tổ chức trình diễn thời trang và xuất bản tạp chí thời trang", "Các nhà sản xuất phim và chương trình truyền hình", "Các nhà hát, đoàn nghệ thuật biểu diễn", "Các cơ quan quản lí nhà nước ngành dệt may", "Các viện, trung tâm nghiên cứu phát triển dệt may"]', TRUE),
+    (91, 'Nhà trắc địa bản đồ', 'IRC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin; Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà trắc địa bản đồ sử dụng các phương pháp và kĩ thuật khảo sát để xác định vị trí chính xác của các phân vùng tự nhiên, phân vùng xây dựng, ranh giới đất, nước, trong lòng đất, xây dựng và chỉnh sửa bản đồ kĩ thuật số, đồ họa và ảnh.', '["Trắc địa bản đồ", "Trắc địa công trình", "Trắc địa mỏ", "Trắc địa biển", "Viễn thám", "Trắc địa ảnh", "Hệ thống thông tin địa lí", "Khảo sát và vẽ bản đồ", "Kĩ thuật công nghệ trắc địa"]', '["Khảo sát, đo đạc và mô tả bề mặt đất cho các mục đích khác nhau, như vẽ bản đồ và xác định ranh giới các khu đất", "Khảo sát thăm dò mỏ, phân tách các tầng trong lòng đất, đánh dấu vị trí chính xác của các phân tầng khác nhau và thiết lập biểu đồ, bản đồ để kiểm soát hướng và qui mô mỏ", "Khảo sát đáy biển, đáy sông hồ, phân tách các tầng dưới nước, đánh dấu vị trí chính xác của các phân tầng khác nhau và thiết lập biểu đồ, bản đồ để xác định các luồng lạch và luồng thông thuyền", "Tiến hành chụp ảnh trên không, viễn thám và khảo sát dữ liệu để xây dựng và sửa đổi bản đồ địa hình, các biểu đồ, bản đồ tiện ích và bản đồ chuyên biệt khác", "Nghiên cứu và tư vấn về kĩ thuật, thẩm mĩ và kinh tế trong việc sản xuất bản đồ"]', '["Cơ quan khí tượng thủy văn", "Cơ quan trắc địa, bản đồ", "Các doanh nghiệp, đơn vị thăm dò khảo sát dầu khí, khảo sát biển và công trình biển"]', TRUE),
+    (92, 'Nhà thiết kế đồ họa và truyền thông đa phương tiện', 'ARE', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế đồ họa và truyền thông đa phương tiện thiết kế nội dung hình ảnh và âm thanh để truyền thông dưới dạng in ấn, phim, điện tử, kĩ thuật số và các phương tiện nghe nhìn khác. Họ tạo ra đồ họa, hiệu ứng đặc biệt, hình ảnh động và các hình ảnh khác để sử dụng trong trò chơi điện tử, phim ảnh, video, bản in và quảng cáo.', '["Thiết kế in ấn", "Thiết kế trang web", "Thiết kế quảng cáo", "Đồ họa video", "Hoạt họa", "Hiệu ứng đặc biệt", "Truyền thông kĩ thuật số", "Xuất bản điện tử (sách, báo, video, nhạc)"]', '["Thảo luận với khách hàng và những người liên quan để xác định và phân tích yêu cầu và mục tiêu truyền thông", "Hình thành ý tưởng thiết kế cho đối tượng cần truyền thông", "Chuẩn bị bản phác thảo, sơ đồ, minh họa và bản trình bày ý tưởng", "Thảo luận và thống nhất phương án thiết kế với khách hàng, lãnh đạo, nhân viên bán hàng và nhân viên sản xuất", "Thiết kế các đồ họa tĩnh và động để đáp ứng các yêu cầu về chức năng, thẩm mĩ và sáng tạo của khách hàng", "Tạo ra hình ảnh 2D và 3D để minh hoạt vật thể chuyển động hoặc quá trình diễn ra bằng các phần mềm máy tính", "Xác định, lựa chọn và đề xuất chất liệu đảm bảo tính năng và thẩm mĩ, phương tiện phát hành, chuyển giao và trình diễn", "Thiết kế chi tiết và viết hướng dẫn cho sản xuất", "Triển khai sản xuất hoặc giám sát sản xuất"]', '["Hành nghề tự do hoặc tự mở studio, công ti", "Các doanh nghiệp xuất bản, in, thiết kế ấn phẩm, quảng cáo", "Các doanh nghiệp truyền thông, tổ chức sự kiện", "Các doanh nghiệp sản xuất video, phim", "Các đài truyền hình", "Nhà hát và các buổi hòa nhạc trực tiếp"]', TRUE),
+    (93, 'Nhà nhiếp ảnh', 'AR', 'Hình học - màu sắc - thiết kế', 'Tương tác với người khác', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Nhà nhiếp ảnh sử dụng khả năng tư duy, sáng tạo của bản thân và các kĩ thuật của máy ảnh để chụp ảnh. Họ có thể chụp hình ảnh tĩnh và động, sử dụng máy ảnh, máy quay video và các thiết bị khác để ghi lại và chỉnh sửa cả hình ảnh và âm thanh.', '["Nhiếp ảnh thời trang", "Nhiếp ảnh công nghiệp", "Nhiếp ảnh y tế", "Nhiếp ảnh báo chí", "Nhiếp ảnh sản phẩm", "Nhiếp ảnh du lịch, thiên nhiên hoang dã"]', '["Chụp ảnh phục vụ mục đích quảng cáo, nghệ thuật, thương mại, công nghiệp, khoa học", "Chụp ảnh minh họa cho tin tức và bài viết trên báo, tạp chí và các ấn phẩm khác", "Chụp ảnh một hay một nhóm người", "Bố trí và thực hiện ảnh động, video, chụp ảnh qua kính hiển vi và thiết bị chuyên dụng, kể cả chụp ảnh trên không"]', '["Hành nghề tự do hoặc mở studio, cửa hàng riêng", "Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện", "Báo và tạp chí", "Xưởng phim điện ảnh và truyền hình", "Các doanh nghiệp in ấn, xuất bản", "Các trung tâm nghiên cứu"]', TRUE),
+    (94, 'Nhà thiết kế và trang trí nội thất', 'AE', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Hình học - màu sắc - thiết kế', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế và trang trí nội thất khảo sát mặt bằng, thiết kế nội thất và ngoại thất, đồ dùng và đồ trang trí nhà ở, nhà thương mại, công trình công cộng và công nghiệp để làm cho công trình đẹp, tiện nghi và thoải mái cho cuộc sống và công việc. Họ cũng phối hợp và tham gia xây dựng và hoàn thiện công trình. Họ cũng có thể thiết kế các sản phẩm đồ gỗ nội thất, đồ gia dụng và trang trí để sản xuất phục vụ tiêu dùng nội địa và xuất khẩu.', '["Thiết kế sản phẩm đồ gỗ nội thất, đồ gia dụng và phụ kiện", "Thiết kế nội ngoại thất gia dụng, văn phòng, tòa nhà thương mại, công trình công nghiệp", "Thiết kế sân khấu, điện ảnh"]', '["Khảo sát mặt bằng và tìm hiểu yêu cầu và sở thích của khách hàng", "Làm bản vẽ trang trí nội thất và ngoại thất cho nhà ở, công trình xây dựng, xe hơi, máy bay, tàu và những công trình khác", "Thiết kế và vẽ cảnh trang trí sân khấu, điện ảnh, truyền hình", "Phối hợp với nhà thầu để triển khai thi công và hoàn thiện phù hợp với bản vẽ, thông số kĩ thuật và chất lượng", "Sáng tạo và thực hiện các"]', '["Hành nghề tự do hoặc tự mở công ti", "Các doanh nghiệp, cơ sở sản xuất đồ gỗ, đồ gia dụng và trang trí nội ngoại thất", "Các doanh nghiệp thiết kế kiến trúc, tư vấn thiết kế, giám sát, xây dựng", "Khách sạn, khu nghỉ dưỡng, nhà khách", "Các doanh nghiệp sản xuất phim, chương trình truyền hình", "Nhà hát, đoàn kịch", "Đài truyền hình"]', TRUE),
+    (95, 'Nhà thiết kế thủ công mĩ nghệ', 'ARE', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế thủ công mĩ nghệ thiết kế các sản phẩm thủ công mĩ nghệ để đảm bảo hài hòa các giá trị thẩm mĩ, văn hóa, công năng và phù hợp với các đối tượng khách hàng. Thủ công mĩ nghệ là một nét văn hóa. Mỗi nhóm dân tộc, mỗi địa phương đều có các nghề thủ công của mình. Sản phẩm thủ công mĩ nghệ đã xuất hiện từ lâu đời để phục vụ các mục đích truyền thống. Ngày nay, các doanh nghiệp và nhà nước mong muốn phát triển các sản phẩm thủ công mĩ nghệ vừa có nét truyền thống vừa phù hợp với đối tượng và nhu cầu sử dụng rộng rãi hơn.', '["Thiết kế chuyên sâu theo loại sản phẩm (như đồ dệt may, đồ gỗ, sơn mài, khảm trai, đồ đá, gốm sứ, thủy tinh)", "Kinh doanh tiếp thị sản phẩm thủ công mĩ nghệ"]', '["Xác định các sản phẩm tiêu dùng có thể thiết kế và sản xuất theo phương pháp thủ công mĩ nghệ", "Thiết kế sản phẩm thủ công mĩ nghệ có các tính năng mà nhiều đối tượng khách hàng có thể sử dụng", "Thiết kế lại hàng thủ công mĩ nghệ truyền thống để phù hợp hơn với các thị trường và khách hàng đa dạng hơn", "Giới thiệu các giá trị truyền thống và tính năng hiện đại để quảng bá mở rộng thị trường cho các mặt hàng thủ công mĩ nghệ", "Tổ chức các nghệ nhân thủ công mĩ nghệ thành các nhóm sản xuất hoặc hợp tác xã, hướng dẫn họ qui trình sản xuất các sản phẩm mẫu mới"]', '["Hành nghề tự do hoặc tự mở xưởng, cửa hàng, công ti", "Các cơ sở, doanh nghiệp sản xuất và mua bán hàng thủ công mĩ nghệ", "Các tổ chức trong nước và quốc tế về bảo tồn, phát triển nghề truyền thống", "Các cửa hàng bán sản phẩm thủ công mĩ nghệ, đồ lưu niệm"]', TRUE),
+    (96, 'Nghệ sĩ Mỹ thuật', 'AR', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Nghệ sĩ Mỹ thuật là người tạo ra các tác phẩm nghệ thuật thông qua các phương tiện khác nhau như màu vẽ, điêu khắc, nhiếp ảnh, sắp đặt vật thể… Nghệ sĩ Mỹ thuật có khả năng biến ý tưởng, suy nghĩ, thông điệp thành hình dạng cụ thể cho người khác thưởng thức.', '["Chuyên sâu theo loại hình Mỹ thuật (như hội họa, điêu khắc, nhiếp ảnh) hoặc kĩ thuật (như bột màu, màu nước, sơn dầu)"]', '["Sáng tác tác phẩm theo một loại hình Mỹ thuật cụ thể (như điêu khắc, hội họa, nhiếp ảnh), bằng các công cụ, vật liệu và phương tiện của loại hình Mỹ thuật đó", "Quan hệ với các đại lí và nhà kinh doanh tác phẩm nghệ thuật", "Tổ chức triển lãm tác phẩm"]', '["Hành nghề tự do", "Mở studio riêng", "Giảng dạy tại các trường Mỹ thuật, trung tâm văn hóa nghệ thuật", "Giảng dạy môn Mỹ thuật tại các trường phổ thông", "Dạy và hỗ trợ trẻ có nhu cầu đặc biệt tại trường khuyết tật"]', TRUE),
+    (97, 'Nhà thiết kế quảng cáo', 'ARE', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Ngôn ngữ', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Nhà thiết kế quảng cáo đưa ra ý tưởng, vẽ và thiết kế nên các hình ảnh mang tính biểu tượng để truyền tải thông điệp trong quảng cáo truyền thông. Mục tiêu là quảng bá sản phẩm, dịch vụ và ý tưởng đến cho người xem. Các hình ảnh và cách trình bày trong các quảng cáo, các lô-gô, biểu tượng của doanh nghiệp và tổ chức là sản phẩm trí tuệ của nhà thiết kế quảng cáo.', '["Quảng cáo và minh hoạ", "Thiết kế thương hiệu", "Thiết kế đồ họa", "Thiết kế đồ họa hoạt hình", "Thiết kế sách và tạp chí", "Biếm họa", "Thiết lập và thiết kế triển lãm"]', '["Thảo luận với khách hàng để xác định và phân tích mục tiêu, yêu cầu, sản phẩm và ý tưởng quảng cáo", "Hình thành ý tưởng thiết kế", "Chuẩn bị các bản phác thảo, minh họa để thể hiện ý tưởng bằng cách vẽ tay hoặc sử dụng phần mềm trên máy tính", "Trình bày và thống nhất mẫu phác thảo với khách hàng", "Thiết kế chi tiết, chỉnh sửa và hoàn thiện theo yêu cầu của khách hàng", "Triển khai sản xuất hoặc giám sát sản xuất sản phẩm quảng cáo nếu cần"]', '["Hành nghề tự do hoặc tự mở cơ sở, studio", "Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện", "Các doanh nghiệp thiết kế đồ họa", "Các doanh nghiệp sản xuất video, phim", "Các nhà xuất bản, tờ báo, tạp chí, đài truyền hình", "Các nhà sản xuất và tập đoàn lớn"]', TRUE),
+    (98, 'Nhà quay phim', 'EAS', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin; Tương tác với người khác', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Nhà quay phim là người ghi hình bộ phim, video, tác phẩm sân khấu, chương trình truyền hình và các sự kiện xã hội hay gia đình. Họ cũng cần đảm bảo rằng có sự phối hợp giữa các diễn viên và đội ngũ ghi hình. Các nhà quay phim là đạo diễn hình ảnh và đảm bảo rằng hành động được ghi lại chính xác.', '["Quay phim trên không", "Quay phim dưới nước", "Quay phim kĩ thuật số", "Quay phim tài liệu, điện ảnh, tác phẩm sân khấu, ca nhạc", "Quay phim báo chí truyền hình", "Quay phim sự kiện xã hội, gia đình"]', '["Bố trí, vận hành và giám sát hoạt động của máy quay, máy ảnh, phụ kiện và ánh sáng để ghi hình", "Chuẩn bị tình huống bấm máy để bắt đầu ghi hình", "Lựa chọn phim tư liệu (từ các phim dự trữ có sẵn với khả năng thay đổi độ sáng và màu sắc), và kiểm soát việc lựa chọn ống kính với độ dài tiêu cự, khẩu độ tiếp xúc và lấy nét cho phù hợp", "Tính toán các chủng loại, số lượng các thiết bị chiếu sáng và phụ kiện một cách cụ thể", "Chiếu sáng vị trí quay phim hoặc thiết lập vị trí quay phim với ánh sáng có sẵn, hoặc ánh sáng ban ngày", "Xây dựng kế hoạch sử dụng ánh sáng, gel, bộ lọc, tiếp xúc, độ dài tiêu cự, lấy nét, tỉ lệ khung hình...", "Đặt máy quay ở vị trí thích hợp liên quan đến các diễn viên/ đối tượng ghi hình, hành động và địa điểm", "Làm việc, trao đổi cụ thể với giám đốc sản xuất để đảm bảo đạt được các yếu tố về nghệ thuật", "Hướng dẫn cụ thể quá trình xử lí, in bộ phim và chuyển sang video (nếu cần)"]', '["Hành nghề tự do hoặc tự mở cơ sở, studio", "Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện, tổ chức biểu diễn", "Các doanh nghiệp sản xuất video, phim", "Các đài truyền hình", "Bộ phận truyền thông của cơ quan, tổ chức, doanh nghiệp lớn"]', TRUE),
+    (99, 'Người làm vườn, vườn ươm và trồng hoa, cây cảnh', 'RC', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Người làm vườn, vườn ươm và trồng hoa, cây cảnh lập kế hoạch và thực hiện các hoạt động cần thiết để trồng và chăm sóc hoa và cây trồng tạo cảnh quan. Họ cũng có thể sản xuất cây, củ và hạt giống để cung cấp cho thương lái, doanh nghiệp bán buôn, bán lẻ hoặc trực tiếp bán ra thị trường.', '["Sản xuất giống", "Trồng hoa", "Trồng cây cảnh", "Chăm sóc vườn hoa cây cảnh ", "Quản lí cây xanh đô thị"]', '["Xác định chủng loại, số lượng cây giống và các sản phẩm để ươm, trồng", "Mua hạt, củ, phân bón, vật tư khác", "Đầu tư cải tạo đất đai, nhà vườn, kho xưởng, máy móc thiết bị, nuôi động vật để phục vụ trồng trọt", "Thực hiện các hoạt động nông nghiệp như làm đất, gieo hạt, trồng, làm cỏ, bón phân, cắt tỉa cho hoa và các cây trồng khác", "Sản xuất cây giống, củ và hạt", "Trồng hoa, cây, cây bụi và cây trồng khác trong công viên, vườn công cộng hoặc tư nhân", "Trồng cây cho triển lãm hoặc cho mục đích y tế", "Cung cấp và tiếp thị sản phẩm cây, hoa và giống cây, hoa", "Thu hoạch, lưu trữ và xử lí cơ bản sản phẩm nếu cần", "Chăm sóc động vật phục vụ trồng trọt và bảo trì nhà vườn, kho xưởng và máy móc thiết bị"]', '["Vườn bách thảo và công viên", "Các khu đô thị", "Các vườn ươm, cơ sở, doanh nghiệp sản xuất giống, hoa và cây cảnh", "Doanh nghiệp công viên cây xanh", "Viện nghiên cứu về cây trồng", "Nhận chăm sóc vườn tại hộ gia đình, tổ chức", "Tự làm vườn hoa, cây cảnh, sản xuất giống"]', TRUE),
+    (100, 'Nhà thiết kế trang sức', 'RAC', 'Hình học - màu sắc - thiết kế', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Điều kiện làm việc', 'Nhà thiết kế trang sức áp dụng các nguyên tắc nghệ thuật và khoa học để thiết kế các sản phẩm kim hoàn, đồ trang sức phục vụ cho trang điểm, nghi lễ, tôn giáo hoặc công nghiệp.', '["Định hình đá quý", "Mạ điện", "Khắc và tráng men", "Đánh bóng và hoàn thiện", "Phân loại đá quý", "Thiết kế trang sức", "Tiếp thị và trưng bày đồ trang sức", "Gia công đá quý"]', '["Thiết kế các sản phẩm trang sức hoàn chỉnh như nhẫn, dây chuyền, vòng đeo tay, trâm cài đầu từ các vật liệu như vàng, bạc, bạch kim, đá quý, đá nhân tạo", "Đúc, đánh đồ trang sức và các sản phẩm kim loại màu khác bằng kĩ thuật thủ công", "Thiết kế đồ trang sức mới và sửa đổi thiết kế hiện tại, có thể sử dụng máy tính khi cần thiết", "Thiết kế khuôn đúc để sử dụng trong chế tác đồ trang sức", "Tái chế, điều chỉnh, sửa chữa đồ trang sức cũ hoặc đồ kim hoàn theo thiết kế hoặc hướng dẫn", "Kiểm tra bề mặt đá quý và kết cấu bên trong bằng các phương pháp như đo khúc xạ, soi kính hiển vi và các công cụ khác để phân biệt các loại đá, xác định các mẫu đá quý hiếm và phát hiện vết ảnh hưởng tới giá trị đá quý", "Mài, khoan và hoàn thiện đá để sử dụng trong các thiết bị đo như la bàn và máy đo thời gian"]', '["Các xưởng, công ty sản xuất, chế tác kim hoàn, đồ trang sức", "Các doanh nghiệp vàng bạc, đá quý", "Các doanh nghiệp thiết kế thời trang", "Hành nghề tự do hoặc mở studio, cửa hàng riêng"]', TRUE);
+
+INSERT INTO job_search_tokens (token, job_id, weight) VALUES
+    ('ki', 51, 15),
+    ('su', 51, 9),
+    ('xay', 51, 18),
+    ('dung', 51, 21),
+    ('phan', 51, 4),
+    ('tich', 51, 4),
+    ('logic', 51, 4),
+    ('cong', 51, 11),
+    ('nghe', 51, 6),
+    ('thuat', 51, 6),
+    ('vat', 51, 3),
+    ('lieu', 51, 2),
+    ('trinh', 51, 3),
+    ('dan', 51, 2),
+    ('va', 51, 3),
+    ('nghiep', 51, 2),
+    ('cac', 51, 2),
+    ('ap', 51, 1),
+    ('toan', 51, 1),
+    ('hoc', 51, 2),
+    ('li', 51, 1),
+    ('hoa', 51, 1),
+    ('de', 51, 1),
+    ('nha', 51, 2),
+    ('o', 51, 1),
+    ('thuong', 51, 1),
+    ('mai', 51, 1),
+    ('duong', 51, 2),
+    ('giao', 51, 1),
+    ('thong', 51, 2),
+    ('cau', 51, 1),
+    ('dap', 51, 1),
+    ('nuoc', 51, 3),
+    ('mang', 51, 2),
+    ('luoi', 51, 2),
+    ('cap', 51, 1),
+    ('thoat', 51, 1),
+    ('ben', 51, 2),
+    ('cang', 51, 1),
+    ('kenh', 51, 1),
+    ('rach', 51, 1),
+    ('san', 51, 1),
+    ('bay', 51, 1),
+    ('he', 51, 1),
+    ('sat', 51, 1),
+    ('ki', 52, 11),
+    ('su', 52, 9),
+    ('o', 52, 15),
+    ('to', 52, 15),
+    ('phan', 52, 4),
+    ('tich', 52, 4),
+    ('logic', 52, 4),
+    ('cong', 52, 5),
+    ('nghe', 52, 4),
+    ('thuat', 52, 2),
+    ('thiet', 52, 1),
+    ('ke', 52, 1),
+    ('thu', 52, 1),
+    ('nghiem', 52, 1),
+    ('phat', 52, 1),
+    ('trien', 52, 1),
+    ('va', 52, 2),
+    ('chi', 52, 1),
+    ('dao', 52, 1),
+    ('san', 52, 1),
+    ('xuat', 52, 1),
+    ('cac', 52, 1),
+    ('loai', 52, 1),
+    ('nhu', 52, 2),
+    ('xe', 52, 5),
+    ('hoi', 52, 1),
+    ('tai', 52, 1),
+    ('buyt', 52, 1),
+    ('bon', 52, 1),
+    ('dua', 52, 1),
+    ('ho', 52, 1),
+    ('giup', 52, 1),
+    ('nganh', 52, 1),
+    ('nghiep', 52, 1),
+    ('dap', 52, 1),
+    ('ung', 52, 1),
+    ('nhung', 52, 1),
+    ('yeu', 52, 1),
+    ('cau', 52, 1),
+    ('moi', 52, 2),
+    ('tang', 52, 1),
+    ('do', 52, 1),
+    ('an', 52, 1),
+    ('toan', 52, 1),
+    ('tiet', 52, 1),
+    ('kiem', 52, 1),
+    ('nhien', 52, 1),
+    ('lieu', 52, 1),
+    ('tieu', 52, 1),
+    ('chuan', 52, 1),
+    ('truong', 52, 1),
+    ('ki', 53, 18),
+    ('su', 53, 9),
+    ('co', 53, 14),
+    ('khi', 53, 11),
+    ('phan', 53, 4),
+    ('tich', 53, 4),
+    ('logic', 53, 4),
+    ('cong', 53, 12),
+    ('nghe', 53, 10),
+    ('thuat', 53, 9),
+    ('che', 53, 2),
+    ('tao', 53, 2),
+    ('may', 53, 3),
+    ('dien', 53, 2),
+    ('tu', 53, 2),
+    ('o', 53, 2),
+    ('to', 53, 2),
+    ('nhiet', 53, 2),
+    ('lam', 53, 1),
+    ('viec', 53, 1),
+    ('lien', 53, 1),
+    ('quan', 53, 1),
+    ('toi', 53, 1),
+    ('qua', 53, 2),
+    ('trinh', 53, 1),
+    ('lap', 53, 1),
+    ('dat', 53, 1),
+    ('van', 53, 2),
+    ('hanh', 53, 1),
+    ('va', 53, 2),
+    ('bao', 53, 1),
+    ('tri', 53, 1),
+    ('moc', 53, 1),
+    ('trong', 53, 1),
+    ('cac', 53, 2),
+    ('nganh', 53, 1),
+    ('nghiep', 53, 1),
+    ('ho', 53, 1),
+    ('giai', 53, 1),
+    ('quyet', 53, 1),
+    ('de', 53, 2),
+    ('hang', 53, 1),
+    ('ngay', 53, 1),
+    ('nang', 53, 2),
+    ('cao', 53, 1),
+    ('hieu', 53, 1),
+    ('suat', 53, 1),
+    ('ki', 54, 15),
+    ('su', 54, 12),
+    ('hoa', 54, 19),
+    ('hoc', 54, 18),
+    ('phan', 54, 4),
+    ('tich', 54, 4),
+    ('logic', 54, 4),
+    ('cong', 54, 3),
+    ('nghe', 54, 2),
+    ('thuat', 54, 5),
+    ('ap', 54, 1),
+    ('dung', 54, 2),
+    ('cac', 54, 6),
+    ('kien', 54, 1),
+    ('thuc', 54, 1),
+    ('vat', 54, 2),
+    ('li', 54, 1),
+    ('va', 54, 2),
+    ('toan', 54, 1),
+    ('de', 54, 1),
+    ('bien', 54, 1),
+    ('doi', 54, 1),
+    ('chat', 54, 2),
+    ('trong', 54, 2),
+    ('nguyen', 54, 1),
+    ('lieu', 54, 2),
+    ('tong', 54, 1),
+    ('hop', 54, 1),
+    ('thanh', 54, 1),
+    ('dang', 54, 1),
+    ('huu', 54, 1),
+    ('ich', 54, 1),
+    ('hon', 54, 2),
+    ('hoac', 54, 1),
+    ('co', 54, 1),
+    ('gia', 54, 1),
+    ('tri', 54, 1),
+    ('vi', 54, 1),
+    ('du', 54, 1),
+    ('nhu', 54, 1),
+    ('xang', 54, 1),
+    ('dau', 54, 1),
+    ('cao', 54, 1),
+    ('cung', 54, 1),
+    ('tao', 54, 1),
+    ('ra', 54, 1),
+    ('loai', 54, 1),
+    ('moi', 54, 1),
+    ('duoc', 54, 1),
+    ('nganh', 54, 1),
+    ('nghiep', 54, 1),
+    ('khac', 54, 1),
+    ('ki', 55, 13),
+    ('su', 55, 9),
+    ('luyen', 55, 21),
+    ('kim', 55, 25),
+    ('phan', 55, 4),
+    ('tich', 55, 4),
+    ('logic', 55, 4),
+    ('gang', 55, 2),
+    ('thep', 55, 2),
+    ('mau', 55, 2),
+    ('den', 55, 2),
+    ('ferro', 55, 2),
+    ('hop', 55, 3),
+    ('cong', 55, 11),
+    ('nghe', 55, 11),
+    ('san', 55, 2),
+    ('xuat', 55, 2),
+    ('alumin', 55, 2),
+    ('nhiet', 55, 2),
+    ('duc', 55, 2),
+    ('loai', 55, 9),
+    ('can', 55, 2),
+    ('keo', 55, 2),
+    ('thuat', 55, 4),
+    ('vat', 55, 6),
+    ('lieu', 55, 4),
+    ('la', 55, 1),
+    ('chuyen', 55, 1),
+    ('gia', 55, 1),
+    ('ve', 55, 1),
+    ('che', 55, 1),
+    ('tao', 55, 1),
+    ('va', 55, 3),
+    ('van', 55, 1),
+    ('dung', 55, 2),
+    ('cac', 55, 2),
+    ('nguyen', 55, 1),
+    ('tac', 55, 1),
+    ('li', 55, 3),
+    ('de', 55, 1),
+    ('xu', 55, 1),
+    ('tuy', 55, 1),
+    ('theo', 55, 1),
+    ('muc', 55, 1),
+    ('dich', 55, 1),
+    ('ung', 55, 1),
+    ('ho', 55, 1),
+    ('nghien', 55, 1),
+    ('cuu', 55, 1),
+    ('tinh', 55, 1),
+    ('chat', 55, 1),
+    ('hoa', 55, 1),
+    ('hoc', 55, 1),
+    ('cua', 55, 1),
+    ('ki', 56, 13),
+    ('su', 56, 10),
+    ('vat', 56, 16),
+    ('lieu', 56, 16),
+    ('phan', 56, 4),
+    ('tich', 56, 4),
+    ('logic', 56, 4),
+    ('cong', 56, 3),
+    ('nghe', 56, 2),
+    ('thuat', 56, 4),
+    ('kim', 56, 3),
+    ('loai', 56, 4),
+    ('nghien', 56, 1),
+    ('cuu', 56, 1),
+    ('cac', 56, 3),
+    ('tinh', 56, 1),
+    ('chat', 56, 2),
+    ('cua', 56, 1),
+    ('nhung', 56, 1),
+    ('tu', 56, 1),
+    ('nhien', 56, 1),
+    ('va', 56, 3),
+    ('tong', 56, 1),
+    ('hop', 56, 1),
+    ('nhu', 56, 1),
+    ('gom', 56, 1),
+    ('polymer', 56, 1),
+    ('go', 56, 1),
+    ('nguon', 56, 1),
+    ('tai', 56, 1),
+    ('nguyen', 56, 1),
+    ('khac', 56, 1),
+    ('nham', 56, 1),
+    ('nang', 56, 1),
+    ('cao', 56, 1),
+    ('luong', 56, 1),
+    ('cho', 56, 1),
+    ('ung', 56, 1),
+    ('dung', 56, 1),
+    ('nghiep', 56, 1),
+    ('thuong', 56, 1),
+    ('mai', 56, 1),
+    ('ki', 57, 12),
+    ('su', 57, 10),
+    ('dien', 57, 25),
+    ('phan', 57, 4),
+    ('tich', 57, 4),
+    ('logic', 57, 4),
+    ('cong', 57, 5),
+    ('nghiep', 57, 2),
+    ('va', 57, 5),
+    ('dan', 57, 2),
+    ('dung', 57, 3),
+    ('he', 57, 2),
+    ('thong', 57, 2),
+    ('nhiet', 57, 2),
+    ('thuy', 57, 2),
+    ('nghe', 57, 2),
+    ('thuat', 57, 2),
+    ('tu', 57, 2),
+    ('lam', 57, 1),
+    ('viec', 57, 2),
+    ('co', 57, 1),
+    ('lien', 57, 1),
+    ('quan', 57, 1),
+    ('toi', 57, 1),
+    ('phat', 57, 1),
+    ('truyen', 57, 1),
+    ('tai', 57, 1),
+    ('ho', 57, 1),
+    ('lap', 57, 1),
+    ('dat', 57, 1),
+    ('van', 57, 1),
+    ('hanh', 57, 1),
+    ('duy', 57, 1),
+    ('tri', 57, 1),
+    ('mang', 57, 1),
+    ('luoi', 57, 1),
+    ('cung', 57, 1),
+    ('la', 57, 1),
+    ('nhung', 57, 1),
+    ('chuyen', 57, 1),
+    ('gia', 57, 2),
+    ('ve', 57, 1),
+    ('cac', 57, 3),
+    ('mach', 57, 1),
+    ('trong', 57, 1),
+    ('san', 57, 1),
+    ('pham', 57, 1),
+    ('nhu', 57, 1),
+    ('may', 57, 1),
+    ('tinh', 57, 1),
+    ('thiet', 57, 1),
+    ('bi', 57, 1),
+    ('ki', 58, 19),
+    ('su', 58, 9),
+    ('dien', 58, 25),
+    ('tu', 58, 22),
+    ('phan', 58, 4),
+    ('tich', 58, 4),
+    ('logic', 58, 4),
+    ('thuat', 58, 11),
+    ('co', 58, 4),
+    ('cong', 58, 6),
+    ('nghe', 58, 6),
+    ('truyen', 58, 2),
+    ('thong', 58, 3),
+    ('cac', 58, 3),
+    ('nghien', 58, 1),
+    ('cuu', 58, 1),
+    ('thiet', 58, 1),
+    ('ke', 58, 1),
+    ('va', 58, 3),
+    ('chi', 58, 1),
+    ('dao', 58, 1),
+    ('xay', 58, 1),
+    ('dung', 58, 1),
+    ('bao', 58, 1),
+    ('duong', 58, 1),
+    ('sua', 58, 1),
+    ('chua', 58, 1),
+    ('he', 58, 1),
+    ('tim', 58, 1),
+    ('hieu', 58, 1),
+    ('van', 58, 2),
+    ('ve', 58, 1),
+    ('de', 58, 1),
+    ('ky', 58, 1),
+    ('cua', 58, 1),
+    ('vat', 58, 1),
+    ('lieu', 58, 1),
+    ('san', 58, 1),
+    ('pham', 58, 1),
+    ('hay', 58, 1),
+    ('qua', 58, 1),
+    ('trinh', 58, 1),
+    ('che', 58, 1),
+    ('tao', 58, 1),
+    ('ki', 59, 13),
+    ('su', 59, 9),
+    ('vien', 59, 13),
+    ('thong', 59, 16),
+    ('phan', 59, 4),
+    ('tich', 59, 4),
+    ('logic', 59, 4),
+    ('cong', 59, 4),
+    ('nghe', 59, 4),
+    ('dien', 59, 4),
+    ('tu', 59, 6),
+    ('phat', 59, 2),
+    ('song', 59, 2),
+    ('thuat', 59, 4),
+    ('truyen', 59, 2),
+    ('cac', 59, 3),
+    ('tien', 59, 1),
+    ('hanh', 59, 2),
+    ('nghien', 59, 2),
+    ('cuu', 59, 2),
+    ('van', 59, 4),
+    ('thiet', 59, 2),
+    ('ke', 59, 1),
+    ('chi', 59, 1),
+    ('dao', 59, 1),
+    ('viec', 59, 1),
+    ('xay', 59, 1),
+    ('dung', 59, 1),
+    ('bao', 59, 1),
+    ('duong', 59, 1),
+    ('va', 59, 3),
+    ('sua', 59, 1),
+    ('chua', 59, 1),
+    ('he', 59, 1),
+    ('bi', 59, 1),
+    ('ho', 59, 1),
+    ('ve', 59, 1),
+    ('de', 59, 1),
+    ('cua', 59, 1),
+    ('vat', 59, 1),
+    ('lieu', 59, 1),
+    ('san', 59, 1),
+    ('pham', 59, 1),
+    ('hay', 59, 1),
+    ('qua', 59, 1),
+    ('trinh', 59, 1),
+    ('ki', 60, 14),
+    ('su', 60, 11),
+    ('vu', 60, 13),
+    ('tru', 60, 13),
+    ('hang', 60, 12),
+    ('khong', 60, 12),
+    ('phan', 60, 4),
+    ('tich', 60, 4),
+    ('logic', 60, 4),
+    ('thuat', 60, 3),
+    ('la', 60, 1),
+    ('chuyen', 60, 1),
+    ('gia', 60, 1),
+    ('trong', 60, 1),
+    ('viec', 60, 2),
+    ('thiet', 60, 2),
+    ('ke', 60, 1),
+    ('va', 60, 2),
+    ('san', 60, 1),
+    ('xuat', 60, 1),
+    ('cac', 60, 4),
+    ('loai', 60, 1),
+    ('bi', 60, 1),
+    ('bay', 60, 3),
+    ('ho', 60, 1),
+    ('cung', 60, 3),
+    ('thuc', 60, 1),
+    ('hien', 60, 1),
+    ('cong', 60, 1),
+    ('duy', 60, 1),
+    ('tu', 60, 2),
+    ('bao', 60, 1),
+    ('duong', 60, 1),
+    ('may', 60, 2),
+    ('co', 60, 1),
+    ('the', 60, 1),
+    ('mo', 60, 1),
+    ('rong', 60, 1),
+    ('den', 60, 1),
+    ('tau', 60, 1),
+    ('ve', 60, 1),
+    ('tinh', 60, 1),
+    ('nhu', 60, 1),
+    ('he', 60, 1),
+    ('thong', 60, 1),
+    ('kiem', 60, 1),
+    ('soat', 60, 1),
+    ('huong', 60, 1),
+    ('dan', 60, 1),
+    ('xa', 60, 1),
+    ('bac', 61, 8),
+    ('si', 61, 8),
+    ('thu', 61, 18),
+    ('y', 61, 20),
+    ('phan', 61, 4),
+    ('tich', 61, 4),
+    ('logic', 61, 4),
+    ('duoc', 61, 2),
+    ('san', 61, 2),
+    ('xuat', 61, 2),
+    ('thuoc', 61, 2),
+    ('dich', 61, 3),
+    ('vu', 61, 2),
+    ('chuyen', 61, 1),
+    ('gia', 61, 3),
+    ('ap', 61, 2),
+    ('dung', 61, 2),
+    ('cac', 61, 3),
+    ('nguyen', 61, 1),
+    ('tac', 61, 1),
+    ('hoc', 61, 2),
+    ('de', 61, 1),
+    ('dieu', 61, 1),
+    ('tri', 61, 1),
+    ('va', 61, 4),
+    ('kiem', 61, 1),
+    ('soat', 61, 1),
+    ('benh', 61, 1),
+    ('trong', 61, 1),
+    ('suc', 61, 1),
+    ('cam', 61, 1),
+    ('vat', 61, 1),
+    ('nuoi', 61, 1),
+    ('ho', 61, 1),
+    ('tien', 61, 2),
+    ('hanh', 61, 1),
+    ('nghien', 61, 1),
+    ('cuu', 61, 1),
+    ('cai', 61, 1),
+    ('phat', 61, 1),
+    ('trien', 61, 1),
+    ('khai', 61, 1),
+    ('niem', 61, 1),
+    ('thuyet', 61, 1),
+    ('phuong', 61, 1),
+    ('phap', 61, 1),
+    ('hoat', 61, 1),
+    ('dong', 61, 1),
+    ('kien', 61, 1),
+    ('thuc', 61, 1),
+    ('khoa', 61, 1),
+    ('vao', 61, 1),
+    ('linh', 61, 1),
+    ('vuc', 61, 1),
+    ('ky', 62, 9),
+    ('thuat', 62, 9),
+    ('vien', 62, 9),
+    ('thu', 62, 23),
+    ('y', 62, 22),
+    ('phan', 62, 4),
+    ('tich', 62, 4),
+    ('logic', 62, 4),
+    ('duoc', 62, 3),
+    ('san', 62, 4),
+    ('xuat', 62, 4),
+    ('thuoc', 62, 4),
+    ('dich', 62, 2),
+    ('vu', 62, 3),
+    ('thuc', 62, 2),
+    ('hien', 62, 2),
+    ('nhiem', 62, 1),
+    ('tu', 62, 1),
+    ('van', 62, 1),
+    ('chan', 62, 1),
+    ('doan', 62, 1),
+    ('phong', 62, 1),
+    ('ngua', 62, 1),
+    ('va', 62, 2),
+    ('chua', 62, 1),
+    ('benh', 62, 1),
+    ('theo', 62, 1),
+    ('chi', 62, 1),
+    ('dan', 62, 1),
+    ('cua', 62, 1),
+    ('bac', 62, 2),
+    ('si', 62, 2),
+    ('ho', 62, 2),
+    ('cham', 62, 1),
+    ('soc', 62, 1),
+    ('dong', 62, 2),
+    ('vat', 62, 1),
+    ('dieu', 62, 1),
+    ('tri', 62, 1),
+    ('cac', 62, 2),
+    ('tuc', 62, 1),
+    ('thuong', 62, 1),
+    ('quy', 62, 1),
+    ('tro', 62, 1),
+    ('trong', 62, 1),
+    ('hoat', 62, 1),
+    ('duoc', 63, 19),
+    ('si', 63, 11),
+    ('phan', 63, 5),
+    ('tich', 63, 4),
+    ('logic', 63, 4),
+    ('ki', 63, 4),
+    ('thuat', 63, 4),
+    ('kiem', 63, 2),
+    ('nghiem', 63, 2),
+    ('thuoc', 63, 3),
+    ('hoc', 63, 3),
+    ('hoa', 63, 2),
+    ('nghien', 63, 1),
+    ('cuu', 63, 1),
+    ('cai', 63, 1),
+    ('tien', 63, 1),
+    ('phat', 63, 1),
+    ('trien', 63, 1),
+    ('cac', 63, 1),
+    ('khai', 63, 1),
+    ('niem', 63, 1),
+    ('thuyet', 63, 1),
+    ('va', 63, 3),
+    ('phuong', 63, 1),
+    ('phap', 63, 1),
+    ('hoat', 63, 1),
+    ('dong', 63, 1),
+    ('pham', 63, 2),
+    ('bang', 63, 1),
+    ('cach', 63, 1),
+    ('chuan', 63, 1),
+    ('bi', 63, 1),
+    ('phoi', 63, 1),
+    ('ban', 63, 1),
+    ('ke', 64, 25),
+    ('toan', 64, 24),
+    ('phan', 64, 5),
+    ('tich', 64, 4),
+    ('logic', 64, 4),
+    ('doanh', 64, 2),
+    ('nghiep', 64, 5),
+    ('hanh', 64, 5),
+    ('chinh', 64, 3),
+    ('su', 64, 2),
+    ('lao', 64, 2),
+    ('dong', 64, 3),
+    ('tien', 64, 2),
+    ('luong', 64, 2),
+    ('va', 64, 5),
+    ('bao', 64, 2),
+    ('hiem', 64, 2),
+    ('xa', 64, 2),
+    ('hoi', 64, 2),
+    ('ngan', 64, 2),
+    ('hang', 64, 2),
+    ('xay', 64, 2),
+    ('dung', 64, 2),
+    ('theo', 64, 1),
+    ('doi', 64, 1),
+    ('cac', 64, 1),
+    ('hoat', 64, 1),
+    ('tai', 64, 1),
+    ('cua', 64, 4),
+    ('mot', 64, 3),
+    ('to', 64, 4),
+    ('chuc', 64, 4),
+    ('ho', 64, 2),
+    ('lap', 64, 1),
+    ('hoach', 64, 1),
+    ('dieu', 64, 1),
+    ('thuc', 64, 2),
+    ('hien', 64, 1),
+    ('he', 64, 2),
+    ('thong', 64, 2),
+    ('cho', 64, 2),
+    ('viec', 64, 2),
+    ('cap', 64, 1),
+    ('chung', 64, 1),
+    ('nhan', 64, 2),
+    ('vu', 64, 2),
+    ('chuyen', 64, 1),
+    ('mon', 64, 1),
+    ('duoc', 64, 1),
+    ('giam', 64, 1),
+    ('sat', 64, 1),
+    ('chat', 64, 1),
+    ('che', 64, 1),
+    ('co', 64, 2),
+    ('nhieu', 64, 2),
+    ('khac', 64, 1),
+    ('nhau', 64, 1),
+    ('vi', 64, 1),
+    ('tri', 64, 1),
+    ('trong', 64, 1),
+    ('nhiem', 64, 1),
+    ('cu', 64, 2),
+    ('the', 64, 2),
+    ('phu', 64, 1),
+    ('thuoc', 64, 1),
+    ('vao', 64, 1),
+    ('cong', 64, 1),
+    ('ma', 64, 1),
+    ('nguoi', 64, 1),
+    ('do', 64, 1),
+    ('dam', 64, 1),
+    ('chuyen', 65, 10),
+    ('gia', 65, 10),
+    ('quan', 65, 12),
+    ('tri', 65, 11),
+    ('dau', 65, 12),
+    ('khi', 65, 12),
+    ('phan', 65, 4),
+    ('tich', 65, 4),
+    ('logic', 65, 4),
+    ('kinh', 65, 2),
+    ('doanh', 65, 2),
+    ('xang', 65, 2),
+    ('va', 65, 4),
+    ('dot', 65, 3),
+    ('la', 65, 1),
+    ('lap', 65, 1),
+    ('ke', 65, 1),
+    ('hoach', 65, 1),
+    ('li', 65, 1),
+    ('hoat', 65, 1),
+    ('dong', 65, 1),
+    ('khai', 65, 1),
+    ('thac', 65, 1),
+    ('chuyen', 66, 9),
+    ('gia', 66, 9),
+    ('quan', 66, 20),
+    ('tri', 66, 9),
+    ('giao', 66, 20),
+    ('thong', 66, 21),
+    ('li', 66, 11),
+    ('va', 66, 14),
+    ('dieu', 66, 10),
+    ('hanh', 66, 10),
+    ('van', 66, 28),
+    ('tai', 66, 27),
+    ('phan', 66, 4),
+    ('tich', 66, 4),
+    ('logic', 66, 4),
+    ('duong', 66, 12),
+    ('sat', 66, 5),
+    ('bo', 66, 5),
+    ('thanh', 66, 4),
+    ('pho', 66, 4),
+    ('da', 66, 2),
+    ('phuong', 66, 2),
+    ('thuc', 66, 2),
+    ('amp', 66, 8),
+    ('kinh', 66, 6),
+    ('te', 66, 6),
+    ('qui', 66, 2),
+    ('hoach', 66, 2),
+    ('do', 66, 2),
+    ('thi', 66, 2),
+    ('khien', 66, 2),
+    ('cac', 66, 4),
+    ('qua', 66, 2),
+    ('trinh', 66, 2),
+    ('khai', 66, 2),
+    ('thac', 66, 2),
+    ('luu', 66, 1),
+    ('giu', 66, 1),
+    ('ho', 66, 1),
+    ('so', 66, 1),
+    ('dich', 66, 1),
+    ('vu', 66, 1),
+    ('khach', 66, 1),
+    ('hang', 66, 1),
+    ('hoa', 66, 1),
+    ('trong', 66, 1),
+    ('he', 66, 1),
+    ('khong', 66, 1),
+    ('thuy', 66, 1),
+    ('chuyen', 67, 10),
+    ('gia', 67, 10),
+    ('quan', 67, 15),
+    ('tri', 67, 15),
+    ('nang', 67, 12),
+    ('luong', 67, 12),
+    ('phan', 67, 5),
+    ('tich', 67, 4),
+    ('logic', 67, 4),
+    ('va', 67, 8),
+    ('kinh', 67, 7),
+    ('doanh', 67, 6),
+    ('dien', 67, 2),
+    ('xang', 67, 2),
+    ('dau', 67, 2),
+    ('khi', 67, 2),
+    ('dot', 67, 2),
+    ('la', 67, 1),
+    ('nhung', 67, 1),
+    ('trong', 67, 1),
+    ('viec', 67, 1),
+    ('mua', 67, 1),
+    ('ban', 67, 1),
+    ('trao', 67, 1),
+    ('doi', 67, 1),
+    ('phoi', 67, 1),
+    ('su', 67, 1),
+    ('dung', 67, 1),
+    ('de', 67, 1),
+    ('dap', 67, 1),
+    ('ung', 67, 1),
+    ('cac', 67, 2),
+    ('yeu', 67, 1),
+    ('cau', 67, 1),
+    ('cu', 67, 1),
+    ('the', 67, 1),
+    ('co', 67, 1),
+    ('tinh', 67, 1),
+    ('den', 67, 1),
+    ('muc', 67, 1),
+    ('tieu', 67, 1),
+    ('moi', 67, 1),
+    ('truong', 67, 1),
+    ('te', 67, 1),
+    ('nha', 68, 9),
+    ('kinh', 68, 28),
+    ('te', 68, 28),
+    ('hoc', 68, 11),
+    ('phan', 68, 6),
+    ('tich', 68, 6),
+    ('logic', 68, 4),
+    ('quoc', 68, 4),
+    ('dan', 68, 2),
+    ('so', 68, 3),
+    ('va', 68, 11),
+    ('lao', 68, 2),
+    ('dong', 68, 2),
+    ('to', 68, 2),
+    ('chuc', 68, 2),
+    ('cong', 68, 4),
+    ('nghiep', 68, 3),
+    ('hoach', 68, 3),
+    ('dinh', 68, 2),
+    ('tai', 68, 3),
+    ('chinh', 68, 3),
+    ('he', 68, 2),
+    ('thong', 68, 5),
+    ('tin', 68, 3),
+    ('hieu', 68, 2),
+    ('cach', 68, 3),
+    ('lam', 68, 2),
+    ('cho', 68, 3),
+    ('mot', 68, 2),
+    ('gia', 68, 2),
+    ('tro', 68, 1),
+    ('nen', 68, 1),
+    ('thinh', 68, 1),
+    ('vuong', 68, 1),
+    ('bang', 68, 1),
+    ('su', 68, 1),
+    ('dung', 68, 2),
+    ('nguon', 68, 1),
+    ('luc', 68, 1),
+    ('cua', 68, 1),
+    ('do', 68, 1),
+    ('nang', 68, 1),
+    ('suat', 68, 1),
+    ('qua', 68, 1),
+    ('ho', 68, 2),
+    ('tien', 68, 1),
+    ('hanh', 68, 2),
+    ('nghien', 68, 1),
+    ('cuu', 68, 1),
+    ('theo', 68, 1),
+    ('doi', 68, 1),
+    ('lieu', 68, 1),
+    ('cac', 68, 6),
+    ('bao', 68, 2),
+    ('cao', 68, 1),
+    ('ke', 68, 1),
+    ('de', 68, 4),
+    ('giai', 68, 3),
+    ('quyet', 68, 1),
+    ('van', 68, 3),
+    ('ve', 68, 1),
+    ('doanh', 68, 3),
+    ('phat', 68, 1),
+    ('trien', 68, 1),
+    ('mo', 68, 1),
+    ('hinh', 68, 1),
+    ('li', 68, 1),
+    ('du', 68, 1),
+    ('vi', 68, 1),
+    ('xu', 68, 1),
+    ('huong', 68, 1),
+    ('tu', 68, 1),
+    ('nhom', 68, 1),
+    ('loi', 68, 1),
+    ('ich', 68, 1),
+    ('phu', 68, 1),
+    ('xay', 68, 1),
+    ('phap', 68, 1),
+    ('hien', 68, 1),
+    ('tuong', 68, 1),
+    ('lai', 68, 1),
+    ('chuyen', 69, 9),
+    ('vien', 69, 8),
+    ('thuong', 69, 11),
+    ('mai', 69, 11),
+    ('quoc', 69, 14),
+    ('te', 69, 15),
+    ('phan', 69, 6),
+    ('tich', 69, 4),
+    ('logic', 69, 4),
+    ('kinh', 69, 5),
+    ('doanh', 69, 3),
+    ('day', 69, 1),
+    ('la', 69, 1),
+    ('linh', 69, 1),
+    ('vuc', 69, 1),
+    ('lien', 69, 1),
+    ('quan', 69, 1),
+    ('toi', 69, 2),
+    ('nhieu', 69, 1),
+    ('khia', 69, 1),
+    ('canh', 69, 1),
+    ('cua', 69, 2),
+    ('cac', 69, 4),
+    ('hoat', 69, 2),
+    ('dong', 69, 3),
+    ('bao', 69, 2),
+    ('gom', 69, 2),
+    ('dam', 69, 1),
+    ('hop', 69, 1),
+    ('tao', 69, 1),
+    ('dieu', 69, 1),
+    ('kien', 69, 1),
+    ('cho', 69, 2),
+    ('viec', 69, 3),
+    ('van', 69, 1),
+    ('hang', 69, 2),
+    ('hoa', 69, 2),
+    ('phoi', 69, 1),
+    ('san', 69, 2),
+    ('pham', 69, 2),
+    ('va', 69, 2),
+    ('dich', 69, 1),
+    ('vu', 69, 1),
+    ('hiep', 69, 1),
+    ('dinh', 69, 1),
+    ('luu', 69, 1),
+    ('kho', 69, 1),
+    ('vi', 69, 1),
+    ('cong', 69, 1),
+    ('ho', 69, 1),
+    ('tu', 69, 1),
+    ('thiet', 69, 1),
+    ('lap', 69, 1),
+    ('thoa', 69, 1),
+    ('thuan', 69, 1),
+    ('giua', 69, 1),
+    ('nha', 69, 1),
+    ('xuat', 69, 1),
+    ('dai', 69, 1),
+    ('li', 69, 1),
+    ('ban', 69, 1),
+    ('le', 69, 1),
+    ('trong', 69, 1),
+    ('mot', 69, 1),
+    ('gia', 69, 1),
+    ('chuyen', 70, 11),
+    ('vien', 70, 9),
+    ('ngan', 70, 11),
+    ('hang', 70, 11),
+    ('quy', 70, 12),
+    ('dau', 70, 10),
+    ('tu', 70, 10),
+    ('phan', 70, 4),
+    ('tich', 70, 4),
+    ('logic', 70, 4),
+    ('tai', 70, 3),
+    ('chinh', 70, 3),
+    ('la', 70, 1),
+    ('cac', 70, 4),
+    ('gia', 70, 1),
+    ('tao', 70, 1),
+    ('ra', 70, 1),
+    ('san', 70, 1),
+    ('pham', 70, 1),
+    ('va', 70, 3),
+    ('dich', 70, 2),
+    ('vu', 70, 1),
+    ('chang', 70, 1),
+    ('han', 70, 1),
+    ('nhu', 70, 1),
+    ('de', 70, 2),
+    ('an', 70, 1),
+    ('tuong', 70, 1),
+    ('ho', 70, 2),
+    ('xu', 70, 1),
+    ('li', 70, 1),
+    ('luong', 70, 1),
+    ('lon', 70, 1),
+    ('giao', 70, 1),
+    ('ve', 70, 1),
+    ('cho', 70, 2),
+    ('vay', 70, 1),
+    ('lien', 70, 1),
+    ('ket', 70, 1),
+    ('voi', 70, 1),
+    ('muc', 70, 1),
+    ('tieu', 70, 1),
+    ('lam', 70, 1),
+    ('the', 70, 1),
+    ('nao', 70, 1),
+    ('co', 70, 1),
+    ('loi', 70, 1),
+    ('nhat', 70, 1),
+    ('nhung', 70, 1),
+    ('nguoi', 70, 1),
+    ('so', 70, 1),
+    ('huu', 70, 1),
+    ('ki', 71, 19),
+    ('su', 71, 9),
+    ('va', 71, 11),
+    ('thuat', 71, 10),
+    ('vien', 71, 9),
+    ('am', 71, 14),
+    ('thanh', 71, 12),
+    ('phan', 71, 4),
+    ('tich', 71, 4),
+    ('logic', 71, 4),
+    ('thiet', 71, 3),
+    ('ke', 71, 2),
+    ('anh', 71, 4),
+    ('sang', 71, 2),
+    ('cong', 71, 2),
+    ('nghe', 71, 2),
+    ('dien', 71, 2),
+    ('truyen', 71, 3),
+    ('hinh', 71, 2),
+    ('van', 71, 1),
+    ('hanh', 71, 1),
+    ('may', 71, 1),
+    ('moc', 71, 1),
+    ('bi', 71, 1),
+    ('de', 71, 1),
+    ('ghi', 71, 1),
+    ('lai', 71, 1),
+    ('dong', 71, 1),
+    ('bo', 71, 1),
+    ('hoa', 71, 1),
+    ('phoi', 71, 1),
+    ('hoac', 71, 1),
+    ('sao', 71, 1),
+    ('chep', 71, 1),
+    ('cac', 71, 2),
+    ('hieu', 71, 1),
+    ('ung', 71, 1),
+    ('ve', 71, 1),
+    ('giong', 71, 1),
+    ('noi', 71, 1),
+    ('nhac', 71, 1),
+    ('trong', 71, 1),
+    ('phong', 71, 1),
+    ('thu', 71, 1),
+    ('dau', 71, 1),
+    ('truong', 71, 2),
+    ('the', 71, 1),
+    ('thao', 71, 1),
+    ('nha', 71, 1),
+    ('hat', 71, 1),
+    ('rap', 71, 1),
+    ('chieu', 71, 1),
+    ('phim', 71, 2),
+    ('quay', 71, 1),
+    ('video', 71, 1),
+    ('nhan', 72, 10),
+    ('vien', 72, 9),
+    ('giao', 72, 11),
+    ('dich', 72, 11),
+    ('ngan', 72, 12),
+    ('hang', 72, 13),
+    ('phan', 72, 4),
+    ('tich', 72, 4),
+    ('logic', 72, 4),
+    ('tai', 72, 4),
+    ('chinh', 72, 4),
+    ('tin', 72, 2),
+    ('dung', 72, 2),
+    ('va', 72, 2),
+    ('cac', 72, 3),
+    ('nghe', 72, 1),
+    ('lien', 72, 2),
+    ('quan', 72, 2),
+    ('lam', 72, 1),
+    ('viec', 72, 1),
+    ('truc', 72, 1),
+    ('tiep', 72, 1),
+    ('voi', 72, 1),
+    ('khach', 72, 1),
+    ('den', 72, 1),
+    ('hoac', 72, 1),
+    ('buu', 72, 1),
+    ('dien', 72, 1),
+    ('thuc', 72, 1),
+    ('hien', 72, 1),
+    ('toi', 72, 1),
+    ('gui', 72, 1),
+    ('chuyen', 72, 1),
+    ('qui', 72, 1),
+    ('doi', 72, 1),
+    ('rut', 72, 1),
+    ('tien', 72, 1),
+    ('giao', 73, 11),
+    ('vien', 73, 11),
+    ('cong', 73, 10),
+    ('nghe', 73, 8),
+    ('thong', 73, 8),
+    ('tin', 73, 8),
+    ('phan', 73, 6),
+    ('tich', 73, 4),
+    ('logic', 73, 4),
+    ('mon', 73, 4),
+    ('lien', 73, 4),
+    ('quan', 73, 8),
+    ('linh', 73, 2),
+    ('vuc', 73, 2),
+    ('chuyen', 73, 5),
+    ('sau', 73, 2),
+    ('chu', 73, 2),
+    ('yeu', 73, 2),
+    ('la', 73, 2),
+    ('den', 73, 2),
+    ('cntt', 73, 4),
+    ('vi', 73, 4),
+    ('du', 73, 4),
+    ('lap', 73, 2),
+    ('trinh', 73, 3),
+    ('cung', 73, 4),
+    ('li', 73, 4),
+    ('co', 73, 2),
+    ('the', 73, 2),
+    ('sang', 73, 2),
+    ('viec', 73, 2),
+    ('va', 73, 4),
+    ('tro', 73, 2),
+    ('thanh', 73, 2),
+    ('nguoi', 73, 3),
+    ('dung', 73, 4),
+    ('dau', 73, 2),
+    ('bo', 73, 3),
+    ('khoa', 73, 4),
+    ('truong', 73, 6),
+    ('hieu', 73, 2),
+    ('xay', 73, 1),
+    ('chuong', 73, 1),
+    ('tri', 73, 1),
+    ('lich', 73, 1),
+    ('hoc', 73, 1),
+    ('thuc', 73, 1),
+    ('hien', 73, 1),
+    ('dao', 73, 1),
+    ('tao', 73, 1),
+    ('ve', 73, 1),
+    ('may', 73, 1),
+    ('tinh', 73, 1),
+    ('cho', 73, 1),
+    ('khong', 73, 1),
+    ('nha', 74, 9),
+    ('thiet', 74, 19),
+    ('ke', 74, 19),
+    ('do', 74, 14),
+    ('hoa', 74, 16),
+    ('va', 74, 14),
+    ('truyen', 74, 12),
+    ('thong', 74, 12),
+    ('da', 74, 9),
+    ('phuong', 74, 10),
+    ('tien', 74, 10),
+    ('phan', 74, 5),
+    ('tich', 74, 5),
+    ('logic', 74, 4),
+    ('ki', 74, 2),
+    ('thuat', 74, 3),
+    ('so', 74, 2),
+    ('hieu', 74, 2),
+    ('ung', 74, 3),
+    ('hinh', 74, 4),
+    ('anh', 74, 4),
+    ('chuyen', 74, 3),
+    ('dong', 74, 3),
+    ('hoat', 74, 2),
+    ('phat', 74, 2),
+    ('trien', 74, 2),
+    ('san', 74, 2),
+    ('xuat', 74, 4),
+    ('ho', 74, 2),
+    ('tro', 74, 2),
+    ('bang', 74, 2),
+    ('vi', 74, 2),
+    ('tinh', 74, 2),
+    ('trang', 74, 3),
+    ('web', 74, 3),
+    ('cong', 74, 2),
+    ('nghe', 74, 2),
+    ('ban', 74, 3),
+    ('dien', 74, 2),
+    ('tu', 74, 3),
+    ('sach', 74, 2),
+    ('bao', 74, 2),
+    ('video', 74, 2),
+    ('nhac', 74, 2),
+    ('ket', 74, 1),
+    ('hop', 74, 1),
+    ('nhung', 74, 1),
+    ('kien', 74, 1),
+    ('thuc', 74, 1),
+    ('ky', 74, 2),
+    ('de', 74, 1),
+    ('nghien', 74, 1),
+    ('cuu', 74, 1),
+    ('danh', 74, 1),
+    ('gia', 74, 1),
+    ('lap', 74, 1),
+    ('trinh', 74, 1),
+    ('sua', 74, 1),
+    ('doi', 74, 1),
+    ('cac', 74, 4),
+    ('dung', 74, 2),
+    ('cung', 74, 1),
+    ('su', 74, 2),
+    ('van', 74, 1),
+    ('am', 74, 1),
+    ('thanh', 74, 1),
+    ('hien', 74, 1),
+    ('thi', 74, 1),
+    ('tuong', 74, 1),
+    ('tac', 74, 1),
+    ('khac', 74, 1),
+    ('nha', 75, 8),
+    ('quan', 75, 11),
+    ('tri', 75, 11),
+    ('co', 75, 9),
+    ('so', 75, 9),
+    ('du', 75, 12),
+    ('lieu', 75, 12),
+    ('va', 75, 11),
+    ('mang', 75, 14),
+    ('may', 75, 11),
+    ('tinh', 75, 11),
+    ('phan', 75, 6),
+    ('tich', 75, 4),
+    ('logic', 75, 4),
+    ('an', 75, 3),
+    ('ninh', 75, 2),
+    ('csdl', 75, 2),
+    ('thiet', 75, 1),
+    ('ke', 75, 1),
+    ('xay', 75, 1),
+    ('dung', 75, 1),
+    ('kiem', 75, 1),
+    ('soat', 75, 1),
+    ('ho', 75, 1),
+    ('tro', 75, 1),
+    ('cac', 75, 1),
+    ('he', 75, 2),
+    ('thong', 75, 2),
+    ('cong', 75, 1),
+    ('nghe', 75, 1),
+    ('tin', 75, 1),
+    ('de', 75, 1),
+    ('dam', 75, 1),
+    ('bao', 75, 2),
+    ('van', 75, 1),
+    ('hanh', 75, 2),
+    ('toan', 75, 1),
+    ('gom', 75, 1),
+    ('ca', 75, 1),
+    ('cung', 75, 1),
+    ('mem', 75, 1),
+    ('dieu', 75, 1),
+    ('ky', 76, 12),
+    ('thuat', 76, 12),
+    ('vien', 76, 9),
+    ('cong', 76, 9),
+    ('nghe', 76, 9),
+    ('thong', 76, 13),
+    ('tin', 76, 10),
+    ('phan', 76, 10),
+    ('tich', 76, 4),
+    ('logic', 76, 4),
+    ('su', 76, 2),
+    ('dung', 76, 2),
+    ('mem', 76, 3),
+    ('lap', 76, 4),
+    ('dat', 76, 2),
+    ('va', 76, 9),
+    ('sua', 76, 2),
+    ('chua', 76, 2),
+    ('cung', 76, 3),
+    ('trinh', 76, 2),
+    ('van', 76, 4),
+    ('hanh', 76, 3),
+    ('cntt', 76, 1),
+    ('truyen', 76, 2),
+    ('ho', 76, 1),
+    ('tro', 76, 1),
+    ('viec', 76, 2),
+    ('xu', 76, 1),
+    ('ly', 76, 2),
+    ('quan', 76, 2),
+    ('he', 76, 1),
+    ('hang', 76, 1),
+    ('ngay', 76, 1),
+    ('bao', 76, 2),
+    ('gom', 76, 1),
+    ('cac', 76, 4),
+    ('mang', 76, 1),
+    ('lan', 76, 1),
+    ('wan', 76, 1),
+    ('thiet', 76, 1),
+    ('bi', 76, 1),
+    ('may', 76, 1),
+    ('tinh', 76, 1),
+    ('lien', 76, 1),
+    ('nham', 76, 1),
+    ('dam', 76, 1),
+    ('tot', 76, 1),
+    ('nhat', 76, 1),
+    ('xac', 76, 1),
+    ('dinh', 76, 1),
+    ('de', 76, 1),
+    ('phat', 76, 1),
+    ('sinh', 76, 1),
+    ('thu', 77, 14),
+    ('quy', 77, 12),
+    ('phan', 77, 4),
+    ('tich', 77, 4),
+    ('logic', 77, 4),
+    ('tien', 77, 2),
+    ('mat', 77, 2),
+    ('la', 77, 1),
+    ('nguoi', 77, 1),
+    ('kiem', 77, 2),
+    ('soat', 77, 1),
+    ('toan', 77, 2),
+    ('bo', 77, 2),
+    ('hoat', 77, 1),
+    ('dong', 77, 1),
+    ('chi', 77, 2),
+    ('phat', 77, 1),
+    ('sinh', 77, 1),
+    ('trong', 77, 2),
+    ('doanh', 77, 1),
+    ('nghiep', 77, 1),
+    ('nhu', 77, 1),
+    ('tra', 77, 1),
+    ('phieu', 77, 2),
+    ('ky', 77, 1),
+    ('xac', 77, 1),
+    ('nhan', 77, 1),
+    ('giao', 77, 1),
+    ('cac', 77, 1),
+    ('lien', 77, 2),
+    ('tam', 77, 1),
+    ('ung', 77, 1),
+    ('quan', 77, 2),
+    ('ly', 77, 1),
+    ('luu', 77, 1),
+    ('tru', 77, 1),
+    ('giay', 77, 1),
+    ('to', 77, 1),
+    ('khac', 77, 1),
+    ('qua', 77, 1),
+    ('trinh', 77, 1),
+    ('nay', 77, 1),
+    ('hoa', 78, 27),
+    ('si', 78, 10),
+    ('truyen', 78, 9),
+    ('tranh', 78, 11),
+    ('biem', 78, 17),
+    ('hinh', 78, 6),
+    ('hoc', 78, 4),
+    ('mau', 78, 5),
+    ('sac', 78, 5),
+    ('thiet', 78, 5),
+    ('ke', 78, 5),
+    ('tam', 78, 2),
+    ('li', 78, 2),
+    ('chinh', 78, 2),
+    ('tri', 78, 2),
+    ('ve', 78, 3),
+    ('ban', 78, 2),
+    ('tinh', 78, 2),
+    ('con', 78, 3),
+    ('nguoi', 78, 4),
+    ('cham', 78, 2),
+    ('do', 78, 2),
+    ('hoat', 78, 2),
+    ('la', 78, 1),
+    ('nghe', 78, 1),
+    ('su', 78, 3),
+    ('dung', 78, 2),
+    ('kha', 78, 1),
+    ('nang', 78, 1),
+    ('cua', 78, 1),
+    ('minh', 78, 1),
+    ('de', 78, 3),
+    ('cu', 78, 1),
+    ('the', 78, 1),
+    ('va', 78, 2),
+    ('lot', 78, 1),
+    ('ta', 78, 1),
+    ('hanh', 78, 1),
+    ('vi', 78, 1),
+    ('kien', 78, 1),
+    ('hay', 78, 1),
+    ('mot', 78, 2),
+    ('van', 78, 1),
+    ('trinh', 78, 1),
+    ('bay', 78, 1),
+    ('cach', 78, 1),
+    ('hai', 78, 1),
+    ('huoc', 78, 1),
+    ('hoac', 78, 1),
+    ('goi', 78, 1),
+    ('mo', 78, 1),
+    ('suy', 78, 1),
+    ('nghi', 78, 1),
+    ('ki', 79, 15),
+    ('thuat', 79, 15),
+    ('vien', 79, 9),
+    ('in', 79, 19),
+    ('an', 79, 11),
+    ('hinh', 79, 4),
+    ('hoc', 79, 4),
+    ('mau', 79, 4),
+    ('sac', 79, 4),
+    ('thiet', 79, 4),
+    ('ke', 79, 4),
+    ('cong', 79, 5),
+    ('nghe', 79, 4),
+    ('vat', 79, 2),
+    ('lieu', 79, 2),
+    ('bao', 79, 4),
+    ('bi', 79, 4),
+    ('dong', 79, 4),
+    ('goi', 79, 4),
+    ('cac', 79, 2),
+    ('sau', 79, 2),
+    ('truoc', 79, 2),
+    ('tien', 79, 1),
+    ('hanh', 79, 1),
+    ('nghien', 79, 1),
+    ('cuu', 79, 1),
+    ('phat', 79, 1),
+    ('trien', 79, 1),
+    ('thuc', 79, 1),
+    ('hien', 79, 1),
+    ('va', 79, 1),
+    ('giam', 79, 1),
+    ('sat', 79, 1),
+    ('qui', 79, 1),
+    ('trinh', 79, 1),
+    ('tot', 79, 1),
+    ('hon', 79, 2),
+    ('kinh', 79, 1),
+    ('te', 79, 1),
+    ('de', 79, 1),
+    ('su', 79, 1),
+    ('dung', 79, 1),
+    ('trong', 79, 1),
+    ('nganh', 79, 1),
+    ('nghiep', 79, 1),
+    ('ki', 80, 11),
+    ('thuat', 80, 11),
+    ('vien', 80, 11),
+    ('thuoc', 80, 17),
+    ('da', 80, 33),
+    ('chuyen', 80, 11),
+    ('gia', 80, 10),
+    ('vat', 80, 10),
+    ('lieu', 80, 8),
+    ('hinh', 80, 5),
+    ('hoc', 80, 4),
+    ('mau', 80, 4),
+    ('sac', 80, 4),
+    ('thiet', 80, 12),
+    ('ke', 80, 12),
+    ('va', 80, 11),
+    ('san', 80, 9),
+    ('xuat', 80, 8),
+    ('giay', 80, 2),
+    ('dep', 80, 2),
+    ('do', 80, 4),
+    ('bang', 80, 4),
+    ('may', 80, 4),
+    ('mac', 80, 3),
+    ('su', 80, 3),
+    ('dung', 80, 3),
+    ('cac', 80, 4),
+    ('qui', 80, 2),
+    ('trinh', 80, 1),
+    ('khac', 80, 2),
+    ('nhau', 80, 1),
+    ('de', 80, 4),
+    ('phu', 80, 1),
+    ('hop', 80, 2),
+    ('voi', 80, 1),
+    ('tieu', 80, 1),
+    ('chuan', 80, 1),
+    ('duoc', 80, 4),
+    ('dinh', 80, 2),
+    ('la', 80, 2),
+    ('trong', 80, 4),
+    ('bao', 80, 1),
+    ('quan', 80, 1),
+    ('say', 80, 1),
+    ('kho', 80, 1),
+    ('lam', 80, 1),
+    ('tot', 80, 1),
+    ('hon', 80, 1),
+    ('hoa', 80, 2),
+    ('chat', 80, 2),
+    ('nhu', 80, 2),
+    ('muoi', 80, 1),
+    ('nhuom', 80, 2),
+    ('dau', 80, 2),
+    ('crom', 80, 2),
+    ('nganh', 80, 1),
+    ('cong', 80, 2),
+    ('nghiep', 80, 2),
+    ('phan', 80, 1),
+    ('tich', 80, 1),
+    ('xac', 80, 1),
+    ('dac', 80, 1),
+    ('tinh', 80, 1),
+    ('cua', 80, 1),
+    ('con', 80, 1),
+    ('viec', 80, 1),
+    ('lap', 80, 2),
+    ('hoach', 80, 1),
+    ('dat', 80, 1),
+    ('bi', 80, 1),
+    ('moc', 80, 1),
+    ('moi', 80, 1),
+    ('co', 80, 1),
+    ('mon', 80, 1),
+    ('nghien', 80, 1),
+    ('cuu', 80, 1),
+    ('ma', 80, 1),
+    ('pham', 80, 1),
+    ('hang', 80, 1),
+    ('the', 80, 1),
+    ('thao', 80, 1),
+    ('loai', 80, 1),
+    ('tuong', 80, 1),
+    ('tu', 80, 1),
+    ('vay', 80, 1),
+    ('ki', 81, 23),
+    ('thuat', 81, 23),
+    ('vien', 81, 9),
+    ('ve', 81, 12),
+    ('hinh', 81, 4),
+    ('hoc', 81, 4),
+    ('mau', 81, 4),
+    ('sac', 81, 4),
+    ('thiet', 81, 6),
+    ('ke', 81, 6),
+    ('nha', 81, 8),
+    ('phac', 81, 9),
+    ('thao', 81, 10),
+    ('dan', 81, 2),
+    ('su', 81, 2),
+    ('kien', 81, 2),
+    ('truc', 81, 2),
+    ('ban', 81, 10),
+    ('do', 81, 4),
+    ('va', 81, 6),
+    ('so', 81, 4),
+    ('chuan', 81, 2),
+    ('bi', 81, 2),
+    ('cac', 81, 7),
+    ('minh', 81, 1),
+    ('hoa', 81, 1),
+    ('tu', 81, 1),
+    ('lieu', 81, 1),
+    ('khac', 81, 1),
+    ('tren', 81, 1),
+    ('in', 81, 2),
+    ('ho', 81, 1),
+    ('cung', 81, 1),
+    ('sao', 81, 1),
+    ('chep', 81, 1),
+    ('hoac', 81, 1),
+    ('phong', 81, 1),
+    ('to', 81, 1),
+    ('de', 81, 1),
+    ('cho', 81, 1),
+    ('viec', 81, 1),
+    ('an', 81, 1),
+    ('ki', 82, 14),
+    ('thuat', 82, 14),
+    ('vien', 82, 9),
+    ('bao', 82, 27),
+    ('bi', 82, 24),
+    ('hinh', 82, 4),
+    ('hoc', 82, 4),
+    ('mau', 82, 4),
+    ('sac', 82, 4),
+    ('thiet', 82, 9),
+    ('ke', 82, 10),
+    ('san', 82, 12),
+    ('pham', 82, 12),
+    ('do', 82, 2),
+    ('hoa', 82, 3),
+    ('xuat', 82, 4),
+    ('vat', 82, 3),
+    ('lieu', 82, 3),
+    ('in', 82, 2),
+    ('dong', 82, 9),
+    ('goi', 82, 7),
+    ('va', 82, 8),
+    ('on', 82, 2),
+    ('dinh', 82, 2),
+    ('quan', 82, 4),
+    ('li', 82, 2),
+    ('chat', 82, 2),
+    ('luong', 82, 2),
+    ('trong', 82, 3),
+    ('cac', 82, 4),
+    ('nganh', 82, 3),
+    ('dac', 82, 2),
+    ('thu', 82, 3),
+    ('nhu', 82, 2),
+    ('hang', 82, 5),
+    ('tieu', 82, 3),
+    ('dung', 82, 3),
+    ('xa', 82, 2),
+    ('xi', 82, 2),
+    ('thuc', 82, 2),
+    ('mi', 82, 2),
+    ('cham', 82, 2),
+    ('soc', 82, 2),
+    ('suc', 82, 2),
+    ('khoe', 82, 2),
+    ('qua', 82, 2),
+    ('tang', 82, 2),
+    ('lap', 82, 1),
+    ('hoach', 82, 1),
+    ('trien', 82, 2),
+    ('khai', 82, 1),
+    ('huong', 82, 1),
+    ('dan', 82, 2),
+    ('hoat', 82, 1),
+    ('lien', 82, 1),
+    ('den', 82, 1),
+    ('viec', 82, 1),
+    ('phat', 82, 1),
+    ('loai', 82, 1),
+    ('ve', 82, 1),
+    ('van', 82, 1),
+    ('chuyen', 82, 1),
+    ('trang', 82, 1),
+    ('tri', 82, 1),
+    ('cong', 82, 1),
+    ('nghe', 82, 1),
+    ('can', 82, 1),
+    ('duoc', 82, 1),
+    ('hop', 82, 2),
+    ('chai', 82, 1),
+    ('thung', 82, 2),
+    ('nhan', 82, 2),
+    ('truoc', 82, 1),
+    ('khi', 82, 1),
+    ('dua', 82, 1),
+    ('ra', 82, 1),
+    ('thi', 82, 1),
+    ('truong', 82, 1),
+    ('su', 82, 1),
+    ('giay', 82, 1),
+    ('bia', 82, 1),
+    ('thuy', 82, 1),
+    ('tinh', 82, 1),
+    ('nhua', 82, 1),
+    ('nhom', 82, 1),
+    ('nhieu', 82, 1),
+    ('khac', 82, 2),
+    ('de', 82, 1),
+    ('tui', 82, 1),
+    ('binh', 82, 1),
+    ('ong', 82, 1),
+    ('lam', 82, 1),
+    ('mac', 82, 1),
+    ('cho', 82, 1),
+    ('ki', 83, 10),
+    ('thuat', 83, 10),
+    ('vien', 83, 9),
+    ('nganh', 83, 8),
+    ('giay', 83, 23),
+    ('hinh', 83, 4),
+    ('hoc', 83, 4),
+    ('mau', 83, 4),
+    ('sac', 83, 4),
+    ('thiet', 83, 4),
+    ('ke', 83, 4),
+    ('cac', 83, 3),
+    ('cong', 83, 4),
+    ('doan', 83, 2),
+    ('san', 83, 8),
+    ('xuat', 83, 3),
+    ('va', 83, 7),
+    ('bia', 83, 2),
+    ('nghien', 83, 3),
+    ('cuu', 83, 2),
+    ('phat', 83, 2),
+    ('trien', 83, 2),
+    ('tu', 83, 6),
+    ('nguyen', 83, 3),
+    ('lieu', 83, 3),
+    ('moi', 83, 4),
+    ('pham', 83, 5),
+    ('tai', 83, 3),
+    ('che', 83, 3),
+    ('phu', 83, 1),
+    ('trach', 83, 1),
+    ('nghe', 83, 1),
+    ('trong', 83, 1),
+    ('qua', 83, 2),
+    ('trinh', 83, 2),
+    ('nay', 83, 1),
+    ('bao', 83, 1),
+    ('gom', 83, 1),
+    ('viec', 83, 1),
+    ('tap', 83, 1),
+    ('ket', 83, 1),
+    ('lam', 83, 1),
+    ('bot', 83, 1),
+    ('xeo', 83, 1),
+    ('ep', 83, 1),
+    ('say', 83, 1),
+    ('can', 83, 1),
+    ('cuon', 83, 1),
+    ('de', 83, 1),
+    ('cuoi', 83, 1),
+    ('cung', 83, 2),
+    ('ra', 83, 1),
+    ('nhu', 83, 1),
+    ('ki', 84, 10),
+    ('thuat', 84, 10),
+    ('vien', 84, 9),
+    ('may', 84, 18),
+    ('mac', 84, 10),
+    ('va', 84, 12),
+    ('cong', 84, 22),
+    ('nghe', 84, 22),
+    ('co', 84, 10),
+    ('lien', 84, 9),
+    ('quan', 84, 9),
+    ('hinh', 84, 4),
+    ('hoc', 84, 4),
+    ('mau', 84, 4),
+    ('sac', 84, 4),
+    ('thiet', 84, 7),
+    ('ke', 84, 4),
+    ('soi', 84, 4),
+    ('det', 84, 11),
+    ('thoi', 84, 2),
+    ('kim', 84, 4),
+    ('san', 84, 4),
+    ('xuat', 84, 4),
+    ('tat', 84, 2),
+    ('hang', 84, 4),
+    ('giat', 84, 2),
+    ('la', 84, 2),
+    ('moc', 84, 3),
+    ('bi', 84, 3),
+    ('nhuom', 84, 2),
+    ('phu', 84, 2),
+    ('trach', 84, 1),
+    ('trong', 84, 1),
+    ('qua', 84, 1),
+    ('trinh', 84, 1),
+    ('vai', 84, 1),
+    ('dai', 84, 1),
+    ('tra', 84, 1),
+    ('ho', 84, 1),
+    ('cung', 84, 1),
+    ('the', 84, 1),
+    ('chuyen', 84, 1),
+    ('ve', 84, 1),
+    ('hoa', 84, 1),
+    ('chat', 84, 2),
+    ('thuoc', 84, 1),
+    ('tay', 84, 1),
+    ('gia', 84, 1),
+    ('hay', 84, 1),
+    ('ki', 85, 10),
+    ('thuat', 85, 10),
+    ('vien', 85, 9),
+    ('da', 85, 24),
+    ('giay', 85, 15),
+    ('hinh', 85, 4),
+    ('hoc', 85, 4),
+    ('mau', 85, 4),
+    ('sac', 85, 4),
+    ('thiet', 85, 13),
+    ('ke', 85, 12),
+    ('va', 85, 16),
+    ('san', 85, 12),
+    ('xuat', 85, 11),
+    ('dep', 85, 2),
+    ('do', 85, 4),
+    ('vat', 85, 2),
+    ('bang', 85, 7),
+    ('may', 85, 3),
+    ('mac', 85, 2),
+    ('phu', 85, 5),
+    ('kien', 85, 3),
+    ('li', 85, 2),
+    ('tui', 85, 3),
+    ('xach', 85, 3),
+    ('trach', 85, 1),
+    ('cong', 85, 1),
+    ('nghe', 85, 1),
+    ('trong', 85, 1),
+    ('qua', 85, 1),
+    ('trinh', 85, 1),
+    ('cac', 85, 1),
+    ('pham', 85, 3),
+    ('tu', 85, 1),
+    ('thuoc', 85, 2),
+    ('long', 85, 1),
+    ('thu', 85, 1),
+    ('den', 85, 1),
+    ('thanh', 85, 2),
+    ('cuoi', 85, 1),
+    ('cung', 85, 2),
+    ('nhu', 85, 1),
+    ('the', 85, 2),
+    ('thao', 85, 1),
+    ('nguyen', 85, 2),
+    ('lieu', 85, 2),
+    ('that', 85, 1),
+    ('gia', 85, 2),
+    ('ho', 85, 1),
+    ('co', 85, 1),
+    ('chuyen', 85, 1),
+    ('ve', 85, 1),
+    ('hoa', 85, 1),
+    ('chat', 85, 1),
+    ('dau', 85, 1),
+    ('nhuom', 85, 1),
+    ('hay', 85, 1),
+    ('moc', 85, 1),
+    ('bi', 85, 1),
+    ('tho', 86, 10),
+    ('tham', 86, 9),
+    ('mi', 86, 10),
+    ('lam', 86, 11),
+    ('dep', 86, 12),
+    ('hinh', 86, 7),
+    ('hoc', 86, 4),
+    ('mau', 86, 4),
+    ('sac', 86, 7),
+    ('thiet', 86, 4),
+    ('ke', 86, 4),
+    ('cham', 86, 8),
+    ('soc', 86, 8),
+    ('da', 86, 2),
+    ('massage', 86, 2),
+    ('mat', 86, 2),
+    ('va', 86, 10),
+    ('toan', 86, 2),
+    ('than', 86, 2),
+    ('trang', 86, 9),
+    ('diem', 86, 7),
+    ('toc', 86, 3),
+    ('mong', 86, 2),
+    ('cac', 86, 5),
+    ('lieu', 86, 5),
+    ('phap', 86, 3),
+    ('dac', 86, 4),
+    ('biet', 86, 2),
+    ('trong', 86, 2),
+    ('vat', 86, 2),
+    ('li', 86, 2),
+    ('tri', 86, 2),
+    ('co', 86, 2),
+    ('truyen', 86, 4),
+    ('nhat', 86, 2),
+    ('ban', 86, 2),
+    ('han', 86, 2),
+    ('quoc', 86, 4),
+    ('trung', 86, 2),
+    ('hoa', 86, 2),
+    ('cho', 86, 3),
+    ('doi', 86, 2),
+    ('tuong', 86, 2),
+    ('dip', 86, 2),
+    ('thu', 86, 2),
+    ('dam', 86, 4),
+    ('cuoi', 86, 2),
+    ('chup', 86, 2),
+    ('anh', 86, 4),
+    ('tiec', 86, 2),
+    ('dien', 86, 2),
+    ('san', 86, 2),
+    ('khau', 86, 2),
+    ('con', 86, 1),
+    ('goi', 86, 1),
+    ('la', 86, 1),
+    ('cat', 86, 1),
+    ('tao', 86, 1),
+    ('dang', 86, 1),
+    ('rau', 86, 1),
+    ('su', 86, 1),
+    ('dung', 86, 1),
+    ('pham', 86, 1),
+    ('thuc', 86, 1),
+    ('hien', 86, 1),
+    ('dich', 86, 1),
+    ('vu', 86, 1),
+    ('khac', 86, 1),
+    ('khach', 86, 1),
+    ('hang', 86, 1),
+    ('de', 86, 1),
+    ('cai', 86, 1),
+    ('thien', 86, 1),
+    ('ngoai', 86, 1),
+    ('cua', 86, 1),
+    ('ho', 86, 1),
+    ('kien', 87, 11),
+    ('truc', 87, 11),
+    ('su', 87, 9),
+    ('xay', 87, 12),
+    ('dung', 87, 13),
+    ('hinh', 87, 4),
+    ('hoc', 87, 4),
+    ('mau', 87, 4),
+    ('sac', 87, 4),
+    ('thiet', 87, 13),
+    ('ke', 87, 14),
+    ('noi', 87, 2),
+    ('ngoai', 87, 2),
+    ('that', 87, 2),
+    ('cong', 87, 7),
+    ('trinh', 87, 4),
+    ('qui', 87, 3),
+    ('hoach', 87, 4),
+    ('do', 87, 4),
+    ('thi', 87, 4),
+    ('canh', 87, 3),
+    ('quan', 87, 3),
+    ('nha', 87, 2),
+    ('o', 87, 1),
+    ('thuong', 87, 1),
+    ('mai', 87, 1),
+    ('cac', 87, 3),
+    ('dan', 87, 1),
+    ('va', 87, 5),
+    ('nghiep', 87, 1),
+    ('lap', 87, 1),
+    ('giam', 87, 1),
+    ('sat', 87, 1),
+    ('bao', 87, 1),
+    ('tri', 87, 1),
+    ('mo', 87, 1),
+    ('rong', 87, 1),
+    ('cai', 87, 1),
+    ('tao', 87, 1),
+    ('ve', 87, 1),
+    ('mat', 87, 1),
+    ('tham', 87, 2),
+    ('mi', 87, 1),
+    ('nang', 87, 1),
+    ('cua', 87, 1),
+    ('ho', 87, 1),
+    ('cung', 87, 1),
+    ('co', 87, 1),
+    ('the', 87, 1),
+    ('gia', 87, 1),
+    ('he', 87, 1),
+    ('thong', 87, 2),
+    ('giao', 87, 1),
+    ('kien', 88, 11),
+    ('truc', 88, 11),
+    ('su', 88, 9),
+    ('canh', 88, 23),
+    ('quan', 88, 24),
+    ('nha', 88, 11),
+    ('thiet', 88, 18),
+    ('ke', 88, 18),
+    ('hinh', 88, 4),
+    ('hoc', 88, 4),
+    ('mau', 88, 4),
+    ('sac', 88, 4),
+    ('vuon', 88, 3),
+    ('hoa', 88, 3),
+    ('cong', 88, 7),
+    ('vien', 88, 3),
+    ('khu', 88, 6),
+    ('du', 88, 3),
+    ('lich', 88, 3),
+    ('nghi', 88, 5),
+    ('duong', 88, 5),
+    ('vuc', 88, 2),
+    ('ngoi', 88, 2),
+    ('giai', 88, 3),
+    ('tri', 88, 3),
+    ('con', 88, 1),
+    ('goi', 88, 1),
+    ('la', 88, 1),
+    ('qui', 88, 1),
+    ('hoach', 88, 1),
+    ('to', 88, 1),
+    ('chuc', 88, 1),
+    ('thi', 88, 1),
+    ('li', 88, 1),
+    ('bao', 88, 2),
+    ('va', 88, 5),
+    ('phuc', 88, 1),
+    ('hoi', 88, 1),
+    ('noi', 88, 1),
+    ('bo', 88, 1),
+    ('khong', 88, 1),
+    ('gian', 88, 1),
+    ('ngoai', 88, 1),
+    ('troi', 88, 1),
+    ('cua', 88, 1),
+    ('cac', 88, 1),
+    ('trinh', 88, 2),
+    ('o', 88, 1),
+    ('van', 88, 1),
+    ('phong', 88, 1),
+    ('thuong', 88, 1),
+    ('mai', 88, 1),
+    ('nghiep', 88, 1),
+    ('ho', 88, 1),
+    ('dam', 88, 1),
+    ('rang', 88, 1),
+    ('dat', 88, 1),
+    ('co', 88, 1),
+    ('trong', 88, 1),
+    ('dep', 88, 1),
+    ('mat', 88, 1),
+    ('than', 88, 1),
+    ('thien', 88, 1),
+    ('voi', 88, 1),
+    ('moi', 88, 1),
+    ('truong', 88, 1),
+    ('nha', 89, 11),
+    ('thiet', 89, 30),
+    ('ke', 89, 26),
+    ('san', 89, 16),
+    ('pham', 89, 15),
+    ('my', 89, 10),
+    ('thuat', 89, 10),
+    ('cong', 89, 13),
+    ('nghiep', 89, 13),
+    ('hinh', 89, 6),
+    ('hoc', 89, 4),
+    ('mau', 89, 4),
+    ('sac', 89, 4),
+    ('tren', 89, 2),
+    ('may', 89, 8),
+    ('tinh', 89, 2),
+    ('moc', 89, 4),
+    ('bi', 89, 7),
+    ('chuyen', 89, 2),
+    ('nganh', 89, 2),
+    ('cu', 89, 2),
+    ('the', 89, 2),
+    ('nhu', 89, 2),
+    ('o', 89, 2),
+    ('to', 89, 2),
+    ('noi', 89, 2),
+    ('that', 89, 2),
+    ('det', 89, 2),
+    ('gia', 89, 2),
+    ('dung', 89, 2),
+    ('bao', 89, 2),
+    ('con', 89, 2),
+    ('goi', 89, 1),
+    ('la', 89, 1),
+    ('thuc', 89, 2),
+    ('cua', 89, 4),
+    ('cac', 89, 3),
+    ('chuan', 89, 1),
+    ('ban', 89, 1),
+    ('ve', 89, 1),
+    ('va', 89, 2),
+    ('thong', 89, 1),
+    ('so', 89, 1),
+    ('de', 89, 1),
+    ('dua', 89, 1),
+    ('vao', 89, 1),
+    ('xuat', 89, 1),
+    ('trong', 89, 1),
+    ('khi', 89, 1),
+    ('ki', 89, 1),
+    ('su', 89, 1),
+    ('ket', 89, 1),
+    ('cau', 89, 1),
+    ('chuc', 89, 1),
+    ('nang', 89, 1),
+    ('hoat', 89, 1),
+    ('dong', 89, 1),
+    ('thi', 89, 1),
+    ('kieu', 89, 1),
+    ('dang', 89, 1),
+    ('sao', 89, 1),
+    ('cho', 89, 1),
+    ('khong', 89, 1),
+    ('chi', 89, 1),
+    ('dep', 89, 1),
+    ('ma', 89, 1),
+    ('hieu', 89, 1),
+    ('qua', 89, 1),
+    ('kinh', 89, 1),
+    ('te', 89, 1),
+    ('nha', 90, 9),
+    ('thiet', 90, 23),
+    ('ke', 90, 23),
+    ('thoi', 90, 16),
+    ('trang', 90, 22),
+    ('hinh', 90, 4),
+    ('hoc', 90, 4),
+    ('mau', 90, 4),
+    ('sac', 90, 4),
+    ('chuyen', 90, 2),
+    ('sau', 90, 2),
+    ('theo', 90, 2),
+    ('nhom', 90, 2),
+    ('san', 90, 5),
+    ('pham', 90, 4),
+    ('cu', 90, 2),
+    ('the', 90, 4),
+    ('nhu', 90, 2),
+    ('nu', 90, 2),
+    ('nam', 90, 2),
+    ('tre', 90, 2),
+    ('em', 90, 2),
+    ('do', 90, 6),
+    ('cong', 90, 2),
+    ('so', 90, 2),
+    ('da', 90, 6),
+    ('hoi', 90, 2),
+    ('ao', 90, 3),
+    ('dai', 90, 2),
+    ('phuc', 90, 4),
+    ('truyen', 90, 4),
+    ('thong', 90, 4),
+    ('thao', 90, 3),
+    ('phu', 90, 3),
+    ('kien', 90, 3),
+    ('giay', 90, 3),
+    ('dep', 90, 3),
+    ('suc', 90, 2),
+    ('va', 90, 9),
+    ('kim', 90, 2),
+    ('hoan', 90, 2),
+    ('tiep', 90, 2),
+    ('thi', 90, 2),
+    ('ban', 90, 2),
+    ('hang', 90, 2),
+    ('ve', 90, 3),
+    ('quan', 90, 1),
+    ('tao', 90, 1),
+    ('ra', 90, 1),
+    ('nhung', 90, 1),
+    ('bo', 90, 1),
+    ('suu', 90, 1),
+    ('tap', 90, 1),
+    ('dong', 90, 1),
+    ('ho', 90, 1),
+    ('phac', 90, 1),
+    ('lua', 90, 1),
+    ('chon', 90, 1),
+    ('chat', 90, 1),
+    ('lieu', 90, 1),
+    ('hoa', 90, 1),
+    ('van', 90, 1),
+    ('chi', 90, 1),
+    ('dan', 90, 1),
+    ('cach', 90, 1),
+    ('xuat', 90, 1),
+    ('vua', 90, 1),
+    ('nha', 91, 9),
+    ('trac', 91, 21),
+    ('dia', 91, 23),
+    ('ban', 91, 14),
+    ('do', 91, 15),
+    ('hinh', 91, 4),
+    ('hoc', 91, 4),
+    ('mau', 91, 4),
+    ('sac', 91, 4),
+    ('thiet', 91, 4),
+    ('ke', 91, 4),
+    ('cong', 91, 4),
+    ('trinh', 91, 2),
+    ('mo', 91, 2),
+    ('bien', 91, 2),
+    ('vien', 91, 2),
+    ('tham', 91, 2),
+    ('anh', 91, 3),
+    ('he', 91, 2),
+    ('thong', 91, 4),
+    ('tin', 91, 2),
+    ('li', 91, 2),
+    ('khao', 91, 3),
+    ('sat', 91, 3),
+    ('va', 91, 5),
+    ('ve', 91, 2),
+    ('ki', 91, 4),
+    ('thuat', 91, 4),
+    ('nghe', 91, 2),
+    ('su', 91, 1),
+    ('dung', 91, 3),
+    ('cac', 91, 2),
+    ('phuong', 91, 1),
+    ('phap', 91, 1),
+    ('de', 91, 1),
+    ('xac', 91, 2),
+    ('dinh', 91, 1),
+    ('vi', 91, 1),
+    ('tri', 91, 1),
+    ('chinh', 91, 2),
+    ('cua', 91, 1),
+    ('phan', 91, 2),
+    ('vung', 91, 2),
+    ('tu', 91, 1),
+    ('nhien', 91, 1),
+    ('xay', 91, 2),
+    ('ranh', 91, 1),
+    ('gioi', 91, 1),
+    ('dat', 91, 2),
+    ('nuoc', 91, 1),
+    ('trong', 91, 1),
+    ('long', 91, 1),
+    ('sua', 91, 1),
+    ('so', 91, 1),
+    ('hoa', 91, 1),
+    ('nha', 92, 9),
+    ('thiet', 92, 20),
+    ('ke', 92, 20),
+    ('do', 92, 12),
+    ('hoa', 92, 14),
+    ('va', 92, 13),
+    ('truyen', 92, 12),
+    ('thong', 92, 12),
+    ('da', 92, 9),
+    ('phuong', 92, 10),
+    ('tien', 92, 10),
+    ('hinh', 92, 7),
+    ('hoc', 92, 4),
+    ('mau', 92, 4),
+    ('sac', 92, 4),
+    ('in', 92, 4),
+    ('an', 92, 3),
+    ('trang', 92, 2),
+    ('web', 92, 2),
+    ('quang', 92, 3),
+    ('cao', 92, 3),
+    ('video', 92, 5),
+    ('hoat', 92, 2),
+    ('hieu', 92, 3),
+    ('ung', 92, 3),
+    ('dac', 92, 3),
+    ('biet', 92, 3),
+    ('ki', 92, 3),
+    ('thuat', 92, 3),
+    ('so', 92, 3),
+    ('xuat', 92, 2),
+    ('ban', 92, 3),
+    ('dien', 92, 4),
+    ('tu', 92, 4),
+    ('sach', 92, 2),
+    ('bao', 92, 2),
+    ('nhac', 92, 2),
+    ('noi', 92, 1),
+    ('dung', 92, 2),
+    ('anh', 92, 4),
+    ('am', 92, 1),
+    ('thanh', 92, 1),
+    ('de', 92, 2),
+    ('duoi', 92, 1),
+    ('dang', 92, 1),
+    ('phim', 92, 2),
+    ('cac', 92, 2),
+    ('nghe', 92, 1),
+    ('nhin', 92, 1),
+    ('khac', 92, 2),
+    ('ho', 92, 1),
+    ('tao', 92, 1),
+    ('ra', 92, 1),
+    ('dong', 92, 1),
+    ('su', 92, 1),
+    ('trong', 92, 1),
+    ('tro', 92, 1),
+    ('choi', 92, 1),
+    ('nha', 93, 9),
+    ('nhiep', 93, 21),
+    ('anh', 93, 26),
+    ('hinh', 93, 6),
+    ('hoc', 93, 4),
+    ('mau', 93, 4),
+    ('sac', 93, 4),
+    ('thiet', 93, 5),
+    ('ke', 93, 4),
+    ('thoi', 93, 2),
+    ('trang', 93, 2),
+    ('cong', 93, 2),
+    ('nghiep', 93, 2),
+    ('y', 93, 2),
+    ('te', 93, 2),
+    ('bao', 93, 2),
+    ('chi', 93, 2),
+    ('san', 93, 2),
+    ('pham', 93, 2),
+    ('du', 93, 2),
+    ('lich', 93, 2),
+    ('thien', 93, 2),
+    ('nhien', 93, 2),
+    ('hoang', 93, 2),
+    ('da', 93, 2),
+    ('su', 93, 2),
+    ('dung', 93, 2),
+    ('kha', 93, 1),
+    ('nang', 93, 1),
+    ('tu', 93, 1),
+    ('duy', 93, 1),
+    ('sang', 93, 1),
+    ('tao', 93, 1),
+    ('cua', 93, 2),
+    ('ban', 93, 1),
+    ('than', 93, 1),
+    ('va', 93, 5),
+    ('cac', 93, 2),
+    ('ki', 93, 1),
+    ('thuat', 93, 1),
+    ('may', 93, 3),
+    ('de', 93, 2),
+    ('chup', 93, 2),
+    ('ho', 93, 1),
+    ('co', 93, 1),
+    ('the', 93, 1),
+    ('tinh', 93, 1),
+    ('dong', 93, 1),
+    ('quay', 93, 1),
+    ('video', 93, 1),
+    ('bi', 93, 1),
+    ('khac', 93, 1),
+    ('ghi', 93, 1),
+    ('lai', 93, 1),
+    ('chinh', 93, 1),
+    ('sua', 93, 1),
+    ('ca', 93, 1),
+    ('am', 93, 1),
+    ('thanh', 93, 1),
+    ('nha', 94, 13),
+    ('thiet', 94, 21),
+    ('ke', 94, 21),
+    ('va', 94, 20),
+    ('trang', 94, 11),
+    ('tri', 94, 11),
+    ('noi', 94, 16),
+    ('that', 94, 16),
+    ('hinh', 94, 4),
+    ('hoc', 94, 4),
+    ('mau', 94, 4),
+    ('sac', 94, 4),
+    ('san', 94, 6),
+    ('pham', 94, 3),
+    ('do', 94, 8),
+    ('go', 94, 3),
+    ('gia', 94, 6),
+    ('dung', 94, 8),
+    ('phu', 94, 2),
+    ('kien', 94, 2),
+    ('ngoai', 94, 3),
+    ('van', 94, 2),
+    ('phong', 94, 2),
+    ('toa', 94, 2),
+    ('thuong', 94, 3),
+    ('mai', 94, 4),
+    ('cong', 94, 11),
+    ('trinh', 94, 5),
+    ('nghiep', 94, 3),
+    ('khau', 94, 3),
+    ('dien', 94, 2),
+    ('anh', 94, 2),
+    ('khao', 94, 1),
+    ('sat', 94, 1),
+    ('mat', 94, 1),
+    ('bang', 94, 1),
+    ('o', 94, 1),
+    ('de', 94, 2),
+    ('lam', 94, 1),
+    ('cho', 94, 2),
+    ('dep', 94, 1),
+    ('tien', 94, 1),
+    ('nghi', 94, 1),
+    ('thoai', 94, 1),
+    ('cuoc', 94, 1),
+    ('song', 94, 1),
+    ('viec', 94, 1),
+    ('ho', 94, 2),
+    ('cung', 94, 2),
+    ('phoi', 94, 1),
+    ('hop', 94, 1),
+    ('tham', 94, 1),
+    ('xay', 94, 1),
+    ('hoan', 94, 1),
+    ('thien', 94, 1),
+    ('co', 94, 1),
+    ('the', 94, 1),
+    ('cac', 94, 1),
+    ('xuat', 94, 2),
+    ('phuc', 94, 1),
+    ('vu', 94, 1),
+    ('tieu', 94, 1),
+    ('dia', 94, 1),
+    ('nha', 95, 10),
+    ('thiet', 95, 16),
+    ('ke', 95, 16),
+    ('thu', 95, 16),
+    ('cong', 95, 17),
+    ('mi', 95, 16),
+    ('nghe', 95, 16),
+    ('hinh', 95, 4),
+    ('hoc', 95, 4),
+    ('mau', 95, 4),
+    ('sac', 95, 4),
+    ('chuyen', 95, 2),
+    ('sau', 95, 2),
+    ('theo', 95, 2),
+    ('loai', 95, 2),
+    ('san', 95, 7),
+    ('pham', 95, 7),
+    ('nhu', 95, 3),
+    ('do', 95, 6),
+    ('det', 95, 2),
+    ('may', 95, 2),
+    ('go', 95, 2),
+    ('son', 95, 2),
+    ('mai', 95, 2),
+    ('kham', 95, 2),
+    ('trai', 95, 2),
+    ('da', 95, 3),
+    ('gom', 95, 2),
+    ('su', 95, 3),
+    ('thuy', 95, 2),
+    ('tinh', 95, 2),
+    ('kinh', 95, 2),
+    ('doanh', 95, 3),
+    ('tiep', 95, 2),
+    ('thi', 95, 2),
+    ('cac', 95, 7),
+    ('de', 95, 2),
+    ('dam', 95, 1),
+    ('bao', 95, 1),
+    ('hai', 95, 1),
+    ('hoa', 95, 3),
+    ('gia', 95, 1),
+    ('tri', 95, 1),
+    ('tham', 95, 1),
+    ('van', 95, 2),
+    ('nang', 95, 1),
+    ('va', 95, 3),
+    ('phu', 95, 2),
+    ('hop', 95, 2),
+    ('voi', 95, 2),
+    ('doi', 95, 3),
+    ('tuong', 95, 2),
+    ('khach', 95, 1),
+    ('hang', 95, 1),
+    ('la', 95, 1),
+    ('mot', 95, 1),
+    ('net', 95, 2),
+    ('moi', 95, 2),
+    ('nhom', 95, 1),
+    ('dan', 95, 1),
+    ('toc', 95, 1),
+    ('dia', 95, 1),
+    ('phuong', 95, 1),
+    ('deu', 95, 1),
+    ('co', 95, 2),
+    ('cua', 95, 1),
+    ('minh', 95, 1),
+    ('xuat', 95, 1),
+    ('hien', 95, 1),
+    ('tu', 95, 1),
+    ('lau', 95, 1),
+    ('phuc', 95, 1),
+    ('vu', 95, 1),
+    ('muc', 95, 1),
+    ('dich', 95, 1),
+    ('truyen', 95, 2),
+    ('thong', 95, 2),
+    ('ngay', 95, 1),
+    ('nay', 95, 1),
+    ('nghiep', 95, 1),
+    ('nuoc', 95, 1),
+    ('mong', 95, 1),
+    ('muon', 95, 1),
+    ('phat', 95, 1),
+    ('trien', 95, 1),
+    ('vua', 95, 2),
+    ('cau', 95, 1),
+    ('dung', 95, 1),
+    ('rong', 95, 1),
+    ('rai', 95, 1),
+    ('hon', 95, 1),
+    ('nghe', 96, 11),
+    ('si', 96, 10),
+    ('my', 96, 12),
+    ('thuat', 96, 15),
+    ('hinh', 96, 7),
+    ('hoc', 96, 4),
+    ('mau', 96, 9),
+    ('sac', 96, 4),
+    ('thiet', 96, 4),
+    ('ke', 96, 4),
+    ('chuyen', 96, 2),
+    ('sau', 96, 2),
+    ('theo', 96, 2),
+    ('loai', 96, 2),
+    ('nhu', 96, 5),
+    ('hoi', 96, 2),
+    ('hoa', 96, 2),
+    ('dieu', 96, 3),
+    ('khac', 96, 5),
+    ('nhiep', 96, 3),
+    ('anh', 96, 3),
+    ('hoac', 96, 2),
+    ('ki', 96, 2),
+    ('bot', 96, 2),
+    ('nuoc', 96, 2),
+    ('son', 96, 2),
+    ('dau', 96, 2),
+    ('la', 96, 1),
+    ('nguoi', 96, 2),
+    ('tao', 96, 1),
+    ('ra', 96, 1),
+    ('cac', 96, 2),
+    ('tac', 96, 1),
+    ('pham', 96, 1),
+    ('thong', 96, 2),
+    ('qua', 96, 1),
+    ('phuong', 96, 1),
+    ('tien', 96, 1),
+    ('nhau', 96, 1),
+    ('ve', 96, 1),
+    ('sap', 96, 1),
+    ('dat', 96, 1),
+    ('vat', 96, 1),
+    ('the', 96, 2),
+    ('co', 96, 1),
+    ('kha', 96, 1),
+    ('nang', 96, 1),
+    ('bien', 96, 1),
+    ('y', 96, 1),
+    ('tuong', 96, 1),
+    ('suy', 96, 1),
+    ('nghi', 96, 1),
+    ('diep', 96, 1),
+    ('thanh', 96, 1),
+    ('dang', 96, 1),
+    ('cu', 96, 1),
+    ('cho', 96, 1),
+    ('thuong', 96, 1),
+    ('thuc', 96, 1),
+    ('nha', 97, 10),
+    ('thiet', 97, 27),
+    ('ke', 97, 25),
+    ('quang', 97, 15),
+    ('cao', 97, 14),
+    ('hinh', 97, 8),
+    ('hoc', 97, 4),
+    ('mau', 97, 4),
+    ('sac', 97, 4),
+    ('va', 97, 10),
+    ('minh', 97, 2),
+    ('hoa', 97, 8),
+    ('thuong', 97, 2),
+    ('hieu', 97, 2),
+    ('do', 97, 4),
+    ('hoat', 97, 2),
+    ('sach', 97, 2),
+    ('tap', 97, 2),
+    ('chi', 97, 2),
+    ('biem', 97, 2),
+    ('lap', 97, 2),
+    ('trien', 97, 2),
+    ('lam', 97, 2),
+    ('dua', 97, 1),
+    ('ra', 97, 1),
+    ('y', 97, 2),
+    ('tuong', 97, 4),
+    ('ve', 97, 1),
+    ('nen', 97, 1),
+    ('cac', 97, 4),
+    ('anh', 97, 2),
+    ('mang', 97, 1),
+    ('tinh', 97, 1),
+    ('bieu', 97, 2),
+    ('de', 97, 1),
+    ('truyen', 97, 2),
+    ('tai', 97, 1),
+    ('thong', 97, 2),
+    ('diep', 97, 1),
+    ('trong', 97, 2),
+    ('muc', 97, 1),
+    ('tieu', 97, 1),
+    ('la', 97, 2),
+    ('ba', 97, 1),
+    ('san', 97, 2),
+    ('pham', 97, 2),
+    ('dich', 97, 1),
+    ('vu', 97, 1),
+    ('den', 97, 1),
+    ('cho', 97, 1),
+    ('nguoi', 97, 1),
+    ('xem', 97, 1),
+    ('cach', 97, 1),
+    ('trinh', 97, 1),
+    ('bay', 97, 1),
+    ('lo', 97, 1),
+    ('go', 97, 1),
+    ('cua', 97, 2),
+    ('doanh', 97, 1),
+    ('nghiep', 97, 1),
+    ('to', 97, 1),
+    ('chuc', 97, 1),
+    ('tri', 97, 1),
+    ('tue', 97, 1),
+    ('nha', 98, 10),
+    ('quay', 98, 22),
+    ('phim', 98, 23),
+    ('hinh', 98, 10),
+    ('hoc', 98, 4),
+    ('mau', 98, 4),
+    ('sac', 98, 4),
+    ('thiet', 98, 4),
+    ('ke', 98, 4),
+    ('tren', 98, 2),
+    ('khong', 98, 2),
+    ('duoi', 98, 2),
+    ('nuoc', 98, 2),
+    ('ki', 98, 2),
+    ('thuat', 98, 2),
+    ('so', 98, 2),
+    ('tai', 98, 2),
+    ('lieu', 98, 2),
+    ('dien', 98, 4),
+    ('anh', 98, 3),
+    ('tac', 98, 3),
+    ('pham', 98, 3),
+    ('san', 98, 3),
+    ('khau', 98, 3),
+    ('ca', 98, 2),
+    ('nhac', 98, 2),
+    ('bao', 98, 4),
+    ('chi', 98, 2),
+    ('truyen', 98, 3),
+    ('su', 98, 4),
+    ('kien', 98, 3),
+    ('xa', 98, 3),
+    ('hoi', 98, 3),
+    ('gia', 98, 3),
+    ('dinh', 98, 3),
+    ('la', 98, 2),
+    ('nguoi', 98, 1),
+    ('ghi', 98, 3),
+    ('bo', 98, 1),
+    ('video', 98, 1),
+    ('chuong', 98, 1),
+    ('trinh', 98, 1),
+    ('va', 98, 3),
+    ('cac', 98, 3),
+    ('hay', 98, 1),
+    ('ho', 98, 1),
+    ('cung', 98, 1),
+    ('can', 98, 1),
+    ('dam', 98, 2),
+    ('rang', 98, 2),
+    ('co', 98, 1),
+    ('phoi', 98, 1),
+    ('hop', 98, 1),
+    ('giua', 98, 1),
+    ('vien', 98, 1),
+    ('doi', 98, 1),
+    ('ngu', 98, 1),
+    ('dao', 98, 1),
+    ('hanh', 98, 1),
+    ('dong', 98, 1),
+    ('duoc', 98, 1),
+    ('lai', 98, 1),
+    ('chinh', 98, 1),
+    ('xac', 98, 1),
+    ('nguoi', 99, 9),
+    ('lam', 99, 9),
+    ('vuon', 99, 20),
+    ('uom', 99, 9),
+    ('va', 99, 13),
+    ('trong', 99, 15),
+    ('hoa', 99, 14),
+    ('cay', 99, 17),
+    ('canh', 99, 14),
+    ('hinh', 99, 4),
+    ('hoc', 99, 4),
+    ('mau', 99, 4),
+    ('sac', 99, 4),
+    ('thiet', 99, 5),
+    ('ke', 99, 5),
+    ('san', 99, 3),
+    ('xuat', 99, 3),
+    ('giong', 99, 3),
+    ('cham', 99, 3),
+    ('soc', 99, 3),
+    ('quan', 99, 3),
+    ('li', 99, 2),
+    ('xanh', 99, 2),
+    ('do', 99, 2),
+    ('thi', 99, 3),
+    ('lap', 99, 1),
+    ('hoach', 99, 1),
+    ('thuc', 99, 1),
+    ('hien', 99, 1),
+    ('cac', 99, 1),
+    ('hoat', 99, 1),
+    ('dong', 99, 1),
+    ('can', 99, 1),
+    ('de', 99, 2),
+    ('tao', 99, 1),
+    ('ho', 99, 1),
+    ('cung', 99, 2),
+    ('co', 99, 1),
+    ('the', 99, 1),
+    ('cu', 99, 1),
+    ('hat', 99, 1),
+    ('cap', 99, 1),
+    ('cho', 99, 1),
+    ('thuong', 99, 1),
+    ('lai', 99, 1),
+    ('doanh', 99, 1),
+    ('nghiep', 99, 1),
+    ('ban', 99, 3),
+    ('buon', 99, 1),
+    ('le', 99, 1),
+    ('hoac', 99, 1),
+    ('truc', 99, 1),
+    ('tiep', 99, 1),
+    ('ra', 99, 1),
+    ('truong', 99, 1),
+    ('nha', 100, 9),
+    ('thiet', 100, 16),
+    ('ke', 100, 16),
+    ('trang', 100, 17),
+    ('suc', 100, 14),
+    ('hinh', 100, 6),
+    ('hoc', 100, 5),
+    ('mau', 100, 4),
+    ('sac', 100, 4),
+    ('dinh', 100, 2),
+    ('da', 100, 6),
+    ('quy', 100, 6),
+    ('ma', 100, 2),
+    ('dien', 100, 2),
+    ('khac', 100, 2),
+    ('va', 100, 7),
+    ('men', 100, 2),
+    ('danh', 100, 2),
+    ('bong', 100, 2),
+    ('hoan', 100, 3),
+    ('thien', 100, 2),
+    ('phan', 100, 2),
+    ('loai', 100, 2),
+    ('tiep', 100, 2),
+    ('thi', 100, 2),
+    ('trung', 100, 2),
+    ('bay', 100, 2),
+    ('do', 100, 3),
+    ('gia', 100, 2),
+    ('cong', 100, 3),
+    ('ap', 100, 1),
+    ('dung', 100, 1),
+    ('cac', 100, 2),
+    ('nguyen', 100, 1),
+    ('tac', 100, 1),
+    ('nghe', 100, 1),
+    ('thuat', 100, 1),
+    ('khoa', 100, 1),
+    ('de', 100, 1),
+    ('san', 100, 1),
+    ('pham', 100, 1),
+    ('kim', 100, 1),
+    ('phuc', 100, 1),
+    ('vu', 100, 1),
+    ('cho', 100, 1),
+    ('diem', 100, 1),
+    ('nghi', 100, 1),
+    ('le', 100, 1),
+    ('ton', 100, 1),
+    ('giao', 100, 1),
+    ('hoac', 100, 1),
+    ('nghiep', 100, 1);
 
 
 -- Batch 3: Jobs 101 to 150
 INSERT INTO jobs (
-    job_name, holland_code, job_group, activities_code,
+    id, job_name, holland_code, job_group, activities_code,
     capacity, essential_ability, education_level, work_environment,
     work_style, work_value, job_description, specializations,
     main_tasks, work_areas, is_active
 ) VALUES
-    ('Thợ gốm sứ và thợ có liên quan', 'RA', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Thợ gốm và các thợ có liên quan chuẩn bị đồ gốm, sứ, đất nung, thiết bị vệ sinh, gạch, ngói và mài bằng tay hoặc bằng máy.', '["Gốm sứ gia dụng", "Gốm sứ xây dựng", "Gốm sứ Mỹ thuật", "Sứ kĩ thuật", "Kinh doanh hóa chất, máy móc thiết bị sản xuất gốm sứ"]', '["Chế tạo đồ gốm, sứ, đất nung", "Chế tạo khuôn thạch cao, polymer, kim loại, silicone, cao su, polyurethane và các vật liệu phù hợp khác", "Đọc các bản vẽ kĩ thuật để biết được yêu cầu của khách hàng", "Tạo dáng sản phẩm trên các máy làm đồ gốm bằng việc ấn ngón tay cái vào chính giữa của máy mài đất sét để tạo thành chỗ lõm, và ấn vào bên trong và bên ngoài của đất sét nổi hình trụ bằng tay và các ngón tay kéo lên một cách từ từ và tạo hình đất sét để tạo thành các hình dáng và kích thước theo yêu cầu", "Điều chỉnh tốc độ của bánh quay theo cảm giác khi sờ vào đất khi các mẩu đất sét đó to ra và các thành trở nên mỏng hơn", "Vận hành thiết bị làm các đồ gốm sứ như bát, chén, đĩa, gạch ngói, sứ đỡ dây", "Điều chỉnh và kiểm soát pha trộn, ép, cắt và đặt đồ bằng đất sét trong hoặc trên các hình dáng theo lí thuyết", "Làm phẳng bề mặt của các mẫu đã hoàn thiện bằng việc sử dụng cái nạo bằng cao su và các miếng bọt biển ướt", "Tạo các bánh xe mài mòn bằng các đúc và ép một hỗn dược mài mòn bằng tay hoặc bằng máy", "Kiểm tra sản phẩm về mặt khiếm khuyết, hình dáng, kích thước bằng cách sử dụng dụng cụ đo và các khuôn mẫu", "Chuẩn bị cho trưng bày và bán hàng, duy trì mối quan hệ với người bán lẻ, xưởng gốm, hệ thống phòng trưng bày triển lãm, giới thiệu sản phẩm để thuận lợi cho việc trưng bày và bán hàng"]', '["Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và phục chế đồ gốm sứ", "Các cơ sở, doanh nghiệp sản xuất đồ gốm sứ", "Các cơ sở, doanh nghiệp sản xuất gạch, ngói, thiết bị vệ sinh, đồ gốm sứ xây dựng và sứ kĩ thuật khác", "Các cơ sở, doanh nghiệp thủ công mĩ nghệ"]', TRUE),
-    ('Thợ vẽ biển quảng cáo, thợ trang trí và thợ có liên quan', 'R', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ vẽ biển quảng cáo, thợ trang trí và các thợ có liên quan trang trí các sản phẩm được làm từ gỗ, kim loại, vải dệt, thủy tinh, gốm và các nguyên vật liệu khác. Họ vẽ, bố trí và sơn các mẫu tự, mẫu trang trí, chữ viết lồng nhau và các kiểu mẫu trang trí để tạo ra các biển hiệu và chạm trổ và khắc axit các mẫu có tính chất trang trí trên thủy tinh và các đồ khác.', '["Kẻ vẽ biển quảng cáo, biển báo", "Sơn vẽ trang trí nội ngoại thất nhà ở, cửa hàng và công trình xây dựng", "Sơn vẽ trang trí trên sản phẩm"]', '["Viết, sơn và in các biển để quảng cáo, chỉ dẫn, trưng bày hoặc cho các mục đích khác", "Sơn trang trí bằng tay các mẫu vẽ lên sản phẩm như đồ gốm, thủy tinh, hộp đựng thuốc lá điếu, chụp đèn, chao đèn", "Chép mẫu vẽ và mẫu trang trí từ giấy kính lên sản phẩm", "Kết hợp các đường kẻ, khoảng trống, hình khối, mầu sắc và phối cảnh để tạo ra hiệu quả mong muốn như minh họa các ý tưởng, xúc cảm hoặc tâm trạng", "Bố trí và sơn một hoặc nhiều mẫu kí tự ngôn ngữ, mẫu trang trí, chữ lồng và họa tiết để tạo ra các biển hiệu", "Phác họa hoặc can lại họa tiết và chữ lên sản phẩm hoặc vật liệu để chuẩn bị các họa tiết hoặc khuôn tô", "Thiết kế họa tiết và chữ để trang trí trên biển quảng cáo, đồ thủy tinh, gốm sứ và sản phẩm tương tự", "Sử dụng phần mềm và thiết bị để tạo ra họa tiết 3D để ứng dụng vào các sản phẩm lớn, các tấm biển được khắc và khảm dát", "Thiết kế và sản xuất các kí tự phẳng hoặc có bóng bằng nhựa vinyl, hoặc ghép kí tự cắt sẵn", "Cắt chữ và dấu hiệu từ ván hoặc bìa bằng tay hoặc bằng máy", "Kiểm tra các bản phác thảo, biểu đồ, mẫu trang trí, họa tiết, ảnh chụp để quyết định cách khắc, cắt, chạm trổ, sơn, in lên sản phẩm", "Đo và tính toán kích thước của các kí tự, họa tiết để trang trí", "Khắc, chạm trổ, in, sơn, vẽ các kí tự, họa tiết, mẫu trang trí, thương hiệu lên bề mặt phẳng hoặc cong của sản phẩm kim loại, thủy tinh hoặc gốm sứ", "Khắc axit các họa tiết, mức đo và các chi tiết khác lên sản phẩm đồ thủy tinh"]', '["Hành nghề tự do hoặc tự mở cửa hàng, xưởng, công ti", "Các công ty quảng cáo, truyền thông, tổ chức sự kiện", "Các công ty thiết kế, tư vấn, thi công trang trí nội thất", "Các cơ sở, công ty sản xuất, phân phối, xuất nhập khẩu đồ gỗ nội ngoại thất, đồ gia dụng và trang trí", "Các cơ sở, công ty sản xuất, phân phối, xuất nhập khẩu hàng thủ công mĩ nghệ"]', TRUE),
-    ('Thợ thủ công trong ngành đồ gỗ và trang trí nội thất', 'RA', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Thợ thủ công trong ngành đồ gỗ và trang trí nội thất áp dụng các kĩ thuật thủ công truyền thống để xử lí vật liệu gỗ, tre, nứa, song, mây, cói, đá, vỏ/ mai/ lông động vật, đất sét, cát thạch anh và các nguyên phụ liệu khác; sản xuất, trang trí, xử lí và hoàn thiện các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí khác nhau. Họ cũng có thể tham gia lắp đặt, vận hành và bảo dưỡng các máy móc thiết bị dùng trong ngành đồ gỗ và trang trí nội thất. Ngày nay, máy móc thiết bị đã được áp dụng nhiều để hỗ trợ cho thợ thủ công làm ra sản phẩm đẹp, chính xác và hiệu quả hơn và không phải công đoạn nào cũng làm thủ công nữa.', '["Sơ chế, xử lí gỗ và vật liệu tự nhiên (tre, nứa, song, mây, cói, lác, bèo…)", "Chuyên sâu theo loại vật liệu (gỗ, đá, kim loại, đất sét, thủy tinh, vật liệu đan, sơn mài, khảm trai)", "Chuyên sâu theo kĩ thuật (mộc, đúc, dát, chạm khắc, thủy tinh, đan)", "Chuyên sâu theo loại sản phẩm (bàn ghế, giường tủ, bình, giỏ, đĩa, túi, hộp, tranh tượng, đồ trang trí)"]', '["Chuẩn bị và xử lí gỗ, tre, nứa, song, mây, cói, đá, vỏ/ mai/ lông động vật, đất sét, cát thạch anh và các nguyên phụ liệu khác", "Sản xuất các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí bằng cách cưa, bào, đục, đẽo, gắn, đóng đinh, sơn gỗ, tre, nứa, đá và các vật liệu tương tự", "Sản xuất các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí bằng cách đan, bện, kết, buộc vật liệu vỏ, sợi tự nhiên và nhân tạo (lạt, song, mây, cói, bèo, sợi nhựa, sợi ni lông, vải, dây…) có khung hoặc không có khung", "Sản xuất các sản phẩm đồ gia dụng và trang trí bằng cách đúc, dát, chạm khắc đồng, bạc và các vật liệu tương tự", "Sản xuất các sản phẩm đồ gia dụng và trang trí bằng thủy tinh bằng cách thổi và chạm khắc thủy tinh và các vật liệu tương tự", "Khắc, chạm, trổ, khảm, vẽ, sơn, gắn hoa văn họa tiết trang trí trên bề mặt sản phẩm", "Xử lí và hoàn thiện sản phẩm bằng cách sơn, phủ men, làm bóng, xử lí mối, mọt, mốc, rỉ"]', '["Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và sửa chữa sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí", "Các cơ sở, doanh nghiệp sản xuất đồ gỗ, trang trí nội ngoại thất", "Các cơ sở, doanh nghiệp thủ công mĩ nghệ", "Các doanh nghiệp sản xuất đồ gỗ và nội thất công nghiệp"]', TRUE),
-    ('Thợ thủ công trong ngành dệt may và da giày', 'R', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ thủ công trong ngành dệt may và da giày áp dụng các kĩ thuật và hoa văn truyền thống để sản xuất vải dệt, chi tiết đan, thêu, đắp nổi và kĩ thuật thủ công khác trong sản phẩm may mặc và da giày thủ công như quần áo, giày dép, túi xách, thắt lưng, phụ kiện, đồ gia dụng và trang trí.', '["Các công đoạn sản xuất da và sản phẩm da giày thủ công (thuộc da, đóng giày, sản xuất đồ da)", "Các công đoạn sản xuất sợi, vải và sản phẩm may thủ công (xe sợi, dệt-nhuộm, thêu, đan, móc, bô-đê, cắt may)", "Các loại sản phẩm dệt may, da giày thủ công (đồ đan, đồ thêu, thảm, tranh, đồ gia dụng, sản phẩm may mặc và phụ kiện)"]', '["Kéo sợi, dệt, nhuộm len, bông, vải, lụa và các loại vật liệu khác bằng thuốc nhuộm tự nhiên và công nghiệp", "Làm ren, đan, móc, thêu, may các sản phẩm may mặc, gia dụng và phụ kiện từ vải sợi", "Xử lí, nhuộm và hoàn thiện vật liệu da bằng thuốc nhuộm tự nhiên và công nghiệp", "Đóng giày dép, sản xuất túi xách, thắt lưng, phụ kiện và đồ gia dụng từ da và vật liệu tương đương."]', '["Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và sửa chữa sản phẩm may, da giày và phụ kiện", "Các cơ sở, doanh nghiệp may đo, sản xuất hàng may mặc thủ công, bán thủ công", "Các cơ sở, doanh nghiệp thuộc da, đóng giày, sản xuất hàng da giầy thủ công, bán thủ công", "Các doanh nghiệp sản xuất sợi, sản phẩm dệt và may mặc công nghiệp", "Các doanh nghiệp da giày công nghiệp", "Làm công việc chăm sóc trang phục trong xưởng phim, truyền hình, đoàn kịch"]', TRUE),
-    ('Thợ vận hành máy sản xuất hàng dệt may và da giày', 'RC', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ vận hành máy sản xuất hàng dệt may và da giày làm công việc vận hành và giám sát hoạt động của các máy móc thiết bị chế biến và xử lí sợi, vải, da và lông thú; sản xuất và hoàn thiện sản phẩm may mặc, giày dép và phụ kiện; sửa chữa, giặt là và làm sạch hàng dệt may, lông và đồ da.', '["Các công đoạn sản xuất da và sản phẩm da giày (thuộc da, đóng giày, sản xuất đồ da)", "Các công đoạn sản xuất sợi, vải và sản phẩm may mặc (xe sợi, dệt - nhuộm , thêu, móc, bô-đê, cắt, may)", "Các loại sản phẩm dệt may công nghiệp (jacket, sơ mi, veston, đồ lót, đồ thể thao, quần áo trẻ em, tất)", "Các loại sản phẩm da giày (giày da, giày thể thao)", "Các loại sản phẩm va li, túi xách và phụ kiện thời trang"]', '["Vận hành và giám sát hoạt động của máy móc thiết bị trong dây chuyền của mình", "Dọn dẹp, làm vệ sinh, thay thế các bộ phận cần thiết sau ca làm việc hoặc theo lịch định kì", "Sử dụng các loại hóa chất và phụ gia tẩy, nhuộm, làm sạch phù hợp", "Tuân thủ đúng qui trình kĩ thuật để sản xuất mã hàng tương ứng", "Tham gia đào tạo và áp dụng qui trình mới khi cải tiến qui trình hay chuyển mã hàng", "Liên tục học hỏi nâng cao kĩ năng tay nghề để sẵn sàng làm đa công đoạn trong dây chuyền nếu cần", "Máy móc sử dụng để sản xuất sợi từ xơ, bông, tơ và vật liệu tự nhiên", "Máy dệt thoi hay dệt kim để dệt các loại vải và sản phẩm dệt kim từ sợi tự nhiên và sợi tổng hợp", "Máy tẩy, nhuộm và xử lí sợi, vải", "Máy may, cắt, thêu, thùa khuyết, đính khuy, khóa và các loại máy và công cụ sử dụng trong sản xuất hàng may mặc", "Máy giặt và là ủi hàng dệt may, lông và thảm", "Máy móc và công cụ để chuẩn bị, chế biến, nhuộm và hoàn thiện sản phẩm da và lông thú", "Máy móc và công cụ đo, cắt, tạo hoa văn hình khối, định hình thân, đế giày, khâu/ dán/ ráp các bộ phận, hoàn thiện giày dép", "Máy móc sản xuất va li, túi xách và phụ kiện da khác."]', '["Các doanh nghiệp sản xuất sợi, dệt, nguyên phụ liệu dệt may", "Các doanh nghiệp sản xuất hàng may mặc công nghiệp", "Các cơ sở, doanh nghiệp thuộc da, sản xuất da lông thú và vải giả da", "Các doanh nghiệp sản xuất giày, sản phẩm da và phụ kiện", "Các cơ sở, doanh nghiệp gia công sản phẩm hoặc bán thành phẩm may mặc, da giày và phụ kiện"]', TRUE),
-    ('Bác sĩ thính học và đặc trị các khuyết tật về ngôn ngữ', 'IS', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Bác sĩ thính học và đặc trị các khuyết tật về ngôn ngữ xác định loại và mức độ khuyết tật ảnh hưởng đến chức năng nghe, nói, giao tiếp và nhai nuốt của con người. Họ chỉ định phương tiện hỗ trợ, thực hiện liệu pháp phục hồi chức năng và tư vấn cho bệnh nhân.', '["Thiết bị khuếch đại âm thanh", "Ngôn ngữ học lâm sàng và ngôn ngữ học tâm lí", "Thính học chẩn đoán", "Rối loạn tính lưu loát", "Thính học nhi khoa", "Các nghiên cứu tâm lí học", "Liệu pháp lời nói và chẩn đoán", "Rối loạn giọng nói"]', '["Xây dựng, hướng dẫn và tham gia tư vấn, sàng lọc, thực hiện các chương trình phục hồi ngôn ngữ và các chương trình khác liên quan đến khả năng nghe và giao tiếp", "Cho bệnh nhân làm kiểm tra khả năng nghe, nói, ngôn ngữ và các kiểm tra khác bằng các thiết bị và phương tiện chẩn đoán đặc biệt", "phân tích kết quả kiểm tra cùng với những thông tin về hành vi, giáo dục và y tế thu được từ bệnh nhân và gia đình, giáo viên, nhà chuyên môn, người sử dụng lao động để xác định tình trạng của bệnh nhân", "Xây dựng và thực hiện các liệu pháp phục hồi chức năng, ví dụ như huấn luyện thính giác, đọc môi, phục hồi ngôn ngữ, hội thoại để khôi phục lại hoặc nâng cao hiệu quả giao tiếp", "Chỉ định máy trợ thính, và phương tiện hỗ trợ khác và hướng dẫn sử dụng cho bệnh nhân", "Tư vấn và hướng dẫn bệnh nhân, gia đình, giáo viên và người sử dụng lao động về các vấn đề xã hội và tâm lí liên quan đến khuyết tật về lời nói"]', '["Bệnh viện tư nhân và Nhà nước", "Trung tâm phục hồi chức năng", "Phòng thí nghiệm nghiên cứu phát triển các phương pháp mới để chẩn đoán và điều trị các vấn đề liên quan đến thính giác và lời nói"]', TRUE),
-    ('Bác sĩ y khoa', 'ISR', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Thành tựu', 'Bác sĩ y khoa khám và chữa bệnh cho những người bị ốm, bệnh tật hoặc tai nạn thương tật khác. Họ cũng tiến hành nghiên cứu, cải tiến và phát triển các khái niệm, lí thuyết và phương pháp phòng và khám chữa bệnh, làm công tác giảng dạy chuyên môn và tuyên truyền giáo dục sức khỏe.', '["Chủ yếu liên quan đến các chuyên khoa, cả về nội khoa (điều trị bằng thuốc) và ngoại khoa (mổ), và các chuyên ngành khác như: da liễu, tai-mũi-họng, nội tiết, tim mạch, tiêu hóa, thần kinh, tâm thần, nhãn khoa, sản khoa, nhi khoa, lão khoa…"]', '["Thăm khám lâm sàng, chỉ định xét nghiệm, hội chẩn với bác sĩ khác và trao đổi với bệnh nhân và gia đình để đưa ra chẩn đoán", "Kê đơn và chỉ định các biện pháp điều trị và phòng ngừa", "Tiến hành phẫu thuật và các thủ thuật khác", "Giám sát hoạt động của nhân viên y tế liên quan", "Theo dõi tiến triển và đáp ứng điều trị của bệnh nhân", "Tư vấn về sức khỏe, dinh dưỡng và sinh hoạt để hỗ trợ điều trị, phòng ngừa bệnh tật và rối loạn", "Lập kế hoạch, quản lí và thực hiện việc chuyển tuyến, chuyển viện cho bệnh nhân cần điều trị đặc biệt, lâu dài hoặc các dạng dịch vụ cần thiết khác", "Nghiên cứu bệnh học và các phương pháp phòng ngừa và điều trị"]', '["Các bệnh viện, phòng khám, trạm y tế, nhà hộ sinh", "Phòng y tế của trường học, cơ quan, nhà máy, doanh nghiệp", "Thẩm mĩ viện", "Các tổ chức tình nguyện, tổ chức phi chính phủ, tổ chức quốc tế như Tổ chức Y tế Thế giới (WHO)", "Các cơ quan quản lí Nhà nước về y tế như bộ, sở y tế", "Giảng dạy tại các trường ĐH, CĐ, TC"]', TRUE),
-    ('Bác sĩ y học cổ truyền', 'SRI', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Thành tựu', 'Bác sĩ y học cổ truyền khám, điều trị, phòng ngừa bệnh tật và chấn thương liên quan đến các bệnh thể chất và tinh thần cho bệnh nhân bằng phương pháp và thuốc y học cổ truyền. Họ áp dụng các kiến thức và kĩ năng thực hành có được thông qua nghiên cứu sâu rộng các lí thuyết, niềm tin và giá trị bắt nguồn từ nền văn hóa và y học dân tộc bản địa.', '["Bác sĩ y học cổ truyền", "Bào chế thuốc y học cổ truyền", "Châm cứu"]', '["Tiến hành kiểm tra sức khỏe cho bệnh nhân, trao đổi với bệnh nhân và gia đình để xác định tình trạng sức khỏe của bệnh nhân", "Đưa ra phác đồ và điều trị các bệnh về thể chất, tinh thần, tâm lí xã hội", "Sử dụng các phương pháp, cách thức chữa bệnh truyền thống của địa phương", "Kê đơn và cắt các loại thuốc truyền thống như cây, lá, chiết xuất khoáng sản và động vật để kích thích khả năng tự hồi phục của cơ thể"]', '["Các bệnh viện y học cổ truyền hoặc có điều trị y học cổ truyền", "Tự mở phòng khám y học cổ truyền"]', TRUE),
-    ('Chuyên gia dịch vụ pháp lí', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Chuyên gia dịch vụ pháp lí, còn gọi là thư kí luật, sử dụng kiến thức chuyên môn để trợ giúp các chuyên gia pháp lí trong thông tin liên lạc, tài liệu, hỗ trợ nội bộ, hỗ trợ thủ tục và các hoạt động phối hợp quản lí nội bộ trong các văn phòng luật sư, ban pháp chế của các doanh nghiệp lớn và các cơ quan Nhà nước. Họ cũng có thể hỗ trợ các nhà quản lí, chuyên gia pháp lí, các chuyên gia kinh tế có liên quan đến các vấn đề pháp lí, bao gồm cả những người có liên quan đến hợp đồng bảo hiểm, cho vay vốn và các giao dịch tài chính khác.', '["Công chứng", "Thanh tra"]', '["Kiểm tra hoặc chuẩn bị cho việc kiểm tra các hồ sơ pháp lí và các văn bản khác có liên quan", "Chuẩn bị các tài liệu tóm tắt các hồ sơ pháp lí hoặc đặt ra các điều kiện cho vay hoặc bảo hiểm", "Tư vấn cho khách hàng và các đại lí về các vấn đề pháp lí, kĩ thuật trong trường hợp cụ thể của họ", "Chuẩn bị tài liệu liên quan đến chuyển giao bất động sản, cổ phiếu hoặc các giao dịch khác cần phải có các thủ tục pháp lí Kiểm tra tính hợp lệ của hồ sơ và gửi chúng đến cơ quan chức năng Quản lí các tài liệu, hồ sơ vụ án và các thư viện về pháp luật"]', '["Các văn phòng luật", "Ban pháp chế của các doanh nghiệp lớn", "Chính phủ"]', TRUE),
-    ('Chuyên gia dinh dưỡng', 'ISC', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Chuyên gia dinh dưỡng tiến hành nghiên cứu, cải tiến và phát triển các khái niệm, phương pháp thực hiện liên quan đến việc chuẩn bị, áp dụng các chế độ ăn uống cho điều trị và các mục đích khác.', '["Dinh dưỡng lâm sàng", "Giáo dục dinh dưỡng", "Quản lí bệnh viện", "Dinh dưỡng cho thể thao"]', '["Phát triển, thử nghiệm các giải pháp dinh dưỡng và chế độ ăn uống", "Lập kế hoạch và chỉ đạo việc chuẩn bị chế độ ăn phục vụ điều trị và các mục đích ăn kiêng khác cho cá nhân hay nhóm trong các bệnh viện, hoặc cho người lao động trong các lĩnh vực cụ thể", "Tham gia các chương trình giáo dục dinh dưỡng và các hoạt động phục hồi chức năng dinh dưỡng", "Tư vấn dinh dưỡng đối với các vấn đề về thực phẩm cộng đồng và các chương trình y tế"]', '["Bệnh viện hoặc nhà dưỡng lão", "Trường học hoặc các tổ chức", "Khách sạn", "Chính quyền địa phương hoặc các cơ quan Nhà nước", "Trung tâm nghiên cứu", "Ngành công nghiệp thực phẩm"]', TRUE),
-    ('Chuyên gia phát triển', 'SEC', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự hợp tác, tương trợ', 'Mối quan hệ', 'Đây là một lĩnh vực liên ngành tập trung vào các vấn đề liên quan đến phát triển kinh tế và xã hội. Các chuyên gia phát triển được đào tạo để ứng dụng chuyên môn trong một lĩnh vực cụ thể với đông đảo nhân dân để giúp đất nước phát triển. Ví dụ như một chuyên gia tâm lí có thể giúp trẻ em của một đất nước phục hồi tâm lí sau chiến tranh. Tương tự, một kĩ sư xây dựng có thể giúp một quốc gia phát triển mạng lưới đường giao thông mới, hoặc một luật sư có thể giúp soạn thảo hiến pháp mới.', '["Quản lí phát triển", "Cải cách thể chế", "Xây dựng dự án phát triển", "Các chương trình sinh kế bền vững", "Quản lí các tổ chức phi chính phủ."]', '["Trở thành chuyên gia trong một lĩnh vực cụ thể", "Nghiên cứu cách ứng dụng chuyên môn trong lĩnh vực đó phục vụ đông đảo nhân dân trong nước", "Nghiên cứu các chuyên ngành liên quan khác, đặc biệt là xã hội học và kinh tế học", "Nghiên cứu các điều kiện, nếp sống và văn hóa của từng địa phương", "Tư vấn cho chính phủ các nước", "Làm việc với các chuyên gia ở các nước khác", "Đào tạo người dân địa phương quản lí và duy trì những công trình, công việc đã được xây dựng và phát triển"]', '["Các tổ chức quốc tế (ví dụ các cơ quan của Liên Hiệp Quốc, Ngân hàng Thế giới, Tổ chức Lao động quốc tế)", "Công ti tư vấn tư nhân chuyên về các dự án phát triển quốc tế"]', TRUE),
-    ('Chuyên gia phục hồi chức năng nghề nghiệp', 'ISR', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Chuyên gia phục hồi chức năng nghề nghiệp giúp đỡ bệnh nhân trong quá trình phục hồi nghề nghiệp sau khi bị bệnh hoặc tai nạn bằng cách đưa họ tham gia các công việc mang tính sáng tạo, nghề nghiệp hoặc thủ công như làm vườn, tập thể dục, trò chơi và âm nhạc theo hướng dẫn của bác sĩ.', '["Lão khoa", "Sức khỏe tâm thần", "Phục hồi chức năng cơ-xương", "Thần kinh học", "Nhi khoa", "Phục hồi thể chất"]', '["Sử dụng các thao tác nghề nghiệp khác nhau để giúp bệnh nhân phát triển, phục hồi hoặc duy trì cuộc sống hàng ngày của họ và kĩ năng làm việc", "Giúp bệnh nhân cải thiện khả năng thực hiện các công việc trong môi trường sống và làm việc của họ", "Sử dụng kĩ thuật đặc biệt để giúp bệnh nhân phát triển, cải thiện, duy trì hoặc khôi phục lại sự tự chủ cao nhất"]', '["Bệnh viện", "Cơ sở chăm sóc sức khỏe cộng đồng", "Trường học", "Trung tâm phục hồi chức năng"]', TRUE),
-    ('Chuyên gia quản lý đô thị', 'IEA', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Chuyên gia quản lí đô thị xây dựng và triển khai các kế hoạch, chiến lược liên quan đến sử dụng đất, thiết kế môi trường đô thị, kể cả hệ thống giao thông, hướng dẫn và đảm bảo sự phát triển có trật tự ở các khu dân cư và cộng đồng. Công việc còn liên quan tới việc nghiên cứu, phân tích, tư duy chiến lược, kiến trúc, thiết kế đô thị, tham vấn cộng đồng, khuyến nghị chính sách, thực hiện quản lí đô thị.', '["Quản lí đô thị", "Quản lí giao thông đô thị", "Môi trường đô thị"]', '["Qui hoạch và điều phối phát triển khu vực đô thị", "Thu thập và phân tích dữ liệu về kinh tế, pháp lí, chính trị, văn hóa, nhân khẩu học, xã hội học, vật lí và môi trường ảnh hưởng đến vấn đề sử dụng đất, xây dựng và đề xuất qui hoạch phát triển và sử dụng đất", "Qui hoạch và điều phối việc sử dụng đất cho công viên, trường học, các cơ quan tổ chức, sân bay, đường xá và các dự án liên quan cho các khu thương mại, công nghiệp và khu dân cư", "Qui hoạch, tham vấn, triển khai xây dựng, giám sát, quản lí hệ thống giao thông đường bộ, giao thông công cộng sao cho hiệu quả và an toàn", "Thẩm định và phản biện các báo cáo đánh giá tác động môi trường"]', '["Cơ quan Nhà nước", "Các công ti kiến trúc", "Tổ chức về BVMT đô thị", "Công ti phát triển bất động sản tư nhân"]', TRUE),
-    ('Chuyên gia quản trị bất động sản', 'EC', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Chuyên gia quản trị bất động sản, còn gọi là đại lí bất động sản và quản lí tài sản, thay mặt khách hàng sắp xếp việc mua, bán, cho thuê bất động sản, tài sản và hưởng lợi trên cơ sở nhận hoa hồng từ các thương vụ thực hiện được.', '["Quản lí kinh doanh bất động sản", "Quản lí nhà và đất"]', '["Thu thập thông tin về tài sản để bán, cho thuê, hoàn cảnh của chủ sở hữu, nhu cầu của người mua và người thuê tiềm năng", "Cung cấp thông tin cho người mua hoặc người thuê tiềm năng, giải thích các điều khoản bán hàng và các điều kiện cho thuê", "Đàm phán thỏa thuận giữa người thuê và chủ sở hữu về tiền thuê và chi phí", "Xây dựng hợp đồng cho thuê và dự toán chi phí", "Sắp xếp việc chuyển quyền sở hữu tài sản;"]', '["Các công ti bất động sản", "Tự mở công ti bất động sản"]', TRUE),
-    ('Chuyên gia quản trị doanh nghiệp nhỏ và vừa', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Chuyên gia quản trị doanh nghiệp nhỏ và vừa (DNNVV) là chuyên gia trong việc thành lập và phát triển DNNVV, hoặc trực tiếp quản lí mọi mặt hoạt động sản xuất kinh doanh của DNNVV. Doanh nghiệp nhỏ và vừa là các doanh nghiệp có vốn hoặc số người lao động không vượt quá một số lượng nhất định. Tại Việt Nam, doanh nghiệp có tổng nguồn vốn không vượt quá 50 tỉ đồng hoặc không vượt quá 100 người lao động trong lĩnh vực thương mại dịch vụ, và doanh nghiệp có tổng nguồn vốn không vượt quá 100 tỉ hoặc không vượt quá 300 người lao động trong các lĩnh vực khác thì được gọi là doanh nghiệp nhỏ và vừa. Số lượng các doanh nghiệp nhỏ và vừa nhiều hơn số lượng doanh nghiệp lớn và tính tổng thể thì DNNNV sử dụng nhiều lao động hơn. DNNVV cũng thường được coi là đầu tàu sáng tạo và cạnh tranh trong nhiều lĩnh vực kinh tế.', '["Quản lí doanh nghiệp"]', '["Xây dựng, thực hiện và giám sát các chính sách, chiến lược và kế hoạch sản xuất của DNNVV", "Lập kế hoạch cụ thể về các hoạt động sản xuất bao gồm đầu ra, số lượng, chất lượng, giá thành, thời gian và chi phí lao động", "quản lí việc vận hành các xưởng sản xuất và qui trình chất lượng thông qua lập kế hoạch bảo dưỡng, cung cấp dụng cụ, thời gian vận hành", "Tuyển dụng, đào tạo, kèm cặp và giám sát nhân viên", "Xây dựng, thực hiện, giám sát và điều chỉnh chiến lược bán hàng và quảng cáo tiếp thị của doanh nghiệp", "Xây dựng và quản lí ngân sách, tài chính, chi phí và báo cáo kết quả kinh doanh"]', '["Tại các DNNVV", "Cơ quan Nhà nước liên quan đến DNNVV", "Các trung tâm, tổ chức hỗ trợ phát triển DNNVV như Hội DNNVV, Trung tâm xúc tiến DNNVV của Phòng Thương mại và Công nghiệp Việt Nam và của các cơ quan khác…"]', TRUE),
-    ('Chuyên gia quản trị kinh doanh nông nghiệp', 'ESR', 'Làm việc với con người', NULL, 'Phân tích - logic', 'Làm việc với con người', 4, NULL, NULL, NULL, 'Chuyên gia quản trị kinh doanh nông nghiệp là người nghiên cứu, tổ chức, quản lí kinh doanh trong lĩnh vực sản xuất nông nghiệp cũng như đưa sản phẩm nông nghiệp đến tay người tiêu dùng.', '["Chủ yếu theo các loại sản phẩm khác nhau như: Quản lí doanh nghiệp lương thực, thực phẩm, Vật tư nông nghiệp, Chăn nuôi và thú y"]', '["Tìm hiểu nhu cầu khách hàng và các loại sản phẩm nông nghiệp khác nhau", "Phát triển và vận hành hệ thống sản xuất sản phẩm nông nghiệp", "Phát triển và vận hành hệ thống phân phối sản phẩm nông nghiệp cho địa phương (chợ, cửa hàng bán lẻ, cửa hàng bán buôn) để đưa sản phẩm đến với khách hàng"]', '["Các doanh nghiệp kinh doanh nông nghiệp, lâm nghiệp, thủy sản và muối"]', TRUE),
-    ('Chuyên gia vật lí trị liệu', 'SIR', 'Làm việc với con người', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Chuyên gia vật lí trị liệu tiến hành trị liệu các rối loạn về xương, cơ và các bộ phận của hệ tuần hoàn hoặc hệ thần kinh. Khách hàng của họ bao gồm những người khuyết tật, bị bệnh tâm thần, người già và những người đang phục hồi sau thời gian dài bệnh tật, tai nạn hoặc phẫu thuật.', '["Bệnh tim mạch lồng ngực", "Vật lí trị liệu lão khoa", "Phục hồi chức năng tay", "Vật lí trị liệu chỉnh hình", "Thần kinh học nhi khoa", "Y học thể thao", "Rối loạn thần kinh (ví dụ: đột quị)", "Kĩ thuật vật lí trị liệu"]', '["Chẩn đoán rối loạn của xương, cơ và các bộ phận của hệ tuần hoàn hoặc hệ thần kinh", "Điều trị bằng các phương pháp sử dụng siêu âm, nhiệt, laser hoặc kĩ thuật tương tự", "Kiểm tra dị tật cơ thể và rối loạn để xác định thông số kĩ thuật cho chân, tay giả hoặc các thiết bị khác", "Tư vấn cho cộng đồng và cá nhân về tư thế đúng của cơ thể khi làm việc hoặc thực hiện các hoạt động khác để tránh chấn thương, căng thẳng và tăng trương cơ bắp", "Làm việc với các cá nhân (ví dụ như người chơi thể thao) để giúp họ tăng cường thể chất"]', '["Bệnh viện, cơ sở y tế", "Trung tâm phục hồi chức năng", "Câu lạc bộ thể thao, đội thể thao", "Phòng khám thể thao", "Phòng tập gym, trung tâm thể dục", "Phòng khám riêng"]', TRUE),
-    ('Đại lí bảo hiểm', 'ECS', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Đại lí bảo hiểm bán bảo hiểm nhân thọ, tai nạn, ô tô, trách nhiệm dân sự, hỏa hoạn, hàng hải và sản phẩm bảo hiểm khác cho các khách hàng mới và khách hàng hiện hữu.', '["Bảo hiểm tai nạn", "Ô tô", "Thiên tai", "Tập đoàn Bảo hiểm", "Bảo hiểm y tế", "Bảo hiểm nhân thọ"]', '["Thu thập thông tin cần thiết về các khách hàng để xác định loại bảo hiểm thích hợp và điều kiện bảo hiểm", "Đàm phán với khách hàng để xác định loại và mức độ rủi ro cho từng trường hợp bảo hiểm, phạm vi và điều khoản thanh toán", "Đàm phán và xây dựng hợp đồng tái bảo hiểm", "Tư vấn và đàm phán các điều khoản của hợp đồng bảo hiểm cho những dự án, công trình và rủi ro đặc biệt"]', '["Các công ti bảo hiểm tư nhân hoặc Nhà nước"]', TRUE),
-    ('Đại lí du lịch và lữ hành', 'EC', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Đại lí du lịch và lữ hành tiến hành tư vấn và tổ chức tour du lịch, lập kế hoạch hành trình và lịch trình đi lại, ăn nghỉ cho khách du lịch, tổ chức hoặc bán tour du lịch trọn gói cho khách', '["Du lịch mạo hiểm", "Du lịch sinh thái", "Du lịch y tế", "Hướng dẫn viên du lịch", "Du lịch / Du lịch Tiếp thị", "Quản lí du lịch", "Điều hành tour", "Đặt phòng du lịch", "Đại lí du lịch"]', '["Thu thập thông tin về tính khả thi, chi phí, mức độ tiện lợi của các loại hình giao thông, chỗ ở, xác định yêu cầu của khách hàng và tư vấn cho họ các hình thức du lịch phù hợp", "Đặt và xác nhận đặt phòng, bàn giao cho khách hàng vé, chứng từ và nhận thanh toán", "Tổ chức tour du lịch trọn gói cho các sự kiện hoặc kì nghỉ và bán các gói du lịch cho khách hàng", "Giúp khách hàng hoàn thiện các hồ sơ cần thiết để thực hiện tour du lịch"]', '["Trong các bộ phận du lịch của các công ti và cơ quan Nhà nước", "Đại lí du lịch", "Khu resort và nghỉ dưỡng", "Các hãng hàng không", "Các tổ chức liên quan đến du lịch"]', TRUE),
-    ('Y tá và hộ sinh', 'SIC', 'Làm việc với con người', 'Phân tích và xử lý', 'Phân tích - logic', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Y tá hỗ trợ các bác sĩ khi họ thực hiện nhiệm vụ và phục vụ các bệnh nhân bị ốm, bị thương hoặc khuyết tật. Trong các y tá có hộ sinh là người hỗ trợ quá trình sinh nở, chăm sóc bà mẹ và trẻ em trước và sau khi sinh, hướng dẫn gia đình trong việc chăm sóc bà mẹ và trẻ sơ sinh.', '["Chăm sóc, điều dưỡng người cao tuổi", "Chăm sóc thai sản", "Chăm sóc sức khỏe nghề nghiệp", "Y tá cấp cứu", "Y tá gây tê", "Y tá sản khoa và hộ sinh", "Y tá chỉnh hình", "Y tá nhi khoa", "Y tá tâm thần", "Y tá phẫu thuật…"]', '["Giúp các bác sĩ áp dụng các biện pháp phòng và chữa bệnh, trong đó có việc cho uống thuốc, tiêm, theo dõi đáp ứng điều trị của bệnh nhân…", "giải quyết các ca bệnh khẩn cấp, nếu có, khi vắng mặt bác sĩ", "Chuẩn bị cho bệnh nhân khi thực hiện các phương pháp điều trị vật lí và tâm lí", "Hỗ trợ bác sĩ phẫu thuật tại phòng mổ, lau rửa vết thương và băng bó, chăm sóc sau phẫu thuật", "(Với hộ sinh) Đánh giá tiến triển trong quá trình mang thai và sinh nở, xử lí biến chứng, ghi nhận các triệu chứng cần can thiệp của bác sĩ chuyên khoa liên quan", "Thực hiện chăm sóc cá nhân, điều dưỡng chuyên nghiệp đối với bệnh nhân, bà mẹ và trẻ sơ sinh tại cơ sở y tế hoặc nhà riêng", "Trả lời các câu hỏi của bệnh nhân và gia đình, cung cấp thông tin và tư vấn về phòng chữa bệnh và chăm sóc", "Hướng dẫn, phối hợp và giám sát các trợ tác khác", "Nghiên cứu, cập nhật kiến thức kĩ năng về chăm sóc y tế và chuẩn bị các báo cáo tài liệu khoa học", "Tham gia công tác giáo dục sức khỏe tại cơ sở y tế và tại cộng đồng"]', '["Bệnh viện", "Phòng khám", "Trung tâm phục hồi chức năng", "Trung tâm y tế cộng đồng ", "Các cơ quan quản lí Nhà nước về y tế", "Các trường ĐH, CĐ và TC y"]', TRUE),
-    ('Nha sĩ', 'IRS', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Các nha sĩ, còn gọi là bác sĩ nha khoa, điều trị các bệnh và các rối loạn răng, nướu và mô mềm của miệng.', '["Nha khoa cộng đồng", "Phẫu thuật nha khoa và nội nha", "Phẫu thuật miệng, hàm, mặt", "Bệnh răng miệng", "Chỉnh nha", "Nha khoa nhi", "Nha khoa trẻ em và nha khoa phòng ngừa", "Nha chu", "Phục hình răng"]', '["Cung cấp dịch vụ chăm sóc răng miệng như làm sạch răng và chữa sâu răng, sử dụng máy nha khoa và các công cụ tương tự khi cần thiết", "Kiểm tra kết quả xét nghiệm các bệnh răng miệng", "Chữa sâu răng bằng chất trám, kim loại hoặc nhựa", "Gây tê cục bộ hoặc gây tê vùng khi cần thiết và chuẩn bị vùng miệng cho phẫu thuật", "Sử dụng các dụng cụ phẫu thuật để nhổ răng gẫy, sâu, hỏng", "Làm và lắp răng giả", "Tư vấn bệnh nhân về các biện pháp khắc phục nha khoa và sức khỏe răng miệng nói chung"]', '["Các bệnh viện nha khoa hoặc khoa răng, hàm, mặt trong bệnh viện", "Các phòng khám nha khoa", "Các viện nha khoa thẩm mĩ", "Mở phòng khám riêng"]', TRUE),
-    ('Giáo viên mầm non', 'SA', 'Làm việc với con người', 'Phân tích và xử lý', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Công tác giảng dạy đòi hỏi chuyên môn theo các nhóm tuổi học sinh. Giáo viên mầm non dạy trẻ em từ 3 đến 6 tuổi. Đây là giai đoạn đặt nền móng cho việc học tập và là giai đoạn quan trọng đối với quá trình giáo dục một con người.', '["Một giáo viên mầm non cần đạt được các tiêu chuẩn trong tất cả các khía cạnh của giáo dục mầm non Một số giáo viên chuyên về các lĩnh vực phát triển cụ thể của trẻ như;Rối loạn học mầm non", "Giáo dục dựa vào cộng đồng", "Dinh dưỡng trẻ em"]', '["Thực hiện các hoạt động sử dụng các loại nguyên vật liệu, trang thiết bị khác nhau để giúp cho trẻ nhỏ phát triển thể chất, giao tiếp, kĩ năng xã hội và quan trọng nhất là sự thích thú trong học tập", "Sử dụng các kĩ thuật như kể chuyện, đóng vai để đặt nền móng cho sự phát triển ngôn ngữ", "Mang lại cơ hội cho trẻ em được tiếp xúc với các thành viên khác nhau của xã hội và tìm hiểu về họ", "Phát triển kĩ năng hỏi và khám phá của trẻ nhỏ", "Giúp trẻ phát triển tất cả các kĩ năng trong sinh hoạt hàng ngày (ví dụ như kĩ năng đi vệ sinh, chăm sóc cá nhân và kĩ năng xã hội)", "Ghi lại quá trình học tập của trẻ nhỏ", "Phát hiện bất cứ dấu hiệu nào của rối loạn phát triển hoặc vấn đề sức khỏe ở trẻ nhỏ", "Đề xuất các chương trình nâng cao sự tăng trưởng và phát triển ở trẻ nhỏ", "Làm việc với các chuyên gia khác (ví dụ như nhà trị liệu ngôn ngữ, nhà tâm lí học) để giúp trẻ vượt qua mọi khó khăn mà chúng có thể gặp phải", "Giúp đỡ trẻ trong việc vệ sinh cá nhân", "Tương tác với phụ huynh để thúc đẩy sự phát triển liên tục của trẻ ở nhà", "Đào tạo những người khác"]', '["Các trường và lớp mầm non", "Tổ chức giáo dục dành riêng cho giáo dục mầm non", "Trường sư phạm", "Bệnh viện nhi đồng", "Tư vấn, cộng tác viên cho các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình vì trẻ em hoặc giáo dục mầm non"]', TRUE),
-    ('Giáo viên tiểu học', 'SAC', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Công tác giảng dạy đòi hỏi chuyên môn theo các nhóm tuổi học sinh. Giáo viên tiểu học dạy trẻ em từ lớp 1 đến lớp 5. Họ chủ yếu tập trung xây dựng cơ sở vững chắc cho kĩ năng đọc, viết, tính toán cùng với các kĩ năng khác như thể chất, tâm lí, trí tuệ và xã hội.', '["Mỗi giáo viên tiểu học cần đạt yêu cầu trong tất cả các khía cạnh của giáo dục tiểu học Một số giáo viên chuyên về các khía cạnh phát triển cụ thể của trẻ như", "Tin học", "Giáo dục cho trẻ có yêu cầu đặc biệt", "Giảng dạy một chủ đề cụ thể (ví dụ: Ngôn ngữ)"]', '["Chuẩn bị kế hoạch bài học hàng ngày và dài hạn cho từng lớp, phục vụ việc dạy chữ, số và sự phát triển chung của trẻ em", "Đặt nền móng cho toàn bộ việc học như: đọc, viết, nghe, nói, toán học, khoa học, khoa học xã hội và giáo dục thể chất", "Sử dụng các loại hình nghệ thuật và âm nhạc để phát triển sự sáng tạo, sự tự thể hiện của trẻ em", "Sử dụng các hoạt động thể thao để tăng cường phát triển thể chất", "Đánh giá và theo dõi sự tiến bộ của học sinh", "Kiểm tra và đánh giá sự tiến bộ của học sinh qua bài kiểm tra giấy và kiểm tra miệng", "Phát hiện dấu hiệu của rối loạn phát triển hoặc vấn đề sức khỏe", "Đề xuất chương trình cho sự tiếp tục tăng trưởng và phát triển ở trẻ", "Làm việc với các chuyên gia khác (ví dụ như nhà trị liệu ngôn ngữ, nhà tâm lí học) để giúp trẻ vượt qua mọi khó khăn có thể có", "Tương tác với phụ huynh để thúc đẩy sự phát triển liên tục của trẻ ở gia đình", "Đào tạo những người khác"]', '["Các trường tiểu học công lập", "Các trường tiểu học tư thục", "Các tổ chức tình nguyện", "Trung tâm học tập cộng đồng", "Tư vấn, cộng tác viên cho các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình vì trẻ em hoặc giáo dục, ví dụ như UNESCO, UNICEF"]', TRUE),
-    ('Giáo viên giáo dục đặc biệt', 'SA', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Giáo viên giáo dục đặc biệt dạy cho trẻ em, thanh thiếu niên, người lớn có khuyết tật về thể chất hay trí tuệ, hoặc những người có khó khăn về học tập.', '["Khiếm thính và khuyết tật lời nói", "Khuyết tật về trí tuệ", "Khuyết tật về thần kinh", "Khuyết tật vận động", "Khiếm thị", "Tự kỉ"]', '["Đánh giá khả năng và khiếm khuyết của học sinh về thể chất, trí tuệ, xã hội và cảm xúc, đặc biệt là khả năng trí tuệ hoặc các trạng thái đặc biệt khác", "Thiết kế và điều chỉnh chương trình giảng dạy, chuẩn bị bài học và các hoạt động phù hợp với yêu cầu", "Hướng dẫn cá nhân hoặc nhóm sử dụng các kĩ thuật và phương tiện hỗ trợ đặc biệt (ví dụ: chữ nổi Braille, máy trợ thính…) phù hợp với từng đối tượng học sinh và giám sát lớp học", "Ứng dụng những chiến lược và kĩ thuật dạy học đặc thù cho từng đối tượng học sinh để hỗ trợ sự phát triển giác quan, vận động, ngôn ngữ, nhận thức và trí nhớ", "Khuyến khích học sinh tự tin, hứng thú, vận động và phối hợp, giúp họ khám phá và áp dụng các phương pháp nhằm hạn chế trình trạng khiếm khuyết và đạt tiến bộ", "Thực hiện kiểm tra, đánh giá, ghi nhận sự tiến bộ của từng học sinh và trao đổi với học sinh, gia đình, giáo viên chủ nhiệm, nhà trị liệu, nhân viên công tác xã hội và các chuyên gia khác", "Tư vấn cá nhân"]', '["Các tổ chức cung cấp dịch vụ liên quan đến khuyết tật (ví dụ: trường chuyên biệt cho trẻ khiếm thị, khiếm thính…)", "Các trường phổ thông cung cấp dịch vụ hòa nhập cho trẻ em có nhu cầu đặc biệt", "Các hội, tổ chức của người khuyết tật", "Các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình hỗ trợ người khuyết tật ví dụ như Tổ chức Hỗ trợ Người khuyết tật Việt Nam (VNAH)", "Trợ giúp trong các hoạt động, sự kiện của người khuyết tật như giải thể thao, Thế vận hội cho người khuyết tật, Paragames", "Tư vấn cho các công ti, doanh nghiệp có chương trình hỗ trợ, hòa nhập, tuyển dụng người khuyết tật"]', TRUE),
-    ('Quản lí bán hàng và marketing', 'EC', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự sáng kiến và tính chủ động đảm nhận các yêu cầu', 'Điều kiện làm việc', 'Nhà quản lí bán hàng và marketing lập kế hoạch, chỉ đạo và điều phối hệ thống phân phối nhằm đảm bảo hàng hóa của doanh nghiệp đến nhà kho, cửa hàng và cuối cùng là đến với người tiêu dùng.', '["Quản lí quảng cáo", "Nghiên cứu hành vi tiêu dùng và nghiên cứu thị trường", "Tiếp thị quốc tế", "Tiếp thị dịch vụ", "Tiếp thị nông thôn", "Quản lí bán hàng", "Tiếp thị du lịch", "Tiếp thị thương mại"]', '["Lập kế hoạch, chỉ đạo và phối hợp hoạt động bán hàng và tiếp thị của doanh nghiệp trên các hồ sơ kinh doanh và đánh giá thị trường", "Xác định bảng giá, giảm giá và điều kiện giao hàng, dự trù kinh phí xúc tiến quảng cáo, phương thức bán hàng, ưu đãi đặc biệt và các chiến dịch bán hàng đặc biệt", "Giám sát việc tuyển dụng, đào tạo và làm việc của nhân viên", "Đại diện bộ phận bán hàng và tiếp thị trong giao dịch với các bộ phận khác hoặc với các cơ quan bên ngoài", "Lập kế hoạch kinh doanh và chiến lược tiếp thị cho sản phẩm mới (ra mắt sản phẩm, làm việc với các chuyên gia quảng cáo)"]', '["Các doanh nghiệp Nhà nước và tư nhân kinh doanh thương mại (bán lẻ hoặc bán buôn trong nước, xuất nhập khẩu)", "Bộ phận bán hàng tiếp thị của các doanh nghiệp sản xuất", "Các doanh nghiệp kinh doanh dịch vụ như giáo dục, y tế, tài chính, tư vấn môi giới, cho thuê…"]', TRUE),
-    ('Quản lí bán lẻ và bán buôn', 'EC', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Nhà quản lí bán lẻ và bán buôn làm công tác quản lí chung trong doanh nghiệp bán buôn và bán lẻ, làm chủ đại lí bán buôn hoặc các doanh nghiệp bán lẻ, lập kế hoạch, chỉ đạo và điều phối các hoạt động kinh doanh.', '["Quản trị bán lẻ", "Bán hàng"]', '["Đàm phán với các nhà cung cấp, khách hàng, đại lí và các tổ chức khác", "Lập dự toán kinh phí", "Xây dựng, thực hiện và điều chỉnh chính sách mua hàng, bán hàng, dịch vụ khách hàng", "Lập kế hoạch và kiểm soát việc sử dụng các nguồn lực và nhân công", "Quản lí hoạt động kinh doanh hàng ngày, bao gồm cả việc theo dõi báo cáo bán hàng, tồn kho, và các báo cáo khác liên quan đến việc bán hàng"]', '["Trung tâm mua sắm và các cửa hàng", "Sách và ngành công nghiệp xuất bản", "Cửa hàng âm nhạc", "Ngành công nghiệp may mặc", "Ngành công nghiệp chế biến thực phẩm"]', TRUE),
-    ('Quản lí khách sạn, nhà hàng', 'ECS', 'Làm việc với con người', 'Thu thập thông tin', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Quản lí khách sạn, nhà hàng lập kế hoạch, chỉ đạo và phối hợp các hoạt động kinh doanh của khách sạn, nhà hàng theo lĩnh vực chuyên môn. Họ có thể quản lí chung hoặc chuyên về một nghiệp vụ như tiền sảnh (đặt phòng cho khách ở khách sạn), nhà hàng Âu, nhà hàng Á, quầy đồ uống, quán cà phê (chuẩn bị và phục vụ đồ ăn, uống cho khách), buồng phòng (đảm bảo dịch vụ buồng, phòng cho khách), bếp nóng, bếp nguội, bếp bánh (mua nguyên liệu và chế biến món ăn cho khách)... Nhiệm vụ cụ thể của quản lí khách sạn, nhà hàng thay đổi tùy theo bộ phận mà người đó phụ trách.', '["Bộ phận lễ tân", "Bộ phận buồng, phòng", "Bộ phận nhà hàng, quầy uống", "Hoạt động tiếp tân", "Hoạt động quản lí buồng, phòng", "Hoạt động nhà hàng", "Kĩ thuật nấu nướng", "Kĩ thuật pha chế đồ uống", "Quản lí khách sạn", "Quản lí khu resort"]', '["Quản lí bộ phận lễ tân: phụ trách đội ngũ nhân viên tương tác trực tiếp với khách hàng để giúp họ đặt phòng khách sạn, nhận và đăng kí khi họ đến nơi, xuất và thu tiền các hóa đơn, hỗ trợ tất cả các vấn đề liên quan nhằm thỏa mãn nhu cầu khách hàng thông qua liên kết với các nhà cung cấp dịch vụ khác như vận tải, du lịch và các bộ phận khác của khách sạn", "Quản lí bộ phận nhà hàng, quầy uống: phụ trách đội ngũ nhân viên chuẩn bị và phục vụ tất cả các mặt hàng thực phẩm và đồ uống trong khách sạn. Lĩnh vực chuyên ngành khác nhau tùy theo các loại món ăn (ví dụ như đồ ăn Âu, đồ ăn Trung Quốc,)", "Quản lí bộ phận buồng, phòng: phụ trách các công việc bảo trì các phòng và dãy phòng trong khách sạn, ví dụ như trang trí phòng, dọn dẹp, vệ sinh, thay ga, khăn và trang bị hàng ngày, kiểm tra và làm phòng khi khách trả phòng"]', '["Khách sạn", "Khu Resorts", "Khu du lịch y tế", "Khu du lịch nghỉ dưỡng", "Hãng hàng hải, hàng không", "Dịch vụ nhà khách ở các công ti"]', TRUE),
-    ('Quản lí nông nghiệp', 'ERC', 'Làm việc với con người', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Nhà quản lí nông nghiệp là người làm chủ hoặc đại diện cho chủ sở hữu các trang trại, nông trường. Họ chịu trách nhiệm quản lí chung, lập kế hoạch, chỉ đạo và điều phối các hoạt động sản xuất kinh doanh.', '["Quản lí rủi ro trong nông nghiệp", "Quản lí kinh doanh nông nghiệp", "Tiếp thị nông nghiệp", "Quản lí kho và chuỗi cung ứng nông nghiệp"]', '["Lập dự toán kinh phí", "Đàm phán với nhà cung cấp, khách hàng và các tổ chức khác", "Lập kế hoạch, và kiểm soát việc sử dụng các nguồn lực và nhân công", "Quản lí hoạt động hàng ngày của doanh nghiệp, đơn vị nông nghiệp"]', '["Làm việc trong các trang trại tư nhân và Chính phủ liên quan đến sản xuất, lưu kho và tiếp thị", "Làm việc cho các công ty liên quan đến nông nghiệpkinh doanh, chế biến thực phẩm, sản xuất giống và cung cấp dịch vụ tư vấn cho ngành nông nghiệp", "Làm việc trong các tổ chức quốc tế với vai trò tư vấn"]', TRUE),
-    ('Quản trị bệnh viện', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Nhà quản trị bệnh viện là chuyên gia về quản trị và quản lí của ngành y tế. Họ đảm bảo rằng các dịch vụ chăm sóc sức khỏe được thực hiện một cách hiệu quả cho bệnh nhân và gia đình thông qua các bệnh viện, trung tâm chăm sóc sức khỏe ban đầu và các tổ chức cung cấp các loại hình dịch vụ y tế khác nhau.', '["Tài chính", "Quan hệ công chúng", "Tổ chức cán bộ và nhân sự", "Đấu thầu"]', '["Lập kế hoạch, chỉ đạo và điều phối các hoạt động của một bệnh viện hoặc tổ chức chăm sóc sức khỏe", "Lập kế hoạch tài chính và dự toán kinh phí", "Lập kế hoạch và kiểm soát việc sử dụng các nguồn lực và lao động", "Lập kế hoạch và thực hiện các chính sách của tổ chức"]', '["Bệnh viện", "Trung tâm điều dưỡng", "Cơ quan về chăm sóc sức khỏe của Chính phủ"]', TRUE),
-    ('Quản lí nhân sự', 'ESC', 'Làm việc với con người', 'Tương tác với người khác', 'Năng lực phân tích – logic; Năng lực ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Nhà quản lí nhân sự lập kế hoạch, điều phối các hoạt động của một tổ chức để thực hiện chiến lược nhân lực một cách tốt nhất.', '["Các hệ thống và qui trình quản lí nhân sự", "Lương thưởng, phúc lợi và bồi thường", "Phát triển nguồn nhân lực", "Quan hệ lao động và pháp luật lao động", "Tranh chấp lao động và đình công"]', '["Tư vấn và thực hiện việc tuyển dụng, phân công, đào tạo, đề bạt, trả lương, bồi thường, phúc lợi cho nhân viên, xây dựng quan hệ quản lí - nhân viên và những lĩnh vực khác của chính sách nhân sự", "Nghiên cứu và phân tích công việc bằng các cách thức như phỏng vấn người lao động, nhà quản lí và mô tả chi tiết vị trí, công việc, nghề nghiệp từ những thông tin thu được", "làm việc về các hệ thống phân loại nghề nghiệp", "Nghiên cứu và tư vấn cho các cá nhân về các cơ hội tuyển dụng, những lựa chọn nghề, giáo dục và đào tạo bậc cao nếu cần", "Phối hợp với bộ phận có liên quan tiến hành đánh giá hiệu quả lao động của người lao động", "Lập, lưu trữ, theo dõi hồ sơ của nhân viên và các dữ liệu nhân sự như đánh giá kết quả, tỉ lệ vắng mặt và tỉ lệ biến động lao động", "Chuẩn bị, đàm phán, giải thích hợp đồng lao động và thỏa ước lao động tập thể", "Tư vấn và thực hiện việc đối thoại và hợp tác với công đoàn cơ sở hoặc đại diện tập thể người lao động để xây dựng quan hệ lao động hài hòa tại nơi làm việc, phòng ngừa và giải quyết tranh chấp lao động"]', '["Tất cả các doanh nghiệp vừa và lớn đều cần nhà quản lí nhân sự", "Các doanh nghiệp, công ty tư vấn tuyển dụng, nhân sự"]', TRUE),
-    ('Cán bộ quan hệ lao động', 'SEC', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Cán bộ quan hệ lao động là chuyên gia trong lĩnh vực xây dựng và duy trì quan hệ lao động hài hòa giữa người sử dụng lao động và người lao động của một doanh nghiệp. Họ hiểu biết sâu về chính sách pháp luật lao động, quan tâm tới các điều kiện làm việc thích hợp và việc làm bền vững cho người lao động, đảm bảo lợi ích cho cả doanh nghiệp và người lao động trong dài hạn.', '["Bồi thường", "Tư vấn", "Tâm lí công nghiệp", "Xã hội học công nghiệp", "Luật lao động", "Phúc lợi lao động", "Thỏa ước lao động tập thể", "Giải quyết tranh chấp lao động và đình công", "Bảo vệ người lao động"]', '["Tìm hiểu, cập nhật, tuyên truyền chính sách pháp luật liên quan đến lao động cho người lao động và người sử dụng lao động", "Tìm hiểu, tuyên truyền và triển khai thực hiện chính sách, nội qui lao động của doanh nghiệp", "Đề xuất với người sử dụng lao động, thực hiện các chương trình vì lợi ích của người lao động và gia đình họ", "Gặp gỡ những người lao động gặp khó khăn (ví dụ khó khăn về tài chính, sức khỏe) và tư vấn cho họ hoặc giới thiệu họ với các chuyên gia có liên quan để tiếp tục hỗ trợ", "Tập huấn, tư vấn, nâng cao trình độ của người lao động và công đoàn cơ sở về quan hệ lao động, đối thoại tại nơi làm việc", "Đóng vai trò kết nối giữa người lao động và người sử dụng lao động, thúc đẩy việc đàm phán kí kết thỏa ước lao động tập thể", "Tham gia giải quyết tranh chấp lao động và đình công thông qua thương lượng tập thể"]', '["Các doanh nghiệp, nhà máy, đặc biệt là doanh nghiệp sử dụng nhiều lao động", "Tổ chức công đoàn các cấp", "Các tổ chức đại diện người sử dụng lao động như Văn phòng giới sử dụng lao động (Phòng Thương mại và Công nghiệp Việt Nam), Liên minh hợp tác xã, hiệp hội dệt may, da giày…", "Cơ quan quản lí Nhà nước về lao động (Bộ và các sở LĐTB&amp;amp;XH, các tổng cục, cụ, vụ viện)", "Các tổ chức quốc tế về vấn đề lao động và việc làm"]', TRUE),
-    ('Nhà tâm lí học', 'SIA', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Nhà tâm lí học nghiên cứu các quá trình tâm lí và hành vi của cá nhân hoặc nhóm người. Họ áp dụng kiến thức này để thúc đẩy, điều chỉnh sự phát triển của cá nhân, xã hội, giáo dục hoặc nghề nghiệp.', '["Tâm lí học ứng dụng", "Tâm sinh lí học", "Tâm lí học nghề nghiệp", "Tâm lí trẻ em", "Tâm lí lâm sàng", "Tâm lí học nhận thức", "Tâm lí học phát triển", "Tâm lí giáo dục", "Tâm lí học thực nghiệm", "Tâm lí học tội phạm", "Tâm lí học công nghiệp", "Tâm lí học xã hội"]', '["Thực hiện các trắc nghiệm để đo lường các đặc tính tâm lí và hành vi (ví dụ như trí thông minh, đặc điểm tính cách, quá trình nhận thức) và giải thích thông tin này để hướng dẫn khách hàng", "Phân tích ảnh hưởng của di truyền, xã hội, nghề nghiệp và các yếu tố khác đối với tư tưởng và hành vi cá nhân", "Thực hiện tư vấn hoặc điều trị đối với cá nhân và nhóm", "Nghiên cứu các yếu tố tâm lí trong chẩn đoán, điều trị và phòng ngừa các bệnh tâm thần", "Nghiên cứu về hành vi làm việc trong môi trường công nghiệp và môi trường tổ chức", "đưa ra và cung cấp dịch vụ để thúc đẩy sức khỏe nghề nghiệp"]', '["Bệnh viện", "Các công ti, nhà máy và ngành công nghiệp", "Các tổ chức giáo dục", "Dịch vụ quốc phòng", "Hành nghề cá nhân"]', TRUE),
-    ('Nhà tư vấn tâm lí', 'ISA', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Mối quan hệ', 'Nhà tư vấn tâm lí hướng dẫn hoặc tư vấn cho các cá nhân nhằm giúp họ đối phó với những khó khăn về tâm lí, tình cảm và căng thẳng liên quan đến cuộc sống hàng ngày. Những khó khăn đó có thể liên quan đến học tập, nghề nghiệp, hôn nhân, cuộc sống gia đình và phát triển cá nhân', '["Chỉ dẫn nghề nghiệp và tư vấn", "Tư vấn liên quan đến thanh thiếu niên (ví dụ như Tư vấn kĩ năng sống)", "Tư vấn giáo dục", "Tư vấn lão khoa (làm việc với người cao tuổi)", "Tư vấn hôn nhân", "Tư vấn trường học", "Tư vấn lạm dụng thuốc và nghiện ngập"]', '["Phỏng vấn khách hàng và những người có liên quan đến khách hàng để thu thập thông tin về giáo dục, nghề nghiệp, xã hội và thông tin liên quan khác để hiểu hơn về nguồn gốc và nguyên nhân có thể dẫn đến những khó khăn", "Tiến hành các trắc nghiệm trí tuệ, khả năng, sở thích, tính cách để đánh giá tình trạng của khách hàng", "Sử dụng các loại kĩ thuật tư vấn khác nhau để giúp khách hàng vượt qua hoặc kiểm soát vấn đề của mình", "Thực hiện hướng dẫn, tư vấn nhóm cho một nhóm khác hàng có chung nhu cầu", "Thực hiện hỗ trợ sau tư vấn theo để tiếp tục hỗ trợ khách hàng"]', '["Các phòng khám và bệnh viện, làm việc với những người trong tình trạng suy sụp tinh thần", "Các cơ sở giáo dục, hỗ trợ tư vấn học đường", "Các doanh nghiệp, nhà máy, giúp nhân viên đối phó tốt hơn với căng thẳng liên quan tới công việc", "Các tổ chức phi chính phủ, tổ chức quốc tế liên quan tới trẻ em, thanh niên, người tàn tật, người già, phụ nữ, người nghiện ma túy và thích", "Hành nghề cá nhân"]', TRUE),
-    ('Nhà tư vấn nghề nghiệp', 'SI', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Nhà tư vấn nghề nghiệp áp dụng các nguyên tắc tâm lí học nghề nghiệp để giúp khách hàng hiểu bản thân mình, hiểu thế giới nghề nghiệp, xây dựng các phương án chọn nghề và chuẩn bị cho nghề nghiệp. Họ phỏng vấn khách hàng, cho làm bản câu hỏi và xác định năng lực hướng nghiệp, cung cấp thông tin về các nghề nghiệp khác nhau. Họ làm việc với khách hàng vào những thời điểm quan trọng trong việc quyết định nghề nghiệp (ví dụ như cuối trung học phổ thông, trung học cơ sở, sau khi tốt nghiệp các cơ sở đào tạo). Họ cũng có thể giúp những người đang có vấn đề về nghề nghiệp (ví dụ như những người không thích nghề của mình, người mất việc làm). Họ có thể tư vấn cá nhân hoặc tư vấn nhóm.', '["Tư vấn nghề nghiệp", "Các nhóm đặc biệt (ví dụ như những người có nhu cầu đặc biệt, người mới phục hồi sau bệnh tật)", "Các nhóm tuổi cụ thể", "Các công việc cụ thể đối với từng mốc phát triển nghề nghiệp (ví dụ như trắc nghiệm, đánh giá, chuẩn bị nghề nghiệp)"]', '["Phỏng vấn khách hàng để xác định tình trạng phát triển nghề nghiệp của họ", "Áp dụng các kĩ thuật khác nhau (ví dụ như kiểm tra, lấy hồ sơ cá nhân) để xác định mong muốn và khả năng của khách hàng", "Giúp đỡ khách hàng hiểu biết sâu hơn về thế giới nghề nghiệp", "Giúp đỡ khách hàng phát triển kĩ năng chuẩn bị nghề nghiệp (ví dụ như chuẩn bị hồ sơ, chuẩn bị phỏng vấn)", "Trao đổi với gia đình của khách hàng (đặc biệt là các khách hàng trẻ tuổi) để xây dựng một kế hoạch phát triển nghề nghiệp hiệu quả hơn", "Xác định các yếu tố xã hội, tâm lí và kinh tế có thể cản trở quá trình phát triển nghề nghiệp và giúp khách hàng nhận thức được những rào cản này", "Lập hồ sơ cá nhân", "Làm việc với các chuyên gia khác như giáo viên, nhân viên tư vấn, nhà tâm lí học và nhân viên xã hội"]', '["Trung tâm dịch vụ việc làm, tư vấn nghề nghiệp", "Cơ quan Nhà nước về lao động", "Các phòng khám tâm lí", "Trung tâm phục hồi chức năng", "Trường học", "Các tổ chức phát triển thanh thiếu niên", "Các tổ chức phát triển, phi chính phủ, tổ chức quốc tế"]', TRUE),
-    ('Kĩ thuật viên chẩn đoán hình ảnh', 'ISR', 'Làm việc với con người', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Thành tựu', 'Kĩ thuật viên chẩn đoán hình ảnh phụ trách các thiết bị chẩn đoán hình ảnh trợ giúp các bác sĩ xác định về tình trạng bệnh tật có thể có của bệnh nhân, như máy X quang, điện tim, siêu âm, nội soi, chụp cắt lớp, cộng hưởng từ… Người làm nghề này hiểu về cơ thể con người, điều kiện y tế và chăm sóc bệnh nhân. Họ cũng nắm vững cách vận hành thiết bị và lưu giữ hồ sơ.', '["Siêu âm", "Nội soi", "X-quang", "Kĩ thuật viên điện tâm đồ", "Chụp cộng hưởng từ (MRI)", "Chụp cắt lớp (CT Scan)", "Kĩ thuật, thiết bị chẩn đoán hình ảnh"]', '["Chuẩn bị cho bệnh nhân chẩn đoán hình ảnh. Công việc này có thể bao gồm tiêm một loại thuốc nhuộm màu hoặc làm sạch các phần của cơ thể được soi chụp", "Tiến hành kiểm tra theo chỉ định của bác sĩ một cách chính xác", "Xử lí thông tin từ các kết quả kiểm tra (ví dụ: rửa phim X-quang)", "Ghi kết quả vào báo cáo", "Chuyển kết quả cho bệnh nhân và bác sĩ", "Vệ sinh, duy tu bảo dưỡng máy móc thiết bị"]', '["Bệnh viện", "Các phòng thí nghiệm y tế", "Các trường đào tạo về y tế", "Trung tâm nghiên cứu"]', TRUE),
-    ('Kĩ thuật viên nhãn khoa', 'CRI', 'Làm việc với con người', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Điều kiện làm việc', 'Kĩ thuật viên nhãn khoa, còn gọi là y tá nhãn khoa, hỗ trợ chẩn đoán, điều trị các vấn đề sức khỏe liên quan đến thị giác và mắt, bao gồm đo và chỉ định kính, kính áp tròng, chẩn đoán và điều trị (không bao gồm phẫu thuật) bất thường về cơ, chấn thương mắt nhỏ, chẩn đoán, điều trị các bệnh như bệnh tăng nhãn áp và các chẩn đoán khác như tổn thương võng mạc do tiểu đường; tiến hành giáo dục sức khỏe, chăm sóc thị lực cho các nhóm bệnh nhân đặc biệt cũng là công việc của y tá nhãn khoa.', '["Kính áp tròng", "Các nhóm đặc biệt như trẻ em, người già hoặc những người cần các thiết bị hỗ trợ thị giác", "Liệu pháp cho người khiếm thị"]', '["Kiểm tra bệnh nhân để xác định dấu hiệu của bệnh và điều trị cho bệnh nhân theo từng lĩnh vực chuyên ngành", "tham gia hoạt động y tế công cộng bao gồm đo thị lực cho cộng đồng, các ngành công nghiệp và trường học", "Xác định lỗi khúc xạ và đưa ra điều chỉnh thích hợp thông qua việc dùng kính", "Chẩn đoán các bệnh về mắt và các vấn đề về tầm nhìn bằng cách kiểm tra cảm nhận màu sắc, nhận thức sâu, khả năng tập trung, và phối hợp và độ sắc nét hình ảnh", "Chăm sóc cho bệnh nhân trước và sau khi phẫu thuật như điều chỉnh bằng tia laser và loại bỏ đục thủy tinh thể"]', '["Bệnh viện", "Các phòng khám, đo mắt", "Các phòng thí nghiệm y tế", "Cơ sở đào tạo y khoa", "Trung tâm nghiên cứu"]', TRUE),
-    ('Kĩ thuật viên y tế', 'ISR', 'Làm việc với con người', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Năng lực thể chất - cơ khí; Năng lực hình học-màu sắc – thiết kế', 'Làm việc với con người', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kỹ thuật Y Sinh (KTYS) là một lĩnh vực liên ngành ứng dụng kỹ thuật tiên tiến (như nano, tế bào gốc, y tế viễn thông) vào việc tạo ra các phương pháp nghiên cứu và thiết bị phục vụ cho sức khỏe cũng như giúp hiểu biết sâu hơn về con người. KTYS bao gồm các lĩnh vực như Thiết bị y tế, Điện tử Y Sinh, Y học tái tạo, Kỹ thuật dược. Những sản phẩm của ngành KTYS bao gồm máy CT-cắt lớp, X-quang, trợ tim, nội soi, các bộ phận nhân tạo trong cơ thể, dược phẩm và vật liệu sinh học. Lĩnh vực này phù hợp với những người yêu thích thiết kế, chế tạo kinh doanh hay nghiên cứu khoa học và y học lâm sàng', '["Chủ yếu là chuyên sâu về các loại thiết bị và thủ thuật cụ thể như", "Máy trợ tim, trợ thở", "Máy gây mê", "Thủ thuật tim mạch, hô hấp…"]', '["Chẩn đoán, xử lí hình ảnh siêu âm, X-Quang, CT, MRI…", "Sử dụng các máy móc, thiết bị y tế trong việc chẩn đoán cho người bệnh", "Xử lý tính hiệu sinh lý học, cơ sinh học, vật liệu sinh học với kỹ thuật sinh học, phân tích hệ thống, mô hình hóa 3 chiều đúc, dát, chạm khắc đồng, bạc và các vật liệu tương tự", "Sản xuất các sản phẩm đồ gia dụng và trang trí bằng thủy tinh bằng cách thổi và chạm khắc thủy tinh và các vật liệu tương tự", "Khắc, chạm, trổ, khảm, vẽ, sơn, gắn hoa văn họa tiết trang trí trên bề mặt sản phẩm", "Xử lí và hoàn thiện sản phẩm bằng cách sơn, phủ men, làm bóng, xử lí mối, mọt, mốc, rỉ"]', '["Bệnh viện", "Các phòng thí nghiệm y tế", "Cơ sở đào tạo y tế", "Trung tâm nghiên cứu"]', TRUE),
-    ('Nhà quản lí sự kiện', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Nhà quản lí sự kiện làm công việc quản lí và điều hành sự kiện. Họ tổ chức và phối hợp các dịch vụ cho các hội nghị, sự kiện, tiệc, đám cưới, triển lãm, hội thảo và các sự kiện đặc biệt.', '["Quản lí MICE", "Quản lí sự kiện thể thao, giải trí", "Dịch vụ cưới hỏi, sự kiện gia đình"]', '["Thảo luận với khách hàng về các yêu cầu của họ và đưa ra các gói dịch vụ và giá cả phù hợp", "đề xuất ý tưởng, chương trình, kịch bản nếu cần", "Giới thiệu dịch vụ hội thảo, hội nghị, sự kiện và triển lãm thương mại cho các khách hàng tiềm năng", "Sắp xếp và phối hợp các dịch vụ, ví dụ như phòng hội nghị, phông màn, biển báo, âm thanh và thiết bị nghe nhìn, máy tính, dẫn chương trình và phiên dịch, chỗ ở, đi lại và hoạt động xã hội cho người tham dự, phục vụ hậu cần cho các diễn giả", "Tổ chức đăng kí tham gia", "Giám sát công việc của các nhà thầu và báo cáo về sự thay đổi so với kế hoạch"]', '["Các công ty tổ chức sự kiện, chuyên về tổ chức các loại sự kiện khác nhau như ca nhạc, hòa nhạc, biểu diễn nghệ thuật, sự kiện truyền hình, lễ hội, trình diễn thời trang, thể thao, giới thiệu sản phẩm, động thổ, khai trương, hội nghị hội thảo, chương trình khuyến mãi, họp báo, đám cưới, lễ kỉ niệm, tiệc, hội họp…", "Các cơ quan/công ty về quan hệ công chúng", "Bộ phận liên quan tới tổ chức sự kiện của các khách sạn lớn", "Tự mở doanh nghiệp, dịch vụ tổ chức sự kiện"]', TRUE),
-    ('Nhân viên công tác xã hội', 'SE', 'Làm việc với con người', 'Thu thập thông tin; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Nhân viên công tác xã hội làm việc với các nhóm và cộng đồng. Họ tìm hiểu các vấn đề xã hội, hướng dẫn cho đối tượng gặp khó khăn trong các vấn đề xã hội và vấn đề liên quan nhằm giúp họ tìm kiếm và sử dụng các nguồn lực để vượt qua khó khăn và đạt được mục tiêu cụ thể.', '["Tổ chức và phát triển cộng đồng", "Tội phạm học và cải huấn", "Phát triển nguồn nhân lực, quản lí nhân lực và quan hệ lao động", "Công tác xã hội trong y tế, tâm thần và tư vấn", "Dịch vụ chăm sóc gia đình"]', '["Thu thập thông tin về nhu cầu của đối tượng gặp khó khăn xã hội, đánh giá khả năng và vấn đề của họ", "Giúp các cá nhân, gia đình và cộng đồng xác định các phương án và kế hoạch hành động", "Hỗ trợ họ xác định và tiếp cận các nguồn hỗ trợ cộng đồng như hỗ trợ pháp lí, y tế, tài chính, nhà ở, việc làm, giao thông, vận động và chăm sóc cá nhân hàng ngày, và các dịch vụ liên quan khác", "Tham gia sàng lọc, lựa chọn người tham gia cho các chương trình xã hội phù hợp", "Cung cấp dịch vụ can thiệp khủng hoảng và tạm lánh", "Thực hiện các tập huấn kĩ năng sống, chương trình điều trị cai nghiện, kiểm soát hành vi, dịch vụ thanh thiếu niên và các chương trình xã hội và cộng đồng khác", "Hỗ trợ đánh giá hiệu quả các biện pháp và chương trình thông qua giám sát và báo cáo tiến bộ của đối tượng", "Liên lạc thường xuyên với các tổ chức xã hội, nhà trường và tổ chức y tế có liên quan để trao đổi thông tin về tình trạng và tiến bộ của đối tượng được hỗ trợ"]', '["Các tổ chức phi chính phủ, tổ chức tình nguyện, tổ chức quốc tế có chương trình hỗ trợ xã hội, phát triển cộng đồng;", "Trung tâm cộng đồng", "Bệnh viện", "Các doanh nghiệp có chương trình trách nhiệm xã hội của doanh nghiệp (CSR)", "Các tổ chức, đoàn thể có chức năng chăm sóc, bảo trợ xã hội cho hội viên, khách hàng như đoàn thanh niên, hội phụ nữ, hội người khuyết tật…"]', TRUE),
-    ('Tiếp viên hàng không hoặc tiếp viên trên phương tiện vận tải', 'ESC', 'Làm việc với con người', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Mối quan hệ', 'Tiếp viên, còn gọi là chiêu đãi viên, là người trực tiếp cung cấp dịch vụ cá nhân nhằm đảm bảo sự an toàn và thoải mái của hành khách. Họ phục vụ bữa ăn, đồ uống trên máy bay và trên tàu.', '["Tiếp viên hàng không", "Tiếp viên trên tàu du lịch…"]', '["Cung cấp các dịch vụ cho khách hàng", "Giải thích việc sử dụng các thiết bị an toàn như dây an toàn, mặt nạ dưỡng khí, phao cứu sinh", "Phát tạp chí, tai nghe, chăn, các vật dụng tương tự, và trả lời các yêu cầu của hành khách", "Phục vụ các bữa ăn và đồ uống được chuẩn bị sẵn", "Bán hàng miễn thuế", "Thực hiện trợ giúp y tế cho khách hàng khi cần thiết", "Đưa ra hành động thích hợp trong trường hợp khẩn cấp hoặc tai nạn", "Chăm sóc hành khách tại các sân bay"]', '["Các hãng hàng không trong nước và quốc tế", "Các sân bay", "Các tàu du lịch, du thuyền", "Các chuyến xe lửa cao cấp và xe buýt du lịch"]', TRUE),
-    ('Thợ chế biến thực phẩm', 'RC', 'Làm việc với con người', 'Thu thập thông tin; Tương tác với người khác', 'Thể chất - cơ khí', 'Làm việc với con người', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu khả năng làm việc dưới áp lực', 'Mối quan hệ', 'Thợ chế biến thực phẩm là người tham gia trực tiếp vào công việc chế biến thực phẩm của các cơ sở sản xuất, kiêm tra chất lượng sản phẩm của dây chuyên chế biến thực phẩm từ nguyên liệu đến thành phẩm; tổ chức sản xuất và chế biến thực phẩm ở quy mô vừa và nhỏ.', '["Chế biến, bảo quản thịt và các sản phẩm từ thịt", "Chế biến, bảo quản thuỷ sản và các sản phẩm từ thuỷ sản", "Chế biến và bảo quản rau quả", "Chế biến sữa và các sản phẩm từ sữa"]', '["Thực hiện việc chế biến thực phẩm từ các nguyên liệu sẵn có", "Tổ chức, điều hành hoạt động chế biến thực phẩm theo dây chuyền hoặc theo từng công đoạn được giao", "Kiểm tra, đánh giá chất lượng thực phẩm"]', '["Các doanh nghiệp chế biến thực phẩm", "Xưởng chế biến thực phẩm", "Các công ty liên quan đến thực phẩm", "Trung tâm dinh dưỡng", "Các khu công nghiệp, chế xuất"]', TRUE),
-    ('Đầu bếp', 'ERA', 'Làm việc với con người', 'Tương tác với người khác', 'Năng lực hình học - màu sắc - thiết kế; Năng lực thể chất – cơ khí', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Thợ đầu bếp chế biến và làm các món ăn, hiểu biết về dinh dưỡng, đảm bảo các món ăn ngon, an toàn thực phẩm và đầy đủ chất dinh dưỡng cần thiết.', '["Các món ăn Âu – Á", "Pha chế đồ uống", "Trang trí các món ăn", "Làm bánh"]', '["Nấu nướng các món ăn từ nguyên liệu có sẵn", "Sơ chế các loại thực phẩm, rau, củ quả để làm các món ăn phù hợp yêu cầu", "Làm thủ công bánh mứt kẹo, sô-cô-la từ hỗn hợp của đường, sô cô la và các thành phần khác với sự hỗ trợ của một số công cụ và máy móc"]', '["Các nhà hàng, khách sạn", "Các bếp ăn lớn", "Các khu du lịch, nghỉ dưỡng, resort", "Các tổ chức, tập đoàn, cơ quan, công ty phục vụ nhiều công nhân, nhân viên"]', TRUE),
-    ('Phụ bếp', 'RE', 'Làm việc với con người', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Làm việc với con người', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Phụ bếp giúp đầu bếp, bếp trưởng, bếp phó thực hiện chế biến và làm các món ăn và các hoạt động khác liên quan đến nấu nướng.', '["Chế biến các món ăn Âu – Á", "Pha chế đồ uống", "Trang trí các món ăn", "Làm bánh"]', '["Chuẩn bị nguyên vật", "liệu để chế biến các món ăn", "Chuẩn bị công cụ, các dụng cụ cần thiết cho việc chế biến thức ăn theo yêu cầu", "Đảm bảo đầy đủ các nguyên, vật liệu thực phẩm để chế biến món ăn", "Tham gia hỗ trợ sơ chế thực phẩm khi có yêu cầu", "Làm sạch, thu dọn, sắp xếp các công cụ, dụng cụ nấu nướng sau khi đã hoàn thành", "Kiểm tra hệ thống an toàn, phòng chống cháy nổ trong khu vực bếp"]', '["Các nhà hàng, khách sạn", "Các bếp ăn lớn", "Các khu du lịch, nghỉ dưỡng, resort", "Các tổ chức, tập đoàn, cơ quan, công ty phục vụ nhiều công nhân, nhân viên"]', TRUE),
-    ('Phục vụ bàn', 'SRE', 'Làm việc với con người', 'Tương tác với người khác', 'Năng lực thể chất – cơ khí; Năng lực hình học – màu sắc – thiết kế', 'Làm việc với con người', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Bồi bàn là người giới thiệu, tư vấn và phục vụ các món ăn, đồ uống cho khách hàng.', '["Phục vụ bàn", "Sắp xếp, bài trí bàn", "Giải đáp thắc mắc của khách"]', '["Nhận yêu cầu về đồ uống, món ăn của khách hàng", "Lấy đồ uống, món ăn phục vụ cho khách", "Thu dọn bàn ăn và thay đồ mới cho khách", "Giải đáp những yêu cầu, thắc mắc của khách", "Đảm bảo vệ sinh khu vực phục vụ"]', '["Các nhà hàng, khách sạn", "Các khu du lịch, nghỉ dưỡng, resort", "Các khu vui chơi, giải trí"]', TRUE),
-    ('Lễ tân', 'CES', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự hợp tác, tương trợ', 'Mối quan hệ', 'Lễ tân là người tiếp xúc, đón tiếp khách đến làm việc, tiếp nhận và xử lí thông tin ban đầu, hỗ trợ các hoạt động của cơ quan với khách hàng.', '["Lễ tân khách sạn", "Lễ tân doanh nghiệp", "Lễ tân kiêm hành chính"]', '["Đón tiếp khách hàng", "Nhận thông tin, yêu cầu từ khách hàng", "Xử lí thông tin và liên hệ với các bộ phận liên quan", "Giải đáp những yêu cầu, thắc mắc của khách", "Chuẩn bị các điều kiện đảm bảo cho hoạt động đạt kết quả tốt"]', '["Các nhà hàng, khách sạn", "Các khu du lịch, nghỉ dưỡng, resort", "Các khu vui chơi, giải trí", "Các cơ quan, công sở, công ty, tập đoàn", "Các tổ chức xã hội, nghề nghiệp"]', TRUE),
-    ('Nhân viên văn phòng', 'CER', 'Làm việc với con người', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Ngôn ngữ', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Nhân viên văn phòng làm việc trong lĩnh vực hành chính văn phòng, thực hiện các công việc thuộc hành chính của các cơ quan, tổ chức, công ty…', '["Quản trị văn phòng", "Quản lí hành chính", "Thư kí văn phòng", "Thống kê, lưu trữ"]', '["Tiếp nhận, xử lí và trả lời thông tin của khách hàng, đối tác", "Thực hiện công việc đón tiếp khách thay lãnh đạo cơ quan, tổ chức", "Hướng dẫn khách hàng, đối tác làm việc với các bộ phận liên quan", "Chuẩn bị, tổ chức các cuộc họp của đơn vị, tổ chức", "tổ chức các điều kiện cần thiết cho hoạt động công tác của lãnh đạo và tổ chức"]', '["Các cơ quan, công sở, công ty, tập đoàn", "Các tổ chức xã hội, nghề nghiệp", "Các đơn vị sản xuất", "Các khu du lịch, khách sạn…"]', TRUE),
-    ('Kĩ sư mỏ', 'IRE', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Kĩ sư mỏ áp dụng các nguyên tắc vật lí, địa chất và hóa học để thăm dò, khai thác và chế biến khoáng sản thiên nhiên. Về bản chất, hoạt động khai thác này gây ra sự xáo trộn môi trường trong và xung quanh khu vực có khoáng sản. Do đó, kĩ sư mỏ ngày nay không phải chỉ chú ý về phương diện khai thác và chế biến khoáng sản mà còn phải quan tâm tới vấn đề giảm nhẹ thiệt hại hoặc ảnh hưởng xấu gây ra cho môi trường.', '["Chuyên ngành về từng loại khoáng sản (ví dụ: than, sắt, dầu khí)", "Chuyên ngành về từng qui trình khai thác và chế biến", "Chuyên ngành về từng loại máy khai thác và chế biến", "Chuyên ngành về từng phương pháp khai thác (ví dụ như khai thác mỏ lộ thiên)", "Chuyên ngành phân theo vị trí mỏ khoáng sản (ví dụ như dưới nước, ở sa mạc)"]', '["Tiến hành thăm dò để xác định vị trí các mỏ khoáng sản và đánh giá mức độ khả thi, hiệu quả chi phí của việc khai thác mỏ", "Xác định các phương pháp khai thác mỏ hiệu quả nhất, trong đó có xét đến các vấn đề như độ sâu, vị trí của mỏ khoáng sản", "Chuẩn bị kế hoạch xây dựng khu mỏ chi tiết, bao gồm cả vị trí và cách bố trí các đường hầm", "Chỉ đạo lắp đặt thiết bị khai thác mỏ và chế biến khoáng sản khai thác", "Làm việc với các chuyên gia khác để đảm bảo rằng tất cả các qui định được tuân thủ", "Đảm bảo rằng tất cả các thiết bị an toàn được cài đặt", "Hướng dẫn, đào tạo thợ mỏ về sử dụng các thiết bị an toàn", "Tiến hành nghiên cứu và thiết lập các hệ thống giảm thiểu tác động của hoạt động khai thác khoáng sản đối với môi trường"]', '["Các doanh nghiệp khai thác mỏ", "Các công ty tư vấn kĩ thuật tư nhân", "Các trung tâm nghiên cứu", "Các trường đại học", "Các cơ quan Nhà nước"]', TRUE),
-    ('Kĩ thuật viên bảo dưỡng máy bay', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Các kĩ sư bảo dưỡng máy bay đảm bảo máy bay đủ điều kiện hoạt động. Họ chỉ đạo, giám sát và thực hiện việc bảo trì, sửa chữa và đại tu kết cấu và động cơ máy bay.', '["Bảo dưỡng các bộ phận điện tử", "Bảo dưỡng các bộ phận cơ khí", "Thiết bị truyền thông", "Nạp nhiên liệu", "Sửa chữa", "Bảo trì", "Bảo trì hệ thống sân bay", "Kĩ thuật bảo dưỡng máy bay", "Kĩ thuật điện sân bay", "Kĩ thuật điện tử sân bay", "Khai thác hoạt động bay"]', '["Kiểm tra thường xuyên động cơ, thân vỏ, các hệ thống điện tử và cơ khí của máy bay đảm bảo vận hành tốt và đáp ứng mọi yêu cầu kĩ thuật và an toàn", "Sửa chữa hoặc thay thế bộ phận và hệ thống hỏng hóc", "Thay thế phụ tùng đến kì thay thế", "Kiểm tra các bộ phận và hệ thống đảm bảo hoạt động hiệu quả", "Bảo trì bảo dưỡng định kì", "Lưu giữ hồ sơ bảo dưỡng và sửa chữa", "Quản lí giám sát kĩ thuật viên và công nhân liên quan"]', '["Các sân bay dân sự và quân sự", "Các công ty bảo trì/bảo dưỡng hàng không", "Các hãng hàng không", "Các đơn vị thiết kế công trình hàng không"]', TRUE),
-    ('Kĩ sư khai thác dầu khí', 'IRC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Phân tích - logic', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư khai thác dầu khí ứng dụng các nguyên tắc vật lí, địa chất và hóa học để phát hiện và khai thác dầu và khí từ các mỏ dầu khí dưới lòng đất và dưới biển.', '["Kĩ thuật khoan", "Đánh giá mỏ dầu khí", "Kĩ thuật sản xuất", "Kĩ thuật tầng chứa", "Kĩ thuật thủy khí", "Vật lí đá"]', '["Tiến hành nghiên cứu thăm dò để xác định vị trí các mỏ dầu, khí đốt và đánh giá tính khả thi, hiệu quả và chi phí của việc khai thác mỏ dầu khí đó", "Đánh giá các loại dầu và khí và trữ lượng trong mỏ đó", "Xác định phương pháp khoan hiệu quả nhất có thể thực hiện có tính đến các vấn đề như độ sâu và vị trí của mỏ dầu khí đó", "Chuẩn bị chi tiết kế hoạch thành lập đơn vị khai thác dầu khí", "Lắp đặt thiết bị khai thác và vận chuyển dầu khí", "Thiết lập hệ thống quản lí dòng dầu khí và vận chuyển đến nơi lưu trữ", "Điều hành kĩ thuật ở các giếng khoan khai thác", "điều khiển, theo dõi, phát hiện, xử lí sự cố ở các giếng", "Làm việc với các chuyên gia khác để đảm bảo rằng tất cả các qui định được tuân thủ", "Đảm bảo rằng tất cả các thiết bị an toàn được lắp đặt và đào tạo công nhân về an toàn vệ sinh lao động", "Nghiên cứu và triển khai các hệ thống giảm thiểu tác động môi trường từ hoạt động khai thác dầu khí"]', '["Các doanh nghiệp dầu khí Nhà nước và tư nhân", "Các trung tâm, viện nghiên cứu", "Giảng dạy tại các trường đại học, cao đẳng, trung học", "Các cơ quan Nhà nước quản lí ngành dầu khí", "Các công ty tư vấn kĩ thuật"]', TRUE),
-    ('Chuyên gia chỉnh hình và phục hình', 'SRI', 'Thể chất - Cơ khí', 'Tương tác với người khác', 'Làm việc với con người', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ thuật viên chỉnh hình và phục hình phục vụ, chăm sóc bệnh nhân khuyết tật ở các bộ phận chân, tay, cột sống hay bị mất một phần hoặc toàn bộ chân, tay bằng cách lắp và chuẩn bị trụ chống chỉnh hình, chân, tay giả theo chỉ đạo, ý kiến của bác sĩ.', '["Các chuyên ngành khác nhau tùy thuộc vào loại thiết bị chân, tay giả hoặc các vật liệu sử dụng để làm chân tay giả. Ví dụ bạn có thể chuyên sâu về", "Trụ chống chỉnh hình hoặc chân, tay giả", "Các loại chân, tay giả, làm bằng nhựa, thép ...", "Sản xuất thiết bị chỉnh hình", "Sản xuất thiết bị phục hồi chức năng"]', '["Kiểm tra, đánh giá nhu cầu của bệnh nhân liên quan đến bệnh tật và khiếm khuyết về chức năng của họ", "Xây dựng thiết kế trụ chống chỉnh hình và chân tay giả", "Lựa chọn vật liệu, làm các phép đo thử, lập mô hình chỉnh hình mẫu và bố trí chỉnh hỉnh", "Thực hiện lắp chân tay giả, bao gồm việc sắp xếp liên kết tĩnh và động", "Ước lượng việc gắn trụ chống chỉnh hình và chân hoặc tay giả cho người bệnh nhân, điều chỉnh để đảm bảo sự phù hợp chức năng hoạt động và chất lượng của chân tay giả", "Hướng dẫn bệnh nhân sử dụng trụ chống chỉnh hình, chân hoặc tay giả và duy trì ghi chép bệnh án"]', '["Các trung tâm phục hồi chức năng", "Bệnh viện", "Các trung tâm chẩn đoán", "Phòng khám đa khoa"]', TRUE);
+    (101, 'Thợ gốm sứ và thợ có liên quan', 'RA', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Thợ gốm và các thợ có liên quan chuẩn bị đồ gốm, sứ, đất nung, thiết bị vệ sinh, gạch, ngói và mài bằng tay hoặc bằng máy.', '["Gốm sứ gia dụng", "Gốm sứ xây dựng", "Gốm sứ Mỹ thuật", "Sứ kĩ thuật", "Kinh doanh hóa chất, máy móc thiết bị sản xuất gốm sứ"]', '["Chế tạo đồ gốm, sứ, đất nung", "Chế tạo khuôn thạch cao, polymer, kim loại, silicone, cao su, polyurethane và các vật liệu phù hợp khác", "Đọc các bản vẽ kĩ thuật để biết được yêu cầu của khách hàng", "Tạo dáng sản phẩm trên các máy làm đồ gốm bằng việc ấn ngón tay cái vào chính giữa của máy mài đất sét để tạo thành chỗ lõm, và ấn vào bên trong và bên ngoài của đất sét nổi hình trụ bằng tay và các ngón tay kéo lên một cách từ từ và tạo hình đất sét để tạo thành các hình dáng và kích thước theo yêu cầu", "Điều chỉnh tốc độ của bánh quay theo cảm giác khi sờ vào đất khi các mẩu đất sét đó to ra và các thành trở nên mỏng hơn", "Vận hành thiết bị làm các đồ gốm sứ như bát, chén, đĩa, gạch ngói, sứ đỡ dây", "Điều chỉnh và kiểm soát pha trộn, ép, cắt và đặt đồ bằng đất sét trong hoặc trên các hình dáng theo lí thuyết", "Làm phẳng bề mặt của các mẫu đã hoàn thiện bằng việc sử dụng cái nạo bằng cao su và các miếng bọt biển ướt", "Tạo các bánh xe mài mòn bằng các đúc và ép một hỗn dược mài mòn bằng tay hoặc bằng máy", "Kiểm tra sản phẩm về mặt khiếm khuyết, hình dáng, kích thước bằng cách sử dụng dụng cụ đo và các khuôn mẫu", "Chuẩn bị cho trưng bày và bán hàng, duy trì mối quan hệ với người bán lẻ, xưởng gốm, hệ thống phòng trưng bày triển lãm, giới thiệu sản phẩm để thuận lợi cho việc trưng bày và bán hàng"]', '["Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và phục chế đồ gốm sứ", "Các cơ sở, doanh nghiệp sản xuất đồ gốm sứ", "Các cơ sở, doanh nghiệp sản xuất gạch, ngói, thiết bị vệ sinh, đồ gốm sứ xây dựng và sứ kĩ thuật khác", "Các cơ sở, doanh nghiệp thủ công mĩ nghệ"]', TRUE),
+    (102, 'Thợ vẽ biển quảng cáo, thợ trang trí và thợ có liên quan', 'R', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ vẽ biển quảng cáo, thợ trang trí và các thợ có liên quan trang trí các sản phẩm được làm từ gỗ, kim loại, vải dệt, thủy tinh, gốm và các nguyên vật liệu khác. Họ vẽ, bố trí và sơn các mẫu tự, mẫu trang trí, chữ viết lồng nhau và các kiểu mẫu trang trí để tạo ra các biển hiệu và chạm trổ và khắc axit các mẫu có tính chất trang trí trên thủy tinh và các đồ khác.', '["Kẻ vẽ biển quảng cáo, biển báo", "Sơn vẽ trang trí nội ngoại thất nhà ở, cửa hàng và công trình xây dựng", "Sơn vẽ trang trí trên sản phẩm"]', '["Viết, sơn và in các biển để quảng cáo, chỉ dẫn, trưng bày hoặc cho các mục đích khác", "Sơn trang trí bằng tay các mẫu vẽ lên sản phẩm như đồ gốm, thủy tinh, hộp đựng thuốc lá điếu, chụp đèn, chao đèn", "Chép mẫu vẽ và mẫu trang trí từ giấy kính lên sản phẩm", "Kết hợp các đường kẻ, khoảng trống, hình khối, mầu sắc và phối cảnh để tạo ra hiệu quả mong muốn như minh họa các ý tưởng, xúc cảm hoặc tâm trạng", "Bố trí và sơn một hoặc nhiều mẫu kí tự ngôn ngữ, mẫu trang trí, chữ lồng và họa tiết để tạo ra các biển hiệu", "Phác họa hoặc can lại họa tiết và chữ lên sản phẩm hoặc vật liệu để chuẩn bị các họa tiết hoặc khuôn tô", "Thiết kế họa tiết và chữ để trang trí trên biển quảng cáo, đồ thủy tinh, gốm sứ và sản phẩm tương tự", "Sử dụng phần mềm và thiết bị để tạo ra họa tiết 3D để ứng dụng vào các sản phẩm lớn, các tấm biển được khắc và khảm dát", "Thiết kế và sản xuất các kí tự phẳng hoặc có bóng bằng nhựa vinyl, hoặc ghép kí tự cắt sẵn", "Cắt chữ và dấu hiệu từ ván hoặc bìa bằng tay hoặc bằng máy", "Kiểm tra các bản phác thảo, biểu đồ, mẫu trang trí, họa tiết, ảnh chụp để quyết định cách khắc, cắt, chạm trổ, sơn, in lên sản phẩm", "Đo và tính toán kích thước của các kí tự, họa tiết để trang trí", "Khắc, chạm trổ, in, sơn, vẽ các kí tự, họa tiết, mẫu trang trí, thương hiệu lên bề mặt phẳng hoặc cong của sản phẩm kim loại, thủy tinh hoặc gốm sứ", "Khắc axit các họa tiết, mức đo và các chi tiết khác lên sản phẩm đồ thủy tinh"]', '["Hành nghề tự do hoặc tự mở cửa hàng, xưởng, công ti", "Các công ty quảng cáo, truyền thông, tổ chức sự kiện", "Các công ty thiết kế, tư vấn, thi công trang trí nội thất", "Các cơ sở, công ty sản xuất, phân phối, xuất nhập khẩu đồ gỗ nội ngoại thất, đồ gia dụng và trang trí", "Các cơ sở, công ty sản xuất, phân phối, xuất nhập khẩu hàng thủ công mĩ nghệ"]', TRUE),
+    (103, 'Thợ thủ công trong ngành đồ gỗ và trang trí nội thất', 'RA', 'Hình học - màu sắc - thiết kế', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Thợ thủ công trong ngành đồ gỗ và trang trí nội thất áp dụng các kĩ thuật thủ công truyền thống để xử lí vật liệu gỗ, tre, nứa, song, mây, cói, đá, vỏ/ mai/ lông động vật, đất sét, cát thạch anh và các nguyên phụ liệu khác; sản xuất, trang trí, xử lí và hoàn thiện các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí khác nhau. Họ cũng có thể tham gia lắp đặt, vận hành và bảo dưỡng các máy móc thiết bị dùng trong ngành đồ gỗ và trang trí nội thất. Ngày nay, máy móc thiết bị đã được áp dụng nhiều để hỗ trợ cho thợ thủ công làm ra sản phẩm đẹp, chính xác và hiệu quả hơn và không phải công đoạn nào cũng làm thủ công nữa.', '["Sơ chế, xử lí gỗ và vật liệu tự nhiên (tre, nứa, song, mây, cói, lác, bèo…)", "Chuyên sâu theo loại vật liệu (gỗ, đá, kim loại, đất sét, thủy tinh, vật liệu đan, sơn mài, khảm trai)", "Chuyên sâu theo kĩ thuật (mộc, đúc, dát, chạm khắc, thủy tinh, đan)", "Chuyên sâu theo loại sản phẩm (bàn ghế, giường tủ, bình, giỏ, đĩa, túi, hộp, tranh tượng, đồ trang trí)"]', '["Chuẩn bị và xử lí gỗ, tre, nứa, song, mây, cói, đá, vỏ/ mai/ lông động vật, đất sét, cát thạch anh và các nguyên phụ liệu khác", "Sản xuất các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí bằng cách cưa, bào, đục, đẽo, gắn, đóng đinh, sơn gỗ, tre, nứa, đá và các vật liệu tương tự", "Sản xuất các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí bằng cách đan, bện, kết, buộc vật liệu vỏ, sợi tự nhiên và nhân tạo (lạt, song, mây, cói, bèo, sợi nhựa, sợi ni lông, vải, dây…) có khung hoặc không có khung", "Sản xuất các sản phẩm đồ gia dụng và trang trí bằng cách đúc, dát, chạm khắc đồng, bạc và các vật liệu tương tự", "Sản xuất các sản phẩm đồ gia dụng và trang trí bằng thủy tinh bằng cách thổi và chạm khắc thủy tinh và các vật liệu tương tự", "Khắc, chạm, trổ, khảm, vẽ, sơn, gắn hoa văn họa tiết trang trí trên bề mặt sản phẩm", "Xử lí và hoàn thiện sản phẩm bằng cách sơn, phủ men, làm bóng, xử lí mối, mọt, mốc, rỉ"]', '["Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và sửa chữa sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí", "Các cơ sở, doanh nghiệp sản xuất đồ gỗ, trang trí nội ngoại thất", "Các cơ sở, doanh nghiệp thủ công mĩ nghệ", "Các doanh nghiệp sản xuất đồ gỗ và nội thất công nghiệp"]', TRUE),
+    (104, 'Thợ thủ công trong ngành dệt may và da giày', 'R', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ thủ công trong ngành dệt may và da giày áp dụng các kĩ thuật và hoa văn truyền thống để sản xuất vải dệt, chi tiết đan, thêu, đắp nổi và kĩ thuật thủ công khác trong sản phẩm may mặc và da giày thủ công như quần áo, giày dép, túi xách, thắt lưng, phụ kiện, đồ gia dụng và trang trí.', '["Các công đoạn sản xuất da và sản phẩm da giày thủ công (thuộc da, đóng giày, sản xuất đồ da)", "Các công đoạn sản xuất sợi, vải và sản phẩm may thủ công (xe sợi, dệt-nhuộm, thêu, đan, móc, bô-đê, cắt may)", "Các loại sản phẩm dệt may, da giày thủ công (đồ đan, đồ thêu, thảm, tranh, đồ gia dụng, sản phẩm may mặc và phụ kiện)"]', '["Kéo sợi, dệt, nhuộm len, bông, vải, lụa và các loại vật liệu khác bằng thuốc nhuộm tự nhiên và công nghiệp", "Làm ren, đan, móc, thêu, may các sản phẩm may mặc, gia dụng và phụ kiện từ vải sợi", "Xử lí, nhuộm và hoàn thiện vật liệu da bằng thuốc nhuộm tự nhiên và công nghiệp", "Đóng giày dép, sản xuất túi xách, thắt lưng, phụ kiện và đồ gia dụng từ da và vật liệu tương đương."]', '["Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và sửa chữa sản phẩm may, da giày và phụ kiện", "Các cơ sở, doanh nghiệp may đo, sản xuất hàng may mặc thủ công, bán thủ công", "Các cơ sở, doanh nghiệp thuộc da, đóng giày, sản xuất hàng da giầy thủ công, bán thủ công", "Các doanh nghiệp sản xuất sợi, sản phẩm dệt và may mặc công nghiệp", "Các doanh nghiệp da giày công nghiệp", "Làm công việc chăm sóc trang phục trong xưởng phim, truyền hình, đoàn kịch"]', TRUE),
+    (105, 'Thợ vận hành máy sản xuất hàng dệt may và da giày', 'RC', 'Hình học - màu sắc - thiết kế', 'Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Hình học - màu sắc - thiết kế', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ vận hành máy sản xuất hàng dệt may và da giày làm công việc vận hành và giám sát hoạt động của các máy móc thiết bị chế biến và xử lí sợi, vải, da và lông thú; sản xuất và hoàn thiện sản phẩm may mặc, giày dép và phụ kiện; sửa chữa, giặt là và làm sạch hàng dệt may, lông và đồ da.', '["Các công đoạn sản xuất da và sản phẩm da giày (thuộc da, đóng giày, sản xuất đồ da)", "Các công đoạn sản xuất sợi, vải và sản phẩm may mặc (xe sợi, dệt - nhuộm , thêu, móc, bô-đê, cắt, may)", "Các loại sản phẩm dệt may công nghiệp (jacket, sơ mi, veston, đồ lót, đồ thể thao, quần áo trẻ em, tất)", "Các loại sản phẩm da giày (giày da, giày thể thao)", "Các loại sản phẩm va li, túi xách và phụ kiện thời trang"]', '["Vận hành và giám sát hoạt động của máy móc thiết bị trong dây chuyền của mình", "Dọn dẹp, làm vệ sinh, thay thế các bộ phận cần thiết sau ca làm việc hoặc theo lịch định kì", "Sử dụng các loại hóa chất và phụ gia tẩy, nhuộm, làm sạch phù hợp", "Tuân thủ đúng qui trình kĩ thuật để sản xuất mã hàng tương ứng", "Tham gia đào tạo và áp dụng qui trình mới khi cải tiến qui trình hay chuyển mã hàng", "Liên tục học hỏi nâng cao kĩ năng tay nghề để sẵn sàng làm đa công đoạn trong dây chuyền nếu cần", "Máy móc sử dụng để sản xuất sợi từ xơ, bông, tơ và vật liệu tự nhiên", "Máy dệt thoi hay dệt kim để dệt các loại vải và sản phẩm dệt kim từ sợi tự nhiên và sợi tổng hợp", "Máy tẩy, nhuộm và xử lí sợi, vải", "Máy may, cắt, thêu, thùa khuyết, đính khuy, khóa và các loại máy và công cụ sử dụng trong sản xuất hàng may mặc", "Máy giặt và là ủi hàng dệt may, lông và thảm", "Máy móc và công cụ để chuẩn bị, chế biến, nhuộm và hoàn thiện sản phẩm da và lông thú", "Máy móc và công cụ đo, cắt, tạo hoa văn hình khối, định hình thân, đế giày, khâu/ dán/ ráp các bộ phận, hoàn thiện giày dép", "Máy móc sản xuất va li, túi xách và phụ kiện da khác."]', '["Các doanh nghiệp sản xuất sợi, dệt, nguyên phụ liệu dệt may", "Các doanh nghiệp sản xuất hàng may mặc công nghiệp", "Các cơ sở, doanh nghiệp thuộc da, sản xuất da lông thú và vải giả da", "Các doanh nghiệp sản xuất giày, sản phẩm da và phụ kiện", "Các cơ sở, doanh nghiệp gia công sản phẩm hoặc bán thành phẩm may mặc, da giày và phụ kiện"]', TRUE),
+    (106, 'Bác sĩ thính học và đặc trị các khuyết tật về ngôn ngữ', 'IS', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Bác sĩ thính học và đặc trị các khuyết tật về ngôn ngữ xác định loại và mức độ khuyết tật ảnh hưởng đến chức năng nghe, nói, giao tiếp và nhai nuốt của con người. Họ chỉ định phương tiện hỗ trợ, thực hiện liệu pháp phục hồi chức năng và tư vấn cho bệnh nhân.', '["Thiết bị khuếch đại âm thanh", "Ngôn ngữ học lâm sàng và ngôn ngữ học tâm lí", "Thính học chẩn đoán", "Rối loạn tính lưu loát", "Thính học nhi khoa", "Các nghiên cứu tâm lí học", "Liệu pháp lời nói và chẩn đoán", "Rối loạn giọng nói"]', '["Xây dựng, hướng dẫn và tham gia tư vấn, sàng lọc, thực hiện các chương trình phục hồi ngôn ngữ và các chương trình khác liên quan đến khả năng nghe và giao tiếp", "Cho bệnh nhân làm kiểm tra khả năng nghe, nói, ngôn ngữ và các kiểm tra khác bằng các thiết bị và phương tiện chẩn đoán đặc biệt", "phân tích kết quả kiểm tra cùng với những thông tin về hành vi, giáo dục và y tế thu được từ bệnh nhân và gia đình, giáo viên, nhà chuyên môn, người sử dụng lao động để xác định tình trạng của bệnh nhân", "Xây dựng và thực hiện các liệu pháp phục hồi chức năng, ví dụ như huấn luyện thính giác, đọc môi, phục hồi ngôn ngữ, hội thoại để khôi phục lại hoặc nâng cao hiệu quả giao tiếp", "Chỉ định máy trợ thính, và phương tiện hỗ trợ khác và hướng dẫn sử dụng cho bệnh nhân", "Tư vấn và hướng dẫn bệnh nhân, gia đình, giáo viên và người sử dụng lao động về các vấn đề xã hội và tâm lí liên quan đến khuyết tật về lời nói"]', '["Bệnh viện tư nhân và Nhà nước", "Trung tâm phục hồi chức năng", "Phòng thí nghiệm nghiên cứu phát triển các phương pháp mới để chẩn đoán và điều trị các vấn đề liên quan đến thính giác và lời nói"]', TRUE),
+    (107, 'Bác sĩ y khoa', 'ISR', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Thành tựu', 'Bác sĩ y khoa khám và chữa bệnh cho những người bị ốm, bệnh tật hoặc tai nạn thương tật khác. Họ cũng tiến hành nghiên cứu, cải tiến và phát triển các khái niệm, lí thuyết và phương pháp phòng và khám chữa bệnh, làm công tác giảng dạy chuyên môn và tuyên truyền giáo dục sức khỏe.', '["Chủ yếu liên quan đến các chuyên khoa, cả về nội khoa (điều trị bằng thuốc) và ngoại khoa (mổ), và các chuyên ngành khác như: da liễu, tai-mũi-họng, nội tiết, tim mạch, tiêu hóa, thần kinh, tâm thần, nhãn khoa, sản khoa, nhi khoa, lão khoa…"]', '["Thăm khám lâm sàng, chỉ định xét nghiệm, hội chẩn với bác sĩ khác và trao đổi với bệnh nhân và gia đình để đưa ra chẩn đoán", "Kê đơn và chỉ định các biện pháp điều trị và phòng ngừa", "Tiến hành phẫu thuật và các thủ thuật khác", "Giám sát hoạt động của nhân viên y tế liên quan", "Theo dõi tiến triển và đáp ứng điều trị của bệnh nhân", "Tư vấn về sức khỏe, dinh dưỡng và sinh hoạt để hỗ trợ điều trị, phòng ngừa bệnh tật và rối loạn", "Lập kế hoạch, quản lí và thực hiện việc chuyển tuyến, chuyển viện cho bệnh nhân cần điều trị đặc biệt, lâu dài hoặc các dạng dịch vụ cần thiết khác", "Nghiên cứu bệnh học và các phương pháp phòng ngừa và điều trị"]', '["Các bệnh viện, phòng khám, trạm y tế, nhà hộ sinh", "Phòng y tế của trường học, cơ quan, nhà máy, doanh nghiệp", "Thẩm mĩ viện", "Các tổ chức tình nguyện, tổ chức phi chính phủ, tổ chức quốc tế như Tổ chức Y tế Thế giới (WHO)", "Các cơ quan quản lí Nhà nước về y tế như bộ, sở y tế", "Giảng dạy tại các trường ĐH, CĐ, TC"]', TRUE),
+    (108, 'Bác sĩ y học cổ truyền', 'SRI', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Thành tựu', 'Bác sĩ y học cổ truyền khám, điều trị, phòng ngừa bệnh tật và chấn thương liên quan đến các bệnh thể chất và tinh thần cho bệnh nhân bằng phương pháp và thuốc y học cổ truyền. Họ áp dụng các kiến thức và kĩ năng thực hành có được thông qua nghiên cứu sâu rộng các lí thuyết, niềm tin và giá trị bắt nguồn từ nền văn hóa và y học dân tộc bản địa.', '["Bác sĩ y học cổ truyền", "Bào chế thuốc y học cổ truyền", "Châm cứu"]', '["Tiến hành kiểm tra sức khỏe cho bệnh nhân, trao đổi với bệnh nhân và gia đình để xác định tình trạng sức khỏe của bệnh nhân", "Đưa ra phác đồ và điều trị các bệnh về thể chất, tinh thần, tâm lí xã hội", "Sử dụng các phương pháp, cách thức chữa bệnh truyền thống của địa phương", "Kê đơn và cắt các loại thuốc truyền thống như cây, lá, chiết xuất khoáng sản và động vật để kích thích khả năng tự hồi phục của cơ thể"]', '["Các bệnh viện y học cổ truyền hoặc có điều trị y học cổ truyền", "Tự mở phòng khám y học cổ truyền"]', TRUE),
+    (109, 'Chuyên gia dịch vụ pháp lí', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Chuyên gia dịch vụ pháp lí, còn gọi là thư kí luật, sử dụng kiến thức chuyên môn để trợ giúp các chuyên gia pháp lí trong thông tin liên lạc, tài liệu, hỗ trợ nội bộ, hỗ trợ thủ tục và các hoạt động phối hợp quản lí nội bộ trong các văn phòng luật sư, ban pháp chế của các doanh nghiệp lớn và các cơ quan Nhà nước. Họ cũng có thể hỗ trợ các nhà quản lí, chuyên gia pháp lí, các chuyên gia kinh tế có liên quan đến các vấn đề pháp lí, bao gồm cả những người có liên quan đến hợp đồng bảo hiểm, cho vay vốn và các giao dịch tài chính khác.', '["Công chứng", "Thanh tra"]', '["Kiểm tra hoặc chuẩn bị cho việc kiểm tra các hồ sơ pháp lí và các văn bản khác có liên quan", "Chuẩn bị các tài liệu tóm tắt các hồ sơ pháp lí hoặc đặt ra các điều kiện cho vay hoặc bảo hiểm", "Tư vấn cho khách hàng và các đại lí về các vấn đề pháp lí, kĩ thuật trong trường hợp cụ thể của họ", "Chuẩn bị tài liệu liên quan đến chuyển giao bất động sản, cổ phiếu hoặc các giao dịch khác cần phải có các thủ tục pháp lí Kiểm tra tính hợp lệ của hồ sơ và gửi chúng đến cơ quan chức năng Quản lí các tài liệu, hồ sơ vụ án và các thư viện về pháp luật"]', '["Các văn phòng luật", "Ban pháp chế của các doanh nghiệp lớn", "Chính phủ"]', TRUE),
+    (110, 'Chuyên gia dinh dưỡng', 'ISC', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Chuyên gia dinh dưỡng tiến hành nghiên cứu, cải tiến và phát triển các khái niệm, phương pháp thực hiện liên quan đến việc chuẩn bị, áp dụng các chế độ ăn uống cho điều trị và các mục đích khác.', '["Dinh dưỡng lâm sàng", "Giáo dục dinh dưỡng", "Quản lí bệnh viện", "Dinh dưỡng cho thể thao"]', '["Phát triển, thử nghiệm các giải pháp dinh dưỡng và chế độ ăn uống", "Lập kế hoạch và chỉ đạo việc chuẩn bị chế độ ăn phục vụ điều trị và các mục đích ăn kiêng khác cho cá nhân hay nhóm trong các bệnh viện, hoặc cho người lao động trong các lĩnh vực cụ thể", "Tham gia các chương trình giáo dục dinh dưỡng và các hoạt động phục hồi chức năng dinh dưỡng", "Tư vấn dinh dưỡng đối với các vấn đề về thực phẩm cộng đồng và các chương trình y tế"]', '["Bệnh viện hoặc nhà dưỡng lão", "Trường học hoặc các tổ chức", "Khách sạn", "Chính quyền địa phương hoặc các cơ quan Nhà nước", "Trung tâm nghiên cứu", "Ngành công nghiệp thực phẩm"]', TRUE),
+    (111, 'Chuyên gia phát triển', 'SEC', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự hợp tác, tương trợ', 'Mối quan hệ', 'Đây là một lĩnh vực liên ngành tập trung vào các vấn đề liên quan đến phát triển kinh tế và xã hội. Các chuyên gia phát triển được đào tạo để ứng dụng chuyên môn trong một lĩnh vực cụ thể với đông đảo nhân dân để giúp đất nước phát triển. Ví dụ như một chuyên gia tâm lí có thể giúp trẻ em của một đất nước phục hồi tâm lí sau chiến tranh. Tương tự, một kĩ sư xây dựng có thể giúp một quốc gia phát triển mạng lưới đường giao thông mới, hoặc một luật sư có thể giúp soạn thảo hiến pháp mới.', '["Quản lí phát triển", "Cải cách thể chế", "Xây dựng dự án phát triển", "Các chương trình sinh kế bền vững", "Quản lí các tổ chức phi chính phủ."]', '["Trở thành chuyên gia trong một lĩnh vực cụ thể", "Nghiên cứu cách ứng dụng chuyên môn trong lĩnh vực đó phục vụ đông đảo nhân dân trong nước", "Nghiên cứu các chuyên ngành liên quan khác, đặc biệt là xã hội học và kinh tế học", "Nghiên cứu các điều kiện, nếp sống và văn hóa của từng địa phương", "Tư vấn cho chính phủ các nước", "Làm việc với các chuyên gia ở các nước khác", "Đào tạo người dân địa phương quản lí và duy trì những công trình, công việc đã được xây dựng và phát triển"]', '["Các tổ chức quốc tế (ví dụ các cơ quan của Liên Hiệp Quốc, Ngân hàng Thế giới, Tổ chức Lao động quốc tế)", "Công ti tư vấn tư nhân chuyên về các dự án phát triển quốc tế"]', TRUE),
+    (112, 'Chuyên gia phục hồi chức năng nghề nghiệp', 'ISR', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Chuyên gia phục hồi chức năng nghề nghiệp giúp đỡ bệnh nhân trong quá trình phục hồi nghề nghiệp sau khi bị bệnh hoặc tai nạn bằng cách đưa họ tham gia các công việc mang tính sáng tạo, nghề nghiệp hoặc thủ công như làm vườn, tập thể dục, trò chơi và âm nhạc theo hướng dẫn của bác sĩ.', '["Lão khoa", "Sức khỏe tâm thần", "Phục hồi chức năng cơ-xương", "Thần kinh học", "Nhi khoa", "Phục hồi thể chất"]', '["Sử dụng các thao tác nghề nghiệp khác nhau để giúp bệnh nhân phát triển, phục hồi hoặc duy trì cuộc sống hàng ngày của họ và kĩ năng làm việc", "Giúp bệnh nhân cải thiện khả năng thực hiện các công việc trong môi trường sống và làm việc của họ", "Sử dụng kĩ thuật đặc biệt để giúp bệnh nhân phát triển, cải thiện, duy trì hoặc khôi phục lại sự tự chủ cao nhất"]', '["Bệnh viện", "Cơ sở chăm sóc sức khỏe cộng đồng", "Trường học", "Trung tâm phục hồi chức năng"]', TRUE),
+    (113, 'Chuyên gia quản lý đô thị', 'IEA', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Chuyên gia quản lí đô thị xây dựng và triển khai các kế hoạch, chiến lược liên quan đến sử dụng đất, thiết kế môi trường đô thị, kể cả hệ thống giao thông, hướng dẫn và đảm bảo sự phát triển có trật tự ở các khu dân cư và cộng đồng. Công việc còn liên quan tới việc nghiên cứu, phân tích, tư duy chiến lược, kiến trúc, thiết kế đô thị, tham vấn cộng đồng, khuyến nghị chính sách, thực hiện quản lí đô thị.', '["Quản lí đô thị", "Quản lí giao thông đô thị", "Môi trường đô thị"]', '["Qui hoạch và điều phối phát triển khu vực đô thị", "Thu thập và phân tích dữ liệu về kinh tế, pháp lí, chính trị, văn hóa, nhân khẩu học, xã hội học, vật lí và môi trường ảnh hưởng đến vấn đề sử dụng đất, xây dựng và đề xuất qui hoạch phát triển và sử dụng đất", "Qui hoạch và điều phối việc sử dụng đất cho công viên, trường học, các cơ quan tổ chức, sân bay, đường xá và các dự án liên quan cho các khu thương mại, công nghiệp và khu dân cư", "Qui hoạch, tham vấn, triển khai xây dựng, giám sát, quản lí hệ thống giao thông đường bộ, giao thông công cộng sao cho hiệu quả và an toàn", "Thẩm định và phản biện các báo cáo đánh giá tác động môi trường"]', '["Cơ quan Nhà nước", "Các công ti kiến trúc", "Tổ chức về BVMT đô thị", "Công ti phát triển bất động sản tư nhân"]', TRUE),
+    (114, 'Chuyên gia quản trị bất động sản', 'EC', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Chuyên gia quản trị bất động sản, còn gọi là đại lí bất động sản và quản lí tài sản, thay mặt khách hàng sắp xếp việc mua, bán, cho thuê bất động sản, tài sản và hưởng lợi trên cơ sở nhận hoa hồng từ các thương vụ thực hiện được.', '["Quản lí kinh doanh bất động sản", "Quản lí nhà và đất"]', '["Thu thập thông tin về tài sản để bán, cho thuê, hoàn cảnh của chủ sở hữu, nhu cầu của người mua và người thuê tiềm năng", "Cung cấp thông tin cho người mua hoặc người thuê tiềm năng, giải thích các điều khoản bán hàng và các điều kiện cho thuê", "Đàm phán thỏa thuận giữa người thuê và chủ sở hữu về tiền thuê và chi phí", "Xây dựng hợp đồng cho thuê và dự toán chi phí", "Sắp xếp việc chuyển quyền sở hữu tài sản;"]', '["Các công ti bất động sản", "Tự mở công ti bất động sản"]', TRUE),
+    (115, 'Chuyên gia quản trị doanh nghiệp nhỏ và vừa', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Chuyên gia quản trị doanh nghiệp nhỏ và vừa (DNNVV) là chuyên gia trong việc thành lập và phát triển DNNVV, hoặc trực tiếp quản lí mọi mặt hoạt động sản xuất kinh doanh của DNNVV. Doanh nghiệp nhỏ và vừa là các doanh nghiệp có vốn hoặc số người lao động không vượt quá một số lượng nhất định. Tại Việt Nam, doanh nghiệp có tổng nguồn vốn không vượt quá 50 tỉ đồng hoặc không vượt quá 100 người lao động trong lĩnh vực thương mại dịch vụ, và doanh nghiệp có tổng nguồn vốn không vượt quá 100 tỉ hoặc không vượt quá 300 người lao động trong các lĩnh vực khác thì được gọi là doanh nghiệp nhỏ và vừa. Số lượng các doanh nghiệp nhỏ và vừa nhiều hơn số lượng doanh nghiệp lớn và tính tổng thể thì DNNNV sử dụng nhiều lao động hơn. DNNVV cũng thường được coi là đầu tàu sáng tạo và cạnh tranh trong nhiều lĩnh vực kinh tế.', '["Quản lí doanh nghiệp"]', '["Xây dựng, thực hiện và giám sát các chính sách, chiến lược và kế hoạch sản xuất của DNNVV", "Lập kế hoạch cụ thể về các hoạt động sản xuất bao gồm đầu ra, số lượng, chất lượng, giá thành, thời gian và chi phí lao động", "quản lí việc vận hành các xưởng sản xuất và qui trình chất lượng thông qua lập kế hoạch bảo dưỡng, cung cấp dụng cụ, thời gian vận hành", "Tuyển dụng, đào tạo, kèm cặp và giám sát nhân viên", "Xây dựng, thực hiện, giám sát và điều chỉnh chiến lược bán hàng và quảng cáo tiếp thị của doanh nghiệp", "Xây dựng và quản lí ngân sách, tài chính, chi phí và báo cáo kết quả kinh doanh"]', '["Tại các DNNVV", "Cơ quan Nhà nước liên quan đến DNNVV", "Các trung tâm, tổ chức hỗ trợ phát triển DNNVV như Hội DNNVV, Trung tâm xúc tiến DNNVV của Phòng Thương mại và Công nghiệp Việt Nam và của các cơ quan khác…"]', TRUE),
+    (116, 'Chuyên gia quản trị kinh doanh nông nghiệp', 'ESR', 'Làm việc với con người', NULL, 'Phân tích - logic', 'Làm việc với con người', 4, NULL, NULL, NULL, 'Chuyên gia quản trị kinh doanh nông nghiệp là người nghiên cứu, tổ chức, quản lí kinh doanh trong lĩnh vực sản xuất nông nghiệp cũng như đưa sản phẩm nông nghiệp đến tay người tiêu dùng.', '["Chủ yếu theo các loại sản phẩm khác nhau như: Quản lí doanh nghiệp lương thực, thực phẩm, Vật tư nông nghiệp, Chăn nuôi và thú y"]', '["Tìm hiểu nhu cầu khách hàng và các loại sản phẩm nông nghiệp khác nhau", "Phát triển và vận hành hệ thống sản xuất sản phẩm nông nghiệp", "Phát triển và vận hành hệ thống phân phối sản phẩm nông nghiệp cho địa phương (chợ, cửa hàng bán lẻ, cửa hàng bán buôn) để đưa sản phẩm đến với khách hàng"]', '["Các doanh nghiệp kinh doanh nông nghiệp, lâm nghiệp, thủy sản và muối"]', TRUE),
+    (117, 'Chuyên gia vật lí trị liệu', 'SIR', 'Làm việc với con người', 'Tương tác với người khác', 'Thể chất - cơ khí', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Chuyên gia vật lí trị liệu tiến hành trị liệu các rối loạn về xương, cơ và các bộ phận của hệ tuần hoàn hoặc hệ thần kinh. Khách hàng của họ bao gồm những người khuyết tật, bị bệnh tâm thần, người già và những người đang phục hồi sau thời gian dài bệnh tật, tai nạn hoặc phẫu thuật.', '["Bệnh tim mạch lồng ngực", "Vật lí trị liệu lão khoa", "Phục hồi chức năng tay", "Vật lí trị liệu chỉnh hình", "Thần kinh học nhi khoa", "Y học thể thao", "Rối loạn thần kinh (ví dụ: đột quị)", "Kĩ thuật vật lí trị liệu"]', '["Chẩn đoán rối loạn của xương, cơ và các bộ phận của hệ tuần hoàn hoặc hệ thần kinh", "Điều trị bằng các phương pháp sử dụng siêu âm, nhiệt, laser hoặc kĩ thuật tương tự", "Kiểm tra dị tật cơ thể và rối loạn để xác định thông số kĩ thuật cho chân, tay giả hoặc các thiết bị khác", "Tư vấn cho cộng đồng và cá nhân về tư thế đúng của cơ thể khi làm việc hoặc thực hiện các hoạt động khác để tránh chấn thương, căng thẳng và tăng trương cơ bắp", "Làm việc với các cá nhân (ví dụ như người chơi thể thao) để giúp họ tăng cường thể chất"]', '["Bệnh viện, cơ sở y tế", "Trung tâm phục hồi chức năng", "Câu lạc bộ thể thao, đội thể thao", "Phòng khám thể thao", "Phòng tập gym, trung tâm thể dục", "Phòng khám riêng"]', TRUE),
+    (118, 'Đại lí bảo hiểm', 'ECS', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Đại lí bảo hiểm bán bảo hiểm nhân thọ, tai nạn, ô tô, trách nhiệm dân sự, hỏa hoạn, hàng hải và sản phẩm bảo hiểm khác cho các khách hàng mới và khách hàng hiện hữu.', '["Bảo hiểm tai nạn", "Ô tô", "Thiên tai", "Tập đoàn Bảo hiểm", "Bảo hiểm y tế", "Bảo hiểm nhân thọ"]', '["Thu thập thông tin cần thiết về các khách hàng để xác định loại bảo hiểm thích hợp và điều kiện bảo hiểm", "Đàm phán với khách hàng để xác định loại và mức độ rủi ro cho từng trường hợp bảo hiểm, phạm vi và điều khoản thanh toán", "Đàm phán và xây dựng hợp đồng tái bảo hiểm", "Tư vấn và đàm phán các điều khoản của hợp đồng bảo hiểm cho những dự án, công trình và rủi ro đặc biệt"]', '["Các công ti bảo hiểm tư nhân hoặc Nhà nước"]', TRUE),
+    (119, 'Đại lí du lịch và lữ hành', 'EC', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Đại lí du lịch và lữ hành tiến hành tư vấn và tổ chức tour du lịch, lập kế hoạch hành trình và lịch trình đi lại, ăn nghỉ cho khách du lịch, tổ chức hoặc bán tour du lịch trọn gói cho khách', '["Du lịch mạo hiểm", "Du lịch sinh thái", "Du lịch y tế", "Hướng dẫn viên du lịch", "Du lịch / Du lịch Tiếp thị", "Quản lí du lịch", "Điều hành tour", "Đặt phòng du lịch", "Đại lí du lịch"]', '["Thu thập thông tin về tính khả thi, chi phí, mức độ tiện lợi của các loại hình giao thông, chỗ ở, xác định yêu cầu của khách hàng và tư vấn cho họ các hình thức du lịch phù hợp", "Đặt và xác nhận đặt phòng, bàn giao cho khách hàng vé, chứng từ và nhận thanh toán", "Tổ chức tour du lịch trọn gói cho các sự kiện hoặc kì nghỉ và bán các gói du lịch cho khách hàng", "Giúp khách hàng hoàn thiện các hồ sơ cần thiết để thực hiện tour du lịch"]', '["Trong các bộ phận du lịch của các công ti và cơ quan Nhà nước", "Đại lí du lịch", "Khu resort và nghỉ dưỡng", "Các hãng hàng không", "Các tổ chức liên quan đến du lịch"]', TRUE),
+    (120, 'Y tá và hộ sinh', 'SIC', 'Làm việc với con người', 'Phân tích và xử lý', 'Phân tích - logic', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Y tá hỗ trợ các bác sĩ khi họ thực hiện nhiệm vụ và phục vụ các bệnh nhân bị ốm, bị thương hoặc khuyết tật. Trong các y tá có hộ sinh là người hỗ trợ quá trình sinh nở, chăm sóc bà mẹ và trẻ em trước và sau khi sinh, hướng dẫn gia đình trong việc chăm sóc bà mẹ và trẻ sơ sinh.', '["Chăm sóc, điều dưỡng người cao tuổi", "Chăm sóc thai sản", "Chăm sóc sức khỏe nghề nghiệp", "Y tá cấp cứu", "Y tá gây tê", "Y tá sản khoa và hộ sinh", "Y tá chỉnh hình", "Y tá nhi khoa", "Y tá tâm thần", "Y tá phẫu thuật…"]', '["Giúp các bác sĩ áp dụng các biện pháp phòng và chữa bệnh, trong đó có việc cho uống thuốc, tiêm, theo dõi đáp ứng điều trị của bệnh nhân…", "giải quyết các ca bệnh khẩn cấp, nếu có, khi vắng mặt bác sĩ", "Chuẩn bị cho bệnh nhân khi thực hiện các phương pháp điều trị vật lí và tâm lí", "Hỗ trợ bác sĩ phẫu thuật tại phòng mổ, lau rửa vết thương và băng bó, chăm sóc sau phẫu thuật", "(Với hộ sinh) Đánh giá tiến triển trong quá trình mang thai và sinh nở, xử lí biến chứng, ghi nhận các triệu chứng cần can thiệp của bác sĩ chuyên khoa liên quan", "Thực hiện chăm sóc cá nhân, điều dưỡng chuyên nghiệp đối với bệnh nhân, bà mẹ và trẻ sơ sinh tại cơ sở y tế hoặc nhà riêng", "Trả lời các câu hỏi của bệnh nhân và gia đình, cung cấp thông tin và tư vấn về phòng chữa bệnh và chăm sóc", "Hướng dẫn, phối hợp và giám sát các trợ tác khác", "Nghiên cứu, cập nhật kiến thức kĩ năng về chăm sóc y tế và chuẩn bị các báo cáo tài liệu khoa học", "Tham gia công tác giáo dục sức khỏe tại cơ sở y tế và tại cộng đồng"]', '["Bệnh viện", "Phòng khám", "Trung tâm phục hồi chức năng", "Trung tâm y tế cộng đồng ", "Các cơ quan quản lí Nhà nước về y tế", "Các trường ĐH, CĐ và TC y"]', TRUE),
+    (121, 'Nha sĩ', 'IRS', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Các nha sĩ, còn gọi là bác sĩ nha khoa, điều trị các bệnh và các rối loạn răng, nướu và mô mềm của miệng.', '["Nha khoa cộng đồng", "Phẫu thuật nha khoa và nội nha", "Phẫu thuật miệng, hàm, mặt", "Bệnh răng miệng", "Chỉnh nha", "Nha khoa nhi", "Nha khoa trẻ em và nha khoa phòng ngừa", "Nha chu", "Phục hình răng"]', '["Cung cấp dịch vụ chăm sóc răng miệng như làm sạch răng và chữa sâu răng, sử dụng máy nha khoa và các công cụ tương tự khi cần thiết", "Kiểm tra kết quả xét nghiệm các bệnh răng miệng", "Chữa sâu răng bằng chất trám, kim loại hoặc nhựa", "Gây tê cục bộ hoặc gây tê vùng khi cần thiết và chuẩn bị vùng miệng cho phẫu thuật", "Sử dụng các dụng cụ phẫu thuật để nhổ răng gẫy, sâu, hỏng", "Làm và lắp răng giả", "Tư vấn bệnh nhân về các biện pháp khắc phục nha khoa và sức khỏe răng miệng nói chung"]', '["Các bệnh viện nha khoa hoặc khoa răng, hàm, mặt trong bệnh viện", "Các phòng khám nha khoa", "Các viện nha khoa thẩm mĩ", "Mở phòng khám riêng"]', TRUE),
+    (122, 'Giáo viên mầm non', 'SA', 'Làm việc với con người', 'Phân tích và xử lý', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Công tác giảng dạy đòi hỏi chuyên môn theo các nhóm tuổi học sinh. Giáo viên mầm non dạy trẻ em từ 3 đến 6 tuổi. Đây là giai đoạn đặt nền móng cho việc học tập và là giai đoạn quan trọng đối với quá trình giáo dục một con người.', '["Một giáo viên mầm non cần đạt được các tiêu chuẩn trong tất cả các khía cạnh của giáo dục mầm non Một số giáo viên chuyên về các lĩnh vực phát triển cụ thể của trẻ như;Rối loạn học mầm non", "Giáo dục dựa vào cộng đồng", "Dinh dưỡng trẻ em"]', '["Thực hiện các hoạt động sử dụng các loại nguyên vật liệu, trang thiết bị khác nhau để giúp cho trẻ nhỏ phát triển thể chất, giao tiếp, kĩ năng xã hội và quan trọng nhất là sự thích thú trong học tập", "Sử dụng các kĩ thuật như kể chuyện, đóng vai để đặt nền móng cho sự phát triển ngôn ngữ", "Mang lại cơ hội cho trẻ em được tiếp xúc với các thành viên khác nhau của xã hội và tìm hiểu về họ", "Phát triển kĩ năng hỏi và khám phá của trẻ nhỏ", "Giúp trẻ phát triển tất cả các kĩ năng trong sinh hoạt hàng ngày (ví dụ như kĩ năng đi vệ sinh, chăm sóc cá nhân và kĩ năng xã hội)", "Ghi lại quá trình học tập của trẻ nhỏ", "Phát hiện bất cứ dấu hiệu nào của rối loạn phát triển hoặc vấn đề sức khỏe ở trẻ nhỏ", "Đề xuất các chương trình nâng cao sự tăng trưởng và phát triển ở trẻ nhỏ", "Làm việc với các chuyên gia khác (ví dụ như nhà trị liệu ngôn ngữ, nhà tâm lí học) để giúp trẻ vượt qua mọi khó khăn mà chúng có thể gặp phải", "Giúp đỡ trẻ trong việc vệ sinh cá nhân", "Tương tác với phụ huynh để thúc đẩy sự phát triển liên tục của trẻ ở nhà", "Đào tạo những người khác"]', '["Các trường và lớp mầm non", "Tổ chức giáo dục dành riêng cho giáo dục mầm non", "Trường sư phạm", "Bệnh viện nhi đồng", "Tư vấn, cộng tác viên cho các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình vì trẻ em hoặc giáo dục mầm non"]', TRUE),
+    (123, 'Giáo viên tiểu học', 'SAC', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Công tác giảng dạy đòi hỏi chuyên môn theo các nhóm tuổi học sinh. Giáo viên tiểu học dạy trẻ em từ lớp 1 đến lớp 5. Họ chủ yếu tập trung xây dựng cơ sở vững chắc cho kĩ năng đọc, viết, tính toán cùng với các kĩ năng khác như thể chất, tâm lí, trí tuệ và xã hội.', '["Mỗi giáo viên tiểu học cần đạt yêu cầu trong tất cả các khía cạnh của giáo dục tiểu học Một số giáo viên chuyên về các khía cạnh phát triển cụ thể của trẻ như", "Tin học", "Giáo dục cho trẻ có yêu cầu đặc biệt", "Giảng dạy một chủ đề cụ thể (ví dụ: Ngôn ngữ)"]', '["Chuẩn bị kế hoạch bài học hàng ngày và dài hạn cho từng lớp, phục vụ việc dạy chữ, số và sự phát triển chung của trẻ em", "Đặt nền móng cho toàn bộ việc học như: đọc, viết, nghe, nói, toán học, khoa học, khoa học xã hội và giáo dục thể chất", "Sử dụng các loại hình nghệ thuật và âm nhạc để phát triển sự sáng tạo, sự tự thể hiện của trẻ em", "Sử dụng các hoạt động thể thao để tăng cường phát triển thể chất", "Đánh giá và theo dõi sự tiến bộ của học sinh", "Kiểm tra và đánh giá sự tiến bộ của học sinh qua bài kiểm tra giấy và kiểm tra miệng", "Phát hiện dấu hiệu của rối loạn phát triển hoặc vấn đề sức khỏe", "Đề xuất chương trình cho sự tiếp tục tăng trưởng và phát triển ở trẻ", "Làm việc với các chuyên gia khác (ví dụ như nhà trị liệu ngôn ngữ, nhà tâm lí học) để giúp trẻ vượt qua mọi khó khăn có thể có", "Tương tác với phụ huynh để thúc đẩy sự phát triển liên tục của trẻ ở gia đình", "Đào tạo những người khác"]', '["Các trường tiểu học công lập", "Các trường tiểu học tư thục", "Các tổ chức tình nguyện", "Trung tâm học tập cộng đồng", "Tư vấn, cộng tác viên cho các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình vì trẻ em hoặc giáo dục, ví dụ như UNESCO, UNICEF"]', TRUE),
+    (124, 'Giáo viên giáo dục đặc biệt', 'SA', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Giáo viên giáo dục đặc biệt dạy cho trẻ em, thanh thiếu niên, người lớn có khuyết tật về thể chất hay trí tuệ, hoặc những người có khó khăn về học tập.', '["Khiếm thính và khuyết tật lời nói", "Khuyết tật về trí tuệ", "Khuyết tật về thần kinh", "Khuyết tật vận động", "Khiếm thị", "Tự kỉ"]', '["Đánh giá khả năng và khiếm khuyết của học sinh về thể chất, trí tuệ, xã hội và cảm xúc, đặc biệt là khả năng trí tuệ hoặc các trạng thái đặc biệt khác", "Thiết kế và điều chỉnh chương trình giảng dạy, chuẩn bị bài học và các hoạt động phù hợp với yêu cầu", "Hướng dẫn cá nhân hoặc nhóm sử dụng các kĩ thuật và phương tiện hỗ trợ đặc biệt (ví dụ: chữ nổi Braille, máy trợ thính…) phù hợp với từng đối tượng học sinh và giám sát lớp học", "Ứng dụng những chiến lược và kĩ thuật dạy học đặc thù cho từng đối tượng học sinh để hỗ trợ sự phát triển giác quan, vận động, ngôn ngữ, nhận thức và trí nhớ", "Khuyến khích học sinh tự tin, hứng thú, vận động và phối hợp, giúp họ khám phá và áp dụng các phương pháp nhằm hạn chế trình trạng khiếm khuyết và đạt tiến bộ", "Thực hiện kiểm tra, đánh giá, ghi nhận sự tiến bộ của từng học sinh và trao đổi với học sinh, gia đình, giáo viên chủ nhiệm, nhà trị liệu, nhân viên công tác xã hội và các chuyên gia khác", "Tư vấn cá nhân"]', '["Các tổ chức cung cấp dịch vụ liên quan đến khuyết tật (ví dụ: trường chuyên biệt cho trẻ khiếm thị, khiếm thính…)", "Các trường phổ thông cung cấp dịch vụ hòa nhập cho trẻ em có nhu cầu đặc biệt", "Các hội, tổ chức của người khuyết tật", "Các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình hỗ trợ người khuyết tật ví dụ như Tổ chức Hỗ trợ Người khuyết tật Việt Nam (VNAH)", "Trợ giúp trong các hoạt động, sự kiện của người khuyết tật như giải thể thao, Thế vận hội cho người khuyết tật, Paragames", "Tư vấn cho các công ti, doanh nghiệp có chương trình hỗ trợ, hòa nhập, tuyển dụng người khuyết tật"]', TRUE),
+    (125, 'Quản lí bán hàng và marketing', 'EC', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự sáng kiến và tính chủ động đảm nhận các yêu cầu', 'Điều kiện làm việc', 'Nhà quản lí bán hàng và marketing lập kế hoạch, chỉ đạo và điều phối hệ thống phân phối nhằm đảm bảo hàng hóa của doanh nghiệp đến nhà kho, cửa hàng và cuối cùng là đến với người tiêu dùng.', '["Quản lí quảng cáo", "Nghiên cứu hành vi tiêu dùng và nghiên cứu thị trường", "Tiếp thị quốc tế", "Tiếp thị dịch vụ", "Tiếp thị nông thôn", "Quản lí bán hàng", "Tiếp thị du lịch", "Tiếp thị thương mại"]', '["Lập kế hoạch, chỉ đạo và phối hợp hoạt động bán hàng và tiếp thị của doanh nghiệp trên các hồ sơ kinh doanh và đánh giá thị trường", "Xác định bảng giá, giảm giá và điều kiện giao hàng, dự trù kinh phí xúc tiến quảng cáo, phương thức bán hàng, ưu đãi đặc biệt và các chiến dịch bán hàng đặc biệt", "Giám sát việc tuyển dụng, đào tạo và làm việc của nhân viên", "Đại diện bộ phận bán hàng và tiếp thị trong giao dịch với các bộ phận khác hoặc với các cơ quan bên ngoài", "Lập kế hoạch kinh doanh và chiến lược tiếp thị cho sản phẩm mới (ra mắt sản phẩm, làm việc với các chuyên gia quảng cáo)"]', '["Các doanh nghiệp Nhà nước và tư nhân kinh doanh thương mại (bán lẻ hoặc bán buôn trong nước, xuất nhập khẩu)", "Bộ phận bán hàng tiếp thị của các doanh nghiệp sản xuất", "Các doanh nghiệp kinh doanh dịch vụ như giáo dục, y tế, tài chính, tư vấn môi giới, cho thuê…"]', TRUE),
+    (126, 'Quản lí bán lẻ và bán buôn', 'EC', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Nhà quản lí bán lẻ và bán buôn làm công tác quản lí chung trong doanh nghiệp bán buôn và bán lẻ, làm chủ đại lí bán buôn hoặc các doanh nghiệp bán lẻ, lập kế hoạch, chỉ đạo và điều phối các hoạt động kinh doanh.', '["Quản trị bán lẻ", "Bán hàng"]', '["Đàm phán với các nhà cung cấp, khách hàng, đại lí và các tổ chức khác", "Lập dự toán kinh phí", "Xây dựng, thực hiện và điều chỉnh chính sách mua hàng, bán hàng, dịch vụ khách hàng", "Lập kế hoạch và kiểm soát việc sử dụng các nguồn lực và nhân công", "Quản lí hoạt động kinh doanh hàng ngày, bao gồm cả việc theo dõi báo cáo bán hàng, tồn kho, và các báo cáo khác liên quan đến việc bán hàng"]', '["Trung tâm mua sắm và các cửa hàng", "Sách và ngành công nghiệp xuất bản", "Cửa hàng âm nhạc", "Ngành công nghiệp may mặc", "Ngành công nghiệp chế biến thực phẩm"]', TRUE),
+    (127, 'Quản lí khách sạn, nhà hàng', 'ECS', 'Làm việc với con người', 'Thu thập thông tin', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Quản lí khách sạn, nhà hàng lập kế hoạch, chỉ đạo và phối hợp các hoạt động kinh doanh của khách sạn, nhà hàng theo lĩnh vực chuyên môn. Họ có thể quản lí chung hoặc chuyên về một nghiệp vụ như tiền sảnh (đặt phòng cho khách ở khách sạn), nhà hàng Âu, nhà hàng Á, quầy đồ uống, quán cà phê (chuẩn bị và phục vụ đồ ăn, uống cho khách), buồng phòng (đảm bảo dịch vụ buồng, phòng cho khách), bếp nóng, bếp nguội, bếp bánh (mua nguyên liệu và chế biến món ăn cho khách)... Nhiệm vụ cụ thể của quản lí khách sạn, nhà hàng thay đổi tùy theo bộ phận mà người đó phụ trách.', '["Bộ phận lễ tân", "Bộ phận buồng, phòng", "Bộ phận nhà hàng, quầy uống", "Hoạt động tiếp tân", "Hoạt động quản lí buồng, phòng", "Hoạt động nhà hàng", "Kĩ thuật nấu nướng", "Kĩ thuật pha chế đồ uống", "Quản lí khách sạn", "Quản lí khu resort"]', '["Quản lí bộ phận lễ tân: phụ trách đội ngũ nhân viên tương tác trực tiếp với khách hàng để giúp họ đặt phòng khách sạn, nhận và đăng kí khi họ đến nơi, xuất và thu tiền các hóa đơn, hỗ trợ tất cả các vấn đề liên quan nhằm thỏa mãn nhu cầu khách hàng thông qua liên kết với các nhà cung cấp dịch vụ khác như vận tải, du lịch và các bộ phận khác của khách sạn", "Quản lí bộ phận nhà hàng, quầy uống: phụ trách đội ngũ nhân viên chuẩn bị và phục vụ tất cả các mặt hàng thực phẩm và đồ uống trong khách sạn. Lĩnh vực chuyên ngành khác nhau tùy theo các loại món ăn (ví dụ như đồ ăn Âu, đồ ăn Trung Quốc,)", "Quản lí bộ phận buồng, phòng: phụ trách các công việc bảo trì các phòng và dãy phòng trong khách sạn, ví dụ như trang trí phòng, dọn dẹp, vệ sinh, thay ga, khăn và trang bị hàng ngày, kiểm tra và làm phòng khi khách trả phòng"]', '["Khách sạn", "Khu Resorts", "Khu du lịch y tế", "Khu du lịch nghỉ dưỡng", "Hãng hàng hải, hàng không", "Dịch vụ nhà khách ở các công ti"]', TRUE),
+    (128, 'Quản lí nông nghiệp', 'ERC', 'Làm việc với con người', 'Phân tích và xử lý', 'Thể chất - cơ khí', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Nhà quản lí nông nghiệp là người làm chủ hoặc đại diện cho chủ sở hữu các trang trại, nông trường. Họ chịu trách nhiệm quản lí chung, lập kế hoạch, chỉ đạo và điều phối các hoạt động sản xuất kinh doanh.', '["Quản lí rủi ro trong nông nghiệp", "Quản lí kinh doanh nông nghiệp", "Tiếp thị nông nghiệp", "Quản lí kho và chuỗi cung ứng nông nghiệp"]', '["Lập dự toán kinh phí", "Đàm phán với nhà cung cấp, khách hàng và các tổ chức khác", "Lập kế hoạch, và kiểm soát việc sử dụng các nguồn lực và nhân công", "Quản lí hoạt động hàng ngày của doanh nghiệp, đơn vị nông nghiệp"]', '["Làm việc trong các trang trại tư nhân và Chính phủ liên quan đến sản xuất, lưu kho và tiếp thị", "Làm việc cho các công ty liên quan đến nông nghiệpkinh doanh, chế biến thực phẩm, sản xuất giống và cung cấp dịch vụ tư vấn cho ngành nông nghiệp", "Làm việc trong các tổ chức quốc tế với vai trò tư vấn"]', TRUE),
+    (129, 'Quản trị bệnh viện', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Nhà quản trị bệnh viện là chuyên gia về quản trị và quản lí của ngành y tế. Họ đảm bảo rằng các dịch vụ chăm sóc sức khỏe được thực hiện một cách hiệu quả cho bệnh nhân và gia đình thông qua các bệnh viện, trung tâm chăm sóc sức khỏe ban đầu và các tổ chức cung cấp các loại hình dịch vụ y tế khác nhau.', '["Tài chính", "Quan hệ công chúng", "Tổ chức cán bộ và nhân sự", "Đấu thầu"]', '["Lập kế hoạch, chỉ đạo và điều phối các hoạt động của một bệnh viện hoặc tổ chức chăm sóc sức khỏe", "Lập kế hoạch tài chính và dự toán kinh phí", "Lập kế hoạch và kiểm soát việc sử dụng các nguồn lực và lao động", "Lập kế hoạch và thực hiện các chính sách của tổ chức"]', '["Bệnh viện", "Trung tâm điều dưỡng", "Cơ quan về chăm sóc sức khỏe của Chính phủ"]', TRUE),
+    (130, 'Quản lí nhân sự', 'ESC', 'Làm việc với con người', 'Tương tác với người khác', 'Năng lực phân tích – logic; Năng lực ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Nhà quản lí nhân sự lập kế hoạch, điều phối các hoạt động của một tổ chức để thực hiện chiến lược nhân lực một cách tốt nhất.', '["Các hệ thống và qui trình quản lí nhân sự", "Lương thưởng, phúc lợi và bồi thường", "Phát triển nguồn nhân lực", "Quan hệ lao động và pháp luật lao động", "Tranh chấp lao động và đình công"]', '["Tư vấn và thực hiện việc tuyển dụng, phân công, đào tạo, đề bạt, trả lương, bồi thường, phúc lợi cho nhân viên, xây dựng quan hệ quản lí - nhân viên và những lĩnh vực khác của chính sách nhân sự", "Nghiên cứu và phân tích công việc bằng các cách thức như phỏng vấn người lao động, nhà quản lí và mô tả chi tiết vị trí, công việc, nghề nghiệp từ những thông tin thu được", "làm việc về các hệ thống phân loại nghề nghiệp", "Nghiên cứu và tư vấn cho các cá nhân về các cơ hội tuyển dụng, những lựa chọn nghề, giáo dục và đào tạo bậc cao nếu cần", "Phối hợp với bộ phận có liên quan tiến hành đánh giá hiệu quả lao động của người lao động", "Lập, lưu trữ, theo dõi hồ sơ của nhân viên và các dữ liệu nhân sự như đánh giá kết quả, tỉ lệ vắng mặt và tỉ lệ biến động lao động", "Chuẩn bị, đàm phán, giải thích hợp đồng lao động và thỏa ước lao động tập thể", "Tư vấn và thực hiện việc đối thoại và hợp tác với công đoàn cơ sở hoặc đại diện tập thể người lao động để xây dựng quan hệ lao động hài hòa tại nơi làm việc, phòng ngừa và giải quyết tranh chấp lao động"]', '["Tất cả các doanh nghiệp vừa và lớn đều cần nhà quản lí nhân sự", "Các doanh nghiệp, công ty tư vấn tuyển dụng, nhân sự"]', TRUE),
+    (131, 'Cán bộ quan hệ lao động', 'SEC', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Cán bộ quan hệ lao động là chuyên gia trong lĩnh vực xây dựng và duy trì quan hệ lao động hài hòa giữa người sử dụng lao động và người lao động của một doanh nghiệp. Họ hiểu biết sâu về chính sách pháp luật lao động, quan tâm tới các điều kiện làm việc thích hợp và việc làm bền vững cho người lao động, đảm bảo lợi ích cho cả doanh nghiệp và người lao động trong dài hạn.', '["Bồi thường", "Tư vấn", "Tâm lí công nghiệp", "Xã hội học công nghiệp", "Luật lao động", "Phúc lợi lao động", "Thỏa ước lao động tập thể", "Giải quyết tranh chấp lao động và đình công", "Bảo vệ người lao động"]', '["Tìm hiểu, cập nhật, tuyên truyền chính sách pháp luật liên quan đến lao động cho người lao động và người sử dụng lao động", "Tìm hiểu, tuyên truyền và triển khai thực hiện chính sách, nội qui lao động của doanh nghiệp", "Đề xuất với người sử dụng lao động, thực hiện các chương trình vì lợi ích của người lao động và gia đình họ", "Gặp gỡ những người lao động gặp khó khăn (ví dụ khó khăn về tài chính, sức khỏe) và tư vấn cho họ hoặc giới thiệu họ với các chuyên gia có liên quan để tiếp tục hỗ trợ", "Tập huấn, tư vấn, nâng cao trình độ của người lao động và công đoàn cơ sở về quan hệ lao động, đối thoại tại nơi làm việc", "Đóng vai trò kết nối giữa người lao động và người sử dụng lao động, thúc đẩy việc đàm phán kí kết thỏa ước lao động tập thể", "Tham gia giải quyết tranh chấp lao động và đình công thông qua thương lượng tập thể"]', '["Các doanh nghiệp, nhà máy, đặc biệt là doanh nghiệp sử dụng nhiều lao động", "Tổ chức công đoàn các cấp", "Các tổ chức đại diện người sử dụng lao động như Văn phòng giới sử dụng lao động (Phòng Thương mại và Công nghiệp Việt Nam), Liên minh hợp tác xã, hiệp hội dệt may, da giày…", "Cơ quan quản lí Nhà nước về lao động (Bộ và các sở LĐTB&amp;amp;XH, các tổng cục, cụ, vụ viện)", "Các tổ chức quốc tế về vấn đề lao động và việc làm"]', TRUE),
+    (132, 'Nhà tâm lí học', 'SIA', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Nhà tâm lí học nghiên cứu các quá trình tâm lí và hành vi của cá nhân hoặc nhóm người. Họ áp dụng kiến thức này để thúc đẩy, điều chỉnh sự phát triển của cá nhân, xã hội, giáo dục hoặc nghề nghiệp.', '["Tâm lí học ứng dụng", "Tâm sinh lí học", "Tâm lí học nghề nghiệp", "Tâm lí trẻ em", "Tâm lí lâm sàng", "Tâm lí học nhận thức", "Tâm lí học phát triển", "Tâm lí giáo dục", "Tâm lí học thực nghiệm", "Tâm lí học tội phạm", "Tâm lí học công nghiệp", "Tâm lí học xã hội"]', '["Thực hiện các trắc nghiệm để đo lường các đặc tính tâm lí và hành vi (ví dụ như trí thông minh, đặc điểm tính cách, quá trình nhận thức) và giải thích thông tin này để hướng dẫn khách hàng", "Phân tích ảnh hưởng của di truyền, xã hội, nghề nghiệp và các yếu tố khác đối với tư tưởng và hành vi cá nhân", "Thực hiện tư vấn hoặc điều trị đối với cá nhân và nhóm", "Nghiên cứu các yếu tố tâm lí trong chẩn đoán, điều trị và phòng ngừa các bệnh tâm thần", "Nghiên cứu về hành vi làm việc trong môi trường công nghiệp và môi trường tổ chức", "đưa ra và cung cấp dịch vụ để thúc đẩy sức khỏe nghề nghiệp"]', '["Bệnh viện", "Các công ti, nhà máy và ngành công nghiệp", "Các tổ chức giáo dục", "Dịch vụ quốc phòng", "Hành nghề cá nhân"]', TRUE),
+    (133, 'Nhà tư vấn tâm lí', 'ISA', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Mối quan hệ', 'Nhà tư vấn tâm lí hướng dẫn hoặc tư vấn cho các cá nhân nhằm giúp họ đối phó với những khó khăn về tâm lí, tình cảm và căng thẳng liên quan đến cuộc sống hàng ngày. Những khó khăn đó có thể liên quan đến học tập, nghề nghiệp, hôn nhân, cuộc sống gia đình và phát triển cá nhân', '["Chỉ dẫn nghề nghiệp và tư vấn", "Tư vấn liên quan đến thanh thiếu niên (ví dụ như Tư vấn kĩ năng sống)", "Tư vấn giáo dục", "Tư vấn lão khoa (làm việc với người cao tuổi)", "Tư vấn hôn nhân", "Tư vấn trường học", "Tư vấn lạm dụng thuốc và nghiện ngập"]', '["Phỏng vấn khách hàng và những người có liên quan đến khách hàng để thu thập thông tin về giáo dục, nghề nghiệp, xã hội và thông tin liên quan khác để hiểu hơn về nguồn gốc và nguyên nhân có thể dẫn đến những khó khăn", "Tiến hành các trắc nghiệm trí tuệ, khả năng, sở thích, tính cách để đánh giá tình trạng của khách hàng", "Sử dụng các loại kĩ thuật tư vấn khác nhau để giúp khách hàng vượt qua hoặc kiểm soát vấn đề của mình", "Thực hiện hướng dẫn, tư vấn nhóm cho một nhóm khác hàng có chung nhu cầu", "Thực hiện hỗ trợ sau tư vấn theo để tiếp tục hỗ trợ khách hàng"]', '["Các phòng khám và bệnh viện, làm việc với những người trong tình trạng suy sụp tinh thần", "Các cơ sở giáo dục, hỗ trợ tư vấn học đường", "Các doanh nghiệp, nhà máy, giúp nhân viên đối phó tốt hơn với căng thẳng liên quan tới công việc", "Các tổ chức phi chính phủ, tổ chức quốc tế liên quan tới trẻ em, thanh niên, người tàn tật, người già, phụ nữ, người nghiện ma túy và thích", "Hành nghề cá nhân"]', TRUE),
+    (134, 'Nhà tư vấn nghề nghiệp', 'SI', 'Làm việc với con người', 'Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Nhà tư vấn nghề nghiệp áp dụng các nguyên tắc tâm lí học nghề nghiệp để giúp khách hàng hiểu bản thân mình, hiểu thế giới nghề nghiệp, xây dựng các phương án chọn nghề và chuẩn bị cho nghề nghiệp. Họ phỏng vấn khách hàng, cho làm bản câu hỏi và xác định năng lực hướng nghiệp, cung cấp thông tin về các nghề nghiệp khác nhau. Họ làm việc với khách hàng vào những thời điểm quan trọng trong việc quyết định nghề nghiệp (ví dụ như cuối trung học phổ thông, trung học cơ sở, sau khi tốt nghiệp các cơ sở đào tạo). Họ cũng có thể giúp những người đang có vấn đề về nghề nghiệp (ví dụ như những người không thích nghề của mình, người mất việc làm). Họ có thể tư vấn cá nhân hoặc tư vấn nhóm.', '["Tư vấn nghề nghiệp", "Các nhóm đặc biệt (ví dụ như những người có nhu cầu đặc biệt, người mới phục hồi sau bệnh tật)", "Các nhóm tuổi cụ thể", "Các công việc cụ thể đối với từng mốc phát triển nghề nghiệp (ví dụ như trắc nghiệm, đánh giá, chuẩn bị nghề nghiệp)"]', '["Phỏng vấn khách hàng để xác định tình trạng phát triển nghề nghiệp của họ", "Áp dụng các kĩ thuật khác nhau (ví dụ như kiểm tra, lấy hồ sơ cá nhân) để xác định mong muốn và khả năng của khách hàng", "Giúp đỡ khách hàng hiểu biết sâu hơn về thế giới nghề nghiệp", "Giúp đỡ khách hàng phát triển kĩ năng chuẩn bị nghề nghiệp (ví dụ như chuẩn bị hồ sơ, chuẩn bị phỏng vấn)", "Trao đổi với gia đình của khách hàng (đặc biệt là các khách hàng trẻ tuổi) để xây dựng một kế hoạch phát triển nghề nghiệp hiệu quả hơn", "Xác định các yếu tố xã hội, tâm lí và kinh tế có thể cản trở quá trình phát triển nghề nghiệp và giúp khách hàng nhận thức được những rào cản này", "Lập hồ sơ cá nhân", "Làm việc với các chuyên gia khác như giáo viên, nhân viên tư vấn, nhà tâm lí học và nhân viên xã hội"]', '["Trung tâm dịch vụ việc làm, tư vấn nghề nghiệp", "Cơ quan Nhà nước về lao động", "Các phòng khám tâm lí", "Trung tâm phục hồi chức năng", "Trường học", "Các tổ chức phát triển thanh thiếu niên", "Các tổ chức phát triển, phi chính phủ, tổ chức quốc tế"]', TRUE),
+    (135, 'Kĩ thuật viên chẩn đoán hình ảnh', 'ISR', 'Làm việc với con người', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Làm việc với con người', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Thành tựu', 'Kĩ thuật viên chẩn đoán hình ảnh phụ trách các thiết bị chẩn đoán hình ảnh trợ giúp các bác sĩ xác định về tình trạng bệnh tật có thể có của bệnh nhân, như máy X quang, điện tim, siêu âm, nội soi, chụp cắt lớp, cộng hưởng từ… Người làm nghề này hiểu về cơ thể con người, điều kiện y tế và chăm sóc bệnh nhân. Họ cũng nắm vững cách vận hành thiết bị và lưu giữ hồ sơ.', '["Siêu âm", "Nội soi", "X-quang", "Kĩ thuật viên điện tâm đồ", "Chụp cộng hưởng từ (MRI)", "Chụp cắt lớp (CT Scan)", "Kĩ thuật, thiết bị chẩn đoán hình ảnh"]', '["Chuẩn bị cho bệnh nhân chẩn đoán hình ảnh. Công việc này có thể bao gồm tiêm một loại thuốc nhuộm màu hoặc làm sạch các phần của cơ thể được soi chụp", "Tiến hành kiểm tra theo chỉ định của bác sĩ một cách chính xác", "Xử lí thông tin từ các kết quả kiểm tra (ví dụ: rửa phim X-quang)", "Ghi kết quả vào báo cáo", "Chuyển kết quả cho bệnh nhân và bác sĩ", "Vệ sinh, duy tu bảo dưỡng máy móc thiết bị"]', '["Bệnh viện", "Các phòng thí nghiệm y tế", "Các trường đào tạo về y tế", "Trung tâm nghiên cứu"]', TRUE),
+    (136, 'Kĩ thuật viên nhãn khoa', 'CRI', 'Làm việc với con người', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Điều kiện làm việc', 'Kĩ thuật viên nhãn khoa, còn gọi là y tá nhãn khoa, hỗ trợ chẩn đoán, điều trị các vấn đề sức khỏe liên quan đến thị giác và mắt, bao gồm đo và chỉ định kính, kính áp tròng, chẩn đoán và điều trị (không bao gồm phẫu thuật) bất thường về cơ, chấn thương mắt nhỏ, chẩn đoán, điều trị các bệnh như bệnh tăng nhãn áp và các chẩn đoán khác như tổn thương võng mạc do tiểu đường; tiến hành giáo dục sức khỏe, chăm sóc thị lực cho các nhóm bệnh nhân đặc biệt cũng là công việc của y tá nhãn khoa.', '["Kính áp tròng", "Các nhóm đặc biệt như trẻ em, người già hoặc những người cần các thiết bị hỗ trợ thị giác", "Liệu pháp cho người khiếm thị"]', '["Kiểm tra bệnh nhân để xác định dấu hiệu của bệnh và điều trị cho bệnh nhân theo từng lĩnh vực chuyên ngành", "tham gia hoạt động y tế công cộng bao gồm đo thị lực cho cộng đồng, các ngành công nghiệp và trường học", "Xác định lỗi khúc xạ và đưa ra điều chỉnh thích hợp thông qua việc dùng kính", "Chẩn đoán các bệnh về mắt và các vấn đề về tầm nhìn bằng cách kiểm tra cảm nhận màu sắc, nhận thức sâu, khả năng tập trung, và phối hợp và độ sắc nét hình ảnh", "Chăm sóc cho bệnh nhân trước và sau khi phẫu thuật như điều chỉnh bằng tia laser và loại bỏ đục thủy tinh thể"]', '["Bệnh viện", "Các phòng khám, đo mắt", "Các phòng thí nghiệm y tế", "Cơ sở đào tạo y khoa", "Trung tâm nghiên cứu"]', TRUE),
+    (137, 'Kĩ thuật viên y tế', 'ISR', 'Làm việc với con người', 'Phân tích và xử lý; Làm việc với công cụ, kỹ thuật', 'Năng lực thể chất - cơ khí; Năng lực hình học-màu sắc – thiết kế', 'Làm việc với con người', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kỹ thuật Y Sinh (KTYS) là một lĩnh vực liên ngành ứng dụng kỹ thuật tiên tiến (như nano, tế bào gốc, y tế viễn thông) vào việc tạo ra các phương pháp nghiên cứu và thiết bị phục vụ cho sức khỏe cũng như giúp hiểu biết sâu hơn về con người. KTYS bao gồm các lĩnh vực như Thiết bị y tế, Điện tử Y Sinh, Y học tái tạo, Kỹ thuật dược. Những sản phẩm của ngành KTYS bao gồm máy CT-cắt lớp, X-quang, trợ tim, nội soi, các bộ phận nhân tạo trong cơ thể, dược phẩm và vật liệu sinh học. Lĩnh vực này phù hợp với những người yêu thích thiết kế, chế tạo kinh doanh hay nghiên cứu khoa học và y học lâm sàng', '["Chủ yếu là chuyên sâu về các loại thiết bị và thủ thuật cụ thể như", "Máy trợ tim, trợ thở", "Máy gây mê", "Thủ thuật tim mạch, hô hấp…"]', '["Chẩn đoán, xử lí hình ảnh siêu âm, X-Quang, CT, MRI…", "Sử dụng các máy móc, thiết bị y tế trong việc chẩn đoán cho người bệnh", "Xử lý tính hiệu sinh lý học, cơ sinh học, vật liệu sinh học với kỹ thuật sinh học, phân tích hệ thống, mô hình hóa 3 chiều đúc, dát, chạm khắc đồng, bạc và các vật liệu tương tự", "Sản xuất các sản phẩm đồ gia dụng và trang trí bằng thủy tinh bằng cách thổi và chạm khắc thủy tinh và các vật liệu tương tự", "Khắc, chạm, trổ, khảm, vẽ, sơn, gắn hoa văn họa tiết trang trí trên bề mặt sản phẩm", "Xử lí và hoàn thiện sản phẩm bằng cách sơn, phủ men, làm bóng, xử lí mối, mọt, mốc, rỉ"]', '["Bệnh viện", "Các phòng thí nghiệm y tế", "Cơ sở đào tạo y tế", "Trung tâm nghiên cứu"]', TRUE),
+    (138, 'Nhà quản lí sự kiện', 'ECS', 'Làm việc với con người', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Nhà quản lí sự kiện làm công việc quản lí và điều hành sự kiện. Họ tổ chức và phối hợp các dịch vụ cho các hội nghị, sự kiện, tiệc, đám cưới, triển lãm, hội thảo và các sự kiện đặc biệt.', '["Quản lí MICE", "Quản lí sự kiện thể thao, giải trí", "Dịch vụ cưới hỏi, sự kiện gia đình"]', '["Thảo luận với khách hàng về các yêu cầu của họ và đưa ra các gói dịch vụ và giá cả phù hợp", "đề xuất ý tưởng, chương trình, kịch bản nếu cần", "Giới thiệu dịch vụ hội thảo, hội nghị, sự kiện và triển lãm thương mại cho các khách hàng tiềm năng", "Sắp xếp và phối hợp các dịch vụ, ví dụ như phòng hội nghị, phông màn, biển báo, âm thanh và thiết bị nghe nhìn, máy tính, dẫn chương trình và phiên dịch, chỗ ở, đi lại và hoạt động xã hội cho người tham dự, phục vụ hậu cần cho các diễn giả", "Tổ chức đăng kí tham gia", "Giám sát công việc của các nhà thầu và báo cáo về sự thay đổi so với kế hoạch"]', '["Các công ty tổ chức sự kiện, chuyên về tổ chức các loại sự kiện khác nhau như ca nhạc, hòa nhạc, biểu diễn nghệ thuật, sự kiện truyền hình, lễ hội, trình diễn thời trang, thể thao, giới thiệu sản phẩm, động thổ, khai trương, hội nghị hội thảo, chương trình khuyến mãi, họp báo, đám cưới, lễ kỉ niệm, tiệc, hội họp…", "Các cơ quan/công ty về quan hệ công chúng", "Bộ phận liên quan tới tổ chức sự kiện của các khách sạn lớn", "Tự mở doanh nghiệp, dịch vụ tổ chức sự kiện"]', TRUE),
+    (139, 'Nhân viên công tác xã hội', 'SE', 'Làm việc với con người', 'Thu thập thông tin; Tương tác với người khác', 'Phân tích - logic', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi tính nhạy bén, nhạy cảm', 'Mối quan hệ', 'Nhân viên công tác xã hội làm việc với các nhóm và cộng đồng. Họ tìm hiểu các vấn đề xã hội, hướng dẫn cho đối tượng gặp khó khăn trong các vấn đề xã hội và vấn đề liên quan nhằm giúp họ tìm kiếm và sử dụng các nguồn lực để vượt qua khó khăn và đạt được mục tiêu cụ thể.', '["Tổ chức và phát triển cộng đồng", "Tội phạm học và cải huấn", "Phát triển nguồn nhân lực, quản lí nhân lực và quan hệ lao động", "Công tác xã hội trong y tế, tâm thần và tư vấn", "Dịch vụ chăm sóc gia đình"]', '["Thu thập thông tin về nhu cầu của đối tượng gặp khó khăn xã hội, đánh giá khả năng và vấn đề của họ", "Giúp các cá nhân, gia đình và cộng đồng xác định các phương án và kế hoạch hành động", "Hỗ trợ họ xác định và tiếp cận các nguồn hỗ trợ cộng đồng như hỗ trợ pháp lí, y tế, tài chính, nhà ở, việc làm, giao thông, vận động và chăm sóc cá nhân hàng ngày, và các dịch vụ liên quan khác", "Tham gia sàng lọc, lựa chọn người tham gia cho các chương trình xã hội phù hợp", "Cung cấp dịch vụ can thiệp khủng hoảng và tạm lánh", "Thực hiện các tập huấn kĩ năng sống, chương trình điều trị cai nghiện, kiểm soát hành vi, dịch vụ thanh thiếu niên và các chương trình xã hội và cộng đồng khác", "Hỗ trợ đánh giá hiệu quả các biện pháp và chương trình thông qua giám sát và báo cáo tiến bộ của đối tượng", "Liên lạc thường xuyên với các tổ chức xã hội, nhà trường và tổ chức y tế có liên quan để trao đổi thông tin về tình trạng và tiến bộ của đối tượng được hỗ trợ"]', '["Các tổ chức phi chính phủ, tổ chức tình nguyện, tổ chức quốc tế có chương trình hỗ trợ xã hội, phát triển cộng đồng;", "Trung tâm cộng đồng", "Bệnh viện", "Các doanh nghiệp có chương trình trách nhiệm xã hội của doanh nghiệp (CSR)", "Các tổ chức, đoàn thể có chức năng chăm sóc, bảo trợ xã hội cho hội viên, khách hàng như đoàn thanh niên, hội phụ nữ, hội người khuyết tật…"]', TRUE),
+    (140, 'Tiếp viên hàng không hoặc tiếp viên trên phương tiện vận tải', 'ESC', 'Làm việc với con người', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Thể chất - cơ khí', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đề cao sự tự kiểm soát về mặt cảm xúc, hành động, lời nói', 'Mối quan hệ', 'Tiếp viên, còn gọi là chiêu đãi viên, là người trực tiếp cung cấp dịch vụ cá nhân nhằm đảm bảo sự an toàn và thoải mái của hành khách. Họ phục vụ bữa ăn, đồ uống trên máy bay và trên tàu.', '["Tiếp viên hàng không", "Tiếp viên trên tàu du lịch…"]', '["Cung cấp các dịch vụ cho khách hàng", "Giải thích việc sử dụng các thiết bị an toàn như dây an toàn, mặt nạ dưỡng khí, phao cứu sinh", "Phát tạp chí, tai nghe, chăn, các vật dụng tương tự, và trả lời các yêu cầu của hành khách", "Phục vụ các bữa ăn và đồ uống được chuẩn bị sẵn", "Bán hàng miễn thuế", "Thực hiện trợ giúp y tế cho khách hàng khi cần thiết", "Đưa ra hành động thích hợp trong trường hợp khẩn cấp hoặc tai nạn", "Chăm sóc hành khách tại các sân bay"]', '["Các hãng hàng không trong nước và quốc tế", "Các sân bay", "Các tàu du lịch, du thuyền", "Các chuyến xe lửa cao cấp và xe buýt du lịch"]', TRUE),
+    (141, 'Thợ chế biến thực phẩm', 'RC', 'Làm việc với con người', 'Thu thập thông tin; Tương tác với người khác', 'Thể chất - cơ khí', 'Làm việc với con người', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu khả năng làm việc dưới áp lực', 'Mối quan hệ', 'Thợ chế biến thực phẩm là người tham gia trực tiếp vào công việc chế biến thực phẩm của các cơ sở sản xuất, kiêm tra chất lượng sản phẩm của dây chuyên chế biến thực phẩm từ nguyên liệu đến thành phẩm; tổ chức sản xuất và chế biến thực phẩm ở quy mô vừa và nhỏ.', '["Chế biến, bảo quản thịt và các sản phẩm từ thịt", "Chế biến, bảo quản thuỷ sản và các sản phẩm từ thuỷ sản", "Chế biến và bảo quản rau quả", "Chế biến sữa và các sản phẩm từ sữa"]', '["Thực hiện việc chế biến thực phẩm từ các nguyên liệu sẵn có", "Tổ chức, điều hành hoạt động chế biến thực phẩm theo dây chuyền hoặc theo từng công đoạn được giao", "Kiểm tra, đánh giá chất lượng thực phẩm"]', '["Các doanh nghiệp chế biến thực phẩm", "Xưởng chế biến thực phẩm", "Các công ty liên quan đến thực phẩm", "Trung tâm dinh dưỡng", "Các khu công nghiệp, chế xuất"]', TRUE),
+    (142, 'Đầu bếp', 'ERA', 'Làm việc với con người', 'Tương tác với người khác', 'Năng lực hình học - màu sắc - thiết kế; Năng lực thể chất – cơ khí', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Sự độc lập', 'Thợ đầu bếp chế biến và làm các món ăn, hiểu biết về dinh dưỡng, đảm bảo các món ăn ngon, an toàn thực phẩm và đầy đủ chất dinh dưỡng cần thiết.', '["Các món ăn Âu – Á", "Pha chế đồ uống", "Trang trí các món ăn", "Làm bánh"]', '["Nấu nướng các món ăn từ nguyên liệu có sẵn", "Sơ chế các loại thực phẩm, rau, củ quả để làm các món ăn phù hợp yêu cầu", "Làm thủ công bánh mứt kẹo, sô-cô-la từ hỗn hợp của đường, sô cô la và các thành phần khác với sự hỗ trợ của một số công cụ và máy móc"]', '["Các nhà hàng, khách sạn", "Các bếp ăn lớn", "Các khu du lịch, nghỉ dưỡng, resort", "Các tổ chức, tập đoàn, cơ quan, công ty phục vụ nhiều công nhân, nhân viên"]', TRUE),
+    (143, 'Phụ bếp', 'RE', 'Làm việc với con người', 'Thu thập thông tin', 'Thể chất - cơ khí', 'Làm việc với con người', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Phụ bếp giúp đầu bếp, bếp trưởng, bếp phó thực hiện chế biến và làm các món ăn và các hoạt động khác liên quan đến nấu nướng.', '["Chế biến các món ăn Âu – Á", "Pha chế đồ uống", "Trang trí các món ăn", "Làm bánh"]', '["Chuẩn bị nguyên vật", "liệu để chế biến các món ăn", "Chuẩn bị công cụ, các dụng cụ cần thiết cho việc chế biến thức ăn theo yêu cầu", "Đảm bảo đầy đủ các nguyên, vật liệu thực phẩm để chế biến món ăn", "Tham gia hỗ trợ sơ chế thực phẩm khi có yêu cầu", "Làm sạch, thu dọn, sắp xếp các công cụ, dụng cụ nấu nướng sau khi đã hoàn thành", "Kiểm tra hệ thống an toàn, phòng chống cháy nổ trong khu vực bếp"]', '["Các nhà hàng, khách sạn", "Các bếp ăn lớn", "Các khu du lịch, nghỉ dưỡng, resort", "Các tổ chức, tập đoàn, cơ quan, công ty phục vụ nhiều công nhân, nhân viên"]', TRUE),
+    (144, 'Phục vụ bàn', 'SRE', 'Làm việc với con người', 'Tương tác với người khác', 'Năng lực thể chất – cơ khí; Năng lực hình học – màu sắc – thiết kế', 'Làm việc với con người', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Bồi bàn là người giới thiệu, tư vấn và phục vụ các món ăn, đồ uống cho khách hàng.', '["Phục vụ bàn", "Sắp xếp, bài trí bàn", "Giải đáp thắc mắc của khách"]', '["Nhận yêu cầu về đồ uống, món ăn của khách hàng", "Lấy đồ uống, món ăn phục vụ cho khách", "Thu dọn bàn ăn và thay đồ mới cho khách", "Giải đáp những yêu cầu, thắc mắc của khách", "Đảm bảo vệ sinh khu vực phục vụ"]', '["Các nhà hàng, khách sạn", "Các khu du lịch, nghỉ dưỡng, resort", "Các khu vui chơi, giải trí"]', TRUE),
+    (145, 'Lễ tân', 'CES', 'Làm việc với con người', 'Tương tác với người khác', 'Ngôn ngữ', 'Làm việc với con người', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự hợp tác, tương trợ', 'Mối quan hệ', 'Lễ tân là người tiếp xúc, đón tiếp khách đến làm việc, tiếp nhận và xử lí thông tin ban đầu, hỗ trợ các hoạt động của cơ quan với khách hàng.', '["Lễ tân khách sạn", "Lễ tân doanh nghiệp", "Lễ tân kiêm hành chính"]', '["Đón tiếp khách hàng", "Nhận thông tin, yêu cầu từ khách hàng", "Xử lí thông tin và liên hệ với các bộ phận liên quan", "Giải đáp những yêu cầu, thắc mắc của khách", "Chuẩn bị các điều kiện đảm bảo cho hoạt động đạt kết quả tốt"]', '["Các nhà hàng, khách sạn", "Các khu du lịch, nghỉ dưỡng, resort", "Các khu vui chơi, giải trí", "Các cơ quan, công sở, công ty, tập đoàn", "Các tổ chức xã hội, nghề nghiệp"]', TRUE),
+    (146, 'Nhân viên văn phòng', 'CER', 'Làm việc với con người', 'Tương tác với người khác; Làm việc với công cụ, kỹ thuật', 'Ngôn ngữ', 'Làm việc với con người', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Mối quan hệ', 'Nhân viên văn phòng làm việc trong lĩnh vực hành chính văn phòng, thực hiện các công việc thuộc hành chính của các cơ quan, tổ chức, công ty…', '["Quản trị văn phòng", "Quản lí hành chính", "Thư kí văn phòng", "Thống kê, lưu trữ"]', '["Tiếp nhận, xử lí và trả lời thông tin của khách hàng, đối tác", "Thực hiện công việc đón tiếp khách thay lãnh đạo cơ quan, tổ chức", "Hướng dẫn khách hàng, đối tác làm việc với các bộ phận liên quan", "Chuẩn bị, tổ chức các cuộc họp của đơn vị, tổ chức", "tổ chức các điều kiện cần thiết cho hoạt động công tác của lãnh đạo và tổ chức"]', '["Các cơ quan, công sở, công ty, tập đoàn", "Các tổ chức xã hội, nghề nghiệp", "Các đơn vị sản xuất", "Các khu du lịch, khách sạn…"]', TRUE),
+    (147, 'Kĩ sư mỏ', 'IRE', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Kĩ sư mỏ áp dụng các nguyên tắc vật lí, địa chất và hóa học để thăm dò, khai thác và chế biến khoáng sản thiên nhiên. Về bản chất, hoạt động khai thác này gây ra sự xáo trộn môi trường trong và xung quanh khu vực có khoáng sản. Do đó, kĩ sư mỏ ngày nay không phải chỉ chú ý về phương diện khai thác và chế biến khoáng sản mà còn phải quan tâm tới vấn đề giảm nhẹ thiệt hại hoặc ảnh hưởng xấu gây ra cho môi trường.', '["Chuyên ngành về từng loại khoáng sản (ví dụ: than, sắt, dầu khí)", "Chuyên ngành về từng qui trình khai thác và chế biến", "Chuyên ngành về từng loại máy khai thác và chế biến", "Chuyên ngành về từng phương pháp khai thác (ví dụ như khai thác mỏ lộ thiên)", "Chuyên ngành phân theo vị trí mỏ khoáng sản (ví dụ như dưới nước, ở sa mạc)"]', '["Tiến hành thăm dò để xác định vị trí các mỏ khoáng sản và đánh giá mức độ khả thi, hiệu quả chi phí của việc khai thác mỏ", "Xác định các phương pháp khai thác mỏ hiệu quả nhất, trong đó có xét đến các vấn đề như độ sâu, vị trí của mỏ khoáng sản", "Chuẩn bị kế hoạch xây dựng khu mỏ chi tiết, bao gồm cả vị trí và cách bố trí các đường hầm", "Chỉ đạo lắp đặt thiết bị khai thác mỏ và chế biến khoáng sản khai thác", "Làm việc với các chuyên gia khác để đảm bảo rằng tất cả các qui định được tuân thủ", "Đảm bảo rằng tất cả các thiết bị an toàn được cài đặt", "Hướng dẫn, đào tạo thợ mỏ về sử dụng các thiết bị an toàn", "Tiến hành nghiên cứu và thiết lập các hệ thống giảm thiểu tác động của hoạt động khai thác khoáng sản đối với môi trường"]', '["Các doanh nghiệp khai thác mỏ", "Các công ty tư vấn kĩ thuật tư nhân", "Các trung tâm nghiên cứu", "Các trường đại học", "Các cơ quan Nhà nước"]', TRUE),
+    (148, 'Kĩ thuật viên bảo dưỡng máy bay', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Các kĩ sư bảo dưỡng máy bay đảm bảo máy bay đủ điều kiện hoạt động. Họ chỉ đạo, giám sát và thực hiện việc bảo trì, sửa chữa và đại tu kết cấu và động cơ máy bay.', '["Bảo dưỡng các bộ phận điện tử", "Bảo dưỡng các bộ phận cơ khí", "Thiết bị truyền thông", "Nạp nhiên liệu", "Sửa chữa", "Bảo trì", "Bảo trì hệ thống sân bay", "Kĩ thuật bảo dưỡng máy bay", "Kĩ thuật điện sân bay", "Kĩ thuật điện tử sân bay", "Khai thác hoạt động bay"]', '["Kiểm tra thường xuyên động cơ, thân vỏ, các hệ thống điện tử và cơ khí của máy bay đảm bảo vận hành tốt và đáp ứng mọi yêu cầu kĩ thuật và an toàn", "Sửa chữa hoặc thay thế bộ phận và hệ thống hỏng hóc", "Thay thế phụ tùng đến kì thay thế", "Kiểm tra các bộ phận và hệ thống đảm bảo hoạt động hiệu quả", "Bảo trì bảo dưỡng định kì", "Lưu giữ hồ sơ bảo dưỡng và sửa chữa", "Quản lí giám sát kĩ thuật viên và công nhân liên quan"]', '["Các sân bay dân sự và quân sự", "Các công ty bảo trì/bảo dưỡng hàng không", "Các hãng hàng không", "Các đơn vị thiết kế công trình hàng không"]', TRUE),
+    (149, 'Kĩ sư khai thác dầu khí', 'IRC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Phân tích - logic', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư khai thác dầu khí ứng dụng các nguyên tắc vật lí, địa chất và hóa học để phát hiện và khai thác dầu và khí từ các mỏ dầu khí dưới lòng đất và dưới biển.', '["Kĩ thuật khoan", "Đánh giá mỏ dầu khí", "Kĩ thuật sản xuất", "Kĩ thuật tầng chứa", "Kĩ thuật thủy khí", "Vật lí đá"]', '["Tiến hành nghiên cứu thăm dò để xác định vị trí các mỏ dầu, khí đốt và đánh giá tính khả thi, hiệu quả và chi phí của việc khai thác mỏ dầu khí đó", "Đánh giá các loại dầu và khí và trữ lượng trong mỏ đó", "Xác định phương pháp khoan hiệu quả nhất có thể thực hiện có tính đến các vấn đề như độ sâu và vị trí của mỏ dầu khí đó", "Chuẩn bị chi tiết kế hoạch thành lập đơn vị khai thác dầu khí", "Lắp đặt thiết bị khai thác và vận chuyển dầu khí", "Thiết lập hệ thống quản lí dòng dầu khí và vận chuyển đến nơi lưu trữ", "Điều hành kĩ thuật ở các giếng khoan khai thác", "điều khiển, theo dõi, phát hiện, xử lí sự cố ở các giếng", "Làm việc với các chuyên gia khác để đảm bảo rằng tất cả các qui định được tuân thủ", "Đảm bảo rằng tất cả các thiết bị an toàn được lắp đặt và đào tạo công nhân về an toàn vệ sinh lao động", "Nghiên cứu và triển khai các hệ thống giảm thiểu tác động môi trường từ hoạt động khai thác dầu khí"]', '["Các doanh nghiệp dầu khí Nhà nước và tư nhân", "Các trung tâm, viện nghiên cứu", "Giảng dạy tại các trường đại học, cao đẳng, trung học", "Các cơ quan Nhà nước quản lí ngành dầu khí", "Các công ty tư vấn kĩ thuật"]', TRUE),
+    (150, 'Chuyên gia chỉnh hình và phục hình', 'SRI', 'Thể chất - Cơ khí', 'Tương tác với người khác', 'Làm việc với con người', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ thuật viên chỉnh hình và phục hình phục vụ, chăm sóc bệnh nhân khuyết tật ở các bộ phận chân, tay, cột sống hay bị mất một phần hoặc toàn bộ chân, tay bằng cách lắp và chuẩn bị trụ chống chỉnh hình, chân, tay giả theo chỉ đạo, ý kiến của bác sĩ.', '["Các chuyên ngành khác nhau tùy thuộc vào loại thiết bị chân, tay giả hoặc các vật liệu sử dụng để làm chân tay giả. Ví dụ bạn có thể chuyên sâu về", "Trụ chống chỉnh hình hoặc chân, tay giả", "Các loại chân, tay giả, làm bằng nhựa, thép ...", "Sản xuất thiết bị chỉnh hình", "Sản xuất thiết bị phục hồi chức năng"]', '["Kiểm tra, đánh giá nhu cầu của bệnh nhân liên quan đến bệnh tật và khiếm khuyết về chức năng của họ", "Xây dựng thiết kế trụ chống chỉnh hình và chân tay giả", "Lựa chọn vật liệu, làm các phép đo thử, lập mô hình chỉnh hình mẫu và bố trí chỉnh hỉnh", "Thực hiện lắp chân tay giả, bao gồm việc sắp xếp liên kết tĩnh và động", "Ước lượng việc gắn trụ chống chỉnh hình và chân hoặc tay giả cho người bệnh nhân, điều chỉnh để đảm bảo sự phù hợp chức năng hoạt động và chất lượng của chân tay giả", "Hướng dẫn bệnh nhân sử dụng trụ chống chỉnh hình, chân hoặc tay giả và duy trì ghi chép bệnh án"]', '["Các trung tâm phục hồi chức năng", "Bệnh viện", "Các trung tâm chẩn đoán", "Phòng khám đa khoa"]', TRUE);
+
+INSERT INTO job_search_tokens (token, job_id, weight) VALUES
+    ('tho', 101, 18),
+    ('gom', 101, 18),
+    ('su', 101, 19),
+    ('va', 101, 10),
+    ('co', 101, 9),
+    ('lien', 101, 9),
+    ('quan', 101, 9),
+    ('hinh', 101, 4),
+    ('hoc', 101, 4),
+    ('mau', 101, 4),
+    ('sac', 101, 4),
+    ('thiet', 101, 7),
+    ('ke', 101, 4),
+    ('gia', 101, 2),
+    ('dung', 101, 4),
+    ('xay', 101, 2),
+    ('my', 101, 2),
+    ('thuat', 101, 4),
+    ('ki', 101, 2),
+    ('kinh', 101, 2),
+    ('doanh', 101, 2),
+    ('hoa', 101, 2),
+    ('chat', 101, 2),
+    ('may', 101, 3),
+    ('moc', 101, 2),
+    ('bi', 101, 4),
+    ('san', 101, 2),
+    ('xuat', 101, 2),
+    ('cac', 101, 1),
+    ('chuan', 101, 1),
+    ('do', 101, 1),
+    ('dat', 101, 1),
+    ('nung', 101, 1),
+    ('ve', 101, 1),
+    ('sinh', 101, 1),
+    ('gach', 101, 1),
+    ('ngoi', 101, 1),
+    ('mai', 101, 1),
+    ('bang', 101, 2),
+    ('tay', 101, 1),
+    ('hoac', 101, 1),
+    ('tho', 102, 27),
+    ('ve', 102, 16),
+    ('bien', 102, 14),
+    ('quang', 102, 11),
+    ('cao', 102, 11),
+    ('trang', 102, 17),
+    ('tri', 102, 18),
+    ('va', 102, 17),
+    ('co', 102, 10),
+    ('lien', 102, 9),
+    ('quan', 102, 9),
+    ('hinh', 102, 4),
+    ('hoc', 102, 4),
+    ('mau', 102, 8),
+    ('sac', 102, 4),
+    ('thiet', 102, 4),
+    ('ke', 102, 6),
+    ('bao', 102, 2),
+    ('son', 102, 5),
+    ('noi', 102, 2),
+    ('ngoai', 102, 2),
+    ('that', 102, 2),
+    ('nha', 102, 2),
+    ('o', 102, 2),
+    ('cua', 102, 2),
+    ('hang', 102, 2),
+    ('cong', 102, 2),
+    ('trinh', 102, 2),
+    ('xay', 102, 2),
+    ('dung', 102, 2),
+    ('tren', 102, 3),
+    ('san', 102, 3),
+    ('pham', 102, 3),
+    ('cac', 102, 8),
+    ('duoc', 102, 1),
+    ('lam', 102, 1),
+    ('tu', 102, 2),
+    ('go', 102, 1),
+    ('kim', 102, 1),
+    ('loai', 102, 1),
+    ('vai', 102, 1),
+    ('det', 102, 1),
+    ('thuy', 102, 2),
+    ('tinh', 102, 3),
+    ('gom', 102, 1),
+    ('nguyen', 102, 1),
+    ('vat', 102, 1),
+    ('lieu', 102, 1),
+    ('khac', 102, 3),
+    ('ho', 102, 1),
+    ('bo', 102, 1),
+    ('chu', 102, 1),
+    ('viet', 102, 1),
+    ('long', 102, 1),
+    ('nhau', 102, 1),
+    ('kieu', 102, 1),
+    ('de', 102, 1),
+    ('tao', 102, 1),
+    ('ra', 102, 1),
+    ('hieu', 102, 1),
+    ('cham', 102, 1),
+    ('tro', 102, 1),
+    ('axit', 102, 1),
+    ('chat', 102, 1),
+    ('do', 102, 1),
+    ('tho', 103, 10),
+    ('thu', 103, 12),
+    ('cong', 103, 13),
+    ('trong', 103, 10),
+    ('nganh', 103, 10),
+    ('do', 103, 14),
+    ('go', 103, 16),
+    ('va', 103, 18),
+    ('trang', 103, 14),
+    ('tri', 103, 14),
+    ('noi', 103, 11),
+    ('that', 103, 11),
+    ('hinh', 103, 4),
+    ('hoc', 103, 4),
+    ('mau', 103, 4),
+    ('sac', 103, 4),
+    ('thiet', 103, 6),
+    ('ke', 103, 4),
+    ('so', 103, 2),
+    ('che', 103, 2),
+    ('xu', 103, 4),
+    ('li', 103, 4),
+    ('vat', 103, 8),
+    ('lieu', 103, 8),
+    ('tu', 103, 4),
+    ('nhien', 103, 2),
+    ('tre', 103, 3),
+    ('nua', 103, 4),
+    ('song', 103, 3),
+    ('may', 103, 5),
+    ('coi', 103, 3),
+    ('lac', 103, 2),
+    ('beo', 103, 2),
+    ('chuyen', 103, 6),
+    ('sau', 103, 6),
+    ('theo', 103, 6),
+    ('loai', 103, 6),
+    ('da', 103, 4),
+    ('kim', 103, 2),
+    ('dat', 103, 6),
+    ('set', 103, 3),
+    ('thuy', 103, 4),
+    ('tinh', 103, 4),
+    ('dan', 103, 4),
+    ('son', 103, 2),
+    ('mai', 103, 3),
+    ('kham', 103, 2),
+    ('trai', 103, 2),
+    ('ki', 103, 3),
+    ('thuat', 103, 3),
+    ('moc', 103, 4),
+    ('duc', 103, 2),
+    ('cham', 103, 2),
+    ('khac', 103, 4),
+    ('san', 103, 5),
+    ('pham', 103, 4),
+    ('ban', 103, 2),
+    ('ghe', 103, 2),
+    ('giuong', 103, 2),
+    ('binh', 103, 2),
+    ('gio', 103, 2),
+    ('dia', 103, 2),
+    ('tui', 103, 2),
+    ('hop', 103, 2),
+    ('tranh', 103, 2),
+    ('tuong', 103, 2),
+    ('ap', 103, 2),
+    ('dung', 103, 4),
+    ('cac', 103, 4),
+    ('truyen', 103, 1),
+    ('thong', 103, 1),
+    ('de', 103, 2),
+    ('vo', 103, 1),
+    ('long', 103, 1),
+    ('dong', 103, 1),
+    ('cat', 103, 1),
+    ('thach', 103, 1),
+    ('anh', 103, 1),
+    ('nguyen', 103, 1),
+    ('phu', 103, 1),
+    ('xuat', 103, 1),
+    ('hoan', 103, 1),
+    ('thien', 103, 1),
+    ('ngoai', 103, 1),
+    ('gia', 103, 2),
+    ('nhau', 103, 1),
+    ('ho', 103, 2),
+    ('cung', 103, 2),
+    ('co', 103, 1),
+    ('the', 103, 1),
+    ('tham', 103, 1),
+    ('lap', 103, 1),
+    ('van', 103, 1),
+    ('hanh', 103, 1),
+    ('bao', 103, 1),
+    ('duong', 103, 1),
+    ('bi', 103, 2),
+    ('ngay', 103, 1),
+    ('nay', 103, 1),
+    ('duoc', 103, 1),
+    ('nhieu', 103, 1),
+    ('tro', 103, 1),
+    ('cho', 103, 1),
+    ('lam', 103, 2),
+    ('ra', 103, 1),
+    ('dep', 103, 1),
+    ('chinh', 103, 1),
+    ('xac', 103, 1),
+    ('hieu', 103, 1),
+    ('qua', 103, 1),
+    ('hon', 103, 1),
+    ('khong', 103, 1),
+    ('phai', 103, 1),
+    ('doan', 103, 1),
+    ('nao', 103, 1),
+    ('tho', 104, 9),
+    ('thu', 104, 17),
+    ('cong', 104, 21),
+    ('trong', 104, 10),
+    ('nganh', 104, 9),
+    ('det', 104, 14),
+    ('may', 104, 18),
+    ('va', 104, 19),
+    ('da', 104, 20),
+    ('giay', 104, 17),
+    ('hinh', 104, 4),
+    ('hoc', 104, 4),
+    ('mau', 104, 4),
+    ('sac', 104, 4),
+    ('thiet', 104, 4),
+    ('ke', 104, 4),
+    ('cac', 104, 7),
+    ('doan', 104, 4),
+    ('san', 104, 16),
+    ('xuat', 104, 7),
+    ('pham', 104, 9),
+    ('thuoc', 104, 2),
+    ('dong', 104, 2),
+    ('do', 104, 9),
+    ('soi', 104, 4),
+    ('vai', 104, 3),
+    ('xe', 104, 2),
+    ('nhuom', 104, 2),
+    ('theu', 104, 5),
+    ('dan', 104, 5),
+    ('moc', 104, 2),
+    ('bo', 104, 2),
+    ('de', 104, 3),
+    ('cat', 104, 2),
+    ('loai', 104, 2),
+    ('tham', 104, 2),
+    ('tranh', 104, 2),
+    ('gia', 104, 3),
+    ('dung', 104, 4),
+    ('mac', 104, 3),
+    ('phu', 104, 3),
+    ('kien', 104, 3),
+    ('ap', 104, 1),
+    ('ki', 104, 2),
+    ('thuat', 104, 2),
+    ('hoa', 104, 1),
+    ('van', 104, 1),
+    ('truyen', 104, 1),
+    ('thong', 104, 1),
+    ('chi', 104, 1),
+    ('tiet', 104, 1),
+    ('dap', 104, 1),
+    ('noi', 104, 1),
+    ('khac', 104, 1),
+    ('nhu', 104, 1),
+    ('quan', 104, 1),
+    ('ao', 104, 1),
+    ('dep', 104, 1),
+    ('tui', 104, 1),
+    ('xach', 104, 1),
+    ('that', 104, 1),
+    ('lung', 104, 1),
+    ('trang', 104, 1),
+    ('tri', 104, 1),
+    ('tho', 105, 9),
+    ('van', 105, 10),
+    ('hanh', 105, 10),
+    ('may', 105, 27),
+    ('san', 105, 27),
+    ('xuat', 105, 16),
+    ('hang', 105, 10),
+    ('det', 105, 14),
+    ('va', 105, 24),
+    ('da', 105, 23),
+    ('giay', 105, 20),
+    ('hinh', 105, 4),
+    ('hoc', 105, 4),
+    ('mau', 105, 4),
+    ('sac', 105, 4),
+    ('thiet', 105, 5),
+    ('ke', 105, 4),
+    ('cac', 105, 11),
+    ('cong', 105, 7),
+    ('doan', 105, 4),
+    ('pham', 105, 11),
+    ('thuoc', 105, 2),
+    ('dong', 105, 3),
+    ('do', 105, 7),
+    ('soi', 105, 5),
+    ('vai', 105, 3),
+    ('mac', 105, 3),
+    ('xe', 105, 2),
+    ('nhuom', 105, 2),
+    ('theu', 105, 2),
+    ('moc', 105, 3),
+    ('bo', 105, 2),
+    ('de', 105, 2),
+    ('cat', 105, 2),
+    ('loai', 105, 6),
+    ('nghiep', 105, 2),
+    ('jacket', 105, 2),
+    ('so', 105, 2),
+    ('mi', 105, 2),
+    ('veston', 105, 2),
+    ('lot', 105, 2),
+    ('the', 105, 4),
+    ('thao', 105, 4),
+    ('quan', 105, 2),
+    ('ao', 105, 2),
+    ('tre', 105, 2),
+    ('em', 105, 2),
+    ('tat', 105, 2),
+    ('li', 105, 3),
+    ('tui', 105, 2),
+    ('xach', 105, 2),
+    ('phu', 105, 3),
+    ('kien', 105, 3),
+    ('thoi', 105, 2),
+    ('trang', 105, 2),
+    ('lam', 105, 2),
+    ('viec', 105, 1),
+    ('giam', 105, 1),
+    ('sat', 105, 1),
+    ('hoat', 105, 1),
+    ('cua', 105, 1),
+    ('bi', 105, 1),
+    ('che', 105, 1),
+    ('bien', 105, 1),
+    ('xu', 105, 1),
+    ('long', 105, 2),
+    ('thu', 105, 1),
+    ('hoan', 105, 1),
+    ('thien', 105, 1),
+    ('dep', 105, 1),
+    ('sua', 105, 1),
+    ('chua', 105, 1),
+    ('giat', 105, 1),
+    ('la', 105, 1),
+    ('sach', 105, 1),
+    ('bac', 106, 9),
+    ('si', 106, 9),
+    ('thinh', 106, 13),
+    ('hoc', 106, 19),
+    ('va', 106, 16),
+    ('dac', 106, 9),
+    ('tri', 106, 9),
+    ('cac', 106, 11),
+    ('khuyet', 106, 10),
+    ('tat', 106, 10),
+    ('ve', 106, 9),
+    ('ngon', 106, 13),
+    ('ngu', 106, 13),
+    ('lam', 106, 6),
+    ('viec', 106, 4),
+    ('voi', 106, 4),
+    ('con', 106, 5),
+    ('nguoi', 106, 5),
+    ('thiet', 106, 2),
+    ('bi', 106, 2),
+    ('khuech', 106, 2),
+    ('dai', 106, 2),
+    ('am', 106, 2),
+    ('thanh', 106, 2),
+    ('sang', 106, 2),
+    ('tam', 106, 4),
+    ('li', 106, 4),
+    ('chan', 106, 4),
+    ('doan', 106, 4),
+    ('roi', 106, 4),
+    ('loan', 106, 4),
+    ('tinh', 106, 2),
+    ('luu', 106, 2),
+    ('loat', 106, 2),
+    ('nhi', 106, 2),
+    ('khoa', 106, 2),
+    ('nghien', 106, 2),
+    ('cuu', 106, 2),
+    ('lieu', 106, 3),
+    ('phap', 106, 3),
+    ('loi', 106, 2),
+    ('noi', 106, 5),
+    ('giong', 106, 2),
+    ('xac', 106, 1),
+    ('dinh', 106, 2),
+    ('loai', 106, 1),
+    ('muc', 106, 1),
+    ('do', 106, 1),
+    ('anh', 106, 1),
+    ('huong', 106, 1),
+    ('den', 106, 1),
+    ('chuc', 106, 2),
+    ('nang', 106, 2),
+    ('nghe', 106, 1),
+    ('giao', 106, 1),
+    ('tiep', 106, 1),
+    ('nhai', 106, 1),
+    ('nuot', 106, 1),
+    ('cua', 106, 1),
+    ('ho', 106, 2),
+    ('chi', 106, 1),
+    ('phuong', 106, 1),
+    ('tien', 106, 1),
+    ('tro', 106, 1),
+    ('thuc', 106, 1),
+    ('hien', 106, 1),
+    ('phuc', 106, 1),
+    ('hoi', 106, 1),
+    ('tu', 106, 1),
+    ('van', 106, 1),
+    ('cho', 106, 1),
+    ('benh', 106, 1),
+    ('nhan', 106, 1),
+    ('bac', 107, 9),
+    ('si', 107, 9),
+    ('y', 107, 9),
+    ('khoa', 107, 23),
+    ('lam', 107, 5),
+    ('viec', 107, 4),
+    ('voi', 107, 4),
+    ('con', 107, 4),
+    ('nguoi', 107, 5),
+    ('chu', 107, 2),
+    ('yeu', 107, 2),
+    ('lien', 107, 2),
+    ('quan', 107, 2),
+    ('den', 107, 2),
+    ('cac', 107, 5),
+    ('chuyen', 107, 5),
+    ('ca', 107, 2),
+    ('ve', 107, 2),
+    ('noi', 107, 4),
+    ('dieu', 107, 2),
+    ('tri', 107, 2),
+    ('bang', 107, 2),
+    ('thuoc', 107, 2),
+    ('va', 107, 9),
+    ('ngoai', 107, 2),
+    ('mo', 107, 2),
+    ('nganh', 107, 2),
+    ('khac', 107, 3),
+    ('nhu', 107, 2),
+    ('da', 107, 2),
+    ('lieu', 107, 2),
+    ('tai', 107, 3),
+    ('mui', 107, 2),
+    ('hong', 107, 2),
+    ('tiet', 107, 2),
+    ('tim', 107, 2),
+    ('mach', 107, 2),
+    ('tieu', 107, 2),
+    ('hoa', 107, 2),
+    ('than', 107, 4),
+    ('kinh', 107, 2),
+    ('tam', 107, 2),
+    ('nhan', 107, 2),
+    ('san', 107, 2),
+    ('nhi', 107, 2),
+    ('lao', 107, 2),
+    ('kham', 107, 2),
+    ('chua', 107, 2),
+    ('benh', 107, 3),
+    ('cho', 107, 1),
+    ('nhung', 107, 1),
+    ('bi', 107, 1),
+    ('om', 107, 1),
+    ('tat', 107, 2),
+    ('hoac', 107, 1),
+    ('nan', 107, 1),
+    ('thuong', 107, 1),
+    ('ho', 107, 1),
+    ('cung', 107, 1),
+    ('tien', 107, 2),
+    ('hanh', 107, 1),
+    ('nghien', 107, 1),
+    ('cuu', 107, 1),
+    ('cai', 107, 1),
+    ('phat', 107, 1),
+    ('trien', 107, 1),
+    ('khai', 107, 1),
+    ('niem', 107, 1),
+    ('li', 107, 1),
+    ('thuyet', 107, 1),
+    ('phuong', 107, 1),
+    ('phap', 107, 1),
+    ('phong', 107, 1),
+    ('cong', 107, 1),
+    ('tac', 107, 1),
+    ('giang', 107, 1),
+    ('day', 107, 1),
+    ('mon', 107, 1),
+    ('tuyen', 107, 1),
+    ('truyen', 107, 1),
+    ('giao', 107, 1),
+    ('duc', 107, 1),
+    ('suc', 107, 1),
+    ('khoe', 107, 1),
+    ('bac', 108, 11),
+    ('si', 108, 11),
+    ('y', 108, 15),
+    ('hoc', 108, 15),
+    ('co', 108, 15),
+    ('truyen', 108, 14),
+    ('lam', 108, 4),
+    ('viec', 108, 4),
+    ('voi', 108, 4),
+    ('con', 108, 4),
+    ('nguoi', 108, 4),
+    ('bao', 108, 2),
+    ('che', 108, 2),
+    ('thuoc', 108, 3),
+    ('cham', 108, 2),
+    ('cuu', 108, 3),
+    ('kham', 108, 1),
+    ('dieu', 108, 1),
+    ('tri', 108, 2),
+    ('phong', 108, 1),
+    ('ngua', 108, 1),
+    ('benh', 108, 3),
+    ('tat', 108, 1),
+    ('va', 108, 6),
+    ('chan', 108, 1),
+    ('thuong', 108, 1),
+    ('lien', 108, 1),
+    ('quan', 108, 1),
+    ('den', 108, 1),
+    ('cac', 108, 3),
+    ('the', 108, 1),
+    ('chat', 108, 1),
+    ('tinh', 108, 1),
+    ('than', 108, 1),
+    ('cho', 108, 1),
+    ('nhan', 108, 1),
+    ('bang', 108, 1),
+    ('phuong', 108, 1),
+    ('phap', 108, 1),
+    ('ho', 108, 1),
+    ('ap', 108, 1),
+    ('dung', 108, 1),
+    ('kien', 108, 1),
+    ('thuc', 108, 2),
+    ('ki', 108, 1),
+    ('nang', 108, 1),
+    ('hanh', 108, 1),
+    ('duoc', 108, 1),
+    ('thong', 108, 1),
+    ('qua', 108, 1),
+    ('nghien', 108, 1),
+    ('sau', 108, 1),
+    ('rong', 108, 1),
+    ('li', 108, 1),
+    ('thuyet', 108, 1),
+    ('niem', 108, 1),
+    ('tin', 108, 1),
+    ('gia', 108, 1),
+    ('bat', 108, 1),
+    ('nguon', 108, 1),
+    ('tu', 108, 1),
+    ('nen', 108, 1),
+    ('van', 108, 1),
+    ('hoa', 108, 1),
+    ('dan', 108, 1),
+    ('toc', 108, 1),
+    ('ban', 108, 1),
+    ('dia', 108, 1),
+    ('chuyen', 109, 13),
+    ('gia', 109, 12),
+    ('dich', 109, 10),
+    ('vu', 109, 9),
+    ('phap', 109, 13),
+    ('li', 109, 14),
+    ('lam', 109, 4),
+    ('viec', 109, 4),
+    ('voi', 109, 4),
+    ('con', 109, 5),
+    ('nguoi', 109, 5),
+    ('cong', 109, 2),
+    ('chung', 109, 2),
+    ('thanh', 109, 2),
+    ('tra', 109, 2),
+    ('goi', 109, 1),
+    ('la', 109, 1),
+    ('thu', 109, 2),
+    ('ki', 109, 1),
+    ('luat', 109, 2),
+    ('su', 109, 2),
+    ('dung', 109, 1),
+    ('kien', 109, 1),
+    ('thuc', 109, 1),
+    ('mon', 109, 1),
+    ('de', 109, 2),
+    ('tro', 109, 4),
+    ('giup', 109, 1),
+    ('cac', 109, 9),
+    ('trong', 109, 2),
+    ('thong', 109, 1),
+    ('tin', 109, 1),
+    ('lien', 109, 3),
+    ('lac', 109, 1),
+    ('tai', 109, 2),
+    ('lieu', 109, 1),
+    ('ho', 109, 4),
+    ('noi', 109, 2),
+    ('bo', 109, 2),
+    ('tuc', 109, 1),
+    ('va', 109, 3),
+    ('hoat', 109, 1),
+    ('dong', 109, 2),
+    ('phoi', 109, 1),
+    ('hop', 109, 2),
+    ('quan', 109, 5),
+    ('van', 109, 2),
+    ('phong', 109, 1),
+    ('ban', 109, 1),
+    ('che', 109, 1),
+    ('cua', 109, 1),
+    ('doanh', 109, 1),
+    ('nghiep', 109, 1),
+    ('lon', 109, 1),
+    ('co', 109, 4),
+    ('nha', 109, 2),
+    ('nuoc', 109, 1),
+    ('cung', 109, 1),
+    ('the', 109, 1),
+    ('kinh', 109, 1),
+    ('te', 109, 1),
+    ('den', 109, 2),
+    ('bao', 109, 2),
+    ('gom', 109, 1),
+    ('ca', 109, 1),
+    ('nhung', 109, 1),
+    ('hiem', 109, 1),
+    ('cho', 109, 1),
+    ('vay', 109, 1),
+    ('von', 109, 1),
+    ('giao', 109, 1),
+    ('chinh', 109, 1),
+    ('khac', 109, 1),
+    ('chuyen', 110, 9),
+    ('gia', 110, 9),
+    ('dinh', 110, 15),
+    ('duong', 110, 15),
+    ('lam', 110, 6),
+    ('viec', 110, 5),
+    ('voi', 110, 4),
+    ('con', 110, 4),
+    ('nguoi', 110, 4),
+    ('sang', 110, 2),
+    ('giao', 110, 2),
+    ('duc', 110, 2),
+    ('quan', 110, 3),
+    ('li', 110, 2),
+    ('benh', 110, 2),
+    ('vien', 110, 2),
+    ('cho', 110, 3),
+    ('the', 110, 2),
+    ('thao', 110, 2),
+    ('tien', 110, 2),
+    ('hanh', 110, 1),
+    ('nghien', 110, 1),
+    ('cuu', 110, 1),
+    ('cai', 110, 1),
+    ('va', 110, 2),
+    ('phat', 110, 1),
+    ('trien', 110, 1),
+    ('cac', 110, 3),
+    ('khai', 110, 1),
+    ('niem', 110, 1),
+    ('phuong', 110, 1),
+    ('phap', 110, 1),
+    ('thuc', 110, 1),
+    ('hien', 110, 1),
+    ('lien', 110, 1),
+    ('den', 110, 1),
+    ('chuan', 110, 1),
+    ('bi', 110, 1),
+    ('ap', 110, 1),
+    ('dung', 110, 1),
+    ('che', 110, 1),
+    ('do', 110, 1),
+    ('an', 110, 1),
+    ('uong', 110, 1),
+    ('dieu', 110, 1),
+    ('tri', 110, 1),
+    ('muc', 110, 1),
+    ('dich', 110, 1),
+    ('khac', 110, 1),
+    ('chuyen', 111, 11),
+    ('gia', 111, 11),
+    ('phat', 111, 16),
+    ('trien', 111, 16),
+    ('lam', 111, 4),
+    ('viec', 111, 4),
+    ('voi', 111, 5),
+    ('con', 111, 4),
+    ('nguoi', 111, 4),
+    ('quan', 111, 5),
+    ('li', 111, 6),
+    ('cai', 111, 2),
+    ('cach', 111, 2),
+    ('the', 111, 6),
+    ('che', 111, 2),
+    ('xay', 111, 3),
+    ('dung', 111, 4),
+    ('du', 111, 3),
+    ('an', 111, 2),
+    ('cac', 111, 6),
+    ('chuong', 111, 2),
+    ('trinh', 111, 2),
+    ('sinh', 111, 2),
+    ('ke', 111, 2),
+    ('ben', 111, 2),
+    ('vung', 111, 2),
+    ('to', 111, 2),
+    ('chuc', 111, 2),
+    ('phi', 111, 2),
+    ('chinh', 111, 2),
+    ('phu', 111, 2),
+    ('day', 111, 1),
+    ('la', 111, 1),
+    ('mot', 111, 7),
+    ('linh', 111, 2),
+    ('vuc', 111, 2),
+    ('lien', 111, 2),
+    ('nganh', 111, 1),
+    ('tap', 111, 1),
+    ('trung', 111, 1),
+    ('vao', 111, 1),
+    ('van', 111, 1),
+    ('de', 111, 3),
+    ('den', 111, 1),
+    ('kinh', 111, 1),
+    ('te', 111, 1),
+    ('va', 111, 1),
+    ('xa', 111, 1),
+    ('hoi', 111, 2),
+    ('duoc', 111, 1),
+    ('dao', 111, 2),
+    ('tao', 111, 1),
+    ('ung', 111, 1),
+    ('mon', 111, 1),
+    ('trong', 111, 1),
+    ('cu', 111, 1),
+    ('dong', 111, 1),
+    ('nhan', 111, 1),
+    ('dan', 111, 1),
+    ('giup', 111, 4),
+    ('dat', 111, 2),
+    ('nuoc', 111, 2),
+    ('vi', 111, 1),
+    ('nhu', 111, 1),
+    ('tam', 111, 2),
+    ('co', 111, 3),
+    ('tre', 111, 1),
+    ('em', 111, 1),
+    ('cua', 111, 1),
+    ('phuc', 111, 1),
+    ('sau', 111, 1),
+    ('chien', 111, 1),
+    ('tranh', 111, 1),
+    ('tuong', 111, 1),
+    ('tu', 111, 1),
+    ('ki', 111, 1),
+    ('su', 111, 2),
+    ('quoc', 111, 1),
+    ('mang', 111, 1),
+    ('luoi', 111, 1),
+    ('duong', 111, 1),
+    ('giao', 111, 1),
+    ('thong', 111, 1),
+    ('moi', 111, 2),
+    ('hoac', 111, 1),
+    ('luat', 111, 1),
+    ('soan', 111, 1),
+    ('thao', 111, 1),
+    ('hien', 111, 1),
+    ('phap', 111, 1),
+    ('chuyen', 112, 9),
+    ('gia', 112, 10),
+    ('phuc', 112, 14),
+    ('hoi', 112, 14),
+    ('chuc', 112, 11),
+    ('nang', 112, 11),
+    ('nghe', 112, 11),
+    ('nghiep', 112, 11),
+    ('lam', 112, 5),
+    ('viec', 112, 5),
+    ('voi', 112, 4),
+    ('con', 112, 4),
+    ('nguoi', 112, 4),
+    ('lao', 112, 2),
+    ('khoa', 112, 4),
+    ('suc', 112, 2),
+    ('khoe', 112, 2),
+    ('tam', 112, 2),
+    ('than', 112, 4),
+    ('co', 112, 2),
+    ('xuong', 112, 2),
+    ('kinh', 112, 2),
+    ('hoc', 112, 2),
+    ('nhi', 112, 2),
+    ('the', 112, 3),
+    ('chat', 112, 2),
+    ('giup', 112, 1),
+    ('do', 112, 1),
+    ('benh', 112, 2),
+    ('nhan', 112, 1),
+    ('trong', 112, 1),
+    ('qua', 112, 1),
+    ('trinh', 112, 1),
+    ('sau', 112, 1),
+    ('khi', 112, 1),
+    ('bi', 112, 1),
+    ('hoac', 112, 2),
+    ('tai', 112, 1),
+    ('nan', 112, 1),
+    ('bang', 112, 1),
+    ('cach', 112, 1),
+    ('dua', 112, 1),
+    ('ho', 112, 1),
+    ('tham', 112, 1),
+    ('cac', 112, 1),
+    ('cong', 112, 2),
+    ('mang', 112, 1),
+    ('tinh', 112, 1),
+    ('sang', 112, 1),
+    ('tao', 112, 1),
+    ('thu', 112, 1),
+    ('nhu', 112, 1),
+    ('vuon', 112, 1),
+    ('tap', 112, 1),
+    ('duc', 112, 1),
+    ('tro', 112, 1),
+    ('choi', 112, 1),
+    ('va', 112, 1),
+    ('am', 112, 1),
+    ('nhac', 112, 1),
+    ('theo', 112, 1),
+    ('huong', 112, 1),
+    ('dan', 112, 1),
+    ('cua', 112, 1),
+    ('bac', 112, 1),
+    ('si', 112, 1),
+    ('chuyen', 113, 9),
+    ('gia', 113, 9),
+    ('quan', 113, 16),
+    ('ly', 113, 8),
+    ('do', 113, 18),
+    ('thi', 113, 18),
+    ('lam', 113, 4),
+    ('viec', 113, 6),
+    ('voi', 113, 4),
+    ('con', 113, 5),
+    ('nguoi', 113, 4),
+    ('li', 113, 6),
+    ('giao', 113, 3),
+    ('thong', 113, 4),
+    ('moi', 113, 3),
+    ('truong', 113, 3),
+    ('xay', 113, 1),
+    ('dung', 113, 2),
+    ('va', 113, 3),
+    ('trien', 113, 2),
+    ('khai', 113, 1),
+    ('cac', 113, 2),
+    ('ke', 113, 4),
+    ('hoach', 113, 1),
+    ('chien', 113, 2),
+    ('luoc', 113, 2),
+    ('lien', 113, 2),
+    ('den', 113, 1),
+    ('su', 113, 2),
+    ('dat', 113, 1),
+    ('thiet', 113, 2),
+    ('ca', 113, 1),
+    ('he', 113, 1),
+    ('huong', 113, 1),
+    ('dan', 113, 2),
+    ('dam', 113, 1),
+    ('bao', 113, 1),
+    ('phat', 113, 1),
+    ('co', 113, 1),
+    ('trat', 113, 1),
+    ('tu', 113, 2),
+    ('o', 113, 1),
+    ('khu', 113, 1),
+    ('cu', 113, 1),
+    ('cong', 113, 3),
+    ('dong', 113, 2),
+    ('toi', 113, 1),
+    ('nghien', 113, 1),
+    ('cuu', 113, 1),
+    ('phan', 113, 1),
+    ('tich', 113, 1),
+    ('duy', 113, 1),
+    ('kien', 113, 1),
+    ('truc', 113, 1),
+    ('tham', 113, 1),
+    ('van', 113, 1),
+    ('khuyen', 113, 1),
+    ('nghi', 113, 1),
+    ('chinh', 113, 1),
+    ('sach', 113, 1),
+    ('thuc', 113, 1),
+    ('hien', 113, 1),
+    ('chuyen', 114, 9),
+    ('gia', 114, 9),
+    ('quan', 114, 14),
+    ('tri', 114, 9),
+    ('bat', 114, 13),
+    ('dong', 114, 13),
+    ('san', 114, 15),
+    ('lam', 114, 4),
+    ('viec', 114, 5),
+    ('voi', 114, 4),
+    ('con', 114, 5),
+    ('nguoi', 114, 4),
+    ('li', 114, 6),
+    ('kinh', 114, 2),
+    ('doanh', 114, 2),
+    ('nha', 114, 2),
+    ('va', 114, 4),
+    ('dat', 114, 2),
+    ('goi', 114, 1),
+    ('la', 114, 1),
+    ('dai', 114, 1),
+    ('tai', 114, 2),
+    ('thay', 114, 1),
+    ('mat', 114, 1),
+    ('khach', 114, 1),
+    ('hang', 114, 1),
+    ('sap', 114, 1),
+    ('xep', 114, 1),
+    ('mua', 114, 1),
+    ('ban', 114, 1),
+    ('cho', 114, 1),
+    ('thue', 114, 1),
+    ('huong', 114, 1),
+    ('loi', 114, 1),
+    ('tren', 114, 1),
+    ('co', 114, 1),
+    ('so', 114, 1),
+    ('nhan', 114, 1),
+    ('hoa', 114, 1),
+    ('hong', 114, 1),
+    ('tu', 114, 1),
+    ('cac', 114, 1),
+    ('thuong', 114, 1),
+    ('vu', 114, 1),
+    ('thuc', 114, 1),
+    ('hien', 114, 1),
+    ('duoc', 114, 1),
+    ('chuyen', 115, 10),
+    ('gia', 115, 10),
+    ('quan', 115, 12),
+    ('tri', 115, 9),
+    ('doanh', 115, 19),
+    ('nghiep', 115, 18),
+    ('nho', 115, 12),
+    ('va', 115, 16),
+    ('vua', 115, 12),
+    ('lam', 115, 4),
+    ('viec', 115, 5),
+    ('voi', 115, 4),
+    ('con', 115, 4),
+    ('nguoi', 115, 7),
+    ('li', 115, 3),
+    ('dnnvv', 115, 4),
+    ('la', 115, 4),
+    ('trong', 115, 4),
+    ('thanh', 115, 1),
+    ('lap', 115, 1),
+    ('phat', 115, 1),
+    ('trien', 115, 1),
+    ('hoac', 115, 4),
+    ('truc', 115, 1),
+    ('tiep', 115, 1),
+    ('moi', 115, 1),
+    ('mat', 115, 1),
+    ('hoat', 115, 1),
+    ('dong', 115, 6),
+    ('san', 115, 1),
+    ('xuat', 115, 1),
+    ('kinh', 115, 2),
+    ('cua', 115, 1),
+    ('cac', 115, 3),
+    ('co', 115, 3),
+    ('von', 115, 3),
+    ('so', 115, 4),
+    ('lao', 115, 4),
+    ('khong', 115, 5),
+    ('vuot', 115, 5),
+    ('qua', 115, 5),
+    ('mot', 115, 1),
+    ('luong', 115, 3),
+    ('nhat', 115, 1),
+    ('dinh', 115, 1),
+    ('tai', 115, 1),
+    ('viet', 115, 1),
+    ('nam', 115, 1),
+    ('tong', 115, 3),
+    ('nguon', 115, 2),
+    ('50', 115, 1),
+    ('ti', 115, 2),
+    ('100', 115, 2),
+    ('linh', 115, 3),
+    ('vuc', 115, 3),
+    ('thuong', 115, 2),
+    ('mai', 115, 1),
+    ('dich', 115, 1),
+    ('vu', 115, 1),
+    ('300', 115, 1),
+    ('khac', 115, 1),
+    ('thi', 115, 2),
+    ('duoc', 115, 2),
+    ('goi', 115, 1),
+    ('nhieu', 115, 3),
+    ('hon', 115, 2),
+    ('lon', 115, 1),
+    ('tinh', 115, 1),
+    ('the', 115, 1),
+    ('dnnnv', 115, 1),
+    ('su', 115, 1),
+    ('dung', 115, 1),
+    ('cung', 115, 1),
+    ('coi', 115, 1),
+    ('dau', 115, 1),
+    ('tau', 115, 1),
+    ('sang', 115, 1),
+    ('tao', 115, 1),
+    ('canh', 115, 1),
+    ('tranh', 115, 1),
+    ('te', 115, 1),
+    ('chuyen', 116, 9),
+    ('gia', 116, 9),
+    ('quan', 116, 12),
+    ('tri', 116, 9),
+    ('kinh', 116, 10),
+    ('doanh', 116, 12),
+    ('nong', 116, 13),
+    ('nghiep', 116, 15),
+    ('lam', 116, 4),
+    ('viec', 116, 4),
+    ('voi', 116, 4),
+    ('con', 116, 4),
+    ('nguoi', 116, 6),
+    ('chu', 116, 2),
+    ('yeu', 116, 2),
+    ('theo', 116, 2),
+    ('cac', 116, 2),
+    ('loai', 116, 2),
+    ('san', 116, 4),
+    ('pham', 116, 5),
+    ('khac', 116, 2),
+    ('nhau', 116, 2),
+    ('nhu', 116, 3),
+    ('li', 116, 3),
+    ('luong', 116, 2),
+    ('thuc', 116, 4),
+    ('vat', 116, 2),
+    ('tu', 116, 2),
+    ('chan', 116, 2),
+    ('nuoi', 116, 2),
+    ('va', 116, 2),
+    ('thu', 116, 2),
+    ('y', 116, 2),
+    ('la', 116, 1),
+    ('nghien', 116, 1),
+    ('cuu', 116, 1),
+    ('to', 116, 1),
+    ('chuc', 116, 1),
+    ('trong', 116, 1),
+    ('linh', 116, 1),
+    ('vuc', 116, 1),
+    ('xuat', 116, 1),
+    ('cung', 116, 1),
+    ('dua', 116, 1),
+    ('den', 116, 1),
+    ('tay', 116, 1),
+    ('tieu', 116, 1),
+    ('dung', 116, 1),
+    ('chuyen', 117, 9),
+    ('gia', 117, 10),
+    ('vat', 117, 15),
+    ('li', 117, 15),
+    ('tri', 117, 16),
+    ('lieu', 117, 16),
+    ('lam', 117, 4),
+    ('viec', 117, 4),
+    ('voi', 117, 4),
+    ('con', 117, 4),
+    ('nguoi', 117, 7),
+    ('benh', 117, 4),
+    ('tim', 117, 2),
+    ('mach', 117, 2),
+    ('long', 117, 2),
+    ('nguc', 117, 2),
+    ('lao', 117, 2),
+    ('khoa', 117, 4),
+    ('phuc', 117, 3),
+    ('hoi', 117, 3),
+    ('chuc', 117, 2),
+    ('nang', 117, 2),
+    ('tay', 117, 2),
+    ('chinh', 117, 2),
+    ('hinh', 117, 2),
+    ('than', 117, 6),
+    ('kinh', 117, 5),
+    ('hoc', 117, 4),
+    ('nhi', 117, 2),
+    ('y', 117, 2),
+    ('the', 117, 2),
+    ('thao', 117, 2),
+    ('roi', 117, 3),
+    ('loan', 117, 3),
+    ('vi', 117, 2),
+    ('du', 117, 2),
+    ('dot', 117, 2),
+    ('qui', 117, 2),
+    ('ki', 117, 2),
+    ('thuat', 117, 3),
+    ('tien', 117, 1),
+    ('hanh', 117, 1),
+    ('cac', 117, 2),
+    ('ve', 117, 1),
+    ('xuong', 117, 1),
+    ('co', 117, 1),
+    ('va', 117, 2),
+    ('bo', 117, 1),
+    ('phan', 117, 1),
+    ('cua', 117, 2),
+    ('he', 117, 2),
+    ('tuan', 117, 1),
+    ('hoan', 117, 1),
+    ('hoac', 117, 2),
+    ('khach', 117, 1),
+    ('hang', 117, 1),
+    ('ho', 117, 1),
+    ('bao', 117, 1),
+    ('gom', 117, 1),
+    ('nhung', 117, 2),
+    ('khuyet', 117, 1),
+    ('tat', 117, 2),
+    ('bi', 117, 1),
+    ('tam', 117, 1),
+    ('dang', 117, 1),
+    ('sau', 117, 1),
+    ('thoi', 117, 1),
+    ('gian', 117, 1),
+    ('dai', 117, 1),
+    ('tai', 117, 1),
+    ('nan', 117, 1),
+    ('phau', 117, 1),
+    ('dai', 118, 9),
+    ('li', 118, 9),
+    ('bao', 118, 19),
+    ('hiem', 118, 19),
+    ('lam', 118, 4),
+    ('viec', 118, 4),
+    ('voi', 118, 4),
+    ('con', 118, 4),
+    ('nguoi', 118, 4),
+    ('tai', 118, 5),
+    ('nan', 118, 3),
+    ('o', 118, 3),
+    ('to', 118, 3),
+    ('thien', 118, 2),
+    ('tap', 118, 2),
+    ('doan', 118, 2),
+    ('y', 118, 2),
+    ('te', 118, 2),
+    ('nhan', 118, 3),
+    ('tho', 118, 3),
+    ('ban', 118, 1),
+    ('trach', 118, 1),
+    ('nhiem', 118, 1),
+    ('dan', 118, 1),
+    ('su', 118, 1),
+    ('hoa', 118, 1),
+    ('hoan', 118, 1),
+    ('hang', 118, 3),
+    ('hai', 118, 1),
+    ('va', 118, 2),
+    ('san', 118, 1),
+    ('pham', 118, 1),
+    ('khac', 118, 1),
+    ('cho', 118, 1),
+    ('cac', 118, 1),
+    ('khach', 118, 2),
+    ('moi', 118, 1),
+    ('hien', 118, 1),
+    ('huu', 118, 1),
+    ('dai', 119, 11),
+    ('li', 119, 13),
+    ('du', 119, 30),
+    ('lich', 119, 31),
+    ('va', 119, 11),
+    ('lu', 119, 9),
+    ('hanh', 119, 13),
+    ('lam', 119, 4),
+    ('viec', 119, 4),
+    ('voi', 119, 4),
+    ('con', 119, 4),
+    ('nguoi', 119, 4),
+    ('mao', 119, 2),
+    ('hiem', 119, 2),
+    ('sinh', 119, 2),
+    ('thai', 119, 2),
+    ('y', 119, 2),
+    ('te', 119, 2),
+    ('huong', 119, 2),
+    ('dan', 119, 2),
+    ('vien', 119, 2),
+    ('tiep', 119, 2),
+    ('thi', 119, 2),
+    ('quan', 119, 2),
+    ('dieu', 119, 2),
+    ('tour', 119, 4),
+    ('dat', 119, 2),
+    ('phong', 119, 2),
+    ('tien', 119, 1),
+    ('tu', 119, 1),
+    ('van', 119, 1),
+    ('to', 119, 2),
+    ('chuc', 119, 2),
+    ('lap', 119, 1),
+    ('ke', 119, 1),
+    ('hoach', 119, 1),
+    ('trinh', 119, 2),
+    ('di', 119, 1),
+    ('lai', 119, 1),
+    ('an', 119, 1),
+    ('nghi', 119, 1),
+    ('cho', 119, 2),
+    ('khach', 119, 2),
+    ('hoac', 119, 1),
+    ('ban', 119, 1),
+    ('tron', 119, 1),
+    ('goi', 119, 1),
+    ('y', 120, 24),
+    ('ta', 120, 24),
+    ('va', 120, 14),
+    ('ho', 120, 14),
+    ('sinh', 120, 14),
+    ('lam', 120, 4),
+    ('viec', 120, 5),
+    ('voi', 120, 4),
+    ('con', 120, 4),
+    ('nguoi', 120, 7),
+    ('cham', 120, 8),
+    ('soc', 120, 8),
+    ('dieu', 120, 2),
+    ('duong', 120, 2),
+    ('cao', 120, 2),
+    ('tuoi', 120, 2),
+    ('thai', 120, 2),
+    ('san', 120, 4),
+    ('suc', 120, 2),
+    ('khoe', 120, 2),
+    ('nghe', 120, 2),
+    ('nghiep', 120, 2),
+    ('cap', 120, 2),
+    ('cuu', 120, 2),
+    ('gay', 120, 2),
+    ('te', 120, 2),
+    ('khoa', 120, 4),
+    ('chinh', 120, 2),
+    ('hinh', 120, 2),
+    ('nhi', 120, 2),
+    ('tam', 120, 2),
+    ('than', 120, 2),
+    ('phau', 120, 2),
+    ('thuat', 120, 2),
+    ('tro', 120, 2),
+    ('cac', 120, 3),
+    ('bac', 120, 1),
+    ('si', 120, 1),
+    ('khi', 120, 2),
+    ('thuc', 120, 1),
+    ('hien', 120, 1),
+    ('nhiem', 120, 1),
+    ('vu', 120, 2),
+    ('phuc', 120, 1),
+    ('benh', 120, 1),
+    ('nhan', 120, 1),
+    ('bi', 120, 2),
+    ('om', 120, 1),
+    ('thuong', 120, 1),
+    ('hoac', 120, 1),
+    ('khuyet', 120, 1),
+    ('tat', 120, 1),
+    ('trong', 120, 2),
+    ('co', 120, 1),
+    ('la', 120, 1),
+    ('qua', 120, 1),
+    ('trinh', 120, 1),
+    ('no', 120, 1),
+    ('ba', 120, 2),
+    ('me', 120, 2),
+    ('tre', 120, 2),
+    ('em', 120, 1),
+    ('truoc', 120, 1),
+    ('sau', 120, 1),
+    ('huong', 120, 1),
+    ('dan', 120, 1),
+    ('gia', 120, 1),
+    ('dinh', 120, 1),
+    ('so', 120, 1),
+    ('nha', 121, 26),
+    ('si', 121, 10),
+    ('lam', 121, 4),
+    ('viec', 121, 4),
+    ('voi', 121, 4),
+    ('con', 121, 5),
+    ('nguoi', 121, 4),
+    ('khoa', 121, 11),
+    ('cong', 121, 2),
+    ('dong', 121, 2),
+    ('phau', 121, 4),
+    ('thuat', 121, 4),
+    ('va', 121, 6),
+    ('noi', 121, 2),
+    ('mieng', 121, 5),
+    ('ham', 121, 2),
+    ('mat', 121, 2),
+    ('benh', 121, 3),
+    ('rang', 121, 5),
+    ('chinh', 121, 2),
+    ('nhi', 121, 2),
+    ('tre', 121, 2),
+    ('em', 121, 2),
+    ('phong', 121, 2),
+    ('ngua', 121, 2),
+    ('chu', 121, 2),
+    ('phuc', 121, 2),
+    ('hinh', 121, 2),
+    ('cac', 121, 3),
+    ('goi', 121, 1),
+    ('la', 121, 1),
+    ('bac', 121, 1),
+    ('dieu', 121, 1),
+    ('tri', 121, 1),
+    ('roi', 121, 1),
+    ('loan', 121, 1),
+    ('nuou', 121, 1),
+    ('mo', 121, 1),
+    ('mem', 121, 1),
+    ('cua', 121, 1),
+    ('giao', 122, 18),
+    ('vien', 122, 13),
+    ('mam', 122, 15),
+    ('non', 122, 15),
+    ('lam', 122, 4),
+    ('viec', 122, 5),
+    ('voi', 122, 5),
+    ('con', 122, 5),
+    ('nguoi', 122, 5),
+    ('mot', 122, 5),
+    ('can', 122, 2),
+    ('dat', 122, 3),
+    ('duoc', 122, 2),
+    ('cac', 122, 7),
+    ('tieu', 122, 2),
+    ('chuan', 122, 2),
+    ('trong', 122, 3),
+    ('tat', 122, 2),
+    ('ca', 122, 2),
+    ('khia', 122, 2),
+    ('canh', 122, 2),
+    ('cua', 122, 4),
+    ('duc', 122, 5),
+    ('so', 122, 2),
+    ('chuyen', 122, 3),
+    ('ve', 122, 2),
+    ('linh', 122, 2),
+    ('vuc', 122, 2),
+    ('phat', 122, 2),
+    ('trien', 122, 2),
+    ('cu', 122, 2),
+    ('the', 122, 2),
+    ('tre', 122, 5),
+    ('nhu', 122, 2),
+    ('roi', 122, 2),
+    ('loan', 122, 2),
+    ('hoc', 122, 4),
+    ('dua', 122, 2),
+    ('vao', 122, 2),
+    ('cong', 122, 3),
+    ('dong', 122, 2),
+    ('dinh', 122, 2),
+    ('duong', 122, 2),
+    ('em', 122, 3),
+    ('tac', 122, 1),
+    ('giang', 122, 1),
+    ('day', 122, 3),
+    ('doi', 122, 2),
+    ('hoi', 122, 1),
+    ('mon', 122, 1),
+    ('theo', 122, 1),
+    ('nhom', 122, 1),
+    ('tuoi', 122, 2),
+    ('sinh', 122, 1),
+    ('tu', 122, 1),
+    ('3', 122, 1),
+    ('den', 122, 1),
+    ('6', 122, 1),
+    ('la', 122, 2),
+    ('giai', 122, 2),
+    ('doan', 122, 2),
+    ('nen', 122, 1),
+    ('mong', 122, 1),
+    ('cho', 122, 1),
+    ('tap', 122, 1),
+    ('va', 122, 1),
+    ('quan', 122, 1),
+    ('qua', 122, 1),
+    ('trinh', 122, 1),
+    ('giao', 123, 17),
+    ('vien', 123, 13),
+    ('tieu', 123, 13),
+    ('hoc', 123, 16),
+    ('lam', 123, 4),
+    ('viec', 123, 4),
+    ('voi', 123, 5),
+    ('con', 123, 4),
+    ('nguoi', 123, 4),
+    ('moi', 123, 2),
+    ('can', 123, 2),
+    ('dat', 123, 2),
+    ('yeu', 123, 5),
+    ('cau', 123, 4),
+    ('trong', 123, 2),
+    ('tat', 123, 2),
+    ('ca', 123, 2),
+    ('cac', 123, 6),
+    ('khia', 123, 4),
+    ('canh', 123, 4),
+    ('cua', 123, 4),
+    ('duc', 123, 4),
+    ('mot', 123, 4),
+    ('so', 123, 3),
+    ('chuyen', 123, 3),
+    ('ve', 123, 2),
+    ('phat', 123, 2),
+    ('trien', 123, 2),
+    ('cu', 123, 4),
+    ('the', 123, 5),
+    ('tre', 123, 5),
+    ('nhu', 123, 3),
+    ('tin', 123, 2),
+    ('cho', 123, 3),
+    ('co', 123, 3),
+    ('dac', 123, 2),
+    ('biet', 123, 2),
+    ('giang', 123, 3),
+    ('day', 123, 4),
+    ('chu', 123, 3),
+    ('de', 123, 2),
+    ('vi', 123, 2),
+    ('du', 123, 2),
+    ('ngon', 123, 2),
+    ('ngu', 123, 2),
+    ('cong', 123, 1),
+    ('tac', 123, 1),
+    ('doi', 123, 1),
+    ('hoi', 123, 2),
+    ('mon', 123, 1),
+    ('theo', 123, 1),
+    ('nhom', 123, 1),
+    ('tuoi', 123, 1),
+    ('sinh', 123, 1),
+    ('em', 123, 1),
+    ('tu', 123, 1),
+    ('lop', 123, 2),
+    ('1', 123, 1),
+    ('den', 123, 1),
+    ('5', 123, 1),
+    ('ho', 123, 1),
+    ('tap', 123, 1),
+    ('trung', 123, 1),
+    ('xay', 123, 1),
+    ('dung', 123, 1),
+    ('vung', 123, 1),
+    ('chac', 123, 1),
+    ('ki', 123, 2),
+    ('nang', 123, 2),
+    ('doc', 123, 1),
+    ('viet', 123, 1),
+    ('tinh', 123, 1),
+    ('toan', 123, 1),
+    ('cung', 123, 1),
+    ('khac', 123, 1),
+    ('chat', 123, 1),
+    ('tam', 123, 1),
+    ('li', 123, 1),
+    ('tri', 123, 1),
+    ('tue', 123, 1),
+    ('va', 123, 1),
+    ('xa', 123, 1),
+    ('giao', 124, 18),
+    ('vien', 124, 9),
+    ('duc', 124, 9),
+    ('dac', 124, 9),
+    ('biet', 124, 9),
+    ('lam', 124, 4),
+    ('viec', 124, 4),
+    ('voi', 124, 4),
+    ('con', 124, 4),
+    ('nguoi', 124, 6),
+    ('khiem', 124, 4),
+    ('thinh', 124, 2),
+    ('va', 124, 2),
+    ('khuyet', 124, 9),
+    ('tat', 124, 9),
+    ('loi', 124, 2),
+    ('noi', 124, 2),
+    ('ve', 124, 6),
+    ('tri', 124, 3),
+    ('tue', 124, 3),
+    ('than', 124, 2),
+    ('kinh', 124, 2),
+    ('van', 124, 2),
+    ('dong', 124, 2),
+    ('thi', 124, 2),
+    ('tu', 124, 2),
+    ('ki', 124, 2),
+    ('day', 124, 1),
+    ('cho', 124, 1),
+    ('tre', 124, 1),
+    ('em', 124, 1),
+    ('thanh', 124, 1),
+    ('thieu', 124, 1),
+    ('nien', 124, 1),
+    ('lon', 124, 1),
+    ('co', 124, 2),
+    ('the', 124, 1),
+    ('chat', 124, 1),
+    ('hay', 124, 1),
+    ('hoac', 124, 1),
+    ('nhung', 124, 1),
+    ('kho', 124, 1),
+    ('khan', 124, 1),
+    ('hoc', 124, 1),
+    ('tap', 124, 1),
+    ('quan', 125, 13),
+    ('li', 125, 13),
+    ('ban', 125, 11),
+    ('hang', 125, 13),
+    ('va', 125, 13),
+    ('marketing', 125, 9),
+    ('lam', 125, 4),
+    ('viec', 125, 4),
+    ('voi', 125, 5),
+    ('con', 125, 4),
+    ('nguoi', 125, 5),
+    ('quang', 125, 2),
+    ('cao', 125, 2),
+    ('nghien', 125, 4),
+    ('cuu', 125, 4),
+    ('hanh', 125, 2),
+    ('vi', 125, 2),
+    ('tieu', 125, 3),
+    ('dung', 125, 3),
+    ('thi', 125, 12),
+    ('truong', 125, 2),
+    ('tiep', 125, 10),
+    ('quoc', 125, 2),
+    ('te', 125, 2),
+    ('dich', 125, 2),
+    ('vu', 125, 2),
+    ('nong', 125, 2),
+    ('thon', 125, 2),
+    ('du', 125, 2),
+    ('lich', 125, 2),
+    ('thuong', 125, 2),
+    ('mai', 125, 2),
+    ('nha', 125, 2),
+    ('lap', 125, 1),
+    ('ke', 125, 1),
+    ('hoach', 125, 1),
+    ('chi', 125, 1),
+    ('dao', 125, 1),
+    ('dieu', 125, 1),
+    ('phoi', 125, 2),
+    ('he', 125, 1),
+    ('thong', 125, 1),
+    ('phan', 125, 1),
+    ('nham', 125, 1),
+    ('dam', 125, 1),
+    ('bao', 125, 1),
+    ('hoa', 125, 1),
+    ('cua', 125, 2),
+    ('doanh', 125, 1),
+    ('nghiep', 125, 1),
+    ('den', 125, 2),
+    ('kho', 125, 1),
+    ('cuoi', 125, 1),
+    ('cung', 125, 1),
+    ('la', 125, 1),
+    ('quan', 126, 12),
+    ('li', 126, 11),
+    ('ban', 126, 26),
+    ('le', 126, 13),
+    ('va', 126, 11),
+    ('buon', 126, 11),
+    ('lam', 126, 6),
+    ('viec', 126, 4),
+    ('voi', 126, 4),
+    ('con', 126, 4),
+    ('nguoi', 126, 4),
+    ('tri', 126, 2),
+    ('hang', 126, 2),
+    ('nha', 126, 1),
+    ('cong', 126, 1),
+    ('tac', 126, 1),
+    ('chung', 126, 1),
+    ('trong', 126, 1),
+    ('doanh', 126, 3),
+    ('nghiep', 126, 2),
+    ('chu', 126, 1),
+    ('dai', 126, 1),
+    ('hoac', 126, 1),
+    ('cac', 126, 2),
+    ('lap', 126, 1),
+    ('ke', 126, 1),
+    ('hoach', 126, 1),
+    ('chi', 126, 1),
+    ('dao', 126, 1),
+    ('dieu', 126, 1),
+    ('phoi', 126, 1),
+    ('hoat', 126, 1),
+    ('dong', 126, 1),
+    ('kinh', 126, 1),
+    ('quan', 127, 18),
+    ('li', 127, 17),
+    ('khach', 127, 18),
+    ('san', 127, 14),
+    ('nha', 127, 17),
+    ('hang', 127, 17),
+    ('lam', 127, 4),
+    ('viec', 127, 4),
+    ('voi', 127, 4),
+    ('con', 127, 4),
+    ('nguoi', 127, 6),
+    ('bo', 127, 7),
+    ('phan', 127, 7),
+    ('le', 127, 2),
+    ('tan', 127, 4),
+    ('buong', 127, 6),
+    ('phong', 127, 7),
+    ('quay', 127, 3),
+    ('uong', 127, 6),
+    ('hoat', 127, 7),
+    ('dong', 127, 7),
+    ('tiep', 127, 2),
+    ('ki', 127, 4),
+    ('thuat', 127, 4),
+    ('nau', 127, 2),
+    ('nuong', 127, 2),
+    ('pha', 127, 2),
+    ('che', 127, 3),
+    ('do', 127, 5),
+    ('khu', 127, 2),
+    ('resort', 127, 2),
+    ('lap', 127, 1),
+    ('ke', 127, 1),
+    ('hoach', 127, 1),
+    ('chi', 127, 1),
+    ('dao', 127, 1),
+    ('va', 127, 3),
+    ('phoi', 127, 1),
+    ('hop', 127, 1),
+    ('cac', 127, 1),
+    ('kinh', 127, 1),
+    ('doanh', 127, 1),
+    ('cua', 127, 2),
+    ('theo', 127, 2),
+    ('linh', 127, 1),
+    ('vuc', 127, 1),
+    ('chuyen', 127, 2),
+    ('mon', 127, 2),
+    ('ho', 127, 1),
+    ('co', 127, 1),
+    ('the', 127, 2),
+    ('chung', 127, 1),
+    ('hoac', 127, 1),
+    ('ve', 127, 1),
+    ('mot', 127, 1),
+    ('nghiep', 127, 1),
+    ('vu', 127, 4),
+    ('nhu', 127, 1),
+    ('tien', 127, 1),
+    ('sanh', 127, 1),
+    ('dat', 127, 1),
+    ('cho', 127, 4),
+    ('o', 127, 1),
+    ('au', 127, 1),
+    ('a', 127, 1),
+    ('ca', 127, 1),
+    ('phe', 127, 1),
+    ('chuan', 127, 1),
+    ('bi', 127, 1),
+    ('phuc', 127, 1),
+    ('an', 127, 2),
+    ('dam', 127, 1),
+    ('bao', 127, 1),
+    ('dich', 127, 1),
+    ('bep', 127, 3),
+    ('nong', 127, 1),
+    ('banh', 127, 1),
+    ('mua', 127, 1),
+    ('nguyen', 127, 1),
+    ('lieu', 127, 1),
+    ('bien', 127, 1),
+    ('nhiem', 127, 1),
+    ('cu', 127, 1),
+    ('thay', 127, 1),
+    ('doi', 127, 1),
+    ('tuy', 127, 1),
+    ('ma', 127, 1),
+    ('phu', 127, 1),
+    ('trach', 127, 1),
+    ('quan', 128, 16),
+    ('li', 128, 16),
+    ('nong', 128, 18),
+    ('nghiep', 128, 17),
+    ('lam', 128, 5),
+    ('viec', 128, 4),
+    ('voi', 128, 4),
+    ('con', 128, 4),
+    ('nguoi', 128, 5),
+    ('rui', 128, 2),
+    ('ro', 128, 2),
+    ('trong', 128, 2),
+    ('kinh', 128, 3),
+    ('doanh', 128, 3),
+    ('tiep', 128, 2),
+    ('thi', 128, 2),
+    ('kho', 128, 2),
+    ('va', 128, 3),
+    ('chuoi', 128, 2),
+    ('cung', 128, 2),
+    ('ung', 128, 2),
+    ('nha', 128, 1),
+    ('la', 128, 1),
+    ('chu', 128, 2),
+    ('hoac', 128, 1),
+    ('dai', 128, 1),
+    ('dien', 128, 1),
+    ('cho', 128, 1),
+    ('so', 128, 1),
+    ('huu', 128, 1),
+    ('cac', 128, 2),
+    ('trang', 128, 1),
+    ('trai', 128, 1),
+    ('truong', 128, 1),
+    ('ho', 128, 1),
+    ('chiu', 128, 1),
+    ('trach', 128, 1),
+    ('nhiem', 128, 1),
+    ('chung', 128, 1),
+    ('lap', 128, 1),
+    ('ke', 128, 1),
+    ('hoach', 128, 1),
+    ('chi', 128, 1),
+    ('dao', 128, 1),
+    ('dieu', 128, 1),
+    ('phoi', 128, 1),
+    ('hoat', 128, 1),
+    ('dong', 128, 1),
+    ('san', 128, 1),
+    ('xuat', 128, 1),
+    ('quan', 129, 13),
+    ('tri', 129, 10),
+    ('benh', 129, 11),
+    ('vien', 129, 10),
+    ('lam', 129, 4),
+    ('viec', 129, 4),
+    ('voi', 129, 4),
+    ('con', 129, 4),
+    ('nguoi', 129, 4),
+    ('tai', 129, 2),
+    ('chinh', 129, 2),
+    ('he', 129, 2),
+    ('cong', 129, 2),
+    ('chung', 129, 2),
+    ('to', 129, 3),
+    ('chuc', 129, 3),
+    ('can', 129, 2),
+    ('bo', 129, 2),
+    ('va', 129, 5),
+    ('nhan', 129, 3),
+    ('su', 129, 2),
+    ('dau', 129, 3),
+    ('thau', 129, 2),
+    ('nha', 129, 1),
+    ('la', 129, 1),
+    ('chuyen', 129, 1),
+    ('gia', 129, 2),
+    ('ve', 129, 1),
+    ('li', 129, 1),
+    ('cua', 129, 1),
+    ('nganh', 129, 1),
+    ('y', 129, 2),
+    ('te', 129, 2),
+    ('ho', 129, 1),
+    ('dam', 129, 1),
+    ('bao', 129, 1),
+    ('rang', 129, 1),
+    ('cac', 129, 4),
+    ('dich', 129, 2),
+    ('vu', 129, 2),
+    ('cham', 129, 2),
+    ('soc', 129, 2),
+    ('suc', 129, 2),
+    ('khoe', 129, 2),
+    ('duoc', 129, 1),
+    ('thuc', 129, 1),
+    ('hien', 129, 1),
+    ('mot', 129, 1),
+    ('cach', 129, 1),
+    ('hieu', 129, 1),
+    ('qua', 129, 2),
+    ('cho', 129, 1),
+    ('dinh', 129, 1),
+    ('thong', 129, 1),
+    ('trung', 129, 1),
+    ('tam', 129, 1),
+    ('ban', 129, 1),
+    ('cung', 129, 1),
+    ('cap', 129, 1),
+    ('loai', 129, 1),
+    ('hinh', 129, 1),
+    ('khac', 129, 1),
+    ('nhau', 129, 1),
+    ('quan', 130, 13),
+    ('li', 130, 11),
+    ('nhan', 130, 14),
+    ('su', 130, 11),
+    ('lam', 130, 4),
+    ('viec', 130, 4),
+    ('voi', 130, 4),
+    ('con', 130, 4),
+    ('nguoi', 130, 4),
+    ('cac', 130, 3),
+    ('he', 130, 4),
+    ('thong', 130, 2),
+    ('va', 130, 8),
+    ('qui', 130, 2),
+    ('trinh', 130, 2),
+    ('luong', 130, 2),
+    ('thuong', 130, 4),
+    ('phuc', 130, 2),
+    ('loi', 130, 2),
+    ('boi', 130, 2),
+    ('phat', 130, 2),
+    ('trien', 130, 2),
+    ('nguon', 130, 2),
+    ('luc', 130, 3),
+    ('lao', 130, 6),
+    ('dong', 130, 7),
+    ('phap', 130, 2),
+    ('luat', 130, 2),
+    ('tranh', 130, 2),
+    ('chap', 130, 2),
+    ('dinh', 130, 2),
+    ('cong', 130, 2),
+    ('nha', 130, 1),
+    ('lap', 130, 1),
+    ('ke', 130, 1),
+    ('hoach', 130, 1),
+    ('dieu', 130, 1),
+    ('phoi', 130, 1),
+    ('hoat', 130, 1),
+    ('cua', 130, 1),
+    ('mot', 130, 2),
+    ('to', 130, 1),
+    ('chuc', 130, 1),
+    ('de', 130, 1),
+    ('thuc', 130, 1),
+    ('hien', 130, 1),
+    ('chien', 130, 1),
+    ('luoc', 130, 1),
+    ('cach', 130, 1),
+    ('tot', 130, 1),
+    ('nhat', 130, 1),
+    ('can', 131, 9),
+    ('bo', 131, 9),
+    ('quan', 131, 11),
+    ('he', 131, 10),
+    ('lao', 131, 25),
+    ('dong', 131, 25),
+    ('lam', 131, 6),
+    ('viec', 131, 6),
+    ('voi', 131, 4),
+    ('con', 131, 4),
+    ('nguoi', 131, 10),
+    ('boi', 131, 2),
+    ('thuong', 131, 2),
+    ('tu', 131, 2),
+    ('van', 131, 2),
+    ('tam', 131, 3),
+    ('li', 131, 2),
+    ('cong', 131, 6),
+    ('nghiep', 131, 6),
+    ('xa', 131, 2),
+    ('hoi', 131, 2),
+    ('hoc', 131, 2),
+    ('luat', 131, 3),
+    ('phuc', 131, 2),
+    ('loi', 131, 3),
+    ('thoa', 131, 2),
+    ('uoc', 131, 2),
+    ('tap', 131, 2),
+    ('the', 131, 2),
+    ('giai', 131, 2),
+    ('quyet', 131, 2),
+    ('tranh', 131, 2),
+    ('chap', 131, 2),
+    ('va', 131, 6),
+    ('dinh', 131, 2),
+    ('bao', 131, 3),
+    ('ve', 131, 3),
+    ('la', 131, 1),
+    ('chuyen', 131, 1),
+    ('gia', 131, 1),
+    ('trong', 131, 2),
+    ('linh', 131, 1),
+    ('vuc', 131, 1),
+    ('xay', 131, 1),
+    ('dung', 131, 2),
+    ('duy', 131, 1),
+    ('tri', 131, 1),
+    ('hai', 131, 1),
+    ('hoa', 131, 1),
+    ('giua', 131, 1),
+    ('su', 131, 1),
+    ('cua', 131, 1),
+    ('mot', 131, 1),
+    ('doanh', 131, 2),
+    ('ho', 131, 1),
+    ('hieu', 131, 1),
+    ('biet', 131, 1),
+    ('sau', 131, 1),
+    ('chinh', 131, 1),
+    ('sach', 131, 1),
+    ('phap', 131, 1),
+    ('toi', 131, 1),
+    ('cac', 131, 1),
+    ('dieu', 131, 1),
+    ('kien', 131, 1),
+    ('thich', 131, 1),
+    ('hop', 131, 1),
+    ('ben', 131, 1),
+    ('vung', 131, 1),
+    ('cho', 131, 2),
+    ('dam', 131, 1),
+    ('ich', 131, 1),
+    ('ca', 131, 1),
+    ('dai', 131, 1),
+    ('han', 131, 1),
+    ('nha', 132, 9),
+    ('tam', 132, 34),
+    ('li', 132, 34),
+    ('hoc', 132, 27),
+    ('lam', 132, 6),
+    ('viec', 132, 4),
+    ('voi', 132, 4),
+    ('con', 132, 4),
+    ('nguoi', 132, 5),
+    ('ung', 132, 2),
+    ('dung', 132, 3),
+    ('sinh', 132, 2),
+    ('nghe', 132, 3),
+    ('nghiep', 132, 5),
+    ('tre', 132, 2),
+    ('em', 132, 2),
+    ('sang', 132, 2),
+    ('nhan', 132, 4),
+    ('thuc', 132, 6),
+    ('phat', 132, 3),
+    ('trien', 132, 3),
+    ('giao', 132, 3),
+    ('duc', 132, 3),
+    ('nghiem', 132, 2),
+    ('toi', 132, 2),
+    ('pham', 132, 2),
+    ('cong', 132, 2),
+    ('xa', 132, 3),
+    ('hoi', 132, 3),
+    ('nghien', 132, 1),
+    ('cuu', 132, 1),
+    ('cac', 132, 1),
+    ('qua', 132, 1),
+    ('trinh', 132, 1),
+    ('va', 132, 1),
+    ('hanh', 132, 1),
+    ('vi', 132, 1),
+    ('cua', 132, 2),
+    ('ca', 132, 2),
+    ('hoac', 132, 2),
+    ('nhom', 132, 1),
+    ('ho', 132, 1),
+    ('ap', 132, 1),
+    ('kien', 132, 1),
+    ('nay', 132, 1),
+    ('de', 132, 1),
+    ('day', 132, 1),
+    ('dieu', 132, 1),
+    ('chinh', 132, 1),
+    ('su', 132, 1),
+    ('nha', 133, 9),
+    ('tu', 133, 26),
+    ('van', 133, 26),
+    ('tam', 133, 10),
+    ('li', 133, 10),
+    ('lam', 133, 8),
+    ('viec', 133, 6),
+    ('voi', 133, 7),
+    ('con', 133, 4),
+    ('nguoi', 133, 6),
+    ('chi', 133, 2),
+    ('dan', 133, 3),
+    ('nghe', 133, 3),
+    ('nghiep', 133, 3),
+    ('va', 133, 6),
+    ('lien', 133, 4),
+    ('quan', 133, 4),
+    ('den', 133, 4),
+    ('thanh', 133, 2),
+    ('thieu', 133, 2),
+    ('nien', 133, 2),
+    ('vi', 133, 2),
+    ('du', 133, 2),
+    ('nhu', 133, 2),
+    ('ki', 133, 2),
+    ('nang', 133, 2),
+    ('song', 133, 4),
+    ('giao', 133, 2),
+    ('duc', 133, 2),
+    ('lao', 133, 2),
+    ('khoa', 133, 2),
+    ('cao', 133, 2),
+    ('tuoi', 133, 2),
+    ('hon', 133, 3),
+    ('nhan', 133, 5),
+    ('truong', 133, 2),
+    ('hoc', 133, 3),
+    ('dung', 133, 2),
+    ('thuoc', 133, 2),
+    ('nghien', 133, 2),
+    ('ngap', 133, 2),
+    ('huong', 133, 1),
+    ('hoac', 133, 1),
+    ('cho', 133, 1),
+    ('cac', 133, 1),
+    ('ca', 133, 2),
+    ('nham', 133, 1),
+    ('giup', 133, 1),
+    ('ho', 133, 1),
+    ('doi', 133, 1),
+    ('pho', 133, 1),
+    ('nhung', 133, 2),
+    ('kho', 133, 2),
+    ('khan', 133, 2),
+    ('ve', 133, 1),
+    ('tinh', 133, 1),
+    ('cam', 133, 1),
+    ('cang', 133, 1),
+    ('thang', 133, 1),
+    ('cuoc', 133, 2),
+    ('hang', 133, 1),
+    ('ngay', 133, 1),
+    ('do', 133, 1),
+    ('co', 133, 1),
+    ('the', 133, 1),
+    ('tap', 133, 1),
+    ('gia', 133, 1),
+    ('dinh', 133, 1),
+    ('phat', 133, 1),
+    ('trien', 133, 1),
+    ('nha', 134, 9),
+    ('tu', 134, 13),
+    ('van', 134, 15),
+    ('nghe', 134, 23),
+    ('nghiep', 134, 23),
+    ('lam', 134, 7),
+    ('viec', 134, 9),
+    ('voi', 134, 7),
+    ('con', 134, 4),
+    ('nguoi', 134, 11),
+    ('cac', 134, 10),
+    ('nhom', 134, 5),
+    ('dac', 134, 4),
+    ('biet', 134, 4),
+    ('vi', 134, 6),
+    ('du', 134, 6),
+    ('nhu', 134, 8),
+    ('nhung', 134, 5),
+    ('co', 134, 7),
+    ('cau', 134, 3),
+    ('moi', 134, 2),
+    ('phuc', 134, 2),
+    ('hoi', 134, 3),
+    ('sau', 134, 3),
+    ('benh', 134, 2),
+    ('tat', 134, 2),
+    ('tuoi', 134, 2),
+    ('cu', 134, 4),
+    ('the', 134, 7),
+    ('cong', 134, 2),
+    ('doi', 134, 2),
+    ('tung', 134, 2),
+    ('moc', 134, 2),
+    ('phat', 134, 2),
+    ('trien', 134, 2),
+    ('trac', 134, 2),
+    ('nghiem', 134, 2),
+    ('danh', 134, 2),
+    ('gia', 134, 2),
+    ('chuan', 134, 3),
+    ('bi', 134, 3),
+    ('ap', 134, 1),
+    ('dung', 134, 2),
+    ('nguyen', 134, 1),
+    ('tac', 134, 1),
+    ('tam', 134, 1),
+    ('li', 134, 1),
+    ('hoc', 134, 3),
+    ('de', 134, 2),
+    ('giup', 134, 2),
+    ('khach', 134, 3),
+    ('hang', 134, 3),
+    ('hieu', 134, 2),
+    ('ban', 134, 2),
+    ('than', 134, 1),
+    ('minh', 134, 2),
+    ('gioi', 134, 1),
+    ('xay', 134, 1),
+    ('phuong', 134, 1),
+    ('an', 134, 1),
+    ('chon', 134, 1),
+    ('va', 134, 2),
+    ('cho', 134, 2),
+    ('ho', 134, 4),
+    ('phong', 134, 1),
+    ('xac', 134, 1),
+    ('dinh', 134, 2),
+    ('nang', 134, 1),
+    ('luc', 134, 1),
+    ('huong', 134, 1),
+    ('cung', 134, 2),
+    ('cap', 134, 1),
+    ('thong', 134, 2),
+    ('tin', 134, 1),
+    ('ve', 134, 2),
+    ('khac', 134, 1),
+    ('nhau', 134, 1),
+    ('vao', 134, 1),
+    ('thoi', 134, 1),
+    ('diem', 134, 1),
+    ('quan', 134, 1),
+    ('trong', 134, 2),
+    ('quyet', 134, 1),
+    ('cuoi', 134, 1),
+    ('trung', 134, 2),
+    ('pho', 134, 1),
+    ('so', 134, 2),
+    ('khi', 134, 1),
+    ('tot', 134, 1),
+    ('dao', 134, 1),
+    ('tao', 134, 1),
+    ('dang', 134, 1),
+    ('khong', 134, 1),
+    ('thich', 134, 1),
+    ('cua', 134, 1),
+    ('mat', 134, 1),
+    ('ca', 134, 1),
+    ('nhan', 134, 1),
+    ('hoac', 134, 1),
+    ('ki', 135, 13),
+    ('thuat', 135, 13),
+    ('vien', 135, 11),
+    ('chan', 135, 12),
+    ('doan', 135, 12),
+    ('hinh', 135, 12),
+    ('anh', 135, 12),
+    ('lam', 135, 5),
+    ('viec', 135, 4),
+    ('voi', 135, 4),
+    ('con', 135, 5),
+    ('nguoi', 135, 6),
+    ('sieu', 135, 3),
+    ('am', 135, 3),
+    ('noi', 135, 3),
+    ('soi', 135, 3),
+    ('x', 135, 3),
+    ('quang', 135, 3),
+    ('dien', 135, 3),
+    ('tam', 135, 2),
+    ('do', 135, 2),
+    ('chup', 135, 5),
+    ('cong', 135, 3),
+    ('huong', 135, 3),
+    ('tu', 135, 3),
+    ('mri', 135, 2),
+    ('cat', 135, 3),
+    ('lop', 135, 3),
+    ('ct', 135, 2),
+    ('scan', 135, 2),
+    ('thiet', 135, 4),
+    ('bi', 135, 4),
+    ('phu', 135, 1),
+    ('trach', 135, 1),
+    ('cac', 135, 2),
+    ('tro', 135, 1),
+    ('giup', 135, 1),
+    ('bac', 135, 1),
+    ('si', 135, 1),
+    ('xac', 135, 1),
+    ('dinh', 135, 1),
+    ('ve', 135, 2),
+    ('tinh', 135, 1),
+    ('trang', 135, 1),
+    ('benh', 135, 3),
+    ('tat', 135, 1),
+    ('co', 135, 3),
+    ('the', 135, 2),
+    ('cua', 135, 1),
+    ('nhan', 135, 2),
+    ('nhu', 135, 1),
+    ('may', 135, 1),
+    ('tim', 135, 1),
+    ('nghe', 135, 1),
+    ('nay', 135, 1),
+    ('hieu', 135, 1),
+    ('dieu', 135, 1),
+    ('kien', 135, 1),
+    ('y', 135, 1),
+    ('te', 135, 1),
+    ('va', 135, 2),
+    ('cham', 135, 1),
+    ('soc', 135, 1),
+    ('ho', 135, 2),
+    ('cung', 135, 1),
+    ('nam', 135, 1),
+    ('vung', 135, 1),
+    ('cach', 135, 1),
+    ('van', 135, 1),
+    ('hanh', 135, 1),
+    ('luu', 135, 1),
+    ('giu', 135, 1),
+    ('so', 135, 1),
+    ('ki', 136, 9),
+    ('thuat', 136, 10),
+    ('vien', 136, 9),
+    ('nhan', 136, 13),
+    ('khoa', 136, 11),
+    ('lam', 136, 4),
+    ('viec', 136, 5),
+    ('voi', 136, 4),
+    ('con', 136, 5),
+    ('nguoi', 136, 10),
+    ('kinh', 136, 4),
+    ('ap', 136, 4),
+    ('trong', 136, 3),
+    ('cac', 136, 8),
+    ('nhom', 136, 3),
+    ('dac', 136, 3),
+    ('biet', 136, 3),
+    ('nhu', 136, 4),
+    ('tre', 136, 2),
+    ('em', 136, 2),
+    ('gia', 136, 2),
+    ('hoac', 136, 2),
+    ('nhung', 136, 2),
+    ('can', 136, 2),
+    ('thiet', 136, 2),
+    ('bi', 136, 2),
+    ('ho', 136, 3),
+    ('tro', 136, 3),
+    ('thi', 136, 6),
+    ('giac', 136, 3),
+    ('lieu', 136, 2),
+    ('phap', 136, 2),
+    ('cho', 136, 3),
+    ('khiem', 136, 2),
+    ('goi', 136, 1),
+    ('la', 136, 2),
+    ('y', 136, 2),
+    ('ta', 136, 2),
+    ('chan', 136, 5),
+    ('doan', 136, 4),
+    ('dieu', 136, 3),
+    ('tri', 136, 3),
+    ('van', 136, 1),
+    ('de', 136, 1),
+    ('suc', 136, 2),
+    ('khoe', 136, 2),
+    ('lien', 136, 1),
+    ('quan', 136, 1),
+    ('den', 136, 1),
+    ('va', 136, 4),
+    ('mat', 136, 2),
+    ('bao', 136, 2),
+    ('gom', 136, 2),
+    ('do', 136, 2),
+    ('chi', 136, 1),
+    ('dinh', 136, 1),
+    ('khong', 136, 1),
+    ('phau', 136, 1),
+    ('bat', 136, 1),
+    ('thuong', 136, 3),
+    ('ve', 136, 1),
+    ('co', 136, 1),
+    ('nho', 136, 1),
+    ('benh', 136, 3),
+    ('tang', 136, 1),
+    ('khac', 136, 1),
+    ('ton', 136, 1),
+    ('vong', 136, 1),
+    ('mac', 136, 1),
+    ('tieu', 136, 1),
+    ('duong', 136, 1),
+    ('tien', 136, 1),
+    ('hanh', 136, 1),
+    ('giao', 136, 1),
+    ('duc', 136, 1),
+    ('cham', 136, 1),
+    ('soc', 136, 1),
+    ('luc', 136, 1),
+    ('cung', 136, 1),
+    ('cong', 136, 1),
+    ('cua', 136, 1),
+    ('ki', 137, 8),
+    ('thuat', 137, 15),
+    ('vien', 137, 9),
+    ('y', 137, 14),
+    ('te', 137, 11),
+    ('lam', 137, 5),
+    ('viec', 137, 5),
+    ('voi', 137, 5),
+    ('con', 137, 5),
+    ('nguoi', 137, 6),
+    ('chu', 137, 2),
+    ('yeu', 137, 3),
+    ('la', 137, 3),
+    ('chuyen', 137, 2),
+    ('sau', 137, 3),
+    ('ve', 137, 3),
+    ('cac', 137, 5),
+    ('loai', 137, 2),
+    ('thiet', 137, 5),
+    ('bi', 137, 4),
+    ('va', 137, 5),
+    ('thu', 137, 4),
+    ('cu', 137, 2),
+    ('the', 137, 3),
+    ('nhu', 137, 5),
+    ('may', 137, 5),
+    ('tro', 137, 5),
+    ('tim', 137, 5),
+    ('tho', 137, 2),
+    ('gay', 137, 2),
+    ('me', 137, 2),
+    ('mach', 137, 2),
+    ('ho', 137, 2),
+    ('hap', 137, 2),
+    ('ky', 137, 3),
+    ('sinh', 137, 3),
+    ('ktys', 137, 3),
+    ('mot', 137, 1),
+    ('linh', 137, 3),
+    ('vuc', 137, 3),
+    ('lien', 137, 1),
+    ('nganh', 137, 2),
+    ('ung', 137, 1),
+    ('dung', 137, 1),
+    ('tien', 137, 2),
+    ('nano', 137, 1),
+    ('bao', 137, 3),
+    ('goc', 137, 1),
+    ('thong', 137, 1),
+    ('vao', 137, 1),
+    ('tao', 137, 4),
+    ('ra', 137, 1),
+    ('phuong', 137, 1),
+    ('phap', 137, 1),
+    ('nghien', 137, 2),
+    ('cuu', 137, 2),
+    ('phuc', 137, 1),
+    ('vu', 137, 1),
+    ('cho', 137, 1),
+    ('suc', 137, 1),
+    ('khoe', 137, 1),
+    ('cung', 137, 1),
+    ('giup', 137, 1),
+    ('hieu', 137, 1),
+    ('biet', 137, 1),
+    ('hon', 137, 1),
+    ('gom', 137, 2),
+    ('dien', 137, 1),
+    ('tu', 137, 1),
+    ('hoc', 137, 4),
+    ('tai', 137, 1),
+    ('duoc', 137, 2),
+    ('nhung', 137, 2),
+    ('san', 137, 1),
+    ('pham', 137, 2),
+    ('cua', 137, 1),
+    ('ct', 137, 1),
+    ('cat', 137, 1),
+    ('lop', 137, 1),
+    ('x', 137, 1),
+    ('quang', 137, 1),
+    ('noi', 137, 1),
+    ('soi', 137, 1),
+    ('bo', 137, 1),
+    ('phan', 137, 1),
+    ('nhan', 137, 1),
+    ('trong', 137, 1),
+    ('co', 137, 1),
+    ('vat', 137, 1),
+    ('lieu', 137, 1),
+    ('nay', 137, 1),
+    ('phu', 137, 1),
+    ('hop', 137, 1),
+    ('thich', 137, 1),
+    ('ke', 137, 1),
+    ('che', 137, 1),
+    ('kinh', 137, 1),
+    ('doanh', 137, 1),
+    ('hay', 137, 1),
+    ('khoa', 137, 1),
+    ('sang', 137, 1),
+    ('nha', 138, 9),
+    ('quan', 138, 14),
+    ('li', 138, 14),
+    ('su', 138, 16),
+    ('kien', 138, 16),
+    ('lam', 138, 6),
+    ('viec', 138, 5),
+    ('voi', 138, 4),
+    ('con', 138, 4),
+    ('nguoi', 138, 4),
+    ('mice', 138, 2),
+    ('the', 138, 2),
+    ('thao', 138, 3),
+    ('giai', 138, 2),
+    ('tri', 138, 2),
+    ('dich', 138, 3),
+    ('vu', 138, 3),
+    ('cuoi', 138, 3),
+    ('hoi', 138, 4),
+    ('gia', 138, 2),
+    ('dinh', 138, 2),
+    ('cong', 138, 1),
+    ('va', 138, 3),
+    ('dieu', 138, 1),
+    ('hanh', 138, 1),
+    ('ho', 138, 1),
+    ('to', 138, 1),
+    ('chuc', 138, 1),
+    ('phoi', 138, 1),
+    ('hop', 138, 1),
+    ('cac', 138, 3),
+    ('cho', 138, 1),
+    ('nghi', 138, 1),
+    ('tiec', 138, 1),
+    ('dam', 138, 1),
+    ('trien', 138, 1),
+    ('dac', 138, 1),
+    ('biet', 138, 1),
+    ('nhan', 139, 13),
+    ('vien', 139, 9),
+    ('cong', 139, 14),
+    ('tac', 139, 11),
+    ('xa', 139, 13),
+    ('hoi', 139, 13),
+    ('lam', 139, 5),
+    ('viec', 139, 5),
+    ('voi', 139, 5),
+    ('con', 139, 4),
+    ('nguoi', 139, 4),
+    ('to', 139, 2),
+    ('chuc', 139, 2),
+    ('va', 139, 12),
+    ('phat', 139, 4),
+    ('trien', 139, 4),
+    ('dong', 139, 5),
+    ('toi', 139, 2),
+    ('pham', 139, 2),
+    ('hoc', 139, 2),
+    ('cai', 139, 2),
+    ('huan', 139, 2),
+    ('nguon', 139, 3),
+    ('luc', 139, 5),
+    ('quan', 139, 5),
+    ('li', 139, 2),
+    ('he', 139, 2),
+    ('lao', 139, 2),
+    ('trong', 139, 3),
+    ('y', 139, 2),
+    ('te', 139, 2),
+    ('tam', 139, 2),
+    ('than', 139, 2),
+    ('tu', 139, 2),
+    ('van', 139, 5),
+    ('dich', 139, 2),
+    ('vu', 139, 2),
+    ('cham', 139, 2),
+    ('soc', 139, 2),
+    ('gia', 139, 2),
+    ('dinh', 139, 2),
+    ('cac', 139, 4),
+    ('nhom', 139, 1),
+    ('ho', 139, 2),
+    ('tim', 139, 2),
+    ('hieu', 139, 1),
+    ('de', 139, 4),
+    ('huong', 139, 1),
+    ('dan', 139, 1),
+    ('cho', 139, 1),
+    ('doi', 139, 1),
+    ('tuong', 139, 1),
+    ('gap', 139, 1),
+    ('kho', 139, 2),
+    ('khan', 139, 2),
+    ('lien', 139, 1),
+    ('nham', 139, 1),
+    ('giup', 139, 1),
+    ('kiem', 139, 1),
+    ('su', 139, 1),
+    ('dung', 139, 1),
+    ('vuot', 139, 1),
+    ('qua', 139, 1),
+    ('dat', 139, 1),
+    ('duoc', 139, 1),
+    ('muc', 139, 1),
+    ('tieu', 139, 1),
+    ('cu', 139, 1),
+    ('the', 139, 1),
+    ('tiep', 140, 22),
+    ('vien', 140, 22),
+    ('hang', 140, 10),
+    ('khong', 140, 10),
+    ('hoac', 140, 8),
+    ('tren', 140, 12),
+    ('phuong', 140, 8),
+    ('tien', 140, 8),
+    ('van', 140, 8),
+    ('tai', 140, 8),
+    ('lam', 140, 4),
+    ('viec', 140, 4),
+    ('voi', 140, 4),
+    ('con', 140, 5),
+    ('nguoi', 140, 5),
+    ('tau', 140, 3),
+    ('du', 140, 2),
+    ('lich', 140, 2),
+    ('goi', 140, 1),
+    ('la', 140, 2),
+    ('chieu', 140, 1),
+    ('dai', 140, 1),
+    ('truc', 140, 1),
+    ('cung', 140, 1),
+    ('cap', 140, 1),
+    ('dich', 140, 1),
+    ('vu', 140, 2),
+    ('ca', 140, 1),
+    ('nhan', 140, 1),
+    ('nham', 140, 1),
+    ('dam', 140, 1),
+    ('bao', 140, 1),
+    ('su', 140, 1),
+    ('an', 140, 2),
+    ('toan', 140, 1),
+    ('va', 140, 2),
+    ('thoai', 140, 1),
+    ('mai', 140, 1),
+    ('cua', 140, 1),
+    ('hanh', 140, 1),
+    ('khach', 140, 1),
+    ('ho', 140, 1),
+    ('phuc', 140, 1),
+    ('bua', 140, 1),
+    ('do', 140, 1),
+    ('uong', 140, 1),
+    ('may', 140, 1),
+    ('bay', 140, 1),
+    ('tho', 141, 9),
+    ('che', 141, 20),
+    ('bien', 141, 20),
+    ('thuc', 141, 12),
+    ('pham', 141, 20),
+    ('lam', 141, 4),
+    ('viec', 141, 5),
+    ('voi', 141, 4),
+    ('con', 141, 4),
+    ('nguoi', 141, 5),
+    ('bao', 141, 6),
+    ('quan', 141, 6),
+    ('thit', 141, 4),
+    ('va', 141, 10),
+    ('cac', 141, 7),
+    ('san', 141, 13),
+    ('tu', 141, 7),
+    ('thuy', 141, 4),
+    ('rau', 141, 2),
+    ('qua', 141, 2),
+    ('sua', 141, 4),
+    ('la', 141, 1),
+    ('tham', 141, 1),
+    ('gia', 141, 1),
+    ('truc', 141, 1),
+    ('tiep', 141, 1),
+    ('vao', 141, 1),
+    ('cong', 141, 1),
+    ('cua', 141, 2),
+    ('co', 141, 1),
+    ('so', 141, 1),
+    ('xuat', 141, 2),
+    ('kiem', 141, 1),
+    ('tra', 141, 1),
+    ('chat', 141, 1),
+    ('luong', 141, 1),
+    ('day', 141, 1),
+    ('chuyen', 141, 1),
+    ('nguyen', 141, 1),
+    ('lieu', 141, 1),
+    ('den', 141, 1),
+    ('thanh', 141, 1),
+    ('to', 141, 1),
+    ('chuc', 141, 1),
+    ('o', 141, 1),
+    ('quy', 141, 1),
+    ('mo', 141, 1),
+    ('vua', 141, 1),
+    ('nho', 141, 1),
+    ('dau', 142, 9),
+    ('bep', 142, 9),
+    ('lam', 142, 7),
+    ('viec', 142, 4),
+    ('voi', 142, 4),
+    ('con', 142, 4),
+    ('nguoi', 142, 4),
+    ('cac', 142, 6),
+    ('mon', 142, 6),
+    ('an', 142, 7),
+    ('au', 142, 2),
+    ('a', 142, 2),
+    ('pha', 142, 2),
+    ('che', 142, 3),
+    ('do', 142, 2),
+    ('uong', 142, 2),
+    ('trang', 142, 2),
+    ('tri', 142, 2),
+    ('banh', 142, 2),
+    ('tho', 142, 1),
+    ('bien', 142, 1),
+    ('va', 142, 2),
+    ('hieu', 142, 1),
+    ('biet', 142, 1),
+    ('ve', 142, 1),
+    ('dinh', 142, 2),
+    ('duong', 142, 2),
+    ('dam', 142, 1),
+    ('bao', 142, 1),
+    ('ngon', 142, 1),
+    ('toan', 142, 1),
+    ('thuc', 142, 1),
+    ('pham', 142, 1),
+    ('day', 142, 1),
+    ('du', 142, 1),
+    ('chat', 142, 1),
+    ('can', 142, 1),
+    ('thiet', 142, 1),
+    ('phu', 143, 9),
+    ('bep', 143, 12),
+    ('lam', 143, 7),
+    ('viec', 143, 4),
+    ('voi', 143, 4),
+    ('con', 143, 4),
+    ('nguoi', 143, 4),
+    ('che', 143, 5),
+    ('bien', 143, 3),
+    ('cac', 143, 6),
+    ('mon', 143, 5),
+    ('an', 143, 5),
+    ('au', 143, 2),
+    ('a', 143, 2),
+    ('pha', 143, 2),
+    ('do', 143, 2),
+    ('uong', 143, 2),
+    ('trang', 143, 2),
+    ('tri', 143, 2),
+    ('banh', 143, 2),
+    ('giup', 143, 1),
+    ('dau', 143, 1),
+    ('truong', 143, 1),
+    ('pho', 143, 1),
+    ('thuc', 143, 1),
+    ('hien', 143, 1),
+    ('va', 143, 2),
+    ('hoat', 143, 1),
+    ('dong', 143, 1),
+    ('khac', 143, 1),
+    ('lien', 143, 1),
+    ('quan', 143, 1),
+    ('den', 143, 1),
+    ('nau', 143, 1),
+    ('nuong', 143, 1),
+    ('phuc', 144, 11),
+    ('vu', 144, 11),
+    ('ban', 144, 13),
+    ('lam', 144, 4),
+    ('viec', 144, 4),
+    ('voi', 144, 4),
+    ('con', 144, 4),
+    ('nguoi', 144, 5),
+    ('sap', 144, 2),
+    ('xep', 144, 2),
+    ('bai', 144, 2),
+    ('tri', 144, 2),
+    ('giai', 144, 2),
+    ('dap', 144, 2),
+    ('thac', 144, 2),
+    ('mac', 144, 2),
+    ('cua', 144, 2),
+    ('khach', 144, 3),
+    ('boi', 144, 1),
+    ('la', 144, 1),
+    ('gioi', 144, 1),
+    ('thieu', 144, 1),
+    ('tu', 144, 1),
+    ('van', 144, 1),
+    ('va', 144, 1),
+    ('cac', 144, 1),
+    ('mon', 144, 1),
+    ('an', 144, 1),
+    ('do', 144, 1),
+    ('uong', 144, 1),
+    ('cho', 144, 1),
+    ('hang', 144, 1),
+    ('le', 145, 15),
+    ('tan', 145, 15),
+    ('lam', 145, 5),
+    ('viec', 145, 5),
+    ('voi', 145, 5),
+    ('con', 145, 4),
+    ('nguoi', 145, 5),
+    ('khach', 145, 4),
+    ('san', 145, 2),
+    ('doanh', 145, 2),
+    ('nghiep', 145, 2),
+    ('kiem', 145, 2),
+    ('hanh', 145, 2),
+    ('chinh', 145, 2),
+    ('la', 145, 1),
+    ('tiep', 145, 3),
+    ('xuc', 145, 1),
+    ('don', 145, 1),
+    ('den', 145, 1),
+    ('nhan', 145, 1),
+    ('va', 145, 1),
+    ('xu', 145, 1),
+    ('li', 145, 1),
+    ('thong', 145, 1),
+    ('tin', 145, 1),
+    ('ban', 145, 1),
+    ('dau', 145, 1),
+    ('ho', 145, 1),
+    ('tro', 145, 1),
+    ('cac', 145, 1),
+    ('hoat', 145, 1),
+    ('dong', 145, 1),
+    ('cua', 145, 1),
+    ('co', 145, 1),
+    ('quan', 145, 1),
+    ('hang', 145, 1),
+    ('nhan', 146, 9),
+    ('vien', 146, 9),
+    ('van', 146, 14),
+    ('phong', 146, 14),
+    ('lam', 146, 5),
+    ('viec', 146, 6),
+    ('voi', 146, 4),
+    ('con', 146, 4),
+    ('nguoi', 146, 4),
+    ('quan', 146, 5),
+    ('tri', 146, 2),
+    ('li', 146, 2),
+    ('hanh', 146, 4),
+    ('chinh', 146, 4),
+    ('thu', 146, 2),
+    ('ki', 146, 2),
+    ('thong', 146, 2),
+    ('ke', 146, 2),
+    ('luu', 146, 2),
+    ('tru', 146, 2),
+    ('trong', 146, 1),
+    ('linh', 146, 1),
+    ('vuc', 146, 1),
+    ('thuc', 146, 1),
+    ('hien', 146, 1),
+    ('cac', 146, 2),
+    ('cong', 146, 2),
+    ('thuoc', 146, 1),
+    ('cua', 146, 1),
+    ('co', 146, 1),
+    ('to', 146, 1),
+    ('chuc', 146, 1),
+    ('ty', 146, 1),
+    ('ki', 147, 10),
+    ('su', 147, 11),
+    ('mo', 147, 14),
+    ('the', 147, 4),
+    ('chat', 147, 6),
+    ('co', 147, 5),
+    ('khi', 147, 6),
+    ('chuyen', 147, 10),
+    ('nganh', 147, 10),
+    ('ve', 147, 10),
+    ('tung', 147, 8),
+    ('loai', 147, 4),
+    ('khoang', 147, 7),
+    ('san', 147, 7),
+    ('vi', 147, 8),
+    ('du', 147, 6),
+    ('than', 147, 2),
+    ('sat', 147, 2),
+    ('dau', 147, 2),
+    ('qui', 147, 2),
+    ('trinh', 147, 2),
+    ('khai', 147, 11),
+    ('thac', 147, 11),
+    ('va', 147, 8),
+    ('che', 147, 6),
+    ('bien', 147, 6),
+    ('may', 147, 2),
+    ('phuong', 147, 3),
+    ('phap', 147, 2),
+    ('nhu', 147, 4),
+    ('lo', 147, 2),
+    ('thien', 147, 3),
+    ('phan', 147, 2),
+    ('theo', 147, 2),
+    ('tri', 147, 2),
+    ('duoi', 147, 2),
+    ('nuoc', 147, 2),
+    ('o', 147, 2),
+    ('sa', 147, 2),
+    ('mac', 147, 2),
+    ('ap', 147, 1),
+    ('dung', 147, 1),
+    ('cac', 147, 1),
+    ('nguyen', 147, 1),
+    ('tac', 147, 1),
+    ('vat', 147, 1),
+    ('li', 147, 1),
+    ('dia', 147, 1),
+    ('hoa', 147, 1),
+    ('hoc', 147, 1),
+    ('de', 147, 2),
+    ('tham', 147, 1),
+    ('do', 147, 3),
+    ('nhien', 147, 1),
+    ('ban', 147, 1),
+    ('hoat', 147, 1),
+    ('dong', 147, 1),
+    ('nay', 147, 2),
+    ('gay', 147, 2),
+    ('ra', 147, 2),
+    ('xao', 147, 1),
+    ('tron', 147, 1),
+    ('moi', 147, 2),
+    ('truong', 147, 2),
+    ('trong', 147, 1),
+    ('xung', 147, 1),
+    ('quanh', 147, 1),
+    ('khu', 147, 1),
+    ('vuc', 147, 1),
+    ('ngay', 147, 1),
+    ('khong', 147, 1),
+    ('phai', 147, 2),
+    ('chi', 147, 1),
+    ('chu', 147, 1),
+    ('y', 147, 1),
+    ('dien', 147, 1),
+    ('ma', 147, 1),
+    ('con', 147, 1),
+    ('quan', 147, 1),
+    ('tam', 147, 1),
+    ('toi', 147, 1),
+    ('van', 147, 1),
+    ('giam', 147, 1),
+    ('nhe', 147, 1),
+    ('thiet', 147, 1),
+    ('hai', 147, 1),
+    ('hoac', 147, 1),
+    ('anh', 147, 1),
+    ('huong', 147, 1),
+    ('xau', 147, 1),
+    ('cho', 147, 1),
+    ('ki', 148, 15),
+    ('thuat', 148, 14),
+    ('vien', 148, 8),
+    ('bao', 148, 21),
+    ('duong', 148, 15),
+    ('may', 148, 13),
+    ('bay', 148, 21),
+    ('the', 148, 4),
+    ('chat', 148, 4),
+    ('co', 148, 7),
+    ('khi', 148, 6),
+    ('cac', 148, 5),
+    ('bo', 148, 4),
+    ('phan', 148, 4),
+    ('dien', 148, 6),
+    ('tu', 148, 5),
+    ('thiet', 148, 2),
+    ('bi', 148, 2),
+    ('truyen', 148, 2),
+    ('thong', 148, 4),
+    ('nap', 148, 2),
+    ('nhien', 148, 2),
+    ('lieu', 148, 2),
+    ('sua', 148, 3),
+    ('chua', 148, 3),
+    ('tri', 148, 5),
+    ('he', 148, 2),
+    ('san', 148, 6),
+    ('khai', 148, 2),
+    ('thac', 148, 2),
+    ('hoat', 148, 3),
+    ('dong', 148, 4),
+    ('su', 148, 1),
+    ('dam', 148, 1),
+    ('du', 148, 1),
+    ('dieu', 148, 1),
+    ('kien', 148, 1),
+    ('ho', 148, 1),
+    ('chi', 148, 1),
+    ('dao', 148, 1),
+    ('giam', 148, 1),
+    ('sat', 148, 1),
+    ('va', 148, 3),
+    ('thuc', 148, 1),
+    ('hien', 148, 1),
+    ('viec', 148, 1),
+    ('dai', 148, 1),
+    ('ket', 148, 1),
+    ('cau', 148, 1),
+    ('ki', 149, 17),
+    ('su', 149, 9),
+    ('khai', 149, 10),
+    ('thac', 149, 10),
+    ('dau', 149, 13),
+    ('khi', 149, 19),
+    ('the', 149, 4),
+    ('chat', 149, 5),
+    ('co', 149, 4),
+    ('thuat', 149, 8),
+    ('khoan', 149, 2),
+    ('danh', 149, 2),
+    ('gia', 149, 2),
+    ('mo', 149, 3),
+    ('san', 149, 2),
+    ('xuat', 149, 2),
+    ('tang', 149, 2),
+    ('chua', 149, 2),
+    ('thuy', 149, 2),
+    ('vat', 149, 3),
+    ('li', 149, 3),
+    ('da', 149, 2),
+    ('ung', 149, 1),
+    ('dung', 149, 1),
+    ('cac', 149, 2),
+    ('nguyen', 149, 1),
+    ('tac', 149, 1),
+    ('dia', 149, 1),
+    ('va', 149, 4),
+    ('hoa', 149, 1),
+    ('hoc', 149, 1),
+    ('de', 149, 1),
+    ('phat', 149, 1),
+    ('hien', 149, 1),
+    ('tu', 149, 1),
+    ('duoi', 149, 2),
+    ('long', 149, 1),
+    ('dat', 149, 1),
+    ('bien', 149, 1),
+    ('chuyen', 150, 12),
+    ('gia', 150, 17),
+    ('chinh', 150, 14),
+    ('hinh', 150, 23),
+    ('va', 150, 10),
+    ('phuc', 150, 12),
+    ('the', 150, 6),
+    ('chat', 150, 4),
+    ('co', 150, 6),
+    ('khi', 150, 4),
+    ('cac', 150, 7),
+    ('nganh', 150, 2),
+    ('khac', 150, 2),
+    ('nhau', 150, 2),
+    ('tuy', 150, 2),
+    ('thuoc', 150, 2),
+    ('vao', 150, 2),
+    ('loai', 150, 4),
+    ('thiet', 150, 6),
+    ('bi', 150, 8),
+    ('chan', 150, 11),
+    ('tay', 150, 11),
+    ('hoac', 150, 5),
+    ('vat', 150, 2),
+    ('lieu', 150, 2),
+    ('su', 150, 2),
+    ('dung', 150, 2),
+    ('de', 150, 2),
+    ('lam', 150, 4),
+    ('vi', 150, 2),
+    ('du', 150, 2),
+    ('ban', 150, 2),
+    ('sau', 150, 2),
+    ('ve', 150, 2),
+    ('tru', 150, 3),
+    ('chong', 150, 3),
+    ('bang', 150, 3),
+    ('nhua', 150, 2),
+    ('thep', 150, 2),
+    ('san', 150, 4),
+    ('xuat', 150, 4),
+    ('hoi', 150, 2),
+    ('chuc', 150, 2),
+    ('nang', 150, 2),
+    ('ki', 150, 1),
+    ('thuat', 150, 1),
+    ('vien', 150, 1),
+    ('vu', 150, 1),
+    ('cham', 150, 1),
+    ('soc', 150, 1),
+    ('benh', 150, 1),
+    ('nhan', 150, 1),
+    ('khuyet', 150, 1),
+    ('tat', 150, 1),
+    ('o', 150, 1),
+    ('bo', 150, 2),
+    ('phan', 150, 2),
+    ('cot', 150, 1),
+    ('song', 150, 1),
+    ('hay', 150, 1),
+    ('mat', 150, 1),
+    ('mot', 150, 1),
+    ('toan', 150, 1),
+    ('cach', 150, 1),
+    ('lap', 150, 1),
+    ('chuan', 150, 1),
+    ('theo', 150, 1),
+    ('chi', 150, 1),
+    ('dao', 150, 1),
+    ('y', 150, 1),
+    ('kien', 150, 1),
+    ('cua', 150, 1),
+    ('bac', 150, 1),
+    ('si', 150, 1);
 
 
 -- Batch 4: Jobs 151 to 200
 INSERT INTO jobs (
-    job_name, holland_code, job_group, activities_code,
+    id, job_name, holland_code, job_group, activities_code,
     capacity, essential_ability, education_level, work_environment,
     work_style, work_value, job_description, specializations,
     main_tasks, work_areas, is_active
 ) VALUES
-    ('Kĩ thuật viên cơ – điện tử', 'RI', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu sự cải tiến sáng tạo và tạo ra giá trị mới', 'Thành tựu', 'Kĩ thuật viên cơ - điện tử làm việc trong một lĩnh vực liên quan tới nhiều ngành nghề kĩ thuật như kĩ thuật cơ khí, kĩ thuật điện, kĩ thuật điều khiển và kĩ thuật máy tính. Sáng tạo robot là một ví dụ về công việc trong lĩnh vực cơ điện tử.', '["Kĩ thuật chế tạo người máy", "Thị giác máy tính", "Tự động hóa", "Hệ thống tự động hóa"]', '["Thu nhận kiến thức của các lĩnh vực kĩ thuật như: kĩ thuật cơ khí, khoa học vật liệu, kĩ thuật điện tử/điện, kĩ thuật máy tính, kĩ thuật hệ thống và kiểm soát hệ thống", "Chuyên sâu vào một trong những lĩnh vực kĩ thuật trên, đồng thời liên hệ với các lĩnh vực khác bổ sung hỗ trợ cho cơ-điện tử", "Áp dụng các nguyên tắc của lĩnh vực chuyên sâu của mình. Các nguyên tắc này được xây dựng trên cơ sở các thông tin và hệ thống được cung cấp bởi các ngành khác"]', '["Các công ty kĩ thuật", "Các doanh nghiệp tham gia vào việc nghiên cứu, thiết kế và sản xuất robot, sản xuất tự động hóa, thị giác máy tính và các kĩ thuật kiểm tra tự động", "Bộ phận nghiên cứu và thiết kế của các doanh nghiệp ô tô"]', TRUE),
-    ('Kĩ sư hàng hải', 'IRC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư hàng hải kiểm soát và tham gia hoạt động thiết kế, điều khiển, bảo trì, bảo dưỡng, sửa chữa thiết bị cơ khí, điện, điện tử và máy móc trên tàu và các phương tiện đường thủy hoặc thực hiện các nhiệm vụ hỗ trợ trên bờ.', '["Kĩ thuật hàng hải", "Kĩ thuật tàu thủy", "Kĩ thuật điện tàu thủy", "Điện và tự động tàu thủy", "Kĩ thuật điện tử tàu thủy"]', '["Kiểm soát hoạt động, bảo trì, bảo dưỡng, sửa chữa thiết bị cơ khí, điện, điện tử và máy móc trên tàu", "Mua sắm nhiên liệu và các đồ dùng dự trữ trong khoang máy tàu thủy cũng như duy trì ghi chép các hoạt động", "Giám sát kĩ thuật việc lắp đặt, bảo trì, sửa chữa máy móc và thiết bị tàu thủy nhằm đảm bảo việc tuần thủ các qui định, yêu cầu kĩ thuật", "Kiểm tra và tiến hành bảo trì, sửa chữa khẩn cấp các động cơ, máy móc và thiết bị phụ trợ", "Trực ca buồng máy, giám sát, theo dõi, ghi chép hoạt động của các động cơ, máy móc và thiết bị phụ trợ"]', '["Các tàu thuyền trên biển", "Làm việc trên bờ đảm nhận việc bảo trì, bảo dưỡng tàu, cảng và các phương tiện vận chuyển hàng hoá", "Các công ty thiết kế và công nghiệp tàu thủy", "Các cơ quan nghiên cứu liên quan đến việc phát triển các dụng cụ thiết bị kĩ thuật hàng hải hiệu quả", "Các cơ quan Nhà nước về vận tải hàng hải, công nghiệp tàu thủy"]', TRUE),
-    ('Công an', 'ERC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Làm việc với con người', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Công an thi hành các qui định luật pháp và trật tự xã hội, đảm bảo ổn định cho xã hội, trật tự kỉ cương, bảo vệ lợi ích của nhà nước trong xã hội, các quyền và lợi ích hợp pháp của công dân.', '["Cảnh sát cơ động", "Cảnh sát hình sự", "Cảnh sát kinh tế", "Cảnh sát giao thông", "Cảnh sát môi trường", "Cảnh sát đặc nhiệm", "Cảnh sát điều tra", "Cảnh sát quản lí hành chính và trật tự xã hội", "Cảnh sát phòng cháy chữa cháy"]', '["Phòng ngừa, phát hiện, đấu tranh chống tội phạm và vi phạm pháp luật về trật tự, an toàn xã hội, BVMT", "phát hiện nguyên nhân, điều kiện phát sinh tội phạm, vi phạm pháp luật khác và kiến nghị biện pháp khắc phục", "tham gia giáo dục đối tượng vi phạm pháp luật tại cộng đồng theo qui định của pháp luật", "Quản lí hộ khẩu, cấp giấy chứng minh nhân dân", "quản lí con dấu", "quản lí về an ninh, trật tự các nghề kinh doanh có điều kiện và dịch vụ bảo vệ", "quản lí và bảo đảm trật tự, an toàn giao thông, trật tự công cộng", "quản lí vũ khí, vật liệu nổ", "quản lí, thực hiện công tác phòng cháy, chữa cháy", "tham gia cứu hộ, cứu nạn theo qui định của pháp luật", "Thi hành án hình sự, thi hành án không phải phạt tù, tạm giữ, tạm giam", "bảo vệ, hỗ trợ tư pháp", "Điều tra các vụ án theo nguyên tắc tố tụng hình sự và bộ luật hình sự", "Thực hiện nhiệm vụ, quyền hạn khác theo qui định của pháp luật"]', '["Các cơ quan thuộc Bộ công an", "Sở, phòng cảnh sát", "Trại giam"]', TRUE),
-    ('Vũ công và biên đạo múa', 'ASE', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Năng lực hình học -màu sắc - thiết kế', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự kiên trì', 'Thành tựu', 'Biên đạo múa sáng tác các điệu múa. Vũ công là người biểu diễn các điệu múa.', '["Biên đạo múa", "Diễn viên múa", "Múa dân tộc", "Múa hiện đại", "Khiêu vũ thể thao"]', '["Tìm hiểu và sáng tác các điệu nhảy, bài múa. Các tiết mục này thường chuyển tải một câu chuyện, một chủ đề, ý tưởng hoặc tâm trạng bằng các động tác di chuyển các bước chân, chuyển động và cử chỉ", "Biểu diễn các điệu nhảy, bài múa đơn, múa đôi hoặc cùng với nhiều thành viên của một nhóm múa"]', '["Các nhà hát, đoàn ca nhạc, nhạc vũ kịch", "Các nhà văn hóa", "Các nhóm múa, nhóm nhảy", "Các đài truyền hình", "Các hãng phim", "Hành nghề tự do"]', TRUE),
-    ('Kĩ thuật xây dựng', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Cán bộ kĩ thuật xây dựng thực hiện các nhiệm vụ kĩ thuật trong nghiên cứu kĩ thuật dân dụng, thiết kế, xây dựng, thực hiện, duy tu và sửa chữa các nhà cao tầng và các công trình xây dựng khác như cung cấp nước, hệ thống xử lí nước thải, cầu, đường, đập nước và sân bay.', '["Cốp pha - giàn giáo", "Kĩ thuật cốt thép", "Cấp thoát nước", "Nề", "Công nghệ xây dựng", "Kĩ thuật xây dựng mỏ", "Xây dựng cầu đường", "Lắp đặt cầu", "Lắp đặt giàn khoan", "Xây dựng và bảo trì đường sắt", "Xây dựng và cải thiện công trình thủy lợi", "Xây dựng công trình thủy lợi", "Bảo trì và sửa chữa sân bay", "Kiểm tra và Kiểm định chất lượng cầu đường"]', '["Thực hiện và hỗ trợ các thử nghiệm trong thực tế và trong phòng thí nghiệm đất trồng và các nguyên vật liệu xây dựng", "Cung cấp hỗ trợ kĩ thuật liên quan tới việc xây dựng nhà cao tầng và các công trình xây dựng khác và với các cuộc điều tra hoặc việc chuẩn bị các báo cáo điều tra", "Đảm bảo sự tương thích giữa các đặc điểm kĩ thuật trong thiết kế, với luật pháp và các qui định liên quan, và duy trì các tiêu chuẩn theo yêu cầu của công việc và của nguyên vật liệu", "Áp dụng kiến thức kĩ thuật về xây dựng và các nguyên tắc kĩ thuật dân dụng và thực tế để xác định và giải quyết các vấn đề phát sinh", "Hỗ trợ việc chuẩn bị các dự toán chi tiết về kĩ thuật và giá cả nguyên vật liệu và nhân công theo yêu cầu của dự án, theo yêu cầu kĩ thuật đã đề ra", "Tổ chức duy tu và sửa chữa", "Giám sát các công nhân khác"]', '["Các công ty xây dựng", "Các phòng quản lí nhà đất - đô thị quận, huyện, phường, xã hoặc các ban dự án xây dựng công trình", "Tự kinh doanh độc lập"]', TRUE),
-    ('Kĩ thuật thủy lợi', 'RIC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Cán bộ kĩ thuật thủy lợi lập qui hoạch, thiết kế và duy tu các hệ thống vận chuyển và phân phối nước cho các vùng sản xuất nông nghiệp và các cụm dân cư. Họ giám sát việc xây dựng, lắp đặt các hệ thống phân phối, tưới tiêu và vận hành sao cho đạt kết quả tối ưu cho trồng trọt hoặc nuôi trồng.', '["Quản lí và khai thác công trình thủy lợi", "Quản lí thủy nông", "Cấp thoát nước", "Thủy lợi tổng hợp", "Thủy điện"]', '["Tiến hành công tác quản lí kĩ thuật thi công tại dự án thủy lợi", "Thực hiện công tác hồ sơ hoàn công, nghiệm thu, thanh quyết toán", "Lập hồ sơ hồ sơ hoàn công các công trình xây dựng thuỷ lợi, thủy điện. Vẽ biện pháp thi công chi tiết cho các hạng mục công trình", "Kiểm soát kĩ thuật, khối lượng thi công tại các công trình thuỷ điện", "Giám sát vận hành các công trình thủy lợi", "Chỉ đạo sửa chữa, cải tạo các công trình thủy lợi: đê, kè, đập, cống, hệ thống cấp thoát nước..."]', '["Các cơ quan quản lí thủy lợi", "Các công ty xây dựng công trình thủy lợi", "Các công ty cấp và thoát nước", "Các trang trại, các doanh nghiệp nông nghiệp", "Các nhà máy thủy điện"]', TRUE),
-    ('Chuyên viên hỗ trợ công nghệ thông tin', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Cán bộ kĩ thuật điện trong ngành CNTT&amp;amp;TT làm công tác kĩ thuật về hệ thống điện của các thiết bị CNTT&amp;amp;TT. Họ lắp đặt, bảo trì, vận hành và sửa chữa hệ thống điện của máy tính, điện thoại…', '["Thiết bị hàng hải", "Công nghệ truyền dẫn quang và vô tuyến", "Công nghệ nguồn thông tin và điện", "Công nghệ thiết bị ra đa", "Công nghệ lắp đặt trạm viễn thông", "Công nghệ mạng ngoại vi và thiết bị đầu cuối"]', '["Lắp đặt thiết bị ngoại vi (như bộ nguồn, dây cáp, máy biến áp) cho phần cứng theo thiết kế hoặc các thông số kĩ thuật", "Thực hiện sửa chữa các bộ phận điện của các thiết bị công nghệ thông tin"]', '["Các doanh nghiệp sản xuất phần cứng máy tính, điện thoại, thiết bị viễn thông", "Các doanh nghiệp cung cấp dịch vụ bảo trì phần cứng"]', TRUE),
-    ('Kĩ thuật điện trong phát và truyền tải điện', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Cán bộ kĩ thuật điện trong phát và truyền tải điện làm công việc vận hành bảng điều khiển và máy móc thiết bị của nhà máy phát điện và các công ty truyền tải, hoặc sửa chữa bảo dưỡng phần điện của nhà máy, trạm, đường dây.', '["Vận hành điện trong nhà máy điện", "Vận hành nhà máy thuỷ điện", "Vận hành nhà máy nhiệt điện", "Vận hành và sửa chữa trạm thủy điện", "Đo điện", "Điện dân dụng", "Sửa chữa đường dây dòng điện", "Lắp đặt đường dây tải điện và trạm biến áp có điện áp từ 220 KV trở lên", "Lắp đặt đường dây tải điện và trạm biến áp có điện áp từ 110 kV trở xuống", "Quản lí, vận hành và sửa chữa đường dây tải điện và trạm biến áp có điện áp từ 220 kV trở lên", "Quản lí, vận hành và sửa chữa đường dây tải điện và trạm biến áp có điện áp từ 110 kV trở xuống", "Máy phát điện diesel", "Kĩ thuật điện khí hóa nông thôn"]', '["Vận hành và kiểm soát hệ thống và các thiết bị phát điện bao gồm tua-bin, máy phát điện, tụ điện và bộ kháng điện các nhà máy thủy điện, nhà máy nhiệt điện, nhà máy than, dầu, khí thiên nhiên và nhà máy hạt nhân để tạo ra và phân phối điện", "Kiểm soát việc khởi động và tắt các thiết bị nhà máy điện, kiểm soát hoạt động đóng ngắt, điều chỉnh mực nước và liên lạc với những người vận hành khác để điều chỉnh tải trọng", "Ghi lại các con số từ các biểu đồ, dụng cụ đo và đồng hồ trong khoảng thời gian thiết lập", "Vệ sinh và bảo trì các thiết bị như máy phát điện, thiết bị bốc hơi, tua-bin và máy bơm để ngăn chặn mất hoặc sụt điện"]', '["Tất cả các nhà máy phát điện", "Tất cả công ty truyền tải điện"]', TRUE),
-    ('Kĩ thuật tua-bin', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Tua-bin là các thiết bị cơ khí sản xuất năng lượng bằng cách xoay nhờ các tác động gió, khí hoặc chất lỏng. Cán bộ kĩ thuật tua-bin làm công việc lắp đặt, bảo trì và sửa chữa các thiết bị này', '["Kĩ thuật nồi hơi", "Kĩ thuật tua-bin gió", "Kĩ thuật tua-bin nước", "Kĩ thuật tua-bin khí", "Lắp đặt và kiểm tra nồi hơi và tua-bin"]', '["Vận hành, giám sát và kiểm tra các loại tua-bin như tua-bin khí, nước, gió và hơi nước", "Vận hành và giám sát các tua-bin để phát điện và phân phối điện", "Kiểm soát việc khởi động và tắt các thiết bị tua-bin, kiểm soát hoạt động đóng ngắt, điều chỉnh mực nước và liên lạc với những người vận hành khác để điều chỉnh tải trọng", "Ghi lại các con số từ các biểu đồ, dụng cụ đo và đồng hồ trong khoảng thời gian thiết lập", "Vệ sinh và bảo trì các thiết bị như máy phát điện, thiết bị bốc hơi, tua-bin, máy bơm để ngăn chặn mất hoặc sụt điện"]', '["Các nhà máy phát điện", "Các công ti, nhà máy, phân xưởng sản xuất có sử dụng tua-bin"]', TRUE),
-    ('Kĩ thuật viên phần cứng máy tính', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Công nghệ thông tin và truyền thông (CNTT&amp;amp;TT) là lĩnh vực liên quan đến tất cả các hình thức truyền thông điện tử, bao gồm điện thoại, máy tính và điện thoại di động. Các kĩ thuật viên trong lĩnh vực này cung cấp hỗ trợ kĩ thuật cho người sử dụng một cách trực tiếp hoặc thông qua điện thoại, thư điện tử hoặc các thiết bị điện tử khác. Họ chẩn đoán và giải quyết các trục trặc về phần cứng, thiết bị ngoại vi, máy tính, mạng, cơ sở dữ liệu và internet. Họ cũng hướng dẫn và hỗ trợ triển khai, lắp đặt và bảo trì các hệ thống này', '["Chế tạo và lắp ráp máy tính", "Kết nối mạng và các mạng cục bộ", "Sửa chữa và bảo trì", "Chuyên về các bộ phận cụ thể của máy tính (ví dụ thiết bị lưu trữ, xử lí)", "Lắp ráp và sửa chữa máy tính", "Thiết kế vi mạch điện tử trên máy tính"]', '["Cài đặt và thực hiện sửa chữa phần cứng, thiết bị ngoại vi theo bản thiết kế hoặc thông số kĩ thuật lắp đặt", "Thiết lập thiết bị và mạng dịch vụ hoặc bảo đảm cài đặt các loại cáp, hệ điều hành hoặc phần mềm phù hợp", "Trả lời về cách giải quyết vấn đề do người sử dụng nêu ra", "Giám sát hoạt động hàng ngày của hệ thống máy tính và hệ thống truyền thông", "Cung cấp cho người sử dụng các tư vấn, hướng dẫn kĩ thuật và các tài liệu khác để họ nghiên cứu và giải quyết các vấn đề phát sinh"]', '["Các doanh nghiệp lắp ráp, kinh doanh thiết bị CNTT", "Các doanh nghiệp truyền thông, hệ thống thông tin và mạng máy tính", "Các dịch vụ lắp ráp, sửa chữa máy tính và mạng", "Chuyên viên CNTT trong các doanh nghiệp", "Ngành khoa học máy tính", "Ngành công nghệ kĩ thuật phần cứng máy tính"]', TRUE),
-    ('Kĩ thuật viên điện đài hàng hải', 'CRE', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Ngôn ngữ', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ thuật viên điện đài trên tàu thủy điều hành hoạt động của thiết bị vô tuyến trên tàu để nhận và truyền tải điện văn mã hóa từ điện thoại vô tuyến hoặc hệ thống điện báo vô tuyến.', '["Các chuyên ngành liên quan đến các loại thiết bị thông tin liên lạc (ví dụ: ra-đa, radio)"]', '["Thiết lập và điều chỉnh các thiết bị hoạt động trên tần số mong muốn", "Duy trì liên lạc thường xuyên với các trạm phát thanh ven biển gần nhất để thu được dự báo thời tiết, tín hiệu báo giờ, báo cáo các thông tin cần thiết về hướng đi và vị trí của tàu", "Thường xuyên theo dõi để nhận tín hiệu từ các tàu bị nạn", "Cung cấp các cảnh báo hàng hải và báo cáo tình hình thời tiết", "Duy trì hoạt động của các thiết bị vô tuyến, ghi chép điện văn nhận được hoặc gửi đi và thực hiện các sửa chữa nhỏ, thay thế các bộ phận", "Bảo trì thiết bị ra đa"]', '["Các doanh nghiệp vận chuyển đường thủy bao gồm cả doanh nghiệp Nhà nước và doanh nghiệp tư nhân"]', TRUE),
-    ('Kĩ thuật viên cơ khí trong sản xuất, lắp ráp và sửa chữa', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên cơ khí trong sản xuất, lắp ráp và sửa chữa là những kĩ thuật viên được đào tạo về sản xuất, lắp ráp, bảo trì và sửa chữa các bộ phận cấu thành của tất cả các loại máy móc cơ khí, bao gồm cả động cơ và tua-bin.', '["Sản xuất và lắp đặt thiết bị cơ khí", "Kĩ thuật lắp đặt và xử lí đường ống", "Chế tạo và lắp dựng kết cấu thép", "Bảo trì đầu máy xe lửa", "Sửa chữa máy dệt", "Sửa chữa máy", "Sửa chữa thiết bị", "Sửa chữa thang máy", "Sửa chữa máy móc xây dựng", "Sửa chữa thiết bị", "Bảo trì hệ thống thiết bị", "Sửa chữa và lắp đặt thiết bị lạnh"]', '["Xem xét các thông số kĩ thuật, sơ đồ và bản vẽ để xác định các tài liệu và hướng dẫn cần thiết", "Lắp ráp và lắp đặt các bộ phận sẵn có", "Làm các chi tiết để tạo thành bộ phận lắp ráp", "Lắp ráp các máy móc, động cơ và thành phẩm cơ khí", "Sửa chữa các loại máy móc"]', '["Tất cả ngành công nghiệp", "Các doanh nghiệp cung cấp các loại máy móc thiết bị khác nhau cho công nghiệp và gia dụng", "Mở xưởng cơ khí sửa chữa riêng"]', TRUE),
-    ('Kĩ thuật viên giao thông vận tải', 'IRC', 'Thể chất - Cơ khí', NULL, 'Phân tích - logic', 'Thể chất - cơ khí', 3, NULL, NULL, NULL, 'Kĩ thuật viên giao thông vận tải là những người làm kĩ thuật chuyên môn trong việc đảm bảo hoạt động thông suốt của tất cả các loại phương tiện vận tải công cộng như taxi, xe buýt, xe lửa, xe điện cũng như các loại phương tiện đường thủy như tàu, thuyền, phà và xuồng.', '["Tín hiệu đường sắt", "Kiểm soát việc chạy tàu", "Quản lí tàu", "Lái xe chuyên dụng", "Kiểm soát giao thông đường thủy nội địa", "Kiểm soát vận chuyển bằng tàu thủy", "Điện đầu máy xe lửa và toa xe lửa", "Lắp đặt và sửa chữa hệ thống tải điện đường sắt"]', '["Bảo dưỡng, bảo trì, kiểm tra và sửa chữa các phương tiện vận tải trên bộ như xe tải, xe buýt và xe lửa", "Bảo dưỡng, bảo trì, kiểm tra và sửa chữa các phương tiện vận tải đường thủy như tàu thuyền, phà, xuồng và tàu thủy", "Thay thế các bộ phận hỏng hóc để đảm bảo thông suốt lịch trình vận tải của phương tiện đó"]', '["Các đơn vị giao thông công cộng", "Ngành đường sắt", "Các doanh nghiệp vận tải đường bộ như vận tải ô tô, xe khách", "Các doanh nghiệp vận tải đường thuỷ nội địa trên sông, hồ, kênh đào… bằng tàu, thuyền, phà và xuồng", "Các doanh nghiệp vận tải hàng hóa và giao nhận hàng nội địa"]', TRUE),
-    ('Kĩ thuật viên khai thác mỏ', 'REI', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên khai thác mỏ làm công việc hỗ trợ kĩ thuật để thăm dò khoáng sản, kim loại và dầu khí (như than, vàng, sắt, dầu thô, khí thiên nhiên) trên đất liền hoặc dưới biển, khai thác, vận chuyển và lưu trữ quặng và nguyên liệu thô có chứa khoáng chất, đảm bảo an toàn vệ sinh lao động và giảm thiểu tác động môi trường.', '["Vận hành thiết bị sàng quặng kim loại", "Khoan nổ mìn", "Khoan đường hầm", "Khoan và khai thác mỏ", "Vận hành máy nén khí, máy bơm, quạt gió", "Vận hành nhà máy khí hóa than", "Khảo sát thủy văn", "Khoan thăm dò địa chất", "Sửa chữa thiết bị khai thác mỏ bằng điện", "Điện trong khai thác mỏ hầm lò"]', '["Hỗ trợ kĩ thuật liên quan đến nghiên cứu và phát triển các phương pháp tiến bộ để thăm dò, khai thác, vận chuyển và lưu trữ khoáng sản", "Hỗ trợ kĩ thuật về thăm dò địa chất và đo vẽ địa hình để xác định vị trí tập trung các khoáng sản trên đất liền và dưới biển", "Làm đánh giá chi tiết về số lượng, chi phí nguyên vật liệu, lao động cho việc thăm dò, khảo sát, chiết xuất và vận chuyển", "Xây dựng, lắp đặt, vận hành, bảo dưỡng và sửa chữa các thiết bị thăm dò, khai thác, chiết xuất và vận chuyển quặng khoáng và thiết bị toàn và môi trường", "Áp dụng các kĩ thuật khai thác mỏ để khai thác, chiết xuất, vận chuyển và lưu trữ quặng, khoáng sản", "Tuân thủ chặt chẽ các qui trình và thiết bị vệ sinh an toàn lao động, giảm thiểu tác động môi trường"]', '["Các doanh nghiệp khai thác mỏ, khoáng sản, dầu khí", "Các doanh nghiệp khảo sát khoáng sản", "Các cơ quan quản lí Nhà nước về khai thác khoáng sản"]', TRUE),
-    ('Kĩ thuật viên luyện kim', 'RCI', 'Thể chất - Cơ khí', NULL, 'Phân tích - logic', 'Thể chất - cơ khí', 3, NULL, NULL, NULL, 'Kĩ thuật viên luyện kim làm công việc hỗ trợ kĩ thuật trong nghiên cứu và phát triển các phương pháp tiến bộ để chiết xuất kim loại từ quặng và luyện kim loại. Đó là những công việc liên quan đến chiết xuất kim loại, tinh chế thành các loại kim loại khác nhau, pha trộn kim loại thành hợp kim và chế biến kim loại theo mục đích sử dụng trong các ngành công nghiệp khác nhau.', '["Quản lí kinh doanh bất động sản", "Quản lí nhà và đất"]', '["Hỗ trợ kĩ thuật liên quan đến nghiên cứu và phát triển các phương pháp để xác định các tính chất của kim loại và hợp kim mới", "Hỗ trợ kĩ thuật về các thiết bị tinh luyện và xử lí kim loại", "Ứng dụng các nguyên lí luyện kim để chiết xuất kim loại từ quặng thô", "Xử lí và tinh chế kim loại đã chiết xuất", "Chế biến kim loại theo mục đích sử dụng trong các ngành công nghiệp khác nhau", "Kiểm soát tác động môi trường của quá trình luyện kim"]', '["Các công ty bất động sản", "Tự mở công ty bất động sản"]', TRUE),
-    ('Vận hành máy móc', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên kĩ thuật cơ khí vận hành máy móc giám sát, vận hành và kiểm tra tại chỗ hoặc bằng điều khiển từ xa hoạt động của các loại máy móc và thiết bị. Có rất nhiều loại máy móc thiết bị khác nhau và nhiệm vụ cụ thể của người vận hành phụ thuộc vào loại máy móc thiết bị và vị trí cụ thể của người đó. Về cơ bản họ có một số nhiệm vụ chung như sau.', '["Máy móc thiết bị kiểm soát qui trình, có áp dụng điều khiển tự động trong sử dụng năng lượng, xử lí rác và nước, tinh chế dầu khí, sản xuất hóa chất, kim loại", "Máy móc thiết bị cố định trong khai thác khoáng sản, sản xuất hóa học, phim ảnh, giấy, nhựa, cao su, dệt, da, thực phẩm, gỗ, thủy tinh, gốm, đóng gói", "Động cơ hơi nước và nồi hơi", "Thiết bị công trình nền móng", "Thiết bị xây dựng đường và đường sắt", "Thiết bị xây dựng"]', '["Vận hành và giám sát hoạt động của máy móc thiết bị, qui trình theo hướng dẫn vận hành", "Kiểm soát quá trình khởi động và tắt", "Phát hiện sai lỗi, hỏng hóc và điều chỉnh, sửa chữa", "Đọc thông số trên máy đo, đồ thị ở những thời điểm nhất định", "Kiểm tra sản phẩm đầu ra và chỉnh máy để sản phẩm đạt yêu cầu kĩ thuật", "Bảo dưỡng, bảo trì và vệ sinh máy móc thiết bị", "Ghi chép và lưu trữ hồ sơ vận hành", "Giám sát công nhân có liên quan"]', '["Tất cả các ngành công, nông, lâm nghiệp đều đòi hỏi phải có người vận hành các loại máy khác nhau"]', TRUE),
-    ('Kĩ thuật viên vận hành thiết bị lọc dầu và khí thiên nhiên', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên vận hành nhà máy lọc dầu và khí thiên nhiên, còn gọi là người vận hành thiết bị tinh chế dầu và khí thiên nhiên, làm công tác vận hành và giám sát hoạt động của các hệ thống máy móc thiết bị, điều chỉnh, duy tu bảo dưỡng các thiết bị chế biến, lọc, tinh chế, chưng cất và xử lí dầu thô và các sản phẩm từ dầu hoặc khí thiên nhiên.', '["Sản xuất khí đốt, vận hành trạm khí đốt tự nhiên hóa lỏng", "Vận hành thiết bị hóa dầu", "Vận hành thiết bị khai thác dầu mỏ", "Sửa chữa thiết bị khai thác dầu mỏ", "Vận hành thiết bị xử lí dầu mỏ", "Vận hành trạm phân phối sản phẩm dầu mỏ", "Vận hành hệ thống đường ống nhà máy và đường ống dẫn khí", "Vận hành nhà máy lọc dầu", "Vận hành thiết bị khí thiên nhiên để sản xuất phân đạm"]', '["Vận hành bảng điều khiển điện tử hoặc máy tính từ phòng điều khiển trung tâm để giám sát và theo dõi các qui trình vật lí và hóa học của một số thiết bị xử lí", "Điều chỉnh các thiết bị, các van, các máy bơm, các thiết bị quản lí và xử lí", "Kiểm soát quá trình khởi động và kết thúc, giải quyết sự cố và quản lí các thiết bị xử lí bên ngoài", "Xác minh sự cố của các thiết bị, kiểm tra các ống dẫn khí xem có sự rò rỉ, nết gãy và sắp xếp việc duy tu bảo dưỡng", "Phân tích các sản phẩm mẫu, thực hiện các bài test, ghi nhận lại dữ liệu và viết các bản ghi sản phẩm", "Giám sát các công nhân khác"]', '["Các nhà máy lọc dầu và khí thiên nhiên", "Các nhà máy sản xuất sản phẩm từ dầu khí"]', TRUE),
-    ('Kĩ thuật viên môi trường', 'IRC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Kĩ thuật viên bảo vệ môi trường (BVMT) tiến hành các xét nghiệm trong phòng thí nghiệm và trên thực địa để giám sát môi trường và phát hiện nguồn gốc vấn đề, kể cả những vấn đề gây ảnh hưởng tới sức khỏe. Họ làm việc dưới sự chỉ đạo của các kĩ sư và nhà khoa học môi trường.', '["BVMT đô thị", "BVMT công nghiệp", "BVMT biển", "Vi sinh – hóa sinh", "Quản lí tài nguyên và môi trường", "Công nghệ kĩ thuật môi trường", "Xử lí nước thải", "Xử lí chất thải rắn", "Bảo hộ lao động và môi trường"]', '["Khảo sát các địa điểm, kể cả nơi công cộng và doanh nghiệp, nhằm đảm bảo không có nguy cơ môi trường, sức khỏe và an toàn", "Lắp đặt và bảo dưỡng các thiết bị giám sát mức độ ô nhiễm như cảm biến đo ô nhiễm khói xe", "Thu thập mẫu không khí, đất, nước và các mẫu vật khác để làm xét nghiệm", "Dán nhãn, viết nguồn gốc và đảm bảo tính nghiêm túc của mẫu vật chuyển về phòng thí nghiệm", "Tiến hành thí nghiệm để xác định và lượng hóa mức độ ô nhiễm của mẫu vật", "Làm biểu đồ và báo cáo kết quả thí nghiệm", "Trao đổi kết quả và phân tích với khách hàng"]', '["Các cơ quan BVMT", "Trong bộ phận lập kế hoạch và thực hiện kế hoạch BVMT của các công ty lớn", "Các viện nghiên cứu, phòng thí nghiệm liên quan đến các vấn đề về môi trường"]', TRUE),
-    ('Kĩ thuật viên lâm nghiệp', 'RIE', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ thuật viên lâm nghiệp thực hiện các hoạt động nuôi dưỡng, bảo tồn và khai thác rừng khi cần thiết để bán hoặc phân phối các sản phẩm lâm nghiệp một cách thường xuyên cho người mua buôn, tổ chức buôn bán thương mại hoặc tại các chợ.', '["Quản lí phát triển", "Quản lí môi trường", "Kinh tế lâm nghiệp", "Quản lí lâm nghiệp", "Lâm nghiệp", "Quản lí tài nguyên rừng", "Lâm sinh"]', '["Điều tra, kiểm đếm, đo lường các nguồn tài nguyên rừng như cây cối, động vật thực vật hoang dã…", "Hỗ trợ lập kế hoạch quản lí và khai thác rừng", "Hỗ trợ lập kế hoạch và giám sát xây dựng các tuyến đường trong rừng", "Thực hiện và giám sát kĩ thuật các hoạt động lâm nghiệp như ươm trồng và chăm sóc rừng, xác định những cây rừng có thể khai thác và ước lượng khối lượng gỗ khai thác, cắt cành, tỉa ngọn, chặt cây, cưa khúc, tạo sản phẩm thô từ gỗ đã đốn", "Tham gia quản lí và chăm sóc rừng, điều phối các hoạt động như khai thác gỗ, phòng chống cháy rừng, kiểm soát bệnh và côn trùng, tỉa bớt cây tạp trong khu rừng trước khi khai thác thương mại", "Liên tục theo dõi để phát hiện cháy rừng và tham gia chữa cháy", "Đảm bảo tuân thủ các qui định về bảo vệ môi trường, sử dụng tài nguyên, phòng chống hỏa hoạn và tai nạn trong rừng", "8. Hỗ trợ nghiên cứu lâm nghiệp"]', '["Các cơ quan kiểm lâm", "Các trại ươm cây giống", "Các cơ quan nghiên cứu và thực nghiệm về lâm nghiệp", "Các cơ quan quản lí Nhà nước ở địa phương có rừng"]', TRUE),
-    ('Thuyền viên - Điều khiển phương tiện hàng hải', 'REC', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Hoa tiêu và nhân viên văn phòng trên tàu chỉ huy và điều khiển tàu thủy và các tàu chở hàng tương tự, thực hiện các chức năng liên quan trên biển.', '["Điều khiển tàu thủy", "Ổn định tàu"]', '["Chỉ huy và điều khiển tàu thủy và các tàu chở hàng tương tự trên biển hoặc đường thủy nội địa", "Kiểm soát và tham gia vào các hoạt động canh gác trên boong hoặc trên cầu", "Điều khiển tàu ra và vào cảng và qua kênh, rạch, eo biển và hải phận khác cần có kiến thức chuyên môn", "Đảm bảo an toàn cho hàng hóa bốc dỡ, bảo đảm sự tuân thủ các qui định và qui trình về an toàn của thủy thủ và hành khách", "Giám sát kĩ thuật đối với việc duy trì và bảo dưỡng tàu thủy để đảm bảo đồng bộ với các chi tiết hoặc qui định", "Áp dụng các kiến thức về qui tắc và thực tiễn liên quan đến hoạt động tàu biển và hàng hải để xác định và giải quyết các vấn đề nảy sinh trong công việc", "Đặt hàng đồ dự trữ trên tàu và tuyển dụng thủy thủ theo yêu cầu và duy trì hoạt động tàu", "Chuyển và nhận lịch trình và các thông tin khẩn cấp với các trạm trên biển và các tàu khác", "Giám sát các thuyền viên khác"]', '["Các tàu chở hàng, chở dầu, chở hành khách và tàu thuyền khác", "Các công ty vận tải đường biển và đường sông nội địa và quốc tế", "Các cảng biển, cảng sông"]', TRUE),
-    ('Phi công', 'RIE', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Phi công phương tiện bay và kĩ thuật viên hỗ trợ liên quan kiểm soát hoạt động của các thiết bị cơ khí, điện và điện tử để điều khiển phương tiện bay vận chuyển hành khách, thư tín, hàng hóa và thực hiện các nhiệm vụ trước và trong khi bay.', '["Phi công chở khách", "Phi công vận tải", "Phi công trực thăng", "Phi công quân sự"]', '["Bay và điều khiển máy bay, phương tiện bay theo qui trình hoạt động và kiểm soát đã được thiết lập", "Chuẩn bị và trình kế hoạch bay hoặc kiểm tra kế hoạch bay tiêu chuẩn", "Kiểm tra các thiết bị cơ khí, điện tử và bảo đảm rằng các dụng cụ và thiết bị kiểm soát hoạt động chính xác", "Áp dụng các qui tắc và thực tiễn liên quan đến hoạt động bay để xác định và giải quyết các vấn đề nảy sinh trong công việc", "Kiểm tra các lịch trình bảo dưỡng và thực hiện thanh tra phương tiện bay vận hành tốt, được bảo dưỡng và các thiết bị đều sẵn sàng", "Kí các chứng chỉ cần thiết và bảo đảm lịch trình bay chính thức", "Nhận chỉ thị và giấy phép trước chuyến bay và duy trì liên lạc với giao thông hàng không và kiếm soát không lưu trong suốt chuyến bay"]', '["Quân đội", "Các hãng hàng không dân dụng", "Các công ty bay dịch vụ", "Các tổ chức, cá nhân có máy bay riêng"]', TRUE),
-    ('Kiểm soát viên không lưu', 'EC', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 4, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kiểm soát viên không lưu, còn gọi là kiểm soát viên giao thông đường hàng không, hướng dẫn hướng bay trên không trung, và dưới mặt đất qua các thiết bị như đài, ra-đa hay hệ thống đèn và cung cấp thông tin cần thiết cho hoạt động của phương tiện bay.', '["Không quân, chuyên đào tạo phi công và quản lí không lưu trong thời kì chiến tranh", "Hàng không nội địa, chuyên ngành hàng không chở hành khách"]', '["Hướng dẫn và điều khiển phương tiện bay hạ cánh và cất cánh và các thao tác trên mặt đất", "Hướng dẫn và kiểm soát phương tiện bay hoạt động trong không phận cho phép", "Kiểm tra và phê chuẩn kế hoạch bay", "Thông báo cho đội bay và phi hành đoàn về điều kiện thời tiết, các điều kiện hoạt động, kế hoạch bay và giao thông hàng không", "Áp dụng các kiến thức về qui tắc và thực tiễn liên quan đến điều khiển giao thông hàng không để xác định và giải quyết các vấn đề nảy sinh trong công việc", "Ban hành và tổ chức tình trạng khẩn cấp, các dịch vụ và qui trình nghiên cứu, và giải cứu", "Chỉ đạo hoạt động của các phương tiện bay và phương tiện dịch vụ tại hoặc gần đường băng", "Duy trì liên lạc qua điện đài và điện thoại với các đài kiểm soát lân cận, các trạm kiểm soát đón khách hay các trung tâm kiểm soát khác, và phối hợp hoạt động của phương tiện bay vào các khu vực lân cận"]', '["Đài chỉ huy các sân bay dân sự và quân sự", "Trung tâm kiểm soát không lưu và tiếp cận đường dài"]', TRUE),
-    ('Kĩ thuật viên y tế và công nghệ y học hạt nhân', 'RSC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Hiện nay, ngành y tế ứng dụng nhiều công nghệ hạt nhân qua sử dụng các vật liệu phóng xạ để hỗ trợ chẩn đoán và điều trị bệnh. Kĩ thuật viên công nghệ y học hạt nhân làm công việc vận hành máy móc liên quan đến y học hạt nhân, như máy chụp cắt lớp, chụp cộng hưởng từ, máy chạy tia gamma...', '["Chuyên sâu về các loại thiết bị cụ thể (như máy chụp CT scan, máy chụp cắt lớp phát xạ - PET scan)", "Lập trình máy tính điều khiển các thiết bị này", "Chuyên sâu về các hình thức xét nghiệm cụ thể (như đo mật độ xương)"]', '["Bảo trì và vận hành các thiết bị liên quan đến y học hạt nhân bao gồm: Máy camera tia gamma, Máy chụp cắt lớp điện toán (CT scan), Thiết bị chụp cộng hưởng từ (MRI), Các hệ thống máy tính điều khiển", "Chuẩn bị và quản lí phóng xạ cho bệnh nhân như dùng chất phóng xạ đánh dấu để xác định bất thường ở các cơ quan trong cơ thể người bệnh", "Đọc kết quả chụp quét, viết và chuyển báo cáo kết quả cho bệnh nhân và bác sĩ", "Sử dụng hóa chất để điều trị bệnh nhân ung thư", "Đảm bảo rằng các chất phóng xạ được lưu trữ và xử lí an toàn", "Theo dõi tất cả các thiết bị an toàn", "Hỗ trợ nghiên cứu", "Hỗ trợ giảng dạy và quản lí sinh viên"]', '["Các bệnh viện, cơ sở y tế", "Các phòng thí nghiệm y tế", "Các bệnh viện đào tạo thực hành", "Các trung tâm nghiên cứu"]', TRUE),
-    ('Kĩ thuật viên phòng xét nghiệm', 'IRC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên phòng xét nghiệm trong các bệnh viện, cơ sở y tế, pháp y, còn gọi là kĩ thuật viên phòng thí nghiệm y tế, tiến hành các xét nghiệm sinh hóa, kiểm tra bằng kính hiển vi và soi vi khuẩn trong phòng thí nghiệm để kiểm tra máu, mô và các chất dịch của bệnh nhân, tử thi để tìm ra nguyên nhân gây bệnh hoặc tử vong.', '["Hóa sinh", "Hóa học lâm sàng", "Tế bào học", "Công nghệ tế bào", "Huyết học", "Mô học", "Miễn dịch học", "Vi sinh vật", "Khoa học truyền dịch", "Kĩ thuật kiểm tra y tế", "Kĩ thuật thiết bị phòng thí nghiệm", "Pháp y"]', '["Thu thập mẫu xét nghiệm từ cơ thể người bệnh như máu, các mô và các chất bài tiết khác của cơ thể để và làm các xét nghiệm phù hợp", "Kiểm tra các mô lấy từ cơ thể người để xác định nguồn gốc và bản chất bệnh bằng cách sử dụng kính hiển vi và các công cụ khác", "Chẩn đoán bản chất bệnh trên cơ sở các phân tích hóa học và báo cáo kết quả cho bác sĩ điều trị của bệnh nhân", "Lập kế hoạch và tiến hành thí nghiệm để nghiên cứu quá trình bệnh lí, tử vong", "Thực hiện khám nghiệm tử thi (khám nghiệm cơ thể người đã chết) để nghiên cứu tình trạng rối loạn của cơ thể hoặc nguyên nhân tử vong"]', '["Các phòng thí nghiệm", "Các bệnh viện, trung tâm y tế, cơ sở chăm sóc sức khỏe", "Các trung tâm nghiên cứu", "Nhà xác", "Bộ phận pháp y của công an"]', TRUE),
-    ('Kĩ thuật viên y tế: kĩ thuật viên phẫu thuật', 'SIR', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Làm việc với con người', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên phẫu thuật, còn là kĩ thuật viên phòng mổ, làm việc dưới sự giám sát của bác sĩ phẫu thuật, y tá, bác sĩ gây mê hoặc nhân viên phẫu thuật khác. Trách nhiệm của họ là chuẩn bị phòng mổ và bệnh nhân trước ca phẫu thuật và thực hiện chăm sóc bệnh nhân ngay sau khi hoàn thành ca phẫu thuật.', '["Kĩ thuật khoan", "Đánh giá mỏ dầu khí", "Kĩ thuật sản xuất", "Kĩ thuật tầng chứa", "Kĩ thuật thủy khí", "Vật lí đá"]', '["Chuẩn bị phòng mổ bằng việc chuẩn bị các dụng cụ, thiết bị mổ, màn vô trùng, và các giải pháp vô trùng trong phẫu thuật", "Điều chỉnh, kiểm tra các thiết bị được sử dụng trong phẫu thuật và đảm bảo tất cả đều hoạt động tốt", "Chuẩn bị cho bệnh nhân trước ca phẫu thuật bằng cách rửa, làm sạch và khử trùng khu vực mổ", "Bố trí bệnh nhân vào vị trí bàn mổ và phủ màn phẫu thuật vô trùng cho bệnh nhân", "Lường trước các yêu cầu của bác sĩ phẫu thuật và đảm bảo rằng họ nhận được dụng cụ phẫu thuật kịp thời trong quá trình phẫu thuật", "Giữ miệng vết mổ, cắt chỉ khâu, giúp đếm gạc, kim, vật tư và các công cụ phẫu thuật", "Điều khiển máy khử trùng, đèn chiếu sáng, hoặc máy hút dịch"]', '["Các doanh nghiệp dầu khí Nhà nước và tư nhân", "Các trung tâm, viện nghiên cứu", "Giảng dạy tại các trường đại học, cao đẳng, trung học", "Các cơ quan Nhà nước quản lí ngành dầu khí", "Các công ty tư vấn kĩ thuật"]', TRUE),
-    ('Kĩ thuật viên y tế: kĩ thuật viên và phụ tá nha khoa', 'SIR', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đề cao sự hợp tác, tương trợ', 'Mối quan hệ', 'Kĩ thuật viên và phụ tá nha khoa trợ giúp cho bác sĩ nha khoa trong tư vấn, chẩn đoán, phòng và chữa bệnh về răng miệng. Về mặt phạm vi và độ phức tạp thì hạn chế hơn so với các nhiệm vụ mà một bác sĩ nha khoa thực hiện.', '["Kĩ thuật viên nha khoa", "Vệ sinh răng miệng", "Kĩ thuật phục hình răng"]', '["Tư vấn cho cá nhân và cộng đồng về vệ sinh răng miệng, chế độ ăn uống và các biện pháp phòng ngừa bệnh răng miệng", "Tiến hành kiểm tra răng, chẩn đoán bệnh và chuyển các ca bệnh khó hơn cho bác sĩ nha khoa khi cần", "Làm sạch răng, chuẩn bị phần lỗ hổng ở răng (khoan và làm sạch lỗ khoan) của người bệnh trước khi hàn và thực hiện việc hàn lỗ hổng đó", "Thực hiện một số công việc liên quan đến việc làm răng giả và một số phương pháp phẫu thuật nhất định", "Chuẩn bị, sát trùng các dụng cụ và thiết bị nha khoa", "Chuẩn bị vật liệu nha khoa", "Giúp bệnh nhân chuẩn bị kiểm tra và điều trị"]', '["Bệnh viện", "Phòng khám nha khoa, răng hàm mặt", "Các cơ sở kĩ thuật phục hình răng"]', TRUE),
-    ('Vận động viên và người chơi thể thao chuyên nghiệp', 'RES', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Làm việc với con người', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Vận động viên và người chơi thể thao chuyên nghiệp tham gia vào một môn thể thao nào đó với tư cách là người chơi hoặc người huấn luyện chuyên nghiệp. Họ tham gia vào các câu lạc bộ, tổ chức hoặc các cuộc thi đấu về các môn thể thao để đạt được thành tích cao. Nhiệm vụ cụ thể của họ phụ thuộc vào công việc cụ thể mà họ đảm nhận.', '["Một môn thể thao cụ thể nào đó", "Quản lí thể thao", "Huấn luyện", "Bình luận và truyền thông"]', '["Vận động viên", "Chơi và tham gia thi đấu một môn thể thao nào đó theo qui chế, luật đã được xây dựng, thể hiện tài năng, năng lực, kĩ thuật và phong cách của mình", "Tham gia luyện tập thường xuyên, thực hiện các bài tập riêng để duy trì thể lực và chuyên môn vể môn thể thao mình chơi", "Thảo luận với huấn luyện viên để quyết định chiến thuật thi đấu", "Đánh giá đối thủ và điều kiện thi đấu", "Thảo luận và kí hợp đồng thi đấu cho các câu lạc bộ, các tổ chức ...", "Huấn luyện viên:", "Xác định điểm mạnh và điểm yếu của vận động viên và đội thể thao", "Lập kế hoạch, hướng dẫn và điều chỉnh việc tập luyện", "Lập kế hoạch và điều phối tham gia thi đấu", "Chuẩn bị và khuyến khích vận động viên thi đấu", "Xây dựng chiến lược chiến thuật thi đấu và chỉ đạo vận động viên", "Theo dõi và phân tích kĩ thuật, thể lực và phong độ để xác định hướng phát triển", "Đại diện tại các cuộc thi đấu thể thao để đảm bảo tiêu chuẩn chất lượng, luật chơi và an toàn", "Theo dõi thời gian thi đấu và ghi chép tỉ số, kết quả", "Đánh giá thể hiện của đối thủ, việc thực hiện cho điểm, phạt và xác định kết quả"]', '["Các đội tuyển thể thao", "Các trung tâm huấn luyện thể thao", "Các nhà văn hóa-thể thao", "Các cơ sở giáo dục – đào tạo", "Các cơ quan quản lí văn hóa-thể thao"]', TRUE),
-    ('Giáo viên giáo dục thể chất', 'SRE', 'Thể chất - Cơ khí', 'Tương tác với người khác', 'Làm việc với con người', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên giáo dục thể chất, thường gọi là giáo viên thể dục, thực hiện việc giảng dạy các lớp học thể chất, tổ chức các trò chơi, huấn luyện học viên tham gia các trò chơi và các môn thể dục thể thao.', '["Các chuyên ngành về một môn thể thao và đào tạo huấn luyện viên thể thao", "Tâm lí học thể thao"]', '["Đào tạo và tổ chức cho cá nhân hoặc nhóm các học sinh của các trường học và các tổ chức giáo dục khác tham gia vào các môn thể thao như thể dục tự do, thể dục dụng cụ và các bài tập thể chất khác để nâng cao sức khỏe, sự cân đối và sự uyển chuyển duyên dáng", "Dạy học viên sử dụng tạ, xà và các thiết bị thể dục thể chất khác", "Tổ chức, chỉ đạo, hướng dẫn và làm trọng tài cho các trò chơi, thi đấu thể dục thể thao", "Tổ chức thi đấu thể thao giữa các lớp, các đơn vị hoặc khu vực", "tổ chức các cuộc gặp gỡ liên quan đến thể thao", "Giám sát việc bảo trì các dụng cụ thể dục thể thao"]', '["Các trường phổ thống, trung cấp, cao đẳng, đại học", "Các tổ chức giáo dục đào tạo", "Các câu lạc bộ sức khỏe", "Phòng tập thể dục", "Trung tâm thể dục thể thao", "Bệnh viện", "Các khu nghỉ dưỡng, khách sạn lớn"]', TRUE),
-    ('Kĩ thuật viên kĩ thuật viễn thông', 'REC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên kĩ thuật viễn thông thực hiện các công việc về kĩ thuật liên quan tới nghiên cứu kĩ thuật viễn thông, thiết kế, sản xuất, lắp ráp, xây dựng, vận hành, duy tu và sửa chữa các hệ thống viễn thông.', '["Thiết bị tin học và viễn thông doanh nghiệp", "Dịch vụ bưu chính viễn thông doanh nghiệp"]', '["Cung cấp các hỗ trợ kĩ thuật liên quan tới nghiên cứu và phát triển các thiết bị viễn thông, hoặc thử nghiệm các vật mẫu", "Nghiên cứu các vật liệu kĩ thuật như các bản thiết kế, bản phác họa kĩ thuật để xác định phương pháp làm việc chấp nhận được", "Chuẩn bị dự toán chi tiết số lượng và giá cả các nguyên vật liệu và nhân công theo yêu cầu của nhà sản xuất và việc lắp đặt các trang thiết bị, tùy thuộc vào đặc điểm kĩ thuật đã đề ra", "Cung cấp việc giám sát kĩ thuật cho việc sản xuất, sử dụng, duy tu và sửa chữa các hệ thống viễn thông nhằm đảm bảo việc vận hành được thỏa đáng và tương thích với các qui định và tiêu chí kĩ thuật đã được đề ra", "Áp dụng kiến thức trên nguyên lí và thực tế kĩ thuật viễn thông để xác định và giải quyết các vấn đề phát sinh trong quá trình thực hiện công việc"]', '["Các công ty viễn thông Nhà nước và tư nhân", "Các công ty dịch vụ điện thoại di động", "Các doanh nghiệp vận tải hàng hải", "Các doanh nghiệp vận tải hàng không", "Các cơ quan quản lí Nhà nước về bưu chính viễn thông"]', TRUE),
-    ('Cảnh sát cứu hỏa', 'RSE', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Cảnh sát cứu hoả thực hiện công việc ngăn chặn, phòng chống hỏa hạn và dập tắt đám cháy. Họ cũng có nhiệm vụ giải cứu những người bị mắc kẹt trong hỏa hoạn, cứu hàng hoá, tài sản trong và sau hoả hoạn hoặc tai nạn nghiêm trọng.', '["Cứu hoả", "Cứu hoả đối với tai nạn máy bay", "Cứu hoả cháy rừng", "Cứu hộ"]', '["Phản ứng khi có báo cháy và các báo động khẩn cấp khác như tai nạn trong nhà máy, hàng không, bom mìn…", "Kiểm soát và dập tắt lửa bằng các phương tiện và hóa chất dập lửa và các kĩ thuật cứu hỏa phù hợp", "Ngăn chặn và hạn chế sự lan tỏa của đám cháy hoặc các chất dễ cháy khi có hoả hoạn hoặc tai nạn", "Sơ tán, cứu người mắc kẹt tại địa điểm hỏa hoạn và nơi xảy ra tai nạn", "Cứu tài sản, hàng hoá trong và sau hoả hoạn hoặc các tai nạn nghiêm trọng", "Tuyên truyền giáo dục cộng đồng về phòng cháy chữa cháy"]', '["Lực lượng cảnh sát cứu hỏa", "Lục quân, hải quân và không quân", "Các cơ quan quản lí phòng chống cháy nổ", "Bộ phận an toàn cháy nổ của các cơ quan, doanh nghiệp", "Bộ phận cứu hỏa của các sân bay, cảng biển, khu công nghiệp", "Các doanh nghiệp vận chuyển các vật liệu dễ cháy"]', TRUE),
-    ('Trồng trọt', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Lao động trồng trọt lập kế hoạch, tổ chức và thực hiện các hoạt động trồng trọt và thu hoạch các loại cây lương thực, thực phẩm như lúa và cây có hạt, rau và hoa màu, cây công nghiệp như mía đường, thuốc lá, chè, cà phê, cao su, cây ăn quả như bưởi, xoài, cam chanh. Họ cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường.', '["Trồng cây lương thực", "Trồng rau", "Trồng cây công nghiệp", "Trồng cây ăn quả", "Bảo vệ thực vật", "Khuyến nông khuyến lâm", "Sản xuất giống", "Thu hoạch và chế biến sau thu hoạch", "Thu mua, vận chuyển và tiêu thụ nông sản"]', '["Xác định chủng loại và số lượng cây trồng", "Mua giống, phân bón và vật tư khác", "Cho thuê hoặc đầu tư cải tạo đất đai, nhà cửa, động vật làm việc, trang thiết bị, máy móc", "Thực hiện các hoạt động canh tác như làm đất, gieo hạt, trồng cây, chăm sóc, thu hoạch", "Lưu trữ và sơ chế sản phẩm sau thu hoạch", "Nuôi dưỡng, chăm sóc động vật lấy sức kéo và bảo dưỡng các khu trang trại, máy móc thiết bị", "Cung cấp và tiếp thị nông sản"]', '["Lao động sản xuất tại các trang trại, nông trường chuyên canh một loại cây trồng, trồng cây hỗn hợp, hoặc trồng trọt kết hợp chăn nuôi, chế biến", "Lao động quản lí trang trại, nông trường về kĩ thuật hoặc tài chính, như tính toán chi phí, định giá sản phẩm và ghi chép sổ sách", "Lao động thu hoạch, chế biến, vận chuyển hoặc nhân viên tiếp thị, bán hàng tại các cơ sở, doanh nghiệp thu mua, chế biến, vận chuyển và kinh doanh nông sản", "Tự tạo việc làm tại gia đình"]', TRUE),
-    ('Chăn nuôi gia súc, gia cầm', 'RC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Lao động chăn nuôi gia súc, gia cầm thực hiện các hoạt động nuôi dưỡng và chăm sóc gia súc gia cầm như trâu, bò, cừu, lợn, dê, ngựa, chó, mèo, gà, vịt, ngan, ngỗng, chim… cho các mục đích như làm việc, chơi thể thao hoặc làm thú cảnh, lấy thịt, sữa, lông, da và các sản phẩm khác để cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường.', '["Chăn nuôi và quản lí gia súc", "Dinh dưỡng động vật", "Quản lí gia cầm"]', '["Lập kế hoạch và thực hiện các hoạt động cần thiết để chăm sóc, nuôi dưỡng gia súc (ví dụ như trâu, bò, lợn, dê) và gia cầm (ví dụ như gà, vịt, chim)", "Phân tích việc sử dụng gia súc, gia cầm vào các mục đích công việc, chơi thể thao, làm thú kiểng hay để lấy thịt, sữa, lông, da và các sản phẩm khác", "Bảo quản và sơ chế các sản phẩm gia súc, gia cầm", "Cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường."]', '["Các trang trại", "Trang trại sản xuất sữa", "Các phòng khám thú y", "Các công ty bán sản phẩm gia súc", "Các viện nghiên cứu"]', TRUE),
-    ('Thợ đường ống', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Thợ đường ống lắp đặt, thay thế và bảo dưỡng hệ thống ống dẫn và máy móc cho đường cấp nước, khí đốt, hệ thống thoát nước, hệ thống cống rãnh và thiết bị chạy bằng sức nước và khí nén.', '["Kết nối khí", "Hệ thống sưởi và hệ thống thông gió", "Lắp đặt hệ thống thủy lợi", "Thợ ống, lợp mái", "Lắp đặt hệ thống tưới nước"]', '["Đo, cắt, bắt ren, uốn cong, nối lại bằng đoạn nối, lắp, bảo dưỡng và sửa chữa các ống dẫn, vật cố định của hệ thống thoát nước, hệ thống làm nóng, hệ thống cung cấp nước và hệ thống cống rãnh", "Lắp các thiết bị ga, máy rửa bát và bình nước nóng, bồn rửa và toa lét sử dụng bằng tay và bằng sức mạnh của dụng cụ", "Đặt ống bằng đất sét, xi măng hoặc gang xuống rãnh, mương để tạo thành cống rãnh, ống dẫn nước, đường ống nước hoặc cho các mục đích khác", "Xem xét, kiểm tra các hệ thống và ống đã được lắp đặt, sử dụng máy đo áp suất, theo dõi và kiểm tra thủy tĩnh hoặc dùng các phương pháp khác", "Thực hiện các công việc có liên quan", "Giám sát các công nhân khác"]', '["Các công ty xây dựng", "Các công ty lắp đặt, sửa chữa", "Nhà máy lọc dầu", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
-    ('Thợ chế tạo khuôn và công cụ', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ chế tạo khuôn và công cụ chế tạo các loại khuôn và lõi khuôn.', '["Lập trình và vận hành máy CNC", "Sản xuất khuôn mẫu", "Quản lí chất lượng", "Thiết kế công cụ"]', '["Chế tạo, bảo dưỡng và sửa chữa các loại khuôn (khuôn đúc, khuôn mẫu), khuôn dẫn, mô hình khuôn và các dụng cụ khác. Các loại khuôn và dụng cụ này được sử dụng cùng với các công cụ cầm tay và máy móc để tạo hình sản phẩm", "Tra lắp và lắp ráp các bộ phận để tạo ra và sửa chữa khuôn, mô hình khuôn và các dụng cụ khác", "Chế tạo và sửa chữa các khuôn mẫu bằng kim loại", "Trình bày cách thức tiến hành và điểm qui chiếu trên nguyên vật liệu kim loại để hướng dẫn thợ cắt, tiện, phay và tạo hình sản phẩm"]', '["Cửa hàng bán máy móc", "Các doanh nghiệp sản xuất, chế tạo khuôn mẫu, chế tạo máy", "Phòng thí nghiệm nghiên cứu phát triển"]', TRUE),
-    ('Thợ mộc và thợ làm đồ gỗ', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ mộc và thợ làm đồ gỗ gia dụng cắt, tạo dáng, lắp ráp, chế tạo và bảo dưỡng sửa chữa nhiều loại công trình và đồ đạc bằng gỗ.', '["Hoàn thiện sản phẩm mộc mĩ nghệ", "Mộc mĩ nghệ các hệ thống bên trong", "Mộc dân dụng", "Mộc thô", "Kĩ thuật mộc dân dụng"]', '["Chế tạo, sửa đổi và sửa chữa các cấu trúc và đồ mộc khác tại xưởng mộc và trên công trường xây dựng", "Xây dựng và thay thế các cấu trúc bằng gỗ nặng trên các khu đất đang xây dựng nhà ở", "Lắp ráp, sửa đổi đồ đạc cố định của tòa nhà như tường, cửa, khung cửa sổ và cửa ra vào, và ván ô của cửa hoặc tường", "Chế tạo và sửa chữa các thiết bị sân khấu cho sân khấu biểu diễn, phim điện ảnh hoặc các chương trình truyền hình", "Xây dựng, lắp đặt và sửa chữa các đồ đạc cố định bằng gỗ và đồ đạc trong toa hành khách và các loại tàu xe khác", "Giám sát các công nhân khác"]', '["Các công ty gia công, chế biến gỗ và lâm sản, thiết kế nội thất", "Các công ty kinh doanh đồ gỗ", "Các doanh nghiệp xây dựng dân dụng", "Các xưởng mộc gia đình", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
-    ('Kĩ thuật viên thiết bị lạnh và điều hòa không khí', 'RCE', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên thiết bị lạnh và điều hòa không khí lắp đặt, bảo dưỡng và sửa chữa máy điều hòa không khí, hệ thống máy lạnh và các thiết bị liên quan, ví dụ như điều hòa, tủ lạnh, kho lạnh và các hệ thống làm lạnh công nghiệp.', '["Vận hành và sửa chữa các thiết bị lạnh", "Kĩ thuật lạnh và điều hòa không khí", "Đông lạnh thủy sản"]', '["Đọc bản thiết kế, bản vẽ hoặc các chi tiết kĩ thuật", "Lắp ráp, lắp đặt và sửa chữa các phần hợp thành của hệ thống điều hòa không khí và hệ thống máy lạnh", "Kết nối hệ thống ống dẫn và các thiết bị bằng việc bắt bu-lông, ghép bằng đinh tán, hàn lại", "Kiểm tra hệ thống, chẩn đoán lỗi, và thực hiện các công việc bảo dưỡng thường xuyên"]', '["Làm việc trong các nhà máy có hệ thống thiết bị lạnh, kho lạnh và điều hòa không khí như: nhà máy thủy sản, đông lạnh, chế biến thực phẩm, đường, giấy, dệt…", "Các công ty cơ điện lạnh", "Các cao ốc văn phòng, nhà hàng khách sạn lớn, các siêu thị, cảng, sân bay… có hệ thống điều hòa lớn", "Các cửa hàng thiết bị lạnh và điều hòa không khí", "Tự tạo việc làm"]', TRUE),
-    ('Thợ hàn và thợ cắt kim loại bằng nhiệt', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ hàn và thợ cắt kim loại bằng nhiệt hàn và cắt các bộ phận kim loại bằng cách sử dụng lửa khí gas hoặc hồ quang điện và các nguồn nhiệt khác làm chảy rồi cắt hoặc nối kim loại.', '["Hàn điện", "Hàn hơi", "Cắt hàn kim loại"]', '["Hàn các phần kim loại bằng lửa khí gas hoặc hồ quang điện, nhiệt nhôm hoặc các phương pháp khác", "Vận hành máy hàn bằng điện trở", "Sử dụng đèn khò để chế tạo và sửa chữa lót bọc chì, đường ống, đáy và các dụng cụ chì khác", "Hàn đồng các phần kim loại với nhau", "Cắt miếng kim loại bằng lửa khí gas hoặc hồ quang điện", "Hàn các miếng kim loại bằng mối hàn tay"]', '["Các doanh nghiệp sản xuất chế tạo", "Các công ty xây dựng", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
-    ('Kĩ thuật viên cơ khí trong đóng tàu', 'RC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Đóng tàu là một trong những ngành công nghiệp cổ xưa nhất, bắt nguồn từ việc sử dụng gỗ để chế tạo tàu thuyền. Ngày nay, đóng tàu là một ngành công nghệ cao sử dụng hầu như tất cả các loại hình kĩ thuật chuyên môn. Kĩ thuật viên cơ khí đóng tàu làm công việc đóng thân tàu (phần thân cách nước của một con tàu) cũng như lắp đặt các máy móc bên trong tàu như đường ống và các loại phụ kiện khác nhau.', '["Chế tạo thân tàu", "Chế tạo và lắp ráp các hệ thống đường ống tàu thủy", "Chế tạo, lắp ráp nội thất tàu thủy", "Lắp ráp hệ thống động lực tàu thủy", "Sửa chữa động cơ tàu thủy"]', '["Sử dụng các kĩ thuật khác nhau như kĩ thuật tạo hình, ép nén, gia công kim loại để tạo ra và lắp ráp thân tàu", "Lắp ráp và lắp đặt tất cả các phụ kiện bên trong con tàu."]', '["Các doanh nghiệp, xưởng đóng tàu", "Các doanh nghiệp vận tải đường biển", "Các bến cảng"]', TRUE),
-    ('Kĩ thuật viên cơ khí trong gia công kim loại', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Gia công kim loại là quá trình gia công, chế biến các kim loại để tạo ra từng bộ phận, phần lắp ráp hoặc các cấu kiện qui mô lớn. Thuật ngữ “gia công kim loại” bao hàm phạm vi rộng các công việc, từ việc gia công các con tàu và cây cầu lớn tới việc gia công các chi tiết động cơ chính xác và đồ trang sức tinh xảo. Thợ gia công kim loại thực hiện các kĩ thuật nguội như ép nguội, uốn nguội, kéo nguội, cắt nguội, hoặc các kĩ thuật rèn như rèn nóng, rèm ấm và rèn nguội.', '["Hàn", "Rèn", "Nguội", "Sửa chữa nguội", "Gia công không phoi", "Gia công cắt gọt kim loại"]', '["Nung kim loại trong lò rèn, chế tạo và sửa chữa các sản phẩm bằng cách vẽ, uốn, cắt, đóng búa các sản phẩm kim loại đó", "Tạo hình kim loại đã được nung nóng thành các hình dạng cụ thể bằng tay hoặc bằng búa", "Tạo hình kim loại không nung nóng thành các hình dạng cụ thể bằng các kĩ thuật nguội như uốn, nắn, cắt, quấn, tán, gò, hàn, đục, chặt, cưa cắt, dũa gọt, khoan, ren, cạo, mài…"]', '["Các công ty xây dựng", "Các doanh nghiệp chế tạo máy móc thiết bị, sản phẩm kim loại", "Các doanh nghiệp thiết kế máy móc thiết bị, sản phẩm", "Các doanh nghiệp luyện kim", "Các doanh nghiệp đóng tàu"]', TRUE),
-    ('Thợ cơ khí và sửa chữa động cơ', 'RCE', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ cơ khí và sửa chữa xe có động cơ làm công việc bảo trì, sửa chữa động cơ và các bộ phận cơ khí của xe máy, xe ô tô chở khách, ô tô tải và các loại xe có động cơ khác.', '["Phương tiện giao thông bốn bánh", "Xe hai bánh", "Xe tải trọng lớn", "Xe thể thao, xe đua", "Phương tiện đi lại tại trang trại"]', '["Lắp ráp, kiểm tra, thử nghiệm và sửa chữa động cơ xe ô tô và các loại xe có động cơ khác", "Thay thế các bộ phận hoặc hoàn thiện động cơ", "Lắp ráp, kiểm tra, điều chỉnh, tháo dỡ, khôi phục và thay thế bộ phận hỏng hóc của các loại xe ô tô", "Lắp đặt hoặc điều chỉnh động cơ, phanh và điều chỉnh tay lái hoặc các bộ phận khác của các loại xe ô tô"]', '["Ngành ô tô xe máy", "Xưởng cơ khí của các đơn vị vận tải đường bộ", "Các đơn vị, bộ phận vận tải của quân đội, các tổ chức bán quân sự và lực lượng vũ trang khác", "Các doanh nghiệp có đội xe riêng", "Các ga-ra tư nhân", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
-    ('Thợ lặn', 'RC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ lặn sử dụng thiết bị chuyên dụng để làm việc dưới nước. Các hoạt động này có thể là để thăm dò tài nguyên thiên nhiên, cứu hộ và tìm kiếm người, tàu và hàng hoá trong trường hợp đắm tàu... Thợ lặn cũng có thể kiểm tra, lắp đặt, sửa chữa các thiết bị dưới nước; kiểm tra, thí nghiệm và chụp ảnh sinh cảnh biển hoặc các cấu trúc dưới nước cho các mục đích thương mại hoặc nghiên cứu. Ngoài lặn dưới nước, còn có lặn HAZMAT là một hình thức lặn mà ở đó các thợ lặn lặn vào một môi trường không phải là nước mà là các chất lỏng khác như bột giấy, xi măng lỏng hoặc bùn dầu.', '["Lặn cứu hộ", "Lặn nghiên cứu", "Hướng dẫn lặn", "Lặn xây dựng"]', '["Thực hiện các biện pháp an toàn như kiểm soát đường dài và độ sâu của việc lặn", "Kiểm tra và bảo trì thiết bị lặn", "Lặn xuống nước với sự hỗ trợ của người trên bờ, liên lạc với người trên bờ trong khi ở dưới nước bằng các tín hiệu hoặc điện thoại đặc biệt", "Làm việc dưới nước để thực hiện các công việc cụ thể (ví dụ sửa chữa các cấu kiện, sửa chữa nhỏ trên thân tàu, loại bỏ các chướng ngại vật dưới nước, khoan lỗ nổ mìn, thu thập mẫu đất, sinh vật biển, các mảnh vỡ, phục hồi vật liệu, chụp ảnh)", "Báo cáo kết quả việc lặn dưới nước và điều kiện môi trường lặn"]', '["Các doanh nghiệp khai thác mỏ", "Các doanh nghiệp xây dựng", "Các doanh nghiệp cung cấp dịch vụ cứu hộ và khôi phục sự cố", "Các đơn vị nghiên cứu về biển", "Giàn khoan dầu ngoài khơi", "Các doanh nghiệp vận tải bằng tàu thủy"]', TRUE),
-    ('Sĩ quan quân đội', 'ESC', 'Thể chất - Cơ khí', NULL, 'Làm việc với con người', 'Thể chất - cơ khí', 4, NULL, NULL, NULL, 'Sĩ quan quân đội là người chỉ huy và quản lí các đơn vị trong lực lượng quốc phòng. Lục quân, hải quân và không quân là ba quân chủng quốc phòng và là lực lượng rất quan trọng đối với việc bảo vệ an ninh quốc gia. Họ bảo vệ lãnh thổ quốc gia bao gồm vùng đất, vùng biển và vùng trời. Bạn cũng có thể tham gia vào lực lượng quốc phòng với tư cách là chuyên gia trong nhiều ngành nghề khác nhau (ví dụ như kĩ sư, bác sĩ, y tá, kế toán, bác sĩ thú y, luật sư). Hầu như bất kì ngành nghề nào cũng có trong các quân chủng quốc phòng. Hệ thống cấp bậc quân hàm của sĩ quan quân đội gồm ba cấp, mười hai bậc: Cấp Uý có bốn bậc gồm Thiếu uý, Trung uý, Thượng uý, Đại uý. Cấp Tá có bốn bậc gồm Thiếu tá, Trung tá, Thượng tá, Đại tá. Cấp Tướng có bốn bậc gồm Thiếu tướng, Chuẩn Đô đốc Hải quân, Trung tướng, Phó Đô đốc Hải quân, Thượng tướng, Đô đốc Hải quân, Đại tướng.', '["Lục quân", "Hải quân", "Phòng không - Không quân", "Công binh", "Quân y"]', '["Tham gia một trong các quân chủng như là một sĩ quan", "Tham dự và vượt qua các kì thi trong các chuyên ngành cụ thể để được thăng tiến", "Phát triển kĩ năng để lãnh đạo và chỉ huy lính"]', NULL, TRUE),
-    ('Lao động trong lâm nghiệp', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự làm việc độc lập cao', 'Sự độc lập', 'Lao động trọng lâm nghiệp là nghề liên quan đến trồng cây gây rừng, bao gồm các nhiệm vụ: Tạo cây giống, trồng, chăm sóc, nuôi dưỡng, cải tạo, làm giàu rừng và sản xuất nông lâm kết hợp trên đất nông lâm nghiệp nhằm phát triển kinh tế và bảo vệ môi trường. Các hoạt động nhằm phát triển, duy trì và bảo tồn đa dạng sinh học các loại rừng; gồm hoạt động trồng rừng tập trung, khoanh nuôi tái sinh kết hợp trồng rừng, chăm sóc rừng mới trồng chưa đạt tiêu chuẩn rừng. Nghề này còn bao gồm cả các hoạt động khai thác, sơ chế gỗ và các lầm sản phục vụ các ngành công nghiệp chế biến...', '["Giáo viên giảng dạy về lâm nghiệp", "Thiết kề trồng rừng", "Trồng và chăm sóc rừng", "Quản lý bảo vệ rừng", "Khai thác và sơ chế các loại lâm sản", "Cán bộ khuyến lâm"]', '["Thiết kế trồng rừng", "Nhân giống cây trồng", "Trồng và chăm sóc rừng", "Nuôi dưỡng và phục hồi rừng", "Quản lý bảo vệ rừng", "Thiết kế khai thác gỗ", "Khai thác gỗ và tre nứa", "Trồng cây ăn quả", "Trồng cây công nghiệp", "Trồng và thu hoạch một số lâm sản ngoài gỗ", "Trồng hoa và cây cảnh", "Nông lâm kết hợp", "Khuyến nông lâm", "Kinh doanh sản xuất nông lâm nghiệp"]', '["Các đơn vị trong lĩnh vực lâm nghiệp"]', TRUE),
-    ('Lao động nuôi trồng và đánh bắt thủy sản', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự làm việc độc lập cao', 'Sự độc lập', 'Nuôi trồng và đánh bắt thuỷ sản (bao gồm cả nước mặn, lợ) là một bộ phận của nền sản xuất nông nghiệp. Nghề này sản xuất ra các loại sản phẩm thuỷ sản có chất lượng cao phục vụ cho đời sống của nhân dân và cung cấp nguyên liệu cho công nghiệp chế biến, xuất khẩu, góp phần cải tạo môi trường sinh thái. Đồng thời khai thác, đánh bắt các loại thủy sản nước ngọt và nước mặn.', '["Nghiên cứu trong lĩnh vực nuôi trồng thủy sản", "các trạm nghiên cứu", "các doanh nghiệp về sản xuất giống", "Các nghiệp đoàn đánh bắt thủy sản gần bờ, xa bờ", "Cán bộ khuyến ngư…."]', '["Xác định thủy sinh vật", "Xác định một số chỉ tiêu sinh học ở cá", "Khảo sát, thiết kế công trình nuôi thuỷ sản", "Chuẩn bị công trình nuôi", "Sản xuất và sử dụng thức ăn trong nuôi", "Quản lý chất lượng nước trong nuôi", "Phòng và trị bệnh thủy sản", "Thực hiện an toàn lao động trong nuôi trồng", "Sản xuất giống cá, tôm, cua…", "Nuôi trồng các loại thủy sản nước ngọt, nước nợ, nước mặn", "Vận chuyển động vật thuỷ sản"]', '["Có thể làm việc theo quy mô hộ gia đình, trang trại...", "Các doanh nghiệp, nghiệp đoàn về nuôi trồng, đánh bắt thủy sản"]', TRUE),
-    ('Thợ xây', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ xây là những người lao động có tay nghề tham gia xây dựng cơ sở hạ tầng, các công trình, nhà cửa…. Thợ xây được chia thành các loại hình sau: thợ nề, thợ mộc, thợ lót thảm, thợ trộn hồ, thợ điện, thợ xây hàng rào, thợ sắt, thợ tô, thợ sửa ống nước, thợ hàn, thợ sơn, thợ mài, trang trí nội thất, thiết kế phong cảnh.', '["Các công trình xây dựng dân dụng", "Các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện"]', '["Xây dựng, hoàn thiện các công trình từ khâu đào móng đến hoàn thiện", "lắp đặt các thiết bị cơ bản của công trình như cửa, cầu thang", "nhiệm vụ của người thợ xây rất đa dạng, từ những việc đơn giản như trộn hồ, quét vôi, xây, trát… đến các công việc phức tạp hơn như khả năng đọc bản vẽ, dự toán…tính toán đến các yếu tố ảnh hưởng đến công trình xây dựng như độ lún, độ chịu lực, tính toán nguyên nhiên vật liệu phù hợp với công trình…."]', '["Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp...", "Các doanh nghiệp chuyên về xây dựng…."]', TRUE),
-    ('Thợ hoàn thiện trong xây dựng', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Thợ hoàn thiện trong xây dựng là nghề chuyên thi công xây dựng và hoàn thiện các công trình xây dựng dân dụng và công nghiệp theo đúng các yêu cầu kỹ thuật, quy định, quy phạm theo TCVN, đạt năng suất, chất lượng, an toàn lao động và vệ sinh môi trường.', '["Các công trình xây dựng dân dụng", "Các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện"]', '["Nhóm hoàn thiện công trình xây dựng gồm các hoạt động liên quan tới việc hoàn thiện hoặc kết thúc công trình như: Trát vữa bên trong và bên ngoài các công trình nhà và công trình xây dựng khác, bao gồm các nguyên liệu đánh bóng, Lắp đặt cửa ra vào, cửa sổ, khung cửa ra vào, khung cửa sổ bằng gỗ hoặc bằng những vật liệu khác, Lắp đặt thiết bị, đồ dùng nhà bếp, cầu thang và những hoạt động tương tự, Lắp đặt thiết bị nội thất", "Hoạt động hoàn thiện bên trong công trình như: Làm trần, ốp gỗ tường, hoặc vách ngăn di chuyển được", "Xếp, lợp, treo hoặc lắp đặt trong các toà nhà hoặc các công trình khác như: Lát sàn hoặc tường bằng gạch, bê tông, đá xẻ, gạch gốm", "Lót ván sàn và các loại phủ sàn bằng gỗ khác", "Thảm và tấm phủ sơn lót sàn, bao gồm bằng cao su và nhựa", "Lát sàn hoặc ốp tường bằng gạch không nung, đá hoa, đá hoa cương (granite), đá phiến… Giấy dán tường", "Sơn bên ngoài và bên trong công trình nhà"]', '["Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp...", "Các doanh nghiệp chuyên về xây dựng…."]', TRUE),
-    ('Thợ sơn', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ sơn là những người quét vôi – sơn nước, một khâu trong công việc hoàn thiện công trình xây dựng, nhà ở, cầu, ô tô, các vật dụng có thể sơn được… Các loại thợ sơn khác nhau bao gồm các thợ sơn xây dựng sơn các tòa nhà mới, các thợ sơn bảo dưỡng cải thiện và duy trì lớp sơn, các thợ sơn nghệ thuật áp dụng các kĩ thuật trang trí vào các bề mặt đã sơn, các công nhân sơn thủ công sơn đồ chơi, ô tô, các vật dụng gia đình và các thiết bị khác.', '["Sơn các công trình xây dựng dân dụng", "Sơn các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện", "Làm về sơn tại các nhà máy, doanh nghiệp sản xuất như ô tô, xe máy, sơn tĩnh điện…."]', '["Tính toán số lượng nguyên vật liệu cần thiết dựa vào các số liệu đo đạc bề mặt sơn và yêu cầu sơn", "Ước tính tổng chi phí của công việc bằng cách ước tính chi phí của nguyên vật liệu và thời gian cần thiết để hoàn thành công việc", "Lựa chọn và mua các vật liệu, công cụ, chất liệu sơn, loại sơn và màu sơn phù hợp cho bề mặt cần sơn, phụ thuộc vào độ bền, dễ xử lí, phương thức sử dụng và mong muốn của khách hàng", "Xử lí các bề mặt trước khi sơn với dầu, nhựa thông làm loãng sơn, chất loại bỏ nấm mốc để đảm bảo sơn bám, khi sơn lên sẽ đẹp", "Pha trộn các màu sơn, chất nhuộm, vecni với dầu và các chất phụ gia làm loãng sơn hay làm khô để có được hỗn hợp sơn như mong muốn", "Bảo vệ các bề mặt trong khi sơn bằng cách dùng băng dính hoặc vải để che phần không muốn bị sơn dính vào", "Dọn sạch khu vực sau khi sơn…."]', '["Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp, doanh nghiệp sản xuất để làm việc ở các vị trí chuyên về sơn...", "Các doanh nghiệp chuyên về sơn…."]', TRUE),
-    ('Thợ lắp đặt và sửa chữa điện', 'RIC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ lắp đặt và sửa chữa điện dân đóng góp vai trò vô cùng to lớn cho ngành Điện lực của chúng ta do hiện nay thợ sửa chữa và lắp đặt hệ thống điện dân dụng còn đang thiếu nhân lực trầm trọng. Lắp đặt và sửa chữa điện bao gốm Hệ thống điện trong hộ gia đình, công ty, trường học, chung cư, nhà máy, các cơ sở sản xuất kinh doanh, sửa chữa cơ khí….', '["Làm việc tại các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện"]', '["Lắp đặt hệ thống mạng điện sản xuất và sinh hoạt", "Lắp đặt thiết bị và đồ dùng điện", "Vận hành, bảo trì, bảo dưỡng, và sửa chữa mạng điện, thiết bị và đồ dùng điện"]', NULL, TRUE),
-    ('Thợ lắp đặt và thợ sửa chữa điện tử viễn thông', 'RIC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Nghề lắp đặt, sửa chữa điện tử viễn thông thực hiện các công việc như: Lắp đặt cáp đồng cũng như các quang, lắp đặt các tủ thiết bị viễn thông, lắp đặt điện và các thiết bị phụ trợ khác; Vận hành, khai thác được các thiết bị cơ bản trong đài trạm viễn thông; Kiểm tra được các chỉ tiêu chất lượng cơ bản của các trang thiết bị; Ứng dụng được một số kỹ thuật công nghệ mới, làm việc độc lập và có khả năng sáng tạo cải tiến trong quá trình làm việc.', '["Chủ yếu liên quan đến lĩnh vực lắp đặt và sửa chữa điện- điện tử viễn thông tại các trạm, đài viễn thông", "lắp đặt, sửa chữa các mạng viễn thông Khi phát triển sự nghiệp, bạn có thể chuyên sâu hơn nữa về một lĩnh của bạn như hỗ trợ giảng dạy, nghiên cứu trong lĩnh vực điện tử viễn thông"]', '["Lắp đặt hệ thống thiết bị điện tử viễn thông", "Vận hành, bảo trì, bảo dưỡng, và sửa chữa trong các đài, trạm viễn thông", "Lắp đặt các mạng viễn thông", "Tư vấn lắp đặt hệ thống viễn thôn"]', '["Làm việc tại các đài, trạm viễn thông", "Các doanh nghiệp kinh doanh về viễn thông"]', TRUE),
-    ('Thợ lắp ráp', 'RCI', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Thợ lắp ráp là người làm việc trong lĩnh vực sản xuất, chuyên lắp ráp các loại sản phẩm như: lắp ráp máy cơ khí, máy cơ học; lắp ráp thiết bị điện; lắp ráp thiết bị điện tử; lắp ráp các sản phẩm kim loại, cao su, chất dẻo; lắp ráp các sản phẩm gỗ và các sản phẩm liên quan; lắp ráp các sản phẩm bằng giấy, bìa, da…..', '["Chủ yếu liên quan đến lĩnh vực lắp ráp, khi phát triển nghề nghiệp bạn có thể học chuyên sâu hơn và có thể nghiên cứu, sang tạo các loại mẫu mã mới, hướng dẫn hoặc tham gia đào tạo tại các cơ sở đào tạo, doanh nghiệp"]', '["Hiểu các tính chất của chất liệu lắp ráp", "Lắp ráp và hoàn thiện các sản phẩm theo yêu cầu của từng loại hình công việc như mô tả nghề nêu trên"]', '["Các doanh nghiệp lắp ráp", "Các xưởng sản xuất, lắp ráp sản phẩm các loại"]', TRUE);
+    (151, 'Kĩ thuật viên cơ – điện tử', 'RI', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu sự cải tiến sáng tạo và tạo ra giá trị mới', 'Thành tựu', 'Kĩ thuật viên cơ - điện tử làm việc trong một lĩnh vực liên quan tới nhiều ngành nghề kĩ thuật như kĩ thuật cơ khí, kĩ thuật điện, kĩ thuật điều khiển và kĩ thuật máy tính. Sáng tạo robot là một ví dụ về công việc trong lĩnh vực cơ điện tử.', '["Kĩ thuật chế tạo người máy", "Thị giác máy tính", "Tự động hóa", "Hệ thống tự động hóa"]', '["Thu nhận kiến thức của các lĩnh vực kĩ thuật như: kĩ thuật cơ khí, khoa học vật liệu, kĩ thuật điện tử/điện, kĩ thuật máy tính, kĩ thuật hệ thống và kiểm soát hệ thống", "Chuyên sâu vào một trong những lĩnh vực kĩ thuật trên, đồng thời liên hệ với các lĩnh vực khác bổ sung hỗ trợ cho cơ-điện tử", "Áp dụng các nguyên tắc của lĩnh vực chuyên sâu của mình. Các nguyên tắc này được xây dựng trên cơ sở các thông tin và hệ thống được cung cấp bởi các ngành khác"]', '["Các công ty kĩ thuật", "Các doanh nghiệp tham gia vào việc nghiên cứu, thiết kế và sản xuất robot, sản xuất tự động hóa, thị giác máy tính và các kĩ thuật kiểm tra tự động", "Bộ phận nghiên cứu và thiết kế của các doanh nghiệp ô tô"]', TRUE),
+    (152, 'Kĩ sư hàng hải', 'IRC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ sư hàng hải kiểm soát và tham gia hoạt động thiết kế, điều khiển, bảo trì, bảo dưỡng, sửa chữa thiết bị cơ khí, điện, điện tử và máy móc trên tàu và các phương tiện đường thủy hoặc thực hiện các nhiệm vụ hỗ trợ trên bờ.', '["Kĩ thuật hàng hải", "Kĩ thuật tàu thủy", "Kĩ thuật điện tàu thủy", "Điện và tự động tàu thủy", "Kĩ thuật điện tử tàu thủy"]', '["Kiểm soát hoạt động, bảo trì, bảo dưỡng, sửa chữa thiết bị cơ khí, điện, điện tử và máy móc trên tàu", "Mua sắm nhiên liệu và các đồ dùng dự trữ trong khoang máy tàu thủy cũng như duy trì ghi chép các hoạt động", "Giám sát kĩ thuật việc lắp đặt, bảo trì, sửa chữa máy móc và thiết bị tàu thủy nhằm đảm bảo việc tuần thủ các qui định, yêu cầu kĩ thuật", "Kiểm tra và tiến hành bảo trì, sửa chữa khẩn cấp các động cơ, máy móc và thiết bị phụ trợ", "Trực ca buồng máy, giám sát, theo dõi, ghi chép hoạt động của các động cơ, máy móc và thiết bị phụ trợ"]', '["Các tàu thuyền trên biển", "Làm việc trên bờ đảm nhận việc bảo trì, bảo dưỡng tàu, cảng và các phương tiện vận chuyển hàng hoá", "Các công ty thiết kế và công nghiệp tàu thủy", "Các cơ quan nghiên cứu liên quan đến việc phát triển các dụng cụ thiết bị kĩ thuật hàng hải hiệu quả", "Các cơ quan Nhà nước về vận tải hàng hải, công nghiệp tàu thủy"]', TRUE),
+    (153, 'Công an', 'ERC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Làm việc với con người', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Công an thi hành các qui định luật pháp và trật tự xã hội, đảm bảo ổn định cho xã hội, trật tự kỉ cương, bảo vệ lợi ích của nhà nước trong xã hội, các quyền và lợi ích hợp pháp của công dân.', '["Cảnh sát cơ động", "Cảnh sát hình sự", "Cảnh sát kinh tế", "Cảnh sát giao thông", "Cảnh sát môi trường", "Cảnh sát đặc nhiệm", "Cảnh sát điều tra", "Cảnh sát quản lí hành chính và trật tự xã hội", "Cảnh sát phòng cháy chữa cháy"]', '["Phòng ngừa, phát hiện, đấu tranh chống tội phạm và vi phạm pháp luật về trật tự, an toàn xã hội, BVMT", "phát hiện nguyên nhân, điều kiện phát sinh tội phạm, vi phạm pháp luật khác và kiến nghị biện pháp khắc phục", "tham gia giáo dục đối tượng vi phạm pháp luật tại cộng đồng theo qui định của pháp luật", "Quản lí hộ khẩu, cấp giấy chứng minh nhân dân", "quản lí con dấu", "quản lí về an ninh, trật tự các nghề kinh doanh có điều kiện và dịch vụ bảo vệ", "quản lí và bảo đảm trật tự, an toàn giao thông, trật tự công cộng", "quản lí vũ khí, vật liệu nổ", "quản lí, thực hiện công tác phòng cháy, chữa cháy", "tham gia cứu hộ, cứu nạn theo qui định của pháp luật", "Thi hành án hình sự, thi hành án không phải phạt tù, tạm giữ, tạm giam", "bảo vệ, hỗ trợ tư pháp", "Điều tra các vụ án theo nguyên tắc tố tụng hình sự và bộ luật hình sự", "Thực hiện nhiệm vụ, quyền hạn khác theo qui định của pháp luật"]', '["Các cơ quan thuộc Bộ công an", "Sở, phòng cảnh sát", "Trại giam"]', TRUE),
+    (154, 'Vũ công và biên đạo múa', 'ASE', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Năng lực hình học -màu sắc - thiết kế', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự kiên trì', 'Thành tựu', 'Biên đạo múa sáng tác các điệu múa. Vũ công là người biểu diễn các điệu múa.', '["Biên đạo múa", "Diễn viên múa", "Múa dân tộc", "Múa hiện đại", "Khiêu vũ thể thao"]', '["Tìm hiểu và sáng tác các điệu nhảy, bài múa. Các tiết mục này thường chuyển tải một câu chuyện, một chủ đề, ý tưởng hoặc tâm trạng bằng các động tác di chuyển các bước chân, chuyển động và cử chỉ", "Biểu diễn các điệu nhảy, bài múa đơn, múa đôi hoặc cùng với nhiều thành viên của một nhóm múa"]', '["Các nhà hát, đoàn ca nhạc, nhạc vũ kịch", "Các nhà văn hóa", "Các nhóm múa, nhóm nhảy", "Các đài truyền hình", "Các hãng phim", "Hành nghề tự do"]', TRUE),
+    (155, 'Kĩ thuật xây dựng', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Cán bộ kĩ thuật xây dựng thực hiện các nhiệm vụ kĩ thuật trong nghiên cứu kĩ thuật dân dụng, thiết kế, xây dựng, thực hiện, duy tu và sửa chữa các nhà cao tầng và các công trình xây dựng khác như cung cấp nước, hệ thống xử lí nước thải, cầu, đường, đập nước và sân bay.', '["Cốp pha - giàn giáo", "Kĩ thuật cốt thép", "Cấp thoát nước", "Nề", "Công nghệ xây dựng", "Kĩ thuật xây dựng mỏ", "Xây dựng cầu đường", "Lắp đặt cầu", "Lắp đặt giàn khoan", "Xây dựng và bảo trì đường sắt", "Xây dựng và cải thiện công trình thủy lợi", "Xây dựng công trình thủy lợi", "Bảo trì và sửa chữa sân bay", "Kiểm tra và Kiểm định chất lượng cầu đường"]', '["Thực hiện và hỗ trợ các thử nghiệm trong thực tế và trong phòng thí nghiệm đất trồng và các nguyên vật liệu xây dựng", "Cung cấp hỗ trợ kĩ thuật liên quan tới việc xây dựng nhà cao tầng và các công trình xây dựng khác và với các cuộc điều tra hoặc việc chuẩn bị các báo cáo điều tra", "Đảm bảo sự tương thích giữa các đặc điểm kĩ thuật trong thiết kế, với luật pháp và các qui định liên quan, và duy trì các tiêu chuẩn theo yêu cầu của công việc và của nguyên vật liệu", "Áp dụng kiến thức kĩ thuật về xây dựng và các nguyên tắc kĩ thuật dân dụng và thực tế để xác định và giải quyết các vấn đề phát sinh", "Hỗ trợ việc chuẩn bị các dự toán chi tiết về kĩ thuật và giá cả nguyên vật liệu và nhân công theo yêu cầu của dự án, theo yêu cầu kĩ thuật đã đề ra", "Tổ chức duy tu và sửa chữa", "Giám sát các công nhân khác"]', '["Các công ty xây dựng", "Các phòng quản lí nhà đất - đô thị quận, huyện, phường, xã hoặc các ban dự án xây dựng công trình", "Tự kinh doanh độc lập"]', TRUE),
+    (156, 'Kĩ thuật thủy lợi', 'RIC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Cán bộ kĩ thuật thủy lợi lập qui hoạch, thiết kế và duy tu các hệ thống vận chuyển và phân phối nước cho các vùng sản xuất nông nghiệp và các cụm dân cư. Họ giám sát việc xây dựng, lắp đặt các hệ thống phân phối, tưới tiêu và vận hành sao cho đạt kết quả tối ưu cho trồng trọt hoặc nuôi trồng.', '["Quản lí và khai thác công trình thủy lợi", "Quản lí thủy nông", "Cấp thoát nước", "Thủy lợi tổng hợp", "Thủy điện"]', '["Tiến hành công tác quản lí kĩ thuật thi công tại dự án thủy lợi", "Thực hiện công tác hồ sơ hoàn công, nghiệm thu, thanh quyết toán", "Lập hồ sơ hồ sơ hoàn công các công trình xây dựng thuỷ lợi, thủy điện. Vẽ biện pháp thi công chi tiết cho các hạng mục công trình", "Kiểm soát kĩ thuật, khối lượng thi công tại các công trình thuỷ điện", "Giám sát vận hành các công trình thủy lợi", "Chỉ đạo sửa chữa, cải tạo các công trình thủy lợi: đê, kè, đập, cống, hệ thống cấp thoát nước..."]', '["Các cơ quan quản lí thủy lợi", "Các công ty xây dựng công trình thủy lợi", "Các công ty cấp và thoát nước", "Các trang trại, các doanh nghiệp nông nghiệp", "Các nhà máy thủy điện"]', TRUE),
+    (157, 'Chuyên viên hỗ trợ công nghệ thông tin', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Cán bộ kĩ thuật điện trong ngành CNTT&amp;amp;TT làm công tác kĩ thuật về hệ thống điện của các thiết bị CNTT&amp;amp;TT. Họ lắp đặt, bảo trì, vận hành và sửa chữa hệ thống điện của máy tính, điện thoại…', '["Thiết bị hàng hải", "Công nghệ truyền dẫn quang và vô tuyến", "Công nghệ nguồn thông tin và điện", "Công nghệ thiết bị ra đa", "Công nghệ lắp đặt trạm viễn thông", "Công nghệ mạng ngoại vi và thiết bị đầu cuối"]', '["Lắp đặt thiết bị ngoại vi (như bộ nguồn, dây cáp, máy biến áp) cho phần cứng theo thiết kế hoặc các thông số kĩ thuật", "Thực hiện sửa chữa các bộ phận điện của các thiết bị công nghệ thông tin"]', '["Các doanh nghiệp sản xuất phần cứng máy tính, điện thoại, thiết bị viễn thông", "Các doanh nghiệp cung cấp dịch vụ bảo trì phần cứng"]', TRUE),
+    (158, 'Kĩ thuật điện trong phát và truyền tải điện', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Cán bộ kĩ thuật điện trong phát và truyền tải điện làm công việc vận hành bảng điều khiển và máy móc thiết bị của nhà máy phát điện và các công ty truyền tải, hoặc sửa chữa bảo dưỡng phần điện của nhà máy, trạm, đường dây.', '["Vận hành điện trong nhà máy điện", "Vận hành nhà máy thuỷ điện", "Vận hành nhà máy nhiệt điện", "Vận hành và sửa chữa trạm thủy điện", "Đo điện", "Điện dân dụng", "Sửa chữa đường dây dòng điện", "Lắp đặt đường dây tải điện và trạm biến áp có điện áp từ 220 KV trở lên", "Lắp đặt đường dây tải điện và trạm biến áp có điện áp từ 110 kV trở xuống", "Quản lí, vận hành và sửa chữa đường dây tải điện và trạm biến áp có điện áp từ 220 kV trở lên", "Quản lí, vận hành và sửa chữa đường dây tải điện và trạm biến áp có điện áp từ 110 kV trở xuống", "Máy phát điện diesel", "Kĩ thuật điện khí hóa nông thôn"]', '["Vận hành và kiểm soát hệ thống và các thiết bị phát điện bao gồm tua-bin, máy phát điện, tụ điện và bộ kháng điện các nhà máy thủy điện, nhà máy nhiệt điện, nhà máy than, dầu, khí thiên nhiên và nhà máy hạt nhân để tạo ra và phân phối điện", "Kiểm soát việc khởi động và tắt các thiết bị nhà máy điện, kiểm soát hoạt động đóng ngắt, điều chỉnh mực nước và liên lạc với những người vận hành khác để điều chỉnh tải trọng", "Ghi lại các con số từ các biểu đồ, dụng cụ đo và đồng hồ trong khoảng thời gian thiết lập", "Vệ sinh và bảo trì các thiết bị như máy phát điện, thiết bị bốc hơi, tua-bin và máy bơm để ngăn chặn mất hoặc sụt điện"]', '["Tất cả các nhà máy phát điện", "Tất cả công ty truyền tải điện"]', TRUE),
+    (159, 'Kĩ thuật tua-bin', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Thành tựu', 'Tua-bin là các thiết bị cơ khí sản xuất năng lượng bằng cách xoay nhờ các tác động gió, khí hoặc chất lỏng. Cán bộ kĩ thuật tua-bin làm công việc lắp đặt, bảo trì và sửa chữa các thiết bị này', '["Kĩ thuật nồi hơi", "Kĩ thuật tua-bin gió", "Kĩ thuật tua-bin nước", "Kĩ thuật tua-bin khí", "Lắp đặt và kiểm tra nồi hơi và tua-bin"]', '["Vận hành, giám sát và kiểm tra các loại tua-bin như tua-bin khí, nước, gió và hơi nước", "Vận hành và giám sát các tua-bin để phát điện và phân phối điện", "Kiểm soát việc khởi động và tắt các thiết bị tua-bin, kiểm soát hoạt động đóng ngắt, điều chỉnh mực nước và liên lạc với những người vận hành khác để điều chỉnh tải trọng", "Ghi lại các con số từ các biểu đồ, dụng cụ đo và đồng hồ trong khoảng thời gian thiết lập", "Vệ sinh và bảo trì các thiết bị như máy phát điện, thiết bị bốc hơi, tua-bin, máy bơm để ngăn chặn mất hoặc sụt điện"]', '["Các nhà máy phát điện", "Các công ti, nhà máy, phân xưởng sản xuất có sử dụng tua-bin"]', TRUE),
+    (160, 'Kĩ thuật viên phần cứng máy tính', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự tỉ mỉ, cẩn thận', 'Điều kiện làm việc', 'Công nghệ thông tin và truyền thông (CNTT&amp;amp;TT) là lĩnh vực liên quan đến tất cả các hình thức truyền thông điện tử, bao gồm điện thoại, máy tính và điện thoại di động. Các kĩ thuật viên trong lĩnh vực này cung cấp hỗ trợ kĩ thuật cho người sử dụng một cách trực tiếp hoặc thông qua điện thoại, thư điện tử hoặc các thiết bị điện tử khác. Họ chẩn đoán và giải quyết các trục trặc về phần cứng, thiết bị ngoại vi, máy tính, mạng, cơ sở dữ liệu và internet. Họ cũng hướng dẫn và hỗ trợ triển khai, lắp đặt và bảo trì các hệ thống này', '["Chế tạo và lắp ráp máy tính", "Kết nối mạng và các mạng cục bộ", "Sửa chữa và bảo trì", "Chuyên về các bộ phận cụ thể của máy tính (ví dụ thiết bị lưu trữ, xử lí)", "Lắp ráp và sửa chữa máy tính", "Thiết kế vi mạch điện tử trên máy tính"]', '["Cài đặt và thực hiện sửa chữa phần cứng, thiết bị ngoại vi theo bản thiết kế hoặc thông số kĩ thuật lắp đặt", "Thiết lập thiết bị và mạng dịch vụ hoặc bảo đảm cài đặt các loại cáp, hệ điều hành hoặc phần mềm phù hợp", "Trả lời về cách giải quyết vấn đề do người sử dụng nêu ra", "Giám sát hoạt động hàng ngày của hệ thống máy tính và hệ thống truyền thông", "Cung cấp cho người sử dụng các tư vấn, hướng dẫn kĩ thuật và các tài liệu khác để họ nghiên cứu và giải quyết các vấn đề phát sinh"]', '["Các doanh nghiệp lắp ráp, kinh doanh thiết bị CNTT", "Các doanh nghiệp truyền thông, hệ thống thông tin và mạng máy tính", "Các dịch vụ lắp ráp, sửa chữa máy tính và mạng", "Chuyên viên CNTT trong các doanh nghiệp", "Ngành khoa học máy tính", "Ngành công nghệ kĩ thuật phần cứng máy tính"]', TRUE),
+    (161, 'Kĩ thuật viên điện đài hàng hải', 'CRE', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Ngôn ngữ', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Kĩ thuật viên điện đài trên tàu thủy điều hành hoạt động của thiết bị vô tuyến trên tàu để nhận và truyền tải điện văn mã hóa từ điện thoại vô tuyến hoặc hệ thống điện báo vô tuyến.', '["Các chuyên ngành liên quan đến các loại thiết bị thông tin liên lạc (ví dụ: ra-đa, radio)"]', '["Thiết lập và điều chỉnh các thiết bị hoạt động trên tần số mong muốn", "Duy trì liên lạc thường xuyên với các trạm phát thanh ven biển gần nhất để thu được dự báo thời tiết, tín hiệu báo giờ, báo cáo các thông tin cần thiết về hướng đi và vị trí của tàu", "Thường xuyên theo dõi để nhận tín hiệu từ các tàu bị nạn", "Cung cấp các cảnh báo hàng hải và báo cáo tình hình thời tiết", "Duy trì hoạt động của các thiết bị vô tuyến, ghi chép điện văn nhận được hoặc gửi đi và thực hiện các sửa chữa nhỏ, thay thế các bộ phận", "Bảo trì thiết bị ra đa"]', '["Các doanh nghiệp vận chuyển đường thủy bao gồm cả doanh nghiệp Nhà nước và doanh nghiệp tư nhân"]', TRUE),
+    (162, 'Kĩ thuật viên cơ khí trong sản xuất, lắp ráp và sửa chữa', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên cơ khí trong sản xuất, lắp ráp và sửa chữa là những kĩ thuật viên được đào tạo về sản xuất, lắp ráp, bảo trì và sửa chữa các bộ phận cấu thành của tất cả các loại máy móc cơ khí, bao gồm cả động cơ và tua-bin.', '["Sản xuất và lắp đặt thiết bị cơ khí", "Kĩ thuật lắp đặt và xử lí đường ống", "Chế tạo và lắp dựng kết cấu thép", "Bảo trì đầu máy xe lửa", "Sửa chữa máy dệt", "Sửa chữa máy", "Sửa chữa thiết bị", "Sửa chữa thang máy", "Sửa chữa máy móc xây dựng", "Sửa chữa thiết bị", "Bảo trì hệ thống thiết bị", "Sửa chữa và lắp đặt thiết bị lạnh"]', '["Xem xét các thông số kĩ thuật, sơ đồ và bản vẽ để xác định các tài liệu và hướng dẫn cần thiết", "Lắp ráp và lắp đặt các bộ phận sẵn có", "Làm các chi tiết để tạo thành bộ phận lắp ráp", "Lắp ráp các máy móc, động cơ và thành phẩm cơ khí", "Sửa chữa các loại máy móc"]', '["Tất cả ngành công nghiệp", "Các doanh nghiệp cung cấp các loại máy móc thiết bị khác nhau cho công nghiệp và gia dụng", "Mở xưởng cơ khí sửa chữa riêng"]', TRUE),
+    (163, 'Kĩ thuật viên giao thông vận tải', 'IRC', 'Thể chất - Cơ khí', NULL, 'Phân tích - logic', 'Thể chất - cơ khí', 3, NULL, NULL, NULL, 'Kĩ thuật viên giao thông vận tải là những người làm kĩ thuật chuyên môn trong việc đảm bảo hoạt động thông suốt của tất cả các loại phương tiện vận tải công cộng như taxi, xe buýt, xe lửa, xe điện cũng như các loại phương tiện đường thủy như tàu, thuyền, phà và xuồng.', '["Tín hiệu đường sắt", "Kiểm soát việc chạy tàu", "Quản lí tàu", "Lái xe chuyên dụng", "Kiểm soát giao thông đường thủy nội địa", "Kiểm soát vận chuyển bằng tàu thủy", "Điện đầu máy xe lửa và toa xe lửa", "Lắp đặt và sửa chữa hệ thống tải điện đường sắt"]', '["Bảo dưỡng, bảo trì, kiểm tra và sửa chữa các phương tiện vận tải trên bộ như xe tải, xe buýt và xe lửa", "Bảo dưỡng, bảo trì, kiểm tra và sửa chữa các phương tiện vận tải đường thủy như tàu thuyền, phà, xuồng và tàu thủy", "Thay thế các bộ phận hỏng hóc để đảm bảo thông suốt lịch trình vận tải của phương tiện đó"]', '["Các đơn vị giao thông công cộng", "Ngành đường sắt", "Các doanh nghiệp vận tải đường bộ như vận tải ô tô, xe khách", "Các doanh nghiệp vận tải đường thuỷ nội địa trên sông, hồ, kênh đào… bằng tàu, thuyền, phà và xuồng", "Các doanh nghiệp vận tải hàng hóa và giao nhận hàng nội địa"]', TRUE),
+    (164, 'Kĩ thuật viên khai thác mỏ', 'REI', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên khai thác mỏ làm công việc hỗ trợ kĩ thuật để thăm dò khoáng sản, kim loại và dầu khí (như than, vàng, sắt, dầu thô, khí thiên nhiên) trên đất liền hoặc dưới biển, khai thác, vận chuyển và lưu trữ quặng và nguyên liệu thô có chứa khoáng chất, đảm bảo an toàn vệ sinh lao động và giảm thiểu tác động môi trường.', '["Vận hành thiết bị sàng quặng kim loại", "Khoan nổ mìn", "Khoan đường hầm", "Khoan và khai thác mỏ", "Vận hành máy nén khí, máy bơm, quạt gió", "Vận hành nhà máy khí hóa than", "Khảo sát thủy văn", "Khoan thăm dò địa chất", "Sửa chữa thiết bị khai thác mỏ bằng điện", "Điện trong khai thác mỏ hầm lò"]', '["Hỗ trợ kĩ thuật liên quan đến nghiên cứu và phát triển các phương pháp tiến bộ để thăm dò, khai thác, vận chuyển và lưu trữ khoáng sản", "Hỗ trợ kĩ thuật về thăm dò địa chất và đo vẽ địa hình để xác định vị trí tập trung các khoáng sản trên đất liền và dưới biển", "Làm đánh giá chi tiết về số lượng, chi phí nguyên vật liệu, lao động cho việc thăm dò, khảo sát, chiết xuất và vận chuyển", "Xây dựng, lắp đặt, vận hành, bảo dưỡng và sửa chữa các thiết bị thăm dò, khai thác, chiết xuất và vận chuyển quặng khoáng và thiết bị toàn và môi trường", "Áp dụng các kĩ thuật khai thác mỏ để khai thác, chiết xuất, vận chuyển và lưu trữ quặng, khoáng sản", "Tuân thủ chặt chẽ các qui trình và thiết bị vệ sinh an toàn lao động, giảm thiểu tác động môi trường"]', '["Các doanh nghiệp khai thác mỏ, khoáng sản, dầu khí", "Các doanh nghiệp khảo sát khoáng sản", "Các cơ quan quản lí Nhà nước về khai thác khoáng sản"]', TRUE),
+    (165, 'Kĩ thuật viên luyện kim', 'RCI', 'Thể chất - Cơ khí', NULL, 'Phân tích - logic', 'Thể chất - cơ khí', 3, NULL, NULL, NULL, 'Kĩ thuật viên luyện kim làm công việc hỗ trợ kĩ thuật trong nghiên cứu và phát triển các phương pháp tiến bộ để chiết xuất kim loại từ quặng và luyện kim loại. Đó là những công việc liên quan đến chiết xuất kim loại, tinh chế thành các loại kim loại khác nhau, pha trộn kim loại thành hợp kim và chế biến kim loại theo mục đích sử dụng trong các ngành công nghiệp khác nhau.', '["Quản lí kinh doanh bất động sản", "Quản lí nhà và đất"]', '["Hỗ trợ kĩ thuật liên quan đến nghiên cứu và phát triển các phương pháp để xác định các tính chất của kim loại và hợp kim mới", "Hỗ trợ kĩ thuật về các thiết bị tinh luyện và xử lí kim loại", "Ứng dụng các nguyên lí luyện kim để chiết xuất kim loại từ quặng thô", "Xử lí và tinh chế kim loại đã chiết xuất", "Chế biến kim loại theo mục đích sử dụng trong các ngành công nghiệp khác nhau", "Kiểm soát tác động môi trường của quá trình luyện kim"]', '["Các công ty bất động sản", "Tự mở công ty bất động sản"]', TRUE),
+    (166, 'Vận hành máy móc', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên kĩ thuật cơ khí vận hành máy móc giám sát, vận hành và kiểm tra tại chỗ hoặc bằng điều khiển từ xa hoạt động của các loại máy móc và thiết bị. Có rất nhiều loại máy móc thiết bị khác nhau và nhiệm vụ cụ thể của người vận hành phụ thuộc vào loại máy móc thiết bị và vị trí cụ thể của người đó. Về cơ bản họ có một số nhiệm vụ chung như sau.', '["Máy móc thiết bị kiểm soát qui trình, có áp dụng điều khiển tự động trong sử dụng năng lượng, xử lí rác và nước, tinh chế dầu khí, sản xuất hóa chất, kim loại", "Máy móc thiết bị cố định trong khai thác khoáng sản, sản xuất hóa học, phim ảnh, giấy, nhựa, cao su, dệt, da, thực phẩm, gỗ, thủy tinh, gốm, đóng gói", "Động cơ hơi nước và nồi hơi", "Thiết bị công trình nền móng", "Thiết bị xây dựng đường và đường sắt", "Thiết bị xây dựng"]', '["Vận hành và giám sát hoạt động của máy móc thiết bị, qui trình theo hướng dẫn vận hành", "Kiểm soát quá trình khởi động và tắt", "Phát hiện sai lỗi, hỏng hóc và điều chỉnh, sửa chữa", "Đọc thông số trên máy đo, đồ thị ở những thời điểm nhất định", "Kiểm tra sản phẩm đầu ra và chỉnh máy để sản phẩm đạt yêu cầu kĩ thuật", "Bảo dưỡng, bảo trì và vệ sinh máy móc thiết bị", "Ghi chép và lưu trữ hồ sơ vận hành", "Giám sát công nhân có liên quan"]', '["Tất cả các ngành công, nông, lâm nghiệp đều đòi hỏi phải có người vận hành các loại máy khác nhau"]', TRUE),
+    (167, 'Kĩ thuật viên vận hành thiết bị lọc dầu và khí thiên nhiên', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên vận hành nhà máy lọc dầu và khí thiên nhiên, còn gọi là người vận hành thiết bị tinh chế dầu và khí thiên nhiên, làm công tác vận hành và giám sát hoạt động của các hệ thống máy móc thiết bị, điều chỉnh, duy tu bảo dưỡng các thiết bị chế biến, lọc, tinh chế, chưng cất và xử lí dầu thô và các sản phẩm từ dầu hoặc khí thiên nhiên.', '["Sản xuất khí đốt, vận hành trạm khí đốt tự nhiên hóa lỏng", "Vận hành thiết bị hóa dầu", "Vận hành thiết bị khai thác dầu mỏ", "Sửa chữa thiết bị khai thác dầu mỏ", "Vận hành thiết bị xử lí dầu mỏ", "Vận hành trạm phân phối sản phẩm dầu mỏ", "Vận hành hệ thống đường ống nhà máy và đường ống dẫn khí", "Vận hành nhà máy lọc dầu", "Vận hành thiết bị khí thiên nhiên để sản xuất phân đạm"]', '["Vận hành bảng điều khiển điện tử hoặc máy tính từ phòng điều khiển trung tâm để giám sát và theo dõi các qui trình vật lí và hóa học của một số thiết bị xử lí", "Điều chỉnh các thiết bị, các van, các máy bơm, các thiết bị quản lí và xử lí", "Kiểm soát quá trình khởi động và kết thúc, giải quyết sự cố và quản lí các thiết bị xử lí bên ngoài", "Xác minh sự cố của các thiết bị, kiểm tra các ống dẫn khí xem có sự rò rỉ, nết gãy và sắp xếp việc duy tu bảo dưỡng", "Phân tích các sản phẩm mẫu, thực hiện các bài test, ghi nhận lại dữ liệu và viết các bản ghi sản phẩm", "Giám sát các công nhân khác"]', '["Các nhà máy lọc dầu và khí thiên nhiên", "Các nhà máy sản xuất sản phẩm từ dầu khí"]', TRUE),
+    (168, 'Kĩ thuật viên môi trường', 'IRC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Thành tựu', 'Kĩ thuật viên bảo vệ môi trường (BVMT) tiến hành các xét nghiệm trong phòng thí nghiệm và trên thực địa để giám sát môi trường và phát hiện nguồn gốc vấn đề, kể cả những vấn đề gây ảnh hưởng tới sức khỏe. Họ làm việc dưới sự chỉ đạo của các kĩ sư và nhà khoa học môi trường.', '["BVMT đô thị", "BVMT công nghiệp", "BVMT biển", "Vi sinh – hóa sinh", "Quản lí tài nguyên và môi trường", "Công nghệ kĩ thuật môi trường", "Xử lí nước thải", "Xử lí chất thải rắn", "Bảo hộ lao động và môi trường"]', '["Khảo sát các địa điểm, kể cả nơi công cộng và doanh nghiệp, nhằm đảm bảo không có nguy cơ môi trường, sức khỏe và an toàn", "Lắp đặt và bảo dưỡng các thiết bị giám sát mức độ ô nhiễm như cảm biến đo ô nhiễm khói xe", "Thu thập mẫu không khí, đất, nước và các mẫu vật khác để làm xét nghiệm", "Dán nhãn, viết nguồn gốc và đảm bảo tính nghiêm túc của mẫu vật chuyển về phòng thí nghiệm", "Tiến hành thí nghiệm để xác định và lượng hóa mức độ ô nhiễm của mẫu vật", "Làm biểu đồ và báo cáo kết quả thí nghiệm", "Trao đổi kết quả và phân tích với khách hàng"]', '["Các cơ quan BVMT", "Trong bộ phận lập kế hoạch và thực hiện kế hoạch BVMT của các công ty lớn", "Các viện nghiên cứu, phòng thí nghiệm liên quan đến các vấn đề về môi trường"]', TRUE),
+    (169, 'Kĩ thuật viên lâm nghiệp', 'RIE', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Sự độc lập', 'Kĩ thuật viên lâm nghiệp thực hiện các hoạt động nuôi dưỡng, bảo tồn và khai thác rừng khi cần thiết để bán hoặc phân phối các sản phẩm lâm nghiệp một cách thường xuyên cho người mua buôn, tổ chức buôn bán thương mại hoặc tại các chợ.', '["Quản lí phát triển", "Quản lí môi trường", "Kinh tế lâm nghiệp", "Quản lí lâm nghiệp", "Lâm nghiệp", "Quản lí tài nguyên rừng", "Lâm sinh"]', '["Điều tra, kiểm đếm, đo lường các nguồn tài nguyên rừng như cây cối, động vật thực vật hoang dã…", "Hỗ trợ lập kế hoạch quản lí và khai thác rừng", "Hỗ trợ lập kế hoạch và giám sát xây dựng các tuyến đường trong rừng", "Thực hiện và giám sát kĩ thuật các hoạt động lâm nghiệp như ươm trồng và chăm sóc rừng, xác định những cây rừng có thể khai thác và ước lượng khối lượng gỗ khai thác, cắt cành, tỉa ngọn, chặt cây, cưa khúc, tạo sản phẩm thô từ gỗ đã đốn", "Tham gia quản lí và chăm sóc rừng, điều phối các hoạt động như khai thác gỗ, phòng chống cháy rừng, kiểm soát bệnh và côn trùng, tỉa bớt cây tạp trong khu rừng trước khi khai thác thương mại", "Liên tục theo dõi để phát hiện cháy rừng và tham gia chữa cháy", "Đảm bảo tuân thủ các qui định về bảo vệ môi trường, sử dụng tài nguyên, phòng chống hỏa hoạn và tai nạn trong rừng", "8. Hỗ trợ nghiên cứu lâm nghiệp"]', '["Các cơ quan kiểm lâm", "Các trại ươm cây giống", "Các cơ quan nghiên cứu và thực nghiệm về lâm nghiệp", "Các cơ quan quản lí Nhà nước ở địa phương có rừng"]', TRUE),
+    (170, 'Thuyền viên - Điều khiển phương tiện hàng hải', 'REC', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Hoa tiêu và nhân viên văn phòng trên tàu chỉ huy và điều khiển tàu thủy và các tàu chở hàng tương tự, thực hiện các chức năng liên quan trên biển.', '["Điều khiển tàu thủy", "Ổn định tàu"]', '["Chỉ huy và điều khiển tàu thủy và các tàu chở hàng tương tự trên biển hoặc đường thủy nội địa", "Kiểm soát và tham gia vào các hoạt động canh gác trên boong hoặc trên cầu", "Điều khiển tàu ra và vào cảng và qua kênh, rạch, eo biển và hải phận khác cần có kiến thức chuyên môn", "Đảm bảo an toàn cho hàng hóa bốc dỡ, bảo đảm sự tuân thủ các qui định và qui trình về an toàn của thủy thủ và hành khách", "Giám sát kĩ thuật đối với việc duy trì và bảo dưỡng tàu thủy để đảm bảo đồng bộ với các chi tiết hoặc qui định", "Áp dụng các kiến thức về qui tắc và thực tiễn liên quan đến hoạt động tàu biển và hàng hải để xác định và giải quyết các vấn đề nảy sinh trong công việc", "Đặt hàng đồ dự trữ trên tàu và tuyển dụng thủy thủ theo yêu cầu và duy trì hoạt động tàu", "Chuyển và nhận lịch trình và các thông tin khẩn cấp với các trạm trên biển và các tàu khác", "Giám sát các thuyền viên khác"]', '["Các tàu chở hàng, chở dầu, chở hành khách và tàu thuyền khác", "Các công ty vận tải đường biển và đường sông nội địa và quốc tế", "Các cảng biển, cảng sông"]', TRUE),
+    (171, 'Phi công', 'RIE', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Phi công phương tiện bay và kĩ thuật viên hỗ trợ liên quan kiểm soát hoạt động của các thiết bị cơ khí, điện và điện tử để điều khiển phương tiện bay vận chuyển hành khách, thư tín, hàng hóa và thực hiện các nhiệm vụ trước và trong khi bay.', '["Phi công chở khách", "Phi công vận tải", "Phi công trực thăng", "Phi công quân sự"]', '["Bay và điều khiển máy bay, phương tiện bay theo qui trình hoạt động và kiểm soát đã được thiết lập", "Chuẩn bị và trình kế hoạch bay hoặc kiểm tra kế hoạch bay tiêu chuẩn", "Kiểm tra các thiết bị cơ khí, điện tử và bảo đảm rằng các dụng cụ và thiết bị kiểm soát hoạt động chính xác", "Áp dụng các qui tắc và thực tiễn liên quan đến hoạt động bay để xác định và giải quyết các vấn đề nảy sinh trong công việc", "Kiểm tra các lịch trình bảo dưỡng và thực hiện thanh tra phương tiện bay vận hành tốt, được bảo dưỡng và các thiết bị đều sẵn sàng", "Kí các chứng chỉ cần thiết và bảo đảm lịch trình bay chính thức", "Nhận chỉ thị và giấy phép trước chuyến bay và duy trì liên lạc với giao thông hàng không và kiếm soát không lưu trong suốt chuyến bay"]', '["Quân đội", "Các hãng hàng không dân dụng", "Các công ty bay dịch vụ", "Các tổ chức, cá nhân có máy bay riêng"]', TRUE),
+    (172, 'Kiểm soát viên không lưu', 'EC', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 4, 'Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kiểm soát viên không lưu, còn gọi là kiểm soát viên giao thông đường hàng không, hướng dẫn hướng bay trên không trung, và dưới mặt đất qua các thiết bị như đài, ra-đa hay hệ thống đèn và cung cấp thông tin cần thiết cho hoạt động của phương tiện bay.', '["Không quân, chuyên đào tạo phi công và quản lí không lưu trong thời kì chiến tranh", "Hàng không nội địa, chuyên ngành hàng không chở hành khách"]', '["Hướng dẫn và điều khiển phương tiện bay hạ cánh và cất cánh và các thao tác trên mặt đất", "Hướng dẫn và kiểm soát phương tiện bay hoạt động trong không phận cho phép", "Kiểm tra và phê chuẩn kế hoạch bay", "Thông báo cho đội bay và phi hành đoàn về điều kiện thời tiết, các điều kiện hoạt động, kế hoạch bay và giao thông hàng không", "Áp dụng các kiến thức về qui tắc và thực tiễn liên quan đến điều khiển giao thông hàng không để xác định và giải quyết các vấn đề nảy sinh trong công việc", "Ban hành và tổ chức tình trạng khẩn cấp, các dịch vụ và qui trình nghiên cứu, và giải cứu", "Chỉ đạo hoạt động của các phương tiện bay và phương tiện dịch vụ tại hoặc gần đường băng", "Duy trì liên lạc qua điện đài và điện thoại với các đài kiểm soát lân cận, các trạm kiểm soát đón khách hay các trung tâm kiểm soát khác, và phối hợp hoạt động của phương tiện bay vào các khu vực lân cận"]', '["Đài chỉ huy các sân bay dân sự và quân sự", "Trung tâm kiểm soát không lưu và tiếp cận đường dài"]', TRUE),
+    (173, 'Kĩ thuật viên y tế và công nghệ y học hạt nhân', 'RSC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Mối quan hệ', 'Hiện nay, ngành y tế ứng dụng nhiều công nghệ hạt nhân qua sử dụng các vật liệu phóng xạ để hỗ trợ chẩn đoán và điều trị bệnh. Kĩ thuật viên công nghệ y học hạt nhân làm công việc vận hành máy móc liên quan đến y học hạt nhân, như máy chụp cắt lớp, chụp cộng hưởng từ, máy chạy tia gamma...', '["Chuyên sâu về các loại thiết bị cụ thể (như máy chụp CT scan, máy chụp cắt lớp phát xạ - PET scan)", "Lập trình máy tính điều khiển các thiết bị này", "Chuyên sâu về các hình thức xét nghiệm cụ thể (như đo mật độ xương)"]', '["Bảo trì và vận hành các thiết bị liên quan đến y học hạt nhân bao gồm: Máy camera tia gamma, Máy chụp cắt lớp điện toán (CT scan), Thiết bị chụp cộng hưởng từ (MRI), Các hệ thống máy tính điều khiển", "Chuẩn bị và quản lí phóng xạ cho bệnh nhân như dùng chất phóng xạ đánh dấu để xác định bất thường ở các cơ quan trong cơ thể người bệnh", "Đọc kết quả chụp quét, viết và chuyển báo cáo kết quả cho bệnh nhân và bác sĩ", "Sử dụng hóa chất để điều trị bệnh nhân ung thư", "Đảm bảo rằng các chất phóng xạ được lưu trữ và xử lí an toàn", "Theo dõi tất cả các thiết bị an toàn", "Hỗ trợ nghiên cứu", "Hỗ trợ giảng dạy và quản lí sinh viên"]', '["Các bệnh viện, cơ sở y tế", "Các phòng thí nghiệm y tế", "Các bệnh viện đào tạo thực hành", "Các trung tâm nghiên cứu"]', TRUE),
+    (174, 'Kĩ thuật viên phòng xét nghiệm', 'IRC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên phòng xét nghiệm trong các bệnh viện, cơ sở y tế, pháp y, còn gọi là kĩ thuật viên phòng thí nghiệm y tế, tiến hành các xét nghiệm sinh hóa, kiểm tra bằng kính hiển vi và soi vi khuẩn trong phòng thí nghiệm để kiểm tra máu, mô và các chất dịch của bệnh nhân, tử thi để tìm ra nguyên nhân gây bệnh hoặc tử vong.', '["Hóa sinh", "Hóa học lâm sàng", "Tế bào học", "Công nghệ tế bào", "Huyết học", "Mô học", "Miễn dịch học", "Vi sinh vật", "Khoa học truyền dịch", "Kĩ thuật kiểm tra y tế", "Kĩ thuật thiết bị phòng thí nghiệm", "Pháp y"]', '["Thu thập mẫu xét nghiệm từ cơ thể người bệnh như máu, các mô và các chất bài tiết khác của cơ thể để và làm các xét nghiệm phù hợp", "Kiểm tra các mô lấy từ cơ thể người để xác định nguồn gốc và bản chất bệnh bằng cách sử dụng kính hiển vi và các công cụ khác", "Chẩn đoán bản chất bệnh trên cơ sở các phân tích hóa học và báo cáo kết quả cho bác sĩ điều trị của bệnh nhân", "Lập kế hoạch và tiến hành thí nghiệm để nghiên cứu quá trình bệnh lí, tử vong", "Thực hiện khám nghiệm tử thi (khám nghiệm cơ thể người đã chết) để nghiên cứu tình trạng rối loạn của cơ thể hoặc nguyên nhân tử vong"]', '["Các phòng thí nghiệm", "Các bệnh viện, trung tâm y tế, cơ sở chăm sóc sức khỏe", "Các trung tâm nghiên cứu", "Nhà xác", "Bộ phận pháp y của công an"]', TRUE),
+    (175, 'Kĩ thuật viên y tế: kĩ thuật viên phẫu thuật', 'SIR', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Làm việc với con người', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên phẫu thuật, còn là kĩ thuật viên phòng mổ, làm việc dưới sự giám sát của bác sĩ phẫu thuật, y tá, bác sĩ gây mê hoặc nhân viên phẫu thuật khác. Trách nhiệm của họ là chuẩn bị phòng mổ và bệnh nhân trước ca phẫu thuật và thực hiện chăm sóc bệnh nhân ngay sau khi hoàn thành ca phẫu thuật.', '["Kĩ thuật khoan", "Đánh giá mỏ dầu khí", "Kĩ thuật sản xuất", "Kĩ thuật tầng chứa", "Kĩ thuật thủy khí", "Vật lí đá"]', '["Chuẩn bị phòng mổ bằng việc chuẩn bị các dụng cụ, thiết bị mổ, màn vô trùng, và các giải pháp vô trùng trong phẫu thuật", "Điều chỉnh, kiểm tra các thiết bị được sử dụng trong phẫu thuật và đảm bảo tất cả đều hoạt động tốt", "Chuẩn bị cho bệnh nhân trước ca phẫu thuật bằng cách rửa, làm sạch và khử trùng khu vực mổ", "Bố trí bệnh nhân vào vị trí bàn mổ và phủ màn phẫu thuật vô trùng cho bệnh nhân", "Lường trước các yêu cầu của bác sĩ phẫu thuật và đảm bảo rằng họ nhận được dụng cụ phẫu thuật kịp thời trong quá trình phẫu thuật", "Giữ miệng vết mổ, cắt chỉ khâu, giúp đếm gạc, kim, vật tư và các công cụ phẫu thuật", "Điều khiển máy khử trùng, đèn chiếu sáng, hoặc máy hút dịch"]', '["Các doanh nghiệp dầu khí Nhà nước và tư nhân", "Các trung tâm, viện nghiên cứu", "Giảng dạy tại các trường đại học, cao đẳng, trung học", "Các cơ quan Nhà nước quản lí ngành dầu khí", "Các công ty tư vấn kĩ thuật"]', TRUE),
+    (176, 'Kĩ thuật viên y tế: kĩ thuật viên và phụ tá nha khoa', 'SIR', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đề cao sự hợp tác, tương trợ', 'Mối quan hệ', 'Kĩ thuật viên và phụ tá nha khoa trợ giúp cho bác sĩ nha khoa trong tư vấn, chẩn đoán, phòng và chữa bệnh về răng miệng. Về mặt phạm vi và độ phức tạp thì hạn chế hơn so với các nhiệm vụ mà một bác sĩ nha khoa thực hiện.', '["Kĩ thuật viên nha khoa", "Vệ sinh răng miệng", "Kĩ thuật phục hình răng"]', '["Tư vấn cho cá nhân và cộng đồng về vệ sinh răng miệng, chế độ ăn uống và các biện pháp phòng ngừa bệnh răng miệng", "Tiến hành kiểm tra răng, chẩn đoán bệnh và chuyển các ca bệnh khó hơn cho bác sĩ nha khoa khi cần", "Làm sạch răng, chuẩn bị phần lỗ hổng ở răng (khoan và làm sạch lỗ khoan) của người bệnh trước khi hàn và thực hiện việc hàn lỗ hổng đó", "Thực hiện một số công việc liên quan đến việc làm răng giả và một số phương pháp phẫu thuật nhất định", "Chuẩn bị, sát trùng các dụng cụ và thiết bị nha khoa", "Chuẩn bị vật liệu nha khoa", "Giúp bệnh nhân chuẩn bị kiểm tra và điều trị"]', '["Bệnh viện", "Phòng khám nha khoa, răng hàm mặt", "Các cơ sở kĩ thuật phục hình răng"]', TRUE),
+    (177, 'Vận động viên và người chơi thể thao chuyên nghiệp', 'RES', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Làm việc với con người', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Thành tựu', 'Vận động viên và người chơi thể thao chuyên nghiệp tham gia vào một môn thể thao nào đó với tư cách là người chơi hoặc người huấn luyện chuyên nghiệp. Họ tham gia vào các câu lạc bộ, tổ chức hoặc các cuộc thi đấu về các môn thể thao để đạt được thành tích cao. Nhiệm vụ cụ thể của họ phụ thuộc vào công việc cụ thể mà họ đảm nhận.', '["Một môn thể thao cụ thể nào đó", "Quản lí thể thao", "Huấn luyện", "Bình luận và truyền thông"]', '["Vận động viên", "Chơi và tham gia thi đấu một môn thể thao nào đó theo qui chế, luật đã được xây dựng, thể hiện tài năng, năng lực, kĩ thuật và phong cách của mình", "Tham gia luyện tập thường xuyên, thực hiện các bài tập riêng để duy trì thể lực và chuyên môn vể môn thể thao mình chơi", "Thảo luận với huấn luyện viên để quyết định chiến thuật thi đấu", "Đánh giá đối thủ và điều kiện thi đấu", "Thảo luận và kí hợp đồng thi đấu cho các câu lạc bộ, các tổ chức ...", "Huấn luyện viên:", "Xác định điểm mạnh và điểm yếu của vận động viên và đội thể thao", "Lập kế hoạch, hướng dẫn và điều chỉnh việc tập luyện", "Lập kế hoạch và điều phối tham gia thi đấu", "Chuẩn bị và khuyến khích vận động viên thi đấu", "Xây dựng chiến lược chiến thuật thi đấu và chỉ đạo vận động viên", "Theo dõi và phân tích kĩ thuật, thể lực và phong độ để xác định hướng phát triển", "Đại diện tại các cuộc thi đấu thể thao để đảm bảo tiêu chuẩn chất lượng, luật chơi và an toàn", "Theo dõi thời gian thi đấu và ghi chép tỉ số, kết quả", "Đánh giá thể hiện của đối thủ, việc thực hiện cho điểm, phạt và xác định kết quả"]', '["Các đội tuyển thể thao", "Các trung tâm huấn luyện thể thao", "Các nhà văn hóa-thể thao", "Các cơ sở giáo dục – đào tạo", "Các cơ quan quản lí văn hóa-thể thao"]', TRUE),
+    (178, 'Giáo viên giáo dục thể chất', 'SRE', 'Thể chất - Cơ khí', 'Tương tác với người khác', 'Làm việc với con người', 'Thể chất - cơ khí', 5, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Giáo viên giáo dục thể chất, thường gọi là giáo viên thể dục, thực hiện việc giảng dạy các lớp học thể chất, tổ chức các trò chơi, huấn luyện học viên tham gia các trò chơi và các môn thể dục thể thao.', '["Các chuyên ngành về một môn thể thao và đào tạo huấn luyện viên thể thao", "Tâm lí học thể thao"]', '["Đào tạo và tổ chức cho cá nhân hoặc nhóm các học sinh của các trường học và các tổ chức giáo dục khác tham gia vào các môn thể thao như thể dục tự do, thể dục dụng cụ và các bài tập thể chất khác để nâng cao sức khỏe, sự cân đối và sự uyển chuyển duyên dáng", "Dạy học viên sử dụng tạ, xà và các thiết bị thể dục thể chất khác", "Tổ chức, chỉ đạo, hướng dẫn và làm trọng tài cho các trò chơi, thi đấu thể dục thể thao", "Tổ chức thi đấu thể thao giữa các lớp, các đơn vị hoặc khu vực", "tổ chức các cuộc gặp gỡ liên quan đến thể thao", "Giám sát việc bảo trì các dụng cụ thể dục thể thao"]', '["Các trường phổ thống, trung cấp, cao đẳng, đại học", "Các tổ chức giáo dục đào tạo", "Các câu lạc bộ sức khỏe", "Phòng tập thể dục", "Trung tâm thể dục thể thao", "Bệnh viện", "Các khu nghỉ dưỡng, khách sạn lớn"]', TRUE),
+    (179, 'Kĩ thuật viên kĩ thuật viễn thông', 'REC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Kĩ thuật viên kĩ thuật viễn thông thực hiện các công việc về kĩ thuật liên quan tới nghiên cứu kĩ thuật viễn thông, thiết kế, sản xuất, lắp ráp, xây dựng, vận hành, duy tu và sửa chữa các hệ thống viễn thông.', '["Thiết bị tin học và viễn thông doanh nghiệp", "Dịch vụ bưu chính viễn thông doanh nghiệp"]', '["Cung cấp các hỗ trợ kĩ thuật liên quan tới nghiên cứu và phát triển các thiết bị viễn thông, hoặc thử nghiệm các vật mẫu", "Nghiên cứu các vật liệu kĩ thuật như các bản thiết kế, bản phác họa kĩ thuật để xác định phương pháp làm việc chấp nhận được", "Chuẩn bị dự toán chi tiết số lượng và giá cả các nguyên vật liệu và nhân công theo yêu cầu của nhà sản xuất và việc lắp đặt các trang thiết bị, tùy thuộc vào đặc điểm kĩ thuật đã đề ra", "Cung cấp việc giám sát kĩ thuật cho việc sản xuất, sử dụng, duy tu và sửa chữa các hệ thống viễn thông nhằm đảm bảo việc vận hành được thỏa đáng và tương thích với các qui định và tiêu chí kĩ thuật đã được đề ra", "Áp dụng kiến thức trên nguyên lí và thực tế kĩ thuật viễn thông để xác định và giải quyết các vấn đề phát sinh trong quá trình thực hiện công việc"]', '["Các công ty viễn thông Nhà nước và tư nhân", "Các công ty dịch vụ điện thoại di động", "Các doanh nghiệp vận tải hàng hải", "Các doanh nghiệp vận tải hàng không", "Các cơ quan quản lí Nhà nước về bưu chính viễn thông"]', TRUE),
+    (180, 'Cảnh sát cứu hỏa', 'RSE', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Làm việc với con người', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Cảnh sát cứu hoả thực hiện công việc ngăn chặn, phòng chống hỏa hạn và dập tắt đám cháy. Họ cũng có nhiệm vụ giải cứu những người bị mắc kẹt trong hỏa hoạn, cứu hàng hoá, tài sản trong và sau hoả hoạn hoặc tai nạn nghiêm trọng.', '["Cứu hoả", "Cứu hoả đối với tai nạn máy bay", "Cứu hoả cháy rừng", "Cứu hộ"]', '["Phản ứng khi có báo cháy và các báo động khẩn cấp khác như tai nạn trong nhà máy, hàng không, bom mìn…", "Kiểm soát và dập tắt lửa bằng các phương tiện và hóa chất dập lửa và các kĩ thuật cứu hỏa phù hợp", "Ngăn chặn và hạn chế sự lan tỏa của đám cháy hoặc các chất dễ cháy khi có hoả hoạn hoặc tai nạn", "Sơ tán, cứu người mắc kẹt tại địa điểm hỏa hoạn và nơi xảy ra tai nạn", "Cứu tài sản, hàng hoá trong và sau hoả hoạn hoặc các tai nạn nghiêm trọng", "Tuyên truyền giáo dục cộng đồng về phòng cháy chữa cháy"]', '["Lực lượng cảnh sát cứu hỏa", "Lục quân, hải quân và không quân", "Các cơ quan quản lí phòng chống cháy nổ", "Bộ phận an toàn cháy nổ của các cơ quan, doanh nghiệp", "Bộ phận cứu hỏa của các sân bay, cảng biển, khu công nghiệp", "Các doanh nghiệp vận chuyển các vật liệu dễ cháy"]', TRUE),
+    (181, 'Trồng trọt', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Lao động trồng trọt lập kế hoạch, tổ chức và thực hiện các hoạt động trồng trọt và thu hoạch các loại cây lương thực, thực phẩm như lúa và cây có hạt, rau và hoa màu, cây công nghiệp như mía đường, thuốc lá, chè, cà phê, cao su, cây ăn quả như bưởi, xoài, cam chanh. Họ cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường.', '["Trồng cây lương thực", "Trồng rau", "Trồng cây công nghiệp", "Trồng cây ăn quả", "Bảo vệ thực vật", "Khuyến nông khuyến lâm", "Sản xuất giống", "Thu hoạch và chế biến sau thu hoạch", "Thu mua, vận chuyển và tiêu thụ nông sản"]', '["Xác định chủng loại và số lượng cây trồng", "Mua giống, phân bón và vật tư khác", "Cho thuê hoặc đầu tư cải tạo đất đai, nhà cửa, động vật làm việc, trang thiết bị, máy móc", "Thực hiện các hoạt động canh tác như làm đất, gieo hạt, trồng cây, chăm sóc, thu hoạch", "Lưu trữ và sơ chế sản phẩm sau thu hoạch", "Nuôi dưỡng, chăm sóc động vật lấy sức kéo và bảo dưỡng các khu trang trại, máy móc thiết bị", "Cung cấp và tiếp thị nông sản"]', '["Lao động sản xuất tại các trang trại, nông trường chuyên canh một loại cây trồng, trồng cây hỗn hợp, hoặc trồng trọt kết hợp chăn nuôi, chế biến", "Lao động quản lí trang trại, nông trường về kĩ thuật hoặc tài chính, như tính toán chi phí, định giá sản phẩm và ghi chép sổ sách", "Lao động thu hoạch, chế biến, vận chuyển hoặc nhân viên tiếp thị, bán hàng tại các cơ sở, doanh nghiệp thu mua, chế biến, vận chuyển và kinh doanh nông sản", "Tự tạo việc làm tại gia đình"]', TRUE),
+    (182, 'Chăn nuôi gia súc, gia cầm', 'RC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Phân tích - logic', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Lao động chăn nuôi gia súc, gia cầm thực hiện các hoạt động nuôi dưỡng và chăm sóc gia súc gia cầm như trâu, bò, cừu, lợn, dê, ngựa, chó, mèo, gà, vịt, ngan, ngỗng, chim… cho các mục đích như làm việc, chơi thể thao hoặc làm thú cảnh, lấy thịt, sữa, lông, da và các sản phẩm khác để cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường.', '["Chăn nuôi và quản lí gia súc", "Dinh dưỡng động vật", "Quản lí gia cầm"]', '["Lập kế hoạch và thực hiện các hoạt động cần thiết để chăm sóc, nuôi dưỡng gia súc (ví dụ như trâu, bò, lợn, dê) và gia cầm (ví dụ như gà, vịt, chim)", "Phân tích việc sử dụng gia súc, gia cầm vào các mục đích công việc, chơi thể thao, làm thú kiểng hay để lấy thịt, sữa, lông, da và các sản phẩm khác", "Bảo quản và sơ chế các sản phẩm gia súc, gia cầm", "Cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường."]', '["Các trang trại", "Trang trại sản xuất sữa", "Các phòng khám thú y", "Các công ty bán sản phẩm gia súc", "Các viện nghiên cứu"]', TRUE),
+    (183, 'Thợ đường ống', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Mối quan hệ', 'Thợ đường ống lắp đặt, thay thế và bảo dưỡng hệ thống ống dẫn và máy móc cho đường cấp nước, khí đốt, hệ thống thoát nước, hệ thống cống rãnh và thiết bị chạy bằng sức nước và khí nén.', '["Kết nối khí", "Hệ thống sưởi và hệ thống thông gió", "Lắp đặt hệ thống thủy lợi", "Thợ ống, lợp mái", "Lắp đặt hệ thống tưới nước"]', '["Đo, cắt, bắt ren, uốn cong, nối lại bằng đoạn nối, lắp, bảo dưỡng và sửa chữa các ống dẫn, vật cố định của hệ thống thoát nước, hệ thống làm nóng, hệ thống cung cấp nước và hệ thống cống rãnh", "Lắp các thiết bị ga, máy rửa bát và bình nước nóng, bồn rửa và toa lét sử dụng bằng tay và bằng sức mạnh của dụng cụ", "Đặt ống bằng đất sét, xi măng hoặc gang xuống rãnh, mương để tạo thành cống rãnh, ống dẫn nước, đường ống nước hoặc cho các mục đích khác", "Xem xét, kiểm tra các hệ thống và ống đã được lắp đặt, sử dụng máy đo áp suất, theo dõi và kiểm tra thủy tĩnh hoặc dùng các phương pháp khác", "Thực hiện các công việc có liên quan", "Giám sát các công nhân khác"]', '["Các công ty xây dựng", "Các công ty lắp đặt, sửa chữa", "Nhà máy lọc dầu", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
+    (184, 'Thợ chế tạo khuôn và công cụ', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ chế tạo khuôn và công cụ chế tạo các loại khuôn và lõi khuôn.', '["Lập trình và vận hành máy CNC", "Sản xuất khuôn mẫu", "Quản lí chất lượng", "Thiết kế công cụ"]', '["Chế tạo, bảo dưỡng và sửa chữa các loại khuôn (khuôn đúc, khuôn mẫu), khuôn dẫn, mô hình khuôn và các dụng cụ khác. Các loại khuôn và dụng cụ này được sử dụng cùng với các công cụ cầm tay và máy móc để tạo hình sản phẩm", "Tra lắp và lắp ráp các bộ phận để tạo ra và sửa chữa khuôn, mô hình khuôn và các dụng cụ khác", "Chế tạo và sửa chữa các khuôn mẫu bằng kim loại", "Trình bày cách thức tiến hành và điểm qui chiếu trên nguyên vật liệu kim loại để hướng dẫn thợ cắt, tiện, phay và tạo hình sản phẩm"]', '["Cửa hàng bán máy móc", "Các doanh nghiệp sản xuất, chế tạo khuôn mẫu, chế tạo máy", "Phòng thí nghiệm nghiên cứu phát triển"]', TRUE),
+    (185, 'Thợ mộc và thợ làm đồ gỗ', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ mộc và thợ làm đồ gỗ gia dụng cắt, tạo dáng, lắp ráp, chế tạo và bảo dưỡng sửa chữa nhiều loại công trình và đồ đạc bằng gỗ.', '["Hoàn thiện sản phẩm mộc mĩ nghệ", "Mộc mĩ nghệ các hệ thống bên trong", "Mộc dân dụng", "Mộc thô", "Kĩ thuật mộc dân dụng"]', '["Chế tạo, sửa đổi và sửa chữa các cấu trúc và đồ mộc khác tại xưởng mộc và trên công trường xây dựng", "Xây dựng và thay thế các cấu trúc bằng gỗ nặng trên các khu đất đang xây dựng nhà ở", "Lắp ráp, sửa đổi đồ đạc cố định của tòa nhà như tường, cửa, khung cửa sổ và cửa ra vào, và ván ô của cửa hoặc tường", "Chế tạo và sửa chữa các thiết bị sân khấu cho sân khấu biểu diễn, phim điện ảnh hoặc các chương trình truyền hình", "Xây dựng, lắp đặt và sửa chữa các đồ đạc cố định bằng gỗ và đồ đạc trong toa hành khách và các loại tàu xe khác", "Giám sát các công nhân khác"]', '["Các công ty gia công, chế biến gỗ và lâm sản, thiết kế nội thất", "Các công ty kinh doanh đồ gỗ", "Các doanh nghiệp xây dựng dân dụng", "Các xưởng mộc gia đình", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
+    (186, 'Kĩ thuật viên thiết bị lạnh và điều hòa không khí', 'RCE', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Kĩ thuật viên thiết bị lạnh và điều hòa không khí lắp đặt, bảo dưỡng và sửa chữa máy điều hòa không khí, hệ thống máy lạnh và các thiết bị liên quan, ví dụ như điều hòa, tủ lạnh, kho lạnh và các hệ thống làm lạnh công nghiệp.', '["Vận hành và sửa chữa các thiết bị lạnh", "Kĩ thuật lạnh và điều hòa không khí", "Đông lạnh thủy sản"]', '["Đọc bản thiết kế, bản vẽ hoặc các chi tiết kĩ thuật", "Lắp ráp, lắp đặt và sửa chữa các phần hợp thành của hệ thống điều hòa không khí và hệ thống máy lạnh", "Kết nối hệ thống ống dẫn và các thiết bị bằng việc bắt bu-lông, ghép bằng đinh tán, hàn lại", "Kiểm tra hệ thống, chẩn đoán lỗi, và thực hiện các công việc bảo dưỡng thường xuyên"]', '["Làm việc trong các nhà máy có hệ thống thiết bị lạnh, kho lạnh và điều hòa không khí như: nhà máy thủy sản, đông lạnh, chế biến thực phẩm, đường, giấy, dệt…", "Các công ty cơ điện lạnh", "Các cao ốc văn phòng, nhà hàng khách sạn lớn, các siêu thị, cảng, sân bay… có hệ thống điều hòa lớn", "Các cửa hàng thiết bị lạnh và điều hòa không khí", "Tự tạo việc làm"]', TRUE),
+    (187, 'Thợ hàn và thợ cắt kim loại bằng nhiệt', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Phân tích - logic', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật; Cấu trúc ổn định, rõ ràng', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ hàn và thợ cắt kim loại bằng nhiệt hàn và cắt các bộ phận kim loại bằng cách sử dụng lửa khí gas hoặc hồ quang điện và các nguồn nhiệt khác làm chảy rồi cắt hoặc nối kim loại.', '["Hàn điện", "Hàn hơi", "Cắt hàn kim loại"]', '["Hàn các phần kim loại bằng lửa khí gas hoặc hồ quang điện, nhiệt nhôm hoặc các phương pháp khác", "Vận hành máy hàn bằng điện trở", "Sử dụng đèn khò để chế tạo và sửa chữa lót bọc chì, đường ống, đáy và các dụng cụ chì khác", "Hàn đồng các phần kim loại với nhau", "Cắt miếng kim loại bằng lửa khí gas hoặc hồ quang điện", "Hàn các miếng kim loại bằng mối hàn tay"]', '["Các doanh nghiệp sản xuất chế tạo", "Các công ty xây dựng", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
+    (188, 'Kĩ thuật viên cơ khí trong đóng tàu', 'RC', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Đóng tàu là một trong những ngành công nghiệp cổ xưa nhất, bắt nguồn từ việc sử dụng gỗ để chế tạo tàu thuyền. Ngày nay, đóng tàu là một ngành công nghệ cao sử dụng hầu như tất cả các loại hình kĩ thuật chuyên môn. Kĩ thuật viên cơ khí đóng tàu làm công việc đóng thân tàu (phần thân cách nước của một con tàu) cũng như lắp đặt các máy móc bên trong tàu như đường ống và các loại phụ kiện khác nhau.', '["Chế tạo thân tàu", "Chế tạo và lắp ráp các hệ thống đường ống tàu thủy", "Chế tạo, lắp ráp nội thất tàu thủy", "Lắp ráp hệ thống động lực tàu thủy", "Sửa chữa động cơ tàu thủy"]', '["Sử dụng các kĩ thuật khác nhau như kĩ thuật tạo hình, ép nén, gia công kim loại để tạo ra và lắp ráp thân tàu", "Lắp ráp và lắp đặt tất cả các phụ kiện bên trong con tàu."]', '["Các doanh nghiệp, xưởng đóng tàu", "Các doanh nghiệp vận tải đường biển", "Các bến cảng"]', TRUE),
+    (189, 'Kĩ thuật viên cơ khí trong gia công kim loại', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 4, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Gia công kim loại là quá trình gia công, chế biến các kim loại để tạo ra từng bộ phận, phần lắp ráp hoặc các cấu kiện qui mô lớn. Thuật ngữ “gia công kim loại” bao hàm phạm vi rộng các công việc, từ việc gia công các con tàu và cây cầu lớn tới việc gia công các chi tiết động cơ chính xác và đồ trang sức tinh xảo. Thợ gia công kim loại thực hiện các kĩ thuật nguội như ép nguội, uốn nguội, kéo nguội, cắt nguội, hoặc các kĩ thuật rèn như rèn nóng, rèm ấm và rèn nguội.', '["Hàn", "Rèn", "Nguội", "Sửa chữa nguội", "Gia công không phoi", "Gia công cắt gọt kim loại"]', '["Nung kim loại trong lò rèn, chế tạo và sửa chữa các sản phẩm bằng cách vẽ, uốn, cắt, đóng búa các sản phẩm kim loại đó", "Tạo hình kim loại đã được nung nóng thành các hình dạng cụ thể bằng tay hoặc bằng búa", "Tạo hình kim loại không nung nóng thành các hình dạng cụ thể bằng các kĩ thuật nguội như uốn, nắn, cắt, quấn, tán, gò, hàn, đục, chặt, cưa cắt, dũa gọt, khoan, ren, cạo, mài…"]', '["Các công ty xây dựng", "Các doanh nghiệp chế tạo máy móc thiết bị, sản phẩm kim loại", "Các doanh nghiệp thiết kế máy móc thiết bị, sản phẩm", "Các doanh nghiệp luyện kim", "Các doanh nghiệp đóng tàu"]', TRUE),
+    (190, 'Thợ cơ khí và sửa chữa động cơ', 'RCE', 'Thể chất - Cơ khí', 'Thu thập thông tin; Phân tích và xử lý', 'Phân tích - logic', 'Thể chất - cơ khí', 3, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ cơ khí và sửa chữa xe có động cơ làm công việc bảo trì, sửa chữa động cơ và các bộ phận cơ khí của xe máy, xe ô tô chở khách, ô tô tải và các loại xe có động cơ khác.', '["Phương tiện giao thông bốn bánh", "Xe hai bánh", "Xe tải trọng lớn", "Xe thể thao, xe đua", "Phương tiện đi lại tại trang trại"]', '["Lắp ráp, kiểm tra, thử nghiệm và sửa chữa động cơ xe ô tô và các loại xe có động cơ khác", "Thay thế các bộ phận hoặc hoàn thiện động cơ", "Lắp ráp, kiểm tra, điều chỉnh, tháo dỡ, khôi phục và thay thế bộ phận hỏng hóc của các loại xe ô tô", "Lắp đặt hoặc điều chỉnh động cơ, phanh và điều chỉnh tay lái hoặc các bộ phận khác của các loại xe ô tô"]', '["Ngành ô tô xe máy", "Xưởng cơ khí của các đơn vị vận tải đường bộ", "Các đơn vị, bộ phận vận tải của quân đội, các tổ chức bán quân sự và lực lượng vũ trang khác", "Các doanh nghiệp có đội xe riêng", "Các ga-ra tư nhân", "Tự mở cơ sở hoặc hành nghề tư nhân"]', TRUE),
+    (191, 'Thợ lặn', 'RC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 3, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ lặn sử dụng thiết bị chuyên dụng để làm việc dưới nước. Các hoạt động này có thể là để thăm dò tài nguyên thiên nhiên, cứu hộ và tìm kiếm người, tàu và hàng hoá trong trường hợp đắm tàu... Thợ lặn cũng có thể kiểm tra, lắp đặt, sửa chữa các thiết bị dưới nước; kiểm tra, thí nghiệm và chụp ảnh sinh cảnh biển hoặc các cấu trúc dưới nước cho các mục đích thương mại hoặc nghiên cứu. Ngoài lặn dưới nước, còn có lặn HAZMAT là một hình thức lặn mà ở đó các thợ lặn lặn vào một môi trường không phải là nước mà là các chất lỏng khác như bột giấy, xi măng lỏng hoặc bùn dầu.', '["Lặn cứu hộ", "Lặn nghiên cứu", "Hướng dẫn lặn", "Lặn xây dựng"]', '["Thực hiện các biện pháp an toàn như kiểm soát đường dài và độ sâu của việc lặn", "Kiểm tra và bảo trì thiết bị lặn", "Lặn xuống nước với sự hỗ trợ của người trên bờ, liên lạc với người trên bờ trong khi ở dưới nước bằng các tín hiệu hoặc điện thoại đặc biệt", "Làm việc dưới nước để thực hiện các công việc cụ thể (ví dụ sửa chữa các cấu kiện, sửa chữa nhỏ trên thân tàu, loại bỏ các chướng ngại vật dưới nước, khoan lỗ nổ mìn, thu thập mẫu đất, sinh vật biển, các mảnh vỡ, phục hồi vật liệu, chụp ảnh)", "Báo cáo kết quả việc lặn dưới nước và điều kiện môi trường lặn"]', '["Các doanh nghiệp khai thác mỏ", "Các doanh nghiệp xây dựng", "Các doanh nghiệp cung cấp dịch vụ cứu hộ và khôi phục sự cố", "Các đơn vị nghiên cứu về biển", "Giàn khoan dầu ngoài khơi", "Các doanh nghiệp vận tải bằng tàu thủy"]', TRUE),
+    (192, 'Sĩ quan quân đội', 'ESC', 'Thể chất - Cơ khí', NULL, 'Làm việc với con người', 'Thể chất - cơ khí', 4, NULL, NULL, NULL, 'Sĩ quan quân đội là người chỉ huy và quản lí các đơn vị trong lực lượng quốc phòng. Lục quân, hải quân và không quân là ba quân chủng quốc phòng và là lực lượng rất quan trọng đối với việc bảo vệ an ninh quốc gia. Họ bảo vệ lãnh thổ quốc gia bao gồm vùng đất, vùng biển và vùng trời. Bạn cũng có thể tham gia vào lực lượng quốc phòng với tư cách là chuyên gia trong nhiều ngành nghề khác nhau (ví dụ như kĩ sư, bác sĩ, y tá, kế toán, bác sĩ thú y, luật sư). Hầu như bất kì ngành nghề nào cũng có trong các quân chủng quốc phòng. Hệ thống cấp bậc quân hàm của sĩ quan quân đội gồm ba cấp, mười hai bậc: Cấp Uý có bốn bậc gồm Thiếu uý, Trung uý, Thượng uý, Đại uý. Cấp Tá có bốn bậc gồm Thiếu tá, Trung tá, Thượng tá, Đại tá. Cấp Tướng có bốn bậc gồm Thiếu tướng, Chuẩn Đô đốc Hải quân, Trung tướng, Phó Đô đốc Hải quân, Thượng tướng, Đô đốc Hải quân, Đại tướng.', '["Lục quân", "Hải quân", "Phòng không - Không quân", "Công binh", "Quân y"]', '["Tham gia một trong các quân chủng như là một sĩ quan", "Tham dự và vượt qua các kì thi trong các chuyên ngành cụ thể để được thăng tiến", "Phát triển kĩ năng để lãnh đạo và chỉ huy lính"]', NULL, TRUE),
+    (193, 'Lao động trong lâm nghiệp', 'RCI', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự làm việc độc lập cao', 'Sự độc lập', 'Lao động trọng lâm nghiệp là nghề liên quan đến trồng cây gây rừng, bao gồm các nhiệm vụ: Tạo cây giống, trồng, chăm sóc, nuôi dưỡng, cải tạo, làm giàu rừng và sản xuất nông lâm kết hợp trên đất nông lâm nghiệp nhằm phát triển kinh tế và bảo vệ môi trường. Các hoạt động nhằm phát triển, duy trì và bảo tồn đa dạng sinh học các loại rừng; gồm hoạt động trồng rừng tập trung, khoanh nuôi tái sinh kết hợp trồng rừng, chăm sóc rừng mới trồng chưa đạt tiêu chuẩn rừng. Nghề này còn bao gồm cả các hoạt động khai thác, sơ chế gỗ và các lầm sản phục vụ các ngành công nghiệp chế biến...', '["Giáo viên giảng dạy về lâm nghiệp", "Thiết kề trồng rừng", "Trồng và chăm sóc rừng", "Quản lý bảo vệ rừng", "Khai thác và sơ chế các loại lâm sản", "Cán bộ khuyến lâm"]', '["Thiết kế trồng rừng", "Nhân giống cây trồng", "Trồng và chăm sóc rừng", "Nuôi dưỡng và phục hồi rừng", "Quản lý bảo vệ rừng", "Thiết kế khai thác gỗ", "Khai thác gỗ và tre nứa", "Trồng cây ăn quả", "Trồng cây công nghiệp", "Trồng và thu hoạch một số lâm sản ngoài gỗ", "Trồng hoa và cây cảnh", "Nông lâm kết hợp", "Khuyến nông lâm", "Kinh doanh sản xuất nông lâm nghiệp"]', '["Các đơn vị trong lĩnh vực lâm nghiệp"]', TRUE),
+    (194, 'Lao động nuôi trồng và đánh bắt thủy sản', 'RIC', 'Thể chất - Cơ khí', 'Phân tích và xử lý; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự làm việc độc lập cao', 'Sự độc lập', 'Nuôi trồng và đánh bắt thuỷ sản (bao gồm cả nước mặn, lợ) là một bộ phận của nền sản xuất nông nghiệp. Nghề này sản xuất ra các loại sản phẩm thuỷ sản có chất lượng cao phục vụ cho đời sống của nhân dân và cung cấp nguyên liệu cho công nghiệp chế biến, xuất khẩu, góp phần cải tạo môi trường sinh thái. Đồng thời khai thác, đánh bắt các loại thủy sản nước ngọt và nước mặn.', '["Nghiên cứu trong lĩnh vực nuôi trồng thủy sản", "các trạm nghiên cứu", "các doanh nghiệp về sản xuất giống", "Các nghiệp đoàn đánh bắt thủy sản gần bờ, xa bờ", "Cán bộ khuyến ngư…."]', '["Xác định thủy sinh vật", "Xác định một số chỉ tiêu sinh học ở cá", "Khảo sát, thiết kế công trình nuôi thuỷ sản", "Chuẩn bị công trình nuôi", "Sản xuất và sử dụng thức ăn trong nuôi", "Quản lý chất lượng nước trong nuôi", "Phòng và trị bệnh thủy sản", "Thực hiện an toàn lao động trong nuôi trồng", "Sản xuất giống cá, tôm, cua…", "Nuôi trồng các loại thủy sản nước ngọt, nước nợ, nước mặn", "Vận chuyển động vật thuỷ sản"]', '["Có thể làm việc theo quy mô hộ gia đình, trang trại...", "Các doanh nghiệp, nghiệp đoàn về nuôi trồng, đánh bắt thủy sản"]', TRUE),
+    (195, 'Thợ xây', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ xây là những người lao động có tay nghề tham gia xây dựng cơ sở hạ tầng, các công trình, nhà cửa…. Thợ xây được chia thành các loại hình sau: thợ nề, thợ mộc, thợ lót thảm, thợ trộn hồ, thợ điện, thợ xây hàng rào, thợ sắt, thợ tô, thợ sửa ống nước, thợ hàn, thợ sơn, thợ mài, trang trí nội thất, thiết kế phong cảnh.', '["Các công trình xây dựng dân dụng", "Các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện"]', '["Xây dựng, hoàn thiện các công trình từ khâu đào móng đến hoàn thiện", "lắp đặt các thiết bị cơ bản của công trình như cửa, cầu thang", "nhiệm vụ của người thợ xây rất đa dạng, từ những việc đơn giản như trộn hồ, quét vôi, xây, trát… đến các công việc phức tạp hơn như khả năng đọc bản vẽ, dự toán…tính toán đến các yếu tố ảnh hưởng đến công trình xây dựng như độ lún, độ chịu lực, tính toán nguyên nhiên vật liệu phù hợp với công trình…."]', '["Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp...", "Các doanh nghiệp chuyên về xây dựng…."]', TRUE),
+    (196, 'Thợ hoàn thiện trong xây dựng', 'RC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Sự độc lập', 'Thợ hoàn thiện trong xây dựng là nghề chuyên thi công xây dựng và hoàn thiện các công trình xây dựng dân dụng và công nghiệp theo đúng các yêu cầu kỹ thuật, quy định, quy phạm theo TCVN, đạt năng suất, chất lượng, an toàn lao động và vệ sinh môi trường.', '["Các công trình xây dựng dân dụng", "Các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện"]', '["Nhóm hoàn thiện công trình xây dựng gồm các hoạt động liên quan tới việc hoàn thiện hoặc kết thúc công trình như: Trát vữa bên trong và bên ngoài các công trình nhà và công trình xây dựng khác, bao gồm các nguyên liệu đánh bóng, Lắp đặt cửa ra vào, cửa sổ, khung cửa ra vào, khung cửa sổ bằng gỗ hoặc bằng những vật liệu khác, Lắp đặt thiết bị, đồ dùng nhà bếp, cầu thang và những hoạt động tương tự, Lắp đặt thiết bị nội thất", "Hoạt động hoàn thiện bên trong công trình như: Làm trần, ốp gỗ tường, hoặc vách ngăn di chuyển được", "Xếp, lợp, treo hoặc lắp đặt trong các toà nhà hoặc các công trình khác như: Lát sàn hoặc tường bằng gạch, bê tông, đá xẻ, gạch gốm", "Lót ván sàn và các loại phủ sàn bằng gỗ khác", "Thảm và tấm phủ sơn lót sàn, bao gồm bằng cao su và nhựa", "Lát sàn hoặc ốp tường bằng gạch không nung, đá hoa, đá hoa cương (granite), đá phiến… Giấy dán tường", "Sơn bên ngoài và bên trong công trình nhà"]', '["Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp...", "Các doanh nghiệp chuyên về xây dựng…."]', TRUE),
+    (197, 'Thợ sơn', 'RCI', 'Thể chất - Cơ khí', 'Thu thập thông tin; Tương tác với người khác', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Thợ sơn là những người quét vôi – sơn nước, một khâu trong công việc hoàn thiện công trình xây dựng, nhà ở, cầu, ô tô, các vật dụng có thể sơn được… Các loại thợ sơn khác nhau bao gồm các thợ sơn xây dựng sơn các tòa nhà mới, các thợ sơn bảo dưỡng cải thiện và duy trì lớp sơn, các thợ sơn nghệ thuật áp dụng các kĩ thuật trang trí vào các bề mặt đã sơn, các công nhân sơn thủ công sơn đồ chơi, ô tô, các vật dụng gia đình và các thiết bị khác.', '["Sơn các công trình xây dựng dân dụng", "Sơn các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện", "Làm về sơn tại các nhà máy, doanh nghiệp sản xuất như ô tô, xe máy, sơn tĩnh điện…."]', '["Tính toán số lượng nguyên vật liệu cần thiết dựa vào các số liệu đo đạc bề mặt sơn và yêu cầu sơn", "Ước tính tổng chi phí của công việc bằng cách ước tính chi phí của nguyên vật liệu và thời gian cần thiết để hoàn thành công việc", "Lựa chọn và mua các vật liệu, công cụ, chất liệu sơn, loại sơn và màu sơn phù hợp cho bề mặt cần sơn, phụ thuộc vào độ bền, dễ xử lí, phương thức sử dụng và mong muốn của khách hàng", "Xử lí các bề mặt trước khi sơn với dầu, nhựa thông làm loãng sơn, chất loại bỏ nấm mốc để đảm bảo sơn bám, khi sơn lên sẽ đẹp", "Pha trộn các màu sơn, chất nhuộm, vecni với dầu và các chất phụ gia làm loãng sơn hay làm khô để có được hỗn hợp sơn như mong muốn", "Bảo vệ các bề mặt trong khi sơn bằng cách dùng băng dính hoặc vải để che phần không muốn bị sơn dính vào", "Dọn sạch khu vực sau khi sơn…."]', '["Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp, doanh nghiệp sản xuất để làm việc ở các vị trí chuyên về sơn...", "Các doanh nghiệp chuyên về sơn…."]', TRUE),
+    (198, 'Thợ lắp đặt và sửa chữa điện', 'RIC', 'Thể chất - Cơ khí', 'Thu thập thông tin; Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy', 'Hỗ trợ', 'Thợ lắp đặt và sửa chữa điện dân đóng góp vai trò vô cùng to lớn cho ngành Điện lực của chúng ta do hiện nay thợ sửa chữa và lắp đặt hệ thống điện dân dụng còn đang thiếu nhân lực trầm trọng. Lắp đặt và sửa chữa điện bao gốm Hệ thống điện trong hộ gia đình, công ty, trường học, chung cư, nhà máy, các cơ sở sản xuất kinh doanh, sửa chữa cơ khí….', '["Làm việc tại các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện"]', '["Lắp đặt hệ thống mạng điện sản xuất và sinh hoạt", "Lắp đặt thiết bị và đồ dùng điện", "Vận hành, bảo trì, bảo dưỡng, và sửa chữa mạng điện, thiết bị và đồ dùng điện"]', NULL, TRUE),
+    (199, 'Thợ lắp đặt và thợ sửa chữa điện tử viễn thông', 'RIC', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Môi trường đề cao quan hệ giữa các cá nhân; Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đòi hỏi sự thích ứng, tính đa dạng', 'Hỗ trợ', 'Nghề lắp đặt, sửa chữa điện tử viễn thông thực hiện các công việc như: Lắp đặt cáp đồng cũng như các quang, lắp đặt các tủ thiết bị viễn thông, lắp đặt điện và các thiết bị phụ trợ khác; Vận hành, khai thác được các thiết bị cơ bản trong đài trạm viễn thông; Kiểm tra được các chỉ tiêu chất lượng cơ bản của các trang thiết bị; Ứng dụng được một số kỹ thuật công nghệ mới, làm việc độc lập và có khả năng sáng tạo cải tiến trong quá trình làm việc.', '["Chủ yếu liên quan đến lĩnh vực lắp đặt và sửa chữa điện- điện tử viễn thông tại các trạm, đài viễn thông", "lắp đặt, sửa chữa các mạng viễn thông Khi phát triển sự nghiệp, bạn có thể chuyên sâu hơn nữa về một lĩnh của bạn như hỗ trợ giảng dạy, nghiên cứu trong lĩnh vực điện tử viễn thông"]', '["Lắp đặt hệ thống thiết bị điện tử viễn thông", "Vận hành, bảo trì, bảo dưỡng, và sửa chữa trong các đài, trạm viễn thông", "Lắp đặt các mạng viễn thông", "Tư vấn lắp đặt hệ thống viễn thôn"]', '["Làm việc tại các đài, trạm viễn thông", "Các doanh nghiệp kinh doanh về viễn thông"]', TRUE),
+    (200, 'Thợ lắp ráp', 'RCI', 'Thể chất - Cơ khí', 'Làm việc với công cụ, kỹ thuật', 'Hình học - màu sắc - thiết kế', 'Thể chất - cơ khí', 2, 'Điều kiện làm việc thực địa, tương tác với công cụ, đồ vật', 'Công việc đề cao sự trung thực và phẩm hạnh cá nhân', 'Hỗ trợ', 'Thợ lắp ráp là người làm việc trong lĩnh vực sản xuất, chuyên lắp ráp các loại sản phẩm như: lắp ráp máy cơ khí, máy cơ học; lắp ráp thiết bị điện; lắp ráp thiết bị điện tử; lắp ráp các sản phẩm kim loại, cao su, chất dẻo; lắp ráp các sản phẩm gỗ và các sản phẩm liên quan; lắp ráp các sản phẩm bằng giấy, bìa, da…..', '["Chủ yếu liên quan đến lĩnh vực lắp ráp, khi phát triển nghề nghiệp bạn có thể học chuyên sâu hơn và có thể nghiên cứu, sang tạo các loại mẫu mã mới, hướng dẫn hoặc tham gia đào tạo tại các cơ sở đào tạo, doanh nghiệp"]', '["Hiểu các tính chất của chất liệu lắp ráp", "Lắp ráp và hoàn thiện các sản phẩm theo yêu cầu của từng loại hình công việc như mô tả nghề nêu trên"]', '["Các doanh nghiệp lắp ráp", "Các xưởng sản xuất, lắp ráp sản phẩm các loại"]', TRUE);
+
+INSERT INTO job_search_tokens (token, job_id, weight) VALUES
+    ('ki', 151, 16),
+    ('thuat', 151, 16),
+    ('vien', 151, 9),
+    ('co', 151, 15),
+    ('dien', 151, 11),
+    ('tu', 151, 14),
+    ('the', 151, 4),
+    ('chat', 151, 4),
+    ('khi', 151, 5),
+    ('che', 151, 2),
+    ('tao', 151, 3),
+    ('nguoi', 151, 2),
+    ('may', 151, 5),
+    ('thi', 151, 2),
+    ('giac', 151, 2),
+    ('tinh', 151, 3),
+    ('dong', 151, 4),
+    ('hoa', 151, 4),
+    ('he', 151, 2),
+    ('thong', 151, 2),
+    ('lam', 151, 1),
+    ('viec', 151, 2),
+    ('trong', 151, 2),
+    ('mot', 151, 2),
+    ('linh', 151, 2),
+    ('vuc', 151, 2),
+    ('lien', 151, 1),
+    ('quan', 151, 1),
+    ('toi', 151, 1),
+    ('nhieu', 151, 1),
+    ('nganh', 151, 1),
+    ('nghe', 151, 1),
+    ('nhu', 151, 1),
+    ('dieu', 151, 1),
+    ('khien', 151, 1),
+    ('va', 151, 1),
+    ('sang', 151, 1),
+    ('robot', 151, 1),
+    ('la', 151, 1),
+    ('vi', 151, 1),
+    ('du', 151, 1),
+    ('ve', 151, 1),
+    ('cong', 151, 1),
+    ('ki', 152, 17),
+    ('su', 152, 9),
+    ('hang', 152, 11),
+    ('hai', 152, 11),
+    ('the', 152, 4),
+    ('chat', 152, 4),
+    ('co', 152, 5),
+    ('khi', 152, 5),
+    ('thuat', 152, 8),
+    ('tau', 152, 9),
+    ('thuy', 152, 9),
+    ('dien', 152, 8),
+    ('va', 152, 5),
+    ('tu', 152, 5),
+    ('dong', 152, 3),
+    ('kiem', 152, 1),
+    ('soat', 152, 1),
+    ('tham', 152, 1),
+    ('gia', 152, 1),
+    ('hoat', 152, 1),
+    ('thiet', 152, 2),
+    ('ke', 152, 1),
+    ('dieu', 152, 1),
+    ('khien', 152, 1),
+    ('bao', 152, 2),
+    ('tri', 152, 1),
+    ('duong', 152, 2),
+    ('sua', 152, 1),
+    ('chua', 152, 1),
+    ('bi', 152, 1),
+    ('may', 152, 1),
+    ('moc', 152, 1),
+    ('tren', 152, 2),
+    ('cac', 152, 2),
+    ('phuong', 152, 1),
+    ('tien', 152, 1),
+    ('hoac', 152, 1),
+    ('thuc', 152, 1),
+    ('hien', 152, 1),
+    ('nhiem', 152, 1),
+    ('vu', 152, 1),
+    ('ho', 152, 1),
+    ('tro', 152, 1),
+    ('bo', 152, 1),
+    ('cong', 153, 10),
+    ('an', 153, 9),
+    ('the', 153, 4),
+    ('chat', 153, 4),
+    ('co', 153, 6),
+    ('khi', 153, 4),
+    ('canh', 153, 18),
+    ('sat', 153, 18),
+    ('dong', 153, 2),
+    ('hinh', 153, 2),
+    ('su', 153, 2),
+    ('kinh', 153, 2),
+    ('te', 153, 2),
+    ('giao', 153, 2),
+    ('thong', 153, 2),
+    ('moi', 153, 2),
+    ('truong', 153, 2),
+    ('dac', 153, 2),
+    ('nhiem', 153, 2),
+    ('dieu', 153, 2),
+    ('tra', 153, 2),
+    ('quan', 153, 2),
+    ('li', 153, 2),
+    ('hanh', 153, 3),
+    ('chinh', 153, 2),
+    ('va', 153, 4),
+    ('trat', 153, 4),
+    ('tu', 153, 4),
+    ('xa', 153, 5),
+    ('hoi', 153, 5),
+    ('phong', 153, 2),
+    ('chay', 153, 4),
+    ('chua', 153, 2),
+    ('thi', 153, 1),
+    ('cac', 153, 2),
+    ('qui', 153, 1),
+    ('dinh', 153, 2),
+    ('luat', 153, 1),
+    ('phap', 153, 2),
+    ('dam', 153, 1),
+    ('bao', 153, 2),
+    ('on', 153, 1),
+    ('cho', 153, 1),
+    ('ki', 153, 1),
+    ('cuong', 153, 1),
+    ('ve', 153, 1),
+    ('loi', 153, 2),
+    ('ich', 153, 2),
+    ('cua', 153, 2),
+    ('nha', 153, 1),
+    ('nuoc', 153, 1),
+    ('trong', 153, 1),
+    ('quyen', 153, 1),
+    ('hop', 153, 1),
+    ('dan', 153, 1),
+    ('vu', 154, 11),
+    ('cong', 154, 9),
+    ('va', 154, 8),
+    ('bien', 154, 11),
+    ('dao', 154, 11),
+    ('mua', 154, 19),
+    ('the', 154, 6),
+    ('chat', 154, 4),
+    ('co', 154, 4),
+    ('khi', 154, 4),
+    ('dien', 154, 3),
+    ('vien', 154, 2),
+    ('dan', 154, 2),
+    ('toc', 154, 2),
+    ('hien', 154, 2),
+    ('dai', 154, 2),
+    ('khieu', 154, 2),
+    ('thao', 154, 2),
+    ('sang', 154, 1),
+    ('tac', 154, 1),
+    ('cac', 154, 2),
+    ('dieu', 154, 2),
+    ('la', 154, 1),
+    ('nguoi', 154, 1),
+    ('bieu', 154, 1),
+    ('ki', 155, 15),
+    ('thuat', 155, 15),
+    ('xay', 155, 23),
+    ('dung', 155, 24),
+    ('the', 155, 4),
+    ('chat', 155, 6),
+    ('co', 155, 4),
+    ('khi', 155, 4),
+    ('cop', 155, 2),
+    ('pha', 155, 2),
+    ('gian', 155, 4),
+    ('giao', 155, 2),
+    ('cot', 155, 2),
+    ('thep', 155, 2),
+    ('cap', 155, 3),
+    ('thoat', 155, 2),
+    ('nuoc', 155, 5),
+    ('ne', 155, 2),
+    ('cong', 155, 7),
+    ('nghe', 155, 2),
+    ('mo', 155, 2),
+    ('cau', 155, 7),
+    ('duong', 155, 7),
+    ('lap', 155, 4),
+    ('dat', 155, 4),
+    ('khoan', 155, 2),
+    ('va', 155, 11),
+    ('bao', 155, 4),
+    ('tri', 155, 4),
+    ('sat', 155, 2),
+    ('cai', 155, 2),
+    ('thien', 155, 2),
+    ('trinh', 155, 5),
+    ('thuy', 155, 4),
+    ('loi', 155, 4),
+    ('sua', 155, 3),
+    ('chua', 155, 3),
+    ('san', 155, 3),
+    ('bay', 155, 3),
+    ('kiem', 155, 4),
+    ('tra', 155, 2),
+    ('dinh', 155, 2),
+    ('luong', 155, 2),
+    ('can', 155, 1),
+    ('bo', 155, 1),
+    ('thuc', 155, 2),
+    ('hien', 155, 2),
+    ('cac', 155, 3),
+    ('nhiem', 155, 1),
+    ('vu', 155, 1),
+    ('trong', 155, 1),
+    ('nghien', 155, 1),
+    ('cuu', 155, 1),
+    ('dan', 155, 1),
+    ('thiet', 155, 1),
+    ('ke', 155, 1),
+    ('duy', 155, 1),
+    ('tu', 155, 1),
+    ('nha', 155, 1),
+    ('cao', 155, 1),
+    ('tang', 155, 1),
+    ('khac', 155, 1),
+    ('nhu', 155, 1),
+    ('cung', 155, 1),
+    ('he', 155, 1),
+    ('thong', 155, 1),
+    ('xu', 155, 1),
+    ('li', 155, 1),
+    ('thai', 155, 1),
+    ('dap', 155, 1),
+    ('ki', 156, 9),
+    ('thuat', 156, 9),
+    ('thuy', 156, 17),
+    ('loi', 156, 13),
+    ('the', 156, 4),
+    ('chat', 156, 4),
+    ('co', 156, 4),
+    ('khi', 156, 4),
+    ('quan', 156, 4),
+    ('li', 156, 4),
+    ('va', 156, 6),
+    ('khai', 156, 2),
+    ('thac', 156, 2),
+    ('cong', 156, 2),
+    ('trinh', 156, 2),
+    ('nong', 156, 3),
+    ('cap', 156, 2),
+    ('thoat', 156, 2),
+    ('nuoc', 156, 3),
+    ('tong', 156, 2),
+    ('hop', 156, 2),
+    ('dien', 156, 2),
+    ('can', 156, 1),
+    ('bo', 156, 1),
+    ('lap', 156, 2),
+    ('qui', 156, 1),
+    ('hoach', 156, 1),
+    ('thiet', 156, 1),
+    ('ke', 156, 1),
+    ('duy', 156, 1),
+    ('tu', 156, 1),
+    ('cac', 156, 4),
+    ('he', 156, 2),
+    ('thong', 156, 2),
+    ('van', 156, 2),
+    ('chuyen', 156, 1),
+    ('phan', 156, 2),
+    ('phoi', 156, 2),
+    ('cho', 156, 3),
+    ('vung', 156, 1),
+    ('san', 156, 1),
+    ('xuat', 156, 1),
+    ('nghiep', 156, 1),
+    ('cum', 156, 1),
+    ('dan', 156, 1),
+    ('cu', 156, 1),
+    ('ho', 156, 1),
+    ('giam', 156, 1),
+    ('sat', 156, 1),
+    ('viec', 156, 1),
+    ('xay', 156, 1),
+    ('dung', 156, 1),
+    ('dat', 156, 2),
+    ('tuoi', 156, 1),
+    ('tieu', 156, 1),
+    ('hanh', 156, 1),
+    ('sao', 156, 1),
+    ('ket', 156, 1),
+    ('qua', 156, 1),
+    ('toi', 156, 1),
+    ('uu', 156, 1),
+    ('trong', 156, 2),
+    ('trot', 156, 1),
+    ('hoac', 156, 1),
+    ('nuoi', 156, 1),
+    ('chuyen', 157, 8),
+    ('vien', 157, 10),
+    ('ho', 157, 9),
+    ('tro', 157, 8),
+    ('cong', 157, 19),
+    ('nghe', 157, 18),
+    ('thong', 157, 14),
+    ('tin', 157, 10),
+    ('the', 157, 4),
+    ('chat', 157, 4),
+    ('co', 157, 4),
+    ('khi', 157, 4),
+    ('thiet', 157, 7),
+    ('bi', 157, 7),
+    ('hang', 157, 2),
+    ('hai', 157, 2),
+    ('truyen', 157, 2),
+    ('dan', 157, 2),
+    ('quang', 157, 2),
+    ('va', 157, 7),
+    ('vo', 157, 2),
+    ('tuyen', 157, 2),
+    ('nguon', 157, 2),
+    ('dien', 157, 6),
+    ('ra', 157, 2),
+    ('da', 157, 2),
+    ('lap', 157, 3),
+    ('dat', 157, 3),
+    ('tram', 157, 2),
+    ('mang', 157, 2),
+    ('ngoai', 157, 2),
+    ('vi', 157, 2),
+    ('dau', 157, 2),
+    ('cuoi', 157, 2),
+    ('can', 157, 1),
+    ('bo', 157, 1),
+    ('ki', 157, 2),
+    ('thuat', 157, 2),
+    ('trong', 157, 1),
+    ('nganh', 157, 1),
+    ('cntt', 157, 2),
+    ('amp', 157, 4),
+    ('tt', 157, 2),
+    ('lam', 157, 1),
+    ('tac', 157, 1),
+    ('ve', 157, 1),
+    ('he', 157, 2),
+    ('cua', 157, 2),
+    ('cac', 157, 1),
+    ('bao', 157, 1),
+    ('tri', 157, 1),
+    ('van', 157, 1),
+    ('hanh', 157, 1),
+    ('sua', 157, 1),
+    ('chua', 157, 1),
+    ('may', 157, 1),
+    ('tinh', 157, 1),
+    ('thoai', 157, 1),
+    ('ki', 158, 11),
+    ('thuat', 158, 11),
+    ('dien', 158, 56),
+    ('trong', 158, 11),
+    ('phat', 158, 12),
+    ('va', 158, 25),
+    ('truyen', 158, 10),
+    ('tai', 158, 18),
+    ('the', 158, 4),
+    ('chat', 158, 4),
+    ('co', 158, 12),
+    ('khi', 158, 6),
+    ('van', 158, 13),
+    ('hanh', 158, 13),
+    ('nha', 158, 8),
+    ('may', 158, 11),
+    ('thuy', 158, 4),
+    ('nhiet', 158, 2),
+    ('sua', 158, 9),
+    ('chua', 158, 9),
+    ('tram', 158, 11),
+    ('do', 158, 2),
+    ('dan', 158, 2),
+    ('dung', 158, 2),
+    ('duong', 158, 12),
+    ('day', 158, 11),
+    ('dong', 158, 2),
+    ('lap', 158, 4),
+    ('dat', 158, 4),
+    ('bien', 158, 8),
+    ('ap', 158, 16),
+    ('tu', 158, 8),
+    ('220', 158, 4),
+    ('kv', 158, 8),
+    ('tro', 158, 8),
+    ('len', 158, 4),
+    ('110', 158, 4),
+    ('xuong', 158, 4),
+    ('quan', 158, 4),
+    ('li', 158, 4),
+    ('diesel', 158, 2),
+    ('hoa', 158, 2),
+    ('nong', 158, 2),
+    ('thon', 158, 2),
+    ('can', 158, 1),
+    ('bo', 158, 1),
+    ('lam', 158, 1),
+    ('cong', 158, 2),
+    ('viec', 158, 1),
+    ('bang', 158, 1),
+    ('dieu', 158, 1),
+    ('khien', 158, 1),
+    ('moc', 158, 1),
+    ('thiet', 158, 1),
+    ('bi', 158, 1),
+    ('cua', 158, 2),
+    ('cac', 158, 1),
+    ('ty', 158, 1),
+    ('hoac', 158, 1),
+    ('bao', 158, 1),
+    ('phan', 158, 1),
+    ('ki', 159, 17),
+    ('thuat', 159, 17),
+    ('tua', 159, 18),
+    ('bin', 159, 18),
+    ('the', 159, 4),
+    ('chat', 159, 5),
+    ('co', 159, 5),
+    ('khi', 159, 8),
+    ('noi', 159, 4),
+    ('hoi', 159, 4),
+    ('gio', 159, 3),
+    ('nuoc', 159, 2),
+    ('lap', 159, 3),
+    ('dat', 159, 3),
+    ('va', 159, 5),
+    ('kiem', 159, 2),
+    ('tra', 159, 2),
+    ('la', 159, 1),
+    ('cac', 159, 3),
+    ('thiet', 159, 2),
+    ('bi', 159, 2),
+    ('san', 159, 1),
+    ('xuat', 159, 1),
+    ('nang', 159, 1),
+    ('luong', 159, 1),
+    ('bang', 159, 1),
+    ('cach', 159, 1),
+    ('xoay', 159, 1),
+    ('nho', 159, 1),
+    ('tac', 159, 1),
+    ('dong', 159, 1),
+    ('hoac', 159, 1),
+    ('long', 159, 1),
+    ('can', 159, 1),
+    ('bo', 159, 1),
+    ('lam', 159, 1),
+    ('cong', 159, 1),
+    ('viec', 159, 1),
+    ('bao', 159, 1),
+    ('tri', 159, 1),
+    ('sua', 159, 1),
+    ('chua', 159, 1),
+    ('nay', 159, 1),
+    ('ki', 160, 10),
+    ('thuat', 160, 10),
+    ('vien', 160, 9),
+    ('phan', 160, 11),
+    ('cung', 160, 11),
+    ('may', 160, 18),
+    ('tinh', 160, 18),
+    ('the', 160, 6),
+    ('chat', 160, 4),
+    ('co', 160, 5),
+    ('khi', 160, 4),
+    ('che', 160, 2),
+    ('tao', 160, 2),
+    ('va', 160, 14),
+    ('lap', 160, 5),
+    ('rap', 160, 4),
+    ('ket', 160, 2),
+    ('noi', 160, 2),
+    ('mang', 160, 5),
+    ('cac', 160, 9),
+    ('cuc', 160, 2),
+    ('bo', 160, 4),
+    ('sua', 160, 4),
+    ('chua', 160, 4),
+    ('bao', 160, 4),
+    ('tri', 160, 3),
+    ('chuyen', 160, 2),
+    ('ve', 160, 3),
+    ('cu', 160, 2),
+    ('cua', 160, 2),
+    ('vi', 160, 5),
+    ('du', 160, 3),
+    ('thiet', 160, 6),
+    ('bi', 160, 4),
+    ('luu', 160, 2),
+    ('tru', 160, 2),
+    ('xu', 160, 2),
+    ('li', 160, 2),
+    ('ke', 160, 2),
+    ('mach', 160, 2),
+    ('dien', 160, 8),
+    ('tu', 160, 5),
+    ('tren', 160, 2),
+    ('cong', 160, 1),
+    ('nghe', 160, 1),
+    ('thong', 160, 5),
+    ('tin', 160, 1),
+    ('truyen', 160, 2),
+    ('cntt', 160, 1),
+    ('amp', 160, 2),
+    ('tt', 160, 1),
+    ('la', 160, 1),
+    ('linh', 160, 2),
+    ('vuc', 160, 2),
+    ('lien', 160, 1),
+    ('quan', 160, 1),
+    ('den', 160, 1),
+    ('tat', 160, 1),
+    ('ca', 160, 1),
+    ('hinh', 160, 1),
+    ('thuc', 160, 1),
+    ('gom', 160, 1),
+    ('thoai', 160, 3),
+    ('di', 160, 1),
+    ('dong', 160, 1),
+    ('trong', 160, 1),
+    ('nay', 160, 2),
+    ('cap', 160, 1),
+    ('ho', 160, 4),
+    ('tro', 160, 2),
+    ('cho', 160, 1),
+    ('nguoi', 160, 1),
+    ('su', 160, 1),
+    ('dung', 160, 1),
+    ('mot', 160, 1),
+    ('cach', 160, 1),
+    ('truc', 160, 2),
+    ('tiep', 160, 1),
+    ('hoac', 160, 2),
+    ('qua', 160, 1),
+    ('thu', 160, 1),
+    ('khac', 160, 1),
+    ('chan', 160, 1),
+    ('doan', 160, 1),
+    ('giai', 160, 1),
+    ('quyet', 160, 1),
+    ('trac', 160, 1),
+    ('ngoai', 160, 1),
+    ('so', 160, 1),
+    ('lieu', 160, 1),
+    ('internet', 160, 1),
+    ('huong', 160, 1),
+    ('dan', 160, 1),
+    ('trien', 160, 1),
+    ('khai', 160, 1),
+    ('dat', 160, 1),
+    ('he', 160, 1),
+    ('ki', 161, 9),
+    ('thuat', 161, 9),
+    ('vien', 161, 9),
+    ('dien', 161, 12),
+    ('dai', 161, 9),
+    ('hang', 161, 8),
+    ('hai', 161, 8),
+    ('the', 161, 4),
+    ('chat', 161, 4),
+    ('co', 161, 4),
+    ('khi', 161, 4),
+    ('cac', 161, 4),
+    ('chuyen', 161, 2),
+    ('nganh', 161, 2),
+    ('lien', 161, 4),
+    ('quan', 161, 2),
+    ('den', 161, 2),
+    ('loai', 161, 2),
+    ('thiet', 161, 3),
+    ('bi', 161, 3),
+    ('thong', 161, 3),
+    ('tin', 161, 2),
+    ('lac', 161, 2),
+    ('vi', 161, 2),
+    ('du', 161, 2),
+    ('ra', 161, 2),
+    ('da', 161, 2),
+    ('radio', 161, 2),
+    ('tren', 161, 2),
+    ('tau', 161, 2),
+    ('thuy', 161, 1),
+    ('dieu', 161, 1),
+    ('hanh', 161, 1),
+    ('hoat', 161, 1),
+    ('dong', 161, 1),
+    ('cua', 161, 1),
+    ('vo', 161, 3),
+    ('tuyen', 161, 3),
+    ('de', 161, 1),
+    ('nhan', 161, 1),
+    ('va', 161, 1),
+    ('truyen', 161, 1),
+    ('tai', 161, 1),
+    ('van', 161, 1),
+    ('ma', 161, 1),
+    ('hoa', 161, 1),
+    ('tu', 161, 1),
+    ('thoai', 161, 1),
+    ('hoac', 161, 1),
+    ('he', 161, 1),
+    ('bao', 161, 1),
+    ('ki', 162, 12),
+    ('thuat', 162, 12),
+    ('vien', 162, 10),
+    ('co', 162, 17),
+    ('khi', 162, 16),
+    ('trong', 162, 9),
+    ('san', 162, 12),
+    ('xuat', 162, 12),
+    ('lap', 162, 18),
+    ('rap', 162, 10),
+    ('va', 162, 19),
+    ('sua', 162, 24),
+    ('chua', 162, 24),
+    ('the', 162, 4),
+    ('chat', 162, 4),
+    ('dat', 162, 6),
+    ('thiet', 162, 10),
+    ('bi', 162, 10),
+    ('xu', 162, 2),
+    ('li', 162, 2),
+    ('duong', 162, 2),
+    ('ong', 162, 2),
+    ('che', 162, 2),
+    ('tao', 162, 3),
+    ('dung', 162, 4),
+    ('ket', 162, 2),
+    ('cau', 162, 3),
+    ('thep', 162, 2),
+    ('bao', 162, 6),
+    ('tri', 162, 5),
+    ('dau', 162, 2),
+    ('may', 162, 11),
+    ('xe', 162, 2),
+    ('lua', 162, 2),
+    ('det', 162, 2),
+    ('thang', 162, 2),
+    ('moc', 162, 3),
+    ('xay', 162, 2),
+    ('he', 162, 2),
+    ('thong', 162, 2),
+    ('lanh', 162, 2),
+    ('la', 162, 1),
+    ('nhung', 162, 1),
+    ('duoc', 162, 1),
+    ('dao', 162, 1),
+    ('ve', 162, 1),
+    ('cac', 162, 2),
+    ('bo', 162, 1),
+    ('phan', 162, 1),
+    ('thanh', 162, 1),
+    ('cua', 162, 1),
+    ('tat', 162, 1),
+    ('ca', 162, 2),
+    ('loai', 162, 1),
+    ('gom', 162, 1),
+    ('dong', 162, 1),
+    ('tua', 162, 1),
+    ('bin', 162, 1),
+    ('ki', 163, 10),
+    ('thuat', 163, 10),
+    ('vien', 163, 9),
+    ('giao', 163, 11),
+    ('thong', 163, 14),
+    ('van', 163, 12),
+    ('tai', 163, 12),
+    ('the', 163, 4),
+    ('chat', 163, 4),
+    ('co', 163, 4),
+    ('khi', 163, 4),
+    ('tin', 163, 2),
+    ('hieu', 163, 2),
+    ('duong', 163, 7),
+    ('sat', 163, 4),
+    ('kiem', 163, 6),
+    ('soat', 163, 6),
+    ('viec', 163, 3),
+    ('chay', 163, 2),
+    ('tau', 163, 7),
+    ('quan', 163, 2),
+    ('li', 163, 2),
+    ('lai', 163, 2),
+    ('xe', 163, 9),
+    ('chuyen', 163, 5),
+    ('dung', 163, 2),
+    ('thuy', 163, 5),
+    ('noi', 163, 2),
+    ('dia', 163, 2),
+    ('bang', 163, 2),
+    ('dien', 163, 5),
+    ('dau', 163, 2),
+    ('may', 163, 2),
+    ('lua', 163, 5),
+    ('va', 163, 5),
+    ('toa', 163, 2),
+    ('lap', 163, 2),
+    ('dat', 163, 2),
+    ('sua', 163, 2),
+    ('chua', 163, 2),
+    ('he', 163, 2),
+    ('la', 163, 1),
+    ('nhung', 163, 1),
+    ('nguoi', 163, 1),
+    ('lam', 163, 1),
+    ('mon', 163, 1),
+    ('trong', 163, 1),
+    ('dam', 163, 1),
+    ('bao', 163, 1),
+    ('hoat', 163, 1),
+    ('dong', 163, 1),
+    ('suot', 163, 1),
+    ('cua', 163, 1),
+    ('tat', 163, 1),
+    ('ca', 163, 1),
+    ('cac', 163, 2),
+    ('loai', 163, 2),
+    ('phuong', 163, 2),
+    ('tien', 163, 2),
+    ('cong', 163, 2),
+    ('nhu', 163, 3),
+    ('taxi', 163, 1),
+    ('buyt', 163, 1),
+    ('cung', 163, 1),
+    ('thuyen', 163, 1),
+    ('pha', 163, 1),
+    ('xuong', 163, 1),
+    ('ki', 164, 10),
+    ('thuat', 164, 10),
+    ('vien', 164, 9),
+    ('khai', 164, 16),
+    ('thac', 164, 16),
+    ('mo', 164, 15),
+    ('the', 164, 4),
+    ('chat', 164, 7),
+    ('co', 164, 5),
+    ('khi', 164, 10),
+    ('van', 164, 9),
+    ('hanh', 164, 6),
+    ('thiet', 164, 4),
+    ('bi', 164, 4),
+    ('sang', 164, 2),
+    ('quang', 164, 3),
+    ('kim', 164, 3),
+    ('loai', 164, 3),
+    ('khoan', 164, 8),
+    ('no', 164, 2),
+    ('min', 164, 2),
+    ('duong', 164, 2),
+    ('ham', 164, 4),
+    ('va', 164, 6),
+    ('may', 164, 6),
+    ('nen', 164, 2),
+    ('bom', 164, 2),
+    ('quat', 164, 2),
+    ('gio', 164, 2),
+    ('nha', 164, 2),
+    ('hoa', 164, 2),
+    ('than', 164, 3),
+    ('khao', 164, 2),
+    ('sat', 164, 3),
+    ('thuy', 164, 2),
+    ('tham', 164, 3),
+    ('do', 164, 3),
+    ('dia', 164, 2),
+    ('sua', 164, 2),
+    ('chua', 164, 3),
+    ('bang', 164, 2),
+    ('dien', 164, 4),
+    ('trong', 164, 2),
+    ('lo', 164, 2),
+    ('lam', 164, 1),
+    ('cong', 164, 1),
+    ('viec', 164, 1),
+    ('ho', 164, 1),
+    ('tro', 164, 1),
+    ('de', 164, 1),
+    ('khoang', 164, 2),
+    ('san', 164, 1),
+    ('dau', 164, 2),
+    ('nhu', 164, 1),
+    ('vang', 164, 1),
+    ('tho', 164, 2),
+    ('thien', 164, 1),
+    ('nhien', 164, 1),
+    ('tren', 164, 1),
+    ('dat', 164, 1),
+    ('lien', 164, 1),
+    ('hoac', 164, 1),
+    ('duoi', 164, 1),
+    ('bien', 164, 1),
+    ('chuyen', 164, 1),
+    ('luu', 164, 1),
+    ('tru', 164, 1),
+    ('nguyen', 164, 1),
+    ('lieu', 164, 1),
+    ('dam', 164, 1),
+    ('bao', 164, 1),
+    ('an', 164, 1),
+    ('toan', 164, 1),
+    ('ve', 164, 1),
+    ('sinh', 164, 1),
+    ('lao', 164, 1),
+    ('dong', 164, 2),
+    ('giam', 164, 1),
+    ('thieu', 164, 1),
+    ('tac', 164, 1),
+    ('moi', 164, 1),
+    ('truong', 164, 1),
+    ('ki', 165, 10),
+    ('thuat', 165, 10),
+    ('vien', 165, 9),
+    ('luyen', 165, 10),
+    ('kim', 165, 16),
+    ('the', 165, 4),
+    ('chat', 165, 4),
+    ('co', 165, 4),
+    ('khi', 165, 4),
+    ('quan', 165, 5),
+    ('li', 165, 4),
+    ('kinh', 165, 2),
+    ('doanh', 165, 2),
+    ('bat', 165, 2),
+    ('dong', 165, 2),
+    ('san', 165, 2),
+    ('nha', 165, 2),
+    ('va', 165, 5),
+    ('dat', 165, 2),
+    ('lam', 165, 1),
+    ('cong', 165, 3),
+    ('viec', 165, 2),
+    ('ho', 165, 1),
+    ('tro', 165, 1),
+    ('trong', 165, 2),
+    ('nghien', 165, 1),
+    ('cuu', 165, 1),
+    ('phat', 165, 1),
+    ('trien', 165, 1),
+    ('cac', 165, 3),
+    ('phuong', 165, 1),
+    ('phap', 165, 1),
+    ('tien', 165, 1),
+    ('bo', 165, 1),
+    ('de', 165, 1),
+    ('chiet', 165, 2),
+    ('xuat', 165, 2),
+    ('loai', 165, 7),
+    ('tu', 165, 1),
+    ('quang', 165, 1),
+    ('do', 165, 1),
+    ('la', 165, 1),
+    ('nhung', 165, 1),
+    ('lien', 165, 1),
+    ('den', 165, 1),
+    ('tinh', 165, 1),
+    ('che', 165, 2),
+    ('thanh', 165, 2),
+    ('khac', 165, 2),
+    ('nhau', 165, 2),
+    ('pha', 165, 1),
+    ('tron', 165, 1),
+    ('hop', 165, 1),
+    ('bien', 165, 1),
+    ('theo', 165, 1),
+    ('muc', 165, 1),
+    ('dich', 165, 1),
+    ('su', 165, 1),
+    ('dung', 165, 1),
+    ('nganh', 165, 1),
+    ('nghiep', 165, 1),
+    ('van', 166, 11),
+    ('hanh', 166, 11),
+    ('may', 166, 16),
+    ('moc', 166, 16),
+    ('the', 166, 6),
+    ('chat', 166, 6),
+    ('co', 166, 14),
+    ('khi', 166, 7),
+    ('thiet', 166, 13),
+    ('bi', 166, 13),
+    ('kiem', 166, 3),
+    ('soat', 166, 2),
+    ('qui', 166, 2),
+    ('trinh', 166, 4),
+    ('ap', 166, 2),
+    ('dung', 166, 8),
+    ('dieu', 166, 3),
+    ('khien', 166, 3),
+    ('tu', 166, 3),
+    ('dong', 166, 7),
+    ('trong', 166, 4),
+    ('su', 166, 4),
+    ('nang', 166, 2),
+    ('luong', 166, 2),
+    ('xu', 166, 2),
+    ('li', 166, 2),
+    ('rac', 166, 2),
+    ('va', 166, 10),
+    ('nuoc', 166, 4),
+    ('tinh', 166, 4),
+    ('che', 166, 2),
+    ('dau', 166, 2),
+    ('san', 166, 6),
+    ('xuat', 166, 4),
+    ('hoa', 166, 4),
+    ('kim', 166, 2),
+    ('loai', 166, 5),
+    ('dinh', 166, 2),
+    ('khai', 166, 2),
+    ('thac', 166, 2),
+    ('khoang', 166, 2),
+    ('hoc', 166, 2),
+    ('phim', 166, 2),
+    ('anh', 166, 2),
+    ('giay', 166, 2),
+    ('nhua', 166, 2),
+    ('cao', 166, 2),
+    ('det', 166, 2),
+    ('da', 166, 2),
+    ('thuc', 166, 2),
+    ('pham', 166, 2),
+    ('go', 166, 2),
+    ('thuy', 166, 2),
+    ('gom', 166, 2),
+    ('goi', 166, 2),
+    ('hoi', 166, 4),
+    ('noi', 166, 2),
+    ('cong', 166, 2),
+    ('nen', 166, 2),
+    ('mong', 166, 2),
+    ('xay', 166, 4),
+    ('duong', 166, 4),
+    ('sat', 166, 3),
+    ('ki', 166, 2),
+    ('thuat', 166, 2),
+    ('vien', 166, 1),
+    ('giam', 166, 1),
+    ('tra', 166, 1),
+    ('tai', 166, 1),
+    ('cho', 166, 1),
+    ('hoac', 166, 1),
+    ('bang', 166, 1),
+    ('xa', 166, 1),
+    ('hoat', 166, 1),
+    ('cua', 166, 3),
+    ('cac', 166, 1),
+    ('rat', 166, 1),
+    ('nhieu', 166, 1),
+    ('khac', 166, 1),
+    ('nhau', 166, 1),
+    ('nhiem', 166, 2),
+    ('vu', 166, 2),
+    ('cu', 166, 2),
+    ('nguoi', 166, 2),
+    ('phu', 166, 1),
+    ('thuoc', 166, 1),
+    ('vao', 166, 1),
+    ('vi', 166, 1),
+    ('tri', 166, 1),
+    ('do', 166, 1),
+    ('ve', 166, 1),
+    ('ban', 166, 1),
+    ('ho', 166, 1),
+    ('mot', 166, 1),
+    ('so', 166, 1),
+    ('chung', 166, 1),
+    ('nhu', 166, 1),
+    ('sau', 166, 1),
+    ('ki', 167, 9),
+    ('thuat', 167, 9),
+    ('vien', 167, 9),
+    ('van', 167, 27),
+    ('hanh', 167, 27),
+    ('thiet', 167, 21),
+    ('bi', 167, 21),
+    ('loc', 167, 12),
+    ('dau', 167, 24),
+    ('va', 167, 15),
+    ('khi', 167, 23),
+    ('thien', 167, 13),
+    ('nhien', 167, 15),
+    ('the', 167, 4),
+    ('chat', 167, 4),
+    ('co', 167, 4),
+    ('san', 167, 7),
+    ('xuat', 167, 4),
+    ('dot', 167, 4),
+    ('tram', 167, 4),
+    ('tu', 167, 4),
+    ('hoa', 167, 4),
+    ('long', 167, 2),
+    ('khai', 167, 4),
+    ('thac', 167, 4),
+    ('mo', 167, 8),
+    ('sua', 167, 2),
+    ('chua', 167, 2),
+    ('xu', 167, 3),
+    ('li', 167, 3),
+    ('phan', 167, 4),
+    ('phoi', 167, 2),
+    ('pham', 167, 3),
+    ('he', 167, 3),
+    ('thong', 167, 3),
+    ('duong', 167, 5),
+    ('ong', 167, 4),
+    ('nha', 167, 5),
+    ('may', 167, 6),
+    ('dan', 167, 2),
+    ('de', 167, 2),
+    ('dam', 167, 2),
+    ('con', 167, 1),
+    ('goi', 167, 1),
+    ('la', 167, 1),
+    ('nguoi', 167, 1),
+    ('tinh', 167, 2),
+    ('che', 167, 3),
+    ('lam', 167, 1),
+    ('cong', 167, 1),
+    ('tac', 167, 1),
+    ('giam', 167, 1),
+    ('sat', 167, 1),
+    ('hoat', 167, 1),
+    ('dong', 167, 1),
+    ('cua', 167, 1),
+    ('cac', 167, 3),
+    ('moc', 167, 1),
+    ('dieu', 167, 1),
+    ('chinh', 167, 1),
+    ('duy', 167, 1),
+    ('bao', 167, 1),
+    ('bien', 167, 1),
+    ('chung', 167, 1),
+    ('cat', 167, 1),
+    ('tho', 167, 1),
+    ('hoac', 167, 1),
+    ('ki', 168, 12),
+    ('thuat', 168, 11),
+    ('vien', 168, 9),
+    ('moi', 168, 17),
+    ('truong', 168, 17),
+    ('the', 168, 4),
+    ('chat', 168, 6),
+    ('co', 168, 4),
+    ('khi', 168, 4),
+    ('bvmt', 168, 7),
+    ('do', 168, 2),
+    ('thi', 168, 3),
+    ('cong', 168, 4),
+    ('nghiep', 168, 2),
+    ('bien', 168, 2),
+    ('vi', 168, 2),
+    ('sinh', 168, 4),
+    ('hoa', 168, 2),
+    ('quan', 168, 2),
+    ('li', 168, 6),
+    ('tai', 168, 2),
+    ('nguyen', 168, 2),
+    ('va', 168, 7),
+    ('nghe', 168, 2),
+    ('xu', 168, 4),
+    ('nuoc', 168, 2),
+    ('thai', 168, 4),
+    ('ran', 168, 2),
+    ('bao', 168, 3),
+    ('ho', 168, 3),
+    ('lao', 168, 2),
+    ('dong', 168, 2),
+    ('ve', 168, 1),
+    ('tien', 168, 1),
+    ('hanh', 168, 1),
+    ('cac', 168, 2),
+    ('xet', 168, 1),
+    ('nghiem', 168, 2),
+    ('trong', 168, 1),
+    ('phong', 168, 1),
+    ('tren', 168, 1),
+    ('thuc', 168, 1),
+    ('dia', 168, 1),
+    ('de', 168, 3),
+    ('giam', 168, 1),
+    ('sat', 168, 1),
+    ('phat', 168, 1),
+    ('hien', 168, 1),
+    ('nguon', 168, 1),
+    ('goc', 168, 1),
+    ('van', 168, 2),
+    ('ke', 168, 1),
+    ('ca', 168, 1),
+    ('nhung', 168, 1),
+    ('gay', 168, 1),
+    ('anh', 168, 1),
+    ('huong', 168, 1),
+    ('toi', 168, 1),
+    ('suc', 168, 1),
+    ('khoe', 168, 1),
+    ('lam', 168, 1),
+    ('viec', 168, 1),
+    ('duoi', 168, 1),
+    ('su', 168, 2),
+    ('chi', 168, 1),
+    ('dao', 168, 1),
+    ('cua', 168, 1),
+    ('nha', 168, 1),
+    ('khoa', 168, 1),
+    ('hoc', 168, 1),
+    ('ki', 169, 9),
+    ('thuat', 169, 9),
+    ('vien', 169, 9),
+    ('lam', 169, 18),
+    ('nghiep', 169, 16),
+    ('the', 169, 4),
+    ('chat', 169, 4),
+    ('co', 169, 4),
+    ('khi', 169, 5),
+    ('quan', 169, 8),
+    ('li', 169, 8),
+    ('phat', 169, 2),
+    ('trien', 169, 2),
+    ('moi', 169, 2),
+    ('truong', 169, 2),
+    ('kinh', 169, 2),
+    ('te', 169, 2),
+    ('tai', 169, 3),
+    ('nguyen', 169, 2),
+    ('rung', 169, 3),
+    ('sinh', 169, 2),
+    ('thuc', 169, 1),
+    ('hien', 169, 1),
+    ('cac', 169, 3),
+    ('hoat', 169, 1),
+    ('dong', 169, 1),
+    ('nuoi', 169, 1),
+    ('duong', 169, 1),
+    ('bao', 169, 1),
+    ('ton', 169, 1),
+    ('va', 169, 1),
+    ('khai', 169, 1),
+    ('thac', 169, 1),
+    ('can', 169, 1),
+    ('thiet', 169, 1),
+    ('de', 169, 1),
+    ('ban', 169, 2),
+    ('hoac', 169, 2),
+    ('phan', 169, 1),
+    ('phoi', 169, 1),
+    ('san', 169, 1),
+    ('pham', 169, 1),
+    ('mot', 169, 1),
+    ('cach', 169, 1),
+    ('thuong', 169, 2),
+    ('xuyen', 169, 1),
+    ('cho', 169, 2),
+    ('nguoi', 169, 1),
+    ('mua', 169, 1),
+    ('buon', 169, 2),
+    ('to', 169, 1),
+    ('chuc', 169, 1),
+    ('mai', 169, 1),
+    ('thuyen', 170, 8),
+    ('vien', 170, 9),
+    ('dieu', 170, 11),
+    ('khien', 170, 11),
+    ('phuong', 170, 8),
+    ('tien', 170, 8),
+    ('hang', 170, 9),
+    ('hai', 170, 8),
+    ('the', 170, 4),
+    ('chat', 170, 4),
+    ('co', 170, 4),
+    ('khi', 170, 4),
+    ('tau', 170, 7),
+    ('thuy', 170, 3),
+    ('on', 170, 2),
+    ('dinh', 170, 2),
+    ('hoa', 170, 1),
+    ('tieu', 170, 1),
+    ('va', 170, 3),
+    ('nhan', 170, 1),
+    ('van', 170, 1),
+    ('phong', 170, 1),
+    ('tren', 170, 2),
+    ('chi', 170, 1),
+    ('huy', 170, 1),
+    ('cac', 170, 2),
+    ('cho', 170, 1),
+    ('tuong', 170, 1),
+    ('tu', 170, 1),
+    ('thuc', 170, 1),
+    ('hien', 170, 1),
+    ('chuc', 170, 1),
+    ('nang', 170, 1),
+    ('lien', 170, 1),
+    ('quan', 170, 1),
+    ('bien', 170, 1),
+    ('phi', 171, 17),
+    ('cong', 171, 17),
+    ('the', 171, 4),
+    ('chat', 171, 4),
+    ('co', 171, 5),
+    ('khi', 171, 6),
+    ('cho', 171, 2),
+    ('khach', 171, 3),
+    ('van', 171, 3),
+    ('tai', 171, 2),
+    ('truc', 171, 2),
+    ('thang', 171, 2),
+    ('quan', 171, 3),
+    ('su', 171, 2),
+    ('phuong', 171, 2),
+    ('tien', 171, 2),
+    ('bay', 171, 3),
+    ('va', 171, 4),
+    ('ki', 171, 1),
+    ('thuat', 171, 1),
+    ('vien', 171, 1),
+    ('ho', 171, 1),
+    ('tro', 171, 1),
+    ('lien', 171, 1),
+    ('kiem', 171, 1),
+    ('soat', 171, 1),
+    ('hoat', 171, 1),
+    ('dong', 171, 1),
+    ('cua', 171, 1),
+    ('cac', 171, 2),
+    ('thiet', 171, 1),
+    ('bi', 171, 1),
+    ('dien', 171, 2),
+    ('tu', 171, 1),
+    ('de', 171, 1),
+    ('dieu', 171, 1),
+    ('khien', 171, 1),
+    ('chuyen', 171, 1),
+    ('hanh', 171, 1),
+    ('thu', 171, 1),
+    ('tin', 171, 1),
+    ('hang', 171, 1),
+    ('hoa', 171, 1),
+    ('thuc', 171, 1),
+    ('hien', 171, 1),
+    ('nhiem', 171, 1),
+    ('vu', 171, 1),
+    ('truoc', 171, 1),
+    ('trong', 171, 1),
+    ('kiem', 172, 10),
+    ('soat', 172, 10),
+    ('vien', 172, 10),
+    ('khong', 172, 19),
+    ('luu', 172, 11),
+    ('the', 172, 4),
+    ('chat', 172, 4),
+    ('co', 172, 4),
+    ('khi', 172, 4),
+    ('quan', 172, 4),
+    ('chuyen', 172, 4),
+    ('dao', 172, 2),
+    ('tao', 172, 2),
+    ('phi', 172, 2),
+    ('cong', 172, 2),
+    ('va', 172, 4),
+    ('li', 172, 2),
+    ('trong', 172, 2),
+    ('thoi', 172, 2),
+    ('ki', 172, 2),
+    ('chien', 172, 2),
+    ('tranh', 172, 2),
+    ('hang', 172, 5),
+    ('noi', 172, 2),
+    ('dia', 172, 2),
+    ('nganh', 172, 2),
+    ('cho', 172, 3),
+    ('hanh', 172, 2),
+    ('khach', 172, 2),
+    ('con', 172, 1),
+    ('goi', 172, 1),
+    ('la', 172, 1),
+    ('giao', 172, 1),
+    ('thong', 172, 3),
+    ('duong', 172, 1),
+    ('huong', 172, 2),
+    ('dan', 172, 1),
+    ('bay', 172, 2),
+    ('tren', 172, 1),
+    ('trung', 172, 1),
+    ('duoi', 172, 1),
+    ('mat', 172, 1),
+    ('dat', 172, 1),
+    ('qua', 172, 1),
+    ('cac', 172, 1),
+    ('thiet', 172, 2),
+    ('bi', 172, 1),
+    ('nhu', 172, 1),
+    ('dai', 172, 1),
+    ('ra', 172, 1),
+    ('da', 172, 1),
+    ('hay', 172, 1),
+    ('he', 172, 1),
+    ('den', 172, 1),
+    ('cung', 172, 1),
+    ('cap', 172, 1),
+    ('tin', 172, 1),
+    ('can', 172, 1),
+    ('hoat', 172, 1),
+    ('dong', 172, 1),
+    ('cua', 172, 1),
+    ('phuong', 172, 1),
+    ('tien', 172, 1),
+    ('ki', 173, 9),
+    ('thuat', 173, 9),
+    ('vien', 173, 9),
+    ('y', 173, 19),
+    ('te', 173, 9),
+    ('va', 173, 9),
+    ('cong', 173, 12),
+    ('nghe', 173, 10),
+    ('hoc', 173, 10),
+    ('hat', 173, 11),
+    ('nhan', 173, 11),
+    ('the', 173, 8),
+    ('chat', 173, 4),
+    ('co', 173, 4),
+    ('khi', 173, 4),
+    ('chuyen', 173, 4),
+    ('sau', 173, 4),
+    ('ve', 173, 4),
+    ('cac', 173, 7),
+    ('loai', 173, 2),
+    ('thiet', 173, 4),
+    ('bi', 173, 4),
+    ('cu', 173, 4),
+    ('nhu', 173, 5),
+    ('may', 173, 9),
+    ('chup', 173, 6),
+    ('ct', 173, 2),
+    ('scan', 173, 4),
+    ('cat', 173, 3),
+    ('lop', 173, 3),
+    ('phat', 173, 2),
+    ('xa', 173, 3),
+    ('pet', 173, 2),
+    ('lap', 173, 2),
+    ('trinh', 173, 2),
+    ('tinh', 173, 2),
+    ('dieu', 173, 3),
+    ('khien', 173, 2),
+    ('nay', 173, 3),
+    ('hinh', 173, 2),
+    ('thuc', 173, 2),
+    ('xet', 173, 2),
+    ('nghiem', 173, 2),
+    ('do', 173, 4),
+    ('mat', 173, 2),
+    ('xuong', 173, 2),
+    ('hien', 173, 1),
+    ('nganh', 173, 1),
+    ('ung', 173, 1),
+    ('dung', 173, 2),
+    ('nhieu', 173, 1),
+    ('qua', 173, 1),
+    ('su', 173, 1),
+    ('vat', 173, 1),
+    ('lieu', 173, 1),
+    ('phong', 173, 1),
+    ('de', 173, 1),
+    ('ho', 173, 1),
+    ('tro', 173, 1),
+    ('chan', 173, 1),
+    ('doan', 173, 1),
+    ('tri', 173, 1),
+    ('benh', 173, 1),
+    ('lam', 173, 1),
+    ('viec', 173, 1),
+    ('van', 173, 1),
+    ('hanh', 173, 1),
+    ('moc', 173, 1),
+    ('lien', 173, 1),
+    ('quan', 173, 1),
+    ('den', 173, 1),
+    ('huong', 173, 1),
+    ('tu', 173, 1),
+    ('chay', 173, 1),
+    ('tia', 173, 1),
+    ('gamma', 173, 1),
+    ('ki', 174, 14),
+    ('thuat', 174, 14),
+    ('vien', 174, 11),
+    ('phong', 174, 13),
+    ('xet', 174, 10),
+    ('nghiem', 174, 14),
+    ('the', 174, 4),
+    ('chat', 174, 5),
+    ('co', 174, 5),
+    ('khi', 174, 4),
+    ('hoa', 174, 5),
+    ('sinh', 174, 5),
+    ('hoc', 174, 12),
+    ('lam', 174, 2),
+    ('sang', 174, 2),
+    ('te', 174, 8),
+    ('bao', 174, 4),
+    ('cong', 174, 2),
+    ('nghe', 174, 2),
+    ('huyet', 174, 2),
+    ('mo', 174, 3),
+    ('mien', 174, 2),
+    ('dich', 174, 5),
+    ('vi', 174, 4),
+    ('vat', 174, 2),
+    ('khoa', 174, 2),
+    ('truyen', 174, 2),
+    ('kiem', 174, 4),
+    ('tra', 174, 4),
+    ('y', 174, 7),
+    ('thiet', 174, 2),
+    ('bi', 174, 2),
+    ('thi', 174, 5),
+    ('phap', 174, 3),
+    ('trong', 174, 2),
+    ('cac', 174, 3),
+    ('benh', 174, 3),
+    ('so', 174, 1),
+    ('con', 174, 1),
+    ('goi', 174, 1),
+    ('la', 174, 1),
+    ('tien', 174, 1),
+    ('hanh', 174, 1),
+    ('bang', 174, 1),
+    ('kinh', 174, 1),
+    ('hien', 174, 1),
+    ('va', 174, 2),
+    ('soi', 174, 1),
+    ('khuan', 174, 1),
+    ('de', 174, 2),
+    ('mau', 174, 1),
+    ('cua', 174, 1),
+    ('nhan', 174, 2),
+    ('tu', 174, 2),
+    ('tim', 174, 1),
+    ('ra', 174, 1),
+    ('nguyen', 174, 1),
+    ('gay', 174, 1),
+    ('hoac', 174, 1),
+    ('vong', 174, 1),
+    ('ki', 175, 26),
+    ('thuat', 175, 39),
+    ('vien', 175, 19),
+    ('y', 175, 9),
+    ('te', 175, 8),
+    ('phau', 175, 13),
+    ('the', 175, 4),
+    ('chat', 175, 4),
+    ('co', 175, 4),
+    ('khi', 175, 9),
+    ('khoan', 175, 2),
+    ('danh', 175, 2),
+    ('gia', 175, 2),
+    ('mo', 175, 4),
+    ('dau', 175, 2),
+    ('san', 175, 2),
+    ('xuat', 175, 2),
+    ('tang', 175, 2),
+    ('chua', 175, 2),
+    ('thuy', 175, 2),
+    ('vat', 175, 2),
+    ('li', 175, 2),
+    ('da', 175, 2),
+    ('con', 175, 1),
+    ('la', 175, 2),
+    ('phong', 175, 2),
+    ('lam', 175, 1),
+    ('viec', 175, 1),
+    ('duoi', 175, 1),
+    ('su', 175, 1),
+    ('giam', 175, 1),
+    ('sat', 175, 1),
+    ('cua', 175, 2),
+    ('bac', 175, 2),
+    ('si', 175, 2),
+    ('ta', 175, 1),
+    ('gay', 175, 1),
+    ('me', 175, 1),
+    ('hoac', 175, 1),
+    ('nhan', 175, 3),
+    ('khac', 175, 1),
+    ('trach', 175, 1),
+    ('nhiem', 175, 1),
+    ('ho', 175, 1),
+    ('chuan', 175, 1),
+    ('bi', 175, 1),
+    ('va', 175, 2),
+    ('benh', 175, 2),
+    ('truoc', 175, 1),
+    ('ca', 175, 2),
+    ('thuc', 175, 1),
+    ('hien', 175, 1),
+    ('cham', 175, 1),
+    ('soc', 175, 1),
+    ('ngay', 175, 1),
+    ('sau', 175, 1),
+    ('hoan', 175, 1),
+    ('thanh', 175, 1),
+    ('ki', 176, 21),
+    ('thuat', 176, 21),
+    ('vien', 176, 19),
+    ('y', 176, 8),
+    ('te', 176, 8),
+    ('va', 176, 11),
+    ('phu', 176, 9),
+    ('ta', 176, 9),
+    ('nha', 176, 13),
+    ('khoa', 176, 13),
+    ('the', 176, 4),
+    ('chat', 176, 4),
+    ('co', 176, 4),
+    ('khi', 176, 4),
+    ('ve', 176, 4),
+    ('sinh', 176, 2),
+    ('rang', 176, 5),
+    ('mieng', 176, 3),
+    ('phuc', 176, 3),
+    ('hinh', 176, 2),
+    ('tro', 176, 1),
+    ('giup', 176, 1),
+    ('cho', 176, 1),
+    ('bac', 176, 2),
+    ('si', 176, 2),
+    ('trong', 176, 1),
+    ('tu', 176, 1),
+    ('van', 176, 1),
+    ('chan', 176, 1),
+    ('doan', 176, 1),
+    ('phong', 176, 1),
+    ('chua', 176, 1),
+    ('benh', 176, 1),
+    ('mat', 176, 1),
+    ('pham', 176, 1),
+    ('vi', 176, 1),
+    ('do', 176, 1),
+    ('tap', 176, 1),
+    ('thi', 176, 1),
+    ('han', 176, 1),
+    ('che', 176, 1),
+    ('hon', 176, 1),
+    ('so', 176, 1),
+    ('voi', 176, 1),
+    ('cac', 176, 1),
+    ('nhiem', 176, 1),
+    ('vu', 176, 1),
+    ('ma', 176, 1),
+    ('mot', 176, 1),
+    ('thuc', 176, 1),
+    ('hien', 176, 1),
+    ('van', 177, 9),
+    ('dong', 177, 9),
+    ('vien', 177, 9),
+    ('va', 177, 11),
+    ('nguoi', 177, 11),
+    ('choi', 177, 10),
+    ('the', 177, 23),
+    ('thao', 177, 15),
+    ('chuyen', 177, 10),
+    ('nghiep', 177, 10),
+    ('chat', 177, 4),
+    ('co', 177, 4),
+    ('khi', 177, 4),
+    ('mot', 177, 3),
+    ('mon', 177, 4),
+    ('cu', 177, 4),
+    ('nao', 177, 3),
+    ('do', 177, 3),
+    ('quan', 177, 2),
+    ('li', 177, 2),
+    ('huan', 177, 3),
+    ('luyen', 177, 3),
+    ('binh', 177, 2),
+    ('luan', 177, 2),
+    ('truyen', 177, 2),
+    ('thong', 177, 2),
+    ('tham', 177, 2),
+    ('gia', 177, 2),
+    ('vao', 177, 3),
+    ('voi', 177, 1),
+    ('tu', 177, 1),
+    ('cach', 177, 1),
+    ('la', 177, 1),
+    ('hoac', 177, 2),
+    ('ho', 177, 3),
+    ('cac', 177, 3),
+    ('cau', 177, 1),
+    ('lac', 177, 1),
+    ('bo', 177, 1),
+    ('to', 177, 1),
+    ('chuc', 177, 1),
+    ('cuoc', 177, 1),
+    ('thi', 177, 1),
+    ('dau', 177, 1),
+    ('ve', 177, 1),
+    ('de', 177, 1),
+    ('dat', 177, 1),
+    ('duoc', 177, 1),
+    ('thanh', 177, 1),
+    ('tich', 177, 1),
+    ('cao', 177, 1),
+    ('nhiem', 177, 1),
+    ('vu', 177, 1),
+    ('cua', 177, 1),
+    ('phu', 177, 1),
+    ('thuoc', 177, 1),
+    ('cong', 177, 1),
+    ('viec', 177, 1),
+    ('ma', 177, 1),
+    ('dam', 177, 1),
+    ('nhan', 177, 1),
+    ('giao', 178, 19),
+    ('vien', 178, 13),
+    ('duc', 178, 11),
+    ('the', 178, 23),
+    ('chat', 178, 14),
+    ('co', 178, 4),
+    ('khi', 178, 4),
+    ('cac', 178, 6),
+    ('chuyen', 178, 2),
+    ('nganh', 178, 2),
+    ('ve', 178, 2),
+    ('mot', 178, 2),
+    ('mon', 178, 3),
+    ('thao', 178, 7),
+    ('va', 178, 3),
+    ('dao', 178, 2),
+    ('tao', 178, 2),
+    ('huan', 178, 3),
+    ('luyen', 178, 3),
+    ('tam', 178, 2),
+    ('li', 178, 2),
+    ('hoc', 178, 4),
+    ('thuong', 178, 1),
+    ('goi', 178, 1),
+    ('la', 178, 1),
+    ('thuc', 178, 1),
+    ('hien', 178, 1),
+    ('viec', 178, 1),
+    ('giang', 178, 1),
+    ('day', 178, 1),
+    ('lop', 178, 1),
+    ('to', 178, 1),
+    ('chuc', 178, 1),
+    ('tro', 178, 2),
+    ('choi', 178, 2),
+    ('tham', 178, 1),
+    ('gia', 178, 1),
+    ('ki', 179, 20),
+    ('thuat', 179, 20),
+    ('vien', 179, 24),
+    ('thong', 179, 16),
+    ('the', 179, 4),
+    ('chat', 179, 4),
+    ('co', 179, 4),
+    ('khi', 179, 4),
+    ('thiet', 179, 3),
+    ('bi', 179, 2),
+    ('tin', 179, 2),
+    ('hoc', 179, 2),
+    ('va', 179, 3),
+    ('doanh', 179, 4),
+    ('nghiep', 179, 4),
+    ('dich', 179, 2),
+    ('vu', 179, 2),
+    ('buu', 179, 2),
+    ('chinh', 179, 2),
+    ('thuc', 179, 1),
+    ('hien', 179, 1),
+    ('cac', 179, 2),
+    ('cong', 179, 1),
+    ('viec', 179, 1),
+    ('ve', 179, 1),
+    ('lien', 179, 1),
+    ('quan', 179, 1),
+    ('toi', 179, 1),
+    ('nghien', 179, 1),
+    ('cuu', 179, 1),
+    ('ke', 179, 1),
+    ('san', 179, 1),
+    ('xuat', 179, 1),
+    ('lap', 179, 1),
+    ('rap', 179, 1),
+    ('xay', 179, 1),
+    ('dung', 179, 1),
+    ('van', 179, 1),
+    ('hanh', 179, 1),
+    ('duy', 179, 1),
+    ('tu', 179, 1),
+    ('sua', 179, 1),
+    ('chua', 179, 1),
+    ('he', 179, 1),
+    ('canh', 180, 9),
+    ('sat', 180, 9),
+    ('cuu', 180, 19),
+    ('hoa', 180, 19),
+    ('the', 180, 4),
+    ('chat', 180, 4),
+    ('co', 180, 5),
+    ('khi', 180, 4),
+    ('doi', 180, 2),
+    ('voi', 180, 2),
+    ('tai', 180, 4),
+    ('nan', 180, 3),
+    ('may', 180, 2),
+    ('bay', 180, 2),
+    ('chay', 180, 3),
+    ('rung', 180, 2),
+    ('ho', 180, 3),
+    ('thuc', 180, 1),
+    ('hien', 180, 1),
+    ('cong', 180, 1),
+    ('viec', 180, 1),
+    ('ngan', 180, 1),
+    ('chan', 180, 1),
+    ('phong', 180, 1),
+    ('chong', 180, 1),
+    ('han', 180, 1),
+    ('va', 180, 2),
+    ('dap', 180, 1),
+    ('tat', 180, 1),
+    ('dam', 180, 1),
+    ('cung', 180, 1),
+    ('nhiem', 180, 1),
+    ('vu', 180, 1),
+    ('giai', 180, 1),
+    ('nhung', 180, 1),
+    ('nguoi', 180, 1),
+    ('bi', 180, 1),
+    ('mac', 180, 1),
+    ('ket', 180, 1),
+    ('trong', 180, 3),
+    ('hoan', 180, 2),
+    ('hang', 180, 1),
+    ('san', 180, 1),
+    ('sau', 180, 1),
+    ('hoac', 180, 1),
+    ('nghiem', 180, 1),
+    ('trong', 181, 18),
+    ('trot', 181, 10),
+    ('the', 181, 4),
+    ('chat', 181, 4),
+    ('co', 181, 6),
+    ('khi', 181, 4),
+    ('cay', 181, 10),
+    ('luong', 181, 3),
+    ('thuc', 181, 7),
+    ('rau', 181, 3),
+    ('cong', 181, 3),
+    ('nghiep', 181, 4),
+    ('an', 181, 3),
+    ('qua', 181, 3),
+    ('bao', 181, 2),
+    ('ve', 181, 2),
+    ('vat', 181, 2),
+    ('khuyen', 181, 4),
+    ('nong', 181, 4),
+    ('lam', 181, 2),
+    ('san', 181, 4),
+    ('xuat', 181, 2),
+    ('giong', 181, 2),
+    ('thu', 181, 9),
+    ('hoach', 181, 6),
+    ('va', 181, 8),
+    ('che', 181, 3),
+    ('bien', 181, 2),
+    ('sau', 181, 2),
+    ('mua', 181, 2),
+    ('van', 181, 2),
+    ('chuyen', 181, 2),
+    ('tieu', 181, 2),
+    ('lao', 181, 1),
+    ('dong', 181, 2),
+    ('lap', 181, 1),
+    ('ke', 181, 1),
+    ('to', 181, 1),
+    ('chuc', 181, 1),
+    ('hien', 181, 1),
+    ('cac', 181, 2),
+    ('hoat', 181, 1),
+    ('loai', 181, 1),
+    ('pham', 181, 1),
+    ('nhu', 181, 3),
+    ('lua', 181, 1),
+    ('hat', 181, 1),
+    ('hoa', 181, 1),
+    ('mau', 181, 1),
+    ('mia', 181, 1),
+    ('duong', 181, 1),
+    ('thuoc', 181, 1),
+    ('la', 181, 1),
+    ('ca', 181, 1),
+    ('phe', 181, 1),
+    ('cao', 181, 1),
+    ('su', 181, 1),
+    ('buoi', 181, 1),
+    ('xoai', 181, 1),
+    ('cam', 181, 1),
+    ('chanh', 181, 1),
+    ('ho', 181, 1),
+    ('cung', 181, 1),
+    ('cap', 181, 1),
+    ('hoac', 181, 2),
+    ('ban', 181, 3),
+    ('thuong', 181, 2),
+    ('xuyen', 181, 1),
+    ('cho', 181, 1),
+    ('so', 181, 1),
+    ('buon', 181, 1),
+    ('doanh', 181, 2),
+    ('kinh', 181, 1),
+    ('mai', 181, 1),
+    ('truc', 181, 1),
+    ('tiep', 181, 1),
+    ('ra', 181, 1),
+    ('thi', 181, 1),
+    ('truong', 181, 1),
+    ('chan', 182, 11),
+    ('nuoi', 182, 12),
+    ('gia', 182, 24),
+    ('suc', 182, 12),
+    ('cam', 182, 12),
+    ('the', 182, 5),
+    ('chat', 182, 4),
+    ('co', 182, 5),
+    ('khi', 182, 4),
+    ('va', 182, 4),
+    ('quan', 182, 4),
+    ('li', 182, 4),
+    ('dinh', 182, 2),
+    ('duong', 182, 3),
+    ('dong', 182, 4),
+    ('vat', 182, 2),
+    ('lao', 182, 1),
+    ('thuc', 182, 1),
+    ('hien', 182, 1),
+    ('cac', 182, 3),
+    ('hoat', 182, 1),
+    ('cham', 182, 1),
+    ('soc', 182, 1),
+    ('nhu', 182, 2),
+    ('trau', 182, 1),
+    ('bo', 182, 1),
+    ('cuu', 182, 1),
+    ('lon', 182, 1),
+    ('de', 182, 2),
+    ('ngua', 182, 1),
+    ('cho', 182, 3),
+    ('meo', 182, 1),
+    ('ga', 182, 1),
+    ('vit', 182, 1),
+    ('ngan', 182, 1),
+    ('ngong', 182, 1),
+    ('chim', 182, 1),
+    ('muc', 182, 1),
+    ('dich', 182, 1),
+    ('lam', 182, 2),
+    ('viec', 182, 1),
+    ('choi', 182, 1),
+    ('thao', 182, 1),
+    ('hoac', 182, 3),
+    ('thu', 182, 1),
+    ('canh', 182, 1),
+    ('lay', 182, 1),
+    ('thit', 182, 1),
+    ('sua', 182, 1),
+    ('long', 182, 1),
+    ('da', 182, 1),
+    ('san', 182, 1),
+    ('pham', 182, 1),
+    ('khac', 182, 1),
+    ('cung', 182, 1),
+    ('cap', 182, 1),
+    ('ban', 182, 3),
+    ('thuong', 182, 2),
+    ('xuyen', 182, 1),
+    ('so', 182, 1),
+    ('buon', 182, 1),
+    ('doanh', 182, 2),
+    ('nghiep', 182, 1),
+    ('kinh', 182, 1),
+    ('mai', 182, 1),
+    ('truc', 182, 1),
+    ('tiep', 182, 1),
+    ('ra', 182, 1),
+    ('thi', 182, 1),
+    ('truong', 182, 1),
+    ('tho', 183, 11),
+    ('duong', 183, 11),
+    ('ong', 183, 12),
+    ('the', 183, 5),
+    ('chat', 183, 4),
+    ('co', 183, 4),
+    ('khi', 183, 8),
+    ('ket', 183, 2),
+    ('noi', 183, 2),
+    ('he', 183, 11),
+    ('thong', 183, 13),
+    ('suoi', 183, 2),
+    ('va', 183, 6),
+    ('gio', 183, 2),
+    ('lap', 183, 5),
+    ('dat', 183, 5),
+    ('thuy', 183, 2),
+    ('loi', 183, 2),
+    ('lop', 183, 2),
+    ('mai', 183, 2),
+    ('tuoi', 183, 2),
+    ('nuoc', 183, 5),
+    ('thay', 183, 1),
+    ('bao', 183, 1),
+    ('dan', 183, 1),
+    ('may', 183, 1),
+    ('moc', 183, 1),
+    ('cho', 183, 1),
+    ('cap', 183, 1),
+    ('dot', 183, 1),
+    ('thoat', 183, 1),
+    ('cong', 183, 1),
+    ('ranh', 183, 1),
+    ('thiet', 183, 1),
+    ('bi', 183, 1),
+    ('chay', 183, 1),
+    ('bang', 183, 1),
+    ('suc', 183, 1),
+    ('nen', 183, 1),
+    ('tho', 184, 9),
+    ('che', 184, 10),
+    ('tao', 184, 10),
+    ('khuon', 184, 13),
+    ('va', 184, 12),
+    ('cong', 184, 11),
+    ('cu', 184, 11),
+    ('the', 184, 4),
+    ('chat', 184, 6),
+    ('co', 184, 4),
+    ('khi', 184, 4),
+    ('lap', 184, 2),
+    ('trinh', 184, 2),
+    ('van', 184, 2),
+    ('hanh', 184, 2),
+    ('may', 184, 2),
+    ('cnc', 184, 2),
+    ('san', 184, 2),
+    ('xuat', 184, 2),
+    ('mau', 184, 2),
+    ('quan', 184, 2),
+    ('li', 184, 2),
+    ('luong', 184, 2),
+    ('thiet', 184, 2),
+    ('ke', 184, 2),
+    ('cac', 184, 1),
+    ('loai', 184, 1),
+    ('loi', 184, 1),
+    ('tho', 185, 20),
+    ('moc', 185, 19),
+    ('va', 185, 11),
+    ('lam', 185, 9),
+    ('do', 185, 10),
+    ('go', 185, 10),
+    ('the', 185, 4),
+    ('chat', 185, 4),
+    ('co', 185, 4),
+    ('khi', 185, 4),
+    ('hoan', 185, 2),
+    ('thien', 185, 2),
+    ('san', 185, 2),
+    ('pham', 185, 2),
+    ('mi', 185, 4),
+    ('nghe', 185, 4),
+    ('cac', 185, 2),
+    ('he', 185, 2),
+    ('thong', 185, 2),
+    ('ben', 185, 2),
+    ('trong', 185, 2),
+    ('dan', 185, 4),
+    ('dung', 185, 5),
+    ('ki', 185, 2),
+    ('thuat', 185, 2),
+    ('gia', 185, 1),
+    ('cat', 185, 1),
+    ('tao', 185, 2),
+    ('dang', 185, 1),
+    ('lap', 185, 1),
+    ('rap', 185, 1),
+    ('che', 185, 1),
+    ('bao', 185, 1),
+    ('duong', 185, 1),
+    ('sua', 185, 1),
+    ('chua', 185, 1),
+    ('nhieu', 185, 1),
+    ('loai', 185, 1),
+    ('cong', 185, 1),
+    ('trinh', 185, 1),
+    ('dac', 185, 1),
+    ('bang', 185, 1),
+    ('ki', 186, 11),
+    ('thuat', 186, 11),
+    ('vien', 186, 9),
+    ('thiet', 186, 12),
+    ('bi', 186, 12),
+    ('lanh', 186, 19),
+    ('va', 186, 16),
+    ('dieu', 186, 13),
+    ('hoa', 186, 13),
+    ('khong', 186, 12),
+    ('khi', 186, 16),
+    ('the', 186, 4),
+    ('chat', 186, 4),
+    ('co', 186, 4),
+    ('van', 186, 2),
+    ('hanh', 186, 2),
+    ('sua', 186, 3),
+    ('chua', 186, 3),
+    ('cac', 186, 4),
+    ('dong', 186, 2),
+    ('thuy', 186, 2),
+    ('san', 186, 2),
+    ('lap', 186, 1),
+    ('dat', 186, 1),
+    ('bao', 186, 1),
+    ('duong', 186, 1),
+    ('may', 186, 2),
+    ('he', 186, 2),
+    ('thong', 186, 2),
+    ('lien', 186, 1),
+    ('quan', 186, 1),
+    ('vi', 186, 1),
+    ('du', 186, 1),
+    ('nhu', 186, 1),
+    ('tu', 186, 1),
+    ('kho', 186, 1),
+    ('lam', 186, 1),
+    ('cong', 186, 1),
+    ('nghiep', 186, 1),
+    ('tho', 187, 18),
+    ('han', 187, 16),
+    ('va', 187, 11),
+    ('cat', 187, 13),
+    ('kim', 187, 13),
+    ('loai', 187, 13),
+    ('bang', 187, 10),
+    ('nhiet', 187, 10),
+    ('the', 187, 4),
+    ('chat', 187, 4),
+    ('co', 187, 4),
+    ('khi', 187, 5),
+    ('dien', 187, 3),
+    ('hoi', 187, 2),
+    ('cac', 187, 2),
+    ('bo', 187, 1),
+    ('phan', 187, 1),
+    ('cach', 187, 1),
+    ('su', 187, 1),
+    ('dung', 187, 1),
+    ('lua', 187, 1),
+    ('gas', 187, 1),
+    ('hoac', 187, 2),
+    ('ho', 187, 1),
+    ('quang', 187, 1),
+    ('nguon', 187, 1),
+    ('khac', 187, 1),
+    ('lam', 187, 1),
+    ('chay', 187, 1),
+    ('roi', 187, 1),
+    ('noi', 187, 1),
+    ('ki', 188, 10),
+    ('thuat', 188, 10),
+    ('vien', 188, 9),
+    ('co', 188, 16),
+    ('khi', 188, 13),
+    ('trong', 188, 10),
+    ('dong', 188, 16),
+    ('tau', 188, 25),
+    ('the', 188, 4),
+    ('chat', 188, 4),
+    ('che', 188, 7),
+    ('tao', 188, 7),
+    ('than', 188, 4),
+    ('va', 188, 3),
+    ('lap', 188, 7),
+    ('rap', 188, 6),
+    ('cac', 188, 5),
+    ('he', 188, 4),
+    ('thong', 188, 4),
+    ('duong', 188, 3),
+    ('ong', 188, 3),
+    ('thuy', 188, 8),
+    ('noi', 188, 2),
+    ('that', 188, 2),
+    ('luc', 188, 2),
+    ('sua', 188, 2),
+    ('chua', 188, 2),
+    ('la', 188, 2),
+    ('mot', 188, 3),
+    ('nhung', 188, 1),
+    ('nganh', 188, 2),
+    ('cong', 188, 3),
+    ('nghiep', 188, 1),
+    ('xua', 188, 1),
+    ('nhat', 188, 1),
+    ('bat', 188, 1),
+    ('nguon', 188, 1),
+    ('tu', 188, 1),
+    ('viec', 188, 2),
+    ('su', 188, 2),
+    ('dung', 188, 2),
+    ('go', 188, 1),
+    ('de', 188, 1),
+    ('thuyen', 188, 1),
+    ('ngay', 188, 1),
+    ('nay', 188, 1),
+    ('nghe', 188, 1),
+    ('cao', 188, 1),
+    ('hau', 188, 1),
+    ('nhu', 188, 3),
+    ('tat', 188, 1),
+    ('ca', 188, 1),
+    ('loai', 188, 2),
+    ('hinh', 188, 1),
+    ('chuyen', 188, 1),
+    ('mon', 188, 1),
+    ('lam', 188, 1),
+    ('phan', 188, 1),
+    ('cach', 188, 1),
+    ('nuoc', 188, 1),
+    ('cua', 188, 1),
+    ('con', 188, 1),
+    ('cung', 188, 1),
+    ('dat', 188, 1),
+    ('may', 188, 1),
+    ('moc', 188, 1),
+    ('ben', 188, 1),
+    ('phu', 188, 1),
+    ('kien', 188, 1),
+    ('khac', 188, 1),
+    ('nhau', 188, 1),
+    ('ki', 189, 10),
+    ('thuat', 189, 11),
+    ('vien', 189, 8),
+    ('co', 189, 13),
+    ('khi', 189, 12),
+    ('trong', 189, 8),
+    ('gia', 189, 18),
+    ('cong', 189, 19),
+    ('kim', 189, 14),
+    ('loai', 189, 14),
+    ('the', 189, 4),
+    ('chat', 189, 4),
+    ('han', 189, 2),
+    ('ren', 189, 5),
+    ('nguoi', 189, 10),
+    ('sua', 189, 2),
+    ('chua', 189, 2),
+    ('khong', 189, 2),
+    ('phoi', 189, 2),
+    ('cat', 189, 3),
+    ('got', 189, 2),
+    ('la', 189, 1),
+    ('qua', 189, 1),
+    ('trinh', 189, 1),
+    ('che', 189, 1),
+    ('bien', 189, 1),
+    ('cac', 189, 7),
+    ('de', 189, 1),
+    ('tao', 189, 1),
+    ('ra', 189, 1),
+    ('tung', 189, 1),
+    ('bo', 189, 1),
+    ('phan', 189, 2),
+    ('lap', 189, 1),
+    ('rap', 189, 1),
+    ('hoac', 189, 2),
+    ('cau', 189, 2),
+    ('kien', 189, 1),
+    ('qui', 189, 1),
+    ('mo', 189, 1),
+    ('lon', 189, 2),
+    ('ngu', 189, 1),
+    ('bao', 189, 1),
+    ('ham', 189, 1),
+    ('pham', 189, 1),
+    ('vi', 189, 1),
+    ('rong', 189, 1),
+    ('viec', 189, 3),
+    ('tu', 189, 1),
+    ('con', 189, 1),
+    ('tau', 189, 1),
+    ('va', 189, 3),
+    ('cay', 189, 1),
+    ('toi', 189, 1),
+    ('chi', 189, 1),
+    ('tiet', 189, 1),
+    ('dong', 189, 1),
+    ('chinh', 189, 1),
+    ('xac', 189, 1),
+    ('do', 189, 1),
+    ('trang', 189, 1),
+    ('suc', 189, 1),
+    ('tinh', 189, 1),
+    ('xao', 189, 1),
+    ('tho', 189, 1),
+    ('thuc', 189, 1),
+    ('hien', 189, 1),
+    ('nhu', 189, 2),
+    ('ep', 189, 1),
+    ('uon', 189, 1),
+    ('keo', 189, 1),
+    ('nong', 189, 1),
+    ('rem', 189, 1),
+    ('am', 189, 1),
+    ('tho', 190, 9),
+    ('co', 190, 27),
+    ('khi', 190, 14),
+    ('va', 190, 11),
+    ('sua', 190, 10),
+    ('chua', 190, 10),
+    ('dong', 190, 11),
+    ('the', 190, 6),
+    ('chat', 190, 4),
+    ('phuong', 190, 4),
+    ('tien', 190, 4),
+    ('giao', 190, 2),
+    ('thong', 190, 2),
+    ('bon', 190, 2),
+    ('banh', 190, 4),
+    ('xe', 190, 12),
+    ('hai', 190, 2),
+    ('tai', 190, 5),
+    ('trong', 190, 2),
+    ('lon', 190, 2),
+    ('thao', 190, 2),
+    ('dua', 190, 2),
+    ('di', 190, 2),
+    ('lai', 190, 2),
+    ('trang', 190, 2),
+    ('trai', 190, 2),
+    ('lam', 190, 1),
+    ('cong', 190, 1),
+    ('viec', 190, 1),
+    ('bao', 190, 1),
+    ('tri', 190, 1),
+    ('cac', 190, 2),
+    ('bo', 190, 1),
+    ('phan', 190, 1),
+    ('cua', 190, 1),
+    ('may', 190, 1),
+    ('o', 190, 2),
+    ('to', 190, 2),
+    ('cho', 190, 1),
+    ('khach', 190, 1),
+    ('loai', 190, 1),
+    ('khac', 190, 1),
+    ('tho', 191, 11),
+    ('lan', 191, 23),
+    ('the', 191, 6),
+    ('chat', 191, 5),
+    ('co', 191, 7),
+    ('khi', 191, 4),
+    ('cuu', 191, 6),
+    ('ho', 191, 3),
+    ('nghien', 191, 3),
+    ('huong', 191, 2),
+    ('dan', 191, 2),
+    ('xay', 191, 2),
+    ('dung', 191, 4),
+    ('su', 191, 1),
+    ('thiet', 191, 2),
+    ('bi', 191, 2),
+    ('chuyen', 191, 1),
+    ('de', 191, 2),
+    ('lam', 191, 1),
+    ('viec', 191, 1),
+    ('duoi', 191, 4),
+    ('nuoc', 191, 5),
+    ('cac', 191, 6),
+    ('hoat', 191, 1),
+    ('dong', 191, 1),
+    ('nay', 191, 1),
+    ('la', 191, 4),
+    ('tham', 191, 1),
+    ('do', 191, 2),
+    ('tai', 191, 1),
+    ('nguyen', 191, 1),
+    ('thien', 191, 1),
+    ('nhien', 191, 1),
+    ('va', 191, 3),
+    ('tim', 191, 1),
+    ('kiem', 191, 3),
+    ('nguoi', 191, 1),
+    ('tau', 191, 2),
+    ('hang', 191, 1),
+    ('hoa', 191, 1),
+    ('trong', 191, 1),
+    ('truong', 191, 2),
+    ('hop', 191, 1),
+    ('dam', 191, 1),
+    ('cung', 191, 1),
+    ('tra', 191, 2),
+    ('lap', 191, 1),
+    ('dat', 191, 1),
+    ('sua', 191, 1),
+    ('chua', 191, 1),
+    ('thi', 191, 1),
+    ('nghiem', 191, 1),
+    ('chup', 191, 1),
+    ('anh', 191, 1),
+    ('sinh', 191, 1),
+    ('canh', 191, 1),
+    ('bien', 191, 1),
+    ('hoac', 191, 3),
+    ('cau', 191, 1),
+    ('truc', 191, 1),
+    ('cho', 191, 1),
+    ('muc', 191, 1),
+    ('dich', 191, 1),
+    ('thuong', 191, 1),
+    ('mai', 191, 1),
+    ('ngoai', 191, 1),
+    ('con', 191, 1),
+    ('hazmat', 191, 1),
+    ('mot', 191, 2),
+    ('hinh', 191, 1),
+    ('thuc', 191, 1),
+    ('ma', 191, 2),
+    ('o', 191, 1),
+    ('vao', 191, 1),
+    ('moi', 191, 1),
+    ('khong', 191, 1),
+    ('phai', 191, 1),
+    ('long', 191, 2),
+    ('khac', 191, 1),
+    ('nhu', 191, 1),
+    ('bot', 191, 1),
+    ('giay', 191, 1),
+    ('xi', 191, 1),
+    ('mang', 191, 1),
+    ('bun', 191, 1),
+    ('dau', 191, 1),
+    ('si', 192, 12),
+    ('quan', 192, 39),
+    ('doi', 192, 11),
+    ('the', 192, 5),
+    ('chat', 192, 4),
+    ('co', 192, 9),
+    ('khi', 192, 4),
+    ('luc', 192, 6),
+    ('hai', 192, 7),
+    ('phong', 192, 6),
+    ('khong', 192, 5),
+    ('cong', 192, 2),
+    ('binh', 192, 2),
+    ('y', 192, 4),
+    ('la', 192, 4),
+    ('nguoi', 192, 1),
+    ('chi', 192, 1),
+    ('huy', 192, 1),
+    ('va', 192, 4),
+    ('li', 192, 1),
+    ('cac', 192, 2),
+    ('don', 192, 1),
+    ('vi', 192, 2),
+    ('trong', 192, 4),
+    ('luong', 192, 3),
+    ('quoc', 192, 6),
+    ('ba', 192, 2),
+    ('chung', 192, 2),
+    ('rat', 192, 1),
+    ('voi', 192, 2),
+    ('viec', 192, 1),
+    ('bao', 192, 3),
+    ('ve', 192, 2),
+    ('an', 192, 1),
+    ('ninh', 192, 1),
+    ('gia', 192, 4),
+    ('ho', 192, 1),
+    ('lanh', 192, 1),
+    ('tho', 192, 1),
+    ('gom', 192, 5),
+    ('vung', 192, 3),
+    ('dat', 192, 1),
+    ('bien', 192, 1),
+    ('troi', 192, 1),
+    ('ban', 192, 1),
+    ('cung', 192, 2),
+    ('tham', 192, 1),
+    ('vao', 192, 1),
+    ('tu', 192, 1),
+    ('cach', 192, 1),
+    ('chuyen', 192, 1),
+    ('nhieu', 192, 1),
+    ('nganh', 192, 2),
+    ('nghe', 192, 2),
+    ('khac', 192, 1),
+    ('nhau', 192, 1),
+    ('du', 192, 1),
+    ('nhu', 192, 2),
+    ('ki', 192, 2),
+    ('su', 192, 2),
+    ('bac', 192, 7),
+    ('ta', 192, 6),
+    ('ke', 192, 1),
+    ('toan', 192, 1),
+    ('thu', 192, 1),
+    ('luat', 192, 1),
+    ('hau', 192, 1),
+    ('bat', 192, 1),
+    ('nao', 192, 1),
+    ('he', 192, 1),
+    ('thong', 192, 1),
+    ('cap', 192, 5),
+    ('ham', 192, 1),
+    ('cua', 192, 1),
+    ('muoi', 192, 1),
+    ('uy', 192, 5),
+    ('bon', 192, 3),
+    ('thieu', 192, 3),
+    ('trung', 192, 3),
+    ('thuong', 192, 3),
+    ('dai', 192, 3),
+    ('tuong', 192, 5),
+    ('chuan', 192, 1),
+    ('do', 192, 3),
+    ('doc', 192, 3),
+    ('pho', 192, 1),
+    ('lao', 193, 9),
+    ('dong', 193, 12),
+    ('trong', 193, 18),
+    ('lam', 193, 19),
+    ('nghiep', 193, 13),
+    ('the', 193, 4),
+    ('chat', 193, 4),
+    ('co', 193, 4),
+    ('khi', 193, 4),
+    ('giao', 193, 2),
+    ('vien', 193, 2),
+    ('giang', 193, 2),
+    ('day', 193, 2),
+    ('ve', 193, 5),
+    ('thiet', 193, 2),
+    ('ke', 193, 2),
+    ('rung', 193, 13),
+    ('va', 193, 8),
+    ('cham', 193, 4),
+    ('soc', 193, 4),
+    ('quan', 193, 3),
+    ('ly', 193, 2),
+    ('bao', 193, 6),
+    ('khai', 193, 3),
+    ('thac', 193, 3),
+    ('so', 193, 3),
+    ('che', 193, 4),
+    ('cac', 193, 8),
+    ('loai', 193, 3),
+    ('san', 193, 4),
+    ('can', 193, 2),
+    ('bo', 193, 2),
+    ('khuyen', 193, 2),
+    ('la', 193, 1),
+    ('nghe', 193, 2),
+    ('lien', 193, 1),
+    ('den', 193, 1),
+    ('cay', 193, 2),
+    ('gay', 193, 1),
+    ('gom', 193, 3),
+    ('nhiem', 193, 1),
+    ('vu', 193, 2),
+    ('tao', 193, 2),
+    ('giong', 193, 1),
+    ('nuoi', 193, 2),
+    ('duong', 193, 1),
+    ('cai', 193, 1),
+    ('giau', 193, 1),
+    ('xuat', 193, 1),
+    ('nong', 193, 2),
+    ('ket', 193, 2),
+    ('hop', 193, 2),
+    ('tren', 193, 1),
+    ('dat', 193, 2),
+    ('nham', 193, 2),
+    ('phat', 193, 2),
+    ('trien', 193, 2),
+    ('kinh', 193, 1),
+    ('te', 193, 1),
+    ('moi', 193, 2),
+    ('truong', 193, 1),
+    ('hoat', 193, 3),
+    ('duy', 193, 1),
+    ('tri', 193, 1),
+    ('ton', 193, 1),
+    ('da', 193, 1),
+    ('dang', 193, 1),
+    ('sinh', 193, 2),
+    ('hoc', 193, 1),
+    ('tap', 193, 1),
+    ('trung', 193, 1),
+    ('khoanh', 193, 1),
+    ('tai', 193, 1),
+    ('chua', 193, 1),
+    ('tieu', 193, 1),
+    ('chuan', 193, 1),
+    ('nay', 193, 1),
+    ('con', 193, 1),
+    ('ca', 193, 1),
+    ('go', 193, 1),
+    ('phuc', 193, 1),
+    ('nganh', 193, 1),
+    ('cong', 193, 1),
+    ('bien', 193, 1),
+    ('lao', 194, 8),
+    ('dong', 194, 9),
+    ('nuoi', 194, 11),
+    ('trong', 194, 13),
+    ('va', 194, 11),
+    ('danh', 194, 12),
+    ('bat', 194, 12),
+    ('thuy', 194, 15),
+    ('san', 194, 20),
+    ('the', 194, 4),
+    ('chat', 194, 5),
+    ('co', 194, 5),
+    ('khi', 194, 4),
+    ('nghien', 194, 4),
+    ('cuu', 194, 4),
+    ('linh', 194, 2),
+    ('vuc', 194, 2),
+    ('cac', 194, 8),
+    ('tram', 194, 2),
+    ('doanh', 194, 2),
+    ('nghiep', 194, 6),
+    ('ve', 194, 2),
+    ('xuat', 194, 5),
+    ('giong', 194, 2),
+    ('doan', 194, 2),
+    ('gan', 194, 2),
+    ('bo', 194, 7),
+    ('xa', 194, 2),
+    ('can', 194, 2),
+    ('khuyen', 194, 2),
+    ('ngu', 194, 2),
+    ('bao', 194, 1),
+    ('gom', 194, 1),
+    ('ca', 194, 1),
+    ('nuoc', 194, 3),
+    ('man', 194, 2),
+    ('lo', 194, 1),
+    ('la', 194, 1),
+    ('mot', 194, 1),
+    ('phan', 194, 2),
+    ('cua', 194, 2),
+    ('nen', 194, 1),
+    ('nong', 194, 1),
+    ('nghe', 194, 1),
+    ('nay', 194, 1),
+    ('ra', 194, 1),
+    ('loai', 194, 2),
+    ('pham', 194, 1),
+    ('luong', 194, 1),
+    ('cao', 194, 1),
+    ('phuc', 194, 1),
+    ('vu', 194, 1),
+    ('cho', 194, 2),
+    ('doi', 194, 1),
+    ('song', 194, 1),
+    ('nhan', 194, 1),
+    ('dan', 194, 1),
+    ('cung', 194, 1),
+    ('cap', 194, 1),
+    ('nguyen', 194, 1),
+    ('lieu', 194, 1),
+    ('cong', 194, 1),
+    ('che', 194, 1),
+    ('bien', 194, 1),
+    ('khau', 194, 1),
+    ('gop', 194, 1),
+    ('cai', 194, 1),
+    ('tao', 194, 1),
+    ('moi', 194, 1),
+    ('truong', 194, 1),
+    ('sinh', 194, 1),
+    ('thai', 194, 1),
+    ('thoi', 194, 1),
+    ('khai', 194, 1),
+    ('thac', 194, 1),
+    ('ngot', 194, 1),
+    ('tho', 195, 22),
+    ('xay', 195, 14),
+    ('the', 195, 4),
+    ('chat', 195, 4),
+    ('co', 195, 6),
+    ('khi', 195, 4),
+    ('cac', 195, 8),
+    ('cong', 195, 9),
+    ('trinh', 195, 7),
+    ('dung', 195, 5),
+    ('dan', 195, 2),
+    ('nghiep', 195, 2),
+    ('nha', 195, 3),
+    ('may', 195, 2),
+    ('thuy', 195, 4),
+    ('loi', 195, 2),
+    ('dien', 195, 3),
+    ('la', 195, 1),
+    ('nhung', 195, 1),
+    ('nguoi', 195, 1),
+    ('lao', 195, 1),
+    ('dong', 195, 1),
+    ('tay', 195, 1),
+    ('nghe', 195, 1),
+    ('tham', 195, 2),
+    ('gia', 195, 1),
+    ('so', 195, 1),
+    ('ha', 195, 1),
+    ('tang', 195, 1),
+    ('cua', 195, 1),
+    ('duoc', 195, 1),
+    ('chia', 195, 1),
+    ('thanh', 195, 1),
+    ('loai', 195, 1),
+    ('hinh', 195, 1),
+    ('sau', 195, 1),
+    ('ne', 195, 1),
+    ('moc', 195, 1),
+    ('lot', 195, 1),
+    ('tron', 195, 1),
+    ('ho', 195, 1),
+    ('hang', 195, 1),
+    ('rao', 195, 1),
+    ('sat', 195, 1),
+    ('to', 195, 1),
+    ('sua', 195, 1),
+    ('ong', 195, 1),
+    ('nuoc', 195, 1),
+    ('han', 195, 1),
+    ('son', 195, 1),
+    ('mai', 195, 1),
+    ('trang', 195, 1),
+    ('tri', 195, 1),
+    ('noi', 195, 1),
+    ('that', 195, 1),
+    ('thiet', 195, 1),
+    ('ke', 195, 1),
+    ('phong', 195, 1),
+    ('canh', 195, 1),
+    ('tho', 196, 9),
+    ('hoan', 196, 10),
+    ('thien', 196, 10),
+    ('trong', 196, 9),
+    ('xay', 196, 13),
+    ('dung', 196, 17),
+    ('the', 196, 4),
+    ('chat', 196, 5),
+    ('co', 196, 4),
+    ('khi', 196, 4),
+    ('cac', 196, 8),
+    ('cong', 196, 11),
+    ('trinh', 196, 7),
+    ('dan', 196, 3),
+    ('nghiep', 196, 3),
+    ('nha', 196, 2),
+    ('may', 196, 2),
+    ('thuy', 196, 4),
+    ('loi', 196, 2),
+    ('dien', 196, 2),
+    ('la', 196, 1),
+    ('nghe', 196, 1),
+    ('chuyen', 196, 1),
+    ('thi', 196, 1),
+    ('va', 196, 3),
+    ('theo', 196, 2),
+    ('yeu', 196, 1),
+    ('cau', 196, 1),
+    ('ky', 196, 1),
+    ('thuat', 196, 1),
+    ('quy', 196, 2),
+    ('dinh', 196, 1),
+    ('pham', 196, 1),
+    ('tcvn', 196, 1),
+    ('dat', 196, 1),
+    ('nang', 196, 1),
+    ('suat', 196, 1),
+    ('luong', 196, 1),
+    ('an', 196, 1),
+    ('toan', 196, 1),
+    ('lao', 196, 1),
+    ('dong', 196, 1),
+    ('ve', 196, 1),
+    ('sinh', 196, 1),
+    ('moi', 196, 1),
+    ('truong', 196, 1),
+    ('tho', 197, 13),
+    ('son', 197, 28),
+    ('the', 197, 5),
+    ('chat', 197, 4),
+    ('co', 197, 5),
+    ('khi', 197, 4),
+    ('cac', 197, 19),
+    ('cong', 197, 12),
+    ('trinh', 197, 7),
+    ('xay', 197, 4),
+    ('dung', 197, 9),
+    ('dan', 197, 2),
+    ('nghiep', 197, 4),
+    ('nha', 197, 6),
+    ('may', 197, 6),
+    ('thuy', 197, 4),
+    ('loi', 197, 2),
+    ('dien', 197, 4),
+    ('lam', 197, 2),
+    ('ve', 197, 2),
+    ('tai', 197, 2),
+    ('doanh', 197, 2),
+    ('san', 197, 2),
+    ('xuat', 197, 2),
+    ('nhu', 197, 2),
+    ('o', 197, 5),
+    ('to', 197, 4),
+    ('xe', 197, 2),
+    ('tinh', 197, 2),
+    ('la', 197, 1),
+    ('nhung', 197, 1),
+    ('nguoi', 197, 1),
+    ('quet', 197, 1),
+    ('voi', 197, 1),
+    ('nuoc', 197, 1),
+    ('mot', 197, 1),
+    ('khau', 197, 1),
+    ('trong', 197, 1),
+    ('viec', 197, 1),
+    ('hoan', 197, 1),
+    ('thien', 197, 2),
+    ('cau', 197, 1),
+    ('vat', 197, 2),
+    ('duoc', 197, 1),
+    ('loai', 197, 1),
+    ('khac', 197, 2),
+    ('nhau', 197, 1),
+    ('bao', 197, 2),
+    ('gom', 197, 1),
+    ('toa', 197, 1),
+    ('moi', 197, 1),
+    ('duong', 197, 1),
+    ('cai', 197, 1),
+    ('va', 197, 2),
+    ('duy', 197, 1),
+    ('tri', 197, 2),
+    ('lop', 197, 1),
+    ('nghe', 197, 1),
+    ('thuat', 197, 2),
+    ('ap', 197, 1),
+    ('ki', 197, 1),
+    ('trang', 197, 1),
+    ('vao', 197, 1),
+    ('be', 197, 1),
+    ('mat', 197, 1),
+    ('da', 197, 1),
+    ('nhan', 197, 1),
+    ('thu', 197, 1),
+    ('do', 197, 1),
+    ('choi', 197, 1),
+    ('gia', 197, 1),
+    ('dinh', 197, 1),
+    ('thiet', 197, 1),
+    ('bi', 197, 1),
+    ('tho', 198, 10),
+    ('lap', 198, 11),
+    ('dat', 198, 11),
+    ('va', 198, 11),
+    ('sua', 198, 12),
+    ('chua', 198, 12),
+    ('dien', 198, 15),
+    ('the', 198, 4),
+    ('chat', 198, 4),
+    ('co', 198, 6),
+    ('khi', 198, 5),
+    ('lam', 198, 2),
+    ('viec', 198, 2),
+    ('tai', 198, 2),
+    ('cac', 198, 5),
+    ('cong', 198, 7),
+    ('trinh', 198, 4),
+    ('nghiep', 198, 2),
+    ('nha', 198, 3),
+    ('may', 198, 3),
+    ('thuy', 198, 4),
+    ('loi', 198, 2),
+    ('dan', 198, 2),
+    ('dong', 198, 1),
+    ('gop', 198, 1),
+    ('vai', 198, 1),
+    ('tro', 198, 1),
+    ('vo', 198, 1),
+    ('cung', 198, 1),
+    ('to', 198, 1),
+    ('lon', 198, 1),
+    ('cho', 198, 1),
+    ('nganh', 198, 1),
+    ('luc', 198, 2),
+    ('cua', 198, 1),
+    ('chung', 198, 2),
+    ('ta', 198, 1),
+    ('do', 198, 1),
+    ('hien', 198, 1),
+    ('nay', 198, 1),
+    ('he', 198, 2),
+    ('thong', 198, 2),
+    ('dung', 198, 1),
+    ('con', 198, 1),
+    ('dang', 198, 1),
+    ('thieu', 198, 1),
+    ('nhan', 198, 1),
+    ('tram', 198, 1),
+    ('trong', 198, 2),
+    ('bao', 198, 1),
+    ('gom', 198, 1),
+    ('ho', 198, 1),
+    ('gia', 198, 1),
+    ('dinh', 198, 1),
+    ('ty', 198, 1),
+    ('truong', 198, 1),
+    ('hoc', 198, 1),
+    ('cu', 198, 1),
+    ('so', 198, 1),
+    ('san', 198, 1),
+    ('xuat', 198, 1),
+    ('kinh', 198, 1),
+    ('doanh', 198, 1),
+    ('tho', 199, 16),
+    ('lap', 199, 17),
+    ('dat', 199, 16),
+    ('va', 199, 12),
+    ('sua', 199, 13),
+    ('chua', 199, 13),
+    ('dien', 199, 16),
+    ('tu', 199, 14),
+    ('vien', 199, 19),
+    ('thong', 199, 19),
+    ('the', 199, 6),
+    ('chat', 199, 5),
+    ('co', 199, 9),
+    ('khi', 199, 6),
+    ('chu', 199, 2),
+    ('yeu', 199, 2),
+    ('lien', 199, 2),
+    ('quan', 199, 2),
+    ('den', 199, 2),
+    ('linh', 199, 6),
+    ('vuc', 199, 4),
+    ('tai', 199, 2),
+    ('cac', 199, 11),
+    ('tram', 199, 3),
+    ('dai', 199, 3),
+    ('mang', 199, 2),
+    ('phat', 199, 2),
+    ('trien', 199, 2),
+    ('su', 199, 2),
+    ('nghiep', 199, 2),
+    ('ban', 199, 6),
+    ('chuyen', 199, 2),
+    ('sau', 199, 2),
+    ('hon', 199, 2),
+    ('nua', 199, 2),
+    ('ve', 199, 2),
+    ('mot', 199, 3),
+    ('cua', 199, 3),
+    ('nhu', 199, 4),
+    ('ho', 199, 2),
+    ('tro', 199, 3),
+    ('giang', 199, 2),
+    ('day', 199, 2),
+    ('nghien', 199, 2),
+    ('cuu', 199, 2),
+    ('trong', 199, 4),
+    ('nghe', 199, 2),
+    ('thuc', 199, 1),
+    ('hien', 199, 1),
+    ('cong', 199, 2),
+    ('viec', 199, 3),
+    ('cap', 199, 1),
+    ('dong', 199, 1),
+    ('cung', 199, 1),
+    ('quang', 199, 1),
+    ('thiet', 199, 4),
+    ('bi', 199, 4),
+    ('phu', 199, 1),
+    ('khac', 199, 1),
+    ('van', 199, 1),
+    ('hanh', 199, 1),
+    ('khai', 199, 1),
+    ('thac', 199, 1),
+    ('duoc', 199, 3),
+    ('kiem', 199, 1),
+    ('tra', 199, 1),
+    ('chi', 199, 1),
+    ('tieu', 199, 1),
+    ('luong', 199, 1),
+    ('trang', 199, 1),
+    ('ung', 199, 1),
+    ('dung', 199, 1),
+    ('so', 199, 1),
+    ('ky', 199, 1),
+    ('thuat', 199, 1),
+    ('moi', 199, 1),
+    ('lam', 199, 2),
+    ('doc', 199, 1),
+    ('kha', 199, 1),
+    ('nang', 199, 1),
+    ('sang', 199, 1),
+    ('tao', 199, 1),
+    ('cai', 199, 1),
+    ('tien', 199, 1),
+    ('qua', 199, 1),
+    ('trinh', 199, 1),
+    ('tho', 200, 9),
+    ('lap', 200, 18),
+    ('rap', 200, 18),
+    ('the', 200, 8),
+    ('chat', 200, 5),
+    ('co', 200, 12),
+    ('khi', 200, 7),
+    ('chu', 200, 2),
+    ('yeu', 200, 2),
+    ('lien', 200, 3),
+    ('quan', 200, 3),
+    ('den', 200, 2),
+    ('linh', 200, 3),
+    ('vuc', 200, 3),
+    ('phat', 200, 2),
+    ('trien', 200, 2),
+    ('nghe', 200, 2),
+    ('nghiep', 200, 4),
+    ('ban', 200, 2),
+    ('hoc', 200, 3),
+    ('chuyen', 200, 3),
+    ('sau', 200, 2),
+    ('hon', 200, 2),
+    ('va', 200, 3),
+    ('nghien', 200, 2),
+    ('cuu', 200, 2),
+    ('sang', 200, 2),
+    ('tao', 200, 6),
+    ('cac', 200, 9),
+    ('loai', 200, 4),
+    ('mau', 200, 2),
+    ('ma', 200, 2),
+    ('moi', 200, 2),
+    ('huong', 200, 2),
+    ('dan', 200, 2),
+    ('hoac', 200, 2),
+    ('tham', 200, 2),
+    ('gia', 200, 2),
+    ('dao', 200, 4),
+    ('tai', 200, 2),
+    ('so', 200, 2),
+    ('doanh', 200, 2),
+    ('la', 200, 1),
+    ('nguoi', 200, 1),
+    ('lam', 200, 1),
+    ('viec', 200, 1),
+    ('trong', 200, 1),
+    ('san', 200, 6),
+    ('xuat', 200, 1),
+    ('pham', 200, 5),
+    ('nhu', 200, 1),
+    ('may', 200, 2),
+    ('thiet', 200, 2),
+    ('bi', 200, 2),
+    ('dien', 200, 2),
+    ('tu', 200, 1),
+    ('kim', 200, 1),
+    ('cao', 200, 1),
+    ('su', 200, 1),
+    ('deo', 200, 1),
+    ('go', 200, 1),
+    ('bang', 200, 1),
+    ('giay', 200, 1),
+    ('bia', 200, 1),
+    ('da', 200, 1);
+
+
+-- Precomputed career suggestions (4-tier algorithm) for every Holland code
+DELETE FROM job_suggestion_cache;
+
+INSERT INTO job_suggestion_cache (
+    holland_code, sort_order, job_id, star_rating, match_type, match_score
+) VALUES
+    ('RIA', 0, 38, 4, 'permutation', 89.00),
+    ('RIA', 1, 2, 4, 'permutation', 86.00),
+    ('RIA', 2, 3, 4, 'permutation', 86.00),
+    ('RIA', 3, 34, 4, 'permutation', 86.00),
+    ('RIA', 4, 87, 4, 'permutation', 80.00),
+    ('RIA', 5, 88, 4, 'permutation', 80.00),
+    ('RIA', 6, 52, 3, 'two_char', 75.00),
+    ('RIA', 7, 62, 3, 'two_char', 75.00),
+    ('RIA', 8, 151, 3, 'two_char', 75.00),
+    ('RIA', 9, 101, 3, 'two_char', 72.50),
+    ('RIA', 10, 103, 3, 'two_char', 72.50),
+    ('RIA', 11, 35, 3, 'two_char', 70.00),
+    ('RIA', 12, 37, 3, 'two_char', 70.00),
+    ('RIA', 13, 42, 3, 'two_char', 70.00),
+    ('RIA', 14, 43, 3, 'two_char', 70.00),
+    ('RIA', 15, 45, 3, 'two_char', 70.00),
+    ('RIA', 16, 93, 3, 'two_char', 65.00),
+    ('RIA', 17, 96, 3, 'two_char', 65.00),
+    ('RIA', 18, 102, 2, 'single_char', 55.00),
+    ('RIA', 19, 104, 2, 'single_char', 55.00),
+    ('RIA', 20, 17, 2, 'single_char', 50.00),
+    ('RIS', 0, 121, 4, 'permutation', 89.00),
+    ('RIS', 1, 107, 4, 'permutation', 86.00),
+    ('RIS', 2, 112, 4, 'permutation', 86.00),
+    ('RIS', 3, 135, 4, 'permutation', 86.00),
+    ('RIS', 4, 137, 4, 'permutation', 86.00),
+    ('RIS', 5, 108, 4, 'permutation', 83.00),
+    ('RIS', 6, 150, 4, 'permutation', 83.00),
+    ('RIS', 7, 117, 4, 'permutation', 80.00),
+    ('RIS', 8, 175, 4, 'permutation', 80.00),
+    ('RIS', 9, 176, 4, 'permutation', 80.00),
+    ('RIS', 10, 52, 3, 'two_char', 75.00),
+    ('RIS', 11, 62, 3, 'two_char', 75.00),
+    ('RIS', 12, 151, 3, 'two_char', 75.00),
+    ('RIS', 13, 35, 3, 'two_char', 70.00),
+    ('RIS', 14, 37, 3, 'two_char', 70.00),
+    ('RIS', 15, 42, 3, 'two_char', 70.00),
+    ('RIS', 16, 43, 3, 'two_char', 70.00),
+    ('RIS', 17, 45, 3, 'two_char', 70.00),
+    ('RIS', 18, 106, 3, 'two_char', 67.50),
+    ('RIS', 19, 8, 3, 'two_char', 65.00),
+    ('RIS', 20, 6, 3, 'two_char', 62.50),
+    ('RIS', 21, 7, 3, 'two_char', 62.50),
+    ('RIS', 22, 9, 3, 'two_char', 62.50),
+    ('RIS', 23, 10, 3, 'two_char', 62.50),
+    ('RIS', 24, 134, 3, 'two_char', 62.50),
+    ('RIS', 25, 102, 2, 'single_char', 55.00),
+    ('RIS', 26, 104, 2, 'single_char', 55.00),
+    ('RIS', 27, 17, 2, 'single_char', 50.00),
+    ('RIE', 0, 48, 5, 'exact', 100.00),
+    ('RIE', 1, 169, 5, 'exact', 100.00),
+    ('RIE', 2, 171, 5, 'exact', 100.00),
+    ('RIE', 3, 164, 4, 'permutation', 92.00),
+    ('RIE', 4, 56, 4, 'permutation', 89.00),
+    ('RIE', 5, 67, 4, 'permutation', 89.00),
+    ('RIE', 6, 147, 4, 'permutation', 89.00),
+    ('RIE', 7, 52, 3, 'two_char', 75.00),
+    ('RIE', 8, 62, 3, 'two_char', 75.00),
+    ('RIE', 9, 151, 3, 'two_char', 75.00),
+    ('RIE', 10, 143, 3, 'two_char', 72.50),
+    ('RIE', 11, 35, 3, 'two_char', 70.00),
+    ('RIE', 12, 37, 3, 'two_char', 70.00),
+    ('RIE', 13, 42, 3, 'two_char', 70.00),
+    ('RIE', 14, 43, 3, 'two_char', 70.00),
+    ('RIE', 15, 45, 3, 'two_char', 70.00),
+    ('RIE', 16, 102, 2, 'single_char', 55.00),
+    ('RIE', 17, 104, 2, 'single_char', 55.00),
+    ('RIE', 18, 17, 2, 'single_char', 50.00),
+    ('RIC', 0, 31, 5, 'exact', 100.00),
+    ('RIC', 1, 44, 5, 'exact', 100.00),
+    ('RIC', 2, 51, 5, 'exact', 100.00),
+    ('RIC', 3, 61, 5, 'exact', 100.00),
+    ('RIC', 4, 71, 5, 'exact', 100.00),
+    ('RIC', 5, 26, 4, 'permutation', 92.00),
+    ('RIC', 6, 55, 4, 'permutation', 92.00),
+    ('RIC', 7, 148, 4, 'permutation', 92.00),
+    ('RIC', 8, 155, 4, 'permutation', 92.00),
+    ('RIC', 9, 159, 4, 'permutation', 92.00),
+    ('RIC', 10, 30, 4, 'permutation', 89.00),
+    ('RIC', 11, 36, 4, 'permutation', 89.00),
+    ('RIC', 12, 46, 4, 'permutation', 89.00),
+    ('RIC', 13, 47, 4, 'permutation', 89.00),
+    ('RIC', 14, 49, 4, 'permutation', 89.00),
+    ('RIC', 15, 24, 4, 'permutation', 86.00),
+    ('RIC', 16, 50, 4, 'permutation', 86.00),
+    ('RIC', 17, 136, 4, 'permutation', 83.00),
+    ('RIC', 18, 52, 3, 'two_char', 75.00),
+    ('RIC', 19, 62, 3, 'two_char', 75.00),
+    ('RIC', 20, 151, 3, 'two_char', 75.00),
+    ('RIC', 21, 79, 3, 'two_char', 72.50),
+    ('RIC', 22, 82, 3, 'two_char', 72.50),
+    ('RIC', 23, 83, 3, 'two_char', 72.50),
+    ('RIC', 24, 84, 3, 'two_char', 72.50),
+    ('RIC', 25, 85, 3, 'two_char', 72.50),
+    ('RIC', 26, 35, 3, 'two_char', 70.00),
+    ('RIC', 27, 37, 3, 'two_char', 70.00),
+    ('RIC', 28, 42, 3, 'two_char', 70.00),
+    ('RIC', 29, 43, 3, 'two_char', 70.00),
+    ('RIC', 30, 45, 3, 'two_char', 70.00),
+    ('RIC', 31, 32, 3, 'two_char', 67.50),
+    ('RIC', 32, 33, 3, 'two_char', 67.50),
+    ('RIC', 33, 40, 3, 'two_char', 62.50),
+    ('RIC', 34, 102, 2, 'single_char', 55.00),
+    ('RIC', 35, 104, 2, 'single_char', 55.00),
+    ('RIC', 36, 17, 2, 'single_char', 50.00),
+    ('RAI', 0, 87, 4, 'permutation', 86.00),
+    ('RAI', 1, 88, 4, 'permutation', 86.00),
+    ('RAI', 2, 38, 4, 'permutation', 83.00),
+    ('RAI', 3, 2, 4, 'permutation', 80.00),
+    ('RAI', 4, 3, 4, 'permutation', 80.00),
+    ('RAI', 5, 34, 4, 'permutation', 80.00),
+    ('RAI', 6, 101, 3, 'two_char', 75.00),
+    ('RAI', 7, 103, 3, 'two_char', 75.00),
+    ('RAI', 8, 52, 3, 'two_char', 72.50),
+    ('RAI', 9, 62, 3, 'two_char', 72.50),
+    ('RAI', 10, 151, 3, 'two_char', 72.50),
+    ('RAI', 11, 93, 3, 'two_char', 70.00),
+    ('RAI', 12, 96, 3, 'two_char', 70.00),
+    ('RAI', 13, 35, 3, 'two_char', 65.00),
+    ('RAI', 14, 37, 3, 'two_char', 65.00),
+    ('RAI', 15, 42, 3, 'two_char', 65.00),
+    ('RAI', 16, 43, 3, 'two_char', 65.00),
+    ('RAI', 17, 45, 3, 'two_char', 65.00),
+    ('RAI', 18, 102, 2, 'single_char', 55.00),
+    ('RAI', 19, 104, 2, 'single_char', 55.00),
+    ('RAI', 20, 17, 2, 'single_char', 45.00),
+    ('RAS', 0, 78, 4, 'permutation', 86.00),
+    ('RAS', 1, 101, 3, 'two_char', 75.00),
+    ('RAS', 2, 103, 3, 'two_char', 75.00),
+    ('RAS', 3, 93, 3, 'two_char', 70.00),
+    ('RAS', 4, 96, 3, 'two_char', 70.00),
+    ('RAS', 5, 21, 3, 'two_char', 67.50),
+    ('RAS', 6, 8, 3, 'two_char', 65.00),
+    ('RAS', 7, 122, 3, 'two_char', 62.50),
+    ('RAS', 8, 124, 3, 'two_char', 62.50),
+    ('RAS', 9, 102, 2, 'single_char', 55.00),
+    ('RAS', 10, 104, 2, 'single_char', 55.00),
+    ('RAE', 0, 74, 4, 'permutation', 89.00),
+    ('RAE', 1, 92, 4, 'permutation', 89.00),
+    ('RAE', 2, 95, 4, 'permutation', 89.00),
+    ('RAE', 3, 97, 4, 'permutation', 89.00),
+    ('RAE', 4, 89, 4, 'permutation', 86.00),
+    ('RAE', 5, 90, 4, 'permutation', 86.00),
+    ('RAE', 6, 142, 4, 'permutation', 83.00),
+    ('RAE', 7, 101, 3, 'two_char', 75.00),
+    ('RAE', 8, 103, 3, 'two_char', 75.00),
+    ('RAE', 9, 143, 3, 'two_char', 72.50),
+    ('RAE', 10, 93, 3, 'two_char', 70.00),
+    ('RAE', 11, 96, 3, 'two_char', 70.00),
+    ('RAE', 12, 94, 3, 'two_char', 67.50),
+    ('RAE', 13, 102, 2, 'single_char', 55.00),
+    ('RAE', 14, 104, 2, 'single_char', 55.00),
+    ('RAC', 0, 100, 5, 'exact', 100.00),
+    ('RAC', 1, 80, 4, 'permutation', 92.00),
+    ('RAC', 2, 81, 4, 'permutation', 92.00),
+    ('RAC', 3, 101, 3, 'two_char', 75.00),
+    ('RAC', 4, 103, 3, 'two_char', 75.00),
+    ('RAC', 5, 79, 3, 'two_char', 72.50),
+    ('RAC', 6, 82, 3, 'two_char', 72.50),
+    ('RAC', 7, 83, 3, 'two_char', 72.50),
+    ('RAC', 8, 84, 3, 'two_char', 72.50),
+    ('RAC', 9, 85, 3, 'two_char', 72.50),
+    ('RAC', 10, 93, 3, 'two_char', 70.00),
+    ('RAC', 11, 96, 3, 'two_char', 70.00),
+    ('RAC', 12, 15, 3, 'two_char', 62.50),
+    ('RAC', 13, 102, 2, 'single_char', 55.00),
+    ('RAC', 14, 104, 2, 'single_char', 55.00),
+    ('RSI', 0, 108, 4, 'permutation', 89.00),
+    ('RSI', 1, 150, 4, 'permutation', 89.00),
+    ('RSI', 2, 117, 4, 'permutation', 86.00),
+    ('RSI', 3, 175, 4, 'permutation', 86.00),
+    ('RSI', 4, 176, 4, 'permutation', 86.00),
+    ('RSI', 5, 121, 4, 'permutation', 83.00),
+    ('RSI', 6, 107, 4, 'permutation', 80.00),
+    ('RSI', 7, 112, 4, 'permutation', 80.00),
+    ('RSI', 8, 135, 4, 'permutation', 80.00),
+    ('RSI', 9, 137, 4, 'permutation', 80.00),
+    ('RSI', 10, 52, 3, 'two_char', 72.50),
+    ('RSI', 11, 62, 3, 'two_char', 72.50),
+    ('RSI', 12, 151, 3, 'two_char', 72.50),
+    ('RSI', 13, 8, 3, 'two_char', 70.00),
+    ('RSI', 14, 6, 3, 'two_char', 67.50),
+    ('RSI', 15, 7, 3, 'two_char', 67.50),
+    ('RSI', 16, 9, 3, 'two_char', 67.50),
+    ('RSI', 17, 10, 3, 'two_char', 67.50),
+    ('RSI', 18, 134, 3, 'two_char', 67.50),
+    ('RSI', 19, 35, 3, 'two_char', 65.00),
+    ('RSI', 20, 37, 3, 'two_char', 65.00),
+    ('RSI', 21, 42, 3, 'two_char', 65.00),
+    ('RSI', 22, 43, 3, 'two_char', 65.00),
+    ('RSI', 23, 45, 3, 'two_char', 65.00),
+    ('RSI', 24, 106, 3, 'two_char', 62.50),
+    ('RSI', 25, 102, 2, 'single_char', 55.00),
+    ('RSI', 26, 104, 2, 'single_char', 55.00),
+    ('RSI', 27, 17, 2, 'single_char', 45.00),
+    ('RSA', 0, 78, 4, 'permutation', 80.00),
+    ('RSA', 1, 101, 3, 'two_char', 72.50),
+    ('RSA', 2, 103, 3, 'two_char', 72.50),
+    ('RSA', 3, 8, 3, 'two_char', 70.00),
+    ('RSA', 4, 122, 3, 'two_char', 67.50),
+    ('RSA', 5, 124, 3, 'two_char', 67.50),
+    ('RSA', 6, 93, 3, 'two_char', 65.00),
+    ('RSA', 7, 96, 3, 'two_char', 65.00),
+    ('RSA', 8, 21, 3, 'two_char', 62.50),
+    ('RSA', 9, 102, 2, 'single_char', 55.00),
+    ('RSA', 10, 104, 2, 'single_char', 55.00),
+    ('RSE', 0, 180, 5, 'exact', 100.00),
+    ('RSE', 1, 177, 4, 'permutation', 92.00),
+    ('RSE', 2, 144, 4, 'permutation', 89.00),
+    ('RSE', 3, 178, 4, 'permutation', 89.00),
+    ('RSE', 4, 116, 4, 'permutation', 80.00),
+    ('RSE', 5, 143, 3, 'two_char', 72.50),
+    ('RSE', 6, 8, 3, 'two_char', 70.00),
+    ('RSE', 7, 28, 3, 'two_char', 67.50),
+    ('RSE', 8, 139, 3, 'two_char', 67.50),
+    ('RSE', 9, 102, 2, 'single_char', 55.00),
+    ('RSE', 10, 104, 2, 'single_char', 55.00),
+    ('RSC', 0, 173, 5, 'exact', 100.00),
+    ('RSC', 1, 4, 4, 'permutation', 80.00),
+    ('RSC', 2, 79, 3, 'two_char', 72.50),
+    ('RSC', 3, 82, 3, 'two_char', 72.50),
+    ('RSC', 4, 83, 3, 'two_char', 72.50),
+    ('RSC', 5, 84, 3, 'two_char', 72.50),
+    ('RSC', 6, 85, 3, 'two_char', 72.50),
+    ('RSC', 7, 8, 3, 'two_char', 70.00),
+    ('RSC', 8, 23, 3, 'two_char', 62.50),
+    ('RSC', 9, 102, 2, 'single_char', 55.00),
+    ('RSC', 10, 104, 2, 'single_char', 55.00),
+    ('REI', 0, 164, 5, 'exact', 100.00),
+    ('REI', 1, 48, 4, 'permutation', 92.00),
+    ('REI', 2, 169, 4, 'permutation', 92.00),
+    ('REI', 3, 171, 4, 'permutation', 92.00),
+    ('REI', 4, 56, 4, 'permutation', 83.00),
+    ('REI', 5, 67, 4, 'permutation', 83.00),
+    ('REI', 6, 147, 4, 'permutation', 83.00),
+    ('REI', 7, 143, 3, 'two_char', 75.00),
+    ('REI', 8, 52, 3, 'two_char', 72.50),
+    ('REI', 9, 62, 3, 'two_char', 72.50),
+    ('REI', 10, 151, 3, 'two_char', 72.50),
+    ('REI', 11, 35, 3, 'two_char', 65.00),
+    ('REI', 12, 37, 3, 'two_char', 65.00),
+    ('REI', 13, 42, 3, 'two_char', 65.00),
+    ('REI', 14, 43, 3, 'two_char', 65.00),
+    ('REI', 15, 45, 3, 'two_char', 65.00),
+    ('REI', 16, 102, 2, 'single_char', 55.00),
+    ('REI', 17, 104, 2, 'single_char', 55.00),
+    ('REI', 18, 17, 2, 'single_char', 45.00),
+    ('REA', 0, 142, 4, 'permutation', 89.00),
+    ('REA', 1, 74, 4, 'permutation', 83.00),
+    ('REA', 2, 92, 4, 'permutation', 83.00),
+    ('REA', 3, 95, 4, 'permutation', 83.00),
+    ('REA', 4, 97, 4, 'permutation', 83.00),
+    ('REA', 5, 89, 4, 'permutation', 80.00),
+    ('REA', 6, 90, 4, 'permutation', 80.00),
+    ('REA', 7, 143, 3, 'two_char', 75.00),
+    ('REA', 8, 101, 3, 'two_char', 72.50),
+    ('REA', 9, 103, 3, 'two_char', 72.50),
+    ('REA', 10, 93, 3, 'two_char', 65.00),
+    ('REA', 11, 96, 3, 'two_char', 65.00),
+    ('REA', 12, 94, 3, 'two_char', 62.50),
+    ('REA', 13, 102, 2, 'single_char', 55.00),
+    ('REA', 14, 104, 2, 'single_char', 55.00),
+    ('RES', 0, 177, 5, 'exact', 100.00),
+    ('RES', 1, 180, 4, 'permutation', 92.00),
+    ('RES', 2, 116, 4, 'permutation', 86.00),
+    ('RES', 3, 144, 4, 'permutation', 83.00),
+    ('RES', 4, 178, 4, 'permutation', 83.00),
+    ('RES', 5, 143, 3, 'two_char', 75.00),
+    ('RES', 6, 8, 3, 'two_char', 65.00),
+    ('RES', 7, 28, 3, 'two_char', 62.50),
+    ('RES', 8, 139, 3, 'two_char', 62.50),
+    ('RES', 9, 102, 2, 'single_char', 55.00),
+    ('RES', 10, 104, 2, 'single_char', 55.00),
+    ('REC', 0, 59, 5, 'exact', 100.00),
+    ('REC', 1, 170, 5, 'exact', 100.00),
+    ('REC', 2, 179, 5, 'exact', 100.00),
+    ('REC', 3, 186, 4, 'permutation', 92.00),
+    ('REC', 4, 190, 4, 'permutation', 92.00),
+    ('REC', 5, 128, 4, 'permutation', 89.00),
+    ('REC', 6, 153, 4, 'permutation', 89.00),
+    ('REC', 7, 65, 4, 'permutation', 86.00),
+    ('REC', 8, 161, 4, 'permutation', 83.00),
+    ('REC', 9, 25, 4, 'permutation', 80.00),
+    ('REC', 10, 66, 4, 'permutation', 80.00),
+    ('REC', 11, 146, 4, 'permutation', 80.00),
+    ('REC', 12, 143, 3, 'two_char', 75.00),
+    ('REC', 13, 79, 3, 'two_char', 72.50),
+    ('REC', 14, 82, 3, 'two_char', 72.50),
+    ('REC', 15, 83, 3, 'two_char', 72.50),
+    ('REC', 16, 84, 3, 'two_char', 72.50),
+    ('REC', 17, 85, 3, 'two_char', 72.50),
+    ('REC', 18, 27, 3, 'two_char', 67.50),
+    ('REC', 19, 69, 3, 'two_char', 67.50),
+    ('REC', 20, 114, 3, 'two_char', 67.50),
+    ('REC', 21, 119, 3, 'two_char', 67.50),
+    ('REC', 22, 125, 3, 'two_char', 67.50),
+    ('REC', 23, 5, 3, 'two_char', 62.50),
+    ('REC', 24, 72, 3, 'two_char', 62.50),
+    ('REC', 25, 77, 3, 'two_char', 62.50),
+    ('REC', 26, 102, 2, 'single_char', 55.00),
+    ('REC', 27, 104, 2, 'single_char', 55.00),
+    ('RCI', 0, 26, 5, 'exact', 100.00),
+    ('RCI', 1, 55, 5, 'exact', 100.00),
+    ('RCI', 2, 148, 5, 'exact', 100.00),
+    ('RCI', 3, 155, 5, 'exact', 100.00),
+    ('RCI', 4, 159, 5, 'exact', 100.00),
+    ('RCI', 5, 31, 4, 'permutation', 92.00),
+    ('RCI', 6, 44, 4, 'permutation', 92.00),
+    ('RCI', 7, 51, 4, 'permutation', 92.00),
+    ('RCI', 8, 61, 4, 'permutation', 92.00),
+    ('RCI', 9, 71, 4, 'permutation', 92.00),
+    ('RCI', 10, 136, 4, 'permutation', 89.00),
+    ('RCI', 11, 30, 4, 'permutation', 83.00),
+    ('RCI', 12, 36, 4, 'permutation', 83.00),
+    ('RCI', 13, 46, 4, 'permutation', 83.00),
+    ('RCI', 14, 47, 4, 'permutation', 83.00),
+    ('RCI', 15, 49, 4, 'permutation', 83.00),
+    ('RCI', 16, 24, 4, 'permutation', 80.00),
+    ('RCI', 17, 50, 4, 'permutation', 80.00),
+    ('RCI', 18, 79, 3, 'two_char', 75.00),
+    ('RCI', 19, 82, 3, 'two_char', 75.00),
+    ('RCI', 20, 83, 3, 'two_char', 75.00),
+    ('RCI', 21, 84, 3, 'two_char', 75.00),
+    ('RCI', 22, 85, 3, 'two_char', 75.00),
+    ('RCI', 23, 52, 3, 'two_char', 72.50),
+    ('RCI', 24, 62, 3, 'two_char', 72.50),
+    ('RCI', 25, 151, 3, 'two_char', 72.50),
+    ('RCI', 26, 40, 3, 'two_char', 67.50),
+    ('RCI', 27, 35, 3, 'two_char', 65.00),
+    ('RCI', 28, 37, 3, 'two_char', 65.00),
+    ('RCI', 29, 42, 3, 'two_char', 65.00),
+    ('RCI', 30, 43, 3, 'two_char', 65.00),
+    ('RCI', 31, 45, 3, 'two_char', 65.00),
+    ('RCI', 32, 32, 3, 'two_char', 62.50),
+    ('RCI', 33, 33, 3, 'two_char', 62.50),
+    ('RCI', 34, 102, 2, 'single_char', 55.00),
+    ('RCI', 35, 104, 2, 'single_char', 55.00),
+    ('RCI', 36, 17, 2, 'single_char', 45.00),
+    ('RCA', 0, 80, 5, 'exact', 100.00),
+    ('RCA', 1, 81, 5, 'exact', 100.00),
+    ('RCA', 2, 100, 4, 'permutation', 92.00),
+    ('RCA', 3, 79, 3, 'two_char', 75.00),
+    ('RCA', 4, 82, 3, 'two_char', 75.00),
+    ('RCA', 5, 83, 3, 'two_char', 75.00),
+    ('RCA', 6, 84, 3, 'two_char', 75.00),
+    ('RCA', 7, 85, 3, 'two_char', 75.00),
+    ('RCA', 8, 101, 3, 'two_char', 72.50),
+    ('RCA', 9, 103, 3, 'two_char', 72.50),
+    ('RCA', 10, 15, 3, 'two_char', 67.50),
+    ('RCA', 11, 93, 3, 'two_char', 65.00),
+    ('RCA', 12, 96, 3, 'two_char', 65.00),
+    ('RCA', 13, 102, 2, 'single_char', 55.00),
+    ('RCA', 14, 104, 2, 'single_char', 55.00),
+    ('RCS', 0, 173, 4, 'permutation', 92.00),
+    ('RCS', 1, 4, 4, 'permutation', 86.00),
+    ('RCS', 2, 79, 3, 'two_char', 75.00),
+    ('RCS', 3, 82, 3, 'two_char', 75.00),
+    ('RCS', 4, 83, 3, 'two_char', 75.00),
+    ('RCS', 5, 84, 3, 'two_char', 75.00),
+    ('RCS', 6, 85, 3, 'two_char', 75.00),
+    ('RCS', 7, 23, 3, 'two_char', 67.50),
+    ('RCS', 8, 8, 3, 'two_char', 65.00),
+    ('RCS', 9, 102, 2, 'single_char', 55.00),
+    ('RCS', 10, 104, 2, 'single_char', 55.00),
+    ('RCE', 0, 186, 5, 'exact', 100.00),
+    ('RCE', 1, 190, 5, 'exact', 100.00),
+    ('RCE', 2, 59, 4, 'permutation', 92.00),
+    ('RCE', 3, 170, 4, 'permutation', 92.00),
+    ('RCE', 4, 179, 4, 'permutation', 92.00),
+    ('RCE', 5, 161, 4, 'permutation', 89.00),
+    ('RCE', 6, 25, 4, 'permutation', 86.00),
+    ('RCE', 7, 66, 4, 'permutation', 86.00),
+    ('RCE', 8, 146, 4, 'permutation', 86.00),
+    ('RCE', 9, 128, 4, 'permutation', 83.00),
+    ('RCE', 10, 153, 4, 'permutation', 83.00),
+    ('RCE', 11, 65, 4, 'permutation', 80.00),
+    ('RCE', 12, 79, 3, 'two_char', 75.00),
+    ('RCE', 13, 82, 3, 'two_char', 75.00),
+    ('RCE', 14, 83, 3, 'two_char', 75.00),
+    ('RCE', 15, 84, 3, 'two_char', 75.00),
+    ('RCE', 16, 85, 3, 'two_char', 75.00),
+    ('RCE', 17, 143, 3, 'two_char', 72.50),
+    ('RCE', 18, 5, 3, 'two_char', 67.50),
+    ('RCE', 19, 72, 3, 'two_char', 67.50),
+    ('RCE', 20, 77, 3, 'two_char', 67.50),
+    ('RCE', 21, 27, 3, 'two_char', 62.50),
+    ('RCE', 22, 69, 3, 'two_char', 62.50),
+    ('RCE', 23, 114, 3, 'two_char', 62.50),
+    ('RCE', 24, 119, 3, 'two_char', 62.50),
+    ('RCE', 25, 125, 3, 'two_char', 62.50),
+    ('RCE', 26, 102, 2, 'single_char', 55.00),
+    ('RCE', 27, 104, 2, 'single_char', 55.00),
+    ('IRA', 0, 38, 5, 'exact', 100.00),
+    ('IRA', 1, 2, 4, 'permutation', 92.00),
+    ('IRA', 2, 3, 4, 'permutation', 92.00),
+    ('IRA', 3, 34, 4, 'permutation', 92.00),
+    ('IRA', 4, 87, 4, 'permutation', 83.00),
+    ('IRA', 5, 88, 4, 'permutation', 83.00),
+    ('IRA', 6, 35, 3, 'two_char', 75.00),
+    ('IRA', 7, 37, 3, 'two_char', 75.00),
+    ('IRA', 8, 42, 3, 'two_char', 75.00),
+    ('IRA', 9, 43, 3, 'two_char', 75.00),
+    ('IRA', 10, 45, 3, 'two_char', 75.00),
+    ('IRA', 11, 52, 3, 'two_char', 70.00),
+    ('IRA', 12, 62, 3, 'two_char', 70.00),
+    ('IRA', 13, 151, 3, 'two_char', 70.00),
+    ('IRA', 14, 101, 3, 'two_char', 67.50),
+    ('IRA', 15, 103, 3, 'two_char', 67.50),
+    ('IRA', 16, 93, 3, 'two_char', 62.50),
+    ('IRA', 17, 96, 3, 'two_char', 62.50),
+    ('IRA', 18, 17, 2, 'single_char', 55.00),
+    ('IRA', 19, 102, 2, 'single_char', 50.00),
+    ('IRA', 20, 104, 2, 'single_char', 50.00),
+    ('IRS', 0, 121, 5, 'exact', 100.00),
+    ('IRS', 1, 107, 4, 'permutation', 92.00),
+    ('IRS', 2, 112, 4, 'permutation', 92.00),
+    ('IRS', 3, 135, 4, 'permutation', 92.00),
+    ('IRS', 4, 137, 4, 'permutation', 92.00),
+    ('IRS', 5, 117, 4, 'permutation', 83.00),
+    ('IRS', 6, 175, 4, 'permutation', 83.00),
+    ('IRS', 7, 176, 4, 'permutation', 83.00),
+    ('IRS', 8, 108, 4, 'permutation', 80.00),
+    ('IRS', 9, 150, 4, 'permutation', 80.00),
+    ('IRS', 10, 35, 3, 'two_char', 75.00),
+    ('IRS', 11, 37, 3, 'two_char', 75.00),
+    ('IRS', 12, 42, 3, 'two_char', 75.00),
+    ('IRS', 13, 43, 3, 'two_char', 75.00),
+    ('IRS', 14, 45, 3, 'two_char', 75.00),
+    ('IRS', 15, 106, 3, 'two_char', 72.50),
+    ('IRS', 16, 52, 3, 'two_char', 70.00),
+    ('IRS', 17, 62, 3, 'two_char', 70.00),
+    ('IRS', 18, 151, 3, 'two_char', 70.00),
+    ('IRS', 19, 6, 3, 'two_char', 65.00),
+    ('IRS', 20, 7, 3, 'two_char', 65.00),
+    ('IRS', 21, 9, 3, 'two_char', 65.00),
+    ('IRS', 22, 10, 3, 'two_char', 65.00),
+    ('IRS', 23, 134, 3, 'two_char', 65.00),
+    ('IRS', 24, 8, 3, 'two_char', 62.50),
+    ('IRS', 25, 17, 2, 'single_char', 55.00),
+    ('IRS', 26, 102, 2, 'single_char', 50.00),
+    ('IRS', 27, 104, 2, 'single_char', 50.00),
+    ('IRE', 0, 56, 5, 'exact', 100.00),
+    ('IRE', 1, 67, 5, 'exact', 100.00),
+    ('IRE', 2, 147, 5, 'exact', 100.00),
+    ('IRE', 3, 48, 4, 'permutation', 89.00),
+    ('IRE', 4, 169, 4, 'permutation', 89.00),
+    ('IRE', 5, 171, 4, 'permutation', 89.00),
+    ('IRE', 6, 164, 4, 'permutation', 86.00),
+    ('IRE', 7, 35, 3, 'two_char', 75.00),
+    ('IRE', 8, 37, 3, 'two_char', 75.00),
+    ('IRE', 9, 42, 3, 'two_char', 75.00),
+    ('IRE', 10, 43, 3, 'two_char', 75.00),
+    ('IRE', 11, 45, 3, 'two_char', 75.00),
+    ('IRE', 12, 52, 3, 'two_char', 70.00),
+    ('IRE', 13, 62, 3, 'two_char', 70.00),
+    ('IRE', 14, 151, 3, 'two_char', 70.00),
+    ('IRE', 15, 143, 3, 'two_char', 67.50),
+    ('IRE', 16, 17, 2, 'single_char', 55.00),
+    ('IRE', 17, 102, 2, 'single_char', 50.00),
+    ('IRE', 18, 104, 2, 'single_char', 50.00),
+    ('IRC', 0, 30, 5, 'exact', 100.00),
+    ('IRC', 1, 36, 5, 'exact', 100.00),
+    ('IRC', 2, 46, 5, 'exact', 100.00),
+    ('IRC', 3, 47, 5, 'exact', 100.00),
+    ('IRC', 4, 49, 5, 'exact', 100.00),
+    ('IRC', 5, 24, 4, 'permutation', 92.00),
+    ('IRC', 6, 50, 4, 'permutation', 92.00),
+    ('IRC', 7, 31, 4, 'permutation', 89.00),
+    ('IRC', 8, 44, 4, 'permutation', 89.00),
+    ('IRC', 9, 51, 4, 'permutation', 89.00),
+    ('IRC', 10, 61, 4, 'permutation', 89.00),
+    ('IRC', 11, 71, 4, 'permutation', 89.00),
+    ('IRC', 12, 26, 4, 'permutation', 86.00),
+    ('IRC', 13, 55, 4, 'permutation', 86.00),
+    ('IRC', 14, 148, 4, 'permutation', 86.00),
+    ('IRC', 15, 155, 4, 'permutation', 86.00),
+    ('IRC', 16, 159, 4, 'permutation', 86.00),
+    ('IRC', 17, 136, 4, 'permutation', 80.00),
+    ('IRC', 18, 35, 3, 'two_char', 75.00),
+    ('IRC', 19, 37, 3, 'two_char', 75.00),
+    ('IRC', 20, 42, 3, 'two_char', 75.00),
+    ('IRC', 21, 43, 3, 'two_char', 75.00),
+    ('IRC', 22, 45, 3, 'two_char', 75.00),
+    ('IRC', 23, 32, 3, 'two_char', 72.50),
+    ('IRC', 24, 33, 3, 'two_char', 72.50),
+    ('IRC', 25, 52, 3, 'two_char', 70.00),
+    ('IRC', 26, 62, 3, 'two_char', 70.00),
+    ('IRC', 27, 151, 3, 'two_char', 70.00),
+    ('IRC', 28, 79, 3, 'two_char', 67.50),
+    ('IRC', 29, 82, 3, 'two_char', 67.50),
+    ('IRC', 30, 83, 3, 'two_char', 67.50),
+    ('IRC', 31, 84, 3, 'two_char', 67.50),
+    ('IRC', 32, 85, 3, 'two_char', 67.50),
+    ('IRC', 33, 40, 3, 'two_char', 65.00),
+    ('IRC', 34, 17, 2, 'single_char', 55.00),
+    ('IRC', 35, 102, 2, 'single_char', 50.00),
+    ('IRC', 36, 104, 2, 'single_char', 50.00),
+    ('IAR', 0, 2, 5, 'exact', 100.00),
+    ('IAR', 1, 3, 5, 'exact', 100.00),
+    ('IAR', 2, 34, 5, 'exact', 100.00);
+
+INSERT INTO job_suggestion_cache (
+    holland_code, sort_order, job_id, star_rating, match_type, match_score
+) VALUES
+    ('IAR', 3, 38, 4, 'permutation', 92.00),
+    ('IAR', 4, 87, 4, 'permutation', 89.00),
+    ('IAR', 5, 88, 4, 'permutation', 89.00),
+    ('IAR', 6, 35, 3, 'two_char', 72.50),
+    ('IAR', 7, 37, 3, 'two_char', 72.50),
+    ('IAR', 8, 42, 3, 'two_char', 72.50),
+    ('IAR', 9, 43, 3, 'two_char', 72.50),
+    ('IAR', 10, 45, 3, 'two_char', 72.50),
+    ('IAR', 11, 93, 3, 'two_char', 67.50),
+    ('IAR', 12, 96, 3, 'two_char', 67.50),
+    ('IAR', 13, 52, 3, 'two_char', 65.00),
+    ('IAR', 14, 62, 3, 'two_char', 65.00),
+    ('IAR', 15, 151, 3, 'two_char', 65.00),
+    ('IAR', 16, 101, 3, 'two_char', 62.50),
+    ('IAR', 17, 103, 3, 'two_char', 62.50),
+    ('IAR', 18, 17, 2, 'single_char', 55.00),
+    ('IAR', 19, 102, 2, 'single_char', 45.00),
+    ('IAR', 20, 104, 2, 'single_char', 45.00),
+    ('IAS', 0, 16, 5, 'exact', 100.00),
+    ('IAS', 1, 133, 4, 'permutation', 92.00),
+    ('IAS', 2, 18, 4, 'permutation', 89.00),
+    ('IAS', 3, 132, 4, 'permutation', 83.00),
+    ('IAS', 4, 11, 4, 'permutation', 80.00),
+    ('IAS', 5, 106, 3, 'two_char', 72.50),
+    ('IAS', 6, 21, 3, 'two_char', 67.50),
+    ('IAS', 7, 6, 3, 'two_char', 65.00),
+    ('IAS', 8, 7, 3, 'two_char', 65.00),
+    ('IAS', 9, 9, 3, 'two_char', 65.00),
+    ('IAS', 10, 10, 3, 'two_char', 65.00),
+    ('IAS', 11, 134, 3, 'two_char', 65.00),
+    ('IAS', 12, 122, 3, 'two_char', 62.50),
+    ('IAS', 13, 124, 3, 'two_char', 62.50),
+    ('IAS', 14, 17, 2, 'single_char', 55.00),
+    ('IAE', 0, 113, 4, 'permutation', 92.00),
+    ('IAE', 1, 1, 4, 'permutation', 86.00),
+    ('IAE', 2, 19, 4, 'permutation', 86.00),
+    ('IAE', 3, 13, 4, 'permutation', 83.00),
+    ('IAE', 4, 94, 3, 'two_char', 67.50),
+    ('IAE', 5, 17, 2, 'single_char', 55.00),
+    ('IAC', 0, 39, 4, 'permutation', 92.00),
+    ('IAC', 1, 20, 4, 'permutation', 89.00),
+    ('IAC', 2, 32, 3, 'two_char', 72.50),
+    ('IAC', 3, 33, 3, 'two_char', 72.50),
+    ('IAC', 4, 40, 3, 'two_char', 65.00),
+    ('IAC', 5, 15, 3, 'two_char', 62.50),
+    ('IAC', 6, 17, 2, 'single_char', 55.00),
+    ('ISR', 0, 107, 5, 'exact', 100.00),
+    ('ISR', 1, 112, 5, 'exact', 100.00),
+    ('ISR', 2, 135, 5, 'exact', 100.00),
+    ('ISR', 3, 137, 5, 'exact', 100.00),
+    ('ISR', 4, 121, 4, 'permutation', 92.00),
+    ('ISR', 5, 117, 4, 'permutation', 89.00),
+    ('ISR', 6, 175, 4, 'permutation', 89.00),
+    ('ISR', 7, 176, 4, 'permutation', 89.00),
+    ('ISR', 8, 108, 4, 'permutation', 86.00),
+    ('ISR', 9, 150, 4, 'permutation', 86.00),
+    ('ISR', 10, 106, 3, 'two_char', 75.00),
+    ('ISR', 11, 35, 3, 'two_char', 72.50),
+    ('ISR', 12, 37, 3, 'two_char', 72.50),
+    ('ISR', 13, 42, 3, 'two_char', 72.50),
+    ('ISR', 14, 43, 3, 'two_char', 72.50),
+    ('ISR', 15, 45, 3, 'two_char', 72.50),
+    ('ISR', 16, 6, 3, 'two_char', 70.00),
+    ('ISR', 17, 7, 3, 'two_char', 70.00),
+    ('ISR', 18, 9, 3, 'two_char', 70.00),
+    ('ISR', 19, 10, 3, 'two_char', 70.00),
+    ('ISR', 20, 134, 3, 'two_char', 70.00),
+    ('ISR', 21, 8, 3, 'two_char', 67.50),
+    ('ISR', 22, 52, 3, 'two_char', 65.00),
+    ('ISR', 23, 62, 3, 'two_char', 65.00),
+    ('ISR', 24, 151, 3, 'two_char', 65.00),
+    ('ISR', 25, 17, 2, 'single_char', 55.00),
+    ('ISR', 26, 102, 2, 'single_char', 45.00),
+    ('ISR', 27, 104, 2, 'single_char', 45.00),
+    ('ISA', 0, 133, 5, 'exact', 100.00),
+    ('ISA', 1, 16, 4, 'permutation', 92.00),
+    ('ISA', 2, 132, 4, 'permutation', 89.00),
+    ('ISA', 3, 11, 4, 'permutation', 86.00),
+    ('ISA', 4, 18, 4, 'permutation', 83.00),
+    ('ISA', 5, 106, 3, 'two_char', 75.00),
+    ('ISA', 6, 6, 3, 'two_char', 70.00),
+    ('ISA', 7, 7, 3, 'two_char', 70.00),
+    ('ISA', 8, 9, 3, 'two_char', 70.00),
+    ('ISA', 9, 10, 3, 'two_char', 70.00),
+    ('ISA', 10, 134, 3, 'two_char', 70.00),
+    ('ISA', 11, 122, 3, 'two_char', 67.50),
+    ('ISA', 12, 124, 3, 'two_char', 67.50),
+    ('ISA', 13, 21, 3, 'two_char', 62.50),
+    ('ISA', 14, 17, 2, 'single_char', 55.00),
+    ('ISE', 0, 106, 3, 'two_char', 75.00),
+    ('ISE', 1, 6, 3, 'two_char', 70.00),
+    ('ISE', 2, 7, 3, 'two_char', 70.00),
+    ('ISE', 3, 9, 3, 'two_char', 70.00),
+    ('ISE', 4, 10, 3, 'two_char', 70.00),
+    ('ISE', 5, 134, 3, 'two_char', 70.00),
+    ('ISE', 6, 28, 3, 'two_char', 67.50),
+    ('ISE', 7, 139, 3, 'two_char', 67.50),
+    ('ISE', 8, 17, 2, 'single_char', 55.00),
+    ('ISC', 0, 110, 5, 'exact', 100.00),
+    ('ISC', 1, 63, 4, 'permutation', 92.00),
+    ('ISC', 2, 73, 4, 'permutation', 89.00),
+    ('ISC', 3, 120, 4, 'permutation', 89.00),
+    ('ISC', 4, 106, 3, 'two_char', 75.00),
+    ('ISC', 5, 32, 3, 'two_char', 72.50),
+    ('ISC', 6, 33, 3, 'two_char', 72.50),
+    ('ISC', 7, 6, 3, 'two_char', 70.00),
+    ('ISC', 8, 7, 3, 'two_char', 70.00),
+    ('ISC', 9, 9, 3, 'two_char', 70.00),
+    ('ISC', 10, 10, 3, 'two_char', 70.00),
+    ('ISC', 11, 134, 3, 'two_char', 70.00),
+    ('ISC', 12, 40, 3, 'two_char', 65.00),
+    ('ISC', 13, 23, 3, 'two_char', 62.50),
+    ('ISC', 14, 17, 2, 'single_char', 55.00),
+    ('IER', 0, 56, 4, 'permutation', 92.00),
+    ('IER', 1, 67, 4, 'permutation', 92.00),
+    ('IER', 2, 147, 4, 'permutation', 92.00),
+    ('IER', 3, 48, 4, 'permutation', 83.00),
+    ('IER', 4, 169, 4, 'permutation', 83.00),
+    ('IER', 5, 171, 4, 'permutation', 83.00),
+    ('IER', 6, 164, 4, 'permutation', 80.00),
+    ('IER', 7, 35, 3, 'two_char', 72.50),
+    ('IER', 8, 37, 3, 'two_char', 72.50),
+    ('IER', 9, 42, 3, 'two_char', 72.50),
+    ('IER', 10, 43, 3, 'two_char', 72.50),
+    ('IER', 11, 45, 3, 'two_char', 72.50),
+    ('IER', 12, 52, 3, 'two_char', 65.00),
+    ('IER', 13, 62, 3, 'two_char', 65.00),
+    ('IER', 14, 151, 3, 'two_char', 65.00),
+    ('IER', 15, 143, 3, 'two_char', 62.50),
+    ('IER', 16, 17, 2, 'single_char', 55.00),
+    ('IER', 17, 102, 2, 'single_char', 45.00),
+    ('IER', 18, 104, 2, 'single_char', 45.00),
+    ('IEA', 0, 113, 5, 'exact', 100.00),
+    ('IEA', 1, 13, 4, 'permutation', 89.00),
+    ('IEA', 2, 1, 4, 'permutation', 80.00),
+    ('IEA', 3, 19, 4, 'permutation', 80.00),
+    ('IEA', 4, 94, 3, 'two_char', 62.50),
+    ('IEA', 5, 17, 2, 'single_char', 55.00),
+    ('IES', 0, 106, 3, 'two_char', 72.50),
+    ('IES', 1, 6, 3, 'two_char', 65.00),
+    ('IES', 2, 7, 3, 'two_char', 65.00),
+    ('IES', 3, 9, 3, 'two_char', 65.00),
+    ('IES', 4, 10, 3, 'two_char', 65.00),
+    ('IES', 5, 134, 3, 'two_char', 65.00),
+    ('IES', 6, 28, 3, 'two_char', 62.50),
+    ('IES', 7, 139, 3, 'two_char', 62.50),
+    ('IES', 8, 17, 2, 'single_char', 55.00),
+    ('IEC', 0, 68, 4, 'permutation', 92.00),
+    ('IEC', 1, 75, 4, 'permutation', 86.00),
+    ('IEC', 2, 41, 4, 'permutation', 80.00),
+    ('IEC', 3, 64, 4, 'permutation', 80.00),
+    ('IEC', 4, 32, 3, 'two_char', 72.50),
+    ('IEC', 5, 33, 3, 'two_char', 72.50),
+    ('IEC', 6, 27, 3, 'two_char', 67.50),
+    ('IEC', 7, 69, 3, 'two_char', 67.50),
+    ('IEC', 8, 114, 3, 'two_char', 67.50),
+    ('IEC', 9, 119, 3, 'two_char', 67.50),
+    ('IEC', 10, 125, 3, 'two_char', 67.50),
+    ('IEC', 11, 40, 3, 'two_char', 65.00),
+    ('IEC', 12, 5, 3, 'two_char', 62.50),
+    ('IEC', 13, 72, 3, 'two_char', 62.50),
+    ('IEC', 14, 77, 3, 'two_char', 62.50),
+    ('IEC', 15, 17, 2, 'single_char', 55.00),
+    ('ICR', 0, 24, 5, 'exact', 100.00),
+    ('ICR', 1, 50, 5, 'exact', 100.00),
+    ('ICR', 2, 30, 4, 'permutation', 92.00),
+    ('ICR', 3, 36, 4, 'permutation', 92.00),
+    ('ICR', 4, 46, 4, 'permutation', 92.00),
+    ('ICR', 5, 47, 4, 'permutation', 92.00),
+    ('ICR', 6, 49, 4, 'permutation', 92.00),
+    ('ICR', 7, 136, 4, 'permutation', 86.00),
+    ('ICR', 8, 31, 4, 'permutation', 83.00),
+    ('ICR', 9, 44, 4, 'permutation', 83.00),
+    ('ICR', 10, 51, 4, 'permutation', 83.00),
+    ('ICR', 11, 61, 4, 'permutation', 83.00),
+    ('ICR', 12, 71, 4, 'permutation', 83.00),
+    ('ICR', 13, 26, 4, 'permutation', 80.00),
+    ('ICR', 14, 55, 4, 'permutation', 80.00),
+    ('ICR', 15, 148, 4, 'permutation', 80.00),
+    ('ICR', 16, 155, 4, 'permutation', 80.00),
+    ('ICR', 17, 32, 3, 'two_char', 75.00),
+    ('ICR', 18, 33, 3, 'two_char', 75.00),
+    ('ICR', 19, 35, 3, 'two_char', 72.50),
+    ('ICR', 20, 37, 3, 'two_char', 72.50),
+    ('ICR', 21, 42, 3, 'two_char', 72.50),
+    ('ICR', 22, 43, 3, 'two_char', 72.50),
+    ('ICR', 23, 45, 3, 'two_char', 72.50),
+    ('ICR', 24, 40, 3, 'two_char', 70.00),
+    ('ICR', 25, 52, 3, 'two_char', 65.00),
+    ('ICR', 26, 62, 3, 'two_char', 65.00),
+    ('ICR', 27, 151, 3, 'two_char', 65.00),
+    ('ICR', 28, 79, 3, 'two_char', 62.50),
+    ('ICR', 29, 82, 3, 'two_char', 62.50),
+    ('ICR', 30, 83, 3, 'two_char', 62.50),
+    ('ICR', 31, 84, 3, 'two_char', 62.50),
+    ('ICR', 32, 85, 3, 'two_char', 62.50),
+    ('ICR', 33, 17, 2, 'single_char', 55.00),
+    ('ICR', 34, 102, 2, 'single_char', 45.00),
+    ('ICR', 35, 104, 2, 'single_char', 45.00),
+    ('ICA', 0, 39, 5, 'exact', 100.00),
+    ('ICA', 1, 20, 4, 'permutation', 83.00),
+    ('ICA', 2, 32, 3, 'two_char', 75.00),
+    ('ICA', 3, 33, 3, 'two_char', 75.00),
+    ('ICA', 4, 40, 3, 'two_char', 70.00),
+    ('ICA', 5, 15, 3, 'two_char', 67.50),
+    ('ICA', 6, 17, 2, 'single_char', 55.00),
+    ('ICS', 0, 63, 5, 'exact', 100.00),
+    ('ICS', 1, 110, 4, 'permutation', 92.00),
+    ('ICS', 2, 73, 4, 'permutation', 83.00),
+    ('ICS', 3, 120, 4, 'permutation', 83.00),
+    ('ICS', 4, 32, 3, 'two_char', 75.00),
+    ('ICS', 5, 33, 3, 'two_char', 75.00),
+    ('ICS', 6, 106, 3, 'two_char', 72.50),
+    ('ICS', 7, 40, 3, 'two_char', 70.00),
+    ('ICS', 8, 23, 3, 'two_char', 67.50),
+    ('ICS', 9, 6, 3, 'two_char', 65.00),
+    ('ICS', 10, 7, 3, 'two_char', 65.00),
+    ('ICS', 11, 9, 3, 'two_char', 65.00),
+    ('ICS', 12, 10, 3, 'two_char', 65.00),
+    ('ICS', 13, 134, 3, 'two_char', 65.00),
+    ('ICS', 14, 17, 2, 'single_char', 55.00),
+    ('ICE', 0, 68, 5, 'exact', 100.00),
+    ('ICE', 1, 41, 4, 'permutation', 86.00),
+    ('ICE', 2, 64, 4, 'permutation', 86.00),
+    ('ICE', 3, 75, 4, 'permutation', 80.00),
+    ('ICE', 4, 32, 3, 'two_char', 75.00),
+    ('ICE', 5, 33, 3, 'two_char', 75.00),
+    ('ICE', 6, 40, 3, 'two_char', 70.00),
+    ('ICE', 7, 5, 3, 'two_char', 67.50),
+    ('ICE', 8, 72, 3, 'two_char', 67.50),
+    ('ICE', 9, 77, 3, 'two_char', 67.50),
+    ('ICE', 10, 27, 3, 'two_char', 62.50),
+    ('ICE', 11, 69, 3, 'two_char', 62.50),
+    ('ICE', 12, 114, 3, 'two_char', 62.50),
+    ('ICE', 13, 119, 3, 'two_char', 62.50),
+    ('ICE', 14, 125, 3, 'two_char', 62.50),
+    ('ICE', 15, 17, 2, 'single_char', 55.00),
+    ('ARI', 0, 87, 4, 'permutation', 92.00),
+    ('ARI', 1, 88, 4, 'permutation', 92.00),
+    ('ARI', 2, 2, 4, 'permutation', 83.00),
+    ('ARI', 3, 3, 4, 'permutation', 83.00),
+    ('ARI', 4, 34, 4, 'permutation', 83.00),
+    ('ARI', 5, 38, 4, 'permutation', 80.00),
+    ('ARI', 6, 93, 3, 'two_char', 75.00),
+    ('ARI', 7, 96, 3, 'two_char', 75.00),
+    ('ARI', 8, 101, 3, 'two_char', 70.00),
+    ('ARI', 9, 103, 3, 'two_char', 70.00),
+    ('ARI', 10, 52, 3, 'two_char', 67.50),
+    ('ARI', 11, 62, 3, 'two_char', 67.50),
+    ('ARI', 12, 151, 3, 'two_char', 67.50),
+    ('ARI', 13, 35, 3, 'two_char', 62.50),
+    ('ARI', 14, 37, 3, 'two_char', 62.50),
+    ('ARI', 15, 42, 3, 'two_char', 62.50),
+    ('ARI', 16, 43, 3, 'two_char', 62.50),
+    ('ARI', 17, 45, 3, 'two_char', 62.50),
+    ('ARI', 18, 102, 2, 'single_char', 50.00),
+    ('ARI', 19, 104, 2, 'single_char', 50.00),
+    ('ARI', 20, 17, 2, 'single_char', 45.00),
+    ('ARS', 0, 78, 4, 'permutation', 92.00),
+    ('ARS', 1, 93, 3, 'two_char', 75.00),
+    ('ARS', 2, 96, 3, 'two_char', 75.00),
+    ('ARS', 3, 21, 3, 'two_char', 72.50),
+    ('ARS', 4, 101, 3, 'two_char', 70.00),
+    ('ARS', 5, 103, 3, 'two_char', 70.00),
+    ('ARS', 6, 122, 3, 'two_char', 65.00),
+    ('ARS', 7, 124, 3, 'two_char', 65.00),
+    ('ARS', 8, 8, 3, 'two_char', 62.50),
+    ('ARS', 9, 102, 2, 'single_char', 50.00),
+    ('ARS', 10, 104, 2, 'single_char', 50.00),
+    ('ARE', 0, 74, 5, 'exact', 100.00),
+    ('ARE', 1, 92, 5, 'exact', 100.00),
+    ('ARE', 2, 95, 5, 'exact', 100.00),
+    ('ARE', 3, 97, 5, 'exact', 100.00),
+    ('ARE', 4, 89, 4, 'permutation', 92.00),
+    ('ARE', 5, 90, 4, 'permutation', 92.00),
+    ('ARE', 6, 142, 4, 'permutation', 80.00),
+    ('ARE', 7, 93, 3, 'two_char', 75.00),
+    ('ARE', 8, 96, 3, 'two_char', 75.00),
+    ('ARE', 9, 94, 3, 'two_char', 72.50),
+    ('ARE', 10, 101, 3, 'two_char', 70.00),
+    ('ARE', 11, 103, 3, 'two_char', 70.00),
+    ('ARE', 12, 143, 3, 'two_char', 67.50),
+    ('ARE', 13, 102, 2, 'single_char', 50.00),
+    ('ARE', 14, 104, 2, 'single_char', 50.00),
+    ('ARC', 0, 100, 4, 'permutation', 89.00),
+    ('ARC', 1, 80, 4, 'permutation', 86.00),
+    ('ARC', 2, 81, 4, 'permutation', 86.00),
+    ('ARC', 3, 93, 3, 'two_char', 75.00),
+    ('ARC', 4, 96, 3, 'two_char', 75.00),
+    ('ARC', 5, 101, 3, 'two_char', 70.00),
+    ('ARC', 6, 103, 3, 'two_char', 70.00),
+    ('ARC', 7, 79, 3, 'two_char', 67.50),
+    ('ARC', 8, 82, 3, 'two_char', 67.50),
+    ('ARC', 9, 83, 3, 'two_char', 67.50),
+    ('ARC', 10, 84, 3, 'two_char', 67.50),
+    ('ARC', 11, 85, 3, 'two_char', 67.50),
+    ('ARC', 12, 15, 3, 'two_char', 65.00),
+    ('ARC', 13, 102, 2, 'single_char', 50.00),
+    ('ARC', 14, 104, 2, 'single_char', 50.00),
+    ('AIR', 0, 87, 5, 'exact', 100.00),
+    ('AIR', 1, 88, 5, 'exact', 100.00),
+    ('AIR', 2, 2, 4, 'permutation', 89.00),
+    ('AIR', 3, 3, 4, 'permutation', 89.00),
+    ('AIR', 4, 34, 4, 'permutation', 89.00),
+    ('AIR', 5, 38, 4, 'permutation', 86.00),
+    ('AIR', 6, 93, 3, 'two_char', 72.50),
+    ('AIR', 7, 96, 3, 'two_char', 72.50),
+    ('AIR', 8, 35, 3, 'two_char', 67.50),
+    ('AIR', 9, 37, 3, 'two_char', 67.50),
+    ('AIR', 10, 42, 3, 'two_char', 67.50),
+    ('AIR', 11, 43, 3, 'two_char', 67.50),
+    ('AIR', 12, 45, 3, 'two_char', 67.50),
+    ('AIR', 13, 101, 3, 'two_char', 65.00),
+    ('AIR', 14, 103, 3, 'two_char', 65.00),
+    ('AIR', 15, 52, 3, 'two_char', 62.50),
+    ('AIR', 16, 62, 3, 'two_char', 62.50),
+    ('AIR', 17, 151, 3, 'two_char', 62.50),
+    ('AIR', 18, 17, 2, 'single_char', 50.00),
+    ('AIR', 19, 102, 2, 'single_char', 45.00),
+    ('AIR', 20, 104, 2, 'single_char', 45.00),
+    ('AIS', 0, 18, 5, 'exact', 100.00),
+    ('AIS', 1, 16, 4, 'permutation', 89.00),
+    ('AIS', 2, 133, 4, 'permutation', 86.00),
+    ('AIS', 3, 11, 4, 'permutation', 83.00),
+    ('AIS', 4, 132, 4, 'permutation', 80.00),
+    ('AIS', 5, 21, 3, 'two_char', 72.50),
+    ('AIS', 6, 106, 3, 'two_char', 67.50),
+    ('AIS', 7, 122, 3, 'two_char', 65.00),
+    ('AIS', 8, 124, 3, 'two_char', 65.00),
+    ('AIS', 9, 6, 3, 'two_char', 62.50),
+    ('AIS', 10, 7, 3, 'two_char', 62.50),
+    ('AIS', 11, 9, 3, 'two_char', 62.50),
+    ('AIS', 12, 10, 3, 'two_char', 62.50),
+    ('AIS', 13, 134, 3, 'two_char', 62.50),
+    ('AIS', 14, 17, 2, 'single_char', 50.00),
+    ('AIE', 0, 1, 4, 'permutation', 92.00),
+    ('AIE', 1, 19, 4, 'permutation', 92.00),
+    ('AIE', 2, 113, 4, 'permutation', 86.00),
+    ('AIE', 3, 13, 4, 'permutation', 80.00),
+    ('AIE', 4, 94, 3, 'two_char', 72.50),
+    ('AIE', 5, 17, 2, 'single_char', 50.00),
+    ('AIC', 0, 20, 5, 'exact', 100.00),
+    ('AIC', 1, 39, 4, 'permutation', 86.00),
+    ('AIC', 2, 32, 3, 'two_char', 67.50),
+    ('AIC', 3, 33, 3, 'two_char', 67.50),
+    ('AIC', 4, 15, 3, 'two_char', 65.00),
+    ('AIC', 5, 40, 3, 'two_char', 62.50),
+    ('AIC', 6, 17, 2, 'single_char', 50.00),
+    ('ASR', 0, 78, 5, 'exact', 100.00),
+    ('ASR', 1, 21, 3, 'two_char', 75.00),
+    ('ASR', 2, 93, 3, 'two_char', 72.50),
+    ('ASR', 3, 96, 3, 'two_char', 72.50),
+    ('ASR', 4, 122, 3, 'two_char', 70.00),
+    ('ASR', 5, 124, 3, 'two_char', 70.00),
+    ('ASR', 6, 8, 3, 'two_char', 67.50),
+    ('ASR', 7, 101, 3, 'two_char', 65.00),
+    ('ASR', 8, 103, 3, 'two_char', 65.00),
+    ('ASR', 9, 102, 2, 'single_char', 45.00),
+    ('ASR', 10, 104, 2, 'single_char', 45.00),
+    ('ASI', 0, 18, 4, 'permutation', 92.00),
+    ('ASI', 1, 11, 4, 'permutation', 89.00),
+    ('ASI', 2, 132, 4, 'permutation', 86.00),
+    ('ASI', 3, 16, 4, 'permutation', 83.00),
+    ('ASI', 4, 133, 4, 'permutation', 80.00),
+    ('ASI', 5, 21, 3, 'two_char', 75.00),
+    ('ASI', 6, 122, 3, 'two_char', 70.00),
+    ('ASI', 7, 124, 3, 'two_char', 70.00),
+    ('ASI', 8, 6, 3, 'two_char', 67.50),
+    ('ASI', 9, 7, 3, 'two_char', 67.50),
+    ('ASI', 10, 9, 3, 'two_char', 67.50),
+    ('ASI', 11, 10, 3, 'two_char', 67.50),
+    ('ASI', 12, 134, 3, 'two_char', 67.50),
+    ('ASI', 13, 106, 3, 'two_char', 62.50),
+    ('ASI', 14, 17, 2, 'single_char', 45.00),
+    ('ASE', 0, 154, 5, 'exact', 100.00),
+    ('ASE', 1, 86, 4, 'permutation', 92.00),
+    ('ASE', 2, 12, 4, 'permutation', 83.00),
+    ('ASE', 3, 22, 4, 'permutation', 83.00),
+    ('ASE', 4, 98, 4, 'permutation', 83.00),
+    ('ASE', 5, 21, 3, 'two_char', 75.00),
+    ('ASE', 6, 94, 3, 'two_char', 72.50),
+    ('ASE', 7, 122, 3, 'two_char', 70.00),
+    ('ASE', 8, 124, 3, 'two_char', 70.00),
+    ('ASE', 9, 28, 3, 'two_char', 67.50),
+    ('ASE', 10, 139, 3, 'two_char', 67.50),
+    ('ASC', 0, 123, 4, 'permutation', 89.00),
+    ('ASC', 1, 21, 3, 'two_char', 75.00),
+    ('ASC', 2, 122, 3, 'two_char', 70.00),
+    ('ASC', 3, 124, 3, 'two_char', 70.00),
+    ('ASC', 4, 15, 3, 'two_char', 65.00),
+    ('ASC', 5, 23, 3, 'two_char', 62.50),
+    ('AER', 0, 89, 5, 'exact', 100.00),
+    ('AER', 1, 90, 5, 'exact', 100.00),
+    ('AER', 2, 74, 4, 'permutation', 92.00),
+    ('AER', 3, 92, 4, 'permutation', 92.00),
+    ('AER', 4, 95, 4, 'permutation', 92.00),
+    ('AER', 5, 97, 4, 'permutation', 92.00),
+    ('AER', 6, 142, 4, 'permutation', 86.00),
+    ('AER', 7, 94, 3, 'two_char', 75.00),
+    ('AER', 8, 93, 3, 'two_char', 72.50),
+    ('AER', 9, 96, 3, 'two_char', 72.50),
+    ('AER', 10, 101, 3, 'two_char', 65.00),
+    ('AER', 11, 103, 3, 'two_char', 65.00),
+    ('AER', 12, 143, 3, 'two_char', 62.50),
+    ('AER', 13, 102, 2, 'single_char', 45.00),
+    ('AER', 14, 104, 2, 'single_char', 45.00),
+    ('AEI', 0, 1, 5, 'exact', 100.00),
+    ('AEI', 1, 19, 5, 'exact', 100.00),
+    ('AEI', 2, 13, 4, 'permutation', 86.00),
+    ('AEI', 3, 113, 4, 'permutation', 80.00),
+    ('AEI', 4, 94, 3, 'two_char', 75.00),
+    ('AEI', 5, 17, 2, 'single_char', 45.00),
+    ('AES', 0, 86, 5, 'exact', 100.00),
+    ('AES', 1, 154, 4, 'permutation', 92.00),
+    ('AES', 2, 12, 4, 'permutation', 89.00),
+    ('AES', 3, 22, 4, 'permutation', 89.00),
+    ('AES', 4, 98, 4, 'permutation', 89.00),
+    ('AES', 5, 94, 3, 'two_char', 75.00),
+    ('AES', 6, 21, 3, 'two_char', 72.50),
+    ('AES', 7, 122, 3, 'two_char', 65.00),
+    ('AES', 8, 124, 3, 'two_char', 65.00),
+    ('AES', 9, 28, 3, 'two_char', 62.50),
+    ('AES', 10, 139, 3, 'two_char', 62.50),
+    ('AEC', 0, 94, 3, 'two_char', 75.00),
+    ('AEC', 1, 27, 3, 'two_char', 67.50),
+    ('AEC', 2, 69, 3, 'two_char', 67.50),
+    ('AEC', 3, 114, 3, 'two_char', 67.50),
+    ('AEC', 4, 119, 3, 'two_char', 67.50),
+    ('AEC', 5, 125, 3, 'two_char', 67.50),
+    ('AEC', 6, 15, 3, 'two_char', 65.00),
+    ('AEC', 7, 5, 3, 'two_char', 62.50),
+    ('AEC', 8, 72, 3, 'two_char', 62.50),
+    ('AEC', 9, 77, 3, 'two_char', 62.50),
+    ('ACR', 0, 100, 4, 'permutation', 83.00),
+    ('ACR', 1, 80, 4, 'permutation', 80.00),
+    ('ACR', 2, 81, 4, 'permutation', 80.00),
+    ('ACR', 3, 93, 3, 'two_char', 72.50),
+    ('ACR', 4, 96, 3, 'two_char', 72.50),
+    ('ACR', 5, 15, 3, 'two_char', 70.00),
+    ('ACR', 6, 101, 3, 'two_char', 65.00),
+    ('ACR', 7, 103, 3, 'two_char', 65.00),
+    ('ACR', 8, 79, 3, 'two_char', 62.50),
+    ('ACR', 9, 82, 3, 'two_char', 62.50),
+    ('ACR', 10, 83, 3, 'two_char', 62.50),
+    ('ACR', 11, 84, 3, 'two_char', 62.50),
+    ('ACR', 12, 85, 3, 'two_char', 62.50),
+    ('ACR', 13, 102, 2, 'single_char', 45.00),
+    ('ACR', 14, 104, 2, 'single_char', 45.00),
+    ('ACI', 0, 20, 4, 'permutation', 92.00),
+    ('ACI', 1, 39, 4, 'permutation', 80.00),
+    ('ACI', 2, 15, 3, 'two_char', 70.00),
+    ('ACI', 3, 40, 3, 'two_char', 67.50),
+    ('ACI', 4, 32, 3, 'two_char', 62.50),
+    ('ACI', 5, 33, 3, 'two_char', 62.50),
+    ('ACI', 6, 17, 2, 'single_char', 45.00),
+    ('ACS', 0, 123, 4, 'permutation', 83.00),
+    ('ACS', 1, 21, 3, 'two_char', 72.50),
+    ('ACS', 2, 15, 3, 'two_char', 70.00),
+    ('ACS', 3, 23, 3, 'two_char', 67.50),
+    ('ACS', 4, 122, 3, 'two_char', 65.00),
+    ('ACS', 5, 124, 3, 'two_char', 65.00),
+    ('ACE', 0, 94, 3, 'two_char', 72.50),
+    ('ACE', 1, 15, 3, 'two_char', 70.00),
+    ('ACE', 2, 5, 3, 'two_char', 67.50),
+    ('ACE', 3, 72, 3, 'two_char', 67.50),
+    ('ACE', 4, 77, 3, 'two_char', 67.50),
+    ('ACE', 5, 27, 3, 'two_char', 62.50),
+    ('ACE', 6, 69, 3, 'two_char', 62.50),
+    ('ACE', 7, 114, 3, 'two_char', 62.50),
+    ('ACE', 8, 119, 3, 'two_char', 62.50),
+    ('ACE', 9, 125, 3, 'two_char', 62.50),
+    ('SRI', 0, 108, 5, 'exact', 100.00),
+    ('SRI', 1, 150, 5, 'exact', 100.00),
+    ('SRI', 2, 117, 4, 'permutation', 92.00),
+    ('SRI', 3, 175, 4, 'permutation', 92.00),
+    ('SRI', 4, 176, 4, 'permutation', 92.00),
+    ('SRI', 5, 107, 4, 'permutation', 83.00),
+    ('SRI', 6, 112, 4, 'permutation', 83.00),
+    ('SRI', 7, 135, 4, 'permutation', 83.00),
+    ('SRI', 8, 137, 4, 'permutation', 83.00),
+    ('SRI', 9, 121, 4, 'permutation', 80.00),
+    ('SRI', 10, 8, 3, 'two_char', 75.00),
+    ('SRI', 11, 6, 3, 'two_char', 72.50),
+    ('SRI', 12, 7, 3, 'two_char', 72.50),
+    ('SRI', 13, 9, 3, 'two_char', 72.50),
+    ('SRI', 14, 10, 3, 'two_char', 72.50),
+    ('SRI', 15, 134, 3, 'two_char', 72.50),
+    ('SRI', 16, 52, 3, 'two_char', 67.50),
+    ('SRI', 17, 62, 3, 'two_char', 67.50),
+    ('SRI', 18, 151, 3, 'two_char', 67.50),
+    ('SRI', 19, 106, 3, 'two_char', 65.00),
+    ('SRI', 20, 35, 3, 'two_char', 62.50),
+    ('SRI', 21, 37, 3, 'two_char', 62.50),
+    ('SRI', 22, 42, 3, 'two_char', 62.50),
+    ('SRI', 23, 43, 3, 'two_char', 62.50),
+    ('SRI', 24, 45, 3, 'two_char', 62.50),
+    ('SRI', 25, 102, 2, 'single_char', 50.00),
+    ('SRI', 26, 104, 2, 'single_char', 50.00),
+    ('SRI', 27, 17, 2, 'single_char', 45.00),
+    ('SRA', 0, 78, 4, 'permutation', 83.00);
+
+INSERT INTO job_suggestion_cache (
+    holland_code, sort_order, job_id, star_rating, match_type, match_score
+) VALUES
+    ('SRA', 1, 8, 3, 'two_char', 75.00),
+    ('SRA', 2, 122, 3, 'two_char', 72.50),
+    ('SRA', 3, 124, 3, 'two_char', 72.50),
+    ('SRA', 4, 101, 3, 'two_char', 67.50),
+    ('SRA', 5, 103, 3, 'two_char', 67.50),
+    ('SRA', 6, 21, 3, 'two_char', 65.00),
+    ('SRA', 7, 93, 3, 'two_char', 62.50),
+    ('SRA', 8, 96, 3, 'two_char', 62.50),
+    ('SRA', 9, 102, 2, 'single_char', 50.00),
+    ('SRA', 10, 104, 2, 'single_char', 50.00),
+    ('SRE', 0, 144, 5, 'exact', 100.00),
+    ('SRE', 1, 178, 5, 'exact', 100.00),
+    ('SRE', 2, 180, 4, 'permutation', 89.00),
+    ('SRE', 3, 177, 4, 'permutation', 86.00),
+    ('SRE', 4, 116, 4, 'permutation', 83.00),
+    ('SRE', 5, 8, 3, 'two_char', 75.00),
+    ('SRE', 6, 28, 3, 'two_char', 72.50),
+    ('SRE', 7, 139, 3, 'two_char', 72.50),
+    ('SRE', 8, 143, 3, 'two_char', 67.50),
+    ('SRE', 9, 102, 2, 'single_char', 50.00),
+    ('SRE', 10, 104, 2, 'single_char', 50.00),
+    ('SRC', 0, 173, 4, 'permutation', 89.00),
+    ('SRC', 1, 4, 4, 'permutation', 83.00),
+    ('SRC', 2, 8, 3, 'two_char', 75.00),
+    ('SRC', 3, 79, 3, 'two_char', 67.50),
+    ('SRC', 4, 82, 3, 'two_char', 67.50),
+    ('SRC', 5, 83, 3, 'two_char', 67.50),
+    ('SRC', 6, 84, 3, 'two_char', 67.50),
+    ('SRC', 7, 85, 3, 'two_char', 67.50),
+    ('SRC', 8, 23, 3, 'two_char', 65.00),
+    ('SRC', 9, 102, 2, 'single_char', 50.00),
+    ('SRC', 10, 104, 2, 'single_char', 50.00),
+    ('SIR', 0, 117, 5, 'exact', 100.00),
+    ('SIR', 1, 175, 5, 'exact', 100.00),
+    ('SIR', 2, 176, 5, 'exact', 100.00),
+    ('SIR', 3, 108, 4, 'permutation', 92.00),
+    ('SIR', 4, 150, 4, 'permutation', 92.00),
+    ('SIR', 5, 107, 4, 'permutation', 89.00),
+    ('SIR', 6, 112, 4, 'permutation', 89.00),
+    ('SIR', 7, 135, 4, 'permutation', 89.00),
+    ('SIR', 8, 137, 4, 'permutation', 89.00),
+    ('SIR', 9, 121, 4, 'permutation', 86.00),
+    ('SIR', 10, 6, 3, 'two_char', 75.00),
+    ('SIR', 11, 7, 3, 'two_char', 75.00),
+    ('SIR', 12, 9, 3, 'two_char', 75.00),
+    ('SIR', 13, 10, 3, 'two_char', 75.00),
+    ('SIR', 14, 134, 3, 'two_char', 75.00),
+    ('SIR', 15, 8, 3, 'two_char', 72.50),
+    ('SIR', 16, 106, 3, 'two_char', 70.00),
+    ('SIR', 17, 35, 3, 'two_char', 67.50),
+    ('SIR', 18, 37, 3, 'two_char', 67.50),
+    ('SIR', 19, 42, 3, 'two_char', 67.50),
+    ('SIR', 20, 43, 3, 'two_char', 67.50),
+    ('SIR', 21, 45, 3, 'two_char', 67.50),
+    ('SIR', 22, 52, 3, 'two_char', 62.50),
+    ('SIR', 23, 62, 3, 'two_char', 62.50),
+    ('SIR', 24, 151, 3, 'two_char', 62.50),
+    ('SIR', 25, 17, 2, 'single_char', 50.00),
+    ('SIR', 26, 102, 2, 'single_char', 45.00),
+    ('SIR', 27, 104, 2, 'single_char', 45.00),
+    ('SIA', 0, 132, 5, 'exact', 100.00),
+    ('SIA', 1, 11, 4, 'permutation', 92.00),
+    ('SIA', 2, 133, 4, 'permutation', 89.00),
+    ('SIA', 3, 16, 4, 'permutation', 86.00),
+    ('SIA', 4, 18, 4, 'permutation', 80.00),
+    ('SIA', 5, 6, 3, 'two_char', 75.00),
+    ('SIA', 6, 7, 3, 'two_char', 75.00),
+    ('SIA', 7, 9, 3, 'two_char', 75.00),
+    ('SIA', 8, 10, 3, 'two_char', 75.00),
+    ('SIA', 9, 134, 3, 'two_char', 75.00),
+    ('SIA', 10, 122, 3, 'two_char', 72.50),
+    ('SIA', 11, 124, 3, 'two_char', 72.50),
+    ('SIA', 12, 106, 3, 'two_char', 70.00),
+    ('SIA', 13, 21, 3, 'two_char', 65.00),
+    ('SIA', 14, 17, 2, 'single_char', 50.00),
+    ('SIE', 0, 6, 3, 'two_char', 75.00),
+    ('SIE', 1, 7, 3, 'two_char', 75.00),
+    ('SIE', 2, 9, 3, 'two_char', 75.00),
+    ('SIE', 3, 10, 3, 'two_char', 75.00),
+    ('SIE', 4, 134, 3, 'two_char', 75.00),
+    ('SIE', 5, 28, 3, 'two_char', 72.50),
+    ('SIE', 6, 139, 3, 'two_char', 72.50),
+    ('SIE', 7, 106, 3, 'two_char', 70.00),
+    ('SIE', 8, 17, 2, 'single_char', 50.00),
+    ('SIC', 0, 73, 5, 'exact', 100.00),
+    ('SIC', 1, 120, 5, 'exact', 100.00),
+    ('SIC', 2, 110, 4, 'permutation', 89.00),
+    ('SIC', 3, 63, 4, 'permutation', 86.00),
+    ('SIC', 4, 6, 3, 'two_char', 75.00),
+    ('SIC', 5, 7, 3, 'two_char', 75.00),
+    ('SIC', 6, 9, 3, 'two_char', 75.00),
+    ('SIC', 7, 10, 3, 'two_char', 75.00),
+    ('SIC', 8, 134, 3, 'two_char', 75.00),
+    ('SIC', 9, 106, 3, 'two_char', 70.00),
+    ('SIC', 10, 32, 3, 'two_char', 67.50),
+    ('SIC', 11, 33, 3, 'two_char', 67.50),
+    ('SIC', 12, 23, 3, 'two_char', 65.00),
+    ('SIC', 13, 40, 3, 'two_char', 62.50),
+    ('SIC', 14, 17, 2, 'single_char', 50.00),
+    ('SAR', 0, 78, 4, 'permutation', 89.00),
+    ('SAR', 1, 122, 3, 'two_char', 75.00),
+    ('SAR', 2, 124, 3, 'two_char', 75.00),
+    ('SAR', 3, 8, 3, 'two_char', 72.50),
+    ('SAR', 4, 21, 3, 'two_char', 70.00),
+    ('SAR', 5, 93, 3, 'two_char', 67.50),
+    ('SAR', 6, 96, 3, 'two_char', 67.50),
+    ('SAR', 7, 101, 3, 'two_char', 62.50),
+    ('SAR', 8, 103, 3, 'two_char', 62.50),
+    ('SAR', 9, 102, 2, 'single_char', 45.00),
+    ('SAR', 10, 104, 2, 'single_char', 45.00),
+    ('SAI', 0, 11, 5, 'exact', 100.00),
+    ('SAI', 1, 132, 4, 'permutation', 92.00),
+    ('SAI', 2, 18, 4, 'permutation', 86.00),
+    ('SAI', 3, 133, 4, 'permutation', 83.00),
+    ('SAI', 4, 16, 4, 'permutation', 80.00),
+    ('SAI', 5, 122, 3, 'two_char', 75.00),
+    ('SAI', 6, 124, 3, 'two_char', 75.00),
+    ('SAI', 7, 6, 3, 'two_char', 72.50),
+    ('SAI', 8, 7, 3, 'two_char', 72.50),
+    ('SAI', 9, 9, 3, 'two_char', 72.50),
+    ('SAI', 10, 10, 3, 'two_char', 72.50),
+    ('SAI', 11, 134, 3, 'two_char', 72.50),
+    ('SAI', 12, 21, 3, 'two_char', 70.00),
+    ('SAI', 13, 106, 3, 'two_char', 65.00),
+    ('SAI', 14, 17, 2, 'single_char', 45.00),
+    ('SAE', 0, 154, 4, 'permutation', 89.00),
+    ('SAE', 1, 86, 4, 'permutation', 86.00),
+    ('SAE', 2, 12, 4, 'permutation', 80.00),
+    ('SAE', 3, 22, 4, 'permutation', 80.00),
+    ('SAE', 4, 98, 4, 'permutation', 80.00),
+    ('SAE', 5, 122, 3, 'two_char', 75.00),
+    ('SAE', 6, 124, 3, 'two_char', 75.00),
+    ('SAE', 7, 28, 3, 'two_char', 72.50),
+    ('SAE', 8, 139, 3, 'two_char', 72.50),
+    ('SAE', 9, 21, 3, 'two_char', 70.00),
+    ('SAE', 10, 94, 3, 'two_char', 67.50),
+    ('SAC', 0, 123, 5, 'exact', 100.00),
+    ('SAC', 1, 122, 3, 'two_char', 75.00),
+    ('SAC', 2, 124, 3, 'two_char', 75.00),
+    ('SAC', 3, 21, 3, 'two_char', 70.00),
+    ('SAC', 4, 23, 3, 'two_char', 65.00),
+    ('SAC', 5, 15, 3, 'two_char', 62.50),
+    ('SER', 0, 144, 4, 'permutation', 92.00),
+    ('SER', 1, 178, 4, 'permutation', 92.00),
+    ('SER', 2, 116, 4, 'permutation', 89.00),
+    ('SER', 3, 180, 4, 'permutation', 83.00),
+    ('SER', 4, 177, 4, 'permutation', 80.00),
+    ('SER', 5, 28, 3, 'two_char', 75.00),
+    ('SER', 6, 139, 3, 'two_char', 75.00),
+    ('SER', 7, 8, 3, 'two_char', 72.50),
+    ('SER', 8, 143, 3, 'two_char', 62.50),
+    ('SER', 9, 102, 2, 'single_char', 45.00),
+    ('SER', 10, 104, 2, 'single_char', 45.00),
+    ('SEI', 0, 28, 3, 'two_char', 75.00),
+    ('SEI', 1, 139, 3, 'two_char', 75.00),
+    ('SEI', 2, 6, 3, 'two_char', 72.50),
+    ('SEI', 3, 7, 3, 'two_char', 72.50),
+    ('SEI', 4, 9, 3, 'two_char', 72.50),
+    ('SEI', 5, 10, 3, 'two_char', 72.50),
+    ('SEI', 6, 134, 3, 'two_char', 72.50),
+    ('SEI', 7, 106, 3, 'two_char', 65.00),
+    ('SEI', 8, 17, 2, 'single_char', 45.00),
+    ('SEA', 0, 12, 4, 'permutation', 86.00),
+    ('SEA', 1, 22, 4, 'permutation', 86.00),
+    ('SEA', 2, 98, 4, 'permutation', 86.00),
+    ('SEA', 3, 154, 4, 'permutation', 83.00),
+    ('SEA', 4, 86, 4, 'permutation', 80.00),
+    ('SEA', 5, 28, 3, 'two_char', 75.00),
+    ('SEA', 6, 139, 3, 'two_char', 75.00),
+    ('SEA', 7, 122, 3, 'two_char', 72.50),
+    ('SEA', 8, 124, 3, 'two_char', 72.50),
+    ('SEA', 9, 21, 3, 'two_char', 65.00),
+    ('SEA', 10, 94, 3, 'two_char', 62.50),
+    ('SEC', 0, 111, 5, 'exact', 100.00),
+    ('SEC', 1, 131, 5, 'exact', 100.00),
+    ('SEC', 2, 29, 4, 'permutation', 89.00),
+    ('SEC', 3, 130, 4, 'permutation', 89.00),
+    ('SEC', 4, 140, 4, 'permutation', 89.00),
+    ('SEC', 5, 192, 4, 'permutation', 89.00),
+    ('SEC', 6, 70, 4, 'permutation', 86.00),
+    ('SEC', 7, 109, 4, 'permutation', 86.00),
+    ('SEC', 8, 115, 4, 'permutation', 86.00),
+    ('SEC', 9, 118, 4, 'permutation', 86.00),
+    ('SEC', 10, 127, 4, 'permutation', 86.00),
+    ('SEC', 11, 14, 4, 'permutation', 83.00),
+    ('SEC', 12, 145, 4, 'permutation', 80.00),
+    ('SEC', 13, 28, 3, 'two_char', 75.00),
+    ('SEC', 14, 139, 3, 'two_char', 75.00),
+    ('SEC', 15, 27, 3, 'two_char', 67.50),
+    ('SEC', 16, 69, 3, 'two_char', 67.50),
+    ('SEC', 17, 114, 3, 'two_char', 67.50),
+    ('SEC', 18, 119, 3, 'two_char', 67.50),
+    ('SEC', 19, 125, 3, 'two_char', 67.50),
+    ('SEC', 20, 23, 3, 'two_char', 65.00),
+    ('SEC', 21, 5, 3, 'two_char', 62.50),
+    ('SEC', 22, 72, 3, 'two_char', 62.50),
+    ('SEC', 23, 77, 3, 'two_char', 62.50),
+    ('SCR', 0, 4, 4, 'permutation', 89.00),
+    ('SCR', 1, 173, 4, 'permutation', 83.00),
+    ('SCR', 2, 8, 3, 'two_char', 72.50),
+    ('SCR', 3, 23, 3, 'two_char', 70.00),
+    ('SCR', 4, 79, 3, 'two_char', 62.50),
+    ('SCR', 5, 82, 3, 'two_char', 62.50),
+    ('SCR', 6, 83, 3, 'two_char', 62.50),
+    ('SCR', 7, 84, 3, 'two_char', 62.50),
+    ('SCR', 8, 85, 3, 'two_char', 62.50),
+    ('SCR', 9, 102, 2, 'single_char', 45.00),
+    ('SCR', 10, 104, 2, 'single_char', 45.00),
+    ('SCI', 0, 73, 4, 'permutation', 92.00),
+    ('SCI', 1, 120, 4, 'permutation', 92.00),
+    ('SCI', 2, 110, 4, 'permutation', 83.00),
+    ('SCI', 3, 63, 4, 'permutation', 80.00),
+    ('SCI', 4, 6, 3, 'two_char', 72.50),
+    ('SCI', 5, 7, 3, 'two_char', 72.50),
+    ('SCI', 6, 9, 3, 'two_char', 72.50),
+    ('SCI', 7, 10, 3, 'two_char', 72.50),
+    ('SCI', 8, 134, 3, 'two_char', 72.50),
+    ('SCI', 9, 23, 3, 'two_char', 70.00),
+    ('SCI', 10, 40, 3, 'two_char', 67.50),
+    ('SCI', 11, 106, 3, 'two_char', 65.00),
+    ('SCI', 12, 32, 3, 'two_char', 62.50),
+    ('SCI', 13, 33, 3, 'two_char', 62.50),
+    ('SCI', 14, 17, 2, 'single_char', 45.00),
+    ('SCA', 0, 123, 4, 'permutation', 92.00),
+    ('SCA', 1, 122, 3, 'two_char', 72.50),
+    ('SCA', 2, 124, 3, 'two_char', 72.50),
+    ('SCA', 3, 23, 3, 'two_char', 70.00),
+    ('SCA', 4, 15, 3, 'two_char', 67.50),
+    ('SCA', 5, 21, 3, 'two_char', 65.00),
+    ('SCE', 0, 111, 4, 'permutation', 92.00),
+    ('SCE', 1, 131, 4, 'permutation', 92.00),
+    ('SCE', 2, 14, 4, 'permutation', 89.00),
+    ('SCE', 3, 145, 4, 'permutation', 86.00),
+    ('SCE', 4, 29, 4, 'permutation', 83.00),
+    ('SCE', 5, 130, 4, 'permutation', 83.00),
+    ('SCE', 6, 140, 4, 'permutation', 83.00),
+    ('SCE', 7, 192, 4, 'permutation', 83.00),
+    ('SCE', 8, 70, 4, 'permutation', 80.00),
+    ('SCE', 9, 109, 4, 'permutation', 80.00),
+    ('SCE', 10, 115, 4, 'permutation', 80.00),
+    ('SCE', 11, 118, 4, 'permutation', 80.00),
+    ('SCE', 12, 127, 4, 'permutation', 80.00),
+    ('SCE', 13, 28, 3, 'two_char', 72.50),
+    ('SCE', 14, 139, 3, 'two_char', 72.50),
+    ('SCE', 15, 23, 3, 'two_char', 70.00),
+    ('SCE', 16, 5, 3, 'two_char', 67.50),
+    ('SCE', 17, 72, 3, 'two_char', 67.50),
+    ('SCE', 18, 77, 3, 'two_char', 67.50),
+    ('SCE', 19, 27, 3, 'two_char', 62.50),
+    ('SCE', 20, 69, 3, 'two_char', 62.50),
+    ('SCE', 21, 114, 3, 'two_char', 62.50),
+    ('SCE', 22, 119, 3, 'two_char', 62.50),
+    ('SCE', 23, 125, 3, 'two_char', 62.50),
+    ('ERI', 0, 164, 4, 'permutation', 89.00),
+    ('ERI', 1, 48, 4, 'permutation', 86.00),
+    ('ERI', 2, 169, 4, 'permutation', 86.00),
+    ('ERI', 3, 171, 4, 'permutation', 86.00),
+    ('ERI', 4, 56, 4, 'permutation', 80.00),
+    ('ERI', 5, 67, 4, 'permutation', 80.00),
+    ('ERI', 6, 147, 4, 'permutation', 80.00),
+    ('ERI', 7, 143, 3, 'two_char', 70.00),
+    ('ERI', 8, 52, 3, 'two_char', 67.50),
+    ('ERI', 9, 62, 3, 'two_char', 67.50),
+    ('ERI', 10, 151, 3, 'two_char', 67.50),
+    ('ERI', 11, 35, 3, 'two_char', 62.50),
+    ('ERI', 12, 37, 3, 'two_char', 62.50),
+    ('ERI', 13, 42, 3, 'two_char', 62.50),
+    ('ERI', 14, 43, 3, 'two_char', 62.50),
+    ('ERI', 15, 45, 3, 'two_char', 62.50),
+    ('ERI', 16, 102, 2, 'single_char', 50.00),
+    ('ERI', 17, 104, 2, 'single_char', 50.00),
+    ('ERI', 18, 17, 2, 'single_char', 45.00),
+    ('ERA', 0, 142, 5, 'exact', 100.00),
+    ('ERA', 1, 89, 4, 'permutation', 83.00),
+    ('ERA', 2, 90, 4, 'permutation', 83.00),
+    ('ERA', 3, 74, 4, 'permutation', 80.00),
+    ('ERA', 4, 92, 4, 'permutation', 80.00),
+    ('ERA', 5, 95, 4, 'permutation', 80.00),
+    ('ERA', 6, 97, 4, 'permutation', 80.00),
+    ('ERA', 7, 143, 3, 'two_char', 70.00),
+    ('ERA', 8, 101, 3, 'two_char', 67.50),
+    ('ERA', 9, 103, 3, 'two_char', 67.50),
+    ('ERA', 10, 94, 3, 'two_char', 65.00),
+    ('ERA', 11, 93, 3, 'two_char', 62.50),
+    ('ERA', 12, 96, 3, 'two_char', 62.50),
+    ('ERA', 13, 102, 2, 'single_char', 50.00),
+    ('ERA', 14, 104, 2, 'single_char', 50.00),
+    ('ERS', 0, 116, 4, 'permutation', 92.00),
+    ('ERS', 1, 177, 4, 'permutation', 89.00),
+    ('ERS', 2, 180, 4, 'permutation', 86.00),
+    ('ERS', 3, 144, 4, 'permutation', 80.00),
+    ('ERS', 4, 178, 4, 'permutation', 80.00),
+    ('ERS', 5, 143, 3, 'two_char', 70.00),
+    ('ERS', 6, 28, 3, 'two_char', 65.00),
+    ('ERS', 7, 139, 3, 'two_char', 65.00),
+    ('ERS', 8, 8, 3, 'two_char', 62.50),
+    ('ERS', 9, 102, 2, 'single_char', 50.00),
+    ('ERS', 10, 104, 2, 'single_char', 50.00),
+    ('ERC', 0, 128, 5, 'exact', 100.00),
+    ('ERC', 1, 153, 5, 'exact', 100.00),
+    ('ERC', 2, 65, 4, 'permutation', 92.00),
+    ('ERC', 3, 59, 4, 'permutation', 89.00),
+    ('ERC', 4, 170, 4, 'permutation', 89.00),
+    ('ERC', 5, 179, 4, 'permutation', 89.00),
+    ('ERC', 6, 186, 4, 'permutation', 86.00),
+    ('ERC', 7, 190, 4, 'permutation', 86.00),
+    ('ERC', 8, 25, 4, 'permutation', 83.00),
+    ('ERC', 9, 66, 4, 'permutation', 83.00),
+    ('ERC', 10, 146, 4, 'permutation', 83.00),
+    ('ERC', 11, 161, 4, 'permutation', 80.00),
+    ('ERC', 12, 27, 3, 'two_char', 72.50),
+    ('ERC', 13, 69, 3, 'two_char', 72.50),
+    ('ERC', 14, 114, 3, 'two_char', 72.50),
+    ('ERC', 15, 119, 3, 'two_char', 72.50),
+    ('ERC', 16, 125, 3, 'two_char', 72.50),
+    ('ERC', 17, 143, 3, 'two_char', 70.00),
+    ('ERC', 18, 79, 3, 'two_char', 67.50),
+    ('ERC', 19, 82, 3, 'two_char', 67.50),
+    ('ERC', 20, 83, 3, 'two_char', 67.50),
+    ('ERC', 21, 84, 3, 'two_char', 67.50),
+    ('ERC', 22, 85, 3, 'two_char', 67.50),
+    ('ERC', 23, 5, 3, 'two_char', 65.00),
+    ('ERC', 24, 72, 3, 'two_char', 65.00),
+    ('ERC', 25, 77, 3, 'two_char', 65.00),
+    ('ERC', 26, 102, 2, 'single_char', 50.00),
+    ('ERC', 27, 104, 2, 'single_char', 50.00),
+    ('EIR', 0, 56, 4, 'permutation', 86.00),
+    ('EIR', 1, 67, 4, 'permutation', 86.00),
+    ('EIR', 2, 147, 4, 'permutation', 86.00),
+    ('EIR', 3, 164, 4, 'permutation', 83.00),
+    ('EIR', 4, 48, 4, 'permutation', 80.00),
+    ('EIR', 5, 169, 4, 'permutation', 80.00),
+    ('EIR', 6, 171, 4, 'permutation', 80.00),
+    ('EIR', 7, 35, 3, 'two_char', 67.50),
+    ('EIR', 8, 37, 3, 'two_char', 67.50),
+    ('EIR', 9, 42, 3, 'two_char', 67.50),
+    ('EIR', 10, 43, 3, 'two_char', 67.50),
+    ('EIR', 11, 45, 3, 'two_char', 67.50),
+    ('EIR', 12, 143, 3, 'two_char', 65.00),
+    ('EIR', 13, 52, 3, 'two_char', 62.50),
+    ('EIR', 14, 62, 3, 'two_char', 62.50),
+    ('EIR', 15, 151, 3, 'two_char', 62.50),
+    ('EIR', 16, 17, 2, 'single_char', 50.00),
+    ('EIR', 17, 102, 2, 'single_char', 45.00),
+    ('EIR', 18, 104, 2, 'single_char', 45.00),
+    ('EIA', 0, 13, 5, 'exact', 100.00),
+    ('EIA', 1, 113, 4, 'permutation', 89.00),
+    ('EIA', 2, 1, 4, 'permutation', 83.00),
+    ('EIA', 3, 19, 4, 'permutation', 83.00),
+    ('EIA', 4, 94, 3, 'two_char', 65.00),
+    ('EIA', 5, 17, 2, 'single_char', 50.00),
+    ('EIS', 0, 106, 3, 'two_char', 67.50),
+    ('EIS', 1, 28, 3, 'two_char', 65.00),
+    ('EIS', 2, 139, 3, 'two_char', 65.00),
+    ('EIS', 3, 6, 3, 'two_char', 62.50),
+    ('EIS', 4, 7, 3, 'two_char', 62.50),
+    ('EIS', 5, 9, 3, 'two_char', 62.50),
+    ('EIS', 6, 10, 3, 'two_char', 62.50),
+    ('EIS', 7, 134, 3, 'two_char', 62.50),
+    ('EIS', 8, 17, 2, 'single_char', 50.00),
+    ('EIC', 0, 75, 4, 'permutation', 92.00),
+    ('EIC', 1, 68, 4, 'permutation', 86.00),
+    ('EIC', 2, 41, 4, 'permutation', 83.00),
+    ('EIC', 3, 64, 4, 'permutation', 83.00),
+    ('EIC', 4, 27, 3, 'two_char', 72.50),
+    ('EIC', 5, 69, 3, 'two_char', 72.50),
+    ('EIC', 6, 114, 3, 'two_char', 72.50),
+    ('EIC', 7, 119, 3, 'two_char', 72.50),
+    ('EIC', 8, 125, 3, 'two_char', 72.50),
+    ('EIC', 9, 32, 3, 'two_char', 67.50),
+    ('EIC', 10, 33, 3, 'two_char', 67.50),
+    ('EIC', 11, 5, 3, 'two_char', 65.00),
+    ('EIC', 12, 72, 3, 'two_char', 65.00),
+    ('EIC', 13, 77, 3, 'two_char', 65.00),
+    ('EIC', 14, 40, 3, 'two_char', 62.50),
+    ('EIC', 15, 17, 2, 'single_char', 50.00),
+    ('EAR', 0, 142, 4, 'permutation', 92.00),
+    ('EAR', 1, 89, 4, 'permutation', 89.00),
+    ('EAR', 2, 90, 4, 'permutation', 89.00),
+    ('EAR', 3, 74, 4, 'permutation', 86.00),
+    ('EAR', 4, 92, 4, 'permutation', 86.00),
+    ('EAR', 5, 95, 4, 'permutation', 86.00),
+    ('EAR', 6, 97, 4, 'permutation', 86.00),
+    ('EAR', 7, 94, 3, 'two_char', 70.00),
+    ('EAR', 8, 93, 3, 'two_char', 67.50),
+    ('EAR', 9, 96, 3, 'two_char', 67.50),
+    ('EAR', 10, 143, 3, 'two_char', 65.00),
+    ('EAR', 11, 101, 3, 'two_char', 62.50),
+    ('EAR', 12, 103, 3, 'two_char', 62.50),
+    ('EAR', 13, 102, 2, 'single_char', 45.00),
+    ('EAR', 14, 104, 2, 'single_char', 45.00),
+    ('EAI', 0, 13, 4, 'permutation', 92.00),
+    ('EAI', 1, 1, 4, 'permutation', 89.00),
+    ('EAI', 2, 19, 4, 'permutation', 89.00),
+    ('EAI', 3, 113, 4, 'permutation', 83.00),
+    ('EAI', 4, 94, 3, 'two_char', 70.00),
+    ('EAI', 5, 17, 2, 'single_char', 45.00),
+    ('EAS', 0, 12, 5, 'exact', 100.00),
+    ('EAS', 1, 22, 5, 'exact', 100.00),
+    ('EAS', 2, 98, 5, 'exact', 100.00),
+    ('EAS', 3, 86, 4, 'permutation', 89.00),
+    ('EAS', 4, 154, 4, 'permutation', 86.00),
+    ('EAS', 5, 94, 3, 'two_char', 70.00),
+    ('EAS', 6, 21, 3, 'two_char', 67.50),
+    ('EAS', 7, 28, 3, 'two_char', 65.00),
+    ('EAS', 8, 139, 3, 'two_char', 65.00),
+    ('EAS', 9, 122, 3, 'two_char', 62.50),
+    ('EAS', 10, 124, 3, 'two_char', 62.50),
+    ('EAC', 0, 27, 3, 'two_char', 72.50),
+    ('EAC', 1, 69, 3, 'two_char', 72.50),
+    ('EAC', 2, 114, 3, 'two_char', 72.50),
+    ('EAC', 3, 119, 3, 'two_char', 72.50),
+    ('EAC', 4, 125, 3, 'two_char', 72.50),
+    ('EAC', 5, 94, 3, 'two_char', 70.00),
+    ('EAC', 6, 5, 3, 'two_char', 65.00),
+    ('EAC', 7, 72, 3, 'two_char', 65.00),
+    ('EAC', 8, 77, 3, 'two_char', 65.00),
+    ('EAC', 9, 15, 3, 'two_char', 62.50),
+    ('ESR', 0, 116, 5, 'exact', 100.00),
+    ('ESR', 1, 144, 4, 'permutation', 86.00),
+    ('ESR', 2, 178, 4, 'permutation', 86.00),
+    ('ESR', 3, 177, 4, 'permutation', 83.00),
+    ('ESR', 4, 180, 4, 'permutation', 80.00),
+    ('ESR', 5, 28, 3, 'two_char', 70.00),
+    ('ESR', 6, 139, 3, 'two_char', 70.00),
+    ('ESR', 7, 8, 3, 'two_char', 67.50),
+    ('ESR', 8, 143, 3, 'two_char', 65.00),
+    ('ESR', 9, 102, 2, 'single_char', 45.00),
+    ('ESR', 10, 104, 2, 'single_char', 45.00),
+    ('ESI', 0, 28, 3, 'two_char', 70.00),
+    ('ESI', 1, 139, 3, 'two_char', 70.00),
+    ('ESI', 2, 6, 3, 'two_char', 67.50),
+    ('ESI', 3, 7, 3, 'two_char', 67.50),
+    ('ESI', 4, 9, 3, 'two_char', 67.50),
+    ('ESI', 5, 10, 3, 'two_char', 67.50),
+    ('ESI', 6, 134, 3, 'two_char', 67.50),
+    ('ESI', 7, 106, 3, 'two_char', 62.50),
+    ('ESI', 8, 17, 2, 'single_char', 45.00),
+    ('ESA', 0, 12, 4, 'permutation', 92.00),
+    ('ESA', 1, 22, 4, 'permutation', 92.00),
+    ('ESA', 2, 98, 4, 'permutation', 92.00),
+    ('ESA', 3, 86, 4, 'permutation', 83.00),
+    ('ESA', 4, 154, 4, 'permutation', 80.00),
+    ('ESA', 5, 28, 3, 'two_char', 70.00),
+    ('ESA', 6, 139, 3, 'two_char', 70.00),
+    ('ESA', 7, 122, 3, 'two_char', 67.50),
+    ('ESA', 8, 124, 3, 'two_char', 67.50),
+    ('ESA', 9, 94, 3, 'two_char', 65.00),
+    ('ESA', 10, 21, 3, 'two_char', 62.50),
+    ('ESC', 0, 29, 5, 'exact', 100.00),
+    ('ESC', 1, 130, 5, 'exact', 100.00),
+    ('ESC', 2, 140, 5, 'exact', 100.00),
+    ('ESC', 3, 192, 5, 'exact', 100.00),
+    ('ESC', 4, 70, 4, 'permutation', 92.00),
+    ('ESC', 5, 109, 4, 'permutation', 92.00),
+    ('ESC', 6, 115, 4, 'permutation', 92.00),
+    ('ESC', 7, 118, 4, 'permutation', 92.00),
+    ('ESC', 8, 127, 4, 'permutation', 92.00),
+    ('ESC', 9, 111, 4, 'permutation', 89.00),
+    ('ESC', 10, 131, 4, 'permutation', 89.00),
+    ('ESC', 11, 145, 4, 'permutation', 83.00),
+    ('ESC', 12, 14, 4, 'permutation', 80.00),
+    ('ESC', 13, 27, 3, 'two_char', 72.50),
+    ('ESC', 14, 69, 3, 'two_char', 72.50),
+    ('ESC', 15, 114, 3, 'two_char', 72.50),
+    ('ESC', 16, 119, 3, 'two_char', 72.50),
+    ('ESC', 17, 125, 3, 'two_char', 72.50),
+    ('ESC', 18, 28, 3, 'two_char', 70.00),
+    ('ESC', 19, 139, 3, 'two_char', 70.00),
+    ('ESC', 20, 5, 3, 'two_char', 65.00),
+    ('ESC', 21, 72, 3, 'two_char', 65.00),
+    ('ESC', 22, 77, 3, 'two_char', 65.00),
+    ('ESC', 23, 23, 3, 'two_char', 62.50),
+    ('ECR', 0, 65, 5, 'exact', 100.00),
+    ('ECR', 1, 128, 4, 'permutation', 92.00),
+    ('ECR', 2, 153, 4, 'permutation', 92.00),
+    ('ECR', 3, 25, 4, 'permutation', 89.00),
+    ('ECR', 4, 66, 4, 'permutation', 89.00),
+    ('ECR', 5, 146, 4, 'permutation', 89.00),
+    ('ECR', 6, 161, 4, 'permutation', 86.00),
+    ('ECR', 7, 59, 4, 'permutation', 83.00),
+    ('ECR', 8, 170, 4, 'permutation', 83.00),
+    ('ECR', 9, 179, 4, 'permutation', 83.00),
+    ('ECR', 10, 186, 4, 'permutation', 80.00),
+    ('ECR', 11, 190, 4, 'permutation', 80.00),
+    ('ECR', 12, 27, 3, 'two_char', 75.00),
+    ('ECR', 13, 69, 3, 'two_char', 75.00),
+    ('ECR', 14, 114, 3, 'two_char', 75.00),
+    ('ECR', 15, 119, 3, 'two_char', 75.00),
+    ('ECR', 16, 125, 3, 'two_char', 75.00),
+    ('ECR', 17, 5, 3, 'two_char', 70.00),
+    ('ECR', 18, 72, 3, 'two_char', 70.00),
+    ('ECR', 19, 77, 3, 'two_char', 70.00),
+    ('ECR', 20, 143, 3, 'two_char', 65.00),
+    ('ECR', 21, 79, 3, 'two_char', 62.50),
+    ('ECR', 22, 82, 3, 'two_char', 62.50),
+    ('ECR', 23, 83, 3, 'two_char', 62.50),
+    ('ECR', 24, 84, 3, 'two_char', 62.50),
+    ('ECR', 25, 85, 3, 'two_char', 62.50),
+    ('ECR', 26, 102, 2, 'single_char', 45.00);
+
+INSERT INTO job_suggestion_cache (
+    holland_code, sort_order, job_id, star_rating, match_type, match_score
+) VALUES
+    ('ECR', 27, 104, 2, 'single_char', 45.00),
+    ('ECI', 0, 75, 5, 'exact', 100.00),
+    ('ECI', 1, 41, 4, 'permutation', 89.00),
+    ('ECI', 2, 64, 4, 'permutation', 89.00),
+    ('ECI', 3, 68, 4, 'permutation', 80.00),
+    ('ECI', 4, 27, 3, 'two_char', 75.00),
+    ('ECI', 5, 69, 3, 'two_char', 75.00),
+    ('ECI', 6, 114, 3, 'two_char', 75.00),
+    ('ECI', 7, 119, 3, 'two_char', 75.00),
+    ('ECI', 8, 125, 3, 'two_char', 75.00),
+    ('ECI', 9, 5, 3, 'two_char', 70.00),
+    ('ECI', 10, 72, 3, 'two_char', 70.00),
+    ('ECI', 11, 77, 3, 'two_char', 70.00),
+    ('ECI', 12, 40, 3, 'two_char', 67.50),
+    ('ECI', 13, 32, 3, 'two_char', 62.50),
+    ('ECI', 14, 33, 3, 'two_char', 62.50),
+    ('ECI', 15, 17, 2, 'single_char', 45.00),
+    ('ECA', 0, 27, 3, 'two_char', 75.00),
+    ('ECA', 1, 69, 3, 'two_char', 75.00),
+    ('ECA', 2, 114, 3, 'two_char', 75.00),
+    ('ECA', 3, 119, 3, 'two_char', 75.00),
+    ('ECA', 4, 125, 3, 'two_char', 75.00),
+    ('ECA', 5, 5, 3, 'two_char', 70.00),
+    ('ECA', 6, 72, 3, 'two_char', 70.00),
+    ('ECA', 7, 77, 3, 'two_char', 70.00),
+    ('ECA', 8, 15, 3, 'two_char', 67.50),
+    ('ECA', 9, 94, 3, 'two_char', 65.00),
+    ('ECS', 0, 70, 5, 'exact', 100.00),
+    ('ECS', 1, 109, 5, 'exact', 100.00),
+    ('ECS', 2, 115, 5, 'exact', 100.00),
+    ('ECS', 3, 118, 5, 'exact', 100.00),
+    ('ECS', 4, 127, 5, 'exact', 100.00),
+    ('ECS', 5, 29, 4, 'permutation', 92.00),
+    ('ECS', 6, 130, 4, 'permutation', 92.00),
+    ('ECS', 7, 140, 4, 'permutation', 92.00),
+    ('ECS', 8, 192, 4, 'permutation', 92.00),
+    ('ECS', 9, 145, 4, 'permutation', 89.00),
+    ('ECS', 10, 14, 4, 'permutation', 86.00),
+    ('ECS', 11, 111, 4, 'permutation', 83.00),
+    ('ECS', 12, 131, 4, 'permutation', 83.00),
+    ('ECS', 13, 27, 3, 'two_char', 75.00),
+    ('ECS', 14, 69, 3, 'two_char', 75.00),
+    ('ECS', 15, 114, 3, 'two_char', 75.00),
+    ('ECS', 16, 119, 3, 'two_char', 75.00),
+    ('ECS', 17, 125, 3, 'two_char', 75.00),
+    ('ECS', 18, 5, 3, 'two_char', 70.00),
+    ('ECS', 19, 72, 3, 'two_char', 70.00),
+    ('ECS', 20, 77, 3, 'two_char', 70.00),
+    ('ECS', 21, 23, 3, 'two_char', 67.50),
+    ('ECS', 22, 28, 3, 'two_char', 65.00),
+    ('ECS', 23, 139, 3, 'two_char', 65.00),
+    ('CRI', 0, 136, 5, 'exact', 100.00),
+    ('CRI', 1, 26, 4, 'permutation', 89.00),
+    ('CRI', 2, 55, 4, 'permutation', 89.00),
+    ('CRI', 3, 148, 4, 'permutation', 89.00),
+    ('CRI', 4, 155, 4, 'permutation', 89.00),
+    ('CRI', 5, 159, 4, 'permutation', 89.00),
+    ('CRI', 6, 31, 4, 'permutation', 86.00),
+    ('CRI', 7, 44, 4, 'permutation', 86.00),
+    ('CRI', 8, 51, 4, 'permutation', 86.00),
+    ('CRI', 9, 61, 4, 'permutation', 86.00),
+    ('CRI', 10, 71, 4, 'permutation', 86.00),
+    ('CRI', 11, 24, 4, 'permutation', 83.00),
+    ('CRI', 12, 50, 4, 'permutation', 83.00),
+    ('CRI', 13, 30, 4, 'permutation', 80.00),
+    ('CRI', 14, 36, 4, 'permutation', 80.00),
+    ('CRI', 15, 46, 4, 'permutation', 80.00),
+    ('CRI', 16, 40, 3, 'two_char', 72.50),
+    ('CRI', 17, 79, 3, 'two_char', 70.00),
+    ('CRI', 18, 82, 3, 'two_char', 70.00),
+    ('CRI', 19, 83, 3, 'two_char', 70.00),
+    ('CRI', 20, 84, 3, 'two_char', 70.00),
+    ('CRI', 21, 85, 3, 'two_char', 70.00),
+    ('CRI', 22, 52, 3, 'two_char', 67.50),
+    ('CRI', 23, 62, 3, 'two_char', 67.50),
+    ('CRI', 24, 151, 3, 'two_char', 67.50),
+    ('CRI', 25, 32, 3, 'two_char', 65.00),
+    ('CRI', 26, 33, 3, 'two_char', 65.00),
+    ('CRI', 27, 35, 3, 'two_char', 62.50),
+    ('CRI', 28, 37, 3, 'two_char', 62.50),
+    ('CRI', 29, 42, 3, 'two_char', 62.50),
+    ('CRI', 30, 43, 3, 'two_char', 62.50),
+    ('CRI', 31, 45, 3, 'two_char', 62.50),
+    ('CRI', 32, 102, 2, 'single_char', 50.00),
+    ('CRI', 33, 104, 2, 'single_char', 50.00),
+    ('CRI', 34, 17, 2, 'single_char', 45.00),
+    ('CRA', 0, 80, 4, 'permutation', 89.00),
+    ('CRA', 1, 81, 4, 'permutation', 89.00),
+    ('CRA', 2, 100, 4, 'permutation', 86.00),
+    ('CRA', 3, 15, 3, 'two_char', 72.50),
+    ('CRA', 4, 79, 3, 'two_char', 70.00),
+    ('CRA', 5, 82, 3, 'two_char', 70.00),
+    ('CRA', 6, 83, 3, 'two_char', 70.00),
+    ('CRA', 7, 84, 3, 'two_char', 70.00),
+    ('CRA', 8, 85, 3, 'two_char', 70.00),
+    ('CRA', 9, 101, 3, 'two_char', 67.50),
+    ('CRA', 10, 103, 3, 'two_char', 67.50),
+    ('CRA', 11, 93, 3, 'two_char', 62.50),
+    ('CRA', 12, 96, 3, 'two_char', 62.50),
+    ('CRA', 13, 102, 2, 'single_char', 50.00),
+    ('CRA', 14, 104, 2, 'single_char', 50.00),
+    ('CRS', 0, 4, 4, 'permutation', 92.00),
+    ('CRS', 1, 173, 4, 'permutation', 86.00),
+    ('CRS', 2, 23, 3, 'two_char', 72.50),
+    ('CRS', 3, 79, 3, 'two_char', 70.00),
+    ('CRS', 4, 82, 3, 'two_char', 70.00),
+    ('CRS', 5, 83, 3, 'two_char', 70.00),
+    ('CRS', 6, 84, 3, 'two_char', 70.00),
+    ('CRS', 7, 85, 3, 'two_char', 70.00),
+    ('CRS', 8, 8, 3, 'two_char', 62.50),
+    ('CRS', 9, 102, 2, 'single_char', 50.00),
+    ('CRS', 10, 104, 2, 'single_char', 50.00),
+    ('CRE', 0, 161, 5, 'exact', 100.00),
+    ('CRE', 1, 25, 4, 'permutation', 92.00),
+    ('CRE', 2, 66, 4, 'permutation', 92.00),
+    ('CRE', 3, 146, 4, 'permutation', 92.00),
+    ('CRE', 4, 186, 4, 'permutation', 89.00),
+    ('CRE', 5, 190, 4, 'permutation', 89.00),
+    ('CRE', 6, 59, 4, 'permutation', 86.00),
+    ('CRE', 7, 170, 4, 'permutation', 86.00),
+    ('CRE', 8, 179, 4, 'permutation', 86.00),
+    ('CRE', 9, 65, 4, 'permutation', 83.00),
+    ('CRE', 10, 128, 4, 'permutation', 80.00),
+    ('CRE', 11, 153, 4, 'permutation', 80.00),
+    ('CRE', 12, 5, 3, 'two_char', 72.50),
+    ('CRE', 13, 72, 3, 'two_char', 72.50),
+    ('CRE', 14, 77, 3, 'two_char', 72.50),
+    ('CRE', 15, 79, 3, 'two_char', 70.00),
+    ('CRE', 16, 82, 3, 'two_char', 70.00),
+    ('CRE', 17, 83, 3, 'two_char', 70.00),
+    ('CRE', 18, 84, 3, 'two_char', 70.00),
+    ('CRE', 19, 85, 3, 'two_char', 70.00),
+    ('CRE', 20, 143, 3, 'two_char', 67.50),
+    ('CRE', 21, 27, 3, 'two_char', 65.00),
+    ('CRE', 22, 69, 3, 'two_char', 65.00),
+    ('CRE', 23, 114, 3, 'two_char', 65.00),
+    ('CRE', 24, 119, 3, 'two_char', 65.00),
+    ('CRE', 25, 125, 3, 'two_char', 65.00),
+    ('CRE', 26, 102, 2, 'single_char', 50.00),
+    ('CRE', 27, 104, 2, 'single_char', 50.00),
+    ('CIR', 0, 136, 4, 'permutation', 92.00),
+    ('CIR', 1, 24, 4, 'permutation', 89.00),
+    ('CIR', 2, 50, 4, 'permutation', 89.00),
+    ('CIR', 3, 30, 4, 'permutation', 86.00),
+    ('CIR', 4, 36, 4, 'permutation', 86.00),
+    ('CIR', 5, 46, 4, 'permutation', 86.00),
+    ('CIR', 6, 47, 4, 'permutation', 86.00),
+    ('CIR', 7, 49, 4, 'permutation', 86.00),
+    ('CIR', 8, 26, 4, 'permutation', 83.00),
+    ('CIR', 9, 55, 4, 'permutation', 83.00),
+    ('CIR', 10, 148, 4, 'permutation', 83.00),
+    ('CIR', 11, 155, 4, 'permutation', 83.00),
+    ('CIR', 12, 159, 4, 'permutation', 83.00),
+    ('CIR', 13, 31, 4, 'permutation', 80.00),
+    ('CIR', 14, 44, 4, 'permutation', 80.00),
+    ('CIR', 15, 40, 3, 'two_char', 75.00),
+    ('CIR', 16, 32, 3, 'two_char', 70.00),
+    ('CIR', 17, 33, 3, 'two_char', 70.00),
+    ('CIR', 18, 35, 3, 'two_char', 67.50),
+    ('CIR', 19, 37, 3, 'two_char', 67.50),
+    ('CIR', 20, 42, 3, 'two_char', 67.50),
+    ('CIR', 21, 43, 3, 'two_char', 67.50),
+    ('CIR', 22, 45, 3, 'two_char', 67.50),
+    ('CIR', 23, 79, 3, 'two_char', 65.00),
+    ('CIR', 24, 82, 3, 'two_char', 65.00),
+    ('CIR', 25, 83, 3, 'two_char', 65.00),
+    ('CIR', 26, 84, 3, 'two_char', 65.00),
+    ('CIR', 27, 85, 3, 'two_char', 65.00),
+    ('CIR', 28, 52, 3, 'two_char', 62.50),
+    ('CIR', 29, 62, 3, 'two_char', 62.50),
+    ('CIR', 30, 151, 3, 'two_char', 62.50),
+    ('CIR', 31, 17, 2, 'single_char', 50.00),
+    ('CIR', 32, 102, 2, 'single_char', 45.00),
+    ('CIR', 33, 104, 2, 'single_char', 45.00),
+    ('CIA', 0, 39, 4, 'permutation', 89.00),
+    ('CIA', 1, 20, 4, 'permutation', 80.00),
+    ('CIA', 2, 40, 3, 'two_char', 75.00),
+    ('CIA', 3, 15, 3, 'two_char', 72.50),
+    ('CIA', 4, 32, 3, 'two_char', 70.00),
+    ('CIA', 5, 33, 3, 'two_char', 70.00),
+    ('CIA', 6, 17, 2, 'single_char', 50.00),
+    ('CIS', 0, 63, 4, 'permutation', 89.00),
+    ('CIS', 1, 110, 4, 'permutation', 86.00),
+    ('CIS', 2, 73, 4, 'permutation', 80.00),
+    ('CIS', 3, 120, 4, 'permutation', 80.00),
+    ('CIS', 4, 40, 3, 'two_char', 75.00),
+    ('CIS', 5, 23, 3, 'two_char', 72.50),
+    ('CIS', 6, 32, 3, 'two_char', 70.00),
+    ('CIS', 7, 33, 3, 'two_char', 70.00),
+    ('CIS', 8, 106, 3, 'two_char', 67.50),
+    ('CIS', 9, 6, 3, 'two_char', 62.50),
+    ('CIS', 10, 7, 3, 'two_char', 62.50),
+    ('CIS', 11, 9, 3, 'two_char', 62.50),
+    ('CIS', 12, 10, 3, 'two_char', 62.50),
+    ('CIS', 13, 134, 3, 'two_char', 62.50),
+    ('CIS', 14, 17, 2, 'single_char', 50.00),
+    ('CIE', 0, 41, 4, 'permutation', 92.00),
+    ('CIE', 1, 64, 4, 'permutation', 92.00),
+    ('CIE', 2, 68, 4, 'permutation', 89.00),
+    ('CIE', 3, 75, 4, 'permutation', 83.00),
+    ('CIE', 4, 40, 3, 'two_char', 75.00),
+    ('CIE', 5, 5, 3, 'two_char', 72.50),
+    ('CIE', 6, 72, 3, 'two_char', 72.50),
+    ('CIE', 7, 77, 3, 'two_char', 72.50),
+    ('CIE', 8, 32, 3, 'two_char', 70.00),
+    ('CIE', 9, 33, 3, 'two_char', 70.00),
+    ('CIE', 10, 27, 3, 'two_char', 65.00),
+    ('CIE', 11, 69, 3, 'two_char', 65.00),
+    ('CIE', 12, 114, 3, 'two_char', 65.00),
+    ('CIE', 13, 119, 3, 'two_char', 65.00),
+    ('CIE', 14, 125, 3, 'two_char', 65.00),
+    ('CIE', 15, 17, 2, 'single_char', 50.00),
+    ('CAR', 0, 80, 4, 'permutation', 83.00),
+    ('CAR', 1, 81, 4, 'permutation', 83.00),
+    ('CAR', 2, 100, 4, 'permutation', 80.00),
+    ('CAR', 3, 15, 3, 'two_char', 75.00),
+    ('CAR', 4, 93, 3, 'two_char', 67.50),
+    ('CAR', 5, 96, 3, 'two_char', 67.50),
+    ('CAR', 6, 79, 3, 'two_char', 65.00),
+    ('CAR', 7, 82, 3, 'two_char', 65.00),
+    ('CAR', 8, 83, 3, 'two_char', 65.00),
+    ('CAR', 9, 84, 3, 'two_char', 65.00),
+    ('CAR', 10, 85, 3, 'two_char', 65.00),
+    ('CAR', 11, 101, 3, 'two_char', 62.50),
+    ('CAR', 12, 103, 3, 'two_char', 62.50),
+    ('CAR', 13, 102, 2, 'single_char', 45.00),
+    ('CAR', 14, 104, 2, 'single_char', 45.00),
+    ('CAI', 0, 20, 4, 'permutation', 86.00),
+    ('CAI', 1, 39, 4, 'permutation', 83.00),
+    ('CAI', 2, 15, 3, 'two_char', 75.00),
+    ('CAI', 3, 40, 3, 'two_char', 72.50),
+    ('CAI', 4, 32, 3, 'two_char', 65.00),
+    ('CAI', 5, 33, 3, 'two_char', 65.00),
+    ('CAI', 6, 17, 2, 'single_char', 45.00),
+    ('CAS', 0, 123, 4, 'permutation', 80.00),
+    ('CAS', 1, 15, 3, 'two_char', 75.00),
+    ('CAS', 2, 23, 3, 'two_char', 72.50),
+    ('CAS', 3, 21, 3, 'two_char', 67.50),
+    ('CAS', 4, 122, 3, 'two_char', 62.50),
+    ('CAS', 5, 124, 3, 'two_char', 62.50),
+    ('CAE', 0, 15, 3, 'two_char', 75.00),
+    ('CAE', 1, 5, 3, 'two_char', 72.50),
+    ('CAE', 2, 72, 3, 'two_char', 72.50),
+    ('CAE', 3, 77, 3, 'two_char', 72.50),
+    ('CAE', 4, 94, 3, 'two_char', 67.50),
+    ('CAE', 5, 27, 3, 'two_char', 65.00),
+    ('CAE', 6, 69, 3, 'two_char', 65.00),
+    ('CAE', 7, 114, 3, 'two_char', 65.00),
+    ('CAE', 8, 119, 3, 'two_char', 65.00),
+    ('CAE', 9, 125, 3, 'two_char', 65.00),
+    ('CSR', 0, 4, 5, 'exact', 100.00),
+    ('CSR', 1, 173, 4, 'permutation', 80.00),
+    ('CSR', 2, 23, 3, 'two_char', 75.00),
+    ('CSR', 3, 8, 3, 'two_char', 67.50),
+    ('CSR', 4, 79, 3, 'two_char', 65.00),
+    ('CSR', 5, 82, 3, 'two_char', 65.00),
+    ('CSR', 6, 83, 3, 'two_char', 65.00),
+    ('CSR', 7, 84, 3, 'two_char', 65.00),
+    ('CSR', 8, 85, 3, 'two_char', 65.00),
+    ('CSR', 9, 102, 2, 'single_char', 45.00),
+    ('CSR', 10, 104, 2, 'single_char', 45.00),
+    ('CSI', 0, 73, 4, 'permutation', 86.00),
+    ('CSI', 1, 120, 4, 'permutation', 86.00),
+    ('CSI', 2, 63, 4, 'permutation', 83.00),
+    ('CSI', 3, 110, 4, 'permutation', 80.00),
+    ('CSI', 4, 23, 3, 'two_char', 75.00),
+    ('CSI', 5, 40, 3, 'two_char', 72.50),
+    ('CSI', 6, 6, 3, 'two_char', 67.50),
+    ('CSI', 7, 7, 3, 'two_char', 67.50),
+    ('CSI', 8, 9, 3, 'two_char', 67.50),
+    ('CSI', 9, 10, 3, 'two_char', 67.50),
+    ('CSI', 10, 134, 3, 'two_char', 67.50),
+    ('CSI', 11, 32, 3, 'two_char', 65.00),
+    ('CSI', 12, 33, 3, 'two_char', 65.00),
+    ('CSI', 13, 106, 3, 'two_char', 62.50),
+    ('CSI', 14, 17, 2, 'single_char', 45.00),
+    ('CSA', 0, 123, 4, 'permutation', 86.00),
+    ('CSA', 1, 23, 3, 'two_char', 75.00),
+    ('CSA', 2, 15, 3, 'two_char', 72.50),
+    ('CSA', 3, 122, 3, 'two_char', 67.50),
+    ('CSA', 4, 124, 3, 'two_char', 67.50),
+    ('CSA', 5, 21, 3, 'two_char', 62.50),
+    ('CSE', 0, 14, 5, 'exact', 100.00),
+    ('CSE', 1, 145, 4, 'permutation', 92.00),
+    ('CSE', 2, 111, 4, 'permutation', 86.00),
+    ('CSE', 3, 131, 4, 'permutation', 86.00),
+    ('CSE', 4, 70, 4, 'permutation', 83.00),
+    ('CSE', 5, 109, 4, 'permutation', 83.00),
+    ('CSE', 6, 115, 4, 'permutation', 83.00),
+    ('CSE', 7, 118, 4, 'permutation', 83.00),
+    ('CSE', 8, 127, 4, 'permutation', 83.00),
+    ('CSE', 9, 29, 4, 'permutation', 80.00),
+    ('CSE', 10, 130, 4, 'permutation', 80.00),
+    ('CSE', 11, 140, 4, 'permutation', 80.00),
+    ('CSE', 12, 192, 4, 'permutation', 80.00),
+    ('CSE', 13, 23, 3, 'two_char', 75.00),
+    ('CSE', 14, 5, 3, 'two_char', 72.50),
+    ('CSE', 15, 72, 3, 'two_char', 72.50),
+    ('CSE', 16, 77, 3, 'two_char', 72.50),
+    ('CSE', 17, 28, 3, 'two_char', 67.50),
+    ('CSE', 18, 139, 3, 'two_char', 67.50),
+    ('CSE', 19, 27, 3, 'two_char', 65.00),
+    ('CSE', 20, 69, 3, 'two_char', 65.00),
+    ('CSE', 21, 114, 3, 'two_char', 65.00),
+    ('CSE', 22, 119, 3, 'two_char', 65.00),
+    ('CSE', 23, 125, 3, 'two_char', 65.00),
+    ('CER', 0, 25, 5, 'exact', 100.00),
+    ('CER', 1, 66, 5, 'exact', 100.00),
+    ('CER', 2, 146, 5, 'exact', 100.00),
+    ('CER', 3, 161, 4, 'permutation', 92.00),
+    ('CER', 4, 65, 4, 'permutation', 89.00),
+    ('CER', 5, 128, 4, 'permutation', 86.00),
+    ('CER', 6, 153, 4, 'permutation', 86.00),
+    ('CER', 7, 186, 4, 'permutation', 83.00),
+    ('CER', 8, 190, 4, 'permutation', 83.00),
+    ('CER', 9, 59, 4, 'permutation', 80.00),
+    ('CER', 10, 170, 4, 'permutation', 80.00),
+    ('CER', 11, 179, 4, 'permutation', 80.00),
+    ('CER', 12, 5, 3, 'two_char', 75.00),
+    ('CER', 13, 72, 3, 'two_char', 75.00),
+    ('CER', 14, 77, 3, 'two_char', 75.00),
+    ('CER', 15, 27, 3, 'two_char', 70.00),
+    ('CER', 16, 69, 3, 'two_char', 70.00),
+    ('CER', 17, 114, 3, 'two_char', 70.00),
+    ('CER', 18, 119, 3, 'two_char', 70.00),
+    ('CER', 19, 125, 3, 'two_char', 70.00),
+    ('CER', 20, 79, 3, 'two_char', 65.00),
+    ('CER', 21, 82, 3, 'two_char', 65.00),
+    ('CER', 22, 83, 3, 'two_char', 65.00),
+    ('CER', 23, 84, 3, 'two_char', 65.00),
+    ('CER', 24, 85, 3, 'two_char', 65.00),
+    ('CER', 25, 143, 3, 'two_char', 62.50),
+    ('CER', 26, 102, 2, 'single_char', 45.00),
+    ('CER', 27, 104, 2, 'single_char', 45.00),
+    ('CEI', 0, 41, 5, 'exact', 100.00),
+    ('CEI', 1, 64, 5, 'exact', 100.00),
+    ('CEI', 2, 75, 4, 'permutation', 89.00),
+    ('CEI', 3, 68, 4, 'permutation', 83.00),
+    ('CEI', 4, 5, 3, 'two_char', 75.00),
+    ('CEI', 5, 72, 3, 'two_char', 75.00),
+    ('CEI', 6, 77, 3, 'two_char', 75.00),
+    ('CEI', 7, 40, 3, 'two_char', 72.50),
+    ('CEI', 8, 27, 3, 'two_char', 70.00),
+    ('CEI', 9, 69, 3, 'two_char', 70.00),
+    ('CEI', 10, 114, 3, 'two_char', 70.00),
+    ('CEI', 11, 119, 3, 'two_char', 70.00),
+    ('CEI', 12, 125, 3, 'two_char', 70.00),
+    ('CEI', 13, 32, 3, 'two_char', 65.00),
+    ('CEI', 14, 33, 3, 'two_char', 65.00),
+    ('CEI', 15, 17, 2, 'single_char', 45.00),
+    ('CEA', 0, 5, 3, 'two_char', 75.00),
+    ('CEA', 1, 72, 3, 'two_char', 75.00),
+    ('CEA', 2, 77, 3, 'two_char', 75.00),
+    ('CEA', 3, 15, 3, 'two_char', 72.50),
+    ('CEA', 4, 27, 3, 'two_char', 70.00),
+    ('CEA', 5, 69, 3, 'two_char', 70.00),
+    ('CEA', 6, 114, 3, 'two_char', 70.00),
+    ('CEA', 7, 119, 3, 'two_char', 70.00),
+    ('CEA', 8, 125, 3, 'two_char', 70.00),
+    ('CEA', 9, 94, 3, 'two_char', 62.50),
+    ('CES', 0, 145, 5, 'exact', 100.00),
+    ('CES', 1, 14, 4, 'permutation', 92.00),
+    ('CES', 2, 70, 4, 'permutation', 89.00),
+    ('CES', 3, 109, 4, 'permutation', 89.00),
+    ('CES', 4, 115, 4, 'permutation', 89.00),
+    ('CES', 5, 118, 4, 'permutation', 89.00),
+    ('CES', 6, 127, 4, 'permutation', 89.00),
+    ('CES', 7, 29, 4, 'permutation', 86.00),
+    ('CES', 8, 130, 4, 'permutation', 86.00),
+    ('CES', 9, 140, 4, 'permutation', 86.00),
+    ('CES', 10, 192, 4, 'permutation', 86.00),
+    ('CES', 11, 111, 4, 'permutation', 80.00),
+    ('CES', 12, 131, 4, 'permutation', 80.00),
+    ('CES', 13, 5, 3, 'two_char', 75.00),
+    ('CES', 14, 72, 3, 'two_char', 75.00),
+    ('CES', 15, 77, 3, 'two_char', 75.00),
+    ('CES', 16, 23, 3, 'two_char', 72.50),
+    ('CES', 17, 27, 3, 'two_char', 70.00),
+    ('CES', 18, 69, 3, 'two_char', 70.00),
+    ('CES', 19, 114, 3, 'two_char', 70.00),
+    ('CES', 20, 119, 3, 'two_char', 70.00),
+    ('CES', 21, 125, 3, 'two_char', 70.00),
+    ('CES', 22, 28, 3, 'two_char', 62.50),
+    ('CES', 23, 139, 3, 'two_char', 62.50);
 
+-- 200 job records inserted
 
 -- Commit transaction
 COMMIT;
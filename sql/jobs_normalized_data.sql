@@ -0,0 +1,3148 @@
+-- =====================================================
+-- JOBS NORMALIZED DATA
+-- job_specializations, job_tasks and job_work_areas rows
+-- Run after jobs_data_insertion.sql (job ids follow the same order)
+-- =====================================================
+
+SET AUTOCOMMIT = 0;
+
+-- Clear existing child rows (if any)
+DELETE FROM job_specializations;
+DELETE FROM job_tasks;
+DELETE FROM job_work_areas;
+
+-- Jobs 1 to 50
+INSERT INTO job_specializations (job_id, sort_order, specialization) VALUES
+    (1, 0, 'Phát thanh viên thời sự'),
+    (1, 1, 'Phát thanh viên thể thao'),
+    (1, 2, 'Phát thanh viên thời tiết'),
+    (2, 0, 'Nhân chủng học ứng dụng'),
+    (2, 1, 'Nhân chủng học trong lĩnh vực sinh học/vật lí'),
+    (2, 2, 'Nhân chủng học ngôn ngữ'),
+    (2, 3, 'Nhân chủng học xã hội/văn hóa'),
+    (3, 0, 'Khảo cổ học ứng dụng'),
+    (3, 1, 'Khảo cổ sinh học'),
+    (3, 2, 'Số hóa khảo cổ học'),
+    (3, 3, 'Khảo cổ dân tộc học'),
+    (3, 4, 'Khảo cổ học thực nghiệm'),
+    (3, 5, 'Khảo cổ học địa chất'),
+    (3, 6, 'Khảo cổ học lịch sử'),
+    (4, 0, 'Cổ vật và chữ viết cổ'),
+    (4, 1, 'Công nghệ thông tin lưu trữ'),
+    (4, 2, 'Quản lí thông tin'),
+    (4, 3, 'Quản lí hồ sơ'),
+    (4, 4, 'An toàn và bảo mật thông tin'),
+    (5, 0, 'Chuyên sâu theo loại tổ chức (ví dụ: tổ chức từ thiện, tổ chức kinh doanh, tổ chức giáo dục...)'),
+    (5, 1, 'Chuyên sâu theo lĩnh vực luật liên quan đến doanh nghiệp (ví dụ: thuế, cổ phần hóa, mua bán sáp nhập...)'),
+    (6, 0, 'Dạy học: lĩnh vực chuyên sâu chủ yếu là liên quan đến các ngành, nghề đào tạo chuyên môn sâu như Kinh tế, tài chính, ngôn ngữ, các lĩnh vực khoa học tự nhiên, khoa học xã hội, công nghệ, dược, các môn cơ sở ngành'),
+    (6, 1, 'Quản lí: Giảng viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)'),
+    (7, 0, 'Dạy học: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: Cao đẳng Giao thông vận tải, giảng dạy các học phần: Cơ lí thuyết, Hình họa – vẽ kĩ thuật, …'),
+    (7, 1, 'Quản lí: Giảng viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)'),
+    (8, 0, 'Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến học phần giảng dạy. Ví dụ: Thực hành lái xe nâng, thực hành gấp khăn, …'),
+    (8, 1, 'Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)'),
+    (9, 0, 'Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, vật lí, toán...'),
+    (9, 1, 'Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường (ví dụ: hiệu phó, hiệu trưởng)'),
+    (10, 0, 'Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, vật lí, toán...'),
+    (10, 1, 'Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường (ví dụ: hiệu phó, hiệu trưởng)'),
+    (11, 0, 'Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến môn học. Ví dụ: tiếng Anh, tiếng Pháp, tiếng Tây ban Nha, ...'),
+    (11, 1, 'Quản lí: Giáo viên Ngôn ngữ cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, tổ, trường... (ví dụ: tổ trưởng chuyên môn, hiệu trưởng)'),
+    (12, 0, 'Quản trị khủng hoảng'),
+    (12, 1, 'Quan hệ Chính phủ (vận động hành lang)'),
+    (12, 2, 'Chủ đầu tư và các mối quan hệ tài chính'),
+    (12, 3, 'Truyền thông tiếp thị'),
+    (12, 4, 'Quan hệ với giới truyền thông'),
+    (12, 5, 'Chuẩn bị các ấn phẩm'),
+    (12, 6, 'Các chiến dịch quảng bá'),
+    (12, 7, 'Sự kiện xúc tiến đặc biệt'),
+    (13, 0, 'Hiến pháp'),
+    (13, 1, 'Luật hành chính'),
+    (13, 2, 'Luật doanh nghiệp'),
+    (13, 3, 'Luật dân sự'),
+    (13, 4, 'Luật thương mại'),
+    (13, 5, 'Luật hình sự'),
+    (13, 6, 'Luật môi trường'),
+    (13, 7, 'Luật y tế'),
+    (13, 8, 'Luật sở hữu trí tuệ'),
+    (14, 0, 'Tự động hóa thư viện và xây dựng mạng lưới'),
+    (14, 1, 'Thư viện kĩ thuật số'),
+    (14, 2, 'Mục lục và tóm tắt'),
+    (14, 3, 'Quản lí nội dung'),
+    (14, 4, 'Các công cụ công nghệ thông tin'),
+    (15, 0, 'Biên tập sách'),
+    (15, 1, 'Biên tập tạp chí'),
+    (15, 2, 'Biên tập báo'),
+    (15, 3, 'Biên tập trên internet'),
+    (16, 0, 'Nhân chủng học'),
+    (16, 1, 'Kinh tế học'),
+    (16, 2, 'Lịch sử'),
+    (16, 3, 'Triết học'),
+    (16, 4, 'Khoa học chính trị'),
+    (16, 5, 'Tâm lí học'),
+    (16, 6, 'Xã hội học'),
+    (17, 0, 'Các thời kì, triều đại trong lịch sử Việt Nam (ví dụ: triều Trần, triều Lê, triều Nguyễn)'),
+    (17, 1, 'Các nhân vật lịch sử cụ thể VN và TG (ví dụ: Trần Hưng Đạo, Hồ Chí Minh, Võ Nguyên Giáp, Lê Nin...)'),
+    (17, 2, 'Các sự kiện lịch sử VN và TG (ví dụ: các cuộc cách mạng, chiến tranh, hiệp ước hòa bình, dịch bệnh lớn trong lịch sử)'),
+    (17, 3, 'Liên kết với các môn khoa học khác như kinh tế học, nhân chủng học hay xã hội học'),
+    (17, 4, 'Lịch sử các quốc gia, khu vực địa lí, theo thời gian (ví dụ: lịch sử Việt Nam, lịch sử châu Âu...) – Lịch sử VN, Lịch sử thế giới (cận đại, trung đại...)'),
+    (18, 0, 'Viết truyện ngắn, tiểu thuyết'),
+    (18, 1, 'Viết kịch bản phim tài liệu'),
+    (18, 2, 'Viết kịch bản kịch'),
+    (18, 3, 'Viết kịch bản phim'),
+    (18, 4, 'Chỉnh sửa kịch bản'),
+    (19, 0, 'Báo điện tử'),
+    (19, 1, 'Báo thời trang'),
+    (19, 2, 'Báo ảnh'),
+    (19, 3, 'Báo in'),
+    (19, 4, 'Báo thể thao'),
+    (19, 5, 'Tranh biếm họa hoặc minh họa cho báo chí'),
+    (20, 0, 'Ngôn ngữ học'),
+    (20, 1, 'Ngôn ngữ học xã hội'),
+    (20, 2, 'Ngôn ngữ học tâm lí'),
+    (20, 3, 'Giảng dạy ngôn ngữ'),
+    (20, 4, 'Biên dịch và phiên dịch'),
+    (20, 5, 'Các rối loạn về khả năng học ngôn ngữ'),
+    (21, 0, 'Chuyên về một ngôn ngữ cụ thể (ví dụ: ngôn ngữ cổ, tiếng Anh, tiếng Nhật...)'),
+    (21, 1, 'Chuyên về một lĩnh vực cụ thể (ví dụ: dịch về pháp luật, y tế, khoa học, công nghệ, văn học, thương mại, du lịch, hàng không...)'),
+    (22, 0, 'Phim ngắn dùng cho mục đích quảng cáo'),
+    (22, 1, 'Phim tài liệu'),
+    (22, 2, 'Phim truyện'),
+    (22, 3, 'Kịch'),
+    (22, 4, 'Ca nhạc'),
+    (23, 0, 'Các bộ phận cụ thể của hệ thống phân loại (ví dụ: hồ sơ khoa khám bệnh, khoa tim mạch...)'),
+    (23, 1, 'Các hệ thống công nghệ lưu trữ và truy cập (ví dụ: hệ thống hồ sơ giấy, hệ thống hồ sơ điện tử...)'),
+    (23, 2, 'Các đối tượng lập hồ sơ cụ thể (ví dụ: hồ sơ bệnh nhân, hồ sơ bệnh học...)'),
+    (24, 0, 'Kĩ thuật viện bảo tàng thường được đào tạo cơ bản trong một ngành cụ thể (ví dụ: nhân chủng học, nghệ thuật, nghệ thuật trang trí, lịch sử tự nhiên, lịch sử xã hội, khoa học hoặc công nghệ). Sau đó, họ được chuyên môn hóa trong việc bảo quản và trưng bày các hiện vật thuộc về ngành đó. Một kĩ thuật viên viện bảo tàng học được đào tạo cơ bản về động vật học có thể chuyên về động vật thời tiền sử, hoặc một nhà nhân loại học có thể chuyên về các loại vũ khí của một nền văn hóa nhất định...'),
+    (25, 0, 'Trợ lí hành chính'),
+    (25, 1, 'Quản trị viên văn phòng'),
+    (25, 2, 'Nhân viên lễ tân'),
+    (25, 3, 'Thư kí trong một loại hình doanh nghiệp cụ thể (ví dụ thư kí luật, thư kí y tế)'),
+    (25, 4, 'Tốc kí'),
+    (25, 5, 'Quản lí hành chính lưu trữ'),
+    (25, 6, 'Thư kí chuyên ngành máy tính'),
+    (26, 0, 'Biên tập âm thanh'),
+    (26, 1, 'Biên tập các tài liệu nghe nhìn'),
+    (26, 2, 'Biên tập phim'),
+    (26, 3, 'Sản xuất phim'),
+    (26, 4, 'Trợ lí sản xuất'),
+    (26, 5, 'Nhà điều hành đài phát thanh'),
+    (26, 6, 'Nhà điều hành truyền hình'),
+    (26, 7, 'Kĩ thuật sản xuất chương trình truyền hình'),
+    (27, 0, 'Dịch vụ khách hàng'),
+    (27, 1, 'Phụ trách các loại sản phẩm cụ thể'),
+    (27, 2, 'Bán hàng và tiếp thị'),
+    (28, 0, 'Các loại hình cụ thể của các tour du lịch (ví dụ: tour du lịch lịch sử, mạo hiểm, du lịch tham quan…)'),
+    (28, 1, 'Các khu vực, địa điểm cụ thể (ví dụ: một thành phố'),
+    (28, 2, 'một khu vực có thiên nhiên, địa hình đẹp, lạ'),
+    (28, 3, 'một di tích lịch sử, văn hóa, tự nhiên)'),
+    (29, 0, 'Trợ giúp bán hàng'),
+    (29, 1, 'Phụ trách một quầy, mặt hàng hoặc nhóm mặt hàng cụ thể (ví dụ: hóa mĩ phẩm, thực phẩm đông lạnh, sữa...)'),
+    (29, 2, 'Giới thiệu sản phẩm'),
+    (30, 0, 'Công nghệ sản xuất chất dẻo từ Polyme'),
+    (30, 1, 'Các hoá chất đặc biệt'),
+    (30, 2, 'Y sinh học'),
+    (30, 3, 'Các thiết bị y khoa'),
+    (30, 4, 'Ống tuỳ chỉnh'),
+    (30, 5, 'Kĩ thuật sản xuất nhựa từ chất dẻo polyme'),
+    (31, 0, 'Công nghệ thực phẩm'),
+    (31, 1, 'Công nghệ sau thu hoạch'),
+    (31, 2, 'Công nghệ chế biến thủy sản'),
+    (31, 3, 'Quản lí chất lượng lương thực, thực phẩm'),
+    (31, 4, 'Kiểm nghiệm chất lượng lương thực, thực phẩm'),
+    (31, 5, 'Kiểm tra chất lượng thực phẩm'),
+    (31, 6, 'Chế biến dầu thực vật'),
+    (31, 7, 'Bảo quản và chế biến các sản phẩm thuỷ sản'),
+    (31, 8, 'Chế biến sữa'),
+    (31, 9, 'Sản xuất bánh kẹo'),
+    (32, 0, 'Kĩ thuật  phần mềm'),
+    (33, 0, 'Tài chính - ngân hàng'),
+    (33, 1, 'Đầu tư ngân hàng'),
+    (33, 2, 'Mua bán và sáp nhập'),
+    (33, 3, 'Quản lí danh mục đầu tư'),
+    (33, 4, 'Chuyên gia phân tích, đánh giá'),
+    (33, 5, 'Chứng khoán và trái phiếu'),
+    (33, 6, 'Tài chính doanh nghiệp'),
+    (33, 7, 'Tín dụng tài chính.'),
+    (34, 0, 'Thiên văn học'),
+    (34, 1, 'Khoa học vũ trụ và ứng dụng'),
+    (35, 0, 'Khí tượng học'),
+    (36, 0, 'Phân tích hoá học'),
+    (36, 1, 'Hoá học ăn mòn'),
+    (36, 2, 'Hoá học môi trường'),
+    (36, 3, 'Hoá học pháp lí'),
+    (36, 4, 'Hoá học công nghiệp'),
+    (36, 5, 'Hoá học vô cơ'),
+    (36, 6, 'Hoá học hữu cơ'),
+    (36, 7, 'Hoá dược phẩm'),
+    (36, 8, 'Hoá học vật lí'),
+    (36, 9, 'Hoá học polymer'),
+    (36, 10, 'Hoá học đất đai'),
+    (37, 0, 'Địa chất học'),
+    (37, 1, 'Khoa học trái đất'),
+    (38, 0, 'Địa lí học'),
+    (38, 1, 'Bản đồ học'),
+    (38, 2, 'Địa lí tự nhiên'),
+    (38, 3, 'Khí tượng học'),
+    (38, 4, 'Thủy văn'),
+    (39, 0, 'Toán học'),
+    (39, 1, 'Toán cơ'),
+    (39, 2, 'Toán ứng dụng'),
+    (40, 0, 'Thống kê kinh tế, xã hội'),
+    (40, 1, 'Thống kê kinh doanh'),
+    (41, 0, 'Toán ứng dụng (toán tài chính, toán kinh tế)'),
+    (41, 1, 'Bảo hiểm'),
+    (42, 0, 'Sinh vật học'),
+    (42, 1, 'Động vật học'),
+    (42, 2, 'Thực vật học'),
+    (42, 3, 'Vi sinh'),
+    (42, 4, 'Sinh học ứng dụng (công nghệ sinh học)'),
+    (43, 0, 'Hải dương học - hóa học'),
+    (43, 1, 'Hải dương học - địa chất'),
+    (43, 2, 'Hải dương học - địa vật lí'),
+    (43, 3, 'Hải dương học - vật lí'),
+    (44, 0, 'Công nghệ sinh học'),
+    (45, 0, 'Kĩ thuật y sinh'),
+    (45, 1, 'Kĩ thuật hình ảnh y học'),
+    (45, 2, 'Thiết bị sinh học'),
+    (45, 3, 'Vật liệu sinh học và cơ chế sinh học kĩ thuật'),
+    (45, 4, 'Tế bào, mô và kĩ thuật di truyền'),
+    (45, 5, 'Kĩ thuật lâm sàng'),
+    (45, 6, 'Hình ảnh y tế'),
+    (45, 7, 'Phẫu thuật chỉnh hình'),
+    (45, 8, 'Kĩ thuật phục hồi chức năng'),
+    (45, 9, 'Kĩ thuật điện tử y tế'),
+    (45, 10, 'Kĩ thuật thiết bị điện tử y tế'),
+    (46, 0, 'Nông nghiệp'),
+    (46, 1, 'Khuyến nông'),
+    (46, 2, 'Chăn nuôi'),
+    (46, 3, 'Nông học'),
+    (46, 4, 'Khoa học cây trồng'),
+    (46, 5, 'Bảo vệ thực vật'),
+    (46, 6, 'Công nghệ rau hoa quả và cảnh quan'),
+    (46, 7, 'Kinh doanh nông nghiệp'),
+    (46, 8, 'Kinh tế nông nghiệp'),
+    (46, 9, 'Phát triển nông thôn'),
+    (47, 0, 'Kĩ thuật khai thác thủy sản'),
+    (47, 1, 'Nuôi trồng thủy sản'),
+    (47, 2, 'Bệnh học thủy sản'),
+    (47, 3, 'Quản lí nguồn lợi thủy sản'),
+    (48, 0, 'Lâm nghiệp'),
+    (48, 1, 'Lâm nghiệp và đô thị'),
+    (48, 2, 'Lâm sinh'),
+    (48, 3, 'Quản lí tài nguyên rừng'),
+    (48, 4, 'Kinh tế tài nguyên thiên nhiên'),
+    (48, 5, 'Công nghệ chế biến lâm sản'),
+    (48, 6, 'Thương mại lâm nghiệp'),
+    (48, 7, 'Kinh tế học lâm nghiệp'),
+    (48, 8, 'Quản lí rừng'),
+    (48, 9, 'Lâm nghiệp xã hội'),
+    (48, 10, 'Khoa học bảo tồn thiên nhiên hoang dã'),
+    (48, 11, 'Khoa học và kĩ thuật gỗ'),
+    (49, 0, 'Khoa học môi trường'),
+    (49, 1, 'Khoa học đất'),
+    (49, 2, 'Công nghệ kĩ thuật môi trường'),
+    (49, 3, 'Kĩ thuật môi trường'),
+    (49, 4, 'Kiểm soát và BVMT'),
+    (49, 5, 'Kinh tế tài nguyên và môi trường'),
+    (49, 6, 'Kinh tế tài nguyên thiên nhiên'),
+    (49, 7, 'Quản lí đất đai'),
+    (49, 8, 'Quản lí tài nguyên và môi trường'),
+    (49, 9, 'Quản lí chất thải'),
+    (49, 10, 'BVMT đô thị'),
+    (49, 11, 'BVMT công nghiệp'),
+    (49, 12, 'BVMT biển'),
+    (49, 13, 'Xử lí sự cố tràn dầu'),
+    (49, 14, 'Xử lí chất thải'),
+    (50, 0, 'Quản lí công nghiệp'),
+    (50, 1, 'Kĩ thuật hệ thống công nghiệp'),
+    (50, 2, 'Kĩ thuật công nghiệp');
+INSERT INTO job_tasks (job_id, sort_order, task) VALUES
+    (1, 0, 'Đọc bản tin và các thông báo khác trên đài phát thanh, đài truyền hình'),
+    (1, 1, 'Giới thiệu diễn viên, nghệ sĩ biểu diễn, người được phỏng vấn và thực hiện các thông báo liên quan trên đài phát thanh, truyền hình hoặc trong nhà hát và các cơ sở khác'),
+    (1, 2, 'Phỏng vấn người ở những nơi công cộng cho các chương trình trên đài phát thanh và truyền hình'),
+    (2, 0, 'Hiểu biết và áp dụng các lí thuyết về nhân chủng học để hiểu hành vi con người'),
+    (2, 1, 'Giảng dạy lí thuyết nhân chủng học cho học sinh, sinh viên'),
+    (2, 2, 'Áp dụng các phương pháp nhân chủng học đặc biệt như quan sát người tham dự để tiến hành quan sát cộng đồng, thu thập và phân tích thông tin về hành vi xã hội, văn hóa của con người'),
+    (2, 3, 'Phát hiện, thu thập và nghiên cứu các hiện vật, phương tiện truyền thông, thậm chí nghiên cứu cả đặc tính sinh học hoặc từng nhóm người cụ thể'),
+    (2, 4, 'Sử dụng dữ liệu thu thập thông qua quan sát để xác nhận hoặc phản biện các lí thuyết, nhận định và chính sách hiện có'),
+    (2, 5, 'Phát triển các lí thuyết mới để giải thích hành vi của con người'),
+    (3, 0, 'Thăm những di tích cổ, tiếp xúc với các tài liệu hiện vật đã được con người sử dụng từ rất lâu'),
+    (3, 1, 'Tiến hành thăm dò, khảo sát và khai quật có hệ thống các vùng đất xa xưa để khám phá thành phố, công trình cổ và các cổ vật khác'),
+    (3, 2, 'Nghiên cứu các di tích hiện vật phát hiện được và công bố báo cáo về tầm quan trọng lịch sử'),
+    (3, 3, 'Chuẩn bị ca-ta-lô về những cổ vật đã thu thập để triển lãm trong bảo tàng'),
+    (3, 4, 'Giảng bài cho học sinh, sinh viên và những người khác quan tâm đến khảo cổ học'),
+    (4, 0, 'Nghiên cứu, đánh giá, phát triển, tổ chức và bảo tồn các tài liệu có ý nghĩa lịch sử và có giá trị như văn bản chính phủ, các giấy tờ cá nhân, tranh ảnh, ghi âm và phim tư liệu'),
+    (4, 1, 'Thực hiện việc chuẩn bị các danh mục và thư mục ấn phẩm, các bản vi phim và các tài liệu tham khảo khác của các tài liệu thu thập được và đem đến cho người sử dụng'),
+    (4, 2, 'Nghiên cứu bản gốc, phân phối và sử dụng các vật liệu và đồ dùng có lợi ích văn hóa và lịch sử'),
+    (4, 3, 'Tổ chức, phát triển và duy trì bộ sưu tập các đồ dùng mang tính nghệ thuật, văn hóa, khoa học và có ý nghĩa lịch sử tại bảo tàng và triển lãm nghệ thuật'),
+    (4, 4, 'Thực hiện phân loại và ghi mục lục các bộ sưu tập bảo tàng và triển lãm nghệ thuật và tổ chức trưng bày'),
+    (4, 5, 'Chuẩn bị các tài liệu và báo cáo học thuật'),
+    (5, 0, 'Tiến hành nghiên cứu, tập hợp số liệu, văn bản pháp lí và văn bản chuyên môn liên quan đến công việc của tổ chức'),
+    (5, 1, 'Làm dự thảo các báo cáo, văn bản theo yêu cầu của lãnh đạo'),
+    (5, 2, 'Tiếp nhận và xử lí yêu cầu của khách lạ cần gặp người phù hợp trong tổ chức'),
+    (5, 3, 'Hỗ trợ lập kế hoạch và chuẩn bị họp, hội nghị, hội đàm trực tiếp hoặc điện tử điện thoại'),
+    (5, 4, 'Chuẩn bị các cuộc họp của các lãnh đạo và ủy ban cấp cao'),
+    (5, 5, 'Trả lời các câu hỏi của công chúng'),
+    (5, 6, 'Đánh các văn bản tài liệu mật trên hệ thống soạn thảo văn bản'),
+    (5, 7, 'Hỗ trợ hành chính văn phòng cho lãnh đạo cấp cao như soạn thảo thư từ, văn bản, xử lí thư từ, điện thoại, fax đến và đi, tiếp khách, đặt lịch họp, lưu tài liệu, chuẩn bị văn phòng phẩm...'),
+    (5, 8, 'Hướng dẫn, đào tạo và/ giám sát thư kí cấp thấp hơn nếu được giao'),
+    (6, 0, 'Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học nghiên cứu theo yêu cầu'),
+    (6, 1, 'Giảng dạy và tổ chức hướng dẫn, thảo luận, và thí nghiệm'),
+    (6, 2, 'Khuyến khích sinh viên thảo luận và tư duy độc lập'),
+    (6, 3, 'Giám sát, nếu cần, các công tác thí nghiệm và thực hành của sinh viên'),
+    (6, 4, 'Quản lí, đánh giá và chấm điểm các bài kiểm tra'),
+    (6, 5, 'Chỉ dẫn sinh viên và các thành viên trong khoa nghiên cứu'),
+    (6, 6, 'Nghiên cứu và phát triển các khái niệm, lí thuyết và các biện pháp hoạt động để ứng dụng trong lĩnh vực chuyên môn và các lĩnh vực khác'),
+    (6, 7, 'Chuẩn bị tài liệu, sách báo, sách giảng dạy'),
+    (6, 8, 'Tham gia các cuộc hội thảo và thảo luận'),
+    (6, 9, 'Tham gia quá trình quyết định liên quan đến các vấn đề về khoa, ngân sách, và các chính sách khác'),
+    (6, 10, 'Trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề'),
+    (6, 11, 'Thực hiện các công việc liên quan khác'),
+    (6, 12, 'Giám sát các giáo viên khác'),
+    (7, 0, 'Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học nghiên cứu theo yêu cầu'),
+    (7, 1, 'Giảng dạy và tổ chức hướng dẫn, thảo luận, và thí nghiệm'),
+    (7, 2, 'Khuyến khích sinh viên thảo luận và tư duy độc lập'),
+    (7, 3, 'Giám sát, nếu cần, các công tác thí nghiệm và thực hành của sinh viên'),
+    (7, 4, 'Quản lí, đánh giá và chấm điểm các bài kiểm tra'),
+    (7, 5, 'Chỉ dẫn sinh viên và các thành viên trong khoa nghiên cứu'),
+    (7, 6, 'Nghiên cứu và phát triển các khái niệm, lí thuyết và các biện pháp hoạt động để ứng dụng trong lĩnh vực chuyên môn và các lĩnh vực khác'),
+    (7, 7, 'Chuẩn bị tài liệu, sách báo, sách giảng dạy'),
+    (7, 8, 'Tham gia các cuộc hội thảo và thảo luận'),
+    (7, 9, 'Tham gia quá trình quyết định liên quan đến các vấn đề về khoa, ngân sách, và các chính sách khác'),
+    (7, 10, 'Trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề'),
+    (7, 11, 'Thực hiện các công việc liên quan khác'),
+    (7, 12, 'Giám sát các giáo viên khác'),
+    (8, 0, 'Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học'),
+    (8, 1, 'Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa đào tạo, hướng nghiệp và nghiên cứu theo yêu cầu'),
+    (8, 2, 'Chuẩn bị, phân công và chữa bài tập'),
+    (8, 3, 'Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh'),
+    (8, 4, 'Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh'),
+    (8, 5, 'Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức'),
+    (8, 6, 'Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề hoặc câu lạc bộ'),
+    (8, 7, 'Giảng dạy cá nhân nếu cần'),
+    (8, 8, 'Thực hiện các công việc liên quan khác'),
+    (8, 9, 'Giám sát các giáo viên khác'),
+    (9, 0, 'Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học'),
+    (9, 1, 'Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp và nghiên cứu theo yêu cầu'),
+    (9, 2, 'Chuẩn bị, phân công và chữa bài tập'),
+    (9, 3, 'Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh'),
+    (9, 4, 'Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh'),
+    (9, 5, 'Dạy đọc, viết và các môn cơ bản khác cho người lớn'),
+    (9, 6, 'Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức'),
+    (9, 7, 'Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...'),
+    (9, 8, 'Giảng dạy cá nhân nếu cần'),
+    (9, 9, 'Hướng dẫn các hoạt động ngoại khóa'),
+    (10, 0, 'Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học'),
+    (10, 1, 'Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp, nghiên cứu theo yêu cầu'),
+    (10, 2, 'Chuẩn bị, phân công và chữa bài tập'),
+    (10, 3, 'Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh'),
+    (10, 4, 'Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh'),
+    (10, 5, 'Dạy đọc, viết và các môn cơ bản khác cho người lớn'),
+    (10, 6, 'Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức'),
+    (10, 7, 'Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...'),
+    (10, 8, 'Giảng dạy cá nhân nếu cần'),
+    (11, 0, 'Giảng dạy môn học của mình và giám sát công việc và qui định của lớp học'),
+    (11, 1, 'Thiết kế và chỉnh sửa chương trình giảng dạy và chuẩn bị các khóa học, hướng nghiệp, nghiên cứu theo yêu cầu'),
+    (11, 2, 'Chuẩn bị, phân công và chữa bài tập'),
+    (11, 3, 'Quản lí, chấm điểm bài kiểm tra và bài thi để đánh giá tiến bộ của học sinh'),
+    (11, 4, 'Chuẩn bị báo cáo về công tác học sinh và liên lạc với các giáo viên khác và cha mẹ học sinh'),
+    (11, 5, 'Dạy đọc, viết và nói'),
+    (11, 6, 'Tham gia các cuộc họp liên quan đến chính sách giáo dục và tổ chức'),
+    (11, 7, 'Tổ chức và trợ giúp các hoạt động ngoại khóa như thảo luận chuyên đề, câu lạc bộ, tham quan...'),
+    (11, 8, 'Giảng dạy cá nhân nếu cần'),
+    (12, 0, 'Duy trì thông tin liên lạc giữa tổ chức và khách hàng của họ để tăng cường hiểu biết và uy tín'),
+    (12, 1, 'Xây dựng, biên tập và phân phối bản thông tin định kì để công bố các hoạt động, phát hành thông cáo báo chí để giới thiệu các hoạt động của tổ chức'),
+    (12, 2, 'Theo dõi sát tin tức, báo chí và các phương tiện truyền thông khác, lưu ý xu hướng của dư luận'),
+    (12, 3, 'Giúp người sử dụng lao động hiểu ý kiến dư luận và phản biện chính sách'),
+    (12, 4, 'Gặp gỡ báo chí và đại diện công chúng để giới thiệu các đặc điểm của tổ chức'),
+    (12, 5, 'Tham gia vào các sự kiện để quảng bá cho tổ chức, doanh nghiệp'),
+    (12, 6, 'Biên soạn các bài giới thiệu đặc biệt, báo cáo hoặc tờ rơi thông tin'),
+    (12, 7, 'Duy trì trung tâm thông tin và tổ chức các hoạt động quan hệ cộng đồng'),
+    (13, 0, 'Tiến hành nghiên cứu trên các lí thuyết pháp lí và mối quan hệ của chúng với các điều luật hoặc dự luật cụ thể'),
+    (13, 1, 'Soạn thảo luật và các qui định của Chính phủ dựa trên pháp luật hiện hành'),
+    (13, 2, 'Đưa ra lời khuyên pháp lí cho khách hàng, bao gồm cả Chính phủ trên nhiều loại vấn đề khác nhau và thay mặt cho khách hàng thực hiện các công việc pháp lí'),
+    (13, 3, 'Hỗ trợ khách hàng để đàm phán, dàn xếp trong những vấn đề liên quan đến tranh chấp pháp lí'),
+    (13, 4, 'Kiểm tra các trường hợp tranh chấp hoặc báo cáo tội phạm để xác định sự kiện và ý nghĩa pháp lí của họ'),
+    (13, 5, 'Chuẩn bị lời biện hộ hoặc các tình huống cho nguyên đơn hoặc bị đơn và trình bày tại tòa án'),
+    (13, 6, 'Đóng vai trò là công tố viên đại diện cho Chính phủ trong các vụ án hình sự'),
+    (14, 0, 'Tổ chức, phát triển và bảo tồn bộ sưu tập có hệ thống các sách, ấn phẩm định kì, và các tài liệu giấy, âm thanh và hình ảnh'),
+    (14, 1, 'Lựa chọn và đề xuất mua lại các sách và các tài liệu in ấn, âm thanh-hình ảnh khác'),
+    (14, 2, 'Tổ chức, phân loại và quản lí hệ thống tài liệu thư viện'),
+    (14, 3, 'Tổ chức và quản lí hệ thống đồ vật mượn và mạng lưới thông tin'),
+    (14, 4, 'Thu hồi tài liệu và cung cấp thông tin cho doanh nghiệp và người sử dụng khác dựa trên các bộ sưu tập trong thư viện và các hệ thống mạng lưới thông tin'),
+    (14, 5, 'Thực hiện nghiên cứu và phân tích, thay đổi các dịch vụ thư viện và thông tin theo những yêu cầu của người sử dụng'),
+    (14, 6, 'Chuẩn bị tài liệu và báo cáo học thuật'),
+    (15, 0, 'Quyết định về vấn đề xuất bản sản phẩm phù hợp với các chính sách và hướng dẫn của nhà xuất bản'),
+    (15, 1, 'Đọc bản thảo để đảm bảo văn phong và ngôn ngữ được sử dụng một cách chính xác'),
+    (15, 2, 'Quản lí công việc hàng ngày của báo chí'),
+    (15, 3, 'tạp chí, các tài liệu cần xuất bản'),
+    (15, 4, 'Xác định các chủ đề, sự kiện và câu chuyện có liên quan, phân công công việc cho biên tập viên cấp dưới, các phóng viên và nhiếp ảnh gia để đảm bảo tiến độ theo kế hoạch của nhóm'),
+    (15, 5, 'Viết các bài báo và bài xã luận về các chủ đề cụ thể'),
+    (16, 0, 'Tìm hiểu các lí thuyết giải thích về hành vi của con người và xã hội'),
+    (16, 1, 'Giảng dạy những lí thuyết này cho sinh viên'),
+    (16, 2, 'Tiến hành nghiên cứu để giải thích, xác nhận hoặc phê bình các lí thuyết hiện hành'),
+    (16, 3, 'Tiến hành nghiên cứu để phát triển các lí thuyết mới giải thích cho hành vi con người'),
+    (16, 4, 'Sử dụng dữ liệu nghiên cứu và các nguyên tắc lí thuyết để khuyến khích cổ vũ sự phát triển hài hòa về xã hội, tâm lí, tình cảm của cả cá nhân và nhóm người'),
+    (17, 0, 'Kiểm tra thông tin về những gì xảy ra trong quá khứ bằng cách nghiên cứu các tác phẩm của nhà sử học đi trước'),
+    (17, 1, 'Truyền đạt thông tin về lịch sử cho học sinh, sinh viên'),
+    (17, 2, 'Kiểm tra bản gốc của các nhật kí, bản thảo, lưu trữ, báo cáo, thống kê, hiện vật, thư từ, báo, tạp chí và các tập san để tạo ra một bức tranh về một thời kì cụ thể'),
+    (17, 3, 'Liên kết thông tin từ các giai đoạn khác nhau để phát triển một ý tưởng hoàn chỉnh hơn về các sự kiện, đời sống con người'),
+    (17, 4, 'Ghi lại các kết quả và phát hiện dưới hình thức báo cáo, sách, bài báo và phổ biến qua các cuộc triển lãm, bảo tàng'),
+    (17, 5, 'Sử dụng dữ liệu nghiên cứu và các nguyên tắc lí thuyết để khuyến khích cổ vũ sự phát triển hài hòa về xã hội, tâm lí, tình cảm của cả cá nhân và nhóm người'),
+    (18, 0, 'Sáng tác các tác phẩm văn học theo các thể loại khác nhau'),
+    (18, 1, 'Nghiên cứu một tác phẩm văn học, tìm hiểu toàn bộ cốt truyện'),
+    (18, 2, 'Nghiên cứu nguồn gốc và bối cảnh câu chuyện'),
+    (18, 3, 'Phát triển phong cách của kịch bản dựa trên thảo luận với đạo diễn và những người khác trong nhóm'),
+    (18, 4, 'Chuyển thể câu chuyện sang dạng kịch bản: viết các cảnh, viết lời thoại cho các nhân vật khác nhau'),
+    (18, 5, 'Kiểm tra kịch bản'),
+    (18, 6, 'Hoàn thiện kịch bản cuối cùng để đưa vào sản xuất. Hoàn thiện tác phẩm văn học của mình và chuyển cho nhà biên tập'),
+    (19, 0, 'Tìm hiểu, thu thập và trình bày một cách khách quan những thông tin quan trọng bằng từ ngữ, hình ảnh, âm thanh theo cách công chúng dễ đọc, dễ hiểu'),
+    (19, 1, 'Một số nhà báo có thể biên tập thông tin, viết bình luận, phân tích chuyên sâu về một vấn đề công chúng quan tâm'),
+    (19, 2, 'Vấn đề thời sự nóng'),
+    (19, 3, 'Trong một số trường hợp, nhà báo có thể điều tra tường tận (như thám tử) về một vấn đề được quan tâm, thông thường liên quan đến hành vi phạm tội, gian lận và tham nhũng'),
+    (20, 0, 'Nghiên cứu để hiểu nguồn gốc lịch sử của ngôn ngữ'),
+    (20, 1, 'Tìm hiểu và trình bày bằng văn bản những hiểu biết về các khía cạnh ngữ âm (nói) và chữ viết của một ngôn ngữ'),
+    (20, 2, 'Tìm hiểu cá tác phẩm văn học viết bằng một ngôn ngữ nào đó'),
+    (20, 3, 'Phát triển phương pháp dạy một ngôn ngữ'),
+    (20, 4, 'Theo dõi và tìm hiểu quá trình phát triển của ngôn ngữ và mối liên hệ của nó với đời sống đương đại'),
+    (21, 0, 'Nghiên cứu mối quan hệ giữa các ngôn ngữ gốc cổ đại và các nhóm ngôn ngữ hiện đại, tìm hiểu nguồn gốc và sự tiến hóa của từ, ngữ pháp và hình thái ngôn ngữ'),
+    (21, 1, 'Tư vấn hoặc biên soạn các hệ thống phân loại ngôn ngữ, ngữ pháp, từ điển và các tài liệu tương tự'),
+    (21, 2, 'Dịch viết từ ngôn ngữ này sang ngôn ngữ khác, đảm bảo diễn đạt chính xác ý nghĩa của bản gốc hay của các tài liệu pháp lí, kĩ thuật và khoa học'),
+    (21, 3, 'Diễn đạt hoặc chuyển tải một cách chính xác hết mức có thể từ ngữ, cú pháp, tinh thần và văn phong của bản gốc'),
+    (21, 4, 'Dịch nói từ ngôn ngữ này sang ngôn ngữ khác tại các hội nghị, cuộc họp và các hoạt động tương tự, đảm bảo diễn đạt ý nghĩa chính xác và truyền tải được hết mức có thể tinh thần của lời nói gốc'),
+    (22, 0, 'Nghiên cứu kịch bản, lựa chọn diễn viên, hướng dẫn diễn viên về diễn xuất, và chỉ đạo các mặt của sáng tác kịch diễn trên sân khấu, truyền hình, phát thanh hoặc phim nhựa'),
+    (22, 1, 'Đưa ra quyết định cuối cùng về trang phục, thiết kế, âm thanh và hiệu ứng ánh sáng'),
+    (22, 2, 'Phối hợp chặt chẽ với nhà quay phim, giám đốc âm nhạc và kĩ thuật viên âm thanh nhằm đảm bảo cho công việc sản xuất của bộ phim'),
+    (22, 3, 'Duy trì quan hệ với các nhà phân phối phim để bộ phim được trình chiếu ở nhiều nơi khác nhau'),
+    (23, 0, 'Sử dụng các phương pháp phân loại để duy trì một hệ thống phân loại hồ sơ y tế của bệnh nhân'),
+    (23, 1, 'Sử dụng các phương pháp phân loại để duy trì hệ thống thông tin y tế'),
+    (23, 2, 'Chuyên nghiệp hóa bằng các phương pháp quản lí thông tin y tế bao gồm cả các hệ thống trên máy vi tính để xác định hồ sơ bệnh nhân, mã hóa các bệnh'),
+    (23, 3, 'Thiết kế các biểu mẫu khác nhau cho các loại bệnh nhân khác nhau'),
+    (23, 4, 'Phát triển các phương pháp mới để quản lí thông tin y tế'),
+    (23, 5, 'Thiết kế hệ thống lưu trữ hồ sơ và thông tin'),
+    (23, 6, 'Dạy và đào tạo các nhân viên khác'),
+    (24, 0, 'Mua các hiện vật cho bảo tàng'),
+    (24, 1, 'Kiểm tra các hiện vật để xác định tình trạng và tính xác thực của nó'),
+    (24, 2, 'Phân loại hiện vật'),
+    (24, 3, 'Tổ chức bảo tồn và phục hồi hiện vật'),
+    (24, 4, 'Lưu và cập nhật hồ sơ của tất cả các hiện vật trong các bộ sưu tập'),
+    (24, 5, 'Tổ chức triển lãm, trưng bày trong bảo tàng và hợp tác với các bảo tàng khác trên thế giới'),
+    (24, 6, 'Sắp xếp việc cho mượn hiện vật với các bảo tàng khác'),
+    (24, 7, 'Thực hiện chương trình giảng dạy và giải đáp thắc mắc'),
+    (24, 8, 'Hỗ trợ các nhà nghiên cứu'),
+    (25, 0, 'Kiểm tra, định dạng và soạn thư từ, biên bản và báo cáo từ lời đọc, tài liệu điện tử hoặc dự thảo văn bản cho phù hợp với tiêu chuẩn soạn thảo văn bản'),
+    (25, 1, 'Sử dụng các ứng dụng phần mềm máy tính khác nhau bao gồm cả bảng tính để phục vụ cho việc hỗ trợ hành chính'),
+    (25, 2, 'Xử lí thư, văn bản đến hoặc đi'),
+    (25, 3, 'rà soát, ghi chép và phân phối các email, thư từ, tài liệu'),
+    (25, 4, 'Sắp xếp các yêu cầu họp và hẹn gặp và hỗ trợ tổ chức họp'),
+    (25, 5, 'Tổ chức và giám sát hệ thống tài liệu'),
+    (25, 6, 'Chủ động giải quyết các thư từ thường xuyên'),
+    (26, 0, 'Quản lí thiết bị để ghi âm thanh'),
+    (26, 1, 'Quản lí các thiết bị để biên tập và trộn hình ảnh và âm thanh đã được ghi lại để đảm bảo chất lượng như ý muốn và để tạo ra các hiệu ứng hình ảnh và âm thanh đặc biệt'),
+    (26, 2, 'Ứng dụng kiến thức trên nguyên lí và thực tế của việc ghi lại và biên tập âm thanh, hình ảnh để xác định và giải quyết các vấn đề'),
+    (26, 3, 'Kiểm soát việc truyền phát tín hiệu và các hệ thống phát thanh truyền hình và các hệ thống vệ tinh của các chương trình phát thanh, truyền hình'),
+    (26, 4, 'Quản lí các chương trình truyền thông, các dịch vụ vệ tinh, và các hệ thống đa thành phần trên đất liền, trên biển và trên không'),
+    (26, 5, 'Ứng dụng kiến thức trên nguyên lí và thực tế của việc phát thanh truyền hình, của các thiết bị đầu cuối viễn thông và các hệ thống truyền tin để xác định và giải quyết các vấn đề'),
+    (26, 6, 'Thực hiện những công việc sửa chữa các thiết bị khẩn cấp'),
+    (27, 0, 'Phát triển ngôn ngữ và kĩ năng giao tiếp theo yêu cầu của doanh nghiệp, bao gồm cả giọng nói, ngữ điệu, hiểu biết về văn hóa doanh nghiệp'),
+    (27, 1, 'Học về hàng hóa, dịch vụ hay chính sách, các giao dịch tài chính của tổ chức và trả lời các câu hỏi của khách hàng'),
+    (27, 2, 'Sử dụng điện thoại đáp ứng các yêu cầu cụ thể của khách hàng'),
+    (27, 3, 'Liên lạc với các khách hàng tiềm năng và thu hút sự quan tâm của họ tới một sản phẩm cụ thể bằng cách mô tả cho họ qua điện thoại'),
+    (27, 4, 'Theo dõi cuộc trò chuyện qua điện thoại để viết báo cáo, giao nhận thêm thông tin cho khách hàng nếu cần thiết'),
+    (28, 0, 'Lập kế hoạch và tổ chức các tour du lịch'),
+    (28, 1, 'Gặp các nhóm khách du lịch và sắp xếp trước kế hoạch ăn nghỉ, phương tiện đi lại và tất cả những gì cần thiết để đảm bảo khách cảm thấy hài lòng'),
+    (28, 2, 'Dẫn tour du lịch đi xung quanh một khu vực để thăm các địa điểm hoặc di tích thú vị'),
+    (28, 3, 'Tham gia giải quyết các vấn đề liên quan đến tổ chức chuyến đi trong suốt hành trình'),
+    (28, 4, 'Sắp xếp các dịch vụ khác cho các thành viên của đoàn trong trường hợp cần thiết (VD: tìm bác sĩ trong trường hợp ốm đau)'),
+    (28, 5, 'Phối hợp với tất cả các bộ phận hỗ trợ khác để chuyến đi thành công (VD: các doanh nghiệp vận tải, khách sạn)'),
+    (28, 6, 'Nộp báo cáo cho doanh nghiệp du lịch và giải quyết công việc hành chính'),
+    (29, 0, 'Tìm hiểu sản phẩm, giá cả, phương thức giao hàng, bảo hành, cách sử dụng và bảo quản sản phẩm. Tìm hiểu nhu cầu và tư vấn cho khách hàng một cách phù hợp'),
+    (29, 1, 'Chứng minh cho khách hàng thấy chất lượng sản phẩm'),
+    (29, 2, 'Bán hàng, nhận thanh toán bằng nhiều phương thức (tiền mặt, thẻ, séc...)'),
+    (29, 3, 'Lập hóa đơn'),
+    (29, 4, 'Ghi sổ bán hàng'),
+    (29, 5, 'Hỗ trợ quản lí hàng trong kho'),
+    (29, 6, 'Sắp xếp và trưng bày hàng hóa'),
+    (29, 7, 'Đóng gói hàng bán'),
+    (29, 8, 'Ghi lại thông tin khách hàng'),
+    (30, 0, 'Tiến hành nghiên cứu và tư vấn sản xuất sản phẩm từ polyme'),
+    (30, 1, 'Phát triển các qui trình hoá học qui mô lớn để lọc và sản xuất các chất và sản phẩm từ polyme'),
+    (30, 2, 'Nghiên cứu tiền khả thi và khả thi về việc xây dựng các nhà máy sản xuất hóa chất'),
+    (30, 3, ' Xác định phương pháp sản xuất vật liệu và các tiêu chuẩn chất lượng để đảm bảo rằng chúng phù hợp với các thông số kĩ thuật'),
+    (30, 4, 'Đề ra các tiêu chuẩn kiểm soát và các qui trình thủ tục đảm bảo sự an toàn và tính hiệu quả của các hoạt động sản xuất'),
+    (30, 5, 'Tìm ra và khắc phục sai sót và trục trặc'),
+    (30, 6, 'Tổ chức và hướng dẫn việc bảo trì, sửa chữa các thiết bị hiện đang hoạt động'),
+    (30, 7, 'Nghiên cứu và tư vấn về mặt kĩ thuật về các vật liệu, sản phẩm hoặc một quá trình nhất định'),
+    (31, 0, 'Tiến hành nghiên cứu cách thức chế biến các loại thực phẩm đồ uống mới'),
+    (31, 1, 'Cải tiến các kĩ thuật hiện có để đảm bảo giữ được chất lượng, hương vị thực phẩm đồ uống như bảo quản lạnh những đồ dễ hư hỏng, thịt, cá, đồ hộp, giữ nước của trái cây và rau'),
+    (31, 2, 'Phát triển các biện pháp như kiểm soát lây nhiễm, trị nấm và côn trùng, lưu trữ để bảo vệ các loại thực phẩm không bị hư hỏng và thiệt hại'),
+    (31, 3, 'Kiểm tra các thực phẩm nhiễm độc, làm giả, giá trị dinh dưỡng v;v'),
+    (31, 4, 'bằng cách xét nghiệm sinh hóa, dinh dưỡng và các biện pháp kiểm soát chất lượng'),
+    (31, 5, 'Phát triển phương pháp và qui trình mới thông qua nghiên cứu để phục hồi các sản phẩm hữu ích từ chất thải công nghiệp và thực phẩm trong nước'),
+    (31, 6, 'Kiểm soát và hướng dẫn quá trình pha chế, chống ô xi hoá, kiểm nghiệm vệ sinh an toàn thực phẩm và kiểm nghiệm vi sinh'),
+    (32, 0, 'Nghiên cứu, phân tích và đánh giá các yêu cầu đối với các phần mềm ứng dụng và hệ điều hành của máy tính'),
+    (32, 1, 'Nghiên cứu, thiết kế và phát triển hệ thống phần mềm'),
+    (32, 2, ' Cố vấn cho các cán bộ kĩ thuật trong việc đánh giá sự khác biệt giữa phần cứng và phần mềm máy tính'),
+    (32, 3, 'Phát triển và hướng dẫn thử nghiệm phần mềm và các thủ tục pháp lí'),
+    (32, 4, 'Khắc phục lỗi của các mô hình hiện tại và áp dụng kiến thức đó vào phát triển các phần mềm mới hoặc nâng cấp các chức năng cũ và cải tiến hiệu suất hoạt động trên máy'),
+    (32, 5, 'Hướng dẫn lên chương trình phần mềm và phát triển các tài liệu phần mềm'),
+    (32, 6, 'Tiếp cận, phát triển, nâng cấp và ghi chép lại các qui trình thủ tục duy trì phần mềm'),
+    (32, 7, 'Tư vấn cho khách hàng các vấn đề liên quan tới việc duy trì hệ thống phần mềm'),
+    (33, 0, 'Phân tích thông tin tài chính để dự đoán các điều kiện kinh doanh, công nghiệp và kinh tế nhằm đưa ra các quyết định đầu tư'),
+    (33, 1, 'Cập nhật kiến thức trong các lĩnh vực kĩ thuật công nghiệp, kinh doanh, tài chính và học thuyết kinh tế'),
+    (33, 2, 'Nắm bắt được các nhân tố ảnh hưởng tới đầu tư như giá cả, sản lượng, tính ổn định, xu hướng tương lai trong quản lí rủi ro và các tác động kinh tế'),
+    (33, 3, 'Giám sát các hoạt động kinh tế, công nghiệp và hợp tác thông qua phân tích thông tin thu thập được từ các báo cáo tài chính và dịch vụ của các hãng đầu tư vào lĩnh vực ngân hàng, các tổ chức chính phủ, các ấn phẩm thương mại, nguồn lực của công ti,và từ phỏng vấn cá nhân'),
+    (33, 4, 'Đề xuất đầu tư và thời điểm đầu tư với các công ti, cán bộ phụ trách đầu tư của công ti hoặc đầu tư công'),
+    (33, 5, 'Xác định mức giá an toàn để có thể cung ứng các dịch vụ tư vấn chứng khoán công'),
+    (33, 6, 'Chuẩn bị kế hoạch hành động cho hoạt động đầu tư dựa trên các phân tích tài chính'),
+    (34, 0, 'Tiến hành nghiên cứu, cải tiến, phát triển khung lí thuyết, các học thuyết và các phương pháp vận hành liên quan tới thiên văn học'),
+    (34, 1, 'Tiến hành các thực nghiệm, thí nghiệm và phân tích cấu trúc, tính chất của vấn đề ở trạng thái rắn và biểu hiện biến chuyển của vật chất đó dưới tác động của nhiệt độ, áp suất, áp lực và các điều kiện khác'),
+    (34, 2, 'đánh giá kết quả điều tra và thực nghiệm nhằm đưa ra kết luận chủ yếu bằng việc sử dụng các kĩ thuật và các mô hình toán học'),
+    (34, 3, 'Phát triển hoặc cải tiến ứng dụng trong các lĩnh vực công nghiệp, y học, quân đội và các ứng dụng thực nghiệm khác của các nguyên lí và kĩ thuật thiên văn học'),
+    (34, 4, 'Quan sát, phân tích và nhận thức được các hiện tượng thiên văn học cũng như phát triển các phương pháp và kĩ thuật được sử dụng trong các lĩnh vực như hàng hải hay khám phá vũ trụ'),
+    (34, 5, 'Chuẩn bị các nghiên cứu và báo cáo khoa học'),
+    (34, 6, 'Giám sát và chỉ đạo những người cùng làm việc'),
+    (35, 0, 'Nghiên cứu, cải tiến và phát triển các khái niệm, học thuyết và phương pháp hoạt động liên quan tới thành phần cấu tạo, cấu trúc và các động lực học của khí quyển'),
+    (35, 1, 'Thu thập dữ liệu về hướng và tốc độ chuyển động của không khí, áp suất, nhiệt độ, độ ẩm và các hiện tượng khác như sự hình thành mây và mưa, nhiễu điện từ hoặc bức xạ năng lượng mặt trời'),
+    (35, 2, 'Nghiên cứu dữ liệu này để chuẩn bị các bản đồ và dự báo thời tiết'),
+    (35, 3, 'Tiến hành thí nghiệm về phát tán sương, tạo mưa và các dạng kiểm soát thời tiết khác'),
+    (35, 4, 'Chuẩn bị các tài liệu và báo cáo khoa học'),
+    (35, 5, 'Giám sát và chỉ đạo những người cùng làm việc'),
+    (36, 0, 'Thực hiện các nghiên cứu và cải tiến hoặc phát triển các khái niệm, học thuyết và các phương pháp hoạt động liên quan tới hóa học'),
+    (36, 1, 'Thực hiện các thí nghiệm, kiểm nghiệm và phân tích để tìm ra các thành phần hóa học và năng lượng và các thay đổi hóa học trong các điều kiện tự nhiên, nhân tạo khác nhau hoặc tổng hợp các chất, các nguyên liệu và sản phẩm khác, đánh giá kết quả và đưa ra kết luận'),
+    (36, 2, 'Phát triển hoặc cải tiến các dược phẩm và các nguyên liệu, sản phẩm và phương pháp công nghiệp khác'),
+    (36, 3, 'Phát triển các qui trình quản lí chất lượng cho nhà sản xuất và người sử dụng'),
+    (36, 4, 'Chuẩn bị các tài liệu và báo cáo khoa học.'),
+    (37, 0, 'Sử dụng dụng cụ và kĩ thuật để tiến hành khảo sát địa chất, lập bản đồ khảo sát không khí và ảnh hàng không, thăm dò địa chất và địa vật lí để xác định vị trí mỏ khoáng sản, mỏ dầu khí đặc biệt'),
+    (37, 1, 'Thu thập các mẫu khoáng sản hoặc đá ở các độ sâu khác nhau phục vụ cho các nghiên cứu chi tiết để xác thành phần, chất lượng và số lượng của các mỏ khoáng sản'),
+    (37, 2, 'Giám sát hoạt động khoan trong các khu vực có các mỏ khoáng sản kinh tế'),
+    (37, 3, 'Chuẩn bị các báo cáo, bản đồ và biểu đồ cho thấy các hồ chứa nước ngầm, lớp đá, thân quặng lộ thiên và cấu trúc địa chất khác nhau của chúng'),
+    (37, 4, 'Tư vấn về tính phù hợp của đất và đá để xây dựng các đập nước, đường hầm, đường giao thông, các tòa nhà trên nền móng vững chắc'),
+    (37, 5, 'Nghiên cứu các hiện tượng tự nhiên như động đất, núi lửa, sông băng và lở núi'),
+    (38, 0, 'Nghiên cứu bản chất của môi trường vật chất và khí hậu ở những khu vực cụ thể bằng cách thu thập số liệu về những ứng dụng trong nhiều ngành khoa học như vật lí, địa lí, hải dương học, vũ trụ học và sinh học'),
+    (38, 1, 'Phân tích hoạt động của con người trong các lĩnh vực khác nhau của xã hội như chính trị, kinh tế, sự di cư và tăng trưởng dân số'),
+    (38, 2, 'và chỉ ra mối quan hệ giữa những hoạt động đó với môi trường địa lí'),
+    (38, 3, 'Tiến hành các nghiên cứu bản đồ và vẽ bản đồ theo kích thước qui định'),
+    (38, 4, 'Tư vấn cho Chính phủ và các tổ chức khác về các khu vực địa lí có khả năng khai thác về mặt kinh tế, xác định ranh giới về mặt chính trị và những vấn đề liên quan'),
+    (39, 0, 'Nghiên cứu, cải tiến, phát triển các lí thuyết và thuật toán'),
+    (39, 1, 'Nghiên cứu, cải tiến, phát triển các lí thuyết và kĩ thuật tính toán rủi ro'),
+    (39, 2, 'Tư vấn và áp dụng các nguyên tắc, mô hình và thuật toán vào nhiều lĩnh vực như kĩ thuật, kinh doanh, y khoa, các lĩnh vực khác trong các ngành khoa học, đời sống tự nhiên và xã hội'),
+    (39, 3, 'Tiến hành phân tích logic về các vấn đề quản lí, đặc biệt là tính hiệu quả đầu vào-đầu ra và xây dựng các mô hình toán cho các vấn đề liên quan tới lập trình các chương trình và giải pháp xử lí bằng máy tính'),
+    (39, 4, 'Thiết kế và đưa vào vận hành lộ trình lương hưu và hệ thống bảo hiểm nhân thọ, y tế, an sinh xã hội và các hình thức bảo hiểm khác'),
+    (39, 5, 'Chuẩn bị báo cáo và nghiên cứu khoa học'),
+    (40, 0, 'Nghiên cứu, cải tiến và phát triển các lí thuyết và phương pháp thống kê'),
+    (40, 1, 'Thiết kế bảng hỏi nghiên cứu'),
+    (40, 2, 'Lên kế hoạch và tổ chức các cuộc điều tra lấy số liệu'),
+    (40, 3, 'Đánh giá, xử lí, phân tích và diễn giải số liệu thống và chuẩn bị phát hành'),
+    (40, 4, 'Tư vấn hoặc áp dụng các phương pháp thu thập dữ liệu khác nhau cũng như các phương pháp và kĩ thuật thống kê'),
+    (40, 5, 'Chuẩn bị bài báo khoa học và các báo cáo.'),
+    (41, 0, 'Nghiên cứu, cải tiến, phát triển các lí thuyết và kĩ thuật định phí bảo hiểm'),
+    (41, 1, 'Thu thập và phân tích số liệu từ các nguồn khác nhau liên quan tới các khoản phí chi cho người bị thương, đau ốm, khuyết tật hoặc tử vong'),
+    (41, 2, 'Thu thập và phân tích số liệu từ các nguồn khác nhau liên quan tới mất mát tài sản do hoả hoạn, trộm cướp, cháy nổ và các mối nguy hại'),
+    (41, 3, 'Tính toán tần suất có thể có của các rủi ro đó'),
+    (41, 4, 'Cố định tỉ lệ tăng thêm của các loại hình rủi ro khác nhau có tính đến thị trường tiền tệ, các điều kiện kinh tế và các xu hướng thị hiếu tương lai'),
+    (41, 5, 'Tiếp tục nghiên cứu các hướng phát triển và kinh doanh mới, các yếu tố pháp luật, xã hội cũng như các yếu tố khác ảnh hưởng tới việc kinh doanh bảo hiểm'),
+    (41, 6, 'Khuyến nghị các biện pháp quản trị phù hợp với chính sách tương lai và các khoá đào tạo nhằm nâng cao doanh thu'),
+    (42, 0, 'Tiến hành thử nghiệm trong thực tế, trong phòng thí nghiệm những vấn đề liên quan tới tất cả các dạng của sự sống bằng cách xác định và phân loại các nhóm người, động vật, bò sát hoặc các loài cây'),
+    (42, 1, 'nghiên cứu tìm hiểu về nguồn gốc, sự phát triển, tính chất vật lí, hoá học, cấu trúc, thành phần và sự tái tạo của chúng'),
+    (42, 2, 'Nghiên cứu và tiến hành các thực nghiệm liên quan tới cấu trúc, sự phát triển và tính chất của các hệ vi sinh vật như vi khuẩn, virus'),
+    (42, 3, 'Nghiên cứu và tiến hành các thực nghiệm liên quan tới các yếu tố hình thành nên nguồn gốc, sự phát triển và quá trình chuyển đổi các tính chất di truyền học ở tất cả các dạng của sự sống'),
+    (42, 4, 'Nghiên cứu sự sống của tất cả các cây cỏ và động vật để phát triển các ứng dụng thực tế trong các lĩnh vực như nông nghiệp, dược dựa trên những kiến thức này'),
+    (42, 5, 'Nghiên cứu và tiến hành thực nghiệm liên quan tới chức năng của các tế bào sống cũng như các ảnh hưởng của các nhân tố vật lí, hoá học đối với các tế bào bình thường và bất thường'),
+    (42, 6, 'Nghiên cứu mối liên kết giữa động, thực vật với các yếu tố môi trường liên quan'),
+    (42, 7, 'Phát triển các ứng dụng trong lĩnh vực công nghiệp và y học. 8. Chuẩn bị nghiên cứu khoa học và các báo cáo'),
+    (43, 0, 'Nghiên cứu tế bào, mô và đời sống của sinh vật trong đại dương'),
+    (43, 1, 'Đánh giá tác động của môi trường bên trong và bên ngoài đối với các sinh vật trong đại dương'),
+    (43, 2, 'Tiến hành thăm dò đại dương để thu thập dữ liệu về hình dạng, tính chất của đáy đại dương và các hiện tượng như thủy triều, dòng chảy, núi băng trôi'),
+    (43, 3, 'Tiến hành phân tích hóa học đáy đại dương và nước biển ở các độ sâu khác nhau'),
+    (43, 4, 'Lập bản đồ và biểu đồ tích tụ cát trên bãi biển'),
+    (43, 5, 'Xây dựng một bức tranh toàn diện và thống nhất về các vận động diễn biến của đại dương'),
+    (43, 6, 'Đánh giá tác động của môi trường bên trong và bên ngoài đối với cấu tạo vật lí của đại dương (ví dụ như đáy đại dương, bờ biển)'),
+    (43, 7, 'Viết báo cáo dựa trên kết quả nghiên cứu để cung cấp thông tin cho công chúng, chính phủ, các tổ chức môi trường, tổ chức khai thác tài nguyên thiên nhiên và đánh bắt thuỷ sản'),
+    (44, 0, 'Tham gia nghiên cứu hệ vi sinh vật như vi khuẩn, nấm, men và enzyme'),
+    (44, 1, 'Tiến hành nghiên cứu trong các lĩnh vực biến đổi gien và sinh học phân tử, bao gồm việc nhân bản cây cối, động vật và con người từ gien'),
+    (44, 2, 'Sử dụng vi khuẩn, chất xúc tác và các sinh vật khác cho các mục đích khác nhau trong công nghiệp, sản xuất nông nghiệp, sản xuất thực phẩm và loại bỏ chất thải'),
+    (44, 3, 'Phát triển và thử nghiệm các phương pháp sản xuất mới'),
+    (44, 4, 'Điều chỉnh gen của các cơ quan để tạo ra sản phẩm mới'),
+    (44, 5, 'Tương tác với khách hàng để đưa ra các giải pháp dựa trên kĩ thuật sinh học'),
+    (44, 6, 'Tính toán ngân sách và chi phí sản xuất cũng như chuẩn bị mua lại hoặc tự phát triển các ứng dụng'),
+    (44, 7, 'Tư vấn cho Chính phủ, các tổ chức hoặc các doanh nghiệp trong lĩnh vực kĩ sinh học'),
+    (45, 0, 'Nghiên cứu liên kết giữa số liệu về sinh học và hành vi dựa trên các nguyên tắc về điện tích, cơ chế, hoá học và các nguyên tắc kĩ thuật khác'),
+    (45, 1, 'Sử dụng thông tin này nhằm thiết kế và phát triển các công cụ và thiết bị như các bộ phận nhân tạo, thiết bị tạo nhịp tim, các thiết bị hình ảnh (ví dụ như máy chụp tia X-quang, máy chụp cắt lớp CT)'),
+    (45, 2, 'Giới thiệu các thiết bị và công cụ chăm sóc sức khoẻ cá nhân'),
+    (45, 3, 'Định hướng và đào tạo nhân lực sử dụng máy móc để quan sát, sửa chữa hoặc điều trị những tổn thương về vật chất hoặc biến dạng'),
+    (46, 0, 'Phát triển kĩ thuật sản xuất (ví dụ như quản lí thủy lợi)'),
+    (46, 1, 'Nâng cao năng suất nông nghiệp về số lượng và chất lượng (ví dụ như lựa chọn các giống cây trồng có khả năng chống chịu hạn hán, phát triển các loại thuốc trừ sâu mới, công nghệ cảm ứng, các mô hình mô phỏng sự phát triển cây trồng, kĩ thuật nuôi cấy tế bào trong ống nghiệm)'),
+    (46, 2, 'Biến đổi các sản phẩm chủ yếu thành sản phẩm đầu ra (ví dụ như sản xuất, bảo quản và đóng gói các sản phẩm sữa)'),
+    (46, 3, 'Khắc phục các tác động bất lợi của môi trường (ví dụ như sâu bệnh, suy thoái đất, xử lí sinh học)'),
+    (47, 0, 'Tìm hiểu về quá trình sinh sản và đời sống của các sinh vật sống dưới nước (ví dụ nuôi cá, sò, trai ngọc)'),
+    (47, 1, 'Tìm hiểu các bệnh có ảnh hưởng đến sự sống của các sinh vật dưới nước'),
+    (47, 2, 'Nuôi trồng các thuỷ sinh vật phục vụ cho tiêu dùng của con người'),
+    (47, 3, 'Sử dụng các công cụ đặc biệt để đo oxy, hàm lượng muối, độ pH và các đặc điểm khác của nước để hiểu làm thế nào những điều này ảnh hưởng đến các thuỷ sinh vật'),
+    (47, 4, 'Duy trì các nhóm sinh vật (ví dụ như tảo) là thức ăn cho các sinh vật biển'),
+    (47, 5, 'Duy trì hồ sơ chi tiết về nuôi hải sản và môi trường sống cũng như vòng đời của các sinh vật được nuôi'),
+    (47, 6, 'Phát triển phương pháp đánh bắt mà không làm suy thoái môi trường'),
+    (47, 7, 'Chế biến thuỷ sản sau thu hoạch'),
+    (47, 8, 'Giảng dạy, tập huấn về nuôi trồng thuỷ, hải sản'),
+    (47, 9, 'Tiến hành nghiên cứu và công bố kết quả nghiên cứu'),
+    (48, 0, 'Cập nhật các phương thức và kĩ thuật lâm nghiệp'),
+    (48, 1, 'Tư vấn các phương pháp nâng cao chất lượng đầu ra, sản lượng thu hoạch, hiệu quả vận hành hệ thống sản xuất lâm nghiệp, các biện pháp bảo tồn tài nguyên thiên nhiên và môi trường'),
+    (48, 2, 'Đề xuất các phương pháp giải quyết các vấn đề như tình trạng xói mòn đất hay sâu bệnh phá hoại, ...'),
+    (48, 3, 'Thu thập số liệu và ước tính số lượng, chi phí nguyên vật liệu, lao động cần thiết trong các dự án'),
+    (48, 4, 'Tổ chức các buổi nói chuyện, thực hành mẫu, và phổ biến tài liệu nhằm nâng cao nhận thức và chuyển giao kĩ thuật'),
+    (48, 5, 'Áp dụng kiến thức khoa học và thực tiễn để phát hiện và giải quyết các vấn đề phát sinh trong quá trình làm việc'),
+    (49, 0, 'Nghiên cứu, thử nghiệm, thu thập mẫu, đi thực tế và phân tích các xét nghiệm để xác định nguồn gốc của các vấn đề về môi trường và khuyến nghị các giải pháp bảo vệ, kiểm soát và phục hồi'),
+    (49, 1, 'Kiểm tra và đánh giá tác động môi trường của các hoạt động, qui trình hiện tại'),
+    (49, 2, 'đánh giá tác động môi trường của các hoạt động, đề xuất, dự án và hướng phát triển tương lai'),
+    (49, 3, 'Phát triển và điều phối việc thực hiện những hệ thống quản lí môi trường để giúp các tổ chức kiểm soát tác động môi trường do các hoạt động của họ'),
+    (49, 4, 'Tư vấn và hỗ trợ kĩ thuật cho các tổ chức để giải quyết hài hòa vấn đề môi trường và tổn thất tài chính'),
+    (49, 5, 'Đánh giá mức độ chấp nhận của xã hội đối với các quyết định và hướng dẫn về môi trường của Nhà nước, xác định vi phạm và mức độ cam kết giải quyết vi phạm'),
+    (49, 6, 'Phát triển các kế hoạch bảo tồn thiên nhiên'),
+    (49, 7, 'Chuẩn bị báo cáo và tài liệu nghiên cứu'),
+    (50, 0, 'Tính toán và bố trí các loại thiết bị máy móc khác nhau trong nhà máy sao cho hợp lí và hiệu quả'),
+    (50, 1, 'Quản lí hệ thống theo cách vừa an toàn vừa năng suất nhất có thể'),
+    (50, 2, 'Điều chỉnh lại máy móc, thiết bị để nâng cao năng suất'),
+    (50, 3, 'Đặt ra tiêu chuẩn hoạt động cho công nhân và máy móc'),
+    (50, 4, 'Phát triển các hệ thống có thể tối ưu hoá tiện nghi ở nơi làm việc thông qua việc quản lí hệ thống ánh sáng, băng ghế, chiều cao máy và mức độ ô nhiễm của máy');
+INSERT INTO job_work_areas (job_id, sort_order, work_area) VALUES
+    (1, 0, 'Đài phát thanh và truyền hình'),
+    (1, 1, 'Doanh nghiệp Tổ chức Sự kiện'),
+    (1, 2, 'Công ty truyền thông và quảng cáo'),
+    (2, 0, 'Giảng dạy tại các trường ĐH'),
+    (2, 1, 'Các tổ chức tình nguyện'),
+    (2, 2, 'Các tổ chức chính phủ'),
+    (2, 3, 'Các tổ chức nghiên cứu quốc tế'),
+    (3, 0, 'Các phòng ban và viện bảo tàng khảo cổ'),
+    (3, 1, 'Các tổ chức phi chính phủ tham gia vào việc bảo tồn di sản'),
+    (4, 0, 'Bảo tàng, phòng trưng bày triển lãm'),
+    (4, 1, 'Cục, chi cục văn thư lưu trữ Nhà nước'),
+    (5, 0, 'Các doanh nghiệp Nhà nước, tư nhân, có vốn đầu tư nước ngoài'),
+    (5, 1, 'Các cơ quan Nhà nước, đoàn thể xã hội, tổ chức phi chính phủ'),
+    (6, 0, 'Giảng dạy trong các trường đại học'),
+    (6, 1, 'Nghiên cứu tại các viện nghiên cứu về giáo dục và các khoa học có liên quan'),
+    (6, 2, 'Vị trí quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng)'),
+    (7, 0, 'Giảng dạy tại các trường Cao đẳng'),
+    (7, 1, 'Vị trí quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng khoa)'),
+    (8, 0, 'Giảng dạy trong các trường trung cấp'),
+    (8, 1, 'Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)'),
+    (9, 0, 'Dạy học tại các trường trung học phổ thông'),
+    (9, 1, 'các trung tâm giáo dục thường xuyên'),
+    (9, 2, 'Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)'),
+    (9, 3, 'Làm việc chuyên môn trong các cơ quan quản lý giáo dục'),
+    (9, 4, 'Dạy học tại các trung tâm bồi dưỡng văn hóa'),
+    (10, 0, 'Dạy học tại các trường trung học cơ sở'),
+    (10, 1, 'các trung tâm giáo dục thường xuyên'),
+    (10, 2, 'Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)'),
+    (10, 3, 'Làm việc chuyên môn trong các cơ quan quản lý giáo dục'),
+    (10, 4, 'Dạy học tại các trung tâm bồi dưỡng văn hóa'),
+    (11, 0, 'Dạy học tại các cơ sở giáo dục'),
+    (11, 1, 'Quản lí trong các cơ sở giáo dục (ví dụ: hiệu trưởng, trưởng phòng)'),
+    (11, 2, 'Làm việc chuyên môn trong các cơ quan quản lý giáo dục'),
+    (11, 3, 'Dạy học tại các trung tâm ngoại ngữ'),
+    (12, 0, 'Bộ phận truyền thông của doanh nghiệp và các tổ chức chính phủ. Ví dụ như hầu hết các doanh nghiệp lớn hiện nay đều có bộ phận quan hệ cộng đồng doanh nghiệp'),
+    (12, 1, 'Các doanh nghiệp dịch vụ quan hệ công chúng. Các doanh nghiệp này được các tổ chức thuê triển khai thực hiện các sự kiện đặc biệt như ra mắt sản phẩm, hội nghị...'),
+    (13, 0, 'Các công ty luật, văn phòng luật sư'),
+    (13, 1, 'Các cơ quan Nhà nước'),
+    (13, 2, 'Các doanh nghiệp lớn'),
+    (13, 3, 'Các tổ chức tình nguyện'),
+    (14, 0, 'Thư viện các trường ĐH, CĐ'),
+    (14, 1, 'Thư viện công cộng hoặc tư nhân'),
+    (14, 2, 'Các cơ quan nghiên cứu và phát triển'),
+    (14, 3, 'Các doanh nghiệp'),
+    (14, 4, 'Thư viện số (sử dụng mạng Internet)'),
+    (15, 0, 'Các nhà xuất bản'),
+    (15, 1, 'Các phòng ban phụ trách công việc xuất bản của các trường ĐH'),
+    (15, 2, 'Báo'),
+    (15, 3, 'Tạp chí'),
+    (15, 4, 'Các doanh nghiệp kinh doanh mạng thông tin internet'),
+    (16, 0, 'Giáo viên tại các trường ĐH, CĐ, TC'),
+    (16, 1, 'Các tổ chức chính phủ'),
+    (16, 2, 'Các tổ chức tình nguyện'),
+    (16, 3, 'Các tổ chức phi chính phủ'),
+    (16, 4, 'Các tổ chức quốc tế'),
+    (16, 5, 'Các tập đoàn kinh tế'),
+    (17, 0, 'Dạy học trong các cơ sở giáo dục'),
+    (17, 1, 'Các tổ chức tình nguyện'),
+    (17, 2, 'Các cơ quan chính phủ'),
+    (17, 3, 'Các tổ chức quốc tế'),
+    (17, 4, 'Các nhóm nghiên cứu hành vi của con người'),
+    (17, 5, 'Các viện bảo tàng'),
+    (17, 6, 'Cơ quan lưu trữ'),
+    (18, 0, 'Các xưởng sản xuất phim'),
+    (18, 1, 'Các đoàn kịch, đoàn nghệ thuật'),
+    (18, 2, 'Các doanh nghiệp sản xuất chương trình phát thanh, truyền hình'),
+    (18, 3, 'Các doanh nghiệp quảng cáo'),
+    (18, 4, 'Hội Văn học Việt nam'),
+    (19, 0, 'Tòa soạn các loại Báo viết'),
+    (19, 1, 'Các loại Tạp chí'),
+    (19, 2, 'Văn phòng thông tin báo chí'),
+    (19, 3, 'Báo mạng, các đài truyền hình và đài phát thanh'),
+    (20, 0, 'Phòng ban, khoa, bộ môn của trường ĐH'),
+    (20, 1, 'Giáo viên ngoại ngữ'),
+    (20, 2, 'Các tổ chức cần người biên dịch, phiên dịch'),
+    (20, 3, 'Trung tâm điều trị trẻ em bị rối loạn khả năng học ngôn ngữ'),
+    (20, 4, 'Nhà xuất bản'),
+    (21, 0, 'Các doanh nghiệp có bộ phận dịch thuật'),
+    (21, 1, 'Các công ty tổ chức sự kiện'),
+    (21, 2, 'Các doanh nghiệp có vốn đầu tư nước ngoài'),
+    (21, 3, 'Các doanh nghiệp thường xuyên giao dịch với khách hàng nước ngoài'),
+    (21, 4, 'Vụ, phòng, bộ phận quan hệ quốc tế của các cơ quan Nhà nước'),
+    (21, 5, 'Các tổ chức quốc tế như các cơ quan Liên Hợp Quốc, tổ chức phi chính phủ, tổ chức tài trợ...'),
+    (22, 0, 'Các doanh nghiệp quảng cáo'),
+    (22, 1, 'Bộ phận truyền thông trong các cơ quan Nhà nước'),
+    (22, 2, 'Các xưởng sản xuất phim'),
+    (22, 3, 'Các đoàn kịch, đoàn nghệ thuật'),
+    (23, 0, 'Các bệnh viện, phòng khám'),
+    (23, 1, 'Các phòng xét nghiệm y tế'),
+    (23, 2, 'Các bệnh viện của trường y'),
+    (23, 3, 'Các trung tâm nghiên cứu'),
+    (24, 0, 'Các khoa của các trường ĐH'),
+    (24, 1, 'Các viện bảo tàng'),
+    (24, 2, 'Các nhóm nghiên cứu'),
+    (25, 0, 'Tất cả các tổ chức đều cần một thư kí tốt'),
+    (26, 0, 'Các công ty phát thanh'),
+    (26, 1, 'Các công ty truyền hình'),
+    (26, 2, 'Các công ty điện ảnh'),
+    (26, 3, 'Dịch vụ phát thanh truyền hình công cộng'),
+    (27, 0, 'Các trung tâm hỗ trợ khách hàng của các công ty như Điện lực, bưu chính viễn thông, v.v...'),
+    (27, 1, 'Dịch vụ chăm sóc khách hàng'),
+    (27, 2, 'Nhân viên Bán hàng online'),
+    (28, 0, 'Các doanh nghiệp du lịch lữ hành'),
+    (28, 1, 'Cơ quan quản lí du lịch của Nhà nước'),
+    (28, 2, 'Tự thành lập cơ sở kinh doanh du lịch'),
+    (28, 3, 'Dẫn tour du lịch vào thời gian rảnh'),
+    (29, 0, 'Tất cả các cửa hàng'),
+    (29, 1, 'Trung tâm thương mại'),
+    (29, 2, 'Điểm bán hàng'),
+    (29, 3, 'Các siêu thị'),
+    (29, 4, 'Bán hàng trên mạng'),
+    (30, 0, 'Ngành công nghiệp hoá chất'),
+    (30, 1, 'Ngành công nghiệp sản xuất các vật dụng từ polyme'),
+    (31, 0, 'Các công ti chế biến thực phẩm đồ uống'),
+    (31, 1, 'Bệnh viện'),
+    (31, 2, 'Cơ sở dịch vụ ăn uống'),
+    (31, 3, 'Cơ quan kiểm tra chất lượng'),
+    (31, 4, 'Phòng thí nghiệm công nghệ thực phẩm'),
+    (32, 0, 'Lập trình viên cho các công ti phần mềm'),
+    (32, 1, 'Tư vấn phát triển phần mềm chuyên dụng cho các ngành nghề, công ty'),
+    (32, 2, 'Kiểm tra, bảo trì, quản trị hệ thống phần mềm cho các tổ chức, công ty'),
+    (32, 3, 'Làm việc trong các tổ chức giáo dục giảng dạy và nghiên cứu các vấn đề liên quan đến lĩnh vực này'),
+    (32, 4, 'Chuyên gia phát triển phần mềm độc lập'),
+    (33, 0, 'Ngân hàng'),
+    (33, 1, 'Các công ti bảo hiểm'),
+    (33, 2, 'Các quĩ chung'),
+    (33, 3, 'Các công ti chứng khoán'),
+    (33, 4, 'Người môi giới chứng khoán'),
+    (33, 5, 'Tư vấn tài chính'),
+    (33, 6, 'Quản lí tài chính'),
+    (34, 0, 'Làm cho các cơ quan công lập và các tổ chức nghiên cứu vũ trụ'),
+    (34, 1, 'Làm cho các tổ chức phi chính phủ bao gồm chế tạo các kính viễn vọng, tổ chức các buổi phổ biến thực hành quan sát thiên văn học trong cộng đồng'),
+    (34, 2, 'Ví dụ về các lĩnh vực khác bao gồm các đài thiên văn, cung thiên văn, công viên khoa học và các trường ĐH'),
+    (35, 0, 'Các Đài, Trạm, Trung tâm dự báo khí tượng thủy văn'),
+    (35, 1, 'Các công ty thủy điện, thủy lợi'),
+    (35, 2, 'Các viện nghiên cứu, Trung tâm Môi trường'),
+    (35, 3, 'Các cơ quan thuộc Bộ TN&amp;amp;MT (gồm các đơn vị thuộc Trung tâm khí tượng thủy văn quốc gia, Viện khoa học KTTV và Môi trường), Bộ NN&amp;amp;PTNT, Viện Khoa học và Công nghệ Quốc gia, Bộ Công nghiệp, Viện nghiên cứu kĩ thuật Bảo hộ Lao động,… và cả các cơ sở hoạt động trong lĩnh vực tin học, tính toán liên quan tới KTTV'),
+    (36, 0, 'Làm việc trong các ngành công nghiệp hoá chất, ví dụ như nước hoa, sơn, màu vẽ và dược phẩm'),
+    (36, 1, 'Làm việc trong các cơ quan môi trường để giảm ô nhiễm, đồng thời quản lí và tái chế chất thải'),
+    (36, 2, 'Làm việc trong ngành công nghiệp đóng gói thực phẩm, nước uống đóng chai và các loại kẹo đóng gói'),
+    (37, 0, 'Làm công tác quản lí ở các cơ quan quản lí Nhà nước của nhiều Bộ, ngành khác nhau'),
+    (37, 1, 'Các viện nghiên cứu'),
+    (37, 2, 'Giảng dạy tại các trường ĐH, CĐ'),
+    (37, 3, 'Các công ty khai thác dầu khí, khoáng sản...'),
+    (38, 0, 'Làm việc trong các cơ quan Nhà nước có nhiệm vụ qui hoạch đô thị và vùng, điều tra việc sử dụng đất, khí tượng và thị hiếu'),
+    (38, 1, 'Làm việc trong các tổ chức tham gia vào hệ thống thông tin địa lí và dự đoán dựa trên các phần mềm ứng dụng'),
+    (38, 2, 'Giảng dạy và nghiên cứu trong các tổ chức giáo dục đại học bao gồm các hoạt động'),
+    (38, 3, 'Làm việc trong các cơ quan tham gia hoạch định chính sách và qui hoạch xã hội, kinh tế và môi trường'),
+    (39, 0, 'Các viện hàn lâm'),
+    (39, 1, 'Các tổ chức nghiên cứu'),
+    (39, 2, 'Nghiên cứu và phát triển công nghiệp'),
+    (39, 3, 'Các công ty bảo hiểm'),
+    (39, 4, 'Giảng dạy nghiên cứu tại các trường ĐH'),
+    (40, 0, 'Các cơ quan Nhà nước, chẳng hạn như Cục thống kê, bộ phận thống kê của các cơ quan chính quyền'),
+    (40, 1, 'Các tổ chức kinh doanh dự đoán nhu cầu về các sản phẩm và phân tích rủi ro, lợi nhuận khi đầu tư'),
+    (40, 2, 'Hỗ trợ các nhà nghiên cứu cả trong khoa học tự nhiên và xã hội'),
+    (40, 3, 'Các tổ chức nghiên cứu và giáo dục'),
+    (40, 4, 'Tạp chí và báo phân tích thị trường tài chính'),
+    (40, 5, 'Kênh thể thao và các hiệp hội cung cấp bình luận đi kèm với điểm phân tích, và các thông tin khác có liên quan'),
+    (41, 0, 'Các công ty bảo hiểm'),
+    (41, 1, 'Các công ty tài chính'),
+    (41, 2, 'Các công ty tư vấn'),
+    (41, 3, 'Các phòng ban bảo hiểm của Nhà nước'),
+    (41, 4, 'Các trường ĐH và CĐ'),
+    (41, 5, 'Các hãng đầu tư và ngân hàng'),
+    (41, 6, 'Các đơn vị kế toán công và liên doanh lớn'),
+    (42, 0, 'Đây là chuyên ngành chính làm nền tảng cho các ngành nghề liên quan tới khoa học về sự sống. Nơi làm việc cụ thể của nhà sinh vật học phụ thuộc vào lĩnh vực chuyên sâu mà người đó chọn, ví dụ như phòng thí nghiệm sinh học, công ty dược phẩm, nhà máy thực phẩm, nhà máy bia… Bạn cũng có thể giảng dạy môn sinh học tại các trường ĐH, CĐ, TC, THPT, THCS'),
+    (43, 0, 'Các viện nghiên cứu của Trung tâm Khoa học tự nhiên và công nghệ quốc gia'),
+    (43, 1, 'Các viện, trung tâm nghiên cứu và các đài, trạm của Tổng cục Khí tượng thủy văn'),
+    (43, 2, 'Tập đoàn Dầu khí'),
+    (43, 3, 'Các đơn vị chuyên môn của quân đội, các cơ quan, doanh nghiệp trong các ngành kinh tế, kĩ thuật liên quan tới khí hậu, tài nguyên, nước và biển…'),
+    (43, 4, 'Các trường đại học'),
+    (44, 0, 'Làm việc trong các phòng nghiên cứu thí nghiệm của Nhà nước và tư nhân'),
+    (44, 1, 'Làm việc trong các doanh nghiệp bào chế thuốc và dược phẩm, sản xuất chất hoá học, nông nghiệp và các ngành liên quan'),
+    (44, 2, 'Làm việc trong các tổ chức giáo dục liên quan tới giảng dạy và nghiên cứu'),
+    (45, 0, 'Bệnh viện'),
+    (45, 1, 'Ngành công nghiệp hoá chất'),
+    (45, 2, 'Các tổ chức nghiên cứu'),
+    (45, 3, 'Các cơ sở giáo dục'),
+    (45, 4, 'Các công ty dược phẩm'),
+    (45, 5, 'Các cơ quan chỉnh hình, phục hồi chức năng'),
+    (45, 6, 'Chuyên gia tư vấn độc lập'),
+    (46, 0, 'Làm việc với các tổ chức, doanh nghiệp phát triển máy móc thiết bị nông nghiệp, phương pháp chế biến thực phẩm, phân bón, thuốc trừ sâu, nâng cao số lượng và chất lượng cây trồng và vật nuôi'),
+    (46, 1, 'Chuyên gia về trang trại như vườn cây ăn quả, cà phê, trang trại gia cầm ...'),
+    (46, 2, 'Làm việc với các cơ quan Nhà nước trong lĩnh vực quản lí nông nghiệp'),
+    (46, 3, 'Làm công tác nghiên cứu giảng dạy trong các trường ĐH, CĐ, TC'),
+    (47, 0, 'Các công ty đánh bắt thuỷ sản'),
+    (47, 1, 'Các tổ chức nghiên cứu và phát triển'),
+    (47, 2, 'Các tổ chức BVMT'),
+    (48, 0, 'Làm việc cho cơ quan kiểm lâm và bảo tồn rừng'),
+    (48, 1, 'Làm việc cho các dự án về môi trường của các tổ chức phi lợi nhuận (ví dụ: Tổ chức Hoà bình xanh)'),
+    (48, 2, 'Làm việc cho các cơ quan quốc tế về phát triển, môi trường'),
+    (49, 0, 'Các trung tâm, viện nghiên cứu'),
+    (49, 1, 'Các tổ chức hàn lâm, trường ĐH, CĐ'),
+    (49, 2, 'Các cơ quan Nhà nước'),
+    (49, 3, 'Các công ty tư vấn kĩ thuật tư nhân'),
+    (49, 4, 'Các nhà máy và xí nghiệp có hệ thống kiểm soát ô nhiễm và quản lí chất thải'),
+    (49, 5, 'Các tổ chức BVMT'),
+    (50, 0, 'Bất cứ ngành công nghiệp nào'),
+    (50, 1, 'Các trung tâm nghiên cứu'),
+    (50, 2, 'Các Viện hàn lâm'),
+    (50, 3, 'Các cơ quan Nhà nước'),
+    (50, 4, 'Các công ty tư vấn kĩ thuật tư nhân');
+
+-- Jobs 51 to 100
+INSERT INTO job_specializations (job_id, sort_order, specialization) VALUES
+    (51, 0, 'Công nghệ kĩ thuật vật liệu xây dựng'),
+    (51, 1, 'Công nghệ kĩ thuật xây dựng'),
+    (51, 2, 'Công nghệ kĩ thuật công trình xây dựng'),
+    (51, 3, 'Xây dựng dân dụng và công nghiệp'),
+    (52, 0, 'Công nghệ ô tô'),
+    (52, 1, 'Công nghệ kĩ thuật ô tô'),
+    (53, 0, 'Công nghệ kĩ thuật cơ khí'),
+    (53, 1, 'Công nghệ chế tạo máy'),
+    (53, 2, 'Công nghệ kĩ thuật cơ điện tử'),
+    (53, 3, 'Công nghệ kĩ thuật ô tô'),
+    (53, 4, 'Công nghệ kĩ thuật nhiệt'),
+    (54, 0, 'Công nghệ kĩ thuật hóa học'),
+    (54, 1, 'Kĩ thuật hóa học'),
+    (54, 2, 'Hóa học'),
+    (55, 0, 'Luyện gang'),
+    (55, 1, 'Luyện thép'),
+    (55, 2, 'Luyện kim màu'),
+    (55, 3, 'Luyện kim đen'),
+    (55, 4, 'Luyện Ferro hợp kim'),
+    (55, 5, 'Công nghệ sản xuất alumin'),
+    (55, 6, 'Công nghệ nhiệt luyện'),
+    (55, 7, 'Công nghệ đúc kim loại'),
+    (55, 8, 'Công nghệ cán, kéo kim loại'),
+    (55, 9, 'Công nghệ kĩ thuật vật liệu'),
+    (55, 10, 'Kĩ thuật vật liệu kim loại'),
+    (56, 0, 'Công nghệ vật liệu'),
+    (56, 1, 'Kĩ thuật vật liệu'),
+    (56, 2, 'Kĩ thuật vật liệu kim loại'),
+    (57, 0, 'Điện công nghiệp và dân dụng'),
+    (57, 1, 'Hệ thống điện'),
+    (57, 2, 'Nhiệt điện'),
+    (57, 3, 'Thủy điện'),
+    (57, 4, 'Công nghệ kĩ thuật điện, điện tử'),
+    (58, 0, 'Kĩ thuật điện, điện tử'),
+    (58, 1, 'Kĩ thuật cơ điện tử'),
+    (58, 2, 'Công nghệ kĩ thuật cơ điện tử'),
+    (58, 3, 'Công nghệ kĩ thuật điện, điện tử'),
+    (58, 4, 'Công nghệ kĩ thuật điện tử, truyền thông'),
+    (59, 0, 'Công nghệ điện tử - viễn thông'),
+    (59, 1, 'Công nghệ phát sóng'),
+    (59, 2, 'Kĩ thuật điện tử truyền thông'),
+    (60, 0, 'Kĩ thuật hàng không'),
+    (60, 1, 'Kĩ sư vũ trụ'),
+    (61, 0, 'Thú y'),
+    (61, 1, 'Dược thú y'),
+    (61, 2, 'Sản xuất thuốc thú y'),
+    (61, 3, 'Dịch vụ thú y'),
+    (62, 0, 'Thú y'),
+    (62, 1, 'Dược thú y'),
+    (62, 2, 'Sản xuất thuốc thú y'),
+    (62, 3, 'Sản xuất thuốc thú y'),
+    (62, 4, 'Dịch vụ thú y'),
+    (63, 0, 'Dược sĩ'),
+    (63, 1, 'Kĩ thuật dược'),
+    (63, 2, 'Kĩ thuật kiểm nghiệm thuốc'),
+    (63, 3, 'Dược học'),
+    (63, 4, 'Hóa dược'),
+    (64, 0, 'Kế toán doanh nghiệp'),
+    (64, 1, 'Kế toán hành chính – sự nghiệp'),
+    (64, 2, 'Kế toán lao động, tiền lương và bảo hiểm xã hội'),
+    (64, 3, 'Kế toán ngân hàng'),
+    (64, 4, 'Kế toán xây dựng'),
+    (65, 0, 'Quản trị kinh doanh xăng dầu và khí đốt'),
+    (66, 0, 'Vận tải đường sắt'),
+    (66, 1, 'Vận tải đường bộ và thành phố'),
+    (66, 2, 'Vận tải đa phương thức'),
+    (66, 3, 'Vận tải &amp;amp; Kinh tế đường sắt'),
+    (66, 4, 'Vận tải - Kinh tế đường bộ và thành phố'),
+    (66, 5, 'Qui hoạch &amp;amp; Quản lí giao thông vận tải đô thị'),
+    (66, 6, 'Điều khiển các quá trình vận tải'),
+    (66, 7, 'Khai thác vận tải'),
+    (66, 8, 'Kinh tế vận tải'),
+    (67, 0, 'Quản trị và kinh doanh điện'),
+    (67, 1, 'Quản trị và kinh doanh xăng dầu và khí đốt'),
+    (67, 2, 'Quản trị kinh doanh năng lượng'),
+    (68, 0, 'Kinh tế học'),
+    (68, 1, 'Kinh tế quốc tế'),
+    (68, 2, 'Kinh tế dân số và lao động'),
+    (68, 3, 'Kinh tế tổ chức công nghiệp'),
+    (68, 4, 'Kinh tế hoạch định'),
+    (68, 5, 'Kinh tế tài chính công'),
+    (68, 6, 'Hệ thống thông tin kinh tế'),
+    (69, 0, 'Kinh tế quốc tế'),
+    (69, 1, 'Kinh doanh quốc tế'),
+    (70, 0, 'Tài chính ngân hàng'),
+    (71, 0, 'Thiết kế âm thanh, ánh sáng'),
+    (71, 1, 'Công nghệ điện ảnh, truyền hình'),
+    (72, 0, 'Tài chính – ngân hàng'),
+    (72, 1, 'Tài chính tín dụng'),
+    (73, 0, 'Môn liên quan: lĩnh vực chuyên sâu chủ yếu là liên quan đến CNTT. Ví dụ: lập trình, phần cứng...'),
+    (73, 1, 'Quản lí: Giáo viên cũng có thể chuyển sang công việc quản lí và trở thành người đứng đầu bộ môn, khoa, trường (ví dụ: trưởng khoa, hiệu trưởng)'),
+    (74, 0, 'Truyền thông kĩ thuật số'),
+    (74, 1, 'Thiết kế'),
+    (74, 2, 'Hiệu ứng hình ảnh'),
+    (74, 3, 'Đồ họa chuyển động'),
+    (74, 4, 'Hoạt họa'),
+    (74, 5, 'Phát triển sản xuất'),
+    (74, 6, 'Hỗ trợ thiết kế bằng vi tính'),
+    (74, 7, 'Thiết kế đồ họa'),
+    (74, 8, 'Thiết kế trang web'),
+    (74, 9, 'Công nghệ xuất bản điện tử (sách, báo, video, nhạc)'),
+    (75, 0, 'Mạng máy tính'),
+    (75, 1, 'An ninh mạng'),
+    (75, 2, 'CSDL'),
+    (75, 3, 'Quản trị dữ liệu'),
+    (76, 0, 'Sử dụng phàn mềm'),
+    (76, 1, 'Lắp đặt và sửa chữa phần cứng'),
+    (76, 2, 'Kỹ thuật lập trình'),
+    (77, 0, 'Thủ quỹ tiền mặt'),
+    (78, 0, 'Biếm họa tâm lí'),
+    (78, 1, 'Biếm họa chính trị'),
+    (78, 2, 'Biếm họa về bản tính con người'),
+    (78, 3, 'Tranh châm biếm'),
+    (78, 4, 'Đồ họa hoạt hình'),
+    (79, 0, 'Công nghệ vật liệu in'),
+    (79, 1, 'Công nghệ bao bì đóng gói: các kĩ thuật in bao bì đóng gói'),
+    (79, 2, 'Kĩ thuật sau in'),
+    (79, 3, 'Kĩ thuật trước in'),
+    (80, 0, 'Thiết kế và sản xuất giày dép da'),
+    (80, 1, 'Thiết kế và sản xuất đồ vật bằng da'),
+    (80, 2, 'Thiết kế và sản xuất đồ may mặc bằng da'),
+    (81, 0, 'Nhà phác thảo kĩ thuật/ dân sự'),
+    (81, 1, 'Nhà phác thảo kiến trúc'),
+    (81, 2, 'Nhà phác thảo bản đồ'),
+    (81, 3, 'Nhà thiết kế và phác thảo kĩ thuật số'),
+    (82, 0, 'Thiết kế bao bì sản phẩm'),
+    (82, 1, 'Thiết kế đồ họa bao bì'),
+    (82, 2, 'Kĩ thuật sản xuất bao bì'),
+    (82, 3, 'Vật liệu bao bì'),
+    (82, 4, 'Kĩ thuật in'),
+    (82, 5, 'Đóng gói và ổn định sản phẩm'),
+    (82, 6, 'Quản lí chất lượng sản phẩm bao bì'),
+    (82, 7, 'Bao bì đóng gói trong các ngành đặc thù (như hàng tiêu dùng, hàng xa xỉ, thực phẩm, mĩ phẩm và chăm sóc sức khỏe, quà tặng)'),
+    (83, 0, 'Các công đoạn sản xuất giấy và bìa'),
+    (83, 1, 'Nghiên cứu và phát triển giấy từ nguyên liệu mới, sản phẩm mới từ giấy'),
+    (83, 2, 'Tái chế giấy'),
+    (84, 0, 'Công nghệ sợi'),
+    (84, 1, 'Công nghệ dệt thoi'),
+    (84, 2, 'Công nghệ dệt kim'),
+    (84, 3, 'Công nghệ may'),
+    (84, 4, 'Công nghệ sản xuất tất và hàng dệt kim'),
+    (84, 5, 'Công nghệ giặt là'),
+    (84, 6, 'Máy móc thiết bị dệt may'),
+    (85, 0, 'Thiết kế và sản xuất giày dép da'),
+    (85, 1, 'Thiết kế và sản xuất đồ vật bằng da'),
+    (85, 2, 'Thiết kế và sản xuất đồ may mặc và phụ kiện bằng da'),
+    (85, 3, 'Thiết kế và sản xuất va li, túi xách bằng da'),
+    (86, 0, 'Chăm sóc da'),
+    (86, 1, 'Massage mặt và toàn thân'),
+    (86, 2, 'Chăm sóc và trang điểm tóc'),
+    (86, 3, 'Làm móng'),
+    (86, 4, 'Các liệu pháp đặc biệt trong chăm sóc sắc đẹp (vật lí trị liệu, cổ truyền, Nhật Bản, Hàn Quốc, Trung Quốc…)'),
+    (86, 5, 'Trang điểm'),
+    (86, 6, 'Trang điểm và hóa trang cho các đối tượng/ dịp đặc thù (đám cưới, chụp ảnh, đám tiệc, điện ảnh, sân khấu, truyền hình…)'),
+    (87, 0, 'Thiết kế kiến trúc'),
+    (87, 1, 'Thiết kế nội ngoại thất công trình xây dựng'),
+    (87, 2, 'Thiết kế qui hoạch đô thị'),
+    (87, 3, 'Thiết kế cảnh quan'),
+    (88, 0, 'Thiết kế cảnh quan, vườn hoa, công viên'),
+    (88, 1, 'Kiến trúc cảnh quan'),
+    (88, 2, 'Thiết kế khu du lịch, nghỉ dưỡng, khu vực nghỉ ngơi giải trí'),
+    (89, 0, 'Thiết kế trên máy tính'),
+    (89, 1, 'Thiết kế máy móc thiết bị công nghiệp'),
+    (89, 2, 'Thiết kế chuyên ngành cụ thể (như ô tô, nội thất, sản phẩm dệt may, thiết bị gia dụng)'),
+    (89, 3, 'Thiết kế bao bì'),
+    (90, 0, 'Thiết kế chuyên sâu theo nhóm sản phẩm cụ thể (như thời trang nữ/ nam/ trẻ em, đồ công sở, dạ hội, áo dài/ trang phục truyền thống, đồ thể thao, phụ kiện…)'),
+    (90, 1, 'Thiết kế giày dép'),
+    (90, 2, 'Thiết kế trang sức và kim hoàn'),
+    (90, 3, 'Thiết kế trang phục da và đồ da'),
+    (90, 4, 'Tiếp thị và bán hàng thời trang'),
+    (90, 5, 'Truyền thông về thời trang'),
+    (91, 0, 'Trắc địa bản đồ'),
+    (91, 1, 'Trắc địa công trình'),
+    (91, 2, 'Trắc địa mỏ'),
+    (91, 3, 'Trắc địa biển'),
+    (91, 4, 'Viễn thám'),
+    (91, 5, 'Trắc địa ảnh'),
+    (91, 6, 'Hệ thống thông tin địa lí'),
+    (91, 7, 'Khảo sát và vẽ bản đồ'),
+    (91, 8, 'Kĩ thuật công nghệ trắc địa'),
+    (92, 0, 'Thiết kế in ấn'),
+    (92, 1, 'Thiết kế trang web'),
+    (92, 2, 'Thiết kế quảng cáo'),
+    (92, 3, 'Đồ họa video'),
+    (92, 4, 'Hoạt họa'),
+    (92, 5, 'Hiệu ứng đặc biệt'),
+    (92, 6, 'Truyền thông kĩ thuật số'),
+    (92, 7, 'Xuất bản điện tử (sách, báo, video, nhạc)'),
+    (93, 0, 'Nhiếp ảnh thời trang'),
+    (93, 1, 'Nhiếp ảnh công nghiệp'),
+    (93, 2, 'Nhiếp ảnh y tế'),
+    (93, 3, 'Nhiếp ảnh báo chí'),
+    (93, 4, 'Nhiếp ảnh sản phẩm'),
+    (93, 5, 'Nhiếp ảnh du lịch, thiên nhiên hoang dã'),
+    (94, 0, 'Thiết kế sản phẩm đồ gỗ nội thất, đồ gia dụng và phụ kiện'),
+    (94, 1, 'Thiết kế nội ngoại thất gia dụng, văn phòng, tòa nhà thương mại, công trình công nghiệp'),
+    (94, 2, 'Thiết kế sân khấu, điện ảnh'),
+    (95, 0, 'Thiết kế chuyên sâu theo loại sản phẩm (như đồ dệt may, đồ gỗ, sơn mài, khảm trai, đồ đá, gốm sứ, thủy tinh)'),
+    (95, 1, 'Kinh doanh tiếp thị sản phẩm thủ công mĩ nghệ'),
+    (96, 0, 'Chuyên sâu theo loại hình Mỹ thuật (như hội họa, điêu khắc, nhiếp ảnh) hoặc kĩ thuật (như bột màu, màu nước, sơn dầu)'),
+    (97, 0, 'Quảng cáo và minh hoạ'),
+    (97, 1, 'Thiết kế thương hiệu'),
+    (97, 2, 'Thiết kế đồ họa'),
+    (97, 3, 'Thiết kế đồ họa hoạt hình'),
+    (97, 4, 'Thiết kế sách và tạp chí'),
+    (97, 5, 'Biếm họa'),
+    (97, 6, 'Thiết lập và thiết kế triển lãm'),
+    (98, 0, 'Quay phim trên không'),
+    (98, 1, 'Quay phim dưới nước'),
+    (98, 2, 'Quay phim kĩ thuật số'),
+    (98, 3, 'Quay phim tài liệu, điện ảnh, tác phẩm sân khấu, ca nhạc'),
+    (98, 4, 'Quay phim báo chí truyền hình'),
+    (98, 5, 'Quay phim sự kiện xã hội, gia đình'),
+    (99, 0, 'Sản xuất giống'),
+    (99, 1, 'Trồng hoa'),
+    (99, 2, 'Trồng cây cảnh'),
+    (99, 3, 'Chăm sóc vườn hoa cây cảnh '),
+    (99, 4, 'Quản lí cây xanh đô thị'),
+    (100, 0, 'Định hình đá quý'),
+    (100, 1, 'Mạ điện'),
+    (100, 2, 'Khắc và tráng men'),
+    (100, 3, 'Đánh bóng và hoàn thiện'),
+    (100, 4, 'Phân loại đá quý'),
+    (100, 5, 'Thiết kế trang sức'),
+    (100, 6, 'Tiếp thị và trưng bày đồ trang sức'),
+    (100, 7, 'Gia công đá quý');
+INSERT INTO job_tasks (job_id, sort_order, task) VALUES
+    (51, 0, 'Thực hiện nghiên cứu và phát triển các lí thuyết và phương pháp mới và được cải tiến liên quan đến kĩ thuật xây dựng'),
+    (51, 1, 'Tư vấn và thiết kế các kết cấu như cầu, đập, bến tầu, đường bộ, sân bay, đường sắt, kênh đào, đường ống, hệ thống thải nước, kiểm soát lũ lụt và các công trình công nghiệp và lớn khác'),
+    (51, 2, 'Quyết định và chỉ rõ các phương pháp xây dựng, vật liệu và tiêu chuẩn chất lượng, và chỉ đạo công tác xây dựng'),
+    (51, 3, 'Thiết lập các hệ thống kiểm soát và đảm bảo hoạt động chức năng hiệu quả của các cấu trúc cũng như độ an toàn và BVMT'),
+    (51, 4, 'Xác định vị trí và chỉnh sửa các sự cố'),
+    (51, 5, 'Tổ chức và chỉ đạo bảo dưỡng sửa chữa các cấu trúc hiện có'),
+    (51, 6, 'Nghiên cứu và tư vấn về các vấn đề của vật liệu đặc biệt'),
+    (51, 7, 'Duy trì đội ngũ kĩ thuật và tư vấn viên với các chuyên gia liên quan khác'),
+    (51, 8, 'Chuẩn bị tài liệu và báo cáo khoa học'),
+    (51, 9, 'Giám sát công nhân'),
+    (52, 0, 'Thiết kế động cơ và các bộ phận khác của xe ô tô, việc này cần áp dụng các công thức toán học và vật lí'),
+    (52, 1, 'Thiết kế các hệ thống cụ thể trong ô tô như hệ thống phun nhiên liệu, điều hòa, phanh...'),
+    (52, 2, 'Thử nghiệm và tiến hành thí nghiệm nguyên mẫu'),
+    (52, 3, 'Giám sát việc lắp ráp và sản xuất ô tô/ phụ tùng ô tô'),
+    (52, 4, 'Xây dựng và giám sát quy trình bảo dưỡng ô tô'),
+    (52, 5, 'Đo lường các chỉ số kỹ thuật của xe ô tô'),
+    (53, 0, 'Tư vấn và thiết kế máy móc thiết bị, dụng cụ, bộ phận phi điện – điện tử để đạt được mục tiêu sản xuất và chế biến nhất định trong các ngành công nghiệp và nông nghiệp'),
+    (53, 1, 'Xác định và kiểm tra các phương pháp sản xuất, lắp đặt và hoạt động của máy móc thiết bị và dụng cụ'),
+    (53, 2, 'Cộng tác với kĩ sư công nghiệp để có kế hoạch bố trí máy móc thiết bị'),
+    (53, 3, 'Thiết lập tiêu chuẩn và qui trình kiểm soát để đảm bảo hoạt động hiệu quả và an toàn của máy móc thiết bị, dụng cụ'),
+    (53, 4, 'Tổ chức và chỉ đạo việc bảo dưỡng và sửa chữa máy móc thiết bị, dụng cụ'),
+    (53, 5, 'Nghiên cứu và tư vấn về nhiên liệu và chức năng của máy móc, về công nghệ của các vật liệu, sản phẩm và qui trình sản xuất cụ thể trên máy móc đó'),
+    (53, 6, 'Quản lí các tác động của việc vận hành máy móc đối với người sử dụng và môi trường'),
+    (53, 7, 'Giám sát thợ cơ khí và công nhân có liên quan'),
+    (54, 0, 'Thực hiện nghiên cứu và tư vấn, phát triển các qui trình hóa chất thương mại để lọc dầu và các chất lỏng khác hoặc khí và sản xuất các chất và hàng hóa như dẫn xuất dầu, chất nổ, lương thực và đồ uống, dược phẩm, hoặc các vật liệu tổng hợp khác'),
+    (54, 1, 'Nghiên cứu tiền khả thi và khả thi về xây dựng các máy móc sản xuất hóa chất'),
+    (54, 2, 'Xác định các phương pháp sản xuất, vật liệu và tiêu chuẩn chất lượng và đảm bảo chúng đồng bộ với các chi tiết kĩ thuật'),
+    (54, 3, 'Lập các tiêu chuẩn và qui trình kiểm soát để đảm bảo độ an toàn và hiệu quả của hoạt động sản xuất'),
+    (54, 4, 'Xác định và chỉnh sửa các sự cố'),
+    (54, 5, 'Tổ chức và chỉ đạo bảo dưỡng, sửa chữa các thiết bị hiện có'),
+    (54, 6, 'Nghiên cứu và tư vấn về các vấn đề về công nghệ liên quan đến các vật liệu, sản phẩm và các quá trình cụ thể'),
+    (54, 7, 'Duy trì đội ngũ kĩ thuật và tư vấn viên với các chuyên gia liên quan khác'),
+    (54, 8, 'Chuẩn bị tài liệu và báo cáo khoa học'),
+    (55, 0, 'Nghiên cứu các tính chất của kim loại, hợp kim và các loại vật liệu khác cũng như mối quan hệ của chúng với kim loại và hợp kim'),
+    (55, 1, 'Nghiên cứu, tư vấn và giám sát công nghệ sản xuất kim loại và hợp kim trong các xưởng đúc, cán, luyện kim và chế tạo'),
+    (55, 2, 'Cộng tác với kĩ sư vật liệu để tìm ra các phương pháp xử lí kim loại'),
+    (55, 3, 'Quản lí các tác động của quá trình luyện kim đối với người sử dụng và môi trường'),
+    (55, 4, 'Giám sát thợ luyện kim và công nhân có liên quan'),
+    (56, 0, 'Nghiên cứu của các nguồn tài nguyên có giá trị công nghiệp và thương mại'),
+    (56, 1, 'Phát triển các phương pháp chế tạo vật liệu thành những sản phẩm sử dụng được'),
+    (56, 2, 'Phát triển các phương pháp kết hợp hai loại vật liệu khác nhau bằng cách ghép nối, nung chảy, chế tạo hợp kim, nhằm tạo ra các vật liệu hoặc sản phẩm mới'),
+    (56, 3, 'Thiết kế sản phẩm mới'),
+    (56, 4, 'Xác định được nguyên nhân vật liệu bị hỏng và cách nâng cao độ bền của vật liệu'),
+    (56, 5, 'Phát triển các biện pháp kéo dài tuổi thọ của vật liệu'),
+    (57, 0, 'Lập kế hoạch và thiết kế các trạm phát điện'),
+    (57, 1, 'Bố trí các loại thiết bị phát điện'),
+    (57, 2, 'Sửa chữa bảo dưỡng các trạm phát điện'),
+    (57, 3, 'Thiết kế các mạch điện trong một sản phẩm'),
+    (57, 4, 'Thiết kế các mạch điện trong một tòa nhà'),
+    (57, 5, 'Thiết kế các mạch điện trong một chiếc xe'),
+    (57, 6, 'Sửa chữa bảo dưỡng thiết bị điện'),
+    (57, 7, 'Thiết kế và duy trì động cơ điện'),
+    (57, 8, 'Lắp đặt thiết bị chuyển mạch, cáp và phụ kiện'),
+    (57, 9, 'Lắp đặt thiết bị phát tín hiệu để quản lí giao thông đường bộ, hàng không, đường sắt'),
+    (57, 10, 'Thiết kế và duy trì cấu tạo điện của mạng viễn thông'),
+    (57, 11, 'Tính toán về mặt kĩ thuật và phát triển các dự toán chi phí'),
+    (58, 0, 'Thiết kế mạch điện tử cho các thiết bị điện tử'),
+    (58, 1, 'Chuẩn bị thiết kế các chi tiết'),
+    (58, 2, 'Phát triển các thiết bị thử nghiệm'),
+    (58, 3, 'Kiểm tra việc cài đặt vì mục tiêu an toàn và chất lượng'),
+    (58, 4, 'Tiến hành nghiên cứu cải tiến thiết kế của thiết bị điện tử cụ thể'),
+    (59, 0, 'Tư vấn và thiết kế phần điện tử của các máy móc thiết bị, bộ phận, hệ thống và các tổ hợp viễn thông'),
+    (59, 1, 'Xác định các phương pháp sản xuất và lắp đặt, tiêu chuẩn vật liệu, chất lượng và an toàn, chỉ đạo và giám sát việc sản xuất, lắp đặt các máy móc thiết bị và hệ thống viễn thông'),
+    (59, 2, 'Tổ chức và chỉ đạo việc bảo dưỡng và sửa chữa các thiết bị, hệ thống viễn thông'),
+    (59, 3, 'Nghiên cứu và tư vấn về các trang bị viễn thông'),
+    (59, 4, 'Thiết kế, qui hoạch các mạng lưới viễn thông ứng dụng công nghệ vô tuyến, hữu tuyến hay cáp quang'),
+    (59, 5, 'Thiết kế các mạng phân phối truyền thanh và truyền hình không dây và có dây'),
+    (59, 6, 'Giám sát thợ kĩ thuật và công nhân có liên quan'),
+    (60, 0, 'Thiết kế các loại máy bay, bao gồm cả thiết kế tổng thể và thiết kế chi tiết'),
+    (60, 1, 'Điều này đòi hỏi phải áp dụng các công thức toán học và vật lí'),
+    (60, 2, 'Thiết kế hệ thống chi tiết trong máy bay như hệ thống phun nhiên liệu, điều hòa, thiết bị hạ cánh… Thử nghiệm và tiến hành thí nghiệm nguyên mẫu'),
+    (60, 3, 'Giám sát việc lắp ráp và sản xuất máy bay / chi tiết máy bay'),
+    (60, 4, 'Sửa chữa máy bay hiện có để thêm các bộ phận mới (ví dụ như thùng nhiên liệu phụ)'),
+    (60, 5, 'Chuẩn bị các chuyến bay'),
+    (60, 6, 'Tiến hành sửa chữa và bảo trì thường xuyên'),
+    (61, 0, 'Nghiên cứu, cải tiến và phát triển các khái niệm, học thuyết và phương pháp hoạt động thú y'),
+    (61, 1, 'Tiến hành kiểm tra và chẩn đoán bệnh và tổn thương trên động vật'),
+    (61, 2, 'Quản lí và thực hiện việc điều trị thú y bằng phẫu thuật hoặc dùng thuốc'),
+    (61, 3, 'Thử nghiệm trên bò sữa và đàn vật nuôi khác, tiêm chủng phòng bệnh trên động vật'),
+    (61, 4, 'Tư vấn về chăm sóc và chăn nuôi gia súc'),
+    (61, 5, 'Kiểm tra chất lượng, độ tinh khiết và an toàn thực phẩm được làm toàn bộ hoặc một phần từ nguyên liệu có nguồn gốc động vật dùng cho người'),
+    (61, 6, 'Hỗ trợ về dịch tễ học, X-quang và giám sát khác về thú y'),
+    (61, 7, 'Chuẩn bị tài liệu và báo cáo khoa học'),
+    (62, 0, 'Tư vấn cho cộng đồng và cá nhân về việc bệnh và điều trị vật nuôi'),
+    (62, 1, 'Khám bệnh vật nuôi để chẩn đoán bệnh vật nuôi'),
+    (62, 2, 'điều trị vật nuôi bị bệnh hoặc bị thương, đặc biệt là các bệnh thông thường'),
+    (62, 3, 'Làm sạch và khử trùng dụng cụ và chuẩn bị vật liệu được sử dụng trong việc khám và điều trị động vật'),
+    (62, 4, 'Thực hiện các nhiệm vụ kỹ thuật liên cần thiết cho việc thụ tinh nhân tạo của vật nuôi'),
+    (62, 5, 'Hỗ trợ bác sĩ thú y trong quá trình điều trị'),
+    (62, 6, 'Tiến hành chụp x quang, lấy mẫu, và tiến hành các xét nghiệm trong phòng thí nghiệm để hỗ trợ chẩn đoán sức khỏe vật nuôi'),
+    (63, 0, 'Chuẩn bị và chỉ đạo chuẩn bị dược phẩm theo đơn đã kê của bác sĩ y khoa, nha khoa, bác sĩ thú y và theo liều lượng cho trước'),
+    (63, 1, 'Kiểm tra đơn để bảo đảm rằng lượng thuốc kê không vượt quá mức cho phép và hướng dẫn sử dụng cho bệnh nhân hoặc những người mua thuốc và tư vấn về các loại thuốc tương khắc nhau'),
+    (63, 2, 'Phân phối thuốc và dược phẩm tại bệnh viện và bán thuốc trong các nhà thuốc'),
+    (63, 3, 'Giữ các hóa đơn, đặc biệt đối với các chất gây mê, chất độc và các thuốc gây nghiện'),
+    (63, 4, 'Thử nghiệm thuốc để xác định tính chất, độ tinh chất và tác dụng'),
+    (63, 5, 'Tham gia phát triển các biện pháp kiểm soát và qui định'),
+    (63, 6, 'Chuẩn bị tài liệu và báo cáo khoa học'),
+    (64, 0, 'Tư vấn, lập kế hoạch và thiết lập ngân sách, kiểm soát tài khoản và các chính sách và hệ thống kiểm soát khác'),
+    (64, 1, 'Chuẩn bị và xác thực báo cáo tài chính để trình bầy, để phục vụ quản lí, cổ đông và các cơ quan theo luật định và các cơ quan khác'),
+    (64, 2, 'Chuẩn bị kế hoạch kinh phí, báo cáo thực hiện thực tế'),
+    (64, 3, 'Chuẩn bị hoàn thuế, tư vấn và nêu ý kiến về các vấn đề thuế trước cơ quản quản lí thuế'),
+    (64, 4, 'Lập kế hoạch lợi nhuận và ngân sách, làm báo cáo kết quả thực hiện thực tế'),
+    (64, 5, 'Thực hiện điều tra tài chính trong những vấn đề như nghi ngờ gian lận, tình trạng không trả được nợ và phá sản'),
+    (64, 6, 'Kiểm tra các tài khoản và sổ sách lưu giữ'),
+    (64, 7, 'Thực hiện điều tra và tư vấn về quản lí các vấn đề quản lí như hiệu quả, cổ phiếu, doanh thu, sản phẩm mới, v.v.'),
+    (64, 8, 'Thiết lập và kiểm soát hệ thống xác định chi phí đơn vị của các sản phẩm và dịch vụ'),
+    (65, 0, 'Xác định hạn ngạch sản xuất'),
+    (65, 1, 'Lập kế hoạch các vị trí khai thác'),
+    (65, 2, 'Lập kế hoạch vận chuyển nguyên liệu thô'),
+    (65, 3, 'Xác định tính phù hợp của nhân viên, thiết bị và công nghệ'),
+    (65, 4, 'Lập kế hoạch và quản lí lịch làm việc và trang thiết bị'),
+    (65, 5, 'Giám sát hoạt động của nhà máy'),
+    (65, 6, 'Giám sát việc mua sắm, lắp đặt và bảo trì thiết bị'),
+    (65, 7, 'Điều phối và triển khai các chính sách về y tế và an toàn lao động'),
+    (65, 8, 'Thực hiện các qui định và luật liên quan đến hoạt động khai thác khoáng sản và môi trường'),
+    (65, 9, 'Lựa chọn, đào tạo và giám sát nhân viên'),
+    (66, 0, 'Lưu giữ hồ sơ vận hành và điều phối thời gian vận tải hành khách và hàng hóa'),
+    (66, 1, 'Chỉ đạo tuyến đường xe lửa, xe buýt, máy bay và tàu thủy'),
+    (66, 2, 'Tạo ra và duy trì hệ thống vận chuyển hành khách, hàng hóa'),
+    (66, 3, 'Chỉ đạo và giám sát các hoạt động như phân công phương tiện, lái xe, cung ứng nhiên liệu và các yêu cầu khác'),
+    (66, 4, 'Giám sát sự di chuyển của phương tiện qua các tuyến đường qui định'),
+    (66, 5, 'Quản lí sự cố phương tiện và điều xe thay thế'),
+    (67, 0, 'Tìm hiểu về các loại năng lượng cần thiết khác nhau'),
+    (67, 1, 'Tính toán lượng năng lượng cần thiết'),
+    (67, 2, 'Phát triển mô hình tiêu thụ năng lượng và tạo ra các hệ thống cung cấp năng lượng dựa trên các mô hình đó'),
+    (67, 3, 'Xác định các nguồn cung cấp năng lượng, đàm phán hợp đồng với các nhà cung cấp và tiến hành mua năng lượng'),
+    (67, 4, 'Xác định các phương tiện truyền tải năng lượng đến nơi cần thiết'),
+    (67, 5, 'Quản lí việc phân phối năng lượng'),
+    (67, 6, 'Tính toán chi phí mua, truyền tải và phân phối năng lượng'),
+    (67, 7, 'Phát triển và triển khai kế hoạch cắt giảm hoặc tối ưu hoá việc tiêu thụ năng lượng'),
+    (68, 0, 'Theo dõi, thu thập, phân tích và lí giải các số liệu kinh tế bằng cách sử dụng các học thuyết kinh tế, kĩ thuật thống kê và kĩ thuật khác'),
+    (68, 1, 'Áp dụng các công thức toán học và kĩ thuật thống kê để kiểm định các học thuyết kinh tế và đề ra giải pháp cho các vấn đề kinh tế'),
+    (68, 2, 'Dự báo những thay đổi trong môi trường kinh tế và các chỉ số chính của nền kinh tế như thu nhập và chi tiêu, lãi suất và tỉ giá, việc làm và thất nghiệp, để xây dựng ngân sách ngắn hạn, lập kế hoạch dài hạn và đánh giá đầu tư'),
+    (68, 3, 'Đánh giá tính phù hợp, kết quả và hiệu quả của các chính sách kinh tế - xã hội, các quyết định chính trị đối với nền kinh tế, tài chính và xã hội'),
+    (68, 4, 'Tư vấn, khuyến nghị về chính sách và kế hoạch cho nền kinh tế, chiến lược và đầu tư cho công ti, tiến hành nghiên cứu khả thi cho dự án, dựa trên những nhân tố và xu hướng quá khứ, hiện tại và dự báo tương lai'),
+    (68, 5, 'Tư vấn ứng dụng các kết quả nghiên cứu vào xây dựng chính sách kinh tế - xã hội cho các bộ phận trong dân số, các vùng và cho phát triển các thị trường'),
+    (68, 6, 'Chuẩn bị các nghiên cứu và báo cáo khoa học'),
+    (69, 0, 'Thông thạo luật và tập quán thương mại quốc tế'),
+    (69, 1, 'Phát triển lĩnh vực chuyên môn để được cấp chứng nhận cần thiết cho việc trao đổi buôn bán các mặt hàng khác nhau'),
+    (69, 2, 'Phát triển danh bạ doanh nghiệp'),
+    (69, 3, 'Xác định sản phẩm thương mại'),
+    (69, 4, 'Hiểu rõ các phương thức vận tải và quản lí hàng hóa (ví dụ như một số sản phẩm có thể dễ bị hư hỏng và cần được chuyển tới người mua trong một vài giờ)'),
+    (69, 5, 'Hiểu rõ cách thức lưu trữ ở kho của sản phẩm'),
+    (69, 6, 'Thông thạo về tiền tệ quốc tế'),
+    (70, 0, 'Nghiên cứu thị trường và xác định các hoạt động đầu tư tiềm năng'),
+    (70, 1, 'Tạo ra các sản phẩm tài chính'),
+    (70, 2, 'Tương tác với khách hàng để nắm bắt được kế hoạch đầu tư của họ, đặc biệt chú ý tới việc hiểu rõ được các mức độ rủi ro mà khách hàng sẵn sàng chấp nhận'),
+    (70, 3, 'Tìm hiểu tình hình tài chính của khách hàng'),
+    (70, 4, 'Phát triển kế hoạch đầu tư cho khách hàng và thực hiện đúng kế hoạch đó'),
+    (70, 5, 'Thông báo cho khách hàng về tình trạng các khoản đầu tư'),
+    (70, 6, 'Điều hành kinh tế và tư vấn khách hàng'),
+    (70, 7, 'Tư vấn cho các ngân hàng và các cơ quan khác về qui trình đầu tư'),
+    (71, 0, 'Làm việc với các loại phương tiện truyền thông ghi âm khác nhau'),
+    (71, 1, 'Thiết kế, cài đặt và vận hành các thiết bị và công cụ ghi âm'),
+    (71, 2, 'Ghi âm, biên tập và phối âm bằng các phương tiện kĩ thuật khác nhau để cho ra sản phẩm hoàn chỉnh'),
+    (72, 0, 'Xử lí tiền gửi và tiền rút séc, chuyển khoản, hối phiếu, thẻ tín dụng, thư chuyển tiền, chi phiếu ngân hàng của khách hàng và những giao dịch ngân hàng có liên quan khác'),
+    (72, 1, 'Ghi nợ vào tài khoản khách hàng'),
+    (72, 2, 'Trả hối phiếu và chuyển nhượng tiền thay mặt khách hàng'),
+    (72, 3, 'Nhận thư, bán tem thư và thực hiện các công việc tại quầy bưu điện như trả hối phiếu, chuyển tiền và các công việc liên quan'),
+    (72, 4, 'Đổi tiền từ ngoại tệ này sang ngoại tệ khác, theo yêu cầu của khách hàng'),
+    (72, 5, 'Ghi lại các giao dịch và giải quyết bằng quyết toán tiền mặt'),
+    (73, 0, 'Xác định nhu cầu đào tạo về CNTT và yêu cầu cụ thể của các cá nhân và tổ chức'),
+    (73, 1, 'Chuẩn bị và phát triển tài liệu học tập và các tài liệu phụ trợ như sổ tay, phương tiện nghe nhìn, mô hình và các tư liệu tham khảo khác'),
+    (73, 2, 'Thiết kế, điều phối. xếp lịch và thực hiện đào tạo các chương trình cho cá nhân và nhóm, hỗ trợ các hội thảo, trình diễn và hội nghị'),
+    (73, 3, 'Thực hiện đánh gia thường xuyên và tổng kết chất lượng và hiệu quả đào tạo, điều chỉnh chương trình đào tạo'),
+    (73, 4, 'Tìm hiểu, nghiên cứu và đánh giá các tư liệu bổ sung để có được hiểu biết rộng hơn về nội dung chuyên môn'),
+    (73, 5, 'Cập nhật các phiên bản phần mềm mới, các tiến bộ về CNTT, biên soạn tài liệu hướng dẫn người dùng và các hướng dẫn khác'),
+    (74, 0, 'Phân tích, thiết kế và phát triển các trang internet có áp dụng một hỗn hợp của nghệ thuật và sáng tạo với việc lập trình phần mềm và các ngôn ngữ chữ viết và giao diện với môi trường hoạt động'),
+    (74, 1, 'Thiết kế và phát triển chuyển động, các hình ảnh, sự trình diễn, trò chơi, âm thanh và đoạn phim video kỹ thuật số và các ứng dụng Internet sử dụng phần mềm đa phương tiện, các công cụ và tiện ích, đồ họa có tính tương tác và ngôn ngữ lập trình'),
+    (74, 2, 'Cùng với các nhà chuyên gia về mạng thực hiện các vấn đề liên quan tới trang web, như là an ninh và việc kết nối tới máy chủ của các trang web, để kiểm soát được an ninh mạng internet và các máy chủ, phân bổ không gian, quyền truy cập của người sử dụng, tính liên tục, sao lưu trang web và lập kế hoạch khôi phục sự cố'),
+    (74, 3, 'Thiết kế, phát triển và kết hợp mã máy tính với các dữ liệu đầu vào chuyên dụng, như các file hình ảnh, âm thanh và ngôn ngữ lập trình, để sản xuất, duy tu và hỗ trợ các trang web'),
+    (74, 4, 'Hỗ trợ trong việc phân tích, xác định và phát triển các chiến lược internet, các phương pháp sử dụng web và các kế hoạch phát triển'),
+    (75, 0, 'Thiết kế và phát triển kiến trúc CSDL, cấu trúc dữ liệu, từ điển và quy ước về dữ liệu cho các dự án hệ thống thông tin'),
+    (75, 1, 'Thiết kê, xây dựng, điều chỉnh, tích hợp và thử nghiệm các hệ CSDL'),
+    (75, 2, 'Xây dựng và triển khai chính sách quản lý, tài liệu, chuẩn và mô hình về dữ liệu'),
+    (75, 3, 'Duy trì và quản lý mạng máy tính và các môi trường máy tính khác'),
+    (75, 4, 'Phân tích phát triển, diễn giải và đánh giá kiến trúc, mô hình dữ liệu và sơ đồ của các hệ phức tạp trong thiết kế, triển khai, cấu hình và tích hợp các hệ thống máy tính'),
+    (76, 0, 'Vận hành và giám sát các thiết bị ngoại vi và các thiết bị máy tính liên quan'),
+    (76, 1, 'Nhập lệnh, sử dụng thiết bị đầu cuối máy tính, và kích hoạt bảng điều khiển máy tính và các thiết bị ngoại vi để tích hợp và vận hành thiết bị'),
+    (76, 2, 'Giám sát hệ thống tìm lỗi của thiết bị hoặc lỗi vận hành'),
+    (76, 3, 'Thông báo cho giám sát viên hoặc kỹ thuật viên bảo dưỡng các trục trặc của thiết bị'),
+    (76, 4, 'Giải quyết các thông báo lỗi chương trình bằng cách tìm và sửa các vấn đề, thông báo lỗi cho các kỹ thuật viên khác hoặc kết thúc chương trình'),
+    (76, 5, 'Đọc các hướng dẫn thiết lập để xác định những thiết bị được sử dụng, yêu cầu sử dụng, các tài liệu như các đĩa và sách hướng dẫn và thiết lập các quản lý'),
+    (76, 6, 'Sửa chữa, khôi phục, tách biệt và sắp xếp các chương trình đầu ra theo yêu cầu, và gửi dữ liệu đến những người sử dụng cụ thể'),
+    (76, 7, 'Cài đặt các thiết bị ngoại vi, như máy in, với các vật liệu được chọn để chạy vận hành, hoặc giám sát việc cài đặt các thiết bị ngoại vi do người vận hành thiết bị ngoại vi thực hiện'),
+    (77, 0, 'Thực hiện việc kiểm tra lần cuối về tính hợp pháp và hợp lý của chứng từ trước khi xuất, nhập tiền khỏi quỹ'),
+    (77, 1, 'Kiểm tra, phân loại, sắp xếp tiền mặt để nhận biết, xuất nhập tiền dễ dàng'),
+    (77, 2, 'Thực hiện việc thanh toán tiền mặt hàng ngày theo quy trình thanh toán của đơn vị'),
+    (77, 3, 'Thực hiện kiểm kê đối chiếu quỹ thường kỳ với kế toán tổng hợp'),
+    (77, 4, 'Quản lý toàn bộ tiền mặt trong két sắt'),
+    (77, 5, 'Lưu trữ chứng từ thu chi tiền'),
+    (77, 6, 'Thực hiện các công việc khác được phân công'),
+    (78, 0, 'Thu thập thông tin về các sự kiện trong lịch sử hoặc trong hiện tại, các vấn đề đang gây tranh cãi, các vấn đề chính trị và triết học'),
+    (78, 1, 'Biến quan sát thành tranh vẽ hài hước, châm biếm hoặc gợi mở suy nghĩ'),
+    (78, 2, 'Tranh có thể có hoặc không có chú thích'),
+    (78, 3, 'Tạo ra một phong cách hoặc một tập hợp các nhân vật'),
+    (78, 4, 'Sử dụng thành thạo công cụ đa phương tiện (ví dụ: bản vẽ bao gồm các đường thẳng và cong riêng biệt đặt trên nền)'),
+    (78, 5, 'Làm việc với các nhà khoa học xã hội, lịch sử, nghệ thuật, nhà in, biên tập viên tạp chí… để tạo ra và sản xuất tranh biếm họa, truyện tranh'),
+    (79, 0, 'Thực hiện các qui trình in ấn khác nhau như in ốp-xét, in cán, in lưới…'),
+    (79, 1, 'Nghiên cứu sử dụng các thiết bị điện tử và từ tính trong quí trình in ấn, ví dụ như in từ tính, in bằng âm thanh nổi, bố cục ảnh, khắc laze, in dầu, in 3D…'),
+    (79, 2, 'Phát triển qui trình in chính xác, nhanh chóng và tiết kiệm để phục vụ mục đích in ấn khác nhau'),
+    (79, 3, 'Thử nghiệm các loại mực giấy và máy móc khác nhau để cải thiện các ấn phẩm cuối cùng'),
+    (79, 4, 'Giám sát qui trình in ấn'),
+    (80, 0, 'Chế biến các loại da thành phẩm'),
+    (80, 1, 'Kiểm tra da và những khiếm khuyết trong cấu trúc da'),
+    (80, 2, 'Tổ chức, quản lí sản xuất da và các nghiên cứu về máy móc sử dụng trong sản xuất da'),
+    (80, 3, 'Kiểm soát chất lượng, tiếp thị và bán sản phẩm da'),
+    (80, 4, 'Áp dụng các qui trình khoa học và kĩ thuật để chế biến da và thuộc da'),
+    (80, 5, 'Giám sát việc sử dụng các hóa chất khác nhau trong chế biến da'),
+    (81, 0, 'Chuẩn bị và sửa lại các bản vẽ từ các bản phác thảo và các chi tiết kĩ thuật được chuẩn bị bởi kĩ sư, nhà thiết kế để sản xuất, lắp đặt và lắp ráp máy móc, thiết bị hoặc để xây dựng, sửa đổi, bảo dưỡng và sửa chữa các công trình xây dựng và các dự án kĩ thuật kiến trúc và kĩ thuật dân dụng khác'),
+    (81, 1, 'Vẽ trên máy tính để tạo, thay đổi và in ra các bản cứng và biểu diễn bằng số liệu các bản phác thảo'),
+    (81, 2, 'Vận hành thiết bị bảng biểu số hóa và các thiết bị khác để chuyển bản cứng thành hình thức số hóa'),
+    (81, 3, 'Sử dụng các dụng cụ đo ba chiều để lấy số liệu đo vẽ địa hình bằng phương pháp tương tự hoặc phương pháp số hóa và sử dụng những số liệu đó để chuẩn bị và xem xét lại phép đo vẽ địa hình, thủy văn học, thực tiễn và các bản đồ khác'),
+    (81, 4, 'Chuẩn bị và xem xét lại các tranh minh họa cho các công việc liên quan, sách tham khảo và sách kĩ thuật liên quan tới lắp đặt, vận hành, bảo dưỡng và sửa chữa máy móc và thiết bị hàng hóa khác'),
+    (82, 0, 'Phân tích các bản vẽ và thông số kĩ thuật của sản phẩm để xác định các đặc tính vật lí và hóa học, các yêu cầu đặc thù về vận chuyển, bảo quản, thẩm mĩ, an toàn, dán nhãn và loại vật liệu cần thiết cho việc đóng gói'),
+    (82, 1, 'Thiết kế bao bì và qui trình đóng gói phù hợp'),
+    (82, 2, 'Lập kế hoạch, triển khai và giám sát hoạt động sản xuất bao bì, kiểm soát chất lượng sản phẩm bao bì'),
+    (82, 3, 'Giám sát việc xử lí phụ phẩm và rác thải'),
+    (82, 4, 'Tư vấn cho doanh nghiệp và khách hàng về qui trình, vật liệu và thiết bị bao gói, dán nhãn, niêm phong và chằng buộc'),
+    (83, 0, 'Xác định và kiểm tra nguyên liệu sản xuất giấy (như bã mía, tre, nứa, bạch đàn, keo, giấy bìa cũ…)'),
+    (83, 1, 'Tham gia lắp đặt dây chuyển máy móc thiết bị sản xuất giấy hoặc sản phẩm từ giấy'),
+    (83, 2, 'Kiểm tra mẫu để đảm bảo định lượng chính xác của sản phẩm giấy'),
+    (83, 3, 'Giám sát và điều chỉnh quá trình sản xuất nếu cần'),
+    (83, 4, 'Kiểm soát chất lượng sản phẩm'),
+    (83, 5, 'Giám sát việc xử lí phụ phẩm và rác thải'),
+    (83, 6, 'Nghiên cứu cải tiến công nghệ sản xuất giấy không ảnh hưởng tới môi trường'),
+    (83, 7, 'Đưa nguyên liệu vào dây chuyền sản xuất bột giấy, giấy hoặc sản phẩm từ giấy đúng chủng loại và định lượng'),
+    (83, 8, 'Vận hành máy móc thiết bị sản xuất bột giấy, giấy hoặc sản phẩm từ giấy theo qui trình đã đề ra'),
+    (84, 0, 'Làm rập, sơ đồ theo tài liệu kĩ thuật từ khách hàng'),
+    (84, 1, 'Viết qui trình công đoạn sản xuất sản phẩm'),
+    (84, 2, 'Làm tài liệu kĩ thuật, thiết kế và cân bằng chuyền'),
+    (84, 3, 'Lập kế hoạch sản uất và theo dõi tiến độ'),
+    (84, 4, 'Đề xuất và kiểm tra định mức nguyên phụ liệu, định mức công đoạn'),
+    (84, 5, 'Kiểm soát chất lượng sản phẩm'),
+    (84, 6, 'Giám sát việc xử lí phụ phẩm và rác thải'),
+    (84, 7, 'Cải tiến thao tác, qui trình, máy móc thiết bị sản xuất'),
+    (84, 8, 'Xây dựng, ban hành qui trình, tài liệu tiêu chuẩn cho các bộ phận sợi, dệt - nhuộm, phụ liệu và sản phẩm dệt - nhuộm'),
+    (84, 9, 'Kiểm tra, đánh giá chất lượng các dòng nguyên phụ liệu mới'),
+    (84, 10, 'Kiểm tra, so mẫu sợi, vải dệt - nhuộm'),
+    (84, 11, 'Khắc phục lỗi, cho ra thành phẩm đúng với mẫu gốc'),
+    (84, 12, 'Kiểm soát chất lượng và an toàn sản phẩm từ khâu thiết kế đến khi sản phẩm lên kệ'),
+    (85, 0, 'Kiểm tra và phân loại nguyên liệu da theo chủng loại, màu sắc, kết cấu, kích thước, mức độ khiếm khuyết trước khi đưa vào thuộc'),
+    (85, 1, 'Triển khai thuộc và chế biến da bằng cách hồi ẩm, làm sạch, làm mềm, tẩy lông, thuộc và xử lí với muối, hóa chất và các chiết xuất từ thiên nhiên'),
+    (85, 2, 'Nhuộm, làm khô và hoàn thiện bề mặt để che khuyết điểm và phủ chống ẩm'),
+    (85, 3, 'Kiểm soát chất lượng sản phẩm'),
+    (85, 4, 'Giám sát việc xử lí phụ phẩm và rác thải'),
+    (85, 5, 'Nghiên cứu, thử nghiệm, cải tiến, áp dụng các hóa chất, máy móc và qui trình công nghệ trong sản xuất da'),
+    (85, 6, 'Đọc, hiểu kĩ tài liệu kĩ thuật, nghiên cứu mẫu giày, túi xách, phụ kiện và yêu cầu của khách hàng'),
+    (85, 7, 'Tham gia thiết kế và sản xuất mẫu sản phẩm'),
+    (85, 8, 'So sánh thông số, qui cách giữa tài liệu kĩ thuật và mẫu để thiết kế ra một bộ rập chính xác ngay từ đầu'),
+    (85, 9, 'Kiểm tra, thiết kế rập và nhảy size theo đúng yêu cầu'),
+    (85, 10, 'Phụ trách kĩ thuật tại xưởng'),
+    (85, 11, 'Điều hành sản xuất, đảm bảo tiến độ và kĩ thuật'),
+    (85, 12, 'Đánh giá kĩ năng công đoạn'),
+    (85, 13, 'Giám sát sản xuất để đề ra các giải pháp nhằm giải quyết những vấn đề chất lượng và hiệu quả sản xuất trên chuyền'),
+    (85, 14, 'Kiểm soát chất lượng sản phẩm từ khâu cắt đến khâu hoàn thiện sản phẩm'),
+    (86, 0, 'Cắt, gội, nhuộm, uốn, duỗi và tạo kiểu tóc'),
+    (86, 1, 'Chăm sóc và điều trị tóc và da đầu'),
+    (86, 2, 'Làm tóc giả theo yêu cầu của khách hàng'),
+    (86, 3, 'Làm sạch và chăm sóc da bằng cách sử dụng các loại kem, sữa và các sản phẩm liên quan đến khuôn mặt và các bộ phận của cơ thể'),
+    (86, 4, 'Massage mặt và cơ thể'),
+    (86, 5, 'Hỗ trợ bác sĩ để làm sạch, chuẩn bị, làm dịu da và cơ thể trong các trị liệu thẩm mĩ chuyên sâu như laser, lăn kim, trị liệu ánh sáng…'),
+    (86, 6, 'Trang điểm cho các khách hàng'),
+    (86, 7, 'Trang điểm và hóa trang cho các diễn viên, nghệ sĩ biểu diễn, người tham gia chương trình truyền hình'),
+    (86, 8, 'Làm sạch, định hình, chăm sóc, đánh bóng và trang điểm móng tay, móng chân'),
+    (86, 9, 'điều trị các bệnh đơn giản của bàn chân con người như nứt nẻ, bị chai hay biến dạng ngón chân, móng tay'),
+    (86, 10, 'Theo dõi sức khỏe và hỗ trợ khách hàng tắm hơi, jacuzzi'),
+    (86, 11, 'Tấy lông cho khách hàng bằng sáp, đường và các kĩ thuật tẩy lông phù hợp'),
+    (86, 12, 'Tư vấn khách hàng về chế độ chăm sóc, dinh dưỡng và thể dục để hỗ trợ giảm và giữ cân'),
+    (87, 0, 'Khảo sát mặt bằng, thảo luận với khách hàng, lãnh đạo và những người liên quan để xác định loại công trình, phong cách, kích thước, nhu cầu sử dụng và các khía cạnh của công trình hiện tại hoặc tương lai'),
+    (87, 1, 'Chuẩn bị và trình bày các phương án đề xuất thiết kế, vật liệu và thời gian thi công'),
+    (87, 2, 'thảo luận và tư vấn khách hàng chọn phương án'),
+    (87, 3, 'Thiết kế công trình, chuẩn bị bản phác thảo, bản vẽ chi tiết, sơ đồ mặt bằng, cân nhắc các yếu tố kết cấu, công năng, thẩm mĩ, nội ngoại thất và trang thiết bị để hoàn thiện thiết kế cuối cùng'),
+    (87, 4, 'Chuẩn bị các thông số, kế hoạch xây dựng và văn bản hợp đồng để huy động thợ hoặc mời thầu giúp khách hàng'),
+    (87, 5, 'Xử lí các giấy tờ thủ tục cần thiết để đảm bảo dự án khả thi về mặt phong cách, cấu trúc, chi phí, thời gian, pháp lí'),
+    (87, 6, 'Giám sát thi công phù hợp với bản vẽ, thông số kĩ thuật và chất lượng, các tiêu chuẩn, hướng dẫn và qui định'),
+    (87, 7, 'Phối hợp với kĩ sư xây dựng, nhà thầu, đội trưởng, thợ chính và thợ phụ để phát hiện và giải quyết các vấn đề phát sinh'),
+    (87, 8, 'Điều phối công việc giữa nhiều nhà thầu khác nhau'),
+    (87, 9, 'Qui hoạch phát triển các khu đô thị như bố trí mặt bằng, đường giao thông, công viên và các tiện ích chung'),
+    (87, 10, 'Cải tiến và phát triển các phương pháp thiết kế kiến trúc'),
+    (88, 0, 'Khảo sát tổng thể, tìm hiểu nhu cầu của khách hàng và đưa ra đề xuất về phong cách và các khía cạnh khác của thiết kế tổng quan'),
+    (88, 1, 'Làm việc với các kiến trúc sư, kĩ sư xây dựng, người làm vườn, chuyên gia quản lí nước và môi trường để thu thập thông tin về công trình, môi trường, đất, nước, đường di chuyển của mặt trời và bóng râm'),
+    (88, 2, 'Quyết định cần trồng hoặc giữ loại thực vật nào'),
+    (88, 3, 'Chuẩn bị bản vẽ tổng quan và chi tiết để bố trí địa điểm xây dựng, vườn hoa, mặt nước, đường đi bộ và chạy xe'),
+    (88, 4, 'Chuẩn bị thông số kĩ thuật, dự toán và danh sách các tài liệu yêu cầu'),
+    (88, 5, 'Giám sát thi công cảnh quan'),
+    (88, 6, 'Quản lí thường xuyên cảnh quan khu vực'),
+    (89, 0, 'Thảo luận với khách hàng và những người liên quan để xác định yêu cầu và mục đích của sản phẩm'),
+    (89, 1, 'Hình thành ý tưởng thiết kế sản phẩm'),
+    (89, 2, 'Cân đối yếu tố thẩm mĩ với các yêu cầu kĩ thuật, tính năng, sinh thái và sản xuất'),
+    (89, 3, 'Chuẩn bị bản phác thảo, sơ đồ, minh họa, kế hoạch, mẫu và mô hình để thể hiện ý tưởng thiết kế'),
+    (89, 4, 'Thảo luận và thống nhất phương án thiết kế với khách hàng, lãnh đạo, nhân viên bán hàng và nhân viên sản xuất'),
+    (89, 5, 'Xác định, lựa chọn và đề xuất chất liệu đảm bảo tính năng và thẩm mĩ, phương pháp sản xuất và hoàn thiện để đưa sản phẩm vào sản xuất'),
+    (89, 6, 'Thiết kế chi tiết và viết hướng dẫn cho thiết kế được chọn để sản xuất'),
+    (89, 7, 'Làm mô hình và sản phẩm mẫu'),
+    (89, 8, 'Giám sát quá trình chuẩn bị vật liệu công cụ và sản xuất sản phẩm'),
+    (90, 0, 'Thiết kế hàng may mặc theo xu hướng thời trang'),
+    (90, 1, 'Phát triển dòng sản phẩm thời trang với màu sắc và chất liệu đặc trưng'),
+    (90, 2, 'Dự các buổi trình diễn thời trang và xem đánh giá của các tạp chí nhằm thu thập thông tin về các xu hướng thời trang và sở thích của người tiêu dùng'),
+    (90, 3, 'Thiết kế trang phục và phụ kiện cho các cá nhân, các nhà bán lẻ hoặc sân khấu, truyền hình, nhà sản xuất phim'),
+    (90, 4, 'Vẽ mẫu cho các thiết kế và cắt theo mẫu'),
+    (90, 5, 'Thử sản phẩm trên người mẫu và ma-nơ-canh, sau đó chỉnh sửa thiết kế để đạt được hiệu quả mong muốn'),
+    (90, 6, 'Điều chỉnh ý tưởng thiết kế cho phù hợp với thị trường đại chúng'),
+    (90, 7, 'Thảo luận ý tưởng thiết kế với nhân viên và người quản trị bán hàng hoặc khách hàng'),
+    (90, 8, 'Định giá sản phẩm thiết kế'),
+    (91, 0, 'Khảo sát, đo đạc và mô tả bề mặt đất cho các mục đích khác nhau, như vẽ bản đồ và xác định ranh giới các khu đất'),
+    (91, 1, 'Khảo sát thăm dò mỏ, phân tách các tầng trong lòng đất, đánh dấu vị trí chính xác của các phân tầng khác nhau và thiết lập biểu đồ, bản đồ để kiểm soát hướng và qui mô mỏ'),
+    (91, 2, 'Khảo sát đáy biển, đáy sông hồ, phân tách các tầng dưới nước, đánh dấu vị trí chính xác của các phân tầng khác nhau và thiết lập biểu đồ, bản đồ để xác định các luồng lạch và luồng thông thuyền'),
+    (91, 3, 'Tiến hành chụp ảnh trên không, viễn thám và khảo sát dữ liệu để xây dựng và sửa đổi bản đồ địa hình, các biểu đồ, bản đồ tiện ích và bản đồ chuyên biệt khác'),
+    (91, 4, 'Nghiên cứu và tư vấn về kĩ thuật, thẩm mĩ và kinh tế trong việc sản xuất bản đồ'),
+    (92, 0, 'Thảo luận với khách hàng và những người liên quan để xác định và phân tích yêu cầu và mục tiêu truyền thông'),
+    (92, 1, 'Hình thành ý tưởng thiết kế cho đối tượng cần truyền thông'),
+    (92, 2, 'Chuẩn bị bản phác thảo, sơ đồ, minh họa và bản trình bày ý tưởng'),
+    (92, 3, 'Thảo luận và thống nhất phương án thiết kế với khách hàng, lãnh đạo, nhân viên bán hàng và nhân viên sản xuất'),
+    (92, 4, 'Thiết kế các đồ họa tĩnh và động để đáp ứng các yêu cầu về chức năng, thẩm mĩ và sáng tạo của khách hàng'),
+    (92, 5, 'Tạo ra hình ảnh 2D và 3D để minh hoạt vật thể chuyển động hoặc quá trình diễn ra bằng các phần mềm máy tính'),
+    (92, 6, 'Xác định, lựa chọn và đề xuất chất liệu đảm bảo tính năng và thẩm mĩ, phương tiện phát hành, chuyển giao và trình diễn'),
+    (92, 7, 'Thiết kế chi tiết và viết hướng dẫn cho sản xuất'),
+    (92, 8, 'Triển khai sản xuất hoặc giám sát sản xuất'),
+    (93, 0, 'Chụp ảnh phục vụ mục đích quảng cáo, nghệ thuật, thương mại, công nghiệp, khoa học'),
+    (93, 1, 'Chụp ảnh minh họa cho tin tức và bài viết trên báo, tạp chí và các ấn phẩm khác'),
+    (93, 2, 'Chụp ảnh một hay một nhóm người'),
+    (93, 3, 'Bố trí và thực hiện ảnh động, video, chụp ảnh qua kính hiển vi và thiết bị chuyên dụng, kể cả chụp ảnh trên không'),
+    (94, 0, 'Khảo sát mặt bằng và tìm hiểu yêu cầu và sở thích của khách hàng'),
+    (94, 1, 'Làm bản vẽ trang trí nội thất và ngoại thất cho nhà ở, công trình xây dựng, xe hơi, máy bay, tàu và những công trình khác'),
+    (94, 2, 'Thiết kế và vẽ cảnh trang trí sân khấu, điện ảnh, truyền hình'),
+    (94, 3, 'Phối hợp với nhà thầu để triển khai thi công và hoàn thiện phù hợp với bản vẽ, thông số kĩ thuật và chất lượng'),
+    (94, 4, 'Sáng tạo và thực hiện các'),
+    (95, 0, 'Xác định các sản phẩm tiêu dùng có thể thiết kế và sản xuất theo phương pháp thủ công mĩ nghệ'),
+    (95, 1, 'Thiết kế sản phẩm thủ công mĩ nghệ có các tính năng mà nhiều đối tượng khách hàng có thể sử dụng'),
+    (95, 2, 'Thiết kế lại hàng thủ công mĩ nghệ truyền thống để phù hợp hơn với các thị trường và khách hàng đa dạng hơn'),
+    (95, 3, 'Giới thiệu các giá trị truyền thống và tính năng hiện đại để quảng bá mở rộng thị trường cho các mặt hàng thủ công mĩ nghệ'),
+    (95, 4, 'Tổ chức các nghệ nhân thủ công mĩ nghệ thành các nhóm sản xuất hoặc hợp tác xã, hướng dẫn họ qui trình sản xuất các sản phẩm mẫu mới'),
+    (96, 0, 'Sáng tác tác phẩm theo một loại hình Mỹ thuật cụ thể (như điêu khắc, hội họa, nhiếp ảnh), bằng các công cụ, vật liệu và phương tiện của loại hình Mỹ thuật đó'),
+    (96, 1, 'Quan hệ với các đại lí và nhà kinh doanh tác phẩm nghệ thuật'),
+    (96, 2, 'Tổ chức triển lãm tác phẩm'),
+    (97, 0, 'Thảo luận với khách hàng để xác định và phân tích mục tiêu, yêu cầu, sản phẩm và ý tưởng quảng cáo'),
+    (97, 1, 'Hình thành ý tưởng thiết kế'),
+    (97, 2, 'Chuẩn bị các bản phác thảo, minh họa để thể hiện ý tưởng bằng cách vẽ tay hoặc sử dụng phần mềm trên máy tính'),
+    (97, 3, 'Trình bày và thống nhất mẫu phác thảo với khách hàng'),
+    (97, 4, 'Thiết kế chi tiết, chỉnh sửa và hoàn thiện theo yêu cầu của khách hàng'),
+    (97, 5, 'Triển khai sản xuất hoặc giám sát sản xuất sản phẩm quảng cáo nếu cần'),
+    (98, 0, 'Bố trí, vận hành và giám sát hoạt động của máy quay, máy ảnh, phụ kiện và ánh sáng để ghi hình'),
+    (98, 1, 'Chuẩn bị tình huống bấm máy để bắt đầu ghi hình'),
+    (98, 2, 'Lựa chọn phim tư liệu (từ các phim dự trữ có sẵn với khả năng thay đổi độ sáng và màu sắc), và kiểm soát việc lựa chọn ống kính với độ dài tiêu cự, khẩu độ tiếp xúc và lấy nét cho phù hợp'),
+    (98, 3, 'Tính toán các chủng loại, số lượng các thiết bị chiếu sáng và phụ kiện một cách cụ thể'),
+    (98, 4, 'Chiếu sáng vị trí quay phim hoặc thiết lập vị trí quay phim với ánh sáng có sẵn, hoặc ánh sáng ban ngày'),
+    (98, 5, 'Xây dựng kế hoạch sử dụng ánh sáng, gel, bộ lọc, tiếp xúc, độ dài tiêu cự, lấy nét, tỉ lệ khung hình...'),
+    (98, 6, 'Đặt máy quay ở vị trí thích hợp liên quan đến các diễn viên/ đối tượng ghi hình, hành động và địa điểm'),
+    (98, 7, 'Làm việc, trao đổi cụ thể với giám đốc sản xuất để đảm bảo đạt được các yếu tố về nghệ thuật'),
+    (98, 8, 'Hướng dẫn cụ thể quá trình xử lí, in bộ phim và chuyển sang video (nếu cần)'),
+    (99, 0, 'Xác định chủng loại, số lượng cây giống và các sản phẩm để ươm, trồng'),
+    (99, 1, 'Mua hạt, củ, phân bón, vật tư khác'),
+    (99, 2, 'Đầu tư cải tạo đất đai, nhà vườn, kho xưởng, máy móc thiết bị, nuôi động vật để phục vụ trồng trọt'),
+    (99, 3, 'Thực hiện các hoạt động nông nghiệp như làm đất, gieo hạt, trồng, làm cỏ, bón phân, cắt tỉa cho hoa và các cây trồng khác'),
+    (99, 4, 'Sản xuất cây giống, củ và hạt'),
+    (99, 5, 'Trồng hoa, cây, cây bụi và cây trồng khác trong công viên, vườn công cộng hoặc tư nhân'),
+    (99, 6, 'Trồng cây cho triển lãm hoặc cho mục đích y tế'),
+    (99, 7, 'Cung cấp và tiếp thị sản phẩm cây, hoa và giống cây, hoa'),
+    (99, 8, 'Thu hoạch, lưu trữ và xử lí cơ bản sản phẩm nếu cần'),
+    (99, 9, 'Chăm sóc động vật phục vụ trồng trọt và bảo trì nhà vườn, kho xưởng và máy móc thiết bị'),
+    (100, 0, 'Thiết kế các sản phẩm trang sức hoàn chỉnh như nhẫn, dây chuyền, vòng đeo tay, trâm cài đầu từ các vật liệu như vàng, bạc, bạch kim, đá quý, đá nhân tạo'),
+    (100, 1, 'Đúc, đánh đồ trang sức và các sản phẩm kim loại màu khác bằng kĩ thuật thủ công'),
+    (100, 2, 'Thiết kế đồ trang sức mới và sửa đổi thiết kế hiện tại, có thể sử dụng máy tính khi cần thiết'),
+    (100, 3, 'Thiết kế khuôn đúc để sử dụng trong chế tác đồ trang sức'),
+    (100, 4, 'Tái chế, điều chỉnh, sửa chữa đồ trang sức cũ hoặc đồ kim hoàn theo thiết kế hoặc hướng dẫn'),
+    (100, 5, 'Kiểm tra bề mặt đá quý và kết cấu bên trong bằng các phương pháp như đo khúc xạ, soi kính hiển vi và các công cụ khác để phân biệt các loại đá, xác định các mẫu đá quý hiếm và phát hiện vết ảnh hưởng tới giá trị đá quý'),
+    (100, 6, 'Mài, khoan và hoàn thiện đá để sử dụng trong các thiết bị đo như la bàn và máy đo thời gian');
+INSERT INTO job_work_areas (job_id, sort_order, work_area) VALUES
+    (51, 0, 'Các công ty xây dựng'),
+    (51, 1, 'Các công ty cầu đường'),
+    (51, 2, 'Các công ty kiến trúc'),
+    (51, 3, 'Tư vấn độc lập'),
+    (52, 0, 'Các công ty sản xuất, lắp ráp, bảo dưỡng ô tô'),
+    (52, 1, 'Các đơn vị nghiên cứu và phát triển về ô tô'),
+    (53, 0, 'Trung tâm nghiên cứu'),
+    (53, 1, 'Các trường ĐH'),
+    (53, 2, 'Các cơ quan Nhà nước'),
+    (53, 3, 'Các doanh nghiệp chế tạo và sửa chữa máy móc thiết bị dụng cụ'),
+    (53, 4, 'Các doanh nghiệp tư vấn chế tạo cơ khí'),
+    (53, 5, 'Các doanh nghiệp có lắp đặt vận hành máy móc thiết bị'),
+    (54, 0, 'Các công ty dược phẩm, thực phẩm và đồ uống, hóa chất, lọc hóa dầu, phân bón'),
+    (54, 1, 'Tất cả các ngành công nghiệp sử dụng nguyên liệu thô để tạo ra sản phẩm (ví dụ như giấy, cao su)'),
+    (54, 2, 'Các đơn vị nghiên cứu và phát triển'),
+    (55, 0, 'Ngành công nghiệp luyện kim (ví dụ như các xưởng đúc, máy cán, chế tạo)'),
+    (55, 1, 'Trung tâm nghiên cứu'),
+    (55, 2, 'Các trường ĐH'),
+    (55, 3, 'Các cơ quan Nhà nước'),
+    (55, 4, 'Các công ty tư vấn kĩ thuật cá nhân'),
+    (56, 0, 'Bất cứ ngành công nghiệp nào'),
+    (56, 1, 'Các trung tâm nghiên cứu'),
+    (56, 2, 'Các viện hàn lâm'),
+    (56, 3, 'Các cơ quan Nhà nước'),
+    (56, 4, 'Các công ty tư vấn kĩ thuật tư nhân'),
+    (57, 0, 'Điện công nghiệp và dân dụng'),
+    (57, 1, 'Hệ thống điện'),
+    (57, 2, 'Nhiệt điện'),
+    (57, 3, 'Thủy điện'),
+    (57, 4, 'Công nghệ kĩ thuật điện, điện tử'),
+    (58, 0, 'Các cơ quan truyền thông, kĩ thuật vũ trụ và giao thông của Nhà nước'),
+    (58, 1, 'Các ngành công nghiệp sản xuất các dụng cụ điện tử'),
+    (58, 2, 'Các ngành công nghiệp liên quan tới truyền thông'),
+    (58, 3, 'Công nghiệp sản xuất máy tính'),
+    (58, 4, 'Các đơn vị nghiên cứu'),
+    (59, 0, 'Các công ty viễn thông'),
+    (59, 1, 'Các viện thiết kế'),
+    (59, 2, 'Các cơ quan quản lý viễn thông của nhà nước'),
+    (60, 0, 'Các nhà máy tham gia sản xuất máy bay'),
+    (60, 1, 'Các sân bay'),
+    (60, 2, 'Công ty hàng không'),
+    (60, 3, 'Không quân'),
+    (60, 4, 'Các đơn vị nghiên cứu và phát triển'),
+    (61, 0, 'Làm việc trong bệnh viện thú y'),
+    (61, 1, 'Làm việc trong các viện nghiên cứu chuyên ngành khác nhau của khoa học thú y'),
+    (61, 2, 'Làm việc trong nhà máy sữa, các công ty dược phẩm, trang trại gia cầm và trang trại nuôi heo'),
+    (61, 3, 'Làm việc trong phòng khám thú y tư nhân'),
+    (62, 0, 'Làm việc tại các nông trường, trang trại lớn Làm việc trong các cơ quan quản lý thú y các cấp'),
+    (62, 1, 'Làm việc trong phòng khám thú y tư nhân, bệnh viện dành cho vật nuôi/thú cưng'),
+    (62, 2, 'Làm việc trong các viện nghiên cứu, các phòng thí nghiệm thú y'),
+    (63, 0, 'Tự mở hiệu thuốc'),
+    (63, 1, 'Bộ phận dược phẩm trong một tổ chức chăm sóc sức khoẻ (ví dụ: bệnh viện)'),
+    (63, 2, 'Công ty dược phẩm sản xuất thuốc'),
+    (64, 0, 'Các doanh nghiệp trong nước, có vốn đầu tư nước ngoài'),
+    (64, 1, 'Các cơ quan Nhà nước'),
+    (64, 2, 'Hành nghề độc lập'),
+    (65, 0, 'Các công ty thăm dò khai thác dầu khí'),
+    (65, 1, 'Các doanh nghiệp, đơn vị thuộc ngành dầu khí'),
+    (65, 2, 'Các vụ, phòng phụ trách lĩnh vực dầu khí thuộc cơ quan quản lí Nhà nước Bộ Công thương, Văn phòng Chính phủ…'),
+    (66, 0, 'Có thể làm tại các bộ phận nghiệp vụ và quản lí trong cơ quan quản lí Nhà nước về giao thông vận tải nói chung, đặc biệt là giao thông vận tải đô thị, quản lí sử dụng đất và môi trường đô thị'),
+    (66, 1, 'Các Viện, trường đào tạo về giao thông vận tải, qui hoạch giao thông vận tải đô thị'),
+    (66, 2, 'Các ban quản lí dự án về xây dựng giao thông vận tải đô thị'),
+    (66, 3, 'Các doanh nghiệp kinh doanh vận tải đô thị, doanh nghiệp quản lí và khai thác cơ sở hạng tầng giao thông đô thị'),
+    (67, 0, 'Các doanh nghiệp, tổ chức sản xuất năng lượng'),
+    (67, 1, 'Các doanh nghiệp tiêu thụ nhiều điện và năng lượng các dạng khác'),
+    (68, 0, 'Các cơ quan Nhà nước'),
+    (68, 1, 'Làm cho các ngân hàng lớn'),
+    (68, 2, 'Các tổ chức phát triển và đa quốc gia như Ngân hàng Thế giới, Tổ chức Lao động quốc tế'),
+    (68, 3, 'Các doanh nghiệp và công ty lớn'),
+    (69, 0, 'Công ty đa quốc gia xuất khẩu và nhập khẩu hàng hoá và dịch vụ'),
+    (69, 1, 'Dịch vụ tư vấn xuất nhập khẩu cá nhân'),
+    (70, 0, 'Ngân hàng'),
+    (70, 1, 'Các công ty chuyên về đầu tư'),
+    (70, 2, 'Các hãng môi giới chứng khoám'),
+    (70, 3, 'Các công ty đa quốc gia'),
+    (71, 0, 'Phòng thu thanh'),
+    (71, 1, 'Công nghiệp làm phim'),
+    (71, 2, 'Hãng phim lồng tiếng'),
+    (71, 3, 'Buổi hoà nhạc trực tiếp'),
+    (71, 4, 'Đài phát thanh'),
+    (72, 0, 'Xử lí giao dịch trong các ngân hàng quốc doanh, cổ phần, nước ngoài…'),
+    (72, 1, 'Công việc liên quan tới chuyển hàng và chuyển tiền trong bưu điện'),
+    (73, 0, 'Các trường trung cấp'),
+    (73, 1, 'Các trường trung học'),
+    (73, 2, 'Các trung tâm đào tạo tin học'),
+    (73, 3, 'Các bộ phận đào tạo của doanh nghiệp'),
+    (74, 0, 'Các hãng phim'),
+    (74, 1, 'Các đài truyền hình'),
+    (74, 2, 'Các cơ quan quảng cáo'),
+    (74, 3, 'Nhà sản xuất video'),
+    (74, 4, 'Nhà hát và các buổi hòa nhạc trực tiếp'),
+    (74, 5, 'Các công ty tổ chức sự kiện'),
+    (75, 0, 'Các công ty dữ liệu'),
+    (75, 1, 'Các bộ phận quản trị mạng và dữ liệu của các công ty'),
+    (75, 2, 'Các ngân hàng'),
+    (75, 3, 'Các công ty viễn thông lớn'),
+    (76, 0, 'Các doanh nghiệp'),
+    (76, 1, 'Các nhà trường'),
+    (76, 2, 'Các cơ quan nhà nước'),
+    (77, 0, 'Các doanh nghiệp trong nước, có vốn đầu tư nước ngoài'),
+    (77, 1, 'Các cơ quan Nhà nước'),
+    (77, 2, 'Hành nghề độc lập'),
+    (78, 0, 'Tạp chí'),
+    (78, 1, 'Các tờ báo'),
+    (78, 2, 'Cơ quan quảng cáo'),
+    (78, 3, 'Làm họa sĩ minh họa hoặc họa sĩ truyện tranh cho các nhà xuất bản'),
+    (78, 4, 'Xưởng hoạt hình trong ngành sản xuất phim'),
+    (79, 0, 'Các xưởng in'),
+    (79, 1, 'Tòa soạn báo và tạp chí'),
+    (79, 2, 'Nhà xuất bản'),
+    (80, 0, 'Các công ti sản xuất giày dép, may mặc và phụ kiện'),
+    (80, 1, 'Nhà máy thuộc da và các công ti hóa da, hóa chất'),
+    (81, 0, 'Trong các ngành công nghiệp liên quan đến xây dựng, bản đồ học, kĩ thuật, kiến trúc và khảo sát'),
+    (82, 0, 'Doanh nghiệp trong các ngành đòi hỏi sản phẩm phải có bao bì như dược phẩm, thực phẩm, mĩ phẩm, hóa chất vệ sinh, công nghiệp chế tạo…'),
+    (82, 1, 'Các cơ sở, doanh nghiệp sản xuất bao bì'),
+    (82, 2, 'Các cơ sở, doanh nghiệp phân phối, bán lẻ'),
+    (82, 3, 'Các phòng thí nghiệm kiểm định chất lượng bao bì'),
+    (83, 0, 'Các cơ sở, doanh nghiệp sản xuất giấy'),
+    (83, 1, 'Các cơ sở, doanh nghiệp tái chế giấy'),
+    (83, 2, 'Các cơ sở sản xuất giấy thủ công'),
+    (83, 3, 'Các cơ sở, doanh nghiệp sản xuất bao bì'),
+    (83, 4, 'Các doanh nghiệp in'),
+    (84, 0, 'Các doanh nghiệp sản xuất sợi, sản phẩm dệt và may mặc'),
+    (84, 1, 'Các doanh nghiệp cung cấp nguyên phụ liệu, hóa chất và máy móc thiết bị cho ngành dệt may'),
+    (84, 2, 'Các phòng thí nghiệm, đơn vị chứng nhận sản phẩm dệt may'),
+    (85, 0, 'Các cơ sở, doanh nghiệp chế biến và thuộc da'),
+    (85, 1, 'Các cơ sở, doanh nghiệp sản xuất giày dép và sản phẩm da'),
+    (85, 2, 'Các doanh nghiệp cung cấp nguyên phụ liệu, hóa chất và máy móc thiết bị cho ngành da giày'),
+    (85, 3, 'Các phòng thí nghiệm, đơn vị chứng nhận sản phẩm da giày'),
+    (86, 0, 'Hành nghề tự do hoặc tự mở cơ sở làm đẹp da, tóc, móng, trang điểm'),
+    (86, 1, 'Mở kênh dạy chăm sóc sắc đẹp và trang điểm riêng trên mạng'),
+    (86, 2, 'Các thẩm mĩ viện, bộ phận thẩm mĩ trong khách sạn và khu nghỉ dưỡng'),
+    (86, 3, 'Các hãng mĩ phẩm'),
+    (86, 4, 'Ngành công nghiệp giải trí (truyền hình, phim, sân khấu)'),
+    (86, 5, 'Các trung tâm chăm sóc sức khỏe và vật lí trị liệu'),
+    (87, 0, 'Hành nghề tự do hoặc tự mở studio, công ty riêng'),
+    (87, 1, 'Các doanh nghiệp thiết kế kiến trúc, thiết kế nội thất'),
+    (87, 2, 'Các doanh nghiệp tư vấn thiết kế, giám sát, thi công xây dựng'),
+    (87, 3, 'Cơ quan nhà nước về quản lí đô thị, qui hoạch đô thị'),
+    (87, 4, 'Các viện nghiên cứu kiến trúc, thiết kế, qui hoạch kiến trúc và qui hoạch đô thị'),
+    (87, 5, 'Các trường dạy về thiết kế kiến trúc xây dựng, qui hoạch đô thị'),
+    (88, 0, 'Hành nghề tự do hoặc tự mở studio, công ty riêng'),
+    (88, 1, 'Các doanh nghiệp thiết kế kiến trúc, tư vấn thiết kế, giám sát, thi công xây dựng'),
+    (88, 2, 'Các doanh nghiệp thiết kế cảnh quan'),
+    (88, 3, 'Các công ty công viên cây xanh, các khu danh thắng, di tích, khu du lịch, khu đô thị'),
+    (88, 4, 'Các doanh nghiệp, đơn vị tư vấn qui hoạch, thiết kế, thi công xây dựng và phát triển đô thị, thi công xây dựng cảnh quan'),
+    (88, 5, 'Các cơ quan quản lí nhà nước về qui hoạch, xây dựng và quản lí đô thị, về cảnh quan và môi trường'),
+    (88, 6, 'Các cơ quan nghiên cứu, đào tạo và chuyển giao công nghệ về kiến trúc cảnh quan trong và ngoài nước'),
+    (89, 0, 'Hầu như tất cả các doanh nghiệp sản xuất, chế tạo máy móc, sản phẩm đều cần nhà thiết kế Mỹ thuật công nghiệp'),
+    (89, 1, 'Các công ty thời trang'),
+    (89, 2, 'Các doanh nghiệp sản xuất hàng tiêu dùng'),
+    (89, 3, 'Các đơn vị tổ chức trình diễn thời trang, sản phẩm'),
+    (90, 0, 'Hành nghề tự do hoặc mở studio, cửa hàng riêng'),
+    (90, 1, 'Các doanh nghiệp thiết kế, sản xuất hàng dệt may, thời trang'),
+    (90, 2, 'Các doanh nghiệp xuất nhập khẩu, phân phối hàng dệt may, thời trang'),
+    (90, 3, 'Các đơn vị tổ chức trình diễn thời trang và xuất bản tạp chí thời trang'),
+    (90, 4, 'Các nhà sản xuất phim và chương trình truyền hình'),
+    (90, 5, 'Các nhà hát, đoàn nghệ thuật biểu diễn'),
+    (90, 6, 'Các cơ quan quản lí nhà nước ngành dệt may'),
+    (90, 7, 'Các viện, trung tâm nghiên cứu phát triển dệt may'),
+    (91, 0, 'Cơ quan khí tượng thủy văn'),
+    (91, 1, 'Cơ quan trắc địa, bản đồ'),
+    (91, 2, 'Các doanh nghiệp, đơn vị thăm dò khảo sát dầu khí, khảo sát biển và công trình biển'),
+    (92, 0, 'Hành nghề tự do hoặc tự mở studio, công ti'),
+    (92, 1, 'Các doanh nghiệp xuất bản, in, thiết kế ấn phẩm, quảng cáo'),
+    (92, 2, 'Các doanh nghiệp truyền thông, tổ chức sự kiện'),
+    (92, 3, 'Các doanh nghiệp sản xuất video, phim'),
+    (92, 4, 'Các đài truyền hình'),
+    (92, 5, 'Nhà hát và các buổi hòa nhạc trực tiếp'),
+    (93, 0, 'Hành nghề tự do hoặc mở studio, cửa hàng riêng'),
+    (93, 1, 'Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện'),
+    (93, 2, 'Báo và tạp chí'),
+    (93, 3, 'Xưởng phim điện ảnh và truyền hình'),
+    (93, 4, 'Các doanh nghiệp in ấn, xuất bản'),
+    (93, 5, 'Các trung tâm nghiên cứu'),
+    (94, 0, 'Hành nghề tự do hoặc tự mở công ti'),
+    (94, 1, 'Các doanh nghiệp, cơ sở sản xuất đồ gỗ, đồ gia dụng và trang trí nội ngoại thất'),
+    (94, 2, 'Các doanh nghiệp thiết kế kiến trúc, tư vấn thiết kế, giám sát, xây dựng'),
+    (94, 3, 'Khách sạn, khu nghỉ dưỡng, nhà khách'),
+    (94, 4, 'Các doanh nghiệp sản xuất phim, chương trình truyền hình'),
+    (94, 5, 'Nhà hát, đoàn kịch'),
+    (94, 6, 'Đài truyền hình'),
+    (95, 0, 'Hành nghề tự do hoặc tự mở xưởng, cửa hàng, công ti'),
+    (95, 1, 'Các cơ sở, doanh nghiệp sản xuất và mua bán hàng thủ công mĩ nghệ'),
+    (95, 2, 'Các tổ chức trong nước và quốc tế về bảo tồn, phát triển nghề truyền thống'),
+    (95, 3, 'Các cửa hàng bán sản phẩm thủ công mĩ nghệ, đồ lưu niệm'),
+    (96, 0, 'Hành nghề tự do'),
+    (96, 1, 'Mở studio riêng'),
+    (96, 2, 'Giảng dạy tại các trường Mỹ thuật, trung tâm văn hóa nghệ thuật'),
+    (96, 3, 'Giảng dạy môn Mỹ thuật tại các trường phổ thông'),
+    (96, 4, 'Dạy và hỗ trợ trẻ có nhu cầu đặc biệt tại trường khuyết tật'),
+    (97, 0, 'Hành nghề tự do hoặc tự mở cơ sở, studio'),
+    (97, 1, 'Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện'),
+    (97, 2, 'Các doanh nghiệp thiết kế đồ họa'),
+    (97, 3, 'Các doanh nghiệp sản xuất video, phim'),
+    (97, 4, 'Các nhà xuất bản, tờ báo, tạp chí, đài truyền hình'),
+    (97, 5, 'Các nhà sản xuất và tập đoàn lớn'),
+    (98, 0, 'Hành nghề tự do hoặc tự mở cơ sở, studio'),
+    (98, 1, 'Các doanh nghiệp quảng cáo, truyền thông, tổ chức sự kiện, tổ chức biểu diễn'),
+    (98, 2, 'Các doanh nghiệp sản xuất video, phim'),
+    (98, 3, 'Các đài truyền hình'),
+    (98, 4, 'Bộ phận truyền thông của cơ quan, tổ chức, doanh nghiệp lớn'),
+    (99, 0, 'Vườn bách thảo và công viên'),
+    (99, 1, 'Các khu đô thị'),
+    (99, 2, 'Các vườn ươm, cơ sở, doanh nghiệp sản xuất giống, hoa và cây cảnh'),
+    (99, 3, 'Doanh nghiệp công viên cây xanh'),
+    (99, 4, 'Viện nghiên cứu về cây trồng'),
+    (99, 5, 'Nhận chăm sóc vườn tại hộ gia đình, tổ chức'),
+    (99, 6, 'Tự làm vườn hoa, cây cảnh, sản xuất giống'),
+    (100, 0, 'Các xưởng, công ty sản xuất, chế tác kim hoàn, đồ trang sức'),
+    (100, 1, 'Các doanh nghiệp vàng bạc, đá quý'),
+    (100, 2, 'Các doanh nghiệp thiết kế thời trang'),
+    (100, 3, 'Hành nghề tự do hoặc mở studio, cửa hàng riêng');
+
+-- Jobs 101 to 150
+INSERT INTO job_specializations (job_id, sort_order, specialization) VALUES
+    (101, 0, 'Gốm sứ gia dụng'),
+    (101, 1, 'Gốm sứ xây dựng'),
+    (101, 2, 'Gốm sứ Mỹ thuật'),
+    (101, 3, 'Sứ kĩ thuật'),
+    (101, 4, 'Kinh doanh hóa chất, máy móc thiết bị sản xuất gốm sứ'),
+    (102, 0, 'Kẻ vẽ biển quảng cáo, biển báo'),
+    (102, 1, 'Sơn vẽ trang trí nội ngoại thất nhà ở, cửa hàng và công trình xây dựng'),
+    (102, 2, 'Sơn vẽ trang trí trên sản phẩm'),
+    (103, 0, 'Sơ chế, xử lí gỗ và vật liệu tự nhiên (tre, nứa, song, mây, cói, lác, bèo…)'),
+    (103, 1, 'Chuyên sâu theo loại vật liệu (gỗ, đá, kim loại, đất sét, thủy tinh, vật liệu đan, sơn mài, khảm trai)'),
+    (103, 2, 'Chuyên sâu theo kĩ thuật (mộc, đúc, dát, chạm khắc, thủy tinh, đan)'),
+    (103, 3, 'Chuyên sâu theo loại sản phẩm (bàn ghế, giường tủ, bình, giỏ, đĩa, túi, hộp, tranh tượng, đồ trang trí)'),
+    (104, 0, 'Các công đoạn sản xuất da và sản phẩm da giày thủ công (thuộc da, đóng giày, sản xuất đồ da)'),
+    (104, 1, 'Các công đoạn sản xuất sợi, vải và sản phẩm may thủ công (xe sợi, dệt-nhuộm, thêu, đan, móc, bô-đê, cắt may)'),
+    (104, 2, 'Các loại sản phẩm dệt may, da giày thủ công (đồ đan, đồ thêu, thảm, tranh, đồ gia dụng, sản phẩm may mặc và phụ kiện)'),
+    (105, 0, 'Các công đoạn sản xuất da và sản phẩm da giày (thuộc da, đóng giày, sản xuất đồ da)'),
+    (105, 1, 'Các công đoạn sản xuất sợi, vải và sản phẩm may mặc (xe sợi, dệt - nhuộm , thêu, móc, bô-đê, cắt, may)'),
+    (105, 2, 'Các loại sản phẩm dệt may công nghiệp (jacket, sơ mi, veston, đồ lót, đồ thể thao, quần áo trẻ em, tất)'),
+    (105, 3, 'Các loại sản phẩm da giày (giày da, giày thể thao)'),
+    (105, 4, 'Các loại sản phẩm va li, túi xách và phụ kiện thời trang'),
+    (106, 0, 'Thiết bị khuếch đại âm thanh'),
+    (106, 1, 'Ngôn ngữ học lâm sàng và ngôn ngữ học tâm lí'),
+    (106, 2, 'Thính học chẩn đoán'),
+    (106, 3, 'Rối loạn tính lưu loát'),
+    (106, 4, 'Thính học nhi khoa'),
+    (106, 5, 'Các nghiên cứu tâm lí học'),
+    (106, 6, 'Liệu pháp lời nói và chẩn đoán'),
+    (106, 7, 'Rối loạn giọng nói'),
+    (107, 0, 'Chủ yếu liên quan đến các chuyên khoa, cả về nội khoa (điều trị bằng thuốc) và ngoại khoa (mổ), và các chuyên ngành khác như: da liễu, tai-mũi-họng, nội tiết, tim mạch, tiêu hóa, thần kinh, tâm thần, nhãn khoa, sản khoa, nhi khoa, lão khoa…'),
+    (108, 0, 'Bác sĩ y học cổ truyền'),
+    (108, 1, 'Bào chế thuốc y học cổ truyền'),
+    (108, 2, 'Châm cứu'),
+    (109, 0, 'Công chứng'),
+    (109, 1, 'Thanh tra'),
+    (110, 0, 'Dinh dưỡng lâm sàng'),
+    (110, 1, 'Giáo dục dinh dưỡng'),
+    (110, 2, 'Quản lí bệnh viện'),
+    (110, 3, 'Dinh dưỡng cho thể thao'),
+    (111, 0, 'Quản lí phát triển'),
+    (111, 1, 'Cải cách thể chế'),
+    (111, 2, 'Xây dựng dự án phát triển'),
+    (111, 3, 'Các chương trình sinh kế bền vững'),
+    (111, 4, 'Quản lí các tổ chức phi chính phủ.'),
+    (112, 0, 'Lão khoa'),
+    (112, 1, 'Sức khỏe tâm thần'),
+    (112, 2, 'Phục hồi chức năng cơ-xương'),
+    (112, 3, 'Thần kinh học'),
+    (112, 4, 'Nhi khoa'),
+    (112, 5, 'Phục hồi thể chất'),
+    (113, 0, 'Quản lí đô thị'),
+    (113, 1, 'Quản lí giao thông đô thị'),
+    (113, 2, 'Môi trường đô thị'),
+    (114, 0, 'Quản lí kinh doanh bất động sản'),
+    (114, 1, 'Quản lí nhà và đất'),
+    (115, 0, 'Quản lí doanh nghiệp'),
+    (116, 0, 'Chủ yếu theo các loại sản phẩm khác nhau như: Quản lí doanh nghiệp lương thực, thực phẩm, Vật tư nông nghiệp, Chăn nuôi và thú y'),
+    (117, 0, 'Bệnh tim mạch lồng ngực'),
+    (117, 1, 'Vật lí trị liệu lão khoa'),
+    (117, 2, 'Phục hồi chức năng tay'),
+    (117, 3, 'Vật lí trị liệu chỉnh hình'),
+    (117, 4, 'Thần kinh học nhi khoa'),
+    (117, 5, 'Y học thể thao'),
+    (117, 6, 'Rối loạn thần kinh (ví dụ: đột quị)'),
+    (117, 7, 'Kĩ thuật vật lí trị liệu'),
+    (118, 0, 'Bảo hiểm tai nạn'),
+    (118, 1, 'Ô tô'),
+    (118, 2, 'Thiên tai'),
+    (118, 3, 'Tập đoàn Bảo hiểm'),
+    (118, 4, 'Bảo hiểm y tế'),
+    (118, 5, 'Bảo hiểm nhân thọ'),
+    (119, 0, 'Du lịch mạo hiểm'),
+    (119, 1, 'Du lịch sinh thái'),
+    (119, 2, 'Du lịch y tế'),
+    (119, 3, 'Hướng dẫn viên du lịch'),
+    (119, 4, 'Du lịch / Du lịch Tiếp thị'),
+    (119, 5, 'Quản lí du lịch'),
+    (119, 6, 'Điều hành tour'),
+    (119, 7, 'Đặt phòng du lịch'),
+    (119, 8, 'Đại lí du lịch'),
+    (120, 0, 'Chăm sóc, điều dưỡng người cao tuổi'),
+    (120, 1, 'Chăm sóc thai sản'),
+    (120, 2, 'Chăm sóc sức khỏe nghề nghiệp'),
+    (120, 3, 'Y tá cấp cứu'),
+    (120, 4, 'Y tá gây tê'),
+    (120, 5, 'Y tá sản khoa và hộ sinh'),
+    (120, 6, 'Y tá chỉnh hình'),
+    (120, 7, 'Y tá nhi khoa'),
+    (120, 8, 'Y tá tâm thần'),
+    (120, 9, 'Y tá phẫu thuật…'),
+    (121, 0, 'Nha khoa cộng đồng'),
+    (121, 1, 'Phẫu thuật nha khoa và nội nha'),
+    (121, 2, 'Phẫu thuật miệng, hàm, mặt'),
+    (121, 3, 'Bệnh răng miệng'),
+    (121, 4, 'Chỉnh nha'),
+    (121, 5, 'Nha khoa nhi'),
+    (121, 6, 'Nha khoa trẻ em và nha khoa phòng ngừa'),
+    (121, 7, 'Nha chu'),
+    (121, 8, 'Phục hình răng'),
+    (122, 0, 'Một giáo viên mầm non cần đạt được các tiêu chuẩn trong tất cả các khía cạnh của giáo dục mầm non Một số giáo viên chuyên về các lĩnh vực phát triển cụ thể của trẻ như;Rối loạn học mầm non'),
+    (122, 1, 'Giáo dục dựa vào cộng đồng'),
+    (122, 2, 'Dinh dưỡng trẻ em'),
+    (123, 0, 'Mỗi giáo viên tiểu học cần đạt yêu cầu trong tất cả các khía cạnh của giáo dục tiểu học Một số giáo viên chuyên về các khía cạnh phát triển cụ thể của trẻ như'),
+    (123, 1, 'Tin học'),
+    (123, 2, 'Giáo dục cho trẻ có yêu cầu đặc biệt'),
+    (123, 3, 'Giảng dạy một chủ đề cụ thể (ví dụ: Ngôn ngữ)'),
+    (124, 0, 'Khiếm thính và khuyết tật lời nói'),
+    (124, 1, 'Khuyết tật về trí tuệ'),
+    (124, 2, 'Khuyết tật về thần kinh'),
+    (124, 3, 'Khuyết tật vận động'),
+    (124, 4, 'Khiếm thị'),
+    (124, 5, 'Tự kỉ'),
+    (125, 0, 'Quản lí quảng cáo'),
+    (125, 1, 'Nghiên cứu hành vi tiêu dùng và nghiên cứu thị trường'),
+    (125, 2, 'Tiếp thị quốc tế'),
+    (125, 3, 'Tiếp thị dịch vụ'),
+    (125, 4, 'Tiếp thị nông thôn'),
+    (125, 5, 'Quản lí bán hàng'),
+    (125, 6, 'Tiếp thị du lịch'),
+    (125, 7, 'Tiếp thị thương mại'),
+    (126, 0, 'Quản trị bán lẻ'),
+    (126, 1, 'Bán hàng'),
+    (127, 0, 'Bộ phận lễ tân'),
+    (127, 1, 'Bộ phận buồng, phòng'),
+    (127, 2, 'Bộ phận nhà hàng, quầy uống'),
+    (127, 3, 'Hoạt động tiếp tân'),
+    (127, 4, 'Hoạt động quản lí buồng, phòng'),
+    (127, 5, 'Hoạt động nhà hàng'),
+    (127, 6, 'Kĩ thuật nấu nướng'),
+    (127, 7, 'Kĩ thuật pha chế đồ uống'),
+    (127, 8, 'Quản lí khách sạn'),
+    (127, 9, 'Quản lí khu resort'),
+    (128, 0, 'Quản lí rủi ro trong nông nghiệp'),
+    (128, 1, 'Quản lí kinh doanh nông nghiệp'),
+    (128, 2, 'Tiếp thị nông nghiệp'),
+    (128, 3, 'Quản lí kho và chuỗi cung ứng nông nghiệp'),
+    (129, 0, 'Tài chính'),
+    (129, 1, 'Quan hệ công chúng'),
+    (129, 2, 'Tổ chức cán bộ và nhân sự'),
+    (129, 3, 'Đấu thầu'),
+    (130, 0, 'Các hệ thống và qui trình quản lí nhân sự'),
+    (130, 1, 'Lương thưởng, phúc lợi và bồi thường'),
+    (130, 2, 'Phát triển nguồn nhân lực'),
+    (130, 3, 'Quan hệ lao động và pháp luật lao động'),
+    (130, 4, 'Tranh chấp lao động và đình công'),
+    (131, 0, 'Bồi thường'),
+    (131, 1, 'Tư vấn'),
+    (131, 2, 'Tâm lí công nghiệp'),
+    (131, 3, 'Xã hội học công nghiệp'),
+    (131, 4, 'Luật lao động'),
+    (131, 5, 'Phúc lợi lao động'),
+    (131, 6, 'Thỏa ước lao động tập thể'),
+    (131, 7, 'Giải quyết tranh chấp lao động và đình công'),
+    (131, 8, 'Bảo vệ người lao động'),
+    (132, 0, 'Tâm lí học ứng dụng'),
+    (132, 1, 'Tâm sinh lí học'),
+    (132, 2, 'Tâm lí học nghề nghiệp'),
+    (132, 3, 'Tâm lí trẻ em'),
+    (132, 4, 'Tâm lí lâm sàng'),
+    (132, 5, 'Tâm lí học nhận thức'),
+    (132, 6, 'Tâm lí học phát triển'),
+    (132, 7, 'Tâm lí giáo dục'),
+    (132, 8, 'Tâm lí học thực nghiệm'),
+    (132, 9, 'Tâm lí học tội phạm'),
+    (132, 10, 'Tâm lí học công nghiệp'),
+    (132, 11, 'Tâm lí học xã hội'),
+    (133, 0, 'Chỉ dẫn nghề nghiệp và tư vấn'),
+    (133, 1, 'Tư vấn liên quan đến thanh thiếu niên (ví dụ như Tư vấn kĩ năng sống)'),
+    (133, 2, 'Tư vấn giáo dục'),
+    (133, 3, 'Tư vấn lão khoa (làm việc với người cao tuổi)'),
+    (133, 4, 'Tư vấn hôn nhân'),
+    (133, 5, 'Tư vấn trường học'),
+    (133, 6, 'Tư vấn lạm dụng thuốc và nghiện ngập'),
+    (134, 0, 'Tư vấn nghề nghiệp'),
+    (134, 1, 'Các nhóm đặc biệt (ví dụ như những người có nhu cầu đặc biệt, người mới phục hồi sau bệnh tật)'),
+    (134, 2, 'Các nhóm tuổi cụ thể'),
+    (134, 3, 'Các công việc cụ thể đối với từng mốc phát triển nghề nghiệp (ví dụ như trắc nghiệm, đánh giá, chuẩn bị nghề nghiệp)'),
+    (135, 0, 'Siêu âm'),
+    (135, 1, 'Nội soi'),
+    (135, 2, 'X-quang'),
+    (135, 3, 'Kĩ thuật viên điện tâm đồ'),
+    (135, 4, 'Chụp cộng hưởng từ (MRI)'),
+    (135, 5, 'Chụp cắt lớp (CT Scan)'),
+    (135, 6, 'Kĩ thuật, thiết bị chẩn đoán hình ảnh'),
+    (136, 0, 'Kính áp tròng'),
+    (136, 1, 'Các nhóm đặc biệt như trẻ em, người già hoặc những người cần các thiết bị hỗ trợ thị giác'),
+    (136, 2, 'Liệu pháp cho người khiếm thị'),
+    (137, 0, 'Chủ yếu là chuyên sâu về các loại thiết bị và thủ thuật cụ thể như'),
+    (137, 1, 'Máy trợ tim, trợ thở'),
+    (137, 2, 'Máy gây mê'),
+    (137, 3, 'Thủ thuật tim mạch, hô hấp…'),
+    (138, 0, 'Quản lí MICE'),
+    (138, 1, 'Quản lí sự kiện thể thao, giải trí'),
+    (138, 2, 'Dịch vụ cưới hỏi, sự kiện gia đình'),
+    (139, 0, 'Tổ chức và phát triển cộng đồng'),
+    (139, 1, 'Tội phạm học và cải huấn'),
+    (139, 2, 'Phát triển nguồn nhân lực, quản lí nhân lực và quan hệ lao động'),
+    (139, 3, 'Công tác xã hội trong y tế, tâm thần và tư vấn'),
+    (139, 4, 'Dịch vụ chăm sóc gia đình'),
+    (140, 0, 'Tiếp viên hàng không'),
+    (140, 1, 'Tiếp viên trên tàu du lịch…'),
+    (141, 0, 'Chế biến, bảo quản thịt và các sản phẩm từ thịt'),
+    (141, 1, 'Chế biến, bảo quản thuỷ sản và các sản phẩm từ thuỷ sản'),
+    (141, 2, 'Chế biến và bảo quản rau quả'),
+    (141, 3, 'Chế biến sữa và các sản phẩm từ sữa'),
+    (142, 0, 'Các món ăn Âu – Á'),
+    (142, 1, 'Pha chế đồ uống'),
+    (142, 2, 'Trang trí các món ăn'),
+    (142, 3, 'Làm bánh'),
+    (143, 0, 'Chế biến các món ăn Âu – Á'),
+    (143, 1, 'Pha chế đồ uống'),
+    (143, 2, 'Trang trí các món ăn'),
+    (143, 3, 'Làm bánh'),
+    (144, 0, 'Phục vụ bàn'),
+    (144, 1, 'Sắp xếp, bài trí bàn'),
+    (144, 2, 'Giải đáp thắc mắc của khách'),
+    (145, 0, 'Lễ tân khách sạn'),
+    (145, 1, 'Lễ tân doanh nghiệp'),
+    (145, 2, 'Lễ tân kiêm hành chính'),
+    (146, 0, 'Quản trị văn phòng'),
+    (146, 1, 'Quản lí hành chính'),
+    (146, 2, 'Thư kí văn phòng'),
+    (146, 3, 'Thống kê, lưu trữ'),
+    (147, 0, 'Chuyên ngành về từng loại khoáng sản (ví dụ: than, sắt, dầu khí)'),
+    (147, 1, 'Chuyên ngành về từng qui trình khai thác và chế biến'),
+    (147, 2, 'Chuyên ngành về từng loại máy khai thác và chế biến'),
+    (147, 3, 'Chuyên ngành về từng phương pháp khai thác (ví dụ như khai thác mỏ lộ thiên)'),
+    (147, 4, 'Chuyên ngành phân theo vị trí mỏ khoáng sản (ví dụ như dưới nước, ở sa mạc)'),
+    (148, 0, 'Bảo dưỡng các bộ phận điện tử'),
+    (148, 1, 'Bảo dưỡng các bộ phận cơ khí'),
+    (148, 2, 'Thiết bị truyền thông'),
+    (148, 3, 'Nạp nhiên liệu'),
+    (148, 4, 'Sửa chữa'),
+    (148, 5, 'Bảo trì'),
+    (148, 6, 'Bảo trì hệ thống sân bay'),
+    (148, 7, 'Kĩ thuật bảo dưỡng máy bay'),
+    (148, 8, 'Kĩ thuật điện sân bay'),
+    (148, 9, 'Kĩ thuật điện tử sân bay'),
+    (148, 10, 'Khai thác hoạt động bay'),
+    (149, 0, 'Kĩ thuật khoan'),
+    (149, 1, 'Đánh giá mỏ dầu khí'),
+    (149, 2, 'Kĩ thuật sản xuất'),
+    (149, 3, 'Kĩ thuật tầng chứa'),
+    (149, 4, 'Kĩ thuật thủy khí'),
+    (149, 5, 'Vật lí đá'),
+    (150, 0, 'Các chuyên ngành khác nhau tùy thuộc vào loại thiết bị chân, tay giả hoặc các vật liệu sử dụng để làm chân tay giả. Ví dụ bạn có thể chuyên sâu về'),
+    (150, 1, 'Trụ chống chỉnh hình hoặc chân, tay giả'),
+    (150, 2, 'Các loại chân, tay giả, làm bằng nhựa, thép ...'),
+    (150, 3, 'Sản xuất thiết bị chỉnh hình'),
+    (150, 4, 'Sản xuất thiết bị phục hồi chức năng');
+INSERT INTO job_tasks (job_id, sort_order, task) VALUES
+    (101, 0, 'Chế tạo đồ gốm, sứ, đất nung'),
+    (101, 1, 'Chế tạo khuôn thạch cao, polymer, kim loại, silicone, cao su, polyurethane và các vật liệu phù hợp khác'),
+    (101, 2, 'Đọc các bản vẽ kĩ thuật để biết được yêu cầu của khách hàng'),
+    (101, 3, 'Tạo dáng sản phẩm trên các máy làm đồ gốm bằng việc ấn ngón tay cái vào chính giữa của máy mài đất sét để tạo thành chỗ lõm, và ấn vào bên trong và bên ngoài của đất sét nổi hình trụ bằng tay và các ngón tay kéo lên một cách từ từ và tạo hình đất sét để tạo thành các hình dáng và kích thước theo yêu cầu'),
+    (101, 4, 'Điều chỉnh tốc độ của bánh quay theo cảm giác khi sờ vào đất khi các mẩu đất sét đó to ra và các thành trở nên mỏng hơn'),
+    (101, 5, 'Vận hành thiết bị làm các đồ gốm sứ như bát, chén, đĩa, gạch ngói, sứ đỡ dây'),
+    (101, 6, 'Điều chỉnh và kiểm soát pha trộn, ép, cắt và đặt đồ bằng đất sét trong hoặc trên các hình dáng theo lí thuyết'),
+    (101, 7, 'Làm phẳng bề mặt của các mẫu đã hoàn thiện bằng việc sử dụng cái nạo bằng cao su và các miếng bọt biển ướt'),
+    (101, 8, 'Tạo các bánh xe mài mòn bằng các đúc và ép một hỗn dược mài mòn bằng tay hoặc bằng máy'),
+    (101, 9, 'Kiểm tra sản phẩm về mặt khiếm khuyết, hình dáng, kích thước bằng cách sử dụng dụng cụ đo và các khuôn mẫu'),
+    (101, 10, 'Chuẩn bị cho trưng bày và bán hàng, duy trì mối quan hệ với người bán lẻ, xưởng gốm, hệ thống phòng trưng bày triển lãm, giới thiệu sản phẩm để thuận lợi cho việc trưng bày và bán hàng'),
+    (102, 0, 'Viết, sơn và in các biển để quảng cáo, chỉ dẫn, trưng bày hoặc cho các mục đích khác'),
+    (102, 1, 'Sơn trang trí bằng tay các mẫu vẽ lên sản phẩm như đồ gốm, thủy tinh, hộp đựng thuốc lá điếu, chụp đèn, chao đèn'),
+    (102, 2, 'Chép mẫu vẽ và mẫu trang trí từ giấy kính lên sản phẩm'),
+    (102, 3, 'Kết hợp các đường kẻ, khoảng trống, hình khối, mầu sắc và phối cảnh để tạo ra hiệu quả mong muốn như minh họa các ý tưởng, xúc cảm hoặc tâm trạng'),
+    (102, 4, 'Bố trí và sơn một hoặc nhiều mẫu kí tự ngôn ngữ, mẫu trang trí, chữ lồng và họa tiết để tạo ra các biển hiệu'),
+    (102, 5, 'Phác họa hoặc can lại họa tiết và chữ lên sản phẩm hoặc vật liệu để chuẩn bị các họa tiết hoặc khuôn tô'),
+    (102, 6, 'Thiết kế họa tiết và chữ để trang trí trên biển quảng cáo, đồ thủy tinh, gốm sứ và sản phẩm tương tự'),
+    (102, 7, 'Sử dụng phần mềm và thiết bị để tạo ra họa tiết 3D để ứng dụng vào các sản phẩm lớn, các tấm biển được khắc và khảm dát'),
+    (102, 8, 'Thiết kế và sản xuất các kí tự phẳng hoặc có bóng bằng nhựa vinyl, hoặc ghép kí tự cắt sẵn'),
+    (102, 9, 'Cắt chữ và dấu hiệu từ ván hoặc bìa bằng tay hoặc bằng máy'),
+    (102, 10, 'Kiểm tra các bản phác thảo, biểu đồ, mẫu trang trí, họa tiết, ảnh chụp để quyết định cách khắc, cắt, chạm trổ, sơn, in lên sản phẩm'),
+    (102, 11, 'Đo và tính toán kích thước của các kí tự, họa tiết để trang trí'),
+    (102, 12, 'Khắc, chạm trổ, in, sơn, vẽ các kí tự, họa tiết, mẫu trang trí, thương hiệu lên bề mặt phẳng hoặc cong của sản phẩm kim loại, thủy tinh hoặc gốm sứ'),
+    (102, 13, 'Khắc axit các họa tiết, mức đo và các chi tiết khác lên sản phẩm đồ thủy tinh'),
+    (103, 0, 'Chuẩn bị và xử lí gỗ, tre, nứa, song, mây, cói, đá, vỏ/ mai/ lông động vật, đất sét, cát thạch anh và các nguyên phụ liệu khác'),
+    (103, 1, 'Sản xuất các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí bằng cách cưa, bào, đục, đẽo, gắn, đóng đinh, sơn gỗ, tre, nứa, đá và các vật liệu tương tự'),
+    (103, 2, 'Sản xuất các sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí bằng cách đan, bện, kết, buộc vật liệu vỏ, sợi tự nhiên và nhân tạo (lạt, song, mây, cói, bèo, sợi nhựa, sợi ni lông, vải, dây…) có khung hoặc không có khung'),
+    (103, 3, 'Sản xuất các sản phẩm đồ gia dụng và trang trí bằng cách đúc, dát, chạm khắc đồng, bạc và các vật liệu tương tự'),
+    (103, 4, 'Sản xuất các sản phẩm đồ gia dụng và trang trí bằng thủy tinh bằng cách thổi và chạm khắc thủy tinh và các vật liệu tương tự'),
+    (103, 5, 'Khắc, chạm, trổ, khảm, vẽ, sơn, gắn hoa văn họa tiết trang trí trên bề mặt sản phẩm'),
+    (103, 6, 'Xử lí và hoàn thiện sản phẩm bằng cách sơn, phủ men, làm bóng, xử lí mối, mọt, mốc, rỉ'),
+    (104, 0, 'Kéo sợi, dệt, nhuộm len, bông, vải, lụa và các loại vật liệu khác bằng thuốc nhuộm tự nhiên và công nghiệp'),
+    (104, 1, 'Làm ren, đan, móc, thêu, may các sản phẩm may mặc, gia dụng và phụ kiện từ vải sợi'),
+    (104, 2, 'Xử lí, nhuộm và hoàn thiện vật liệu da bằng thuốc nhuộm tự nhiên và công nghiệp'),
+    (104, 3, 'Đóng giày dép, sản xuất túi xách, thắt lưng, phụ kiện và đồ gia dụng từ da và vật liệu tương đương.'),
+    (105, 0, 'Vận hành và giám sát hoạt động của máy móc thiết bị trong dây chuyền của mình'),
+    (105, 1, 'Dọn dẹp, làm vệ sinh, thay thế các bộ phận cần thiết sau ca làm việc hoặc theo lịch định kì'),
+    (105, 2, 'Sử dụng các loại hóa chất và phụ gia tẩy, nhuộm, làm sạch phù hợp'),
+    (105, 3, 'Tuân thủ đúng qui trình kĩ thuật để sản xuất mã hàng tương ứng'),
+    (105, 4, 'Tham gia đào tạo và áp dụng qui trình mới khi cải tiến qui trình hay chuyển mã hàng'),
+    (105, 5, 'Liên tục học hỏi nâng cao kĩ năng tay nghề để sẵn sàng làm đa công đoạn trong dây chuyền nếu cần'),
+    (105, 6, 'Máy móc sử dụng để sản xuất sợi từ xơ, bông, tơ và vật liệu tự nhiên'),
+    (105, 7, 'Máy dệt thoi hay dệt kim để dệt các loại vải và sản phẩm dệt kim từ sợi tự nhiên và sợi tổng hợp'),
+    (105, 8, 'Máy tẩy, nhuộm và xử lí sợi, vải'),
+    (105, 9, 'Máy may, cắt, thêu, thùa khuyết, đính khuy, khóa và các loại máy và công cụ sử dụng trong sản xuất hàng may mặc'),
+    (105, 10, 'Máy giặt và là ủi hàng dệt may, lông và thảm'),
+    (105, 11, 'Máy móc và công cụ để chuẩn bị, chế biến, nhuộm và hoàn thiện sản phẩm da và lông thú'),
+    (105, 12, 'Máy móc và công cụ đo, cắt, tạo hoa văn hình khối, định hình thân, đế giày, khâu/ dán/ ráp các bộ phận, hoàn thiện giày dép'),
+    (105, 13, 'Máy móc sản xuất va li, túi xách và phụ kiện da khác.'),
+    (106, 0, 'Xây dựng, hướng dẫn và tham gia tư vấn, sàng lọc, thực hiện các chương trình phục hồi ngôn ngữ và các chương trình khác liên quan đến khả năng nghe và giao tiếp'),
+    (106, 1, 'Cho bệnh nhân làm kiểm tra khả năng nghe, nói, ngôn ngữ và các kiểm tra khác bằng các thiết bị và phương tiện chẩn đoán đặc biệt'),
+    (106, 2, 'phân tích kết quả kiểm tra cùng với những thông tin về hành vi, giáo dục và y tế thu được từ bệnh nhân và gia đình, giáo viên, nhà chuyên môn, người sử dụng lao động để xác định tình trạng của bệnh nhân'),
+    (106, 3, 'Xây dựng và thực hiện các liệu pháp phục hồi chức năng, ví dụ như huấn luyện thính giác, đọc môi, phục hồi ngôn ngữ, hội thoại để khôi phục lại hoặc nâng cao hiệu quả giao tiếp'),
+    (106, 4, 'Chỉ định máy trợ thính, và phương tiện hỗ trợ khác và hướng dẫn sử dụng cho bệnh nhân'),
+    (106, 5, 'Tư vấn và hướng dẫn bệnh nhân, gia đình, giáo viên và người sử dụng lao động về các vấn đề xã hội và tâm lí liên quan đến khuyết tật về lời nói'),
+    (107, 0, 'Thăm khám lâm sàng, chỉ định xét nghiệm, hội chẩn với bác sĩ khác và trao đổi với bệnh nhân và gia đình để đưa ra chẩn đoán'),
+    (107, 1, 'Kê đơn và chỉ định các biện pháp điều trị và phòng ngừa'),
+    (107, 2, 'Tiến hành phẫu thuật và các thủ thuật khác'),
+    (107, 3, 'Giám sát hoạt động của nhân viên y tế liên quan'),
+    (107, 4, 'Theo dõi tiến triển và đáp ứng điều trị của bệnh nhân'),
+    (107, 5, 'Tư vấn về sức khỏe, dinh dưỡng và sinh hoạt để hỗ trợ điều trị, phòng ngừa bệnh tật và rối loạn'),
+    (107, 6, 'Lập kế hoạch, quản lí và thực hiện việc chuyển tuyến, chuyển viện cho bệnh nhân cần điều trị đặc biệt, lâu dài hoặc các dạng dịch vụ cần thiết khác'),
+    (107, 7, 'Nghiên cứu bệnh học và các phương pháp phòng ngừa và điều trị'),
+    (108, 0, 'Tiến hành kiểm tra sức khỏe cho bệnh nhân, trao đổi với bệnh nhân và gia đình để xác định tình trạng sức khỏe của bệnh nhân'),
+    (108, 1, 'Đưa ra phác đồ và điều trị các bệnh về thể chất, tinh thần, tâm lí xã hội'),
+    (108, 2, 'Sử dụng các phương pháp, cách thức chữa bệnh truyền thống của địa phương'),
+    (108, 3, 'Kê đơn và cắt các loại thuốc truyền thống như cây, lá, chiết xuất khoáng sản và động vật để kích thích khả năng tự hồi phục của cơ thể'),
+    (109, 0, 'Kiểm tra hoặc chuẩn bị cho việc kiểm tra các hồ sơ pháp lí và các văn bản khác có liên quan'),
+    (109, 1, 'Chuẩn bị các tài liệu tóm tắt các hồ sơ pháp lí hoặc đặt ra các điều kiện cho vay hoặc bảo hiểm'),
+    (109, 2, 'Tư vấn cho khách hàng và các đại lí về các vấn đề pháp lí, kĩ thuật trong trường hợp cụ thể của họ'),
+    (109, 3, 'Chuẩn bị tài liệu liên quan đến chuyển giao bất động sản, cổ phiếu hoặc các giao dịch khác cần phải có các thủ tục pháp lí Kiểm tra tính hợp lệ của hồ sơ và gửi chúng đến cơ quan chức năng Quản lí các tài liệu, hồ sơ vụ án và các thư viện về pháp luật'),
+    (110, 0, 'Phát triển, thử nghiệm các giải pháp dinh dưỡng và chế độ ăn uống'),
+    (110, 1, 'Lập kế hoạch và chỉ đạo việc chuẩn bị chế độ ăn phục vụ điều trị và các mục đích ăn kiêng khác cho cá nhân hay nhóm trong các bệnh viện, hoặc cho người lao động trong các lĩnh vực cụ thể'),
+    (110, 2, 'Tham gia các chương trình giáo dục dinh dưỡng và các hoạt động phục hồi chức năng dinh dưỡng'),
+    (110, 3, 'Tư vấn dinh dưỡng đối với các vấn đề về thực phẩm cộng đồng và các chương trình y tế'),
+    (111, 0, 'Trở thành chuyên gia trong một lĩnh vực cụ thể'),
+    (111, 1, 'Nghiên cứu cách ứng dụng chuyên môn trong lĩnh vực đó phục vụ đông đảo nhân dân trong nước'),
+    (111, 2, 'Nghiên cứu các chuyên ngành liên quan khác, đặc biệt là xã hội học và kinh tế học'),
+    (111, 3, 'Nghiên cứu các điều kiện, nếp sống và văn hóa của từng địa phương'),
+    (111, 4, 'Tư vấn cho chính phủ các nước'),
+    (111, 5, 'Làm việc với các chuyên gia ở các nước khác'),
+    (111, 6, 'Đào tạo người dân địa phương quản lí và duy trì những công trình, công việc đã được xây dựng và phát triển'),
+    (112, 0, 'Sử dụng các thao tác nghề nghiệp khác nhau để giúp bệnh nhân phát triển, phục hồi hoặc duy trì cuộc sống hàng ngày của họ và kĩ năng làm việc'),
+    (112, 1, 'Giúp bệnh nhân cải thiện khả năng thực hiện các công việc trong môi trường sống và làm việc của họ'),
+    (112, 2, 'Sử dụng kĩ thuật đặc biệt để giúp bệnh nhân phát triển, cải thiện, duy trì hoặc khôi phục lại sự tự chủ cao nhất'),
+    (113, 0, 'Qui hoạch và điều phối phát triển khu vực đô thị'),
+    (113, 1, 'Thu thập và phân tích dữ liệu về kinh tế, pháp lí, chính trị, văn hóa, nhân khẩu học, xã hội học, vật lí và môi trường ảnh hưởng đến vấn đề sử dụng đất, xây dựng và đề xuất qui hoạch phát triển và sử dụng đất'),
+    (113, 2, 'Qui hoạch và điều phối việc sử dụng đất cho công viên, trường học, các cơ quan tổ chức, sân bay, đường xá và các dự án liên quan cho các khu thương mại, công nghiệp và khu dân cư'),
+    (113, 3, 'Qui hoạch, tham vấn, triển khai xây dựng, giám sát, quản lí hệ thống giao thông đường bộ, giao thông công cộng sao cho hiệu quả và an toàn'),
+    (113, 4, 'Thẩm định và phản biện các báo cáo đánh giá tác động môi trường'),
+    (114, 0, 'Thu thập thông tin về tài sản để bán, cho thuê, hoàn cảnh của chủ sở hữu, nhu cầu của người mua và người thuê tiềm năng'),
+    (114, 1, 'Cung cấp thông tin cho người mua hoặc người thuê tiềm năng, giải thích các điều khoản bán hàng và các điều kiện cho thuê'),
+    (114, 2, 'Đàm phán thỏa thuận giữa người thuê và chủ sở hữu về tiền thuê và chi phí'),
+    (114, 3, 'Xây dựng hợp đồng cho thuê và dự toán chi phí'),
+    (114, 4, 'Sắp xếp việc chuyển quyền sở hữu tài sản;'),
+    (115, 0, 'Xây dựng, thực hiện và giám sát các chính sách, chiến lược và kế hoạch sản xuất của DNNVV'),
+    (115, 1, 'Lập kế hoạch cụ thể về các hoạt động sản xuất bao gồm đầu ra, số lượng, chất lượng, giá thành, thời gian và chi phí lao động'),
+    (115, 2, 'quản lí việc vận hành các xưởng sản xuất và qui trình chất lượng thông qua lập kế hoạch bảo dưỡng, cung cấp dụng cụ, thời gian vận hành'),
+    (115, 3, 'Tuyển dụng, đào tạo, kèm cặp và giám sát nhân viên'),
+    (115, 4, 'Xây dựng, thực hiện, giám sát và điều chỉnh chiến lược bán hàng và quảng cáo tiếp thị của doanh nghiệp'),
+    (115, 5, 'Xây dựng và quản lí ngân sách, tài chính, chi phí và báo cáo kết quả kinh doanh'),
+    (116, 0, 'Tìm hiểu nhu cầu khách hàng và các loại sản phẩm nông nghiệp khác nhau'),
+    (116, 1, 'Phát triển và vận hành hệ thống sản xuất sản phẩm nông nghiệp'),
+    (116, 2, 'Phát triển và vận hành hệ thống phân phối sản phẩm nông nghiệp cho địa phương (chợ, cửa hàng bán lẻ, cửa hàng bán buôn) để đưa sản phẩm đến với khách hàng'),
+    (117, 0, 'Chẩn đoán rối loạn của xương, cơ và các bộ phận của hệ tuần hoàn hoặc hệ thần kinh'),
+    (117, 1, 'Điều trị bằng các phương pháp sử dụng siêu âm, nhiệt, laser hoặc kĩ thuật tương tự'),
+    (117, 2, 'Kiểm tra dị tật cơ thể và rối loạn để xác định thông số kĩ thuật cho chân, tay giả hoặc các thiết bị khác'),
+    (117, 3, 'Tư vấn cho cộng đồng và cá nhân về tư thế đúng của cơ thể khi làm việc hoặc thực hiện các hoạt động khác để tránh chấn thương, căng thẳng và tăng trương cơ bắp'),
+    (117, 4, 'Làm việc với các cá nhân (ví dụ như người chơi thể thao) để giúp họ tăng cường thể chất'),
+    (118, 0, 'Thu thập thông tin cần thiết về các khách hàng để xác định loại bảo hiểm thích hợp và điều kiện bảo hiểm'),
+    (118, 1, 'Đàm phán với khách hàng để xác định loại và mức độ rủi ro cho từng trường hợp bảo hiểm, phạm vi và điều khoản thanh toán'),
+    (118, 2, 'Đàm phán và xây dựng hợp đồng tái bảo hiểm'),
+    (118, 3, 'Tư vấn và đàm phán các điều khoản của hợp đồng bảo hiểm cho những dự án, công trình và rủi ro đặc biệt'),
+    (119, 0, 'Thu thập thông tin về tính khả thi, chi phí, mức độ tiện lợi của các loại hình giao thông, chỗ ở, xác định yêu cầu của khách hàng và tư vấn cho họ các hình thức du lịch phù hợp'),
+    (119, 1, 'Đặt và xác nhận đặt phòng, bàn giao cho khách hàng vé, chứng từ và nhận thanh toán'),
+    (119, 2, 'Tổ chức tour du lịch trọn gói cho các sự kiện hoặc kì nghỉ và bán các gói du lịch cho khách hàng'),
+    (119, 3, 'Giúp khách hàng hoàn thiện các hồ sơ cần thiết để thực hiện tour du lịch'),
+    (120, 0, 'Giúp các bác sĩ áp dụng các biện pháp phòng và chữa bệnh, trong đó có việc cho uống thuốc, tiêm, theo dõi đáp ứng điều trị của bệnh nhân…'),
+    (120, 1, 'giải quyết các ca bệnh khẩn cấp, nếu có, khi vắng mặt bác sĩ'),
+    (120, 2, 'Chuẩn bị cho bệnh nhân khi thực hiện các phương pháp điều trị vật lí và tâm lí'),
+    (120, 3, 'Hỗ trợ bác sĩ phẫu thuật tại phòng mổ, lau rửa vết thương và băng bó, chăm sóc sau phẫu thuật'),
+    (120, 4, '(Với hộ sinh) Đánh giá tiến triển trong quá trình mang thai và sinh nở, xử lí biến chứng, ghi nhận các triệu chứng cần can thiệp của bác sĩ chuyên khoa liên quan'),
+    (120, 5, 'Thực hiện chăm sóc cá nhân, điều dưỡng chuyên nghiệp đối với bệnh nhân, bà mẹ và trẻ sơ sinh tại cơ sở y tế hoặc nhà riêng'),
+    (120, 6, 'Trả lời các câu hỏi của bệnh nhân và gia đình, cung cấp thông tin và tư vấn về phòng chữa bệnh và chăm sóc'),
+    (120, 7, 'Hướng dẫn, phối hợp và giám sát các trợ tác khác'),
+    (120, 8, 'Nghiên cứu, cập nhật kiến thức kĩ năng về chăm sóc y tế và chuẩn bị các báo cáo tài liệu khoa học'),
+    (120, 9, 'Tham gia công tác giáo dục sức khỏe tại cơ sở y tế và tại cộng đồng'),
+    (121, 0, 'Cung cấp dịch vụ chăm sóc răng miệng như làm sạch răng và chữa sâu răng, sử dụng máy nha khoa và các công cụ tương tự khi cần thiết'),
+    (121, 1, 'Kiểm tra kết quả xét nghiệm các bệnh răng miệng'),
+    (121, 2, 'Chữa sâu răng bằng chất trám, kim loại hoặc nhựa'),
+    (121, 3, 'Gây tê cục bộ hoặc gây tê vùng khi cần thiết và chuẩn bị vùng miệng cho phẫu thuật'),
+    (121, 4, 'Sử dụng các dụng cụ phẫu thuật để nhổ răng gẫy, sâu, hỏng'),
+    (121, 5, 'Làm và lắp răng giả'),
+    (121, 6, 'Tư vấn bệnh nhân về các biện pháp khắc phục nha khoa và sức khỏe răng miệng nói chung'),
+    (122, 0, 'Thực hiện các hoạt động sử dụng các loại nguyên vật liệu, trang thiết bị khác nhau để giúp cho trẻ nhỏ phát triển thể chất, giao tiếp, kĩ năng xã hội và quan trọng nhất là sự thích thú trong học tập'),
+    (122, 1, 'Sử dụng các kĩ thuật như kể chuyện, đóng vai để đặt nền móng cho sự phát triển ngôn ngữ'),
+    (122, 2, 'Mang lại cơ hội cho trẻ em được tiếp xúc với các thành viên khác nhau của xã hội và tìm hiểu về họ'),
+    (122, 3, 'Phát triển kĩ năng hỏi và khám phá của trẻ nhỏ'),
+    (122, 4, 'Giúp trẻ phát triển tất cả các kĩ năng trong sinh hoạt hàng ngày (ví dụ như kĩ năng đi vệ sinh, chăm sóc cá nhân và kĩ năng xã hội)'),
+    (122, 5, 'Ghi lại quá trình học tập của trẻ nhỏ'),
+    (122, 6, 'Phát hiện bất cứ dấu hiệu nào của rối loạn phát triển hoặc vấn đề sức khỏe ở trẻ nhỏ'),
+    (122, 7, 'Đề xuất các chương trình nâng cao sự tăng trưởng và phát triển ở trẻ nhỏ'),
+    (122, 8, 'Làm việc với các chuyên gia khác (ví dụ như nhà trị liệu ngôn ngữ, nhà tâm lí học) để giúp trẻ vượt qua mọi khó khăn mà chúng có thể gặp phải'),
+    (122, 9, 'Giúp đỡ trẻ trong việc vệ sinh cá nhân'),
+    (122, 10, 'Tương tác với phụ huynh để thúc đẩy sự phát triển liên tục của trẻ ở nhà'),
+    (122, 11, 'Đào tạo những người khác'),
+    (123, 0, 'Chuẩn bị kế hoạch bài học hàng ngày và dài hạn cho từng lớp, phục vụ việc dạy chữ, số và sự phát triển chung của trẻ em'),
+    (123, 1, 'Đặt nền móng cho toàn bộ việc học như: đọc, viết, nghe, nói, toán học, khoa học, khoa học xã hội và giáo dục thể chất'),
+    (123, 2, 'Sử dụng các loại hình nghệ thuật và âm nhạc để phát triển sự sáng tạo, sự tự thể hiện của trẻ em'),
+    (123, 3, 'Sử dụng các hoạt động thể thao để tăng cường phát triển thể chất'),
+    (123, 4, 'Đánh giá và theo dõi sự tiến bộ của học sinh'),
+    (123, 5, 'Kiểm tra và đánh giá sự tiến bộ của học sinh qua bài kiểm tra giấy và kiểm tra miệng'),
+    (123, 6, 'Phát hiện dấu hiệu của rối loạn phát triển hoặc vấn đề sức khỏe'),
+    (123, 7, 'Đề xuất chương trình cho sự tiếp tục tăng trưởng và phát triển ở trẻ'),
+    (123, 8, 'Làm việc với các chuyên gia khác (ví dụ như nhà trị liệu ngôn ngữ, nhà tâm lí học) để giúp trẻ vượt qua mọi khó khăn có thể có'),
+    (123, 9, 'Tương tác với phụ huynh để thúc đẩy sự phát triển liên tục của trẻ ở gia đình'),
+    (123, 10, 'Đào tạo những người khác'),
+    (124, 0, 'Đánh giá khả năng và khiếm khuyết của học sinh về thể chất, trí tuệ, xã hội và cảm xúc, đặc biệt là khả năng trí tuệ hoặc các trạng thái đặc biệt khác'),
+    (124, 1, 'Thiết kế và điều chỉnh chương trình giảng dạy, chuẩn bị bài học và các hoạt động phù hợp với yêu cầu'),
+    (124, 2, 'Hướng dẫn cá nhân hoặc nhóm sử dụng các kĩ thuật và phương tiện hỗ trợ đặc biệt (ví dụ: chữ nổi Braille, máy trợ thính…) phù hợp với từng đối tượng học sinh và giám sát lớp học'),
+    (124, 3, 'Ứng dụng những chiến lược và kĩ thuật dạy học đặc thù cho từng đối tượng học sinh để hỗ trợ sự phát triển giác quan, vận động, ngôn ngữ, nhận thức và trí nhớ'),
+    (124, 4, 'Khuyến khích học sinh tự tin, hứng thú, vận động và phối hợp, giúp họ khám phá và áp dụng các phương pháp nhằm hạn chế trình trạng khiếm khuyết và đạt tiến bộ'),
+    (124, 5, 'Thực hiện kiểm tra, đánh giá, ghi nhận sự tiến bộ của từng học sinh và trao đổi với học sinh, gia đình, giáo viên chủ nhiệm, nhà trị liệu, nhân viên công tác xã hội và các chuyên gia khác'),
+    (124, 6, 'Tư vấn cá nhân'),
+    (125, 0, 'Lập kế hoạch, chỉ đạo và phối hợp hoạt động bán hàng và tiếp thị của doanh nghiệp trên các hồ sơ kinh doanh và đánh giá thị trường'),
+    (125, 1, 'Xác định bảng giá, giảm giá và điều kiện giao hàng, dự trù kinh phí xúc tiến quảng cáo, phương thức bán hàng, ưu đãi đặc biệt và các chiến dịch bán hàng đặc biệt'),
+    (125, 2, 'Giám sát việc tuyển dụng, đào tạo và làm việc của nhân viên'),
+    (125, 3, 'Đại diện bộ phận bán hàng và tiếp thị trong giao dịch với các bộ phận khác hoặc với các cơ quan bên ngoài'),
+    (125, 4, 'Lập kế hoạch kinh doanh và chiến lược tiếp thị cho sản phẩm mới (ra mắt sản phẩm, làm việc với các chuyên gia quảng cáo)'),
+    (126, 0, 'Đàm phán với các nhà cung cấp, khách hàng, đại lí và các tổ chức khác'),
+    (126, 1, 'Lập dự toán kinh phí'),
+    (126, 2, 'Xây dựng, thực hiện và điều chỉnh chính sách mua hàng, bán hàng, dịch vụ khách hàng'),
+    (126, 3, 'Lập kế hoạch và kiểm soát việc sử dụng các nguồn lực và nhân công'),
+    (126, 4, 'Quản lí hoạt động kinh doanh hàng ngày, bao gồm cả việc theo dõi báo cáo bán hàng, tồn kho, và các báo cáo khác liên quan đến việc bán hàng'),
+    (127, 0, 'Quản lí bộ phận lễ tân: phụ trách đội ngũ nhân viên tương tác trực tiếp với khách hàng để giúp họ đặt phòng khách sạn, nhận và đăng kí khi họ đến nơi, xuất và thu tiền các hóa đơn, hỗ trợ tất cả các vấn đề liên quan nhằm thỏa mãn nhu cầu khách hàng thông qua liên kết với các nhà cung cấp dịch vụ khác như vận tải, du lịch và các bộ phận khác của khách sạn'),
+    (127, 1, 'Quản lí bộ phận nhà hàng, quầy uống: phụ trách đội ngũ nhân viên chuẩn bị và phục vụ tất cả các mặt hàng thực phẩm và đồ uống trong khách sạn. Lĩnh vực chuyên ngành khác nhau tùy theo các loại món ăn (ví dụ như đồ ăn Âu, đồ ăn Trung Quốc,)'),
+    (127, 2, 'Quản lí bộ phận buồng, phòng: phụ trách các công việc bảo trì các phòng và dãy phòng trong khách sạn, ví dụ như trang trí phòng, dọn dẹp, vệ sinh, thay ga, khăn và trang bị hàng ngày, kiểm tra và làm phòng khi khách trả phòng'),
+    (128, 0, 'Lập dự toán kinh phí'),
+    (128, 1, 'Đàm phán với nhà cung cấp, khách hàng và các tổ chức khác'),
+    (128, 2, 'Lập kế hoạch, và kiểm soát việc sử dụng các nguồn lực và nhân công'),
+    (128, 3, 'Quản lí hoạt động hàng ngày của doanh nghiệp, đơn vị nông nghiệp'),
+    (129, 0, 'Lập kế hoạch, chỉ đạo và điều phối các hoạt động của một bệnh viện hoặc tổ chức chăm sóc sức khỏe'),
+    (129, 1, 'Lập kế hoạch tài chính và dự toán kinh phí'),
+    (129, 2, 'Lập kế hoạch và kiểm soát việc sử dụng các nguồn lực và lao động'),
+    (129, 3, 'Lập kế hoạch và thực hiện các chính sách của tổ chức'),
+    (130, 0, 'Tư vấn và thực hiện việc tuyển dụng, phân công, đào tạo, đề bạt, trả lương, bồi thường, phúc lợi cho nhân viên, xây dựng quan hệ quản lí - nhân viên và những lĩnh vực khác của chính sách nhân sự'),
+    (130, 1, 'Nghiên cứu và phân tích công việc bằng các cách thức như phỏng vấn người lao động, nhà quản lí và mô tả chi tiết vị trí, công việc, nghề nghiệp từ những thông tin thu được'),
+    (130, 2, 'làm việc về các hệ thống phân loại nghề nghiệp'),
+    (130, 3, 'Nghiên cứu và tư vấn cho các cá nhân về các cơ hội tuyển dụng, những lựa chọn nghề, giáo dục và đào tạo bậc cao nếu cần'),
+    (130, 4, 'Phối hợp với bộ phận có liên quan tiến hành đánh giá hiệu quả lao động của người lao động'),
+    (130, 5, 'Lập, lưu trữ, theo dõi hồ sơ của nhân viên và các dữ liệu nhân sự như đánh giá kết quả, tỉ lệ vắng mặt và tỉ lệ biến động lao động'),
+    (130, 6, 'Chuẩn bị, đàm phán, giải thích hợp đồng lao động và thỏa ước lao động tập thể'),
+    (130, 7, 'Tư vấn và thực hiện việc đối thoại và hợp tác với công đoàn cơ sở hoặc đại diện tập thể người lao động để xây dựng quan hệ lao động hài hòa tại nơi làm việc, phòng ngừa và giải quyết tranh chấp lao động'),
+    (131, 0, 'Tìm hiểu, cập nhật, tuyên truyền chính sách pháp luật liên quan đến lao động cho người lao động và người sử dụng lao động'),
+    (131, 1, 'Tìm hiểu, tuyên truyền và triển khai thực hiện chính sách, nội qui lao động của doanh nghiệp'),
+    (131, 2, 'Đề xuất với người sử dụng lao động, thực hiện các chương trình vì lợi ích của người lao động và gia đình họ'),
+    (131, 3, 'Gặp gỡ những người lao động gặp khó khăn (ví dụ khó khăn về tài chính, sức khỏe) và tư vấn cho họ hoặc giới thiệu họ với các chuyên gia có liên quan để tiếp tục hỗ trợ'),
+    (131, 4, 'Tập huấn, tư vấn, nâng cao trình độ của người lao động và công đoàn cơ sở về quan hệ lao động, đối thoại tại nơi làm việc'),
+    (131, 5, 'Đóng vai trò kết nối giữa người lao động và người sử dụng lao động, thúc đẩy việc đàm phán kí kết thỏa ước lao động tập thể'),
+    (131, 6, 'Tham gia giải quyết tranh chấp lao động và đình công thông qua thương lượng tập thể'),
+    (132, 0, 'Thực hiện các trắc nghiệm để đo lường các đặc tính tâm lí và hành vi (ví dụ như trí thông minh, đặc điểm tính cách, quá trình nhận thức) và giải thích thông tin này để hướng dẫn khách hàng'),
+    (132, 1, 'Phân tích ảnh hưởng của di truyền, xã hội, nghề nghiệp và các yếu tố khác đối với tư tưởng và hành vi cá nhân'),
+    (132, 2, 'Thực hiện tư vấn hoặc điều trị đối với cá nhân và nhóm'),
+    (132, 3, 'Nghiên cứu các yếu tố tâm lí trong chẩn đoán, điều trị và phòng ngừa các bệnh tâm thần'),
+    (132, 4, 'Nghiên cứu về hành vi làm việc trong môi trường công nghiệp và môi trường tổ chức'),
+    (132, 5, 'đưa ra và cung cấp dịch vụ để thúc đẩy sức khỏe nghề nghiệp'),
+    (133, 0, 'Phỏng vấn khách hàng và những người có liên quan đến khách hàng để thu thập thông tin về giáo dục, nghề nghiệp, xã hội và thông tin liên quan khác để hiểu hơn về nguồn gốc và nguyên nhân có thể dẫn đến những khó khăn'),
+    (133, 1, 'Tiến hành các trắc nghiệm trí tuệ, khả năng, sở thích, tính cách để đánh giá tình trạng của khách hàng'),
+    (133, 2, 'Sử dụng các loại kĩ thuật tư vấn khác nhau để giúp khách hàng vượt qua hoặc kiểm soát vấn đề của mình'),
+    (133, 3, 'Thực hiện hướng dẫn, tư vấn nhóm cho một nhóm khác hàng có chung nhu cầu'),
+    (133, 4, 'Thực hiện hỗ trợ sau tư vấn theo để tiếp tục hỗ trợ khách hàng'),
+    (134, 0, 'Phỏng vấn khách hàng để xác định tình trạng phát triển nghề nghiệp của họ'),
+    (134, 1, 'Áp dụng các kĩ thuật khác nhau (ví dụ như kiểm tra, lấy hồ sơ cá nhân) để xác định mong muốn và khả năng của khách hàng'),
+    (134, 2, 'Giúp đỡ khách hàng hiểu biết sâu hơn về thế giới nghề nghiệp'),
+    (134, 3, 'Giúp đỡ khách hàng phát triển kĩ năng chuẩn bị nghề nghiệp (ví dụ như chuẩn bị hồ sơ, chuẩn bị phỏng vấn)'),
+    (134, 4, 'Trao đổi với gia đình của khách hàng (đặc biệt là các khách hàng trẻ tuổi) để xây dựng một kế hoạch phát triển nghề nghiệp hiệu quả hơn'),
+    (134, 5, 'Xác định các yếu tố xã hội, tâm lí và kinh tế có thể cản trở quá trình phát triển nghề nghiệp và giúp khách hàng nhận thức được những rào cản này'),
+    (134, 6, 'Lập hồ sơ cá nhân'),
+    (134, 7, 'Làm việc với các chuyên gia khác như giáo viên, nhân viên tư vấn, nhà tâm lí học và nhân viên xã hội'),
+    (135, 0, 'Chuẩn bị cho bệnh nhân chẩn đoán hình ảnh. Công việc này có thể bao gồm tiêm một loại thuốc nhuộm màu hoặc làm sạch các phần của cơ thể được soi chụp'),
+    (135, 1, 'Tiến hành kiểm tra theo chỉ định của bác sĩ một cách chính xác'),
+    (135, 2, 'Xử lí thông tin từ các kết quả kiểm tra (ví dụ: rửa phim X-quang)'),
+    (135, 3, 'Ghi kết quả vào báo cáo'),
+    (135, 4, 'Chuyển kết quả cho bệnh nhân và bác sĩ'),
+    (135, 5, 'Vệ sinh, duy tu bảo dưỡng máy móc thiết bị'),
+    (136, 0, 'Kiểm tra bệnh nhân để xác định dấu hiệu của bệnh và điều trị cho bệnh nhân theo từng lĩnh vực chuyên ngành'),
+    (136, 1, 'tham gia hoạt động y tế công cộng bao gồm đo thị lực cho cộng đồng, các ngành công nghiệp và trường học'),
+    (136, 2, 'Xác định lỗi khúc xạ và đưa ra điều chỉnh thích hợp thông qua việc dùng kính'),
+    (136, 3, 'Chẩn đoán các bệnh về mắt và các vấn đề về tầm nhìn bằng cách kiểm tra cảm nhận màu sắc, nhận thức sâu, khả năng tập trung, và phối hợp và độ sắc nét hình ảnh'),
+    (136, 4, 'Chăm sóc cho bệnh nhân trước và sau khi phẫu thuật như điều chỉnh bằng tia laser và loại bỏ đục thủy tinh thể'),
+    (137, 0, 'Chẩn đoán, xử lí hình ảnh siêu âm, X-Quang, CT, MRI…'),
+    (137, 1, 'Sử dụng các máy móc, thiết bị y tế trong việc chẩn đoán cho người bệnh'),
+    (137, 2, 'Xử lý tính hiệu sinh lý học, cơ sinh học, vật liệu sinh học với kỹ thuật sinh học, phân tích hệ thống, mô hình hóa 3 chiều đúc, dát, chạm khắc đồng, bạc và các vật liệu tương tự'),
+    (137, 3, 'Sản xuất các sản phẩm đồ gia dụng và trang trí bằng thủy tinh bằng cách thổi và chạm khắc thủy tinh và các vật liệu tương tự'),
+    (137, 4, 'Khắc, chạm, trổ, khảm, vẽ, sơn, gắn hoa văn họa tiết trang trí trên bề mặt sản phẩm'),
+    (137, 5, 'Xử lí và hoàn thiện sản phẩm bằng cách sơn, phủ men, làm bóng, xử lí mối, mọt, mốc, rỉ'),
+    (138, 0, 'Thảo luận với khách hàng về các yêu cầu của họ và đưa ra các gói dịch vụ và giá cả phù hợp'),
+    (138, 1, 'đề xuất ý tưởng, chương trình, kịch bản nếu cần'),
+    (138, 2, 'Giới thiệu dịch vụ hội thảo, hội nghị, sự kiện và triển lãm thương mại cho các khách hàng tiềm năng'),
+    (138, 3, 'Sắp xếp và phối hợp các dịch vụ, ví dụ như phòng hội nghị, phông màn, biển báo, âm thanh và thiết bị nghe nhìn, máy tính, dẫn chương trình và phiên dịch, chỗ ở, đi lại và hoạt động xã hội cho người tham dự, phục vụ hậu cần cho các diễn giả'),
+    (138, 4, 'Tổ chức đăng kí tham gia'),
+    (138, 5, 'Giám sát công việc của các nhà thầu và báo cáo về sự thay đổi so với kế hoạch'),
+    (139, 0, 'Thu thập thông tin về nhu cầu của đối tượng gặp khó khăn xã hội, đánh giá khả năng và vấn đề của họ'),
+    (139, 1, 'Giúp các cá nhân, gia đình và cộng đồng xác định các phương án và kế hoạch hành động'),
+    (139, 2, 'Hỗ trợ họ xác định và tiếp cận các nguồn hỗ trợ cộng đồng như hỗ trợ pháp lí, y tế, tài chính, nhà ở, việc làm, giao thông, vận động và chăm sóc cá nhân hàng ngày, và các dịch vụ liên quan khác'),
+    (139, 3, 'Tham gia sàng lọc, lựa chọn người tham gia cho các chương trình xã hội phù hợp'),
+    (139, 4, 'Cung cấp dịch vụ can thiệp khủng hoảng và tạm lánh'),
+    (139, 5, 'Thực hiện các tập huấn kĩ năng sống, chương trình điều trị cai nghiện, kiểm soát hành vi, dịch vụ thanh thiếu niên và các chương trình xã hội và cộng đồng khác'),
+    (139, 6, 'Hỗ trợ đánh giá hiệu quả các biện pháp và chương trình thông qua giám sát và báo cáo tiến bộ của đối tượng'),
+    (139, 7, 'Liên lạc thường xuyên với các tổ chức xã hội, nhà trường và tổ chức y tế có liên quan để trao đổi thông tin về tình trạng và tiến bộ của đối tượng được hỗ trợ'),
+    (140, 0, 'Cung cấp các dịch vụ cho khách hàng'),
+    (140, 1, 'Giải thích việc sử dụng các thiết bị an toàn như dây an toàn, mặt nạ dưỡng khí, phao cứu sinh'),
+    (140, 2, 'Phát tạp chí, tai nghe, chăn, các vật dụng tương tự, và trả lời các yêu cầu của hành khách'),
+    (140, 3, 'Phục vụ các bữa ăn và đồ uống được chuẩn bị sẵn'),
+    (140, 4, 'Bán hàng miễn thuế'),
+    (140, 5, 'Thực hiện trợ giúp y tế cho khách hàng khi cần thiết'),
+    (140, 6, 'Đưa ra hành động thích hợp trong trường hợp khẩn cấp hoặc tai nạn'),
+    (140, 7, 'Chăm sóc hành khách tại các sân bay'),
+    (141, 0, 'Thực hiện việc chế biến thực phẩm từ các nguyên liệu sẵn có'),
+    (141, 1, 'Tổ chức, điều hành hoạt động chế biến thực phẩm theo dây chuyền hoặc theo từng công đoạn được giao'),
+    (141, 2, 'Kiểm tra, đánh giá chất lượng thực phẩm'),
+    (142, 0, 'Nấu nướng các món ăn từ nguyên liệu có sẵn'),
+    (142, 1, 'Sơ chế các loại thực phẩm, rau, củ quả để làm các món ăn phù hợp yêu cầu'),
+    (142, 2, 'Làm thủ công bánh mứt kẹo, sô-cô-la từ hỗn hợp của đường, sô cô la và các thành phần khác với sự hỗ trợ của một số công cụ và máy móc'),
+    (143, 0, 'Chuẩn bị nguyên vật'),
+    (143, 1, 'liệu để chế biến các món ăn'),
+    (143, 2, 'Chuẩn bị công cụ, các dụng cụ cần thiết cho việc chế biến thức ăn theo yêu cầu'),
+    (143, 3, 'Đảm bảo đầy đủ các nguyên, vật liệu thực phẩm để chế biến món ăn'),
+    (143, 4, 'Tham gia hỗ trợ sơ chế thực phẩm khi có yêu cầu'),
+    (143, 5, 'Làm sạch, thu dọn, sắp xếp các công cụ, dụng cụ nấu nướng sau khi đã hoàn thành'),
+    (143, 6, 'Kiểm tra hệ thống an toàn, phòng chống cháy nổ trong khu vực bếp'),
+    (144, 0, 'Nhận yêu cầu về đồ uống, món ăn của khách hàng'),
+    (144, 1, 'Lấy đồ uống, món ăn phục vụ cho khách'),
+    (144, 2, 'Thu dọn bàn ăn và thay đồ mới cho khách'),
+    (144, 3, 'Giải đáp những yêu cầu, thắc mắc của khách'),
+    (144, 4, 'Đảm bảo vệ sinh khu vực phục vụ'),
+    (145, 0, 'Đón tiếp khách hàng'),
+    (145, 1, 'Nhận thông tin, yêu cầu từ khách hàng'),
+    (145, 2, 'Xử lí thông tin và liên hệ với các bộ phận liên quan'),
+    (145, 3, 'Giải đáp những yêu cầu, thắc mắc của khách'),
+    (145, 4, 'Chuẩn bị các điều kiện đảm bảo cho hoạt động đạt kết quả tốt'),
+    (146, 0, 'Tiếp nhận, xử lí và trả lời thông tin của khách hàng, đối tác'),
+    (146, 1, 'Thực hiện công việc đón tiếp khách thay lãnh đạo cơ quan, tổ chức'),
+    (146, 2, 'Hướng dẫn khách hàng, đối tác làm việc với các bộ phận liên quan'),
+    (146, 3, 'Chuẩn bị, tổ chức các cuộc họp của đơn vị, tổ chức'),
+    (146, 4, 'tổ chức các điều kiện cần thiết cho hoạt động công tác của lãnh đạo và tổ chức'),
+    (147, 0, 'Tiến hành thăm dò để xác định vị trí các mỏ khoáng sản và đánh giá mức độ khả thi, hiệu quả chi phí của việc khai thác mỏ'),
+    (147, 1, 'Xác định các phương pháp khai thác mỏ hiệu quả nhất, trong đó có xét đến các vấn đề như độ sâu, vị trí của mỏ khoáng sản'),
+    (147, 2, 'Chuẩn bị kế hoạch xây dựng khu mỏ chi tiết, bao gồm cả vị trí và cách bố trí các đường hầm'),
+    (147, 3, 'Chỉ đạo lắp đặt thiết bị khai thác mỏ và chế biến khoáng sản khai thác'),
+    (147, 4, 'Làm việc với các chuyên gia khác để đảm bảo rằng tất cả các qui định được tuân thủ'),
+    (147, 5, 'Đảm bảo rằng tất cả các thiết bị an toàn được cài đặt'),
+    (147, 6, 'Hướng dẫn, đào tạo thợ mỏ về sử dụng các thiết bị an toàn'),
+    (147, 7, 'Tiến hành nghiên cứu và thiết lập các hệ thống giảm thiểu tác động của hoạt động khai thác khoáng sản đối với môi trường'),
+    (148, 0, 'Kiểm tra thường xuyên động cơ, thân vỏ, các hệ thống điện tử và cơ khí của máy bay đảm bảo vận hành tốt và đáp ứng mọi yêu cầu kĩ thuật và an toàn'),
+    (148, 1, 'Sửa chữa hoặc thay thế bộ phận và hệ thống hỏng hóc'),
+    (148, 2, 'Thay thế phụ tùng đến kì thay thế'),
+    (148, 3, 'Kiểm tra các bộ phận và hệ thống đảm bảo hoạt động hiệu quả'),
+    (148, 4, 'Bảo trì bảo dưỡng định kì'),
+    (148, 5, 'Lưu giữ hồ sơ bảo dưỡng và sửa chữa'),
+    (148, 6, 'Quản lí giám sát kĩ thuật viên và công nhân liên quan'),
+    (149, 0, 'Tiến hành nghiên cứu thăm dò để xác định vị trí các mỏ dầu, khí đốt và đánh giá tính khả thi, hiệu quả và chi phí của việc khai thác mỏ dầu khí đó'),
+    (149, 1, 'Đánh giá các loại dầu và khí và trữ lượng trong mỏ đó'),
+    (149, 2, 'Xác định phương pháp khoan hiệu quả nhất có thể thực hiện có tính đến các vấn đề như độ sâu và vị trí của mỏ dầu khí đó'),
+    (149, 3, 'Chuẩn bị chi tiết kế hoạch thành lập đơn vị khai thác dầu khí'),
+    (149, 4, 'Lắp đặt thiết bị khai thác và vận chuyển dầu khí'),
+    (149, 5, 'Thiết lập hệ thống quản lí dòng dầu khí và vận chuyển đến nơi lưu trữ'),
+    (149, 6, 'Điều hành kĩ thuật ở các giếng khoan khai thác'),
+    (149, 7, 'điều khiển, theo dõi, phát hiện, xử lí sự cố ở các giếng'),
+    (149, 8, 'Làm việc với các chuyên gia khác để đảm bảo rằng tất cả các qui định được tuân thủ'),
+    (149, 9, 'Đảm bảo rằng tất cả các thiết bị an toàn được lắp đặt và đào tạo công nhân về an toàn vệ sinh lao động'),
+    (149, 10, 'Nghiên cứu và triển khai các hệ thống giảm thiểu tác động môi trường từ hoạt động khai thác dầu khí'),
+    (150, 0, 'Kiểm tra, đánh giá nhu cầu của bệnh nhân liên quan đến bệnh tật và khiếm khuyết về chức năng của họ'),
+    (150, 1, 'Xây dựng thiết kế trụ chống chỉnh hình và chân tay giả'),
+    (150, 2, 'Lựa chọn vật liệu, làm các phép đo thử, lập mô hình chỉnh hình mẫu và bố trí chỉnh hỉnh'),
+    (150, 3, 'Thực hiện lắp chân tay giả, bao gồm việc sắp xếp liên kết tĩnh và động'),
+    (150, 4, 'Ước lượng việc gắn trụ chống chỉnh hình và chân hoặc tay giả cho người bệnh nhân, điều chỉnh để đảm bảo sự phù hợp chức năng hoạt động và chất lượng của chân tay giả'),
+    (150, 5, 'Hướng dẫn bệnh nhân sử dụng trụ chống chỉnh hình, chân hoặc tay giả và duy trì ghi chép bệnh án');
+INSERT INTO job_work_areas (job_id, sort_order, work_area) VALUES
+    (101, 0, 'Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và phục chế đồ gốm sứ'),
+    (101, 1, 'Các cơ sở, doanh nghiệp sản xuất đồ gốm sứ'),
+    (101, 2, 'Các cơ sở, doanh nghiệp sản xuất gạch, ngói, thiết bị vệ sinh, đồ gốm sứ xây dựng và sứ kĩ thuật khác'),
+    (101, 3, 'Các cơ sở, doanh nghiệp thủ công mĩ nghệ'),
+    (102, 0, 'Hành nghề tự do hoặc tự mở cửa hàng, xưởng, công ti'),
+    (102, 1, 'Các công ty quảng cáo, truyền thông, tổ chức sự kiện'),
+    (102, 2, 'Các công ty thiết kế, tư vấn, thi công trang trí nội thất'),
+    (102, 3, 'Các cơ sở, công ty sản xuất, phân phối, xuất nhập khẩu đồ gỗ nội ngoại thất, đồ gia dụng và trang trí'),
+    (102, 4, 'Các cơ sở, công ty sản xuất, phân phối, xuất nhập khẩu hàng thủ công mĩ nghệ'),
+    (103, 0, 'Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và sửa chữa sản phẩm đồ gỗ nội ngoại thất, đồ gia dụng và trang trí'),
+    (103, 1, 'Các cơ sở, doanh nghiệp sản xuất đồ gỗ, trang trí nội ngoại thất'),
+    (103, 2, 'Các cơ sở, doanh nghiệp thủ công mĩ nghệ'),
+    (103, 3, 'Các doanh nghiệp sản xuất đồ gỗ và nội thất công nghiệp'),
+    (104, 0, 'Hành nghề tự do hoặc tự mở hiệu, xưởng sản xuất và sửa chữa sản phẩm may, da giày và phụ kiện'),
+    (104, 1, 'Các cơ sở, doanh nghiệp may đo, sản xuất hàng may mặc thủ công, bán thủ công'),
+    (104, 2, 'Các cơ sở, doanh nghiệp thuộc da, đóng giày, sản xuất hàng da giầy thủ công, bán thủ công'),
+    (104, 3, 'Các doanh nghiệp sản xuất sợi, sản phẩm dệt và may mặc công nghiệp'),
+    (104, 4, 'Các doanh nghiệp da giày công nghiệp'),
+    (104, 5, 'Làm công việc chăm sóc trang phục trong xưởng phim, truyền hình, đoàn kịch'),
+    (105, 0, 'Các doanh nghiệp sản xuất sợi, dệt, nguyên phụ liệu dệt may'),
+    (105, 1, 'Các doanh nghiệp sản xuất hàng may mặc công nghiệp'),
+    (105, 2, 'Các cơ sở, doanh nghiệp thuộc da, sản xuất da lông thú và vải giả da'),
+    (105, 3, 'Các doanh nghiệp sản xuất giày, sản phẩm da và phụ kiện'),
+    (105, 4, 'Các cơ sở, doanh nghiệp gia công sản phẩm hoặc bán thành phẩm may mặc, da giày và phụ kiện'),
+    (106, 0, 'Bệnh viện tư nhân và Nhà nước'),
+    (106, 1, 'Trung tâm phục hồi chức năng'),
+    (106, 2, 'Phòng thí nghiệm nghiên cứu phát triển các phương pháp mới để chẩn đoán và điều trị các vấn đề liên quan đến thính giác và lời nói'),
+    (107, 0, 'Các bệnh viện, phòng khám, trạm y tế, nhà hộ sinh'),
+    (107, 1, 'Phòng y tế của trường học, cơ quan, nhà máy, doanh nghiệp'),
+    (107, 2, 'Thẩm mĩ viện'),
+    (107, 3, 'Các tổ chức tình nguyện, tổ chức phi chính phủ, tổ chức quốc tế như Tổ chức Y tế Thế giới (WHO)'),
+    (107, 4, 'Các cơ quan quản lí Nhà nước về y tế như bộ, sở y tế'),
+    (107, 5, 'Giảng dạy tại các trường ĐH, CĐ, TC'),
+    (108, 0, 'Các bệnh viện y học cổ truyền hoặc có điều trị y học cổ truyền'),
+    (108, 1, 'Tự mở phòng khám y học cổ truyền'),
+    (109, 0, 'Các văn phòng luật'),
+    (109, 1, 'Ban pháp chế của các doanh nghiệp lớn'),
+    (109, 2, 'Chính phủ'),
+    (110, 0, 'Bệnh viện hoặc nhà dưỡng lão'),
+    (110, 1, 'Trường học hoặc các tổ chức'),
+    (110, 2, 'Khách sạn'),
+    (110, 3, 'Chính quyền địa phương hoặc các cơ quan Nhà nước'),
+    (110, 4, 'Trung tâm nghiên cứu'),
+    (110, 5, 'Ngành công nghiệp thực phẩm'),
+    (111, 0, 'Các tổ chức quốc tế (ví dụ các cơ quan của Liên Hiệp Quốc, Ngân hàng Thế giới, Tổ chức Lao động quốc tế)'),
+    (111, 1, 'Công ti tư vấn tư nhân chuyên về các dự án phát triển quốc tế'),
+    (112, 0, 'Bệnh viện'),
+    (112, 1, 'Cơ sở chăm sóc sức khỏe cộng đồng'),
+    (112, 2, 'Trường học'),
+    (112, 3, 'Trung tâm phục hồi chức năng'),
+    (113, 0, 'Cơ quan Nhà nước'),
+    (113, 1, 'Các công ti kiến trúc'),
+    (113, 2, 'Tổ chức về BVMT đô thị'),
+    (113, 3, 'Công ti phát triển bất động sản tư nhân'),
+    (114, 0, 'Các công ti bất động sản'),
+    (114, 1, 'Tự mở công ti bất động sản'),
+    (115, 0, 'Tại các DNNVV'),
+    (115, 1, 'Cơ quan Nhà nước liên quan đến DNNVV'),
+    (115, 2, 'Các trung tâm, tổ chức hỗ trợ phát triển DNNVV như Hội DNNVV, Trung tâm xúc tiến DNNVV của Phòng Thương mại và Công nghiệp Việt Nam và của các cơ quan khác…'),
+    (116, 0, 'Các doanh nghiệp kinh doanh nông nghiệp, lâm nghiệp, thủy sản và muối'),
+    (117, 0, 'Bệnh viện, cơ sở y tế'),
+    (117, 1, 'Trung tâm phục hồi chức năng'),
+    (117, 2, 'Câu lạc bộ thể thao, đội thể thao'),
+    (117, 3, 'Phòng khám thể thao'),
+    (117, 4, 'Phòng tập gym, trung tâm thể dục'),
+    (117, 5, 'Phòng khám riêng'),
+    (118, 0, 'Các công ti bảo hiểm tư nhân hoặc Nhà nước'),
+    (119, 0, 'Trong các bộ phận du lịch của các công ti và cơ quan Nhà nước'),
+    (119, 1, 'Đại lí du lịch'),
+    (119, 2, 'Khu resort và nghỉ dưỡng'),
+    (119, 3, 'Các hãng hàng không'),
+    (119, 4, 'Các tổ chức liên quan đến du lịch'),
+    (120, 0, 'Bệnh viện'),
+    (120, 1, 'Phòng khám'),
+    (120, 2, 'Trung tâm phục hồi chức năng'),
+    (120, 3, 'Trung tâm y tế cộng đồng '),
+    (120, 4, 'Các cơ quan quản lí Nhà nước về y tế'),
+    (120, 5, 'Các trường ĐH, CĐ và TC y'),
+    (121, 0, 'Các bệnh viện nha khoa hoặc khoa răng, hàm, mặt trong bệnh viện'),
+    (121, 1, 'Các phòng khám nha khoa'),
+    (121, 2, 'Các viện nha khoa thẩm mĩ'),
+    (121, 3, 'Mở phòng khám riêng'),
+    (122, 0, 'Các trường và lớp mầm non'),
+    (122, 1, 'Tổ chức giáo dục dành riêng cho giáo dục mầm non'),
+    (122, 2, 'Trường sư phạm'),
+    (122, 3, 'Bệnh viện nhi đồng'),
+    (122, 4, 'Tư vấn, cộng tác viên cho các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình vì trẻ em hoặc giáo dục mầm non'),
+    (123, 0, 'Các trường tiểu học công lập'),
+    (123, 1, 'Các trường tiểu học tư thục'),
+    (123, 2, 'Các tổ chức tình nguyện'),
+    (123, 3, 'Trung tâm học tập cộng đồng'),
+    (123, 4, 'Tư vấn, cộng tác viên cho các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình vì trẻ em hoặc giáo dục, ví dụ như UNESCO, UNICEF'),
+    (124, 0, 'Các tổ chức cung cấp dịch vụ liên quan đến khuyết tật (ví dụ: trường chuyên biệt cho trẻ khiếm thị, khiếm thính…)'),
+    (124, 1, 'Các trường phổ thông cung cấp dịch vụ hòa nhập cho trẻ em có nhu cầu đặc biệt'),
+    (124, 2, 'Các hội, tổ chức của người khuyết tật'),
+    (124, 3, 'Các tổ chức tình nguyện, phi chính phủ, tổ chức quốc tế có chương trình hỗ trợ người khuyết tật ví dụ như Tổ chức Hỗ trợ Người khuyết tật Việt Nam (VNAH)'),
+    (124, 4, 'Trợ giúp trong các hoạt động, sự kiện của người khuyết tật như giải thể thao, Thế vận hội cho người khuyết tật, Paragames'),
+    (124, 5, 'Tư vấn cho các công ti, doanh nghiệp có chương trình hỗ trợ, hòa nhập, tuyển dụng người khuyết tật'),
+    (125, 0, 'Các doanh nghiệp Nhà nước và tư nhân kinh doanh thương mại (bán lẻ hoặc bán buôn trong nước, xuất nhập khẩu)'),
+    (125, 1, 'Bộ phận bán hàng tiếp thị của các doanh nghiệp sản xuất'),
+    (125, 2, 'Các doanh nghiệp kinh doanh dịch vụ như giáo dục, y tế, tài chính, tư vấn môi giới, cho thuê…'),
+    (126, 0, 'Trung tâm mua sắm và các cửa hàng'),
+    (126, 1, 'Sách và ngành công nghiệp xuất bản'),
+    (126, 2, 'Cửa hàng âm nhạc'),
+    (126, 3, 'Ngành công nghiệp may mặc'),
+    (126, 4, 'Ngành công nghiệp chế biến thực phẩm'),
+    (127, 0, 'Khách sạn'),
+    (127, 1, 'Khu Resorts'),
+    (127, 2, 'Khu du lịch y tế'),
+    (127, 3, 'Khu du lịch nghỉ dưỡng'),
+    (127, 4, 'Hãng hàng hải, hàng không'),
+    (127, 5, 'Dịch vụ nhà khách ở các công ti'),
+    (128, 0, 'Làm việc trong các trang trại tư nhân và Chính phủ liên quan đến sản xuất, lưu kho và tiếp thị'),
+    (128, 1, 'Làm việc cho các công ty liên quan đến nông nghiệpkinh doanh, chế biến thực phẩm, sản xuất giống và cung cấp dịch vụ tư vấn cho ngành nông nghiệp'),
+    (128, 2, 'Làm việc trong các tổ chức quốc tế với vai trò tư vấn'),
+    (129, 0, 'Bệnh viện'),
+    (129, 1, 'Trung tâm điều dưỡng'),
+    (129, 2, 'Cơ quan về chăm sóc sức khỏe của Chính phủ'),
+    (130, 0, 'Tất cả các doanh nghiệp vừa và lớn đều cần nhà quản lí nhân sự'),
+    (130, 1, 'Các doanh nghiệp, công ty tư vấn tuyển dụng, nhân sự'),
+    (131, 0, 'Các doanh nghiệp, nhà máy, đặc biệt là doanh nghiệp sử dụng nhiều lao động'),
+    (131, 1, 'Tổ chức công đoàn các cấp'),
+    (131, 2, 'Các tổ chức đại diện người sử dụng lao động như Văn phòng giới sử dụng lao động (Phòng Thương mại và Công nghiệp Việt Nam), Liên minh hợp tác xã, hiệp hội dệt may, da giày…'),
+    (131, 3, 'Cơ quan quản lí Nhà nước về lao động (Bộ và các sở LĐTB&amp;amp;XH, các tổng cục, cụ, vụ viện)'),
+    (131, 4, 'Các tổ chức quốc tế về vấn đề lao động và việc làm'),
+    (132, 0, 'Bệnh viện'),
+    (132, 1, 'Các công ti, nhà máy và ngành công nghiệp'),
+    (132, 2, 'Các tổ chức giáo dục'),
+    (132, 3, 'Dịch vụ quốc phòng'),
+    (132, 4, 'Hành nghề cá nhân'),
+    (133, 0, 'Các phòng khám và bệnh viện, làm việc với những người trong tình trạng suy sụp tinh thần'),
+    (133, 1, 'Các cơ sở giáo dục, hỗ trợ tư vấn học đường'),
+    (133, 2, 'Các doanh nghiệp, nhà máy, giúp nhân viên đối phó tốt hơn với căng thẳng liên quan tới công việc'),
+    (133, 3, 'Các tổ chức phi chính phủ, tổ chức quốc tế liên quan tới trẻ em, thanh niên, người tàn tật, người già, phụ nữ, người nghiện ma túy và thích'),
+    (133, 4, 'Hành nghề cá nhân'),
+    (134, 0, 'Trung tâm dịch vụ việc làm, tư vấn nghề nghiệp'),
+    (134, 1, 'Cơ quan Nhà nước về lao động'),
+    (134, 2, 'Các phòng khám tâm lí'),
+    (134, 3, 'Trung tâm phục hồi chức năng'),
+    (134, 4, 'Trường học'),
+    (134, 5, 'Các tổ chức phát triển thanh thiếu niên'),
+    (134, 6, 'Các tổ chức phát triển, phi chính phủ, tổ chức quốc tế'),
+    (135, 0, 'Bệnh viện'),
+    (135, 1, 'Các phòng thí nghiệm y tế'),
+    (135, 2, 'Các trường đào tạo về y tế'),
+    (135, 3, 'Trung tâm nghiên cứu'),
+    (136, 0, 'Bệnh viện'),
+    (136, 1, 'Các phòng khám, đo mắt'),
+    (136, 2, 'Các phòng thí nghiệm y tế'),
+    (136, 3, 'Cơ sở đào tạo y khoa'),
+    (136, 4, 'Trung tâm nghiên cứu'),
+    (137, 0, 'Bệnh viện'),
+    (137, 1, 'Các phòng thí nghiệm y tế'),
+    (137, 2, 'Cơ sở đào tạo y tế'),
+    (137, 3, 'Trung tâm nghiên cứu'),
+    (138, 0, 'Các công ty tổ chức sự kiện, chuyên về tổ chức các loại sự kiện khác nhau như ca nhạc, hòa nhạc, biểu diễn nghệ thuật, sự kiện truyền hình, lễ hội, trình diễn thời trang, thể thao, giới thiệu sản phẩm, động thổ, khai trương, hội nghị hội thảo, chương trình khuyến mãi, họp báo, đám cưới, lễ kỉ niệm, tiệc, hội họp…'),
+    (138, 1, 'Các cơ quan/công ty về quan hệ công chúng'),
+    (138, 2, 'Bộ phận liên quan tới tổ chức sự kiện của các khách sạn lớn'),
+    (138, 3, 'Tự mở doanh nghiệp, dịch vụ tổ chức sự kiện'),
+    (139, 0, 'Các tổ chức phi chính phủ, tổ chức tình nguyện, tổ chức quốc tế có chương trình hỗ trợ xã hội, phát triển cộng đồng;'),
+    (139, 1, 'Trung tâm cộng đồng'),
+    (139, 2, 'Bệnh viện'),
+    (139, 3, 'Các doanh nghiệp có chương trình trách nhiệm xã hội của doanh nghiệp (CSR)'),
+    (139, 4, 'Các tổ chức, đoàn thể có chức năng chăm sóc, bảo trợ xã hội cho hội viên, khách hàng như đoàn thanh niên, hội phụ nữ, hội người khuyết tật…'),
+    (140, 0, 'Các hãng hàng không trong nước và quốc tế'),
+    (140, 1, 'Các sân bay'),
+    (140, 2, 'Các tàu du lịch, du thuyền'),
+    (140, 3, 'Các chuyến xe lửa cao cấp và xe buýt du lịch'),
+    (141, 0, 'Các doanh nghiệp chế biến thực phẩm'),
+    (141, 1, 'Xưởng chế biến thực phẩm'),
+    (141, 2, 'Các công ty liên quan đến thực phẩm'),
+    (141, 3, 'Trung tâm dinh dưỡng'),
+    (141, 4, 'Các khu công nghiệp, chế xuất'),
+    (142, 0, 'Các nhà hàng, khách sạn'),
+    (142, 1, 'Các bếp ăn lớn'),
+    (142, 2, 'Các khu du lịch, nghỉ dưỡng, resort'),
+    (142, 3, 'Các tổ chức, tập đoàn, cơ quan, công ty phục vụ nhiều công nhân, nhân viên'),
+    (143, 0, 'Các nhà hàng, khách sạn'),
+    (143, 1, 'Các bếp ăn lớn'),
+    (143, 2, 'Các khu du lịch, nghỉ dưỡng, resort'),
+    (143, 3, 'Các tổ chức, tập đoàn, cơ quan, công ty phục vụ nhiều công nhân, nhân viên'),
+    (144, 0, 'Các nhà hàng, khách sạn'),
+    (144, 1, 'Các khu du lịch, nghỉ dưỡng, resort'),
+    (144, 2, 'Các khu vui chơi, giải trí'),
+    (145, 0, 'Các nhà hàng, khách sạn'),
+    (145, 1, 'Các khu du lịch, nghỉ dưỡng, resort'),
+    (145, 2, 'Các khu vui chơi, giải trí'),
+    (145, 3, 'Các cơ quan, công sở, công ty, tập đoàn'),
+    (145, 4, 'Các tổ chức xã hội, nghề nghiệp'),
+    (146, 0, 'Các cơ quan, công sở, công ty, tập đoàn'),
+    (146, 1, 'Các tổ chức xã hội, nghề nghiệp'),
+    (146, 2, 'Các đơn vị sản xuất'),
+    (146, 3, 'Các khu du lịch, khách sạn…'),
+    (147, 0, 'Các doanh nghiệp khai thác mỏ'),
+    (147, 1, 'Các công ty tư vấn kĩ thuật tư nhân'),
+    (147, 2, 'Các trung tâm nghiên cứu'),
+    (147, 3, 'Các trường đại học'),
+    (147, 4, 'Các cơ quan Nhà nước'),
+    (148, 0, 'Các sân bay dân sự và quân sự'),
+    (148, 1, 'Các công ty bảo trì/bảo dưỡng hàng không'),
+    (148, 2, 'Các hãng hàng không'),
+    (148, 3, 'Các đơn vị thiết kế công trình hàng không'),
+    (149, 0, 'Các doanh nghiệp dầu khí Nhà nước và tư nhân'),
+    (149, 1, 'Các trung tâm, viện nghiên cứu'),
+    (149, 2, 'Giảng dạy tại các trường đại học, cao đẳng, trung học'),
+    (149, 3, 'Các cơ quan Nhà nước quản lí ngành dầu khí'),
+    (149, 4, 'Các công ty tư vấn kĩ thuật'),
+    (150, 0, 'Các trung tâm phục hồi chức năng'),
+    (150, 1, 'Bệnh viện'),
+    (150, 2, 'Các trung tâm chẩn đoán'),
+    (150, 3, 'Phòng khám đa khoa');
+
+-- Jobs 151 to 200
+INSERT INTO job_specializations (job_id, sort_order, specialization) VALUES
+    (151, 0, 'Kĩ thuật chế tạo người máy'),
+    (151, 1, 'Thị giác máy tính'),
+    (151, 2, 'Tự động hóa'),
+    (151, 3, 'Hệ thống tự động hóa'),
+    (152, 0, 'Kĩ thuật hàng hải'),
+    (152, 1, 'Kĩ thuật tàu thủy'),
+    (152, 2, 'Kĩ thuật điện tàu thủy'),
+    (152, 3, 'Điện và tự động tàu thủy'),
+    (152, 4, 'Kĩ thuật điện tử tàu thủy'),
+    (153, 0, 'Cảnh sát cơ động'),
+    (153, 1, 'Cảnh sát hình sự'),
+    (153, 2, 'Cảnh sát kinh tế'),
+    (153, 3, 'Cảnh sát giao thông'),
+    (153, 4, 'Cảnh sát môi trường'),
+    (153, 5, 'Cảnh sát đặc nhiệm'),
+    (153, 6, 'Cảnh sát điều tra'),
+    (153, 7, 'Cảnh sát quản lí hành chính và trật tự xã hội'),
+    (153, 8, 'Cảnh sát phòng cháy chữa cháy'),
+    (154, 0, 'Biên đạo múa'),
+    (154, 1, 'Diễn viên múa'),
+    (154, 2, 'Múa dân tộc'),
+    (154, 3, 'Múa hiện đại'),
+    (154, 4, 'Khiêu vũ thể thao'),
+    (155, 0, 'Cốp pha - giàn giáo'),
+    (155, 1, 'Kĩ thuật cốt thép'),
+    (155, 2, 'Cấp thoát nước'),
+    (155, 3, 'Nề'),
+    (155, 4, 'Công nghệ xây dựng'),
+    (155, 5, 'Kĩ thuật xây dựng mỏ'),
+    (155, 6, 'Xây dựng cầu đường'),
+    (155, 7, 'Lắp đặt cầu'),
+    (155, 8, 'Lắp đặt giàn khoan'),
+    (155, 9, 'Xây dựng và bảo trì đường sắt'),
+    (155, 10, 'Xây dựng và cải thiện công trình thủy lợi'),
+    (155, 11, 'Xây dựng công trình thủy lợi'),
+    (155, 12, 'Bảo trì và sửa chữa sân bay'),
+    (155, 13, 'Kiểm tra và Kiểm định chất lượng cầu đường'),
+    (156, 0, 'Quản lí và khai thác công trình thủy lợi'),
+    (156, 1, 'Quản lí thủy nông'),
+    (156, 2, 'Cấp thoát nước'),
+    (156, 3, 'Thủy lợi tổng hợp'),
+    (156, 4, 'Thủy điện'),
+    (157, 0, 'Thiết bị hàng hải'),
+    (157, 1, 'Công nghệ truyền dẫn quang và vô tuyến'),
+    (157, 2, 'Công nghệ nguồn thông tin và điện'),
+    (157, 3, 'Công nghệ thiết bị ra đa'),
+    (157, 4, 'Công nghệ lắp đặt trạm viễn thông'),
+    (157, 5, 'Công nghệ mạng ngoại vi và thiết bị đầu cuối'),
+    (158, 0, 'Vận hành điện trong nhà máy điện'),
+    (158, 1, 'Vận hành nhà máy thuỷ điện'),
+    (158, 2, 'Vận hành nhà máy nhiệt điện'),
+    (158, 3, 'Vận hành và sửa chữa trạm thủy điện'),
+    (158, 4, 'Đo điện'),
+    (158, 5, 'Điện dân dụng'),
+    (158, 6, 'Sửa chữa đường dây dòng điện'),
+    (158, 7, 'Lắp đặt đường dây tải điện và trạm biến áp có điện áp từ 220 KV trở lên'),
+    (158, 8, 'Lắp đặt đường dây tải điện và trạm biến áp có điện áp từ 110 kV trở xuống'),
+    (158, 9, 'Quản lí, vận hành và sửa chữa đường dây tải điện và trạm biến áp có điện áp từ 220 kV trở lên'),
+    (158, 10, 'Quản lí, vận hành và sửa chữa đường dây tải điện và trạm biến áp có điện áp từ 110 kV trở xuống'),
+    (158, 11, 'Máy phát điện diesel'),
+    (158, 12, 'Kĩ thuật điện khí hóa nông thôn'),
+    (159, 0, 'Kĩ thuật nồi hơi'),
+    (159, 1, 'Kĩ thuật tua-bin gió'),
+    (159, 2, 'Kĩ thuật tua-bin nước'),
+    (159, 3, 'Kĩ thuật tua-bin khí'),
+    (159, 4, 'Lắp đặt và kiểm tra nồi hơi và tua-bin'),
+    (160, 0, 'Chế tạo và lắp ráp máy tính'),
+    (160, 1, 'Kết nối mạng và các mạng cục bộ'),
+    (160, 2, 'Sửa chữa và bảo trì'),
+    (160, 3, 'Chuyên về các bộ phận cụ thể của máy tính (ví dụ thiết bị lưu trữ, xử lí)'),
+    (160, 4, 'Lắp ráp và sửa chữa máy tính'),
+    (160, 5, 'Thiết kế vi mạch điện tử trên máy tính'),
+    (161, 0, 'Các chuyên ngành liên quan đến các loại thiết bị thông tin liên lạc (ví dụ: ra-đa, radio)'),
+    (162, 0, 'Sản xuất và lắp đặt thiết bị cơ khí'),
+    (162, 1, 'Kĩ thuật lắp đặt và xử lí đường ống'),
+    (162, 2, 'Chế tạo và lắp dựng kết cấu thép'),
+    (162, 3, 'Bảo trì đầu máy xe lửa'),
+    (162, 4, 'Sửa chữa máy dệt'),
+    (162, 5, 'Sửa chữa máy'),
+    (162, 6, 'Sửa chữa thiết bị'),
+    (162, 7, 'Sửa chữa thang máy'),
+    (162, 8, 'Sửa chữa máy móc xây dựng'),
+    (162, 9, 'Sửa chữa thiết bị'),
+    (162, 10, 'Bảo trì hệ thống thiết bị'),
+    (162, 11, 'Sửa chữa và lắp đặt thiết bị lạnh'),
+    (163, 0, 'Tín hiệu đường sắt'),
+    (163, 1, 'Kiểm soát việc chạy tàu'),
+    (163, 2, 'Quản lí tàu'),
+    (163, 3, 'Lái xe chuyên dụng'),
+    (163, 4, 'Kiểm soát giao thông đường thủy nội địa'),
+    (163, 5, 'Kiểm soát vận chuyển bằng tàu thủy'),
+    (163, 6, 'Điện đầu máy xe lửa và toa xe lửa'),
+    (163, 7, 'Lắp đặt và sửa chữa hệ thống tải điện đường sắt'),
+    (164, 0, 'Vận hành thiết bị sàng quặng kim loại'),
+    (164, 1, 'Khoan nổ mìn'),
+    (164, 2, 'Khoan đường hầm'),
+    (164, 3, 'Khoan và khai thác mỏ'),
+    (164, 4, 'Vận hành máy nén khí, máy bơm, quạt gió'),
+    (164, 5, 'Vận hành nhà máy khí hóa than'),
+    (164, 6, 'Khảo sát thủy văn'),
+    (164, 7, 'Khoan thăm dò địa chất'),
+    (164, 8, 'Sửa chữa thiết bị khai thác mỏ bằng điện'),
+    (164, 9, 'Điện trong khai thác mỏ hầm lò'),
+    (165, 0, 'Quản lí kinh doanh bất động sản'),
+    (165, 1, 'Quản lí nhà và đất'),
+    (166, 0, 'Máy móc thiết bị kiểm soát qui trình, có áp dụng điều khiển tự động trong sử dụng năng lượng, xử lí rác và nước, tinh chế dầu khí, sản xuất hóa chất, kim loại'),
+    (166, 1, 'Máy móc thiết bị cố định trong khai thác khoáng sản, sản xuất hóa học, phim ảnh, giấy, nhựa, cao su, dệt, da, thực phẩm, gỗ, thủy tinh, gốm, đóng gói'),
+    (166, 2, 'Động cơ hơi nước và nồi hơi'),
+    (166, 3, 'Thiết bị công trình nền móng'),
+    (166, 4, 'Thiết bị xây dựng đường và đường sắt'),
+    (166, 5, 'Thiết bị xây dựng'),
+    (167, 0, 'Sản xuất khí đốt, vận hành trạm khí đốt tự nhiên hóa lỏng'),
+    (167, 1, 'Vận hành thiết bị hóa dầu'),
+    (167, 2, 'Vận hành thiết bị khai thác dầu mỏ'),
+    (167, 3, 'Sửa chữa thiết bị khai thác dầu mỏ'),
+    (167, 4, 'Vận hành thiết bị xử lí dầu mỏ'),
+    (167, 5, 'Vận hành trạm phân phối sản phẩm dầu mỏ'),
+    (167, 6, 'Vận hành hệ thống đường ống nhà máy và đường ống dẫn khí'),
+    (167, 7, 'Vận hành nhà máy lọc dầu'),
+    (167, 8, 'Vận hành thiết bị khí thiên nhiên để sản xuất phân đạm'),
+    (168, 0, 'BVMT đô thị'),
+    (168, 1, 'BVMT công nghiệp'),
+    (168, 2, 'BVMT biển'),
+    (168, 3, 'Vi sinh – hóa sinh'),
+    (168, 4, 'Quản lí tài nguyên và môi trường'),
+    (168, 5, 'Công nghệ kĩ thuật môi trường'),
+    (168, 6, 'Xử lí nước thải'),
+    (168, 7, 'Xử lí chất thải rắn'),
+    (168, 8, 'Bảo hộ lao động và môi trường'),
+    (169, 0, 'Quản lí phát triển'),
+    (169, 1, 'Quản lí môi trường'),
+    (169, 2, 'Kinh tế lâm nghiệp'),
+    (169, 3, 'Quản lí lâm nghiệp'),
+    (169, 4, 'Lâm nghiệp'),
+    (169, 5, 'Quản lí tài nguyên rừng'),
+    (169, 6, 'Lâm sinh'),
+    (170, 0, 'Điều khiển tàu thủy'),
+    (170, 1, 'Ổn định tàu'),
+    (171, 0, 'Phi công chở khách'),
+    (171, 1, 'Phi công vận tải'),
+    (171, 2, 'Phi công trực thăng'),
+    (171, 3, 'Phi công quân sự'),
+    (172, 0, 'Không quân, chuyên đào tạo phi công và quản lí không lưu trong thời kì chiến tranh'),
+    (172, 1, 'Hàng không nội địa, chuyên ngành hàng không chở hành khách'),
+    (173, 0, 'Chuyên sâu về các loại thiết bị cụ thể (như máy chụp CT scan, máy chụp cắt lớp phát xạ - PET scan)'),
+    (173, 1, 'Lập trình máy tính điều khiển các thiết bị này'),
+    (173, 2, 'Chuyên sâu về các hình thức xét nghiệm cụ thể (như đo mật độ xương)'),
+    (174, 0, 'Hóa sinh'),
+    (174, 1, 'Hóa học lâm sàng'),
+    (174, 2, 'Tế bào học'),
+    (174, 3, 'Công nghệ tế bào'),
+    (174, 4, 'Huyết học'),
+    (174, 5, 'Mô học'),
+    (174, 6, 'Miễn dịch học'),
+    (174, 7, 'Vi sinh vật'),
+    (174, 8, 'Khoa học truyền dịch'),
+    (174, 9, 'Kĩ thuật kiểm tra y tế'),
+    (174, 10, 'Kĩ thuật thiết bị phòng thí nghiệm'),
+    (174, 11, 'Pháp y'),
+    (175, 0, 'Kĩ thuật khoan'),
+    (175, 1, 'Đánh giá mỏ dầu khí'),
+    (175, 2, 'Kĩ thuật sản xuất'),
+    (175, 3, 'Kĩ thuật tầng chứa'),
+    (175, 4, 'Kĩ thuật thủy khí'),
+    (175, 5, 'Vật lí đá'),
+    (176, 0, 'Kĩ thuật viên nha khoa'),
+    (176, 1, 'Vệ sinh răng miệng'),
+    (176, 2, 'Kĩ thuật phục hình răng'),
+    (177, 0, 'Một môn thể thao cụ thể nào đó'),
+    (177, 1, 'Quản lí thể thao'),
+    (177, 2, 'Huấn luyện'),
+    (177, 3, 'Bình luận và truyền thông'),
+    (178, 0, 'Các chuyên ngành về một môn thể thao và đào tạo huấn luyện viên thể thao'),
+    (178, 1, 'Tâm lí học thể thao'),
+    (179, 0, 'Thiết bị tin học và viễn thông doanh nghiệp'),
+    (179, 1, 'Dịch vụ bưu chính viễn thông doanh nghiệp'),
+    (180, 0, 'Cứu hoả'),
+    (180, 1, 'Cứu hoả đối với tai nạn máy bay'),
+    (180, 2, 'Cứu hoả cháy rừng'),
+    (180, 3, 'Cứu hộ'),
+    (181, 0, 'Trồng cây lương thực'),
+    (181, 1, 'Trồng rau'),
+    (181, 2, 'Trồng cây công nghiệp'),
+    (181, 3, 'Trồng cây ăn quả'),
+    (181, 4, 'Bảo vệ thực vật'),
+    (181, 5, 'Khuyến nông khuyến lâm'),
+    (181, 6, 'Sản xuất giống'),
+    (181, 7, 'Thu hoạch và chế biến sau thu hoạch'),
+    (181, 8, 'Thu mua, vận chuyển và tiêu thụ nông sản'),
+    (182, 0, 'Chăn nuôi và quản lí gia súc'),
+    (182, 1, 'Dinh dưỡng động vật'),
+    (182, 2, 'Quản lí gia cầm'),
+    (183, 0, 'Kết nối khí'),
+    (183, 1, 'Hệ thống sưởi và hệ thống thông gió'),
+    (183, 2, 'Lắp đặt hệ thống thủy lợi'),
+    (183, 3, 'Thợ ống, lợp mái'),
+    (183, 4, 'Lắp đặt hệ thống tưới nước'),
+    (184, 0, 'Lập trình và vận hành máy CNC'),
+    (184, 1, 'Sản xuất khuôn mẫu'),
+    (184, 2, 'Quản lí chất lượng'),
+    (184, 3, 'Thiết kế công cụ'),
+    (185, 0, 'Hoàn thiện sản phẩm mộc mĩ nghệ'),
+    (185, 1, 'Mộc mĩ nghệ các hệ thống bên trong'),
+    (185, 2, 'Mộc dân dụng'),
+    (185, 3, 'Mộc thô'),
+    (185, 4, 'Kĩ thuật mộc dân dụng'),
+    (186, 0, 'Vận hành và sửa chữa các thiết bị lạnh'),
+    (186, 1, 'Kĩ thuật lạnh và điều hòa không khí'),
+    (186, 2, 'Đông lạnh thủy sản'),
+    (187, 0, 'Hàn điện'),
+    (187, 1, 'Hàn hơi'),
+    (187, 2, 'Cắt hàn kim loại'),
+    (188, 0, 'Chế tạo thân tàu'),
+    (188, 1, 'Chế tạo và lắp ráp các hệ thống đường ống tàu thủy'),
+    (188, 2, 'Chế tạo, lắp ráp nội thất tàu thủy'),
+    (188, 3, 'Lắp ráp hệ thống động lực tàu thủy'),
+    (188, 4, 'Sửa chữa động cơ tàu thủy'),
+    (189, 0, 'Hàn'),
+    (189, 1, 'Rèn'),
+    (189, 2, 'Nguội'),
+    (189, 3, 'Sửa chữa nguội'),
+    (189, 4, 'Gia công không phoi'),
+    (189, 5, 'Gia công cắt gọt kim loại'),
+    (190, 0, 'Phương tiện giao thông bốn bánh'),
+    (190, 1, 'Xe hai bánh'),
+    (190, 2, 'Xe tải trọng lớn'),
+    (190, 3, 'Xe thể thao, xe đua'),
+    (190, 4, 'Phương tiện đi lại tại trang trại'),
+    (191, 0, 'Lặn cứu hộ'),
+    (191, 1, 'Lặn nghiên cứu'),
+    (191, 2, 'Hướng dẫn lặn'),
+    (191, 3, 'Lặn xây dựng'),
+    (192, 0, 'Lục quân'),
+    (192, 1, 'Hải quân'),
+    (192, 2, 'Phòng không - Không quân'),
+    (192, 3, 'Công binh'),
+    (192, 4, 'Quân y'),
+    (193, 0, 'Giáo viên giảng dạy về lâm nghiệp'),
+    (193, 1, 'Thiết kề trồng rừng'),
+    (193, 2, 'Trồng và chăm sóc rừng'),
+    (193, 3, 'Quản lý bảo vệ rừng'),
+    (193, 4, 'Khai thác và sơ chế các loại lâm sản'),
+    (193, 5, 'Cán bộ khuyến lâm'),
+    (194, 0, 'Nghiên cứu trong lĩnh vực nuôi trồng thủy sản'),
+    (194, 1, 'các trạm nghiên cứu'),
+    (194, 2, 'các doanh nghiệp về sản xuất giống'),
+    (194, 3, 'Các nghiệp đoàn đánh bắt thủy sản gần bờ, xa bờ'),
+    (194, 4, 'Cán bộ khuyến ngư….'),
+    (195, 0, 'Các công trình xây dựng dân dụng'),
+    (195, 1, 'Các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện'),
+    (196, 0, 'Các công trình xây dựng dân dụng'),
+    (196, 1, 'Các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện'),
+    (197, 0, 'Sơn các công trình xây dựng dân dụng'),
+    (197, 1, 'Sơn các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện'),
+    (197, 2, 'Làm về sơn tại các nhà máy, doanh nghiệp sản xuất như ô tô, xe máy, sơn tĩnh điện….'),
+    (198, 0, 'Làm việc tại các công trình công nghiệp, các nhà máy, công trình thủy lơi, thủy điện'),
+    (199, 0, 'Chủ yếu liên quan đến lĩnh vực lắp đặt và sửa chữa điện- điện tử viễn thông tại các trạm, đài viễn thông'),
+    (199, 1, 'lắp đặt, sửa chữa các mạng viễn thông Khi phát triển sự nghiệp, bạn có thể chuyên sâu hơn nữa về một lĩnh của bạn như hỗ trợ giảng dạy, nghiên cứu trong lĩnh vực điện tử viễn thông'),
+    (200, 0, 'Chủ yếu liên quan đến lĩnh vực lắp ráp, khi phát triển nghề nghiệp bạn có thể học chuyên sâu hơn và có thể nghiên cứu, sang tạo các loại mẫu mã mới, hướng dẫn hoặc tham gia đào tạo tại các cơ sở đào tạo, doanh nghiệp');
+INSERT INTO job_tasks (job_id, sort_order, task) VALUES
+    (151, 0, 'Thu nhận kiến thức của các lĩnh vực kĩ thuật như: kĩ thuật cơ khí, khoa học vật liệu, kĩ thuật điện tử/điện, kĩ thuật máy tính, kĩ thuật hệ thống và kiểm soát hệ thống'),
+    (151, 1, 'Chuyên sâu vào một trong những lĩnh vực kĩ thuật trên, đồng thời liên hệ với các lĩnh vực khác bổ sung hỗ trợ cho cơ-điện tử'),
+    (151, 2, 'Áp dụng các nguyên tắc của lĩnh vực chuyên sâu của mình. Các nguyên tắc này được xây dựng trên cơ sở các thông tin và hệ thống được cung cấp bởi các ngành khác'),
+    (152, 0, 'Kiểm soát hoạt động, bảo trì, bảo dưỡng, sửa chữa thiết bị cơ khí, điện, điện tử và máy móc trên tàu'),
+    (152, 1, 'Mua sắm nhiên liệu và các đồ dùng dự trữ trong khoang máy tàu thủy cũng như duy trì ghi chép các hoạt động'),
+    (152, 2, 'Giám sát kĩ thuật việc lắp đặt, bảo trì, sửa chữa máy móc và thiết bị tàu thủy nhằm đảm bảo việc tuần thủ các qui định, yêu cầu kĩ thuật'),
+    (152, 3, 'Kiểm tra và tiến hành bảo trì, sửa chữa khẩn cấp các động cơ, máy móc và thiết bị phụ trợ'),
+    (152, 4, 'Trực ca buồng máy, giám sát, theo dõi, ghi chép hoạt động của các động cơ, máy móc và thiết bị phụ trợ'),
+    (153, 0, 'Phòng ngừa, phát hiện, đấu tranh chống tội phạm và vi phạm pháp luật về trật tự, an toàn xã hội, BVMT'),
+    (153, 1, 'phát hiện nguyên nhân, điều kiện phát sinh tội phạm, vi phạm pháp luật khác và kiến nghị biện pháp khắc phục'),
+    (153, 2, 'tham gia giáo dục đối tượng vi phạm pháp luật tại cộng đồng theo qui định của pháp luật'),
+    (153, 3, 'Quản lí hộ khẩu, cấp giấy chứng minh nhân dân'),
+    (153, 4, 'quản lí con dấu'),
+    (153, 5, 'quản lí về an ninh, trật tự các nghề kinh doanh có điều kiện và dịch vụ bảo vệ'),
+    (153, 6, 'quản lí và bảo đảm trật tự, an toàn giao thông, trật tự công cộng'),
+    (153, 7, 'quản lí vũ khí, vật liệu nổ'),
+    (153, 8, 'quản lí, thực hiện công tác phòng cháy, chữa cháy'),
+    (153, 9, 'tham gia cứu hộ, cứu nạn theo qui định của pháp luật'),
+    (153, 10, 'Thi hành án hình sự, thi hành án không phải phạt tù, tạm giữ, tạm giam'),
+    (153, 11, 'bảo vệ, hỗ trợ tư pháp'),
+    (153, 12, 'Điều tra các vụ án theo nguyên tắc tố tụng hình sự và bộ luật hình sự'),
+    (153, 13, 'Thực hiện nhiệm vụ, quyền hạn khác theo qui định của pháp luật'),
+    (154, 0, 'Tìm hiểu và sáng tác các điệu nhảy, bài múa. Các tiết mục này thường chuyển tải một câu chuyện, một chủ đề, ý tưởng hoặc tâm trạng bằng các động tác di chuyển các bước chân, chuyển động và cử chỉ'),
+    (154, 1, 'Biểu diễn các điệu nhảy, bài múa đơn, múa đôi hoặc cùng với nhiều thành viên của một nhóm múa'),
+    (155, 0, 'Thực hiện và hỗ trợ các thử nghiệm trong thực tế và trong phòng thí nghiệm đất trồng và các nguyên vật liệu xây dựng'),
+    (155, 1, 'Cung cấp hỗ trợ kĩ thuật liên quan tới việc xây dựng nhà cao tầng và các công trình xây dựng khác và với các cuộc điều tra hoặc việc chuẩn bị các báo cáo điều tra'),
+    (155, 2, 'Đảm bảo sự tương thích giữa các đặc điểm kĩ thuật trong thiết kế, với luật pháp và các qui định liên quan, và duy trì các tiêu chuẩn theo yêu cầu của công việc và của nguyên vật liệu'),
+    (155, 3, 'Áp dụng kiến thức kĩ thuật về xây dựng và các nguyên tắc kĩ thuật dân dụng và thực tế để xác định và giải quyết các vấn đề phát sinh'),
+    (155, 4, 'Hỗ trợ việc chuẩn bị các dự toán chi tiết về kĩ thuật và giá cả nguyên vật liệu và nhân công theo yêu cầu của dự án, theo yêu cầu kĩ thuật đã đề ra'),
+    (155, 5, 'Tổ chức duy tu và sửa chữa'),
+    (155, 6, 'Giám sát các công nhân khác'),
+    (156, 0, 'Tiến hành công tác quản lí kĩ thuật thi công tại dự án thủy lợi'),
+    (156, 1, 'Thực hiện công tác hồ sơ hoàn công, nghiệm thu, thanh quyết toán'),
+    (156, 2, 'Lập hồ sơ hồ sơ hoàn công các công trình xây dựng thuỷ lợi, thủy điện. Vẽ biện pháp thi công chi tiết cho các hạng mục công trình'),
+    (156, 3, 'Kiểm soát kĩ thuật, khối lượng thi công tại các công trình thuỷ điện'),
+    (156, 4, 'Giám sát vận hành các công trình thủy lợi'),
+    (156, 5, 'Chỉ đạo sửa chữa, cải tạo các công trình thủy lợi: đê, kè, đập, cống, hệ thống cấp thoát nước...'),
+    (157, 0, 'Lắp đặt thiết bị ngoại vi (như bộ nguồn, dây cáp, máy biến áp) cho phần cứng theo thiết kế hoặc các thông số kĩ thuật'),
+    (157, 1, 'Thực hiện sửa chữa các bộ phận điện của các thiết bị công nghệ thông tin'),
+    (158, 0, 'Vận hành và kiểm soát hệ thống và các thiết bị phát điện bao gồm tua-bin, máy phát điện, tụ điện và bộ kháng điện các nhà máy thủy điện, nhà máy nhiệt điện, nhà máy than, dầu, khí thiên nhiên và nhà máy hạt nhân để tạo ra và phân phối điện'),
+    (158, 1, 'Kiểm soát việc khởi động và tắt các thiết bị nhà máy điện, kiểm soát hoạt động đóng ngắt, điều chỉnh mực nước và liên lạc với những người vận hành khác để điều chỉnh tải trọng'),
+    (158, 2, 'Ghi lại các con số từ các biểu đồ, dụng cụ đo và đồng hồ trong khoảng thời gian thiết lập'),
+    (158, 3, 'Vệ sinh và bảo trì các thiết bị như máy phát điện, thiết bị bốc hơi, tua-bin và máy bơm để ngăn chặn mất hoặc sụt điện'),
+    (159, 0, 'Vận hành, giám sát và kiểm tra các loại tua-bin như tua-bin khí, nước, gió và hơi nước'),
+    (159, 1, 'Vận hành và giám sát các tua-bin để phát điện và phân phối điện'),
+    (159, 2, 'Kiểm soát việc khởi động và tắt các thiết bị tua-bin, kiểm soát hoạt động đóng ngắt, điều chỉnh mực nước và liên lạc với những người vận hành khác để điều chỉnh tải trọng'),
+    (159, 3, 'Ghi lại các con số từ các biểu đồ, dụng cụ đo và đồng hồ trong khoảng thời gian thiết lập'),
+    (159, 4, 'Vệ sinh và bảo trì các thiết bị như máy phát điện, thiết bị bốc hơi, tua-bin, máy bơm để ngăn chặn mất hoặc sụt điện'),
+    (160, 0, 'Cài đặt và thực hiện sửa chữa phần cứng, thiết bị ngoại vi theo bản thiết kế hoặc thông số kĩ thuật lắp đặt'),
+    (160, 1, 'Thiết lập thiết bị và mạng dịch vụ hoặc bảo đảm cài đặt các loại cáp, hệ điều hành hoặc phần mềm phù hợp'),
+    (160, 2, 'Trả lời về cách giải quyết vấn đề do người sử dụng nêu ra'),
+    (160, 3, 'Giám sát hoạt động hàng ngày của hệ thống máy tính và hệ thống truyền thông'),
+    (160, 4, 'Cung cấp cho người sử dụng các tư vấn, hướng dẫn kĩ thuật và các tài liệu khác để họ nghiên cứu và giải quyết các vấn đề phát sinh'),
+    (161, 0, 'Thiết lập và điều chỉnh các thiết bị hoạt động trên tần số mong muốn'),
+    (161, 1, 'Duy trì liên lạc thường xuyên với các trạm phát thanh ven biển gần nhất để thu được dự báo thời tiết, tín hiệu báo giờ, báo cáo các thông tin cần thiết về hướng đi và vị trí của tàu'),
+    (161, 2, 'Thường xuyên theo dõi để nhận tín hiệu từ các tàu bị nạn'),
+    (161, 3, 'Cung cấp các cảnh báo hàng hải và báo cáo tình hình thời tiết'),
+    (161, 4, 'Duy trì hoạt động của các thiết bị vô tuyến, ghi chép điện văn nhận được hoặc gửi đi và thực hiện các sửa chữa nhỏ, thay thế các bộ phận'),
+    (161, 5, 'Bảo trì thiết bị ra đa'),
+    (162, 0, 'Xem xét các thông số kĩ thuật, sơ đồ và bản vẽ để xác định các tài liệu và hướng dẫn cần thiết'),
+    (162, 1, 'Lắp ráp và lắp đặt các bộ phận sẵn có'),
+    (162, 2, 'Làm các chi tiết để tạo thành bộ phận lắp ráp'),
+    (162, 3, 'Lắp ráp các máy móc, động cơ và thành phẩm cơ khí'),
+    (162, 4, 'Sửa chữa các loại máy móc'),
+    (163, 0, 'Bảo dưỡng, bảo trì, kiểm tra và sửa chữa các phương tiện vận tải trên bộ như xe tải, xe buýt và xe lửa'),
+    (163, 1, 'Bảo dưỡng, bảo trì, kiểm tra và sửa chữa các phương tiện vận tải đường thủy như tàu thuyền, phà, xuồng và tàu thủy'),
+    (163, 2, 'Thay thế các bộ phận hỏng hóc để đảm bảo thông suốt lịch trình vận tải của phương tiện đó'),
+    (164, 0, 'Hỗ trợ kĩ thuật liên quan đến nghiên cứu và phát triển các phương pháp tiến bộ để thăm dò, khai thác, vận chuyển và lưu trữ khoáng sản'),
+    (164, 1, 'Hỗ trợ kĩ thuật về thăm dò địa chất và đo vẽ địa hình để xác định vị trí tập trung các khoáng sản trên đất liền và dưới biển'),
+    (164, 2, 'Làm đánh giá chi tiết về số lượng, chi phí nguyên vật liệu, lao động cho việc thăm dò, khảo sát, chiết xuất và vận chuyển'),
+    (164, 3, 'Xây dựng, lắp đặt, vận hành, bảo dưỡng và sửa chữa các thiết bị thăm dò, khai thác, chiết xuất và vận chuyển quặng khoáng và thiết bị toàn và môi trường'),
+    (164, 4, 'Áp dụng các kĩ thuật khai thác mỏ để khai thác, chiết xuất, vận chuyển và lưu trữ quặng, khoáng sản'),
+    (164, 5, 'Tuân thủ chặt chẽ các qui trình và thiết bị vệ sinh an toàn lao động, giảm thiểu tác động môi trường'),
+    (165, 0, 'Hỗ trợ kĩ thuật liên quan đến nghiên cứu và phát triển các phương pháp để xác định các tính chất của kim loại và hợp kim mới'),
+    (165, 1, 'Hỗ trợ kĩ thuật về các thiết bị tinh luyện và xử lí kim loại'),
+    (165, 2, 'Ứng dụng các nguyên lí luyện kim để chiết xuất kim loại từ quặng thô'),
+    (165, 3, 'Xử lí và tinh chế kim loại đã chiết xuất'),
+    (165, 4, 'Chế biến kim loại theo mục đích sử dụng trong các ngành công nghiệp khác nhau'),
+    (165, 5, 'Kiểm soát tác động môi trường của quá trình luyện kim'),
+    (166, 0, 'Vận hành và giám sát hoạt động của máy móc thiết bị, qui trình theo hướng dẫn vận hành'),
+    (166, 1, 'Kiểm soát quá trình khởi động và tắt'),
+    (166, 2, 'Phát hiện sai lỗi, hỏng hóc và điều chỉnh, sửa chữa'),
+    (166, 3, 'Đọc thông số trên máy đo, đồ thị ở những thời điểm nhất định'),
+    (166, 4, 'Kiểm tra sản phẩm đầu ra và chỉnh máy để sản phẩm đạt yêu cầu kĩ thuật'),
+    (166, 5, 'Bảo dưỡng, bảo trì và vệ sinh máy móc thiết bị'),
+    (166, 6, 'Ghi chép và lưu trữ hồ sơ vận hành'),
+    (166, 7, 'Giám sát công nhân có liên quan'),
+    (167, 0, 'Vận hành bảng điều khiển điện tử hoặc máy tính từ phòng điều khiển trung tâm để giám sát và theo dõi các qui trình vật lí và hóa học của một số thiết bị xử lí'),
+    (167, 1, 'Điều chỉnh các thiết bị, các van, các máy bơm, các thiết bị quản lí và xử lí'),
+    (167, 2, 'Kiểm soát quá trình khởi động và kết thúc, giải quyết sự cố và quản lí các thiết bị xử lí bên ngoài'),
+    (167, 3, 'Xác minh sự cố của các thiết bị, kiểm tra các ống dẫn khí xem có sự rò rỉ, nết gãy và sắp xếp việc duy tu bảo dưỡng'),
+    (167, 4, 'Phân tích các sản phẩm mẫu, thực hiện các bài test, ghi nhận lại dữ liệu và viết các bản ghi sản phẩm'),
+    (167, 5, 'Giám sát các công nhân khác'),
+    (168, 0, 'Khảo sát các địa điểm, kể cả nơi công cộng và doanh nghiệp, nhằm đảm bảo không có nguy cơ môi trường, sức khỏe và an toàn'),
+    (168, 1, 'Lắp đặt và bảo dưỡng các thiết bị giám sát mức độ ô nhiễm như cảm biến đo ô nhiễm khói xe'),
+    (168, 2, 'Thu thập mẫu không khí, đất, nước và các mẫu vật khác để làm xét nghiệm'),
+    (168, 3, 'Dán nhãn, viết nguồn gốc và đảm bảo tính nghiêm túc của mẫu vật chuyển về phòng thí nghiệm'),
+    (168, 4, 'Tiến hành thí nghiệm để xác định và lượng hóa mức độ ô nhiễm của mẫu vật'),
+    (168, 5, 'Làm biểu đồ và báo cáo kết quả thí nghiệm'),
+    (168, 6, 'Trao đổi kết quả và phân tích với khách hàng'),
+    (169, 0, 'Điều tra, kiểm đếm, đo lường các nguồn tài nguyên rừng như cây cối, động vật thực vật hoang dã…'),
+    (169, 1, 'Hỗ trợ lập kế hoạch quản lí và khai thác rừng'),
+    (169, 2, 'Hỗ trợ lập kế hoạch và giám sát xây dựng các tuyến đường trong rừng'),
+    (169, 3, 'Thực hiện và giám sát kĩ thuật các hoạt động lâm nghiệp như ươm trồng và chăm sóc rừng, xác định những cây rừng có thể khai thác và ước lượng khối lượng gỗ khai thác, cắt cành, tỉa ngọn, chặt cây, cưa khúc, tạo sản phẩm thô từ gỗ đã đốn'),
+    (169, 4, 'Tham gia quản lí và chăm sóc rừng, điều phối các hoạt động như khai thác gỗ, phòng chống cháy rừng, kiểm soát bệnh và côn trùng, tỉa bớt cây tạp trong khu rừng trước khi khai thác thương mại'),
+    (169, 5, 'Liên tục theo dõi để phát hiện cháy rừng và tham gia chữa cháy'),
+    (169, 6, 'Đảm bảo tuân thủ các qui định về bảo vệ môi trường, sử dụng tài nguyên, phòng chống hỏa hoạn và tai nạn trong rừng'),
+    (169, 7, '8. Hỗ trợ nghiên cứu lâm nghiệp'),
+    (170, 0, 'Chỉ huy và điều khiển tàu thủy và các tàu chở hàng tương tự trên biển hoặc đường thủy nội địa'),
+    (170, 1, 'Kiểm soát và tham gia vào các hoạt động canh gác trên boong hoặc trên cầu'),
+    (170, 2, 'Điều khiển tàu ra và vào cảng và qua kênh, rạch, eo biển và hải phận khác cần có kiến thức chuyên môn'),
+    (170, 3, 'Đảm bảo an toàn cho hàng hóa bốc dỡ, bảo đảm sự tuân thủ các qui định và qui trình về an toàn của thủy thủ và hành khách'),
+    (170, 4, 'Giám sát kĩ thuật đối với việc duy trì và bảo dưỡng tàu thủy để đảm bảo đồng bộ với các chi tiết hoặc qui định'),
+    (170, 5, 'Áp dụng các kiến thức về qui tắc và thực tiễn liên quan đến hoạt động tàu biển và hàng hải để xác định và giải quyết các vấn đề nảy sinh trong công việc'),
+    (170, 6, 'Đặt hàng đồ dự trữ trên tàu và tuyển dụng thủy thủ theo yêu cầu và duy trì hoạt động tàu'),
+    (170, 7, 'Chuyển và nhận lịch trình và các thông tin khẩn cấp với các trạm trên biển và các tàu khác'),
+    (170, 8, 'Giám sát các thuyền viên khác'),
+    (171, 0, 'Bay và điều khiển máy bay, phương tiện bay theo qui trình hoạt động và kiểm soát đã được thiết lập'),
+    (171, 1, 'Chuẩn bị và trình kế hoạch bay hoặc kiểm tra kế hoạch bay tiêu chuẩn'),
+    (171, 2, 'Kiểm tra các thiết bị cơ khí, điện tử và bảo đảm rằng các dụng cụ và thiết bị kiểm soát hoạt động chính xác'),
+    (171, 3, 'Áp dụng các qui tắc và thực tiễn liên quan đến hoạt động bay để xác định và giải quyết các vấn đề nảy sinh trong công việc'),
+    (171, 4, 'Kiểm tra các lịch trình bảo dưỡng và thực hiện thanh tra phương tiện bay vận hành tốt, được bảo dưỡng và các thiết bị đều sẵn sàng'),
+    (171, 5, 'Kí các chứng chỉ cần thiết và bảo đảm lịch trình bay chính thức'),
+    (171, 6, 'Nhận chỉ thị và giấy phép trước chuyến bay và duy trì liên lạc với giao thông hàng không và kiếm soát không lưu trong suốt chuyến bay'),
+    (172, 0, 'Hướng dẫn và điều khiển phương tiện bay hạ cánh và cất cánh và các thao tác trên mặt đất'),
+    (172, 1, 'Hướng dẫn và kiểm soát phương tiện bay hoạt động trong không phận cho phép'),
+    (172, 2, 'Kiểm tra và phê chuẩn kế hoạch bay'),
+    (172, 3, 'Thông báo cho đội bay và phi hành đoàn về điều kiện thời tiết, các điều kiện hoạt động, kế hoạch bay và giao thông hàng không'),
+    (172, 4, 'Áp dụng các kiến thức về qui tắc và thực tiễn liên quan đến điều khiển giao thông hàng không để xác định và giải quyết các vấn đề nảy sinh trong công việc'),
+    (172, 5, 'Ban hành và tổ chức tình trạng khẩn cấp, các dịch vụ và qui trình nghiên cứu, và giải cứu'),
+    (172, 6, 'Chỉ đạo hoạt động của các phương tiện bay và phương tiện dịch vụ tại hoặc gần đường băng'),
+    (172, 7, 'Duy trì liên lạc qua điện đài và điện thoại với các đài kiểm soát lân cận, các trạm kiểm soát đón khách hay các trung tâm kiểm soát khác, và phối hợp hoạt động của phương tiện bay vào các khu vực lân cận'),
+    (173, 0, 'Bảo trì và vận hành các thiết bị liên quan đến y học hạt nhân bao gồm: Máy camera tia gamma, Máy chụp cắt lớp điện toán (CT scan), Thiết bị chụp cộng hưởng từ (MRI), Các hệ thống máy tính điều khiển'),
+    (173, 1, 'Chuẩn bị và quản lí phóng xạ cho bệnh nhân như dùng chất phóng xạ đánh dấu để xác định bất thường ở các cơ quan trong cơ thể người bệnh'),
+    (173, 2, 'Đọc kết quả chụp quét, viết và chuyển báo cáo kết quả cho bệnh nhân và bác sĩ'),
+    (173, 3, 'Sử dụng hóa chất để điều trị bệnh nhân ung thư'),
+    (173, 4, 'Đảm bảo rằng các chất phóng xạ được lưu trữ và xử lí an toàn'),
+    (173, 5, 'Theo dõi tất cả các thiết bị an toàn'),
+    (173, 6, 'Hỗ trợ nghiên cứu'),
+    (173, 7, 'Hỗ trợ giảng dạy và quản lí sinh viên'),
+    (174, 0, 'Thu thập mẫu xét nghiệm từ cơ thể người bệnh như máu, các mô và các chất bài tiết khác của cơ thể để và làm các xét nghiệm phù hợp'),
+    (174, 1, 'Kiểm tra các mô lấy từ cơ thể người để xác định nguồn gốc và bản chất bệnh bằng cách sử dụng kính hiển vi và các công cụ khác'),
+    (174, 2, 'Chẩn đoán bản chất bệnh trên cơ sở các phân tích hóa học và báo cáo kết quả cho bác sĩ điều trị của bệnh nhân'),
+    (174, 3, 'Lập kế hoạch và tiến hành thí nghiệm để nghiên cứu quá trình bệnh lí, tử vong'),
+    (174, 4, 'Thực hiện khám nghiệm tử thi (khám nghiệm cơ thể người đã chết) để nghiên cứu tình trạng rối loạn của cơ thể hoặc nguyên nhân tử vong'),
+    (175, 0, 'Chuẩn bị phòng mổ bằng việc chuẩn bị các dụng cụ, thiết bị mổ, màn vô trùng, và các giải pháp vô trùng trong phẫu thuật'),
+    (175, 1, 'Điều chỉnh, kiểm tra các thiết bị được sử dụng trong phẫu thuật và đảm bảo tất cả đều hoạt động tốt'),
+    (175, 2, 'Chuẩn bị cho bệnh nhân trước ca phẫu thuật bằng cách rửa, làm sạch và khử trùng khu vực mổ'),
+    (175, 3, 'Bố trí bệnh nhân vào vị trí bàn mổ và phủ màn phẫu thuật vô trùng cho bệnh nhân'),
+    (175, 4, 'Lường trước các yêu cầu của bác sĩ phẫu thuật và đảm bảo rằng họ nhận được dụng cụ phẫu thuật kịp thời trong quá trình phẫu thuật'),
+    (175, 5, 'Giữ miệng vết mổ, cắt chỉ khâu, giúp đếm gạc, kim, vật tư và các công cụ phẫu thuật'),
+    (175, 6, 'Điều khiển máy khử trùng, đèn chiếu sáng, hoặc máy hút dịch'),
+    (176, 0, 'Tư vấn cho cá nhân và cộng đồng về vệ sinh răng miệng, chế độ ăn uống và các biện pháp phòng ngừa bệnh răng miệng'),
+    (176, 1, 'Tiến hành kiểm tra răng, chẩn đoán bệnh và chuyển các ca bệnh khó hơn cho bác sĩ nha khoa khi cần'),
+    (176, 2, 'Làm sạch răng, chuẩn bị phần lỗ hổng ở răng (khoan và làm sạch lỗ khoan) của người bệnh trước khi hàn và thực hiện việc hàn lỗ hổng đó'),
+    (176, 3, 'Thực hiện một số công việc liên quan đến việc làm răng giả và một số phương pháp phẫu thuật nhất định'),
+    (176, 4, 'Chuẩn bị, sát trùng các dụng cụ và thiết bị nha khoa'),
+    (176, 5, 'Chuẩn bị vật liệu nha khoa'),
+    (176, 6, 'Giúp bệnh nhân chuẩn bị kiểm tra và điều trị'),
+    (177, 0, 'Vận động viên'),
+    (177, 1, 'Chơi và tham gia thi đấu một môn thể thao nào đó theo qui chế, luật đã được xây dựng, thể hiện tài năng, năng lực, kĩ thuật và phong cách của mình'),
+    (177, 2, 'Tham gia luyện tập thường xuyên, thực hiện các bài tập riêng để duy trì thể lực và chuyên môn vể môn thể thao mình chơi'),
+    (177, 3, 'Thảo luận với huấn luyện viên để quyết định chiến thuật thi đấu'),
+    (177, 4, 'Đánh giá đối thủ và điều kiện thi đấu'),
+    (177, 5, 'Thảo luận và kí hợp đồng thi đấu cho các câu lạc bộ, các tổ chức ...'),
+    (177, 6, 'Huấn luyện viên:'),
+    (177, 7, 'Xác định điểm mạnh và điểm yếu của vận động viên và đội thể thao'),
+    (177, 8, 'Lập kế hoạch, hướng dẫn và điều chỉnh việc tập luyện'),
+    (177, 9, 'Lập kế hoạch và điều phối tham gia thi đấu'),
+    (177, 10, 'Chuẩn bị và khuyến khích vận động viên thi đấu'),
+    (177, 11, 'Xây dựng chiến lược chiến thuật thi đấu và chỉ đạo vận động viên'),
+    (177, 12, 'Theo dõi và phân tích kĩ thuật, thể lực và phong độ để xác định hướng phát triển'),
+    (177, 13, 'Đại diện tại các cuộc thi đấu thể thao để đảm bảo tiêu chuẩn chất lượng, luật chơi và an toàn'),
+    (177, 14, 'Theo dõi thời gian thi đấu và ghi chép tỉ số, kết quả'),
+    (177, 15, 'Đánh giá thể hiện của đối thủ, việc thực hiện cho điểm, phạt và xác định kết quả'),
+    (178, 0, 'Đào tạo và tổ chức cho cá nhân hoặc nhóm các học sinh của các trường học và các tổ chức giáo dục khác tham gia vào các môn thể thao như thể dục tự do, thể dục dụng cụ và các bài tập thể chất khác để nâng cao sức khỏe, sự cân đối và sự uyển chuyển duyên dáng'),
+    (178, 1, 'Dạy học viên sử dụng tạ, xà và các thiết bị thể dục thể chất khác'),
+    (178, 2, 'Tổ chức, chỉ đạo, hướng dẫn và làm trọng tài cho các trò chơi, thi đấu thể dục thể thao'),
+    (178, 3, 'Tổ chức thi đấu thể thao giữa các lớp, các đơn vị hoặc khu vực'),
+    (178, 4, 'tổ chức các cuộc gặp gỡ liên quan đến thể thao'),
+    (178, 5, 'Giám sát việc bảo trì các dụng cụ thể dục thể thao'),
+    (179, 0, 'Cung cấp các hỗ trợ kĩ thuật liên quan tới nghiên cứu và phát triển các thiết bị viễn thông, hoặc thử nghiệm các vật mẫu'),
+    (179, 1, 'Nghiên cứu các vật liệu kĩ thuật như các bản thiết kế, bản phác họa kĩ thuật để xác định phương pháp làm việc chấp nhận được'),
+    (179, 2, 'Chuẩn bị dự toán chi tiết số lượng và giá cả các nguyên vật liệu và nhân công theo yêu cầu của nhà sản xuất và việc lắp đặt các trang thiết bị, tùy thuộc vào đặc điểm kĩ thuật đã đề ra'),
+    (179, 3, 'Cung cấp việc giám sát kĩ thuật cho việc sản xuất, sử dụng, duy tu và sửa chữa các hệ thống viễn thông nhằm đảm bảo việc vận hành được thỏa đáng và tương thích với các qui định và tiêu chí kĩ thuật đã được đề ra'),
+    (179, 4, 'Áp dụng kiến thức trên nguyên lí và thực tế kĩ thuật viễn thông để xác định và giải quyết các vấn đề phát sinh trong quá trình thực hiện công việc'),
+    (180, 0, 'Phản ứng khi có báo cháy và các báo động khẩn cấp khác như tai nạn trong nhà máy, hàng không, bom mìn…'),
+    (180, 1, 'Kiểm soát và dập tắt lửa bằng các phương tiện và hóa chất dập lửa và các kĩ thuật cứu hỏa phù hợp'),
+    (180, 2, 'Ngăn chặn và hạn chế sự lan tỏa của đám cháy hoặc các chất dễ cháy khi có hoả hoạn hoặc tai nạn'),
+    (180, 3, 'Sơ tán, cứu người mắc kẹt tại địa điểm hỏa hoạn và nơi xảy ra tai nạn'),
+    (180, 4, 'Cứu tài sản, hàng hoá trong và sau hoả hoạn hoặc các tai nạn nghiêm trọng'),
+    (180, 5, 'Tuyên truyền giáo dục cộng đồng về phòng cháy chữa cháy'),
+    (181, 0, 'Xác định chủng loại và số lượng cây trồng'),
+    (181, 1, 'Mua giống, phân bón và vật tư khác'),
+    (181, 2, 'Cho thuê hoặc đầu tư cải tạo đất đai, nhà cửa, động vật làm việc, trang thiết bị, máy móc'),
+    (181, 3, 'Thực hiện các hoạt động canh tác như làm đất, gieo hạt, trồng cây, chăm sóc, thu hoạch'),
+    (181, 4, 'Lưu trữ và sơ chế sản phẩm sau thu hoạch'),
+    (181, 5, 'Nuôi dưỡng, chăm sóc động vật lấy sức kéo và bảo dưỡng các khu trang trại, máy móc thiết bị'),
+    (181, 6, 'Cung cấp và tiếp thị nông sản'),
+    (182, 0, 'Lập kế hoạch và thực hiện các hoạt động cần thiết để chăm sóc, nuôi dưỡng gia súc (ví dụ như trâu, bò, lợn, dê) và gia cầm (ví dụ như gà, vịt, chim)'),
+    (182, 1, 'Phân tích việc sử dụng gia súc, gia cầm vào các mục đích công việc, chơi thể thao, làm thú kiểng hay để lấy thịt, sữa, lông, da và các sản phẩm khác'),
+    (182, 2, 'Bảo quản và sơ chế các sản phẩm gia súc, gia cầm'),
+    (182, 3, 'Cung cấp hoặc bán thường xuyên cho cơ sở bán buôn, doanh nghiệp kinh doanh thương mại hoặc trực tiếp bán ra thị trường.'),
+    (183, 0, 'Đo, cắt, bắt ren, uốn cong, nối lại bằng đoạn nối, lắp, bảo dưỡng và sửa chữa các ống dẫn, vật cố định của hệ thống thoát nước, hệ thống làm nóng, hệ thống cung cấp nước và hệ thống cống rãnh'),
+    (183, 1, 'Lắp các thiết bị ga, máy rửa bát và bình nước nóng, bồn rửa và toa lét sử dụng bằng tay và bằng sức mạnh của dụng cụ'),
+    (183, 2, 'Đặt ống bằng đất sét, xi măng hoặc gang xuống rãnh, mương để tạo thành cống rãnh, ống dẫn nước, đường ống nước hoặc cho các mục đích khác'),
+    (183, 3, 'Xem xét, kiểm tra các hệ thống và ống đã được lắp đặt, sử dụng máy đo áp suất, theo dõi và kiểm tra thủy tĩnh hoặc dùng các phương pháp khác'),
+    (183, 4, 'Thực hiện các công việc có liên quan'),
+    (183, 5, 'Giám sát các công nhân khác'),
+    (184, 0, 'Chế tạo, bảo dưỡng và sửa chữa các loại khuôn (khuôn đúc, khuôn mẫu), khuôn dẫn, mô hình khuôn và các dụng cụ khác. Các loại khuôn và dụng cụ này được sử dụng cùng với các công cụ cầm tay và máy móc để tạo hình sản phẩm'),
+    (184, 1, 'Tra lắp và lắp ráp các bộ phận để tạo ra và sửa chữa khuôn, mô hình khuôn và các dụng cụ khác'),
+    (184, 2, 'Chế tạo và sửa chữa các khuôn mẫu bằng kim loại'),
+    (184, 3, 'Trình bày cách thức tiến hành và điểm qui chiếu trên nguyên vật liệu kim loại để hướng dẫn thợ cắt, tiện, phay và tạo hình sản phẩm'),
+    (185, 0, 'Chế tạo, sửa đổi và sửa chữa các cấu trúc và đồ mộc khác tại xưởng mộc và trên công trường xây dựng'),
+    (185, 1, 'Xây dựng và thay thế các cấu trúc bằng gỗ nặng trên các khu đất đang xây dựng nhà ở'),
+    (185, 2, 'Lắp ráp, sửa đổi đồ đạc cố định của tòa nhà như tường, cửa, khung cửa sổ và cửa ra vào, và ván ô của cửa hoặc tường'),
+    (185, 3, 'Chế tạo và sửa chữa các thiết bị sân khấu cho sân khấu biểu diễn, phim điện ảnh hoặc các chương trình truyền hình'),
+    (185, 4, 'Xây dựng, lắp đặt và sửa chữa các đồ đạc cố định bằng gỗ và đồ đạc trong toa hành khách và các loại tàu xe khác'),
+    (185, 5, 'Giám sát các công nhân khác'),
+    (186, 0, 'Đọc bản thiết kế, bản vẽ hoặc các chi tiết kĩ thuật'),
+    (186, 1, 'Lắp ráp, lắp đặt và sửa chữa các phần hợp thành của hệ thống điều hòa không khí và hệ thống máy lạnh'),
+    (186, 2, 'Kết nối hệ thống ống dẫn và các thiết bị bằng việc bắt bu-lông, ghép bằng đinh tán, hàn lại'),
+    (186, 3, 'Kiểm tra hệ thống, chẩn đoán lỗi, và thực hiện các công việc bảo dưỡng thường xuyên'),
+    (187, 0, 'Hàn các phần kim loại bằng lửa khí gas hoặc hồ quang điện, nhiệt nhôm hoặc các phương pháp khác'),
+    (187, 1, 'Vận hành máy hàn bằng điện trở'),
+    (187, 2, 'Sử dụng đèn khò để chế tạo và sửa chữa lót bọc chì, đường ống, đáy và các dụng cụ chì khác'),
+    (187, 3, 'Hàn đồng các phần kim loại với nhau'),
+    (187, 4, 'Cắt miếng kim loại bằng lửa khí gas hoặc hồ quang điện'),
+    (187, 5, 'Hàn các miếng kim loại bằng mối hàn tay'),
+    (188, 0, 'Sử dụng các kĩ thuật khác nhau như kĩ thuật tạo hình, ép nén, gia công kim loại để tạo ra và lắp ráp thân tàu'),
+    (188, 1, 'Lắp ráp và lắp đặt tất cả các phụ kiện bên trong con tàu.'),
+    (189, 0, 'Nung kim loại trong lò rèn, chế tạo và sửa chữa các sản phẩm bằng cách vẽ, uốn, cắt, đóng búa các sản phẩm kim loại đó'),
+    (189, 1, 'Tạo hình kim loại đã được nung nóng thành các hình dạng cụ thể bằng tay hoặc bằng búa'),
+    (189, 2, 'Tạo hình kim loại không nung nóng thành các hình dạng cụ thể bằng các kĩ thuật nguội như uốn, nắn, cắt, quấn, tán, gò, hàn, đục, chặt, cưa cắt, dũa gọt, khoan, ren, cạo, mài…'),
+    (190, 0, 'Lắp ráp, kiểm tra, thử nghiệm và sửa chữa động cơ xe ô tô và các loại xe có động cơ khác'),
+    (190, 1, 'Thay thế các bộ phận hoặc hoàn thiện động cơ'),
+    (190, 2, 'Lắp ráp, kiểm tra, điều chỉnh, tháo dỡ, khôi phục và thay thế bộ phận hỏng hóc của các loại xe ô tô'),
+    (190, 3, 'Lắp đặt hoặc điều chỉnh động cơ, phanh và điều chỉnh tay lái hoặc các bộ phận khác của các loại xe ô tô'),
+    (191, 0, 'Thực hiện các biện pháp an toàn như kiểm soát đường dài và độ sâu của việc lặn'),
+    (191, 1, 'Kiểm tra và bảo trì thiết bị lặn'),
+    (191, 2, 'Lặn xuống nước với sự hỗ trợ của người trên bờ, liên lạc với người trên bờ trong khi ở dưới nước bằng các tín hiệu hoặc điện thoại đặc biệt'),
+    (191, 3, 'Làm việc dưới nước để thực hiện các công việc cụ thể (ví dụ sửa chữa các cấu kiện, sửa chữa nhỏ trên thân tàu, loại bỏ các chướng ngại vật dưới nước, khoan lỗ nổ mìn, thu thập mẫu đất, sinh vật biển, các mảnh vỡ, phục hồi vật liệu, chụp ảnh)'),
+    (191, 4, 'Báo cáo kết quả việc lặn dưới nước và điều kiện môi trường lặn'),
+    (192, 0, 'Tham gia một trong các quân chủng như là một sĩ quan'),
+    (192, 1, 'Tham dự và vượt qua các kì thi trong các chuyên ngành cụ thể để được thăng tiến'),
+    (192, 2, 'Phát triển kĩ năng để lãnh đạo và chỉ huy lính'),
+    (193, 0, 'Thiết kế trồng rừng'),
+    (193, 1, 'Nhân giống cây trồng'),
+    (193, 2, 'Trồng và chăm sóc rừng'),
+    (193, 3, 'Nuôi dưỡng và phục hồi rừng'),
+    (193, 4, 'Quản lý bảo vệ rừng'),
+    (193, 5, 'Thiết kế khai thác gỗ'),
+    (193, 6, 'Khai thác gỗ và tre nứa'),
+    (193, 7, 'Trồng cây ăn quả'),
+    (193, 8, 'Trồng cây công nghiệp'),
+    (193, 9, 'Trồng và thu hoạch một số lâm sản ngoài gỗ'),
+    (193, 10, 'Trồng hoa và cây cảnh'),
+    (193, 11, 'Nông lâm kết hợp'),
+    (193, 12, 'Khuyến nông lâm'),
+    (193, 13, 'Kinh doanh sản xuất nông lâm nghiệp'),
+    (194, 0, 'Xác định thủy sinh vật'),
+    (194, 1, 'Xác định một số chỉ tiêu sinh học ở cá'),
+    (194, 2, 'Khảo sát, thiết kế công trình nuôi thuỷ sản'),
+    (194, 3, 'Chuẩn bị công trình nuôi'),
+    (194, 4, 'Sản xuất và sử dụng thức ăn trong nuôi'),
+    (194, 5, 'Quản lý chất lượng nước trong nuôi'),
+    (194, 6, 'Phòng và trị bệnh thủy sản'),
+    (194, 7, 'Thực hiện an toàn lao động trong nuôi trồng'),
+    (194, 8, 'Sản xuất giống cá, tôm, cua…'),
+    (194, 9, 'Nuôi trồng các loại thủy sản nước ngọt, nước nợ, nước mặn'),
+    (194, 10, 'Vận chuyển động vật thuỷ sản'),
+    (195, 0, 'Xây dựng, hoàn thiện các công trình từ khâu đào móng đến hoàn thiện'),
+    (195, 1, 'lắp đặt các thiết bị cơ bản của công trình như cửa, cầu thang'),
+    (195, 2, 'nhiệm vụ của người thợ xây rất đa dạng, từ những việc đơn giản như trộn hồ, quét vôi, xây, trát… đến các công việc phức tạp hơn như khả năng đọc bản vẽ, dự toán…tính toán đến các yếu tố ảnh hưởng đến công trình xây dựng như độ lún, độ chịu lực, tính toán nguyên nhiên vật liệu phù hợp với công trình….'),
+    (196, 0, 'Nhóm hoàn thiện công trình xây dựng gồm các hoạt động liên quan tới việc hoàn thiện hoặc kết thúc công trình như: Trát vữa bên trong và bên ngoài các công trình nhà và công trình xây dựng khác, bao gồm các nguyên liệu đánh bóng, Lắp đặt cửa ra vào, cửa sổ, khung cửa ra vào, khung cửa sổ bằng gỗ hoặc bằng những vật liệu khác, Lắp đặt thiết bị, đồ dùng nhà bếp, cầu thang và những hoạt động tương tự, Lắp đặt thiết bị nội thất'),
+    (196, 1, 'Hoạt động hoàn thiện bên trong công trình như: Làm trần, ốp gỗ tường, hoặc vách ngăn di chuyển được'),
+    (196, 2, 'Xếp, lợp, treo hoặc lắp đặt trong các toà nhà hoặc các công trình khác như: Lát sàn hoặc tường bằng gạch, bê tông, đá xẻ, gạch gốm'),
+    (196, 3, 'Lót ván sàn và các loại phủ sàn bằng gỗ khác'),
+    (196, 4, 'Thảm và tấm phủ sơn lót sàn, bao gồm bằng cao su và nhựa'),
+    (196, 5, 'Lát sàn hoặc ốp tường bằng gạch không nung, đá hoa, đá hoa cương (granite), đá phiến… Giấy dán tường'),
+    (196, 6, 'Sơn bên ngoài và bên trong công trình nhà'),
+    (197, 0, 'Tính toán số lượng nguyên vật liệu cần thiết dựa vào các số liệu đo đạc bề mặt sơn và yêu cầu sơn'),
+    (197, 1, 'Ước tính tổng chi phí của công việc bằng cách ước tính chi phí của nguyên vật liệu và thời gian cần thiết để hoàn thành công việc'),
+    (197, 2, 'Lựa chọn và mua các vật liệu, công cụ, chất liệu sơn, loại sơn và màu sơn phù hợp cho bề mặt cần sơn, phụ thuộc vào độ bền, dễ xử lí, phương thức sử dụng và mong muốn của khách hàng'),
+    (197, 3, 'Xử lí các bề mặt trước khi sơn với dầu, nhựa thông làm loãng sơn, chất loại bỏ nấm mốc để đảm bảo sơn bám, khi sơn lên sẽ đẹp'),
+    (197, 4, 'Pha trộn các màu sơn, chất nhuộm, vecni với dầu và các chất phụ gia làm loãng sơn hay làm khô để có được hỗn hợp sơn như mong muốn'),
+    (197, 5, 'Bảo vệ các bề mặt trong khi sơn bằng cách dùng băng dính hoặc vải để che phần không muốn bị sơn dính vào'),
+    (197, 6, 'Dọn sạch khu vực sau khi sơn….'),
+    (198, 0, 'Lắp đặt hệ thống mạng điện sản xuất và sinh hoạt'),
+    (198, 1, 'Lắp đặt thiết bị và đồ dùng điện'),
+    (198, 2, 'Vận hành, bảo trì, bảo dưỡng, và sửa chữa mạng điện, thiết bị và đồ dùng điện'),
+    (199, 0, 'Lắp đặt hệ thống thiết bị điện tử viễn thông'),
+    (199, 1, 'Vận hành, bảo trì, bảo dưỡng, và sửa chữa trong các đài, trạm viễn thông'),
+    (199, 2, 'Lắp đặt các mạng viễn thông'),
+    (199, 3, 'Tư vấn lắp đặt hệ thống viễn thôn'),
+    (200, 0, 'Hiểu các tính chất của chất liệu lắp ráp'),
+    (200, 1, 'Lắp ráp và hoàn thiện các sản phẩm theo yêu cầu của từng loại hình công việc như mô tả nghề nêu trên');
+INSERT INTO job_work_areas (job_id, sort_order, work_area) VALUES
+    (151, 0, 'Các công ty kĩ thuật'),
+    (151, 1, 'Các doanh nghiệp tham gia vào việc nghiên cứu, thiết kế và sản xuất robot, sản xuất tự động hóa, thị giác máy tính và các kĩ thuật kiểm tra tự động'),
+    (151, 2, 'Bộ phận nghiên cứu và thiết kế của các doanh nghiệp ô tô'),
+    (152, 0, 'Các tàu thuyền trên biển'),
+    (152, 1, 'Làm việc trên bờ đảm nhận việc bảo trì, bảo dưỡng tàu, cảng và các phương tiện vận chuyển hàng hoá'),
+    (152, 2, 'Các công ty thiết kế và công nghiệp tàu thủy'),
+    (152, 3, 'Các cơ quan nghiên cứu liên quan đến việc phát triển các dụng cụ thiết bị kĩ thuật hàng hải hiệu quả'),
+    (152, 4, 'Các cơ quan Nhà nước về vận tải hàng hải, công nghiệp tàu thủy'),
+    (153, 0, 'Các cơ quan thuộc Bộ công an'),
+    (153, 1, 'Sở, phòng cảnh sát'),
+    (153, 2, 'Trại giam'),
+    (154, 0, 'Các nhà hát, đoàn ca nhạc, nhạc vũ kịch'),
+    (154, 1, 'Các nhà văn hóa'),
+    (154, 2, 'Các nhóm múa, nhóm nhảy'),
+    (154, 3, 'Các đài truyền hình'),
+    (154, 4, 'Các hãng phim'),
+    (154, 5, 'Hành nghề tự do'),
+    (155, 0, 'Các công ty xây dựng'),
+    (155, 1, 'Các phòng quản lí nhà đất - đô thị quận, huyện, phường, xã hoặc các ban dự án xây dựng công trình'),
+    (155, 2, 'Tự kinh doanh độc lập'),
+    (156, 0, 'Các cơ quan quản lí thủy lợi'),
+    (156, 1, 'Các công ty xây dựng công trình thủy lợi'),
+    (156, 2, 'Các công ty cấp và thoát nước'),
+    (156, 3, 'Các trang trại, các doanh nghiệp nông nghiệp'),
+    (156, 4, 'Các nhà máy thủy điện'),
+    (157, 0, 'Các doanh nghiệp sản xuất phần cứng máy tính, điện thoại, thiết bị viễn thông'),
+    (157, 1, 'Các doanh nghiệp cung cấp dịch vụ bảo trì phần cứng'),
+    (158, 0, 'Tất cả các nhà máy phát điện'),
+    (158, 1, 'Tất cả công ty truyền tải điện'),
+    (159, 0, 'Các nhà máy phát điện'),
+    (159, 1, 'Các công ti, nhà máy, phân xưởng sản xuất có sử dụng tua-bin'),
+    (160, 0, 'Các doanh nghiệp lắp ráp, kinh doanh thiết bị CNTT'),
+    (160, 1, 'Các doanh nghiệp truyền thông, hệ thống thông tin và mạng máy tính'),
+    (160, 2, 'Các dịch vụ lắp ráp, sửa chữa máy tính và mạng'),
+    (160, 3, 'Chuyên viên CNTT trong các doanh nghiệp'),
+    (160, 4, 'Ngành khoa học máy tính'),
+    (160, 5, 'Ngành công nghệ kĩ thuật phần cứng máy tính'),
+    (161, 0, 'Các doanh nghiệp vận chuyển đường thủy bao gồm cả doanh nghiệp Nhà nước và doanh nghiệp tư nhân'),
+    (162, 0, 'Tất cả ngành công nghiệp'),
+    (162, 1, 'Các doanh nghiệp cung cấp các loại máy móc thiết bị khác nhau cho công nghiệp và gia dụng'),
+    (162, 2, 'Mở xưởng cơ khí sửa chữa riêng'),
+    (163, 0, 'Các đơn vị giao thông công cộng'),
+    (163, 1, 'Ngành đường sắt'),
+    (163, 2, 'Các doanh nghiệp vận tải đường bộ như vận tải ô tô, xe khách'),
+    (163, 3, 'Các doanh nghiệp vận tải đường thuỷ nội địa trên sông, hồ, kênh đào… bằng tàu, thuyền, phà và xuồng'),
+    (163, 4, 'Các doanh nghiệp vận tải hàng hóa và giao nhận hàng nội địa'),
+    (164, 0, 'Các doanh nghiệp khai thác mỏ, khoáng sản, dầu khí'),
+    (164, 1, 'Các doanh nghiệp khảo sát khoáng sản'),
+    (164, 2, 'Các cơ quan quản lí Nhà nước về khai thác khoáng sản'),
+    (165, 0, 'Các công ty bất động sản'),
+    (165, 1, 'Tự mở công ty bất động sản'),
+    (166, 0, 'Tất cả các ngành công, nông, lâm nghiệp đều đòi hỏi phải có người vận hành các loại máy khác nhau'),
+    (167, 0, 'Các nhà máy lọc dầu và khí thiên nhiên'),
+    (167, 1, 'Các nhà máy sản xuất sản phẩm từ dầu khí'),
+    (168, 0, 'Các cơ quan BVMT'),
+    (168, 1, 'Trong bộ phận lập kế hoạch và thực hiện kế hoạch BVMT của các công ty lớn'),
+    (168, 2, 'Các viện nghiên cứu, phòng thí nghiệm liên quan đến các vấn đề về môi trường'),
+    (169, 0, 'Các cơ quan kiểm lâm'),
+    (169, 1, 'Các trại ươm cây giống'),
+    (169, 2, 'Các cơ quan nghiên cứu và thực nghiệm về lâm nghiệp'),
+    (169, 3, 'Các cơ quan quản lí Nhà nước ở địa phương có rừng'),
+    (170, 0, 'Các tàu chở hàng, chở dầu, chở hành khách và tàu thuyền khác'),
+    (170, 1, 'Các công ty vận tải đường biển và đường sông nội địa và quốc tế'),
+    (170, 2, 'Các cảng biển, cảng sông'),
+    (171, 0, 'Quân đội'),
+    (171, 1, 'Các hãng hàng không dân dụng'),
+    (171, 2, 'Các công ty bay dịch vụ'),
+    (171, 3, 'Các tổ chức, cá nhân có máy bay riêng'),
+    (172, 0, 'Đài chỉ huy các sân bay dân sự và quân sự'),
+    (172, 1, 'Trung tâm kiểm soát không lưu và tiếp cận đường dài'),
+    (173, 0, 'Các bệnh viện, cơ sở y tế'),
+    (173, 1, 'Các phòng thí nghiệm y tế'),
+    (173, 2, 'Các bệnh viện đào tạo thực hành'),
+    (173, 3, 'Các trung tâm nghiên cứu'),
+    (174, 0, 'Các phòng thí nghiệm'),
+    (174, 1, 'Các bệnh viện, trung tâm y tế, cơ sở chăm sóc sức khỏe'),
+    (174, 2, 'Các trung tâm nghiên cứu'),
+    (174, 3, 'Nhà xác'),
+    (174, 4, 'Bộ phận pháp y của công an'),
+    (175, 0, 'Các doanh nghiệp dầu khí Nhà nước và tư nhân'),
+    (175, 1, 'Các trung tâm, viện nghiên cứu'),
+    (175, 2, 'Giảng dạy tại các trường đại học, cao đẳng, trung học'),
+    (175, 3, 'Các cơ quan Nhà nước quản lí ngành dầu khí'),
+    (175, 4, 'Các công ty tư vấn kĩ thuật'),
+    (176, 0, 'Bệnh viện'),
+    (176, 1, 'Phòng khám nha khoa, răng hàm mặt'),
+    (176, 2, 'Các cơ sở kĩ thuật phục hình răng'),
+    (177, 0, 'Các đội tuyển thể thao'),
+    (177, 1, 'Các trung tâm huấn luyện thể thao'),
+    (177, 2, 'Các nhà văn hóa-thể thao'),
+    (177, 3, 'Các cơ sở giáo dục – đào tạo'),
+    (177, 4, 'Các cơ quan quản lí văn hóa-thể thao'),
+    (178, 0, 'Các trường phổ thống, trung cấp, cao đẳng, đại học'),
+    (178, 1, 'Các tổ chức giáo dục đào tạo'),
+    (178, 2, 'Các câu lạc bộ sức khỏe'),
+    (178, 3, 'Phòng tập thể dục'),
+    (178, 4, 'Trung tâm thể dục thể thao'),
+    (178, 5, 'Bệnh viện'),
+    (178, 6, 'Các khu nghỉ dưỡng, khách sạn lớn'),
+    (179, 0, 'Các công ty viễn thông Nhà nước và tư nhân'),
+    (179, 1, 'Các công ty dịch vụ điện thoại di động'),
+    (179, 2, 'Các doanh nghiệp vận tải hàng hải'),
+    (179, 3, 'Các doanh nghiệp vận tải hàng không'),
+    (179, 4, 'Các cơ quan quản lí Nhà nước về bưu chính viễn thông'),
+    (180, 0, 'Lực lượng cảnh sát cứu hỏa'),
+    (180, 1, 'Lục quân, hải quân và không quân'),
+    (180, 2, 'Các cơ quan quản lí phòng chống cháy nổ'),
+    (180, 3, 'Bộ phận an toàn cháy nổ của các cơ quan, doanh nghiệp'),
+    (180, 4, 'Bộ phận cứu hỏa của các sân bay, cảng biển, khu công nghiệp'),
+    (180, 5, 'Các doanh nghiệp vận chuyển các vật liệu dễ cháy'),
+    (181, 0, 'Lao động sản xuất tại các trang trại, nông trường chuyên canh một loại cây trồng, trồng cây hỗn hợp, hoặc trồng trọt kết hợp chăn nuôi, chế biến'),
+    (181, 1, 'Lao động quản lí trang trại, nông trường về kĩ thuật hoặc tài chính, như tính toán chi phí, định giá sản phẩm và ghi chép sổ sách'),
+    (181, 2, 'Lao động thu hoạch, chế biến, vận chuyển hoặc nhân viên tiếp thị, bán hàng tại các cơ sở, doanh nghiệp thu mua, chế biến, vận chuyển và kinh doanh nông sản'),
+    (181, 3, 'Tự tạo việc làm tại gia đình'),
+    (182, 0, 'Các trang trại'),
+    (182, 1, 'Trang trại sản xuất sữa'),
+    (182, 2, 'Các phòng khám thú y'),
+    (182, 3, 'Các công ty bán sản phẩm gia súc'),
+    (182, 4, 'Các viện nghiên cứu'),
+    (183, 0, 'Các công ty xây dựng'),
+    (183, 1, 'Các công ty lắp đặt, sửa chữa'),
+    (183, 2, 'Nhà máy lọc dầu'),
+    (183, 3, 'Tự mở cơ sở hoặc hành nghề tư nhân'),
+    (184, 0, 'Cửa hàng bán máy móc'),
+    (184, 1, 'Các doanh nghiệp sản xuất, chế tạo khuôn mẫu, chế tạo máy'),
+    (184, 2, 'Phòng thí nghiệm nghiên cứu phát triển'),
+    (185, 0, 'Các công ty gia công, chế biến gỗ và lâm sản, thiết kế nội thất'),
+    (185, 1, 'Các công ty kinh doanh đồ gỗ'),
+    (185, 2, 'Các doanh nghiệp xây dựng dân dụng'),
+    (185, 3, 'Các xưởng mộc gia đình'),
+    (185, 4, 'Tự mở cơ sở hoặc hành nghề tư nhân'),
+    (186, 0, 'Làm việc trong các nhà máy có hệ thống thiết bị lạnh, kho lạnh và điều hòa không khí như: nhà máy thủy sản, đông lạnh, chế biến thực phẩm, đường, giấy, dệt…'),
+    (186, 1, 'Các công ty cơ điện lạnh'),
+    (186, 2, 'Các cao ốc văn phòng, nhà hàng khách sạn lớn, các siêu thị, cảng, sân bay… có hệ thống điều hòa lớn'),
+    (186, 3, 'Các cửa hàng thiết bị lạnh và điều hòa không khí'),
+    (186, 4, 'Tự tạo việc làm'),
+    (187, 0, 'Các doanh nghiệp sản xuất chế tạo'),
+    (187, 1, 'Các công ty xây dựng'),
+    (187, 2, 'Tự mở cơ sở hoặc hành nghề tư nhân'),
+    (188, 0, 'Các doanh nghiệp, xưởng đóng tàu'),
+    (188, 1, 'Các doanh nghiệp vận tải đường biển'),
+    (188, 2, 'Các bến cảng'),
+    (189, 0, 'Các công ty xây dựng'),
+    (189, 1, 'Các doanh nghiệp chế tạo máy móc thiết bị, sản phẩm kim loại'),
+    (189, 2, 'Các doanh nghiệp thiết kế máy móc thiết bị, sản phẩm'),
+    (189, 3, 'Các doanh nghiệp luyện kim'),
+    (189, 4, 'Các doanh nghiệp đóng tàu'),
+    (190, 0, 'Ngành ô tô xe máy'),
+    (190, 1, 'Xưởng cơ khí của các đơn vị vận tải đường bộ'),
+    (190, 2, 'Các đơn vị, bộ phận vận tải của quân đội, các tổ chức bán quân sự và lực lượng vũ trang khác'),
+    (190, 3, 'Các doanh nghiệp có đội xe riêng'),
+    (190, 4, 'Các ga-ra tư nhân'),
+    (190, 5, 'Tự mở cơ sở hoặc hành nghề tư nhân'),
+    (191, 0, 'Các doanh nghiệp khai thác mỏ'),
+    (191, 1, 'Các doanh nghiệp xây dựng'),
+    (191, 2, 'Các doanh nghiệp cung cấp dịch vụ cứu hộ và khôi phục sự cố'),
+    (191, 3, 'Các đơn vị nghiên cứu về biển'),
+    (191, 4, 'Giàn khoan dầu ngoài khơi'),
+    (191, 5, 'Các doanh nghiệp vận tải bằng tàu thủy'),
+    (193, 0, 'Các đơn vị trong lĩnh vực lâm nghiệp'),
+    (194, 0, 'Có thể làm việc theo quy mô hộ gia đình, trang trại...'),
+    (194, 1, 'Các doanh nghiệp, nghiệp đoàn về nuôi trồng, đánh bắt thủy sản'),
+    (195, 0, 'Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp...'),
+    (195, 1, 'Các doanh nghiệp chuyên về xây dựng….'),
+    (196, 0, 'Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp...'),
+    (196, 1, 'Các doanh nghiệp chuyên về xây dựng….'),
+    (197, 0, 'Làm việc tại các công trình xây dựng dân dụng hoặc công nghiệp, doanh nghiệp sản xuất để làm việc ở các vị trí chuyên về sơn...'),
+    (197, 1, 'Các doanh nghiệp chuyên về sơn….'),
+    (199, 0, 'Làm việc tại các đài, trạm viễn thông'),
+    (199, 1, 'Các doanh nghiệp kinh doanh về viễn thông'),
+    (200, 0, 'Các doanh nghiệp lắp ráp'),
+    (200, 1, 'Các xưởng sản xuất, lắp ráp sản phẩm các loại');
+
+-- Commit transaction
+COMMIT;
+SET AUTOCOMMIT = 1;
+
+-- Verify insertion
+SELECT 
+    (SELECT COUNT(*) FROM job_specializations) as total_specializations,
+    (SELECT COUNT(*) FROM job_tasks) as total_tasks,
+    (SELECT COUNT(*) FROM job_work_areas) as total_work_areas;
@@ -0,0 +1,315 @@
+-- =====================================================
+-- BỘ CÂU HỎI DỰNG SẴN (question_pools)
+-- =====================================================
+-- Tạo bởi: create_sql_migrate_questions.py
+-- 100 bộ cho mỗi số câu/nhóm (5, 10, 20); mỗi bộ cân bằng R/I/A/S/E/C và đã xáo trộn
+-- question_ids là question_id của bảng questions: chạy sau khi đã nạp câu hỏi
+-- =====================================================
+
+START TRANSACTION;
+
+DELETE FROM question_pools;
+
+INSERT INTO question_pools (questions_per_group, pool_number, question_ids) VALUES
+    (5, 0, '["108","514","34","448","70","591","468","463","563","Q007","373","Q051","99","510","98","368","75","111","Q022","643","224","76","53","570","457","441","376","431","530","578"]'),
+    (5, 1, '["71","348","Q019","Q044","455","508","324","Q052","475","598","68","119","628","403","294","303","594","408","Q045","399","1","20","343","55","273","481","Q059","630","183","7"]'),
+    (5, 2, '["533","293","486","631","297","517","118","Q027","158","558","Q028","497","372","151","581","312","412","287","178","557","346","230","Q054","212","371","632","433","467","175","422"]'),
+    (5, 3, '["439","350","540","515","229","148","242","Q006","487","259","522","375","77","197","606","299","338","64","79","309","123","410","255","488","637","427","461","541","233","127"]'),
+    (5, 4, '["210","641","203","110","74","662","295","576","613","566","327","357","161","549","251","334","383","505","518","32","49","132","442","520","479","265","157","Q018","236","554"]'),
+    (5, 5, '["206","664","331","185","476","63","81","450","635","569","617","656","491","200","214","113","250","351","138","495","Q002","163","480","575","83","615","147","190","316","146"]'),
+    (5, 6, '["39","610","Q033","402","384","213","337","189","650","51","325","193","140","238","228","160","286","114","261","Q049","511","129","121","107","367","310","304","447","201","326"]'),
+    (5, 7, '["527","648","145","459","634","137","296","599","278","629","387","663","Q010","500","307","181","409","608","647","344","Q039","91","341","390","217","509","44","525","Q057","323"]'),
+    (5, 8, '["41","516","454","60","87","262","191","Q034","320","535","25","258","464","141","506","58","395","587","618","619","564","556","169","Q037","5","544","274","284","536","317"]'),
+    (5, 9, '["239","241","283","597","Q031","Q024","252","332","149","Q014","282","272","30","374","666","658","379","227","Q017","50","15","504","186","625","513","12","577","607","223","313"]'),
+    (5, 10, '["601","345","418","116","257","270","484","174","135","652","279","595","639","11","Q030","19","166","72","237","377","583","298","354","247","292","231","385","266","109","136"]'),
+    (5, 11, '["507","Q053","405","436","359","340","416","226","347","526","537","521","562","24","10","59","164","590","472","4","290","56","667","Q009","382","42","355","Q004","65","413"]'),
+    (5, 12, '["Q056","Q025","496","Q013","21","636","234","281","471","268","550","449","16","361","48","393","168","Q008","388","155","221","115","156","Q043","531","216","199","17","669","92"]'),
+    (5, 13, '["222","9","440","36","640","638","474","244","Q005","644","490","411","219","645","40","453","Q046","579","465","572","642","329","425","318","565","417","365","543","288","38"]'),
+    (5, 14, '["626","392","126","616","176","328","646","671","605","596","314","86","493","548","651","124","386","220","14","249","84","473","670","560","567","539","353","275","202","437"]'),
+    (5, 15, '["62","100","333","267","415","8","69","Q029","369","280","568","263","33","254","43","28","381","534","235","620","370","300","444","426","172","668","592","171","339","319"]'),
+    (5, 16, '["Q026","289","96","291","561","215","Q042","584","22","311","150","524","Q003","46","542","512","Q035","182","240","559","391","445","6","Q016","57","Q032","406","256","586","612"]'),
+    (5, 17, '["94","23","321","Q023","196","389","378","462","429","18","394","420","248","264","653","Q047","302","446","421","170","Q036","593","342","529","120","103","78","26","112","432"]'),
+    (5, 18, '["173","35","205","660","460","330","82","435","523","73","469","3","Q021","31","546","218","285","Q038","528","659","614","401","424","501","192","627","142","600","498","85"]'),
+    (5, 19, '["654","209","396","Q060","269","585","364","207","356","404","276","66","483","582","80","456","553","655","502","131","423","179","88","571","485","Q050","45","29","104","159"]'),
+    (5, 20, '["609","398","335","187","414","352","604","407","117","271","494","349","308","482","208","580","162","336","555","139","315","397","133","458","452","125","Q040","184","47","503"]'),
+    (5, 21, '["143","245","128","466","519","363","188","306","573","434","647","499","244","419","13","Q058","657","Q055","380","79","671","665","571","602","322","611","177","Q011","89","492"]'),
+    (5, 22, '["52","76","153","301","29","345","93","225","305","438","232","Q058","122","366","Q025","589","448","464","97","616","477","532","25","358","134","478","538","37","376","552"]'),
+    (5, 23, '["504","23","547","578","Q033","95","Q060","425","90","67","166","274","361","4","130","Q020","53","Q023","Q015","180","261","360","568","622","243","Q001","603","451","489","80"]'),
+    (5, 24, '["204","588","167","140","Q001","463","402","656","452","362","57","512","194","260","54","411","620","649","Q022","486","154","556","185","428","131","144","443","596","Q012","9"]'),
+    (5, 25, '["405","59","480","Q021","198","115","277","66","48","Q029","633","50","294","551","106","400","619","410","2","203","597","612","174","636","105","430","61","455","173","149"]'),
+    (5, 26, '["151","147","419","424","557","435","392","558","206","624","521","Q036","565","344","172","510","150","97","1","292","470","354","246","537","253","648","643","538","545","184"]'),
+    (5, 27, '["276","355","58","Q040","100","312","233","338","559","399","Q041","359","334","320","442","Q039","102","574","256","161","631","27","321","389","518","661","309","262","522","642"]'),
+    (5, 28, '["266","211","16","528","316","380","474","623","Q027","Q020","621","31","401","482","270","599","156","422","343","113","Q048","Q008","101","469","570","423","326","299","17","204"]'),
+    (5, 29, '["610","122","272","227","391","71","662","542","554","416","551","532","350","Q005","535","658","236","322","121","315","271","137","594","183","7","118","164","665","645","479"]'),
+    (5, 30, '["536","499","543","280","Q034","547","181","305","Q050","615","24","143","27","Q011","629","304","34","99","235","443","176","520","119","Q003","323","331","103","47","383","659"]'),
+    (5, 31, '["379","148","508","230","255","488","167","302","141","291","252","349","132","492","67","566","541","6","289","126","476","472","374","330","229","307","500","Q046","222","198"]'),
+    (5, 32, '["277","491","192","81","634","663","194","313","Q009","531","Q018","318","Q010","327","265","651","42","187","Q032","109","224","234","655","388","86","257","546","282","130","310"]'),
+    (5, 33, '["591","489","459","177","Q057","431","470","Q026","607","288","Q037","555","413","336","449","Q042","248","269","439","228","397","446","471","Q015","212","85","93","341","283","179"]'),
+    (5, 34, '["409","515","191","408","77","581","Q024","249","278","337","104","107","157","562","223","468","263","592","259","146","220","215","96","Q031","544","483","386","123","171","398"]'),
+    (5, 35, '["462","221","632","163","503","390","505","606","381","481","393","563","652","473","484","105","579","585","83","168","208","68","55","365","153","406","Q030","138","188","108"]'),
+    (5, 36, '["112","Q041","545","74","332","339","84","668","644","40","Q047","38","128","268","65","135","396","290","526","617","598","519","529","Q035","33","117","Q051","12","420","286"]'),
+    (5, 37, '["125","297","237","506","114","353","593","87","395","238","120","Q055","199","646","56","372","314","225","216","232","461","602","569","210","509","384","513","14","561","352"]'),
+    (5, 38, '["145","78","549","110","30","375","196","430","417","62","154","72","Q019","41","Q056","98","630","356","189","426","403","319","493","514","15","281","394","437","421","275"]'),
+    (5, 39, '["296","54","576","485","456","129","497","20","583","335","61","595","253","611","200","95","465","159","308","111","Q043","434","346","340","516","590","254","614","333","75"]'),
+    (5, 40, '["450","347","180","404","258","567","Q044","26","490","162","429","51","69","311","35","89","357","378","317","613","260","329","231","213","524","530","Q052","653","Q016","186"]'),
+    (5, 41, '["366","279","649","387","298","553","182","377","Q053","82","560","440","587","589","Q028","209","447","169","285","19","664","348","498","207","588","217","73","94","10","433"]'),
+    (5, 42, '["92","264","22","219","267","205","503","Q002","461","155","525","116","284","569","460","60","412","626","Q059","540","8","88","139","577","Q006","Q054","258","343","639","178"]'),
+    (5, 43, '["90","438","638","Q048","566","Q013","43","58","302","133","548","370","261","494","601","293","201","407","507","3","5","633","245","641","51","432","45","11","124","197"]'),
+    (5, 44, '["454","Q007","661","669","17","666","590","214","91","539","362","286","193","358","Q038","657","552","622","217","Q053","347","Q028","534","63","373","667","405","9","57","640"]'),
+    (5, 45, '["467","323","218","103","127","466","637","295","235","550","501","18","298","85","414","191","670","241","301","533","400","Q055","16","325","324","419","114","527","36","190"]'),
+    (5, 46, '["608","328","247","Q052","671","361","350","477","Q030","496","548","72","156","115","101","561","650","609","474","523","618","445","233","82","511","70","475","79","Q034","582"]'),
+    (5, 47, '["531","273","288","242","342","568","Q004","49","236","142","137","Q032","605","26","385","449","409","251","444","243","73","Q017","447","575","517","283","573","565","471","229"]'),
+    (5, 48, '["316","654","458","478","281","617","603","587","356","158","495","13","635","359","170","28","189","69","Q060","329","52","322","421","39","589","140","537","351","360","367"]'),
+    (5, 49, '["67","46","176","458","134","455","452","358","188","21","303","Q057","502","294","Q045","642","Q027","Q039","136","113","428","579","628","109","606","2","464","560","Q014","390"]'),
+    (5, 50, '["648","297","81","65","64","352","251","369","197","546","564","99","584","306","77","15","Q033","144","223","623","Q007","32","150","621","163","312","604","Q003","525","231"]'),
+    (5, 51, '["Q012","98","173","627","290","453","71","Q025","506","148","44","240","287","193","457","125","59","555","600","192","43","597","382","252","402","491","410","439","396","451"]'),
+    (5, 52, '["534","647","500","136","142","612","459","276","325","22","295","487","436","268","102","608","442","75","567","480","88","404","48","Q058","292","427","625","479","596","35"]'),
+    (5, 53, '["386","4","669","515","583","624","239","418","213","433","175","220","668","431","523","104","628","533","664","272","Q054","373","41","Q049","349","313","119","219","2","610"]'),
+    (5, 54, '["501","496","549","Q051","68","580","344","159","300","211","Q035","64","424","66","31","646","486","111","529","285","53","275","368","420","550","416","255","586","146","25"]'),
+    (5, 55, '["383","387","434","363","249","572","574","532","Q031","282","226","423","245","611","Q023","403","Q015","178","440","52","293","541","256","497","76","130","415","422","20","507"]'),
+    (5, 56, '["151","494","147","643","42","465","376","314","633","615","168","406","601","106","553","37","635","202","364","619","651","110","392","446","160","308","50","412","620","153"]'),
+    (5, 57, '["556","70","441","453","379","201","250","143","299","306","Q012","131","80","47","371","30","570","340","468","246","483","448","518","89","438","200","660","559","199","19"]'),
+    (5, 58, '["227","215","196","270","595","512","211","639","495","289","34","656","Q021","369","266","510","581","240","274","38","74","100","265","12","375","511","180","333","622","83"]'),
+    (5, 59, '["485","311","513","659","320","327","117","564","225","563","357","547","Q037","652","129","365","598","649","24","426","29","46","355","666","304","478","205","430","305","540"]'),
+    (5, 60, '["Q013","354","385","481","482","162","638","206","139","400","389","473","460","502","521","149","271","623","203","112","95","207","413","345","326","244","172","616","Q036","557"]'),
+    (5, 61, '["321","466","351","11","141","177","40","660","116","Q002","56","476","334","Q040","91","86","Q010","296","Q024","212","Q026","221","145","368","625","382","124","61","78","Q022"]'),
+    (5, 62, '["364","243","Q008","309","107","636","157","663","167","393","Q029","280","348","654","536","307","384","543","166","526","441","Q056","7","516","230","571","554","336","264","164"]'),
+    (5, 63, '["671","435","542","578","Q020","126","329","Q026","607","228","613","Q059","73","250","580","93","558","492","411","324","198","60","600","269","488","Q044","128","404","395","490"]'),
+    (5, 64, '["367","Q006","161","614","380","281","497","235","310","101","602","522","238","425","87","661","169","47","585","23","545","45","655","599","204","Q023","194","377","477","257"]'),
+    (5, 65, '["457","381","399","562","653","8","263","218","186","27","31","5","454","90","185","55","524","609","109","175","378","360","632","58","402","97","84","Q038","Q005","345"]'),
+    (5, 66, '["222","79","444","337","366","542","644","Q025","81","259","267","419","263","105","346","174","302","520","36","280","572","322","94","Q028","594","408","118","657","530","14"]'),
+    (5, 67, '["187","493","581","407","665","150","275","158","552","504","443","318","154","415","498","258","140","18","645","556","252","135","262","227","652","394","512","254","631","427"]'),
+    (5, 68, '["670","429","214","44","528","561","Q047","462","256","188","102","629","335","472","221","108","315","384","244","451","210","573","189","626","Q053","342","33","294","620","603"]'),
+    (5, 69, '["446","113","Q009","428","Q033","571","260","Q014","614","Q019","1","499","330","239","577","202","157","332","Q017","51","121","606","Q001","174","425","474","74","355","648","422"]'),
+    (5, 70, '["120","Q004","667","516","434","391","28","591","467","271","297","9","218","311","149","461","527","229","659","289","279","592","39","282","63","128","576","662","57","54"]'),
+    (5, 71, '["465","147","494","356","668","658","207","489","372","426","398","338","40","248","88","584","Q016","16","219","388","586","Q046","416","442","630","Q030","509","508","470","312"]'),
+    (5, 72, '["75","246","92","138","41","650","191","362","249","50","640","417","463","598","301","184","514","515","170","319","408","201","Q024","588","Q060","323","624","518","327","617"]'),
+    (5, 73, '["298","438","65","Q040","107","82","283","295","641","538","290","241","540","182","328","108","423","76","313","339","447","106","208","469","183","133","303","190","503","582"]'),
+    (5, 74, '["129","554","418","Q054","412","653","386","110","Q058","331","304","403","539","458","114","473","310","287","Q029","93","397","54","Q034","618","127","450","278","72","247","274"]'),
+    (5, 75, '["314","565","517","111","344","480","Q011","596","455","22","123","663","24","420","604","559","Q007","594","637","631","226","137","544","551","484","199","230","66","326","374"]'),
+    (5, 76, '["272","641","232","206","78","349","34","482","135","463","341","358","224","486","163","257","13","521","432","464","414","Q018","267","401","646","17","122","8","Q045","Q036"]'),
+    (5, 77, '["49","Q052","664","370","213","71","608","192","308","273","642","209","161","Q022","6","Q021","19","Q043","Q057","98","12","45","62","603","116","32","269","234","48","371"]'),
+    (5, 78, '["376","343","350","176","35","Q027","91","505","649","28","193","449","552","528","25","30","103","605","180","508","178","291","379","144","Q019","20","Q042","168","52","409"]'),
+    (5, 79, '["550","200","475","437","607","566","491","166","363","655","421","436","385","459","119","Q038","504","582","650","340","405","381","336","1","243","59","80","492","181","500"]'),
+    (5, 80, '["472","15","Q049","268","260","615","392","154","185","237","222","134","38","262","321","347","424","126","307","456","558","Q013","179","29","Q031","225","520","485","548","217"]'),
+    (5, 81, '["233","519","55","377","546","21","184","3","Q055","182","319","60","284","531","589","361","626","236","579","251","132","396","261","301","Q015","569","245","647","320","382"]'),
+    (5, 82, '["131","593","23","406","507","479","96","536","495","160","299","378","56","136","471","253","348","560","32","212","Q048","549","316","306","85","120","7","231","640","Q037"]'),
+    (5, 83, '["42","452","592","104","570","77","Q050","567","146","117","153","562","242","277","632","288","359","537","2","587","53","532","26","99","522","265","621","568","629","353"]'),
+    (5, 84, '["68","266","445","351","612","43","308","440","476","84","Q041","387","173","Q001","312","Q035","668","74","638","138","506","352","535","529","590","666","103","574","487","599"]'),
+    (5, 85, '["296","617","670","209","198","158","398","402","509","513","37","177","Q024","388","543","148","575","294","10","Q051","155","510","448","446","197","328","115","94","634","124"]'),
+    (5, 86, '["411","125","69","557","468","584","Q003","170","405","199","648","216","345","315","287","383","Q056","171","488","87","525","354","583","123","300","317","490","636","404","627"]'),
+    (5, 87, '["646","Q023","Q059","618","97","498","89","4","341","544","657","217","271","616","621","401","286","67","477","215","433","325","635","637","363","162","272","254","49","Q044"]'),
+    (5, 88, '["324","232","558","276","473","Q039","533","436","278","223","429","149","353","373","628","207","456","656","596","75","362","285","611","Q052","18","137","503","192","86","Q006"]'),
+    (5, 89, '["535","462","142","661","519","419","Q020","514","Q026","277","578","114","291","350","23","569","489","293","497","601","Q004","439","630","236","172","616","407","46","117","273"]'),
+    (5, 90, '["386","391","595","256","140","537","425","Q008","17","659","399","347","390","220","203","96","156","534","395","588","62","20","297","604","216","333","10","501","413","346"]'),
+    (5, 91, '["188","410","444","Q054","342","669","58","255","Q053","349","247","435","Q014","580","370","210","561","555","354","Q032","105","Q025","597","400","318","491","5","559","484","478"]'),
+    (5, 92, '["128","147","574","Q048","645","290","83","228","586","Q030","358","Q017","420","571","255","219","100","Q009","525","330","381","270","469","257","234","526","572","193","252","29"]'),
+    (5, 93, '["485","Q045","113","459","Q005","240","233","160","379","214","380","384","523","311","229","315","532","309","368","454","321","573","337","53","408","452","445","73","264","658"]'),
+    (5, 94, '["313","643","431","197","464","663","241","172","322","585","515","194","428","327","57","Q012","21","644","563","303","Q040","467","4","Q002","161","131","176","31","600","145"]'),
+    (5, 95, '["568","Q057","442","634","524","417","177","305","206","393","409","121","70","65","Q055","389","201","651","Q010","6","394","81","451","642","213","466","536","623","97","110"]'),
+    (5, 96, '["332","212","167","101","465","602","92","407","94","619","72","624","517","338","329","269","275","411","307","622","124","289","378","339","671","133","610","183","355","14"]'),
+    (5, 97, '["Q027","335","494","7","530","375","533","85","227","669","159","283","169","Q035","480","292","367","538","111","76","143","553","317","112","365","539","348","471","33","87"]'),
+    (5, 98, '["633","82","116","16","356","89","395","300","298","141","320","138","186","613","264","235","576","499","437","118","Q058","448","80","64","413","652","483","453","476","174"]'),
+    (5, 99, '["406","284","603","396","518","Q060","357","502","418","666","614","390","261","Q046","439","11","331","109","221","Q037","Q033","334","26","295","Q018","77","185","151","516","424"]'),
+    (10, 0, '["132","109","644","119","582","304","668","505","473","264","27","490","330","Q050","486","560","556","368","629","458","546","19","149","56","637","500","482","63","294","128","564","365","381","110","441","111","345","97","278","146","39","43","22","258","398","94","350","58","92","328","307","575","425","352","177","80","494","124","66","332"]'),
+    (10, 1, '["634","44","503","Q057","54","222","463","570","449","618","624","544","7","Q026","125","460","563","336","Q053","662","627","Q018","603","26","303","197","281","72","413","559","Q038","516","298","610","52","108","171","411","228","659","635","248","244","389","218","163","419","498","205","578","200","439","207","617","400","20","Q015","484","342","470"]'),
+    (10, 2, '["Q017","272","219","491","499","512","279","Q043","583","641","633","471","Q032","Q010","372","282","445","670","588","364","594","325","9","467","340","338","408","Q055","245","6","185","431","186","397","198","79","383","156","158","35","510","Q042","485","Q012","77","268","557","479","59","323","Q023","379","569","606","567","Q046","140","81","190","148"]'),
+    (10, 3, '["162","223","184","191","540","Q025","522","71","194","155","513","99","13","Q059","55","174","382","480","580","334","614","212","661","313","Q047","335","41","402","65","643","343","Q039","151","283","67","399","380","390","554","203","348","Q027","314","457","638","476","414","653","602","535","145","118","15","114","61","581","433","642","209","Q024"]'),
+    (10, 4, '["646","261","465","541","87","300","42","656","496","469","196","175","619","Q022","292","376","122","391","514","257","599","86","78","528","356","669","305","639","243","116","434","597","608","318","288","17","240","406","521","Q005","626","29","217","192","Q040","651","Q004","113","660","622","495","667","464","354","115","341","Q031","24","587","202"]'),
+    (10, 5, '["280","93","326","224","403","88","183","592","529","347","648","103","34","577","213","561","657","253","456","543","126","596","346","315","107","600","367","429","164","239","595","215","53","233","168","235","423","267","322","289","393","453","Q019","Q034","443","187","548","238","344","532","357","73","311","339","572","671","18","260","135","337"]'),
+    (10, 6, '["308","274","631","333","210","1","375","50","497","46","47","Q056","271","551","216","655","573","33","131","358","447","591","21","632","247","604","327","317","Q001","373","101","312","Q054","306","32","371","520","542","395","Q033","23","188","650","386","421","82","28","40","Q029","143","370","16","359","539","515","270","84","377","167","378"]'),
+    (10, 7, '["468","396","5","98","48","474","286","302","8","440","Q009","664","466","361","83","478","585","301","507","492","487","404","374","547","112","96","523","297","91","427","Q058","214","178","102","589","157","201","566","351","290","76","236","571","Q021","416","366","299","649","565","665","221","154","150","448","269","64","255","436","321","85"]'),
+    (10, 8, '["329","Q030","173","324","254","229","89","166","161","Q016","225","481","Q002","385","349","605","256","133","446","504","Q035","144","477","284","615","160","Q020","549","176","530","574","Q060","531","Q037","31","584","141","472","647","69","459","60","123","259","275","172","182","450","590","388","415","518","Q003","461","562","181","265","276","Q051","568"]'),
+    (10, 9, '["147","25","Q045","320","550","189","208","Q014","640","506","Q013","384","630","663","536","Q036","246","291","454","501","426","620","104","180","204","462","127","57","488","138","533","509","405","220","410","249","242","576","153","227","409","263","355","652","4","658","558","412","601","353","231","252","250","Q028","555","537","527","296","45","241"]'),
+    (10, 10, '["199","586","51","75","435","511","502","Q041","Q008","570","430","277","404","444","Q044","424","134","37","38","293","363","129","30","407","569","193","526","117","525","483","142","Q052","232","344","422","74","12","68","244","628","455","636","137","331","420","206","645","14","130","Q007","360","616","319","534","273","2","579","392","452","442"]'),
+    (10, 11, '["251","524","666","288","448","38","612","438","105","103","235","598","525","136","437","369","199","345","159","114","607","266","252","425","271","387","221","211","162","538","316","Q049","234","295","230","74","170","36","88","378","Q037","613","553","593","621","100","98","517","309","262","508","120","494","4","310","419","31","578","552","45"]'),
+    (10, 12, '["625","184","30","116","179","11","611","590","86","389","3","159","669","Q053","Q057","312","40","534","479","226","285","Q029","17","70","Q011","328","413","19","489","429","Q006","609","432","579","Q028","642","493","140","121","Q058","417","62","260","Q052","394","401","559","20","106","434","15","488","169","55","348","49","287","Q034","59","275"]'),
+    (10, 13, '["655","402","599","286","80","630","617","670","496","598","354","Q009","498","359","462","151","406","428","420","237","Q006","142","2","Q059","612","94","Q048","108","638","519","466","51","7","611","571","545","399","607","58","Q004","491","76","90","418","555","Q055","264","451","120","126","321","471","568","213","639","362","424","210","387","654"]'),
+    (10, 14, '["548","576","464","497","446","565","632","41","634","474","5","150","232","129","121","Q023","550","270","68","551","192","323","615","214","358","623","139","70","102","10","267","256","384","Q051","533","263","77","200","78","324","157","475","353","81","95","409","135","131","69","373","518","439","Q016","180","Q060","174","90","91","432","231"]'),
+    (10, 15, '["428","149","60","208","512","223","487","625","648","113","556","654","383","544","484","Q027","128","191","407","350","107","262","553","530","Q021","79","298","177","11","361","Q007","452","82","154","57","62","176","265","504","307","106","581","501","115","480","417","228","66","631","43","536","296","573","482","219","54","454","303","538","585"]'),
+    (10, 16, '["134","272","403","653","185","111","61","188","326","445","9","301","Q014","577","381","136","624","302","Q013","351","268","109","254","Q046","554","72","528","13","196","Q039","Q033","257","310","145","386","322","183","566","18","449","400","85","295","395","209","329","206","392","316","280","Q025","207","436","137","483","477","352","375","273","278"]'),
+    (10, 17, '["320","390","426","347","492","651","47","647","526","586","331","283","605","560","132","476","657","277","411","39","561","292","610","1","435","16","37","93","393","218","602","Q031","Q035","205","230","274","251","197","241","314","490","110","327","567","589","Q010","376","613","22","73","50","506","580","222","531","75","408","671","35","340"]'),
+    (10, 18, '["537","529","24","342","486","645","410","285","201","539","614","56","343","478","522","101","Q001","29","460","12","163","25","552","646","Q024","620","394","160","652","229","500","Q005","186","318","226","203","Q054","405","198","443","259","453","540","473","236","511","545","224","412","558","Q036","233","380","595","240","363","315","441","396","513"]'),
+    (10, 19, '["48","582","52","95","313","148","6","Q003","637","663","161","541","416","193","237","293","3","349","84","227","53","104","636","308","21","596","217","472","Q042","423","601","658","583","290","557","485","173","127","667","169","294","167","444","261","42","147","330","455","23","641","182","377","649","489","258","Q008","26","112","Q022","255"]'),
+    (10, 20, '["181","516","379","515","289","166","459","71","282","604","65","311","Q020","468","628","507","520","587","36","461","467","143","635","422","356","593","49","532","297","368","Q030","Q026","281","335","89","238","194","597","442","189","32","427","606","Q041","623","204","668","63","543","99","124","564","212","665","309","509","503","117","250","619"]'),
+    (10, 21, '["304","31","34","465","320","319","616","65","542","249","133","64","355","141","458","Q040","266","659","269","388","386","656","382","535","433","Q056","414","239","67","178","179","384","505","153","621","329","524","16","130","Q049","27","125","339","629","447","568","594","87","119","51","234","243","440","421","546","450","401","Q027","158","299"]'),
+    (10, 22, '["603","8","437","618","289","176","333","46","168","74","502","59","187","666","608","469","418","191","172","493","626","398","495","562","117","456","660","514","97","463","Q012","306","519","338","343","118","Q038","465","7","140","671","137","362","510","499","85","50","402","523","156","565","614","Q057","640","485","Q002","Q032","215","570","371"]'),
+    (10, 23, '["246","287","217","188","595","207","361","332","480","325","88","15","650","Q060","220","Q018","284","421","438","359","360","149","271","403","Q019","664","591","391","559","43","79","Q022","549","451","572","461","261","508","77","322","100","510","633","175","366","190","615","381","146","245","670","14","55","424","276","89","521","Q059","211","337"]'),
+    (10, 24, '["263","300","579","492","281","350","334","210","Q017","Q010","500","459","601","Q015","431","584","661","372","385","592","662","157","138","346","563","180","139","298","619","457","463","123","374","244","515","644","409","475","317","92","405","Q054","242","440","323","131","17","520","376","290","30","99","341","28","73","344","574","47","616","626"]'),
+    (10, 25, '["235","81","24","335","352","216","495","128","408","397","307","407","Q044","642","314","668","Q011","122","354","10","170","Q009","67","664","225","147","91","548","446","291","104","547","279","202","256","389","659","Q048","449","349","283","83","249","379","609","310","171","643","481","41","87","336","540","603","482","566","518","110","636","33"]'),
+    (10, 26, '["491","430","44","419","426","96","348","434","155","555","600","Q036","467","649","150","272","556","143","168","173","644","527","72","Q025","Q031","569","Q024","305","543","66","531","57","215","257","92","274","Q012","204","599","2","116","Q040","648","647","163","656","597","198","119","466","498","410","Q047","248","346","130","220","367","Q005","84"]'),
+    (10, 27, '["383","627","185","113","Q029","641","561","622","53","321","Q001","141","294","413","590","608","161","158","98","236","64","262","115","Q045","58","406","282","547","385","292","380","420","411","546","653","369","502","68","197","109","549","227","479","56","588","94","Q050","336","Q006","136","484","184","Q023","144","309","473","164","370","105","172"]'),
+    (10, 28, '["415","364","221","Q021","575","14","Q051","558","232","516","365","253","517","260","25","286","438","464","45","529","469","280","Q033","571","193","530","80","75","663","120","444","125","Q018","552","470","121","153","285","258","93","448","358","494","521","478","78","200","404","247","107","Q043","452","6","Q011","357","20","Q007","203","594","607"]'),
+    (10, 29, '["123","393","633","327","617","497","308","625","564","553","646","40","611","665","476","351","Q047","347","Q053","537","288","328","655","90","60","146","124","183","212","100","377","Q028","324","396","415","620","Q034","186","164","512","Q026","458","313","233","284","245","447","Q020","18","34","Q013","21","412","259","612","598","517","454","486","578"]'),
+    (10, 30, '["103","316","363","604","192","477","430","26","488","229","423","269","35","69","170","662","596","246","432","1","539","304","48","431","36","71","506","201","238","97","29","273","581","345","225","468","538","275","471","532","62","364","Q055","206","503","Q030","Q004","Q044","219","251","378","226","652","167","52","44","312","19","38","428"]'),
+    (10, 31, '["23","86","148","575","Q039","585","199","631","Q032","632","8","Q035","630","542","618","433","536","240","111","12","397","490","360","341","388","254","606","4","302","Q003","162","Q050","404","252","147","382","330","525","637","74","Q029","Q041","422","624","425","301","231","267","9","202","76","190","403","214","462","522","Q052","Q049","106","589"]'),
+    (10, 32, '["392","541","533","645","47","Q056","507","108","587","514","474","241","243","53","416","199","255","456","Q017","114","660","177","Q008","221","79","501","297","505","524","455","171","311","400","Q058","509","265","192","442","370","295","Q048","395","213","133","154","189","82","134","628","24","366","429","398","244","559","Q016","230","160","178","76"]'),
+    (10, 33, '["218","293","173","242","629","647","344","Q037","96","109","77","188","46","531","115","563","269","61","402","348","151","542","620","414","475","156","386","534","297","448","584","294","592","303","22","582","54","25","337","174","211","391","485","355","613","33","390","669","265","504","666","338","441","339","Q038","118","326","Q014","496","550"]'),
+    (10, 34, '["85","325","159","187","375","191","590","356","340","216","384","316","368","373","658","562","557","659","460","176","166","268","511","95","217","413","287","583","315","350","621","7","488","474","281","650","Q057","18","4","299","638","132","519","497","229","63","266","457","435","491","258","319","80","102","Q043","68","263","142","327","560"]'),
+    (10, 35, '["342","343","566","Q022","577","651","573","578","353","528","283","51","419","394","663","138","222","194","212","42","439","3","418","365","189","554","572","87","248","34","558","250","41","443","601","185","494","Q055","568","583","315","609","156","345","270","602","38","139","161","483","323","648","129","567","610","127","306","271","Q056","314"]'),
+    (10, 36, '["320","35","523","331","Q058","635","361","362","305","527","617","32","174","508","37","20","126","Q054","374","252","261","551","Q031","209","329","224","135","223","264","182","172","595","489","312","5","Q052","486","586","122","236","435","596","235","516","417","614","533","612","387","213","544","81","422","288","Q015","482","Q040","513","334","Q002"]'),
+    (10, 37, '["279","55","298","101","375","333","657","591","275","569","1","472","29","464","453","27","39","603","304","302","Q051","286","606","357","335","Q004","58","369","669","276","105","59","293","526","291","640","411","463","203","639","645","228","52","257","556","155","522","412","581","99","410","83","379","104","98","Q026","433","406","50","587"]'),
+    (10, 38, '["641","30","237","307","Q028","616","11","667","73","Q025","72","503","623","622","322","289","218","231","223","56","208","656","576","149","70","607","Q010","17","489","668","Q059","296","518","10","Q033","447","162","111","277","643","299","166","28","399","492","332","184","395","401","Q019","555","207","282","440","436","159","565","16","300","145"]'),
+    (10, 39, '["588","Q036","561","Q030","439","71","113","13","479","371","331","584","597","501","451","405","426","619","635","535","33","356","45","541","137","507","48","94","471","78","196","490","646","557","580","658","407","387","140","240","653","513","459","536","342","308","31","504","476","40","Q018","205","23","427","525","163","157","253","Q038","32"]'),
+    (10, 40, '["169","107","125","662","64","650","272","340","470","129","666","86","378","560","280","589","43","380","112","499","Q021","670","Q023","Q024","332","570","605","487","49","57","200","598","450","576","63","89","69","Q053","22","75","130","Q034","117","538","347","270","349","Q035","Q042","70","608","396","610","131","295","461","421","429","652","239"]'),
+    (10, 41, '["567","473","325","Q003","333","630","534","437","388","Q046","Q039","255","287","432","318","515","537","215","65","317","326","632","671","424","247","532","103","609","481","222","84","278","465","493","116","219","510","Q032","Q037","548","Q005","550","543","642","420","114","574","600","Q027","599","124","290","9","180","446","321","551","394","225","571"]'),
+    (10, 42, '["302","540","552","638","150","Q045","345","545","620","566","452","194","354","376","227","88","565","442","554","352","559","234","500","254","181","627","123","108","329","523","528","563","615","110","199","399","67","524","629","367","655","289","179","264","93","381","14","398","654","83","201","271","128","661","144","495","423","186","198","204"]'),
+    (10, 43, '["428","303","Q060","579","338","82","256","390","382","409","473","28","239","472","232","233","370","249","58","568","51","Q017","372","604","313","502","283","66","491","168","634","594","266","336","480","267","347","455","151","197","546","Q023","593","175","262","512","143","467","377","141","454","425","644","12","445","193","468","217","274","235"]'),
+    (10, 44, '["Q046","506","593","276","667","310","514","548","Q051","458","221","261","Q016","640","272","Q014","177","91","497","290","8","234","664","449","355","416","75","320","482","210","544","479","206","138","211","17","196","330","Q006","120","2","406","164","59","242","318","60","162","15","140","136","520","35","Q059","Q002","311","518","245","258","Q015"]'),
+    (10, 45, '["53","570","642","328","498","Q001","359","445","72","354","133","461","31","110","282","118","309","115","230","244","434","237","142","319","401","553","34","466","107","358","297","415","97","636","582","505","530","626","148","574","26","124","6","651","509","317","384","160","146","257","324","628","233","617","284","408","103","92","Q011","586"]'),
+    (10, 46, '["308","622","588","122","639","111","521","81","508","379","412","389","579","339","504","585","286","444","581","476","483","590","20","154","599","371","453","80","355","Q050","546","200","438","182","Q022","298","9","95","365","420","153","592","Q008","219","601","Q047","383","Q037","190","220","Q054","337","38","230","243","485","423","96","62","Q028"]'),
+    (10, 47, '["Q025","321","349","188","657","516","135","611","529","229","24","304","591","647","460","492","185","Q045","436","539","Q043","631","187","414","301","100","Q007","385","540","79","260","556","131","121","227","166","106","656","56","181","36","43","97","114","564","477","238","344","602","440","251","534","277","293","545","403","348","202","281","77"]'),
+    (10, 48, '["478","562","512","381","334","19","12","572","373","126","69","464","29","359","46","269","87","313","431","357","54","78","391","57","637","531","549","137","392","183","547","561","386","451","306","90","Q012","449","405","341","Q055","71","404","210","3","169","378","470","670","Q042","594","268","369","Q021","197","85","156","400","446","214"]'),
+    (10, 49, '["312","48","125","419","16","Q056","665","636","Q034","417","661","113","592","Q024","128","589","Q009","463","74","466","649","Q007","42","25","623","669","148","525","438","643","605","205","292","68","402","578","145","147","109","527","8","351","481","558","104","294","526","270","119","65","176","356","Q049","Q029","Q013","484","213","462","480","487"]'),
+    (10, 50, '["86","616","Q003","296","255","285","Q019","157","510","73","275","Q052","326","437","367","Q032","Q053","76","625","173","503","39","391","427","Q058","515","127","671","426","407","170","627","224","542","203","366","552","648","456","397","163","154","346","653","119","447","509","496","553","5","180","393","459","471","571","536","533","389","209","409"]'),
+    (10, 51, '["49","228","158","274","278","606","375","Q020","178","611","513","149","252","98","116","208","Q057","537","630","61","575","573","500","189","372","651","Q026","Q030","608","132","273","654","30","488","465","343","569","139","443","316","236","338","41","21","Q001","434","633","469","322","Q038","395","7","618","352","327","47","416","45","448","635"]'),
+    (10, 52, '["112","495","569","442","245","441","Q039","393","406","421","Q011","350","193","474","292","206","291","Q008","236","519","498","52","167","138","646","337","522","659","99","266","Q010","425","248","159","511","Q027","177","668","192","4","626","455","587","5","216","430","215","280","339","550","459","55","385","475","581","117","Q033","325","Q016","462"]'),
+    (10, 53, '["108","171","103","27","564","226","37","Q020","207","271","444","120","497","Q041","377","614","93","158","328","315","Q014","515","212","Q019","275","134","563","174","307","50","13","523","57","507","Q024","580","662","256","349","135","62","259","150","91","Q006","394","410","671","Q036","265","10","109","508","82","299","319","596","249","494","143"]'),
+    (10, 54, '["252","191","84","404","Q017","Q009","387","253","390","228","655","641","647","422","175","600","302","Q060","643","541","40","102","424","168","517","639","64","368","Q031","323","295","364","260","94","161","634","288","396","382","568","652","612","263","376","524","11","192","294","619","67","81","26","346","486","529","65","305","23","491","644"]'),
+    (10, 55, '["218","88","471","246","23","145","146","521","114","243","598","151","452","38","105","583","555","220","155","477","620","300","Q013","Q040","668","502","1","Q005","Q044","408","55","506","358","484","493","362","468","72","78","250","411","577","435","556","402","537","614","548","666","290","403","363","321","584","571","254","312","489","136","111"]'),
+    (10, 56, '["85","525","272","341","500","283","490","179","557","576","645","413","44","499","Q048","50","562","140","Q018","535","101","222","201","18","543","59","613","342","514","Q035","22","433","199","Q058","457","361","334","244","33","595","308","15","Q023","311","642","247","615","448","663","659","223","63","446","660","542","Q057","232","335","157","309"]'),
+    (10, 57, '["624","14","621","170","431","532","Q052","450","Q004","640","378","267","476","329","425","626","79","77","46","482","397","400","518","327","374","141","520","117","454","172","310","186","241","73","617","628","353","657","89","501","279","162","58","360","510","144","473","Q022","590","Q040","314","178","547","Q060","418","453","184","41","320","594"]'),
+    (10, 58, '["567","51","30","566","31","61","638","128","596","235","183","451","316","401","622","426","405","131","408","664","224","344","467","262","388","Q046","Q030","Q028","458","464","429","336","123","422","442","4","416","8","130","153","265","505","Q059","317","20","225","633","511","457","593","40","330","528","652","583","34","206","585","137","383"]'),
+    (10, 59, '["76","607","144","251","Q042","455","231","226","164","124","113","479","460","486","276","324","536","257","99","610","21","300","Q035","258","200","Q054","559","615","603","215","36","439","392","407","281","534","219","360","658","574","483","381","609","296","380","351","587","597","398","372","230","282","75","512","19","353","359","350","74","646"]'),
+    (10, 60, '["194","478","554","29","436","606","269","217","570","376","496","209","440","237","595","98","386","133","670","212","185","Q034","191","248","650","268","227","261","129","35","264","470","367","340","629","259","348","150","549","168","298","449","87","565","239","631","39","288","602","474","32","480","539","634","54","126","Q012","Q026","384","190"]'),
+    (10, 61, '["149","338","418","24","661","Q025","573","516","47","319","172","636","285","307","578","533","333","427","100","147","655","509","637","7","419","189","604","379","221","488","16","93","599","Q002","148","25","27","370","582","133","461","323","66","179","Q053","92","560","345","494","233","70","618","80","632","546","535","167","306","187","481"]'),
+    (10, 62, '["586","545","304","127","289","45","Q029","651","297","361","Q032","538","660","263","501","184","201","52","648","Q027","53","204","163","314","354","2","526","469","193","173","Q037","421","552","380","142","503","28","649","641","499","409","Q021","417","Q051","450","432","434","256","493","44","335","365","197","377","60","466","485","154","343","347"]'),
+    (10, 63, '["362","Q002","485","443","6","529","364","554","249","247","357","616","656","653","577","404","275","560","399","403","229","536","118","388","551","520","420","188","160","301","472","492","121","139","42","43","Q033","391","68","89","85","110","231","240","373","125","343","115","458","498","74","221","557","561","544","90","271","17","223","601"]'),
+    (10, 64, '["177","116","366","287","281","260","73","627","385","273","313","104","67","274","Q023","423","318","668","431","331","Q056","489","410","207","49","37","12","332","82","176","298","238","495","412","414","Q004","83","Q038","9","272","648","Q005","537","56","Q015","437","579","182","299","497","415","214","153","305","Q036","198","530","635","570","280"]'),
+    (10, 65, '["517","312","438","293","355","592","6","429","435","598","531","105","413","374","130","Q025","26","140","181","243","311","100","262","129","14","196","460","Q018","218","569","286","369","322","332","Q020","83","251","558","97","428","11","22","566","473","96","Q022","Q029","88","341","384","102","483","465","424","213","504","308","540","107","Q055"]'),
+    (10, 66, '["292","587","487","269","611","171","532","170","86","389","Q007","109","619","Q059","54","585","176","15","211","150","339","75","183","633","581","104","46","103","669","159","377","Q006","161","234","255","518","145","553","525","621","108","92","18","445","527","334","3","620","112","387","147","320","315","386","358","278","Q024","397","671","229"]'),
+    (10, 67, '["563","624","244","113","28","411","381","Q019","71","202","547","614","33","69","210","122","325","94","573","354","665","284","137","199","2","156","589","630","352","663","301","Q009","9","Q055","654","143","117","461","57","65","235","328","565","80","515","81","Q050","478","306","267","50","4","631","519","222","203","351","1","205","456"]'),
+    (10, 68, '["513","Q030","77","Q047","242","395","555","313","246","494","268","531","356","368","Q031","Q039","603","19","607","526","612","600","491","166","174","582","476","348","528","376","254","568","452","10","228","539","149","350","561","216","564","59","447","13","62","186","173","23","540","241","439","76","464","266","605","295","294","138","Q016","550"]'),
+    (10, 69, '["383","25","32","297","588","390","416","95","347","608","616","463","185","642","533","639","277","656","309","333","210","79","643","177","Q011","426","189","121","Q048","270","Q049","562","208","219","126","349","287","56","Q026","31","645","Q021","290","94","609","314","396","500","375","70","106","652","Q028","252","161","Q057","575","623","51","475"]'),
+    (10, 70, '["530","8","662","82","310","625","405","482","58","209","254","230","432","288","523","644","279","Q036","Q008","613","363","200","329","Q045","484","392","119","182","134","107","Q027","346","355","441","162","579","522","69","506","43","115","295","571","382","157","91","479","258","261","101","666","Q043","454","47","315","580","72","296","448","556"]'),
+    (10, 71, '["337","393","Q013","Q001","285","48","175","111","40","638","29","Q053","66","572","141","Q037","227","617","541","504","302","Q044","650","444","16","53","41","551","123","35","591","667","Q060","192","78","303","534","84","Q010","98","155","Q003","264","433","203","371","132","114","Q041","402","168","63","344","321","206","410","503","596","233","322"]'),
+    (10, 72, '["559","361","Q056","486","236","125","218","449","240","42","543","253","474","293","198","38","20","330","379","180","465","477","467","422","468","442","521","456","471","446","519","646","610","626","670","516","357","459","201","291","106","120","453","169","250","430","507","602","Q051","399","647","664","363","158","24","280","283","324","649","265"]'),
+    (10, 73, '["507","7","581","340","164","163","78","Q045","549","299","443","238","45","407","661","30","632","108","256","406","175","246","597","425","545","567","506","327","12","323","440","289","17","538","342","326","142","424","605","345","225","283","Q012","583","419","155","217","487","469","Q040","Q058","245","591","524","135","53","93","156","462","668"]'),
+    (10, 74, '["204","472","572","38","5","490","272","276","542","441","378","562","311","87","664","257","302","485","660","362","574","488","194","Q031","222","463","604","207","138","594","110","Q006","217","232","421","470","282","27","75","144","146","187","211","391","213","89","255","653","571","154","611","Q015","479","343","385","646","188","589","546","304"]'),
+    (10, 75, '["244","636","631","133","615","430","560","191","420","412","669","658","21","415","271","Q032","55","193","612","537","503","300","116","Q026","501","657","508","Q047","628","512","64","Q021","373","606","590","423","147","268","278","303","468","629","51","73","102","197","665","576","286","131","359","603","584","274","336","101","14","79","231","Q038"]'),
+    (10, 76, '["308","72","548","263","630","Q054","637","61","452","400","36","95","388","100","659","31","118","Q017","273","513","450","623","85","348","91","140","236","128","215","134","565","480","358","601","153","502","414","Q033","409","496","124","455","103","558","641","34","514","Q007","645","417","136","Q052","Q043","90","Q010","331","249","498","350","212"]'),
+    (10, 77, '["671","112","543","221","457","316","494","542","18","512","263","43","663","423","398","60","578","461","220","492","401","305","563","151","640","88","74","618","143","Q014","Q046","Q057","223","647","394","619","99","Q034","86","466","167","381","447","135","226","113","515","264","475","252","438","259","212","10","320","Q025","178","80","338","544"]'),
+    (10, 78, '["294","553","301","148","434","Q041","376","371","497","55","216","207","422","159","561","Q039","97","523","187","26","445","517","462","174","406","411","179","607","510","Q027","403","633","484","500","333","71","270","15","509","335","569","511","330","162","64","629","650","188","57","379","77","186","402","248","349","13","321","11","Q004","638"]'),
+    (10, 79, '["598","528","Q024","310","539","439","62","567","520","399","570","Q035","111","20","365","382","635","521","640","613","323","599","595","347","166","224","396","180","132","309","652","378","455","592","287","352","621","237","242","109","1","23","408","6","531","Q022","169","208","9","367","518","495","47","329","532","192","307","401","150","642"]'),
+    (10, 80, '["Q019","59","405","307","52","480","577","558","473","92","655","67","2","375","209","Q048","340","66","576","172","68","Q033","413","614","344","253","346","76","Q030","654","173","141","319","Q056","185","Q032","368","471","282","245","Q028","573","190","559","241","556","426","324","617","555","397","356","81","105","575","177","171","530","464","666"]'),
+    (10, 81, '["481","458","281","520","120","366","476","404","659","383","Q034","536","298","312","198","126","115","311","433","Q002","149","588","332","290","535","448","197","46","336","Q050","168","325","370","620","386","534","474","107","99","345","205","110","584","254","125","136","Q055","418","56","228","407","593","Q017","522","258","351","586","389","429","238"]'),
+    (10, 82, '["409","Q044","477","160","651","174","139","Q023","24","Q053","275","360","128","398","280","16","667","256","634","648","626","Q013","313","127","Q060","Q059","260","178","390","600","326","227","594","380","215","420","Q029","Q051","653","557","292","597","548","121","459","240","643","483","29","632","392","202","327","86","436","355","146","432","598","261"]'),
+    (10, 83, '["609","58","97","183","444","36","60","451","22","622","137","583","7","285","316","Q008","96","65","203","235","84","44","131","Q001","229","Q018","627","267","377","68","358","425","467","616","Q038","443","491","291","566","170","353","384","568","328","315","Q009","181","199","8","465","505","502","446","525","Q005","176","421","247","585","289"]'),
+    (10, 84, '["Q049","286","615","196","Q015","225","16","250","88","372","299","647","Q021","339","596","163","427","489","459","564","74","374","354","590","34","Q039","582","283","273","656","269","204","17","Q025","39","454","404","554","435","129","570","119","547","317","Q012","587","12","233","431","493","Q035","342","93","499","103","296","486","395","193","524"]'),
+    (10, 85, '["526","19","49","184","3","289","Q003","297","304","320","230","166","552","364","54","30","527","644","295","114","77","35","514","412","568","76","658","337","549","48","214","104","488","69","145","251","32","452","71","424","25","503","485","265","529","306","655","5","261","639","57","50","122","624","191","648","428","Q042","239","373"]'),
+    (10, 86, '["236","625","157","342","116","189","142","277","318","232","284","369","45","460","Q014","243","580","67","550","310","449","Q029","341","516","37","540","200","279","Q023","490","210","361","599","447","213","Q054","251","201","356","461","81","255","223","234","560","192","541","343","645","149","117","467","437","4","Q052","275","48","334","405","608"]'),
+    (10, 87, '["591","357","446","28","667","436","274","87","509","123","669","124","180","529","Q042","244","82","365","322","524","79","308","140","419","216","257","444","662","85","670","434","172","665","262","555","Q058","288","403","617","388","221","396","663","127","Q020","482","562","649","508","Q037","302","276","40","651","Q040","440","623","453","551","442"]'),
+    (10, 88, '["472","158","270","242","249","618","125","612","263","393","451","577","286","70","Q031","325","318","513","587","538","49","664","423","601","489","Q022","378","657","159","19","Q005","Q027","479","536","Q036","22","197","496","219","561","78","26","156","206","109","559","473","410","124","37","Q030","31","181","83","182","430","654","450","212","Q008"]'),
+    (10, 89, '["11","Q048","148","465","139","35","256","394","222","43","571","416","194","428","119","616","457","Q053","184","603","151","33","387","252","220","266","143","265","73","47","245","352","157","241","420","519","Q045","65","411","Q056","544","42","610","53","549","147","51","18","595","511","Q001","533","504","15","478","100","Q004","327","293","569"]'),
+    (10, 90, '["321","628","448","384","637","429","63","347","557","498","162","Q058","274","326","Q009","41","631","625","Q011","408","237","298","Q028","589","72","491","415","314","331","602","25","248","130","488","532","217","413","211","469","Q003","400","477","96","588","1","233","468","Q016","363","183","492","497","196","470","272","Q059","94","344","510","207"]'),
+    (10, 91, '["606","218","494","458","368","287","628","120","487","375","380","466","580","189","24","585","579","381","335","155","108","546","111","646","Q051","471","607","126","Q060","98","89","382","639","401","188","622","Q007","545","630","578","341","75","453","234","366","482","154","161","445","329","186","235","406","348","134","359","386","419","642","20"]'),
+    (10, 92, '["374","175","447","209","117","58","480","543","137","515","644","427","281","179","153","282","66","269","Q024","367","389","518","317","517","268","442","292","185","532","230","520","395","649","301","Q015","141","202","110","38","345","661","Q019","556","671","288","550","394","88","581","Q014","640","360","199","46","168","641","492","80","148","219"]'),
+    (10, 93, '["Q055","371","227","655","41","40","285","29","501","379","250","97","567","107","391","262","402","240","Q006","434","547","506","Q041","493","369","315","472","18","210","531","566","90","650","618","Q026","350","324","537","590","28","13","280","558","54","452","565","213","257","102","435","70","668","510","432","258","226","505","312","433","338"]'),
+    (10, 94, '["610","443","115","Q046","116","586","421","331","349","106","476","294","495","150","390","Q054","297","648","8","521","498","23","56","228","516","118","620","635","405","93","95","187","464","267","408","229","156","599","Q010","271","204","205","98","264","299","123","135","258","266","571","29","247","169","393","50","666","105","330","208","136"]'),
+    (10, 95, '["504","512","657","384","525","523","626","34","253","246","64","481","45","113","383","104","163","4","431","575","290","36","412","336","Q026","Q050","58","642","353","563","565","438","413","314","75","192","373","305","Q043","303","548","26","215","398","Q044","91","261","355","319","636","404","62","52","377","551","579","78","602","158","552"]'),
+    (10, 96, '["255","486","632","327","276","344","129","663","203","634","364","454","235","176","540","Q011","Q030","526","522","621","164","463","171","273","9","502","Q033","114","414","440","333","231","422","627","658","620","416","302","14","566","406","652","39","Q032","439","598","553","372","633","387","7","473","55","475","542","108","99","348","260","514"]'),
+    (10, 97, '["249","449","Q049","3","232","345","138","278","283","149","340","Q040","608","376","611","167","59","483","656","507","313","469","479","322","425","220","32","63","Q047","17","500","352","358","190","76","Q052","161","214","614","85","Q002","328","596","172","546","72","101","528","485","83","132","272","147","15","145","619","Q016","198","259","592"]'),
+    (10, 98, '["122","Q007","530","466","459","193","597","133","217","407","245","131","84","662","386","385","650","402","238","354","584","399","659","200","174","539","441","351","323","308","73","94","426","671","613","103","89","166","128","418","Q057","60","424","Q027","173","191","455","291","337","594","474","554","277","456","574","160","223","454","570","21"]'),
+    (10, 99, '["184","527","Q025","409","396","543","31","569","14","549","Q039","224","30","376","82","81","69","508","536","437","113","533","47","206","9","52","417","370","150","617","176","354","Q020","669","604","653","554","Q002","541","392","581","490","573","35","112","652","491","178","609","194","600","53","377","499","524","71","561","538","239","429"]'),
+    (20, 0, '["216","172","35","108","235","412","288","350","361","Q021","577","365","516","250","114","123","307","585","76","416","663","168","201","496","146","599","396","437","371","22","316","669","Q045","395","Q035","555","209","281","293","61","639","Q014","487","338","376","107","223","237","367","137","490","129","557","544","400","374","79","222","64","438","408","300","558","392","471","81","319","Q016","169","340","260","532","349","429","461","221","39","Q029","348","358","Q057","117","475","179","Q041","308","176","124","69","1","530","602","478","391","373","145","275","354","646","375","Q005","636","522","327","274","500","512","523","297","Q038","208","252","63","199","Q030","120","Q060","244","50","476"]'),
+    (20, 1, '["464","151","467","153","106","212","580","170","459","228","353","515","590","401","144","336","133","463","110","339","491","53","405","289","272","Q022","98","33","Q003","191","109","410","253","440","551","72","2","346","229","546","Q031","36","385","575","13","494","326","55","586","125","665","83","589","612","498","617","74","40","387","77","481","613","592","266","317","263","126","112","574","85","Q025","189","432","369","97","68","619","Q051","10","651","Q056","57","528","225","629","390","135","162","579","454","668","245","Q044","Q048","286","159","254","141","70","188","174","282","255","654","Q032","381","472","562","407","18","518","578","218","503","Q013","258","449","465","521","517"]'),
+    (20, 2, '["431","187","611","186","Q009","185","86","415","111","485","Q023","600","21","119","413","23","140","545","155","242","194","284","404","6","180","96","436","15","335","296","662","593","32","388","514","295","653","455","206","Q024","Q011","220","166","526","19","213","139","671","647","450","273","314","439","Q001","311","364","632","601","377","448","489","73","82","664","670","492","537","539","620","Q002","42","315","276","200","427","642","163","341","51","134","378","312","Q053","52","563","9","136","95","520","233","298","394","325","280","43","59","268","497","420","271","411","456","570","318","Q054","406","583","510","657","265","588","Q052","389","94","78","192","130","101","100","534"]'),
+    (20, 3, '["285","248","164","157","386","27","239","150","659","453","28","584","399","167","645","156","193","402","310","366","184","Q055","29","621","527","480","5","60","3","504","219","652","345","556","576","641","656","7","451","62","615","147","587","356","452","243","495","58","Q040","658","Q028","4","550","88","16","67","38","Q017","540","648","Q039","261","667","211","31","269","236","17","643","414","149","524","466","323","Q036","561","122","173","418","507","473","624","128","631","171","506","Q026","384","47","118","637","Q059","560","343","447","484","89","158","Q004","204","483","443","541","34","513","115","71","Q042","270","571","533","227","46","26","278","650","12","257","607","444"]'),
+    (20, 4, '["202","279","321","226","75","65","457","393","116","554","409","238","342","24","292","Q020","Q008","525","247","559","547","355","623","178","566","568","231","357","379","161","595","92","370","644","142","322","84","426","20","542","564","474","479","Q010","569","154","160","567","148","290","177","113","519","91","442","553","435","424","197","66","344","529","565","131","48","582","618","313","535","334","264","610","Q027","488","660","294","347","596","633","Q034","616","382","581","626","423","215","256","417","8","536","635","Q047","531","14","363","121","655","493","299","627","320","143","598","606","93","329","337","468","45","433","486","Q018","324","127","203","605","80","425","445","302"]'),
+    (20, 5, '["566","287","352","538","283","649","428","421","214","458","601","277","Q007","Q024","Q050","403","181","424","Q037","217","103","628","Q049","30","469","Q058","321","190","138","552","464","430","331","634","398","441","54","350","630","640","87","477","594","501","49","232","198","597","25","308","380","210","638","329","Q033","502","80","Q021","Q006","666","351","332","596","591","Q019","419","543","446","511","531","304","4","249","614","512","581","549","397","37","99","379","Q043","482","306","41","221","416","189","230","604","294","383","359","259","328","12","548","258","Q012","470","201","183","56","609","434","196","570","422","Q051","309","207","603","290","330","175","608","104","405","452","559"]'),
+    (20, 6, '["31","262","225","151","362","658","298","508","240","Q001","241","Q040","403","182","Q038","Q056","197","251","301","6","385","572","319","153","44","314","310","525","15","333","Q022","549","55","393","9","372","488","661","17","Q046","58","538","Q010","358","Q006","87","Q015","460","105","Q005","245","97","462","246","102","85","305","669","180","491","386","411","267","499","74","359","Q023","81","99","45","540","227","280","647","459","476","166","504","622","309","626","103","200","66","90","302","668","528","537","24","11","446","643","288","224","378","376","666","275","233","234","295","400","534","652","307","23","573","129","46","465","110","594","505","Q033","303","509","631","339","291"]'),
+    (20, 7, '["454","78","76","484","375","522","168","432","557","40","404","25","494","28","136","337","82","521","582","348","634","473","77","576","621","29","438","662","193","216","425","257","328","571","242","474","236","322","401","273","205","150","511","408","79","283","223","191","316","217","564","453","113","548","363","595","14","287","532","71","159","262","52","229","353","157","374","368","Q039","347","461","442","381","659","154","628","Q025","72","360","509","219","50","18","535","384","124","26","519","625","Q003","382","207","286","541","267","324","128","486","19","480","620","255","413","160","Q055","301","533","13","608","554","228","139","Q020","457","Q030","377","149","132","270","164"]'),
+    (20, 8, '["568","366","213","617","418","345","619","317","252","265","433","Q004","597","Q053","274","656","612","203","185","665","88","69","315","629","336","300","448","642","161","115","199","261","70","131","561","169","118","Q027","64","431","210","7","116","618","230","630","34","163","633","569","162","266","137","487","311","38","312","513","289","330","178","592","430","671","483","8","653","183","481","Q046","176","Q052","304","380","352","39","472","84","121","343","402","407","360","249","572","383","284","553","646","271","51","342","158","460","Q031","35","117","112","235","147","649","181","636","466","638","394","30","184","33","593","567","338","122","111","67","420","42","187","106","215"]'),
+    (20, 9, '["500","536","Q019","640","598","506","421","422","660","68","440","644","104","244","395","190","60","340","546","427","439","410","Q057","192","48","5","574","269","102","132","325","Q029","75","398","268","362","134","92","Q042","423","524","Q060","37","552","Q036","444","Q032","447","65","206","Q049","Q028","2","140","174","175","318","125","565","1","455","144","297","558","496","59","586","497","406","508","479","654","599","419","392","177","272","463","615","73","53","293","331","98","86","320","170","583","409","458","146","490","16","515","502","306","542","Q050","648","367","173","578","155","224","254","391","429","20","182","62","477","657","326","323","108","471","354","489","396","91"]'),
+    (20, 10, '["603","85","138","590","256","485","32","135","141","606","Q026","172","275","670","503","664","Q002","518","79","335","651","456","482","313","47","279","632","305","399","57","449","327","Q041","514","90","520","Q022","349","248","239","372","148","Q015","523","109","114","467","94","145","556","204","142","334","194","282","Q059","51","238","412","332","443","637","119","616","389","516","346","Q017","Q054","299","259","461","188","414","565","Q058","3","264","495","498","344","623","641","639","Q037","469","260","212","Q035","Q013","Q034","96","562","356","437","587","570","156","Q048","27","614","507","627","281","251","291","263","Q021","426","140","56","355","120","415","361","492","44","43","107","573"]'),
+    (20, 11, '["595","661","610","207","377","543","609","605","434","607","93","613","Q045","214","167","486","249","71","515","78","Q011","276","89","Q009","217","347","369","205","530","20","588","512","63","231","650","227","312","579","499","232","322","540","591","230","21","652","189","Q007","455","54","243","373","186","263","655","49","344","308","191","143","292","56","539","459","Q012","527","404","537","126","647","645","402","Q008","555","288","635","50","559","560","663","390","271","611","671","Q014","397","16","128","Q035","4","510","600","Q030","229","Q016","589","218","351","435","445","596","364","388","9","501","550","147","222","253","533","274","421","624","107","462","478","277","464","408","41"]'),
+    (20, 12, '["293","125","240","518","161","53","95","298","252","435","528","198","551","316","663","97","544","548","Q010","260","201","Q052","Q029","61","87","130","235","209","302","69","620","376","36","494","83","34","517","104","241","185","449","221","607","303","246","584","74","183","76","Q006","388","199","233","333","563","Q018","358","625","585","440","356","341","285","296","41","Q058","561","387","109","606","602","261","283","127","428","433","493","Q057","Q060","Q047","89","258","47","575","345","100","526","123","269","470","436","411","545","220","247","491","547","482","357","133","558","Q044","Q034","468","383","506","22","29","529","447","589","Q043","614","1","359","385","599","651","Q024","420"]'),
+    (20, 13, '["286","35","492","Q013","375","103","278","371","571","206","Q004","153","642","208","46","156","130","348","256","667","166","Q026","88","Q031","281","Q054","12","351","534","489","105","117","658","576","417","422","451","276","273","350","171","448","560","154","180","244","502","285","232","579","450","465","32","196","176","365","379","81","556","Q059","194","75","100","604","143","149","543","396","219","80","8","77","Q037","290","212","581","393","522","441","403","Q033","508","320","444","268","294","108","373","549","314","659","211","113","475","622","262","562","387","Q055","222","101","568","202","135","370","498","17","188","228","474","429","226","594","98","546","617","63","349","157","209"]'),
+    (20, 14, '["361","670","7","Q003","451","488","254","352","237","313","301","431","Q053","82","339","26","65","136","243","343","619","15","10","529","299","318","Q028","520","473","257","485","178","174","Q036","628","414","424","179","57","423","572","38","648","234","632","631","236","211","231","557","192","138","580","11","378","42","287","389","584","251","240","289","410","198","175","585","637","Q025","583","213","55","272","397","386","28","634","297","315","578","475","105","170","405","58","280","325","Q019","577","630","119","641","Q018","531","500","111","215","115","159","99","238","368","24","442","223","66","384","616","250","480","Q027","505","603","193","168","259","668","292","419","390","137"]'),
+    (20, 15, '["566","523","92","656","516","162","80","331","443","172","327","329","503","418","114","310","186","495","479","611","554","261","40","73","574","507","311","524","552","468","150","535","452","319","660","650","446","79","323","569","493","395","428","120","163","Q051","182","643","54","425","382","237","43","438","60","437","Q056","202","497","116","598","471","553","282","392","394","336","210","458","460","505","640","Q048","655","590","665","536","649","406","235","39","200","6","45","Q049","133","86","639","131","368","255","203","646","476","Q038","31","485","84","124","328","68","321","625","412","550","627","62","504","434","Q023","454","23","467","601","525","27","72","59","591","545"]'),
+    (20, 16, '["581","307","157","30","Q042","612","121","85","372","298","337","354","462","654","613","544","117","542","326","220","277","Q032","Q012","355","248","93","Q039","439","Q024","126","662","420","265","19","Q007","330","477","587","371","Q005","563","Q026","37","94","229","Q055","110","381","409","148","173","24","501","346","17","427","Q043","617","407","225","296","551","258","525","116","592","35","43","25","515","302","426","197","244","300","626","190","416","73","638","555","246","76","61","615","123","403","633","252","618","Q002","36","532","667","401","267","18","Q008","95","48","446","646","308","478","Q040","353","564","644","521","304","484","271","473","623","218","264","309","295","139","184"]'),
+    (20, 17, '["Q001","597","635","327","548","332","22","479","236","527","286","472","132","558","569","405","106","Q050","Q009","624","192","610","226","205","620","487","Q030","612","50","33","664","404","541","306","379","Q016","265","158","608","166","338","Q014","636","70","Q039","369","335","413","Q011","Q021","504","345","269","416","363","91","615","274","498","594","168","464","125","239","342","666","398","357","9","539","82","546","Q023","510","602","461","145","110","642","2","378","160","Q046","341","518","245","7","4","88","218","164","14","177","144","213","188","291","94","141","77","509","657","334","29","214","445","377","669","129","653","350","587","270","540","536","347","87","52","538","499"]'),
+    (20, 18, '["279","411","Q059","204","25","614","313","661","250","513","131","483","245","598","542","562","450","497","568","470","41","163","58","45","133","289","Q020","324","342","441","400","Q033","199","Q058","406","486","526","Q017","481","207","134","436","391","459","469","142","187","31","609","3","543","490","449","463","415","155","645","Q006","263","413","488","399","254","53","329","424","554","71","573","266","180","519","656","65","565","455","47","322","362","171","83","348","386","Q015","89","510","465","496","173","629","422","234","Q005","503","520","429","566","156","384","69","453","107","64","380","349","500","316","146","67","216","93","284","361","227","185","466","241","138","312","247"]'),
+    (20, 19, '["196","341","Q036","426","124","251","360","402","Q057","583","432","81","221","257","582","74","647","398","15","Q056","570","281","145","599","78","16","288","607","409","567","18","438","34","354","596","10","222","111","328","Q022","359","604","143","294","370","137","11","595","96","376","331","605","528","264","533","Q027","5","408","272","334","Q035","Q034","388","653","23","Q015","224","606","600","147","592","174","Q040","530","671","523","142","365","522","Q010","385","430","49","151","315","321","Q003","531","283","561","75","537","514","55","529","622","547","Q041","580","563","108","573","578","333","115","340","54","112","458","564","253","439","51","209","57","127","290","457","355","659"]'),
+    (20, 20, '["44","526","255","Q004","278","167","38","590","121","556","417","153","391","364","186","197","650","Q044","130","Q051","492","293","421","220","172","382","Q028","149","454","432","366","20","118","555","136","128","323","553","109","609","343","539","394","346","651","483","635","68","344","256","571","338","399","616","72","658","Q025","179","559","Q029","26","547","176","494","557","206","162","203","295","275","652","305","501","482","200","217","Q037","296","103","212","471","317","113","514","122","86","140","233","325","619","98","668","311","59","521","320","577","159","621","648","297","Q008","303","589","575","148","8","588","626","491","597","181","60","452","64","367","516","611","232","586"]'),
+    (20, 21, '["447","464","356","Q060","Q018","126","406","95","532","541","662","511","435","189","161","268","21","141","30","Q017","52","307","Q031","2","393","330","208","512","448","419","407","57","Q001","412","191","210","Q043","Q045","177","490","283","193","343","339","298","Q038","Q022","442","267","423","513","405","433","282","289","403","663","99","374","150","242","508","249","453","629","Q054","306","280","477","149","Q053","608","668","517","560","375","183","101","425","194","404","476","Q052","581","Q047","460","327","28","Q044","1","344","102","551","235","305","13","76","135","469","593","285","389","440","90","381","Q032","104","230","114","12","169","205","569","603","332","641","456","Q020","81","299"]'),
+    (20, 22, '["Q054","600","29","566","642","150","250","63","601","392","80","585","119","40","410","465","333","83","314","631","Q048","Q025","558","666","576","431","655","636","659","466","637","613","664","6","252","336","312","213","646","596","397","197","Q053","395","175","113","527","669","46","102","377","324","471","100","512","390","22","11","171","275","74","649","536","474","443","352","134","451","485","212","304","51","56","61","670","277","272","201","434","66","97","215","36","579","618","358","242","524","545","84","326","253","480","444","85","556","200","32","Q012","265","288","214","644","463","565","588","302","428","534","70","630","Q049","219","320","276","617","5","4","176","559"]'),
+    (20, 23, '["263","445","544","533","534","40","231","379","154","147","216","317","408","199","530","583","167","479","574","137","571","128","441","300","310","467","271","20","Q021","498","496","572","146","484","506","578","92","7","462","266","156","139","473","532","Q036","293","360","491","117","401","552","Q011","188","625","273","351","294","238","164","87","229","356","383","Q057","632","48","78","602","42","280","507","Q023","591","Q009","434","648","55","548","315","Q060","246","257","318","31","124","643","Q056","239","538","626","645","489","Q028","Q046","21","380","Q007","3","189","67","56","657","158","91","347","361","72","419","335","23","509","373","319","258","240","116","115","568","350","655"]'),
+    (20, 24, '["671","476","112","495","370","502","88","255","292","337","241","97","542","96","196","202","225","Q029","65","549","Q037","577","Q026","233","367","Q014","480","520","119","500","Q051","301","647","425","582","323","624","606","14","307","198","86","Q052","Q055","190","178","Q002","599","Q032","247","Q030","402","77","363","228","281","468","482","174","Q058","345","653","262","352","Q035","226","429","Q008","396","140","79","223","413","270","Q004","109","224","59","17","348","623","184","589","628","69","71","62","384","151","621","129","488","386","390","570","19","290","633","211","563","472","446","322","243","131","260","470","114","459","611","170","50","540","389","665","204","Q016","424","660","461"]'),
+    (20, 25, '["620","308","135","219","111","231","438","217","90","191","15","518","417","584","381","587","329","400","192","173","309","478","638","497","Q050","129","Q019","388","452","567","Q013","303","580","314","182","120","Q005","244","127","Q040","494","614","598","661","185","287","640","436","38","426","10","525","201","47","372","123","44","316","18","19","43","118","103","531","16","340","435","89","396","546","Q027","1","612","610","58","481","162","448","562","221","187","560","509","639","33","108","510","256","37","Q024","669","601","132","100","463","12","387","284","157","75","418","376","138","73","297","Q045","656","24","411","412","125","380","375","468","550","632","349","605","105","515"]'),
+    (20, 26, '["104","503","353","203","355","62","141","628","Q025","454","336","282","53","261","13","561","592","440","517","49","158","369","Q034","9","442","444","107","357","291","146","22","163","41","313","552","584","72","48","400","285","25","161","371","539","449","604","192","507","234","366","270","332","Q029","148","645","398","94","45","496","30","Q007","34","521","616","93","249","362","298","110","420","26","126","505","543","Q024","58","274","338","537","123","24","402","254","455","321","593","555","Q027","64","109","663","359","304","328","160","516","541","83","590","70","78","218","423","499","395","666","182","330","575","457","Q041","299","421","289","559","329","637","Q018","236","106"]'),
+    (20, 27, '["494","415","35","Q031","568","27","311","446","508","440","529","172","73","409","339","456","670","153","464","149","407","77","297","169","Q001","140","467","8","Q016","222","581","181","634","143","101","506","Q012","168","547","443","636","Q017","Q003","354","Q057","348","248","312","9","358","Q059","236","68","294","207","25","644","420","163","259","210","85","535","399","557","346","227","662","Q047","627","Q006","615","671","208","364","526","603","133","492","351","63","414","431","286","643","155","269","230","Q038","65","313","652","646","187","159","609","633","482","490","406","193","99","325","16","422","368","585","Q009","497","635","511","378","474","278","475","528","Q033","345","Q039","340"]'),
+    (20, 28, '["Q020","319","489","88","283","52","45","217","295","427","147","365","237","145","14","551","267","17","381","658","553","128","204","Q042","404","439","235","271","179","292","228","251","260","654","Q055","107","274","113","487","121","322","54","206","144","151","622","504","374","608","273","586","471","50","479","437","Q014","Q028","302","500","110","540","393","513","447","342","46","512","320","Q013","647","519","36","81","493","76","433","266","308","279","460","583","450","620","485","91","424","31","579","373","293","122","166","39","306","177","Q030","391","667","57","594","651","410","416","377","269","275","476","173","469","215","262","378","98","430","324","554","486","229","595","82"]'),
+    (20, 29, '["242","374","511","657","337","384","301","Q039","642","369","20","573","567","125","335","574","257","218","323","426","441","82","264","491","206","265","245","246","607","422","148","473","358","Q036","30","652","544","282","650","575","383","205","354","176","531","314","466","318","114","660","203","310","537","194","116","287","261","570","453","87","428","350","477","522","524","244","166","617","66","416","538","523","448","458","12","303","386","418","103","68","536","484","514","615","649","576","341","Q060","618","5","502","594","430","47","51","597","Q056","170","385","Q031","549","321","49","185","7","630","415","220","525","67","626","258","499","474","Q011","648","317","184","Q022","221"]'),
+    (20, 30, '["565","142","296","515","334","326","Q040","432","664","111","279","564","239","132","480","198","28","619","305","495","23","597","461","403","566","238","75","191","Q002","199","601","423","668","463","503","259","470","118","255","419","Q032","590","154","188","Q034","655","167","268","360","207","397","84","213","95","629","245","104","32","670","343","29","61","74","501","186","472","189","162","41","631","548","Q026","417","307","405","181","174","80","571","669","288","164","370","284","596","Q010","447","171","546","349","530","442","71","602","563","183","197","641","120","347","387","483","527","223","79","59","1","156","410","572","37","55","225","610","263","40","534","Q021","94","180"]'),
+    (20, 31, '["216","344","324","251","Q059","427","558","126","232","640","135","Q045","178","Q005","459","133","409","234","488","Q037","580","11","80","556","333","635","75","542","35","664","639","392","Q023","533","33","260","272","56","27","106","498","300","641","177","466","86","Q043","53","Q048","Q022","516","Q010","518","401","489","Q019","653","462","384","382","280","244","659","252","509","613","38","479","372","131","638","Q053","510","582","281","569","277","144","Q015","335","233","60","497","Q058","327","2","507","99","587","578","Q001","Q051","362","276","18","227","264","77","256","394","656","439","589","Q033","117","391","157","Q038","200","455","451","78","155","29","209","243","371","201","215","250"]'),
+    (20, 32, '["445","119","649","43","616","285","331","219","115","268","481","532","Q002","65","Q054","363","42","425","153","346","193","74","51","224","139","124","Q023","134","387","493","376","105","421","361","520","449","299","Q047","Q052","130","555","400","Q042","312","519","359","137","22","491","237","637","172","406","614","485","315","388","326","386","184","4","550","379","577","136","Q035","53","97","Q027","252","283","230","286","465","150","667","517","396","458","634","273","271","325","429","666","34","Q013","212","383","6","599","625","240","504","343","328","565","619","352","508","92","450","Q029","606","663","298","478","390","351","561","671","595","290","395","408","309","129","437","475","81"]'),
+    (20, 33, '["151","522","460","270","59","180","269","591","278","319","640","503","130","140","557","275","286","308","15","Q008","63","356","Q004","454","642","316","612","407","464","141","442","412","349","526","295","562","345","69","190","603","226","484","569","647","350","210","169","502","543","627","121","281","657","124","161","605","535","Q044","401","440","62","486","287","380","515","162","93","311","632","518","35","579","444","639","368","96","624","506","376","253","646","448","73","39","272","492","551","297","512","394","488","473","310","102","382","617","413","411","188","353","236","Q058","280","98","120","198","115","108","366","549","116","90","456","249","42","44","426","592","608","570"]'),
+    (20, 34, '["58","Q034","467","Q035","604","4","8","648","385","187","Q030","537","112","Q006","117","435","86","57","588","76","436","629","211","365","223","125","Q009","196","336","571","101","38","89","636","199","Q041","541","210","425","10","405","403","19","122","590","202","290","160","655","228","327","477","472","355","68","611","304","420","452","402","Q025","618","600","Q007","Q056","3","329","265","398","598","538","434","348","616","Q053","525","Q049","469","330","407","560","274","26","579","291","209","192","225","82","422","610","661","168","337","189","Q052","220","54","593","114","217","123","88","322","645","338","443","109","254","276","91","72","521","Q017","179","381","438","Q020","52","288"]'),
+    (20, 35, '["332","69","536","320","46","231","487","501","333","183","Q050","302","377","149","347","230","66","127","Q031","Q037","584","542","596","633","172","56","554","665","Q046","621","414","516","258","89","495","389","545","446","261","612","12","468","64","194","586","668","154","222","367","650","41","620","524","342","20","340","558","213","Q018","36","100","457","212","176","654","Q059","79","241","357","248","375","606","221","191","147","455","614","587","294","17","256","Q051","13","15","5","364","566","344","166","85","500","334","168","146","431","296","631","295","433","92","50","143","107","602","175","208","40","510","341","Q054","505","465","24","266","136","486","658","461","564","663"]'),
+    (20, 36, '["207","568","156","Q049","645","Q038","539","604","599","Q021","Q003","238","Q014","369","408","552","103","459","559","16","436","478","353","483","67","83","623","131","197","354","47","550","523","60","Q033","70","185","643","Q016","548","289","529","99","111","449","358","528","163","164","37","81","159","Q015","7","235","14","218","267","138","48","453","544","531","Q040","255","101","404","233","Q060","219","659","644","150","607","247","208","412","Q026","Q055","432","379","217","520","480","578","170","513","632","161","173","104","200","292","263","317","503","547","305","622","34","199","306","Q028","214","38","651","630","21","Q012","314","553","581","158","31","362","Q024","26","496","481","624"]'),
+    (20, 37, '["361","374","243","636","33","546","137","25","304","540","Q019","594","211","23","48","106","201","93","565","319","299","71","140","14","328","402","85","585","28","366","662","571","45","21","309","406","483","653","43","157","Q023","204","51","232","419","373","405","313","Q057","433","282","Q022","613","53","628","Q001","505","600","108","441","409","229","55","447","492","471","438","661","193","573","536","142","Q011","73","31","250","609","128","Q045","301","321","264","Q010","631","312","126","293","523","246","537","281","656","490","174","331","153","489","365","545","257","509","556","668","514","423","77","468","143","375","561","392","634","118","323","Q029","241","110","437","311","134"]'),
+    (20, 38, '["111","259","240","352","462","127","216","344","611","428","Q054","576","654","647","355","482","32","664","360","Q051","307","421","529","109","302","583","586","22","203","135","3","335","291","Q026","559","94","100","414","Q036","566","104","98","262","47","642","370","87","638","84","226","425","467","399","582","665","498","Q002","65","563","186","410","368","145","430","275","Q041","24","424","558","330","268","315","239","54","2","Q039","148","78","592","476","113","178","185","652","343","182","474","133","80","Q047","18","231","316","572","6","530","466","626","339","532","163","58","671","397","617","345","431","Q003","74","227","504","393","378","567","390","440","587","494","253","9"]'),
+    (20, 39, '["380","119","137","461","209","356","157","149","648","244","151","97","434","644","534","327","Q032","263","411","105","30","274","601","388","346","582","204","593","399","622","669","589","Q027","90","303","350","183","473","424","32","233","464","543","270","562","202","623","181","16","294","Q019","Q007","459","191","533","64","19","55","49","391","621","Q011","249","470","235","331","34","8","421","113","456","Q059","245","347","117","103","197","177","309","518","206","224","452","110","658","Q048","221","342","341","160","524","501","660","633","670","552","485","377","450","488","17","595","138","359","382","308","186","Q050","418","432","610","598","252","91","192","376","619","296","284","650"]'),
+    (20, 40, '["408","442","340","277","102","57","666","237","170","146","89","278","Q030","30","266","372","169","9","422","311","272","652","72","419","299","472","497","396","194","182","528","8","498","184","448","Q004","542","Q018","546","147","569","36","641","215","207","469","261","248","92","26","455","630","615","123","457","597","176","463","549","371","598","234","326","386","486","570","324","620","395","444","413","50","271","398","403","Q025","482","526","357","27","121","404","20","254","43","321","591","561","129","Q013","332","649","493","531","667","154","7","39","384","320","435","616","479","416","Q006","40","439","507","670","214","238","656","407","354","289","605","550","511","574","4"]'),
+    (20, 41, '["460","243","279","25","627","659","52","229","474","540","502","519","172","95","42","449","522","465","136","Q014","298","61","257","348","512","Q039","265","383","292","646","Q021","584","Q009","504","458","415","Q056","60","247","389","580","162","139","260","283","70","168","553","588","236","230","76","215","94","535","400","477","429","258","86","527","1","379","218","28","29","521","99","378","290","155","568","662","581","205","107","499","356","174","93","180","167","Q028","475","349","515","517","352","150","Q053","554","120","338","491","Q024","614","541","18","615","142","269","329","210","75","Q060","585","618","607","446","177","223","122","640","286","651","310","251","79","625","262"]'),
+    (20, 42, '["560","406","557","212","Q057","643","534","141","252","179","131","189","344","Q042","454","657","423","386","178","282","159","59","80","256","Q028","56","125","351","350","530","603","404","190","217","295","495","555","144","347","Q005","166","412","Q055","364","506","88","445","Q058","608","255","114","339","473","638","490","297","33","288","462","426","Q032","267","41","325","334","Q025","Q044","300","565","6","Q031","97","496","556","298","385","228","130","46","635","Q008","158","427","192","577","606","128","461","420","596","663","655","171","513","401","Q037","116","198","200","281","10","367","222","358","11","337","479","Q030","149","66","175","Q046","417","451","132","196","397","173","82","314"]'),
+    (20, 43, '["Q052","497","Q002","539","641","527","29","328","484","612","433","242","366","Q027","72","510","538","632","289","409","594","476","572","492","Q024","46","254","61","112","575","579","338","144","78","590","276","Q033","609","71","480","301","373","148","349","304","324","188","225","108","583","38","363","453","560","563","602","621","551","308","Q029","645","471","600","258","628","206","23","325","548","513","96","525","247","567","487","318","67","213","84","44","35","Q038","313","336","115","76","273","381","280","521","13","323","405","155","135","581","124","322","161","413","58","2","12","500","140","63","Q043","Q040","227","Q021","571","564","Q016","439","Q010","380","580","345","494","1"]'),
+    (20, 44, '["574","13","220","614","668","111","232","639","145","55","575","280","359","213","294","52","Q034","573","Q003","Q005","112","532","264","503","535","307","476","355","568","14","669","203","601","424","109","491","459","236","132","Q017","556","537","394","74","239","Q041","Q001","119","98","372","235","103","187","652","154","Q058","475","226","516","Q022","508","201","468","540","67","318","501","426","75","222","371","441","547","533","384","592","199","629","291","637","116","576","302","343","393","44","51","115","561","Q035","511","240","Q036","229","363","361","Q023","Q052","531","387","603","477","7","478","626","87","482","599","5","62","316","557","514","470","Q044","396","522","636","410","483"]'),
+    (20, 45, '["133","284","68","512","489","323","Q015","37","138","570","27","379","333","293","524","Q050","418","443","306","257","81","173","653","5","403","156","595","376","627","271","Q026","431","11","499","16","337","562","611","555","Q060","145","341","326","642","587","104","85","458","411","369","205","24","549","53","137","559","157","419","643","Q020","620","Q049","452","447","381","578","654","Q045","287","320","191","315","589","69","159","427","202","529","187","54","15","244","277","Q048","Q043","434","282","421","327","455","31","520","467","183","Q055","45","216","219","332","57","273","48","285","129","392","647","541","378","261","Q012","275","249","495","178","263","416","22","102","83","193"]'),
+    (20, 46, '["283","630","669","460","585","414","143","177","646","Q019","660","60","86","105","260","402","589","169","Q054","90","Q047","269","100","639","Q056","305","290","604","542","428","420","597","Q004","110","307","346","329","348","285","444","523","538","220","36","622","197","Q013","566","171","593","313","188","516","617","Q006","Q020","430","162","221","95","509","Q007","515","395","20","97","492","77","528","210","367","47","71","17","382","91","413","648","609","391","250","449","554","518","224","525","185","500","530","147","238","619","248","35","465","464","640","286","249","397","201","272","644","579","472","160","339","73","164","312","416","9","485","383","215","65","670","68","41","438"]'),
+    (20, 47, '["39","344","315","347","242","335","206","167","189","316","620","573","117","385","664","174","270","208","536","494","193","552","446","432","194","537","425","130","190","151","233","Q040","646","256","76","362","113","498","203","370","300","653","466","211","231","400","543","506","212","Q046","Q042","127","2","126","103","292","49","510","553","200","289","631","131","488","330","322","Q037","658","657","268","612","596","480","568","42","228","608","671","288","462","19","287","246","223","Q057","599","442","651","Q024","445","569","349","388","43","312","659","334","94","120","520","265","219","10","276","626","267","106","638","329","84","75","422","79","21","Q016","254","565","134","107","253"]'),
+    (20, 48, '["591","308","375","440","150","225","88","274","Q035","Q009","296","163","153","407","237","594","453","209","471","175","662","454","74","429","207","245","306","66","415","665","496","333","172","490","12","504","Q014","148","508","Q038","649","360","536","293","244","184","450","70","633","544","505","386","Q051","443","Q053","283","118","176","548","218","463","607","342","340","558","34","613","57","384","299","374","83","Q008","359","666","584","180","314","577","59","634","635","423","23","294","31","82","448","464","350","354","317","78","507","479","667","348","18","196","353","125","435","570","377","50","390","255","80","550","533","610","503","Q022","487","251","409","26","451","Q026","319"]'),
+    (20, 49, '["264","139","199","545","547","540","298","229","410","668","274","123","619","656","398","Q002","Q039","586","558","661","655","645","64","4","53","192","28","73","578","405","227","408","278","Q059","240","320","632","364","571","25","Q007","616","566","399","509","310","452","295","532","147","67","259","101","114","161","434","Q032","168","309","141","389","615","486","569","204","1","435","583","121","448","35","555","420","576","426","381","483","217","20","473","124","331","484","Q034","549","241","365","122","368","281","447","234","624","297","650","16","Q028","625","623","231","261","6","401","198","652","387","393","501","457","328","539","618","29","534","605","321","181","303","590","40"]'),
+    (20, 50, '["519","392","163","554","25","404","606","176","108","Q011","235","330","242","Q018","188","559","373","352","33","385","588","136","563","418","671","262","607","Q021","601","Q031","256","502","87","477","378","265","Q023","514","186","38","227","456","126","518","553","616","411","89","608","66","112","345","304","561","Q017","321","461","98","236","429","230","Q043","8","552","275","562","191","469","153","279","Q012","436","311","128","170","55","647","642","56","117","517","564","412","437","214","500","417","96","582","342","158","185","62","481","596","635","491","394","403","303","377","129","47","357","335","179","459","32","493","159","3","358","557","379","617","355","406","99","356","446"]'),
+    (20, 51, '["63","343","567","Q036","556","252","223","Q029","388","598","637","290","201","524","140","93","526","628","92","27","325","183","542","266","142","72","272","Q053","268","357","167","Q055","24","43","Q025","301","139","85","419","146","Q008","81","Q015","69","14","232","58","21","351","471","184","255","336","65","107","546","156","531","535","474","605","52","581","522","258","91","214","115","109","372","45","Q059","529","631","278","590","478","603","106","212","193","497","369","Q033","30","363","433","648","Q049","409","551","15","354","182","243","361","34","475","Q041","166","629","59","376","260","149","277","251","133","595","368","319","Q035","137","286","602","Q046","485","663","499","79"]'),
+    (20, 52, '["548","360","327","442","253","9","100","315","302","19","208","177","111","Q023","69","239","528","120","101","114","336","657","226","547","196","348","411","104","564","512","573","395","54","170","180","23","492","Q027","296","Q030","454","271","361","209","459","439","585","668","222","654","400","94","77","364","293","468","237","587","392","Q050","Q058","408","434","375","322","347","601","431","15","394","311","520","313","248","51","79","Q044","594","282","415","476","489","Q028","352","460","297","530","Q011","570","495","207","630","245","651","236","467","402","351","263","250","659","135","233","661","515","Q034","18","187","57","323","550","371","453","156","221","511","Q048","413","641","216"]'),
+    (20, 53, '["458","Q025","Q020","391","217","507","579","374","257","422","130","213","428","534","280","438","Q057","47","Q004","666","643","161","389","Q056","249","148","650","572","559","86","497","636","533","Q047","85","121","383","574","339","58","660","455","309","44","16","578","46","324","308","3","157","258","614","48","621","627","186","228","51","32","24","298","359","399","656","623","125","151","440","588","110","523","543","162","404","205","4","669","17","416","670","326","521","56","358","575","211","292","64","164","538","197","Q031","65","215","221","281","81","Q006","200","452","118","662","312","189","593","571","629","287","173","270","463","50","301","174","546","450","551","470","478"]'),
+    (20, 54, '["244","410","482","92","Q052","491","108","Q036","Q001","506","150","353","457","541","Q051","Q060","288","271","611","479","486","Q040","82","29","465","72","560","620","235","124","449","305","345","487","122","36","474","444","665","113","142","494","199","421","396","39","637","Q010","592","510","513","496","515","390","525","597","285","537","45","7","28","393","261","577","644","488","70","172","147","283","Q005","332","210","Q033","425","423","519","664","628","600","190","356","527","269","134","532","649","380","490","642","76","254","259","241","136","595","22","310","640","344","366","116","284","240","314","2","8","606","267","648","60","20","154","Q042","472","141","604","667","424","Q054"]'),
+    (20, 55, '["46","Q032","140","295","506","608","105","518","40","377","266","646","504","179","599","276","48","264","500","338","350","247","33","335","313","387","580","84","90","238","355","652","405","663","71","111","476","206","31","516","471","323","334","565","49","383","613","232","386","528","536","619","275","12","102","132","26","517","87","325","10","61","246","89","589","503","381","Q003","34","Q029","168","378","658","62","469","175","379","466","587","610","138","498","568","202","655","406","25","166","149","388","337","373","Q019","220","Q022","306","443","143","119","634","22","Q009","37","321","41","171","83","7","227","125","13","272","Q026","349","489","430","638","540","647","103"]'),
+    (20, 56, '["135","Q015","11","194","365","268","Q030","128","407","131","591","169","144","204","557","299","539","243","231","370","230","440","99","80","480","586","Q017","576","566","Q037","505","513","633","330","Q003","307","73","468","Q014","97","671","615","437","117","Q054","127","567","30","68","54","Q038","17","438","603","267","632","Q024","602","274","327","414","317","280","158","279","197","617","531","342","446","423","526","464","109","160","155","512","229","482","514","123","436","Q039","263","626","396","441","67","384","75","203","412","625","Q010","Q027","402","461","618","113","77","544","126","Q056","95","426","Q021","340","63","641","596","225","124","116","38","219","Q052","343","198","447","Q009"]'),
+    (20, 57, '["53","333","659","445","525","521","656","546","6","289","69","590","288","107","397","614","545","23","431","251","40","192","178","354","Q055","582","218","Q045","390","104","291","609","401","451","622","244","304","569","5","584","473","563","Q034","Q018","119","427","81","417","89","Q031","318","256","612","245","212","74","96","493","98","456","184","320","455","491","639","636","159","362","234","224","650","466","598","462","403","260","Q016","367","294","150","78","376","182","290","4","592","655","137","145","Q012","583","433","349","398","93","570","481","302","316","581","88","502","300","129","624","146","485","233","509","483","181","322","252","273","161","329","380","452","653","143"]'),
+    (20, 58, '["29","508","109","38","222","26","297","153","108","502","369","666","299","110","344","399","617","59","424","520","417","373","581","9","253","44","671","435","487","559","339","648","15","565","312","261","524","517","201","140","346","207","Q002","Q058","42","270","334","176","101","556","515","329","257","631","421","341","285","561","597","Q013","193","575","664","319","609","133","420","507","315","56","187","147","Q001","55","516","262","662","105","316","523","Q057","545","87","407","218","562","200","175","Q060","484","460","599","386","442","428","362","503","246","601","286","477","331","308","43","504","594","338","Q043","660","295","382","605","Q047","Q046","93","275","237","14","432","Q006"]'),
+    (20, 59, '["148","505","236","353","Q011","114","102","50","328","Q012","163","365","613","571","73","157","336","389","188","522","131","501","294","265","348","326","225","534","112","Q008","413","463","45","416","447","591","542","549","Q017","670","419","258","548","553","569","287","493","Q051","479","558","620","279","458","283","444","189","219","402","142","409","645","622","100","103","560","665","351","411","276","74","551","223","186","209","Q004","272","240","182","647","31","300","355","191","154","Q059","627","206","481","465","213","194","625","634","162","368","68","115","630","203","134","Q026","595","235","628","441","474","633","86","508","19","282","582","Q022","Q053","317","311","292","252","352","138"]'),
+    (20, 60, '["385","Q024","643","425","618","607","568","387","377","269","10","541","66","555","Q055","382","Q032","79","327","271","160","146","52","Q036","530","36","304","20","525","537","629","340","356","Q058","185","512","616","164","529","492","43","310","33","554","23","640","564","654","98","173","183","1","78","Q037","454","242","527","498","Q029","403","Q052","583","247","422","450","357","97","30","284","533","239","497","448","18","624","77","511","472","Q035","584","13","24","215","324","577","404","345","Q060","94","180","128","495","585","Q042","375","381","395","661","343","611","642","28","11","Q021","298","439","171","303","412","333","141","51","249","598","70","Q018","488","Q007","35","494"]'),
+    (20, 61, '["376","Q041","406","88","16","293","449","Q030","635","480","610","615","529","519","371","638","310","653","76","539","482","560","Q059","262","Q027","486","100","135","91","35","576","578","459","322","228","189","384","41","422","469","Q005","429","538","137","5","211","106","453","614","644","658","122","168","32","475","149","485","306","496","250","167","Q050","255","174","157","391","494","192","410","Q025","566","205","113","217","Q028","552","444","426","544","72","156","668","37","230","319","567","451","590","172","549","127","669","606","144","289","64","586","Q056","419","145","53","651","457","Q044","85","204","392","Q033","57","46","467","543","99","550","269","621","423","162","Q010","421"]'),
+    (20, 62, '["462","592","280","238","602","116","579","650","350","360","341","58","82","54","4","159","483","67","80","155","380","12","394","154","438","75","464","552","600","139","473","367","630","Q038","659","212","166","Q054","632","443","259","177","199","612","176","130","221","463","Q039","547","263","526","666","389","49","646","297","446","314","Q007","2","626","Q045","455","210","8","208","435","536","178","118","499","119","220","637","132","65","398","542","337","572","358","47","434","200","588","281","302","332","405","442","652","420","663","55","461","3","347","63","254","393","110","532","39","Q023","589","Q013","50","593","359","92","651","256","190","234","267","233","374","320","Q040"]'),
+    (20, 63, '["324","141","649","477","623","408","490","331","466","Q008","224","401","485","454","Q053","75","448","121","1","307","286","361","301","566","97","574","536","114","432","514","219","484","115","668","470","169","459","Q003","535","427","Q037","302","Q051","486","641","Q025","128","196","479","111","245","445","619","89","Q014","671","604","620","364","21","27","440","415","278","22","366","546","611","275","69","214","257","318","62","595","Q027","Q009","271","140","138","218","123","71","Q031","248","321","543","589","573","241","355","354","117","616","646","664","Q020","232","338","425","Q016","410","587","478","230","170","523","185","403","Q028","42","47","78","556","521","Q015","7","282","510","313"]'),
+    (20, 64, '["266","309","657","402","533","264","25","60","323","Q024","516","273","198","Q035","507","258","396","504","468","61","151","291","413","83","429","17","179","506","Q006","644","260","Q049","531","456","90","558","400","81","197","363","430","158","473","Q019","9","524","6","370","16","378","329","414","59","405","307","94","107","48","18","361","20","58","Q004","458","96","663","346","639","12","388","243","45","498","Q021","298","500","95","349","254","612","522","73","227","311","596","181","296","231","424","226","85","68","294","540","330","277","437","580","372","120","397","217","207","80","34","Q005","Q057","561","648","202","30","91","66","471","84","281","436","449","136","71"]'),
+    (20, 65, '["229","304","253","572","658","418","439","534","235","343","548","104","192","252","109","371","259","489","Q002","383","656","636","153","472","184","581","568","51","201","14","635","618","341","265","567","174","345","488","431","Q026","553","599","331","5","221","315","27","52","31","Q016","584","126","492","643","284","41","476","518","657","98","569","163","578","178","236","414","124","565","509","379","215","172","278","559","285","528","156","225","223","667","74","372","510","125","290","99","188","191","382","274","196","150","309","250","216","357","Q048","288","62","180","238","359","594","335","293","339","451","305","Q045","213","76","102","204","173","Q040","465","554","537","467","244"]'),
+    (20, 66, '["207","328","478","123","481","134","59","497","476","Q057","222","117","640","607","32","433","251","142","647","384","325","400","96","183","57","570","Q038","347","257","247","638","210","272","503","19","287","508","385","461","571","292","390","101","420","344","655","242","167","190","609","411","166","348","13","579","660","563","10","Q054","652","356","626","Q032","608","139","598","143","305","446","65","642","Q022","199","Q036","631","42","25","370","562","488","79","29","256","115","Q051","295","669","228","513","121","4","291","442","200","387","255","539","224","495","525","268","118","77","583","395","82","551","409","26","527","394","392","132","131","Q014","616","133","441","548","8"]'),
+    (20, 67, '["Q039","575","491","129","342","628","493","72","590","670","515","Q003","549","408","634","360","351","447","450","56","397","406","Q001","300","352","404","501","522","417","474","465","Q059","266","324","Q046","517","426","Q029","364","Q023","Q030","88","103","557","610","585","423","375","234","373","17","145","386","573","399","Q048","55","607","137","540","464","323","621","209","158","40","521","124","416","279","148","514","24","15","580","518","326","261","Q034","412","60","317","87","320","603","637","308","151","286","617","556","312","232","182","206","636","558","365","314","597","376","283","163","480","147","391","624","303","36","107","177","270","162","645","327","187","555","203","297","369"]'),
+    (20, 68, '["653","48","429","547","127","180","615","401","161","191","407","192","9","662","462","644","316","Q020","505","74","147","197","173","383","346","639","92","221","606","350","520","649","545","440","495","38","326","299","613","601","51","150","110","Q047","330","Q005","482","Q027","532","381","452","222","37","57","421","358","227","593","185","354","149","212","434","220","78","436","193","566","302","487","342","334","611","168","280","277","93","582","Q018","337","53","605","58","141","129","374","202","Q033","6","240","86","438","231","Q050","65","388","288","Q026","393","188","273","233","600","108","335","604","105","265","144","170","550","289","61","403","157","249","235","501","214","666"]'),
+    (20, 69, '["530","39","153","499","502","91","20","347","345","94","166","516","33","211","313","Q002","169","519","395","404","269","298","497","270","84","659","483","510","16","49","409","275","668","320","598","486","424","552","66","418","226","576","457","63","274","463","114","432","30","614","361","2","500","289","172","125","524","43","Q022","315","595","443","665","332","670","210","133","Q060","631","243","466","45","366","237","512","Q011","448","130","198","103","602","427","Q038","469","7","663","126","362","363","73","406","106","375","199","588","459","186","402","407","241","471","88","437","34","159","422","216","553","416","Q058","75","570","538","50","262","Q015","113","22","597","Q004"]'),
+    (20, 70, '["415","81","79","650","468","131","26","176","290","321","646","541","629","632","19","307","Q012","496","122","181","651","430","329","208","Q019","40","276","439","579","475","31","561","229","633","515","536","189","318","Q030","526","322","87","296","35","336","333","630","95","174","484","456","531","261","116","213","647","412","509","135","446","563","391","327","411","Q008","542","Q056","28","71","23","528","Q053","353","461","56","344","154","175","248","Q001","574","356","568","68","100","368","419","433","Q036","544","587","620","112","384","Q052","Q037","53","338","641","583","447","490","Q013","18","306","350","254","470","398","425","111","577","47","311","367","120","83","396","Q017","Q044"]'),
+    (20, 71, '["Q055","263","15","440","246","413","Q043","171","59","177","271","390","378","282","98","Q009","252","205","379","236","220","11","164","Q041","520","108","543","244","230","3","145","503","325","564","431","12","551","455","442","343","Q049","239","465","52","312","377","460","642","569","67","104","513","354","504","458","64","485","421","464","21","601","299","206","89","70","494","1","308","82","623","535","85","573","622","467","596","46","523","654","340","578","397","245","281","537","146","136","452","162","Q021","160","179","183","Q007","479","584","667","555","453","339","559","565","Q058","625","283","304","301","161","336","606","511","117","120","194","629","608","265","533","251","603"]'),
+    (20, 72, '["405","280","671","119","263","219","49","29","132","571","661","321","586","599","435","328","664","334","109","115","184","257","619","155","454","624","600","278","44","615","Q055","618","128","444","272","233","260","355","591","657","258","240","168","76","540","Q017","14","140","176","Q023","Q040","392","Q042","572","149","232","445","473","512","Q034","170","581","290","372","381","123","80","Q012","33","218","554","203","297","319","Q032","276","368","Q028","54","352","Q010","557","560","8","Q057","194","423","655","316","Q018","542","428","86","148","358","77","90","70","530","264","490","489","491","61","107","494","374","386","156","158","359","627","238","424","72","313","Q006","346","138","217"]'),
+    (20, 73, '["645","507","380","612","562","Q028","314","408","140","469","96","348","574","518","Q024","592","301","69","23","294","178","503","593","517","385","291","323","425","Q031","337","111","293","Q011","506","378","160","Q019","197","586","648","95","482","24","38","617","448","519","255","227","475","223","635","242","594","137","588","150","213","185","143","658","127","191","207","249","656","548","393","Q053","508","505","527","41","11","Q060","649","434","126","209","634","Q025","250","308","637","557","Q013","149","267","450","99","529","347","Q039","653","Q029","610","35","Q047","273","492","252","477","389","204","349","193","390","146","201","643","268","Q014","462","343","589","Q033","569","528","310","192"]'),
+    (20, 74, '["184","Q035","410","93","215","82","114","500","267","159","502","Q020","474","386","202","173","319","Q015","385","Q056","168","463","5","9","662","509","547","536","62","287","626","309","97","537","341","652","609","534","326","Q052","306","561","535","65","480","216","181","295","420","Q051","483","281","613","139","350","80","317","455","391","135","205","437","556","523","371","661","236","294","55","492","106","246","16","88","318","419","Q001","142","274","485","83","164","327","7","546","616","515","92","498","639","566","118","Q008","302","499","488","436","669","635","522","532","161","379","466","646","Q004","400","75","461","562","285","226","116","348","2","660","271","225","611","449"]'),
+    (20, 75, '["651","131","496","239","148","377","125","614","136","599","389","467","585","431","78","32","217","113","295","119","110","408","169","668","292","654","256","218","98","491","439","229","438","153","Q027","478","Q006","Q023","640","Q039","476","237","597","501","373","279","124","666","338","332","Q002","Q021","564","147","300","579","596","144","443","648","86","200","46","57","330","Q054","249","474","428","45","384","6","365","128","457","406","401","429","633","Q035","163","399","669","10","525","366","513","359","587","370","647","495","58","644","376","353","47","410","43","531","568","Q016","221","565","623","293","60","248","357","243","121","409","189","34","51","545","208","473","538","284"]'),
+    (20, 76, '["628","Q036","275","582","590","539","133","14","104","489","Q025","560","105","340","641","Q059","659","171","532","627","63","479","25","Q037","380","186","157","416","497","303","24","435","364","617","415","459","581","282","286","555","394","575","360","524","269","255","Q046","422","66","4","154","Q042","349","102","36","595","352","Q030","603","50","362","20","486","471","40","91","558","188","222","283","351","344","Q038","Q041","653","580","667","272","210","228","99","331","182","510","Q009","258","261","141","262","212","44","322","143","Q003","333","426","432","541","312","594","638","42","559","71","37","402","87","621","21","405","288","453","17","296","413","Q033","22","325","108","13"]'),
+    (20, 77, '["412","481","34","414","299","109","200","198","81","191","395","15","442","387","548","89","201","472","506","297","622","266","404","614","157","Q029","511","464","446","Q007","298","134","235","544","Q005","54","77","363","468","487","460","358","606","604","543","576","29","382","655","43","85","73","670","305","39","180","117","605","601","Q050","67","90","64","626","554","602","130","375","231","361","110","650","151","Q032","514","Q031","313","307","187","84","Q045","155","418","55","529","115","230","636","571","329","421","219","244","199","345","596","590","233","526","268","100","1","427","253","30","398","521","367","570","251","74","28","550","578","484","567","465","558","Q024","174"]'),
+    (20, 78, '["388","48","470","281","383","335","286","526","452","619","190","441","Q043","602","324","444","648","553","123","396","68","591","350","403","Q018","282","573","663","Q052","671","211","Q022","104","Q049","377","116","76","630","101","8","620","79","472","434","659","52","473","Q026","Q010","662","449","107","656","615","504","577","576","430","53","456","447","425","432","150","652","19","260","56","387","196","320","393","314","209","369","103","608","156","477","625","265","277","207","203","665","Q044","41","Q057","356","642","142","Q017","151","173","254","Q029","632","443","315","125","166","72","121","645","269","38","259","234","310","273","17","59","Q020","176","285","31","12","433","289","224"]'),
+    (20, 79, '["146","241","80","321","51","245","113","552","304","445","185","97","288","263","50","136","643","193","633","78","323","563","566","460","214","627","328","639","Q040","73","496","454","25","320","103","516","Q056","247","111","604","592","628","94","62","5","458","598","631","183","Q053","411","664","33","18","270","53","47","215","402","479","407","308","69","301","494","118","426","27","381","451","164","112","422","2","Q012","612","261","223","264","499","122","179","514","649","617","206","175","534","186","236","Q060","533","507","177","607","138","57","493","Q048","93","3","518","448","31","316","35","489","419","287","81","539","498","536","638","549","417","129","294","167","342"]'),
+    (20, 80, '["162","488","Q023","278","166","199","Q021","471","275","599","671","358","527","398","326","180","502","131","257","647","189","109","135","153","14","550","622","525","292","446","658","256","411","589","564","559","379","32","546","266","72","541","274","229","101","7","366","Q058","340","36","16","Q055","325","378","174","455","159","56","667","246","Q041","214","170","341","68","172","144","395","98","13","52","390","140","Q034","583","345","355","328","339","556","343","163","521","216","227","372","305","528","26","Q013","429","625","188","520","138","38","513","385","406","523","311","64","296","134","480","267","581","588","534","39","400","623","70","238","289","616","342","179","283","85"]'),
+    (20, 81, '["549","636","122","Q014","424","587","271","348","468","276","18","251","145","544","120","106","537","436","23","478","Q002","Q040","Q048","97","316","490","124","346","592","572","Q003","291","334","40","384","Q008","156","500","456","374","570","333","531","302","154","46","243","58","512","644","312","399","82","133","272","290","309","589","552","212","507","196","69","423","476","383","561","464","637","262","Q005","75","213","353","10","Q054","60","298","568","29","540","376","619","197","414","250","160","375","487","114","533","226","416","433","44","569","93","26","37","668","584","9","640","516","24","Q024","612","401","361","594","404","542","329","598","130","520","182","597","656","591"]'),
+    (20, 82, '["407","663","247","245","515","280","580","220","95","Q049","585","480","6","Q051","543","Q026","336","41","605","579","306","177","244","330","557","86","618","217","137","355","127","485","370","438","4","319","408","441","317","437","128","15","634","364","565","223","607","586","354","321","224","201","322","615","28","413","629","391","369","Q019","143","Q010","561","191","409","377","231","149","65","48","258","304","420","458","440","466","30","252","192","593","181","461","392","63","609","442","204","669","603","21","482","386","178","558","382","595","184","162","632","253","212","228","620","445","453","Q059","642","20","503","571","74","225","551","114","423","100","311","Q022","664","547"]'),
+    (20, 83, '["560","139","582","337","611","Q043","332","508","84","211","459","454","322","190","Q030","168","323","Q016","Q011","Q015","183","327","519","351","Q052","509","388","349","344","645","286","234","110","530","601","665","403","108","235","172","646","194","522","314","161","538","Q037","310","439","257","113","657","497","501","213","Q028","111","600","373","394","556","574","265","666","338","347","200","67","331","79","630","59","422","362","221","567","96","Q050","203","288","42","Q038","176","555","23","577","208","299","471","222","Q025","202","626","315","147","578","218","504","77","491","363","606","Q027","452","405","427","475","124","270","463","483","230","290","76","356","462","Q033","418","300","484"]'),
+    (20, 84, '["380","345","Q007","302","621","206","Q028","61","293","249","403","402","469","397","635","318","371","570","254","486","232","8","261","412","3","38","562","264","47","83","297","432","474","659","379","210","563","74","354","71","485","115","575","272","610","417","608","584","240","428","17","431","641","518","132","119","613","268","481","464","Q031","126","494","517","Q035","357","554","435","652","217","490","Q057","510","221","492","173","188","137","349","198","157","335","Q029","20","530","158","129","215","633","279","631","155","476","Q011","587","542","55","187","209","506","339","671","670","505","624","Q058","495","Q009","545","295","255","163","Q044","401","447","92","497","583","105","639"]'),
+    (20, 85, '["141","88","207","22","553","457","242","192","Q034","415","662","193","85","79","Q045","62","352","376","655","482","654","Q047","Q032","434","324","91","283","60","410","43","657","396","Q055","616","90","653","12","Q039","Q054","199","524","389","646","239","171","651","308","512","404","312","4","Q024","204","109","526","54","102","158","359","99","313","568","472","394","263","650","269","Q016","237","146","Q017","444","281","271","334","Q042","449","548","511","29","117","205","Q004","440","49","233","274","Q006","365","189","227","467","508","450","19","360","Q053","260","296","45","65","248","559","66","Q036","87","120","658","491","1","252","32","142","275","532","397","546","367","89","529"]'),
+    (20, 86, '["325","531","502","Q014","393","277","Q023","451","629","636","169","140","498","229","76","9","320","241","553","186","385","382","52","219","661","352","571","Q008","309","358","425","107","510","541","336","175","479","535","108","430","284","50","465","259","Q021","389","493","Q027","324","Q001","295","78","409","504","664","609","35","381","378","167","492","Q060","420","650","614","350","620","Q020","592","351","660","112","187","Q046","Q002","94","361","589","500","303","148","488","307","7","262","555","103","6","11","170","557","24","77","298","607","596","8","470","12","232","149","647","Q033","292","368","645","610","332","595","45","27","477","525","566","57","330","419","384","180","424"]'),
+    (20, 87, '["431","421","3","287","503","99","600","327","537","196","294","244","119","663","588","430","259","Q013","617","135","517","293","439","603","590","46","366","34","68","164","406","116","256","326","577","545","236","234","41","453","100","540","654","64","80","Q015","Q059","547","299","527","56","399","Q056","461","54","448","567","235","582","197","159","249","260","408","1","75","125","63","Q051","489","280","546","306","560","289","581","426","316","436","348","670","Q004","150","455","225","638","Q007","53","15","668","72","396","333","84","310","579","443","268","583","25","19","496","Q045","370","451","Q047","81","71","127","282","498","446","104","514","185","462","193","Q036","551","520"]'),
+    (20, 88, '["495","596","540","386","40","136","440","513","642","590","163","172","178","243","145","5","Q005","441","329","67","28","405","Q025","473","379","669","66","95","337","51","25","376","258","183","230","469","16","648","578","459","387","194","372","323","Q012","347","307","623","126","14","200","280","208","Q044","90","Q026","219","612","613","522","575","355","425","151","248","363","203","7","586","176","147","Q022","286","395","569","156","31","564","174","167","392","263","421","87","285","129","Q041","166","251","177","13","143","Q003","97","653","521","649","282","291","322","48","Q030","Q035","476","210","656","169","130","400","565","507","228","101","91","44","641","515","549","198","242"]'),
+    (20, 89, '["55","58","237","331","327","356","36","538","535","602","250","218","315","Q026","171","635","Q010","184","92","497","229","486","128","313","413","111","618","552","Q042","139","406","202","73","429","50","181","88","454","304","364","197","Q025","422","342","344","340","182","562","403","267","571","587","240","543","512","201","Q018","273","491","424","377","300","533","467","585","447","Q038","565","231","386","Q021","265","435","94","516","666","82","591","104","270","297","343","272","222","160","199","634","109","314","640","644","580","277","534","536","185","410","484","284","341","390","33","213","35","611","539","460","266","426","346","80","667","21","17","450","480","438","148","Q050","652"]'),
+    (20, 90, '["93","605","Q019","42","Q001","601","573","244","483","536","116","615","58","631","238","281","Q009","608","500","274","434","Q046","233","383","51","Q058","31","269","121","365","466","301","Q024","501","207","276","38","473","102","26","70","Q031","247","2","606","305","532","335","348","132","149","123","470","168","632","Q039","418","Q032","162","133","275","621","556","655","110","574","131","373","581","220","59","471","191","519","319","648","398","624","671","154","294","455","598","Q037","628","458","49","478","488","416","506","529","137","Q052","Q057","442","493","144","643","86","550","391","124","371","405","65","122","85","83","474","118","477","375","457","Q006","78","30","161","576","637"]'),
+    (20, 91, '["419","569","288","239","28","179","570","444","584","354","255","619","6","568","627","188","69","661","525","Q015","220","285","367","190","461","599","541","Q023","Q029","215","618","345","452","368","463","485","112","142","89","518","Q060","Q034","563","412","141","594","626","407","214","245","11","18","482","414","509","373","140","151","290","173","622","362","511","359","660","Q056","604","523","150","206","374","289","346","554","16","Q055","651","388","647","228","494","254","157","23","459","524","567","98","617","Q040","22","264","Q027","642","42","130","253","433","399","257","449","380","47","614","539","411","Q028","338","585","616","20","311","465","528","328","350","339","415","223","544"]'),
+    (20, 92, '["400","513","60","10","138","468","86","39","423","501","388","252","Q054","555","134","593","186","333","479","381","611","302","Q017","125","114","515","254","292","230","18","92","449","464","558","475","271","603","108","597","566","283","203","548","324","659","107","209","378","427","178","131","663","645","71","Q043","298","261","625","113","45","251","630","135","357","620","547","246","656","87","204","638","43","216","Q022","578","128","481","Q020","70","22","559","27","456","552","147","212","279","34","Q019","Q053","57","579","192","407","136","505","256","Q059","240","189","382","83","561","344","487","117","37","572","404","33","Q005","72","260","454","29","589","153","Q036","303","12"]'),
+    (20, 93, '["73","4","351","445","106","528","553","629","499","540","241","416","258","143","226","507","421","608","148","155","665","113","594","227","494","312","640","389","318","175","347","353","76","5","606","278","Q048","79","74","9","534","626","653","217","156","115","103","573","498","304","503","206","56","176","221","668","531","236","542","52","287","635","119","233","267","25","432","402","438","270","1","201","97","601","496","610","329","61","428","Q049","562","321","643","631","564","93","120","245","616","417","105","495","398","84","369","77","295","81","53","420","597","655","Q001","299","158","172","182","484","257","243","2","263","639","Q030","619","448","24","Q051","360","96"]'),
+    (20, 94, '["58","345","121","355","211","326","265","328","298","Q037","644","301","446","587","459","75","43","163","205","Q002","417","538","412","633","192","577","380","609","112","9","532","137","122","413","317","50","397","646","Q035","367","473","599","571","493","235","69","238","224","349","474","48","434","598","342","316","Q045","409","36","661","343","478","406","67","394","387","242","455","582","40","312","200","Q056","167","576","226","530","184","396","510","588","462","649","117","658","323","164","526","320","641","375","Q057","308","659","637","521","197","44","Q033","Q040","442","557","377","636","293","268","614","503","549","180","384","428","Q004","437","537","170","669","88","286","91","420"]'),
+    (20, 95, '["306","207","371","Q009","141","657","662","194","104","221","296","408","568","446","414","433","Q053","155","262","94","Q047","332","35","Q011","222","55","Q048","319","502","595","309","504","63","374","439","16","Q003","315","385","363","623","632","210","426","37","46","61","193","356","Q054","308","41","133","472","310","276","621","612","466","275","147","314","338","115","437","Q028","401","231","352","99","198","123","213","320","127","283","451","423","219","Q039","4","Q029","425","185","253","199","551","98","189","604","177","81","129","536","Q016","150","34","327","51","208","509","109","419","110","30","628","522","Q031","23","580","107","533","54","Q024","Q025","550","Q046","80","Q006","27"]'),
+    (20, 96, '["53","430","376","244","543","291","157","482","410","671","334","336","404","427","Q010","85","523","330","290","529","490","168","Q012","544","646","492","379","443","670","391","297","602","531","Q013","153","524","514","59","516","561","359","146","480","76","392","161","393","166","479","572","274","485","20","256","183","583","78","211","96","341","187","450","Q014","634","247","370","264","217","237","154","461","Q058","444","Q044","506","322","17","340","666","273","548","625","358","126","8","Q038","21","347","647","101","82","281","255","66","527","581","62","372","7","605","215","100","383","Q018","395","590","145","468","488","288","453","378","89","329","279","452","615","174","75","261"]'),
+    (20, 97, '["Q018","Q013","525","546","14","105","518","111","Q034","497","321","570","364","138","504","353","520","303","15","227","448","470","337","458","607","335","331","225","569","300","469","Q059","266","223","400","422","565","574","186","26","249","232","307","516","387","Q026","665","Q021","424","476","348","541","390","411","282","317","131","613","162","369","361","Q049","299","483","64","280","435","343","668","537","515","248","554","252","508","68","218","Q060","440","311","63","Q027","32","19","500","Q031","24","181","159","563","464","38","73","Q032","591","429","584","542","269","83","179","491","11","144","284","431","Q052","467","325","447","650","140","486","630","460","373","Q008","173","586","235"]'),
+    (20, 98, '["Q010","212","Q007","171","642","88","70","366","592","202","149","349","402","664","333","354","651","103","617","629","114","229","191","178","188","395","Q055","392","264","578","477","313","Q040","512","553","622","545","Q050","196","65","480","136","206","302","666","236","36","319","599","120","305","68","267","393","106","560","415","596","Q051","116","125","463","Q022","465","607","92","97","Q023","246","91","142","98","5","277","593","285","13","219","589","15","471","124","652","394","556","381","409","368","31","184","384","513","225","271","602","Q043","648","403","262","95","332","12","Q030","508","407","296","79","134","294","489","654","215","26","Q001","311","87","362","355","558","29"]'),
+    (20, 99, '["433","389","227","357","289","316","449","642","132","306","74","198","Q016","566","487","66","234","160","318","Q012","111","222","Q052","388","663","356","314","190","119","315","330","327","Q017","492","547","52","431","57","197","500","200","620","600","205","150","472","185","188","293","456","559","655","413","72","344","326","102","6","506","47","Q041","322","Q003","510","429","624","408","304","10","Q020","652","Q007","71","129","485","341","268","530","575","637","Q058","280","463","412","238","499","169","350","272","531","18","236","618","421","50","154","560","151","405","526","258","Q023","444","77","386","496","365","7","616","278","30","551","8","209","518","99","514","561","441","594"]');
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- =====================================================
+-- PAC - Nâng cấp bảng quiz_suggested_jobs (job_id, specializations)
+-- =====================================================
+--
+-- CHỨC NĂNG: Đưa bảng quiz_suggested_jobs của database đang chạy về đúng
+-- schema trong create-all-tables.sql, giữ nguyên dữ liệu:
+-- - job_id: jobs.id mà CareerSuggestionEngine::saveSuggestedJobs ghi vào
+-- - specializations: chuyên ngành của nghề (JSON)
+-- - job_code: cho phép NULL (engine không còn ghi cột này)
+--
+-- HƯỚNG DẪN:
+-- Chỉ chạy MỘT LẦN trên database tạo từ create-all-tables.sql / one-shot.sql
+-- cũ (chưa có cột job_id). Database tạo mới từ one-shot.sql không cần file này.
+-- =====================================================
+
+ALTER TABLE quiz_suggested_jobs
+    ADD COLUMN job_id INT NULL COMMENT 'jobs.id (CareerSuggestionEngine::saveSuggestedJobs)' AFTER result_id,
+    ADD COLUMN specializations JSON NULL COMMENT 'Chuyên ngành' AFTER main_tasks,
+    MODIFY job_code VARCHAR(20) NULL COMMENT 'Mã nghề nghiệp (cũ, engine không ghi)',
+    ADD INDEX idx_job_id (job_id);
+
+-- Gán job_id cho các gợi ý đã lưu trước khi nâng cấp (theo tên nghề và Holland Code;
+-- nếu trùng tên thì lấy nghề có id nhỏ nhất)
+UPDATE quiz_suggested_jobs qsj
+JOIN (
+    SELECT job_name, holland_code, MIN(id) AS id
+    FROM jobs
+    GROUP BY job_name, holland_code
+) j ON j.job_name = qsj.job_name AND j.holland_code = qsj.holland_code
+SET qsj.job_id = j.id
+WHERE qsj.job_id IS NULL;
+
+-- Kiểm tra
+SELECT
+    COUNT(*) AS total_suggestions,
+    COUNT(job_id) AS with_job_id
+FROM quiz_suggested_jobs;
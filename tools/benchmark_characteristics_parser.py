@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the characteristics extraction on large and pathological inputs
+Author: PAC Development Team
+Purpose: Prove that extract-characteristics-data.py finishes in linear time on
+         multi-megabyte characteristics.ts files, including malformed ones
+
+Usage:
+    python benchmark_characteristics_parser.py
+    python benchmark_characteristics_parser.py --sizes 1 2 4 8 16 --legacy
+
+For every size (in MB) a well-formed file and a pathological file are
+generated, extracted, and timed. The run fails when the time per byte of the
+largest input is more than --tolerance times that of the smallest one.
+With --legacy, the regexes used by the previous implementation are timed on
+small pathological inputs (each run capped by --legacy-timeout) to show the
+superlinear growth that the single-pass scanner removes.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+
+# Patterns used by the extractor before the single-pass scanner
+LEGACY_PATTERNS = [
+    r'export const (\w+) = \[(.*?)\];',
+    r'export const (\w+) = \{(.*?)\};',
+    r'const (\w+) = \[(.*?)\];\s*export',
+    r'(\w+):\s*\[(.*?)\]',
+]
+LEGACY_OBJECT_PATTERN = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
+
+VALID_RECORD = """  {
+    code: '%s',
+    name: 'Nhóm %s',
+    description: 'Bạn là người tự chủ, độc lập và có xu hướng kiểm soát mọi thứ \\'xung quanh\\'.',
+    strengths: ['Kiên trì', "Sáng tạo", `Giao tiếp ${'tốt'}`],
+    work_values: { primary: 'Độc lập', secondary: 'Thành tựu' },
+    jobs: [
+      'Đánh giá chất lượng sản phẩm, dịch vụ, con người',
+      'Điều phối chung về công việc, sự kiện, chương trình, hoạt động',
+    ],
+  },
+"""
+
+# Fragments that trigger backtracking in the legacy regexes: unclosed
+# property arrays, unbalanced braces and half-written declarations
+PATHOLOGICAL_UNITS = [
+    "  work_style: [ 'độc lập', 'chủ động'\n",
+    "  { {} {} {} { {} {} \n",
+    "const broken = { key: 'value' \n",
+    "  strengths: [ { a: [ { b: 'x' } \n",
+]
+
+
+def load_extractor():
+    """Import extract-characteristics-data.py as a module"""
+    spec = importlib.util.spec_from_file_location(
+        'extract_characteristics_data', SCRIPT_DIR / 'extract-characteristics-data.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_valid(size_bytes):
+    """Well-formed characteristics.ts of roughly size_bytes"""
+    parts = ["export const CHARACTERISTICS = [\n"]
+    written = len(parts[0])
+    index = 0
+    while written < size_bytes:
+        code = 'RIASEC'[index % 6] + 'RIASEC'[(index // 6) % 6]
+        record = VALID_RECORD % (code, index)
+        parts.append(record)
+        written += len(record.encode('utf-8'))
+        index += 1
+    parts.append("];\n")
+    return ''.join(parts)
+
+
+def generate_pathological(size_bytes):
+    """Malformed characteristics.ts of roughly size_bytes"""
+    parts = ["export const CHARACTERISTICS = [\n", VALID_RECORD % ('RI', 0), "];\n",
+             "[" * 5000]
+    written = sum(len(part) for part in parts)
+    index = 0
+    while written < size_bytes:
+        unit = PATHOLOGICAL_UNITS[index % len(PATHOLOGICAL_UNITS)]
+        parts.append(unit)
+        written += len(unit.encode('utf-8'))
+        index += 1
+    parts.append("/* unterminated comment\n")
+    return ''.join(parts)
+
+
+def time_extraction(extractor, content, work_dir):
+    """Write content to disk and time one extraction; returns (seconds, records)"""
+    file_path = os.path.join(work_dir, 'characteristics.ts')
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(content)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        records = extractor.extract_characteristics_from_typescript(file_path)
+        elapsed = time.perf_counter() - start
+    return elapsed, len(records)
+
+
+def run_legacy_regexes(content):
+    """Run the legacy discovery and fallback regexes over content"""
+    for pattern in LEGACY_PATTERNS:
+        re.findall(pattern, content, re.DOTALL)
+    re.findall(LEGACY_OBJECT_PATTERN, content, re.DOTALL)
+
+
+def time_legacy(content, timeout):
+    """Time the legacy regexes in a child process; None when it times out"""
+    process = multiprocessing.Process(target=run_legacy_regexes, args=(content,))
+    start = time.perf_counter()
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return None
+    return time.perf_counter() - start
+
+
+def check_linear(label, results, tolerance):
+    """Compare time per byte of the largest and smallest runs"""
+    (small_size, small_time), (large_size, large_time) = results[0], results[-1]
+    small_rate = small_time / small_size
+    large_rate = large_time / large_size
+    ratio = large_rate / small_rate if small_rate else 0.0
+    status = "OK" if ratio <= tolerance else "FAIL"
+    print(f"[{status}] {label}: time/byte ratio largest vs smallest = {ratio:.2f} "
+          f"(tolerance {tolerance:.2f})")
+    return ratio <= tolerance
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 2, 4, 8],
+                        help='input sizes in MB (default: 1 2 4 8)')
+    parser.add_argument('--tolerance', type=float, default=2.5,
+                        help='max allowed growth of time per byte (default: 2.5)')
+    parser.add_argument('--legacy', action='store_true',
+                        help='also time the legacy regexes on small pathological inputs')
+    parser.add_argument('--legacy-timeout', type=float, default=20.0,
+                        help='seconds before a legacy run is abandoned (default: 20)')
+    args = parser.parse_args()
+
+    extractor = load_extractor()
+    sizes = sorted(int(size * 1024 * 1024) for size in args.sizes)
+    all_linear = True
+
+    print("[INFO] Characteristics extraction benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for label, generator in (("valid", generate_valid), ("pathological", generate_pathological)):
+            results = []
+            for size in sizes:
+                content = generator(size)
+                actual_size = len(content.encode('utf-8'))
+                elapsed, records = time_extraction(extractor, content, work_dir)
+                results.append((actual_size, elapsed))
+                print(f"[{label.upper()}] {actual_size / 1048576:7.2f} MB  {elapsed * 1000:9.1f} ms  "
+                      f"{actual_size / 1048576 / elapsed:7.2f} MB/s  {records:,} records")
+            all_linear = check_linear(label, results, args.tolerance) and all_linear
+
+    if args.legacy:
+        print("\n[INFO] Legacy regexes on pathological input")
+        for size in (16 * 1024, 32 * 1024, 64 * 1024, 128 * 1024):
+            elapsed = time_legacy(generate_pathological(size), args.legacy_timeout)
+            if elapsed is None:
+                print(f"[LEGACY] {size // 1024:5d} KB  > {args.legacy_timeout:.0f} s (aborted)")
+                break
+            print(f"[LEGACY] {size // 1024:5d} KB  {elapsed * 1000:9.1f} ms")
+
+    print("=" * 60)
+    if all_linear:
+        print("[SUCCESS] Extraction time grows linearly with input size")
+    else:
+        print("[ERROR] Extraction time grows faster than input size")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
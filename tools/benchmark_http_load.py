@@ -0,0 +1,745 @@
+#!/usr/bin/env python3
+"""
+HTTP load generator for the quiz and checkout flows
+Author: PAC Development Team
+Purpose: Log in simulated users against a running site and drive the quiz
+         lifecycle, the cart / order endpoints and the history pages at a
+         target arrival rate and concurrency, reporting latency percentiles
+         and throughput per endpoint, so slow endpoints and the capacity of
+         a deployment show up before traffic does
+
+Usage:
+    PHP_CLI_SERVER_WORKERS=8 php -S localhost:8000        # from the project root
+    python benchmark_http_load.py --base-url http://localhost:8000/ --duration 60 --rate 5
+    python benchmark_http_load.py --rate 0 --concurrency 32 --sessions 500 --mix quiz=1
+    python benchmark_http_load.py --report load.json --hgrm-dir histograms/
+
+The database behind the site needs one-shot.sql and the capacity fixtures
+(capacity_fixtures.py): sessions log in as the users in its manifest
+(capacity_<id> / DEFAULT_PASSWORD), or as --users FIRST-LAST. Users that
+login.php rejects as not active (403) are replaced by the next user.
+
+Flows (one per simulated session, after POST api/auth/login.php):
+    quiz      create-exam-from-package.php (force_new) -> get-questions.php
+              -> submit-quiz.php (random answers) -> complete-quiz.php
+              -> get-result.php -> suggested-jobs.php
+    checkout  cart/clear.php -> cart/add.php (1-2 of --cart-packages)
+              -> cart/get.php -> orders/create.php (pending order)
+              -> orders/payment-history.php
+    history   quiz/get-user-exams.php -> orders/payment-history.php
+              -> orders/list.php
+--mix picks the flow of each session by weight (default quiz=3,checkout=1,history=1).
+
+Load model: with --rate R sessions start as a Poisson process of R per
+second (open model), at most --concurrency at a time; a start that has to
+wait for a free slot is counted as delayed, since its wait is not in the
+latencies. --rate 0 runs --concurrency sessions back to back (closed model).
+The run stops starting sessions after --duration seconds or --sessions
+sessions and waits for the running ones.
+
+A request fails when it cannot be sent or read, returns an HTTP error, a
+body that is not JSON, or JSON with success false / status "error". A failed
+step ends its session, as does a response without the fields the next step
+needs. The run exits 1 when more than --max-error-rate of the requests or of
+the sessions failed. Latencies are recorded in HDR-style log-linear
+histograms (HISTOGRAM_SUB_BUCKET_BITS, under 1% error). The JSON report holds
+the percentiles and buckets per endpoint and flow; --hgrm-dir writes each
+histogram in the HdrHistogram percentile distribution format (.hgrm) for the
+usual plotters.
+
+HTTP/1.1 is spoken directly over asyncio streams (keep-alive, cookies per
+session, Content-Length / chunked / close-delimited bodies); http and https.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import ssl
+import sys
+import time
+from collections import Counter, namedtuple
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from capacity_fixtures import DEFAULT_OUTPUT_DIR, DEFAULT_PASSWORD, MANIFEST_FILE  # noqa: E402
+from synthetic_data import DEFAULT_SEED  # noqa: E402
+
+DEFAULT_BASE_URL = "http://localhost:8000/"
+DEFAULT_MANIFEST = DEFAULT_OUTPUT_DIR / MANIFEST_FILE
+DEFAULT_MIX = "quiz=3,checkout=1,history=1"
+DEFAULT_QUIZ_PACKAGE = 1            # free career test (quiz_package_configs)
+DEFAULT_CART_PACKAGES = [2, 3, 8]   # paid test, course and consultation packages
+
+# Sub-buckets per power of two: 2^7 = 128, values within 1/128 of the recorded one
+HISTOGRAM_SUB_BUCKET_BITS = 7
+# Percentile steps per halving of the distance to 100% in .hgrm output
+HGRM_TICKS_PER_HALF_DISTANCE = 5
+REPORT_PERCENTILES = {"p50": 0.50, "p90": 0.90, "p95": 0.95, "p99": 0.99, "p999": 0.999}
+
+LOGIN_ATTEMPTS = 5
+MAX_RESPONSE_HEADER = 64 * 1024
+USER_AGENT = "pac-load/1.0 (tools/benchmark_http_load.py)"
+
+Response = namedtuple('Response', ['status', 'headers', 'body'])
+
+
+class FlowError(Exception):
+    """A step of a flow failed; the session stops"""
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in microseconds (HdrHistogram bucket layout)"""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.total = 0
+        self.sum = 0
+        self.sum_squares = 0
+        self.min = None
+        self.max = 0
+
+    @staticmethod
+    def _shift(value):
+        return max(0, value.bit_length() - HISTOGRAM_SUB_BUCKET_BITS)
+
+    @classmethod
+    def highest_equivalent(cls, bucket):
+        """Largest value that lands in the bucket starting at bucket"""
+        return bucket + (1 << cls._shift(bucket)) - 1
+
+    def record(self, microseconds):
+        value = max(1, int(microseconds))
+        shift = self._shift(value)
+        self.counts[(value >> shift) << shift] += 1
+        self.total += 1
+        self.sum += value
+        self.sum_squares += value * value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum += other.sum
+        self.sum_squares += other.sum_squares
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def value_at(self, fraction):
+        """Value at a percentile (0-1): highest equivalent value of the bucket holding that rank"""
+        rank = max(1, math.ceil(fraction * self.total))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self.highest_equivalent(bucket), self.max)
+        return self.max
+
+    def mean(self):
+        return self.sum / self.total if self.total else 0
+
+    def stddev(self):
+        if not self.total:
+            return 0
+        return math.sqrt(max(0, self.sum_squares / self.total - self.mean() ** 2))
+
+    def summary(self):
+        """Milliseconds summary for the JSON report"""
+        result = {"count": self.total}
+        if not self.total:
+            return result
+        result["min_ms"] = round(self.min / 1000, 3)
+        result["mean_ms"] = round(self.mean() / 1000, 3)
+        for name, fraction in REPORT_PERCENTILES.items():
+            result[f"{name}_ms"] = round(self.value_at(fraction) / 1000, 3)
+        result["max_ms"] = round(self.max / 1000, 3)
+        result["buckets_ms"] = [[round(self.highest_equivalent(bucket) / 1000, 3), self.counts[bucket]]
+                                for bucket in sorted(self.counts)]
+        return result
+
+    def hgrm(self, scale=1000.0):
+        """Percentile distribution in the HdrHistogram .hgrm text format (values in ms)"""
+        lines = [f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}", ""]
+        if self.total:
+            buckets = sorted(self.counts)
+            cumulative = []
+            seen = 0
+            for bucket in buckets:
+                seen += self.counts[bucket]
+                cumulative.append((bucket, seen))
+            fraction = 0.0
+            while True:
+                rank = max(1, math.ceil(fraction * self.total))
+                bucket, count = next(item for item in cumulative if item[1] >= rank)
+                value = min(self.highest_equivalent(bucket), self.max) / scale
+                if count >= self.total:
+                    lines.append(f"{self.max / scale:12.3f} {1.0:14.12f} {self.total:10d}")
+                    break
+                lines.append(f"{value:12.3f} {fraction:14.12f} {count:10d} {1 / (1 - fraction):14.2f}")
+                half_distance = 2 ** (math.floor(math.log2(1 / (1 - fraction))) + 1)
+                fraction += 1 / (half_distance * HGRM_TICKS_PER_HALF_DISTANCE)
+        lines.append(f"#[Mean    = {self.mean() / scale:12.3f}, StdDeviation   = {self.stddev() / scale:12.3f}]")
+        lines.append(f"#[Max     = {self.max / scale:12.3f}, Total count    = {self.total:12d}]")
+        lines.append(f"#[Buckets = {len(self.counts):12d}, SubBuckets     = {1 << HISTOGRAM_SUB_BUCKET_BITS:12d}]")
+        return '\n'.join(lines) + '\n'
+
+
+class EndpointStats:
+    """Latencies and outcomes of one endpoint or flow"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.statuses = Counter()
+        self.errors = 0
+
+    def record(self, seconds, status, error):
+        if seconds is not None:
+            self.histogram.record(seconds * 1000000)
+        self.statuses[str(status)] += 1
+        if error:
+            self.errors += 1
+
+    def summary(self, elapsed):
+        result = self.histogram.summary()
+        requests = sum(self.statuses.values())
+        result.update({
+            "requests": requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / requests, 4) if requests else 0,
+            "throughput_per_s": round(requests / elapsed, 3) if elapsed else 0,
+            "statuses": dict(sorted(self.statuses.items())),
+        })
+        return result
+
+
+class LoadStats:
+    """Everything one run measured"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.flows = {}
+        self.sessions = Counter()
+        self.delayed_starts = 0
+        self.max_start_delay = 0.0
+
+    def endpoint(self, name):
+        if name not in self.endpoints:
+            self.endpoints[name] = EndpointStats()
+        return self.endpoints[name]
+
+    def flow(self, name):
+        if name not in self.flows:
+            self.flows[name] = EndpointStats()
+        return self.flows[name]
+
+
+class HTTPSession:
+    """One simulated browser: a keep-alive HTTP/1.1 connection and its cookies"""
+
+    def __init__(self, base_url, timeout):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported base URL {base_url!r}")
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.host_header = parts.netloc
+        self.base_path = parts.path if parts.path.endswith('/') else parts.path + '/'
+        self.timeout = timeout
+        self.cookies = {}
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+            self.reader = self.writer = None
+
+    async def request(self, method, path, params=None, body=None):
+        """Send one request and read the whole response"""
+        target = self.base_path + path + ('?' + urlencode(params) if params else '')
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        headers = [f"{method} {target} HTTP/1.1", f"Host: {self.host_header}",
+                   f"User-Agent: {USER_AGENT}", "Accept: application/json", "Connection: keep-alive"]
+        if self.cookies:
+            headers.append("Cookie: " + '; '.join(f"{name}={value}" for name, value in self.cookies.items()))
+        if body is not None or method in ("POST", "PUT", "DELETE"):
+            headers.append("Content-Type: application/json")
+            headers.append(f"Content-Length: {len(payload)}")
+        message = ('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + payload
+        return await asyncio.wait_for(self._exchange(message), self.timeout)
+
+    async def _exchange(self, message):
+        reused = self.writer is not None
+        if not reused:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        try:
+            self.writer.write(message)
+            await self.writer.drain()
+            status_line = await self.reader.readline()
+            if not status_line:
+                raise ConnectionResetError("connection closed before the response")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection: send once more on a new one
+            return await self._exchange(message)
+        response = await self._read_response(status_line)
+        return response
+
+    async def _read_response(self, status_line):
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+        headers = {}
+        header_bytes = 0
+        while True:
+            line = await self.reader.readline()
+            header_bytes += len(line)
+            if header_bytes > MAX_RESPONSE_HEADER:
+                raise ValueError("response header too large")
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip().lower()
+            value = value.strip()
+            if name == 'set-cookie':
+                self._store_cookie(value)
+            headers[name] = value
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0].strip(), 16)
+                if size == 0:
+                    while (await self.reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await self.reader.readexactly(int(headers['content-length']))
+        else:
+            body = await self.reader.read()
+            keep_alive = False
+        if not keep_alive:
+            await self.close()
+        return Response(int(status), headers, body)
+
+    def _store_cookie(self, header):
+        pair = header.split(';', 1)[0]
+        name, _, value = pair.partition('=')
+        name = name.strip()
+        expired = any(attribute.strip().lower().startswith('max-age=0')
+                      for attribute in header.split(';')[1:])
+        if not value or value == 'deleted' or expired:
+            self.cookies.pop(name, None)
+        else:
+            self.cookies[name] = value.strip()
+
+
+def failed_body(data):
+    """True when a JSON body reports an error (both response styles of the API)"""
+    if not isinstance(data, dict):
+        return False
+    return data.get("success") is False or data.get("status") == "error"
+
+
+async def step(session, stats, method, path, params=None, body=None, accept=()):
+    """One timed request; returns (status, JSON body), raises FlowError when it failed
+
+    Statuses in accept are returned to the caller instead of failing the step.
+    """
+    start = time.perf_counter()
+    try:
+        response = await session.request(method, path, params, body)
+    except (OSError, ssl.SSLError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+        await session.close()
+        stats.endpoint(path).record(None, type(e).__name__, True)
+        raise FlowError(f"{path}: {type(e).__name__}: {e}") from e
+    seconds = time.perf_counter() - start
+
+    try:
+        data = json.loads(response.body.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError):
+        data = None
+    if response.status in accept:
+        stats.endpoint(path).record(seconds, response.status, False)
+        return response.status, data
+    error = response.status >= 400 or data is None or failed_body(data)
+    stats.endpoint(path).record(seconds, response.status if data is not None else f"{response.status} non-JSON",
+                                error)
+    if error:
+        message = data.get("message") or data.get("error") if isinstance(data, dict) else response.body[:120]
+        raise FlowError(f"{path}: HTTP {response.status}: {message}")
+    return response.status, data
+
+
+def field(data, path, *keys):
+    """data[key][key]... of a response body; FlowError when the body does not have it"""
+    value = data
+    try:
+        for key in keys:
+            value = value[key]
+    except (KeyError, TypeError, IndexError) as e:
+        raise FlowError(f"{path}: unexpected response, no {'.'.join(map(str, keys))}") from e
+    return value
+
+
+class UserPool:
+    """Fixture users handed out in a seeded order, each at most once per cycle"""
+
+    def __init__(self, first_id, last_id, seed):
+        self.ids = list(range(first_id, last_id + 1))
+        random.Random(seed).shuffle(self.ids)
+        self.position = 0
+
+    def next(self):
+        user_id = self.ids[self.position % len(self.ids)]
+        self.position += 1
+        return user_id
+
+
+async def login(session, stats, users):
+    """Log in as the next usable user; returns the user id"""
+    for _ in range(LOGIN_ATTEMPTS):
+        user_id = users.next()
+        status, _ = await step(session, stats, "POST", "api/auth/login.php",
+                               body={"username": f"capacity_{user_id}", "password": DEFAULT_PASSWORD},
+                               accept=(403,))
+        if status != 403:
+            return user_id
+    raise FlowError(f"no active user in {LOGIN_ATTEMPTS} attempts")
+
+
+async def quiz_flow(session, stats, rng, options):
+    path = "api/quiz/create-exam-from-package.php"
+    _, created = await step(session, stats, "POST", path,
+                            body={"package_id": options.quiz_package, "force_new": True})
+    exam_id = field(created, path, "data", "exam_info", "exam_id")
+    exam_code = field(created, path, "data", "exam_info", "exam_code")
+    await options.think(rng)
+    path = "api/quiz/get-questions.php"
+    _, loaded = await step(session, stats, "GET", path, params={"exam_id": exam_id})
+    answers = {field(question, path, "id"): rng.randint(0, 2)
+               for question in field(loaded, path, "data", "questions")}
+    await options.think(rng)
+    _, submitted = await step(session, stats, "POST", "api/quiz/submit-quiz.php",
+                              body={"exam_id": exam_id, "answers": answers})
+    _, completed = await step(session, stats, "POST", "api/quiz/complete-quiz.php",
+                              body={"exam_id": exam_id})
+    result_id = (field(completed, "api/quiz/complete-quiz.php", "data", "result", "result_id")
+                 or field(submitted, "api/quiz/submit-quiz.php", "data", "result_id"))
+    await options.think(rng)
+    await step(session, stats, "GET", "api/quiz/get-result.php", params={"exam_code": exam_code})
+    await step(session, stats, "GET", "api/quiz/suggested-jobs.php", params={"result_id": result_id})
+
+
+async def checkout_flow(session, stats, rng, options):
+    await step(session, stats, "DELETE", "api/cart/clear.php")
+    packages = rng.sample(options.cart_packages, rng.randint(1, min(2, len(options.cart_packages))))
+    for package_id in packages:
+        await step(session, stats, "POST", "api/cart/add.php",
+                   body={"product_package_id": package_id, "quantity": 1})
+        await options.think(rng)
+    _, cart = await step(session, stats, "GET", "api/cart/get.php")
+    await options.think(rng)
+    customer = {"first_name": "Capacity", "last_name": "Test", "email": "capacity@example.com",
+                "phone": "0900000000"}
+    await step(session, stats, "POST", "api/orders/create.php",
+               body={"customer_info": customer, "payment_method": "vnpay",
+                     "total_amount": field(cart, "api/cart/get.php", "data", "summary", "total_amount")})
+    await step(session, stats, "GET", "api/orders/payment-history.php", params={"limit": 20})
+
+
+async def history_flow(session, stats, rng, options):
+    await step(session, stats, "GET", "api/quiz/get-user-exams.php", params={"page": 1, "limit": 10})
+    await options.think(rng)
+    await step(session, stats, "GET", "api/orders/payment-history.php", params={"limit": 20})
+    await step(session, stats, "GET", "api/orders/list.php", params={"page": 1, "limit": 10})
+
+
+FLOWS = {"quiz": quiz_flow, "checkout": checkout_flow, "history": history_flow}
+
+
+class FlowOptions:
+    """Settings the flows read"""
+
+    def __init__(self, quiz_package, cart_packages, think_time):
+        self.quiz_package = quiz_package
+        self.cart_packages = cart_packages
+        self.think_time = think_time
+
+    async def think(self, rng):
+        """Pause like a user between pages (not part of any latency)"""
+        if self.think_time > 0:
+            await asyncio.sleep(rng.expovariate(1 / self.think_time))
+
+
+async def run_session(number, flow, args, stats, users, options):
+    rng = random.Random(args.seed * 1000003 + number)
+    session = HTTPSession(args.base_url, args.timeout)
+    start = time.perf_counter()
+    try:
+        await login(session, stats, users)
+        await FLOWS[flow](session, stats, rng, options)
+    except FlowError as e:
+        stats.sessions["failed"] += 1
+        stats.flow(flow).record(None, "failed", True)
+        if args.verbose:
+            print(f"[FAIL] session {number} ({flow}): {e}")
+    else:
+        stats.sessions["completed"] += 1
+        stats.flow(flow).record(time.perf_counter() - start, "completed", False)
+    finally:
+        await session.close()
+
+
+async def run_load(args, stats, users, options):
+    """Start sessions until the duration or session count is reached; returns the elapsed seconds"""
+    loop = asyncio.get_running_loop()
+    arrivals = random.Random(args.seed)
+    flows = list(args.mix)
+    weights = list(args.mix.values())
+    slots = asyncio.Semaphore(args.concurrency)
+    tasks = set()
+    started = 0
+    begin = loop.time()
+    deadline = begin + args.duration
+    scheduled = begin
+
+    def finished(task):
+        slots.release()
+        tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # A bug in a flow, not a failed request: count it and keep the run going
+            error = task.exception()
+            stats.sessions["failed"] += 1
+            print(f"[ERROR] session crashed: {type(error).__name__}: {error}")
+
+    while loop.time() < deadline and (not args.sessions or started < args.sessions):
+        if args.rate > 0:
+            scheduled += arrivals.expovariate(args.rate)
+            if scheduled >= deadline:
+                break
+            await asyncio.sleep(max(0.0, scheduled - loop.time()))
+            if slots.locked():
+                stats.delayed_starts += 1
+        await slots.acquire()
+        if args.rate > 0:
+            stats.max_start_delay = max(stats.max_start_delay, loop.time() - scheduled)
+        flow = arrivals.choices(flows, weights=weights)[0]
+        stats.sessions["started"] += 1
+        task = asyncio.ensure_future(run_session(started, flow, args, stats, users, options))
+        task.add_done_callback(finished)
+        tasks.add(task)
+        started += 1
+        if args.progress and started % args.progress == 0:
+            print(f"[INFO] {started:,} sessions started, {len(tasks)} running")
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return loop.time() - begin
+
+
+async def check_reachable(base_url, timeout):
+    """Error message when the base URL does not accept connections, else None"""
+    session = HTTPSession(base_url, timeout)
+    try:
+        await asyncio.wait_for(asyncio.open_connection(session.host, session.port, ssl=session.ssl), timeout)
+    except (OSError, ssl.SSLError, asyncio.TimeoutError) as e:
+        return f"{session.host}:{session.port}: {e or type(e).__name__}"
+    return None
+
+
+def parse_mix(value):
+    """'quiz=3,checkout=1' -> {'quiz': 3.0, 'checkout': 1.0}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in FLOWS:
+            raise argparse.ArgumentTypeError(f"unknown flow {name!r} (flows: {', '.join(FLOWS)})")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight in {part!r}") from None
+    if not any(weight > 0 for weight in mix.values()):
+        raise argparse.ArgumentTypeError("at least one flow needs a positive weight")
+    return mix
+
+
+def parse_user_range(value):
+    """'FIRST-LAST' -> (first, last)"""
+    first, _, last = value.partition('-')
+    try:
+        first, last = int(first), int(last)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST-LAST user ids, got {value!r}") from None
+    if first < 1 or last < first:
+        raise argparse.ArgumentTypeError(f"empty user id range {value!r}")
+    return first, last
+
+
+def manifest_users(path):
+    """(first, last) user id of a capacity fixture manifest"""
+    with open(path, 'r', encoding='utf-8') as file:
+        users = json.load(file)["tables"]["users"]
+    return users["first_id"], users["first_id"] + users["rows"] - 1
+
+
+def build_report(args, stats, elapsed):
+    return {
+        "base_url": args.base_url,
+        "seed": args.seed,
+        "rate_per_s": args.rate,
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        "think_time_s": args.think_time,
+        "elapsed_s": round(elapsed, 3),
+        "sessions": dict(stats.sessions),
+        "delayed_starts": stats.delayed_starts,
+        "max_start_delay_s": round(stats.max_start_delay, 3),
+        "endpoints": {name: endpoint.summary(elapsed) for name, endpoint in sorted(stats.endpoints.items())},
+        "flows": {name: flow.summary(elapsed) for name, flow in sorted(stats.flows.items())},
+    }
+
+
+def print_report(report):
+    """One line per endpoint and flow"""
+    def line(name, result):
+        if not result.get("count"):
+            return (f"[FAIL]  {name:38s} {result['requests']:>7,} req  {result['errors']:>6,} err  "
+                    f"no responses: {', '.join(result['statuses'])}")
+        return (f"[BENCH] {name:38s} {result['requests']:>7,} req  {result['errors']:>6,} err  "
+                f"{result['throughput_per_s']:>7.2f}/s  p50 {result['p50_ms']:8.1f}  "
+                f"p95 {result['p95_ms']:8.1f}  p99 {result['p99_ms']:8.1f}  max {result['max_ms']:8.1f} ms")
+
+    for name, result in report["endpoints"].items():
+        print(line(name, result))
+    for name, result in report["flows"].items():
+        print(line(f"flow:{name}", result))
+    sessions = report["sessions"]
+    print(f"[INFO] {sessions.get('started', 0):,} sessions in {report['elapsed_s']:.1f} s: "
+          f"{sessions.get('completed', 0):,} completed, {sessions.get('failed', 0):,} failed")
+    if report["delayed_starts"]:
+        print(f"[WARNING] {report['delayed_starts']:,} session starts waited for a free slot "
+              f"(up to {report['max_start_delay_s']:.2f} s); raise --concurrency or lower --rate")
+
+
+def write_hgrm_files(directory, stats):
+    os.makedirs(directory, exist_ok=True)
+    histograms = {name: endpoint.histogram for name, endpoint in stats.endpoints.items()}
+    histograms.update({f"flow-{name}": flow.histogram for name, flow in stats.flows.items()})
+    for name, histogram in sorted(histograms.items()):
+        path = Path(directory) / (name.replace('/', '_').removesuffix('.php') + '.hgrm')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(histogram.hgrm())
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL,
+                        help=f'site root the api/ paths are relative to (default: {DEFAULT_BASE_URL})')
+    parser.add_argument('--rate', type=float, default=2.0,
+                        help='session arrivals per second; 0 runs sessions back to back (default: 2)')
+    parser.add_argument('--concurrency', type=int, default=16,
+                        help='most sessions running at once (default: 16)')
+    parser.add_argument('--duration', type=float, default=60.0,
+                        help='seconds to start sessions for (default: 60)')
+    parser.add_argument('--sessions', type=int, default=0,
+                        help='stop after starting this many sessions (default: no limit)')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f'flow weights (default: {DEFAULT_MIX})')
+    parser.add_argument('--think-time', type=float, default=0.0,
+                        help='mean pause in seconds between pages of a session (default: 0)')
+    parser.add_argument('--quiz-package', type=int, default=DEFAULT_QUIZ_PACKAGE,
+                        help=f'package_id of the quiz flow exams (default: {DEFAULT_QUIZ_PACKAGE})')
+    parser.add_argument('--cart-packages', type=int, nargs='+', default=DEFAULT_CART_PACKAGES,
+                        help='product_package ids the checkout flow adds to the cart')
+    parser.add_argument('--manifest', type=Path, default=DEFAULT_MANIFEST,
+                        help='capacity fixture manifest with the users to log in as')
+    parser.add_argument('--users', type=parse_user_range, metavar='FIRST-LAST',
+                        help='user ids to log in as instead of the manifest users')
+    parser.add_argument('--timeout', type=float, default=30.0, help='seconds per request (default: 30)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='random seed')
+    parser.add_argument('--report', metavar='FILE', help='write the results as JSON to FILE')
+    parser.add_argument('--hgrm-dir', metavar='DIR', help='write one .hgrm histogram per endpoint and flow')
+    parser.add_argument('--max-error-rate', type=float, default=0.01,
+                        help='fail when more requests or sessions than this fraction fail (default: 0.01)')
+    parser.add_argument('--verbose', action='store_true', help='print every failed session')
+    args = parser.parse_args()
+    if args.concurrency < 1 or args.rate < 0 or args.duration <= 0:
+        parser.error("--concurrency must be at least 1, --rate at least 0 and --duration positive")
+    args.mix = {name: weight for name, weight in args.mix.items() if weight > 0}
+    args.progress = max(10, int(args.rate * 10)) if args.rate > 0 else 10 * args.concurrency
+
+    if args.users:
+        first_id, last_id = args.users
+    else:
+        try:
+            first_id, last_id = manifest_users(args.manifest)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[ERROR] Cannot read the users from {args.manifest} ({e}); run capacity_fixtures.py "
+                  f"or pass --users FIRST-LAST")
+            sys.exit(2)
+    users = UserPool(first_id, last_id, args.seed)
+    options = FlowOptions(args.quiz_package, args.cart_packages, args.think_time)
+
+    print("[INFO] HTTP load test of the quiz and checkout flows")
+    print("=" * 60)
+    mode = f"{args.rate:g} sessions/s" if args.rate > 0 else "closed loop"
+    print(f"[INFO] {args.base_url}: {mode}, concurrency {args.concurrency}, {args.duration:g} s, "
+          f"mix {', '.join(f'{name}={weight:g}' for name, weight in args.mix.items())}, "
+          f"users {first_id}-{last_id}")
+    if len(users.ids) < args.concurrency:
+        print(f"[WARNING] {len(users.ids)} users for {args.concurrency} concurrent sessions: "
+              f"some users run in parallel sessions")
+
+    unreachable = asyncio.run(check_reachable(args.base_url, args.timeout))
+    if unreachable:
+        print(f"[ERROR] Cannot connect to {unreachable}")
+        sys.exit(2)
+
+    stats = LoadStats()
+    elapsed = asyncio.run(run_load(args, stats, users, options))
+    report = build_report(args, stats, elapsed)
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"[INFO] Report written to {args.report}")
+    if args.hgrm_dir:
+        write_hgrm_files(args.hgrm_dir, stats)
+        print(f"[INFO] Histograms written to {args.hgrm_dir}")
+
+    requests = sum(result["requests"] for result in report["endpoints"].values())
+    errors = sum(result["errors"] for result in report["endpoints"].values())
+    print("=" * 60)
+    if not requests or errors / requests > args.max_error_rate:
+        print(f"[ERROR] {errors:,} of {requests:,} requests failed (limit {args.max_error_rate:.1%})")
+        sys.exit(1)
+    # Sessions also fail on responses that are HTTP 200 but lack the fields a flow needs
+    started, failed = stats.sessions["started"], stats.sessions["failed"]
+    if failed / started > args.max_error_rate:
+        print(f"[ERROR] {failed:,} of {started:,} sessions failed (limit {args.max_error_rate:.1%})")
+        sys.exit(1)
+    print("[SUCCESS] Load test completed")
+
+
+if __name__ == "__main__":
+    main()
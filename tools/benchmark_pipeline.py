@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for every data tool
+Author: PAC Development Team
+Purpose: Run each build stage on synthetic inputs at several multiples of the
+         current data size, record throughput and peak memory, and fail when
+         a stage grows faster than its stored baseline allows
+
+Usage:
+    python benchmark_pipeline.py                        # 1x, 10x, 100x
+    python benchmark_pipeline.py --scales 1 10 100 1000
+    python benchmark_pipeline.py --update-baseline      # store the results
+    python benchmark_pipeline.py jobs questions --report bench.json
+
+For each stage the growth exponent k in time ~ input_bytes^k (and the same
+for peak memory) is fitted over all scales. k close to 1 means linear
+growth. The run fails when k exceeds max(baseline k, 1) + --tolerance.
+The exponent cannot see a constant-factor slowdown, so the throughput of
+each run is also compared with the baseline run at the same scale: the run
+fails when it drops by more than --throughput-tolerance (a fraction, default
+DEFAULT_THROUGHPUT_TOLERANCE). Absolute throughput is machine dependent;
+refresh the baseline with --update-baseline on the machine that checks, or
+pass --throughput-tolerance 1 to only print the comparison. Peak memory
+comes from tracemalloc, which also slows every stage down by a roughly
+constant factor.
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import build_pipeline
+import instrumentation
+from synthetic_data import DEFAULT_SEED, generate_project
+
+SCRIPT_DIR = Path(__file__).parent
+BASELINE_FILE = SCRIPT_DIR / "benchmarks" / "baselines.json"
+
+DEFAULT_SCALES = [1.0, 10.0, 100.0]
+DEFAULT_TOLERANCE = 0.15
+DEFAULT_THROUGHPUT_TOLERANCE = 0.5
+
+
+def input_guard(name, root):
+    """Reason why a stage refuses its input at this scale, or None"""
+    if name != "characteristics":
+        return None
+    module = build_pipeline.load_tool("extract-characteristics-data.py")
+    stage = build_pipeline.STAGES_BY_NAME[name]
+    size = sum(path.stat().st_size for path in build_pipeline.resolve_paths(stage, root)[0]
+               if path.exists())
+    if size > module.MAX_INPUT_BYTES:
+        return f"input is {size:,} bytes, MAX_INPUT_BYTES is {module.MAX_INPUT_BYTES:,}"
+    return None
+
+
+def measure_stage(name, root, repeat):
+    """Run one stage `repeat` times; returns the result dict of the fastest run"""
+    stage = build_pipeline.STAGES_BY_NAME[name]
+    inputs, outputs = build_pipeline.resolve_paths(stage, root)
+    input_bytes = sum(path.stat().st_size for path in inputs if path.exists())
+
+    best = None
+    for _ in range(repeat):
+        _, ok, output, _, stage_records = build_pipeline.execute_stage(name, root)
+        if not ok:
+            return {"ok": False, "input_bytes": input_bytes, "output": output[-2000:]}
+        total = next(record for record in stage_records if record["stage"] == f"pipeline.{name}")
+        if best is None or total["wall_seconds"] < best["wall_seconds"]:
+            best = {
+                "ok": True,
+                "input_bytes": input_bytes,
+                "output_bytes": sum(path.stat().st_size for path in outputs if path.exists()),
+                "wall_seconds": total["wall_seconds"],
+                "cpu_seconds": total["cpu_seconds"],
+                "peak_memory_bytes": total["peak_memory_bytes"],
+                "breakdown": {record["stage"]: record["wall_seconds"]
+                              for record in stage_records if record is not total},
+            }
+    best["throughput_mb_s"] = round(input_bytes / 1048576 / best["wall_seconds"], 3) \
+        if best["wall_seconds"] else None
+    return best
+
+
+def growth_exponent(points):
+    """Least-squares slope of log(value) over log(size); None with < 2 points"""
+    points = [(size, value) for size, value in points if size and value]
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(value) for _, value in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread, 3)
+
+
+def run_benchmarks(stage_names, scales, seed=DEFAULT_SEED, repeat=1):
+    """Benchmark the stages at every scale; returns {stage: {"runs": [...], exponents}}"""
+    instrumentation.configure(track_memory=True)
+    for name in stage_names:
+        # Import outside the measured runs so module loading is not timed
+        build_pipeline.load_tool(build_pipeline.STAGES_BY_NAME[name].script)
+
+    results = {name: {"runs": []} for name in stage_names}
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix=f"pac-bench-{scale:g}x-") as work_dir:
+            root = Path(work_dir).resolve()
+            print(f"\n[INFO] Generating {scale:g}x synthetic data...")
+            generate_project(root, scale, seed)
+
+            # Definition order runs producers (jobs) before consumers (merge)
+            for name in stage_names:
+                reason = input_guard(name, root)
+                if reason:
+                    print(f"[SKIPPED] {name:16s} {scale:>6g}x  {reason}")
+                    results[name]["runs"].append({"scale": scale, "ok": False, "skipped": reason})
+                    continue
+
+                run = measure_stage(name, root, repeat)
+                run["scale"] = scale
+                results[name]["runs"].append(run)
+                if run["ok"]:
+                    print(f"[BENCH] {name:16s} {scale:>6g}x  {run['input_bytes'] / 1048576:9.2f} MB  "
+                          f"{run['wall_seconds'] * 1000:10.1f} ms  "
+                          f"{run['throughput_mb_s'] or 0:8.2f} MB/s  "
+                          f"peak {instrumentation.format_bytes(run['peak_memory_bytes'])}")
+                else:
+                    print(f"[ERROR] {name} failed at {scale:g}x:\n{run['output']}")
+
+    for result in results.values():
+        runs = [run for run in result["runs"] if run["ok"]]
+        result["time_exponent"] = growth_exponent(
+            [(run["input_bytes"], run["wall_seconds"]) for run in runs])
+        result["memory_exponent"] = growth_exponent(
+            [(run["input_bytes"], run["peak_memory_bytes"]) for run in runs])
+    return results
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {"stages": {}}
+
+
+def save_baseline(path, results, scales, seed):
+    """Store the results as the new baseline of the benchmarked stages"""
+    stages = load_baseline(path).get("stages", {})
+    baseline = {
+        "metadata": {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scales": scales,
+            "seed": seed,
+            "description": "Growth exponents k (time ~ bytes^k) and runs per stage",
+        },
+        "stages": dict(stages, **{
+            name: {
+                "time_exponent": result["time_exponent"],
+                "memory_exponent": result["memory_exponent"],
+                "runs": [{key: run[key] for key in ("scale", "input_bytes", "wall_seconds",
+                                                      "throughput_mb_s", "peak_memory_bytes")}
+                         for run in result["runs"] if run["ok"]],
+            }
+            for name, result in results.items()
+        }),
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+    print(f"[SUCCESS] Baseline written to {path}")
+
+
+def check_against_baseline(results, baseline, tolerance,
+                           throughput_tolerance=DEFAULT_THROUGHPUT_TOLERANCE):
+    """Print the comparison; returns False when a stage grew superlinearly or lost throughput"""
+    print(f"\n{'='*60}")
+    print("[SUMMARY] Growth exponents (1.00 = linear) and throughput")
+    print(f"{'='*60}")
+    passed = True
+    for name, result in results.items():
+        stored = baseline.get("stages", {}).get(name, {})
+        failed_runs = [run for run in result["runs"] if not run["ok"] and "skipped" not in run]
+        if failed_runs:
+            scales_text = ', '.join(f"{run['scale']:g}x" for run in failed_runs)
+            print(f"   [FAIL] {name}: failed at {scales_text}")
+            passed = False
+
+        for metric in ("time_exponent", "memory_exponent"):
+            value = result[metric]
+            if value is None:
+                print(f"   [----] {name:16s} {metric:16s} not enough scales")
+                continue
+            reference = stored.get(metric)
+            allowed = max(reference if reference is not None else 1.0, 1.0) + tolerance
+            ok = value <= allowed
+            passed = passed and ok
+            reference_text = f"{reference:.2f}" if reference is not None else "none"
+            print(f"   [{'OK' if ok else 'FAIL':4s}] {name:16s} {metric:16s} {value:5.2f} "
+                  f"(baseline {reference_text}, allowed {allowed:.2f})")
+
+        stored_runs = {run["scale"]: run for run in stored.get("runs", [])}
+        for run in result["runs"]:
+            reference = stored_runs.get(run["scale"])
+            if run["ok"] and reference and reference.get("throughput_mb_s"):
+                change = run["throughput_mb_s"] / reference["throughput_mb_s"] - 1
+                ok = change >= -throughput_tolerance
+                passed = passed and ok
+                print(f"   [{'OK' if ok else 'FAIL':4s}] {name:16s} {run['scale']:>6g}x throughput "
+                      f"{run['throughput_mb_s']:8.2f} MB/s ({change:+.0%} vs baseline "
+                      f"{reference['throughput_mb_s']:.2f}, allowed -{throughput_tolerance:.0%})")
+    return passed
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the data tools")
+    parser.add_argument('stages', nargs='*', metavar='STAGE',
+                        help=f"stages to benchmark ({', '.join(build_pipeline.STAGES_BY_NAME)}); "
+                             "default: all")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help='multiples of the current data size (default: 1 10 100)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='synthetic data seed')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs per stage and scale, the fastest is kept (default: 1)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed exponent above max(baseline, 1) (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--throughput-tolerance', type=float, default=DEFAULT_THROUGHPUT_TOLERANCE,
+                        help='allowed throughput drop vs the baseline run at the same scale, as a '
+                             f'fraction (default: {DEFAULT_THROUGHPUT_TOLERANCE})')
+    parser.add_argument('--baseline', default=str(BASELINE_FILE),
+                        help='baseline JSON file (default: tools/benchmarks/baselines.json)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results to the baseline file instead of checking them')
+    parser.add_argument('--report', metavar='FILE', help='write all results as JSON to FILE')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.stages if name not in build_pipeline.STAGES_BY_NAME]
+    if unknown:
+        print(f"[ERROR] Unknown stage(s): {', '.join(unknown)}")
+        sys.exit(2)
+    stage_names = [stage.name for stage in build_pipeline.STAGES
+                   if not args.stages or stage.name in args.stages]
+    if "merge" in stage_names and "jobs" not in stage_names:
+        # merge reads the jobs SQL produced in the same synthetic tree
+        stage_names.insert(stage_names.index("merge"), "jobs")
+    scales = sorted(int(scale) if scale.is_integer() else scale for scale in args.scales)
+
+    print("[INFO] Data tools scaling benchmark")
+    print("=" * 60)
+    results = run_benchmarks(stage_names, scales, args.seed, args.repeat)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump({"scales": scales, "seed": args.seed, "stages": results}, file, indent=2)
+        print(f"[INFO] Report written to {args.report}")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results, scales, args.seed)
+        return
+
+    if not check_against_baseline(results, load_baseline(args.baseline), args.tolerance,
+                                  args.throughput_tolerance):
+        print("[ERROR] Superlinear growth, lost throughput or failures compared to the baseline")
+        sys.exit(1)
+    print("[SUCCESS] All stages scale within the baseline")
+
+
+if __name__ == "__main__":
+    main()
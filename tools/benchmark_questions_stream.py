@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the streaming questions migration on large exports
+Author: PAC Development Team
+Purpose: Prove that create_sql_migrate_questions.py keeps a flat peak memory
+         on multi-hundred-megabyte questions exports, as a JSON array and as
+         mongoexport JSON Lines
+
+Usage:
+    python benchmark_questions_stream.py
+    python benchmark_questions_stream.py --sizes 10 100 400 --legacy
+
+For every size (in MB) and format a synthetic export is generated and
+migrated (parse, classify, SQL and snapshot) in a fresh child process that
+reports its peak resident memory. The run fails when the peak grows by more
+than --tolerance MB per MB of export between the smallest and the largest
+input (the bounded buffers, e.g. one INSERT of up to max_allowed_packet, only
+fill up on the first tens of megabytes). With --legacy, json.load of the
+array exports is measured the same way to show memory that grows with the
+export.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import synthetic_data  # noqa: E402
+
+FORMATS = {
+    "array": synthetic_data.write_questions_json,
+    "jsonl": synthetic_data.write_questions_jsonl,
+}
+
+SAMPLE_QUESTIONS = 2000
+
+
+def peak_memory_bytes():
+    """Peak resident memory of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def bytes_per_question(writer):
+    """Average export size of one question in the given format"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'sample.json')
+        writer(path, SAMPLE_QUESTIONS, random.Random(0))
+        return os.path.getsize(path) / SAMPLE_QUESTIONS
+
+
+def generate_export(path, writer, size_bytes):
+    """Write an export of roughly size_bytes; returns the question count"""
+    count = max(1, int(size_bytes / bytes_per_question(writer)))
+    writer(path, count, random.Random(synthetic_data.DEFAULT_SEED))
+    return count
+
+
+def run_child(mode, export_path, work_dir, queue):
+    """Migrate (or json.load) export_path and report (seconds, peak bytes, ok)"""
+    import create_sql_migrate_questions as migration
+
+    tracing = resource is None
+    if tracing:
+        import tracemalloc
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == "legacy":
+            with open(export_path, 'r', encoding='utf-8') as file:
+                ok = bool(json.load(file))
+        else:
+            ok = migration.run_migration(export_path, os.path.join(work_dir, 'migrate_questions.sql'))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if tracing else peak_memory_bytes()
+    queue.put((elapsed, peak, ok))
+
+
+def measure(mode, export_path, work_dir):
+    """Run one measurement in a fresh interpreter so peaks do not carry over"""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=run_child, args=(mode, export_path, work_dir, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def memory_growth(results):
+    """Peak memory growth (MB per MB of export) between the smallest and largest runs"""
+    (small_size, small_peak), (large_size, large_peak) = results[0], results[-1]
+    return (large_peak - small_peak) / (large_size - small_size) if large_size > small_size else 0.0
+
+
+def check_flat(label, results, tolerance):
+    """Compare the peak memory of the largest and smallest runs"""
+    growth = memory_growth(results)
+    status = "OK" if growth <= tolerance else "FAIL"
+    print(f"[{status}] {label}: peak memory growth = {growth:.3f} MB per MB of export "
+          f"(tolerance {tolerance:.3f})")
+    return growth <= tolerance
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[10, 100, 300],
+                        help='export sizes in MB (default: 10 100 300)')
+    parser.add_argument('--formats', nargs='+', choices=sorted(FORMATS), default=sorted(FORMATS),
+                        help='export formats (default: all)')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='max allowed peak memory growth in MB per MB of export (default: 0.1)')
+    parser.add_argument('--legacy', action='store_true',
+                        help='also measure json.load of the array exports')
+    args = parser.parse_args()
+
+    sizes = sorted(int(size * 1024 * 1024) for size in args.sizes)
+    all_flat = True
+
+    print("[INFO] Streaming questions migration benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        export_path = os.path.join(work_dir, 'questions.json')
+        for label in args.formats:
+            results = []
+            legacy = []
+            for size in sizes:
+                count = generate_export(export_path, FORMATS[label], size)
+                actual_size = os.path.getsize(export_path)
+                elapsed, peak, ok = measure("stream", export_path, work_dir)
+                if not ok:
+                    print(f"[ERROR] {label}: migration of {actual_size:,} bytes failed")
+                    sys.exit(1)
+                results.append((actual_size, peak))
+                print(f"[{label.upper()}] {actual_size / 1048576:8.1f} MB  {count:>10,} questions  "
+                      f"{elapsed:7.1f} s  {actual_size / 1048576 / elapsed:6.1f} MB/s  "
+                      f"peak {peak / 1048576:7.1f} MB")
+                if args.legacy and label == "array":
+                    elapsed, peak, _ = measure("legacy", export_path, work_dir)
+                    legacy.append((actual_size, peak))
+                    print(f"[LEGACY] {actual_size / 1048576:8.1f} MB  json.load {elapsed:7.1f} s  "
+                          f"peak {peak / 1048576:7.1f} MB")
+            all_flat = check_flat(label, results, args.tolerance) and all_flat
+            if legacy:
+                print(f"[INFO] array (json.load): peak memory growth = "
+                      f"{memory_growth(legacy):.3f} MB per MB of export")
+
+    print("=" * 60)
+    if all_flat:
+        print("[SUCCESS] Peak memory does not grow with the export size")
+    else:
+        print("[ERROR] Peak memory grows with the export size")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
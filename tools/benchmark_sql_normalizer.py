@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Equivalence check and import benchmark for merge_all_sql.py --normalize
+Author: PAC Development Team
+Purpose: Prove that the INSERT-coalescing normalizer keeps every row of
+         one-shot.sql unchanged, and measure how much it cuts the number of
+         statements (and, with a MySQL server, the import time)
+
+Usage:
+    python benchmark_sql_normalizer.py
+    python benchmark_sql_normalizer.py --mysql "mysql -u root pac_bench" --repeat 3
+
+Both versions of one-shot.sql are merged into a temporary directory. Every
+INSERT of each file is parsed into rows (strings decoded, other values
+whitespace-normalized) and the rows of every table must match in order;
+all other statements must match too, apart from the autocommit, key check
+and transaction statements the normalizer manages. With --mysql, each file
+is piped into that command (a scratch database: create-all-tables.sql drops
+and recreates every table) and the import times are compared.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import merge_all_sql  # noqa: E402
+from sql_normalizer import table_rows  # noqa: E402
+from sql_statements import iter_chunks, iter_statements  # noqa: E402
+
+
+def merge(sql_dir, output_file, normalize):
+    """Run merge_all_sql quietly; exits when the merge fails"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = merge_all_sql.merge_sql_files(sql_dir, output_file, normalize=normalize)
+    if not ok:
+        print(f"[ERROR] merge_all_sql failed for {output_file.name}")
+        sys.exit(1)
+
+
+def read_rows(path):
+    """table_rows() of a SQL file, read in chunks"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return table_rows(iter_statements(iter_chunks(file)))
+
+
+def count_statements(path):
+    """Number of SQL statements in a file"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return sum(1 for statement in iter_statements(iter_chunks(file)) if statement.kind == "sql")
+
+
+def check_equivalence(plain_path, normalized_path):
+    """Compare rows per table and the remaining statements; True when equal"""
+    plain_tables, plain_others = read_rows(plain_path)
+    normalized_tables, normalized_others = read_rows(normalized_path)
+    equal = True
+    for table in sorted(set(plain_tables) | set(normalized_tables)):
+        plain_table_rows = plain_tables.get(table, [])
+        normalized_table_rows = normalized_tables.get(table, [])
+        same = plain_table_rows == normalized_table_rows
+        equal = equal and same
+        print(f"[{'OK' if same else 'FAIL'}] {table}: {len(plain_table_rows):,} rows "
+              f"(normalized: {len(normalized_table_rows):,})")
+    same = plain_others == normalized_others
+    equal = equal and same
+    print(f"[{'OK' if same else 'FAIL'}] other statements: {len(plain_others):,} "
+          f"(normalized: {len(normalized_others):,})")
+    return equal
+
+
+def time_import(command, path, repeat):
+    """Best wall-clock time of piping path into command"""
+    best = None
+    for _ in range(repeat):
+        with open(path, 'rb') as file:
+            start = time.perf_counter()
+            result = subprocess.run(command, stdin=file, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE)
+            elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            print(f"[ERROR] Import of {path.name} failed: {result.stderr.decode(errors='replace').strip()}")
+            sys.exit(1)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sql-dir', type=Path, default=merge_all_sql.SQL_DIR,
+                        help='directory with the source SQL files (default: ../sql)')
+    parser.add_argument('--mysql', metavar='COMMAND',
+                        help='client command for a scratch database, e.g. "mysql -u root pac_bench"')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='imports per file with --mysql, best time is kept (default: 1)')
+    args = parser.parse_args()
+
+    print("[INFO] SQL normalizer equivalence check")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        plain_path = Path(work_dir) / "plain" / "one-shot.sql"
+        normalized_path = Path(work_dir) / "normalized" / "one-shot.sql"
+        for path, normalize in ((plain_path, False), (normalized_path, True)):
+            os.makedirs(path.parent)
+            merge(args.sql_dir, path, normalize)
+            print(f"[INFO] {path.parent.name:>10}: {path.stat().st_size:>12,} bytes  "
+                  f"{count_statements(path):>7,} statements")
+
+        equal = check_equivalence(plain_path, normalized_path)
+
+        if equal and args.mysql:
+            command = shlex.split(args.mysql)
+            plain_time = time_import(command, plain_path, args.repeat)
+            normalized_time = time_import(command, normalized_path, args.repeat)
+            print(f"[INFO] import: plain {plain_time:.2f} s, normalized {normalized_time:.2f} s "
+                  f"({plain_time / normalized_time:.1f}x)")
+
+    print("=" * 60)
+    if equal:
+        print("[SUCCESS] Normalized one-shot.sql holds the same rows")
+    else:
+        print("[ERROR] Normalized one-shot.sql differs from the plain merge")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+SQLite replay of the generated schema and the career suggestion queries
+Author: PAC Development Team
+Purpose: Load create-all-tables.sql, the generated jobs SQL and the
+         questions SQL of scaled synthetic catalogues into an
+         in-process SQLite database (sqlite_dialect.py) and replay the
+         queries CareerSuggestionEngine issues, reporting latency
+         percentiles and full table scans per query shape and scale
+
+Usage:
+    python benchmark_sqlite_replay.py                          # 1x, 10x, 100x
+    python benchmark_sqlite_replay.py --scales 1 10 --iterations 10 --report replay.json
+    python benchmark_sqlite_replay.py --scales 1 --keep-database /tmp/pac-db
+
+Query shapes (SQL text as in api/quiz/CareerSuggestionEngine.php):
+    cache           findCachedSuggestions: job_suggestion_cache JOIN jobs
+    exact           findExactMatches: one findActiveJobs query, LIMIT 5
+    permutation     findPermutationMatches: findActiveJobs per permutation,
+                    LIMIT 5, stopping at 15 jobs like the engine
+    two_char        findTwoCharMatches: per two-letter prefix, LIMIT 5, stops at 20
+    single_char     findSingleCharMatches: per letter, LIMIT 4
+    suggested       getSuggestedJobs(result_id) with the default LIMIT 50
+    suggested_star  getSuggestedJobs with a star filter (4)
+    suggested_area  getSuggestedJobs with the most common work area
+    summary         getSuggestedJobsSummary
+One sample is one call (all its queries) for one of the 120 Holland codes;
+every code is replayed --iterations times. quiz_suggested_jobs is filled
+with the suggestion_ranking.py result of every code (result_id = code
+number), using the columns the generated table actually has.
+
+SQLite is not MySQL: absolute times only compare runs of this tool. What
+carries over is the shape: how a query grows with the catalogue and
+whether it can use an index, which EXPLAIN QUERY PLAN shows (a SCAN
+without an index is reported). A shape that SQLite cannot prepare against
+the generated schema (e.g. a column the engine uses but the table does not
+have) fails the run.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from itertools import permutations
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import build_pipeline  # noqa: E402
+from sqlite_dialect import SQLiteLoader  # noqa: E402
+from suggestion_ranking import (MAX_JOBS_PER_STAR, PERMUTATION_QUERY_LIMIT,  # noqa: E402
+                                SAVED_JOB_COLUMNS, SINGLE_CHAR_QUERY_LIMIT, TWO_CHAR_QUERY_LIMIT,
+                                add_job_id, all_holland_codes, rank_suggestions, saved_job_values)
+from synthetic_data import DEFAULT_SEED, generate_project  # noqa: E402
+
+DEFAULT_SCALES = [1.0, 10.0, 100.0]
+
+# Loaded in this order, like one-shot.sql
+SQL_FILES = ["create-all-tables.sql", "jobs_data_insertion.sql",
+             "jobs_normalized_data.sql", "migrate_questions.sql", "question_pools.sql"]
+
+CACHE_SQL = """SELECT c.star_rating, c.match_type, c.match_score, j.*
+                    FROM job_suggestion_cache c
+                    JOIN jobs j ON j.id = c.job_id
+                    WHERE c.holland_code = ?
+                    ORDER BY c.sort_order"""
+ACTIVE_JOBS_SQL = """SELECT * FROM jobs
+                WHERE holland_code = ? AND is_active = TRUE
+                LIMIT ?"""
+SUGGESTED_JOBS_SQL = """SELECT
+                    qsj.*,
+                    j.job_name,
+                    j.job_name_en,
+                    j.job_group,
+                    j.activities_code,
+                    j.capacity,
+                    j.essential_ability,
+                    j.supplementary_ability,
+                    j.education_level,
+                    j.work_environment,
+                    j.work_style,
+                    j.work_value,
+                    j.job_description,
+                    j.specializations,
+                    j.main_tasks,
+                    j.work_areas,
+                    j.icon_url,
+                    j.sort_order as job_sort_order
+                FROM quiz_suggested_jobs qsj
+                LEFT JOIN jobs j ON qsj.job_id = j.id
+                WHERE qsj.result_id = ?"""
+STAR_FILTER_SQL = " AND qsj.star_rating = ?"
+WORK_AREA_FILTER_SQL = " AND qsj.job_id IN (SELECT jwa.job_id FROM job_work_areas jwa WHERE jwa.work_area = ?)"
+SUGGESTED_JOBS_ORDER_SQL = " ORDER BY qsj.star_rating DESC, qsj.match_score DESC, qsj.sort_order ASC LIMIT ?"
+SUMMARY_SQL = """SELECT
+                    star_rating,
+                    COUNT(*) as count,
+                    AVG(match_score) as avg_score
+                FROM quiz_suggested_jobs
+                WHERE result_id = ?
+                GROUP BY star_rating
+                ORDER BY star_rating DESC"""
+
+# CareerSuggestionEngine::getSuggestedJobs default limit and the star filter replayed
+SUGGESTED_JOBS_LIMIT = 50
+STAR_FILTER = 4
+
+def build_database(root, scale, seed, connection):
+    """Generate a catalogue, run the jobs and questions migrations and load the SQL; returns the loader"""
+    generate_project(root, scale, seed)
+    module = build_pipeline.load_tool("migrate_jobs_to_sql.py")
+    migrator = module.JobDataMigrator(str(root / build_pipeline.CONSTANTS_DIR / "suggestJobs.ts"),
+                                      str(root / "sql"), php_index_path=str(root / module.PHP_INDEX_FILE),
+                                      normalized=True)
+    if not migrator.run_migration():
+        raise RuntimeError(f"jobs migration failed at {scale:g}x")
+    stage = build_pipeline.STAGES_BY_NAME["questions"]
+    if stage.run(build_pipeline.load_tool(stage.script), root) is False:
+        raise RuntimeError(f"questions migration failed at {scale:g}x")
+
+    loader = SQLiteLoader(connection)
+    connection.execute("BEGIN")
+    for name in SQL_FILES:
+        loader.load_file(root / "sql" / name)
+    connection.execute("COMMIT")
+    connection.execute("ANALYZE")
+    return loader
+
+
+def save_suggestions(connection):
+    """Fill quiz_suggested_jobs for every code; returns the saveSuggestedJobs columns the table lacks"""
+    job_ids_by_code = {}
+    jobs = {}
+    connection.row_factory = sqlite3.Row
+    for job in connection.execute("SELECT * FROM jobs WHERE is_active = TRUE ORDER BY id"):
+        add_job_id(job_ids_by_code, job["holland_code"], job["id"])
+        jobs[job["id"]] = job
+    connection.row_factory = None
+
+    table_columns = [row[1] for row in connection.execute("PRAGMA table_info(quiz_suggested_jobs)")]
+    columns = [column for column in SAVED_JOB_COLUMNS if column in table_columns]
+    if "job_code" in table_columns and "job_code" not in columns:
+        # Legacy column the engine does not write, filled with the job id
+        columns.append("job_code")
+    rows = []
+    for result_id, code in enumerate(all_holland_codes(), start=1):
+        for sort_order, suggestion in enumerate(rank_suggestions(code, job_ids_by_code)):
+            values = saved_job_values(result_id, sort_order, suggestion, jobs[suggestion.job_id])
+            values["job_code"] = str(suggestion.job_id)
+            rows.append([values[column] for column in columns])
+
+    placeholders = ', '.join('?' * len(columns))
+    connection.execute("BEGIN")
+    connection.executemany(f"INSERT INTO quiz_suggested_jobs ({', '.join(columns)}) VALUES ({placeholders})", rows)
+    connection.execute("COMMIT")
+    connection.execute("ANALYZE quiz_suggested_jobs")
+    return [column for column in SAVED_JOB_COLUMNS if column not in table_columns]
+
+
+def tier_calls(code):
+    """(sql, params, stop) calls of the four tiers for one code; stop: job count that ends the tier"""
+    permutation_codes = [''.join(letters) for letters in permutations(code)]
+    two_char_codes = list(dict.fromkeys(permutation_code[:2] for permutation_code in permutation_codes))
+    return {
+        "exact": ([(code, MAX_JOBS_PER_STAR[5])], None),
+        "permutation": ([(permutation_code, PERMUTATION_QUERY_LIMIT) for permutation_code in permutation_codes
+                         if permutation_code != code], MAX_JOBS_PER_STAR[4]),
+        "two_char": ([(two_char, TWO_CHAR_QUERY_LIMIT) for two_char in two_char_codes], MAX_JOBS_PER_STAR[3]),
+        "single_char": ([(letter, SINGLE_CHAR_QUERY_LIMIT) for letter in code], None),
+    }
+
+
+def query_shapes(connection):
+    """{shape: (sql, function(code, result_id) -> (params of each query, stop))}"""
+    work_area = connection.execute("SELECT work_area FROM job_work_areas GROUP BY work_area "
+                                   "ORDER BY COUNT(*) DESC, work_area LIMIT 1").fetchone()
+    work_area = work_area[0] if work_area else ''
+    shapes = {"cache": (CACHE_SQL, lambda code, result_id: ([(code,)], None))}
+    for tier in ("exact", "permutation", "two_char", "single_char"):
+        shapes[tier] = (ACTIVE_JOBS_SQL, lambda code, result_id, tier=tier: tier_calls(code)[tier])
+    shapes.update({
+        "suggested": (SUGGESTED_JOBS_SQL + SUGGESTED_JOBS_ORDER_SQL,
+                      lambda code, result_id: ([(result_id, SUGGESTED_JOBS_LIMIT)], None)),
+        "suggested_star": (SUGGESTED_JOBS_SQL + STAR_FILTER_SQL + SUGGESTED_JOBS_ORDER_SQL,
+                           lambda code, result_id: ([(result_id, STAR_FILTER, SUGGESTED_JOBS_LIMIT)], None)),
+        "suggested_area": (SUGGESTED_JOBS_SQL + WORK_AREA_FILTER_SQL + SUGGESTED_JOBS_ORDER_SQL,
+                           lambda code, result_id: ([(result_id, work_area, SUGGESTED_JOBS_LIMIT)], None)),
+        "summary": (SUMMARY_SQL, lambda code, result_id: ([(result_id,)], None)),
+    })
+    return shapes
+
+
+def run_call(connection, sql, calls, stop):
+    """Run one engine call; returns (queries, rows)"""
+    queries = 0
+    rows = 0
+    for params in calls:
+        rows += len(connection.execute(sql, params).fetchall())
+        queries += 1
+        if stop is not None and rows >= stop:
+            break
+    return queries, rows
+
+
+def percentile(timings, fraction):
+    """Nearest-rank percentile of sorted timings (same rule as suggestion_benchmark.php)"""
+    return timings[min(len(timings) - 1, int(math.floor(fraction * len(timings))))]
+
+
+def query_plan(connection, sql, params):
+    """EXPLAIN QUERY PLAN details and the full table scans among them"""
+    details = [row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + sql, params)]
+    scans = [detail for detail in details if detail.startswith("SCAN ") and " USING " not in detail]
+    return details, scans
+
+
+def replay_shape(connection, sql, calls_for, iterations):
+    """Time one query shape over all codes; returns its result dict"""
+    codes = all_holland_codes()
+    first_calls, _ = calls_for(codes[0], 1)
+    try:
+        details, scans = query_plan(connection, sql, first_calls[0])
+    except sqlite3.Error as e:
+        return {"status": "FAIL", "error": str(e)}
+
+    timings = []
+    queries = 0
+    rows = 0
+    for _ in range(iterations):
+        for result_id, code in enumerate(codes, start=1):
+            calls, stop = calls_for(code, result_id)
+            start = time.perf_counter()
+            call_queries, call_rows = run_call(connection, sql, calls, stop)
+            timings.append((time.perf_counter() - start) * 1000)
+            queries += call_queries
+            rows += call_rows
+    timings.sort()
+    return {
+        "status": "OK",
+        "calls": len(timings),
+        "queries": queries,
+        "rows_per_call": round(rows / len(timings), 2),
+        "mean_ms": round(sum(timings) / len(timings), 4),
+        "p50_ms": round(percentile(timings, 0.50), 4),
+        "p95_ms": round(percentile(timings, 0.95), 4),
+        "p99_ms": round(percentile(timings, 0.99), 4),
+        "max_ms": round(timings[-1], 4),
+        "plan": details,
+        "full_scans": scans,
+    }
+
+
+def replay_scale(scale, args):
+    """Build, load and replay one scale; returns its result dict"""
+    with tempfile.TemporaryDirectory(prefix=f"pac-replay-{scale:g}x-") as work_dir:
+        root = Path(work_dir).resolve()
+        connection = sqlite3.connect(":memory:", isolation_level=None)
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            loader = build_database(root, scale, args.seed, connection)
+        build_seconds = time.perf_counter() - start
+        load_bytes = sum((root / "sql" / name).stat().st_size for name in SQL_FILES)
+
+    missing_columns = save_suggestions(connection)
+    jobs = connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+    result = {
+        "scale": scale,
+        "jobs": jobs,
+        "sql_bytes": load_bytes,
+        "build_seconds": round(build_seconds, 3),
+        "statements": loader.executed,
+        "rows": loader.rows,
+        "skipped": dict(loader.skipped),
+        "dropped": dict(loader.dropped),
+        "load_errors": [{"file": source, "statement": head, "error": message}
+                        for source, head, message in loader.errors],
+        "missing_columns": missing_columns,
+        "shapes": {},
+    }
+    for shape, (sql, calls_for) in query_shapes(connection).items():
+        result["shapes"][shape] = replay_shape(connection, sql, calls_for, args.iterations)
+
+    if args.keep_database:
+        os.makedirs(args.keep_database, exist_ok=True)
+        path = Path(args.keep_database) / f"pac-replay-{scale:g}x.sqlite3"
+        if path.exists():
+            path.unlink()
+        with contextlib.closing(sqlite3.connect(path)) as target:
+            connection.backup(target)
+        result["database"] = str(path)
+    connection.close()
+    return result
+
+
+def print_result(result):
+    """Print the load summary and one line per query shape"""
+    scale = result["scale"]
+    print(f"[INFO] {scale:g}x: {result['jobs']:,} jobs, {result['sql_bytes'] / 1048576:.2f} MB SQL, "
+          f"{result['statements']:,} statements, {result['rows']:,} rows "
+          f"(generated and loaded in {result['build_seconds']:.1f} s)")
+    skipped = ', '.join(f"{count} {reason}" for reason, count in sorted(result["skipped"].items()))
+    dropped = ', '.join(f"{count} {clause}" for clause, count in sorted(result["dropped"].items()))
+    print(f"       skipped: {skipped or 'none'}; dropped: {dropped or 'none'}")
+    for error in result["load_errors"]:
+        print(f"[WARNING] {error['file']}: {error['error']} in: {error['statement']}")
+    if result["missing_columns"]:
+        print(f"[WARNING] quiz_suggested_jobs has no column {', '.join(result['missing_columns'])} "
+              f"(written by saveSuggestedJobs)")
+    for shape, timing in result["shapes"].items():
+        if timing["status"] != "OK":
+            print(f"[FAIL]  {scale:>6g}x  {shape:15s}  {timing['error']}")
+            continue
+        print(f"[BENCH] {scale:>6g}x  {shape:15s}  p50 {timing['p50_ms']:8.3f} ms  "
+              f"p95 {timing['p95_ms']:8.3f} ms  p99 {timing['p99_ms']:8.3f} ms  "
+              f"max {timing['max_ms']:8.3f} ms  {timing['queries']:>6} queries")
+        for scan in timing["full_scans"]:
+            print(f"        full scan: {scan}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help='multiples of the current catalogue size (default: 1 10 100)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='synthetic data seed')
+    parser.add_argument('--iterations', type=int, default=5,
+                        help='rounds over all 120 Holland codes per shape (default: 5)')
+    parser.add_argument('--report', metavar='FILE', help='write all results as JSON to FILE')
+    parser.add_argument('--keep-database', metavar='DIR',
+                        help='save each loaded database as DIR/pac-replay-<scale>x.sqlite3')
+    args = parser.parse_args()
+
+    print(f"[INFO] SQLite replay of the suggestion queries (SQLite {sqlite3.sqlite_version})")
+    print("=" * 60)
+    results = []
+    for scale in sorted(args.scales):
+        print(f"\n[INFO] Generating and loading {scale:g}x catalogue...")
+        try:
+            result = replay_scale(scale, args)
+        except RuntimeError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+        results.append(result)
+        print_result(result)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump({"seed": args.seed, "iterations": args.iterations,
+                       "sqlite_version": sqlite3.sqlite_version, "results": results}, file, indent=2)
+        print(f"[INFO] Report written to {args.report}")
+
+    failed = sorted({shape for result in results for shape, timing in result["shapes"].items()
+                     if timing["status"] != "OK"})
+    print("=" * 60)
+    if failed:
+        print(f"[ERROR] Query shapes failed against the generated schema: {', '.join(failed)}")
+        sys.exit(1)
+    print("[SUCCESS] Replay completed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Career suggestion benchmark: database queries vs generated PHP jobs index
+Author: PAC Development Team
+Purpose: Build scaled synthetic job catalogues, generate their SQL and
+         jobs-by-code.php through migrate_jobs_to_sql.py, and time
+         CareerSuggestionEngine on both paths (tools/suggestion_benchmark.php)
+
+Usage:
+    python benchmark_suggestions.py                          # 1x, 10x, 100x
+    python benchmark_suggestions.py --scales 1 10 --iterations 10 --report suggest.json
+    python benchmark_suggestions.py --dsn "mysql:host=127.0.0.1;dbname=pac_bench;charset=utf8mb4"
+
+Requirements: php with pdo_mysql (and opcache for representative file timings)
+and a scratch MySQL database; its `jobs` table is dropped and recreated.
+Never point --dsn at pac_db.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import build_pipeline
+from synthetic_data import DEFAULT_SEED, generate_project
+
+SCRIPT_DIR = Path(__file__).parent
+BENCHMARK_SCRIPT = SCRIPT_DIR / "suggestion_benchmark.php"
+
+DEFAULT_SCALES = [1.0, 10.0, 100.0]
+DEFAULT_DSN = "mysql:host=localhost;dbname=pac_bench;charset=utf8mb4"
+
+
+def build_catalogue(root, scale, seed):
+    """Generate a synthetic project and migrate its jobs; returns the PHP index path"""
+    generate_project(root, scale, seed)
+    module = build_pipeline.load_tool("migrate_jobs_to_sql.py")
+    index_path = root / module.PHP_INDEX_FILE
+    migrator = module.JobDataMigrator(str(root / build_pipeline.CONSTANTS_DIR / "suggestJobs.ts"),
+                                      str(root / "sql"), php_index_path=str(index_path))
+    if not migrator.run_migration():
+        raise RuntimeError(f"jobs migration failed at {scale:g}x")
+    return index_path
+
+
+def run_php_benchmark(php, index_path, args):
+    """Run suggestion_benchmark.php on one catalogue; returns its JSON result"""
+    command = [php, "-d", "opcache.enable_cli=1", str(BENCHMARK_SCRIPT),
+               f"--index={index_path}", f"--iterations={args.iterations}",
+               f"--dsn={args.dsn}", f"--user={args.user}", f"--password={args.password}"]
+    completed = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip() or completed.stdout.strip())
+    return json.loads(completed.stdout)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark the database and jobs index suggestion paths")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help='multiples of the current catalogue size (default: 1 10 100)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='synthetic data seed')
+    parser.add_argument('--iterations', type=int, default=5,
+                        help='rounds over all 120 Holland codes per path (default: 5)')
+    parser.add_argument('--dsn', default=DEFAULT_DSN, help=f'scratch database DSN (default: {DEFAULT_DSN})')
+    parser.add_argument('--user', default='root', help='database user (default: root)')
+    parser.add_argument('--password', default='', help='database password (default: empty)')
+    parser.add_argument('--report', metavar='FILE', help='write all results as JSON to FILE')
+    args = parser.parse_args()
+
+    php = shutil.which("php")
+    if not php:
+        print("[ERROR] php executable not found, the benchmark needs php with pdo_mysql")
+        sys.exit(2)
+    if "dbname=pac_db" in args.dsn:
+        print("[ERROR] Refusing to recreate the jobs table of pac_db, use a scratch database")
+        sys.exit(2)
+
+    print("[INFO] Career suggestion benchmark (database vs jobs-by-code.php)")
+    print("=" * 60)
+    results = []
+    for scale in sorted(args.scales):
+        with tempfile.TemporaryDirectory(prefix=f"pac-suggest-{scale:g}x-") as work_dir:
+            root = Path(work_dir).resolve()
+            print(f"\n[INFO] Generating {scale:g}x catalogue...")
+            with contextlib.redirect_stdout(io.StringIO()):
+                index_path = build_catalogue(root, scale, args.seed)
+            try:
+                result = run_php_benchmark(php, index_path, args)
+            except (RuntimeError, json.JSONDecodeError) as e:
+                print(f"[ERROR] Benchmark failed at {scale:g}x: {e}")
+                sys.exit(1)
+
+        result["scale"] = scale
+        results.append(result)
+        for path in ("db", "file"):
+            timing = result[path]
+            print(f"[BENCH] {scale:>6g}x {result['jobs']:>7} jobs  {path:4s}  "
+                  f"mean {timing['mean_ms']:8.3f} ms  p95 {timing['p95_ms']:8.3f} ms  "
+                  f"p99 {timing['p99_ms']:8.3f} ms  {timing['queries']:>6} queries")
+        print(f"        speedup {result['speedup']}x  (opcache {'on' if result['opcache'] else 'off'}, "
+              f"index {result['index_bytes'] / 1048576:.2f} MB)")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump({"seed": args.seed, "iterations": args.iterations, "results": results}, file, indent=2)
+        print(f"[INFO] Report written to {args.report}")
+    print("[SUCCESS] Benchmark completed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+In-process build pipeline for all generated data files
+Author: PAC Development Team
+Purpose: Run the extraction and SQL generation tools as a dependency graph,
+         in one Python process (plus a fork-based worker pool), skipping
+         stages whose inputs have not changed since the last run
+
+Usage:
+    python build_pipeline.py                 # build everything that changed
+    python build_pipeline.py groups merge    # only these stages (+ dependencies)
+    python build_pipeline.py --force         # ignore the cache
+    python build_pipeline.py --jobs 1        # run serially, no worker processes
+    python build_pipeline.py --timing-report build-timings.json --profile
+
+Stages import the existing scripts as modules and call their entry functions
+with explicit paths. A stage depends on every stage that produces one of its
+input files. A stage is skipped when the SHA-256 of its input files and tool
+sources matches the previous successful run and all of its outputs exist.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib.util
+import io
+import json
+import sys
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import instrumentation
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+CACHE_FILE = SCRIPT_DIR / ".build-cache.json"
+
+CONSTANTS_DIR = Path("old-project") / "backend-app" / "src" / "constants"
+
+
+# ---------------------------------------------------------------------------
+# Stage definitions
+# ---------------------------------------------------------------------------
+
+Stage = namedtuple('Stage', ['name', 'title', 'script', 'sources', 'inputs', 'outputs', 'run'])
+
+
+def load_tool(script_name):
+    """Import a script from tools/ as a module (works for hyphenated names)"""
+    module_name = script_name[:-3].replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPT_DIR / script_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_groups(module, root):
+    return module.run_extraction(**module.default_paths(root))
+
+
+def _run_characteristics(module, root):
+    return module.run_extraction(module.find_input_file(root),
+                                 root / "static" / "characteristics-data.json")
+
+
+def _characteristics_inputs(root):
+    module = load_tool("extract-characteristics-data.py")
+    with contextlib.redirect_stdout(io.StringIO()):
+        input_file = module.find_input_file(root)
+    return [input_file or root / CONSTANTS_DIR / "characteristics.ts"]
+
+
+def _run_jobs(module, root):
+    migrator = module.JobDataMigrator(str(root / CONSTANTS_DIR / "suggestJobs.ts"),
+                                      str(root / "sql"),
+                                      php_index_path=str(root / module.PHP_INDEX_FILE),
+                                      normalized=True)
+    return migrator.run_migration()
+
+
+def _run_questions(module, root):
+    return module.run_migration(str(root / "old-project" / "db" / "questions.json"),
+                                str(root / "sql" / "migrate_questions.sql"),
+                                pools_dir=str(root / "static" / "question-pools"))
+
+
+def _merge_inputs(root):
+    module = load_tool("merge_all_sql.py")
+    return [root / "sql" / name for name in module.SQL_FILES]
+
+
+def _run_merge(module, root):
+    return module.merge_sql_files(root / "sql", root / "sql" / "one-shot.sql")
+
+
+STAGES = [
+    Stage(
+        name="groups",
+        title="Group Data Extraction",
+        script="extract-group-data.py",
+        sources=["ts_literal_parser.py", "static_shards.py", "vietnamese_text.py"],
+        inputs=lambda root: [root / CONSTANTS_DIR / "group.ts"],
+        outputs=lambda root: [root / "static" / "group-data.json",
+                              root / "static" / "group-summary.json",
+                              root / "static" / "group-details" / "index.json",
+                              root / "static" / "groups" / "index.json"],
+        run=_run_groups,
+    ),
+    Stage(
+        name="characteristics",
+        title="Characteristics Data Extraction",
+        script="extract-characteristics-data.py",
+        sources=["ts_literal_parser.py", "static_shards.py"],
+        inputs=_characteristics_inputs,
+        outputs=lambda root: [root / "static" / "characteristics-data.json",
+                              root / "static" / "characteristics" / "index.json"],
+        run=_run_characteristics,
+    ),
+    Stage(
+        name="jobs",
+        title="Jobs SQL Migration",
+        script="migrate_jobs_to_sql.py",
+        sources=["sql_writer.py", "suggestion_ranking.py", "php_index.py", "row_snapshot.py",
+                 "vietnamese_text.py", "ts_literal_parser.py", "sqlite_dialect.py",
+                 "sql_normalizer.py", "sql_statements.py"],
+        inputs=lambda root: [root / CONSTANTS_DIR / "suggestJobs.ts"],
+        outputs=lambda root: [root / "sql" / "jobs_data_insertion.sql",
+                              root / "sql" / "jobs_normalized_data.sql",
+                              root / "sql" / "jobs_snapshot.json",
+                              root / "api" / "quiz" / "generated" / "jobs-by-code.php"],
+        run=_run_jobs,
+    ),
+    Stage(
+        name="questions",
+        title="Questions SQL Migration",
+        script="create_sql_migrate_questions.py",
+        sources=["row_snapshot.py", "sql_writer.py", "json_stream.py", "question_classifier.py",
+                 "rules/question_rules.json", "question_pools.py", "static_shards.py"],
+        inputs=lambda root: [root / "old-project" / "db" / "questions.json"],
+        outputs=lambda root: [root / "sql" / "migrate_questions.sql",
+                              root / "sql" / "question_pools.sql",
+                              root / "static" / "question-pools" / "index.json"],
+        run=_run_questions,
+    ),
+    Stage(
+        name="merge",
+        title="Merge SQL (one-shot.sql)",
+        script="merge_all_sql.py",
+        sources=["sql_statements.py", "sql_normalizer.py", "sql_writer.py"],
+        inputs=_merge_inputs,
+        outputs=lambda root: [root / "sql" / "one-shot.sql",
+                              root / "sql" / "one-shot.manifest.json"],
+        run=_run_merge,
+    ),
+]
+
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+
+# ---------------------------------------------------------------------------
+# Dependency graph and input hashing
+# ---------------------------------------------------------------------------
+
+def resolve_paths(stage, root):
+    """Return (inputs, outputs) of a stage as resolved absolute paths"""
+    inputs = [Path(path).resolve() for path in stage.inputs(root)]
+    outputs = [Path(path).resolve() for path in stage.outputs(root)]
+    return inputs, outputs
+
+
+def build_dependencies(stages, root):
+    """Map stage name -> set of stage names that produce one of its inputs"""
+    producers = {}
+    for stage in stages:
+        for output in resolve_paths(stage, root)[1]:
+            producers[output] = stage.name
+
+    dependencies = {}
+    for stage in stages:
+        inputs = resolve_paths(stage, root)[0]
+        dependencies[stage.name] = {producers[path] for path in inputs
+                                    if path in producers and producers[path] != stage.name}
+    return dependencies
+
+
+def select_stages(names, dependencies):
+    """Requested stages plus everything they depend on, in definition order"""
+    if not names:
+        return [stage.name for stage in STAGES]
+
+    selected = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(dependencies[name])
+    return [stage.name for stage in STAGES if stage.name in selected]
+
+
+def hash_file(path, digest):
+    """Feed a file (or a marker when it does not exist) into digest"""
+    digest.update(str(path).encode('utf-8'))
+    try:
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        digest.update(b'<missing>')
+
+
+def stage_fingerprint(stage, root):
+    """SHA-256 over the stage's input files and the tool sources it runs"""
+    digest = hashlib.sha256()
+    for path in [SCRIPT_DIR / stage.script] + [SCRIPT_DIR / name for name in stage.sources]:
+        hash_file(path, digest)
+    for path in resolve_paths(stage, root)[0]:
+        hash_file(path, digest)
+    return digest.hexdigest()
+
+
+def load_cache(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache_file, cache):
+    with open(cache_file, 'w', encoding='utf-8') as file:
+        json.dump(cache, file, indent=2, sort_keys=True)
+
+
+def is_up_to_date(stage, root, fingerprint, cache):
+    """True when the fingerprint matches the last successful run and outputs exist"""
+    if cache.get(stage.name) != fingerprint:
+        return False
+    return all(path.exists() for path in resolve_paths(stage, root)[1])
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+def execute_stage(name, root, instrumentation_options=None):
+    """Run one stage with its output captured
+
+    Returns (name, ok, output, seconds, stage_records) where stage_records are
+    the instrumentation records the stage produced. Top-level function so it
+    can be sent to worker processes.
+    """
+    stage = STAGES_BY_NAME[name]
+    root = Path(root)
+    buffer = io.StringIO()
+    if instrumentation_options:
+        instrumentation.configure(**instrumentation_options)
+    first_record = len(instrumentation.records())
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            with instrumentation.instrument_stage(f"pipeline.{name}"):
+                ok = bool(stage.run(load_tool(stage.script), root))
+        except SystemExit as e:
+            ok = e.code in (0, None)
+        except Exception:
+            traceback.print_exc()
+            ok = False
+
+    stage_records = instrumentation.records()[first_record:]
+    return name, ok, buffer.getvalue(), time.perf_counter() - start, stage_records
+
+
+def report_stage(stage, ok, output, seconds):
+    print(f"\n{'='*60}")
+    print(f"[RUNNING] {stage.title}")
+    print(f"{'='*60}")
+    if output:
+        print(output.rstrip())
+    if ok:
+        print(f"[SUCCESS] {stage.title} completed in {seconds:.2f}s")
+    else:
+        print(f"[ERROR] {stage.title} failed after {seconds:.2f}s")
+
+
+def run_pipeline(stage_names=None, root=PROJECT_ROOT, jobs=None, force=False,
+                 cache_file=CACHE_FILE, instrumentation_options=None):
+    """Build the requested stages; returns {stage name: status}
+
+    Status is one of 'built', 'skipped' (up to date), 'failed' or 'blocked'
+    (a dependency failed). instrumentation_options are passed to
+    instrumentation.configure() in every worker; the stage records of all
+    workers end up in instrumentation.records() of this process.
+    """
+    root = Path(root).resolve()
+    dependencies = build_dependencies(STAGES, root)
+
+    unknown = [name for name in stage_names or [] if name not in STAGES_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)}")
+
+    selected = select_stages(stage_names, dependencies)
+    cache = {} if force else load_cache(cache_file)
+    new_cache = load_cache(cache_file)
+    status = {}
+    fingerprints = {}
+    running = set()
+
+    def ready_stages():
+        """Stages whose dependencies are all finished; marks skipped/blocked ones"""
+        ready = []
+        for name in selected:
+            if name in status or name in running:
+                continue
+            deps = dependencies[name] & set(selected)
+            if any(status.get(dep) in ('failed', 'blocked') for dep in deps):
+                status[name] = 'blocked'
+                print(f"[SKIPPED] {STAGES_BY_NAME[name].title} - a dependency failed")
+                continue
+            if not all(dep in status for dep in deps):
+                continue
+
+            stage = STAGES_BY_NAME[name]
+            fingerprints[name] = stage_fingerprint(stage, root)
+            if is_up_to_date(stage, root, fingerprints[name], cache):
+                status[name] = 'skipped'
+                print(f"[UP-TO-DATE] {stage.title}")
+                continue
+            ready.append(name)
+        return ready
+
+    def finish(name, ok, output, seconds, stage_records=()):
+        report_stage(STAGES_BY_NAME[name], ok, output, seconds)
+        status[name] = 'built' if ok else 'failed'
+        if ok:
+            # Inputs may have been produced by an upstream stage in this run
+            new_cache[name] = stage_fingerprint(STAGES_BY_NAME[name], root)
+        else:
+            new_cache.pop(name, None)
+
+    if jobs == 1:
+        while True:
+            ready = ready_stages()
+            if not ready:
+                break
+            for name in ready:
+                # Records of in-process stages are already collected
+                finish(*execute_stage(name, root, instrumentation_options)[:4])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {}
+            while True:
+                for name in ready_stages():
+                    running.add(name)
+                    futures[executor.submit(execute_stage, name, str(root),
+                                            instrumentation_options)] = name
+                if not futures:
+                    break
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    running.discard(name)
+                    try:
+                        result = future.result()
+                        instrumentation.add_records(result[4])
+                        finish(*result)
+                    except Exception as e:
+                        finish(name, False, f"[ERROR] Worker crashed: {e}", 0.0)
+
+    save_cache(cache_file, new_cache)
+    return status
+
+
+def instrumentation_options(args):
+    """Worker instrumentation settings from the parsed command line flags"""
+    return {
+        "profile": args.profile,
+        "profile_dir": str(Path(args.profile_dir).resolve()),
+        "track_memory": bool(args.timing_report),
+    }
+
+
+def print_summary(status):
+    print(f"\n{'='*60}")
+    print("[SUMMARY] BUILD SUMMARY")
+    print(f"{'='*60}")
+    for name, result in status.items():
+        print(f"   {result.upper():8s} {STAGES_BY_NAME[name].title}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Build all generated data files")
+    parser.add_argument('stages', nargs='*', metavar='STAGE',
+                        help=f"stages to build ({', '.join(STAGES_BY_NAME)}); default: all")
+    parser.add_argument('--force', action='store_true', help='rebuild even if inputs are unchanged')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count; 1 = serial, in-process)')
+    instrumentation.add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    instrumentation.configure_from_args(args)
+
+    print("PAC Data Build Pipeline")
+    print("=" * 60)
+
+    try:
+        status = run_pipeline(args.stages, jobs=args.jobs, force=args.force,
+                              instrumentation_options=instrumentation_options(args))
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(2)
+
+    print_summary(status)
+    instrumentation.finish_from_args(args, "build_pipeline")
+    if any(result in ('failed', 'blocked') for result in status.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
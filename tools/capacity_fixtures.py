@@ -0,0 +1,721 @@
+#!/usr/bin/env python3
+"""
+Capacity test fixtures for the user, quiz and order tables
+Author: PAC Development Team
+Purpose: Generate consistent, referentially valid rows for users, sessions,
+         orders, order_items, purchased_packages, quiz_exams, quiz_answers,
+         quiz_results and quiz_suggested_jobs at any scale (millions of rows),
+         so get-user-exams.php, payment-history.php and the admin listings
+         can be measured at the table sizes we expect
+
+Usage:
+    python capacity_fixtures.py --users 100000
+    python capacity_fixtures.py --users 1000000 --seed 7 --output-dir /data/pac-capacity
+    python capacity_fixtures.py --users 20000 --load-data     # TSV files + LOAD DATA script
+    python capacity_fixtures.py --users 2000 --check          # verify keys in SQLite
+
+    cat ../sql/capacity/*.sql | mysql -u root pac_bench       # after one-shot.sql
+
+Reference data: the files one-shot.sql is merged from (merge_all_sql.SQL_FILES)
+are loaded into SQLite with sqlite_dialect.py, and the fixtures only point
+at rows those files create: products, product_packages, quiz_package_configs,
+active questions and jobs. Generated ids start after the largest id of each
+table there, so the fixtures load on top of one-shot.sql.
+
+Output (OUTPUT_DIR, default sql/capacity): one file per table in load order
+(01-users.sql ... 09-quiz_suggested_jobs.sql). Each file holds multi-row
+INSERTs sized to max_allowed_packet, with unique and foreign key checks and
+autocommit turned off and a single COMMIT at the end. A manifest
+(capacity-fixtures.manifest.json) holds the first id and the row count per
+table; benchmark_http_load.py logs in as the users it lists. With --load-data the
+tables are written as TSV files plus load-data.sql. For a given --users and
+--seed the output is always the same.
+
+Model (one random.Random for the whole run, user by user):
+    users        sign-ups over HISTORY_DAYS before HISTORY_END, more of them
+                 recently; mostly active students, a few banned / admins
+    sessions     0-6 per user, some still valid, "remember me" ones for 30 days
+    orders       for ORDER_RATE of the users; 1-3 paid packages each;
+                 completed + paid, pending or cancelled + failed
+    purchases    one purchased_packages row per item of a completed and paid
+                 order, like the auto_create_purchased_packages trigger
+    quiz_exams   most users take one test, some several, a few hundreds of
+                 power users many; paid career test packages only after they
+                 were bought; only the latest exam can be a draft (QuizGenerator
+                 refuses a second one)
+    answers      one row per question of the exam (questions_per_group per
+                 Holland group from the config), biased towards a per-user
+                 profile; drafts have unanswered rows (user_answer -1)
+    results      scores from the answers exactly like complete-quiz.php
+    suggestions  the CareerSuggestionEngine ranking of the result's code
+                 (suggestion_ranking.py), in the columns the generated
+                 quiz_suggested_jobs table actually has
+Ids follow user order, not event time. Every user has the password
+DEFAULT_PASSWORD (login.php compares plain text) and the username
+capacity_<id>.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import merge_all_sql  # noqa: E402
+from migrate_jobs_to_sql import TSV_ESCAPES  # noqa: E402
+from sql_writer import (DEFAULT_MAX_ALLOWED_PACKET, PACKET_HEADROOM,  # noqa: E402
+                        ROW_SEPARATOR, SQLFileWriter)
+from sqlite_dialect import SQLiteLoader  # noqa: E402
+from suggestion_ranking import (HOLLAND_LETTERS, SAVED_JOB_COLUMNS, add_job_id,  # noqa: E402
+                                rank_suggestions, saved_job_values)
+from synthetic_data import DEFAULT_SEED  # noqa: E402
+
+PROJECT_ROOT = SCRIPT_DIR.parent
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "sql" / "capacity"
+MANIFEST_FILE = "capacity-fixtures.manifest.json"
+LOAD_SCRIPT_FILE = "load-data.sql"
+
+DEFAULT_USERS = 10000
+DEFAULT_PASSWORD = "capacity123"
+
+# Fixed end of the simulated history, so the output does not depend on the day it runs
+HISTORY_END = datetime(2025, 12, 31, 20, 0, 0)
+HISTORY_DAYS = 730
+
+# Weighted choices
+USER_STATUSES = {'active': 94, 'inactive': 3, 'pending': 2, 'banned': 1}
+USER_ROLES = {'user': 995, 'moderator': 4, 'admin': 1}
+ORDER_OUTCOMES = {('completed', 'paid'): 72, ('pending', 'pending'): 18, ('cancelled', 'failed'): 10}
+PAYMENT_METHODS = {'vnpay': 85, 'bank_transfer': 15}
+ITEMS_PER_ORDER = {1: 80, 2: 15, 3: 5}
+
+EMAIL_VERIFIED_RATE = 0.8
+SESSION_CONTINUE_RATE = 0.5         # P(one more session), at most MAX_SESSIONS
+MAX_SESSIONS = 6
+REMEMBER_RATE = 0.3
+ORDER_RATE = 0.35                   # users with at least one order
+ORDER_CONTINUE_RATE = 0.25
+EXAM_RATE = 0.75                    # users with at least one exam
+EXAM_CONTINUE_RATE = 0.45
+POWER_USER_RATE = 0.001             # users with POWER_USER_EXAMS exams
+POWER_USER_EXAMS = (20, 60)
+DRAFT_RATE = 0.15                   # latest exam left unfinished
+PAID_EXAM_RATE = 0.8                # exams on an owned paid test package
+SECONDS_PER_QUESTION = (6, 25)
+
+# P(user_answer = 0, 1, 2) for questions of the user's profile letters and the others
+PROFILE_ANSWER_WEIGHTS = [10, 30, 60]
+OTHER_ANSWER_WEIGHTS = [45, 35, 20]
+
+# purchased_packages.access_code prefixes of the generate_access_code trigger
+ACCESS_CODE_PREFIXES = {'course': 'CRS', 'career_test': 'TST', 'consultation': 'CON'}
+
+SURNAMES = ["Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Huỳnh", "Phan", "Vũ", "Võ", "Đặng",
+            "Bùi", "Đỗ", "Hồ", "Ngô", "Dương", "Lý"]
+MIDDLE_NAMES = ["Văn", "Thị", "Minh", "Ngọc", "Thanh", "Hoàng", "Quốc", "Gia", "Bảo", "Thu"]
+GIVEN_NAMES = ["An", "Bình", "Chi", "Dũng", "Giang", "Hà", "Hải", "Hân", "Hiếu", "Hương", "Khang",
+               "Khánh", "Linh", "Long", "Mai", "Nam", "Ngân", "Phúc", "Quân", "Tâm", "Thảo", "Trang",
+               "Trung", "Tú", "Uyên", "Vy", "Yến"]
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+    "Mozilla/5.0 (Linux; Android 14; SM-A546E) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Mobile Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+]
+
+# Load order; quiz_suggested_jobs columns come from the schema
+TABLE_COLUMNS = {
+    "users": ["id", "fullname", "email", "username", "password", "phone", "birth_date", "status",
+              "role", "email_verified", "created_at", "updated_at"],
+    "sessions": ["id", "user_id", "session_token", "expires_at", "user_agent", "ip_address",
+                 "is_remember", "created_at", "updated_at"],
+    "orders": ["id", "order_code", "user_id", "total_amount", "status", "payment_method",
+               "payment_status", "created_at", "updated_at"],
+    "order_items": ["id", "order_id", "product_id", "package_id", "quantity", "unit_price",
+                    "total_price", "product_name", "package_name", "created_at"],
+    "purchased_packages": ["id", "user_id", "order_id", "package_id", "access_code", "package_name",
+                           "product_name", "product_type", "package_price", "status",
+                           "access_starts_at", "first_accessed_at", "last_accessed_at",
+                           "access_count", "created_at", "updated_at"],
+    "quiz_exams": ["id", "exam_code", "user_id", "exam_type", "package_id", "product_id",
+                   "exam_status", "total_questions", "answered_questions", "start_time",
+                   "end_time", "time_limit", "ip_address", "created_at", "updated_at"],
+    "quiz_answers": ["id", "exam_id", "question_id", "user_answer", "answer_time", "is_changed",
+                     "change_count", "created_at", "updated_at"],
+    "quiz_results": ["id", "exam_id", "user_id", "score_r", "score_i", "score_a", "score_s",
+                     "score_e", "score_c", "total_score", "holland_code", "primary_group",
+                     "secondary_group", "tertiary_group", "characteristics_code",
+                     "calculation_time", "created_at", "updated_at"],
+    "quiz_suggested_jobs": None,
+}
+
+
+def sql_literal(value):
+    """MySQL literal of a Python value"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        return f"'{value:%Y-%m-%d %H:%M:%S}'"
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def tsv_field(value):
+    """LOAD DATA field of a Python value (default escaping, NULL as \\N)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, datetime):
+        return f"{value:%Y-%m-%d %H:%M:%S}"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return str(value).translate(TSV_ESCAPES)
+
+
+class SQLTableFile:
+    """Rows of one table as byte-bounded multi-row INSERTs in a bulk-load wrapper"""
+
+    def __init__(self, path, table, columns, max_bytes):
+        self.writer = SQLFileWriter(path)
+        self.path = path
+        self.table = table
+        self.prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n"
+        self.overhead = len(self.prefix.encode('utf-8')) + len(";\n")
+        self.max_bytes = max_bytes
+        self.batch = []
+        self.size = self.overhead
+        self.rows = 0
+
+    encode = staticmethod(sql_literal)
+
+    def __enter__(self):
+        self.writer.__enter__()
+        self.writer.write(f"-- Capacity fixtures: {self.table} (generated by tools/capacity_fixtures.py)\n"
+                          "SET UNIQUE_CHECKS = 0;\nSET FOREIGN_KEY_CHECKS = 0;\nSET AUTOCOMMIT = 0;\n\n")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self._flush()
+            self.writer.write("COMMIT;\nSET UNIQUE_CHECKS = 1;\nSET FOREIGN_KEY_CHECKS = 1;\nSET AUTOCOMMIT = 1;\n")
+        return self.writer.__exit__(exc_type, exc_value, traceback)
+
+    def add(self, values):
+        self.add_encoded([self.encode(value) for value in values])
+
+    def add_encoded(self, fields):
+        """Add a row of already encoded values"""
+        row = "(" + ", ".join(fields) + ")"
+        row_size = len(row.encode('utf-8')) + len(ROW_SEPARATOR)
+        if self.overhead + row_size > self.max_bytes:
+            raise ValueError(f"{self.table} row of {row_size} bytes does not fit in a "
+                             f"{self.max_bytes}-byte statement")
+        if self.batch and self.size + row_size > self.max_bytes:
+            self._flush()
+        self.batch.append(row)
+        self.size += row_size
+        self.rows += 1
+
+    def _flush(self):
+        if self.batch:
+            self.writer.write(self.prefix + ROW_SEPARATOR.join(self.batch) + ";\n\n")
+            self.writer.end_batch()
+            self.batch = []
+            self.size = self.overhead
+
+
+class TSVTableFile:
+    """Rows of one table as a LOAD DATA file (header line, tab separated)"""
+
+    # Rows written between two flushes
+    FLUSH_ROWS = 5000
+
+    def __init__(self, path, table, columns, max_bytes=None):
+        self.writer = SQLFileWriter(path, newline='')
+        self.path = path
+        self.table = table
+        self.columns = columns
+        self.rows = 0
+
+    encode = staticmethod(tsv_field)
+
+    def __enter__(self):
+        self.writer.__enter__()
+        self.writer.write('\t'.join(self.columns) + '\n')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.writer.__exit__(exc_type, exc_value, traceback)
+
+    def add(self, values):
+        self.add_encoded([self.encode(value) for value in values])
+
+    def add_encoded(self, fields):
+        """Add a row of already encoded values"""
+        self.writer.write('\t'.join(fields) + '\n')
+        self.rows += 1
+        if self.rows % self.FLUSH_ROWS == 0:
+            self.writer.end_batch()
+
+
+def load_data_script(outputs):
+    """load-data.sql for the TSV files, in load order"""
+    parts = ["-- Capacity fixtures: LOAD DATA script (generated by tools/capacity_fixtures.py)\n"
+             "-- Run from the directory of the TSV files with local_infile enabled, e.g.:\n"
+             f"--   mysql --local-infile=1 -u root pac_bench < {LOAD_SCRIPT_FILE}\n\n"
+             "SET UNIQUE_CHECKS = 0;\nSET FOREIGN_KEY_CHECKS = 0;\n\n"]
+    for output in outputs.values():
+        parts.append(f"LOAD DATA LOCAL INFILE '{Path(output.path).name}'\n"
+                     f"INTO TABLE {output.table}\n"
+                     "CHARACTER SET utf8mb4\n"
+                     "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n"
+                     "LINES TERMINATED BY '\\n'\n"
+                     "IGNORE 1 LINES\n"
+                     f"({', '.join(output.columns)});\n\n")
+    parts.append("SET UNIQUE_CHECKS = 1;\nSET FOREIGN_KEY_CHECKS = 1;\n")
+    return ''.join(parts)
+
+
+def load_reference(sql_dir):
+    """SQLite database with the merged SQL files loaded; returns (connection, loader)"""
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    loader = SQLiteLoader(connection)
+    connection.execute("BEGIN")
+    for name in merge_all_sql.SQL_FILES:
+        path = Path(sql_dir) / name
+        if path.exists():
+            loader.load_file(path)
+    connection.execute("COMMIT")
+    return connection, loader
+
+
+class Reference:
+    """Catalogue rows the fixtures point at, read from the reference database"""
+
+    def __init__(self, connection):
+        connection.row_factory = sqlite3.Row
+        try:
+            self._read(connection)
+        finally:
+            connection.row_factory = None
+
+    def _read(self, connection):
+        self.next_ids = {}
+        for table in TABLE_COLUMNS:
+            self.next_ids[table] = connection.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()[0]
+
+        self.packages = {}
+        for row in connection.execute(
+                "SELECT pp.id, pp.product_id, pp.package_name, pp.original_price, pp.sale_price, pp.is_free, "
+                "p.name AS product_name, p.type AS product_type "
+                "FROM product_packages pp JOIN products p ON p.id = pp.product_id "
+                "WHERE pp.status = 'active' AND p.status = 'active' ORDER BY pp.id"):
+            package = dict(row)
+            price = package['sale_price'] if package['sale_price'] is not None else package['original_price']
+            package['price'] = round(float(price), 2)
+            self.packages[package['id']] = package
+        # Cheaper packages sell more often
+        self.paid_packages = [package for package in self.packages.values() if not package['is_free']]
+        self.package_weights = [1 / (1 + package['price'] / 1000000) for package in self.paid_packages]
+
+        # quiz_package_configs whose product matches the package
+        self.quiz_configs = {}
+        self.skipped_configs = []
+        for row in connection.execute("SELECT * FROM quiz_package_configs ORDER BY package_id"):
+            package = self.packages.get(row['package_id'])
+            if package is None or package['product_id'] != row['product_id']:
+                self.skipped_configs.append(row['package_id'])
+                continue
+            self.quiz_configs[row['package_id']] = dict(row)
+        self.free_configs = [config for package_id, config in self.quiz_configs.items()
+                             if self.packages[package_id]['is_free']]
+
+        self.questions = {letter: [] for letter in HOLLAND_LETTERS}
+        for row in connection.execute("SELECT question_id, holland_code FROM questions "
+                                      "WHERE is_active = 1 ORDER BY id"):
+            if row['holland_code'] in self.questions:
+                self.questions[row['holland_code']].append(row['question_id'])
+
+        self.jobs = {}
+        self.job_ids_by_code = {}
+        for row in connection.execute("SELECT * FROM jobs WHERE is_active = 1 ORDER BY id"):
+            self.jobs[row['id']] = row
+            add_job_id(self.job_ids_by_code, row['holland_code'], row['id'])
+
+        schema = [row['name'] for row in connection.execute("PRAGMA table_info(quiz_suggested_jobs)")]
+        self.missing_suggestion_columns = [column for column in SAVED_JOB_COLUMNS if column not in schema]
+        # job_code is a legacy column the engine does not write: filled with the job id
+        self.suggestion_columns = (["id"] + [column for column in SAVED_JOB_COLUMNS if column in schema]
+                                   + [column for column in ("job_code", "created_at") if column in schema])
+
+    def problems(self):
+        """Reasons the reference data cannot back the fixtures"""
+        problems = []
+        if not self.paid_packages:
+            problems.append("no active paid product_packages (sample-data.sql)")
+        if not self.quiz_configs:
+            problems.append("no usable quiz_package_configs (questions-and-quiz.sql)")
+        for letter, question_ids in self.questions.items():
+            if not question_ids:
+                problems.append(f"no active questions for Holland group {letter}")
+        if not self.jobs:
+            problems.append("no active jobs (jobs_data_insertion.sql)")
+        return problems
+
+
+class FixtureGenerator:
+    """Simulate users one by one and write their rows to the table outputs"""
+
+    def __init__(self, reference, outputs, seed):
+        self.reference = reference
+        self.outputs = outputs
+        self.rng = random.Random(seed)
+        self.next_ids = dict(reference.next_ids)
+        self.rankings = {}
+        self.history_start = HISTORY_END - timedelta(days=HISTORY_DAYS)
+
+    def _id(self, table):
+        value = self.next_ids[table]
+        self.next_ids[table] += 1
+        return value
+
+    def _choice(self, weights):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _count(self, continue_rate, limit):
+        """1 + geometric number of repeats, at most limit"""
+        count = 1
+        while count < limit and self.rng.random() < continue_rate:
+            count += 1
+        return count
+
+    def _time_between(self, start, end):
+        return start + timedelta(seconds=int((end - start).total_seconds() * self.rng.random()))
+
+    def _ip_address(self):
+        return f"{self.rng.choice((14, 27, 113, 171, 222))}.{self.rng.randrange(256)}." \
+               f"{self.rng.randrange(256)}.{self.rng.randrange(1, 255)}"
+
+    def generate(self, users, progress=None):
+        for index in range(users):
+            self.user()
+            if progress and (index + 1) % progress == 0:
+                print(f"[INFO] {index + 1:,} / {users:,} users")
+
+    def user(self):
+        rng = self.rng
+        user_id = self._id("users")
+        # More sign-ups recently: days before HISTORY_END skewed towards 0
+        created = HISTORY_END - timedelta(seconds=int(HISTORY_DAYS * 86400 * rng.random() ** 2))
+        age = rng.choice((14, 15, 16, 17, 17, 18, 18, 19, 20, 21, 22, 25, 30, 40))
+        birth_date = (created - timedelta(days=age * 365 + rng.randrange(365))).date().isoformat()
+        fullname = f"{rng.choice(SURNAMES)} {rng.choice(MIDDLE_NAMES)} {rng.choice(GIVEN_NAMES)}"
+        self.outputs["users"].add([
+            user_id, fullname, f"capacity_{user_id}@example.com", f"capacity_{user_id}", DEFAULT_PASSWORD,
+            f"09{rng.randrange(10 ** 8):08d}", birth_date, self._choice(USER_STATUSES),
+            self._choice(USER_ROLES), int(rng.random() < EMAIL_VERIFIED_RATE), created, created])
+
+        self.sessions(user_id, created)
+        owned_tests = self.orders(user_id, created)
+        self.exams(user_id, created, owned_tests)
+
+    def sessions(self, user_id, created):
+        rng = self.rng
+        count = self._count(SESSION_CONTINUE_RATE, MAX_SESSIONS) if rng.random() < 0.8 else 0
+        for _ in range(count):
+            start = self._time_between(created, HISTORY_END)
+            remember = rng.random() < REMEMBER_RATE
+            expires = start + timedelta(days=30 if remember else 1)
+            self.outputs["sessions"].add([
+                self._id("sessions"), user_id, f"{rng.getrandbits(256):064x}", expires,
+                rng.choice(USER_AGENTS), self._ip_address(), int(remember), start, start])
+
+    def orders(self, user_id, created):
+        """Write the user's orders; returns [(paid at, package id)] of owned career tests"""
+        rng = self.rng
+        reference = self.reference
+        owned_tests = []
+        if rng.random() >= ORDER_RATE:
+            return owned_tests
+        for _ in range(self._count(ORDER_CONTINUE_RATE, 5)):
+            order_id = self._id("orders")
+            ordered = self._time_between(created, HISTORY_END)
+            status, payment_status = self._choice(ORDER_OUTCOMES)
+            packages = []
+            for package in rng.choices(reference.paid_packages, weights=reference.package_weights,
+                                       k=self._choice(ITEMS_PER_ORDER)):
+                if package not in packages:
+                    packages.append(package)
+            total = round(sum(package['price'] for package in packages), 2)
+            updated = ordered + timedelta(minutes=rng.randrange(1, 30)) if status != 'pending' else ordered
+            self.outputs["orders"].add([
+                order_id, f"PAC{ordered:%Y%m%d}{order_id:06d}", user_id, total, status,
+                self._choice(PAYMENT_METHODS), payment_status, ordered, updated])
+
+            for package in packages:
+                self.outputs["order_items"].add([
+                    self._id("order_items"), order_id, package['product_id'], package['id'], 1,
+                    package['price'], package['price'], package['product_name'], package['package_name'],
+                    ordered])
+            if (status, payment_status) != ('completed', 'paid'):
+                continue
+            for package in packages:
+                self.purchase(user_id, order_id, package, updated)
+                if package['id'] in reference.quiz_configs:
+                    owned_tests.append((updated, package['id']))
+        return owned_tests
+
+    def purchase(self, user_id, order_id, package, paid):
+        rng = self.rng
+        purchase_id = self._id("purchased_packages")
+        prefix = ACCESS_CODE_PREFIXES.get(package['product_type'], 'PKG')
+        access_code = f"{prefix}_{user_id}_{int(paid.timestamp())}_{package['id']}_{purchase_id}"
+        accesses = rng.choice((0, 1, 1, 2, 3, 5, 8, 13))
+        first_access = last_access = None
+        if accesses:
+            first_access = self._time_between(paid, min(paid + timedelta(days=7), HISTORY_END))
+            last_access = self._time_between(first_access, HISTORY_END)
+        status = 'completed' if accesses >= 5 and package['product_type'] != 'course' else 'active'
+        self.outputs["purchased_packages"].add([
+            purchase_id, user_id, order_id, package['id'], access_code, package['package_name'],
+            package['product_name'], package['product_type'], package['price'], status, paid,
+            first_access, last_access, accesses, paid, last_access or paid])
+
+    def exams(self, user_id, created, owned_tests):
+        rng = self.rng
+        if rng.random() < POWER_USER_RATE:
+            count = rng.randint(*POWER_USER_EXAMS)
+        elif rng.random() < EXAM_RATE:
+            count = self._count(EXAM_CONTINUE_RATE, 10)
+        else:
+            return
+        # Profile: the user's "true" Holland code, answers lean towards its letters
+        profile = set(rng.sample(HOLLAND_LETTERS, 3))
+        starts = sorted(self._time_between(created, HISTORY_END) for _ in range(count))
+        for number, start in enumerate(starts):
+            owned = [package_id for paid, package_id in owned_tests if paid <= start]
+            if owned and rng.random() < PAID_EXAM_RATE:
+                config = self.reference.quiz_configs[rng.choice(owned)]
+            else:
+                config = rng.choice(self.reference.free_configs or list(self.reference.quiz_configs.values()))
+            draft = number == count - 1 and rng.random() < DRAFT_RATE
+            self.exam(user_id, start, config, profile, draft)
+
+    def exam(self, user_id, start, config, profile, draft):
+        rng = self.rng
+        reference = self.reference
+        exam_id = self._id("quiz_exams")
+        questions = []
+        for letter in HOLLAND_LETTERS:
+            pool = reference.questions[letter]
+            questions += [(question_id, letter) for question_id in
+                          rng.sample(pool, min(config['questions_per_group'], len(pool)))]
+        rng.shuffle(questions)
+        answered = rng.randrange(len(questions)) if draft else len(questions)
+
+        scores = dict.fromkeys(HOLLAND_LETTERS, 0)
+        moment = start
+        answer_rows = []
+        for position, (question_id, letter) in enumerate(questions):
+            if position < answered:
+                weights = PROFILE_ANSWER_WEIGHTS if letter in profile else OTHER_ANSWER_WEIGHTS
+                answer = rng.choices((0, 1, 2), weights=weights)[0]
+                moment += timedelta(seconds=rng.randint(*SECONDS_PER_QUESTION))
+                changes = 1 if rng.random() < 0.05 else 0
+                scores[letter] += answer
+                answer_rows.append([question_id, answer, moment, changes, changes, start, moment])
+            else:
+                answer_rows.append([question_id, -1, None, 0, 0, start, start])
+        end = None if draft else moment
+
+        # time_limit: QuizGenerator::getTimeLimit() stores 0 (unlimited) for every package
+        exam_type = 0 if reference.packages[config['package_id']]['is_free'] else 1
+        self.outputs["quiz_exams"].add([
+            exam_id, f"EX{start:%Y%m%d}_{exam_id:06X}", user_id, exam_type, config['package_id'],
+            config['product_id'], 0 if draft else 1, len(questions), answered, start, end, 0,
+            self._ip_address(), start, end or moment])
+        for row in answer_rows:
+            self.outputs["quiz_answers"].add([self._id("quiz_answers"), exam_id] + row)
+        if not draft:
+            self.result(exam_id, user_id, scores, end)
+
+    def result(self, exam_id, user_id, scores, completed):
+        result_id = self._id("quiz_results")
+        # arsort() in complete-quiz.php keeps RIASEC order for equal scores
+        top_three = sorted(HOLLAND_LETTERS, key=lambda letter: -scores[letter])[:3]
+        holland_code = ''.join(top_three)
+        self.outputs["quiz_results"].add([
+            result_id, exam_id, user_id] + [scores[letter] for letter in HOLLAND_LETTERS] + [
+            sum(scores.values()), holland_code, top_three[0], top_three[1], top_three[2],
+            holland_code[:2], round(self.rng.uniform(2, 40), 2), completed, completed])
+
+        output = self.outputs["quiz_suggested_jobs"]
+        encode = output.encode
+        for encoded in self._ranking(holland_code):
+            output.add_encoded([encode(self._id("quiz_suggested_jobs")), encode(result_id)] + encoded
+                               + ([encode(completed)] if "created_at" in self.reference.suggestion_columns else []))
+
+    def _ranking(self, holland_code):
+        """Encoded suggestion rows of a code without id, result_id and created_at (cached per code)"""
+        if holland_code not in self.rankings:
+            encode = self.outputs["quiz_suggested_jobs"].encode
+            columns = [column for column in self.reference.suggestion_columns
+                       if column not in ("id", "result_id", "created_at")]
+            rows = []
+            for sort_order, suggestion in enumerate(rank_suggestions(holland_code, self.reference.job_ids_by_code)):
+                values = saved_job_values(None, sort_order, suggestion, self.reference.jobs[suggestion.job_id])
+                values["job_code"] = str(suggestion.job_id)
+                rows.append([encode(values[column]) for column in columns])
+            self.rankings[holland_code] = rows
+        return self.rankings[holland_code]
+
+
+def table_columns(reference, table):
+    """Column list of a table in output order"""
+    if table != "quiz_suggested_jobs":
+        return TABLE_COLUMNS[table]
+    columns = reference.suggestion_columns
+    middle = [column for column in columns if column not in ("id", "result_id", "created_at")]
+    return ["id", "result_id"] + middle + (["created_at"] if "created_at" in columns else [])
+
+
+def output_path(output_dir, number, table, load_data):
+    return Path(output_dir) / f"{number:02d}-{table}.{'tsv' if load_data else 'sql'}"
+
+
+def write_fixtures(reference, output_dir, users, seed, load_data=False,
+                   max_allowed_packet=DEFAULT_MAX_ALLOWED_PACKET, progress=None):
+    """Write all table files; returns the manifest dict"""
+    os.makedirs(output_dir, exist_ok=True)
+    # Files of the other format or of a previous run would be loaded too
+    for stale in Path(output_dir).glob("[0-9][0-9]-*.*"):
+        if stale.suffix in (".sql", ".tsv"):
+            stale.unlink()
+
+    table_file = TSVTableFile if load_data else SQLTableFile
+    max_bytes = max_allowed_packet - PACKET_HEADROOM
+    with contextlib.ExitStack() as stack:
+        outputs = {}
+        for number, table in enumerate(TABLE_COLUMNS, start=1):
+            outputs[table] = stack.enter_context(table_file(
+                str(output_path(output_dir, number, table, load_data)), table,
+                table_columns(reference, table), max_bytes))
+        FixtureGenerator(reference, outputs, seed).generate(users, progress)
+
+    tables = {}
+    for table, output in outputs.items():
+        tables[table] = {"file": Path(output.path).name, "first_id": reference.next_ids[table],
+                         "rows": output.rows, "bytes": os.path.getsize(output.path)}
+    if load_data:
+        with SQLFileWriter(Path(output_dir) / LOAD_SCRIPT_FILE) as writer:
+            writer.write(load_data_script(outputs))
+    manifest = {"users": users, "seed": seed, "format": "load-data" if load_data else "sql",
+                "max_allowed_packet": max_allowed_packet, "tables": tables}
+    with SQLFileWriter(Path(output_dir) / MANIFEST_FILE) as writer:
+        writer.write(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+    return manifest
+
+
+def check_fixtures(sql_dir, output_dir, manifest, first_ids):
+    """Load reference + fixture SQL into SQLite and check row counts and keys; True when valid"""
+    connection, loader = load_reference(sql_dir)
+    errors_before = len(loader.errors)
+    connection.execute("BEGIN")
+    for entry in manifest["tables"].values():
+        loader.load_file(Path(output_dir) / entry["file"])
+    connection.execute("COMMIT")
+
+    valid = True
+    for source, statement, message in loader.errors[errors_before:]:
+        valid = False
+        print(f"[FAIL] {source}: {message} in: {statement}")
+    for table, entry in manifest["tables"].items():
+        count = connection.execute(f"SELECT COUNT(*) FROM {table} WHERE id >= ?",
+                                   (first_ids[table],)).fetchone()[0]
+        if count != entry["rows"]:
+            valid = False
+            print(f"[FAIL] {table}: {count:,} rows loaded, manifest says {entry['rows']:,}")
+    violations = {}
+    for table, _, parent, _ in connection.execute("PRAGMA foreign_key_check"):
+        violations[(table, parent)] = violations.get((table, parent), 0) + 1
+    for (table, parent), count in sorted(violations.items()):
+        valid = False
+        print(f"[FAIL] {count:,} {table} rows reference a missing {parent} row")
+    connection.close()
+    return valid
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS,
+                        help=f'number of users to simulate (default: {DEFAULT_USERS})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='random seed')
+    parser.add_argument('--sql-dir', type=Path, default=merge_all_sql.SQL_DIR,
+                        help='directory with the reference SQL files (default: ../sql)')
+    parser.add_argument('--output-dir', type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help='directory for the fixture files (default: ../sql/capacity)')
+    parser.add_argument('--load-data', action='store_true',
+                        help='write TSV files and a LOAD DATA script instead of INSERT files')
+    parser.add_argument('--max-allowed-packet', type=merge_all_sql.parse_size,
+                        default=DEFAULT_MAX_ALLOWED_PACKET,
+                        help='largest INSERT statement in bytes, e.g. 16M (default: 4M)')
+    parser.add_argument('--check', action='store_true',
+                        help='load the result into SQLite and verify keys (INSERT files only)')
+    args = parser.parse_args()
+
+    print("[INFO] Capacity fixture generator")
+    print("=" * 60)
+    connection, loader = load_reference(args.sql_dir)
+    reference = Reference(connection)
+    connection.close()
+    if loader.errors:
+        print(f"[WARNING] {len(loader.errors)} reference statement(s) failed in SQLite, first: "
+              f"{loader.errors[0][0]}: {loader.errors[0][2]}")
+    for package_id in reference.skipped_configs:
+        print(f"[WARNING] Skipping quiz_package_configs of package {package_id}: "
+              f"its product_id does not match product_packages")
+    if reference.missing_suggestion_columns:
+        print(f"[WARNING] quiz_suggested_jobs has no column "
+              f"{', '.join(reference.missing_suggestion_columns)} (written by saveSuggestedJobs)")
+    problems = reference.problems()
+    if problems:
+        for problem in problems:
+            print(f"[ERROR] Reference data: {problem}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    manifest = write_fixtures(reference, args.output_dir, args.users, args.seed, args.load_data,
+                              args.max_allowed_packet, progress=max(1, args.users // 10))
+    elapsed = time.perf_counter() - start
+    for table, entry in manifest["tables"].items():
+        print(f"[OUTPUT] {entry['file']:28s} {entry['rows']:>12,} rows {entry['bytes'] / 1048576:>10.1f} MB")
+    total_rows = sum(entry["rows"] for entry in manifest["tables"].values())
+    print(f"[INFO] {total_rows:,} rows in {elapsed:.1f} s ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+
+    if args.check:
+        if args.load_data:
+            print("[ERROR] --check reads the INSERT files, run it without --load-data")
+            sys.exit(2)
+        if not check_fixtures(args.sql_dir, args.output_dir, manifest, reference.next_ids):
+            print("[ERROR] Fixtures are not consistent with the reference data")
+            sys.exit(1)
+        print("[OK] All rows loaded, no unique or foreign key violations")
+    print("=" * 60)
+    print(f"[SUCCESS] Fixtures written to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
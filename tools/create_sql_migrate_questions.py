@@ -4,61 +4,86 @@
 Script tạo file SQL migration từ questions.json sang MySQL
 Tác giả: PAC Migration System
 Ngày tạo: November 2025
+
+Mỗi lần chạy ghi questions_snapshot.json (hash nội dung từng câu hỏi theo
+question_id). Với --delta, script chỉ sinh migrate_questions_delta.sql gồm
+INSERT ... ON DUPLICATE KEY UPDATE cho câu hỏi mới/thay đổi và tắt (is_active = 0)
+câu hỏi đã bị xóa, thay vì DELETE FROM questions rồi nạp lại toàn bộ.
+
+Category và độ khó của câu hỏi lấy từ file luật rules/question_rules.json
+(question_classifier), sửa luật không cần sửa code; dùng --rules để chọn file khác.
+
+Script cũng sinh sẵn các bộ câu hỏi cân bằng R/I/A/S/E/C, đã xáo trộn (bảng
+question_pools và static/question-pools/) cho mỗi số câu/nhóm của
+quiz_package_configs, để tạo bài thi chỉ cần chọn một bộ (question_pools.py).
+Bảng question_pools được ghi riêng vào question_pools.sql (cùng thư mục, luôn
+thay toàn bộ, cả khi delta) để merge_all_sql.py gộp vào one-shot.sql.
+
+questions.json được đọc dần từng câu hỏi (json_stream), dạng mảng JSON hoặc
+JSON Lines của mongoexport, nên bộ nhớ không phụ thuộc kích thước file export.
 """
 
+import argparse
 import json
 import os
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
+from itertools import chain
 
-def load_questions_json(file_path):
-    """Đọc file questions.json từ dự án cũ"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        print(f"✅ Đọc thành công {len(data)} câu hỏi từ {file_path}")
-        return data
-    except FileNotFoundError:
-        print(f"❌ Không tìm thấy file: {file_path}")
-        return None
-    except json.JSONDecodeError as e:
-        print(f"❌ Lỗi định dạng JSON: {e}")
-        return None
-    except Exception as e:
-        print(f"❌ Lỗi đọc file: {e}")
-        return None
+from instrumentation import (
+    add_instrumentation_arguments, configure_from_args, finish_from_args, instrument_stage
+)
+from json_stream import JSONStreamError, iter_json_records
+from question_classifier import (
+    CLASSIFY_BATCH_SIZE, DEFAULT_RULES_FILE, QuestionClassifier, RuleFileError
+)
+from question_pools import (
+    DEFAULT_GROUP_SIZES, DEFAULT_POOL_COUNT, HOLLAND_CODES, QuestionSampler, build_pools,
+    capacity_for
+)
+from row_snapshot import UNCHANGED, RowSnapshot, row_hash
+from sql_writer import (
+    DEFAULT_MAX_ALLOWED_PACKET, PACKET_HEADROOM, ROW_SEPARATOR, SQLFileWriter, iter_batches,
+    iter_byte_batches
+)
+from static_shards import save_code_shards
 
-def categorize_question(question_text, question_id):
-    """Phân loại câu hỏi dựa vào nội dung và ID"""
-    text = question_text.lower()
-    
-    # Phân loại theo nội dung câu hỏi
-    if any(keyword in text for keyword in ['muốn làm', 'làm việc', 'nghề nghiệp', 'chuyên gia', 'giám đốc', 'trưởng phòng']):
-        return 'interests'  # Câu hỏi về sở thích nghề nghiệp
-    elif any(keyword in text for keyword in ['thích', 'hứng thú', 'quan tâm', 'yêu', 'tham gia']):
-        return 'activities'  # Câu hỏi về hoạt động yêu thích
-    elif any(keyword in text for keyword in ['môn học', 'học', 'khoa học', 'toán', 'nghệ thuật']):
-        return 'subjects'  # Câu hỏi về môn học
-    else:
-        return 'personality'  # Câu hỏi về tính cách
+SNAPSHOT_FILE = "questions_snapshot.json"
+DELTA_FILE = "migrate_questions_delta.sql"
+POOLS_FILE = "question_pools.sql"
+# Đổi khi đổi cột hoặc cách phân loại câu hỏi (snapshot cũ sẽ bị bỏ qua)
+SNAPSHOT_FINGERPRINT = row_hash(["question_id", "question_text", "holland_code", "category",
+                                 "difficulty_level", "createdAt", "updatedAt"])
 
-def determine_difficulty(question_text, holland_code):
-    """Xác định độ khó dựa vào độ phức tạp câu hỏi"""
-    text = question_text.lower()
-    
-    # Câu hỏi dài và phức tạp -> khó
-    if len(question_text) > 80 or any(keyword in text for keyword in [
-        'phức tạp', 'chuyên sâu', 'trừu tượng', 'logic', 'phân tích'
-    ]):
-        return 'hard'
-    
-    # Câu hỏi ngắn và đơn giản -> dễ
-    if len(question_text) < 40 or any(keyword in text for keyword in [
-        'giỏi', 'thích', 'muốn', 'có phải'
-    ]):
-        return 'easy'
+INSERT_PREFIX = """INSERT INTO questions (
+    question_id, question_text, holland_code, category, difficulty_level,
+    sort_order, is_active, created_at, updated_at
+) VALUES
+"""
+
+# Câu hỏi bị xóa khỏi questions.json chỉ bị tắt: quiz_answers và test_answers
+# tham chiếu questions(question_id) với ON DELETE RESTRICT
+UPSERT_UPDATES = """ON DUPLICATE KEY UPDATE
+    question_text = VALUES(question_text),
+    holland_code = VALUES(holland_code),
+    category = VALUES(category),
+    difficulty_level = VALUES(difficulty_level),
+    sort_order = VALUES(sort_order),
+    is_active = VALUES(is_active),
+    updated_at = VALUES(updated_at)"""
+
+POOL_INSERT_PREFIX = """INSERT INTO question_pools (questions_per_group, pool_number, question_ids) VALUES
+"""
+
+def iter_questions_json(file_path):
+    """Đọc dần từng câu hỏi của questions.json (mảng JSON hoặc JSON Lines)
     
-    # Mặc định là trung bình
-    return 'medium'
+    Lỗi định dạng được báo bằng JSONStreamError khi đọc tới chỗ sai.
+    """
+    for record in iter_json_records(file_path):
+        if not isinstance(record, dict):
+            raise JSONStreamError(f"Câu hỏi không phải object JSON: {str(record)[:80]}", None)
+        yield record
 
 def escape_sql_string(text):
     """Escape ký tự đặc biệt trong SQL string"""
@@ -76,6 +101,16 @@ def escape_sql_string(text):
 def convert_timestamp(timestamp_str):
     """Chuyển đổi timestamp từ MongoDB format sang MySQL TIMESTAMP"""
     try:
+        # mongoexport: {"$date": "2022-07-20T02:19:34.953Z"} hoặc {"$date": {"$numberLong": "..."}}
+        if isinstance(timestamp_str, dict):
+            value = timestamp_str['$date']
+            if isinstance(value, dict):
+                value = int(value['$numberLong'])
+            if isinstance(value, int):
+                dt = datetime.fromtimestamp(value / 1000, timezone.utc)
+            else:
+                dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            return dt.strftime("%Y-%m-%d %H:%M:%S")
         # Parse timestamp từ format: "2022-07-20 02:19:34.953000"
         dt = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
         # Trả về format MySQL TIMESTAMP
@@ -84,101 +119,13 @@ def convert_timestamp(timestamp_str):
         # Fallback về timestamp hiện tại
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-def create_sql_migration(questions_data, output_file):
-    """Tạo file SQL migration từ dữ liệu questions"""
-    
-    # Header của file SQL
-    sql_content = f"""-- =====================================================
--- PAC Holland Code Questions Migration
--- =====================================================
--- 
--- File: migrate_questions.sql
--- Mục đích: Migration dữ liệu từ MongoDB questions.json sang MySQL
--- Tạo bởi: create_sql_migrate_questions.py
--- Ngày tạo: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
--- Tổng số câu hỏi: {len(questions_data)}
---
--- HƯỚNG DẪN SỬ DỤNG:
--- 1. Đảm bảo đã chạy create-all-tables.sql trước
--- 2. Chạy file này trong HeidiSQL hoặc MySQL CLI
--- 3. Kiểm tra kết quả: SELECT COUNT(*) FROM questions;
--- =====================================================
-
--- Bắt đầu transaction để đảm bảo tính toàn vẹn dữ liệu
-START TRANSACTION;
-
--- Xóa dữ liệu cũ nếu có (để có thể chạy lại script)
-DELETE FROM questions;
-
--- Reset AUTO_INCREMENT
-ALTER TABLE questions AUTO_INCREMENT = 1;
-
--- Thêm dữ liệu questions
-"""
-
-    # Đếm số lượng theo Holland Code
-    holland_stats = {}
-    category_stats = {}
-    difficulty_stats = {}
-    
-    # Tạo các câu lệnh INSERT
-    sql_content += "\n-- Bắt đầu INSERT dữ liệu\n"
-    
-    for i, question in enumerate(questions_data, 1):
-        # Lấy dữ liệu từ JSON
-        question_id = question.get('id', str(i))
-        question_text = question.get('question', '')
-        holland_code = question.get('code', 'R')
-        created_at = question.get('createdAt', '')
-        updated_at = question.get('updatedAt', '')
-        
-        # Xử lý dữ liệu
-        category = categorize_question(question_text, question_id)
-        difficulty = determine_difficulty(question_text, holland_code)
-        
-        # Escape SQL strings
-        escaped_text = escape_sql_string(question_text)
-        
-        # Convert timestamps
-        mysql_created_at = convert_timestamp(created_at)
-        mysql_updated_at = convert_timestamp(updated_at)
-        
-        # Thống kê
-        holland_stats[holland_code] = holland_stats.get(holland_code, 0) + 1
-        category_stats[category] = category_stats.get(category, 0) + 1
-        difficulty_stats[difficulty] = difficulty_stats.get(difficulty, 0) + 1
-        
-        # Tạo câu lệnh INSERT
-        sql_content += f"""INSERT INTO questions (
-    question_id, 
-    question_text, 
-    holland_code, 
-    category, 
-    difficulty_level, 
-    sort_order, 
-    is_active,
-    created_at, 
-    updated_at
-) VALUES (
-    '{question_id}',
-    '{escaped_text}',
-    '{holland_code}',
-    '{category}',
-    '{difficulty}',
-    {question_id},
-    1,
-    '{mysql_created_at}',
-    '{mysql_updated_at}'
-);
-
-"""
-
-    # Footer với thống kê
-    sql_content += f"""-- =====================================================
+def build_footer(total, holland_stats, category_stats, difficulty_stats):
+    """Phần cuối file SQL: thống kê, COMMIT và các truy vấn kiểm tra"""
+    footer = f"""-- =====================================================
 -- THỐNG KÊ DỮ LIỆU ĐÃ MIGRATION
 -- =====================================================
 
--- Tổng số câu hỏi: {len(questions_data)}
+-- Tổng số câu hỏi: {total}
 
 -- Phân bố theo Holland Code:
 """
@@ -192,21 +139,21 @@ ALTER TABLE questions AUTO_INCREMENT = 1;
             'E': 'Enterprising (Doanh nghiệp)',
             'C': 'Conventional (Truyền thống)'
         }.get(code, code)
-        sql_content += f"-- {code}: {count} câu ({code_name})\n"
+        footer += f"-- {code}: {count} câu ({code_name})\n"
     
-    sql_content += f"""
+    footer += f"""
 -- Phân bố theo Category:
 """
     for category, count in sorted(category_stats.items()):
-        sql_content += f"-- {category}: {count} câu\n"
+        footer += f"-- {category}: {count} câu\n"
     
-    sql_content += f"""
+    footer += f"""
 -- Phân bố theo Difficulty:
 """
     for difficulty, count in sorted(difficulty_stats.items()):
-        sql_content += f"-- {difficulty}: {count} câu\n"
+        footer += f"-- {difficulty}: {count} câu\n"
 
-    sql_content += f"""
+    footer += f"""
 -- Commit transaction
 COMMIT;
 
@@ -239,80 +186,389 @@ ORDER BY category;
 -- =====================================================
 -- KẾT THÚC MIGRATION
 -- =====================================================
+"""
+    return footer
+
+def iter_question_rows(questions_data, stats, snapshot=None, delta=False, classifier=None,
+                       sampler=None):
+    """Sinh VALUES tuple của từng câu hỏi và cập nhật stats (holland, category, difficulty, luật)
+    
+    Câu hỏi được phân loại theo lô CLASSIFY_BATCH_SIZE câu bằng classifier
+    (QuestionClassifier, mặc định rules/question_rules.json).
+    sampler (QuestionSampler) nhận mọi câu hỏi, kể cả câu không đổi khi delta.
+    Khi delta, bỏ qua câu hỏi không đổi so với snapshot.
+    """
+    holland_stats, category_stats, difficulty_stats, rule_stats = stats
+    classifier = classifier or QuestionClassifier.from_file()
+    for batch in iter_batches(enumerate(questions_data, 1), CLASSIFY_BATCH_SIZE):
+        # Phân loại cả lô: mỗi bộ luật quét qua mỗi câu hỏi một lần
+        results = classifier.classify_batch(question.get('question', '') for _, question in batch)
+        for (i, question), result in zip(batch, results):
+            # Lấy dữ liệu từ JSON
+            question_id = question.get('id', str(i))
+            question_text = question.get('question', '')
+            holland_code = question.get('code', 'R')
+            created_at = question.get('createdAt', '')
+            updated_at = question.get('updatedAt', '')
+            category = result.category
+            difficulty = result.difficulty
+            
+            # Escape SQL strings
+            escaped_text = escape_sql_string(question_text)
+            
+            # Convert timestamps
+            mysql_created_at = convert_timestamp(created_at)
+            mysql_updated_at = convert_timestamp(updated_at)
+            
+            # Thống kê
+            holland_stats[holland_code] = holland_stats.get(holland_code, 0) + 1
+            category_stats[category] = category_stats.get(category, 0) + 1
+            difficulty_stats[difficulty] = difficulty_stats.get(difficulty, 0) + 1
+            for rule in (f"category: {result.category_rule}", f"difficulty: {result.difficulty_rule}"):
+                rule_stats[rule] = rule_stats.get(rule, 0) + 1
+            if sampler is not None:
+                sampler.add(str(question_id), holland_code)
+            
+            # So sánh với lần chạy trước (timestamp gốc, vì convert_timestamp có thể trả về thời điểm hiện tại)
+            if snapshot is not None:
+                if str(question_id) in snapshot.current:
+                    raise ValueError(f"Trùng question_id: {question_id}")
+                change = snapshot.classify(str(question_id), row_hash([
+                    str(question_id), question_text, holland_code, category, difficulty,
+                    created_at, updated_at]))
+                if delta and change == UNCHANGED:
+                    continue
+            
+            yield (f"    ('{question_id}', '{escaped_text}', '{holland_code}', '{category}', "
+                   f"'{difficulty}', {question_id}, 1, '{mysql_created_at}', '{mysql_updated_at}')")
+
+def build_question_pools(sampler, pool_sizes, pool_count):
+    """{số câu/nhóm: danh sách bộ câu hỏi}; bỏ qua (có cảnh báo) số câu/nhóm không đủ câu hỏi"""
+    pools_by_size = {}
+    for questions_per_group in sorted(set(pool_sizes)):
+        try:
+            pools_by_size[questions_per_group] = build_pools(sampler, questions_per_group, pool_count)
+        except ValueError as e:
+            print(f"⚠️ Bỏ qua bộ câu hỏi {questions_per_group} câu/nhóm: {e}")
+    return pools_by_size
+
+def write_pool_sql(pools_by_size, pools_file, pool_count, max_statement_bytes):
+    """Ghi question_pools.sql: xóa rồi nạp lại toàn bộ bảng question_pools"""
+    sizes = ', '.join(str(size) for size in pools_by_size) or 'không có'
+    suffix = ";\n\n"
+    overhead = len(POOL_INSERT_PREFIX.encode('utf-8')) + len(suffix)
+    with SQLFileWriter(pools_file) as writer:
+        writer.write(f"""-- =====================================================
+-- BỘ CÂU HỎI DỰNG SẴN (question_pools)
+-- =====================================================
+-- Tạo bởi: create_sql_migrate_questions.py
+-- {pool_count} bộ cho mỗi số câu/nhóm ({sizes}); mỗi bộ cân bằng R/I/A/S/E/C và đã xáo trộn
+-- question_ids là question_id của bảng questions: chạy sau khi đã nạp câu hỏi
+-- =====================================================
+
+START TRANSACTION;
+
+DELETE FROM question_pools;
+
+""")
+        for batch in iter_byte_batches(iter_pool_rows(pools_by_size), max_statement_bytes, overhead):
+            writer.write(POOL_INSERT_PREFIX + ROW_SEPARATOR.join(batch) + suffix)
+            writer.end_batch()
+        writer.write("COMMIT;\n")
+
+def iter_pool_rows(pools_by_size):
+    """Sinh VALUES tuple của từng bộ câu hỏi (question_ids là mảng JSON)"""
+    for questions_per_group, pools in pools_by_size.items():
+        for pool_number, question_ids in enumerate(pools):
+            ids = escape_sql_string(json.dumps(question_ids, ensure_ascii=False, separators=(',', ':')))
+            yield f"    ({questions_per_group}, {pool_number}, '{ids}')"
+
+def save_pool_shards(pools_by_size, pools_dir):
+    """Ghi static/question-pools/<số câu mỗi nhóm>.json và index.json"""
+    records = [{
+        "code": str(questions_per_group),
+        "questions_per_group": questions_per_group,
+        "question_count": questions_per_group * len(HOLLAND_CODES),
+        "pools": pools,
+    } for questions_per_group, pools in pools_by_size.items()]
+    return save_code_shards(records, pools_dir, "questions.json")
+
+def create_sql_migration(questions_data, output_file, snapshot=None,
+                         max_allowed_packet=DEFAULT_MAX_ALLOWED_PACKET, classifier=None,
+                         pool_sizes=DEFAULT_GROUP_SIZES, pool_count=DEFAULT_POOL_COUNT,
+                         pools_dir=None):
+    """Tạo file SQL migration từ dữ liệu questions
+    
+    questions_data có thể là iterator (đọc dần từ file): chỉ được duyệt một lần.
+    Câu hỏi được gộp thành các lệnh INSERT nhiều dòng, mỗi lệnh không vượt quá
+    max_allowed_packet của MySQL; file được ghi dần qua SQLFileWriter.
+    snapshot (RowSnapshot) ghi lại hash từng câu hỏi; nếu snapshot đã có dữ liệu
+    lần chạy trước thì chỉ sinh các câu lệnh cho phần thay đổi (delta).
+    classifier (QuestionClassifier) xác định category và độ khó của câu hỏi.
+    pool_count bộ câu hỏi cho mỗi số câu/nhóm trong pool_sizes được ghi vào
+    POOLS_FILE cạnh output_file (bảng question_pools, thay toàn bộ, cả khi delta)
+    và pools_dir nếu có; 0 để tắt.
+    """
+    delta = snapshot is not None and snapshot.loaded
+    
+    if delta:
+        header = f"""-- =====================================================
+-- PAC Holland Code Questions Migration (DELTA)
+-- =====================================================
+-- 
+-- File: {os.path.basename(output_file)}
+-- Mục đích: Chỉ cập nhật các câu hỏi thay đổi so với {SNAPSHOT_FILE}
+-- Tạo bởi: create_sql_migrate_questions.py --delta
+-- Ngày tạo: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Tổng số câu hỏi: xem phần thống kê cuối file
+--
+-- HƯỚNG DẪN SỬ DỤNG:
+-- Chỉ chạy trên database tương ứng với snapshot (đã chạy migration lần trước).
+-- Câu hỏi không đổi giữ nguyên id, không bị ghi lại.
+-- =====================================================
+
+START TRANSACTION;
+"""
+    else:
+        header = f"""-- =====================================================
+-- PAC Holland Code Questions Migration
+-- =====================================================
+-- 
+-- File: migrate_questions.sql
+-- Mục đích: Migration dữ liệu từ MongoDB questions.json sang MySQL
+-- Tạo bởi: create_sql_migrate_questions.py
+-- Ngày tạo: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Tổng số câu hỏi: xem phần thống kê cuối file
+--
+-- HƯỚNG DẪN SỬ DỤNG:
+-- 1. Đảm bảo đã chạy create-all-tables.sql trước
+-- 2. Chạy file này trong HeidiSQL hoặc MySQL CLI
+-- 3. Kiểm tra kết quả: SELECT COUNT(*) FROM questions;
+-- 4. Chạy question_pools.sql (bộ câu hỏi dựng sẵn)
+-- =====================================================
+
+-- Bắt đầu transaction để đảm bảo tính toàn vẹn dữ liệu
+START TRANSACTION;
+
+-- Xóa dữ liệu cũ nếu có (để có thể chạy lại script)
+DELETE FROM questions;
+
+-- Reset AUTO_INCREMENT
+ALTER TABLE questions AUTO_INCREMENT = 1;
+
+-- Thêm dữ liệu questions
 """
 
-    # Ghi file SQL
+    # Đếm số lượng theo Holland Code
+    holland_stats = {}
+    category_stats = {}
+    difficulty_stats = {}
+    rule_stats = {}
+    sampler = QuestionSampler(capacity_for(pool_count, pool_sizes)) if pool_count and pool_sizes else None
+    rows = iter_question_rows(questions_data,
+                              (holland_stats, category_stats, difficulty_stats, rule_stats),
+                              snapshot, delta, classifier, sampler)
+    pools_by_size = {}
+    
+    # Lệnh INSERT nhiều dòng, giới hạn theo số byte
+    suffix = "\n" + UPSERT_UPDATES + ";\n\n" if delta else ";\n\n"
+    max_statement_bytes = max_allowed_packet - PACKET_HEADROOM
+    overhead = len(INSERT_PREFIX.encode('utf-8')) + len(suffix.encode('utf-8'))
+    
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(sql_content)
-        print(f"✅ Tạo thành công file SQL: {output_file}")
+        with instrument_stage("questions.write", max_statement_bytes=max_statement_bytes) as stage, \
+                SQLFileWriter(output_file) as writer:
+            writer.write(header)
+            writer.write(f"\n-- Bắt đầu INSERT dữ liệu (tối đa {max_statement_bytes} bytes mỗi lệnh)\n")
+            for batch in iter_byte_batches(rows, max_statement_bytes, overhead):
+                writer.write(INSERT_PREFIX + ROW_SEPARATOR.join(batch) + suffix)
+                writer.end_batch()
+            stage["statements"] = writer.batches
+            total = sum(holland_stats.values())
+            stage["questions"] = total
+            
+            if delta:
+                removed = sorted(snapshot.removed(), key=lambda key: (len(key), key))
+                if removed:
+                    ids = ', '.join(f"'{escape_sql_string(key)}'" for key in removed)
+                    writer.write(f"""-- Câu hỏi đã bị xóa khỏi questions.json: tắt thay vì DELETE (quiz_answers/test_answers dùng ON DELETE RESTRICT)
+UPDATE questions SET is_active = 0 WHERE question_id IN ({ids});
+
+""")
+                writer.write(f"-- Delta: {snapshot.summary()}\n\n")
+            
+            writer.write(build_footer(total, holland_stats, category_stats, difficulty_stats))
+        
+        # Sampler chỉ đầy đủ sau khi đã duyệt hết câu hỏi
+        pools_file = os.path.join(os.path.dirname(os.path.abspath(output_file)), POOLS_FILE)
+        if sampler is not None:
+            with instrument_stage("questions.pools"):
+                pools_by_size = build_question_pools(sampler, pool_sizes, pool_count)
+                write_pool_sql(pools_by_size, pools_file, pool_count, max_statement_bytes)
+        
+        print(f"✅ Tạo thành công file SQL: {output_file} ({stage['statements']} lệnh INSERT)")
+        if pools_by_size:
+            print(f"🎲 Bộ câu hỏi: {pool_count} bộ x {len(pools_by_size)} cấu hình "
+                  f"({', '.join(f'{size} câu/nhóm' for size in pools_by_size)})")
+            print(f"✅ Bảng question_pools: {pools_file}")
+            if pools_dir:
+                save_pool_shards(pools_by_size, pools_dir)
+                print(f"✅ Static JSON: {pools_dir}")
+        if snapshot is not None:
+            snapshot.save()
+            print(f"✅ Snapshot: {snapshot.path}")
+        if delta:
+            print(f"🔁 Delta: {snapshot.summary()}")
         
         # In thống kê
         print("\n📊 THỐNG KÊ DỮ LIỆU:")
-        print(f"Tổng số câu hỏi: {len(questions_data)}")
+        print(f"Tổng số câu hỏi: {total}")
         print("\nPhân bố Holland Code:")
         for code, count in sorted(holland_stats.items()):
-            percentage = (count / len(questions_data)) * 100
+            percentage = (count / total) * 100
             print(f"  {code}: {count} câu ({percentage:.1f}%)")
         
         print("\nPhân bố Category:")
         for category, count in sorted(category_stats.items()):
-            percentage = (count / len(questions_data)) * 100
+            percentage = (count / total) * 100
             print(f"  {category}: {count} câu ({percentage:.1f}%)")
             
         print("\nPhân bố Difficulty:")
         for difficulty, count in sorted(difficulty_stats.items()):
-            percentage = (count / len(questions_data)) * 100
+            percentage = (count / total) * 100
             print(f"  {difficulty}: {count} câu ({percentage:.1f}%)")
+        
+        print("\nLuật phân loại đã áp dụng:")
+        for rule, count in sorted(rule_stats.items()):
+            print(f"  {rule}: {count} câu")
             
         return True
-        
+    
+    except JSONStreamError as e:
+        print(f"❌ Lỗi định dạng JSON: {e}")
+        return False
+    except ValueError as e:
+        print(f"❌ {e}")
+        return False
     except Exception as e:
         print(f"❌ Lỗi ghi file SQL: {e}")
         return False
 
-def main():
-    """Hàm chính"""
-    print("🚀 PAC Questions Migration Tool")
-    print("=" * 50)
-    
-    # Đường dẫn file (từ thư mục tools)
-    questions_json_path = "../old-project/db/questions.json"
-    output_sql_path = "../sql/migrate_questions.sql"
+def run_migration(questions_json_path, output_sql_path, delta=False,
+                  max_allowed_packet=DEFAULT_MAX_ALLOWED_PACKET, rules_path=DEFAULT_RULES_FILE,
+                  pool_sizes=DEFAULT_GROUP_SIZES, pool_count=DEFAULT_POOL_COUNT, pools_dir=None):
+    """Đọc questions.json và ghi file SQL migration; trả về True nếu thành công
     
+    delta=True: ghi DELTA_FILE (cùng thư mục) với các thay đổi so với SNAPSHOT_FILE;
+    nếu chưa có snapshot dùng được thì ghi migration đầy đủ vào output_sql_path.
+    max_allowed_packet: giới hạn (bytes) của server MySQL cho mỗi lệnh INSERT.
+    rules_path: file luật phân loại category/độ khó (xem question_classifier.py).
+    pool_sizes, pool_count, pools_dir: bộ câu hỏi dựng sẵn (xem create_sql_migration).
+    """
     # Kiểm tra file tồn tại
     if not os.path.exists(questions_json_path):
         print(f"❌ Không tìm thấy file: {questions_json_path}")
-        print("💡 Đảm bảo bạn đang chạy script từ thư mục tools")
-        return
+        return False
+    
+    # Nạp và biên dịch luật phân loại một lần cho cả file
+    try:
+        classifier = QuestionClassifier.from_file(rules_path)
+    except RuleFileError as e:
+        print(f"❌ Lỗi file luật phân loại: {e}")
+        return False
     
     # Tạo thư mục sql nếu chưa có
-    os.makedirs("../sql", exist_ok=True)
+    os.makedirs(os.path.dirname(os.path.abspath(output_sql_path)), exist_ok=True)
     
-    # Đọc dữ liệu questions
+    # Đọc dữ liệu questions (từng câu hỏi, không nạp cả file vào bộ nhớ)
     print("📖 Đang đọc file questions.json...")
-    questions_data = load_questions_json(questions_json_path)
+    questions_data = iter_questions_json(questions_json_path)
+    try:
+        first_question = next(questions_data, None)
+    except JSONStreamError as e:
+        print(f"❌ Lỗi định dạng JSON: {e}")
+        return False
     
-    if not questions_data:
+    if first_question is None:
         print("❌ Không thể đọc dữ liệu questions")
-        return
+        return False
+    questions_data = chain([first_question], questions_data)
+    
+    # Snapshot lần chạy trước (chỉ dùng khi delta)
+    output_dir = os.path.dirname(os.path.abspath(output_sql_path))
+    snapshot_path = os.path.join(output_dir, SNAPSHOT_FILE)
+    snapshot = RowSnapshot.load(snapshot_path, SNAPSHOT_FINGERPRINT) if delta else None
+    if delta and snapshot is None:
+        print(f"⚠️ Chưa có snapshot dùng được ({snapshot_path}), tạo migration đầy đủ")
+    elif delta:
+        output_sql_path = os.path.join(output_dir, DELTA_FILE)
+    snapshot = snapshot or RowSnapshot(snapshot_path, SNAPSHOT_FINGERPRINT)
     
     # Tạo file SQL migration
     print("🔄 Đang tạo file SQL migration...")
-    success = create_sql_migration(questions_data, output_sql_path)
+    # Gồm cả bước ghi file (questions.write: sinh và ghi từng lệnh INSERT)
+    with instrument_stage("questions.generate_sql"):
+        return create_sql_migration(questions_data, output_sql_path, snapshot, max_allowed_packet,
+                                    classifier, pool_sizes, pool_count, pools_dir)
+
+def main():
+    """Hàm chính"""
+    parser = argparse.ArgumentParser(description="Tạo file SQL migration từ questions.json")
+    parser.add_argument('--delta', action='store_true',
+                        help=f'chỉ ghi {DELTA_FILE} với các thay đổi so với {SNAPSHOT_FILE}')
+    parser.add_argument('--max-allowed-packet', type=int, default=DEFAULT_MAX_ALLOWED_PACKET,
+                        metavar='BYTES',
+                        help=f'max_allowed_packet của MySQL server, giới hạn kích thước mỗi lệnh '
+                             f'INSERT (mặc định: {DEFAULT_MAX_ALLOWED_PACKET})')
+    parser.add_argument('--rules', default=str(DEFAULT_RULES_FILE), metavar='PATH',
+                        help='file luật phân loại category và độ khó '
+                             '(mặc định: rules/question_rules.json)')
+    parser.add_argument('--pool-sizes', type=int, nargs='+', default=list(DEFAULT_GROUP_SIZES),
+                        metavar='N',
+                        help='số câu mỗi nhóm của các bộ câu hỏi dựng sẵn, theo '
+                             'quiz_package_configs.questions_per_group (mặc định: '
+                             f"{' '.join(map(str, DEFAULT_GROUP_SIZES))})")
+    parser.add_argument('--pool-count', type=int, default=DEFAULT_POOL_COUNT, metavar='N',
+                        help=f'số bộ câu hỏi cho mỗi cấu hình, 0 để tắt (mặc định: {DEFAULT_POOL_COUNT})')
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    if args.pool_count < 0 or any(size <= 0 for size in args.pool_sizes):
+        parser.error("--pool-count phải >= 0 và --pool-sizes phải > 0")
+    configure_from_args(args)
+    print("🚀 PAC Questions Migration Tool")
+    print("=" * 50)
+    
+    # Đường dẫn file (tính từ thư mục tools, chạy được từ bất kỳ thư mục nào)
+    tools_dir = os.path.dirname(os.path.abspath(__file__))
+    questions_json_path = os.path.join(tools_dir, "..", "old-project", "db", "questions.json")
+    output_sql_path = os.path.join(tools_dir, "..", "sql", "migrate_questions.sql")
+    pools_dir = os.path.join(tools_dir, "..", "static", "question-pools")
+    if args.delta and RowSnapshot.load(os.path.join(tools_dir, "..", "sql", SNAPSHOT_FILE),
+                                       SNAPSHOT_FINGERPRINT):
+        # run_migration ghi file delta cạnh file đầy đủ
+        result_sql_path = os.path.join(tools_dir, "..", "sql", DELTA_FILE)
+    else:
+        result_sql_path = output_sql_path
+    
+    success = run_migration(questions_json_path, output_sql_path, delta=args.delta,
+                            max_allowed_packet=args.max_allowed_packet, rules_path=args.rules,
+                            pool_sizes=args.pool_sizes, pool_count=args.pool_count,
+                            pools_dir=pools_dir)
+    finish_from_args(args, "create_sql_migrate_questions")
     
     if success:
         print(f"\n✅ HOÀN THÀNH!")
-        print(f"📁 File SQL đã được tạo: {output_sql_path}")
+        print(f"📁 File SQL đã được tạo: {result_sql_path}")
         print(f"📋 Các bước tiếp theo:")
         print(f"   1. Mở HeidiSQL và kết nối database")
-        print(f"   2. Chạy file: {output_sql_path}")
+        print(f"   2. Chạy file: {result_sql_path}")
         print(f"   3. Kiểm tra: SELECT COUNT(*) FROM questions;")
         print(f"\n💡 Hướng dẫn chạy:")
         print(f"   - Từ thư mục tools: python create_sql_migrate_questions.py")
         print(f"   - Hoặc từ thư mục gốc: python tools/create_sql_migrate_questions.py")
     else:
         print("❌ Có lỗi xảy ra trong quá trình tạo file SQL")
+        sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,43 +3,21 @@
 Master script to extract all personality data from TypeScript files
 Author: PAC Development Team
 Purpose: Run both group and characteristics extraction scripts
+
+The extractors are imported and run in-process through build_pipeline.py
+(no interpreter per script); unchanged inputs are skipped. Use --all to also
+rebuild the SQL files (jobs, questions, one-shot.sql).
 """
 
-import subprocess
+import argparse
 import sys
-import os
 from pathlib import Path
 
-def run_script(script_path, script_name):
-    """Run a Python script and handle output"""
-    print(f"\n{'='*60}")
-    print(f"[RUNNING] {script_name}")
-    print(f"{'='*60}")
-    
-    try:
-        result = subprocess.run([sys.executable, script_path], 
-                              capture_output=True, text=True, encoding='utf-8')
-        
-        # Print stdout
-        if result.stdout:
-            print(result.stdout)
-        
-        # Print stderr if there are errors
-        if result.stderr:
-            print(f"[WARNING] Warnings/Errors from {script_name}:")
-            print(result.stderr)
-        
-        # Check return code
-        if result.returncode == 0:
-            print(f"[SUCCESS] {script_name} completed successfully")
-            return True
-        else:
-            print(f"[ERROR] {script_name} failed with return code {result.returncode}")
-            return False
-            
-    except Exception as e:
-        print(f"[ERROR] Error running {script_name}: {e}")
-        return False
+from build_pipeline import instrumentation_options, print_summary, run_pipeline
+from instrumentation import add_instrumentation_arguments, configure_from_args, finish_from_args
+
+# Stages run by default; --all also builds the SQL files
+EXTRACTION_STAGES = ["groups", "characteristics"]
 
 def check_output_files():
     """Check if output files were created successfully"""
@@ -48,7 +26,11 @@ def check_output_files():
     
     output_files = [
         project_root / "static" / "group-data.json",
-        project_root / "static" / "characteristics-data.json"
+        project_root / "static" / "characteristics-data.json",
+        project_root / "static" / "group-summary.json",
+        project_root / "static" / "group-details" / "index.json",
+        project_root / "static" / "groups" / "index.json",
+        project_root / "static" / "characteristics" / "index.json"
     ]
     
     print(f"\n{'='*60}")
@@ -60,9 +42,9 @@ def check_output_files():
     for file_path in output_files:
         if file_path.exists():
             size = file_path.stat().st_size
-            print(f"[OK] {file_path.name} - {size:,} bytes")
+            print(f"[OK] {file_path.relative_to(project_root)} - {size:,} bytes")
         else:
-            print(f"[MISSING] {file_path.name} - Not found")
+            print(f"[MISSING] {file_path.relative_to(project_root)} - Not found")
             all_files_exist = False
     
     return all_files_exist
@@ -75,47 +57,28 @@ def main():
     print("and converts them to JSON format for frontend use.")
     print("=" * 60)
     
-    script_dir = Path(__file__).parent
-    
-    # Define scripts to run
-    scripts = [
-        {
-            "path": script_dir / "extract-group-data.py",
-            "name": "Group Data Extraction"
-        },
-        {
-            "path": script_dir / "extract-characteristics-data.py", 
-            "name": "Characteristics Data Extraction"
-        }
-    ]
+    parser = argparse.ArgumentParser(description="Extract all personality data")
+    parser.add_argument('--all', action='store_true',
+                        help='also build the SQL files (jobs, questions, one-shot.sql)')
+    parser.add_argument('--force', action='store_true', help='rebuild even if inputs are unchanged')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count; 1 = serial, in-process)')
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
     
-    # Check if all scripts exist
-    missing_scripts = []
-    for script in scripts:
-        if not script["path"].exists():
-            missing_scripts.append(script["path"])
-    
-    if missing_scripts:
-        print("[ERROR] Missing script files:")
-        for script_path in missing_scripts:
-            print(f"   - {script_path}")
-        print("\n[INFO] Please ensure all extraction scripts are in the tools/ directory")
-        sys.exit(1)
-    
-    # Run all scripts
-    success_count = 0
-    
-    for script in scripts:
-        if run_script(script["path"], script["name"]):
-            success_count += 1
+    # Run all stages in this process (dependencies first, independent ones in parallel)
+    stages = None if args.all else EXTRACTION_STAGES
+    status = run_pipeline(stages, jobs=args.jobs, force=args.force,
+                          instrumentation_options=instrumentation_options(args))
+    success_count = sum(1 for result in status.values() if result in ('built', 'skipped'))
     
     # Summary
-    print(f"\n{'='*60}")
-    print("[SUMMARY] EXTRACTION SUMMARY")
-    print(f"{'='*60}")
-    print(f"[INFO] Successful extractions: {success_count}/{len(scripts)}")
+    print_summary(status)
+    finish_from_args(args, "extract-all-data")
+    print(f"[INFO] Successful stages: {success_count}/{len(status)}")
     
-    if success_count == len(scripts):
+    if success_count == len(status):
         print("[SUCCESS] All data extraction completed successfully!")
         
         # Check output files
@@ -129,12 +92,16 @@ def main():
             print("\n[FILES] Generated Files:")
             print("   - static/group-data.json (Personality groups)")
             print("   - static/characteristics-data.json (Detailed characteristics)")
+            print("   - static/group-summary.json (List-view fields only)")
+            print("   - static/group-details/<CODE>.json (Long group texts, loaded on demand)")
+            print("   - static/groups/<CODE>.json + index.json (Per-code group shards)")
+            print("   - static/characteristics/<CODE>.json + index.json (Per-code characteristics shards)")
             
         else:
             print("[WARNING] Some output files were not created successfully")
             
     else:
-        print(f"[ERROR] {len(scripts) - success_count} extraction(s) failed")
+        print(f"[ERROR] {len(status) - success_count} stage(s) failed")
         print("[INFO] Please check the error messages above and fix any issues")
         sys.exit(1)
 
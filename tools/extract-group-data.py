@@ -5,111 +5,53 @@ Author: PAC Development Team
 Purpose: Convert group.ts data to JSON format for frontend use
 """
 
-import re
 import json
 import sys
 import os
 from pathlib import Path
 
-def clean_typescript_string(text):
-    """Clean TypeScript string by removing quotes and handling special characters"""
-    if not text:
-        return ""
-    
-    # Remove surrounding quotes
-    if text.startswith("'") and text.endswith("'"):
-        text = text[1:-1]
-    elif text.startswith('"') and text.endswith('"'):
-        text = text[1:-1]
-    
-    # Handle escaped quotes
-    text = text.replace("\\'", "'").replace('\\"', '"')
-    
-    return text.strip()
+from instrumentation import finish_from_args, instrument_stage, parse_instrumentation_args
+from static_shards import encode_json, save_code_shards
+from ts_literal_parser import parse_declarations
+from vietnamese_text import FOLDING_DESCRIPTION, normalize_phrase, tokenize
 
-def extract_array_values(content, array_name):
-    """Extract array values from TypeScript content"""
-    pattern = rf'{array_name}:\s*\[(.*?)\]'
-    match = re.search(pattern, content, re.DOTALL)
-    
-    if not match:
-        return []
-    
-    array_content = match.group(1)
-    
-    # Split by comma and clean each item
-    items = []
-    current_item = ""
-    quote_count = 0
-    
-    for char in array_content:
-        if char in ["'", '"']:
-            quote_count += 1
-        
-        if char == ',' and quote_count % 2 == 0:
-            if current_item.strip():
-                items.append(clean_typescript_string(current_item.strip()))
-            current_item = ""
-        else:
-            current_item += char
-    
-    # Add the last item
-    if current_item.strip():
-        items.append(clean_typescript_string(current_item.strip()))
-    
-    return items
+# Basic string fields of a group object
+STRING_FIELDS = [
+    'characterName', 'code', 'description', 'explain',
+    'group', 'hollandName', 'id', 'trendDescription'
+]
 
-def extract_string_value(content, field_name):
-    """Extract string value from TypeScript content"""
-    # Pattern for single-line string
-    pattern = rf'{field_name}:\s*[\'"]([^\'"]*)[\'"]'
-    match = re.search(pattern, content)
-    
-    if match:
-        return match.group(1)
-    
-    # Pattern for multi-line string
-    pattern = rf'{field_name}:\s*[\'"]([^\'"]*)$'
-    match = re.search(pattern, content, re.MULTILINE)
-    
-    if match:
-        # Find the end of the multi-line string
-        start_pos = match.end()
-        remaining_content = content[start_pos:]
-        
-        # Look for the closing quote
-        quote_char = content[match.start():match.end()][-1]
-        end_match = re.search(rf'[^\\\]{quote_char}', remaining_content)
-        
-        if end_match:
-            full_string = match.group(1) + remaining_content[:end_match.start() + 1]
-            return full_string.replace('\\n', '\n').replace('\\t', '\t')
-    
-    return ""
+# Array fields of a group object
+ARRAY_FIELDS = [
+    'favoriteActivity', 'highlights', 'jobs', 'keywords',
+    'majors', 'needValue'
+]
+
+# Fields kept in the lightweight summary used by list views
+SUMMARY_FIELDS = ['id', 'code', 'characterName', 'hollandName', 'group']
+
+# Long text fields moved to per-group detail payloads loaded on demand
+DETAIL_FIELDS = ['description', 'explain', 'trendDescription']
 
-def parse_group_object(group_content):
-    """Parse a single group object from TypeScript"""
+def clean_string_value(value):
+    """Convert a parsed literal value to a string"""
+    if value is None:
+        return ""
+    return str(value)
+
+def parse_group_object(group_obj):
+    """Build a group record from a parsed TypeScript object"""
     group_data = {}
     
-    # Extract basic string fields
-    string_fields = [
-        'characterName', 'code', 'description', 'explain', 
-        'group', 'hollandName', 'id', 'trendDescription'
-    ]
-    
-    for field in string_fields:
-        value = extract_string_value(group_content, field)
-        group_data[field] = value
+    for field in STRING_FIELDS:
+        group_data[field] = clean_string_value(group_obj.get(field))
     
-    # Extract array fields
-    array_fields = [
-        'favoriteActivity', 'highlights', 'jobs', 'keywords', 
-        'majors', 'needValue'
-    ]
-    
-    for field in array_fields:
-        values = extract_array_values(group_content, field)
-        group_data[field] = values
+    for field in ARRAY_FIELDS:
+        values = group_obj.get(field)
+        if not isinstance(values, list):
+            values = []
+        items = (clean_string_value(item).strip() for item in values)
+        group_data[field] = [item for item in items if item]
     
     return group_data
 
@@ -119,35 +61,20 @@ def extract_groups_from_typescript(file_path):
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
         
-        # Find the NTC array
-        ntc_pattern = r'export const NTC = \[(.*?)\];'
-        ntc_match = re.search(ntc_pattern, content, re.DOTALL)
+        # Parse the whole file once and pick the NTC array from the tree
+        ntc_array = parse_declarations(content).get('NTC')
         
-        if not ntc_match:
+        if not isinstance(ntc_array, list):
             print("❌ Could not find NTC array in TypeScript file")
             return []
         
-        ntc_content = ntc_match.group(1)
-        
-        # Split into individual group objects
         groups = []
-        brace_count = 0
-        current_group = ""
-        
-        for char in ntc_content:
-            current_group += char
-            
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                
-                if brace_count == 0:
-                    # We've found a complete group object
-                    group_data = parse_group_object(current_group)
-                    if group_data.get('code'):  # Only add if we have a valid code
-                        groups.append(group_data)
-                    current_group = ""
+        for group_obj in ntc_array:
+            if not isinstance(group_obj, dict):
+                continue
+            group_data = parse_group_object(group_obj)
+            if group_data.get('code'):  # Only add if we have a valid code
+                groups.append(group_data)
         
         return groups
         
@@ -158,8 +85,47 @@ def extract_groups_from_typescript(file_path):
         print(f"❌ Error reading file: {e}")
         return []
 
-def save_groups_to_json(groups, output_path):
-    """Save groups data to JSON file"""
+def build_group_indexes(groups):
+    """Build lookup tables stored next to the groups array
+
+    - code: Holland code -> position in the groups array
+    - keywords: folded keyword phrase -> group ids
+    - tokens: folded token from jobs/majors -> group ids
+    """
+    code_index = {}
+    keyword_index = {}
+    token_index = {}
+    
+    for position, group in enumerate(groups):
+        group_id = group.get('id') or group.get('code')
+        code_index[group['code']] = position
+        
+        for keyword in group.get('keywords', []):
+            phrase = normalize_phrase(keyword)
+            if phrase:
+                keyword_index.setdefault(phrase, []).append(group_id)
+        
+        for field in ('jobs', 'majors'):
+            for item in group.get(field, []):
+                for token in tokenize(item):
+                    token_index.setdefault(token, []).append(group_id)
+    
+    def postings(index):
+        # Unique ids per entry, in group order; keys sorted for stable output
+        return {key: list(dict.fromkeys(ids)) for key, ids in sorted(index.items())}
+    
+    return {
+        "code": code_index,
+        "keywords": postings(keyword_index),
+        "tokens": postings(token_index)
+    }
+
+def save_groups_to_json(groups, output_path, shard_dir=None):
+    """Save groups data to JSON file, plus one shard file per code
+
+    Shards go to static/groups/<CODE>.json by default, next to an index.json
+    listing the available codes with content hashes.
+    """
     try:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -171,64 +137,138 @@ def save_groups_to_json(groups, output_path):
                 "source": "group.ts",
                 "extracted_at": "2024-11-07",
                 "total_groups": len(groups),
-                "description": "Holland Code personality groups data extracted from TypeScript"
+                "description": "Holland Code personality groups data extracted from TypeScript",
+                "index_folding": FOLDING_DESCRIPTION
             },
-            "groups": groups
+            "groups": groups,
+            "indexes": build_group_indexes(groups)
         }
         
         with open(output_path, 'w', encoding='utf-8') as file:
             json.dump(output_data, file, ensure_ascii=False, indent=2)
         
         print(f"[SUCCESS] Successfully saved {len(groups)} groups to {output_path}")
+        
+        # Per-code shards so a page can fetch only the code it renders
+        if shard_dir is None:
+            shard_dir = os.path.join(os.path.dirname(output_path), "groups")
+        index = save_code_shards(groups, shard_dir, "group.ts")
+        print(f"[SUCCESS] Saved {len(index['codes'])} shards to {shard_dir}")
         return True
         
     except Exception as e:
         print(f"[ERROR] Error saving JSON file: {e}")
         return False
 
-def main():
-    """Main function"""
+def save_group_summary_and_details(groups, summary_path, details_dir):
+    """Save a compact summary file plus per-group detail payloads
+
+    The summary holds only the list-view fields and, for each group, the
+    detail file name and content hash. The long text fields are written to
+    details_dir/<CODE>.json (with an index.json) and fetched only when a
+    group is opened.
+    """
+    try:
+        details = [{field: group.get(field, "") for field in ['code'] + DETAIL_FIELDS}
+                   for group in groups]
+        details_index = save_code_shards(details, details_dir, "group.ts")
+        
+        summary_groups = []
+        for group in groups:
+            entry = {field: group.get(field, "") for field in SUMMARY_FIELDS}
+            detail_entry = details_index["codes"].get(group['code'])
+            if detail_entry:
+                entry["detail"] = {"file": detail_entry["file"], "hash": detail_entry["hash"]}
+            summary_groups.append(entry)
+        
+        summary_data = {
+            "metadata": {
+                "version": "1.0",
+                "source": "group.ts",
+                "total_groups": len(groups),
+                "details_dir": os.path.basename(os.path.normpath(details_dir)),
+                "description": "List-view fields only; long texts are in the per-group detail files"
+            },
+            "groups": summary_groups,
+            "indexes": {
+                "code": {group['code']: position for position, group in enumerate(groups)}
+            }
+        }
+        
+        os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+        with open(summary_path, 'wb') as file:
+            file.write(encode_json(summary_data))
+        
+        print(f"[SUCCESS] Saved group summary to {summary_path}")
+        print(f"[SUCCESS] Saved {len(details_index['codes'])} group detail files to {details_dir}")
+        return True
+        
+    except Exception as e:
+        print(f"[ERROR] Error saving group summary/details: {e}")
+        return False
+
+def default_paths(project_root):
+    """Default input/output locations relative to the project root"""
+    project_root = Path(project_root)
+    return {
+        "input_file": project_root / "old-project" / "backend-app" / "src" / "constants" / "group.ts",
+        "output_file": project_root / "static" / "group-data.json",
+        "summary_file": project_root / "static" / "group-summary.json",
+        "details_dir": project_root / "static" / "group-details"
+    }
+
+def run_extraction(input_file, output_file, summary_file, details_dir):
+    """Extract group.ts and write every group output; returns True on success"""
     print("[INFO] Starting group data extraction...")
-    
-    # File paths
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    
-    input_file = project_root / "old-project" / "backend-app" / "src" / "constants" / "group.ts"
-    output_file = project_root / "static" / "group-data.json"
-    
     print(f"[INPUT] Input file: {input_file}")
     print(f"[OUTPUT] Output file: {output_file}")
+    print(f"[OUTPUT] Summary file: {summary_file}")
     
     # Check if input file exists
-    if not input_file.exists():
+    if not Path(input_file).exists():
         print(f"[ERROR] Input file not found: {input_file}")
-        sys.exit(1)
+        return False
     
     # Extract groups data
-    groups = extract_groups_from_typescript(input_file)
+    with instrument_stage("groups.parse") as stage:
+        groups = extract_groups_from_typescript(input_file)
+        stage["groups"] = len(groups or [])
     
     if not groups:
         print("[ERROR] No groups data extracted")
-        sys.exit(1)
+        return False
     
-    # Save to JSON
-    if save_groups_to_json(groups, output_file):
-        print(f"[SUCCESS] Group data extraction completed successfully!")
-        print(f"[INFO] Extracted {len(groups)} personality groups")
-        
-        # Display summary (avoid Unicode issues)
-        try:
-            for i, group in enumerate(groups, 1):
-                name = group.get('characterName', 'Unknown')
-                code = group.get('code', 'N/A')
-                # Use ASCII representation to avoid encoding issues
-                print(f"   {i}. Group {code}")
-        except UnicodeEncodeError:
-            print("[INFO] Group details saved successfully (Unicode display skipped)")
-    else:
+    # Save to JSON (full file, summary and on-demand details)
+    with instrument_stage("groups.save", groups=len(groups)):
+        saved = (save_groups_to_json(groups, output_file)
+                 and save_group_summary_and_details(groups, summary_file, details_dir))
+    if not saved:
         print("[ERROR] Failed to save group data")
+        return False
+    
+    print(f"[SUCCESS] Group data extraction completed successfully!")
+    print(f"[INFO] Extracted {len(groups)} personality groups")
+    
+    # Display summary (avoid Unicode issues)
+    try:
+        for i, group in enumerate(groups, 1):
+            code = group.get('code', 'N/A')
+            # Use ASCII representation to avoid encoding issues
+            print(f"   {i}. Group {code}")
+    except UnicodeEncodeError:
+        print("[INFO] Group details saved successfully (Unicode display skipped)")
+    
+    return True
+
+def main():
+    """Main function"""
+    args = parse_instrumentation_args("Extract group data from group.ts to JSON")
+    project_root = Path(__file__).parent.parent
+    
+    success = run_extraction(**default_paths(project_root))
+    finish_from_args(args, "extract-group-data")
+    if not success:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Shared timing, peak-memory and cProfile instrumentation for the data tools
+Author: PAC Development Team
+Purpose: Measure how long parsing, SQL generation and file writes take, so
+         regressions and hot spots show up as data volumes grow
+
+Usage inside a tool:
+    from instrumentation import instrument_stage
+    with instrument_stage("jobs.parse"):
+        jobs = parse(...)
+
+Command line flags (added with add_instrumentation_arguments):
+    --profile              cProfile each stage, dump <stage>.prof files and
+                           print the top functions; also tracks peak memory
+    --profile-dir DIR      where .prof files go (default: ./profiles)
+    --timing-report FILE   write a machine-readable JSON timing report;
+                           also tracks peak memory
+
+Stages can be nested. Each stage's cProfile data covers only its own code:
+the parent's profiler is paused while a nested stage runs and the nested
+stage gets its own .prof file. Peak memory (tracemalloc) of a parent
+includes the peaks of its nested stages.
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# How many functions to print per stage with --profile
+PROFILE_TOP_FUNCTIONS = 15
+
+_config = {
+    "profile": False,
+    "profile_dir": "profiles",
+    "track_memory": False,
+}
+_records = []
+_stack = []
+
+
+def configure(profile=False, profile_dir=None, track_memory=False):
+    """Enable or disable profiling and memory tracking for later stages"""
+    _config["profile"] = profile
+    _config["profile_dir"] = profile_dir or _config["profile_dir"]
+    _config["track_memory"] = track_memory or profile
+    if _config["track_memory"] and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def reset():
+    """Forget collected stage records"""
+    _records.clear()
+
+
+def records():
+    """Stage records collected so far (list of dicts, in completion order)"""
+    return list(_records)
+
+
+def add_records(stage_records):
+    """Append records collected elsewhere (e.g. in a worker process)"""
+    _records.extend(stage_records)
+
+
+def _profile_path(name):
+    safe_name = re.sub(r'[^\w.-]+', '_', name)
+    return os.path.join(_config["profile_dir"], f"{safe_name}.prof")
+
+
+@contextlib.contextmanager
+def instrument_stage(name, **details):
+    """Time a block of work; records wall/CPU time, peak memory and profile
+
+    Extra keyword arguments (e.g. rows=200) are stored in the record. The
+    yielded dict can be updated inside the block to add more details.
+    """
+    parent = _stack[-1] if _stack else None
+    frame = {"name": name, "details": dict(details), "peak": 0, "profiler": None}
+
+    if parent:
+        if parent["profiler"]:
+            parent["profiler"].disable()
+        if tracemalloc.is_tracing():
+            parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    if _config["profile"]:
+        frame["profiler"] = cProfile.Profile()
+
+    _stack.append(frame)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if frame["profiler"]:
+        frame["profiler"].enable()
+
+    try:
+        yield frame["details"]
+    finally:
+        if frame["profiler"]:
+            frame["profiler"].disable()
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        _stack.pop()
+
+        peak = None
+        if tracemalloc.is_tracing():
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+
+        record = {
+            "stage": name,
+            "wall_seconds": round(wall_seconds, 6),
+            "cpu_seconds": round(cpu_seconds, 6),
+            "peak_memory_bytes": peak,
+        }
+        record.update(frame["details"])
+
+        if frame["profiler"]:
+            os.makedirs(_config["profile_dir"], exist_ok=True)
+            profile_path = _profile_path(name)
+            frame["profiler"].dump_stats(profile_path)
+            record["profile"] = profile_path
+            _print_profile(name, frame["profiler"])
+
+        _records.append(record)
+
+        if parent:
+            if peak is not None:
+                parent["peak"] = max(parent["peak"], peak)
+                tracemalloc.reset_peak()
+            if parent["profiler"]:
+                parent["profiler"].enable()
+
+
+def _print_profile(name, profiler):
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+    print(f"\n[PROFILE] {name}")
+    print(stream.getvalue().rstrip())
+
+
+def format_bytes(size):
+    """Human-readable byte count ('-' when memory was not tracked)"""
+    if size is None:
+        return "-"
+    if size < 1024:
+        return f"{size} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024
+        if size < 1024 or unit == "GB":
+            return f"{size:,.1f} {unit}"
+
+
+def print_timing_summary(stage_records=None):
+    """Print one line per stage: wall time, CPU time and peak memory"""
+    stage_records = _records if stage_records is None else stage_records
+    if not stage_records:
+        return
+    print("\n[TIMING] Stage timings")
+    for record in stage_records:
+        print(f"   {record['stage']:40s} {record['wall_seconds'] * 1000:10.1f} ms wall "
+              f"{record['cpu_seconds'] * 1000:10.1f} ms cpu  "
+              f"peak {format_bytes(record['peak_memory_bytes'])}")
+
+
+def build_report(tool, stage_records=None):
+    """Machine-readable report dict for the collected stages"""
+    return {
+        "tool": tool,
+        "generated_at": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "memory_tracked": _config["track_memory"],
+        "stages": _records if stage_records is None else stage_records,
+    }
+
+
+def write_report(path, tool, stage_records=None):
+    """Write the JSON timing report"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(build_report(tool, stage_records), file, indent=2)
+    print(f"[TIMING] Report written to {path}")
+
+
+def add_instrumentation_arguments(parser):
+    """Add --profile, --profile-dir and --timing-report to an ArgumentParser"""
+    group = parser.add_argument_group('instrumentation')
+    group.add_argument('--profile', action='store_true',
+                       help='cProfile every stage and track peak memory')
+    group.add_argument('--profile-dir', default='profiles',
+                       help='directory for .prof files (default: ./profiles)')
+    group.add_argument('--timing-report', metavar='FILE',
+                       help='write a JSON timing/memory report to FILE')
+
+
+def configure_from_args(args):
+    """Apply the instrumentation flags parsed by add_instrumentation_arguments"""
+    configure(profile=args.profile, profile_dir=args.profile_dir,
+              track_memory=bool(args.timing_report))
+
+
+def finish_from_args(args, tool):
+    """Print the stage summary and write the report requested on the command line"""
+    print_timing_summary()
+    if args.timing_report:
+        write_report(args.timing_report, tool)
+
+
+def parse_instrumentation_args(description, argv=None):
+    """Parse only the instrumentation flags (for tools without other options)"""
+    parser = argparse.ArgumentParser(description=description)
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    configure_from_args(args)
+    return args
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON record reader
+Author: PAC Development Team
+Purpose: Read a JSON export record by record, either a top-level JSON array
+         or JSON Lines (the default output of mongoexport), so memory use
+         does not depend on the size of the file
+
+Usage:
+    for record in iter_json_records("questions.json"):
+        ...
+
+The format is detected from the first non-whitespace character: '[' starts
+an array, anything else is read as JSON Lines (one object per line, blank
+lines are skipped).
+Array elements are decoded with json.JSONDecoder.raw_decode from a buffer
+that only holds the unread rest of the current chunk, and the buffer is
+compacted once per chunk read, not once per element.
+"""
+
+import json
+
+# Characters read from the file at a time
+READ_CHUNK_SIZE = 1024 * 1024
+# Largest array element read ahead before a decoding error is reported
+MAX_RECORD_CHARS = 64 * 1024 * 1024
+
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARACTERS = frozenset('0123456789+-.eE')
+
+
+class JSONStreamError(ValueError):
+    """Malformed export; position is a character offset (array) or line number (JSON Lines)"""
+
+    def __init__(self, message, position):
+        super().__init__(message)
+        self.position = position
+
+
+def _first_character(file):
+    """First non-whitespace character of the file, or '' when there is none"""
+    while True:
+        char = file.read(1)
+        if char == '' or char not in WHITESPACE:
+            return char
+
+
+def _may_continue(buffer, end):
+    """True when a value decoded up to end could still grow with the next chunk
+
+    Only a number can: '-1.' or '12e' at the end of a chunk decodes as -1 or
+    12, so everything after end must be number characters up to the end of
+    the buffer.
+    """
+    while end < len(buffer) and buffer[end] in NUMBER_CHARACTERS:
+        end += 1
+    return end == len(buffer)
+
+
+def iter_json_records(path, chunk_size=READ_CHUNK_SIZE):
+    """Yield the records of a JSON array or JSON Lines file one at a time"""
+    # utf-8-sig: exports written on Windows often start with a BOM
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        first = _first_character(file)
+        if first == '[':
+            yield from _iter_array(file, chunk_size)
+        elif first:
+            file.seek(0)
+            yield from _iter_lines(file)
+
+
+def _iter_lines(file):
+    """Records of a JSON Lines file"""
+    for line_number, line in enumerate(file, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise JSONStreamError(f"Invalid JSON on line {line_number}: {e.msg}", line_number) from None
+
+
+def _iter_array(file, chunk_size):
+    """Elements of a JSON array whose opening '[' has been read"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    # Characters dropped from the front of buffer (for error offsets)
+    dropped = 1
+    eof = False
+    expect_value = True
+    first = True
+
+    def fill():
+        """Append the next chunk to the unread part of buffer; False at end of file"""
+        nonlocal buffer, pos, dropped, eof
+        chunk = file.read(chunk_size)
+        dropped += pos
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+        return bool(chunk)
+
+    def skip_whitespace():
+        """Move pos to the next non-whitespace character; False at end of file"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return True
+            if not fill():
+                return False
+
+    while True:
+        if not skip_whitespace():
+            raise JSONStreamError("Unterminated JSON array", dropped + pos)
+
+        char = buffer[pos]
+        if char == ']' and (first or not expect_value):
+            pos += 1
+            if skip_whitespace():
+                raise JSONStreamError("Extra data after the JSON array", dropped + pos)
+            return
+        if not expect_value:
+            if char != ',':
+                raise JSONStreamError(f"Expected ',' or ']' but found {char!r}", dropped + pos)
+            pos += 1
+            expect_value = True
+            continue
+
+        # Decode one element; read more first when it may be cut off by the chunk end
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                if eof or not _may_continue(buffer, end):
+                    break
+            except json.JSONDecodeError as e:
+                if eof or len(buffer) - pos > MAX_RECORD_CHARS:
+                    raise JSONStreamError(f"Invalid JSON: {e.msg}", dropped + e.pos) from None
+            fill()
+        pos = end
+        yield value
+        first = False
+        expect_value = False
@@ -1,11 +1,41 @@
 """
 Script để gộp các file SQL quan trọng thành file one-shot.sql
-Thứ tự: create-all-tables.sql -> sample-data.sql -> questions-and-quiz.sql -> jobs_data_insertion.sql
+Thứ tự: create-all-tables.sql -> sample-data.sql -> questions-and-quiz.sql -> question_pools.sql
+        -> jobs_data_insertion.sql -> jobs_normalized_data.sql
+
+Các file nguồn được đọc và ghi ra theo từng khối, bộ nhớ không tăng theo kích
+thước jobs_data_insertion.sql hay file câu hỏi. Tuỳ chọn:
+    --gzip              ghi thêm one-shot.sql.gz
+    --split-size SIZE   chia thành one-shot.part001.sql, one-shot.part002.sql...
+                        mỗi phần không quá SIZE (vd: 2M, 512K), chỉ cắt giữa
+                        các câu lệnh để vừa giới hạn import của hosting
+    --normalize         gộp các INSERT liên tiếp cùng bảng thành INSERT nhiều
+                        dòng và chạy phần dữ liệu trong một transaction, tạm
+                        tắt kiểm tra UNIQUE/FOREIGN KEY (xem sql_normalizer.py)
+
+Mỗi phần được import trong một phiên riêng, nên đầu mỗi phần lặp lại các lệnh
+SET/USE đã chạy trước đó (và DELIMITER, START TRANSACTION nếu đang mở); phần
+bị cắt giữa một transaction kết thúc bằng COMMIT.
+
+one-shot.manifest.json ghi kích thước, SHA-256 và số câu lệnh của từng file.
+Không có --split-size/--normalize thì các khối được chép thẳng, không qua bộ
+tách câu lệnh (sql_statements.py, chậm hơn nhiều): manifest không có số câu lệnh.
 """
 
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
 import os
+import re
 from pathlib import Path
 
+from instrumentation import (add_instrumentation_arguments, configure_from_args,
+                             finish_from_args, instrument_stage)
+from sql_normalizer import normalize_statements
+from sql_statements import DEFAULT_DELIMITER, iter_chunks, iter_statements
+
 # Đường dẫn tương đối
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -17,76 +47,376 @@ SQL_FILES = [
     "create-all-tables.sql",
     "sample-data.sql",
     "questions-and-quiz.sql",
-    "jobs_data_insertion.sql"
+    "question_pools.sql",
+    "jobs_data_insertion.sql",
+    "jobs_normalized_data.sql"
 ]
 
-def read_sql_file(file_path):
-    """Đọc nội dung file SQL"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return content
-    except Exception as e:
-        print(f"❌ Lỗi khi đọc file {file_path}: {e}")
-        return None
+HEADER_LINES = [
+    "-- =========================================",
+    "-- ONE-SHOT SQL DEPLOYMENT SCRIPT",
+    "-- Auto-generated by merge_all_sql.py",
+    "-- =========================================",
+]
+
+# Lệnh SET theo phiên cần lặp lại ở đầu mỗi phần (SET GLOBAL / SET TRANSACTION thì không)
+SESSION_SET = re.compile(r'SET\s+(?:SESSION\s+|LOCAL\s+|@@SESSION\.|@@LOCAL\.|@@)?(@?[\w$]+)',
+                         re.IGNORECASE)
+NOT_SESSION_SET = {'GLOBAL', 'PERSIST', 'PERSIST_ONLY', 'TRANSACTION'}
+TRANSACTION_START = re.compile(r'(?:START\s+TRANSACTION|BEGIN(?:\s+WORK)?)\b', re.IGNORECASE)
+TRANSACTION_END = re.compile(r'(?:COMMIT|ROLLBACK)\b', re.IGNORECASE)
+USE_DATABASE = re.compile(r'USE\s', re.IGNORECASE)
+AUTOCOMMIT_OFF = re.compile(r'=\s*(?:0|OFF|FALSE)\b', re.IGNORECASE)
+
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(value):
+    """Kích thước dạng 2M, 512K hoặc số byte"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?)i?B?\s*', value, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"kích thước không hợp lệ: {value!r} (vd: 2M, 512K)")
+    size = int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+    if size <= 0:
+        raise argparse.ArgumentTypeError("kích thước phải lớn hơn 0")
+    return size
+
+
+def part_path(output_file, number):
+    """one-shot.sql -> one-shot.part001.sql"""
+    return output_file.with_name(f"{output_file.stem}.part{number:03d}{output_file.suffix}")
+
+
+def manifest_path(output_file):
+    """one-shot.sql -> one-shot.manifest.json"""
+    return output_file.with_name(f"{output_file.stem}.manifest.json")
+
+
+class _HashingWriter:
+    """Ghi bytes ra file, đồng thời tính SHA-256 và kích thước"""
+
+    def __init__(self, file):
+        self.file = file
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, data):
+        self.file.write(data)
+        self.sha256.update(data)
+        self.bytes += len(data)
+        return len(data)
+
+    def flush(self):
+        self.file.flush()
+
+
+class MergeOutput:
+    """File đầu ra (thường hoặc .gz) ghi qua file tạm, kèm SHA-256 và số câu lệnh"""
+
+    def __init__(self, path, compress=False):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(self.path.name + ".tmp")
+        self.compress = compress
+        self.statements = 0
+
+    def __enter__(self):
+        self.file = open(self.temp_path, 'wb')
+        self.hashed = _HashingWriter(self.file)
+        self.stream = self.hashed
+        if self.compress:
+            # mtime=0: cùng nội dung thì cùng file .gz (và cùng SHA-256)
+            self.stream = gzip.GzipFile(filename=self.path.stem, mode='wb',
+                                        fileobj=self.hashed, mtime=0)
+        self.size = 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.compress:
+            self.stream.close()
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.temp_path, self.path)
+        else:
+            os.remove(self.temp_path)
+        return False
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.stream.write(data)
+        self.size += len(data)
+
+    def manifest_entry(self):
+        """Thông tin file cho manifest (sau khi đã đóng)"""
+        entry = {
+            "file": self.path.name,
+            "bytes": self.hashed.bytes,
+            "sha256": self.hashed.sha256.hexdigest(),
+            "statements": self.statements,
+        }
+        if self.compress:
+            entry["uncompressed_bytes"] = self.size
+        return entry
+
+
+class SessionState:
+    """Trạng thái phiên MySQL sau các câu lệnh đã ghi (để mở lại ở phần sau)"""
+
+    def __init__(self):
+        self.database = None
+        self.variables = {}
+        self.transaction = False
+        self.autocommit = True
+        self.delimiter = DEFAULT_DELIMITER
+
+    def copy(self):
+        state = SessionState()
+        state.database = self.database
+        state.variables = dict(self.variables)
+        state.transaction = self.transaction
+        state.autocommit = self.autocommit
+        state.delimiter = self.delimiter
+        return state
+
+    def apply(self, statement):
+        """Cập nhật trạng thái sau một câu lệnh"""
+        if statement.kind == "delimiter":
+            self.delimiter = statement.body
+            return
+        body = statement.body
+        if statement.kind != "sql" or not body:
+            return
+        set_match = SESSION_SET.match(body)
+        if set_match and set_match.group(1).upper() not in NOT_SESSION_SET:
+            name = set_match.group(1).upper()
+            self.variables[name] = body
+            if name == 'AUTOCOMMIT':
+                self.autocommit = not AUTOCOMMIT_OFF.search(body)
+        elif USE_DATABASE.match(body):
+            self.database = body
+        elif TRANSACTION_START.fullmatch(body):
+            self.transaction = True
+        elif TRANSACTION_END.match(body):
+            self.transaction = False
+
+    def preamble(self):
+        """Các lệnh mở lại phiên ở đầu một phần mới"""
+        lines = []
+        if self.database:
+            lines.append(f"{self.database};")
+        lines.extend(f"{statement};" for statement in self.variables.values())
+        if self.transaction:
+            lines.append("START TRANSACTION;")
+        if self.delimiter != DEFAULT_DELIMITER:
+            lines.append(f"DELIMITER {self.delimiter}")
+        if not lines:
+            return ""
+        return "-- Trạng thái phiên từ các phần trước\n" + "\n".join(lines) + "\n"
+
+    def closing(self):
+        """Lệnh kết thúc phần khi bị cắt giữa một transaction"""
+        if self.transaction or not self.autocommit:
+            return f"\n-- Phần bị cắt giữa transaction\nCOMMIT{self.delimiter}\n"
+        return ""
+
+
+class SQLPartSplitter:
+    """Chia luồng câu lệnh thành các file one-shot.partNNN.sql không quá max_bytes"""
+
+    def __init__(self, output_file, max_bytes):
+        self.output_file = Path(output_file)
+        self.max_bytes = max_bytes
+        self.state = SessionState()
+        self.current = None
+        # Số đoạn (câu lệnh, DELIMITER, chú thích) đã ghi vào phần hiện tại
+        self.pieces = 0
+        self.parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.current is not None:
+            # Có lỗi: xoá phần đang ghi dở; không lỗi: kết thúc phần cuối
+            if exc_type is None:
+                self._close_part()
+            else:
+                self.current.__exit__(exc_type, exc_value, traceback)
+                self.current = None
+        if exc_type is None:
+            self._remove_stale_parts()
+        return False
+
+    def add(self, statement):
+        data_size = len(statement.text.encode('utf-8'))
+        after = self.state.copy()
+        after.apply(statement)
+        if self.pieces:
+            closing_size = len(after.closing().encode('utf-8'))
+            if self.current.size + data_size + closing_size > self.max_bytes:
+                self._close_part()
+        if self.current is None:
+            self._open_part()
+        self.current.write(statement.text)
+        self.pieces += 1
+        if statement.kind == "sql":
+            self.current.statements += 1
+        self.state = after
+
+    def _open_part(self):
+        number = len(self.parts) + 1
+        self.current = MergeOutput(part_path(self.output_file, number)).__enter__()
+        self.current.write(f"-- ONE-SHOT SQL DEPLOYMENT SCRIPT - PART {number}\n"
+                           f"-- Auto-generated by merge_all_sql.py\n")
+        self.current.write(self.state.preamble())
+
+    def _close_part(self):
+        part = self.current
+        part.write(self.state.closing())
+        part.__exit__(None, None, None)
+        self.pieces = 0
+        entry = part.manifest_entry()
+        if part.hashed.bytes > self.max_bytes:
+            entry["oversized"] = True
+            print(f"⚠️  {part.path.name} lớn hơn giới hạn {self.max_bytes:,} bytes "
+                  f"(một câu lệnh quá lớn, không thể chia nhỏ hơn)")
+        self.parts.append(entry)
+        self.current = None
+
+    def _remove_stale_parts(self):
+        """Xoá các phần thừa từ lần chạy trước (khi lần trước có nhiều phần hơn)"""
+        number = len(self.parts) + 1
+        while part_path(self.output_file, number).exists():
+            part_path(self.output_file, number).unlink()
+            number += 1
+
+
+def iter_merged_text(sql_dir, sources):
+    """Nội dung one-shot.sql theo từng khối; sources nhận tên các file đã gộp"""
+    yield '\n'.join(HEADER_LINES) + '\n'
 
-def merge_sql_files():
-    """Gộp các file SQL thành một file duy nhất"""
-    print("🔄 Bắt đầu gộp các file SQL...")
-    print(f"📁 Thư mục SQL: {SQL_DIR}")
-    print(f"📝 File output: {OUTPUT_FILE}")
-    print("-" * 60)
-    
-    merged_content = []
-    
-    # Header cho file output
-    merged_content.append("-- =========================================")
-    merged_content.append("-- ONE-SHOT SQL DEPLOYMENT SCRIPT")
-    merged_content.append("-- Auto-generated by merge_all_sql.py")
-    merged_content.append("-- =========================================")
-    merged_content.append("")
-    
-    # Gộp từng file
     for sql_file in SQL_FILES:
-        file_path = SQL_DIR / sql_file
-        
+        file_path = sql_dir / sql_file
+
         if not file_path.exists():
             print(f"⚠️  File không tồn tại: {sql_file}")
             continue
-        
+
         print(f"✅ Đọc file: {sql_file}")
-        content = read_sql_file(file_path)
-        
-        if content:
-            # Thêm separator và tên file
-            merged_content.append(f"\n-- =========================================")
-            merged_content.append(f"-- SOURCE: {sql_file}")
-            merged_content.append(f"-- =========================================\n")
-            merged_content.append(content)
-            merged_content.append("\n")
-    
-    # Ghi ra file output
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                chunks = iter_chunks(f)
+                first_chunk = next(chunks, '')
+                # File rỗng thì bỏ qua như trước
+                if not first_chunk:
+                    continue
+                sources.append(sql_file)
+                # Thêm separator và tên file
+                yield (f"\n\n-- =========================================\n"
+                       f"-- SOURCE: {sql_file}\n"
+                       f"-- =========================================\n\n")
+                yield first_chunk
+                yield from chunks
+        except (OSError, UnicodeDecodeError) as e:
+            raise OSError(f"Lỗi khi đọc file {file_path}: {e}") from e
+        yield "\n\n"
+
+
+def merge_sql_files(sql_dir=SQL_DIR, output_file=OUTPUT_FILE, compress=False, split_size=None,
+                    normalize=False):
+    """Gộp các file SQL thành một file duy nhất (ghi theo từng khối)"""
+    sql_dir = Path(sql_dir)
+    output_file = Path(output_file)
+
+    print("🔄 Bắt đầu gộp các file SQL...")
+    print(f"📁 Thư mục SQL: {sql_dir}")
+    print(f"📝 File output: {output_file}")
+    print("-" * 60)
+
+    sources = []
+    outputs = [MergeOutput(output_file)]
+    if compress:
+        outputs.append(MergeOutput(output_file.with_name(output_file.name + ".gz"), compress=True))
+    splitter = SQLPartSplitter(output_file, split_size) if split_size else None
+    # Chỉ tách câu lệnh khi cần ranh giới câu lệnh (chia phần, gộp INSERT)
+    parse = bool(splitter) or normalize
+    statements = 0 if parse else None
+
     try:
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(merged_content))
-        
+        with instrument_stage("merge.stream", files=len(SQL_FILES)):
+            # File tạm chỉ được đổi tên thành file thật khi gộp xong không lỗi
+            with contextlib.ExitStack() as stack:
+                for output in outputs:
+                    stack.enter_context(output)
+                if splitter:
+                    stack.enter_context(splitter)
+                if not parse:
+                    for chunk in iter_merged_text(sql_dir, sources):
+                        for output in outputs:
+                            output.write(chunk)
+                else:
+                    merged = iter_statements(iter_merged_text(sql_dir, sources))
+                    if normalize:
+                        merged = normalize_statements(merged)
+                    for statement in merged:
+                        for output in outputs:
+                            output.write(statement.text)
+                        if statement.kind == "sql":
+                            statements += 1
+                        if splitter:
+                            splitter.add(statement)
+            for output in outputs:
+                output.statements = statements
+
+        manifest = {
+            "generated_by": "merge_all_sql.py",
+            "sources": sources,
+            "normalized": normalize,
+            "statements": statements,
+            "outputs": [output.manifest_entry() for output in outputs],
+        }
+        if splitter:
+            manifest["parts"] = {"max_bytes": split_size, "files": splitter.parts}
+        with open(manifest_path(output_file), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
         print("-" * 60)
-        print(f"✅ Đã tạo file {OUTPUT_FILE.name} thành công!")
-        print(f"📊 Tổng kích thước: {OUTPUT_FILE.stat().st_size:,} bytes")
-        
+        print(f"✅ Đã tạo file {output_file.name} thành công!")
+        if parse:
+            print(f"📊 Tổng kích thước: {output_file.stat().st_size:,} bytes ({statements:,} câu lệnh)")
+        else:
+            print(f"📊 Tổng kích thước: {output_file.stat().st_size:,} bytes")
+        if compress:
+            print(f"🗜️  {outputs[1].path.name}: {outputs[1].hashed.bytes:,} bytes")
+        if splitter:
+            print(f"✂️  Chia thành {len(splitter.parts)} phần (tối đa {split_size:,} bytes mỗi phần)")
+        print(f"🧾 Manifest: {manifest_path(output_file).name}")
+
     except Exception as e:
         print(f"❌ Lỗi khi ghi file output: {e}")
         return False
-    
+
     return True
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gộp các file SQL thành one-shot.sql")
+    parser.add_argument('--gzip', action='store_true',
+                        help='ghi thêm one-shot.sql.gz')
+    parser.add_argument('--split-size', type=parse_size, metavar='SIZE',
+                        help='chia thành các phần không quá SIZE (vd: 2M, 512K)')
+    parser.add_argument('--normalize', action='store_true',
+                        help='gộp INSERT liên tiếp thành INSERT nhiều dòng, dữ liệu trong một transaction')
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
     print("\n" + "=" * 60)
     print("  MERGE SQL FILES - PAC WEBSITE DEPLOYMENT")
     print("=" * 60 + "\n")
-    
-    success = merge_sql_files()
-    
+
+    success = merge_sql_files(compress=args.gzip, split_size=args.split_size,
+                              normalize=args.normalize)
+    finish_from_args(args, "merge_all_sql")
+
     print("\n" + "=" * 60)
     if success:
         print("  ✅ HOÀN TẤT!")
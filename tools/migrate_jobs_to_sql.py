@@ -8,23 +8,220 @@ and generates SQL INSERT statements for the new database.
 Handles duplicate job_codes by generating unique identifiers.
 
 Usage:
-    python migrate_jobs_to_sql.py
+    python migrate_jobs_to_sql.py [--load-data [--verify] | --delta] [--normalized]
+                                  [--search-json] [--workers N]
+                                  [--profile] [--timing-report FILE]
 
 Output:
-    - jobs_data_insertion.sql (data insertion with unique job_codes)
+    - jobs_data_insertion.sql (data insertion with unique job_codes, the
+      job_search_tokens inverted index of each batch, followed by the
+      precomputed job_suggestion_cache rows of all 120 Holland codes)
+    - api/quiz/generated/jobs-by-code.php: the same jobs as a PHP array keyed
+      by holland_code (engine columns only, id order) for CareerSuggestionEngine
+    - with --load-data: jobs_data.tsv + jobs_load_data.sql, the same rows as a
+      tab-separated file and a LOAD DATA LOCAL INFILE script for bulk reloads
+      (--verify loads both outputs into SQLite and compares the rows), plus
+      jobs_search_tokens.tsv for the search index
+    - with --normalized: jobs_normalized_data.sql, one row per specialization,
+      task and work area in job_specializations / job_tasks / job_work_areas
+      (run after jobs_data_insertion.sql)
+    - with --search-json: static/jobs-search-index.json, the same search index
+      as token -> [[job_id, weight], ...] for client-side search
+    - jobs_snapshot.json: id and content hash of every job by natural key
+      (job_code), the state the generated scripts leave the database in
+    - with --delta: jobs_delta.sql instead of jobs_data_insertion.sql, only
+      INSERT ... ON DUPLICATE KEY UPDATE for new or changed jobs, DELETEs for
+      removed ones and the cached suggestions of the codes whose ranking
+      changed; unchanged rows keep their ids and are not touched (falls back
+      to a full migration when there is no usable snapshot); with --normalized
+      the child rows of those jobs go to jobs_normalized_delta.sql, leaving
+      jobs_normalized_data.sql as the full reload
+
+Jobs are streamed: the TypeScript file is read in chunks, a brace- and
+string-aware scanner (ts_literal_parser.scan_object_spans) cuts out each job
+object, and the SQL is written one batch at a time, so memory use does not
+grow with the number of jobs. Large sources are parsed in a process pool,
+PARSE_CHUNK_SIZE blocks per task, keeping the original job order.
 """
 
+import argparse
+import contextlib
 import re
 import json
 import os
-from typing import Dict, List, Any
-from collections import defaultdict
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, zip_longest
+
+from php_index import PHPIndexWriter
+from instrumentation import (
+    add_instrumentation_arguments, configure_from_args, finish_from_args, instrument_stage
+)
+from row_snapshot import NEW, UNCHANGED, RowSnapshot, row_hash
+from sql_writer import SQLFileWriter, iter_batches
+from sqlite_dialect import SQLiteLoader
+from ts_literal_parser import TSIdentifier, TSParseError, parse_ts_literal, scan_object_spans
+from suggestion_ranking import add_job_id, rank_all_codes
+from vietnamese_text import FOLDING_DESCRIPTION, tokenize
+
+# Characters read from the TypeScript file at a time
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Jobs per INSERT statement
+BATCH_SIZE = 50
+
+# Suggestion cache rows per INSERT statement
+CACHE_BATCH_SIZE = 500
+
+JOBS_ARRAY_START = re.compile(r'export const jobs = \[')
+
+# Job blocks per worker task, and the source size from which the pool is used
+PARSE_CHUNK_SIZE = 256
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# TypeScript job fields -> SQL columns
+STRING_FIELDS = {
+    'activitiesCode': 'activities_code',
+    'capacity': 'capacity',
+    'code': 'job_code',
+    'description': 'job_description',
+    'essentialAbility': 'essential_ability',
+    'group': 'job_group',
+    'hollandCode': 'holland_code',
+    'name': 'job_name',
+    'workContext': 'work_environment',
+    'workStyle': 'work_style',
+    'workValue': 'work_value'
+}
+ARRAY_FIELDS = {
+    'expertise': 'specializations',
+    'mission': 'main_tasks',
+    'workArea': 'work_areas'
+}
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Columns written by both output modes, in order
+JOB_COLUMNS = [
+    'job_name', 'holland_code', 'job_group', 'activities_code',
+    'capacity', 'essential_ability', 'education_level', 'work_environment',
+    'work_style', 'work_value', 'job_description', 'specializations',
+    'main_tasks', 'work_areas', 'is_active'
+]
+
+# Columns CareerSuggestionEngine reads from a job row
+ENGINE_COLUMNS = [
+    'id', 'job_name', 'job_name_en', 'holland_code', 'job_group', 'activities_code',
+    'capacity', 'essential_ability', 'supplementary_ability', 'education_level',
+    'work_environment', 'work_style', 'work_value', 'job_description',
+    'specializations', 'main_tasks', 'work_areas'
+]
+
+PHP_INDEX_FILE = os.path.join("api", "quiz", "generated", "jobs-by-code.php")
+
+NORMALIZED_FILE = "jobs_normalized_data.sql"
+NORMALIZED_DELTA_FILE = "jobs_normalized_delta.sql"
+# (table, value column, JSON column of jobs) of the normalized child tables
+CHILD_TABLES = [
+    ('job_specializations', 'specialization', 'specializations'),
+    ('job_tasks', 'task', 'main_tasks'),
+    ('job_work_areas', 'work_area', 'work_areas'),
+]
+
+# Search index: weight of one token occurrence per field (folded, see vietnamese_text)
+SEARCH_FIELD_WEIGHTS = {
+    'job_name': 8,
+    'job_group': 4,
+    'specializations': 2,
+    'job_description': 1,
+}
+SEARCH_JSON_FIELDS = {'specializations'}
+MAX_TOKEN_LENGTH = 64
+MAX_TOKEN_WEIGHT = 65535  # SMALLINT UNSIGNED
+SEARCH_JSON_FILE = os.path.join("static", "jobs-search-index.json")
+SEARCH_TOKENS_FILE = "jobs_search_tokens.tsv"
+
+SNAPSHOT_FILE = "jobs_snapshot.json"
+DELTA_FILE = "jobs_delta.sql"
+# Everything the content hash of a job depends on besides its row
+SNAPSHOT_FINGERPRINT = row_hash([JOB_COLUMNS, SEARCH_FIELD_WEIGHTS, MAX_TOKEN_LENGTH])
+
+LOAD_DATA_FILE = "jobs_data.tsv"
+LOAD_SCRIPT_FILE = "jobs_load_data.sql"
+
+# LOAD DATA default escaping (FIELDS ESCAPED BY '\\'), NULL is written as \N
+TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+# Tables both outputs fill, compared by --verify
+VERIFY_TABLES = ('jobs', 'job_search_tokens', 'job_suggestion_cache')
+
+def parse_job_block(block: str) -> Dict[str, Any]:
+    """Parse one job object literal and map its fields to SQL columns"""
+    value = parse_ts_literal(block)
+    if not isinstance(value, dict):
+        raise TSParseError("Job block is not an object", 0)
+    job = {}
+    
+    # Simple string fields, whitespace (including escaped \\n and \\t) collapsed
+    for ts_field, sql_field in STRING_FIELDS.items():
+        field = value.get(ts_field)
+        if isinstance(field, str) and not isinstance(field, TSIdentifier):
+            job[sql_field] = WHITESPACE_RE.sub(' ', field).strip()
+    
+    # educationLevel (number)
+    education_level = value.get('educationLevel')
+    if isinstance(education_level, (int, float)) and not isinstance(education_level, bool):
+        job['education_level'] = int(education_level)
+    
+    # Array fields, stored as JSON strings
+    for ts_field, sql_field in ARRAY_FIELDS.items():
+        field = value.get(ts_field)
+        if isinstance(field, list):
+            items = [item for item in field if isinstance(item, str) and not isinstance(item, TSIdentifier)]
+            if items:
+                job[sql_field] = json.dumps(items, ensure_ascii=False)
+    
+    return job
+
+
+def parse_job_chunk(spans: List[Tuple[int, int, str]]) -> List[Tuple[int, int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Parse (number, byte_start, text) job blocks; returns (number, byte_start, job, error) per block
+
+    Runs in worker processes, so errors are returned instead of raised. The
+    byte offset of a parse error points at the offending character.
+    """
+    results = []
+    for number, byte_start, text in spans:
+        try:
+            results.append((number, byte_start, parse_job_block(text), None))
+        except TSParseError as e:
+            error_byte = byte_start + len(text[:e.offset].encode('utf-8'))
+            results.append((number, error_byte, None, e.reason))
+        except (RecursionError, ValueError) as e:
+            results.append((number, byte_start, None, str(e)))
+    return results
+
 
 class JobDataMigrator:
-    def __init__(self):
+    def __init__(self, input_path: str = None, output_dir: str = None,
+                 load_data: bool = False, verify: bool = False, php_index_path: str = None,
+                 normalized: bool = False, search_json_path: str = None,
+                 workers: Optional[int] = None, delta: bool = False):
         self.base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.old_project_path = os.path.join(self.base_path, "old-project", "backend-app", "src", "constants", "suggestJobs.ts")
-        self.sql_output_path = os.path.join(self.base_path, "sql")
+        self.old_project_path = input_path or os.path.join(self.base_path, "old-project", "backend-app", "src", "constants", "suggestJobs.ts")
+        self.sql_output_path = output_dir or os.path.join(self.base_path, "sql")
+        self.php_index_path = php_index_path or os.path.join(self.base_path, PHP_INDEX_FILE)
+        self.load_data = load_data
+        self.verify = verify
+        self.normalized = normalized
+        # None: no static search index
+        self.search_json_path = search_json_path
+        # None: process pool for sources >= PARALLEL_MIN_BYTES, serial otherwise
+        self.workers = workers
+        # Diff against the previous snapshot instead of DELETE-and-reload
+        self.delta = delta
         
         # Ensure output directory exists
         os.makedirs(self.sql_output_path, exist_ok=True)
@@ -45,101 +242,105 @@ class JobDataMigrator:
     
     def parse_typescript_data(self, content: str) -> List[Dict[str, Any]]:
         """Parse TypeScript job data and convert to Python dictionaries"""
-        jobs = []
-        
-        # Find the jobs array
-        jobs_match = re.search(r'export const jobs = \[(.*)\];', content, re.DOTALL)
-        if not jobs_match:
-            print("❌ Could not find jobs array in TypeScript file")
-            return []
-        
-        jobs_content = jobs_match.group(1)
-        
-        # Split individual job objects
-        # We'll use a simple approach: split by '},\n  {' pattern
-        job_blocks = re.split(r'},\s*\n\s*{', jobs_content)
-        
-        print(f"🔍 Found {len(job_blocks)} job blocks to parse")
-        
-        for i, block in enumerate(job_blocks):
-            try:
-                # Clean up the block
-                block = block.strip()
-                if not block.startswith('{'):
-                    block = '{' + block
-                if not block.endswith('}'):
-                    block = block + '}'
-                
-                # Parse individual job
-                job = self.parse_job_object(block)
-                if job:
-                    jobs.append(job)
-                    
-                if (i + 1) % 50 == 0:
-                    print(f"📊 Processed {i + 1} jobs...")
-                    
-            except Exception as e:
-                print(f"⚠️ Error parsing job block {i + 1}: {e}")
-                continue
-        
-        print(f"✅ Successfully parsed {len(jobs)} jobs")
+        jobs = list(self.iter_jobs([content]))
         
         # Check for duplicates and fix them
-        jobs = self.fix_duplicate_job_codes(jobs)
+        return self.fix_duplicate_job_codes(jobs)
+    
+    def read_typescript_chunks(self) -> Iterator[str]:
+        """Read the TypeScript file in chunks of READ_CHUNK_SIZE characters"""
+        with open(self.old_project_path, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), ''):
+                yield chunk
+    
+    def resolve_workers(self) -> int:
+        """Worker processes for parsing; None means all cores for large sources, else serial"""
+        if self.workers is not None:
+            return max(1, self.workers)
+        try:
+            large = os.path.getsize(self.old_project_path) >= PARALLEL_MIN_BYTES
+        except OSError:
+            large = False
+        return (os.cpu_count() or 1) if large else 1
+    
+    def iter_parsed_chunks(self, span_chunks: Iterable[List[Tuple[int, int, str]]]) -> Iterator[list]:
+        """Parse chunks of (number, byte_start, text) blocks, serially or in a process pool, in order"""
+        workers = self.resolve_workers()
+        if workers == 1:
+            for spans in span_chunks:
+                yield parse_job_chunk(spans)
+            return
         
-        return jobs
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # At most two chunks per worker in flight, so memory stays bounded
+            pending = deque()
+            for spans in span_chunks:
+                pending.append(executor.submit(parse_job_chunk, spans))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def iter_jobs(self, chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Parse job blocks from chunks of TypeScript source as they arrive"""
+        parsed = 0
+        blocks = 0
+        spans = (tuple(span) for span in scan_object_spans(chunks, JOBS_ARRAY_START))
+        try:
+            for results in self.iter_parsed_chunks(iter_batches(spans, PARSE_CHUNK_SIZE)):
+                for number, byte_start, job, error in results:
+                    blocks = number
+                    if error:
+                        print(f"⚠️ Error parsing job block {number} (byte {byte_start}): {error}")
+                        continue
+                    if job:
+                        parsed += 1
+                        yield job
+                    
+                    if number % 50 == 0:
+                        print(f"📊 Processed {number} jobs...")
+        except TSParseError as e:
+            print(f"❌ Could not read the jobs array: {e.reason} (byte {e.offset})")
+        
+        print(f"🔍 Found {blocks} job blocks")
+        print(f"✅ Successfully parsed {parsed} jobs")
     
     def parse_job_object(self, block: str) -> Dict[str, Any]:
         """Parse a single job object from TypeScript"""
-        job = {}
-        
-        # Extract simple string fields
-        string_fields = {
-            'activitiesCode': 'activities_code',
-            'capacity': 'capacity', 
-            'code': 'job_code',
-            'description': 'job_description',
-            'essentialAbility': 'essential_ability',
-            'group': 'job_group',
-            'hollandCode': 'holland_code',
-            'name': 'job_name',
-            'workContext': 'work_environment',
-            'workStyle': 'work_style',
-            'workValue': 'work_value'
-        }
-        
-        for ts_field, sql_field in string_fields.items():
-            pattern = rf"{ts_field}:\s*['\"]([^'\"]*)['\"]"
-            match = re.search(pattern, block, re.DOTALL)
-            if match:
-                value = match.group(1).replace('\\n', ' ').replace('\\t', ' ').strip()
-                # Clean up multiple spaces
-                value = re.sub(r'\s+', ' ', value)
-                job[sql_field] = value
-        
-        # Extract educationLevel (number)
-        edu_match = re.search(r'educationLevel:\s*(\d+)', block)
-        if edu_match:
-            job['education_level'] = int(edu_match.group(1))
-        
-        # Extract array fields
-        array_fields = {
-            'expertise': 'specializations',
-            'mission': 'main_tasks', 
-            'workArea': 'work_areas'
-        }
-        
-        for ts_field, sql_field in array_fields.items():
-            pattern = rf"{ts_field}:\s*\[(.*?)\]"
-            match = re.search(pattern, block, re.DOTALL)
-            if match:
-                array_content = match.group(1)
-                # Extract individual array items
-                items = re.findall(r"['\"]([^'\"]*)['\"]", array_content)
-                if items:
-                    job[sql_field] = json.dumps(items, ensure_ascii=False)
+        return parse_job_block(block)
+    
+    def job_key(self, job: Dict[str, Any], seen: Dict[str, int]) -> str:
+        """Stable natural key: job_code (else holland_code:job_name), numbered when repeated"""
+        base = job.get('job_code') or f"{job.get('holland_code', '')}:{job.get('job_name', '')}"
+        seen[base] = seen.get(base, 0) + 1
+        return base if seen[base] == 1 else f"{base}#{seen[base]}"
+    
+    def assign_job_ids(self, jobs: Iterable[Dict[str, Any]],
+                       snapshot: Optional[RowSnapshot] = None) -> Iterator[Dict[str, Any]]:
+        """Pass jobs through with job['id'] set, classifying them against snapshot
         
-        return job
+        Jobs known to the snapshot keep their id and new jobs get the next free
+        one. Without a previous run ids are stream positions, as after the
+        AUTO_INCREMENT reset of a full migration. job['change'] is NEW, CHANGED
+        or UNCHANGED.
+        """
+        seen = {}
+        next_id = snapshot.meta.get('next_id', 1) if snapshot else 1
+        for job in jobs:
+            key = self.job_key(job, seen)
+            previous = snapshot.previous.get(key) if snapshot else None
+            if previous:
+                job['id'] = previous['id']
+            else:
+                job['id'] = next_id
+                next_id += 1
+            job['change'] = NEW
+            if snapshot:
+                job['change'] = snapshot.classify(key, row_hash(self.job_row(job)), id=job['id'],
+                                                  holland_code=job.get('holland_code'))
+            yield job
+        if snapshot:
+            snapshot.meta['next_id'] = next_id
     
     def fix_duplicate_job_codes(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """No job_code needed - use auto-increment id only"""
@@ -148,61 +349,47 @@ class JobDataMigrator:
     
     def generate_data_insertion_sql(self, jobs: List[Dict[str, Any]]) -> str:
         """Generate SQL INSERT statements for job data"""
-        sql = """-- =====================================================
+        return ''.join(self.iter_data_insertion_sql(jobs))
+    
+    def iter_data_insertion_sql(self, jobs: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the SQL file piece by piece: header, one INSERT per batch, footer"""
+        yield """-- =====================================================
 -- JOBS DATA INSERTION 
--- Insert 200 job records from old project
+-- Insert the job records from old project (count at the end)
 -- =====================================================
 
 -- Disable foreign key checks and autocommit for better performance
 SET FOREIGN_KEY_CHECKS = 0;
 SET AUTOCOMMIT = 0;
 
--- Clear existing jobs data (if any)
+-- Clear existing jobs data (if any); FOREIGN_KEY_CHECKS = 0 skips the
+-- cascade, so the child tables are cleared explicitly
 DELETE FROM jobs;
+DELETE FROM job_search_tokens;
+DELETE FROM job_specializations;
+DELETE FROM job_tasks;
+DELETE FROM job_work_areas;
 
--- Reset auto increment
+-- Reset auto increment (rows carry explicit ids, MySQL moves it past the highest)
 ALTER TABLE jobs AUTO_INCREMENT = 1;
 
 -- Insert job data
 """
         
         # Group inserts for better performance
-        batch_size = 50
-        for i in range(0, len(jobs), batch_size):
-            batch = jobs[i:i + batch_size]
-            sql += f"\n-- Batch {i//batch_size + 1}: Jobs {i+1} to {min(i + batch_size, len(jobs))}\n"
-            sql += "INSERT INTO jobs (\n"
-            sql += "    job_name, holland_code, job_group, activities_code,\n"
-            sql += "    capacity, essential_ability, education_level, work_environment,\n" 
-            sql += "    work_style, work_value, job_description, specializations,\n"
-            sql += "    main_tasks, work_areas, is_active\n"
-            sql += ") VALUES\n"
-            
-            values = []
-            for job in batch:
-                value_parts = [
-                    self.escape_sql_string(job.get('job_name', '')),
-                    self.escape_sql_string(job.get('holland_code', '')),
-                    self.escape_sql_string(job.get('job_group', '')),
-                    self.escape_sql_string(job.get('activities_code', '')),
-                    self.escape_sql_string(job.get('capacity', '')),
-                    self.escape_sql_string(job.get('essential_ability', '')),
-                    str(job.get('education_level', 'NULL')),
-                    self.escape_sql_string(job.get('work_environment', '')),
-                    self.escape_sql_string(job.get('work_style', '')),
-                    self.escape_sql_string(job.get('work_value', '')),
-                    self.escape_sql_string(job.get('job_description', '')),
-                    self.escape_sql_string(job.get('specializations', 'NULL'), is_json=True),
-                    self.escape_sql_string(job.get('main_tasks', 'NULL'), is_json=True),
-                    self.escape_sql_string(job.get('work_areas', 'NULL'), is_json=True),
-                    'TRUE'
-                ]
-                
-                values.append(f"    ({', '.join(value_parts)})")
-            
-            sql += ',\n'.join(values) + ';\n\n'
+        job_ids_by_code = {}
+        first = 0
+        for batch_number, batch in enumerate(
+                iter_batches(self.collect_job_ids(jobs, job_ids_by_code), BATCH_SIZE), 1):
+            yield self.build_insert_batch(batch, batch_number, first)
+            yield self.build_search_token_batch(batch)
+            first += len(batch)
         
-        sql += """
+        yield from self.iter_suggestion_cache_sql(job_ids_by_code)
+        
+        yield f"""
+-- {first} job records inserted
+
 -- Commit transaction
 COMMIT;
 
@@ -219,8 +406,306 @@ FROM jobs;
 
 SELECT 'Jobs data insertion completed successfully!' as message;
 """
+    
+    def build_insert_batch(self, batch: List[Dict[str, Any]], batch_number: int, first: int) -> str:
+        """One multi-row INSERT statement; first is the 0-based index of batch[0]
+        
+        Ids are explicit: the search tokens, suggestion cache, child tables and
+        PHP index refer to job['id'], not to whatever AUTO_INCREMENT hands out.
+        """
+        values = [f"    ({job['id']}, {', '.join(self.insert_values(job))})" for job in batch]
+        
+        return (
+            f"\n-- Batch {batch_number}: Jobs {first + 1} to {first + len(batch)}\n"
+            "INSERT INTO jobs (\n"
+            "    id, job_name, holland_code, job_group, activities_code,\n"
+            "    capacity, essential_ability, education_level, work_environment,\n"
+            "    work_style, work_value, job_description, specializations,\n"
+            "    main_tasks, work_areas, is_active\n"
+            ") VALUES\n"
+            + ',\n'.join(values) + ';\n\n'
+        )
+    
+    def insert_values(self, job: Dict[str, Any]) -> List[str]:
+        """SQL literals of a job in JOB_COLUMNS order"""
+        return [
+            self.escape_sql_string(job.get('job_name', '')),
+            self.escape_sql_string(job.get('holland_code', '')),
+            self.escape_sql_string(job.get('job_group', '')),
+            self.escape_sql_string(job.get('activities_code', '')),
+            self.escape_sql_string(job.get('capacity', '')),
+            self.escape_sql_string(job.get('essential_ability', '')),
+            str(job.get('education_level', 'NULL')),
+            self.escape_sql_string(job.get('work_environment', '')),
+            self.escape_sql_string(job.get('work_style', '')),
+            self.escape_sql_string(job.get('work_value', '')),
+            self.escape_sql_string(job.get('job_description', '')),
+            self.escape_sql_string(job.get('specializations', 'NULL'), is_json=True),
+            self.escape_sql_string(job.get('main_tasks', 'NULL'), is_json=True),
+            self.escape_sql_string(job.get('work_areas', 'NULL'), is_json=True),
+            'TRUE'
+        ]
+    
+    def iter_delta_sql(self, jobs: Iterable[Dict[str, Any]], snapshot: RowSnapshot) -> Iterator[str]:
+        """Yield a delta script: upserts for new and changed jobs, deletes for removed ones"""
+        yield """-- =====================================================
+-- JOBS DELTA MIGRATION
+-- Changes since the run recorded in jobs_snapshot.json
+-- =====================================================
+-- Apply only to the database the snapshot belongs to. Unchanged jobs
+-- keep their rows and ids; foreign key checks stay on, so child rows,
+-- search tokens and cached suggestions of removed jobs cascade.
+
+SET AUTOCOMMIT = 0;
+"""
+        changed = (job for job in jobs if job['change'] != UNCHANGED)
+        for batch_number, batch in enumerate(iter_batches(changed, BATCH_SIZE), 1):
+            yield self.build_upsert_batch(batch, batch_number)
+            ids = ', '.join(str(job['id']) for job in batch)
+            yield f"DELETE FROM job_search_tokens WHERE job_id IN ({ids});\n"
+            yield self.build_search_token_batch(batch)
+        
+        removed_ids = sorted(entry['id'] for entry in snapshot.removed().values())
+        if removed_ids:
+            yield "\n-- Removed jobs\n"
+            for batch in iter_batches(removed_ids, CACHE_BATCH_SIZE):
+                yield f"DELETE FROM jobs WHERE id IN ({', '.join(map(str, batch))});\n"
+        
+        yield from self.iter_suggestion_cache_sql(self.snapshot_job_ids(snapshot.current),
+                                                  self.snapshot_job_ids(snapshot.previous))
         
-        return sql
+        yield f"""
+-- {snapshot.summary()}
+
+-- Commit transaction
+COMMIT;
+SET AUTOCOMMIT = 1;
+"""
+    
+    def build_upsert_batch(self, batch: List[Dict[str, Any]], batch_number: int) -> str:
+        """One multi-row INSERT ... ON DUPLICATE KEY UPDATE with explicit ids"""
+        values = [f"    ({job['id']}, {', '.join(self.insert_values(job))})" for job in batch]
+        updates = ',\n'.join(f"    {column} = VALUES({column})" for column in JOB_COLUMNS)
+        return (
+            f"\n-- Batch {batch_number}: {len(batch)} new or changed jobs\n"
+            f"INSERT INTO jobs (id, {', '.join(JOB_COLUMNS)}) VALUES\n"
+            + ',\n'.join(values) + "\nON DUPLICATE KEY UPDATE\n" + updates + ';\n'
+        )
+    
+    def snapshot_job_ids(self, entries: Dict[str, Dict[str, Any]]) -> Dict[str, List[int]]:
+        """holland_code -> lowest job ids, from snapshot entries"""
+        job_ids_by_code = {}
+        for entry in entries.values():
+            if entry.get('holland_code'):
+                add_job_id(job_ids_by_code, entry['holland_code'], entry['id'])
+        return job_ids_by_code
+    
+    def search_tokens(self, job: Dict[str, Any]) -> Dict[str, int]:
+        """Folded token -> weight (sum of SEARCH_FIELD_WEIGHTS per occurrence) of one job"""
+        weights = {}
+        for field, field_weight in SEARCH_FIELD_WEIGHTS.items():
+            text = job.get(field)
+            if not text or text == 'NULL':
+                continue
+            if field in SEARCH_JSON_FIELDS:
+                text = ' '.join(json.loads(text))
+            for token in tokenize(text):
+                if len(token) <= MAX_TOKEN_LENGTH:
+                    weights[token] = min(weights.get(token, 0) + field_weight, MAX_TOKEN_WEIGHT)
+        return weights
+    
+    def build_search_token_batch(self, batch: List[Dict[str, Any]]) -> str:
+        """One multi-row INSERT of the search tokens of a batch"""
+        values = [
+            f"    ('{token}', {job['id']}, {weight})"
+            for job in batch
+            for token, weight in self.search_tokens(job).items()
+        ]
+        if not values:
+            return ''
+        return (
+            "INSERT INTO job_search_tokens (token, job_id, weight) VALUES\n"
+            + ',\n'.join(values) + ';\n\n'
+        )
+    
+    def collect_search_postings(self, jobs: Iterable[Dict[str, Any]],
+                                postings: Dict[str, List[List[int]]],
+                                names: List[list]) -> Iterator[Dict[str, Any]]:
+        """Pass jobs through, adding them to the static search index postings"""
+        for job in jobs:
+            names.append([job['id'], job.get('job_name', ''), job.get('holland_code', '')])
+            for token, weight in self.search_tokens(job).items():
+                postings.setdefault(token, []).append([job['id'], weight])
+            yield job
+    
+    def write_search_json(self, postings: Dict[str, List[List[int]]], names: List[list]) -> None:
+        """Write the static search index: token -> [[job_id, weight], ...] (ids ascending)"""
+        output_data = {
+            "metadata": {
+                "source": "suggestJobs.ts",
+                "total_jobs": len(names),
+                "total_tokens": len(postings),
+                "description": "Inverted index of job names, groups, specializations and descriptions",
+                "index_folding": FOLDING_DESCRIPTION,
+                "field_weights": SEARCH_FIELD_WEIGHTS,
+            },
+            # Delta runs assign ids out of stream order
+            "jobs": sorted(names),
+            "tokens": {token: sorted(postings[token]) for token in sorted(postings)},
+        }
+        os.makedirs(os.path.dirname(self.search_json_path), exist_ok=True)
+        with SQLFileWriter(self.search_json_path) as writer:
+            writer.write(json.dumps(output_data, ensure_ascii=False, separators=(',', ':')))
+    
+    def collect_job_ids(self, jobs: Iterable[Dict[str, Any]],
+                        job_ids_by_code: Dict[str, List[int]]) -> Iterator[Dict[str, Any]]:
+        """Pass jobs through, recording their ids by holland_code"""
+        for job in jobs:
+            if job.get('holland_code'):
+                add_job_id(job_ids_by_code, job['holland_code'], job['id'])
+            yield job
+    
+    def iter_suggestion_cache_sql(self, job_ids_by_code: Dict[str, List[int]],
+                                  previous_ids_by_code: Dict[str, List[int]] = None) -> Iterator[str]:
+        """Yield the job_suggestion_cache rows of all 120 codes, ranked like CareerSuggestionEngine
+        
+        With previous_ids_by_code only the codes whose ranking changed are replaced.
+        """
+        rankings = rank_all_codes(job_ids_by_code)
+        if previous_ids_by_code is not None:
+            previous = rank_all_codes(previous_ids_by_code)
+            rankings = {code: suggestions for code, suggestions in rankings.items()
+                        if suggestions != previous[code]}
+            if not rankings:
+                return
+        rows = (
+            f"    ('{holland_code}', {sort_order}, {suggestion.job_id}, {suggestion.star_rating}, "
+            f"'{suggestion.match_type}', {suggestion.match_score:.2f})"
+            for holland_code, suggestions in rankings.items()
+            for sort_order, suggestion in enumerate(suggestions)
+        )
+        
+        if previous_ids_by_code is None:
+            yield """
+-- Precomputed career suggestions (4-tier algorithm) for every Holland code
+DELETE FROM job_suggestion_cache;
+"""
+        else:
+            codes = ', '.join(f"'{code}'" for code in rankings)
+            yield f"""
+-- Precomputed career suggestions of the {len(rankings)} Holland codes whose ranking changed
+DELETE FROM job_suggestion_cache WHERE holland_code IN ({codes});
+"""
+        for batch in iter_batches(rows, CACHE_BATCH_SIZE):
+            yield (
+                "\nINSERT INTO job_suggestion_cache (\n"
+                "    holland_code, sort_order, job_id, star_rating, match_type, match_score\n"
+                ") VALUES\n"
+                + ',\n'.join(batch) + ';\n'
+            )
+    
+    def tee_normalized_sql(self, jobs: Iterable[Dict[str, Any]], writer: SQLFileWriter,
+                           delta: bool = False) -> Iterator[Dict[str, Any]]:
+        """Pass jobs through, writing their child table rows to writer one batch of jobs at a time
+        
+        With delta, only new and changed jobs are written, replacing their old rows.
+        """
+        if delta:
+            writer.write("""-- =====================================================
+-- JOBS NORMALIZED DATA (DELTA)
+-- Child rows of the new and changed jobs only
+-- Run after jobs_delta.sql (rows of removed jobs cascade)
+-- =====================================================
+
+SET AUTOCOMMIT = 0;
+""")
+        else:
+            writer.write("""-- =====================================================
+-- JOBS NORMALIZED DATA
+-- job_specializations, job_tasks and job_work_areas rows
+-- Run after jobs_data_insertion.sql (job ids follow the same order)
+-- =====================================================
+
+SET AUTOCOMMIT = 0;
+
+-- Clear existing child rows (if any)
+DELETE FROM job_specializations;
+DELETE FROM job_tasks;
+DELETE FROM job_work_areas;
+""")
+        batch = []
+        for job in jobs:
+            if not delta or job['change'] != UNCHANGED:
+                batch.append((job['id'], job))
+            yield job
+            if len(batch) == BATCH_SIZE:
+                writer.write(self.build_child_batch(batch, delta))
+                writer.end_batch()
+                batch = []
+        if batch:
+            writer.write(self.build_child_batch(batch, delta))
+            writer.end_batch()
+        
+        writer.write("""
+-- Commit transaction
+COMMIT;
+SET AUTOCOMMIT = 1;
+
+-- Verify insertion
+SELECT 
+    (SELECT COUNT(*) FROM job_specializations) as total_specializations,
+    (SELECT COUNT(*) FROM job_tasks) as total_tasks,
+    (SELECT COUNT(*) FROM job_work_areas) as total_work_areas;
+""")
+    
+    def build_child_batch(self, batch: List[Tuple[int, Dict[str, Any]]], delta: bool = False) -> str:
+        """One multi-row INSERT per child table for a batch of (job_id, job)"""
+        statements = [f"\n-- Jobs {batch[0][0]} to {batch[-1][0]}\n"]
+        if delta:
+            statements[0] = f"\n-- {len(batch)} new or changed jobs\n"
+            ids = ', '.join(str(job_id) for job_id, _ in batch)
+            statements += [f"DELETE FROM {table} WHERE job_id IN ({ids});\n"
+                           for table, _, _ in CHILD_TABLES]
+        for table, column, json_column in CHILD_TABLES:
+            values = []
+            for job_id, job in batch:
+                items = json.loads(job[json_column]) if job.get(json_column) else []
+                values += [f"    ({job_id}, {sort_order}, {self.escape_sql_string(item)})"
+                           for sort_order, item in enumerate(items) if item]
+            if values:
+                statements.append(f"INSERT INTO {table} (job_id, sort_order, {column}) VALUES\n"
+                                  + ',\n'.join(values) + ';\n')
+        return ''.join(statements)
+    
+    def write_data_insertion_sql(self, jobs: Iterable[Dict[str, Any]], data_file: str,
+                                 snapshot: Optional[RowSnapshot] = None) -> int:
+        """Stream jobs into the SQL file one batch at a time; returns the job count
+        
+        With a loaded snapshot the file is a delta script (iter_delta_sql).
+        Nothing is written (and 0 is returned) when there are no jobs.
+        """
+        jobs = iter(jobs)
+        first_job = next(jobs, None)
+        if first_job is None:
+            return 0
+        count = 0
+        
+        def counted(items):
+            nonlocal count
+            for item in items:
+                count += 1
+                yield item
+        
+        jobs = counted(chain([first_job], jobs))
+        if snapshot is not None and snapshot.loaded:
+            pieces = self.iter_delta_sql(jobs, snapshot)
+        else:
+            pieces = self.iter_data_insertion_sql(jobs)
+        with SQLFileWriter(data_file) as writer:
+            for piece in pieces:
+                writer.write(piece)
+                writer.end_batch()
+        return count
     
     def escape_sql_string(self, value: str, is_json: bool = False) -> str:
         """Escape string for SQL insertion"""
@@ -235,56 +720,296 @@ SELECT 'Jobs data insertion completed successfully!' as message;
         
         return f"'{escaped}'"
     
-    def run_migration(self):
-        """Main migration process"""
+    def job_row(self, job: Dict[str, Any]) -> List[Optional[str]]:
+        """Column values of a job in JOB_COLUMNS order as strings; None is NULL
+        
+        Same NULL rules as escape_sql_string: missing, empty and 'NULL' values.
+        """
+        row = []
+        for column in JOB_COLUMNS[:-1]:
+            value = job.get(column)
+            row.append(None if value is None or value == '' or value == 'NULL' else str(value))
+        row.append('1')  # is_active = TRUE
+        return row
+    
+    def engine_row(self, job_id: int, job: Dict[str, Any]) -> Dict[str, Any]:
+        """A job as CareerSuggestionEngine gets it from the jobs table, limited to ENGINE_COLUMNS"""
+        row = dict(zip(JOB_COLUMNS, self.job_row(job)), id=job_id)
+        if row['education_level'] is not None:
+            row['education_level'] = int(row['education_level'])
+        return {column: row.get(column) for column in ENGINE_COLUMNS}
+    
+    def index_jobs(self, jobs: Iterable[Dict[str, Any]],
+                   php_index: PHPIndexWriter) -> Iterator[Dict[str, Any]]:
+        """Pass jobs through, adding each one to the PHP jobs index under its id"""
+        for job in jobs:
+            if job.get('holland_code'):
+                php_index.add(job['holland_code'], self.engine_row(job['id'], job), order=job['id'])
+            yield job
+    
+    def tsv_line(self, row: List[Optional[str]]) -> str:
+        """One LOAD DATA line: tab-separated, escaped, NULL as \\N"""
+        return '\t'.join('\\N' if value is None else value.translate(TSV_ESCAPES)
+                         for value in row) + '\n'
+    
+    def write_load_data_files(self, jobs: Iterable[Dict[str, Any]], data_path: str,
+                              script_path: str, tokens_path: str) -> int:
+        """Stream jobs into TSV data files and write their LOAD DATA script; returns the job count"""
+        count = 0
+        job_ids_by_code = {}
+        with SQLFileWriter(data_path, newline='') as writer, \
+                SQLFileWriter(tokens_path, newline='') as tokens_writer:
+            # Header lines, skipped by IGNORE 1 LINES
+            writer.write('\t'.join(['id'] + JOB_COLUMNS) + '\n')
+            tokens_writer.write('token\tjob_id\tweight\n')
+            for batch in iter_batches(self.collect_job_ids(jobs, job_ids_by_code), BATCH_SIZE):
+                writer.write(''.join(self.tsv_line([str(job['id'])] + self.job_row(job)) for job in batch))
+                writer.end_batch()
+                tokens_writer.write(''.join(
+                    f"{token}\t{job['id']}\t{weight}\n"
+                    for job in batch
+                    for token, weight in self.search_tokens(job).items()))
+                tokens_writer.end_batch()
+                count += len(batch)
+        
+        columns = ',\n    '.join(['id'] + JOB_COLUMNS)
+        script = f"""-- =====================================================
+-- JOBS BULK LOAD (LOAD DATA LOCAL INFILE)
+-- Loads {count} job records from {os.path.basename(data_path)}
+-- =====================================================
+-- Same rows as jobs_data_insertion.sql, without parsing INSERT statements.
+-- Run from the directory that contains {os.path.basename(data_path)}, with
+-- local_infile enabled on the server and the client, e.g.:
+--   mysql --local-infile=1 -u root pac_db < {os.path.basename(script_path)}
+
+SET FOREIGN_KEY_CHECKS = 0;
+
+-- Clear existing jobs data (if any); FOREIGN_KEY_CHECKS = 0 skips the
+-- cascade, so the child tables are cleared explicitly
+DELETE FROM jobs;
+DELETE FROM job_search_tokens;
+DELETE FROM job_specializations;
+DELETE FROM job_tasks;
+DELETE FROM job_work_areas;
+
+-- Reset auto increment (rows carry explicit ids, MySQL moves it past the highest)
+ALTER TABLE jobs AUTO_INCREMENT = 1;
+
+LOAD DATA LOCAL INFILE '{os.path.basename(data_path)}'
+INTO TABLE jobs
+CHARACTER SET utf8mb4
+FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+LINES TERMINATED BY '\\n'
+IGNORE 1 LINES
+(
+    {columns}
+);
+
+LOAD DATA LOCAL INFILE '{os.path.basename(tokens_path)}'
+INTO TABLE job_search_tokens
+CHARACTER SET utf8mb4
+FIELDS TERMINATED BY '\\t'
+LINES TERMINATED BY '\\n'
+IGNORE 1 LINES
+(token, job_id, weight);
+{''.join(self.iter_suggestion_cache_sql(job_ids_by_code))}
+SET FOREIGN_KEY_CHECKS = 1;
+
+-- Verify load
+SELECT 
+    COUNT(*) as total_jobs,
+    COUNT(DISTINCT holland_code) as unique_holland_codes,
+    COUNT(DISTINCT job_group) as unique_job_groups
+FROM jobs;
+"""
+        with SQLFileWriter(script_path) as writer:
+            writer.write(script)
+        return count
+    
+    def verify_load_data(self, sql_file: str, script_file: str) -> Tuple[bool, int]:
+        """Round-trip check: load both outputs into SQLite and compare the stored rows; returns (ok, jobs)"""
+        schema = os.path.join(self.sql_output_path, "create-all-tables.sql")
+        databases = []
+        for output in (sql_file, script_file):
+            loader = SQLiteLoader(sqlite3.connect(':memory:', isolation_level=None))
+            loader.load_file(Path(schema))
+            loader.load_file(Path(output))
+            if loader.errors:
+                print(f"❌ {len(loader.errors)} statements failed to load {os.path.basename(output)} into SQLite")
+                for source, head, message in loader.errors[:5]:
+                    print(f"   {source}: {message} ({head})")
+                return False, 0
+            databases.append(loader.connection)
+        
+        jobs = 0
+        for table in VERIFY_TABLES:
+            # Columns filled by the database itself (load timestamps) differ by design
+            columns = [row[1] for row in databases[0].execute(f"PRAGMA table_info({table})")
+                       if 'CURRENT_TIMESTAMP' not in (row[4] or '').upper()]
+            query = f"SELECT {', '.join(columns)} FROM {table} ORDER BY {', '.join(columns)}"
+            count = 0
+            for left, right in zip_longest(databases[0].execute(query), databases[1].execute(query)):
+                count += 1
+                if left == right:
+                    continue
+                print(f"❌ {table} row {count} differs between {os.path.basename(sql_file)} "
+                      f"and {os.path.basename(script_file)}")
+                for column, left_value, right_value in zip(columns, left or [], right or []):
+                    if left_value != right_value:
+                        print(f"   {column}: {left_value!r} != {right_value!r}")
+                if left is None or right is None:
+                    print("   one output loads more rows than the other")
+                return False, count
+            if table == 'jobs':
+                jobs = count
+        return True, jobs
+    
+    def run_migration(self) -> bool:
+        """Main migration process; returns True when the SQL file was written"""
         print("🚀 Starting job data migration from TypeScript to SQL...")
         print("=" * 60)
         
-        # Step 1: Read TypeScript file
-        content = self.read_typescript_file()
-        if not content:
-            return
+        # Step 1: Check the TypeScript file
+        if not os.path.exists(self.old_project_path):
+            print(f"❌ Error: TypeScript file not found at {self.old_project_path}")
+            return False
+        print(f"✅ Reading TypeScript file: {self.old_project_path}")
         
-        # Step 2: Parse job data
-        jobs = self.parse_typescript_data(content)
-        if not jobs:
-            print("❌ No jobs found to migrate")
-            return
+        # Previous run to diff against (delta mode only)
+        snapshot_file = os.path.join(self.sql_output_path, SNAPSHOT_FILE)
+        snapshot = RowSnapshot.load(snapshot_file, SNAPSHOT_FINGERPRINT) if self.delta else None
+        if self.delta and snapshot is None:
+            print(f"⚠️ No usable snapshot at {snapshot_file}, generating a full migration instead")
+        delta = snapshot is not None
+        snapshot = snapshot or RowSnapshot(snapshot_file, SNAPSHOT_FINGERPRINT)
         
-        # Step 3: Generate data insertion SQL
-        print("\n📝 Generating data insertion SQL...")
-        data_sql = self.generate_data_insertion_sql(jobs)
-        data_file = os.path.join(self.sql_output_path, "jobs_data_insertion.sql")
+        # Step 2 + 3: Parse jobs and write the data insertion SQL as they stream in
+        print(f"\n📝 Generating {'delta' if delta else 'data insertion'} SQL...")
+        data_file = os.path.join(self.sql_output_path, DELTA_FILE if delta else "jobs_data_insertion.sql")
+        normalized_file = os.path.join(self.sql_output_path, NORMALIZED_DELTA_FILE if delta else NORMALIZED_FILE)
+        sample_jobs = []
         
-        with open(data_file, 'w', encoding='utf-8') as f:
-            f.write(data_sql)
-        print(f"✅ Data insertion SQL saved to: {data_file}")
+        def keep_sample(jobs):
+            for job in jobs:
+                if not sample_jobs:
+                    # The row as written, without the snapshot classification
+                    sample_jobs.append({key: value for key, value in job.items() if key != 'change'})
+                yield job
+        
+        try:
+            # One parse feeds both outputs, so the PHP index cannot drift from the SQL
+            with instrument_stage("jobs.stream") as stage, contextlib.ExitStack() as outputs:
+                php_index = outputs.enter_context(PHPIndexWriter(
+                    self.php_index_path, "Generated by tools/migrate_jobs_to_sql.py from suggestJobs.ts"))
+                jobs = self.assign_job_ids(self.iter_jobs(self.read_typescript_chunks()), snapshot)
+                jobs = self.index_jobs(keep_sample(jobs), php_index)
+                if self.normalized:
+                    normalized_writer = outputs.enter_context(SQLFileWriter(normalized_file))
+                    jobs = self.tee_normalized_sql(jobs, normalized_writer, delta)
+                if self.search_json_path:
+                    postings, names = {}, []
+                    jobs = self.collect_search_postings(jobs, postings, names)
+                job_count = self.write_data_insertion_sql(jobs, data_file, snapshot)
+                if job_count:
+                    snapshot.save()
+                if self.search_json_path and job_count:
+                    self.write_search_json(postings, names)
+                if self.normalized and not job_count:
+                    normalized_writer.discard()
+                stage["jobs"] = job_count
+        except Exception as e:
+            print(f"❌ Error generating SQL: {e}")
+            return False
+        
+        if not job_count:
+            print("❌ No jobs found to migrate")
+            return False
+        if delta:
+            print(f"✅ Delta SQL saved to: {data_file} ({snapshot.summary()})")
+        else:
+            print(f"✅ Data insertion SQL saved to: {data_file}")
+        print(f"✅ Snapshot saved to: {snapshot_file}")
+        print(f"✅ PHP jobs index saved to: {self.php_index_path}")
+        if self.normalized:
+            print(f"✅ Normalized child tables SQL saved to: {normalized_file}")
+        if self.search_json_path:
+            print(f"✅ Static search index saved to: {self.search_json_path}")
+        
+        # Optional: LOAD DATA output from a second pass over the same source
+        if self.load_data and not delta:
+            print("\n📝 Generating LOAD DATA files...")
+            tsv_file = os.path.join(self.sql_output_path, LOAD_DATA_FILE)
+            script_file = os.path.join(self.sql_output_path, LOAD_SCRIPT_FILE)
+            tokens_file = os.path.join(self.sql_output_path, SEARCH_TOKENS_FILE)
+            with instrument_stage("jobs.load_data"):
+                self.write_load_data_files(self.assign_job_ids(self.iter_jobs(self.read_typescript_chunks())),
+                                           tsv_file, script_file, tokens_file)
+            print(f"✅ LOAD DATA files saved to: {tsv_file}, {tokens_file}, {script_file}")
+            
+            if self.verify:
+                with instrument_stage("jobs.verify_load_data"):
+                    ok, rows = self.verify_load_data(data_file, script_file)
+                if not ok:
+                    return False
+                print(f"✅ Round-trip check passed: both outputs load the same {rows} jobs, "
+                      f"search tokens and cached suggestions into SQLite")
         
         # Step 4: Summary
         print("\n" + "=" * 60)
         print("📊 MIGRATION SUMMARY")
         print("=" * 60)
-        print(f"✅ Total jobs migrated: {len(jobs)}")
+        print(f"✅ Total jobs migrated: {job_count}")
         print(f"✅ File generated: {data_file}")
+        print(f"✅ File generated: {self.php_index_path}")
         print()
         print("🔧 NEXT STEPS:")
         print("1. Jobs table already exists in create-all-tables.sql")
-        print("2. Run jobs_data_insertion.sql to populate data")
+        print(f"2. Run {os.path.basename(data_file)} to {'apply the changes' if delta else 'populate data'}")
         print("3. Update quiz system to use jobs table for suggestions")
         
         # Step 5: Sample data preview
-        if jobs:
+        if sample_jobs:
             print("\n📋 SAMPLE JOB DATA:")
-            sample_job = jobs[0]
+            sample_job = sample_jobs[0]
             for key, value in sample_job.items():
                 if isinstance(value, str) and len(value) > 100:
                     value = value[:100] + "..."
                 print(f"   {key}: {value}")
+        
+        return True
 
 def main():
     """Main entry point"""
-    migrator = JobDataMigrator()
-    migrator.run_migration()
+    parser = argparse.ArgumentParser(description="Migrate job data from suggestJobs.ts to SQL")
+    parser.add_argument('--load-data', action='store_true',
+                        help=f'also write {LOAD_DATA_FILE} and {LOAD_SCRIPT_FILE} for LOAD DATA LOCAL INFILE')
+    parser.add_argument('--verify', action='store_true',
+                        help='load the INSERT and LOAD DATA outputs into SQLite and check they hold identical rows')
+    parser.add_argument('--delta', action='store_true',
+                        help=f'write {DELTA_FILE} with only the changes since {SNAPSHOT_FILE}')
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f'parser processes (default: all cores for sources over '
+                             f'{PARALLEL_MIN_BYTES // 1048576} MB, else 1)')
+    parser.add_argument('--search-json', action='store_true',
+                        help=f'also write {SEARCH_JSON_FILE} for client-side job search')
+    parser.add_argument('--normalized', action='store_true',
+                        help=f'also write {NORMALIZED_FILE} for the job_specializations, '
+                             f'job_tasks and job_work_areas tables ({NORMALIZED_DELTA_FILE} with --delta)')
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    if args.delta and (args.load_data or args.verify):
+        parser.error('--delta cannot be combined with --load-data or --verify (full reloads)')
+    configure_from_args(args)
+    
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    migrator = JobDataMigrator(load_data=args.load_data or args.verify, verify=args.verify,
+                               normalized=args.normalized, workers=args.workers, delta=args.delta,
+                               search_json_path=os.path.join(base_path, SEARCH_JSON_FILE)
+                               if args.search_json else None)
+    success = migrator.run_migration()
+    finish_from_args(args, "migrate_jobs_to_sql")
+    if not success:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Generated PHP data files
+Author: PAC Development Team
+Purpose: Write static data as a plain `return [...];` PHP file that the API
+         can `require` directly; opcache keeps such constant arrays in shared
+         memory, so reading them costs no database round trip
+
+Usage:
+    with PHPIndexWriter(path, "Generated by ...") as index:
+        for row in rows:                      # rows in id order
+            index.add(row["holland_code"], row)
+
+The result is `return ['AEI' => [[...], [...]], ...];`: groups sorted by key,
+rows of a group in the order they were added (or by the order passed to add).
+Rows are spilled to a temporary file while streaming, so only their offsets
+are kept in memory.
+"""
+
+import os
+import tempfile
+
+from sql_writer import SQLFileWriter
+
+INDENT = '    '
+
+
+def php_literal(value):
+    """PHP source for a str/int/float/bool/None value"""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    # Only \\ and \' are escapes inside single-quoted PHP strings
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def php_row(row, indent):
+    """One associative array literal on a single line"""
+    items = ', '.join(f"{php_literal(key)} => {php_literal(value)}" for key, value in row.items())
+    return f"{indent}[{items}],\n"
+
+
+class PHPIndexWriter:
+    """Stream rows into a PHP file grouped by key; nothing is written when no row was added"""
+
+    def __init__(self, path, description):
+        self.path = str(path)
+        self.description = description
+        self.offsets = {}
+        self.count = 0
+        self.spill = None
+
+    def __enter__(self):
+        self.spill = tempfile.TemporaryFile('w+', encoding='utf-8', newline='')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None and self.count:
+                self.write()
+        finally:
+            self.spill.close()
+        return False
+
+    def add(self, key, row, order=None):
+        """Append a row to the group of key; order sorts rows within the group (default: add order)"""
+        line = php_row(row, INDENT * 2)
+        # Text-mode tell() is an opaque cookie, but valid for seek()
+        self.offsets.setdefault(key, []).append(
+            (self.count if order is None else order, self.spill.tell()))
+        self.spill.write(line)
+        self.count += 1
+
+    def write(self):
+        """Copy the spilled rows into the PHP file, one group at a time"""
+        self.spill.flush()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with SQLFileWriter(self.path, newline='') as writer:
+            writer.write(f"<?php\n\n// {self.description}\n"
+                         f"// {self.count} rows in {len(self.offsets)} groups - do not edit\n\n"
+                         "return [\n")
+            for key in sorted(self.offsets):
+                writer.write(f"{INDENT}{php_literal(key)} => [\n")
+                for _, offset in sorted(self.offsets[key]):
+                    self.spill.seek(offset)
+                    writer.write(self.spill.readline())
+                writer.write(f"{INDENT}],\n")
+                writer.end_batch()
+            writer.write("];\n")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Rule-driven question classifier
+Author: PAC Development Team
+Purpose: Assign a category and a difficulty to quiz questions from the rules
+         in rules/question_rules.json, compiled once into one regular
+         expression per rule set and run over whole batches of questions
+
+Usage:
+    classifier = QuestionClassifier.from_file()        # DEFAULT_RULES_FILE
+    for result in classifier.classify_batch(texts):
+        result.category, result.difficulty, result.category_rule, result.difficulty_rule
+
+Rule file:
+    {"version": 1,
+     "category":   {"default": "personality", "rules": [...]},
+     "difficulty": {"default": "medium", "rules": [...]}}
+
+Every rule has a name, a value and either keywords (lowercase substrings of
+the lowercased question) or min_length / max_length (characters of the
+question). Rules are tried in order and the first match sets the value;
+when no rule matches, the default is used and the rule name is "default".
+
+All keywords of a rule set are compiled into a single regular expression
+shaped like a trie (keywords sharing a prefix share a branch, so the engine
+follows one path per position instead of trying every keyword) and searched
+over a whole batch (questions joined by newlines). The trie matches the
+longest keyword at a position; every shorter keyword found there is a
+prefix of it, so the earliest rule of the position is looked up per matched
+keyword. Every search restarts one character after the previous match, so
+overlapping keywords are all seen. Each question is therefore scanned once
+per rule set, however many keywords there are, and the scan moves on to the
+next question as soon as a keyword of the first rule is found.
+"""
+
+import json
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_RULES_FILE = SCRIPT_DIR / "rules" / "question_rules.json"
+
+RULES_VERSION = 1
+RULE_SETS = ("category", "difficulty")
+DEFAULT_RULE = "default"
+
+# Questions joined into one text per classify_batch() call
+CLASSIFY_BATCH_SIZE = 1000
+
+Classification = namedtuple('Classification',
+                            ['category', 'difficulty', 'category_rule', 'difficulty_rule'])
+
+Rule = namedtuple('Rule', ['name', 'value', 'keywords', 'min_length', 'max_length'])
+
+
+def trie_pattern(keywords):
+    """Regular expression matching the longest of keywords, factored by common prefixes"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class RuleFileError(ValueError):
+    """Rule file that cannot be read or does not follow the format"""
+
+
+class RuleSet:
+    """Ordered rules of one attribute (category or difficulty), compiled"""
+
+    def __init__(self, name, spec):
+        if not isinstance(spec, dict) or not isinstance(spec.get('rules'), list):
+            raise RuleFileError(f"{name}: expected an object with a 'rules' list")
+        if not isinstance(spec.get('default'), str):
+            raise RuleFileError(f"{name}: missing the default value")
+        self.name = name
+        self.default = spec['default']
+        self.rules = [self._parse_rule(index, rule) for index, rule in enumerate(spec['rules'])]
+
+        # Keyword -> index of the first rule that lists the keyword or one of its prefixes
+        self.keyword_rules = {}
+        for index, rule in enumerate(self.rules):
+            for keyword in rule.keywords:
+                self.keyword_rules.setdefault(keyword, index)
+        for keyword in self.keyword_rules:
+            self.keyword_rules[keyword] = min(
+                self.keyword_rules.get(keyword[:end], len(self.rules))
+                for end in range(1, len(keyword) + 1))
+        self.pattern = None
+        if self.keyword_rules:
+            self.pattern = re.compile(trie_pattern(self.keyword_rules))
+        # (earliest keyword rule, text length) -> (value, rule name)
+        self._resolved = {}
+
+    def _parse_rule(self, index, rule):
+        """Validate one rule of the file"""
+        where = f"{self.name} rule {index + 1}"
+        if not isinstance(rule, dict) or not isinstance(rule.get('value'), str):
+            raise RuleFileError(f"{where}: expected an object with a 'value'")
+        name = str(rule.get('name') or f"{self.name}-{index + 1}")
+        keywords = rule.get('keywords') or []
+        min_length = rule.get('min_length')
+        max_length = rule.get('max_length')
+        has_length = min_length is not None or max_length is not None
+        if bool(keywords) == has_length:
+            raise RuleFileError(f"{where} ({name}): use either keywords or min_length/max_length")
+        if not all(isinstance(keyword, str) and keyword and '\n' not in keyword
+                   for keyword in keywords):
+            raise RuleFileError(f"{where} ({name}): keywords must be non-empty single-line strings")
+        for bound in (min_length, max_length):
+            if bound is not None and (not isinstance(bound, int) or bound < 0):
+                raise RuleFileError(f"{where} ({name}): lengths must be non-negative integers")
+        return Rule(name, rule['value'], [keyword.lower() for keyword in keywords],
+                    min_length, max_length)
+
+    def first_keyword_rules(self, joined, starts):
+        """Index of the earliest matching keyword rule per question (len(rules): none)"""
+        best = [len(self.rules)] * len(starts)
+        if self.pattern is None:
+            return best
+        keyword_rules = self.keyword_rules
+        search = self.pattern.search
+        ends = starts[1:] + [len(joined)]
+        position = 0
+        while True:
+            match = search(joined, position)
+            if match is None:
+                return best
+            start = match.start()
+            question = bisect_right(starts, start) - 1
+            rule = keyword_rules[match.group()]
+            if rule < best[question]:
+                best[question] = rule
+            # Nothing can beat the first rule: continue with the next question
+            position = ends[question] if rule == 0 else start + 1
+
+    def resolve(self, text, keyword_rule):
+        """(value, rule name) for one question given its earliest keyword rule"""
+        key = (keyword_rule, len(text))
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = self._resolved[key] = self._resolve(*key)
+        return resolved
+
+    def _resolve(self, keyword_rule, length):
+        """First rule that matches a text of this length and earliest keyword rule"""
+        for index, rule in enumerate(self.rules):
+            if rule.keywords:
+                if index == keyword_rule:
+                    return rule.value, rule.name
+            elif ((rule.min_length is None or length >= rule.min_length) and
+                  (rule.max_length is None or length <= rule.max_length)):
+                return rule.value, rule.name
+        return self.default, DEFAULT_RULE
+
+
+class QuestionClassifier:
+    """Category and difficulty rule sets loaded from a rule file"""
+
+    def __init__(self, rules, source=None):
+        if not isinstance(rules, dict) or rules.get('version') != RULES_VERSION:
+            raise RuleFileError(f"{source or 'rules'}: expected version {RULES_VERSION}")
+        self.source = str(source) if source else None
+        self.rule_sets = [RuleSet(name, rules.get(name)) for name in RULE_SETS]
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_RULES_FILE):
+        """Load and compile a rule file"""
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                rules = json.load(file)
+        except OSError as e:
+            raise RuleFileError(f"Cannot read {path}: {e.strerror}") from None
+        except json.JSONDecodeError as e:
+            raise RuleFileError(f"Invalid JSON in {path}: {e}") from None
+        return cls(rules, path)
+
+    def classify_batch(self, texts):
+        """Classification of every question text in texts (one scan per rule set)"""
+        texts = [text or '' for text in texts]
+        starts = []
+        offset = 0
+        lowered = []
+        # Lowercase per question: lower() may change the length of a text
+        for text in texts:
+            text = text.lower()
+            starts.append(offset)
+            lowered.append(text)
+            offset += len(text) + 1
+        joined = '\n'.join(lowered)
+
+        category_set, difficulty_set = self.rule_sets
+        categories = category_set.first_keyword_rules(joined, starts)
+        difficulties = difficulty_set.first_keyword_rules(joined, starts)
+        results = []
+        for text, category_rule, difficulty_rule in zip(texts, categories, difficulties):
+            category, category_name = category_set.resolve(text, category_rule)
+            difficulty, difficulty_name = difficulty_set.resolve(text, difficulty_rule)
+            results.append(Classification(category, difficulty, category_name, difficulty_name))
+        return results
+
+    def classify(self, text):
+        """Classification of a single question text"""
+        return self.classify_batch([text])[0]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Precomputed question pools for the quiz packages
+Author: PAC Development Team
+Purpose: Build balanced, shuffled question sets ahead of time, so starting an
+         exam only picks one pool instead of running ORDER BY RAND() per
+         Holland group (includes/classes/QuizGenerator.php)
+
+Usage:
+    sampler = QuestionSampler(capacity_for(DEFAULT_POOL_COUNT, DEFAULT_GROUP_SIZES))
+    for question in questions:
+        sampler.add(question_id, holland_code)
+    pools = build_pools(sampler, questions_per_group=5, pool_count=100)
+
+Every pool holds questions_per_group questions of each code R, I, A, S, E, C,
+shuffled together like QuizGenerator::generateQuestionSet. Within a code the
+questions are dealt in cycles, each a new shuffle of all of them, so the
+number of pools of any two questions differs by at most one and no pool
+holds a question twice.
+
+The sampler keeps a seeded reservoir sample of at most `capacity` question
+ids per code, so memory does not grow with the question bank; with fewer
+questions than the capacity (the current bank has about 110 per code) every
+question is kept. The output is deterministic for a given input and seed.
+"""
+
+import random
+
+HOLLAND_CODES = "RIASEC"
+
+# questions_per_group of quiz_package_configs (sql/questions-and-quiz.sql)
+DEFAULT_GROUP_SIZES = (5, 10, 20)
+DEFAULT_POOL_COUNT = 100
+DEFAULT_POOL_SEED = 20251101
+
+
+def capacity_for(pool_count, group_sizes):
+    """Questions per code needed for every pool to draw distinct questions"""
+    return pool_count * max(group_sizes)
+
+
+class QuestionSampler:
+    """Seeded reservoir sample of question ids per Holland code"""
+
+    def __init__(self, capacity, seed=DEFAULT_POOL_SEED):
+        self.capacity = capacity
+        self.rng = random.Random(seed)
+        self.samples = {code: [] for code in HOLLAND_CODES}
+        self.seen = dict.fromkeys(HOLLAND_CODES, 0)
+
+    def add(self, question_id, holland_code):
+        """Offer one active question; codes outside RIASEC are ignored"""
+        sample = self.samples.get(holland_code)
+        if sample is None:
+            return
+        self.seen[holland_code] += 1
+        if len(sample) < self.capacity:
+            sample.append(question_id)
+        else:
+            slot = self.rng.randrange(self.seen[holland_code])
+            if slot < self.capacity:
+                sample[slot] = question_id
+
+
+def build_pools(sampler, questions_per_group, pool_count, seed=DEFAULT_POOL_SEED):
+    """pool_count shuffled lists of question ids, questions_per_group per code
+
+    Raises ValueError when a code has fewer questions than questions_per_group.
+    """
+    rng = random.Random(f"{seed}:{questions_per_group}")
+    pools = [[] for _ in range(pool_count)]
+    for code in HOLLAND_CODES:
+        questions = sampler.samples[code]
+        if len(questions) < questions_per_group:
+            raise ValueError(f"Not enough questions for code {code}: "
+                             f"need {questions_per_group}, have {len(questions)}")
+        deck = []
+        position = 0
+        for pool in pools:
+            if position + questions_per_group > len(deck):
+                # Next cycle: every question once, in a new order. The pool that
+                # spans both cycles must not get a question of the old tail again.
+                tail = deck[position:]
+                cycle = questions[:]
+                rng.shuffle(cycle)
+                blocked = set(tail)
+                head = [question for question in cycle
+                        if question not in blocked][:questions_per_group - len(tail)]
+                blocked = set(head)
+                deck = tail + head + [question for question in cycle if question not in blocked]
+                position = 0
+            pool.extend(deck[position:position + questions_per_group])
+            position += questions_per_group
+    for pool in pools:
+        rng.shuffle(pool)
+    return pools
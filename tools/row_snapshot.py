@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Row snapshots for delta migrations
+Author: PAC Development Team
+Purpose: Remember a content hash per row (keyed by a stable natural key) of
+         the last generated migration, so the next run can emit upserts for
+         new or changed rows and targeted deletes for removed ones only
+
+Usage:
+    snapshot = RowSnapshot.load(path, fingerprint)     # None: no usable snapshot
+    snapshot = snapshot or RowSnapshot(path, fingerprint)
+    for key, values in rows:
+        status = snapshot.classify(key, row_hash(values), id=...)  # NEW / CHANGED / UNCHANGED
+    removed = snapshot.removed()                       # {key: previous entry}
+    snapshot.save()
+
+A snapshot describes the database the generated scripts are applied to, so
+it is saved only after a script was written and must stay with the database
+it belongs to. The fingerprint covers the output format (columns, derived
+fields); a snapshot with another fingerprint is ignored, which forces a full
+migration.
+
+Without a previous run nothing needs to be compared, so the rows of the
+current run are spilled to a temporary file instead of being kept in
+memory (duplicate keys are then left to the table's primary key).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import Counter
+
+from sql_writer import SQLFileWriter
+
+SNAPSHOT_VERSION = 1
+
+NEW = 'new'
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+
+
+def row_hash(values):
+    """SHA-256 of a JSON-serialisable row (list or dict)"""
+    text = json.dumps(values, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class RowSnapshot:
+    """Previous and current {natural key: {'hash': ..., extra fields}} of one table"""
+
+    def __init__(self, path, fingerprint, previous=None, meta=None):
+        self.path = str(path)
+        self.fingerprint = fingerprint
+        # None: no previous run, every row is new
+        self.loaded = previous is not None
+        self.previous = previous or {}
+        self.current = {}
+        # Baseline run: "key":entry pieces of the current run, see classify()
+        self._spill = None
+        self._spilled = 0
+        # Free-form values kept between runs (e.g. the next job id)
+        self.meta = dict(meta or {})
+        self.counts = Counter()
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        """Snapshot of the previous run, or None when missing, unreadable or of another format"""
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != SNAPSHOT_VERSION or data.get('fingerprint') != fingerprint:
+            return None
+        return cls(path, fingerprint, data.get('rows', {}), data.get('meta'))
+
+    def classify(self, key, content_hash, **extra):
+        """Record a row of the current run; returns NEW, CHANGED or UNCHANGED"""
+        entry = dict(extra, hash=content_hash)
+        if not self.loaded:
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile('w+', encoding='utf-8')
+            if self._spilled:
+                self._spill.write(',')
+            self._spill.write(json.dumps(key, ensure_ascii=False) + ':' +
+                              json.dumps(entry, ensure_ascii=False, separators=(',', ':')))
+            self._spilled += 1
+            self.counts[NEW] += 1
+            return NEW
+        if key in self.current:
+            raise ValueError(f"Duplicate natural key: {key}")
+        self.current[key] = entry
+        previous = self.previous.get(key)
+        if previous is None:
+            status = NEW
+        elif previous['hash'] == content_hash:
+            status = UNCHANGED
+        else:
+            status = CHANGED
+        self.counts[status] += 1
+        return status
+
+    def removed(self):
+        """Rows of the previous run that the current run did not classify"""
+        return {key: entry for key, entry in self.previous.items() if key not in self.current}
+
+    def summary(self):
+        """'3 new, 1 changed, 2 removed, 194 unchanged'"""
+        return (f"{self.counts[NEW]} new, {self.counts[CHANGED]} changed, "
+                f"{len(self.removed())} removed, {self.counts[UNCHANGED]} unchanged")
+
+    def save(self):
+        """Write the current run as the snapshot for the next one"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        head = json.dumps({
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": self.fingerprint,
+            "meta": self.meta,
+        }, ensure_ascii=False, separators=(',', ':'))
+        with SQLFileWriter(self.path) as writer:
+            writer.write(head[:-1] + ',"rows":')
+            if self._spill is None:
+                writer.write(json.dumps(self.current, ensure_ascii=False, separators=(',', ':')))
+            else:
+                writer.write('{')
+                self._spill.seek(0)
+                while True:
+                    piece = self._spill.read(1024 * 1024)
+                    if not piece:
+                        break
+                    writer.write(piece)
+                writer.write('}')
+            writer.write('}')
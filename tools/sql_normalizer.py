@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+INSERT-coalescing SQL normalizer
+Author: PAC Development Team
+Purpose: Rewrite a stream of SQL statements (see sql_statements.py) so the
+         server parses, plans and logs far fewer statements: runs of
+         single-row INSERTs become byte-bounded multi-row INSERTs and the
+         data section runs with autocommit and key checks turned off
+
+Usage:
+    for statement in normalize_statements(iter_statements(chunks)):
+        output.write(statement.text)
+
+Coalescing: consecutive INSERT ... VALUES statements into the same table
+with the same column list (and the same IGNORE modifier) are merged into
+multi-row INSERTs of at most max_bytes (max_allowed_packet minus headroom,
+like sql_writer.iter_byte_batches). Every row keeps its exact source text.
+INSERTs with ON DUPLICATE KEY UPDATE, INSERT ... SELECT, or rows using
+LAST_INSERT_ID() or @variables are left as they are, since merging could
+change their result. Comments between merged INSERTs are dropped; a run of
+one INSERT is copied unchanged.
+
+Data section: from the first INSERT/REPLACE/UPDATE/DELETE to the end, the
+output runs with UNIQUE_CHECKS, FOREIGN_KEY_CHECKS and AUTOCOMMIT set to 0
+and ends with COMMIT (then all three back to 1), like a mysqldump import.
+The source files' own START TRANSACTION / BEGIN / COMMIT and SET statements
+for those three variables are dropped there (their comments are kept). DDL
+in the data section (e.g. ALTER TABLE ... AUTO_INCREMENT) still commits
+implicitly; with autocommit off the next statement opens a new transaction.
+"""
+
+import re
+
+from sql_statements import DEFAULT_DELIMITER, SQLStatement, unquote_string
+from sql_writer import DEFAULT_MAX_ALLOWED_PACKET, PACKET_HEADROOM, ROW_SEPARATOR
+
+DEFAULT_MAX_BYTES = DEFAULT_MAX_ALLOWED_PACKET - PACKET_HEADROOM
+
+INSERT_HEAD = re.compile(
+    r'INSERT\s+(IGNORE\s+)?INTO\s+(`[^`]+`|[\w$.]+)\s*\(([^()\'"]*)\)\s*VALUES\b\s*',
+    re.IGNORECASE)
+DATA_STATEMENT = re.compile(r'(?:INSERT|REPLACE|UPDATE|DELETE)\b', re.IGNORECASE)
+TRANSACTION_CONTROL = re.compile(
+    r'(?:START\s+TRANSACTION|BEGIN(?:\s+WORK)?|COMMIT(?:\s+WORK)?)\s*$', re.IGNORECASE)
+MANAGED_SET = re.compile(
+    r'SET\s+(?:SESSION\s+|@@SESSION\.|@@)?(?:UNIQUE_CHECKS|FOREIGN_KEY_CHECKS|AUTOCOMMIT)\s*=\s*\w+\s*$',
+    re.IGNORECASE)
+# Row expressions whose value depends on the statement they are in
+STATEMENT_DEPENDENT = re.compile(r'@|LAST_INSERT_ID', re.IGNORECASE)
+
+# Tokens of a VALUES list: quoted strings and identifiers, comments,
+# parentheses and commas, and runs of anything else
+VALUE_TOKEN = re.compile(r"""
+      '(?:[^'\\]|\\.|'')*'
+    | "(?:[^"\\]|\\.|"")*"
+    | `(?:[^`]|``)*`
+    | --(?:[ \t][^\n]*)?(?:\n|$)
+    | \#[^\n]*
+    | /\*.*?\*/
+    | [(),]
+    | [^'"`(),#/-]+
+    | [-/]
+""", re.VERBOSE | re.DOTALL)
+
+DATA_PROLOGUE = ("-- =========================================\n"
+                 "-- DATA: autocommit and UNIQUE/FOREIGN KEY checks off (merge_all_sql.py --normalize)\n"
+                 "-- =========================================\n")
+DATA_SETTINGS = ("UNIQUE_CHECKS", "FOREIGN_KEY_CHECKS", "AUTOCOMMIT")
+
+
+def _is_comment(token):
+    return token.startswith(('--', '#', '/*'))
+
+
+def parse_insert(body):
+    """(key, head, rows) of a coalescible INSERT ... VALUES statement, else None
+
+    key identifies the table, column list and modifier; head is the source
+    text up to VALUES; rows are the source texts of the row tuples.
+    """
+    match = INSERT_HEAD.match(body)
+    if not match:
+        return None
+    modifier, table, columns = match.groups()
+    key = (bool(modifier), table.strip('`').lower(),
+           tuple(column.strip().strip('`').lower() for column in columns.split(',')))
+
+    rows = []
+    depth = 0
+    row_start = None
+    expect_row = True
+    for token_match in VALUE_TOKEN.finditer(body, match.end()):
+        token = token_match.group()
+        if depth == 0:
+            if token.isspace() or _is_comment(token):
+                continue
+            if token == '(' and expect_row:
+                row_start = token_match.start()
+                depth = 1
+                expect_row = False
+            elif token == ',' and not expect_row:
+                expect_row = True
+            else:
+                # ON DUPLICATE KEY UPDATE, row aliases, ...
+                return None
+        elif token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+            if depth == 0:
+                rows.append(body[row_start:token_match.end()])
+        elif token[0] not in '\'"`' and STATEMENT_DEPENDENT.search(token):
+            return None
+    if depth or expect_row or not rows:
+        return None
+    return key, body[:match.end()].rstrip(), rows
+
+
+def row_values(row):
+    """Values of one row tuple: strings decoded, other expressions whitespace-normalized"""
+    values = []
+    parts = []
+    depth = 0
+    for token_match in VALUE_TOKEN.finditer(row, 1, len(row) - 1):
+        token = token_match.group()
+        if _is_comment(token):
+            continue
+        if token == ',' and depth == 0:
+            values.append(parts)
+            parts = []
+            continue
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        parts.append(token)
+    values.append(parts)
+
+    result = []
+    for parts in values:
+        tokens = [part for part in parts if not part.isspace()]
+        if len(tokens) == 1 and tokens[0][0] in '\'"':
+            result.append(('string', unquote_string(tokens[0].strip())))
+        else:
+            result.append(('expr', ' '.join(''.join(parts).split()).upper()))
+    return tuple(result)
+
+
+class _InsertRun:
+    """Rows of consecutive INSERTs with the same key, flushed in byte-bounded batches"""
+
+    def __init__(self, statement, key, head, max_bytes):
+        self.first = statement
+        self.key = key
+        self.delimiter = statement.delimiter
+        self.head = head
+        self.leading = statement.text[:statement.text.rfind(statement.body)]
+        self.max_bytes = max_bytes
+        self.overhead = len(head.encode('utf-8')) + 1 + len(self.delimiter.encode('utf-8'))
+        self.rows = []
+        self.size = self.overhead
+        self.statements = 0
+        self.emitted = 0
+
+    def add(self, rows):
+        """Add the rows of one more INSERT; yields statements that became full"""
+        self.statements += 1
+        for row in rows:
+            row_size = len(row.encode('utf-8')) + len(ROW_SEPARATOR)
+            if self.rows and self.size + row_size > self.max_bytes:
+                yield self._statement()
+            self.rows.append(row)
+            self.size += row_size
+
+    def flush(self):
+        """Remaining rows as the last statement of the run"""
+        if self.statements == 1 and not self.emitted:
+            # Nothing merged: keep the source text
+            yield self.first
+        elif self.rows:
+            yield self._statement()
+
+    def _statement(self):
+        body = self.head + "\n" + ROW_SEPARATOR.join(self.rows)
+        leading = self.leading if not self.emitted else "\n\n"
+        self.rows = []
+        self.size = self.overhead
+        self.emitted += 1
+        return SQLStatement(leading + body + self.delimiter, "sql", body, self.delimiter)
+
+
+def _setting_statements(value, delimiter):
+    return [SQLStatement(f"SET {name} = {value}{delimiter}\n", "sql", f"SET {name} = {value}",
+                         delimiter) for name in DATA_SETTINGS]
+
+
+def normalize_statements(statements, max_bytes=DEFAULT_MAX_BYTES):
+    """Yield the statements with INSERT runs coalesced and the data section wrapped"""
+    run = None
+    in_data = False
+    delimiter = DEFAULT_DELIMITER
+    trailing = []
+
+    for statement in statements:
+        insert = None
+        if statement.kind == "sql":
+            insert = parse_insert(statement.body)
+        if run is not None and (insert is None or insert[0] != run.key
+                                or statement.delimiter != run.delimiter):
+            yield from run.flush()
+            run = None
+
+        if statement.kind == "delimiter":
+            delimiter = statement.body
+        elif statement.kind == "comment":
+            # Only whitespace and comments after the last statement
+            trailing.append(statement)
+            continue
+        elif statement.kind == "sql":
+            if not in_data and DATA_STATEMENT.match(statement.body):
+                in_data = True
+                yield SQLStatement("\n\n" + DATA_PROLOGUE, "comment", '', delimiter)
+                yield from _setting_statements(0, delimiter)
+            if in_data and (TRANSACTION_CONTROL.match(statement.body)
+                            or MANAGED_SET.match(statement.body)):
+                leading = statement.text[:statement.text.rfind(statement.body)]
+                yield SQLStatement(leading, "comment", '', delimiter)
+                continue
+
+        if insert is not None:
+            if run is None:
+                run = _InsertRun(statement, insert[0], insert[1], max_bytes)
+            yield from run.add(insert[2])
+        else:
+            yield statement
+
+    if run is not None:
+        yield from run.flush()
+    if in_data:
+        yield SQLStatement(f"\n\nCOMMIT{delimiter}\n", "sql", "COMMIT", delimiter)
+        yield from _setting_statements(1, delimiter)
+    yield from trailing
+
+
+def table_rows(statements):
+    """Rows per table in statement order, and the other statements (for equivalence checks)
+
+    Returns ({table: [(columns, values), ...]}, [normalized statement, ...]).
+    Statements the normalizer adds or drops (autocommit, key checks and
+    transaction control) are left out of the second list.
+    """
+    tables = {}
+    others = []
+    for statement in statements:
+        if statement.kind != "sql":
+            continue
+        insert = parse_insert(statement.body)
+        if insert is not None:
+            (_, table, columns), _, rows = insert
+            tables.setdefault(table, []).extend((columns, row_values(row)) for row in rows)
+        elif not (TRANSACTION_CONTROL.match(statement.body) or MANAGED_SET.match(statement.body)):
+            others.append(' '.join(statement.body.split()))
+    return tables, others
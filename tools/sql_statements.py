@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Streaming SQL statement scanner
+Author: PAC Development Team
+Purpose: Split SQL files into statements the way the mysql client does,
+         reading them chunk by chunk, so tools can count, split or rewrite
+         multi-megabyte SQL files with memory bounded by the largest
+         statement instead of the file size
+
+Usage:
+    with open(path, 'r', encoding='utf-8') as file:
+        for statement in iter_statements(iter_chunks(file)):
+            statement.kind, statement.body, statement.text
+
+Every statement keeps the exact source text (leading whitespace and
+comments included), so ''.join(statement.text ...) reproduces the input.
+The scanner understands quoted strings and identifiers (backslash escapes
+and doubled quotes), -- / # / C-style comments and the client's DELIMITER
+command, which is reported as its own statement of kind "delimiter".
+Comments and whitespace after the last statement come out as kind
+"comment".
+"""
+
+import re
+from collections import namedtuple
+
+# Characters read from a source file per chunk
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+DEFAULT_DELIMITER = ';'
+
+# text: exact source text; kind: "sql", "delimiter" or "comment"; body: the
+# statement without leading comments and its delimiter (the new delimiter for
+# kind "delimiter"); delimiter: the delimiter in effect for the statement
+SQLStatement = namedtuple('SQLStatement', ['text', 'kind', 'body', 'delimiter'])
+
+DELIMITER_COMMAND = re.compile(r'delimiter[ \t]+(\S+)[^\n]*(?:\n|$)', re.IGNORECASE)
+LEADING_SPACE = re.compile(r'\s*')
+QUOTES = "'\"`"
+
+# Backslash escapes of MySQL string literals (any other escaped character stands for itself)
+STRING_ESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+STRING_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+
+
+def iter_chunks(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield chunks of an open text file until it is exhausted"""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def unquote_string(literal):
+    """Value of a quoted MySQL string literal ('...' or "...")"""
+    quote = literal[0]
+    text = literal[1:-1].replace(quote * 2, quote)
+    return STRING_ESCAPE.sub(lambda match: STRING_ESCAPES.get(match.group(1), match.group(1)), text)
+
+
+class _NeedMoreInput(Exception):
+    """The buffer ends inside a token; scan again once more text is read"""
+
+
+class StatementScanner:
+    """Incremental statement splitter: feed() text, collect finished statements"""
+
+    def __init__(self, delimiter=DEFAULT_DELIMITER):
+        self.buffer = ''
+        self.eof = False
+        self._set_delimiter(delimiter)
+        self._reset_statement(0)
+
+    def _set_delimiter(self, delimiter):
+        self.delimiter = delimiter
+        self._special = re.compile("['\"`#]|--|/\\*|" + re.escape(delimiter))
+
+    def _reset_statement(self, start):
+        self.start = start          # start of the statement's source text
+        self.position = start       # everything before is fully scanned
+        self.code_start = None      # first character after leading comments
+
+    def feed(self, text):
+        """Add text and return the statements completed by it"""
+        self.buffer += text
+        return self._scan()
+
+    def close(self):
+        """Return the statements left at the end of the input"""
+        self.eof = True
+        statements = self._scan()
+        rest = self.buffer[self.start:]
+        if rest:
+            if self.code_start is None:
+                statements.append(SQLStatement(rest, "comment", '', self.delimiter))
+            else:
+                # Last statement without delimiter: the client still runs it
+                body = self.buffer[self.code_start:].rstrip()
+                statements.append(SQLStatement(rest, "sql", body, self.delimiter))
+        self.buffer = ''
+        self._reset_statement(0)
+        return statements
+
+    def _scan(self):
+        statements = []
+        try:
+            while True:
+                statement = self._next_statement()
+                if statement is None:
+                    break
+                statements.append(statement)
+        except _NeedMoreInput:
+            pass
+        # Drop the text of finished statements from the buffer
+        if self.start:
+            self.buffer = self.buffer[self.start:]
+            if self.code_start is not None:
+                self.code_start -= self.start
+            self.position -= self.start
+            self.start = 0
+        return statements
+
+    def _next_statement(self):
+        """Scan one statement from self.position; None when the buffer is used up"""
+        buffer = self.buffer
+        if self.code_start is None:
+            self.position = self._skip_comments(self.position)
+            if self.position >= len(buffer):
+                return None
+            self.code_start = self.position
+            command = DELIMITER_COMMAND.match(buffer, self.position)
+            if command and (command.group().endswith('\n') or self.eof):
+                return self._finish(command.end(), "delimiter", command.group(1))
+            head = buffer[self.position:self.position + len('delimiter')].lower()
+            if not self.eof and 'delimiter'.startswith(head) and buffer.find('\n', self.position) < 0:
+                # The DELIMITER line may not be complete yet
+                self.code_start = None
+                raise _NeedMoreInput
+
+        while True:
+            match = self._special.search(buffer, self.position)
+            if match is None:
+                # Rescan the tail: a delimiter, '--' or '/*' may continue in the next chunk
+                self.position = max(self.position, len(buffer) - max(len(self.delimiter), 2) + 1)
+                raise _NeedMoreInput
+            token = match.group()
+            if token == self.delimiter:
+                body = buffer[self.code_start:match.start()].rstrip()
+                return self._finish(match.end(), "sql", body)
+            if token in QUOTES:
+                self.position = self._skip_quoted(match.start(), token)
+            elif token == '/*':
+                self.position = self._skip_block_comment(match.start())
+            elif token == '#' or self._is_line_comment(match.start()):
+                self.position = self._skip_line(match.start())
+            else:
+                self.position = match.start() + 1
+
+    def _finish(self, end, kind, body):
+        statement = SQLStatement(self.buffer[self.start:end], kind, body, self.delimiter)
+        if kind == "delimiter":
+            self._set_delimiter(body)
+        self._reset_statement(end)
+        return statement
+
+    def _skip_comments(self, position):
+        """Position of the first character that is not whitespace or a comment"""
+        buffer = self.buffer
+        while True:
+            position = LEADING_SPACE.match(buffer, position).end()
+            if buffer.startswith('/*', position):
+                position = self._skip_block_comment(position)
+            elif buffer.startswith('#', position) or self._is_line_comment(position):
+                position = self._skip_line(position)
+            elif position + 2 > len(buffer) and buffer.startswith(('-', '/'), position) and not self.eof:
+                raise _NeedMoreInput
+            else:
+                return position
+
+    def _is_line_comment(self, position):
+        """'--' starts a comment only when followed by whitespace (or the end)"""
+        if not self.buffer.startswith('--', position):
+            return False
+        if position + 2 >= len(self.buffer):
+            if not self.eof:
+                raise _NeedMoreInput
+            return True
+        return self.buffer[position + 2].isspace()
+
+    def _skip_line(self, position):
+        end = self.buffer.find('\n', position)
+        if end < 0:
+            if not self.eof:
+                raise _NeedMoreInput
+            return len(self.buffer)
+        return end + 1
+
+    def _skip_block_comment(self, position):
+        end = self.buffer.find('*/', position + 2)
+        if end < 0:
+            if not self.eof:
+                raise _NeedMoreInput
+            return len(self.buffer)
+        return end + 2
+
+    def _skip_quoted(self, position, quote):
+        """Position after the string or quoted identifier opened at position"""
+        buffer = self.buffer
+        escapes = quote != '`'
+        index = position + 1
+        while True:
+            end = buffer.find(quote, index)
+            if end < 0:
+                if not self.eof:
+                    raise _NeedMoreInput
+                return len(buffer)
+            backslashes = 0
+            if escapes:
+                while buffer[end - 1 - backslashes] == '\\':
+                    backslashes += 1
+            if backslashes % 2:
+                index = end + 1
+                continue
+            if end + 1 == len(buffer) and not self.eof:
+                # A doubled quote may continue in the next chunk
+                raise _NeedMoreInput
+            if end + 1 < len(buffer) and buffer[end + 1] == quote:
+                index = end + 2
+                continue
+            return end + 1
+
+
+def iter_statements(chunks, delimiter=DEFAULT_DELIMITER):
+    """Yield SQLStatement tuples from an iterable of text chunks"""
+    scanner = StatementScanner(delimiter)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Streaming writer for generated SQL files
+Author: PAC Development Team
+Purpose: Write SQL batch by batch through a buffered file instead of building
+         the whole file as one string, so memory stays flat as data grows
+
+Usage:
+    with SQLFileWriter(path) as writer:
+        writer.write(header)
+        for batch in iter_batches(rows, 50):
+            writer.write(insert_statement(batch))
+            writer.end_batch()
+
+The file is written to <path>.tmp and renamed over <path> only when the
+block finishes without an exception (and discard() was not called), so a
+failed run never leaves a truncated SQL file behind.
+
+iter_byte_batches sizes multi-row INSERTs by bytes instead of row count, so
+every statement fits in the server's max_allowed_packet:
+
+    for batch in iter_byte_batches(rows, max_allowed_packet - PACKET_HEADROOM,
+                                   overhead=len(prefix.encode('utf-8'))):
+        writer.write(prefix + ',\n'.join(batch) + ';\n')
+"""
+
+import os
+from itertools import islice
+
+# Size of the in-memory write buffer (bytes)
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Smallest max_allowed_packet default still deployed (MySQL 5.7: 4 MB;
+# MariaDB 10.2+: 16 MB, MySQL 8.0: 64 MB)
+DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024
+# Bytes of a packet kept free for the protocol header and comments
+PACKET_HEADROOM = 1024
+ROW_SEPARATOR = ',\n'
+
+
+def iter_batches(items, batch_size):
+    """Yield lists of up to batch_size items from any iterable"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_byte_batches(rows, max_bytes, overhead=0):
+    """Yield lists of SQL row strings whose statement stays within max_bytes
+
+    overhead is the UTF-8 size of the statement around the rows (INSERT ...
+    VALUES and the terminator); rows are joined with ROW_SEPARATOR. Raises
+    ValueError for a row that does not fit into a statement on its own.
+    """
+    batch = []
+    size = overhead
+    for row in rows:
+        row_size = len(row.encode('utf-8')) + len(ROW_SEPARATOR)
+        if overhead + row_size > max_bytes:
+            raise ValueError(f"SQL row of {row_size} bytes does not fit in a {max_bytes}-byte statement")
+        if batch and size + row_size > max_bytes:
+            yield batch
+            batch = []
+            size = overhead
+        batch.append(row)
+        size += row_size
+    if batch:
+        yield batch
+
+
+class SQLFileWriter:
+    """Buffered UTF-8 SQL file writer that flushes after every completed batch"""
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE, newline=None):
+        self.path = str(path)
+        self.temp_path = self.path + ".tmp"
+        self.buffer_size = buffer_size
+        # newline='' keeps '\n' on every platform (needed for data files)
+        self.newline = newline
+        self.file = None
+        self.batches = 0
+        self.discarded = False
+
+    def __enter__(self):
+        self.file = open(self.temp_path, 'w', encoding='utf-8', buffering=self.buffer_size,
+                         newline=self.newline)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.file.close()
+        if exc_type is None and not self.discarded:
+            os.replace(self.temp_path, self.path)
+        else:
+            os.remove(self.temp_path)
+        return False
+
+    def write(self, text):
+        self.file.write(text)
+
+    def discard(self):
+        """Drop the output on exit and keep any existing file at path"""
+        self.discarded = True
+    
+    def end_batch(self):
+        """Mark the end of a batch and hand it to the OS"""
+        self.file.flush()
+        self.batches += 1
@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+MySQL to SQLite loader for the generated SQL files
+Author: PAC Development Team
+Purpose: Load create-all-tables.sql and the generated data files into an
+         in-process SQLite database, so schema, indexes and queries can be
+         checked offline without a MySQL server
+
+Usage:
+    connection = sqlite3.connect(':memory:', isolation_level=None)
+    loader = SQLiteLoader(connection)
+    loader.load_file(sql_dir / "create-all-tables.sql")
+    loader.executed, loader.rows, loader.skipped, loader.dropped, loader.errors
+
+Translated (the MySQL dialect these files use):
+    - CREATE TABLE: ENUM / SET / JSON columns become TEXT; UNSIGNED, ZEROFILL,
+      COMMENT, CHARACTER SET / COLLATE, ON UPDATE CURRENT_TIMESTAMP and the
+      table options are dropped; an AUTO_INCREMENT column becomes INTEGER
+      PRIMARY KEY AUTOINCREMENT; UNIQUE KEY becomes a UNIQUE constraint and
+      KEY / INDEX a CREATE INDEX (renamed to <table>_<name> when the name is
+      taken, since SQLite index names are global); FULLTEXT / SPATIAL indexes
+      and CHECK constraints are dropped
+    - ALTER TABLE ... ADD [UNIQUE] INDEX / KEY and ... AUTO_INCREMENT = n
+    - DROP TABLE / VIEW with several names, TRUNCATE, INSERT IGNORE,
+      ON DUPLICATE KEY UPDATE (an upsert with VALUES(col) as excluded.col),
+      backquoted identifiers, double-quoted strings, backslash escapes, NOW()
+    - INSERT ... VALUES with literal rows runs as one executemany() with
+      bound parameters instead of a parsed SQL text
+    - LOAD DATA [LOCAL] INFILE reads the file (relative to the directory of
+      the script, like running mysql from there) and inserts its rows:
+      FIELDS TERMINATED / ESCAPED BY, LINES TERMINATED BY, IGNORE n LINES,
+      REPLACE / IGNORE and a column list; ENCLOSED BY and SET are not supported
+Skipped (counted per reason): SET / USE / transaction statements (the
+caller owns the transaction), report SELECTs, views, triggers, functions
+and procedures. Statements SQLite rejects are recorded and loading goes on.
+"""
+
+import re
+import sqlite3
+from collections import Counter, namedtuple
+from pathlib import Path
+
+from sql_normalizer import parse_insert, row_values
+from sql_statements import STRING_ESCAPES, iter_chunks, iter_statements, unquote_string
+
+Token = namedtuple('Token', ['kind', 'text'])
+
+TOKEN = re.compile(r"""
+      (?P<string>'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*")
+    | (?P<identifier>`(?:[^`]|``)*`)
+    | (?P<comment>--(?:[ \t][^\n]*)?(?:\n|$)|\#[^\n]*|/\*.*?\*/)
+    | (?P<space>\s+)
+    | (?P<number>\d+(?:\.\d*)?(?:[eE][-+]?\d+)?(?![\w$]))
+    | (?P<word>[\w$]+)
+    | (?P<symbol>.)
+""", re.VERBOSE | re.DOTALL)
+
+NUMBER = re.compile(r'-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?')
+LITERAL_VALUES = {'NULL': None, 'TRUE': 1, 'FALSE': 0}
+
+SESSION_WORDS = {'SET', 'USE', 'START', 'BEGIN', 'COMMIT', 'ROLLBACK', 'LOCK', 'UNLOCK'}
+ROUTINE_WORDS = {'TRIGGER', 'FUNCTION', 'PROCEDURE', 'EVENT'}
+CREATE_KINDS = {'TABLE', 'VIEW', 'INDEX', 'UNIQUE', 'FULLTEXT', 'SPATIAL'} | ROUTINE_WORDS
+TEXT_TYPES = {'ENUM', 'SET', 'JSON'}
+# Column attributes SQLite has no use for: word -> number of following tokens to drop
+DROPPED_ATTRIBUTES = {'UNSIGNED': 0, 'ZEROFILL': 0, 'SIGNED': 0, 'COMMENT': 1,
+                      'COLLATE': 1, 'CHARSET': 1, 'AUTO_INCREMENT': 0}
+
+
+def quote_string(value):
+    """SQLite string literal of a Python string"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def quote_identifier(name):
+    """SQLite quoted identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def tokenize(sql):
+    """Tokens of a MySQL statement in SQLite spelling; whitespace and comments are dropped"""
+    tokens = []
+    for match in TOKEN.finditer(sql):
+        kind = match.lastgroup
+        if kind in ('space', 'comment'):
+            continue
+        text = match.group()
+        if kind == 'string':
+            text = quote_string(unquote_string(text))
+        elif kind == 'identifier':
+            text = quote_identifier(text[1:-1].replace('``', '`'))
+        tokens.append(Token(kind, text))
+    return tokens
+
+
+def split_load_data_line(line, terminator='\t', escape='\\'):
+    """Field values of one LOAD DATA line: escapes resolved, \\N as None"""
+    if not escape or escape not in line:
+        return line.split(terminator)
+    values = []
+    field = []
+    start = index = 0
+    while True:
+        if index == len(line) or line.startswith(terminator, index):
+            values.append(None if line[start:index] == escape + 'N' else ''.join(field))
+            if index == len(line):
+                return values
+            index += len(terminator)
+            start = index
+            field = []
+        elif line[index] == escape and index + 1 < len(line):
+            field.append(STRING_ESCAPES.get(line[index + 1], line[index + 1]))
+            index += 2
+        else:
+            field.append(line[index])
+            index += 1
+
+
+def join_tokens(tokens):
+    return ' '.join(token.text for token in tokens)
+
+
+def _word(tokens, index):
+    """Upper-case text of the word at index, '' for other tokens or past the end"""
+    if index < len(tokens) and tokens[index].kind == 'word':
+        return tokens[index].text.upper()
+    return ''
+
+
+def _name(token):
+    """Unquoted name of a word or quoted identifier"""
+    if token.kind == 'identifier':
+        return token.text[1:-1].replace('""', '"')
+    return token.text
+
+
+def _string(token):
+    """Value of a string token in SQLite spelling"""
+    if token.kind != 'string':
+        raise ValueError(f"expected a string, got {token.text}")
+    return token.text[1:-1].replace("''", "'")
+
+
+def _closing_paren(tokens, start):
+    """Index of the ')' matching the '(' at start"""
+    depth = 0
+    for index in range(start, len(tokens)):
+        if tokens[index].text == '(':
+            depth += 1
+        elif tokens[index].text == ')':
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError("unbalanced parentheses")
+
+
+def _split_top_level(tokens):
+    """Split a token list at commas outside parentheses"""
+    parts = [[]]
+    depth = 0
+    for token in tokens:
+        if token.text == ',' and depth == 0:
+            parts.append([])
+            continue
+        if token.text == '(':
+            depth += 1
+        elif token.text == ')':
+            depth -= 1
+        parts[-1].append(token)
+    return [part for part in parts if part]
+
+
+def _index_columns(tokens):
+    """SQLite column list of an index: prefix lengths and USING clauses removed"""
+    columns = []
+    for part in _split_top_level(tokens):
+        column = [part[0]]
+        index = 1
+        if index < len(part) and part[index].text == '(':
+            index = _closing_paren(part, index) + 1
+        column += [token for token in part[index:] if token.text.upper() in ('ASC', 'DESC')]
+        columns.append(join_tokens(column))
+    return '(' + ', '.join(columns) + ')'
+
+
+class SQLiteLoader:
+    """Translate MySQL statements and run them on a sqlite3 connection"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.directory = None       # LOAD DATA files are relative to the running script
+        self.index_names = set()
+        self.executed = 0
+        self.rows = 0
+        self.skipped = Counter()    # reason -> statements
+        self.dropped = Counter()    # clause -> occurrences (FULLTEXT index, ...)
+        self.errors = []            # (source, statement head, message)
+
+    def load_file(self, path):
+        """Run every statement of a SQL file"""
+        self.directory = Path(path).parent
+        with open(path, 'r', encoding='utf-8') as file:
+            self.load_statements(iter_statements(iter_chunks(file)), source=Path(path).name)
+
+    def load_statements(self, statements, source=''):
+        for statement in statements:
+            if statement.kind != "sql":
+                continue
+            try:
+                translated = self.translate(statement.body)
+            except (ValueError, IndexError) as e:
+                self._record_error(source, statement.body, f"cannot translate: {e}")
+                continue
+            except OSError as e:
+                self._record_error(source, statement.body, f"cannot read: {e}")
+                continue
+            for sql, rows in translated:
+                try:
+                    if rows is None:
+                        self.connection.execute(sql)
+                    else:
+                        self.connection.executemany(sql, rows)
+                        self.rows += len(rows)
+                    self.executed += 1
+                except sqlite3.Error as e:
+                    self._record_error(source, sql, str(e))
+
+    def _record_error(self, source, sql, message):
+        self.errors.append((source, ' '.join(sql.split())[:80], message))
+
+    def translate(self, body):
+        """[(sql, rows or None), ...] for one MySQL statement; [] when it is skipped"""
+        first = body.split(None, 1)[0].upper() if body.strip() else ''
+        if first in ('INSERT', 'REPLACE'):
+            bound = self._bound_insert(body)
+            if bound is not None:
+                return [bound]
+        tokens = tokenize(body)
+        first = _word(tokens, 0)
+        if first in SESSION_WORDS:
+            return self._skip("session and transaction statements")
+        if first in ('SELECT', 'SHOW', 'EXPLAIN'):
+            return self._skip("report queries")
+        if first == 'CREATE':
+            return self._create(tokens)
+        if first == 'DROP':
+            return self._drop(tokens)
+        if first == 'ALTER' and _word(tokens, 1) == 'TABLE':
+            return self._alter_table(tokens)
+        if first == 'TRUNCATE':
+            table = tokens[2] if _word(tokens, 1) == 'TABLE' else tokens[1]
+            return [(f"DELETE FROM {table.text}", None)]
+        if first in ('INSERT', 'REPLACE'):
+            return [(self._insert(tokens), None)]
+        if first == 'LOAD' and _word(tokens, 1) == 'DATA':
+            return [self._load_data(tokens)]
+        return [(self._expression(tokens), None)]
+
+    def _skip(self, reason):
+        self.skipped[reason] += 1
+        return []
+
+    def _drop_clause(self, clause):
+        self.dropped[clause] += 1
+
+    @staticmethod
+    def _expression(tokens):
+        """Statement text with MySQL-only functions replaced"""
+        result = []
+        index = 0
+        while index < len(tokens):
+            if (_word(tokens, index) in ('NOW', 'CURRENT_TIMESTAMP') and index + 2 < len(tokens)
+                    and tokens[index + 1].text == '(' and tokens[index + 2].text == ')'):
+                result.append(Token('word', 'CURRENT_TIMESTAMP'))
+                index += 3
+                continue
+            result.append(tokens[index])
+            index += 1
+        return join_tokens(result)
+
+    def _bound_insert(self, body):
+        """INSERT with literal rows as (parameterized sql, rows); None when not that simple"""
+        insert = parse_insert(body)
+        if insert is None:
+            return None
+        (ignore, table, columns), _, rows = insert
+        parameters = []
+        for row in rows:
+            values = []
+            for kind, value in row_values(row):
+                if kind == 'expr':
+                    if value in LITERAL_VALUES:
+                        value = LITERAL_VALUES[value]
+                    elif NUMBER.fullmatch(value):
+                        value = float(value) if any(c in value for c in '.eE') else int(value)
+                    else:
+                        # Functions and other expressions go through the SQL text path
+                        return None
+                values.append(value)
+            if len(values) != len(columns):
+                return None
+            parameters.append(values)
+        verb = "INSERT OR IGNORE" if ignore else "INSERT"
+        if body.split(None, 1)[0].upper() == 'REPLACE':
+            verb = "REPLACE"
+        sql = (f"{verb} INTO {quote_identifier(table)} "
+               f"({', '.join(quote_identifier(column) for column in columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        return sql, parameters
+
+    def _insert(self, tokens):
+        """INSERT text: IGNORE and ON DUPLICATE KEY UPDATE in SQLite spelling"""
+        if _word(tokens, 1) == 'IGNORE':
+            tokens = [Token('word', 'INSERT'), Token('word', 'OR'), Token('word', 'IGNORE')] + tokens[2:]
+        depth = 0
+        for index, token in enumerate(tokens):
+            if token.text == '(':
+                depth += 1
+            elif token.text == ')':
+                depth -= 1
+            elif (depth == 0 and _word(tokens, index) == 'ON' and _word(tokens, index + 1) == 'DUPLICATE'
+                  and _word(tokens, index + 2) == 'KEY' and _word(tokens, index + 3) == 'UPDATE'):
+                head = tokens[:index]
+                words = [_word(head, position) for position in range(len(head))]
+                if 'SELECT' in words and 'WHERE' not in words[words.index('SELECT'):]:
+                    # SQLite needs a WHERE before ON CONFLICT after a SELECT
+                    head.append(Token('word', 'WHERE TRUE'))
+                update = self._excluded_values(tokens[index + 4:])
+                return self._expression(head) + " ON CONFLICT DO UPDATE SET " + self._expression(update)
+        return self._expression(tokens)
+
+    @staticmethod
+    def _excluded_values(tokens):
+        """VALUES(col) of an ON DUPLICATE KEY UPDATE list as excluded.col"""
+        result = []
+        index = 0
+        while index < len(tokens):
+            if (_word(tokens, index) == 'VALUES' and index + 3 < len(tokens)
+                    and tokens[index + 1].text == '(' and tokens[index + 3].text == ')'):
+                result.append(Token('word', 'excluded.' + tokens[index + 2].text))
+                index += 4
+                continue
+            result.append(tokens[index])
+            index += 1
+        return result
+
+    def _load_data(self, tokens):
+        """LOAD DATA INFILE as (parameterized INSERT, rows of the file)"""
+        words = [_word(tokens, position) for position in range(len(tokens))]
+        index = words.index('INFILE')
+        path = _string(tokens[index + 1])
+        verb = {'REPLACE': "REPLACE", 'IGNORE': "INSERT OR IGNORE"}.get(words[index + 2], "INSERT")
+        index = words.index('TABLE', index) + 1
+        table = _name(tokens[index])
+        field_terminator, escape, line_terminator = '\t', '\\', '\n'
+        encoding = 'utf-8'
+        ignore_lines = 0
+        columns = None
+        section = 'FIELDS'
+        index += 1
+        while index < len(tokens):
+            word = words[index]
+            if word in ('FIELDS', 'COLUMNS', 'LINES'):
+                section = word
+            elif word in ('CHARACTER', 'CHARSET'):
+                index += 2 if word == 'CHARACTER' else 1
+                if not _name(tokens[index]).lower().startswith('utf8'):
+                    encoding = _name(tokens[index])
+            elif word == 'BY':
+                clause, value = words[index - 1], _string(tokens[index + 1])
+                if clause == 'TERMINATED' and section == 'LINES':
+                    line_terminator = value
+                elif clause == 'TERMINATED':
+                    field_terminator = value
+                elif clause == 'ESCAPED':
+                    escape = value
+                elif value:
+                    raise ValueError(f"{clause} BY is not supported")
+                index += 1
+            elif word == 'IGNORE' and words[index + 2:index + 3] in (['LINES'], ['ROWS']):
+                ignore_lines = int(tokens[index + 1].text)
+                index += 2
+            elif tokens[index].text == '(':
+                end = _closing_paren(tokens, index)
+                columns = [_name(part[0]) for part in _split_top_level(tokens[index + 1:end])]
+                index = end
+            elif word == 'SET':
+                raise ValueError("LOAD DATA ... SET is not supported")
+            index += 1
+        if columns is None:
+            columns = [row[1] for row in self.connection.execute(f"PRAGMA table_info({quote_identifier(table)})")]
+
+        with open((self.directory or Path()) / path, 'r', encoding=encoding, newline='') as file:
+            lines = file.read().split(line_terminator)
+        if lines and not lines[-1]:
+            lines.pop()
+        rows = [split_load_data_line(line, field_terminator, escape) for line in lines[ignore_lines:]]
+        sql = (f"{verb} INTO {quote_identifier(table)} "
+               f"({', '.join(quote_identifier(column) for column in columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        return sql, rows
+
+    def _create(self, tokens):
+        # Skip OR REPLACE, TEMPORARY, DEFINER = ..., ALGORITHM = ... up to the object kind
+        index = 1
+        while index < len(tokens) and _word(tokens, index) not in CREATE_KINDS:
+            index += 1
+        kind = _word(tokens, index)
+        if kind == 'TABLE':
+            return self._create_table(tokens, index + 1)
+        if kind == 'VIEW':
+            return self._skip("views")
+        if kind in ROUTINE_WORDS:
+            return self._skip("triggers, functions and procedures")
+        if kind in ('INDEX', 'UNIQUE', 'FULLTEXT', 'SPATIAL'):
+            return self._create_index_statement(tokens, index)
+        return [(self._expression(tokens), None)]
+
+    def _create_index_statement(self, tokens, index):
+        """CREATE [UNIQUE] INDEX name ON table (cols)"""
+        kind = _word(tokens, index)
+        if kind in ('FULLTEXT', 'SPATIAL'):
+            self._drop_clause(f"{kind} indexes")
+            return []
+        unique = kind == 'UNIQUE'
+        index += 2 if unique else 1
+        name = _name(tokens[index])
+        table = _name(tokens[index + 2])
+        start = index + 3
+        return [self._index(table, name, tokens[start + 1:_closing_paren(tokens, start)], unique)]
+
+    def _index(self, table, name, column_tokens, unique=False):
+        """CREATE INDEX statement; the name gets the table as prefix when already used"""
+        if not name or name.lower() in self.index_names:
+            name = f"{table}_{name or 'idx'}"
+            suffix = 2
+            base = name
+            while name.lower() in self.index_names:
+                name = f"{base}_{suffix}"
+                suffix += 1
+        self.index_names.add(name.lower())
+        sql = (f"CREATE {'UNIQUE ' if unique else ''}INDEX {quote_identifier(name)} "
+               f"ON {quote_identifier(table)} {_index_columns(column_tokens)}")
+        return sql, None
+
+    def _create_table(self, tokens, index):
+        if _word(tokens, index) == 'IF':
+            # IF NOT EXISTS
+            index += 3
+        table = _name(tokens[index])
+        open_paren = index + 1
+        if open_paren >= len(tokens) or tokens[open_paren].text != '(':
+            # CREATE TABLE ... LIKE / AS SELECT
+            return [(self._expression(tokens), None)]
+        close_paren = _closing_paren(tokens, open_paren)
+        definitions = _split_top_level(tokens[open_paren + 1:close_paren])
+
+        columns = []
+        constraints = []
+        indexes = []
+        auto_increment = None
+        for definition in definitions:
+            first = _word(definition, 0)
+            if first == 'CONSTRAINT':
+                # CONSTRAINT name PRIMARY KEY / UNIQUE / FOREIGN KEY ...
+                definition = definition[2:] if _word(definition, 1) not in (
+                    'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK') else definition[1:]
+                first = _word(definition, 0)
+            if first == 'PRIMARY':
+                constraints.append(('primary', definition))
+            elif first == 'UNIQUE':
+                constraints.append(('unique', definition))
+            elif first in ('KEY', 'INDEX'):
+                start = 1 if definition[1].text == '(' else 2
+                name = _name(definition[1]) if start == 2 else ''
+                indexes.append(self._index(table, name, definition[start + 1:_closing_paren(definition, start)]))
+            elif first in ('FULLTEXT', 'SPATIAL'):
+                self._drop_clause(f"{first} indexes")
+            elif first == 'CHECK':
+                self._drop_clause("CHECK constraints")
+            elif first == 'FOREIGN':
+                constraints.append(('foreign', definition))
+            else:
+                column, is_auto_increment = self._column(definition)
+                columns.append(column)
+                if is_auto_increment:
+                    auto_increment = _name(definition[0])
+
+        parts = list(columns)
+        for kind, definition in constraints:
+            if kind == 'primary':
+                key_start = next(i for i, token in enumerate(definition) if token.text == '(')
+                key = _split_top_level(definition[key_start + 1:_closing_paren(definition, key_start)])
+                if auto_increment and len(key) == 1 and _name(key[0][0]) == auto_increment:
+                    # Already the INTEGER PRIMARY KEY column
+                    continue
+                parts.append("PRIMARY KEY " + _index_columns(definition[key_start + 1:
+                                                                        _closing_paren(definition, key_start)]))
+            elif kind == 'unique':
+                key_start = next(i for i, token in enumerate(definition) if token.text == '(')
+                parts.append("UNIQUE " + _index_columns(definition[key_start + 1:
+                                                                   _closing_paren(definition, key_start)]))
+            else:
+                parts.append(join_tokens(definition))
+
+        create = f"CREATE TABLE {quote_identifier(table)} (\n    " + ",\n    ".join(parts) + "\n)"
+        return [(create, None)] + indexes
+
+    def _column(self, definition):
+        """(SQLite column definition, is AUTO_INCREMENT) of a MySQL column definition"""
+        name = definition[0]
+        type_name = _word(definition, 1)
+        index = 2
+        type_tokens = [definition[1]]
+        if index < len(definition) and definition[index].text == '(':
+            end = _closing_paren(definition, index)
+            if type_name not in TEXT_TYPES:
+                type_tokens += definition[index:end + 1]
+            index = end + 1
+        if type_name in TEXT_TYPES:
+            type_tokens = [Token('word', 'TEXT')]
+
+        attributes = []
+        words = [_word(definition, position) for position in range(len(definition))]
+        is_auto_increment = 'AUTO_INCREMENT' in words
+        while index < len(definition):
+            word = words[index]
+            if word in DROPPED_ATTRIBUTES:
+                index += 1 + DROPPED_ATTRIBUTES[word]
+            elif word == 'CHARACTER' and words[index + 1:index + 2] == ['SET']:
+                index += 3
+            elif word == 'ON' and words[index + 1:index + 2] == ['UPDATE']:
+                # ON UPDATE CURRENT_TIMESTAMP[(n)]
+                index += 3
+                if index < len(definition) and definition[index].text == '(':
+                    index = _closing_paren(definition, index) + 1
+            elif word == 'PRIMARY' and is_auto_increment:
+                index += 2
+            elif word == 'CHECK':
+                self._drop_clause("CHECK constraints")
+                index = _closing_paren(definition, index + 1) + 1
+            else:
+                attributes.append(definition[index])
+                index += 1
+
+        if is_auto_increment:
+            type_tokens = [Token('word', 'INTEGER PRIMARY KEY AUTOINCREMENT')]
+        return ' '.join([name.text, join_tokens(type_tokens), self._expression(attributes)]).rstrip(), \
+            is_auto_increment
+
+    def _drop(self, tokens):
+        kind = _word(tokens, 1)
+        if kind in ROUTINE_WORDS:
+            return self._skip("triggers, functions and procedures")
+        if kind == 'INDEX':
+            return [(f"DROP INDEX IF EXISTS {tokens[2].text}", None)]
+        if kind not in ('TABLE', 'VIEW'):
+            return [(self._expression(tokens), None)]
+        index = 2
+        if _word(tokens, index) == 'IF':
+            index += 2
+        names = [part[0].text for part in _split_top_level(tokens[index:])
+                 if _word(part, 0) not in ('CASCADE', 'RESTRICT')]
+        return [(f"DROP {kind} IF EXISTS {name}", None) for name in names]
+
+    def _alter_table(self, tokens):
+        table = _name(tokens[2])
+        statements = []
+        for action in _split_top_level(tokens[3:]):
+            first = _word(action, 0)
+            if first == 'AUTO_INCREMENT':
+                value = int(action[-1].text)
+                statements.append((f"DELETE FROM sqlite_sequence WHERE name = {quote_string(table)}", None))
+                if value > 1:
+                    statements.append((f"INSERT INTO sqlite_sequence (name, seq) "
+                                       f"VALUES ({quote_string(table)}, {value - 1})", None))
+            elif first == 'ADD' and _word(action, 1) in ('INDEX', 'KEY', 'UNIQUE'):
+                unique = _word(action, 1) == 'UNIQUE'
+                index = 2
+                if unique and _word(action, index) in ('INDEX', 'KEY'):
+                    index += 1
+                name = ''
+                if action[index].text != '(':
+                    name = _name(action[index])
+                    index += 1
+                statements.append(self._index(table, name, action[index + 1:_closing_paren(action, index)],
+                                              unique))
+            elif first == 'ADD' and _word(action, 1) in ('FULLTEXT', 'SPATIAL'):
+                self._drop_clause(f"{_word(action, 1)} indexes")
+            else:
+                statements.append((f"ALTER TABLE {quote_identifier(table)} {join_tokens(action)}", None))
+        return statements
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Helpers to write per-code JSON shards for the static data files
+Author: PAC Development Team
+Purpose: Split group/characteristics data into static/<kind>/<CODE>.json files
+         plus an index.json with content hashes, so a page can fetch only the
+         entry for the Holland code it renders
+"""
+
+import hashlib
+import json
+import os
+import re
+
+# Codes are used as file names, keep them to a safe character set
+SAFE_CODE_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+INDEX_FILE_NAME = "index.json"
+
+# Length of the hex content hash stored in index.json (also usable as ?v=)
+HASH_LENGTH = 16
+
+
+def encode_json(data, compact=True):
+    """Serialize data to UTF-8 JSON bytes"""
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+    return text.encode('utf-8')
+
+
+def content_hash(payload):
+    """Short SHA-256 hex digest of a payload"""
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+
+def save_code_shards(records, shard_dir, source, code_field='code'):
+    """Write one <CODE>.json per record and an index.json listing them
+
+    Returns the index dict. Shards left over from codes that no longer exist
+    are removed so the directory always matches the index.
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+
+    shards = {}
+    for record in records:
+        code = record.get(code_field, '')
+        if not SAFE_CODE_PATTERN.match(code):
+            print(f"[WARNING] Skipping shard with unusable code: {code!r}")
+            continue
+        if code in shards:
+            print(f"[WARNING] Duplicate code {code}, keeping the last entry")
+        shards[code] = record
+
+    index_codes = {}
+    for code, record in shards.items():
+        payload = encode_json(record)
+        file_name = f"{code}.json"
+        with open(os.path.join(shard_dir, file_name), 'wb') as file:
+            file.write(payload)
+        index_codes[code] = {
+            "file": file_name,
+            "hash": content_hash(payload),
+            "bytes": len(payload)
+        }
+
+    expected_files = {entry["file"] for entry in index_codes.values()} | {INDEX_FILE_NAME}
+    for file_name in os.listdir(shard_dir):
+        if file_name.endswith('.json') and file_name not in expected_files:
+            os.remove(os.path.join(shard_dir, file_name))
+
+    index = {
+        "metadata": {
+            "version": "1.0",
+            "source": source,
+            "total_codes": len(index_codes),
+            "description": "Per-code shards; fetch <code>.json?v=<hash>"
+        },
+        "codes": index_codes
+    }
+    with open(os.path.join(shard_dir, INDEX_FILE_NAME), 'wb') as file:
+        file.write(encode_json(index, compact=False))
+
+    return index
@@ -0,0 +1,176 @@
+<?php
+
+/**
+ * Benchmark CareerSuggestionEngine: database path vs generated jobs index file
+ *
+ * Nạp jobs của một file jobs-by-code.php vào bảng `jobs` của database benchmark
+ * (KHÔNG dùng pac_db), rồi đo thời gian gợi ý nghề cho cả 120 Holland Code:
+ *   - db:   mỗi tầng truy vấn MySQL (SELECT * FROM jobs ... LIMIT ?)
+ *   - file: require file jobs index (opcache), không truy vấn database
+ * Kết quả in ra dạng JSON. Thường được gọi bởi tools/benchmark_suggestions.py.
+ *
+ * Usage:
+ *   php -d opcache.enable_cli=1 tools/suggestion_benchmark.php --index=api/quiz/generated/jobs-by-code.php
+ *       [--iterations=5] [--dsn="mysql:host=localhost;dbname=pac_bench;charset=utf8mb4"]
+ *       [--user=root] [--password=]
+ */
+
+require_once __DIR__ . '/../api/quiz/CareerSuggestionEngine.php';
+
+/**
+ * Database adapter tối thiểu cho CareerSuggestionEngine (giống DatabaseAdapter trong get-result.php)
+ */
+class BenchmarkDatabaseAdapter {
+    private $pdo;
+    public $queries = 0;
+
+    public function __construct($pdo) {
+        $this->pdo = $pdo;
+    }
+
+    public function fetchAll($sql, $params = []) {
+        $this->queries++;
+        $stmt = $this->pdo->prepare($sql);
+        $stmt->execute($params);
+        return $stmt->fetchAll(PDO::FETCH_ASSOC);
+    }
+}
+
+/**
+ * Tạo lại bảng jobs của database benchmark từ jobs index
+ */
+function loadJobsTable($pdo, $jobsByCode) {
+    $pdo->exec("DROP TABLE IF EXISTS jobs");
+    $pdo->exec("CREATE TABLE jobs (
+        id INT PRIMARY KEY,
+        job_name VARCHAR(255) NOT NULL,
+        job_name_en VARCHAR(255) NULL,
+        holland_code VARCHAR(3) NOT NULL,
+        job_group VARCHAR(100) NULL,
+        activities_code VARCHAR(255) NULL,
+        capacity VARCHAR(255) NULL,
+        essential_ability VARCHAR(255) NULL,
+        supplementary_ability VARCHAR(255) NULL,
+        education_level TINYINT NULL,
+        work_environment VARCHAR(255) NULL,
+        work_style VARCHAR(255) NULL,
+        work_value VARCHAR(100) NULL,
+        job_description TEXT NULL,
+        specializations JSON NULL,
+        main_tasks JSON NULL,
+        work_areas JSON NULL,
+        is_active BOOLEAN DEFAULT TRUE,
+        INDEX idx_jobs_holland_code (holland_code)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci");
+
+    $jobs = array_merge(...array_values($jobsByCode));
+    usort($jobs, fn($a, $b) => $a['id'] <=> $b['id']);
+
+    $columns = array_keys($jobs[0]);
+    $placeholders = '(' . implode(', ', array_fill(0, count($columns), '?')) . ')';
+    $pdo->beginTransaction();
+    foreach (array_chunk($jobs, 200) as $batch) {
+        $sql = "INSERT INTO jobs (" . implode(', ', $columns) . ") VALUES "
+            . implode(', ', array_fill(0, count($batch), $placeholders));
+        $params = [];
+        foreach ($batch as $job) {
+            foreach ($columns as $column) {
+                $params[] = $job[$column];
+            }
+        }
+        $pdo->prepare($sql)->execute($params);
+    }
+    $pdo->commit();
+
+    return count($jobs);
+}
+
+/**
+ * Thời gian (ms) của mỗi lần gợi ý: tạo engine + thuật toán 4 tầng cho một Holland Code
+ */
+function measure($createEngine, $hollandCodes, $iterations) {
+    $findJobs = new ReflectionMethod(CareerSuggestionEngine::class, 'findJobsByHollandCode');
+    $findJobs->setAccessible(true);
+    $cacheEnabled = new ReflectionProperty(CareerSuggestionEngine::class, 'cacheEnabled');
+    $cacheEnabled->setAccessible(true);
+
+    $timings = [];
+    for ($i = 0; $i < $iterations; $i++) {
+        foreach ($hollandCodes as $hollandCode) {
+            $start = hrtime(true);
+            $engine = $createEngine();
+            // So sánh truy vấn trực tiếp, không dùng bảng job_suggestion_cache
+            $cacheEnabled->setValue($engine, false);
+            $findJobs->invoke($engine, $hollandCode);
+            $timings[] = (hrtime(true) - $start) / 1e6;
+        }
+    }
+    sort($timings);
+
+    $percentile = fn($p) => round($timings[min(count($timings) - 1, (int) floor($p * count($timings)))], 4);
+    return [
+        'calls' => count($timings),
+        'mean_ms' => round(array_sum($timings) / count($timings), 4),
+        'p50_ms' => $percentile(0.50),
+        'p95_ms' => $percentile(0.95),
+        'p99_ms' => $percentile(0.99),
+        'max_ms' => round(end($timings), 4),
+    ];
+}
+
+$options = getopt('', ['index:', 'iterations::', 'dsn::', 'user::', 'password::']);
+if (empty($options['index']) || !is_file($options['index'])) {
+    fwrite(STDERR, "Usage: php suggestion_benchmark.php --index=<jobs-by-code.php> [--iterations=5] [--dsn=...]\n");
+    exit(2);
+}
+$indexFile = realpath($options['index']);
+$iterations = (int) ($options['iterations'] ?? 5);
+$dsn = $options['dsn'] ?? 'mysql:host=localhost;dbname=pac_bench;charset=utf8mb4';
+
+$letters = str_split('RIASEC');
+$hollandCodes = [];
+foreach ($letters as $first) {
+    foreach ($letters as $second) {
+        foreach ($letters as $third) {
+            if ($first !== $second && $first !== $third && $second !== $third) {
+                $hollandCodes[] = $first . $second . $third;
+            }
+        }
+    }
+}
+
+try {
+    $pdo = new PDO($dsn, $options['user'] ?? 'root', $options['password'] ?? '', [
+        PDO::ATTR_ERRMODE => PDO::ERRMODE_EXCEPTION,
+        PDO::ATTR_DEFAULT_FETCH_MODE => PDO::FETCH_ASSOC,
+        PDO::ATTR_EMULATE_PREPARES => false,
+    ]);
+} catch (PDOException $e) {
+    fwrite(STDERR, "Database connection failed: " . $e->getMessage() . "\n");
+    exit(1);
+}
+
+$jobCount = loadJobsTable($pdo, require $indexFile);
+$database = new BenchmarkDatabaseAdapter($pdo);
+
+// Chạy một lần để làm nóng opcache và buffer pool của MySQL
+measure(fn() => new CareerSuggestionEngine($database, $indexFile), $hollandCodes, 1);
+measure(fn() => new CareerSuggestionEngine($database, false), $hollandCodes, 1);
+
+$database->queries = 0;
+$file = measure(fn() => new CareerSuggestionEngine($database, $indexFile), $hollandCodes, $iterations);
+$file['queries'] = $database->queries;
+
+$database->queries = 0;
+$db = measure(fn() => new CareerSuggestionEngine($database, false), $hollandCodes, $iterations);
+$db['queries'] = $database->queries;
+
+echo json_encode([
+    'jobs' => $jobCount,
+    'index_bytes' => filesize($indexFile),
+    'iterations' => $iterations,
+    'opcache' => function_exists('opcache_get_status') && (bool) opcache_get_status(false),
+    'db' => $db,
+    'file' => $file,
+    'speedup' => $file['mean_ms'] > 0 ? round($db['mean_ms'] / $file['mean_ms'], 2) : null,
+]), "\n";
@@ -0,0 +1,87 @@
+<?php
+
+/**
+ * Parity dump for tools/suggestion_ranking.py --parity
+ *
+ * Chạy CareerSuggestionEngine thật (thuật toán 4 tầng, không dùng cache) trên
+ * danh sách jobs của một fixture JSON và in kết quả của cả 120 Holland Code:
+ *   {"AEI": [[job_id, star_rating, match_type, match_score], ...], ...}
+ *
+ * Usage: php tools/suggestion_parity.php tools/fixtures/suggestion-jobs.json
+ */
+
+require_once __DIR__ . '/../api/quiz/CareerSuggestionEngine.php';
+
+/**
+ * Database adapter giả: trả về jobs của fixture theo thứ tự id như MySQL
+ */
+class FixtureJobsDatabase {
+
+    private $jobs;
+
+    public function __construct($jobs) {
+        usort($jobs, fn($a, $b) => $a['id'] <=> $b['id']);
+        $this->jobs = $jobs;
+    }
+
+    public function fetchAll($sql, $params = []) {
+        if (strpos($sql, 'FROM jobs') === false) {
+            throw new Exception("Unexpected query: $sql");
+        }
+        [$hollandCode, $limit] = $params;
+        $rows = [];
+        foreach ($this->jobs as $job) {
+            if ($job['holland_code'] === $hollandCode && ($job['is_active'] ?? true)) {
+                $rows[] = $job + [
+                    'job_name' => 'Job ' . $job['id'],
+                    'job_name_en' => null,
+                    'job_group' => null,
+                    'essential_ability' => null,
+                    'supplementary_ability' => null,
+                    'work_environment' => null,
+                    'work_style' => null,
+                    'education_level' => null,
+                    'job_description' => null,
+                    'work_areas' => null,
+                    'main_tasks' => null,
+                    'specializations' => null,
+                ];
+                if (count($rows) >= $limit) break;
+            }
+        }
+        return $rows;
+    }
+}
+
+if ($argc < 2) {
+    fwrite(STDERR, "Usage: php suggestion_parity.php <fixture.json>\n");
+    exit(2);
+}
+
+$fixture = json_decode(file_get_contents($argv[1]), true);
+// false: không dùng api/quiz/generated/jobs-by-code.php, chỉ dùng jobs của fixture
+$engine = new CareerSuggestionEngine(new FixtureJobsDatabase($fixture['jobs']), false);
+
+// So sánh với thuật toán gốc nên tắt cache
+$cacheEnabled = new ReflectionProperty(CareerSuggestionEngine::class, 'cacheEnabled');
+$cacheEnabled->setAccessible(true);
+$cacheEnabled->setValue($engine, false);
+
+$findJobs = new ReflectionMethod(CareerSuggestionEngine::class, 'findJobsByHollandCode');
+$findJobs->setAccessible(true);
+
+$letters = str_split('RIASEC');
+$rankings = [];
+foreach ($letters as $first) {
+    foreach ($letters as $second) {
+        foreach ($letters as $third) {
+            if ($first === $second || $first === $third || $second === $third) continue;
+            $hollandCode = $first . $second . $third;
+            $rankings[$hollandCode] = array_map(function($job) {
+                return [(int) $job['job_id'], $job['star_rating'], $job['match_type'], (float) $job['match_score']];
+            }, $findJobs->invoke($engine, $hollandCode));
+        }
+    }
+}
+
+echo json_encode($rankings), "\n";
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Python port of the CareerSuggestionEngine tiering
+Author: PAC Development Team
+Purpose: Rank jobs for a Holland code exactly like
+         api/quiz/CareerSuggestionEngine.php::findJobsByHollandCode, so the
+         jobs migration can precompute the suggestions for every code
+
+Tiers (same limits and scores as the PHP engine):
+    5 stars  exact code             up to 5 jobs          score 100
+    4 stars  other permutations     5 per code, max 15    score 95 - 3 * index
+    3 stars  2-letter prefixes      5 per code, max 20    score 75 - 2.5 * index
+    2 stars  single letters         4 per letter, max 10  score 55 - 5 * index
+The result is sorted by star rating, then match score (both descending),
+keeping the tier order for ties like PHP 8's stable usort.
+
+The engine's queries have no ORDER BY; MySQL returns the rows in id order
+(index on holland_code, then primary key), which is what job_ids_by_code must
+hold.
+
+Usage:
+    python suggestion_ranking.py AEI             # print the ranking of a fixture
+    python suggestion_ranking.py --parity        # compare with the PHP engine (needs php)
+"""
+
+import argparse
+import bisect
+import json
+import shutil
+import subprocess
+import sys
+from collections import namedtuple
+from itertools import permutations
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+FIXTURE_FILE = SCRIPT_DIR / "fixtures" / "suggestion-jobs.json"
+PARITY_SCRIPT = SCRIPT_DIR / "suggestion_parity.php"
+
+HOLLAND_LETTERS = "RIASEC"
+
+# CareerSuggestionEngine::$maxJobsPerStar
+MAX_JOBS_PER_STAR = {5: 5, 4: 15, 3: 20, 2: 10}
+# LIMIT of the per-code queries in the permutation, two-letter and single-letter tiers
+PERMUTATION_QUERY_LIMIT = 5
+TWO_CHAR_QUERY_LIMIT = 5
+SINGLE_CHAR_QUERY_LIMIT = 4
+
+# Most jobs a single code can contribute to any ranking
+MAX_IDS_PER_CODE = max(MAX_JOBS_PER_STAR[5], PERMUTATION_QUERY_LIMIT,
+                       TWO_CHAR_QUERY_LIMIT, SINGLE_CHAR_QUERY_LIMIT)
+
+Suggestion = namedtuple('Suggestion', ['job_id', 'star_rating', 'match_type', 'match_score'])
+
+# Columns CareerSuggestionEngine::saveSuggestedJobs writes to quiz_suggested_jobs, in its order
+SAVED_JOB_COLUMNS = ["result_id", "job_id", "job_name", "job_name_en", "holland_code",
+                     "star_rating", "match_type", "match_score", "job_group",
+                     "essential_ability", "supplementary_ability", "work_environment",
+                     "work_style", "education_level", "job_description",
+                     "work_areas", "main_tasks", "specializations", "is_highlighted", "sort_order"]
+
+
+def all_holland_codes():
+    """The 120 ordered three-letter codes over R/I/A/S/E/C"""
+    return [''.join(letters) for letters in permutations(HOLLAND_LETTERS, 3)]
+
+
+def add_job_id(job_ids_by_code, holland_code, job_id):
+    """Record a job, keeping the MAX_IDS_PER_CODE lowest ids of its code in id order"""
+    ids = job_ids_by_code.setdefault(holland_code, [])
+    if len(ids) < MAX_IDS_PER_CODE or job_id < ids[-1]:
+        bisect.insort(ids, job_id)
+        del ids[MAX_IDS_PER_CODE:]
+
+
+def rank_suggestions(holland_code, job_ids_by_code):
+    """Ranked Suggestion list for a code; job_ids_by_code maps code -> active ids in id order"""
+    letters = list(holland_code)
+    # Same order as CareerSuggestionEngine::permutationCalculator
+    permutation_codes = [''.join(permutation) for permutation in permutations(letters)]
+
+    def fetch(code, limit):
+        return job_ids_by_code.get(code, [])[:limit]
+
+    # Tier 1: exact match
+    suggestions = [Suggestion(job_id, 5, 'exact', 100.0)
+                   for job_id in fetch(holland_code, MAX_JOBS_PER_STAR[5])]
+
+    # Tier 2: permutations (the exact code is skipped but keeps its index)
+    tier = []
+    for index, code in enumerate(permutation_codes):
+        if code == holland_code:
+            continue
+        tier += [Suggestion(job_id, 4, 'permutation', round(95.0 - index * 3, 2))
+                 for job_id in fetch(code, PERMUTATION_QUERY_LIMIT)]
+        if len(tier) >= MAX_JOBS_PER_STAR[4]:
+            break
+    suggestions += tier[:MAX_JOBS_PER_STAR[4]]
+
+    # Tier 3: distinct two-letter prefixes of the permutations
+    two_char_codes = list(dict.fromkeys(code[:2] for code in permutation_codes))
+    tier = []
+    for index, code in enumerate(two_char_codes):
+        tier += [Suggestion(job_id, 3, 'two_char', round(75.0 - index * 2.5, 2))
+                 for job_id in fetch(code, TWO_CHAR_QUERY_LIMIT)]
+        if len(tier) >= MAX_JOBS_PER_STAR[3]:
+            break
+    suggestions += tier[:MAX_JOBS_PER_STAR[3]]
+
+    # Tier 4: single letters
+    tier = []
+    for index, letter in enumerate(letters):
+        tier += [Suggestion(job_id, 2, 'single_char', round(55.0 - index * 5, 2))
+                 for job_id in fetch(letter, SINGLE_CHAR_QUERY_LIMIT)]
+    suggestions += tier[:MAX_JOBS_PER_STAR[2]]
+
+    return sorted(suggestions, key=lambda s: (-s.star_rating, -s.match_score))
+
+
+def saved_job_values(result_id, sort_order, suggestion, job):
+    """{column: value} saveSuggestedJobs writes for one suggestion; job maps jobs columns to values"""
+    values = {"result_id": result_id, "job_id": suggestion.job_id, "star_rating": suggestion.star_rating,
+              "match_type": suggestion.match_type, "match_score": suggestion.match_score,
+              # buildJobSuggestion highlights 4 and 5 star jobs
+              "is_highlighted": int(suggestion.star_rating >= 4), "sort_order": sort_order}
+    for column in SAVED_JOB_COLUMNS:
+        if column not in values:
+            values[column] = job[column]
+    return values
+
+
+def rank_all_codes(job_ids_by_code):
+    """{code: ranked suggestions} for all 120 codes"""
+    return {code: rank_suggestions(code, job_ids_by_code) for code in all_holland_codes()}
+
+
+def load_fixture(path=FIXTURE_FILE):
+    """job_ids_by_code of the active jobs in a fixture file, in id order"""
+    with open(path, 'r', encoding='utf-8') as file:
+        jobs = json.load(file)["jobs"]
+    job_ids_by_code = {}
+    for job in sorted(jobs, key=lambda job: job["id"]):
+        if job.get("is_active", True):
+            add_job_id(job_ids_by_code, job["holland_code"], job["id"])
+    return job_ids_by_code
+
+
+def run_php_engine(fixture_path=FIXTURE_FILE):
+    """Rankings of the real PHP engine for all codes; None when php is not installed"""
+    php = shutil.which("php")
+    if not php:
+        return None
+    completed = subprocess.run([php, str(PARITY_SCRIPT), str(fixture_path)],
+                               capture_output=True, text=True, encoding='utf-8', check=True)
+    return json.loads(completed.stdout)
+
+
+def check_parity(fixture_path=FIXTURE_FILE):
+    """Compare the Python and PHP rankings on a fixture; None when php is missing"""
+    php_rankings = run_php_engine(fixture_path)
+    if php_rankings is None:
+        return None
+
+    python_rankings = rank_all_codes(load_fixture(fixture_path))
+    mismatches = 0
+    for code, suggestions in python_rankings.items():
+        expected = [tuple(row) for row in php_rankings.get(code, [])]
+        actual = [tuple(suggestion) for suggestion in suggestions]
+        if actual != expected:
+            mismatches += 1
+            print(f"[MISMATCH] {code}")
+            print(f"   php:    {expected}")
+            print(f"   python: {actual}")
+    print(f"[INFO] Compared {len(python_rankings)} codes, {mismatches} mismatch(es)")
+    return mismatches == 0
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Python port of the career suggestion tiering")
+    parser.add_argument('codes', nargs='*', help='Holland codes to rank (e.g. AEI)')
+    parser.add_argument('--fixture', default=str(FIXTURE_FILE),
+                        help='jobs fixture JSON (default: tools/fixtures/suggestion-jobs.json)')
+    parser.add_argument('--parity', action='store_true',
+                        help='compare all 120 rankings with CareerSuggestionEngine.php')
+    args = parser.parse_args()
+
+    if args.parity:
+        result = check_parity(args.fixture)
+        if result is None:
+            print("[ERROR] php executable not found, parity check cannot run")
+            sys.exit(2)
+        if not result:
+            print("[ERROR] Python ranking differs from CareerSuggestionEngine.php")
+            sys.exit(1)
+        print("[SUCCESS] Python ranking matches CareerSuggestionEngine.php")
+        return
+
+    job_ids_by_code = load_fixture(args.fixture)
+    for code in args.codes or all_holland_codes()[:1]:
+        print(f"[{code.upper()}]")
+        for position, suggestion in enumerate(rank_suggestions(code.upper(), job_ids_by_code)):
+            print(f"   {position:2d}. job {suggestion.job_id:<5} {suggestion.star_rating}* "
+                  f"{suggestion.match_type:12s} {suggestion.match_score:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Synthetic input generators for the data tools
+Author: PAC Development Team
+Purpose: Produce group.ts, characteristics.ts, suggestJobs.ts, questions.json
+         and SQL inputs at a multiple of the current data size, so the tools
+         can be benchmarked at 1x, 10x, 100x and 1000x
+
+Usage:
+    python synthetic_data.py OUTPUT_DIR --scale 10 [--seed 42]
+
+OUTPUT_DIR receives the same layout as the project root (old-project/... and
+sql/...), so it can be passed as `root` to build_pipeline.run_pipeline().
+The output is deterministic for a given scale and seed. Records are written
+one at a time, so generating large scales does not need much memory.
+
+At 1x the record counts match the current data (BASE_COUNTS) and the files
+are within about 25% of the real sizes (group.ts ~22 KB, characteristics.ts
+~72 KB, suggestJobs.ts ~390 KB, questions.json ~140 KB). At 1000x
+characteristics.ts is larger than MAX_INPUT_BYTES of
+extract-characteristics-data.py.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+CONSTANTS_DIR = Path("old-project") / "backend-app" / "src" / "constants"
+
+SCALES = (1, 10, 100, 1000)
+DEFAULT_SEED = 42
+
+# Record counts of the current data (1x)
+BASE_COUNTS = {
+    "groups": 6,
+    "characteristics": 30,
+    "jobs": 200,
+    "questions": 668,
+}
+
+# Hand-written SQL files copied unchanged into the synthetic tree
+STATIC_SQL_FILES = ["create-all-tables.sql", "sample-data.sql"]
+
+HOLLAND_LETTERS = "RIASEC"
+
+WORDS = (
+    "công việc nghề nghiệp phát triển sáng tạo kỹ năng quản lý dự án nghiên cứu "
+    "phân tích dữ liệu thiết kế sản phẩm dịch vụ khách hàng giao tiếp con người "
+    "hệ thống kỹ thuật môi trường làm việc tổ chức sự kiện chương trình hoạt động "
+    "đánh giá chất lượng điều phối hướng dẫn đào tạo giảng dạy chăm sóc sức khỏe "
+    "tài chính kế toán kinh doanh tiếp thị truyền thông nghệ thuật âm nhạc hội họa "
+    "xây dựng vận hành máy móc công cụ thiết bị nông nghiệp thể thao khoa học "
+    "toán học ngôn ngữ văn hóa xã hội pháp luật an toàn trách nhiệm đáng tin cậy "
+    "độc lập chủ động kiên trì tỉ mỉ chính xác linh hoạt thực tế lý thuyết"
+).split()
+
+SHORT_VALUES = [
+    "Phân tích và xử lý", "Làm việc với con người", "Ngôn ngữ", "Thành tựu",
+    "Cấu trúc ổn định, rõ ràng", "Độc lập", "Hỗ trợ", "Sáng tạo", "Kỹ thuật",
+    "Công việc yêu cầu tính đúng đắn, trách nhiệm và sự đáng tin cậy",
+]
+
+
+def _sentence(rng, min_words, max_words):
+    """Random Vietnamese-looking sentence; some contain quotes to exercise escaping"""
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    words[0] = words[0].capitalize()
+    text = ' '.join(words)
+    roll = rng.random()
+    if roll < 0.05:
+        text += " của 'nhà tuyển dụng'"
+    elif roll < 0.10:
+        text += ' (được ví như “nhân vật đinh”)'
+    return text
+
+
+def _paragraph(rng, sentences):
+    return ' '.join(_sentence(rng, 8, 20) + '.' for _ in range(sentences))
+
+
+def _ts_string(text):
+    """Single-quoted TypeScript string literal"""
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _ts_array(items):
+    return '[' + ', '.join(_ts_string(item) for item in items) + ']'
+
+
+def _numbered_code(base, index, period):
+    """Base code for the first `period` records, then base + a counter"""
+    return base if index < period else f"{base}{index // period}"
+
+
+def _write_ts_records(path, declaration, records):
+    """Write `export const NAME = [ ... ];` one record (list of lines) at a time"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(f"// synthetic data\nexport const {declaration} = [\n")
+        for lines in records:
+            file.write("  {\n" + ''.join(f"    {line},\n" for line in lines) + "  },\n")
+        file.write("];\n")
+
+
+def _group_records(count, rng):
+    for index in range(count):
+        letter = HOLLAND_LETTERS[index % 6]
+        yield [
+            f"characterName: {_ts_string(_sentence(rng, 1, 3))}",
+            f"code: {_ts_string(_numbered_code(letter, index, 6))}",
+            f"description: {_ts_string(_paragraph(rng, 5))}",
+            f"explain: {_ts_string(_paragraph(rng, 14))}",
+            f"group: {_ts_string(_sentence(rng, 2, 3))}",
+            f"hollandName: {_ts_string(_sentence(rng, 1, 2))}",
+            f"id: {_ts_string(str(index + 1))}",
+            f"trendDescription: {_ts_string(_paragraph(rng, 4))}",
+            f"favoriteActivity: {_ts_array(_sentence(rng, 3, 8) for _ in range(5))}",
+            f"highlights: {_ts_array(_sentence(rng, 1, 3) for _ in range(9))}",
+            f"jobs: {_ts_array(_sentence(rng, 2, 5) for _ in range(15))}",
+            f"keywords: {_ts_array(_sentence(rng, 1, 2) for _ in range(9))}",
+            f"majors: {_ts_array(_sentence(rng, 2, 4) for _ in range(10))}",
+            f"needValue: {_ts_array(_sentence(rng, 1, 3) for _ in range(2))}",
+        ]
+
+
+def _characteristics_records(count, rng):
+    pairs = [a + b for a in HOLLAND_LETTERS for b in HOLLAND_LETTERS if a != b]
+    for index in range(count):
+        yield [
+            f"code: {_ts_string(_numbered_code(pairs[index % 30], index, 30))}",
+            f"description: {_ts_string(_paragraph(rng, 6))}",
+            f"jobs: [\n" + ''.join(f"      {_ts_string(_sentence(rng, 8, 20))},\n"
+                                   for _ in range(rng.randint(14, 22))) + "    ]",
+        ]
+
+
+def _job_records(count, rng):
+    codes = [a + b + c for a in HOLLAND_LETTERS for b in HOLLAND_LETTERS
+             for c in HOLLAND_LETTERS if len({a, b, c}) == 3]
+    optional = ['activitiesCode', 'capacity', 'essentialAbility', 'group',
+                'workContext', 'workStyle', 'workValue']
+    for index in range(count):
+        lines = [f"code: 'JOB{index:06d}'"]
+        for field in optional[:2]:
+            if rng.random() < 0.95:
+                lines.append(f"{field}: {_ts_string(rng.choice(SHORT_VALUES))}")
+        lines.append(f"description: {_ts_string(_paragraph(rng, rng.randint(3, 6)))}")
+        for field in optional[2:4]:
+            if rng.random() < 0.95:
+                lines.append(f"{field}: {_ts_string(rng.choice(SHORT_VALUES))}")
+        lines.append(f"hollandCode: '{rng.choice(codes)}'")
+        lines.append(f"name: {_ts_string(_sentence(rng, 3, 8))}")
+        for field in optional[4:]:
+            if rng.random() < 0.95:
+                lines.append(f"{field}: {_ts_string(rng.choice(SHORT_VALUES))}")
+        if rng.random() < 0.9:
+            lines.append(f"educationLevel: {rng.randint(1, 5)}")
+        lines.append(f"expertise: {_ts_array(_sentence(rng, 2, 5) for _ in range(rng.randint(2, 6)))}")
+        lines.append(f"mission: {_ts_array(_sentence(rng, 10, 30) for _ in range(rng.randint(4, 9)))}")
+        lines.append(f"workArea: {_ts_array(_sentence(rng, 2, 6) for _ in range(rng.randint(1, 4)))}")
+        yield lines
+
+
+def write_group_ts(path, count, rng):
+    """Synthetic group.ts with `count` groups in the NTC array"""
+    _write_ts_records(path, "NTC", _group_records(count, rng))
+
+
+def write_characteristics_ts(path, count, rng):
+    """Synthetic characteristics.ts with `count` records"""
+    _write_ts_records(path, "CHARACTERISTICS", _characteristics_records(count, rng))
+
+
+def write_suggest_jobs_ts(path, count, rng):
+    """Synthetic suggestJobs.ts with `count` jobs"""
+    _write_ts_records(path, "jobs", _job_records(count, rng))
+
+
+def _questions(count, rng):
+    for index in range(count):
+        timestamp = f"2022-07-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:" \
+                    f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}.953000"
+        yield {
+            "id": str(index + 1),
+            "question": "Bạn " + _sentence(rng, 4, 14).lower(),
+            "code": rng.choice(HOLLAND_LETTERS),
+            "createdAt": timestamp,
+            "updatedAt": timestamp,
+        }
+
+
+def write_questions_json(path, count, rng):
+    """Synthetic questions.json (MongoDB export format) with `count` questions"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("[\n")
+        for index, question in enumerate(_questions(count, rng)):
+            separator = ",\n" if index else ""
+            file.write(separator + json.dumps(question, ensure_ascii=False, indent=2))
+        file.write("\n]\n")
+
+
+def write_questions_jsonl(path, count, rng):
+    """Synthetic mongoexport JSON Lines export (ObjectId and $date fields) with `count` questions"""
+    with open(path, 'w', encoding='utf-8') as file:
+        for index, question in enumerate(_questions(count, rng)):
+            timestamp = question["createdAt"].replace(" ", "T")[:23] + "Z"
+            # Same questions as write_questions_json for the same rng
+            question = {
+                "_id": {"$oid": f"62d765f6{index:016x}"},
+                **question,
+                "createdAt": {"$date": timestamp},
+                "updatedAt": {"$date": timestamp},
+            }
+            file.write(json.dumps(question, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+
+def _quiz_setup_sql(project_root):
+    """Package/limit part of sql/questions-and-quiz.sql (after the questions)"""
+    try:
+        content = (Path(project_root) / "sql" / "questions-and-quiz.sql").read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return ""
+    marker = content.find("-- PHẦN 2")
+    if marker < 0:
+        return ""
+    return content[content.rfind("\n", 0, content.rfind("-- ====", 0, marker)) + 1:]
+
+
+def write_questions_and_quiz_sql(path, count, rng, project_root=PROJECT_ROOT):
+    """Synthetic questions-and-quiz.sql: one INSERT per question plus the quiz setup"""
+    categories = ['personality', 'activities', 'subjects', 'interests']
+    difficulties = ['easy', 'medium', 'hard']
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("-- synthetic questions data\nSTART TRANSACTION;\n\nDELETE FROM questions;\n\n")
+        for question in _questions(count, rng):
+            text = question["question"].replace("'", "''").replace("\\", "\\\\")
+            timestamp = question["createdAt"][:19]
+            file.write(
+                "INSERT INTO questions (\n    question_id, question_text, holland_code, category, "
+                "difficulty_level, sort_order, is_active, created_at, updated_at\n) VALUES (\n"
+                f"    '{question['id']}', '{text}', '{question['code']}', "
+                f"'{rng.choice(categories)}', '{rng.choice(difficulties)}', {question['id']}, 1, "
+                f"'{timestamp}', '{timestamp}'\n);\n\n")
+        file.write("COMMIT;\n\n")
+        file.write(_quiz_setup_sql(project_root))
+
+
+def scaled_counts(scale):
+    """Record counts for a scale factor"""
+    return {kind: max(1, round(count * scale)) for kind, count in BASE_COUNTS.items()}
+
+
+def generate_project(root, scale=1, seed=DEFAULT_SEED, project_root=PROJECT_ROOT):
+    """Write a synthetic project tree under root; returns {relative path: bytes}"""
+    root = Path(root)
+    counts = scaled_counts(scale)
+    constants_dir = root / CONSTANTS_DIR
+    db_dir = root / "old-project" / "db"
+    sql_dir = root / "sql"
+    for directory in (constants_dir, db_dir, sql_dir, root / "static"):
+        os.makedirs(directory, exist_ok=True)
+
+    # One generator per file so each file does not depend on the others' sizes
+    writers = [
+        (constants_dir / "group.ts", write_group_ts, counts["groups"]),
+        (constants_dir / "characteristics.ts", write_characteristics_ts, counts["characteristics"]),
+        (constants_dir / "suggestJobs.ts", write_suggest_jobs_ts, counts["jobs"]),
+        (db_dir / "questions.json", write_questions_json, counts["questions"]),
+    ]
+    for offset, (path, writer, count) in enumerate(writers):
+        writer(path, count, random.Random(seed * 100 + offset))
+    write_questions_and_quiz_sql(sql_dir / "questions-and-quiz.sql", counts["questions"],
+                                 random.Random(seed * 100 + len(writers)), project_root)
+
+    for name in STATIC_SQL_FILES:
+        source = Path(project_root) / "sql" / name
+        if source.exists():
+            (sql_dir / name).write_bytes(source.read_bytes())
+
+    files = [path for path, _, _ in writers] + [sql_dir / "questions-and-quiz.sql"]
+    files += [sql_dir / name for name in STATIC_SQL_FILES if (sql_dir / name).exists()]
+    return {str(path.relative_to(root)): path.stat().st_size for path in files}
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Generate synthetic inputs for the data tools")
+    parser.add_argument('output_dir', help='directory to write the synthetic project tree to')
+    parser.add_argument('--scale', type=float, default=1,
+                        help=f"multiple of the current data size (e.g. {', '.join(map(str, SCALES))})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='random seed')
+    args = parser.parse_args()
+
+    if args.scale <= 0:
+        print("[ERROR] --scale must be positive")
+        sys.exit(2)
+
+    print(f"[INFO] Generating {args.scale:g}x synthetic data in {args.output_dir}")
+    sizes = generate_project(args.output_dir, args.scale, args.seed)
+    for name, size in sizes.items():
+        print(f"   {name:55s} {size:>14,} bytes")
+    print(f"[SUCCESS] {sum(sizes.values()):,} bytes written")
+
+
+if __name__ == "__main__":
+    main()
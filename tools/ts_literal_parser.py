@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Shared parser for TypeScript literal data (constants files)
+Author: PAC Development Team
+Purpose: Parse strings, template literals, numbers, arrays and nested objects
+         from files such as group.ts and characteristics.ts in one linear pass
+
+The parser walks the source text left to right exactly once. For very large
+arrays, scan_object_spans() splits a streamed source into the text of each
+top-level object without parsing it, so the objects can be parsed elsewhere
+(e.g. in worker processes). String bodies are
+consumed in runs with pre-compiled regexes and joined at the end, so the cost
+grows with the size of the file and not with the number of fields looked up.
+None of the patterns below can backtrack across more than one token, and
+scan_declarations() enforces a hard input size and time budget.
+"""
+
+import re
+import time
+from collections import namedtuple
+
+# Hard limits for scan_declarations()
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TIME_LIMIT = 60.0
+
+# How many values are parsed between two deadline checks
+_DEADLINE_CHECK_INTERVAL = 4096
+
+# Whitespace and comments between tokens (an unterminated block comment runs to EOF)
+_SKIP_RE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?(?:\*/|\Z))*', re.DOTALL)
+
+# Identifiers (also dotted references such as HollandCode.R)
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*')
+
+# Numeric literals (decimal, float, exponent, hex)
+_NUMBER_RE = re.compile(
+    r'[-+]?(?:0[xX][0-9a-fA-F]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][-+]?\d+)?)'
+)
+
+# Runs of plain characters inside a string body, per quote type
+_STRING_CHUNK_RE = {
+    "'": re.compile(r"[^'\\]+"),
+    '"': re.compile(r'[^"\\]+'),
+    '`': re.compile(r'[^`\\$]+'),
+}
+
+# `const NAME = `, `export const NAME: Type[] = ` and `export default ` declarations
+_DECLARATION_RE = re.compile(
+    r'\b(?:(?:export\s+)?(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*(?::[^=;]{0,200})?='
+    r'|export\s+(default)\b)\s*'
+)
+
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+# Span scanner: runs of characters that cannot open/close a value, string or comment
+_SPAN_SKIP_RE = re.compile(r"[^{}\[\]'\"`/]+")
+# Complete string literals and comments (no match = not finished in the buffer yet)
+_SPAN_TOKEN_RE = {
+    "'": re.compile(r"'[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL),
+    '"': re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+    '`': re.compile(r'`[^`\\]*(?:\\.[^`\\]*)*`', re.DOTALL),
+    '//': re.compile(r'//[^\n]*\n'),
+    '/*': re.compile(r'/\*.*?\*/', re.DOTALL),
+}
+
+
+class TSParseError(ValueError):
+    """Raised when the input is not a literal the parser understands"""
+
+    def __init__(self, message, offset):
+        super().__init__(f"{message} (offset {offset})")
+        self.reason = message
+        self.offset = offset
+
+
+class TSParseLimitError(TSParseError):
+    """Raised when the input exceeds the size or time budget"""
+
+
+class TSIdentifier(str):
+    """Bare identifier or member reference (e.g. HollandCode.R) left unresolved"""
+
+
+# A top-level literal found by scan_declarations(). start/end are offsets in
+# the decoded text, byte_start/byte_end the matching UTF-8 byte offsets.
+Declaration = namedtuple('Declaration', ['name', 'start', 'end', 'byte_start', 'byte_end', 'value'])
+
+# An object found by scan_object_spans(): 1-based number, UTF-8 byte offset
+# of its '{' in the whole stream, and its source text.
+ObjectSpan = namedtuple('ObjectSpan', ['number', 'byte_start', 'text'])
+
+
+class _ByteOffsets:
+    """Convert increasing text offsets to UTF-8 byte offsets incrementally"""
+
+    def __init__(self, text):
+        self.text = text
+        self.char_pos = 0
+        self.byte_pos = 0
+
+    def __call__(self, offset):
+        self.byte_pos += len(self.text[self.char_pos:offset].encode('utf-8'))
+        self.char_pos = offset
+        return self.byte_pos
+
+
+class _Parser:
+    """Recursive-descent parser over a single source string"""
+
+    def __init__(self, text, pos=0, deadline=None):
+        self.text = text
+        self.pos = pos
+        self.length = len(text)
+        self.deadline = deadline
+        self.values_until_check = _DEADLINE_CHECK_INTERVAL
+
+    def check_deadline(self):
+        self.values_until_check = _DEADLINE_CHECK_INTERVAL
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TSParseLimitError("Time limit exceeded", self.pos)
+
+    def skip(self):
+        self.pos = _SKIP_RE.match(self.text, self.pos).end()
+
+    def peek(self):
+        self.skip()
+        return self.text[self.pos] if self.pos < self.length else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise TSParseError(f"Expected '{char}'", self.pos)
+        self.pos += 1
+
+    def parse_value(self):
+        self.values_until_check -= 1
+        if self.values_until_check <= 0:
+            self.check_deadline()
+
+        char = self.peek()
+        if not char:
+            raise TSParseError("Unexpected end of input", self.pos)
+        if char in _STRING_CHUNK_RE:
+            return self.parse_string(char)
+        if char == '[':
+            return self.parse_array()
+        if char == '{':
+            return self.parse_object()
+        if char.isdigit() or char in '-+.':
+            return self.parse_number()
+
+        match = _IDENTIFIER_RE.match(self.text, self.pos)
+        if not match:
+            raise TSParseError(f"Unexpected character {char!r}", self.pos)
+        self.pos = match.end()
+        name = match.group(0)
+        if name in _KEYWORDS:
+            return _KEYWORDS[name]
+        if self.peek() == '(':
+            raise TSParseError(f"Function call '{name}(...)' is not a literal", self.pos)
+        return TSIdentifier(name)
+
+    def parse_number(self):
+        match = _NUMBER_RE.match(self.text, self.pos)
+        if not match:
+            raise TSParseError("Invalid number", self.pos)
+        self.pos = match.end()
+        raw = match.group(0).replace('_', '')
+        if raw.lstrip('+-')[:2] in ('0x', '0X'):
+            return int(raw, 16)
+        if any(c in raw for c in '.eE'):
+            return float(raw)
+        return int(raw)
+
+    def parse_string(self, quote):
+        start = self.pos
+        self.pos += 1
+        chunk_re = _STRING_CHUNK_RE[quote]
+        text = self.text
+        parts = []
+
+        while True:
+            match = chunk_re.match(text, self.pos)
+            if match:
+                parts.append(match.group(0))
+                self.pos = match.end()
+            if self.pos >= self.length:
+                raise TSParseError("Unterminated string", start)
+
+            char = text[self.pos]
+            if char == quote:
+                self.pos += 1
+                return ''.join(parts)
+            if char == '\\':
+                parts.append(self.parse_escape())
+            else:
+                # '$' inside a template literal
+                parts.append(self.parse_template_placeholder())
+
+    def parse_escape(self):
+        text = self.text
+        self.pos += 1
+        if self.pos >= self.length:
+            raise TSParseError("Unterminated escape sequence", self.pos)
+
+        char = text[self.pos]
+        self.pos += 1
+        if char in _SIMPLE_ESCAPES:
+            return _SIMPLE_ESCAPES[char]
+        if char == '\r':
+            # Line continuation (\r\n or \r)
+            if text.startswith('\n', self.pos):
+                self.pos += 1
+            return ''
+        if char in '\n\u2028\u2029':
+            return ''
+        if char == 'x':
+            return self.parse_hex_escape(2)
+        if char == 'u':
+            if text.startswith('{', self.pos):
+                end = text.find('}', self.pos)
+                if end == -1:
+                    raise TSParseError("Unterminated unicode escape", self.pos)
+                code = text[self.pos + 1:end]
+                self.pos = end + 1
+                try:
+                    return chr(int(code, 16))
+                except ValueError:
+                    raise TSParseError("Invalid unicode escape", self.pos)
+            return self.parse_hex_escape(4)
+        # \' \" \` \\ \$ and any other character escape to itself
+        return char
+
+    def parse_hex_escape(self, digits):
+        code = self.text[self.pos:self.pos + digits]
+        if len(code) != digits:
+            raise TSParseError("Truncated hex escape", self.pos)
+        try:
+            value = chr(int(code, 16))
+        except ValueError:
+            raise TSParseError("Invalid hex escape", self.pos)
+        self.pos += digits
+        return value
+
+    def parse_template_placeholder(self):
+        """Keep ${...} placeholders verbatim; a lone '$' is a literal dollar"""
+        text = self.text
+        start = self.pos
+        if not text.startswith('${', start):
+            self.pos += 1
+            return '$'
+
+        depth = 0
+        pos = start + 1
+        while pos < self.length:
+            char = text[pos]
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    self.pos = pos + 1
+                    return text[start:self.pos]
+            pos += 1
+        raise TSParseError("Unterminated template placeholder", start)
+
+    def parse_array(self):
+        self.pos += 1
+        items = []
+        while True:
+            char = self.peek()
+            if char == ']':
+                self.pos += 1
+                return items
+            if char == ',':
+                # Elision / trailing comma
+                self.pos += 1
+                continue
+            if char == '.' and self.text.startswith('...', self.pos):
+                raise TSParseError("Spread elements are not supported", self.pos)
+            items.append(self.parse_value())
+            char = self.peek()
+            if char == ',':
+                self.pos += 1
+            elif char != ']':
+                raise TSParseError("Expected ',' or ']' in array", self.pos)
+
+    def parse_object(self):
+        self.pos += 1
+        obj = {}
+        while True:
+            char = self.peek()
+            if char == '}':
+                self.pos += 1
+                return obj
+            if char == ',':
+                self.pos += 1
+                continue
+
+            key = self.parse_key(char)
+            char = self.peek()
+            if char == ':':
+                self.pos += 1
+                obj[key] = self.parse_value()
+            elif char in ',}':
+                # Shorthand property `{ name }`
+                obj[key] = TSIdentifier(key)
+            else:
+                raise TSParseError(f"Expected ':' after key '{key}'", self.pos)
+
+            char = self.peek()
+            if char == ',':
+                self.pos += 1
+            elif char != '}':
+                raise TSParseError("Expected ',' or '}' in object", self.pos)
+
+    def parse_key(self, char):
+        if char in ('"', "'"):
+            return self.parse_string(char)
+        if char.isdigit():
+            return str(self.parse_number())
+        match = _IDENTIFIER_RE.match(self.text, self.pos)
+        if not match or '.' in match.group(0):
+            raise TSParseError("Invalid object key", self.pos)
+        self.pos = match.end()
+        return match.group(0)
+
+
+def parse_literal(text, pos=0):
+    """Parse one literal starting at pos; return (value, end_offset)"""
+    parser = _Parser(text, pos)
+    try:
+        value = parser.parse_value()
+    except RecursionError:
+        raise TSParseError("Literal is nested too deeply", parser.pos)
+    return value, parser.pos
+
+
+def parse_ts_literal(text):
+    """Parse a string that contains exactly one literal"""
+    value, end = parse_literal(text)
+    rest = _SKIP_RE.match(text, end).end()
+    if rest < len(text) and text[rest:].strip(' \t\r\n;') != '':
+        raise TSParseError("Unexpected content after literal", rest)
+    return value
+
+
+def scan_declarations(content, max_bytes=DEFAULT_MAX_BYTES, time_limit=DEFAULT_TIME_LIMIT):
+    """Find and parse every top-level literal declaration in one pass
+
+    Returns a list of Declaration tuples in source order. Declarations whose
+    value is not a plain literal (functions, calls, ...) are skipped, and
+    scanning always resumes after the furthest offset the parser reached, so
+    no part of the input is visited twice. Raises TSParseLimitError when the
+    input is larger than max_bytes characters or takes longer than
+    time_limit seconds.
+    """
+    if max_bytes is not None and len(content) > max_bytes:
+        raise TSParseLimitError(f"Input larger than {max_bytes:,} characters", 0)
+
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+    byte_offset = _ByteOffsets(content)
+    declarations = []
+    pos = 0
+
+    while True:
+        match = _DECLARATION_RE.search(content, pos)
+        if not match:
+            return declarations
+
+        parser = _Parser(content, match.end(), deadline)
+        parser.check_deadline()
+        try:
+            value = parser.parse_value()
+        except TSParseLimitError:
+            raise
+        except (TSParseError, RecursionError):
+            pos = max(match.end(), parser.pos)
+            continue
+
+        start, end = match.end(), parser.pos
+        declarations.append(Declaration(match.group(1) or match.group(2), start, end,
+                                        byte_offset(start), byte_offset(end), value))
+        pos = parser.pos
+
+
+def parse_declarations(content, **limits):
+    """Parse every `const NAME = <literal>` in a TypeScript file into {name: value}"""
+    return {decl.name: decl.value for decl in scan_declarations(content, **limits)}
+
+
+def iter_object_arrays(value, path=''):
+    """Yield (path, array) for every array of objects nested anywhere in value
+
+    Arrays that are yielded are not descended into, so records nested inside
+    a record are not reported as separate collections.
+    """
+    if isinstance(value, list):
+        if any(isinstance(item, dict) for item in value):
+            yield path, value
+            return
+        for index, item in enumerate(value):
+            yield from iter_object_arrays(item, f"{path}[{index}]")
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_object_arrays(item, f"{path}.{key}" if path else key)
+
+
+def iter_objects(value):
+    """Yield every object nested anywhere in value, outermost first"""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def scan_object_spans(chunks, start_re):
+    """Yield an ObjectSpan for every object directly inside the array that start_re opens
+
+    chunks is any iterable of text pieces (e.g. a file read in blocks).
+    start_re must match up to and including the array's '['. Braces and
+    brackets are counted outside strings, template literals and comments,
+    so nested objects and any formatting split correctly. Only the current
+    object and one chunk are held in memory. Raises TSParseError (with a
+    byte offset) when the array is missing or not terminated.
+    """
+    chunks = iter(chunks)
+    buffer = ''
+    # Absolute byte offset of buffer[cursor_char]
+    cursor_char = cursor_byte = 0
+
+    def byte_offset(offset):
+        nonlocal cursor_char, cursor_byte
+        cursor_byte += len(buffer[cursor_char:offset].encode('utf-8'))
+        cursor_char = offset
+        return cursor_byte
+
+    # Find the start of the array, keeping a tail in case it spans two chunks
+    while True:
+        match = start_re.search(buffer)
+        if match:
+            break
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise TSParseError("Array declaration not found", byte_offset(len(buffer)))
+        keep = max(0, len(buffer) - 256)
+        byte_offset(keep)
+        buffer, cursor_char = buffer[keep:] + chunk, 0
+
+    pos = match.end()
+    depth = 0
+    block_start = None
+    number = 0
+    while True:
+        match = _SPAN_SKIP_RE.match(buffer, pos)
+        if match:
+            pos = match.end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if char in '{[':
+                depth += 1
+                if depth == 1:
+                    block_start = pos if char == '{' else None
+                pos += 1
+                continue
+            if char in '}]':
+                if depth == 0:
+                    # ']' (or a stray '}') closing the array itself
+                    return
+                depth -= 1
+                pos += 1
+                if depth == 0 and block_start is not None:
+                    number += 1
+                    yield ObjectSpan(number, byte_offset(block_start), buffer[block_start:pos])
+                    block_start = None
+                continue
+            # String, template literal, comment or a lone '/'
+            key = buffer[pos:pos + 2] if char == '/' else char
+            if key in _SPAN_TOKEN_RE:
+                match = _SPAN_TOKEN_RE[key].match(buffer, pos)
+                if match:
+                    pos = match.end()
+                    continue
+            elif pos + 1 < len(buffer):
+                pos += 1
+                continue
+
+        # Need more input: drop everything before the current object (or position)
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise TSParseError("Unterminated array, object, string or comment",
+                               byte_offset(block_start if block_start is not None else pos))
+        keep = block_start if block_start is not None else pos
+        byte_offset(keep)
+        buffer, cursor_char = buffer[keep:] + chunk, 0
+        pos -= keep
+        if block_start is not None:
+            block_start = 0
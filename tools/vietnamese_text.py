@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Vietnamese text normalization helpers for search indexes
+Author: PAC Development Team
+Purpose: Fold diacritics (ắ→a, đ→d, ...) and tokenize Vietnamese text the same
+         way at build time and at query time
+
+The folding is: Unicode NFD decomposition, drop combining marks, map đ/Đ to d,
+lowercase. The equivalent in JavaScript is:
+    text.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '')
+        .replace(/đ/g, 'd').replace(/Đ/g, 'D').toLowerCase()
+"""
+
+import re
+import unicodedata
+
+FOLDING_DESCRIPTION = "NFD, strip combining marks, đ->d, lowercase"
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_EXTRA_FOLDS = str.maketrans({'đ': 'd', 'Đ': 'D'})
+
+
+def fold_diacritics(text):
+    """Lowercase text and strip Vietnamese diacritics"""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize('NFD', text.translate(_EXTRA_FOLDS))
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return stripped.lower()
+
+
+def normalize_phrase(text):
+    """Folded phrase with whitespace collapsed, for exact-phrase lookups"""
+    return _WHITESPACE_RE.sub(' ', fold_diacritics(text)).strip()
+
+
+def tokenize(text):
+    """Split text into folded alphanumeric tokens"""
+    return _TOKEN_RE.findall(fold_diacritics(text))